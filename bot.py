@@ -19,8 +19,26 @@ import json
 import datetime
 import re
 from pathlib import Path
-
-from config.settings import BotConfig, MarketDirection
+from typing import NamedTuple
+
+import aiohttp
+
+try:
+    import uvloop  # libuv event loop: faster socket I/O for the feeds and dashboard fan-out
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+from config.settings import (
+    Active5mConfig,
+    BotConfig,
+    EdgeConfig,
+    LateWindowConfig,
+    MarketDirection,
+    MarketMakerConfig,
+    PolymarketConfig,
+    configure,
+)
 from oracles.price_feed import OracleEngine
 from strategies.signal_engine import StrategyEngine
 from core.polymarket_client import PolymarketClient
@@ -29,7 +47,7 @@ from core.trade_logger import TradeLogger
 from core.edge import EdgeEngine
 from core.arb_scanner import ArbScanner, ArbScannerConfig
 from core.market_maker import MarketMaker
-from core.dashboard_server import DashboardServer, build_dashboard_state
+from core.dashboard_server import DashboardServer, PolymarketSnapshot, RiskSnapshot, build_dashboard_state
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,31 +56,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger("bot")
 
+# Market interval inference: slug first, then question/slug keywords.
+# The lookbehind keeps "15m" / "15 min" from being read as 5 minutes.
+_SLUG_INTERVAL_RE = re.compile(r"btc-updown-(\d+)([mh])-")
+_INTERVAL_KW_RE = re.compile(r"(?<!\d)(5|15)(?:[- ]?min|m)")
+
+
+class _EntryInfo(NamedTuple):
+    """Next directional entry, formatted once per boundary."""
+    boundary_ts: float
+    entry_ts: float
+    entry_str: str      # HH:MM:SS of the entry trigger
+    boundary_str: str   # HH:MM of the targeted boundary
+
+
+def _make_http_connector() -> aiohttp.TCPConnector:
+    """Keep-alive connection pool shared by the oracle, CLOB and arb clients."""
+    return aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60)
+
+
+def _on_sigint(callback):
+    """Run `callback` on the event loop when Ctrl+C arrives."""
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, callback)
+    except NotImplementedError:
+        # Windows event loops have no add_signal_handler
+        signal.signal(signal.SIGINT, lambda sig, frame: loop.call_soon_threadsafe(callback))
+
 
 class BTCPredictionBot:
     def __init__(self, config: BotConfig, dashboard: bool = False):
         self.config = config
         self.running = False
+        self._stop_event = asyncio.Event()  # set by stop(); wakes every scheduler sleep at once
         self.trade_logger = TradeLogger(config.logging)
-        self.oracle = OracleEngine(config)
+        # One keep-alive connection pool shared by every HTTP client, so the
+        # Gamma/CLOB/Binance round-trips on the hot path reuse warm TLS sockets
+        self._http = _make_http_connector()
+        self.oracle = OracleEngine(config, connector=self._http)
         self.strategy = StrategyEngine(config.strategy)
-        self.polymarket = PolymarketClient(config)
+        self.polymarket = PolymarketClient(config, connector=self._http)
         self.risk_manager = RiskManager(config.risk, capital=config.bankroll)
         self.edge = EdgeEngine(config.edge)
         self.dashboard = DashboardServer() if dashboard else None
+        self._pending_broadcast: asyncio.Task | None = None
+        self._last_pushed_prices: tuple[float, float] = (0.0, 0.0)  # (chainlink, binance) of the last price_tick
         self._cycle_count = 0
-        self._start_time = 0
+        self._start_time = 0.0  # time.monotonic() at start; 0.0 = never started
         self._traded_this_window = False
         self._last_consensus = None
         self._last_anchor = None
         self._last_decision = None
-        self._last_live_bankroll_sync = 0.0
+        # Interval/TTL bookkeeping uses time.monotonic() (immune to NTP steps);
+        # only boundary math and timestamps use the wall clock
+        self._last_live_bankroll_sync = float("-inf")
         self._last_live_bankroll_value = None
         self._directional_interval_mins = int(config.polymarket.market_interval_minutes or 15)
-        self._last_interval_refresh = 0.0
+        # Next 15m boundary, reused until it passes: (interval_mins, boundary_ts)
+        self._boundary_cache: tuple[int, float] = (0, 0.0)
+        self._entry_info: _EntryInfo | None = None  # cached by _next_entry_info until the boundary moves
         # ── Late-window state (Phase 2 + 5m) ──
         self._late_window_traded_markets: set = set()  # dedup: condition_ids traded this cycle
         self._last_anchor_price = None  # Saved from main cycle for late-window reuse
+        # Hot-path config, resolved once (configs are frozen after configure())
+        self._strategy_delay = int(getattr(config, 'strategy_delay_secs', 0))
+        self._min_liquidity = float(config.polymarket.min_liquidity_usd)
+        self._5m_enabled = bool(getattr(config, 'active_5m', None) and config.active_5m.enabled)
+        lw_cfg = getattr(config, 'late_window', None)
+        self._lw_enabled = bool(lw_cfg and lw_cfg.enabled)
+        self._lw_lead_secs = float(getattr(lw_cfg, 'lead_secs', 150))
+        self._lw_min_drift = float(getattr(lw_cfg, 'min_drift_pct', 0.08))
+        self._lw_max_entry = float(getattr(lw_cfg, 'max_entry_price', 0.75))
         # Wire late-window budget limits into risk manager
         if hasattr(config, 'late_window'):
             self.risk_manager.late_window_max_daily_trades = config.late_window.max_daily_trades
@@ -82,8 +147,10 @@ class BTCPredictionBot:
         self._5m_traded_this_window = False
         self._5m_cycle_count = 0
         self._5m_last_anchor_price = None
-        self._5m_trade_ids: set = set()  # Track 5m trade IDs for PnL routing
-        self._lw_trade_ids: set = set()  # Track late-window trade IDs for PnL routing
+        self._5m_trade_ids: dict[str, float] = {}  # 5m trade ID → opened_at, for PnL routing
+        self._5m_entry_lead_secs = int(config.active_5m.entry_lead_secs)
+        self._5m_entry_window_secs = int(config.active_5m.entry_window_secs)
+        self._lw_trade_ids: dict[str, float] = {}  # Late-window trade ID → opened_at, for PnL routing
 
         # Independent arb scanner (runs its own loop when --arb is enabled)
         if config.edge.enable_arb:
@@ -97,7 +164,7 @@ class BTCPredictionBot:
                 cooldown_per_market_secs=config.edge.arb_cooldown_secs,
                 scan_timeframes=config.edge.arb_timeframes,
             )
-            self.arb_scanner = ArbScanner(arb_config, self.polymarket)
+            self.arb_scanner = ArbScanner(arb_config, self.polymarket, connector=self._http)
         else:
             self.arb_scanner = None
 
@@ -113,7 +180,7 @@ class BTCPredictionBot:
         if not self.config.polymarket.sync_live_bankroll:
             return
 
-        now = time.time()
+        now = time.monotonic()
         poll_secs = max(5, int(self.config.polymarket.live_bankroll_poll_secs))
         if not force and (now - self._last_live_bankroll_sync) < poll_secs:
             return
@@ -128,6 +195,18 @@ class BTCPredictionBot:
         self.risk_manager.capital = self._last_live_bankroll_value
         logger.info(f"Synced live bankroll: ${self._last_live_bankroll_value:.2f}")
 
+    async def _fetch_fee_pct(self, default: float | None = None) -> float | None:
+        """Dynamic taker-fee estimate for edge filtering (Phase 1); falls back to `default`."""
+        try:
+            first_market = self.polymarket.first_active_market()
+            if first_market:
+                fetched = await self.polymarket.get_fee_pct_for_price(first_market.token_id_up, first_market.price_up)
+                if fetched is not None:
+                    return fetched
+        except Exception:
+            pass  # Fall back → signal_engine uses 1.56% default when None
+        return default
+
     async def _trading_cycle(self):
         self._cycle_count += 1
 
@@ -149,15 +228,21 @@ class BTCPredictionBot:
             # price against the anchor. If we run strategy immediately,
             # drift ≈ 0 and the signal is dead weight. Waiting lets
             # BTC move so we get a meaningful directional read.
-            delay = getattr(self.config, 'strategy_delay_secs', 0)
+            delay = self._strategy_delay
             if delay > 0 and open_price:
-                logger.info(f"📌 Anchor: ${open_price:,.2f} — waiting {delay}s for price drift...")
+                logger.info("📌 Anchor: $%.2f — waiting %ds for price drift...", open_price, delay)
                 await asyncio.sleep(delay)
 
             # ─────────────────────────────────────────────────────
             # PHASE 3: Fresh price + strategy (after the delay)
             # ─────────────────────────────────────────────────────
-            consensus = await self.oracle.get_price()
+            # Price, candles and fee estimate are independent round-trips —
+            # fetch them concurrently so the critical path is max(), not sum()
+            consensus, candles, market_fee_pct = await asyncio.gather(
+                self.oracle.get_price(),
+                self.oracle.get_candles(f"{self._directional_interval_mins}m", limit=100),
+                self._fetch_fee_pct(default=self.polymarket._fee_fallback_pct * 4.0 * 0.5 * 0.5),
+            )
             self._last_consensus = consensus
             self.trade_logger.log_oracle({
                 "price": consensus.price, "chainlink": consensus.chainlink_price,
@@ -166,26 +251,11 @@ class BTCPredictionBot:
             })
 
             # 3. Candles
-            candles = await self.oracle.get_candles(f"{self._directional_interval_mins}m", limit=100)
             if len(candles) < 30:
-                logger.warning(f"Only {len(candles)} candles — skipping")
+                logger.warning("Only %d candles — skipping", len(candles))
                 return
 
             # 4. Strategy (anchored to window open price)
-            # ── Fetch dynamic fee estimate for edge filtering (Phase 1) ──
-            market_fee_pct = None
-            try:
-                market_fee_pct = self.polymarket._fee_fallback_pct * 4.0 * 0.5 * 0.5
-                if self.polymarket._active_markets:
-                    first_market = next(iter(self.polymarket._active_markets.values()), None)
-                    if first_market:
-                        token_id = first_market.token_id_up
-                        fetched = await self.polymarket.get_fee_pct_for_price(token_id, first_market.price_up)
-                        if fetched is not None:
-                            market_fee_pct = fetched
-            except Exception:
-                pass  # Fall back to None → signal_engine uses 1.56% default
-
             decision = self.strategy.analyze(candles, consensus.price, open_price=open_price, fee_pct=market_fee_pct)
             self._last_decision = decision
             self.trade_logger.log_strategy({
@@ -200,36 +270,38 @@ class BTCPredictionBot:
             })
 
             if not decision.should_trade:
-                logger.info(f"Cycle {self._cycle_count}: HOLD — {decision.reason}")
+                logger.info("Cycle %d: HOLD — %s", self._cycle_count, decision.reason)
                 await self._notify_engine_event("15m", "hold", f"Cycle #{self._cycle_count}: {decision.reason}")
                 return
 
-            # 5. Live bankroll sync + risk
-            await self._sync_live_bankroll_if_enabled()
+            # 5. Live bankroll sync + market discovery (concurrent), then risk
+            _, markets = await asyncio.gather(
+                self._sync_live_bankroll_if_enabled(),
+                self.polymarket.discover_markets(),
+            )
             can_trade, reason = self.risk_manager.can_trade()
             if not can_trade:
-                logger.info(f"Cycle {self._cycle_count}: BLOCKED — {reason}")
+                logger.info("Cycle %d: BLOCKED — %s", self._cycle_count, reason)
                 await self._notify_engine_event("15m", "blocked", f"Cycle #{self._cycle_count}: {reason}")
                 return
 
-            # 6. Markets — discover then filter to CURRENT window only
-            markets = await self.polymarket.discover_markets()
-            tradeable = [m for m in markets if m.is_tradeable and m.liquidity >= self.config.polymarket.min_liquidity_usd]
+            # 6. Markets — filter discovered set to CURRENT window only
+            tradeable = list(self.polymarket.iter_tradeable(self._min_liquidity))
 
             if not markets:
-                logger.info(f"Cycle {self._cycle_count}: No directional markets discovered")
+                logger.info("Cycle %d: No directional markets discovered", self._cycle_count)
                 return
             if not tradeable:
                 logger.info(
-                    f"Cycle {self._cycle_count}: {len(markets)} markets discovered but none met liquidity "
-                    f"threshold ${self.config.polymarket.min_liquidity_usd:.2f}"
+                    "Cycle %d: %d markets discovered but none met liquidity threshold $%.2f",
+                    self._cycle_count, len(markets), self._min_liquidity,
                 )
                 return
 
             # Filter to current window — prevents trading future windows
             tradeable = self.polymarket.filter_current_window(tradeable, self._directional_interval_mins)
             if not tradeable:
-                logger.info(f"Cycle {self._cycle_count}: No markets for current {self._directional_interval_mins}m window")
+                logger.info("Cycle %d: No markets for current %dm window", self._cycle_count, self._directional_interval_mins)
                 return
 
             market = max(tradeable, key=lambda m: m.liquidity)
@@ -240,19 +312,18 @@ class BTCPredictionBot:
 
             # 6b. Hedge check (if enabled)
             direction = decision.direction.value
-            open_trades = self.polymarket.get_trade_records()
+            open_trades = list(self.polymarket.iter_open_trades())
             hedges = self.edge.check_hedge(
                 open_trades=open_trades,
                 current_direction=direction,
                 current_confidence=decision.confidence,
                 markets=self.polymarket._active_markets,
             )
+            if hedges:
+                cond_by_trade = {t.trade_id: t.market_condition_id for t in open_trades}
+                market_by_cond = {m.condition_id: m for m in tradeable}
             for h in hedges:
-                hedge_market = next(
-                    (m for m in tradeable if m.condition_id ==
-                     next((t.market_condition_id for t in open_trades if t.trade_id == h.original_trade_id), "")),
-                    None
-                )
+                hedge_market = market_by_cond.get(cond_by_trade.get(h.original_trade_id, ""))
                 if hedge_market:
                     trade = await self.polymarket.place_order(
                         market=hedge_market, direction=h.hedge_direction,
@@ -290,23 +361,7 @@ class BTCPredictionBot:
 
             # 8. Resolutions — route 5m/LW PnL to separate trackers
             resolved = await self.polymarket.check_resolutions()
-            for r in resolved:
-                is_5m = r.trade_id in self._5m_trade_ids
-                is_lw = r.trade_id in self._lw_trade_ids
-                if is_5m:
-                    self.risk_manager.record_5m_trade(0, pnl=r.pnl)
-                    self._5m_trade_ids.discard(r.trade_id)
-                elif is_lw:
-                    self.risk_manager.record_late_window_trade(0, pnl=r.pnl)
-                    self._lw_trade_ids.discard(r.trade_id)
-                else:
-                    self.risk_manager.record_trade(r.pnl)
-                self.trade_logger.log_resolution({"trade_id": r.trade_id, "outcome": r.outcome, "pnl": r.pnl})
-                engine_label = "directional_5m" if is_5m else ("late_window" if is_lw else "directional")
-                await self._notify_trade("resolved", r.direction, r.size_usd, pnl=r.pnl,
-                                         outcome=r.outcome, engine=engine_label)
-            if resolved:
-                await self._refresh_dashboard()
+            await self._route_resolutions(resolved)
 
             # 8. Status
             stats = self.polymarket.get_stats()
@@ -316,32 +371,57 @@ class BTCPredictionBot:
             })
 
             logger.info(
-                f"Cycle {self._cycle_count} | BTC=${consensus.price:,.2f} | "
-                f"{direction.upper()} conf={decision.confidence:.2f} | "
-                f"W/R={stats.get('win_rate', 0):.0f}%"
+                "Cycle %d | BTC=$%.2f | %s conf=%.2f | W/R=%.0f%%",
+                self._cycle_count, consensus.price, direction.upper(),
+                decision.confidence, stats.get('win_rate', 0),
             )
 
         except Exception as e:
-            logger.error(f"Cycle {self._cycle_count} error: {e}", exc_info=True)
+            logger.error("Cycle %d error: %s", self._cycle_count, e, exc_info=True)
 
         finally:
-            # Broadcast state to dashboard (even on error/hold)
-            if self.dashboard and self.dashboard.is_running:
-                try:
-                    state = build_dashboard_state(
-                        cycle=self._cycle_count,
-                        consensus=self._last_consensus,
-                        anchor=self._last_anchor,
-                        decision=self._last_decision,
-                        risk_manager=self.risk_manager,
-                        polymarket_client=self.polymarket,
-                        edge_config=self.config.edge,
-                        config=self.config,
-                        arb_scanner=self.arb_scanner,
-                    )
-                    await self.dashboard.broadcast(state)
-                except Exception as e:
-                    logger.warning(f"Dashboard broadcast failed: {e}")
+            # Broadcast state to dashboard (even on error/hold) — in the
+            # background, so the cycle returns without waiting on clients
+            self._schedule_state_broadcast()
+
+    @staticmethod
+    def _track_trade_id(ids: dict[str, float], trade_id: str, max_age: float = 6 * 3600):
+        """Remember a trade ID for PnL routing; drop IDs that never resolved within `max_age`.
+
+        Dicts keep insertion order, so the stale entries are always at the front.
+        """
+        now = time.time()
+        ids[trade_id] = now
+        for stale_id, opened_at in list(ids.items()):
+            if now - opened_at <= max_age:
+                break
+            del ids[stale_id]
+
+    async def _route_resolutions(self, resolved: list):
+        """Route resolved trades' PnL to the 5m / late-window / 15m trackers, then notify."""
+        if not resolved:
+            return
+        engines = []
+        for r in resolved:
+            if r.trade_id in self._5m_trade_ids:
+                self.risk_manager.record_5m_trade(0, pnl=r.pnl)
+                engines.append("directional_5m")
+            elif r.trade_id in self._lw_trade_ids:
+                self.risk_manager.record_late_window_trade(0, pnl=r.pnl)
+                engines.append("late_window")
+            else:
+                self.risk_manager.record_trade(r.pnl)
+                engines.append("directional")
+            self.trade_logger.log_resolution({"trade_id": r.trade_id, "outcome": r.outcome, "pnl": r.pnl})
+        for r in resolved:
+            self._5m_trade_ids.pop(r.trade_id, None)
+            self._lw_trade_ids.pop(r.trade_id, None)
+        await asyncio.gather(*(
+            self._notify_trade("resolved", r.direction, r.size_usd, pnl=r.pnl,
+                               outcome=r.outcome, engine=engine)
+            for r, engine in zip(resolved, engines)
+        ))
+        await self._refresh_dashboard()
 
     # ── Late-Window Conviction (Phase 2) ────────────────────────
 
@@ -352,38 +432,35 @@ class BTCPredictionBot:
         where Chainlink has drifted significantly from the anchor with
         ≤lead_secs remaining before resolution.
         """
-        lw = getattr(self.config, 'late_window', None)
-        if not lw or not lw.enabled:
+        if not self._lw_enabled:
             return
+        lw = self.config.late_window
 
         try:
-            # 1. Fresh Chainlink price
-            consensus = await self.oracle.get_price()
+            # 1. Fresh Chainlink price + 2. discover ALL active markets (concurrent)
+            consensus, markets = await asyncio.gather(
+                self.oracle.get_price(),
+                self.polymarket.discover_markets(),
+            )
             if not consensus or not consensus.price:
                 return
 
-            # 2. Discover ALL active markets
-            markets = await self.polymarket.discover_markets()
-            tradeable = [m for m in markets if m.is_tradeable and m.liquidity >= self.config.polymarket.min_liquidity_usd]
-            if not tradeable:
-                return
-
+            # One pass over the discovered set: keep tradeable, liquid markets whose
+            # end time (parsed once at discovery, 0.0 = unknown) falls in the late-window
+            # zone — (now + 30s, now + lead_secs]; the final 30s are too volatile.
             now = time.time()
+            zone_start = now + 30
+            zone_end = now + self._lw_lead_secs
+            min_liq = self._min_liquidity
+            candidates = [
+                m for m in markets
+                if zone_start < m.end_ts <= zone_end and m.liquidity >= min_liq and m.is_tradeable
+            ]
+            if not candidates:
+                return
 
-            for market in tradeable:
-                # Parse end time from market
-                end_date = getattr(market, "end_date", "")
-                if not end_date:
-                    continue
-                try:
-                    import datetime as _dt
-                    end_ts = _dt.datetime.fromisoformat(end_date.replace("Z", "+00:00")).timestamp()
-                except:
-                    continue
-
-                time_remaining = end_ts - now
-                if time_remaining <= 30 or time_remaining > lw.lead_secs:
-                    continue  # Not in the late-window zone (skip final 30s — too volatile)
+            for market in candidates:
+                time_remaining = market.end_ts - now
 
                 # Infer timeframe for logging
                 tf = self._infer_market_interval_minutes(market)
@@ -405,8 +482,6 @@ class BTCPredictionBot:
 
                 # Skip if we already traded this exact market in late-window
                 market_lw_key = f"lw_{market.condition_id}"
-                if getattr(self, '_late_window_traded_markets', None) is None:
-                    self._late_window_traded_markets = set()
                 if market_lw_key in self._late_window_traded_markets:
                     continue
 
@@ -415,21 +490,21 @@ class BTCPredictionBot:
                     current_price=consensus.price,
                     anchor_price=anchor_price,
                     time_remaining_secs=time_remaining,
-                    min_drift_pct=lw.min_drift_pct,
+                    min_drift_pct=self._lw_min_drift,
                     base_confidence=lw.base_confidence,
                     max_confidence=lw.max_confidence,
                     drift_scale_pct=lw.drift_scale_pct,
                 )
 
                 if not decision.should_trade:
-                    logger.info(f"Late-window [{tf_label}]: HOLD — {decision.reason}")
+                    logger.info("Late-window [%s]: HOLD — %s", tf_label, decision.reason)
                     await self._notify_engine_event("lw", "hold", f"{tf_label} mkt: {decision.reason}")
                     continue
 
                 # 4. Risk check
                 can_trade, reason = self.risk_manager.can_late_window_trade()
                 if not can_trade:
-                    logger.info(f"Late-window [{tf_label}]: BLOCKED — {reason}")
+                    logger.info("Late-window [%s]: BLOCKED — %s", tf_label, reason)
                     await self._notify_engine_event("lw", "blocked", f"{tf_label} mkt: {reason}")
                     break  # Budget exhausted, stop scanning
 
@@ -445,11 +520,11 @@ class BTCPredictionBot:
                 token_id_lw = market.token_id_up if direction == "up" else market.token_id_down
                 clob_entry = self.polymarket.get_clob_price(token_id_lw, side="BUY")
                 entry_price = clob_entry if clob_entry else (market.price_up if direction == "up" else market.price_down)
-                max_entry = getattr(lw, 'max_entry_price', 0.75)
+                max_entry = self._lw_max_entry
                 if entry_price > max_entry:
                     logger.info(
-                        f"Late-window [{tf_label}]: SKIP — entry price ${entry_price:.2f} too high "
-                        f"(max ${max_entry:.2f}, only {(1.0 - entry_price)*100:.0f}¢ edge)"
+                        "Late-window [%s]: SKIP — entry price $%.2f too high (max $%.2f, only %.0f¢ edge)",
+                        tf_label, entry_price, max_entry, (1.0 - entry_price) * 100,
                     )
                     await self._notify_engine_event("lw", "skip", f"{tf_label} mkt: Entry ${entry_price:.2f} > max ${max_entry:.2f}")
                     continue
@@ -461,7 +536,7 @@ class BTCPredictionBot:
 
                 if trade:
                     self._late_window_traded_markets.add(market_lw_key)
-                    self._lw_trade_ids.add(trade.trade_id)
+                    self._track_trade_id(self._lw_trade_ids, trade.trade_id)
                     self.risk_manager.record_late_window_trade(size)
                     self.trade_logger.log_trade({
                         "type": "late_window",
@@ -478,38 +553,40 @@ class BTCPredictionBot:
                                              entry_price=trade.entry_price, engine="late_window")
                     await self._refresh_dashboard()
                     logger.info(
-                        f"🔮 LATE-WINDOW [{tf_label}] {direction.upper()} | "
-                        f"${size:.2f} @ conf={decision.confidence:.2f} | "
-                        f"drift={decision.drift_pct:+.4f}% | {time_remaining:.0f}s left"
+                        "🔮 LATE-WINDOW [%s] %s | $%.2f @ conf=%.2f | drift=%+.4f%% | %.0fs left",
+                        tf_label, direction.upper(), size, decision.confidence,
+                        decision.drift_pct, time_remaining,
                     )
 
         except Exception as e:
-            logger.error(f"Late-window error: {e}", exc_info=True)
+            logger.error("Late-window error: %s", e, exc_info=True)
 
     # ── 5-Minute Parallel Loop (Phase 3) ────────────────────────
 
     def _next_5m_boundary(self) -> float:
-        """Next 5-minute boundary timestamp."""
-        now = time.time()
-        dt = datetime.datetime.fromtimestamp(now)
-        next_min = ((dt.minute // 5) + 1) * 5
-        if next_min >= 60:
-            b = dt.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(hours=1)
-        else:
-            b = dt.replace(minute=next_min, second=0, microsecond=0)
-        return b.timestamp()
+        """Next 5-minute boundary timestamp.
+
+        Pure integer math on the epoch: every UTC offset is a whole multiple
+        of 15 minutes, so epoch-aligned 5m/15m boundaries match local ones.
+        """
+        return float((int(time.time()) // 300 + 1) * 300)
 
     def _is_in_5m_entry_window(self) -> bool:
         """Check if we're in the entry window for a 5m boundary."""
-        cfg = self.config.active_5m
-        secs_until = self._next_5m_boundary() - cfg.entry_lead_secs - time.time()
-        return -cfg.entry_window_secs <= secs_until <= 0
+        secs_until = self._next_5m_boundary() - self._5m_entry_lead_secs - time.time()
+        return -self._5m_entry_window_secs <= secs_until <= 0
 
     def _is_also_15m_boundary(self) -> bool:
         """Check if the next 5m boundary is also a 15m boundary (avoid double-trading)."""
-        boundary = self._next_5m_boundary()
-        dt = datetime.datetime.fromtimestamp(boundary)
-        return dt.minute % 15 == 0
+        return int(self._next_5m_boundary()) % 900 == 0
+
+    def _5m_sleep_secs(self) -> float:
+        """Sleep until the next 5m entry window opens, capped at the resolution poll interval."""
+        secs_until_entry = self._next_5m_boundary() - self._5m_entry_lead_secs - time.time()
+        poll = float(self.config.sleep_poll_secs)
+        if secs_until_entry <= 0:
+            return poll  # Inside (or just past) the window — entry already handled this tick
+        return max(0.1, min(poll, secs_until_entry))
 
     async def _5m_trading_cycle(self):
         """Execute a single 5m directional trade — mirrors _trading_cycle but with 5m params."""
@@ -525,53 +602,44 @@ class BTCPredictionBot:
             # 2. Shorter strategy delay for 5m
             delay = cfg.strategy_delay_secs
             if delay > 0 and open_price:
-                logger.info(f"📌 [5m] Anchor: ${open_price:,.2f} — waiting {delay}s...")
+                logger.info("📌 [5m] Anchor: $%.2f — waiting %ds...", open_price, delay)
                 await asyncio.sleep(delay)
 
-            # 3. Fresh price + strategy
-            consensus = await self.oracle.get_price()
+            # 3. Fresh price + candles + fee estimate (concurrent), then strategy
+            consensus, candles, market_fee_pct = await asyncio.gather(
+                self.oracle.get_price(),
+                self.oracle.get_candles("5m", limit=100),
+                self._fetch_fee_pct(),
+            )
             if not consensus or not consensus.price:
                 logger.warning("[5m] No oracle price — skipping")
                 return
 
-            candles = await self.oracle.get_candles("5m", limit=100)
             if len(candles) < 30:
-                logger.warning(f"[5m] Only {len(candles)} candles — skipping")
+                logger.warning("[5m] Only %d candles — skipping", len(candles))
                 return
 
-            # Fee estimate
-            market_fee_pct = None
-            try:
-                if self.polymarket._active_markets:
-                    first_market = next(iter(self.polymarket._active_markets.values()), None)
-                    if first_market:
-                        token_id = first_market.token_id_up
-                        fetched = await self.polymarket.get_fee_pct_for_price(token_id, first_market.price_up)
-                        if fetched is not None:
-                            market_fee_pct = fetched
-            except Exception:
-                pass
-
             decision = self.strategy.analyze(candles, consensus.price, open_price=open_price, fee_pct=market_fee_pct)
 
             if not decision.should_trade:
-                logger.info(f"[5m] Cycle {self._5m_cycle_count}: HOLD — {decision.reason}")
+                logger.info("[5m] Cycle %d: HOLD — %s", self._5m_cycle_count, decision.reason)
                 await self._notify_engine_event("5m", "hold", f"Cycle #{self._5m_cycle_count}: {decision.reason}")
                 return
 
             # 4. Risk check (separate 5m budget)
             can_trade, reason = self.risk_manager.can_trade_5m()
             if not can_trade:
-                logger.info(f"[5m] Cycle {self._5m_cycle_count}: BLOCKED — {reason}")
+                logger.info("[5m] Cycle %d: BLOCKED — %s", self._5m_cycle_count, reason)
                 await self._notify_engine_event("5m", "blocked", f"Cycle #{self._5m_cycle_count}: {reason}")
                 return
 
             # 5. Discover + filter to current 5m window
-            markets = await self.polymarket.discover_markets()
-            tradeable = [m for m in markets if m.is_tradeable and m.liquidity >= self.config.polymarket.min_liquidity_usd]
+            # Only refreshes the client's discovery cache; iter_tradeable reads from it
+            await self.polymarket.discover_markets()
+            tradeable = list(self.polymarket.iter_tradeable(self._min_liquidity))
             tradeable = self.polymarket.filter_current_window(tradeable, 5)
             if not tradeable:
-                logger.info(f"[5m] Cycle {self._5m_cycle_count}: No markets for current 5m window")
+                logger.info("[5m] Cycle %d: No markets for current 5m window", self._5m_cycle_count)
                 await self._notify_engine_event("5m", "no_markets", f"Cycle #{self._5m_cycle_count}: No 5m markets")
                 return
 
@@ -589,7 +657,7 @@ class BTCPredictionBot:
             )
 
             if trade:
-                self._5m_trade_ids.add(trade.trade_id)
+                self._track_trade_id(self._5m_trade_ids, trade.trade_id)
                 self.risk_manager.record_5m_trade(size)
                 self.trade_logger.log_trade({
                     "type": "directional_5m",
@@ -603,12 +671,12 @@ class BTCPredictionBot:
                                          entry_price=trade.entry_price, engine="directional_5m")
                 await self._refresh_dashboard()
                 logger.info(
-                    f"⏱️ [5m] {direction.upper()} | ${size:.2f} @ conf={decision.confidence:.2f} | "
-                    f"BTC=${consensus.price:,.2f}"
+                    "⏱️ [5m] %s | $%.2f @ conf=%.2f | BTC=$%.2f",
+                    direction.upper(), size, decision.confidence, consensus.price,
                 )
 
         except Exception as e:
-            logger.error(f"[5m] Cycle {self._5m_cycle_count} error: {e}", exc_info=True)
+            logger.error("[5m] Cycle %d error: %s", self._5m_cycle_count, e, exc_info=True)
 
     async def _5m_loop(self):
         """Independent 5m trading loop — runs as async task alongside 15m loop."""
@@ -619,23 +687,7 @@ class BTCPredictionBot:
                 # Check resolutions every tick — 5m trades resolve fast
                 try:
                     resolved = await self.polymarket.check_resolutions()
-                    for r in resolved:
-                        is_5m = r.trade_id in self._5m_trade_ids
-                        is_lw = r.trade_id in self._lw_trade_ids
-                        if is_5m:
-                            self.risk_manager.record_5m_trade(0, pnl=r.pnl)
-                            self._5m_trade_ids.discard(r.trade_id)
-                        elif is_lw:
-                            self.risk_manager.record_late_window_trade(0, pnl=r.pnl)
-                            self._lw_trade_ids.discard(r.trade_id)
-                        else:
-                            self.risk_manager.record_trade(r.pnl)
-                        self.trade_logger.log_resolution({"trade_id": r.trade_id, "outcome": r.outcome, "pnl": r.pnl})
-                        engine_label = "directional_5m" if is_5m else ("late_window" if is_lw else "directional")
-                        await self._notify_trade("resolved", r.direction, r.size_usd, pnl=r.pnl,
-                                                 outcome=r.outcome, engine=engine_label)
-                    if resolved:
-                        await self._refresh_dashboard()
+                    await self._route_resolutions(resolved)
                 except Exception:
                     pass
 
@@ -653,30 +705,76 @@ class BTCPredictionBot:
                         self._5m_traded_this_window = True
                 else:
                     # Reset when approaching next 5m entry window
-                    cfg = self.config.active_5m
-                    secs_until = self._next_5m_boundary() - cfg.entry_lead_secs - time.time()
-                    if secs_until > 0 and secs_until < cfg.entry_lead_secs:
+                    secs_until = self._next_5m_boundary() - self._5m_entry_lead_secs - time.time()
+                    if secs_until > 0 and secs_until < self._5m_entry_lead_secs:
                         self._5m_traded_this_window = False
 
             except Exception as e:
                 logger.error(f"[5m] Loop error: {e}", exc_info=True)
 
-            await asyncio.sleep(self.config.sleep_poll_secs)
+            await self._sleep_unless_stopped(self._5m_sleep_secs())
 
         logger.info("⏱️ [5m] Parallel trading loop stopped")
 
     # ── Clock Sync ──────────────────────────────────────────────
 
+    async def _sleep_unless_stopped(self, secs: float):
+        """Sleep for `secs`, returning early as soon as stop() is called."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=secs)
+        except TimeoutError:
+            pass
+
+    def _main_sleep_secs(self) -> float:
+        """
+        How long the 15m loop can sleep before it next has work to do.
+
+        Wakes at the entry window (1s early after a trade, so the
+        _traded_this_window reset runs first), when the next market enters
+        the late-window zone, and at least every 45s so interval refreshes
+        still happen. Inside/just past the entry window it falls back to
+        sleep_poll_secs.
+        """
+        poll = float(self.config.sleep_poll_secs)
+        secs_until_entry = self._seconds_until_entry()
+        if secs_until_entry <= 0:
+            return poll
+        wake = secs_until_entry - 1 if self._traded_this_window and secs_until_entry > 1 else secs_until_entry
+        if self._lw_enabled and self._traded_this_window:
+            lw_wake = self._late_window_wake_secs()
+            wake = min(wake, poll if lw_wake is None else lw_wake)
+        return max(0.05, min(wake, 45.0))
+
+    def _late_window_wake_secs(self) -> float | None:
+        """Seconds until the next cached market enters the late-window zone; poll cadence while one is in it."""
+        now = time.time()
+        next_entry = None
+        for m in self.polymarket.cached_markets():
+            if not m.end_ts:
+                continue
+            remaining = m.end_ts - now
+            if 30 < remaining <= self._lw_lead_secs:
+                return float(self.config.sleep_poll_secs)  # In the zone — re-check drift each poll
+            if remaining > self._lw_lead_secs:
+                until_zone = remaining - self._lw_lead_secs
+                next_entry = until_zone if next_entry is None else min(next_entry, until_zone)
+        return next_entry
+
     def _next_boundary(self) -> float:
         now = time.time()
-        dt = datetime.datetime.fromtimestamp(now)
         interval = max(1, int(self._directional_interval_mins))
+        cached_interval, cached_boundary = self._boundary_cache
+        if cached_interval == interval and now < cached_boundary:
+            return cached_boundary  # Same window — reuse until the boundary passes
+        dt = datetime.datetime.fromtimestamp(now)
         next_min = ((dt.minute // interval) + 1) * interval
         if next_min >= 60:
             b = dt.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(hours=1)
         else:
             b = dt.replace(minute=next_min, second=0, microsecond=0)
-        return b.timestamp()
+        boundary = b.timestamp()
+        self._boundary_cache = (interval, boundary)
+        return boundary
 
     def _seconds_until_entry(self) -> float:
         return self._next_boundary() - self.config.entry_lead_secs - time.time()
@@ -685,50 +783,67 @@ class BTCPredictionBot:
         secs = self._seconds_until_entry()
         return -self.config.entry_window_secs <= secs <= 0
 
+    def _next_entry_info(self) -> _EntryInfo:
+        boundary = self._next_boundary()
+        info = self._entry_info
+        if info is not None and info.boundary_ts == boundary:
+            return info
+        entry_ts = boundary - self.config.entry_lead_secs
+        info = _EntryInfo(
+            boundary_ts=boundary,
+            entry_ts=entry_ts,
+            entry_str=datetime.datetime.fromtimestamp(entry_ts).strftime('%H:%M:%S'),
+            boundary_str=datetime.datetime.fromtimestamp(boundary).strftime('%H:%M'),
+        )
+        self._entry_info = info
+        return info
+
     def _format_next_entry(self) -> str:
-        entry_ts = self._next_boundary() - self.config.entry_lead_secs
-        entry_dt = datetime.datetime.fromtimestamp(entry_ts)
-        boundary_dt = datetime.datetime.fromtimestamp(self._next_boundary())
-        return f"{entry_dt.strftime('%H:%M:%S')} (→ {boundary_dt.strftime('%H:%M')})"
+        info = self._next_entry_info()
+        return f"{info.entry_str} (→ {info.boundary_str})"
 
     def _infer_market_interval_minutes(self, market) -> int | None:
-        slug = (getattr(market, "slug", "") or "").lower()
-        m = re.search(r"btc-updown-(\d+)(m|h)-", slug)
+        raw_slug = getattr(market, "slug", "") or ""
+        slug = raw_slug.lower()
+        m = _SLUG_INTERVAL_RE.search(slug)
         if m:
-            qty = int(m.group(1))
-            unit = m.group(2)
-            return qty * (60 if unit == "h" else 1)
-
-        text = f"{getattr(market, 'question', '')} {getattr(market, 'slug', '')}".lower()
-        if any(k in text for k in ["5-min", "5 min", "5m", "5-minute"]):
-            return 5
-        if any(k in text for k in ["15-min", "15 min", "15m", "15-minute"]):
-            return 15
-        return None
-
-    async def _refresh_directional_interval(self, force: bool = False):
-        # When 5m parallel loop is active, lock main loop to 15m only
-        if hasattr(self.config, 'active_5m') and self.config.active_5m.enabled:
-            self._directional_interval_mins = 15
-            return
+            return int(m.group(1)) * (60 if m.group(2) == "h" else 1)
 
-        now = time.time()
-        if not force and (now - self._last_interval_refresh) < 45:
-            return
-        self._last_interval_refresh = now
+        kw = _INTERVAL_KW_RE.search(f"{getattr(market, 'question', '')} {raw_slug}".lower())
+        return int(kw.group(1)) if kw else None
 
-        markets = await self.polymarket.discover_markets()
-        tradeable = [m for m in markets if m.is_tradeable and m.liquidity >= self.config.polymarket.min_liquidity_usd]
-        if not tradeable:
+    async def _refresh_directional_interval(self):
+        # When 5m parallel loop is active, lock main loop to 15m only
+        if self._5m_enabled:
+            self._directional_interval_mins = 15
             return
 
-        intervals = {self._infer_market_interval_minutes(m) for m in tradeable}
-        intervals.discard(None)
-        if not intervals:
+        # discover_markets() is TTL-cached, so this is cheap between refreshes
+        await self.polymarket.discover_markets()
+        infer = self._infer_market_interval_minutes
+
+        # Preference is 15m > 5m > shortest other; stop as soon as a 15m market shows up
+        has_5 = False
+        min_other = None
+        target = None
+        for m in self.polymarket.iter_tradeable(self._min_liquidity):
+            v = infer(m)
+            if v == 15:
+                target = 15
+                break
+            if v == 5:
+                has_5 = True
+            elif v is not None and (min_other is None or v < min_other):
+                min_other = v
+        if target is None:
+            target = 5 if has_5 else min_other
+        if target is None:
             return
 
-        target = 15 if 15 in intervals else (5 if 5 in intervals else min(intervals))
         if target != self._directional_interval_mins:
+            # Rare (about once per window), so the full interval set is only gathered here
+            intervals = {infer(m) for m in self.polymarket.iter_tradeable(self._min_liquidity)}
+            intervals.discard(None)
             logger.info(
                 f"Directional interval switched: {self._directional_interval_mins}m -> {target}m "
                 f"(available: {sorted(intervals)})"
@@ -738,68 +853,93 @@ class BTCPredictionBot:
 
     # ── Main Loop ───────────────────────────────────────────────
 
-    async def run(self):
-        print()
-        print("=" * 60)
-        print("  BTC-15M-Oracle — LIVE (v2.5)")
-        print(f"  Bankroll: ${self.config.bankroll:,.2f}")
-        print(f"  Arb: {'ON (independent scanner)' if self.config.edge.enable_arb else 'off'}  |  Hedge: {'ON' if self.config.edge.enable_hedge else 'off'}")
-        lw = getattr(self.config, 'late_window', None)
-        print(f"  Late-Window: {'ON (drift ≥' + str(lw.min_drift_pct) + '%, ' + str(lw.lead_secs) + 's before close)' if lw and lw.enabled else 'off'}")
-        mm = getattr(self.config, 'market_maker', None)
-        print(f"  Market Maker: {'ON (spread=' + str(mm.spread_bps) + 'bps, $' + str(mm.order_size_usd) + '/side, budget=$' + str(mm.max_daily_budget) + '/day)' if mm and mm.enabled else 'off'}")
-        a5 = getattr(self.config, 'active_5m', None)
-        print(f"  5m Parallel: {'ON (budget=' + str(a5.budget_pct) + '%, max $' + str(a5.max_trade_size_usd) + '/trade, delay=' + str(a5.strategy_delay_secs) + 's)' if a5 and a5.enabled else 'off'}")
-        print(f"  Entry: {self.config.entry_lead_secs}s before each 15m boundary")
-        print(f"  Strategy delay: {getattr(self.config, 'strategy_delay_secs', 0)}s after anchor capture")
-        print(f"  Next: {self._format_next_entry()}")
-        if self.config.edge.enable_arb:
-            print(f"  Arb Scanner: polling every {self.config.edge.arb_poll_secs}s | "
-                  f"timeframes: {', '.join(self.config.edge.arb_timeframes)} | "
-                  f"budget: ${self.config.edge.arb_max_daily_budget}/day")
+    def _build_banner(self) -> str:
+        """Startup banner, resolved from config in one pass."""
+        cfg = self.config
+        edge = cfg.edge
+        lw = getattr(cfg, 'late_window', None)
+        mm = getattr(cfg, 'market_maker', None)
+        a5 = getattr(cfg, 'active_5m', None)
+        lines = [
+            "",
+            "=" * 60,
+            "  BTC-15M-Oracle — LIVE (v2.5)",
+            f"  Bankroll: ${cfg.bankroll:,.2f}",
+            f"  Arb: {'ON (independent scanner)' if edge.enable_arb else 'off'}  |  Hedge: {'ON' if edge.enable_hedge else 'off'}",
+            f"  Late-Window: {f'ON (drift ≥{lw.min_drift_pct}%, {lw.lead_secs}s before close)' if lw and lw.enabled else 'off'}",
+            f"  Market Maker: {f'ON (spread={mm.spread_bps}bps, ${mm.order_size_usd}/side, budget=${mm.max_daily_budget}/day)' if mm and mm.enabled else 'off'}",
+            f"  5m Parallel: {f'ON (budget={a5.budget_pct}%, max ${a5.max_trade_size_usd}/trade, delay={a5.strategy_delay_secs}s)' if a5 and a5.enabled else 'off'}",
+            f"  Entry: {cfg.entry_lead_secs}s before each 15m boundary",
+            f"  Strategy delay: {self._strategy_delay}s after anchor capture",
+            f"  Next: {self._format_next_entry()}",
+        ]
+        if edge.enable_arb:
+            lines.append(
+                f"  Arb Scanner: polling every {edge.arb_poll_secs}s | "
+                f"timeframes: {', '.join(edge.arb_timeframes)} | "
+                f"budget: ${edge.arb_max_daily_budget}/day"
+            )
         if self.dashboard:
-            print(f"  Dashboard: http://localhost:8765")
-        print("=" * 60)
-        print()
+            lines.append("  Dashboard: http://localhost:8765")
+        lines += ["=" * 60, ""]
+        return "\n".join(lines)
+
+    async def run(self, max_cycles: int | None = None):
+        print(self._build_banner())
 
         # Start dashboard server if enabled
         if self.dashboard:
             await self.dashboard.start()
 
-        # Start persistent RTDS price stream (single websocket for Chainlink + Binance)
-        rtds_task = asyncio.create_task(self.oracle.start_rtds_stream())
-        logger.info("🔌 RTDS persistent stream launched")
-
-        # Start independent arb scanner (its own async loop)
-        arb_task = None
-        if self.arb_scanner:
-            arb_task = asyncio.create_task(self.arb_scanner.run())
-            logger.info("Arb scanner launched as independent task")
-
-        # Start independent market maker (its own async loop)
-        mm_task = None
-        if self.market_maker:
-            mm_task = asyncio.create_task(self.market_maker.run())
-            logger.info("Market maker launched as independent task")
-
-        # Start independent 5m trading loop (Phase 3)
-        fivem_task = None
-        if hasattr(self.config, 'active_5m') and self.config.active_5m.enabled:
-            fivem_task = asyncio.create_task(self._5m_loop())
-            logger.info("⏱️ [5m] Parallel trading loop launched as independent task")
-
-        # Start dashboard live price push (updates BTC price between cycles)
-        price_push_task = None
-        if self.dashboard:
-            price_push_task = asyncio.create_task(self._price_push_loop())
-            logger.info("📊 Dashboard live price push launched")
+        # Move JSONL / performance writes off the trading path
+        self.trade_logger.start()
 
         self.running = True
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+
+        # Every long-lived loop runs in one TaskGroup: when the main loop
+        # returns (stop()/SIGINT) the background tasks are cancelled and
+        # awaited here, so no stream or scanner outlives shutdown().
+        async with asyncio.TaskGroup() as tg:
+            background: list[asyncio.Task] = []
+
+            # Persistent RTDS price stream (single websocket for Chainlink + Binance)
+            background.append(tg.create_task(self.oracle.start_rtds_stream()))
+            logger.info("🔌 RTDS persistent stream launched")
+
+            # CLOB market stream (best bid/ask for every discovered token)
+            background.append(tg.create_task(self.polymarket.start_market_stream()))
+            logger.info("📡 CLOB market stream launched")
+
+            # Independent arb scanner (its own async loop)
+            if self.arb_scanner:
+                background.append(tg.create_task(self.arb_scanner.run()))
+                logger.info("Arb scanner launched as independent task")
+
+            # Independent market maker (its own async loop)
+            if self.market_maker:
+                background.append(tg.create_task(self.market_maker.run()))
+                logger.info("Market maker launched as independent task")
+
+            # Independent 5m trading loop (Phase 3)
+            if hasattr(self.config, 'active_5m') and self.config.active_5m.enabled:
+                background.append(tg.create_task(self._5m_loop()))
+                logger.info("⏱️ [5m] Parallel trading loop launched as independent task")
+
+            # Dashboard live price push (updates BTC price between cycles)
+            if self.dashboard:
+                background.append(tg.create_task(self._price_push_loop()))
+                logger.info("📊 Dashboard live price push launched")
 
-        # ── Live bankroll sync on boot ────────────────────────────
-        # Always attempt to read actual CLOB balance at startup,
-        # regardless of --sync-live-bankroll flag.
+            try:
+                await self._boot_bankroll_sync()
+                await self._main_loop(max_cycles)
+            finally:
+                for task in background:
+                    task.cancel()
+
+    async def _boot_bankroll_sync(self):
+        """Read the actual CLOB balance at startup, regardless of --sync-live-bankroll."""
         try:
             live_bal = await self.polymarket.get_available_balance_usd()
             if live_bal is not None and live_bal > 0:
@@ -816,24 +956,35 @@ class BTCPredictionBot:
         except Exception as e:
             logger.warning(f"⚠️ Boot bankroll sync failed: {e} — using config ${self.risk_manager.capital:.2f}")
 
+    async def _main_loop(self, max_cycles: int | None = None):
+        """15m entry loop: trade at each boundary, late-window checks in between.
+
+        With max_cycles set, returns after that many entry cycles.
+        """
+        completed = 0
         while self.running:
             await self._refresh_directional_interval()
 
             if self._is_in_entry_window():
                 if not self._traded_this_window:
-                    boundary = datetime.datetime.fromtimestamp(self._next_boundary())
-                    logger.info(f"⏰ ENTRY — targeting {boundary.strftime('%H:%M')}")
+                    logger.info(f"⏰ ENTRY — targeting {self._next_entry_info().boundary_str}")
                     await self._trading_cycle()
                     self._traded_this_window = True
                     # Reset late-window dedup set for new window cycle
                     self._late_window_traded_markets = set()
-                    logger.info(f"💤 Next: {self._format_next_entry()}")
+                    completed += 1
+                    if max_cycles and completed >= max_cycles:
+                        logger.info(f"🏁 Completed {completed}/{max_cycles} cycles")
+                        break
+                    if max_cycles:
+                        logger.info(f"Cycle {completed}/{max_cycles}. Next: {self._format_next_entry()}")
+                    else:
+                        logger.info(f"💤 Next: {self._format_next_entry()}")
             else:
                 # ── Late-window check (Phase 2 + 5m support) ──
                 # Runs on every tick, scans ALL markets for any nearing expiry.
                 # Internal dedup prevents trading the same market twice.
-                lw = getattr(self.config, 'late_window', None)
-                if lw and lw.enabled and self._traded_this_window:
+                if self._lw_enabled and self._traded_this_window:
                     await self._late_window_check()
 
                 # Only reset _traded_this_window when we're approaching the NEXT
@@ -842,48 +993,63 @@ class BTCPredictionBot:
                 if secs_to_next_entry > 0 and secs_to_next_entry < self.config.entry_lead_secs:
                     self._traded_this_window = False
 
-            await asyncio.sleep(self.config.sleep_poll_secs)
+            await self._sleep_unless_stopped(self._main_sleep_secs())
 
     # ── Dashboard Live Updates ──────────────────────────────────
 
+    async def _broadcast_state(self):
+        state = build_dashboard_state(
+            cycle=self._cycle_count,
+            consensus=self._last_consensus,
+            anchor=self._last_anchor,
+            decision=self._last_decision,
+            risk=RiskSnapshot.capture(self.risk_manager),
+            polymarket=PolymarketSnapshot.capture(self.polymarket),
+            edge_config=self.config.edge,
+            config=self.config,
+            arb_scanner=self.arb_scanner,
+        )
+        await self.dashboard.broadcast(state)
+
     async def _refresh_dashboard(self):
         """Re-broadcast full state so positions table updates immediately."""
         if not self.dashboard or not self.dashboard.is_running:
             return
         try:
-            state = build_dashboard_state(
-                cycle=self._cycle_count,
-                consensus=self._last_consensus,
-                anchor=self._last_anchor,
-                decision=self._last_decision,
-                risk_manager=self.risk_manager,
-                polymarket_client=self.polymarket,
-                edge_config=self.config.edge,
-                config=self.config,
-                arb_scanner=self.arb_scanner,
-            )
-            await self.dashboard.broadcast(state)
+            await self._broadcast_state()
         except Exception:
             pass
 
+    def _schedule_state_broadcast(self):
+        """Fire-and-forget state broadcast; skipped if the previous one is still in flight."""
+        if not self.dashboard or not self.dashboard.is_running:
+            return
+        if self._pending_broadcast and not self._pending_broadcast.done():
+            return
+        self._pending_broadcast = asyncio.create_task(self._broadcast_state_logged())
+
+    async def _broadcast_state_logged(self):
+        try:
+            await self._broadcast_state()
+        except Exception as e:
+            logger.warning(f"Dashboard broadcast failed: {e}")
+
     async def _price_push_loop(self):
         """Push live BTC price to dashboard every 2 seconds between cycles."""
         while self.running:
             try:
                 if self.dashboard and self.dashboard.is_running and self.dashboard.client_count > 0:
-                    cl_price = 0
-                    bn_price = 0
-                    # RTDS buffers are PricePoint objects with .price attribute
-                    cl_pp = getattr(self.oracle, '_rtds_chainlink_latest', None)
-                    bn_pp = getattr(self.oracle, '_rtds_binance_latest', None)
-                    if cl_pp and hasattr(cl_pp, 'price'):
-                        cl_price = cl_pp.price or 0
-                    if bn_pp and hasattr(bn_pp, 'price'):
-                        bn_price = bn_pp.price or 0
+                    # RTDS buffers are Optional[PricePoint], initialised by OracleEngine
+                    cl_pp = self.oracle._rtds_chainlink_latest
+                    bn_pp = self.oracle._rtds_binance_latest
+                    cl_price = (cl_pp.price or 0) if cl_pp is not None else 0
+                    bn_price = (bn_pp.price or 0) if bn_pp is not None else 0
                     # Fallback to last consensus
                     if cl_price == 0 and bn_price == 0 and self._last_consensus:
-                        cl_price = getattr(self._last_consensus, 'price', 0)
-                    if cl_price or bn_price:
+                        cl_price = self._last_consensus.price
+                    prices = (cl_price, bn_price)
+                    if (cl_price or bn_price) and prices != self._last_pushed_prices:
+                        self._last_pushed_prices = prices
                         msg = {
                             "type": "price_tick",
                             "price": cl_price or bn_price,
@@ -936,6 +1102,7 @@ class BTCPredictionBot:
 
     def stop(self):
         self.running = False
+        self._stop_event.set()
         logger.info("Shutdown initiated")
 
     async def shutdown(self):
@@ -948,13 +1115,15 @@ class BTCPredictionBot:
             logger.info(f"Market maker stats: {self.market_maker.get_stats()}")
         await self.oracle.close()
         await self.polymarket.close()
+        await self._http.close()
         if self.dashboard:
             await self.dashboard.stop()
         stats = self.polymarket.get_stats()
         self.trade_logger.save_performance({
             "status": "shutdown", "cycles": self._cycle_count,
-            "uptime_secs": time.time() - self._start_time, **stats,
+            "uptime_secs": time.monotonic() - self._start_time if self._start_time else 0.0, **stats,
         })
+        await self.trade_logger.close()
         logger.info(f"Stopped after {self._cycle_count} cycles")
 
 
@@ -981,14 +1150,19 @@ async def main():
 
         # In arb-only mode, limits are sourced from live Polymarket balance.
         # If live balance cannot be read, --bankroll is used as a fallback.
-        config = BotConfig(bankroll=0.0)
-        config.edge.enable_arb = True
         # Arb-only mode always sources limits from live account balance.
-        config.polymarket.sync_live_bankroll = True
-        config.polymarket.live_bankroll_poll_secs = args.live_bankroll_poll_secs
+        config = configure(
+            bankroll=0.0,
+            edge=EdgeConfig(enable_arb=True),
+            polymarket=PolymarketConfig(
+                sync_live_bankroll=True,
+                live_bankroll_poll_secs=args.live_bankroll_poll_secs,
+            ),
+        )
 
         # Polymarket client for order execution + live balance reads
-        polymarket = PolymarketClient(config)
+        http = _make_http_connector()
+        polymarket = PolymarketClient(config, connector=http)
         live_balance = await polymarket.get_available_balance_usd()
         if live_balance is None or live_balance <= 0:
             if args.bankroll > 0:
@@ -1003,6 +1177,7 @@ async def main():
                     "or a positive --bankroll fallback"
                 )
                 await polymarket.close()
+                await http.close()
                 return
 
         base_size_per_side = config.edge.arb_size_usd
@@ -1016,6 +1191,7 @@ async def main():
                 f"(size_per_side={base_size_per_side}, budget_cap={base_daily_budget})"
             )
             await polymarket.close()
+            await http.close()
             return
 
         arb_config = ArbScannerConfig(
@@ -1029,86 +1205,121 @@ async def main():
             scan_timeframes=config.edge.arb_timeframes,
         )
 
-        scanner = ArbScanner(arb_config, polymarket)
+        scanner = ArbScanner(arb_config, polymarket, connector=http)
         last_live_balance = live_balance
-        last_live_sync = time.time()
 
         # Optional dashboard
         dashboard = DashboardServer() if args.dashboard else None
 
-        print()
-        print("=" * 60)
-        print("  BTC ARB SCANNER — ARBITRAGE ONLY MODE")
-        print(f"  Live bankroll: ${live_balance:,.2f}")
-        print(f"  Budget cap: ${base_daily_budget:,.2f}/day")
-        print(f"  Effective budget: ${effective_budget:,.2f}/day")
-        print(f"  Size cap: ${base_size_per_side:,.2f} per side")
-        print(f"  Effective size: ${effective_size:,.2f} per side")
-        print(f"  Threshold: YES+NO < {config.edge.arb_threshold}")
-        print(f"  Polling: every {config.edge.arb_poll_secs}s")
-        print(f"  Timeframes: {', '.join(config.edge.arb_timeframes)}")
-        print(f"  Max trades: {config.edge.arb_max_daily_trades}/day")
+        banner = [
+            "",
+            "=" * 60,
+            "  BTC ARB SCANNER — ARBITRAGE ONLY MODE",
+            f"  Live bankroll: ${live_balance:,.2f}",
+            f"  Budget cap: ${base_daily_budget:,.2f}/day",
+            f"  Effective budget: ${effective_budget:,.2f}/day",
+            f"  Size cap: ${base_size_per_side:,.2f} per side",
+            f"  Effective size: ${effective_size:,.2f} per side",
+            f"  Threshold: YES+NO < {config.edge.arb_threshold}",
+            f"  Polling: every {config.edge.arb_poll_secs}s",
+            f"  Timeframes: {', '.join(config.edge.arb_timeframes)}",
+            f"  Max trades: {config.edge.arb_max_daily_trades}/day",
+        ]
         if dashboard:
-            print(f"  Dashboard: http://localhost:8765")
-        print()
-        print("  No directional trading. Pure arb capture.")
-        print("=" * 60)
-        print()
+            banner.append("  Dashboard: http://localhost:8765")
+        banner += ["", "  No directional trading. Pure arb capture.", "=" * 60, ""]
+        print("\n".join(banner))
 
-        running = True
+        stop_event = asyncio.Event()
 
-        def handle_signal(sig, frame):
-            nonlocal running
+        def handle_signal():
             print("\n\nCtrl+C — shutting down...")
             scanner.stop()
-            running = False
-        signal.signal(signal.SIGINT, handle_signal)
+            stop_event.set()
+        _on_sigint(handle_signal)
 
+        async def _bankroll_refresher(interval: float):
+            """Re-read the live balance every `interval` seconds and rescale arb limits."""
+            nonlocal last_live_balance
+            while True:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=interval)
+                    return
+                except TimeoutError:
+                    pass
+                refreshed_balance = await polymarket.get_available_balance_usd()
+                if refreshed_balance is not None and refreshed_balance > 0:
+                    last_live_balance = refreshed_balance
+                    refreshed_budget = round(min(base_daily_budget, refreshed_balance), 2)
+                    refreshed_size = round(min(base_size_per_side, refreshed_budget / 2), 2)
+                    scanner.config.max_daily_arb_budget = refreshed_budget
+                    scanner.config.size_per_side_usd = max(0.5, refreshed_size)
+
+        async def _dashboard_pusher(interval: float):
+            """Broadcast arb-only state to the dashboard every `interval` seconds."""
+            # Arb-only state has a fixed shape: build it once, refresh the live fields
+            state = {
+                "type": "state",
+                "timestamp": 0.0,
+                "cycle": 0,
+                "mode": "arb_only",
+                "oracle": {"price": 0, "chainlink": None, "sources": [], "spread_pct": 0},
+                "anchor": {"open_price": None, "source": None, "drift_pct": None},
+                "strategy": {"direction": "hold", "confidence": 0, "should_trade": False, "reason": "Arb-only mode"},
+                "signals": {},
+                "stats": {"wins": 0, "losses": 0, "win_rate": 0, "total_pnl": 0, "total_wagered": 0, "total_trades": 0},
+                "risk": {"daily_trades": 0, "max_daily_trades": config.edge.arb_max_daily_trades},
+                "positions": {"open": [], "closed": []},
+                "arb_scanner": {},
+                "config": {"bankroll": 0.0, "arb_enabled": True, "hedge_enabled": False},
+            }
+            stats, risk, cfg = state["stats"], state["risk"], state["config"]
+            while True:
+                if dashboard.is_running:
+                    try:
+                        arb_stats = scanner.get_stats()
+                        daily_trades = arb_stats.get("daily_trades", 0)
+                        state["timestamp"] = time.time()
+                        state["cycle"] = arb_stats.get("scan_count", 0)
+                        stats["total_pnl"] = arb_stats.get("daily_profit", 0)
+                        stats["total_wagered"] = arb_stats.get("daily_spent", 0)
+                        stats["total_trades"] = daily_trades
+                        risk["daily_trades"] = daily_trades
+                        state["arb_scanner"] = arb_stats
+                        cfg["bankroll"] = round(last_live_balance, 2)
+                        await dashboard.broadcast(state)
+                    except Exception:
+                        pass
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=interval)
+                    return
+                except TimeoutError:
+                    pass
+
+        tasks: list[asyncio.Task] = []
         try:
             if dashboard:
                 await dashboard.start()
 
-            # Run arb scanner as main task
+            # Run arb scanner as main task; helpers wake only on their own schedule
             arb_task = asyncio.create_task(scanner.run())
+            tasks.append(arb_task)
+            tasks.append(asyncio.create_task(_bankroll_refresher(max(5, args.live_bankroll_poll_secs))))
+            if dashboard:
+                tasks.append(asyncio.create_task(_dashboard_pusher(5)))
+            stop_wait = asyncio.create_task(stop_event.wait())
+            tasks.append(stop_wait)
 
-            # Keep alive + periodic dashboard broadcast
-            while running and not arb_task.done():
-                if time.time() - last_live_sync >= max(5, args.live_bankroll_poll_secs):
-                    refreshed_balance = await polymarket.get_available_balance_usd()
-                    last_live_sync = time.time()
-                    if refreshed_balance is not None and refreshed_balance > 0:
-                        last_live_balance = refreshed_balance
-                        refreshed_budget = round(min(base_daily_budget, refreshed_balance), 2)
-                        refreshed_size = round(min(base_size_per_side, refreshed_budget / 2), 2)
-                        scanner.config.max_daily_arb_budget = refreshed_budget
-                        scanner.config.size_per_side_usd = max(0.5, refreshed_size)
-
-                if dashboard and dashboard.is_running:
-                    try:
-                        arb_stats = scanner.get_stats()
-                        state = {
-                            "type": "state",
-                            "timestamp": time.time(),
-                            "cycle": arb_stats.get("scan_count", 0),
-                            "mode": "arb_only",
-                            "oracle": {"price": 0, "chainlink": None, "sources": [], "spread_pct": 0},
-                            "anchor": {"open_price": None, "source": None, "drift_pct": None},
-                            "strategy": {"direction": "hold", "confidence": 0, "should_trade": False, "reason": "Arb-only mode"},
-                            "signals": {},
-                            "stats": {"wins": 0, "losses": 0, "win_rate": 0, "total_pnl": arb_stats.get("daily_profit", 0), "total_wagered": arb_stats.get("daily_spent", 0), "total_trades": arb_stats.get("daily_trades", 0)},
-                            "risk": {"daily_trades": arb_stats.get("daily_trades", 0), "max_daily_trades": config.edge.arb_max_daily_trades},
-                            "positions": {"open": [], "closed": []},
-                            "arb_scanner": arb_stats,
-                            "config": {"bankroll": round(last_live_balance, 2), "arb_enabled": True, "hedge_enabled": False},
-                        }
-                        await dashboard.broadcast(state)
-                    except Exception:
-                        pass
-                await asyncio.sleep(5)
+            # Block until the scanner exits or Ctrl+C
+            await asyncio.wait({arb_task, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
 
         finally:
             scanner.stop()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             await polymarket.close()
+            await http.close()
             if dashboard:
                 await dashboard.stop()
             stats = scanner.get_stats()
@@ -1121,46 +1332,34 @@ async def main():
         return
 
     # ── Normal Mode (directional + optional arb/hedge) ───────────
-    config = BotConfig(bankroll=args.bankroll)
-    config.edge.enable_arb = args.arb
-    config.polymarket.sync_live_bankroll = args.sync_live_bankroll
-    config.polymarket.live_bankroll_poll_secs = args.live_bankroll_poll_secs
-    config.edge.enable_hedge = args.hedge
-    config.late_window.enabled = args.late_window
-    config.market_maker.enabled = args.mm
-    config.active_5m.enabled = args.fivem
-
+    overrides = dict(
+        bankroll=args.bankroll,
+        edge=EdgeConfig(enable_arb=args.arb, enable_hedge=args.hedge),
+        polymarket=PolymarketConfig(
+            sync_live_bankroll=args.sync_live_bankroll,
+            live_bankroll_poll_secs=args.live_bankroll_poll_secs,
+        ),
+        late_window=LateWindowConfig(enabled=args.late_window),
+        market_maker=MarketMakerConfig(enabled=args.mm),
+        active_5m=Active5mConfig(enabled=args.fivem),
+    )
     # Apply strategy delay override if provided via CLI
     if args.strategy_delay is not None:
-        config.strategy_delay_secs = max(0, args.strategy_delay)
+        overrides["strategy_delay_secs"] = max(0, args.strategy_delay)
+    config = configure(**overrides)
 
     bot = BTCPredictionBot(config, dashboard=args.dashboard)
 
-    def handle_signal(sig, frame):
+    def handle_signal():
         print("\n\nCtrl+C — shutting down...")
         bot.stop()
-    signal.signal(signal.SIGINT, handle_signal)
+    _on_sigint(handle_signal)
 
     try:
         if args.cycles > 0:
-            bot._start_time = time.time()
-            bot.running = True
-            completed = 0
             print(f"\nRunning {args.cycles} cycles | Bankroll: ${args.bankroll}")
             print(f"Next: {bot._format_next_entry()}\n")
-            while completed < args.cycles and bot.running:
-                await bot._refresh_directional_interval()
-
-                if bot._is_in_entry_window():
-                    if not bot._traded_this_window:
-                        await bot._trading_cycle()
-                        bot._traded_this_window = True
-                        completed += 1
-                        if completed < args.cycles:
-                            logger.info(f"Cycle {completed}/{args.cycles}. Next: {bot._format_next_entry()}")
-                else:
-                    bot._traded_this_window = False
-                await asyncio.sleep(bot.config.sleep_poll_secs)
+            await bot.run(max_cycles=args.cycles)
         else:
             await bot.run()
     finally:
@@ -1168,4 +1367,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1 +1,15 @@
-from config.settings import BotConfig, MarketDirection
+# Re-exports resolve on first access (PEP 562), so importing a sibling
+# module does not build the settings classes as a side effect.
+_LAZY = {
+    "BotConfig": "config.settings",
+    "MarketDirection": "config.settings",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
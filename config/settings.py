@@ -10,14 +10,34 @@ import os
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Configs are frozen: build them with keyword overrides (see configure())
+# or dataclasses.replace(), never by assigning to fields after construction.
+# Derived fields (init=False: *_frac, endpoint *_url) are filled in
+# __post_init__, so they track the field they are computed from.
 
-class MarketDirection(Enum):
+# Environment snapshot taken once at import; PolymarketConfig defaults resolve from here
+_ENV = dict(os.environ)
+
+
+def _env(key: str, default: str = "") -> str:
+    return _ENV.get(key, default)
+
+
+_SIG_TYPE = int(_env("POLY_SIG_TYPE", "0"))
+
+# Immutable, so one shared default instead of a default_factory list per instance
+_ARB_TIMEFRAMES = ("5m", "15m", "30m", "1h")
+_MM_TIMEFRAMES = ("15m", "5m")
+
+
+class MarketDirection(str, Enum):
+    """Members are str instances: compare equal to "up"/"down"/"hold" and JSON-encode as such."""
     UP = "up"
     DOWN = "down"
     HOLD = "hold"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class OracleConfig:
     coingecko_base_url: str = "https://api.coingecko.com/api/v3"
     binance_base_url: str = "https://api.binance.com/api/v3"
@@ -28,30 +48,51 @@ class OracleConfig:
     min_oracle_consensus: int = 2
     history_candle_count: int = 100
     candle_interval: str = "15m"
+    # Endpoint URLs, joined once from the base URLs above
+    binance_ticker_url: str = field(init=False)
+    binance_klines_url: str = field(init=False)
+    coingecko_price_url: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "binance_ticker_url", f"{self.binance_base_url}/ticker/bookTicker")
+        object.__setattr__(self, "binance_klines_url", f"{self.binance_base_url}/klines")
+        object.__setattr__(self, "coingecko_price_url", f"{self.coingecko_base_url}/simple/price")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class PolymarketConfig:
     clob_api_url: str = "https://clob.polymarket.com"
     gamma_api_url: str = "https://gamma-api.polymarket.com"
+    clob_ws_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
     chain_id: int = 137
-    rpc_url: str = os.getenv("POLYGON_RPC_URL", "https://polygon-rpc.com")
-    private_key: str = os.getenv("POLY_PRIVATE_KEY", "")
-    funder: str = os.getenv("POLY_FUNDER", "")
-    sig_type: int = int(os.getenv("POLY_SIG_TYPE", "0"))
+    rpc_url: str = _env("POLYGON_RPC_URL", "https://polygon-rpc.com")
+    private_key: str = _env("POLY_PRIVATE_KEY")
+    funder: str = _env("POLY_FUNDER")
+    sig_type: int = _SIG_TYPE
     market_slug_pattern: str = "btc-price"
     market_interval_minutes: int = 15
     order_type: str = "market"
     max_slippage_pct: float = 2.0
+    max_slippage_frac: float = field(init=False)   # max_slippage_pct / 100
+    gamma_events_url: str = field(init=False)      # gamma_api_url + "/events"
     min_liquidity_usd: float = 50.0
     sync_live_bankroll: bool = False
     live_bankroll_poll_secs: int = 60
     # ── Fee handling (Phase 1) ──
     fee_cache_ttl_secs: int = 60         # how long to cache fee lookups per token
     fee_fallback_pct: float = 1.56       # fallback fee % if API lookup fails (worst-case at 50c)
+    # ── CLOB market stream ──
+    stream_max_age_secs: float = 5.0     # streamed quotes older than this fall back to HTTP
+    # ── Discovery cache ──
+    market_cache_ttl_secs: float = 20.0  # discover_markets() result reused this long
+    market_cache_swr_secs: float = 10.0  # then served stale for this long while refreshing
 
+    def __post_init__(self):
+        object.__setattr__(self, "max_slippage_frac", self.max_slippage_pct / 100.0)
+        object.__setattr__(self, "gamma_events_url", f"{self.gamma_api_url}/events")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, eq=False)
 class StrategyConfig:
     confidence_threshold: float = 0.72
     strong_signal_threshold: float = 0.75
@@ -71,10 +112,31 @@ class StrategyConfig:
     weight_macd: float = 0.25
     weight_ema_cross: float = 0.20
 
+    def __post_init__(self):
+        # Invariants the signal engine relies on without re-checking per tick
+        # (e.g. the RSI neutral-zone scaling divides by the distance to 50)
+        if not 0 < self.confidence_threshold <= self.strong_signal_threshold < 1:
+            raise ValueError(
+                f"Need 0 < confidence_threshold ({self.confidence_threshold}) <= "
+                f"strong_signal_threshold ({self.strong_signal_threshold}) < 1"
+            )
+        if not 0 < self.rsi_oversold < 50 < self.rsi_overbought < 100:
+            raise ValueError(f"Need 0 < rsi_oversold ({self.rsi_oversold}) < 50 < rsi_overbought ({self.rsi_overbought}) < 100")
+        if not 0 < self.ema_fast < self.ema_slow:
+            raise ValueError(f"Need 0 < ema_fast ({self.ema_fast}) < ema_slow ({self.ema_slow})")
+        if not 0 < self.macd_fast < self.macd_slow:
+            raise ValueError(f"Need 0 < macd_fast ({self.macd_fast}) < macd_slow ({self.macd_slow})")
+        if not 0 <= self.min_volatility_pct < self.max_volatility_pct:
+            raise ValueError(f"Need 0 <= min_volatility_pct ({self.min_volatility_pct}) < max_volatility_pct ({self.max_volatility_pct})")
+        weight_sum = self.weight_momentum + self.weight_rsi + self.weight_macd + self.weight_ema_cross
+        if abs(weight_sum - 1.0) > 1e-6:
+            raise ValueError(f"Indicator weights must sum to 1.0 (got {weight_sum:.4f})")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class RiskConfig:
     max_trade_pct: float = 5.0
+    max_trade_frac: float = field(init=False)      # max_trade_pct / 100
     max_daily_trades: int = 20
     max_daily_loss_pct: float = 25.0
     max_consecutive_losses: int = 5
@@ -83,8 +145,20 @@ class RiskConfig:
     min_trade_size_usd: float = 1.0
     max_trade_size_usd: float = 25.0
 
+    def __post_init__(self):
+        if not 0 < self.max_trade_pct <= 100:
+            raise ValueError(f"Need 0 < max_trade_pct ({self.max_trade_pct}) <= 100")
+        if not 0 < self.kelly_fraction <= 1:
+            raise ValueError(f"Need 0 < kelly_fraction ({self.kelly_fraction}) <= 1")
+        if not 0 < self.min_trade_size_usd <= self.max_trade_size_usd:
+            raise ValueError(
+                f"Need 0 < min_trade_size_usd ({self.min_trade_size_usd}) <= "
+                f"max_trade_size_usd ({self.max_trade_size_usd})"
+            )
+        object.__setattr__(self, "max_trade_frac", self.max_trade_pct / 100.0)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, eq=False)
 class EdgeConfig:
     """Arbitrage + Hedge toggles."""
     # ── Arbitrage (independent scanner) ──
@@ -96,13 +170,21 @@ class EdgeConfig:
     arb_max_daily_trades: int = 50       # daily arb trade pair limit
     arb_max_daily_budget: float = 20.0  # max USD committed per day
     arb_cooldown_secs: float = 120.0     # don't re-arb same market within 2min
-    arb_timeframes: list = field(default_factory=lambda: ["5m", "15m", "30m", "1h"])
+    arb_timeframes: tuple = _ARB_TIMEFRAMES
     # ── Hedge ──
     enable_hedge: bool = False           # --hedge to turn on
     hedge_min_confidence: float = 0.65   # only hedge if flip signal is strong
 
+    def __post_init__(self):
+        if not 0 < self.arb_threshold <= 1:
+            raise ValueError(f"Need 0 < arb_threshold ({self.arb_threshold}) <= 1")
+        if self.arb_size_usd <= 0 or self.arb_max_daily_budget <= 0:
+            raise ValueError("arb_size_usd and arb_max_daily_budget must be positive")
+        if not 0 < self.hedge_min_confidence < 1:
+            raise ValueError(f"Need 0 < hedge_min_confidence ({self.hedge_min_confidence}) < 1")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class LoggingConfig:
     log_dir: str = "logs"
     trade_log_file: str = "logs/trades.jsonl"
@@ -114,7 +196,7 @@ class LoggingConfig:
     alert_on_oracle_downtime_secs: int = 60
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class LateWindowConfig:
     """Phase 2: Late-window conviction trading based on Chainlink drift."""
     enabled: bool = False                 # --late-window to turn on
@@ -132,15 +214,17 @@ class LateWindowConfig:
     max_trade_size_usd: float = 5.0       # max USD per late-window trade (more trades, smaller risk)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class MarketMakerConfig:
     """Phase 4: Market making — post-only orders, zero fees, earn rebates."""
     enabled: bool = False                 # --mm to turn on
     # ── Quoting ──
     spread_bps: int = 400                 # half-spread in basis points (200 bps = 2 cents each side)
+    spread_frac: float = field(init=False)         # spread_bps / 10_000
     order_size_usd: float = 3.0           # USD per side per quote
     num_levels: int = 1                   # number of price levels each side
     level_spacing_bps: int = 100          # spacing between levels in bps (1 cent)
+    level_spacing_frac: float = field(init=False)  # level_spacing_bps / 10_000
     refresh_secs: float = 15.0            # re-quote interval
     # ── Inventory ──
     max_inventory_imbalance: float = 10.0 # max $ net position before widening
@@ -149,10 +233,14 @@ class MarketMakerConfig:
     pull_before_close_secs: int = 60      # cancel all quotes N secs before window resolution
     max_daily_budget: float = 50.0        # max USD committed across all maker orders per day
     max_open_orders: int =4             # max simultaneous open orders
-    timeframes: list = field(default_factory=lambda: ["15m", "5m"])
+    timeframes: tuple = _MM_TIMEFRAMES
 
+    def __post_init__(self):
+        object.__setattr__(self, "spread_frac", self.spread_bps / 10_000.0)
+        object.__setattr__(self, "level_spacing_frac", self.level_spacing_bps / 10_000.0)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, eq=False)
 class Active5mConfig:
     """Phase 3: Parallel 5-minute directional trading loop."""
     enabled: bool = False                 # --5m to turn on
@@ -169,7 +257,7 @@ class Active5mConfig:
     entry_window_secs: int = 20           # 20s entry window
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class BotConfig:
     oracle: OracleConfig = field(default_factory=OracleConfig)
     polymarket: PolymarketConfig = field(default_factory=PolymarketConfig)
@@ -194,3 +282,10 @@ class BotConfig:
     # (35% weight) has a meaningful signal instead of always being ~0.
     # Recommended: 30-60 seconds. Set to 0 to disable (old behavior).
     strategy_delay_secs: int = 45
+
+
+# ── Process-wide config ─────────────────────────────────────────
+
+def configure(**overrides) -> BotConfig:
+    """Build the process config with BotConfig keyword overrides (CLI flags)."""
+    return BotConfig(**overrides)
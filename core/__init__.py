@@ -1,3 +1,18 @@
-from core.polymarket_client import PolymarketClient, BinaryMarket, TradeRecord
-from core.risk_manager import RiskManager
-from core.trade_logger import TradeLogger
+# Re-exports resolve on first access (PEP 562), so `import core.edge` does
+# not pull in the CLOB client, aiohttp and the rest of the trading stack.
+_LAZY = {
+    "PolymarketClient": "core.polymarket_client",
+    "BinaryMarket": "core.polymarket_client",
+    "TradeRecord": "core.polymarket_client",
+    "RiskManager": "core.risk_manager",
+    "TradeLogger": "core.trade_logger",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
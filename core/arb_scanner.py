@@ -11,20 +11,41 @@
 """
 
 import asyncio
+import heapq
 import json as _json
 import re
 import time
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import NamedTuple, Optional
 
 import aiohttp
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from core.polymarket_client import gather_pooled, iso_to_ts
+
 logger = logging.getLogger("arb_scanner")
 
+SLUG_PREFIX = "btc-updown-"
 SLUG_PATTERN = re.compile(r'^btc-updown-(\d+m|\d+h)-(\d+)$')
 TIMEFRAME_LABELS = {"5m": "5-Min", "15m": "15-Min", "30m": "30-Min", "1h": "1-Hour"}
 TIMEFRAME_SECONDS = {"5m": 300, "15m": 900, "30m": 1800, "1h": 3600}
+_row_end_ts = itemgetter("end_ts")
+_edge_pct = attrgetter("edge_pct")
+
+# Gamma bodies and the JSON-string fields inside them (orjson when available).
+# Bodies are decoded straight from bytes: resp.json() would first copy the
+# whole payload into a str.
+_loads = orjson.loads if HAS_ORJSON else _json.loads
 
 
 # ── Helpers ──────────────────────────────────────────────────────
@@ -37,7 +58,7 @@ def _safe_json(val):
         return val
     if isinstance(val, str):
         try:
-            return _json.loads(val)
+            return _loads(val)
         except Exception:
             return []
     return []
@@ -106,13 +127,34 @@ def _parse_market_from_event(event: dict, slug: str, timeframe: str) -> Optional
         end_date=m.get("endDate", event.get("endDate", "")),
         timeframe=timeframe,
         volume=float(m.get("volumeNum", m.get("volume", 0))),
-        last_refreshed=time.time(),
+        last_refreshed=time.monotonic(),
     )
 
 
+@lru_cache(maxsize=32)
+def _slugs_for_minute(timeframes: tuple, offsets: tuple, minute: int) -> tuple[tuple[str, str], ...]:
+    """
+    Deterministic window slugs as of a given epoch minute.
+
+    Every timeframe is a whole number of minutes, so now // secs only moves
+    on minute boundaries and the result is exact for the whole minute.
+    """
+    now = minute * 60
+    slugs = []
+    for tf in timeframes:
+        secs = TIMEFRAME_SECONDS.get(tf)
+        if not secs:
+            continue
+        for offset in offsets:
+            window_ts = (now // secs + offset) * secs
+            if window_ts > 0:
+                slugs.append((f"{SLUG_PREFIX}{tf}-{window_ts}", tf))
+    return tuple(slugs)
+
+
 # ── Data Models ──────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class ArbMarket:
     condition_id: str
     question: str
@@ -126,14 +168,22 @@ class ArbMarket:
     timeframe: str
     volume: float = 0.0
     last_refreshed: float = 0.0
-
-    @property
-    def combined(self) -> float:
-        return self.price_yes + self.price_no
-
-    @property
-    def edge_pct(self) -> float:
-        return (1.0 - self.combined) * 100 if self.combined < 1.0 else 0.0
+    _end_ts: float = field(init=False, default=0.0, repr=False)  # end_date parsed once
+    # Derived from the prices; kept current by set_prices()
+    combined: float = field(init=False, default=0.0)
+    edge_pct: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self._end_ts = iso_to_ts(self.end_date)
+        self.set_prices(self.price_yes, self.price_no)
+
+    def set_prices(self, price_yes: float, price_no: float):
+        """Update both outcome prices and the fields derived from them."""
+        self.price_yes = price_yes
+        self.price_no = price_no
+        combined = price_yes + price_no
+        self.combined = combined
+        self.edge_pct = (1.0 - combined) * 100 if combined < 1.0 else 0.0
 
     @property
     def is_arb(self) -> bool:
@@ -141,19 +191,23 @@ class ArbMarket:
 
     @property
     def end_ts(self) -> float:
-        try:
-            from datetime import datetime
-            dt = datetime.fromisoformat(self.end_date.replace("Z", "+00:00"))
-            return dt.timestamp()
-        except Exception:
-            return 0.0
+        return self._end_ts
 
     @property
     def time_remaining_secs(self) -> float:
         return max(0, self.end_ts - time.time())
 
 
-@dataclass
+class NearMiss(NamedTuple):
+    """A market that came within 2¢ of the arb threshold (wall-clock time, for display)."""
+    time: float
+    question: str
+    timeframe: str
+    combined: float
+    gap: float
+
+
+@dataclass(slots=True)
 class ArbExecution:
     timestamp: float
     condition_id: str
@@ -184,35 +238,65 @@ class ArbScannerConfig:
 
 
 class ArbScanner:
-    def __init__(self, config: ArbScannerConfig, polymarket_client=None):
+    MAX_EXECUTIONS = 500
+    MAX_NEAR_MISSES = 200
+    MAX_EXPIRED = 1000
+
+    def __init__(self, config: ArbScannerConfig, polymarket_client=None,
+                 connector: Optional[aiohttp.BaseConnector] = None):
         self.config = config
         self.polymarket = polymarket_client
         self._running = False
         self._session: Optional[aiohttp.ClientSession] = None
+        self._connector = connector  # Shared keep-alive pool (owned by the bot) or None
         self._known_markets: dict[str, ArbMarket] = {}
-        self._expired_markets: dict[str, ArbMarket] = {}
-        self._executions: list[ArbExecution] = []
-        self._cooldowns: dict[str, float] = {}
+        # Indexes over _known_markets, kept in step by _track_market/_expire_market
+        self._markets_by_slug: dict[str, ArbMarket] = {}
+        self._counts_by_tf: dict[str, int] = {}
+        self._expiry_heap: list[tuple[float, str]] = []  # (end_ts, condition_id), min-heap
+        # /events/slug responses: slug → (fetched_at monotonic, event or None), plus in-flight requests
+        self._slug_cache: dict[str, tuple[float, Optional[dict]]] = {}
+        self._slug_inflight: dict[str, asyncio.Future] = {}
+        self._market_view: dict[str, dict] = {}  # condition_id → get_stats row, rebuilt when the market changes
+        # History is bounded for long-running daemons; totals are counted separately
+        self._expired_markets: dict[str, ArbMarket] = {}   # insertion-ordered, trimmed to MAX_EXPIRED
+        self._expired_total = 0
+        self._executions: deque[ArbExecution] = deque(maxlen=self.MAX_EXECUTIONS)
+        self._executions_total = 0
+        self._cooldowns: dict[str, float] = {}        # condition_id → monotonic time of last attempt
         self._daily_trades = 0
         self._daily_spent = 0.0
         self._daily_profit = 0.0
         self._day_start = 0.0
         self._scan_count = 0
-        self._last_discovery = 0.0
+        self._last_discovery = float("-inf")  # monotonic; -inf so the first tick always discovers
         self._last_scan_time_ms = 0.0
-        self._near_misses: list[dict] = []
+        self._near_misses: deque[NearMiss] = deque(maxlen=self.MAX_NEAR_MISSES)  # oldest first, 5-min window
         self._best_edge_seen: float = 0.0
         self._total_markets_discovered = 0
         self._consecutive_errors: int = 0
-        self._backoff_until: float = 0.0
+        self._backoff_until: float = 0.0              # monotonic
         self._discovery_interval = 45.0
         self._gamma_url = "https://gamma-api.polymarket.com"
+        self._event_slug_url = f"{self._gamma_url}/events/slug/"
+        # Slug matcher restricted to the configured timeframes, so the regex
+        # itself rejects other intervals during pagination
+        self._slug_re = re.compile(
+            rf"^{SLUG_PREFIX}({'|'.join(map(re.escape, config.scan_timeframes))})-(\d+)$"
+        )
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
+            owned = self._connector is None
+            # Standalone use gets its own keep-alive pool sized for the slug fan-out
+            connector = self._connector or aiohttp.TCPConnector(
+                limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75,
+            )
             self._session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=15),
-                headers={"Content-Type": "application/json"},
+                headers={"Accept": "application/json"},
+                connector=connector,
+                connector_owner=owned,
             )
         return self._session
 
@@ -223,35 +307,46 @@ class ArbScanner:
     # ── Deterministic Slug Generation ────────────────────────────
 
     @staticmethod
-    def _generate_slugs(timeframes: list, offsets: list = None) -> list[tuple[str, str]]:
+    def _generate_slugs(timeframes: list, offsets: list = None) -> tuple[tuple[str, str], ...]:
         if offsets is None:
-            offsets = [-1, 0, 1, 2]
-        now = int(time.time())
-        slugs = []
-        for tf in timeframes:
-            secs = TIMEFRAME_SECONDS.get(tf)
-            if not secs:
-                continue
-            for offset in offsets:
-                window_ts = (now // secs + offset) * secs
-                if window_ts > 0:
-                    slugs.append((f"btc-updown-{tf}-{window_ts}", tf))
-        return slugs
+            offsets = (-1, 0, 1, 2)
+        return _slugs_for_minute(tuple(timeframes), tuple(offsets), int(time.time()) // 60)
 
     # ── Event Slug Lookup (PRIMARY) ──────────────────────────────
 
+    async def _get_event(self, slug: str) -> Optional[dict]:
+        """
+        GET /events/slug/{slug}, shared across callers.
+
+        A response (including a miss) is reused for the refresh staleness
+        window, and concurrent callers for the same slug await one request.
+        """
+        now = time.monotonic()
+        hit = self._slug_cache.get(slug)
+        if hit is not None and now - hit[0] < self.config.poll_interval_secs * 0.8:
+            return hit[1]
+        pending = self._slug_inflight.get(slug)
+        if pending is None:
+            pending = asyncio.ensure_future(self._request_event(slug))
+            self._slug_inflight[slug] = pending
+            pending.add_done_callback(lambda _f, slug=slug: self._slug_inflight.pop(slug, None))
+        # shield: a cancelled waiter must not cancel the request other callers share
+        return await asyncio.shield(pending)
+
+    async def _request_event(self, slug: str) -> Optional[dict]:
+        session = await self._get_session()
+        async with session.get(self._event_slug_url + slug) as resp:
+            event = _loads(await resp.read()) if resp.status == 200 else None
+        self._slug_cache[slug] = (time.monotonic(), event)
+        return event
+
     async def _fetch_event_by_slug(self, slug: str, timeframe: str) -> Optional[ArbMarket]:
         """GET /events/slug/{slug} → parse clobTokenIds + outcomePrices."""
         try:
-            session = await self._get_session()
-            url = f"{self._gamma_url}/events/slug/{slug}"
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    return None
-                event = await resp.json()
+            event = await self._get_event(slug)
             return _parse_market_from_event(event, slug, timeframe)
         except Exception as e:
-            logger.debug(f"Event slug lookup failed for {slug}: {e}")
+            logger.debug("Event slug lookup failed for %s: %s", slug, e)
             return None
 
     async def _discover_by_slug(self) -> list[ArbMarket]:
@@ -259,13 +354,14 @@ class ArbScanner:
         found = []
         tasks = []
         for slug, tf in slugs:
-            existing = next((m for m in self._known_markets.values() if m.slug == slug), None)
+            existing = self._markets_by_slug.get(slug)
             if existing and existing.time_remaining_secs > 0:
                 found.append(existing)
                 continue
             tasks.append(self._fetch_event_by_slug(slug, tf))
         if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Bounded like _refresh_prices so a slow Gamma can't monopolise the pool
+            results = await gather_pooled(tasks, limit=20)
             for r in results:
                 if isinstance(r, ArbMarket):
                     found.append(r)
@@ -284,18 +380,18 @@ class ArbScanner:
                 async with session.get(f"{self._gamma_url}/events", params=params) as resp:
                     if resp.status != 200:
                         break
-                    data = await resp.json()
+                    data = _loads(await resp.read())
                 if not data:
                     break
+                slug_re = self._slug_re
                 for ev in data:
                     slug = ev.get("slug", "")
-                    match = SLUG_PATTERN.match(slug)
+                    if not slug.startswith(SLUG_PREFIX):
+                        continue  # Nearly every event on the page; skip the regex
+                    match = slug_re.match(slug)
                     if not match:
                         continue
-                    tf = match.group(1)
-                    if tf not in self.config.scan_timeframes:
-                        continue
-                    mkt = _parse_market_from_event(ev, slug, tf)
+                    mkt = _parse_market_from_event(ev, slug, match.group(1))
                     if mkt:
                         found.append(mkt)
                 if len(data) < 100:
@@ -309,73 +405,116 @@ class ArbScanner:
     # ── Combined Discovery ───────────────────────────────────────
 
     async def _discover_markets(self) -> list[ArbMarket]:
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_discovery < self._discovery_interval and self._known_markets:
             return list(self._known_markets.values())
 
+        # Drop cached lookups for windows that are long gone
+        cutoff = now - self._discovery_interval
+        self._slug_cache = {k: v for k, v in self._slug_cache.items() if v[0] >= cutoff}
+
         found = await self._discover_by_slug()
         if not found:
             logger.info("Slug lookup found 0 — trying events pagination...")
             found = await self._discover_by_pagination()
 
-        # Expire old
-        for cid, mkt in list(self._known_markets.items()):
-            if mkt.time_remaining_secs <= 0:
-                self._expired_markets[cid] = mkt
-                del self._known_markets[cid]
-
         for market in found:
             if market.time_remaining_secs > 0:
-                self._known_markets[market.condition_id] = market
+                self._track_market(market)
 
         self._last_discovery = now
         self._total_markets_discovered = len(self._known_markets)
 
-        by_tf = {}
-        for mkt in self._known_markets.values():
-            by_tf.setdefault(mkt.timeframe, 0)
-            by_tf[mkt.timeframe] += 1
-        summary = " · ".join(f"{TIMEFRAME_LABELS.get(k, k)}: {v}" for k, v in sorted(by_tf.items()))
+        summary = " · ".join(f"{TIMEFRAME_LABELS.get(k, k)}: {v}" for k, v in sorted(self._counts_by_tf.items()))
         logger.info(f"🔍 Discovered {len(self._known_markets)} BTC markets — {summary}")
         return list(self._known_markets.values())
 
+    def _track_market(self, market: ArbMarket):
+        old = self._known_markets.get(market.condition_id)
+        if old is market:
+            return
+        if old is not None:
+            self._untrack(old)
+        self._known_markets[market.condition_id] = market
+        self._markets_by_slug[market.slug] = market
+        self._counts_by_tf[market.timeframe] = self._counts_by_tf.get(market.timeframe, 0) + 1
+        heapq.heappush(self._expiry_heap, (market.end_ts, market.condition_id))
+        self._market_view[market.condition_id] = self._market_row(market)
+
+    def _expire_market(self, cid: str):
+        mkt = self._known_markets.pop(cid, None)
+        if mkt is not None:
+            self._untrack(mkt)
+            self._expired_markets[cid] = mkt
+            self._expired_total += 1
+            if len(self._expired_markets) > self.MAX_EXPIRED:
+                del self._expired_markets[next(iter(self._expired_markets))]
+
+    def _evict_expired(self) -> int:
+        """Expire markets whose end time has passed, popping only those off the heap."""
+        now = time.time()
+        heap = self._expiry_heap
+        evicted = 0
+        while heap and heap[0][0] <= now:
+            _, cid = heapq.heappop(heap)
+            mkt = self._known_markets.get(cid)
+            # Entries left behind by a replaced market are skipped
+            if mkt is not None and mkt.end_ts <= now:
+                self._expire_market(cid)
+                evicted += 1
+        return evicted
+
+    def _market_row(self, m: ArbMarket) -> dict:
+        combined = m.combined
+        return {"question": m.question[:70], "timeframe": m.timeframe, "tf_label": TIMEFRAME_LABELS.get(m.timeframe, m.timeframe), "price_yes": m.price_yes, "price_no": m.price_no, "combined": round(combined, 4), "edge_pct": round(m.edge_pct, 2), "liquidity": m.liquidity, "volume": m.volume, "time_remaining": m.time_remaining_secs, "end_date": m.end_date, "end_ts": m.end_ts, "is_arb": combined > 0 and combined < self.config.arb_threshold}
+
+    def _untrack(self, mkt: ArbMarket):
+        self._market_view.pop(mkt.condition_id, None)
+        if self._markets_by_slug.get(mkt.slug) is mkt:
+            del self._markets_by_slug[mkt.slug]
+        left = self._counts_by_tf.get(mkt.timeframe, 0) - 1
+        if left > 0:
+            self._counts_by_tf[mkt.timeframe] = left
+        else:
+            self._counts_by_tf.pop(mkt.timeframe, None)
+
     # ── Price Refresh ────────────────────────────────────────────
 
     async def _refresh_prices(self, markets: list[ArbMarket]) -> list[ArbMarket]:
         """Re-fetch events by slug to get updated outcomePrices."""
         if not markets:
             return markets
-        now = time.time()
+        now = time.monotonic()
         stale = self.config.poll_interval_secs * 0.8
+        due = [m for m in markets if now - m.last_refreshed >= stale and m.time_remaining_secs > 0]
         try:
-            session = await self._get_session()
-            for mkt in markets:
-                if now - mkt.last_refreshed < stale or mkt.time_remaining_secs <= 0:
-                    continue
-                try:
-                    url = f"{self._gamma_url}/events/slug/{mkt.slug}"
-                    async with session.get(url) as resp:
-                        if resp.status != 200:
-                            continue
-                        event = await resp.json()
-                    ms = event.get("markets", [])
-                    if not ms:
-                        continue
-                    m = ms[0]
-                    prices = _safe_json(m.get("outcomePrices"))
-                    if len(prices) >= 2:
-                        mkt.price_yes = float(prices[0])
-                        mkt.price_no = float(prices[1])
-                    mkt.liquidity = float(m.get("liquidityClob", m.get("liquidityNum", 0)))
-                    mkt.volume = float(m.get("volumeNum", m.get("volume", 0)))
-                    mkt.last_refreshed = now
-                except Exception:
-                    pass
+            # All due markets in flight at once, bounded by the per-host pool size
+            await gather_pooled((self._refresh_one(m, now) for m in due), limit=20)
             return list(self._known_markets.values())
         except Exception as e:
             logger.error(f"Price refresh error: {e}")
             return markets
 
+    async def _refresh_one(self, mkt: ArbMarket, now: float):
+        try:
+            event = await self._get_event(mkt.slug)
+            if not event:
+                return
+            ms = event.get("markets", [])
+            if not ms:
+                return
+            m = ms[0]
+            prices = _safe_json(m.get("outcomePrices"))
+            if len(prices) >= 2:
+                mkt.set_prices(float(prices[0]), float(prices[1]))
+            mkt.liquidity = float(m.get("liquidityClob", m.get("liquidityNum", 0)))
+            mkt.volume = float(m.get("volumeNum", m.get("volume", 0)))
+            mkt.last_refreshed = now
+            if self._known_markets.get(mkt.condition_id) is mkt:
+                self._market_view[mkt.condition_id] = self._market_row(mkt)
+        except Exception:
+            pass
+
     # ── Fee Estimation (Phase 1) ───────────────────────────────
 
     @staticmethod
@@ -393,33 +532,44 @@ class ArbScanner:
 
     def _find_opportunities(self, markets: list[ArbMarket]) -> list[ArbMarket]:
         now = time.time()
+        threshold = self.config.arb_threshold
+        near_miss_ceiling = threshold + 0.02
+        min_edge = self.config.min_edge_pct
+        mono = time.monotonic()
+        cooldowns = self._cooldowns
+        cooldown_secs = self.config.cooldown_per_market_secs
         opps = []
         for m in markets:
-            if m.combined == 0 or m.time_remaining_secs <= 0:
+            combined = m.combined
+            if combined == 0 or m.end_ts <= now:
                 continue
-            if m.combined < self.config.arb_threshold + 0.02 and m.combined >= self.config.arb_threshold:
-                self._near_misses = [nm for nm in self._near_misses if now - nm.get("time", 0) < 300]
-                self._near_misses.append({"time": now, "question": m.question[:60], "timeframe": m.timeframe, "combined": round(m.combined, 4), "gap": round((1.0 - m.combined) * 100, 2)})
-            if m.combined >= self.config.arb_threshold:
+            if threshold <= combined < near_miss_ceiling:
+                near = self._near_misses
+                while near and now - near[0].time >= 300:
+                    near.popleft()
+                near.append(NearMiss(now, m.question[:60], m.timeframe, round(combined, 4), round((1.0 - combined) * 100, 2)))
+            if combined >= threshold:
                 continue
-            if m.edge_pct < self.config.min_edge_pct:
+            edge_pct = m.edge_pct
+            if edge_pct < min_edge:
                 continue
 
             # ── Fee-aware profit check (Phase 1) ──
             fee_yes_pct = self._estimate_taker_fee_pct(m.price_yes)
             fee_no_pct = self._estimate_taker_fee_pct(m.price_no)
             total_fee_pct = fee_yes_pct + fee_no_pct
-            net_edge_pct = m.edge_pct - total_fee_pct
+            net_edge_pct = edge_pct - total_fee_pct
             if net_edge_pct <= 0:
                 logger.debug(
-                    f"Arb edge {m.edge_pct:.2f}% wiped by fees "
-                    f"({fee_yes_pct:.2f}%+{fee_no_pct:.2f}%={total_fee_pct:.2f}%) — skipping"
+                    "Arb edge %.2f%% wiped by fees (%.2f%%+%.2f%%=%.2f%%) — skipping",
+                    edge_pct, fee_yes_pct, fee_no_pct, total_fee_pct,
                 )
                 continue
 
             if net_edge_pct > self._best_edge_seen:
                 self._best_edge_seen = net_edge_pct
-            if now - self._cooldowns.get(m.condition_id, 0) < self.config.cooldown_per_market_secs:
+            last_attempt = cooldowns.get(m.condition_id)
+            if last_attempt is not None and mono - last_attempt < cooldown_secs:
                 continue
             if m.liquidity < self.config.min_liquidity_usd:
                 continue
@@ -444,23 +594,32 @@ class ArbScanner:
         net_profit = round(gross_profit - total_fees, 2)
 
         if net_profit <= 0:
-            logger.info(f"⚠️ ARB gross=${gross_profit:.2f} but fees=${total_fees:.2f} → net=${net_profit:.2f} — skipping")
+            logger.info("⚠️ ARB gross=$%.2f but fees=$%.2f → net=$%.2f — skipping", gross_profit, total_fees, net_profit)
             return None
 
         execution = ArbExecution(timestamp=now, condition_id=market.condition_id, question=market.question, timeframe=market.timeframe, price_yes=market.price_yes, price_no=market.price_no, combined=market.combined, edge_pct=market.edge_pct, size_per_side=self.config.size_per_side_usd, guaranteed_profit=net_profit)
         tf_label = TIMEFRAME_LABELS.get(market.timeframe, market.timeframe)
         logger.info(
-            f"💰 ARB [{tf_label}]: {market.question[:60]}... | "
-            f"YES={market.price_yes:.3f} + NO={market.price_no:.3f} = {market.combined:.3f} | "
-            f"edge={market.edge_pct:.1f}% | gross=${gross_profit:.2f} fees=${total_fees:.2f} net=${net_profit:.2f}"
+            "💰 ARB [%s]: %s... | YES=%.3f + NO=%.3f = %.3f | edge=%.1f%% | gross=$%.2f fees=$%.2f net=$%.2f",
+            tf_label, market.question[:60], market.price_yes, market.price_no, market.combined,
+            market.edge_pct, gross_profit, total_fees, net_profit,
         )
         if self.polymarket:
             try:
                 from core.polymarket_client import BinaryMarket, MarketStatus
-                bm = BinaryMarket(condition_id=market.condition_id, question=market.question, slug=market.slug, token_id_up=market.token_id_yes, token_id_down=market.token_id_no, price_up=market.price_yes, price_down=market.price_no, volume=market.volume, liquidity=market.liquidity, created_at="", end_date=market.end_date, status=MarketStatus.ACTIVE)
-                yes_trade = await self.polymarket.place_order(market=bm, direction="up", size_usd=self.config.size_per_side_usd, oracle_price=0.0, confidence=1.0)
+                bm = BinaryMarket(condition_id=market.condition_id, question=market.question, slug=market.slug, token_id_up=market.token_id_yes, token_id_down=market.token_id_no, price_up=market.price_yes, price_down=market.price_no, volume=market.volume, liquidity=market.liquidity, created_at="", end_date=market.end_date, status=MarketStatus.ACTIVE, end_ts=market.end_ts)
+                # Both legs hit the CLOB together — the gap between them is pure leg risk
+                yes_trade, no_trade = await asyncio.gather(
+                    self.polymarket.place_order(market=bm, direction="up", size_usd=self.config.size_per_side_usd, oracle_price=0.0, confidence=1.0),
+                    self.polymarket.place_order(market=bm, direction="down", size_usd=self.config.size_per_side_usd, oracle_price=0.0, confidence=1.0),
+                    return_exceptions=True,
+                )
+                for side, leg in (("YES", yes_trade), ("NO", no_trade)):
+                    if isinstance(leg, BaseException):
+                        logger.error("Arb %s leg error: %s", side, leg)
+                if isinstance(yes_trade, BaseException): yes_trade = None
+                if isinstance(no_trade, BaseException): no_trade = None
                 if yes_trade: execution.order_id_yes = yes_trade.order_id
-                no_trade = await self.polymarket.place_order(market=bm, direction="down", size_usd=self.config.size_per_side_usd, oracle_price=0.0, confidence=1.0)
                 if no_trade: execution.order_id_no = no_trade.order_id
                 execution.status = "filled" if (yes_trade and no_trade) else "partial" if (yes_trade or no_trade) else "failed"
             except Exception as e:
@@ -469,7 +628,8 @@ class ArbScanner:
         else:
             execution.status = "dry_run"
         self._executions.append(execution)
-        self._cooldowns[market.condition_id] = now
+        self._executions_total += 1
+        self._cooldowns[market.condition_id] = time.monotonic()
         self._daily_trades += 1
         self._daily_spent += cost
         if execution.status in ("filled", "dry_run"):
@@ -492,7 +652,7 @@ class ArbScanner:
                 self._check_daily_reset()
 
                 # ── Backoff check: skip scan if backing off after errors ──
-                now = time.time()
+                now = time.monotonic()
                 if now < self._backoff_until:
                     remaining = int(self._backoff_until - now)
                     if self._scan_count % 10 == 0:
@@ -502,21 +662,24 @@ class ArbScanner:
                     continue
 
                 self._scan_count += 1
-                scan_start = time.time()
-                if time.time() - self._last_discovery > self._discovery_interval:
+                scan_start = time.monotonic()
+                # The one expiry pass per tick; _find_opportunities also skips
+                # anything that ends while this scan's requests are in flight
+                self._evict_expired()
+                if scan_start - self._last_discovery > self._discovery_interval:
                     await self._discover_markets()
                 else:
                     await self._refresh_prices(list(self._known_markets.values()))
-                for cid in [c for c, m in self._known_markets.items() if m.time_remaining_secs <= 0]:
-                    self._expired_markets[cid] = self._known_markets.pop(cid)
                 opps = self._find_opportunities(list(self._known_markets.values()))
-                if opps:
-                    opps.sort(key=lambda m: m.edge_pct, reverse=True)
-                    for opp in opps:
+                remaining = self.config.max_daily_arb_trades - self._daily_trades
+                if opps and remaining > 0:
+                    # Best edge first; an opportunity _execute_arb turns down falls
+                    # through to the next one until today's trade/budget cap is hit
+                    for opp in sorted(opps, key=_edge_pct, reverse=True):
                         await self._execute_arb(opp)
                         if self._daily_trades >= self.config.max_daily_arb_trades or self._daily_spent >= self.config.max_daily_arb_budget:
                             break
-                self._last_scan_time_ms = (time.time() - scan_start) * 1000
+                self._last_scan_time_ms = (time.monotonic() - scan_start) * 1000
 
                 # ── Success: reset error counter ──
                 self._consecutive_errors = 0
@@ -528,7 +691,7 @@ class ArbScanner:
             except Exception as e:
                 self._consecutive_errors += 1
                 backoff_secs = min(300, self.config.poll_interval_secs * (2 ** self._consecutive_errors))
-                self._backoff_until = time.time() + backoff_secs
+                self._backoff_until = time.monotonic() + backoff_secs
                 logger.error(f"Arb scan error: {e} — backing off {backoff_secs:.0f}s after {self._consecutive_errors} consecutive errors", exc_info=True)
             await asyncio.sleep(self.config.poll_interval_secs)
         await self._close_session()
@@ -541,15 +704,16 @@ class ArbScanner:
 
     def get_stats(self) -> dict:
         by_tf = self._count_by_timeframe()
-        market_list = [{"question": m.question[:70], "timeframe": m.timeframe, "tf_label": TIMEFRAME_LABELS.get(m.timeframe, m.timeframe), "price_yes": m.price_yes, "price_no": m.price_no, "combined": round(m.combined, 4), "edge_pct": round(m.edge_pct, 2), "liquidity": m.liquidity, "volume": m.volume, "time_remaining": m.time_remaining_secs, "end_date": m.end_date, "is_arb": m.combined > 0 and m.combined < self.config.arb_threshold} for m in sorted(self._known_markets.values(), key=lambda x: x.end_ts)]
-        return {"running": self._running, "scan_count": self._scan_count, "scan_time_ms": round(self._last_scan_time_ms, 1), "poll_interval": self.config.poll_interval_secs, "markets_live": len(self._known_markets), "markets_expired": len(self._expired_markets), "markets_by_timeframe": by_tf, "market_list": market_list[-50:], "threshold": self.config.arb_threshold, "size_per_side": self.config.size_per_side_usd, "timeframes": self.config.scan_timeframes, "daily_trades": self._daily_trades, "daily_profit": round(self._daily_profit, 2), "daily_spent": round(self._daily_spent, 2), "daily_budget": self.config.max_daily_arb_budget, "daily_budget_remaining": round(self.config.max_daily_arb_budget - self._daily_spent, 2), "daily_max_trades": self.config.max_daily_arb_trades, "best_edge_pct": round(self._best_edge_seen, 2), "near_misses": self._near_misses[-5:], "total_executions": len(self._executions), "consecutive_errors": self._consecutive_errors, "backoff_remaining_secs": max(0, round(self._backoff_until - time.time(), 1)) if self._backoff_until > time.time() else 0, "recent_arbs": [{"time": e.timestamp, "timeframe": e.timeframe, "tf_label": TIMEFRAME_LABELS.get(e.timeframe, e.timeframe), "edge_pct": round(e.edge_pct, 2), "profit": e.guaranteed_profit, "status": e.status, "yes": e.price_yes, "no": e.price_no, "combined": round(e.combined, 4), "question": e.question[:60]} for e in self._executions[-10:]]}
+        now = time.time()
+        # Latest-ending 50, oldest first; copies, since earlier snapshots may still be serialized
+        market_list = [
+            {**row, "time_remaining": max(0, row["end_ts"] - now)}
+            for row in reversed(heapq.nlargest(50, self._market_view.values(), key=_row_end_ts))
+        ]
+        return {"running": self._running, "scan_count": self._scan_count, "scan_time_ms": round(self._last_scan_time_ms, 1), "poll_interval": self.config.poll_interval_secs, "markets_live": len(self._known_markets), "markets_expired": self._expired_total, "markets_by_timeframe": by_tf, "market_list": market_list, "threshold": self.config.arb_threshold, "size_per_side": self.config.size_per_side_usd, "timeframes": self.config.scan_timeframes, "daily_trades": self._daily_trades, "daily_profit": round(self._daily_profit, 2), "daily_spent": round(self._daily_spent, 2), "daily_budget": self.config.max_daily_arb_budget, "daily_budget_remaining": round(self.config.max_daily_arb_budget - self._daily_spent, 2), "daily_max_trades": self.config.max_daily_arb_trades, "best_edge_pct": round(self._best_edge_seen, 2), "near_misses": [nm._asdict() for nm in islice(self._near_misses, max(0, len(self._near_misses) - 5), None)], "total_executions": self._executions_total, "consecutive_errors": self._consecutive_errors, "backoff_remaining_secs": max(0.0, round(self._backoff_until - time.monotonic(), 1)), "recent_arbs": [{"time": e.timestamp, "timeframe": e.timeframe, "tf_label": TIMEFRAME_LABELS.get(e.timeframe, e.timeframe), "edge_pct": round(e.edge_pct, 2), "profit": e.guaranteed_profit, "status": e.status, "yes": e.price_yes, "no": e.price_no, "combined": round(e.combined, 4), "question": e.question[:60]} for e in islice(reversed(self._executions), 10)][::-1]}
 
     def _count_by_timeframe(self) -> dict:
-        counts = {}
-        for m in self._known_markets.values():
-            counts.setdefault(m.timeframe, 0)
-            counts[m.timeframe] += 1
-        return counts
+        return dict(self._counts_by_tf)
 
     def get_executions(self) -> list[ArbExecution]:
-        return self._executions.copy()
+        return list(self._executions)
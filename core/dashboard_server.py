@@ -8,9 +8,13 @@ Full 1920x1080 streaming-grade dashboard.
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import logging
 import time
+from dataclasses import dataclass
+from operator import itemgetter
 from typing import Optional
 
 import aiohttp
@@ -18,15 +22,68 @@ from aiohttp import web
 
 logger = logging.getLogger("dashboard")
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_bytes(payload: dict | list) -> bytes:
+    """Serialize a dashboard payload to UTF-8 JSON (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=str).encode()
+
+
+def _dumps(payload: dict | list) -> str:
+    """Serialize a dashboard payload to a JSON text frame."""
+    if HAS_ORJSON:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload, default=str)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True if an Accept-Encoding header allows gzip (an explicit or `*` entry with q > 0)."""
+    allowed = None
+    for token in accept_encoding.split(","):
+        coding, _, params = token.strip().partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "*":
+            allowed = q > 0 if allowed is None else allowed  # only when gzip isn't named
+        else:
+            return q > 0
+    return bool(allowed)
+
 
 class DashboardServer:
+    BATCH_WINDOW = 0.05  # seconds to coalesce bursts of messages into one frame
+    CLIENT_QUEUE = 32    # frames a client may fall behind before it is dropped
+
     def __init__(self, host="0.0.0.0", port=8765):
         self.host = host
         self.port = port
         self.clients: set[web.WebSocketResponse] = set()
+        # Per-client outbound queue + the relay task draining it into the socket
+        self._relays: dict[web.WebSocketResponse, tuple[asyncio.Queue, asyncio.Task]] = {}
         self._state: dict = {}
+        self._state_body: Optional[bytes] = None  # _state serialized once, shared by /state and ws
+        self._state_text: Optional[str] = None  # _state_body decoded as a text frame
+        self._state_hash: Optional[int] = None  # content fingerprint of _state, minus its timestamp
         self._running = False
         self._runner: Optional[web.AppRunner] = None
+        self._outbox: list[dict] = []  # messages waiting for the next batched frame
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def start(self):
         app = web.Application()
@@ -41,44 +98,140 @@ class DashboardServer:
         logger.info(f"Dashboard: http://localhost:{self.port}")
 
     async def _handle_page(self, request):
-        return web.Response(text=_build_html(), content_type="text/html")
+        # Static page: encoded once at import; revalidated by ETag so browsers
+        # still pick up a new page after an upgrade
+        if _accepts_gzip(request.headers.get("Accept-Encoding", "")):
+            body, etag = _HTML_GZ, _HTML_ETAG_GZ
+            headers = {"Content-Encoding": "gzip"}
+        else:
+            body, etag = _HTML_BYTES, _HTML_ETAG
+            headers = {}
+        headers.update({"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"})
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type="text/html", charset="utf-8", headers=headers)
 
     async def _handle_state(self, request):
-        return web.json_response(self._state)
+        # Same serialization the websocket clients get; only re-encoded when state changes.
+        # Weak ETag from the content fingerprint: pollers that are current get a 304
+        if self._state_hash is None:
+            return web.Response(body=self._state_payload(), content_type="application/json")
+        etag = f'W/"{self._state_hash & 0xFFFFFFFFFFFFFFFF:016x}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=self._state_payload(), content_type="application/json", headers=headers)
 
     async def _handle_ws(self, request):
-        ws = web.WebSocketResponse()
+        # No permessage-deflate: it would rerun zlib on the same frame for every
+        # client, and aiohttp has no public way to share one compressed frame
+        ws = web.WebSocketResponse(compress=False)
         await ws.prepare(request)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.CLIENT_QUEUE)
+        if self._state:
+            queue.put_nowait(self._state_frame())
+        relay = asyncio.create_task(self._relay(ws, queue))
+        self._relays[ws] = (queue, relay)
         self.clients.add(ws)
         logger.info(f"Dashboard client connected ({len(self.clients)} total)")
         try:
-            if self._state:
-                await ws.send_json(self._state)
             async for msg in ws:
                 if msg.type == aiohttp.WSMsgType.PING:
                     await ws.pong(msg.data)
                 elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR):
                     break
         finally:
+            relay.cancel()
+            self._relays.pop(ws, None)
             self.clients.discard(ws)
             logger.info(f"Dashboard client disconnected ({len(self.clients)} remaining)")
         return ws
 
-    async def broadcast(self, state: dict):
-        self._state = state
-        dead = set()
-        for ws in self.clients:
+    async def broadcast(self, msg: dict):
+        # Only full-state messages become the snapshot new clients and /state get;
+        # price ticks / toasts / engine events are fire-and-forget
+        if msg.get("type") == "state":
+            # Serialized exactly once: the timestamp is set aside so re-sends of an
+            # unchanged state hash the same (callers may mutate and resend the same
+            # dict), then spliced back into those bytes for the outgoing frame
+            ts = msg.pop("timestamp", None)
+            try:
+                body = _dumps_bytes(msg)
+            finally:
+                if ts is not None:
+                    msg["timestamp"] = ts
+            state_hash = hash(body)
+            if state_hash == self._state_hash:
+                return
+            if ts is not None:
+                body = b'{"timestamp":' + _dumps_bytes(ts) + b"," + body[1:]
+            self._state = msg
+            self._state_body = body
+            self._state_text = None
+            self._state_hash = state_hash
+        if not self.clients:
+            return
+        # Queue and return: messages arriving within BATCH_WINDOW go out as one frame
+        self._outbox.append(msg)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_outbox())
+
+    async def _flush_outbox(self):
+        await asyncio.sleep(self.BATCH_WINDOW)
+        batch, self._outbox = self._outbox, []
+        if not batch or not self.clients:
+            return
+        # A lone message is sent as-is; a burst as a JSON array. Serialized once for
+        # every client, as text because the pages JSON.parse() e.data.
+        if len(batch) == 1 and batch[0] is self._state:
+            frame = self._state_frame()  # shared with clients that connect later
+        else:
+            frame = _dumps(batch[0] if len(batch) == 1 else batch)
+        # Hand the frame to each client's relay; a client whose queue is full
+        # has stopped keeping up and is dropped rather than buffered forever
+        for ws, (queue, relay) in tuple(self._relays.items()):
             try:
-                await ws.send_json(state)
-            except Exception:
-                dead.add(ws)
-        self.clients -= dead
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                logger.warning("Dashboard client too slow — dropping it")
+                self.clients.discard(ws)
+                del self._relays[ws]
+                relay.cancel()  # the relay closes the socket on its way out
+
+    @staticmethod
+    async def _relay(ws: web.WebSocketResponse, queue: asyncio.Queue):
+        """Drain one client's queue into its socket; closes the socket when stopped."""
+        try:
+            while True:
+                await ws.send_str(await queue.get())
+        except Exception:
+            pass
+        finally:
+            if not ws.closed:
+                await ws.close()
+
+    def _state_frame(self) -> str:
+        """The latest state as a text frame, decoded once per state."""
+        if self._state_text is None:
+            self._state_text = self._state_payload().decode()
+        return self._state_text
+
+    def _state_payload(self) -> bytes:
+        """The latest state as a UTF-8 body, as serialized by broadcast()."""
+        if self._state_body is None:
+            self._state_body = _dumps_bytes(self._state)  # only before the first state
+        return self._state_body
 
     async def stop(self):
         self._running = False
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        for _, relay in self._relays.values():
+            relay.cancel()
         for ws in list(self.clients):
             await ws.close()
         self.clients.clear()
+        self._relays.clear()
         if self._runner:
             await self._runner.cleanup()
         logger.info("Dashboard server stopped")
@@ -92,39 +245,108 @@ class DashboardServer:
         return self._running
 
 
-def build_dashboard_state(cycle, consensus, anchor, decision, risk_manager, polymarket_client, edge_config, config, arb_scanner=None):
-    stats = polymarket_client.get_stats()
-    risk_status = risk_manager.get_status()
-    open_trades = polymarket_client.get_trade_records()
-    live_capital = round(risk_manager.capital, 2)
+# -- Per-broadcast snapshots --
+# Read once from the live engines, then consumed by build_dashboard_state().
+
+# RiskManager.get_status() keys, in RiskSnapshot field order after `capital`
+_RISK_STATUS = itemgetter(
+    "daily_trades", "daily_pnl", "daily_loss_pct", "consecutive_losses", "in_cooldown", "total_pnl",
+    "5m_trades", "5m_wins", "5m_losses", "5m_pnl",
+    "late_window_trades", "late_window_wins", "late_window_losses", "late_window_pnl",
+)
+# PolymarketClient.get_stats() omits wins/losses until a trade resolves
+_POLY_STATS_DEFAULTS = {"wins": 0, "losses": 0, "win_rate": 0, "total_pnl": 0, "total_wagered": 0, "total_trades": 0, "completed": 0, "pending": 0}
+_POLY_STATS = itemgetter(*_POLY_STATS_DEFAULTS)
+
+@dataclass(frozen=True, slots=True)
+class RiskSnapshot:
+    capital: float
+    daily_trades: int
+    daily_pnl: float
+    daily_loss_pct: float
+    consecutive_losses: int
+    in_cooldown: bool
+    total_pnl: float
+    trades_5m: int
+    wins_5m: int
+    losses_5m: int
+    pnl_5m: float
+    late_window_trades: int
+    late_window_wins: int
+    late_window_losses: int
+    late_window_pnl: float
+
+    @classmethod
+    def capture(cls, risk_manager) -> "RiskSnapshot":
+        return cls(round(risk_manager.capital, 2), *_RISK_STATUS(risk_manager.get_status()))
 
-    signals = {}
-    for s in (decision.signals if decision else []):
-        signals[s.name] = {"direction": s.direction.value, "strength": round(s.strength, 3), "raw_value": round(s.raw_value, 4), "description": s.description}
 
-    open_pos = []
-    for t in open_trades:
-        if t.outcome is None:
-            open_pos.append({"id": t.trade_id, "direction": t.direction, "size_usd": t.size_usd, "entry_price": t.entry_price, "confidence": t.confidence, "timestamp": t.timestamp, "oracle_price": t.oracle_price_at_entry})
+@dataclass(frozen=True, slots=True)
+class PolymarketSnapshot:
+    wins: int
+    losses: int
+    win_rate: float
+    total_pnl: float
+    total_wagered: float
+    total_trades: int
+    completed: int
+    pending: int
+    open_positions: tuple
+    closed_positions: tuple  # last 50 resolved trades
 
-    closed_pos = []
-    for t in open_trades:
-        if t.outcome is not None:
-            closed_pos.append({"id": t.trade_id, "direction": t.direction, "size_usd": t.size_usd, "entry_price": t.entry_price, "confidence": t.confidence, "pnl": t.pnl, "outcome": t.outcome, "timestamp": t.timestamp})
+    @classmethod
+    def capture(cls, polymarket_client) -> "PolymarketSnapshot":
+        stats = _POLY_STATS({**_POLY_STATS_DEFAULTS, **polymarket_client.get_stats()})
+        open_pos = tuple(
+            {"id": t.trade_id, "direction": t.direction, "size_usd": t.size_usd, "entry_price": t.entry_price, "confidence": t.confidence, "timestamp": t.timestamp, "oracle_price": t.oracle_price_at_entry}
+            for t in polymarket_client.iter_open_trades()
+        )
+        # Resolved trades come from the client's bounded ring, not a scan of all history
+        closed_pos = polymarket_client.get_recent_closed()
+        return cls(
+            *stats,
+            open_positions=open_pos,
+            closed_positions=tuple(
+                {"id": t.trade_id, "direction": t.direction, "size_usd": t.size_usd, "entry_price": t.entry_price, "confidence": t.confidence, "pnl": t.pnl, "outcome": t.outcome, "timestamp": t.timestamp}
+                for t in closed_pos
+            ),
+        )
+
+
+def build_dashboard_state(cycle, consensus, anchor, decision, risk: RiskSnapshot, polymarket: PolymarketSnapshot, edge_config, config, arb_scanner=None):
+    live_capital = risk.capital
+
+    # Each optional input is tested once, not once per field
+    if consensus:
+        oracle = {"price": consensus.price, "chainlink": consensus.chainlink_price, "sources": consensus.sources, "spread_pct": consensus.spread_pct}
+    else:
+        oracle = {"price": 0, "chainlink": None, "sources": [], "spread_pct": 0}
+    drift_pct = decision.drift_pct if decision else None
+    if anchor:
+        anchor_state = {"open_price": anchor.open_price, "source": anchor.source, "drift_pct": drift_pct}
+    else:
+        anchor_state = {"open_price": None, "source": None, "drift_pct": drift_pct}
+    signals = {}
+    if decision:
+        strategy = {"direction": decision.direction.value, "confidence": decision.confidence, "should_trade": decision.should_trade, "reason": decision.reason, "drift_pct": drift_pct, "volatility_pct": decision.volatility_pct}
+        for s in decision.signals:
+            signals[s.name] = {"direction": s.direction.value, "strength": round(s.strength, 3), "raw_value": round(s.raw_value, 4), "description": s.description}
+    else:
+        strategy = {"direction": "hold", "confidence": 0, "should_trade": False, "reason": "", "drift_pct": None, "volatility_pct": 0}
 
     arb_stats = arb_scanner.get_stats() if arb_scanner else None
 
     # ── Per-engine stats ──
     # 15m directional: global stats minus 5m (since record_trade handles 15m+LW resolutions)
-    g_wins = stats.get("wins", 0)
-    g_losses = stats.get("losses", 0)
-    g_pnl = stats.get("total_pnl", 0)
-    w5 = risk_status.get("5m_wins", 0)
-    l5 = risk_status.get("5m_losses", 0)
-    p5 = risk_status.get("5m_pnl", 0)
-    lw_w = risk_status.get("late_window_wins", 0)
-    lw_l = risk_status.get("late_window_losses", 0)
-    lw_p = risk_status.get("late_window_pnl", 0)
+    g_wins = polymarket.wins
+    g_losses = polymarket.losses
+    g_pnl = polymarket.total_pnl
+    w5 = risk.wins_5m
+    l5 = risk.losses_5m
+    p5 = risk.pnl_5m
+    lw_w = risk.late_window_wins
+    lw_l = risk.late_window_losses
+    lw_p = risk.late_window_pnl
     # 15m = global minus 5m (LW resolutions go through record_trade so are mixed in global)
     dir15_wins = max(0, g_wins - w5 - lw_w)
     dir15_losses = max(0, g_losses - l5 - lw_l)
@@ -138,13 +360,13 @@ def build_dashboard_state(cycle, consensus, anchor, decision, risk_manager, poly
             "win_rate": round(dir15_wins / max(1, dir15_wins + dir15_losses) * 100, 1),
         },
         "dir_5m": {
-            "trades": risk_status.get("5m_trades", 0),
+            "trades": risk.trades_5m,
             "wins": w5, "losses": l5,
             "pnl": p5,
             "win_rate": round(w5 / max(1, w5 + l5) * 100, 1),
         },
         "late_window": {
-            "trades": risk_status.get("late_window_trades", 0),
+            "trades": risk.late_window_trades,
             "wins": lw_w, "losses": lw_l,
             "pnl": lw_p,
             "win_rate": round(lw_w / max(1, lw_w + lw_l) * 100, 1),
@@ -153,13 +375,13 @@ def build_dashboard_state(cycle, consensus, anchor, decision, risk_manager, poly
 
     return {
         "type": "state", "timestamp": time.time(), "cycle": cycle,
-        "oracle": {"price": consensus.price if consensus else 0, "chainlink": consensus.chainlink_price if consensus else None, "sources": consensus.sources if consensus else [], "spread_pct": consensus.spread_pct if consensus else 0},
-        "anchor": {"open_price": anchor.open_price if anchor else None, "source": anchor.source if anchor else None, "drift_pct": decision.drift_pct if decision else None},
-        "strategy": {"direction": decision.direction.value if decision else "hold", "confidence": decision.confidence if decision else 0, "should_trade": decision.should_trade if decision else False, "reason": decision.reason if decision else "", "drift_pct": decision.drift_pct if decision else None, "volatility_pct": decision.volatility_pct if decision else 0},
+        "oracle": oracle,
+        "anchor": anchor_state,
+        "strategy": strategy,
         "signals": signals,
-        "stats": {"wins": stats.get("wins", 0), "losses": stats.get("losses", 0), "win_rate": stats.get("win_rate", 0), "total_pnl": stats.get("total_pnl", 0), "total_wagered": stats.get("total_wagered", 0), "total_trades": stats.get("total_trades", 0), "completed": stats.get("completed", 0), "pending": stats.get("pending", 0)},
-        "risk": {"capital": live_capital, "daily_trades": risk_status.get("daily_trades", 0), "max_daily_trades": config.risk.max_daily_trades, "daily_pnl": risk_status.get("daily_pnl", 0), "daily_loss_pct": risk_status.get("daily_loss_pct", 0), "consecutive_losses": risk_status.get("consecutive_losses", 0), "cooldown_active": risk_status.get("in_cooldown", False), "total_pnl": risk_status.get("total_pnl", 0)},
-        "positions": {"open": open_pos, "closed": closed_pos[-50:]},
+        "stats": {"wins": g_wins, "losses": g_losses, "win_rate": polymarket.win_rate, "total_pnl": g_pnl, "total_wagered": polymarket.total_wagered, "total_trades": polymarket.total_trades, "completed": polymarket.completed, "pending": polymarket.pending},
+        "risk": {"capital": live_capital, "daily_trades": risk.daily_trades, "max_daily_trades": config.risk.max_daily_trades, "daily_pnl": risk.daily_pnl, "daily_loss_pct": risk.daily_loss_pct, "consecutive_losses": risk.consecutive_losses, "cooldown_active": risk.in_cooldown, "total_pnl": risk.total_pnl},
+        "positions": {"open": list(polymarket.open_positions), "closed": list(polymarket.closed_positions)},
         "arb_scanner": arb_stats,
         "engine_stats": engine_stats,
         "config": {"bankroll": live_capital, "arb_enabled": edge_config.enable_arb, "hedge_enabled": edge_config.enable_hedge},
@@ -169,4 +391,11 @@ def build_dashboard_state(cycle, consensus, anchor, decision, risk_manager, poly
 # -- HTML Builder -- Command Center v4 --
 
 def _build_html():
-    return '<!DOCTYPE html><html><head><meta charset="utf-8"><title>GRIDPHANTOMDEV Command Center</title>\n<link rel="preconnect" href="https://fonts.googleapis.com">\n<link href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Share+Tech+Mono&family=Rajdhani:wght@400;500;600;700&display=swap" rel="stylesheet">\n<style>\n*{margin:0;padding:0;box-sizing:border-box}\nbody{background:#0a0a0f;color:#d4d4d8;font-family:\'Rajdhani\',sans-serif;overflow:hidden;transform-origin:top left;width:1920px;height:1080px}\n.m{font-family:\'Share Tech Mono\',monospace}\n\n/* ── ROW 1: LOGO BANNER ── */\n.logo-bar{height:160px;background:linear-gradient(180deg,#111118 0%,#0a0a0f 100%);border-bottom:2px solid #fab005;display:flex;align-items:center;justify-content:flex-start;position:relative;gap:16px;padding-left:20px}\n.logo-title{font-family:\'Orbitron\',sans-serif;font-weight:900;font-size:52px;letter-spacing:10px;color:#fff;text-shadow:0 0 30px rgba(250,176,5,.3),0 2px 4px rgba(0,0,0,.5)}.logo-title span{color:#fab005}\n.logo-sub{position:absolute;right:24px;top:50%;transform:translateY(-50%);display:flex;align-items:center;gap:16px;font-size:13px}\n.logo-ver{color:#3f3f46;font-family:\'Share Tech Mono\',monospace;font-size:10px}\n.logo-left{position:absolute;left:20px;top:50%;transform:translateY(-50%);display:flex;align-items:center;gap:8px}\n.logo-left img{height:32px;width:32px;border-radius:4px}\n\n/* ── ROW 2: STATS TICKER ── */\n.ticker-bar{height:110px;background:#0d0d14;border-bottom:1px solid #27272a;display:flex;align-items:center;padding:0 16px;gap:6px;overflow:hidden}\n.tk{display:flex;align-items:center;gap:8px;padding:0 16px;height:80px;border-right:1px solid #1a1a2e;white-space:nowrap}\n.tk:last-child{border-right:none}\n.tk-l{font-size:15px;color:#71717a;text-transform:uppercase;letter-spacing:1px;font-family:\'Share Tech Mono\',monospace}\n.tk-v{font-size:38px;font-weight:700;font-family:\'Share Tech Mono\',monospace}\n.tk-v.amber{color:#fab005}\n.tk-v.green{color:#22c55e}\n.tk-v.red{color:#ef4444}\n.tk-v.dim{color:#71717a}\n.tk-timer{font-size:36px;font-family:\'Share Tech Mono\',monospace;min-width:42px;text-align:center}\n\n/* ── ROW 3: ENGINES (horizontal) ── */\n.engine-row{height:130px;background:#0d0d14;border-bottom:1px solid #1a1a2e;display:flex;padding:6px 12px;gap:8px}\n.eng{flex:1;background:#111118;border:1px solid #1a1a2e;border-radius:6px;padding:8px 12px;position:relative;overflow:hidden;transition:border-color .3s}\n.eng:hover{border-color:#27272a}\n.eng.fl{animation:engFlash .6s ease}\n@keyframes engFlash{0%{border-color:#22c55e;box-shadow:0 0 12px rgba(34,197,94,.2)}100%{border-color:#1a1a2e;box-shadow:none}}\n.eng-h{display:flex;align-items:center;justify-content:space-between;margin-bottom:4px}\n.eng-name{font-size:14px;font-weight:700;color:#d4d4d8;letter-spacing:1px}\n.eng-badge{font-size:10px;padding:2px 7px;border-radius:3px;font-weight:700;letter-spacing:1px}\n.eng-d{width:6px;height:6px;border-radius:50%;background:#3f3f46;display:inline-block;margin-right:4px}\n.eng-d.on{background:#22c55e;box-shadow:0 0 6px rgba(34,197,94,.4)}\n.eng-stats{display:flex;gap:12px;font-size:11px;margin-bottom:4px}\n.eng-stat{display:flex;flex-direction:column;align-items:center}\n.eng-stat-l{color:#71717a;font-size:10px;text-transform:uppercase;letter-spacing:.5px}\n.eng-stat-v{font-family:\'Share Tech Mono\',monospace;font-size:19px;font-weight:700}\n.eng-bar{height:3px;background:#1a1a2e;border-radius:1px;margin-top:auto}\n.eng-bar-f{height:100%;border-radius:1px;transition:width .5s;background:#3b82f6}\n.eng-status{font-size:11px;color:#3f3f46;font-family:\'Share Tech Mono\',monospace;margin-top:2px;white-space:nowrap;overflow:hidden;text-overflow:ellipsis}\n\n/* ── MAIN 3-COLUMN AREA ── */\n.main{display:flex;height:calc(1080px - 160px - 110px - 130px);overflow:hidden}\n.col-left{flex:1;display:flex;flex-direction:column;border-right:1px solid #1a1a2e;min-width:0}\n.col-mid{width:280px;border-right:1px solid #1a1a2e;display:flex;flex-direction:column;overflow:hidden}\n.col-right{width:320px;display:flex;flex-direction:column;overflow:hidden}\n\n/* ── EQUITY CURVE ── */\n.eq-wrap{height:260px;padding:8px 12px;border-bottom:1px solid #1a1a2e;position:relative}\n.eq-title{font-size:10px;color:#52525b;letter-spacing:1px;text-transform:uppercase;margin-bottom:4px;display:flex;justify-content:space-between}\n.eq-pnl{font-family:\'Share Tech Mono\',monospace;font-size:13px;font-weight:700}\ncanvas{width:100%;height:calc(100% - 20px);display:block}\n\n/* ── POSITIONS TABLE ── */\n.pos-wrap{flex:1;display:flex;flex-direction:column;overflow:hidden}\n.pos-h{display:flex;align-items:center;justify-content:space-between;padding:8px 12px;border-bottom:1px solid #1a1a2e}\n.pos-title{font-size:11px;color:#52525b;letter-spacing:1px;text-transform:uppercase}\n.tb{font-size:10px;padding:2px 10px;background:transparent;border:1px solid #27272a;color:#71717a;cursor:pointer;border-radius:3px;font-family:\'Share Tech Mono\',monospace}\n.tb.a{background:#22c55e18;border-color:#22c55e;color:#22c55e}\n.pos-cols{display:grid;grid-template-columns:70px 36px 100px 40px 50px 50px;padding:4px 12px;font-size:8px;color:#3f3f46;text-transform:uppercase;letter-spacing:.5px;border-bottom:1px solid #111118}\n.pos-body{flex:1;overflow-y:auto;padding:0 12px}\n.tr{display:grid;grid-template-columns:70px 36px 100px 40px 50px 50px;padding:4px 0;font-size:11px;border-bottom:1px solid #111118;align-items:center}\n.db{font-size:9px;padding:1px 5px;border-radius:2px;font-weight:700}\n.rp{font-size:8px;padding:1px 5px;border-radius:2px;font-weight:700}\n\n/* ── SIGNALS PANEL ── */\n.sig-wrap{flex:1;display:flex;flex-direction:column;overflow:hidden}\n.sig-h{padding:8px 10px;border-bottom:1px solid #1a1a2e;display:flex;align-items:center;justify-content:space-between}\n.sig-title{font-size:10px;color:#52525b;letter-spacing:1px;text-transform:uppercase}\n.sig-body{flex:1;overflow-y:auto;padding:4px 10px}\n.sigr{display:flex;align-items:center;gap:8px;padding:5px 0;border-bottom:1px solid #111118}\n.sigi{width:22px;height:22px;display:flex;align-items:center;justify-content:center;border-radius:4px;font-size:12px;flex-shrink:0}\n.sign{font-size:10px;color:#a1a1aa}\n.sigv{font-size:11px;font-weight:700;font-family:\'Share Tech Mono\',monospace}\n.sigbw{width:40px;height:3px;background:#1a1a2e;border-radius:2px;flex-shrink:0}\n.sigbf{height:100%;border-radius:2px}\n\n/* ── CONFIDENCE + ORACLE ── */\n.conf-wrap{padding:10px;border-bottom:1px solid #1a1a2e;text-align:center}\n.conf-num{font-family:\'Orbitron\',sans-serif;font-size:42px;font-weight:900;line-height:1}\n.conf-dir{font-size:12px;font-weight:700;margin-top:2px}\n.conf-label{font-size:8px;color:#3f3f46;margin-top:2px}\n.oracle-wrap{padding:8px 10px;border-bottom:1px solid #1a1a2e}\n.oracle-title{font-size:9px;color:#52525b;letter-spacing:1px;text-transform:uppercase;margin-bottom:4px;display:flex;justify-content:space-between}\n.oracle-row{display:flex;justify-content:space-between;align-items:center;font-size:10px;padding:2px 0}\n.oracle-dot{width:5px;height:5px;border-radius:50%;display:inline-block;margin-right:4px}\n\n/* ── STRATEGY INFO (in signals col) ── */\n.strat-wrap{padding:8px 10px;border-bottom:1px solid #1a1a2e}\n.strat-row{display:flex;justify-content:space-between;font-size:10px;padding:1px 0}\n.strat-l{color:#52525b}\n.strat-v{font-family:\'Share Tech Mono\',monospace;color:#d4d4d8}\n\n/* ── ACTIVITY FEED ── */\n.feed-wrap{flex:1;display:flex;flex-direction:column;overflow:hidden}\n.feed-h{padding:8px 10px;border-bottom:1px solid #1a1a2e;display:flex;align-items:center;justify-content:space-between}\n.feed-title{font-size:10px;color:#52525b;letter-spacing:1px;text-transform:uppercase}\n.feed-body{flex:1;overflow-y:auto;padding:4px 8px}\n.fi{display:flex;gap:6px;padding:4px 0;border-bottom:1px solid #111118;align-items:flex-start}\n.fic{font-size:12px;flex-shrink:0;margin-top:1px}\n.ft{font-size:10px;line-height:1.3}\n.fts{font-size:8px;color:#3f3f46}\n\n/* ── TOASTS ── */\n.to-wrap{position:fixed;top:130px;right:16px;z-index:100;display:flex;flex-direction:column;gap:6px;pointer-events:none}\n.to{display:flex;align-items:center;gap:8px;padding:8px 12px;border-radius:6px;font-size:11px;animation:toIn .3s ease;pointer-events:auto;min-width:240px}\n.to.op{background:rgba(59,130,246,.1);border:1px solid rgba(59,130,246,.3)}\n.to.w{background:rgba(34,197,94,.1);border:1px solid rgba(34,197,94,.3)}\n.to.l{background:rgba(239,68,68,.1);border:1px solid rgba(239,68,68,.3)}\n.to-x{opacity:0;transform:translateX(20px);transition:all .25s}\n.to-i{font-size:16px}\n.to-t{font-weight:600;font-size:11px}\n.to-d{font-size:9px;color:#71717a}\n.to-p{font-weight:700;font-size:13px;font-family:\'Share Tech Mono\',monospace}\n@keyframes toIn{from{opacity:0;transform:translateX(20px)}to{opacity:1;transform:translateX(0)}}\n@keyframes prUp{0%{color:#22c55e}100%{color:#fab005}}\n@keyframes prDn{0%{color:#ef4444}100%{color:#fab005}}\n\n/* ── LIVE INDICATOR ── */\n.live-ind{display:flex;align-items:center;gap:6px}\n.live-dot{width:7px;height:7px;border-radius:50%;background:#22c55e;animation:pulse 2s infinite}\n@keyframes pulse{0%,100%{opacity:1}50%{opacity:.4}}\n.hb-dot{width:5px;height:5px;border-radius:50%;background:#3f3f46;transition:all .3s}\n\n/* ── SCROLLBAR ── */\n::-webkit-scrollbar{width:3px}\n::-webkit-scrollbar-track{background:#0a0a0f}\n::-webkit-scrollbar-thumb{background:#27272a;border-radius:2px}\n</style></head>\n<body>\n\n<!-- ROW 1: LOGO -->\n<div class="logo-bar">\n  <img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABAAAAAQACAYAAAB/HSuDAAEAAElEQVR42uz9eZylZ33feX+u67q3c05Vd1er1RJCQkICtLAjAWIVi8ALeCGOcGyPY5PEMPGSOE6ewPN6ZWZgyDMvyJPlNTPOApnHTmLjcSTHK4YYZMwuEMggIQkJSa2l1VpavVbVWe77vpbnj/ucU6dKvUkC2Ux/369XqatOnX3RXb/f9fv9LhAREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREROS0YPQUiIiLf3wfwdKxfppNfPj2FPxiSXgIRERElAEREROR7f/C2Cz/HxYD8WEf21J1uFqJ2O73cPJg3Wy4/Pe/sMnb+q+6WA1FJABERke8zTk+BiIjI96e0EPifLKNvjvFz2nrCCa7ETv/r5rer8F9EROT7jSoAREREvu9Yuhz+bB0/YYhY4nELAOI0hE9YwG8s9JtjXafduCCRjRqDiCNurhwQERGR7xuqABAREfm+Y4CMxUYAg5ku4j++u99gp6fajQSBSZv7CJKb/lmQsdFksCWdYBLJJC0fiIiIfB//BSEiIiLfdyybI/jFw3ra9JOdrtmb6b8JCLOLTxf3TbJYLAYzL/eP0z7/ME8YzNb+45bBAyIiIvL9QBUAIiIi34fMtCQfIphpYG5mjfxmU4o/Tc+72Oaftmwj4DC4aY2AnV6/mScNEsmEWaZgMccgIiIi31d/P4iIiMj3/xH8cUf0rX38zHcD2HSxaSDvppeZVQHMev7T9LLzBX+z8L2SACIiIkoAiIiIyPeYPc5R/VhBeTrGedLmPwS6VX87vdp43JvdGAeo+F9EROT7jVoAREREvt8YMLntQvC0EMFP43aXdd0AaRbHW9vV/BvTDftzBcQcTAEuxyRIRCxp2gYwvZgB58Cn6VVbRzSOqOV/ERGR79c/IUREROT7+kieLNY5TJYTmmaaCTBA6Nr26TL+eQbJgwcCxbTLv9s+0BI2dQiUJUzqjZV+YwtSNAuZhkB3TSIiIqIEgIiIiHxPOKACMgOTZPA4AjmzbfxsvySOhkBLRkOfNN/gL5texwho2Qjwk9kI69O0uACArCArKnydwEdIBpfnhHZNCQARERElAEREROR7KQN604O4BzwWky3TYok+AJE8d7h2jZxID+gDF23j629708WXv/6Nb+ITn/86n/78127Z8xgv9oDrwaEx1Abyfk7TBDAZhGkmIHb7AzhrCaEhETjRrAARERFRAkBERES+SwmAvoUGGMfZ6n3Xve+IlEAJnFWw+40vW3n07a+/nJc991x6Zsx47SitdQxbwzfvvI8//tytfO0uzKEE6wbGADYDm4Ox0NaY5OkZcKmrEqjp/hURERElAEREROR7ePAuFr63QJVB8JADZ+Rw3i7SW193MW+68kWcvZThxgep0oReFslMwOUZtYeaPmO3zP2HPV/61h7+/Ot3ctue2hxqu+RCopsd6AyEuDEBoFUCQERERAkAERER+V4fvbNukr9NmDCmCLAM7AR+6ErS33jrlVywa8CugaG0Hj8ZQQqUZU5KiclkQgxh+odAtxuAtX3amLNaOw6PDZ/+0je4ec/DfP0ezP4IQ6C2EKzZGBiQ1AIgIiKiBICIiMj/4w+gdv79xoZ48bgH2bT1xHT8A3E6zgHbTv9NQDDTYYAJnrubf/U33/y8X/uxq17EecuRcPghdlaJOFmFFLBlCUDbeoKxFEWF9xGTwASP8RFH1u0fGDLa1jK2PY6GitsfXuPTN32bz9xy4Nf2HOHfjIGUQ2zZ9Ki7+2y33OvF58NueTxx4bHa4zzH8fHPiznBkyQiIiJKAIiIiHy3g/8cB1gCcRoApy7gNXG+9d5iwB7pFs43gt1IZhzEWfhssViS6a4vpIjNHBZD8H4+xd8B2+lmALzqOaQfePPzufwFz2bX9owirOP8iDw02BTJksFEQ0qBZA3GGXzy+JhwtiKlBKnFhJbCGnC2uz9NwKeCkPdpswGjWPHoKHDrvfv47A23cMMt7NwXONzStQl4IK8q2mQJzTQz4GzXk2AiBkeybmG7gYCjnQ4xtN2cAdxCpB8xJFz3W6BrNwjzv1ymjQhKAoiIiCgBICIi8r0+eFosYOdr1Gn63eKq9eK69tZVcucMIYSunz8vCG1LIhGnwW1VVjT1BAcs5WA9mAQ7C7jiOb307ne8gvN2wK6dyxRFINRDCBMsicIafNtSuKxrF4iRFD2JSEoBHwNl3ifFSAqemBpMCCQCzjmMc6RoCSajjY5kCiiWCOQcXh3y4JHIH914H5/6yoM/89Aav2MsrMeNuQA2z2nb6YQAYyClLshPZvqXR8KkLrjvzjVLbcwmDETcdJcBs5AA6CoAsnmSQLsQiIiIKAEgIiLyvTVbsDbTyDRClmZr2LYr0ccuDMnrAlW3ENCW/YrheLJxJDaAtVhXECcNGZHtBWRNFx4/e4U/fccPX/DDb3zNCzhnpccg1VRETEw0TUPwLZZE7hLOJiwtoR3j6wmkRJlVkJUQEqkZYWyEUHcPxuVgcogJH6AhkfWWCMYSQsT7iDOWft7DWUcTMx4aO2K1k1vv2ssffepzfO1WzCowsbAWIViILidESwwB5wz5tMKg9i1poxACh8XNKwASkUgiEsyWv1SS7foPgC7doASAiIiIEgAiIiLf6wRAtiUBEBcTAJYwXcPeSAAEHBHHRjVAmPUIZHZ6QrefX89AFWEAvOg80o9ffRmvf+VzOHNHIvrDJD/G1FDYnMwUONMF0NYkoq8JfkRKNUVhsVlGCom2scSYY02PjECcHCbLE1gLPhIxWJeTnAPrGNc1Li8wxhB9wKRAlgzE1AX15Xa861EHaEyPfYeG/PFnbuCPP3f0rAOR/et0WwXOwvTZQ3XTp8y7jacmS5aM2fp/nO8ykCwbZRQJiJZNmQMlAERERJQAEBER+Z4fPWcR7UYPACbN4tXFknaIeKDtZgCYjatY3pazNo4kn6bBracP7DRwzVVnpjdd/mxe/cJzWS5rJpNDYFrIDDF2Q/tyMmyyOO+xs4n8fgyhhcKSQmQSDK3rQ75Ck5Y4OkwMjx7hmdtylkpDsp7JeBVMYFBaXPQ066tUWdE9INw0cs8gyyHLgBxMj6ZuKRxgDN6Dz5e48+FV/vymu/jtTz58xaMtN63SVe0nDK1PZNMEwMRmYBzEgEmRfNr8kKZfLWw8XwvPs1no+9cIABERESUAREREnoYDqJ32pMfNR9Ro57/fGALou1X/2Yp2ApvAxo1ugoHtruoVF9r0d955NS+9YJkd2ZC+HWL8UWJqwNmuLD9aMldgsZgQsN6TE8BNo2VjSD7hXUUsdtBWKxyuK27d8wifu+FWbr55H5dekPOKF1/Ky154MdsHwOQwRVhnm/M46m6AX2ggdgMKcRnYnGQcwRhisORZhnF0gwPbSMorGtvnaOxxwA/4xBdu5g8/c/vn7jrAGzzdsEA7De6HZF3bAR5SwEwTAGzKqUxP2TJYcXYeJQBERESUABAREfmeckA+DUYbLJ4cyKbRqQcCJN8FrAmiWdjCztiu7z1FKroy/7MM+Vsu3978xA++mkuffQaxPsj2ZUPdrOLbCZlLFNZiY8J6jzGO6BzWdXP0CU13m8ZAtPhYkC0/k9Wm5O79Y2684yFuuO0+brv30EcfPsJ7hi3YHM4YcPGlz6zueM0l5/O6y87lkrMHDNJR4vAxelXoKg6Mmc4IyCBl00qFBMZDb0CoG1pyquWd1E3LeDRh244Vmjriqm3sHwa+ePNd/OFnvsEX78Cs0e0cEIB2nkSx0+fGbJQAJDAE7MLcBOaJASUARERElAAQERF5mhIA5fQg6oGGnEQxbQuYdrAbPw9kXdpcul4AO4AKePsrz04/9fbX8txdjiWzTpk3xHoVbwLGWZKzEA02BrLINPieBsouEfAkEzEuI9mSSSpZ9z2+c/8a3967xldve4Cb7z70aw+t8m/GBkIBwWYEYwh1yyDA2SX5s7fTvPBZlqtechGXX3YeO3oJE0eYVGNT6roAksWYbNrd0HatBuUy0eYMJwGb5fTyDD8Zk1uLsY5gK8ZuG0fYzrf3rfL7f/FVPvX5+81q3VUCtHSzAgI52NkkACB2aYLZ3AQWgn4F/yIiIkoAiIiIPG0HTwdkputT93EalBrAuS5ItwZSmA8ILIHeNOhfAv7GlWemt131Up5/8bmYcATrj1DmDSZMIDRkriA2LdYW3XW206F3lm4LPJuDtbTG0OYlI1PxyKrn5nse4/b7DvPlb9zP/lXecmCV68cJcBnBQDKRlBLG5KQUMIQung+wlMF5O/n0s3dy9Rsvfx4Xn3MGz33mDlb6DhtGmNSAabEmkGWG2NZELFlRdPMBvCf4iDGuq1KwDp8yWjJS1idlPUYe1hvLx/7wU/z5DY99bs8h3jAGajKG5ECOKXOSXwdTd4UNdBF/npXEWOCjn6YOvN6MIiIiSgCIiIh8b5VlTlO3AOQ5GGOo225d2uQWjCO1Ldtyw4AEdVfu/5YX7Ug//fareN6ZhjO2BVKc0DarZM5jrYfgcVkOrenq5G3epRvCdJsBZ6l9wJXbaEzGwXHk3v1HuGXPfm6+51Fuf3D86L5DnD0MMPQOHxzYHOcMJkUwHpMiNoFPkegMxkEbAjHAwMHOEqoWLtpNuuJ5u7n8svO47Nln8YydfZyrSc0ahWkxoYYUSLG73wbI8hzyanp/i252wHTLhEAi+ESdLPTO4tv3HuDTX7qVT37hoY/uWeM9EyBmFau+IZm4eeuAxkIq6QYQWkjDaRJARERElAAQERH5npmN7gPMdB/AbtofFigsELpV/z6wE/jBK5fS3/qR1/O8c7fRrj7M8lLCpgn4msyE7urqtlv1L3oQsq7v3pXEmBi3LSbPyIqcYcy556Dn7oeO8K07H+K2ew5wz8NcsX/ETUOmJfXGgXGYzJFbh4mJ5AMugrGBZFp86mJpmxWkVNB4TwwBSBRlJI+RJQtnL/Hei8/mQ1dc8kxe+YKLuez8XZTpIGWqsSbgTMQYuqmGbQ1tM31uTFe9YCwkRzQWmxVQ9EkhZzQx1PTYd7DmU1+6nY9//t7P3XmUNwyBUMIw0E1OtNP5A346RdEAaYQqAERERJQAEBER+Z4nAKwrcHlOTIHQjDCpW+eerlHTA553Bt+++soLLvnB176Ii86uMPVjmHCUpR5M6qNkOZhkITpyXBfwG9ut+odEnLRMkiNmFaEcsN4m7n7wEb517yPceNcB7nkkHb5/HzvHsxYEl+NNgbeGZBLJdh3zJqWuTyGAJcO6RGRCnDbT27zE2BKfctqUut0EbMSahjwOyRooPZxVsfuyZ5tHn3/Bbt766kt4xkrBzuUeWRhiJkcpUk1eGMhs9xV81xdhp8kS74kYrMkYrTf0t50JWcl45KntgCOx5BNfvJnf/MM73rdnlQ8PgXo2ODF1lQyWSAy+S7rM9wsQERERJQBERES+R9xCMiAzDpsCOZEV4LztXPuev3X5NS+4YIlnn5ljw2FSPaRXZbisoPUjysoTvCeEHok+JvWwyZKiJzYTityQDDSu5NFR4PaHhtxy32G+dsfDfOveeNHDI/aMpwF8kVuc7eHbaX+/g0QNJpEShATGWIwtMBSYFMnsBKKnjRBtTmumtfbJgrXQ1hgiZW6oMgu+pm273MBSARefQ7r4nB289LnP4IUX7OR5Z/Y4o5/AD4njo9jegJQCyTpsXnYXjB7qESEkXLEN6qZ7IovudsfJcaTpsb+p+M9/8Dm+fOvR67/zKG/Bgassq8M4K7SgRYMARURElAAQERF5Gg6epZuW+vsuEi2Bl51fpJ/84Vfxttc/n3TkbrYXIyo3hDCCkEhYPBnee3pFYjKZkOXbyXo78I2lbhLJGGzmCClycG3C/QdWuenOfXz25iPcvhdzqIEREEtLazNs6nYJSE3XimANVEVG8JNuswDTrZNbm2NsRogW7xtyl3AYgoGIwcdIottdwCbo93o0k5rga6DbytA4cEVGmSXcONCLsJKz+6IzefQVF/d49Ysu5AUXncNZZ/TxzZhES/SemBoym8gdXctEiKRgCCGQ2Qg2kbwnuZyYLzNhidqtsO9I4lNfvpVrP377B/ce5X9u6GYNDluY0I1IEBERESUAREREvqcHz5yNUv8XX0C65i0v4K2vuozdvZrJwb2s9C2xHUGMkCw+WkI0GJdRZCWZLWEy7lbGHbRtjc8qQrHEauxx+wNHuOGW+/jCLXu5ex/mcDcQH+MMTTK0xhGtASLOGKwFay0hBLyP5LbC2m5LvZg84LEOYvS0AZLNumn904DfmtR9JUjR0/pEkVuyvCQaaGOgDYmYIvjQPfbCUJoELVQWnnUmD1z5wnPOe9nzzubyi5/BWcuOHZWHZp3QDLE2Ypwj4vEkYow4l5ObvBsaaIEQacZj8qpHKrYRqp08cLDlTz5/G//tz+656e7HuGJElwTRBAARERElAERE5HQ6gqXZj9P947GkWX/44lFuy/mSOUb/eLILP8TH3dTstzndcL8XnU96+xtfzNWvfC7P3gll/RhZewSXG2gmEB0pZYTU9fcbclJKpJCwqcBEg80T3kQaa6mzijsePMJnb76HL33rAHc9wiUPrXJnayHZnGQshTVEwAeDzQwxedq2wVjIc4vBEoIheINzGSRLiA0GT5YnXJaICXwqCdGCD5gUya2hsIZEIPnQrfhbi0+R1gPWkBUFxjhCCOTW4b0npYTLDDZ5ChNZKWF3xW+/+rJtP/PKS8/lFc8/l7O3Z5Q0OBsgtfhQY11L27Y4V+BsTmwjNgZcTjdM0NfgHD5mNHYHoXc2ew9E/uTTN/J7f3b/L+9Z599O2JgEEJhVBNhjvFXiptPTpvM9fpbA1j+O1GogIiJKAIiIiPxVHr2y6fe+G6Tnut3sAUvAkwhdIGk24jyTwJGRgGADuLQR+8XpoLlZsO8gxXY+2X92c7mFc5e58ld/8tIbXvv8Z3D+7hUYHyFrV8nxOBrIMkgG78G4brCfbwImQWEdCUtLRkNGa3JWvePe/at87Tt7+fIte/n2vm6if22hNYZATpw+Dpe6gNXEbvXemFlmo+v/T9MzGuOw1pKSIcZuaJ513WD+lCAmhzUZxhhS9IQQIE6DeWu760qJmBIpmWnSpNvu0JgupE7Gksw0cWIiJnnyFCgjLBl4xjL/60uem/1PV13+PC6/5Fk8Y0dJTkMW17HNAcp+0W0VGCMpGXyKJBPJ84wYY/fYoiEEwOQYCnwLh9sev/vZO/j4Fx7g9r2YGmgMjBIkMnDTigIihoQl0sv7NG1DIJHnPSbtrIGgmaYO4uMSPfNUkNmSBEgWDSAUERElAERERJ6uo9csVg8bgT2YLrgngfGbI7lpAiAnJ5Lw+C6qn8ZxruwRmggxYouCWI+xJjLIwLbdqv9KCW9768XpZ3/k1Twrf4Qdbo3Y1CTvKfMMUugG3ZUFofG0IU6D7G7Sf2ZzDJZJC3VvG/vXPfc8eIC/vON+vnrbY3znQZYONgybvAtLG5uRyIgG7CzwJ2ABkwwpGmKM04DfzEv+U0rzIL4LpA15ntPr9a7M8/wagMOHj/5j7z0xRqy1ZFmXDPDe470nz/NjP/XGTJ/OMA2MMxK2yywAJiYcDWUMWA9LwAW7+exLnlNc9dJLzuclF1/Ac5+5jR3ZOsQxbT0iJk85KKDI8PWIpmlIKZG7jDzLulc1TZM5MYDtc9SdxX2HAn/x5du59hP3X3/3Y7ylNmB6BUdHvttRISWss8QQuoGGLoeU8DHhZ28OE1hsJpjlU45dCzKN//UJFBERJQBERESePo5uFTYuBmRm4chmFn6Rui+DxU4vZ4gUhSMkR91OkwWZo1tujmQmo4cn9zAA3v5y0k+97RU8//zdVGGdkhGOSMBi8gJb5NRNTV2PyFzCpBZSojA5pIK2dRg7IISCgxPLF+58mG/ueYRv3vYw9z+CWU9dEcLEwDgayHokup0ATEo4PAaPnYajDYaYTDf1fxr8G2M2Bf3QzQXI85zBYPDPlpaWPpjnXRvC+vropvF4/J7hcHhT0zQYY3DOza8jpfS4oH+WXDBEihSnwbEjmIxoHHEaNlsiWQyU1lMSSG2Xazmj4uKXXNa/4yXPfQZvetmzOXdXyVIfkl/HhFUcY5wLuMJCE7upgziiSTQxdc92kZOVBclljBoHbhcPHzL80adv5Xf/9N53PbDKfxoDYwBnoSihrSFFMmdITfe45qv6act7ZqFipFvpLzE4LAFDO08WBCUCRERECQAREZGn4+BlyafBZujWomfV/5sCftLGii4s9n5HiulpXe+4nQZ/3fXYBFWAHQZe/0LST//Qy3nDi8+j3zwGo8dwvRzqAOUSuJymDQRjcXmGsR5Si8HTjCfEkOGybQSzzKF1y6137OOrtz/IZ28/eMfDQ644MmLYMF1Az0sCBR7bVbDT9a9bIi612OS7pIOBcYTk7DxoB4gxEmOcJwWKoqCqqot7vd5Her3eVWVZdo85BIzpevjH4/Ge9fX1K0aj0WHvPdZ21xlCeFzwP0sAuNQlAGyaplJMRjAZwXTtDWBxBkgtmfEUJpBFT5p2XfQtvOZSm177sot45eXP4byz+2zL1rH+MDRHcSZ2gXtIYCw4SzSRMYGUQZ4bfD2iypewdhu1H1Czk32HE3/45zfzsT++46pHJnz+sJ/G8LPAftru3+vBZLTwnjDH+KsoAbEb89gljloMNRY/nzmgBICIiCgBICIi8jQcvGYJgJbY9aHPAr1p4O/iRpdAZLpua+lOTOB8921W5LQJ2rZbZa8MlAle+VzST7/t2fzQKy9mh62xo/VuBTg2XZl/1geTQ7RMvCcBRZljTKJuxuTOEm1Jayr2r8Kt9x7lL+94lBu/9TDfeAAzBIIz2KwCkzNpAm2MGHJmq/SGLtg2eFwK83+TgREJsmxe6h9CmJf+O+fI85x+v//P+v3+B4uimFcIxBjnCYBZ8sB7z3A4vGl9ff2K8Xg8Hc7nNj/n095/gIyE822XADCQplUAAde1BBhLSJBCC0ScTZSF66oX2hYTPD3got189vkXLV31oovP5OWXnslzzhmwo2jIXIDxsHuerYEqgwK8bWlSQ0iRXraNDAchEtppyX+5wsGh5TsP13z0v36RP78Rs24gVDAcda+/61WE4WSjrn9r8D9PHlm6xg9L9/by0wqAjcSREgAiIqIEgIiIyNNw8HLYab//LPiP8wDOxFnotpEAaGZzA6YJAOstA+sY+xYL7NpmGa9Gzt/BL/2Dd73i1990+dmcWY2p/GHS8CguAtZ2E/Sw+GjwAcqihyl70AZCiBiXk8hocOxfa7n7kaPccPtePveXh7ljL2Ytdf39lBWTNpEi2Dwny8v5qnz0AWstlohNcVp+3n1v6Ableee6Rerpqn+MiSxz9Ho9yrL86V6v95GyLJdmvfyzFf0Z5/L5/IBZcqCua4bD4XWj0eidk8lk4bo3zmetxZpEFvz81YhYgulmASQc0VhijGR5TuYcbVsTmqZLBmQZgyrDNOvkMZF52FGxcsl5HHr5pQNe8+Jn86LnncNK3wAjCCN8GhFtQ8oD2EQMQOqR24rMBUI9IvqWvL8ExRLDsWWdHXz9jv38xn/7Sz77dUyTd++BxgNFH+qmmytg48abaiH4NyfYJQAF/yIiogSAiIjI030EW6z77yI4kyL5tBt9NqvdA94Ame0SABFMKsjbCT3bVQv0gHf/5Pb07p/6AZbiGtl4hK1H5NSYQQk2MFlbpwkZ27Zvh9gS6gZnMkg5TCKJiugGHG0LvvPQET53y9185psPccdDmAMt+AxMVeAxGL95cF+M4L2fBuduUw8+dG0J3cPsglFn2FTun+c5VVVd2ev1PpLn+YuKopiv8IcQ5nMBZreX5+V84J8xZj4EMMaI956jR49+2Ht/fV3X19d1vanCwBjTBeLzVfPFkXnd993ttt38gmlFgrWWpmlomwaXdzsqZAFooQBWHLz0Ypte/sJzeMvrL+HsnZ4zlgM2rmLCCGdT19dPBjgmTSR3Ba4sIXjwE2Zr8z6Cz7ZRnXkxX7n5Yf7lR67nc3+JWQdaetNRihGo58+pSWCnwyS7EN93FQ6LswGSnX4dOzEgIiKiBICIiMh3le16w2f96bNpbgkcEbewpdusSiAYuhV820XbWYA+XeD/g6+q0i/97Ju4+Jk5/ugeViqH8RFsQWo9k6bGlRlZXlG3hrZtKbOI8ZHMluBzYhzQpGW+fd9BPveNPdxw5z7ufCS96oERX2lyCEWJt5aYgLbB2kQK00SFNfPhe6QuSI8xTsvru1RGNLA4m75IiRS64L0sS5aWln6j1+u9a3F6/6xkf3FQYJdsiITQBeaLOwcsns9aO6sIuGk4HL5lMpkcniUosAZvN8/JN9OhgF2lAt312+6xdde9cX+CsRibEXz34vSKgsJEwnhIz8IzV/hnr3rp9g++8oXncOVLzuMZO6FijcLUECYQGuj1iE1LMjmYnBQimZv2fvgRVCU0ibotCMW5DDmHP/nzO/j3//kLv37PQX5lRFeJYVlMJM22kvRE2se3lgDEaYIgBSUARERECQAREZHvvQxMuRGImRaSx7ouXgsBjJ0GzjHinCOzBt82GGA5B9fCm19B+um3v5orLj6LFTMmb1axcYixDTGriQai7dG0jlTn9LKS3BpSaKiDx2UVzi2xNim5e+86X/7GfXz2Gw9w2wPRHEwwcn1qlxNsF1RiZoP8NjrI7SyHkTb/6xzEBCEZgjXdvIFkujPEBCHQL3L6/f4P9Xq9jxRFcd7WgH4xCfC4PwCMe1yiYFFKiSzL5gMBR6MRq6ur71lfX//ouGkhz7s7mSL4FlLAmEhmDSZ1yRhjuq+Upl9xli4oSCwTycCOMabG2AZHwiYoIuzIYGfJLz3/wv6vX/2qi3nNS87mmWcGSneIjLUu+E4JjCNaR8CBNdhoccbQjibk1TKYkmaYSMUyWW+Fb96+h9/7s6/xG58MZjwN4QOWSJ9ARqDFukBMk+nOEN1L1/VbQFn2qSeTeeJDRERECQAREZHvdQKAqgugnccaT4i+C55nRzZXTgO3iCFQElkyUKXuLP/LP3xBetmlu7noGQPM5CBueIR+L4PMQL0OReToaESyA7Yt7cbGPn7kSZMRTUwU23fz2HrLPQ8c4mu37uWGbzzGtx7AHIlQZwUjejQ2n1YqREgtjhaXGgyRSOp2oLPdNn9bD8rTUQMwHagXkyFhwHal+jt6vcuLzP1QWZbvzfN8aXELv8Wg/skmAIqimLcYzCoCvPeMRiPGk+aWhx478GKCh5QwucOZ6dC/FOd1CnZriGxcd7umIPqSiCXZmuRqsC2QsMngIqQ6slI4qhQYWAZXvID1d7ztJbz65c9i11JNffBeBks5uIx6UhONpewNIEZG62OW+kvgPeA2JvaVJSTD/lW47bGcf/HvP8M3b8MEoCZnQkFLItm2yxDNtiOM0B+sMF5dBxKly6lDTVICQERElAAQERH5XrNU+RJ1O8ZOJ7NHM21FzyxkAxibboU6NJRxyDKwBLzpRaRfftebOH93oucmZBYII2JcJbctNk9ADnUGpgIKoo9M6oDLe1jbZ7UpuePhCV+78yG+dNNdfPt+XnRgwrfGBiYmp0kOm+V0m+QlXNwojTfJkoyhxRAsXem8STgTMNMhf5DmgXeXDEiElLAmoyxLiqK6enl58Gnn3DHL+IH5aY8P/M1CeH78BIBzbp4AyLKM2UyBWfvAkcOrHD58+Ir19fWbDJGUAiEEMgt5VdLUHrDTRIeF5EjWYXAYG7CpwaRIMnY6d88xq7m3RMo8px4dwSWoHGQRztjOla991e4bfvD1F/PGlw4o4n6y5MgshNbj2wlFaSmWesR2yHi8TpZlXWLAJ6hTlxBwy+wfGZr8bP7oT7/Jf/ite654aMRNI2CCharq2gwMkBXQemgTDkuBJZFoabrtJ0VERJQAEBER+d4evBybp/wn120b350hB9eH0FKEEQPgBbv59t/9iedd8rbXXsyyPUzJEUKzRrIVWb8HmaeZrEI7obAFsAytheDwMSPmA2rb5669h7nxtof5ky/u5cGjvOuRo/ynYQJfZFAMiMYQUsC0NQ6PSxEXDSQ3LX3PiTi8hTgdO2+mowotCWu6if/GGGzaCDCttZRlmQ8GyzeUZXk5zmKmA/lmK/+Lq//HCuo3n3biBID3fp5cmF3/bJhfkeUMqgFHDh/m4MGDrK+vv2oyGX2lbpvumrOiC/5TIqZuD4OExRhLSgZDS27WcSRSMl0rgClIZPPbz3Jo2iHORqrSYqKnnUCvgrO286G3XGHf++ZXPpuXv/AylgowzREGZQQzZjw+SG97RfD1NIlhMMGRpQzTdi0irreNw+NEb8dz+MvvHOF/+/U/48u3YnwBax6K7cs0a8OulSHLSXUgw1DSI9DS0hLw+jCKiIgSACIiIk9HAsABWQZthHa6hZs13QqySVACOzN4x9Vnpb/3ztdx4a5AfehOthU1NtZQZmArmsYQyMnzkixGYj3E+km3atxbgWwXdz2W+PzND/IXX7+bm+4KFz00ZE8LpMwRXUUTI8QANlBkCRcjLk2n9ye6rfLo4ekRsRjbNZWnFEl0A+XsdPW/W1FPOAO5MxRFQa+sPlSW5XuLoiDLMuroYSHQX1z53xrQH7sN4MQJgFnAb63tKhCm2wjmeU7uMpaqHg6D957V4Tpra0OGo9GHV4fr7xuOR+RFRSCRogVrMHQVACklbGzJzQhHhGlrQ0puvndDAtrgybJu+GGMfl6FEL2nHo85o4JnrvAbr3hh+a4ffN3zefmlZ3JGf0yeDpPZMU27TtGrwOQ0bYSUkWcVFgchQjOBvGB1HAi9s1hPZ/A7f3wj/9fv3H/eo6s82ADVUsm4bWiaRJE5bHDE2A1ZbKlJSgCIiIgSACIiIt/7g1eRdUPlQtx8eka3pVwPuOplNv3kj76GV77gHAYcJPOHWcoboCYM17uSdpPRREdKPTJXkmdl15hPSxssB4eWm+7Yzye/uIcv3urfuW+N69aB/srSYDjxw7oOYBx5WXQD7/yI4D1l1t0fm6YVCskSqYiURCA3kGjnK/fJpGkgHudb9+WFo1dWFw761W/3er1XOecw0RCjB9cFysda/V8s/z/eDICTJQDyPO92IojTbQenMwZijKQQKbKM5cESZVnS+JZxXdP4ltX1NVZXV993dG3twyEEQugmABprsbZb4Tcx4EzYVOEQSNPgv0sCZHnJZDIBZ6mqirquiW0LRLatbN89Hq7tz6KnDHD2dq5+7Qv59NvfeCGveNHZnLXdEv0RMhvxwRNJFHmfEBN1m8hSpHAQx2vY5WXq1nBg7Ohtfw7f+PZR/vePXM9Xb8W0dDsFtMBs5n8ixxpLTC0aAigiIkoAiIiIPB0s3WC3lJPZChsbMmq2AWcv89O/+Lef+7HXv/xczj/T0QwfITeJ3DnauhuAVxYZoR2TxQB5Nl0VDkxCTshXWGMHf3nXAa7/+j184RuPfu6ufbyhNeAqqAP46RD62eZxpNlQ+hyXZzQxkUw3m6Dr/Z+ub6eITbErdp+eJ5DAWKIzWJMRp6v+WV7+dFVVH6qK8jzn3CxSJhFwZnPgvrX8//jD/2YVA+aECYDFGQCzpMI8AZASzuXkRUFeOJgOCbSZwYeGpmk4cOAx6sno1yfD0a/Uk3G3M8P0+UoRMAWQkYwHIpGwsdVhshiTk3yXbLDW0C8NLgPfThjWUAy204RAEWvy1JI1cN4OfvpH37TjY++4+iVc8qw+g2Id6kM07RpFWYLLaCJkrsA2NZQ5qR7hUySvljg6iqyPK4ql5/C7f3AjH/v9Pb++5wi/EoC6zBi2nnmXglf8LyIiSgCIiMhpFYEvemLR0OwAlI57wglux9CF3SmRYSgIZMBOCz/6pl3pJ9/2Ul50UY8yPorzh7pBgbbEx4I2FGBzUjuhKjNsCPhJjbMWU62w2pY8tJbzyRvu4fqv38tX72jNagBXdIPquqqDMN8Bz0W6/e4T+GhIZATrCMYRjZ3e14hNAZd89y8JG6YP13TPnHF0E/6dA2PYeebuZJ3Dua7kfD6Qz+Y4ZwhtjeXxwf4sWJ8lBJ5sAiCEQJ7nONeV7bdtOx8ImGUZbfCE6c+9Xo+yV2CtJSZPSpHMGdbX1zly8ACrRw9fMRmPbordJgHECImKhCOZAMYTCBuvd7LEYMhdhsUQQwuxwdnuuW4jNGa5G/zgIDMe065TRXjWGfz8RWfzm+9484W84oVn85xzlsjMKtZOwLS0ocHaDEfOZDymLA0mM8S6xroeuO2M1gu8O5tv3nGY3/6jL/HxG0ZmHRg6iDmzvQMhZtP3a5y+fTc+A+l4f2Ul+6Q+L0/18yYiIqIEgIiIPIXg304PI2khMD9JUDINfgyR2SZ0YRoEb900LnMWHyLYLmDHe0iRosxo6jGGjBxPSbch4AufSfrFn30hb7/qBfi1Bxm4CcQJxOkm7q4iuYI6GHw7Ycl1S7gp9WjMEq3bwcFJjxtv28eff+1uPvXFR8wQGEZoMYCZjuzrtoWbldmbtCVAS5ZkINH1r8+340sB4nQz+RRwmC64tl25f0qJvCzYvm3lD5aXl388pHjM4N0YhzFpel3HD/BPXgGQTpgAONkcAWMMsxyCtXbeo1+WJVlmCSF0FQMhMB6POHLkCEcPH3nX2traf2oaT170aNtACG3XXuBmuxhMkxrTBE93Wwk7faJj9KToSGapexeZlkQDZkJmoEiQJ9jd54UvfwG3/NDrn8+rX/xMzt7pycMBbDqCtdDEJbK8JKYxTT2CaKmyZWxYItYWWw5og+NwE/nvX76Z//N3HvnNex7j74wdTBJgcky5jVTX3bBJErOyAGOnGw6Yha/pLAhi9vgA/pQ+N3bhT7fp+0hJABERUQJARESengSAW4xQTp4ASJtXMN00EZCmSYB5oMRCTmEh8HFZRgjtNCiMlHR9/ssG3vhy0i/+D6/lZc/dia3348pAPHwI2+uBLYiTlqYNuKIkz113lW1LWycau8x63M539o34wjf38sWbH+C2e1szTFCT0YRuK7su+A7T+nW61WfscR/urIR+sYx+88T+MD+9KAr6/f5P93q9j2RZtmStna+8z3rwt271N28JOE6Q/t1MABzr94tVBsaY+Q4BeZ537QCzBMm0IsF7z/r6OocOHWJ1dfWStbXhnYvtBd32gmF+XbPHvfjcze9LyuaBdLSegCfZBmOmcyASmBq2ZXDZuaQ3vGIXV7/6Al5w0TLL+SqhWSNzJT5FsB6XWyw50YNrM4iWOBljd+wA37AWKr79cOTf/c6X+NPPY9wAhqbP+npLN7QRHIl+VTKajLr3tNnynp7F/JuC+VNMAqTFhNssURaUABARESUARETk6UoA2C0R+6kmADavZDriRiJgvlqaYbOK1DaUNPNLeKA1BmsTu3K46Bmkn/3xy3j761/MsjnIsh1iy8TaYw+yvOtMJqMJbYCqqsizDMYjGK/ReoNZOp+10OOhAyNuvOVerv/SA9x8FxcdmrBnCJBDS4GfbmFnTcCY2ZZ9EJM5YQJgFtRunc6/MbCvG/aX5zlLS0v/amlp6deKoiDGiPd+HmAf6/IxxsclAE5t8v/mBMDxBwSevJJgcdDgYhJgdj+Xlpbmt+GcwzmH957xeMxkMuHRRx+7aX19/Yr19XVijGRZNn/OYoybrn/2PMwSAc5k06xRJNhufkCw3fNpksVFqJwlTlp6wFk9Ln7pJdzx2pefx5WXX8hlz1omGz6AsTVkOYFEaz2JltIYrLFACTVQLpNay5rZhtn2LP78K3fzz//Nn39sz6P8D2XPcmQcu3V/17U2YG33jdkc16fZe2V+gmVT1cspJQA2PjeqABARESUARETkaU4AzJx6+f/8cmbaRE/otoObhjPzdoDkMCRKPPlC2GMNLPXg7/2tC9Lb3nAZ5+7skU8Os2u7Iw0Psr5+gOWzdtHUddezb3JMTNgm4hqPDS0+LbOv3cXX7nyEL3zlm3z9Fj7xwEHeFgF6MGyhJcOTd1vUTQN/Y8JGKfpJEgAxxk3D8xYD2ZQSRZFRVdWVg8Hg02VZLm1dcffez7/fGoyfSrB/sgTAyX53sssf7z7M/q2qijzP54H94vmstayvjzh48CD79++/aH19fU9KaVPSY+vztmkgIWa6ZWLstgkkEUw33JFUYJMhtIEll9E3Lck3OOCcHfyzV7x4+YNXXLKTd7zqPFaWPBSBpj0KuadYLiF62qND8rxPqsEUfSiWGI8TtR3QsMSBYcXHfu8GfveP7zdHPEyA2kAqph0ns5xYApc2Pi+R2LWQmCeYAHhcEgAlAERERAkAERF5upMAHD94SSdLGrgugLHt5oBp4eDU75eMRjUOGNANYH/pBaRfetdree0rz8b4/dA0ZMlTmECRJcgCZFCP1yl6fZo2MlwLFG6ZQbnC8HDNXQ+P+MOv7+OLNz/CnfdgfATyrsKgSeBTTjAZmGwagIbuzhk/TQSk+XZ1xxNCmK+IL5byz4bo9fvVP6uq6oNVVc0D/tnKd5ZlNE0zv/ysPB661oIsy+YJhqcS5J/o9CcyF+B4QwTLsqTf71MUxbx6Yf72SN3sg9FoxIEDB3jsscfMcDjEGLPp8R0reUIK5NMCiGi6cQjJQDIOYtlF4sFgcZQm4WKDYw0L9EvYVfDzP/PGM3/z9S89i5e8bCf5YJU4PkCKHmf7QE5MEbu0RLO+xmjSsn3bmRgKmrEn6+/ioXXDF7+xl3/7m7ccvmMfO8fAyEDWc7R16AL26KZF+7P5ABshe5pvJ3CcYP6EAwRR8C8iIkoAiIjIX6MjSDpWssA+/jrsNPhJFiK46YDAzEEIUOWQWthp4O//1AvS337Hq+ilhyDuI7Nj8qykyHNiCIRQY63H5UCZMRnWtLGk6p9FYhd79hzhC1+4jS9/62G+cC/FoYbWWHA51DVMPBhTkEwG1nXb0dlZv34k0XYD+JiuNp/o6VkIimfBf57n9Hq9q8uyfG+vV159rCB6MeCdrZyHEOYVAbMEwhMN/J9IYL/1tJMlFI6VCJhtGTibcdDr9SiKYv54wJLn3Q4Hs9kAhw4d+vDa2tr76rrelCx4XBVF9JsSACnNpu4bIhWknF617eJ6Eu6MbYvBk7sGZ1ucbeklOCPAq19E+uG3nseVL3sGZ21LJL+Ow0FRgTUcPnqQwfY+Ra9icmgV5yN5sYSftGRnnsPegy0H1rbx+5/8Jr/zxw+Yx0Zd10DTvdos9usb4sK73xKnaYHNwXx8kp8vERERJQBEROSv4ghy0m38pkGRicxK/bvrC4sN0/ScwfrEAPiBK4r0yz/3Azzn7Aq/up9dywabjkDPQIi0dd0Fk6WB5MFEgo/4VBDcGRydDLjplsN84vpbufHmtXc+NOa6SQm1s6RoaJoAKaM/WAYMa+tDcld2wa3t+q1D6rarg4jlxOX/s6B1sZy9KAqqqnpvVVUf6rbXM/N+91mf/OKMgMWV/8V2gllVwJMJ/p9oYH+i8yzOEDhWEqAsS+q6pm1bjDH0er15EqB7nOZx1zerBjhw4MBFdV3v8d7PEx+zwYLdc+bJ3LSChDQfsI8FkiNSEJsINiPLSowN+DAmhQYc9HJYtlB4uGg36a2veiZvfc0FPPdZA3rZkJBG2KLEJ99tU0hNFhqqzEHogYeJSWTLy6yOEmO/wk3fGvIbv/MlvnJrY4YYJrhuzd/6TW37bvruCfMEwNaV/PgkP2ciIiJKAIiIyF+7BMBCoDMd+Nddn59fZxa7Cf/P3s5Pv+tHL/vYj77hUrbnhyjiUZZ7BSnVGDzNZI1i0IeqIo5HYA22LKmbCNkyFLu456Exn/jMbfzZ5/exZx9mHB1j16PODePQkjmHsxltXRNDIsty8iyjbVusnW13N60CIJCMwZnULT2fwOK0/qqqGAwGn66q6uqN6f5+UzC/qcd9mjxo25a2bW8xxqwURXFeURSbqgKeSgLgqbQCHO9yi9c9a2dY3A3AOUdRFGRZhnP5pvPPnpfRaMT6+jp79+59Z13X100mE0IImxIAIYSFKohI6iYC0l1dN7Qxz3rUviWGrq/EuUS0XSUHqXtX5gEGCc7q8/rnn28+9+qXPJPXvPw8nnfRTsoyEppVsDVVHjGhJvqAC9PAPe/aDnyCmLaTV8/jO/dGPvpfvsC1f3GfGQEjwM9mZc5a/ZOd1wWk430ulAAQERElAERE5K/1ESQd/2yGrq87hND1VpuMzFia2JAM5KWhbRPEbh/3HvD6i0k/9dbn8eaXnM+yXcOGIS5vCLYlGSiyHoSIzc105TdCVhLNgLXQZ7XdwWdv3MOffvZWbr6redHhEd9qTUagwhtHY3w3OC4tpinS/OdZNcL8YZk4H1JoEjhj5ufduqWeMYamaaiqin6/f8101f/CxSDZWjZN+V/8HcDa2tq/ds5dXhTFVV3FwOYKgafa/794u08mUXCqVQiL0/tnQby1ln5/aV7av7UqwRjD0aNHOXr0KI899tg7jxw5cp33fr7zQQiJouzNqwFILZguAWBZqL4w04V3k0h2OmByuhqfWYMfJ3IH/SInjFq2OXj95dvTD1x1EW951TM4c7mhSEOa8RCwmMxB5rEu4OtVynJAfSRQliuQDZiEAY+u5nzyc3fwLz9ym1mNsEbXFmBzSwgR4sYWjyl6DF3ywwfPQhZj03vqiXzeRERElAAQEZG/kgSAcw6TIMTw+ACSDJcZjGvxDfSLLlK6cCf/6O9e87J//dpLV3jmcsMSq9h2jSK3mMwTsoas12d8tKHXX4bC4euGJliodnF4nHPXQy3/9598jbv2eb7zUGsOTyDajGhzIqHbTcBaorHYBBDnD8ekjansiY1dCebD22bbu4WIM3bTkL9Z6b61lrIsyfP8mrIs35vn+eVbJ+FD3BQcG9MNxWvbdm/bttfleX6Nc+68Wc//7PJPNgFwqiv5W8/7RBIAxzr/1gTA7N88L8myjDzPNz22xURBXdccPnyY/fv37zly5MhFTdN11xubUbfTrQJNwsSAs5HMOWLb0PpEni/uKtH9G83Gz4Vx1G3E2AKblYRJxIQRK1nk/F38xt95x7Pf9aoXnsmLLzqTLPOkekwdRrRmTJZ5ejZ07SuTDLIBsW2ok6G3/UweGxbctqfhX/37T/HVOzC2gMNNVw1gbNElApJ/3EfIWQd2YwcIJQBEREQJABER+WueAOiCOWcgToNpa8EmyLJucv6k9aRpsGhTYmcFbgJ/43VZ+oWfeC3P2mZYdh4XxoybIThPUQVCHGF8TVHkmGrAeNziTYEb7GaUtnHXwzWf+cq9fP7GB7htD2bdQ0sFZYErDD6O8TTdanFrNuYPzB9OxC5U989WkMFunIbFJDApYTHzcvfFXv8sy1aWl5fvsdaubB1gtxEgb0y5jzHivV/33l8fQrgJYHl5+YOLwbA53srwKQb5T3RA4BNJJBzrtFliZPE8m78ceZ5TVdWmoYaLsw6cc4QQWFtb4+DBgxw8ePC6I0eOvHM8riGftkOkRGwbrDHkzpJZS/RhU7Kme7YXkjdEbAzEBC0lZDkmz8iMx4UhZZPYXTB43Yuq9bdd9RyufMkzeMaZBt8eIsSaslfAaBVChHwA5QBqz6SeYAqINsdTcWCt5No/vp1f/9ijZgQMgdYUpMyS2gm9vPs8hBAIJOIs99TtNbFwz5UAEBERJQBEROSvXQJgY1W4X5WMJ+MuGeCAsDlmMQ5c6Lb36wMf/PvPT++46hLK8QPY8QGIButyJibRpkBWBMo8kE8D55QVTFLJJN/Ow+uOL37rET79lT3cdFva+ehRDmd5QaBHsg7jIoGaOoxJtrs/ru36sTfSFo+fyZ5mQfdiEmB6mcxaUojzCf+zXv9er/eRoijePZtwv7h93WIAnFKYl/RPJpM/rOv6wwBVVX2o1+tdNQuKj1eKvzW4fiqB/7HOd6qB/vF+t7iqv/VxdN/b+UyAPM/nVQ6zZEeMcb7l4awa4NChQ+zdu/emhx995IpoLBjTJWFiIoaASVC4jLIomFULdHfCToP/bha/JZDbmmigCQVtSGACpjCUWSKPnmzcvTfP28m1V79q6Zqf+OEX88JLd2LDKvXafsp+D3wLRQZtIEawmcW3Y2JqsJkBt8Kh8Qo3fPMw/8u/uOmqvWM+PwEazHR04fS5Ml2SrJkWylRlxbheuP+zeRlKAIiIiBIAIiLyV3YEScefhG9JJBJ2y8HGWShKaMZd4P+CM/jyv/ynV73q8nNLwuEHiO061XKfiMGn6bT06eq6cxBNy6hpyartHGoLbt835s9uvJv//tXJO+87yHXRgc0qTMxIMWJjS6LFG4gWYg5ZZrCThFtYIo4LD2x+8qbHZzetKBM3+venE/4v7/f71xZFceHiDgDHCv4BYvR47/c2TfPRtm2vs9ZeWBTFu3u93o+XZTm/7q3T9mf/zhIPT7YV4GQJhCe6W8DjXv+TzAhwLp+/rnmez1om5pfL83xeWTFLBLRt220XeOQw9z94vxmNRhCgyCusMbS1hxTJXf74O5TcNEFlwTRgxhgLjpKUDG3bEunmQlgHeQ55BGrYaeGtV+5If+MHLuWVLyxZ2RFoVtdwzuLyyKQZ4UwiL8puKqB1UI8ZjicMdp3JatPj9vsT/+YjX+YLN2NGABmMPPMdDJyFGCGwtQLgWE96VAJARESUABARkaeTPc7P08CU2JX8h0hMkDtwGdQ1lMBZDv7mm3enX/mZN1IM72dbOkJlasgzsIYYAhMfyLMeeV7RtIkmJqI1TEzB3iOGz33zXq7/6n6+9QDmsRZiCRTLtE0kNwkbW7LUYqZZiGAyvOkCQeNrXEqQzKaS/9lqsUmPf5xmIejyMcxXsPv9/nt7vd6HZqv+s237tg75mwXeKSW8b26ZTCbva5rmk3meX7m0tHRDr9frrtv7TWXxs8svJgCO1wrwdM0AOFnFwPEqF2Y/Z1mxKcAvioKyLOfDDrMsY/PQRDufk+B9w0OP7OPhhx/+4IEDh/7nFKbXF+iSPhYc3etqid2qf5q+CZIl2kBgTAhQYugVPRyGNjQ0piUVUDdAZijTgLwZs4PAJeeRfvytZ/L2tzyfXUuJwjVEP8Y5T+YM1BOoIzBtLSkco/EqxfKZrNbLHFzfzu9e+01+79MPvureMV8ZA0UBMUAbuiQANqf17TR19vjPFcdIWYmIiCgBICIiT1MC4FhVABFDpNcrqcc1MJsJ0P32wmUu/Dd/98X3vP7SXUQ8ZeXwfh3ShFSvUZhIUVXQtGAKfLAMG/C2YhIsD64V/NZn7uIr3z5w3b2PpndGCynPGMVESJFku+nus6Hv3TJrTgoFPmSEFChz360ET4v/N1b3u4F/dh70d5u2menWcSZNdwJwjqIqV/r9/rVlWV49C9gXt/NbDP5ngwK993u899c3zeRfAzjnLu/1eh/p9XpLs50StiYATjaR/1SC/O/2DIBTaRE41nk3Avpsy89dJcCsHSClNP956/XE6DE2cuDAAfbte4j9jx4w43E7307QmEQMLclEzHQ3gC55YzZe7yzhQ8S0jiw5MgzReIILeAvFUkUznEDIKIqSIowwdeL8XfzSy5/Pr//iz7+Mi85x2LalIlGaAE0NhYUQwBbQGMi3c3h1QtXbQVn1OXRklU/ccDcf/K2HLrnvCHdC1wIQpp+NoqyY1JNpAuDYny0lAERERAkAERF50geAdKxA/phlxgvnMdPvU9zy+3n9PEVmCL4lA8ppz/8LL8rTP/ibr+ftz46U4TEoBqy1vuuldpGMMUVssU2NwYGtaELBmGWOhj5fuWUP133mO9z0IOZACyEajM1oE5jM4Arwsdm467G7izblWNODVJJSADsBs3G+ZKaBf+p6/W3a/DyZFDclAJa2bbum7FUfqqrqwtn+9DHG+QC7rZPcY4y0bbunrusPt217XdNMDi8tLf3S9u3bfz3P824QXOiqCvI8x3t/ymX4343g/6kkAE503uPPMOhW+WfBfghhvnvCrB1gc8uAmydFQmjJM4tzlqNHV9mz5z4e3PewqesWYxIhtFi38c7edJ9SN9uhTQmX5WSpJLURYsC6SMoinkjwCdPrkaKFeoIzidJCFiN9By9/Punnf/I5vOy553NmZajao5jmCHa5gPV1QjC4aoVkBviYEZuaMgfMKutpJ5/4Zs5/+L+/yDfvbEwwMEnT8n/X5Q8gm36KjvX5stMEQJr+G0/8193Ce3nxkiIiogSAiIicJv/zzzfi467PHrvlqDBNAJhpcJEs81p67PRnD7RdaOIMMWSQMroS6ATUOOcpA2wD3nEl6Rfe/jou211QhlXw6yTAZwU+c3gTMClSuESRPL72GNOjyc7g7gOOT33jQf70q/fyzfsb4zPwplsljfPS/Y0t/LaMHJz282ddUgFIBLZuxYc18wA/tH5ejj4Pzo2lqiqqqrpmefu2a09U5r5Yoh9jZDKZXD8cDt8yC/JXVlbS4rT7rS0CJ99mL54w8D7VGQFPtMT/RKX/J6oKWEwGwEZJ/9bZCLPz9vv9TdsEzp7P2aDAlBJZluGcYzgcs2/fPh588MGPHjly5D3dY4/z52HWkjFLNnjvMV29/XwQpJluB5lM7LYM3FThEnFpOkIwRYxJZA4uOIs/+IFXnv3jP/6GS3jZBRU9DkNzdFruYvBY6thVJVR51g0NbCdgl/HtLr6zr+HfXfcZfv9LmHULYwM+djMAspQTiUR8t2uFM2ArYjP7fHWfXGi6f008/l91qXt8buGT2SoJICJyWnJ6CkRETs8EQDb9N82C/9lvzGLUsFgFYKYhQ7f3+qxX35pASmAjOCJlVhCix+DJ8JQJtgM/95Z+evePvYaL+iN67UGoh5DnmNwS2oYYAr3cUVhL29SEYEnFdkZ2B7c+OOaPvnw3f/yl+z5268PhxU1R4o0hmoWBfWZLwD8voV6sSogYE8GEeYC9GHym6WC/FOOmlelZsFn1KvqDwYfKqnq/c663WL6+das+5xwpJdq2ZTwef3g8Hv9cCIGyLK9eXl6+Zxa8LgbCJwrAH396+q4E90/0PN+tBMDjtwU0x7zvx7r+2TaCIUTatmuXWFlZYWVl5XLg/evr6x9omhYwZFlOnhfEmJidVpYVMSQ29niYRsjTnQIMZuHdkxanQEwrRXI8JavD9r8++vD6XY8deOgnytxy1u5dVP0BoR7hgyfvlxS5wTcj8A129nkKNTaMOHP3Mi94wUX0+0fe/+07xx9o22lyLrc00WMzulGapqtiSaH7061XDfC+ZmP1P228/0+y+m8f/ysRETnN/gYUEZHT8H/+XQbYTouIt2yCNw1UDI8fQTYPh6ar7S7LqCyk2s9XGFu6tckCOH/A63/xmks+92OvvJCleIhBHrB+QqhrcAmTVdjckkJLqGusCdhiwJovGea7+Nq9a1z76b/k8zfXZi1AymHYgC02h2an/NjnQeTmHPjiwL7ZCvysnz/LMqqqmvf7z4L7xVXp2Sr+7PTpqv+e0Wj0zrZtbzLGUBTFNYPB4NrZsL9jBc1bhwYePzA/cQXAsYYEPtXhfqf6u9ntnyio35qAOVaFwGwuwKxVYPYcd5fPNj3OsiwxxnDw4EEefvhh7r33XjMajfDez9sJ2rarVimKghDCU/j8REwIXZF+hGUHL72E9MNvPI83v+J8Ljzb4eoDZLHuPgg277YVaFvaVGOLnDZApCIx4Mhoia/dus6/+Hdfvm7PId55FKizadHKND8x6PUZDyfzyo5ZZYJZ+AkWyvu37NJhpjUNs/MHJQBERJQAEBGR0+kAsLEeuCn4n0/x53Fb+KWFc5msm17uUldNULAxdC+nm/R/+cWk//HH38hLnzVgB0eo7ITV4RF6vZzMuY2AzGWQAqH1YHJCvp27DwU+9Y0H+JOvP8odj2JWI7SmSzDkec6kCU8pAZCSOebK+4z3HmvtbIu/a/r9/rWzQHJxyN/s+8X962OMrK+vv28ymXy4bVuKomB5efmefr8/nxcwqzBYDPpPFJg/1QTAqVQYnMqq/5PZMvBYK/xbWwCOdx8XhwPmeb6QBOhmJQA0TTNP1MxaNu6//3727dt33SOPPPLOlNJ8hwHvPd537R1PJQHgQqAqukREPWkxEZ59Dh952+sH737LK87n5c/ZSS8cxTVjsBaqAqKnpsaUOT4zTMaeoikYVM/k8JElvvNQ4P3/9k+48T7Mej5rrpl+8EJ3NYZuu0B4/JyK2VnjvG7BsDgn4FifZRERUQJARET+H+9YE8a7yf1sCfztpnN0At3iYq80xHFitsP6bAO0FQNvfznpl9/5Fi5ctjA6SG4trR+SDwyTdoK1lqosSZOa8XBEvxzA8pk8erjl5vuO8kdfvYsb7w4fvvMw76sd5P0+49YTfUOZZ9Ny6Cdx4DtGAmDrdn2zIL0oCnq93nurqvrQYvC/ODdg9jUd8kdd1x9tmuaj4/H4pmnwujIYDD49GAwun608t227acr/1tXyU9vm79QTAE82aD+V8x3vvMf73fESAFsvO+vzn7VT5Hk+Hw7YJQHcfDV8NkdhVnkxe+yPPvoo999/P/v37zdN08yTB7OZAE8lAVACbRsImSUrHD60uBaetcLVl57Np9/zE8/nVZfuZscZFlYfIjSruEFByC3D2BILyChZituIRyI228GhsWPvpORf/Oaf8vEvY4YWTA4RR2y7N/ygZxiN0nwg5eM/o11zT5ruZgGR1E3aWNgWA20iICKiBICIiJxWCQBjZxvfHzf4P5bZemKy3fZlWdgYKJMBZw0Y/Ohrd63/jz/0Ulb8QXb1cxiPoMihcKytPcryyjLNpCVzBTYmQnIEM+DBI5FP33Q/n/rLR7jhXkyoYOIK1iaehMFWJRCJk5o8c5vb/p9kAmAWgM+Cwllffq/XuzrP82uKonj34mrxrDR9NrV+Fqg2TcNwOHznaDS6rq5r8jxnaWnpmuXl5WsXg/1Z4Hu8FfrvVgLgVJ6DE513cQjhsc5/rFaF78YQwMUEweKWis45iqKgKIppS8BGGX9RFPPXZNa+4ZwjhMDBgwe599572bt3r2maBmMMZVk+tRaA1G0W6VPEG4txGcYkbGgYRFiO8JqLSX/zBy7lB153EctLE2gfI8Q1vEuQGaKJjI6O2FnswhTbaQ8cIj/7XB49VHPEnMG//50b+KPP7DePrHVZNc90dwCzOejf/BmYTfZYrOyJREK3m8BiAiChMgARkdOQhgCKiJyWDJjZwL+N8uBjlfzHhVhh8assHd4nAhkJyEk8bxf/6l1vu/RP3vX2V/KMqsG1I2gb3NIAPx4Rw4Terh0MDx6gV/Ro20QTC46GHjfdP+S/fvEufu/GQ7/+9Yd4pR9UrHqHD4mqLMisoR1PSMlRLW0j+RbzJCKYjSDUPC44zbKMoigoy/LqwWDw6TzPL1+c0D877+LqdNu2jEajjw6Hw7eMx+ObZomBpaWlqweDwZ/0er15MLuYQFgMoE82tO/Y9z894QTA1ts6Ubn+qVQAnKxN4KnMANhaZbFYeQHgXDbfGjDGON92cbZzQNu23fT9btcGnHPv997/HzHGyWIC48lIFppkcFVBXjhCaEmNx8SMKluizItz73+k+cePHjj8/kPrQ2yR01sqsZkBWqosI59E+stnYprAeLhGeeYZjFcP0asgjzWve8WLGLjh+/c9cMStDfmLmCCRk4g4Z4hx62cyI03HFxo2PtddBUCcf+y19CMiogSAiIicrgkAABPmBwSzJfDfqAmYFflv7BYQ/Kz82pCnyGVn8pFfeufrfvln3nAp5do+ijDCELB5TvQRa1PX5z9cp6r6RJ9BucIhP+DL3znI737hDj7xjYnZs8on/dISYxxYhyUQ2habYjfMzRW0dY016SklAGLc3Ls/W2Hu9/sf6fV6/3uWZZum+y+uWM9WmUMIjEaj96ytrX1gOBxOQgiz67h8aWnpi7OV/1l/+qxnfTZf4FjB76kPAXxyCYBTPc+JpvGfSjLgZAmBrd8fLwGwWImwGLRb6+Z9/LPntyzL2fwFyrKkaRoAtm/fzs6dO8my7L2TyeTh0Wh001NpAcBAzBwxtATvybOMMitwKce3lolPq8k4Hj7UfOCOPau/++ihh35527Zlzj5nN72ypB0NyaKD9RGUOXm/Yn19larMyV2kZz1MjvDqK17CGTv7V915275taxM+5YzDYAmpC+s3Pptu/gnukgERQ5h+pfkkAAX/IiKiQ4GIyGn7f/9pYJXiwq4AnW5CuMUWJbGN3fQxgOjBWfAB6xwu1hQJnreTf/bPf+nqD772whXafbdzxraSZBzjlJhgyAtH3yZsO8SMh91U9MG57F0zfPKbe7n2c9/hxr2YumeJ+QA/qcGBSxE726Et2XnfczIQTTxh+L81mNz6O2M2esadc/T7/cunq/4rs77z412vMYb19fXr19bW3jKZTOanO+cYDAbXbNu27drFFe5jBcyLge2JAvLj/y6eUoB/omn8J7p/J0sabE1UnOjxnagC4FSSDse6jTwvKctytro/H744mwcwq8SYnZ7nOSEE9u3bx3333XfTww8/fEWe51hr8d5vaumYzQk4nmAguml6LFiyaHGzt1iypGmSqCwMzo/IPFzxPNLf+1sv4i2vuYCldAizvh96GcTEJEFRDqAN2GbaLtM0xFASly/ihttX+Rf/8TN8+duYGmjJaDBkZY8QIbUt5EX3nmgnZLkltPUxP9Mbn/SABgGIiJx+VAEgInI6ZwHM40v/Z6v/rux1wX9Z0kUZkaJXEuoJGYEsBXrAxTv4X//5r7z5/c8ZrDOoH2HlGTvh8H5MiuRFjssdk3rMpJ5gs5KsGNCYFW7ZO+G6z93BdV/Ye913jvCC9aqkCY7oW2yVY2KNI2LTbL92i0kWlww2JaI9tdX/rVP6gWlvOfNV/6qqLq+q6kNlWT5/ccV/Fjxaa+dD++q6Zjgcfng0Gv3cLHAEZiv/1/T7/XnP/6mWzz+5BMCpb/N3KgH1E00AHG+V/3i/O9ltn0pyYvO/m6sGZsH71td8/gfPdJBgnucMBoNzmqb5kfF4/NHJZDKfCzC77GKLxrGfE7py+2TIUhf8dzM0AsEFokk0BoJ1GFcSUsORw3zgsccefb+1ll27zmTbyjZoJ1DmZHnOpF4ntxGTWzhyCPoVhobR2gHOOmuFl7/8csbrj77/rj3jD0Akywrq1ndvg8x1WwM4ILPEdtJ9vBc+12b+39mcgIiGAIiInJZ//YmIyGl7BEgbpf+zKf7zlUKTQ1VB7bvfpBaSJwP6wA7g/GV++//7T676mWfvaNnuJpTWE4e+G9bnIuHAQ7jlCpZ3cGiYMPkKoS24+d41Pnb97dx0//qP37fGH40Bs9SniRFCjbWQTQN/Nx9CkHXBS3JAIlhPMvGEgf9iILl1mz5juv7wfr//kTzPr8mybGWxpHxxEN+WQX9vGY/H19d1vdCP7lhaWrp6eXn500VRHDN4PFGA/OQSAE+tAuBkJfyLlzve748XqB8vaN86BPBEvz95AqGbzZDn+Wxuw3wngBDCvN1iccDj7DZjjOzfv5/777+fvXv3Gu89s10eZgmdE7cIWEh24Y8oD8aTTJpWp4B1Gb6NFFhKC0w8JXDZBaQ3v/p83vHWCzj3DE/pGjKGFIWHeghNgt4OWPPQG0Co8WTEwTO4+5HIf7726/zWHx82PoPDHjwZWDdt6UlgArbMiOMJJnXbdNp5uJ8RyKf3ue3ut4iIKAEgIiKnewIgg6yA2AV51aCkXjtCAewaQBzCD19q0q/+zA+yu3eUM3oNLk1oRyPychu0bRdghCHkCVyP1Ww3R9IKn//Gg1z76Vv40v2YxmWYzOFNIllDsokYA20bKFwXvLhZnJsskWIewCR74gDmZFP287yk3+9/qNfrvXcWOC5edlbSb4yhaRpGo9H7RqPRh73382TArDKg1+utLC0tfb3X6104CyJPNkX/r1MC4FQn+R/vek+W4DjelP8T/f5EiYR5EA6btggsimJTcmJr4mcW3GdZRkqJQ4cOcd999/Hggw+a0WjEYkvA1haNTfcpWVzYeB9G64k2EM10Yw3AYCAmUgu93NLPMuphN5Ng1xK86sWkd//slVx+yRk0R+9nKV+jyCDVAZNvhybHr4/JljKInkPrDb1dF3DPQ4n/9Htf4bc+MTHeQMhhtYFkLZQVNE33uZgO/d+cALBbEgBqARAROd2oBUBE5LRl53uI2Y18AJtOSd2KYqhHnFFB5sG18MbnkT7w82/gwqWafg6TSY2JiXz7Dpqjh3Fl1u1Z1h9AgMCAo22P3//C7fyHT97z4b98lNeNqx2MoyX4lsJFclpCE4gxkWcFKXW375jOACARDbQ2Jxg7HXAWTxg0L265N+vpngaLea/X/9/Ksnzv4krxLDBdvNxse7+1tbWPTiaT+WryLBAtioJt27Z9sd/vPx943O9PNdB+ulsAnkwbwKlc/4nK9p9IhcCJrnseYh9jeOIsKbO4JWCWZfOZDrMtAgF6vR69Xo8Y4/snk8kHZkMDZwmC4+fOHDYV049RS3CeMNtVE4OJjtREytxhSAQ/XYrPCiYhpw6BPffzgYNHHn7/yhlLPPuCZ5A5Qz2eEFNF9N2QzixzXTlBdPSyAS5FqnLC857zLB55cO/773+ID4QAZQZ1mDbvuLzL4hGn2xVufLa7qRmLn3S1AIiInG4yPQUiIqehecO/nYcFjwulU6DoVTSjNQogD1ACl55N+vs/9QYu2JFg7THob8c3nsHObbSrqxSDqitHLpYZTVpccTaPrMMffO5bfOwvjv7MHWN+Z9xbwubdyiYpEaeVBjGAsRnOFMTUbV8WaDDTREW3whqIJuJSPGH8sjixfzEwLMtyd1mW7y2K8tdmK//HmxMwGo2uW19ff2dd1/NZACklvPc457DWUhTFhVVVXZ5lGW3bzifSzxIBpxLg/5W9DZ7gDIAnknB4qjMAjlW5sPm2zKbXqm3bTYmfxSB+awvA7Hx5nnPmmWfOEgTp/vvvN8Ph8BRerzhtP4kEQxf5pwTGYGKGSRZjgWixNhCBiY8kAjGviFlJimt86ovBrB69Ka2+8/lcdfl59IsS2wypskQzGdJbWoZhpB63lL0lLIZtaY1sueAf/d0fJnOfSn/2VW9GHnoWRj4Alry/RDsaMhv0t6nb33jmNQGK/0VETjuqABAROS1ZMHbaNxyPUQEArizx9ZAM2D2ANIEXn0f6f//Kj3LxWQMmj91Nf9d26iNDBkvbmQzHZLmjbSdkVc563VIXK9xxqM9vfupO/n+fPmgeiXyrOmPnjw3Xj95JPWIpbyjLEp8cdczAFWQmJwYzLU6wRJPjbUYwjmjAmAaLP+mW5rNgfbYKXBQFvV7vyqqqPpTn+TXOZcVisLlYKt62Levr6+8cj8cfGI/HhBDmLQGLwWlZliwtLV1bVdWFs0BzcYX5iQTbT3cFwIl2ITiVFf/vdQXAyYcEmk1D/xbL/lNK83L+zXMfzKbfG2Pm2wdWVUWWZe+PMT7ctu1NJ6oAwCSS9UQX5u9Rk3JMynDJYjAUWYlvI4YClxUEYwimBdPg2xqLocgtjzyaPnDLrY9tW10fveqss89mZVtGbA4zWC4YHjhAbBzVYAXahB9PcMHgQsb2Hbu59AXPJzOH3/+tO9Y+4BMUpaMJhth20/4NZroN4EYCrfvgKPIXEVECQERETiNmGvxvBJMbc8G7KeEpBiyRAZC38Npnk/7Jz7+By565HTN8lDNXKprDBymqPikk8l5FDAHrLONoqd02Hm238R8/fhMf+/x+MypKRq7H2tranduWSkrjiQEmjSfiMC4nJgMJrLFYZgPVLMnYafAfcQt7m58oBTAL/GYr8r1e78per/eRPM+vstYWxmwEj4uBZdM0eyaTyfsOHz78W977x7USzJILAIPB4OqlpaX3Lw6PO17v+BPZbu/pSACceq/9qV33qQTtT+T3W2/78ec9dgJj1u4xa+WYvR6zxMyscmPWEjJ73bZt28bOnTux1v7I+vr67XVd3378z0+cVqJ08wAMdhpsm2m7CpASPgSMyUjG4H2Lybrd+qKH3ELdREy5xOqo+dQ3vrX2gdX1h97/nPOfwZk7lmA8IjeWoloG4whtS+YcuAJ8pPEtKzu2ce6ZO2hHe99/733+A6OQ8MaAzSDNuv67HQpmCb5N2T4RETkd/wIUEZHT8//+FpwDH+iVFeN6BGQYk5MSYCNZrNkFXLGb9P/5hZdx8dklk8mEpX5JCEOcM5g4DXqMJfpApMD3dnLXEcNH/+hLfPwv181hMtYpCG1L4TwuJbBmmnBwgJ2GKgvblqVpZfWm+x0xqQvcuiBvo5NtFtDNAr1Z8G+tpaqqlX6/f21RFFcvBuuLwWBd19ePx+P31HW9Z9Y/vthHPksAzJIAeZ6zffv2Dy0vL7939rvZ0MCuYiCdMIA+WUXAsabsP5HEwYkC/K0B9ckC8KeaGDjW7R5rF4Anmsw40WMvy5Jer0dZlo/bzrGrDtn8es7uT9M0TCYTbrjhho+ura29Zzwez38/qyLoWjw8ydh5pcrJzFoGIGJIZKl7b09SSZ7nZGHIICb+xuuW0j/+uTdz0c4JdvIoppfDZEjbpq60v44Ym5OVAw4/dpjlfInVZpl/+n/+KX98M+aAgeSybgigy7BtQ0bE0Y39ax2QO6iDkgAiIqchq6dAROQ0lhLWwqQeUWWOqiqYxZ3WQI9uu79/8rev5LxBoDQTtmcel2qKqmI8HmNNwBQZoa6x+YDU381dj3o+9omv85Vvr3/wsRpG0RBTwmaWPM8wzhJxJPL5oahbpdwIkmYBk1n8mgdbdlPwvxgQznr0Z2Xeg8Hg6n6/f61z7vLFSfCz4X9t2zIejz86C/699/PzHC8on/WPO+cu3xrYPtmA/QnncE4SAD+RpMCp3NZTOc+TqXp4qrz3NE1D0zSbWjNSSrRtu6liY5bgmbWK9Pt9XvnKV7777LPPTtANBayqCmvtwnvDLlTSx5N+mTStFkgZJk2TXxYg0AZozYA1D1/51vr7/sNvfZZv3rmO6Z9PWA8QDflSn+HqYbxtSS6yfuRRVrYXZGGVYvIY//Tv/SgvOYc0cIDzYD0p1hgipc3m7T0mc9AG/b9PROQ0pRYAEZHTku32Dk+RzEVchB6Jpm0J1kCZ4dox5xj48C++ML3k3IIzty/T1h5XlgQC1hqyaWkxbUtIBbG3i289NOLaz9zCn3zl0FkPDPl4C2R5RootzoC1GY0PGPPUDkFbp79vnQg/XQG+pt/v/5c8z58P9GKMewCccz1jDG3b7hmNRu8cjUb/x2QyOTwb4je7vlmv/9ZA1VrLYDC4pqqq92ZZdswkxOLy6hPpr38qQf7Jzn+sFfhj3acnW+K/9XZOVGlwKjMITvX2j/VYZxUgs9dwthPArLLDGDuvAFl8TmZtAtu3b6eqKmKM719bW/vAZDIhyzKyLKOu62POeXgin7+mjdgsI8WISS1lBsYEjqzzpfv21h+Y1PvfP+j3eObuXdDW2NBSlA5fNxS5o3SGMPFY26fobcP4mje96ZX8+ZdudYfG/EUoLARLnhJZiiRT0GC6pENKWv0XETl9/wIUEZHT0mz7Ow+V6VqGLYCNmMmQ3Q7+8c+/Or35JRdwRtkyHq0y8QHykhAtflJjs5LUeHzIsIMzuG3vEX77v9/IH375kHmkYf8EyKq8C7RSJAZPGzz+uxB8bO3dn/2cZRlFUbC0tPSRqqo+ZK1dmQaCh6fnXwEYDocfHg6HbxkOh9dPJhO895uC0+MNgZuVkVdV9aEsyzYFoYsB58kC2FNNcJwoiD/Z+Z/I7Z5sq8BTHdZ3sts/2X3/blULzCpBZlUATdPMX+PFVX9gniyYtQqklBgOh5xzzjm85CUv4dxzz02zFoDFyz21P79yrKnIrYEQibGGDJoCDgF/+IXa/Mfrvs639qyTsl0kn0PKyVMiNRMILW6pYjgaMx6tsnP3Er36Uf79B376f7pwiddn40hmAwZoAJ9iNzchJMhL/f9PROQ0pRkAIiKn5f/9LZgcTKIKDfn0iOBKGE1gGfjVn3hu+rmrX8TO+hEGWaBt1smXljmyOmLb0jJpdARnDD5lhGIbdx0I/Paf3cgffKUxBxI0RcE4OizgsgS+xqdEshZshnuKSYDF1flZ4D0L/ouiePdgMPjINKDbY4xZmSUCvPfXhxBuWl9ff5/3ft4usHVVemsCYHaeoigoy/LClZWVe2YryMfq108pHDOwfrKJgSca4J8sgXAqgwFPdD9PdeDg1ts+1ven8pw80cqJxdfMOTef9l+WJUVRkNLm987i6x9CmFcDWGs5cuQId955J3fddZcZj8dUVXXcNpFTe/NmYAqsheiH+OAxrjs5WUNlDQwjux289cWkf/izV/OC8yqatfsplhxxfKRrKSiXaYaGotpBWB/ilnexf+T48j2H+dV/fYN5pIZqULE69DgiZVExbJvur784a08QEZHTiSoARERO50NAjMwK2NsEeNgGvPttl6aff+sLKVbvZtBzTFaPkA8qiC3WgEndIDKKZdLgLG57aMx/+tMv88kbm7MOJfC9gjYbEHC0MdFEQ3JFl3iICRufeg/yYtBtrSXPc4qioKqqD1VV9aHZqv9s5X8a2N00mUzet7q6+r6maTZt77e4pdxsoODWoHLaI77S6/U+Mhv4d7xhfScKqJ/oCvJ3oxrgVCb/n2rA/t2qAPhezk1YTA6FEObD/Wav++Jq/+LrO/sqy3JeObBz506e97zncf7556eqqqjr+ikm4CLOWHzd4EPEZkDWDb0kZkxahx0UHArwmW9g/uN1X+Smuw7h+udCqrC2wlhHHA4plnoQa4wN0BxlZ9jPW19wJr/2U89LuyyMhxOsdUDEh2Y6WVPrPyIip6tMT4GIyGkoAVkGradZOBgYD2+5jPQLP3gxu9v9FNtzJkcepdo+IE66AGrbGbsYr65R2B6jNOBb969y7Wdu5eNfj+axBFSOJjiijTiXEYwjpoi3CWMj+BabAhgzn/z/pNIXCyvvzjnKsrywLMv3Zll2tTFmJcY4L/mPMe5pmub6uq4/PJlMDjdNMy/l3jrd/1hB7uLtFEXx7qqqrl683MnKwp9syfh3I1FwvPOc6v19siv0J6t4eKq3/0STRLPhf7PrKIrqcYmfxUqApmnIsgzvPcPhkF6vxyWXXEKWZemee+4xs3aCJ/W6pogJE7q5/A5cRXJp2ptvIASiy/G2Yc3Cf/vyxIzaG9K7f+I1PGenZWVpGVjHmgn4BoIBZ8EPyfqOdOhufv4tL+Whh4+k/+vP95tDviYHfPDTyh80A0BE5DSlCgARkdOVb8BaWrq9yQvggj4/9g/+1lXsTPspmsMwXqXqW9pmSMLQ376T+shh8qJPk+/grsdafu8vvsWf3jgyRxy0ZcaRSQKX0dbdDgHWAN4TgicZR+7A2qe+ArkYuE0TAO8ty/LdzrkLZ8P+rLUr1toLvffXj0aj9w2Hw8NN0zxu9XwW/C0OjDteYOqcu3y2g8Di5RYDzePND3iqMwBOJXh+qp5MD/4T2U3gZOf9bj22xddmtqqfUqJpGkaj0XxLv1klR4xxvjvA7HyzeQ+zYP+MM87g/PPP51nPetZTDp+NbcktFEUJyZHGESYBm8A6x6QJkPdYczlrFv70a8l89Novsu9oybjdTpg46C0zXhtCYbGFhVBDPSQvA8XwIX71Z3+QH3n12WmJjZ7PzBmI2gVAREQJABEROc10MUwyGXXbbff3//rZl/7hswct2/MaSgdNDZklt4m1cUMbDHnRo44Z3zno+c1Pfo1PfH1t6YiFteQYhhxXLtE0DYUzGD/BpQlZBtYYTApEDOEEQ8hnQeKsDH9xdX1xz3bvPVmWMRgMVnq93mzlf3a+w865laZprjt69KhZXV19X13X84Bva5C4WP4NzEvEF2+zqipWVla+vrS0dM1CMmC+r/xiYuJYE/aPlzA4WQB7qqcv3tdjPZ+nmjg43nVsva5jPb7vRtJi8TXZeplTed4Wzzt7XWfl/rPrm63qj8fjTf3+s8GBIQSKotj0vTGGuq4ZDAZcdtllnHPOOamqKtq2nV93CIEQwsl3CDCRRACbSDFgQiSzGbkpyH3ChUDuLI0PTNqE7+WEctoO8Ptf55HJTnxxNpORobf9DGIbwY+gl8Gkhayi6hnK0UP8z++6mledSyqAzEHyzcJ2myIicrrRNoAiIqclg7HdDIDeoKBoWv7Rjz0r/ejLL+DMYoytj9JOhrht24hHV8E4etvPwKeMOuU8cDTxX66/hc/ftva+vSP+ojaGxvUIOKzNwCRs8jg8loDFT4OORDKOZCzmODnoUykhn636V1W1Mp3Gf7UxpjcNEHvW2nMmk8mH67r+cNM0h2eD/rauCp/wGVoo8c/znH6/f02v1/uHs+qAk/fep5MGxScKnJ/oFoAnu0+nErif6r+n8hieyHU9kV0NvlszB1I69paFWxNOW7eFnP28vLxM0zTvHw6HH4Bu94nFrSNPlnxLpvuydC0BeTS4lLAJojVEZ7qI3UQiiRQidYTRpDlnfVRffv75z2DXGTuZDNcxfoQzvkvYDc4AU+LX1xhsXyauH+DSyy7kptvue+7BdX7fAFnmCFE9ACIiSgCIiMhpous3zgiUbctbL+un9/zoi3lWf0yeWmJb43ol3gdSdLhqiegDtSm4f9Vy3efu5A+/euiie9b5eANkVUGIlpAS0WSQwJqIJZClRJ7ATgPi1pREckzqEgLHC5YWS/wXA9jZ+fv9/oVFUfztLMuuttZeaIzpAcQYb/fef3w0Gv1q0zSHZyu0W1ePTyUBMFsd7vf7K0tLS18vy/KUguHu5yc2XO9Ug/knG/yfLBlwKgH6qSYTnmrw/3QkAGJMxxwAuDX4XxwIufge3L59Oykl6rr+kclk8lHv/abqlRMlAZIxeGtJBrIUyGIgI+JIRCzBdu89U1hINYRI1u0WyOERH9/7yOE/6y8v/71nnH0GO6tI7tfBRCAnZDuYtJYyczA+Sr+C3TuWWDlz5UVfufGhDzQJmpg0AkBE5DSlFgARkdOQAUob6QMXVlz5Cz/2ap7Zh8mRR6EeYfMcU/ZZG7Xkg+3EmDNqIgeGgU985W7+25ceu2Jfw56RMdgix9gMUguxhRRIJNI05Lepuz2zeOgxlmg2B/iPC5K29NXPArFpvz+9Xu8jWZZdHWPcE0K4aXq+w5PJ5H1Hjx59z2zf960l/lu3+ztukLaw7V+v1/tIVVXzy50s+D9RUuFUAvwnsiJ+suD/eEH8EwmoT+Xyx0sKnGoS4lSSHN/VP4CmrQFN01DXNYuJoq2r+FsrAZxzNE3D7t27ueiiiy7fuXPntbPdBhYHC57w/WUsCYtNCZfAEQFPnA/p75J0NgIBjHPk/R51vswDa+Yr1/7Ft5pPfPkugulD0Se2CaolxnUkkHXVA5khDQ9Q+YO84fm7+YUfPy/16YZ+2lN8n4qIiBIAIiLyfc4B2wysAL/8jvNveNHuyI6yoKqWqOMEssj46ISlwRk0WNZjpM3P4IZb9/M7f/HQzzzQcNPYFaSsJJCo6zHEltyBsxFcJBqIxhJMN6R8U5ifusTAsQKsrQmAxWBktg1fv9//kDFmxVp7oXPucoCmaT46Ho/fMx6Pr59MJvOEwWJZ9xMJLmOMZFlGr9e7utfrXTMbIrfYPnCqwfpTHX73RHvrn2pQfyrXdayV/uOdfrJWgr+KwHP2Gnrv50mAxYTR/5+9PwuS7DrvPMHfWe7i7uGxZURmYiWQCRAkuDMhLhJXMSFKlEqiugR2WamsqzTTBtqYqmxmpAfgoWpsZtQP5EOrH0ptbaTNlHqsqqtniBkrVfWUpqsIlbaSIIoEFxAg1kwAmcg9MmP15S7nnHm4fm7c8PRYckEuxPnRnIjw8PX69Zv3/z/f9/8mGTLNfdQYQ6vV4q677uLQoUOP7d+//1vNwMCd1b9EWIlwEjv6fhhG3xNRVcagFNJUBoACytKQl5YSQaYSXnwrS/74r1/ib3/yFoXrYKI5jNEoKWgnimyQwVQXKxVCFHTdEn//0Q9y5F5ci1ACGggEAsEACAQCgcA7Bg3EBn71o7H75Y+/hym7DkWvWt1MEkpTiZ84isiLAhdP86M3VvjW069xfJ1/nUddLBopHKUxFNaBEiglUBRIWyIpcUApBIUQlEJg0ShnkK5kUgjZdmn6PqQtiiLiOH48iqLHyrJ8Wkp5SGt9yFp7vN/vP7m+vv50nud1oNtOK7l7EYhpmvpKg8tMib2uXl/JaL5Jj3Ulq+RXO15vN2NgLwbElVYAXKlBcr1prvZ7EyDPc4wxW17X+IjHZihkWZZIKWsTYGZm5glr7ZbHmLjdsKiRCWaEoJSQKSgUWFmCKNE4hCmRUqGVwjhBXhY4cqQUDJ3kxTeG4v/9Jz/g+IpBd/eRFSWtSOKyftWOszFEdWfIsgFTsWMhLfnNL32UKaqpH9tt8ysJWwwEAoHA7UUwgAOBQOAdSBt4uM03nvhHnz5yIHV0taEYLGPKDJl0KY0kTSRl1qM0gtfPZ/zf/8MP+fZrThRJh36piMmJlMFRzSCXWoNzOJOjnUGMAv8KkVCKBCNiBALpSjSjUL5dxKUXIlprkiSZS5Lkf6+UOuL7/YFhnuf/cjAY/B+Gw2HVNz0Sk5OS5CdVFWxHFEV0Op2vdTqdv+MNhZ3aB0IGwO6PdbVhf1dqYlxJCGAza8L37o9/zpPen5SybhtIkoQkSQCO5nl+piiKZ3c0AOqS/yozI5eVCWBk1TgjnUUYg3AgZQoyxlqBlJZUFWhRoK2kKB1LK/xp2ip+612LHWajEmkLXJ4hoxZDW1JkPeJ2yjB3KJ2wb3ofZ8++/n9+6az9v2SjqpZAIBAIvHMIFQCBQCDw03I4F7q6jA7tW/vuKxSQAh3gf/dfvvvxB/fHRLZPWQyJIk3SbjMsQcYpRZFTOMGGa/EfvvMi/+k5K/oSMlKEkBhbwKjM3iJxbhR+5kCpzX9e3Kjn3yGxiNH/21Fo2Q4iqVF2PSr9fzyO48ellIfKsnw6juPHiqJ4am1t7cn19XWMMfVIvu3KsK+kDSCKIqIoeqw50q05T/5auR4j867m8a/2dnu5/ZVWGNxsmmMcjTHkec5wOCTLsonBkc39J89ztNZEUYS1llarxb333ss999zzjU6nc2jX7egsEkZZGJvfXTf64ko5MsEQGAvGVeaEFFXURhRFOKU5sc5f/M9Pn/n6M8+/hUvnsXmJSiMiKRClJZIJlBLtBGV/nTu6jv/qVz/FNJBaS7TllFBuPW4If2xh22NKIBAIBIIBEAgEAoEbjZAgIhBJ9V8kETDTUlsO9wkwC/yDT0+7z77vTqbdGm2dU5Y5Q6cpVIrSmqIoGJgIMXM3/+kn5/l33x/+0UUFWTRFkfWRwiJkjHGVaJCAM7Z6HqkorQChkAgiqnGAESVKWJxQWKlAqMv6q5sl/341P45jkiQ5Olr5nxNCzCmljqysrIiNjY2vF0WxZdXfOVeLup1KnJsVAs3f/crvzMyMi+P4UFP4+fLu6ndXXyqx5rZcdmO7doSd2hSa108aYTcedjgp/2B8m+z0XDsZHds9/6TLuOifVJ2x033HjYPqb2pTtAq15TLpuubtq787jCkoyxxrS6SsRHdZ5vR66+T5EGMKwI4+T4tzBucMYNG6egxrS6wtEcLRaiXccccBHnrowWNay/q2fv9QSiAl5GVBicA4h7AGZS3CWpStsgGcq0IynRBYVwA5WgmcE2QlWAHDwtIvQM9O8coFnvxXf/IGPzpVUCYzUBiwho7UqIFA9iGWES0KsrW3eM89LZ78Rw+5OaCrvahXKCKiyo4Yqf3RRhGVMeC3XjABAoFAIBgAgUAgELjRmn/LiXgluKkFk0UA+dCM/AGJour7fWCGb/3qZz9MRwzAbACGJI3QWmOMwdkSEaXI9j6++9JZvv2DNzi+wq9nkpFwd0iqFXbnqw2agX5VETOblQgW5UoEJQKLE6PbjMRlU/R7gefT1KMoIkmSI3EcP+4T/4uieCrLsq8XRbEltK0pGJuj23bCr/L6VX4/ym1qaurQpJFw17Nc+krL+a/m+r2+jmu53dVmHNzq+MkAzbaR7QyYpjE0NTXF4uIi733ve938/Pxvl6WhKAoA/GSKViupvgei+n74TIDqe1R9d5yvBsA2LuDQGKGxUiHjhLVeQTwt+clbTP2rf/8MZ3sRVk7BMIc8R8UJIophkKGcpZNoRLbMJ993gE+/FyfLqipIiwjDWDKHr9Jp7PY2HHoDgUAgGACBQCAQuPHiX+GDXEZi2zlwBpxBj27j9YqkpCWrE/1/8Gsffuz9992J1pLSOKx1SKWIXIHKBlCWOBdxMW/zJ99/g79+zoqeAy0V2uYoBVJeHyE83pPfFNxaa+I4PpQkyRNRFD0GUBTFU4PB4Ml+v//0pDF/TbG+VwOgKe588v/09PSx8XFub2fZ/7WYAjvdZi+98Ff7eDfCnLjRNI2e4XBIcx8bfy8+L8BXXPjf0zRldnaWd7/73dx///1/MD3dxbnN218vE6l0FicstsiIdbL/4ga9p/9mePiZl86zLOYo02kKY8BlIC2lM1gUQqUIU/Ku/bP8l7/yMdpUxiDOoHWLEk3pl/kd4Moqi6BpTITTx0AgEAgGQCAQCARu7MFbXXYQt+Cqcns5One3o/P4GIgtfPBO3Bd+5r24/jJSOKwQWBwYA8WQiBKJZL2QPPPiGZ55dZUlCzKuEsvLfIAUBrtNiv/VCOKm+PZivrnyL6U8ZIx5Nsuyrw+Hw683e7QnmQlXtB1HAt+ntsdxTKvVejxJki3z3MdXfq/2fV6tOXCtwnu3n3cK/tvp/ew2veBWSfy/Gqy1FEVRVwI0AwL9330+hd9XnHMYY7DWkqYp9913H4cPH3atVooxliiqKm0Gg+zajAoBVjkKLFoKNlYH53UCqwXHn/qTH/O919fIkznKOKEsh2AyRBTh0NjCkEiNHSzz8fcd4u98fN61AI1BOAFC1DkEOFCuOtZU6R1q1BZA6AMIBAKBYAAEAoFA4Eay2QLgKwAsODM6Wa9EQgl0WhppYQr4P/7WLxEPzpO4HsIZUFWvvCtyMDkiThEy5cylkj/+zqu8eA7RA1w0RVEYpAMlLWWeX5/3MEFQaa1ptVqHkiR5Qil1xBjz7HA4fHIwGHzdC38hRC26mj38zRX9KzUAlFJ0u92jnU7nG5NE7tUK12spkd9JRO9V5O/FFLiS211Jkv/V3u6GfH/G8h/GLz6HYjgcMhwO62DJ5oSJ8X3O/16WJVmWMTMzw3333cf+/fudUlWVwHZTJK7InACEVjhXkkSS0kAuUgaR5i9edOL/+SfP8fzJS5ikg2qnDPMeTgqcVBRDQ6okutigZVb5h1/+PA92+VctSqwZQtoa9f1XxxE9uoDCoUMSYCAQCAQDIBAIBAI3C1dbAZX4F3WfcCX+LWCykhbwm0cPug/cO0Ni1mlLg8CM/iEQdQgYOuXiuuOHr53nB6+tPbqUCQrZZlCCAVoxaK243oPDvKBSShHH8ZwX/9ba43mefzPLsqezLKv7rJVSlwn08RDBKxGBQgiSJGFqaurbSZLUJsN2t71Sc2O7x7nSVfLtQvWuVLDvZCZcy/jBt3uywQ09QRrtQ17M+0oAY0xtEDRX/JttAlrr+r7dbpe77rqLdrtNnpejsYHRdfnOYKvnjmLFRuZYyTVZK+bPn7sk/u2f/4Az6wbRmatyA0bfncpBcHTTCDYu8eBCyuOPfeo3O0DEAPJBfXoo3abWD2X/gUAgEAyAQCAQCNwk7Ejgm1oNWBQlPvO/CvOKQEmkhcOz/POvPPox3KUT7O/G2HJQJZubsqockBJEwqAHP3xjmf/4nZc4u8HTZTSNVQl5CVIphFJYa1H62t+DXzH1wmRU9k8URY9JKQ8VRfHUSPw/m+d5Lby2CKA9itztBJ43DZIkodVqPRFF0WUrw1cj/ncT21dqGuz1PYYMgGsX1c1qEv+zNwGGw2EdDDhpTGDTgKpK/QdIKdm3bx9TU1P/ZtK+e9Unb0UOQlCWDqkirIwwTlEks52lHP7k2bWn/valsyyvGWTURiGQtkBpcK4a19nWlqh3hi9+7BCfOqzdnKCaMegAVx1nRj9uNvw46vGfgUAgEAgGQCAQCARuhFAZiXxTd/ubOhSwvj5u4YylBTz68bv+8b5oyMEpsEW/Sr5H1Kn/CM3Qpby1LvnBiVX+8zEneg6EipFewEnNoDD0hyVSXrsD4NPTfQl1FEXEcfyYUuqIc245y7Kv53n+bDPt34snY0y98jpJoO9FYAkhmr3/c0mSPOGF/3j4324r9tdD/F9v3q52hebtbsd0/73i941mJYAPBfRl/n6ChNZ6yzQAb2r5EZVpmpKm6ZfTNEYpRZ6X1/bZuqpyJ1URONgYDInTCCLNYH29V0YRr1/kK9996TzHz/RxahqlIjAlowmcmNISxxGdZEjUf5N/8g9/idhBm5HAt5vHmRJwfhKBs5uuQCAQCASCARAIBAKBG3P4diJBt7oAKOzmAV0pkAoKQ6xgTsIXPvYeZlhHDFeRwlGUlYBppSlFYTAiYdha5E9fOMUf/dXp3xoCyBauyFA2JxIG48DJCBlFGDcKCtuDSJzUX+0FlBf+rVaLNE0f11of9T3/Gxsby8PhsO6bbo7la863307wN1Pax2fQN80ErTXtdvtbaZrO+fv5sYDb9YlPMh0mvf+dbjPpMa9k3OD4/bZ7zO3uu9v1k1oVJr2nt6u8f9K23s6U2cvjTNoHm6v8k4weL+ibPf9ZltHr9baU+fuqAL+fAhRFQZIkZFmGUorDhw8zOzv73w4GGUkS1fulrxbwmQOT2k8mGQCRc7iirKp8Ik1e9EBkoGFYGoYK/uwHa7/5ty+chWSBPLMI6ZCtiMIashxI29C7wEy8yofvS/ivf/mgSx1oaxEuQukWVkVYKUFYolaEqqIAQwxAIBAIBAMgEAgEAjcMIUFoyrxapVQCEn9EFwqcRCQCbeDox7ruXXMaOVxByQKHRMYJUkrywhC3phnIDt9//RJPP/cm5wz/4wpViKCiQLsMRYlDYtA4sbd/OsZLpMdFoxc9DcE1Z609PhwOv7mxsXH8mv+B22YsoBdpxhg/ahCt9dHma7G7lDhfb8F7o6sKrjUkcDfh/9NQGTDJZPKmgTEGn0nRNBrGK1L8PiilpNPpsLCw8DudTqsW+t4I81UF46Mnd0JZULYayVdN+8iBIVDggA0DZ9f519996Rw/eOkMUWsOax2UOVIL2tMLDC9cgv3TCLVBuXqML33mYe6f4vEqD8Bgy2pMqFOANFhb1iNIA4FAIBAMgEAgEAjc0CO4GjXmWrSAwpfs2lFLwHCDe6c58os/9wEWEkssiqrnXygQGqVGPcMqZbmM+PYPj/Pd1524aDSl7AAW5XKUKxCUWAGuFna7//MxLrwn/a61JkkStNZHy7J8ejAYfN33WV8PA2C8V7tpQDjniOOYdrv9rSiKtvx9fBX2avrnr6eIv9Lk/XFxvtcxgHt57it53rfbyHi7DYDmf/3+60v8m+MBm3/31QLjTE1Nceedd7Jv3771cYOpGSwopdzVgJKAcCODC40Tm6NBlSsRWJxOWXHwnZfz+T959jXWTIrRbUrnqnYAB1LFkPUhMrRUj0OLir/3xQe+MQUkWCL/NgSgBcYM6wmA4QQyEAgEggEQCAQCgRtKJfQlDuc2QwGFMGhKOg7+/i9+6HvvuWMa279E3GlhjN0UHFYgZMSlgeSFkyv81fPnX1oD+k4j4gQrAGFGpb4O6UaRYG5v/3TspYx9tAL/OMBgMHi21+thjCGO4+u3lRql3c3yb6UUrVbr8Var9ZhSak8TBK6nUN1r0v9exP/1GO+32+PvdZrA9doGN/3bNdZeMS7yfem/X733+46vIGne3+9vc3NzzM/PT0VRVOcHNMdZ7jXDwlJV6NhRNY4YpfVLWyX3SwcqbmFkxJmc5f/8/Hm+d+wMZTyLlUllZBQFcacDeQ5Yom5CuX6BX/3cR3h4nkspkMpR/J9zYMwoF6CaAxhiAAOBQCAYAIFAIBC4YerEQjkEV6KEIHeQA0JrImdpOXhomv/rL3zkXmZEH10OQCicjClNjpCjlUyZslwmfPu7L3H8PO/NlQBnQBqcsBgJVlZiQ2CRzo7+W4mOvYi7SWP6hBC0Wi2UUnNFUTw1HA6f9n3U16unfFJJdrMiIE1TkiSpk//99c3S7RstRncT6JO2zV7ucyXPfTUjBa/Xqv+tNC5wuxyF5v5sjKmDAZstA+P7um8bSJKE2dlZZmdn/2mzWsDvb74tYNdcAwGFlJjR91K5qiXAi3/hJM4UGKUoFDx/FvHv/urHnM9irGqNRmlCWfShuw9jqoqAbidif9vy2C8+PNcGMFnVYODs5kgApShDAkAgEAgEAyAQCAQCNw6BJZYWTYl1tkr91yl21BbQAv7uZ+/4Z4tynS59Ou2EbJChWm3KMifVEiEkhY04vWb4qx+v/f5AQq+oqgqEKDDSYoSgEIx6jEuUK1EjE2AvAm88uM1fr5Si3W5/A6Df7y8PBgOgCgQUQpDn+TVvo6agb4oyP3Kw0+l8K47jQ/5vVyKG3442gKtZYb8S8X8tP+9k7lyvFfzrvU23C/+70pDFSUGEzawI38Pv8wD8fXwLijcF/GSA6elpDhw48HtqNFLTTxNo7od7yQGworoAKAfCysqUcxKQmDyrwvrbKcsO/urF7Mkfv7lEVipElOLyPlparJW4dIY8MyRpgigu8YVPPsyhGf46AbQDrKtT/62QGMIQgEAgEAgGQCAQCARu6MFbO0M8KsitQgFjbGHRwEOL/OgLHznMjFsjdUPQgtyAkylaCXAWpSLWh4a//uErnFrjdwvlF/gswgxxQCk0pVQ4IZA4tDOVAXCFZ/9NEaW1JooiiqJ4qiiKZV9CPSmx/3oLQW8ytFqtI2maPuZFWnMVdlIfd8gAuLrnvVni/3obM+Ovr1lJ4kV8URSMV7E0e/v97TudDouLi8zMzDymtd5iVPnH3rUCAImREiMkYvR9lE6DTbHE4DQIA8owQJDHcKrP17/9nec5e2GtEvSmD52UlV6BUdOUok1ZlLS0ZWFK8Es//8AnW0AM6NHqv5AS40bHm3AKGQgEAsEACAQCgcCNw7hqZV5rVZXokgEFizF8/pF7PnjPjGbftELYAvISFSUUpiTWmrIw9GhxeiB4+jsnnysE9AvQSVSt8BWWatQgdc9/NXscwILYvQJgu9F5o7FnR9bX158uiqKeo+77qoUQ1zUDoPlaAB88WJf+Nw2A8f7tW0WE3mwx/XYK9NtN/I/vT/73Zpq/36/Gx/o554iiiKmpKebm5r6VJMnmCdlYG8DOL84CFkFZfxctEiMUjpFhpxTCWexggFRVRshffn/1q6+czejlMaKdgh3Q6UyR5YYkaaGVBDfEFBf5pc9/kLu7/PM2o3BBRscCa0Gzp2NAIBAIBIIBEAgEAoHrgEXiREKBprQghEXbjK6DO9v8iy9/9uO0ZQ6DHkJo0BHGFiRxNcCrKBSXogP8L997g5MrfKhvQceS0mrQXVApziqEcShboEwVNGgcGATWiV1LrJsiyYt8X/Y8HA6fbc5h3/LeRv3S11Nc+pVaIQRJkjzW7XYf265ne7cqhO1mxu9UFr+X213p44xfNy6mx2fe79bmsFPw4CRDZC+l9Ff6/vYqwCcZTFdS5r8X06FpDDXL+puj+vzj+CwAnwfQNJs83tRyztHtdrnnnntotVpf88/hzQKl1O7tIM4S2RztSqQDI6CUUEpLKavfhVBQGmIlUFkl4JfW+ea/+PaPOa3uANWC/gZJp01kDcrmYIdYnRMlGXfN9PgHf+eufxyNxL8mGfUclNU0kUAgEAgEAyAQCAQCNwYHOKGxKErr0LoKAetK+IWPH/ytA1OOthDVDaMInKUVR7gyh2FOPL2P1y8OefbVs6wbiJNqnBhW4HIDqlqZVK4KGPP/WDjhn3vv4rsp1vwItesl8HcTcM2xaj54MEmSJ7YThz8N8+tvB26n7TxeHTLertI0KZrtAONmhBf43ljodrt0u90nfPVLM1dgV2OFqu9fObDC4gQYaXFilNrvDRQHkRMIW4X4Dxy8uWKe+svn3sSkXZAa+uuk0uDKAutKnLBY2ydy63z6Iw9w7zT/PAIcRWUFjCYOhBCAQCAQCAZAIBAIBG6UKAEia6qEbqUobFWiv9jhsV/9+Y/SFRtIGQEpxBJjc3SkMEYwsJpcpXz3Ry/yk1cHwgBCCQpTglLVFABrRsO+tlKNH5N7GgU4PgHAi6cbaQA0n19rTbvd/lqSJEd2SncPwnznz/JqHmu73IFrubztJ0ijlX8v+MeDJCe9Fm8A5HleC/7x/d+/99nZWQ4cOMDU1NSh5vV7bT9xtQaX2/6lfigBpa3aAM5fsl/5T3/9XS72NUSzUAwRVYogTmniKCISEmkE999zF7/wqXv/cWv0LN74c0H8BwKBQDAAAoFAIHAjD94WR4HAgRAgIAI+fWTft959sENcXqqEvKrW7hwjwe0kdGZ58a0l/vxvX6QPCAXDwuEMaC0h0lBkSGfxq4m2PvmvxL8VErfHf0K2m6N+IwScF11a63rsX7OE+50u/rcLAdzt+uttMNyS37HR/tPs659U1TK+rxtjtpgAk0ZbjlpROHDgAIuLi8eklJRlWVes7Pb9cFTfwep7WH03JdV0Dn/BlpvbXFbiH1llfbzw6vpXv/PSKcp4dlQhlI8CQCOkg1gotFQU/TW+8qXPMCchjmxtLIhgAAQCgUAwAAKBQCBwg8UbBj36iUiwf5r9/8UXP0U0PE8ih2AKiJKqZFdJMAYRJeTJDH/2/Zf58ZsIHVe9w5mpEr5daZASEAKBRbotqqMWHo699VCPCxkvcPYy5ux6CDi/CpskCa1W6xv+eZs93NdrjN3tKv63E/1XMhngp0X0j79u59yWdH+lFEqpbQMu/X5vraUoii0j/pr7vTcK5ufnueOOO2i1WnV1gFJqT6/PUZlwTsjGSZ1FYlGuxJkSJStzwDIaG6jAKDi3wTf/4zM/YWkYQ9KCcoh1lWFgswLlIFYaij4P3DXFrx1ddLYAqEI7BaFaJhAIBIIBEAgEAoEbfgC3lCAFZI5f+Ln7zj1wsE1s+tXqvyhBC3ACKTRIgdUxr53r8Zc/XqIPlBoyC0hJlCaYPMPmOXEkRiuJm/9QWOEzAK5uzNtOIXNvJ6PU/6NJkjzeHPu3nfB/p1UD7Bo4dw1VADdqlOLbvW28mPfXNUv7tzMB/H3KsqxbXpr7V1mWxHHMwsIC+/btcz4gc6/bxonLsziqkYC+CsCh1KgKhirAs3BQCsEAePbljad//OYSuAhUFdCJNQg7Gi9SFsx2ElbPvcZvfOlTzMTU1QUuGACBQCAQDIBAIBAI3FgKqh79VBQsKPi7j36UKL+AkBIMoEpgUK3mOwVasl46/vwHr/HSaYRVsDoEKxVOKqwFqTWYavWwagHY+k+Gxc//3vs/H5MS5W9EC4C1liiKaLVaRFH0WDPBfdKYtZABEDIAxvcfv+JvjCHLsonZFX5fntQO4FsBiqLYYgI0QwWnpqY4cOAAnU6nzsfY7f1Vq/qj72NjTCejY4J01UVLQWFc1cijFZmFoXGUEk4v8+iffOdF3rzQB9VBoKAskEpXj2JNdZTJljl8d5fPf6zr2q5yEtwVHgMCgUAgEAyAQCAQCFyLOKEqAe62EqLM8HMPp+79d3eYiTIoS5BRpQDKDBAYC1YlLBeCZ35ykgsF0IopLEidVgFhWUa7naIklIWpEwB9//+VSvbxEMC9jmi7XhhjiOOY0cr/IWCLoAsE82M3A0BrjU/pHx/x1xwXOckEaOYBeAOgWX2ilKIsS7TWzM7O0mq1vubbB/Z6Cle15DQ+R6iNO1d/D6qqHRUn2NHkECsUKyX81Q/OPffSmR4bYorCSUyWg1RgLGjFcPUSiwdnsYMlfv3zH2ZOMmo72swHCQQCgUAwAAKBQCBwAw7fBokwGdPAf/2rn6Q1PIsdXIJ2l7ygCgCMIuxwgEpbDESLv/zRa/ztywgbw9rAIqKUrDQIoRBaMtjoIUQ1VnALzv+TIUHY6rILN1LsTzIckiTxgv9IFEVHfW91czrAdq93L695tznzk1ar97KiPZ44v1uIYvP3Sa/9WlfO/WP68XTbbZ9bZQW/mdQ/aZvsVIEwTlEURFFEmqbkec76+nod1ucfw1eWND8zbxD4ahNfBeD/XhTFltGB+/fv5+DBg09EUUSSJNf+nRFVZ1BZGLSujIphXlZj/1RMbgUOOHGRD/37v36ZU/0UoTuoOIG8BB1BnpFOd8gHPWzZ47Mfvo+ffS8uBuTo+9+sqgkEAoFAMAACgUAg8LZRrcDlOXzmIdyH7m4hexfoxAJMQTzVxY4af2W7TVZaTi6X/KfvniST0DeSUmpcNUeg+gfBsdn3P7rS9xk3VxkbU8ZuKju1FjSE2RGl1JHx4MFbocT8Rm2Xt+N+VxIYeD1e226Gz07XX+1zevFujEFrTRzHGGMYDodbJkyMj/ebZCb5aQI+R0BrXRsJSiniOOaee+5h//7938uybO/HgC1GnN36HWWU2wFbggKrP0tkBH0Df/ta77nn3lhjo9AgEigdOAuxoOytIySkkYWNM/y9L32YBIhcVW3gt0/z/YdqkkAgEAgGQCAQCATeBiIsCfB3H32Qe6ZyoqIPFnI7pIxEFe4lE4gVuU74/msXeOYFRKEgs2IsyMuLiUZp70jo+3YDJ6ryYrHFNrg12Eb8o7U+GkXREa31FnF/u6xY7lVQ7dS7P+nve33M8fDGnR5jUsjjdve/EUbA9TIejDEopWi32zjn6Pf7dTn/dlUjk1oB8jwnz/M6W6D5GFJK7rzzTu6+++4jsPdJAMKxZVKHg3o84OaozvF93YGwCFWFAb52jg/95Y9P0iunsCYejQ41IA2ly1BaEwmLzlZ59OMP8/CdZDEQiRtj9AQCgUAgGACBQCDwjkcBMfD+O3Gf/MB9ZKunSGJZzf5WgrzMQChQLYaZYd0l/MUPj7EClE4ixGaNv1/xr9LDG5aAoBYRW0aNOTsyAm69HuAx8X9Ia31Ua72lRPt2ESg7rW7vJV1/tzF/V2IwbHf7nUyCnYL/xu97PUIA91K9cSUVC9baLUZRmqbEcUxRFKyvr28J82v27o/nAvjffZCgzxLwGQC+RUBrzYEDB5idnT2ym0El3ObIv/F2HFdfKvHvJwVIbJ3iL5wlKxwlYGP43gunObXq2HAtrIzAlVAWJIlGKnCmpKVBFOv8xi88FLepBoyMf5Y3suUnEAgEAsEACAQCgXeUAZAAv/aFDzDfUZi8B7ECKdHSogQ4W4IQ9NUUL51b529fzn6nEFCUDiUkwoHAjYl5W4v/KmBsq/hHbIqIm812fehKKaIoYiT+jzZnr9/oXIK32xDYy9+vpILgSlogtmsDuFEVADsZAns1A3a6+JX65s/tdhshBKurq3XOwKT9q/m7fy4/FWA4HDIYDOo2AKUUzjkGgwHT09McPHjwe3sJAhSuMfbPWdzou1pfGuK/Pm44ixoZfZmpzgKtSDl2MhPfef40Qz1PgQQMiAIhDZgchUNJTX/lEkc/+V7uSPiEsFy2Da7n5xsIBAKBYAAEAoFAoGEAHIjY//mfeQ95b4W0nWCyPsRQZHnlBSiHQ1DqWb7z/AneWuW/6ztwMiJRGuU2xf+4qPer/pbNSy06uHVX/4UQaK2JouhoHMeP+9L/qxGAt7r432sP/HaPcyVtAbtVE1xNBcCVCvzdPqOdQhW3e417eQ1eoFtrSdOUVqtFWZb0+32KotjymE3xP6kywFcB9Pv9evXfG1ZlWRLHMQcOHEBflsI54bWN8jouezdu8/vqRwRW313/PS8BCxJ0GrPRL+mX8KfffZlzPUGJAq1AQVFkmGJIpDS5sbRaCXd0BUfewzOqYcSNGxbBAAgEAoFgAAQCgUDgOhsAv/jZ/ecOTo/CxOIOQ5ODMEjrEMYhtKFwJScuDnjmR6foO7C6CjfDbhX+VVn/1uewozFjdR+xk9W1t2ALgBcco/L/Q1rro0mSHJlU+n87iZOf1gyA67193o4MAKUU1tp6hdsYg5SSdrtNmqZcunSJXq+HMWbiyMtmiGCz4qQsS7IsY319vS7/b6bpz83NsbCwsEuJylheR+M769t2qhwAL/43RwQqN5rnoau8P5xFS8ELx9bFXz77MoUTVVuBtehIYfMMsGRWEiUtVL7ML3/+Iabiy42P+nXYMCIwEAgEggEQCAQCgcnipPmDaIp8jRpN3fZ/E1Sl/y3gyz9/hCi/REtpnJFEcQtQREkLZx0oQc85fnLsIi+fIM4AGbUxriQre1vEQzPlv9nzP3GF8RZhu3F3UspDo/T/y8LUbjfxf6WmwJWW2V+vUvyref3XuwLjen+23gBo/uzHS7bbbdbW1v58MBhgjLnsc2lWADRT8r04NsbQ6/Ww1jIYDLa0ArRaLRYXF6/hdG5v5lxRQjbMUZHAKcm5DJ7+q+fo54oys9Wowk4LZ0psWSKkJh9ukLg+nz3yIAc7/NPp2FF9wzQSUR8rHK5x4PDjQ6v/CioDM9QIBAKBQDAAAoFA4B0m/KuTYVmfDI9OkkdCXxMREaNG588qBSVgQcJv/OyUe/d+wYxep4XDDUGLKYxJKKyk1DF9JxioDn/6Ny+zMqQgamFkDGoU9jcKD/Or/M3U8DpkzI2v+I8njN9cgeyFlg/6G4m1I+12+6j/3a/g+sC2zZ5lu+NFCFdfJt+GHVPgd7veC8q93nf87+Oic9JYxN2E96TH2Km83m9H3/O93WPulLHgX/+1hgA2Px9/kZItP0+6bH6mO28bv4rv30uSJD5ckn379jE/P//Zt95665PLy8sANMf3+X5/KWVdzu9NAL8f5vmQwaCHEA5jCpwz9b51zz130e129htTUm1qW7+n2izYUqGzNRiw/u5i8W/Vf8fNqLUnUgkARhv6ypAjOHam/PIzzx5Diumq6mF9lbjVpigtVhqUKohsjyl3kd/5hw/+XpqBBgQpuKrxoNUS9TFMiOo4BxFIBUISVb+FE9BAIBAIBkAgEAi8sw6/WwS0GAnyesldjtb/FX7x0FpIRtW5v/Cz76fFOsL0wJVIBFLECKIqtExqhjbm+ddO8+b5NfpAaSOscZTWomLYWj58+ciwZr//ZfkAt8g/H15wNldqtdZHb/ce5N1WwvdS8v52b4OrzRO4nT6DncyX2dlZlFJHLl68uLG0tESaprWxMW7kNH9vGj/D4ZB+v1+3Gvh9uN1uMz8/fy6Oo7rCoGmsVP+9fMRfFQzY+O6O+TBN00A4kEJiHBQOSpWw0uffPvfKGU4vZwiZolQl1Z0UaGmRGLA52vT48EOLvO9eXAqokYVpgaxwm8c0aNicgLTN3wKBQCAQDIBAIBB4Z3GZkHYWnAYUFgOYzSTvArSFe2b5F0c+9ABKgrMWJzLQ1eqhsNV9jLMYOc1zL57k9DJTiGr1E2Ox5U9P+W1zDBtAHMdHoyg6utsYtVtNYO61dP9KRu5dqTjf6/XbVQvczBDFq32+a3mt8/Pz7Nu37w8uXLjQXVpaYjgcAtRZAZcL9q0mgJSyDgTMsqw2BpRStFot7r77blqtVmTMeLUCW0yBq3rfDrAlURSBE2AlUkLfwHdeyJZfPLHK0MaAphz1ByVCoIzBOUWJ4+475vnUx/dVE0lENVLAicqoRAKuGi9qa2ugAGdxgCEQCAQCwQAIBAKBd/LB2NWOADiFQ1NQMKCPVKAURLbqnf17/8XDv5XQQ43uJJQDVeLKIbbMwRVYJzi3annulSVWhvREVJ2Eby19vr3/CRgvm5dSEkXRY3tJUL8dTIGrEblXmhtwpYn4u6X/34yV/93GEV5JzsBuwYfN/S2KIu6++24ANjY2Pnnq1CmGw2Fd+r9T+0azUqAsSwaDAcPhsK4EEEJw8OBBpqenL40bCErJ6zLGUjiLMxZECjIGU0n14yvM/+D4RVZ6AkNM4arn1dYgrcEpjdMSW2zw85/6MNMClOtjfZWQ765xUDUIjMYK+komwCAJMYGBQCAQDIBAIBB4hyFAbJ4IC7f1pLmkxAiwQiCMIALuaPHQ5z72EBQXEbaowvu0A2WxtkAKg9KC0mme/ckpnn+DL/eBDLCuQAmI46pr93anWV49Ev9EUfTYePDf7Sz6r9UY2Mvq/17GCe5kHmwnvG/Edruez7PbqMNxBoMBMzMz3H333a7f7//N0tJSfP78+YnZDZNMCV8F4JxjMBjQ7/friQLWWqanp5mfn59KkmiLcXBdqluERSqqcD8ScDGlzRExrAHffe0Sby0X5DZB6gglHBKDsAVECqckwg547/0L/OJn5pxidFypeosqpxLpfwA/stAxqmsaHeoCgUAgEAyAQCAQeCfp/+aP0m2V5SIeHaVLAcYRA7/wqXtfaosNZlsOZw3W19kqixIGEWmE1KwOLD946QwX+vzbQlYp/5ISTI4Qgqxwt0wf/7UINi+0oigiSZIntNZzt2vS//jPu61U7+X+Vyqer6SEf7egv5u5Pa90H7iSMYL+vQ0GA7Is413vehdKKYqiKE6fPi3yPK/7+scDG5uUZVn/XBQFg8GAPM+3BFseOHCAmZmZ3/ZGQdPwulYqae5QKHBVykcuJUMJL7zFe148scp6kSCiGKVcZRrgEJFGaslUW9ES6/z93/gUCaBEOeEZJH4qgXKgXNVx4G7l8SKBQCAQDIBAIBAIvD1qxV12ulydlFug3DxJdtUwwA7w6GffR0f1iUSBpur7txKsK7HSgFb0Mzh5boNXT68yVOBiMAK0cliT46zAudv/8O9FkRCCJEmOpGn6tdup/P92zwDwYni8v/1miP8bnQHge/XX19dJkoQ777zTOefo9/ucOXOGS5cuYa3ddtKDfwwfXimEoCzLOg/Am1v79+9nfn7+DzYzBa7t/W4xIJxDa4G0BoocFSt6xjKQEReGvPzdl89yZq3EWIdSBoSpJojEEqEFWlmUWeXD753hQw/iynL0Ausm/0r8u9Fav7cDKrczNAAEAoFAMAACgUAgUJ3cU4Io6p7ZWLVIga6Ch+5tccfCFMPVi0hZ9QtbJygtmNFYv5WB4OSFPieWikc3DGRG4UqBUpXnoFSEkrf/IK7mKDqt9dEoirZcF7h2gfx2Pc6tIv6vxGTxot2Tpil+tf+ee+6hKAqUUpw6dUqsrq7+4Xji/7hp0mxVUUrVrQA+TNC3AUxNTaGU2jJd4No/B0thIIo1zuaAJW63KC3kQlEoeP7NIWfWLJmx1YhCaatqoxhk5KAY0o4KEi7w85+ZHmn6grjVBtccs1nidX/jIBcIBAKBYAAEAoHAO0mRjU6OhW2M1fOXYnMkoANtHBr4r35j0c201llfOk3a7gAWHWmEUGTGoZKEgREs92P+4nuvcn6dp02UgOiATCkLS6SrcmPErX/490nnXtT7FdWmkJJSEscxfvW/uao6LriaP1+PVepJj9W8btLlah7/WoRxUzROErGTnmuvoXlCiHoKw/j9/PWT7nutvfu7Pa6UcuLz73VKwfh2n7QNhRAYY5iammJ9fR1jDPfcc4/zK/eXLl3637z55psn/X2HwyFRFKGUIs/zKn1/bH+x1lKWJXmeMxwOa4Pgnnvu4cCBA64s7ZbnvqZ9V4CMIM8LpMvRStAfDiHSIC1DCyeWEd976S0GJSAFxApSDbFAaQvOgCqx5Wm++IWHaUnotCV5r48QmroUQPgjm0Qgq19CC0AgEAgEAyAQCATecThbXQDbCMyqS/9VdQ4dk9MGPvahe4ndMt2pBIqCssxBCsrCIWTM0Ck2jOZHx8/xyslyOZdgxOhxXbM0/vYqvx0Xpv5nn8SeJMnjXiw1A9YCN+6z2YvJ8NPyfv17U0oxHA5J05T19XXm5uZot9v7ra1uc/HixXsvXrzoW1QYDocURUGSJBO3j9+nfR6ArxJot9tMTU2RpnFthF0XA2skwJW1VdURciTKLVbAUh9eObPOpZ7ByKQq5W/HmKKPMRkkMWR9Uj3kzgXJrzyauHKj6vV3tjI4LbbudLIonA8FDOI/EAgEggEQCAQC7yzldPmvdvzqHJQFRcYH78V96N2LyGINpKW0BjFqqrUWlEwpZJuloeS7L57i2AXmSzF6PCcRVtYn/dXl1hdoXhA1g8/GV26TJDnUarW+0ez9b4YD3ojXeCUBcrfytr6a0MBxUXyzMgBuhhFgjEFKSZIkZFmGUoqFhYVzUaQxxjAYDDl9+nS8srJSl/j7+5RluW2lgW8rGA6HOOeYmppiYWGB6enp35ZS1KMCr+0NSHBVOKgY2Y/VwULiS/YHFl57a423ljJMMk2hIujE1TQRWYUC2nIIMqeblvzGL/0MbQfdGNSo/N+bDFUxk6yeyRFGAAQCgUAwAAKBQOAdagI0ToQNjbX50d8SATHw5S9+gG5UoG1JORwi4wgVaVxZIhxYp8npcPxsnxdODtgASumnC1iUs1WPbv18llu9EmAz+Ozy8n2/+t9qtb6RpilSyi2BajdKNG8nlK80qO9mCv+r/X1S+8Okn2+2qXG1l53Ev1+pb7fbCCFotVqsrKwwMzPD3NzcPwVIkpiVlbXixIkTB9bW1oiiCK01RVHUIr5pcvltZq0lz3PW1tbI85w0TVlYWGB2dvYPqjYXuB6jLt3o/5zwI0gluGpcnxMQxXBuhcMvvrHMgC5lnIIzKCWq6iSTI9MYbInJV/nQA3N8/P04WVQGgBs70XSN5wwmQCAQCAQDIBAIBN5R+Ap/0bjCYXBelDsQTiEd3DHFP/rsJw4jBgMSmVJgcbHASUc27BMrTWk0q4OE7798ntcvMpWraviWdKBdgXIWXIxF4oSFy0Z23YLbaIf+dSklaZoeSZLk6Hjvv+8Dv5XE9O0g/ieJ56u57/US6Lca44aHF+HOOaanp7HW0uv1mJub+71WqzV6H7C8vHr+1KlTvz8YDOr9cnz/nDQusNfr4e8zOzvLvn37SNO0Ctq/ZoNFAhqHxqJxyKoVwFQ5fzgQQrLe4/gPXj7P6TWBjVoMsyFS6yrtXwDtFkUpUM6yrz3k1794b3XMmfDxmdH/NqcEBAKBQCAYAIFAIPAONAGqX2wj+E+Ci4hFjAKOvJ8/XJwpUMaBi1Fak5l8M/QsSRDEvHWmz49ePsuFIb1cg0MjHUTWoJwBVHXCLyxW2MoIuA0MgPGVUh/812q1vuFLq69XX/TbIaavt3C+kcbFTr9PCuG7ld/ntYr/cbGeJAmDwQAhBFEUMT8/z8rKyh9qrel2u/8iz3NarRStJUtLS7975swZ+v0+Ukp8y0pz3x7fpsYYer0ew+GQVqvF4uIis7OzTmtJWV5jCCASnMYRYYQGJNqCdpvHBFNYyhxePpE9+/wblxhaWdmTUQTWjTJKLHkuSHVKwhqffuR+5tvM1cc1tzltxFBWxqOrnhsXTkEDgUAgGACBQCDwjj0A2810bCIgQVhJC/iFLzwE5SVkKcCllMJRCosTjjiOwRmKwvD8S6d49SS/NRBQ6uokXzqBoERgsS7GuWjTfbhNRNf4yvCo9P/xOI6PNBPRmyuyIQPg+r6Pnf4+3vLw0zyCsblflWVZTxwwxtDtdpmamvqtjY0Noih6zIf9eZPq3Llz4vz58+R5jjGmbgPwj9Hcd/1lY2ODtbU1lFIsLi5y8OBBOp0O12X3dgqLxhJhEWhriQx1ab4eLfKfWeaRv/r+Mc5eXEbFshLuQuAEGGNBpOA0UbnK3QsRP/+Z7iVbvz5NbXPWxzeJQBEIBAKBYAAEAoHAO4rGufZYP6xGYFD0uHeBf/Wpn3mAWA6qe6gEUwraSQtnHELHDAc5F/sFPzp2jlMr/I+5A2PVaNKWAVHiRImTJVaAdBJlQdwmPbjj4+W01iRJ8kRz9b85em58XODb+bquRCz/NArjd0oFwCQjoNfr0el0kFJSFAXOOe688042Nja+ZK09Pjc392eDQYYxhlarxXCYs7S0JPr9Pnmeb2lZaW4vv/865+j3+6yvr+OcY2Zmhvn5eTqdzr+5Hh0udjSK1NaiXNbT+RwgVDUbYGUA33/+DG+dGVLaNpQFUOKERWhFq9XCmiFQ0I0yfvHn309LcJnEF3UGiQjt/4FAIBAMgEAgEHhn4QQYWV0SIVBudCUaBMRqQBf43/7d+36zUy5DvgGpICuGpHEbCoXNHKiYnox56cIa3zs++Gd5JBFqCrIEaQsEGaVwFMpS6h5OZmgTo8sUsWU04K1HM+28LEuMMWitSdP0iTRND/kgQyGqGQrOGawtAUslkOy2FyHcjkbDpNn2u82532ne/aTrt7vPdvffaZV9t4qH7R737TQpdttu8gouSsr64q/b6Xn28j6uJAxwfNtX6f8t8rzEOUEcp8RxihCKhYX9f7y+3vuQc6JYWFh4zDnBxkafNE0ZDDJOnHjrcFEYtI5xTmCMwzmBGI31EEIhhMIYRxxX9zlz5hzd7gz333+YKEq+3G5P1e0w/jX5tgI/aWDnN29xMsPJAuksILGo0dhQsBJ6zlGkMSqJOf4m4rmfrNMbTIMWONFHxoo8H2JZR7YcFCU2W+dnPzDHpz6CSwEokFUtEjGgnQSlG9UAgUAgEAgGQCAQCLxT8COynEMhwSqQCijBwFxM50Pv3kc3EURSUJoMoS0KBaVAxy2cUfRsxA9fOcnFPv9Nr1C4QoGI8Cn/TlQn9NVJd4lwAjUKGLzlN1GjP1opRRzHRFH02J5Mliusk77ZyfXXIr5/2lfcb8kTqAkmUBRFTE1NMTc354bD4ZPGmGe11nWVwCjh//jS0hJlWW757JxzW0wS/7eyLOtKgCiK2L9/fz31onkxxtSPsQd7bbQkX44mhTAaBrh5WugElEKznpUMSnjp1SXOnC9AxAglyYdDlBbVVABTQhQhpWN+2vDrXzqMBiJK7GisoPKPrgAZUgADgUAgGACBQCDwTjQARifelmpmn9QCnEEDj3yYjXcfugtT2krQS4eUFmdzFA50RIlkrS/4wQsbDDLq1XCpqpN5SzXr28JosoAEHK4u/b19iKKIdrv9jTiOj1yNqN/LmLq3wwS4kaXxwQi4Ofj9RmvN1NQUi4uLWGuPO+eWoyhCKVWX9RdFwYULF8T6+jp5nk+cdtH8PMuypNfrcf78eQDuuece0jR9Yrw6odkK43MxdtxXRj3+wtnaENgSDCpAKFmX67/4ysYfv/b6aXKT4kQH4SASCkGCywEZgzG4IuNTH/swdy7w9/1CvxBiNObUgihAbBl6GggEAoFgAAQCgcA7QTX4/0jMqBxA4tCUdAR8+ZceIYkg62cYY9GRAlEgTIHQClcaCmKOn1rhzdP8lnGVAIk04AqsACPYFPpWIl01BtDK2+MEfCz5fy5N08ejKLoiob6T2J/0t7crRPBKMwOC6L899k1/8T39cRwzNTVFt9s9ppQ64svzfdiftZZ+v8/58+ef2tjY2NLqMv5Yfj80xrC0tMTGxgbz8/PMzc19LYqiy0IE/b50dRkYY/u8UhhjUDpBRXDuAr/8w+dfZ2lVYOkSRSkYizMC63Ql9SUMB+t0W5bPf3ruf4oZDQtwrjH9r7z8uQKBQCAQDIBAIBD4qRf/FnCSEgdSjoIBMmLggbu59PGPvIfBxkWiKAER4aRByhIpLThDbh0bheL7L57l0noV/iecQQqLKzKskNVldLhXTiKcxAqLkeVts6m8gIrj+HGt9TUJ3u0E/9v1urcLA9ypV/1KDIF3agjfrWIA+G3tBbgX3lprFhcX55IkecKvxnsTwN9naWnpK6urqwyHw+obOvYYXshLKVFKsbGxwcWLF7HWsrCwQBRFden/eM7CXvdp6RiVAviWAIsTozgSKTBZgVQaIzQ94NkfZ7z6xjqF64JQ2DxHiASl2+AsJBFtDZHr8SuPfpTWqN3fYJFaVY9rg/4PBAKBYAAEAoHAO5AqhE/icPVIbFnClIDPPLJ/rhuXuHJAND2FUoqiyKoSfylwZYlMOpxZGfDjVy4xmhGAtSVaGJS0WMAIOZr5LRFWIxy4UanvlnLfW1T4Q9X7n6bpoSRJnmgKpCsR+7uV/1/Nqv9ewuOuRJBfaSVAEP+3xj7qV+DHP4OZmRk6nc5RX8bfXOWvvs8Fa2tr86urq2RZNnGfMsaglKorB9bW1lhZWWF6eppOp/M151zd++8fu2lIbH/sqaqBGt8ANkMyR8ei0VhN6wRF6bDAG2eY/9FLF1gbprjCVWGbMgKdkg2HYHOktKRyyEce2s9H34eLqNoASq/6gwEQCAQCwQAIBAKBd5xwQI4Gb8l65Q1AOdg/w2OPfup92OEK3SSCIkPozR5inAEkRia8cOwsb5zld3JAqVH5r8mI1OgMW0gQEickwo1iuES1ynfL/wM1ElVRFNFqtb4Rx/GcL4+We5yDFjIAAm/ntvbG0aQpDVEUMT09TRzHh8qyrI0r/18pJf1+f9lXAvhQQL8fNlfyrbVorTHGsLy87CsMnkiSZMtr8ceIPVeQOFkLfyfGckGsA63JjaVEIRSsZyx/54dv8ebpDUojII2htGBAKgFmCGUP7QZMRev82i8+QEtVJ5tlaUf9AMEACAQCgWAABAKBwDv0ECxQoxPwAoUjBvZ1+NZHHr6D2GUkacLGyhJCVCuBzgkoS0SUsF4IXnz9Akvr/HcDJEK3ATClq8px61TvqgIAJNKJaiqAYGQ83NoCSwjh0/+Paq1rkfPTJnSDcL/98PuivzTNIy/I2+02aZp+rbnf+p+TJCHPc1ZXV59aX1+nKIotmQL+OZxzlGWJDxPs9/t1G0C73T7aLPs3xlxl///l2DxHag3GYJ3ASskQeO4Vvvzqm8vkRoKOGQwG4EqiTgq6amPSMqMcnOPopz5EJ4HIH/GU2jQAggkQCAQCwQAIBAKBd9bhtyr/9x6AoiQCfvM37kOaJTQW8oKpbgq2IJIRSsQYJ8md5sK640cvr7NuQUcz9LIcJwVSbPYTVyfZt+bQ7fEVVGDLCqYxhlarxdTU1Pd8GbXvh272Se9mIOwk4MZX/PeyWt98rf717tRCsJcQwvFAuWZ/+fjK8vUwDK6mDeJqqiO2a4tofvbbfQ7N24/fZqcMhe2ee7fshd22x/j9/b7YrEYZ/4zSNGV2dvaxVqtV7y/+PmVZEscxzjkuXLggzp49S1EU+HC/PM/xppff//M8J45j8jyn3W4zOzv7baVUfb1vLdj7/lGt/tuGGegjAbACW5Yk7Ta5sxRO4SSsDPm3f/Xsq5SiBYOMVqeNNQWuyAADsQSbM5PCdJzzC5854CQQK7CFRbhw8hkIBALBAAgEAoF3GA4QRFgcchSg3VGw0Obu9x5epBOXKGlxxoDJquA/JDiFkylGd3jx9SXOrfNHGdU0bycEDolzgK2GC26utFVZAHZ0gi9vg9W3KIrQWh+VUh7aTjC+XQF+exXuexXBV2pQ3IxWgd2e80ZWKbydn+uN3J5RFNHtdpmamnq8GQDoWwKaowHX19cfWV5eZjgc1iaBb4NpXvxKvzGGNE3xbQBNI+2KP6uxaiDpAKXAOqwtAUnhYAisZ/Dm6YyzlwpQUzgr2MwPMGAtCIMohnR0yS994WeIgEQD1qFkhHOSUPMSCAQCwQAIBAKBdxRm1Pdvy6r3Xxr48Hs5+cC75pFuiFICh8WaolLtBqzVOD1Fv0j5mx+9wdkVfr2kCvZDyiogUIA1IJ1FOYtv+K/TvUcmAO7m/hPQXOWeJJ5ardaROI4fV0rNjYvvq03zn3TfnbIBrudIwLcjCHAvBsNOonC3sMKrCTN8u7bN7WACjFc5SCnpdrvMzc19I47j6sRrQkq/MYa1tbVnl5aWvrq+vr5F7HujwN/X374sSz9u8BtAnY2x13wM4SaJf1n/VwkJxuCcAeEoHFgpGAKvvcVnf3LsEoWYARkh/N2crLIDpAJTos2QT37kEHfN8Y8oqmInYSVVU0A4BQ0EAoFgAAQCgcA7CEd1Yo2FRFYnx0c/8wFmWhHFcFCdeCuQQlQR/0WJlDFGpLy1NOAHL6+wlgMChCyrfD9UlfsnQNlqJc+LfTMK/xOj625FydUsrY7j+PEoih7zgmZSWfxOAv5KzILdRP61lL9fyfXXIpz32r6wl1XivZTXv9PF/04TH/x1vqR/dnaWVqt11N9GKbUl48K3BKytrX1zbW2Nfr9f77t+1F9z//dVA61Wi263+7jWek9tMbsflPy0EInwK/vCodRoeojSWAEX1/mL7z53mtVBCxF1RiMLqUYDSlUVA6gYVw5IxSpf/NzMH0oLqYZqnoAMp6CBQCAQDIBAIBB4JzEqmRUCQSX+59vc/cmfuZ9ICKTT5GaIEKZa2TfgCgc6oSDhpTeXePMcIgOkBseg6ptHYNFYJGpUAaD8Sr+wGOGQTqJu0QprKSVRFJEkydyo/P8yYTtJdF2NgN/JHLjaCoOrFbk3Qvzv9blvVBXAdibD9ay6uJlmgNaasixxztHpdOh2u99ujvZrGjH+99FowEeXlpbq0MBxA8xvH/84nU6HVqtVHVUaQYNXfkTyolyD09WwEQeSkkrTm6p1KdJkFp59fsAbJ3NwLbCquogYIROcVSA0iYJyeIpf/oUPk1DFA0jMKPw0EAgEAsEACAQCgXcSwoIzREpACR9/hJMH9kk0DoHG2AwnTRXZ71S1Yi8V633Lj158k5UBVZ+uAGsNDoMxFmMlzgmUA23tZqmvtCBtNQPcypveAjBJRI1W/ufSNP2a7/2/UQJ+L1UBuwX+XalQv57VADvdby+i/loqAq4Xt5Pw3yngsLmyD5AkCbOzs7Tb7S1p/ZPK+3u93tNLS0uPDIfDOjRQa10L/OY2staSpindbveYlLI2AK54EoBrTgwRCCeQo/eANThX4BwUpsQJiQGOn0A8++NTbKwXOAuCGIzAygiLgqFBSEk76fPQ4Vne/15cmUOiI1wVfxoIBAKBYAAEAoHAO8kAqOK2XemQwKNfeBApNsjzEms0KEfhBlA6kDE4sIOM0+cu8cMXLjEAiNoYwFgQwgGyCgMUjCoL7MTAP+HkLfEPwLhwUkoRRdFjaZo+7lf/JyXlTxI4IQNge4G63e1ulQyA20387+WzM8YQRVHdlz87O8vCwoJLkmTL/tuchCGlxBjDxsbGs0tLS/R6vVrUj297n/gfRRHT09OHoijCObfnDIAqE8RWOaGNh5YjM0BQteIYY3BUbQAWR2ktTlZhgH/77HHOX1ihLECqBFNIjFU4kQAxlIZEZUwlGV989P7KxBQlYAkEAoFAMAACgUDg9jrhZ6yPXoxfqYEIQYSgmXrtV9oAHMLBXQv8o49/6BCxW6cc9nG2pK0FqjSYwgEJzklWeyUnLxa89GZ1Gi2UwlnAUYV2VQ3/CNTmAABhEViag7fdLdB2PUlMSinRWh/1o9D87cZF+riA2qvYv9Fi80b2t9/Ivvzr8Vy3e/DfbtUWRVGgta4FeafTYW5ujlardWQ8ANP/7k0vay1LS0tifX2doigue3yfk+HbANrtNkqpLZMArvY0sBoJWPX+SwTGVDklWutRvojAKUUGvPTG8LnzywVlGYFuUxauDiOkPYUrSzAbJGqNL3z8IeZSsKXBUV52MBUTX9v4JRAIBALBAAgEAoGbJP79Kamo0ve2nqcKgBRBF0kLSbR5NQqBIkYTW0ci4Wc+2v3DbpQRlT0ilSGKHvQH6MzhCgW26v23yTz/n6dfYFWAUJBnfRCgJDhjUM6gZHUSnylJpiRWGCQFwlqUtRgBhbx11uB8onkcx8zMzBxrt9uPlWW5RRyNj0RrhqhtFwg46bqt95E7XpSKEEIBVUuFEKq+gNwSujaeVTBuQOw0h367VoDxEXDjArP2mpwD53DWgnPVrijElkvzdv7v/v5Kyst+10rV1zX/1nyu5t8n/bzbZfyzmrR9Jm23620c7OVzmXRxzrA5/m7rRQiH1hJry2o4h6wqdBYW5rnjjgPfU0rUQt/vz97Y8oZXlmWcPXt2fmNjo17tN8YQxzHOOfx3xDmHUoqpqalvxXFM87uz4/t2EuE2hbUTtrpIg5MGi6G0lYkhkJjCIp1EOEdpDX0JZ/t87vlXL6LTu8j6ghJB2k4o8z75yhqi08aWfUS2xAfvTvnVT+NiDVDUp6GicTzdfNmSym2Q1YEOVX8vLzNeA4FAIBAMgEAgELg1TALJ9tOuJcJVNQLKwtHPfYCWtsRS4PKcOIohB2SMRJINc6xs89zLZzh2Nnu276BqHLDgqtCuKtm/EiBOgBESIyRuVAGgXJUH4McB3gpVAH7FMooi4jg+IqU81BS5N5Nxgb9FfAtBHMd1ybYXZ9tNKrhZxop/D6PWCqIoqlelm8bFdkbKT8N4vpv2/R8zMUbVLbTbbWZmZj4xXqHSbHHxUwGKolheWlp6dmVlhTRNSZKEPM8vq44Zjc18LIqia/zcxs2M5umiHJkGo1sqWBuy/OOfnOLk6R6GGK1jXJaDM8StBDfoVd9vJTAb5/nVox+FArTwz1V9r6RrqHrB5mhCb9SJpu0aCAQCgWAABAKBwI0Wro1TZIesRLivsq/P6QsgG/23qLL8BIDBYUeF+nDoHv7sk0fuR1qDKSTSyGqJvoxAtpAaSlvQs22e+cFrnDrLIz8tssyLnZG4ecLPSN+LgLnSEMCmsL1SA8DftxnC5kuzvbD212VZRpZlN90IaIbQNV+7Hyu30+r6bp9BMAaubl8frdSzuLj4jFLqMrOlmQfg96elpaVHlpaW6vv7yQL+dj4ocGpqina7/fiN+nyUgryEn7yW8eob53FOooXE5iWxrDJMrCkQIgWrKF3Gz3z8/TxwF3/dFt6s3HosnbDRwNnGMTVkBwQCgUAwAAKBQOBmndALf146GuTnNg0A4UDWBkCGHa3Kb65uVavyEvjSF/Z/thOvY02JzR1at7FDC2UChcJhEFHMG+f7fP+lFXoOdKSwPyUaTClFkiSPJ0nymDcArkSo70Xs7xT0t5vIbQYPehHtS7D9YxljyLKM4XBYl2Bfy2i+64HWuhaVxpi6QmHSaLndzIqb/V5uV8Hf3Gf8f9M0ZW5ujna7PVeH7I0+F79trbVEUYS1lizLWFlZERcvXiTLMpRSW4wob+aMxgF+42rHAF7Zm5M4B1LB+VW+9OKxC2QZozYBAVLgsnVUrIGEbGCJ2gohevzGlx76ZGKrov7RaJPmoZPaFaiF/9a/hukBgUAgEAyAQCAQuHkIfyiVQFSV4Tt/cC2BAou9vAEag6RkWsEXP/seZHYG5Uoi3YESpIjBJjC0VXm5jPjbn5zmldN8sAScULfcGL+rEUhSSr+C/lhzRfRKBcxeRv9dqQkwbgA0w9dGpgVFUbC8vLxx8eLF3+/3+38ohCBN03ou+80Uy82WhObr9u0Anmag4iQTIIj/7feP3S7jBpJzDq01U1NTzM7OXvL9/D44z38H/O/+v1mW8dZbbz2yurq65bNrPr7WmjRN8dMA3m7KsjrCrWX8/557+QxLywNsCUJGMByAyauDoUuwRqFiyLIL/PJnPsQ0IwMARj/phvCv98xtLsEECAQCgWAABAKBwM0Q/lvSqCQCjURffmD1pf9bzlotGsN7H8AduiOhJTeQGJAas9EDFUHUAhFjRcxqv+TZn5xiaciPx0Xb7Uwcx6Rp+pjW+uhehfluRsBertvrYzXbALx49tt/OByyvr7+R+vr64eNMc+2Wq3fmp6eJkmSelW2KZpvdDuAMQaoKgF8NYC11veW1y0Ck1aMJ40ODOL/Ck+wGrkRze3s8yP27dtHq9Wq9/txw8AbOFprjDEsLy8/e/HixWezLLvMVPCXNE1pt9uP3agWgNJBz8KrJ8vjx9+4BC4BNC4vEVrhBjmUiki3yMohnRbcPSt5z904XYt8WZkALto8LRX+8Grr/4by/0AgEAgGQCAQCNz8I2gdZgVylO7f9AWsGNP9zt+yWvc6+rmHaNMjMRkKh8uGKGHBFNXjRi1QU7xxZo0XT/af3QBEEmHc7X8yPBJCc2mafs2XNTeF014E+tuZAdC8jxfvDeHPpUuXPpll2dfTNP3azMzM/+TFv3OOoiguS7O/Wdt4fJv4leI4jreYADuJ/+0eN7C3fXR83J8QgpmZGdrt9rfGWzV8ZYxf/W/us8vLy4+cO3eOPM/r2zfvmyQJ3W73W96oensNDgUCBk5wfo1Hvv/cG6yvOWx/iNBVW5QtLC53KKXJ8yFa5CTlBX75MwvVmr8P+0OPLnJLxH9VW2UbE1TC6WsgEAgEAyAQCARuqoodP6Rq5Pih1a/+u1FYoKvE/1QEn/vkg7SlQeYlsZJkww2YaUE5wOUDEJLCTfH6Wz3OrvPIALBSUVh7S6T4X6s4jaLosSiKDjVXR9+OlfJrqSxoirc8z+n1ek+trq6K4XD4N1rro9PT07/V6XRwzjEcDrHWkqbpLSNAfR+6b0+Yn5/n4MGDdWXAdpMAgvi/Nvx2b/brj2cBxHE816zOaBoAPvTPV3IkSUK/3+f8+fPCVwF408wbAFprWq0Wb78BIDGlwxCRy5T1kuXnXxxw7mLG8sp6VR6QGZRMMHVWhqS3dpHU9fjcJ9/DZiODaRw/xcRDrGj+Nex+gUAgEAyAQCAQuGnivxqOvuUktZ6rLTczrHTSARehVVr9DnzqY7h7D0hiK9AuxWUFcSQh2wBRIBIYlpZ+McULxy6xMoCokzIsi9viJHg82MyLR/97q9WiWfo/nrI/Xt48Hqp2NSJ+O2Hf7PG3tspdaJb/G2NYW1tjaWnp8MrKyleyLGP//v1uZmbm97TWW8RY8zEnXSZti+bvO828b67ON0f8KaW2pMh7Eelfi9aabrfL/Pw88/PzzMzMcPDgQfbt20en06mD5ZpVGJO2d/P1SCm3mAfN0YLjVQWT9o3dLrvd73oYUNvtF3vt79/pPRlj6s/Ai/jx/XphYYGZmZmv+c9Ra12n+vvb+scoy5I4jrHW8sYbb4g8z+vPyYt/rbWfCPCEH1HZ3Bf859N8PVdLlKQ4JAWSzMGJM3zz5dcu0p7eh80tuBhcjJaCIs/QTpJIDaLP4XumefgBXCRAUSIQaF1ZAkqHf1oCgUAgGACBQCBwS3P53GzHaIS1AEREmTkgwpYlGksEfPrjB5nt5FAaKDQYkM6CLSEGpCOXmlMXc147uUrmYDAcYiS3xer/pLFmzTL0UfDfkUlC6kZkHHgR5MVzczxeHMfEcYwQguFwyPLy8tcvXrwoer3e8SiKmJub+1Ycx7XgGhfDN2KVvCkum8LdGwLNcLl2u83s7Cyzs7PEcYwxhlarxdTUFHNzcywsLDA3N0eapjjnyLJs20A7YwxlWW4rgP3EgcDun1+73WZmZuYJnxvhvxvNSRKTsgHKssRPBfDfs6IoMMYQRRGdTudrzdyB7TIeroUsyyitweEYGljL+f1zK5CZmNIoMAoMOFeinEUahbaiMjfFBp/72X3EIzM0AsqyQOgYY/d6dhpOYQOBQCAYAIFAIHAjqROrLZJyNMxq0wqoT7lFBE4jkGhKEuCuRR7//CceIpFDygKsjRBOVkdlY0AICukwUcQrb63w2lvuszKqHtSLzdvJAGgKeyklSZKQJMkTSqlDTWPgRhoAwJay6/GwtsFgwOrq6tNLS0vi0qVLT2ZZRpIkzM3NucXFxceiKKpL6G/W9h3/3b92X/KfJAkzMzPMz88zPT1NmqY0Ry1GUVSbAPv27WN+fp7Z2Vmmp6drY8Nvp2bFgRepZVlumTbQfB3vdPZiBvmWjE6n8zVvAPjxf9t9n3yQ49LSktjY2Khv6z8PbyxEUbRl37ye1RP1d1YIlJYYJ1grePnV02tc6itK0cGUEmctWIuwBlUqpFHgDE70+dzPvY/EQQpIMgQW50xdWeVGR9Ytp6qXhakGAoFAIBgAgUAgcKNNgPqHSvo7qv58W7cIVIfaCEdEiQI+87HkG/cuTmF7azgnMHUAVlzd0UhKK+mVkhfeOMOFAX+hI4mKNc4KnFC3RRXAJLExGqH3RBRFR3aqEni78avkZVnWxoQQgjzPWVtbe3ZpaWl+aWnp0bW1Nay1zM7OPnbgwAE3PT29pcR9Uqn8jXgP46ZF83n9XPj5+XkWFxeZmZlBKVWvEvtWh6aoT9OUmZkZFhcXufPOO5mdnaXb7ZKmKc2gOv/43ogar3y4XQyqm/V9aLazALTbbaanp5/w5f87mTvN/W0URvn1Xq9Xl/l7Q0ZrTZIkW0Zr7mQeXdUJpJQIUT2vUJo1C88fX+GN031y08YJWaX4C4dyoAyIUgIOK3IO3dvlfQ9UcwMUBQo3Mj+p+6kcEhdOVQOBQCAYAIFAIHBLMFrq3zqmqmxeWV1s9TdJhqSq7n/0Mx8kKjOK3gCpFUYInHFQChAphYkpaHNhecgLb56gD5S5JRYRJi+5XaYAjgtTP4M+iqJ6VNn4aqcXkTfKBNC6ajrOsoz19fXllZWVR1dWVh7Z2NhY9snqc3Nzj83NzX2r0+kghGAwGFwm6q6XsLpaMelNjDRNmZ6eZmFhgdnZWdrtdt3j780OL+DGt/PInKHdbnPw4EEOHDjA/v37mZ+fZ2pqijiOgWq12bcaNLMGmq8lsLsZ5rfj9PQ03W73CEBRFJfdZzxnwe9na2trTy4vLz+d53mdG+ArCdI0/Zo3bnZ6DVf/3XY4UyJGbTMZ8OppxAuvLtPPO9XqvSxBOHCKqNRgJEZISgztJOdXfn4WSVUFAKPbahoZJ9UgwGACBAKBQDAAAoFA4CafzW9eNotU7Wj9n7HYakeVdJ2jgXffj/vgew4is5zIaKwUFFhsAQwdiA6GFCvaHDtxluNn7JMoyEtQVoNTCKGqlMFbXPA0x+c1eusf973/zRXPGz1z3vex+5XT1dXVrywtLc2vrq4+PRwO6z75hYWF7/mefy9yx4XVePjdjXj94wbKqPe7XvX3Pf1e+Esp67JwnxswafKC/zlJkro9YHFxkQMHDrC4uFhXBnix73v+m48Z2L0Vorm9R5/b95IkoaxT8ycbTP5+UkqGwyErKyuPbmxsXDZ6stVqHYqiaG5SlsA1f7eFxcnR47iqosRIWCvhJ68tsbxiRqNKR2aGk+AkykpyFEaCsht84dMfpQOjsaiWNE02q6pEOFUNBAKBt4OQtRoIBAJXfRasR+tTTVegsfJZtwBUFQBqdND94i/MM9eV6A2AhMwWlBRIkVBkhihJcC5ibcPw7I9f4twaX5cpyJ7AZYIoSjGYrc91ixoAvszeC804jg/Fcfz4dkLEGwXj88/fLgMgz3OKonhqMBh8dTAYLHsR1VhJ/3a32z0SRVEteDfT2suJgu56iay94sv3p6am6Ha7dDqdWug3cxeaK8TNEvTxsD9vZHjTQGtNHMd0Oh2MMeR5TlmWrKysYIyhKAqKorhMuAa2/17444X/fiRJwvz8PBsbG9/I8/yr/nPZbqpDs2UmyzJWVlYOSymPTU1N1e0dSZKgtT4qpXzq7fhchACtBcpZrAMRSYS1vHxsnWMnlrln3pGIIVK0KxFfAlLgZIRRBumG3H/nHXzmE2337/+mLwSVUUWzdUpInJNYJJJQVRIIBALXg2CrBgKBwDUcPqsiAFv/z/f/VwpzpNFliV8JSyUc/cTDJGYVrAMnKPMChUAohTBVfGDpIk4tlfzwZUOvoFoxEzElJVoprCluj63UCNUD0Fof9av/46uaI2GzfCNFZK/Xe3RpaekrKysry0VR1On/Sin27dvnut3u0SiKLhu/l+f5tuLOr4rfCHxVxdTUVB3glyQJQL0inKZpfV0z76A5wWBcWE7KFdBa1zkB8/PzPPjgg9x///3cdddd9ThBPxIxTAHYmwHVXM0fGTiPJ0lST6Zofi6TxiRGUTU6b2Nj4/j6+vqT/jGttf7zPfJ2VaS40o6eKycvcowVWAnHzyBePXmJolC4UowSUd1odEn1OjQO7SypzPniox9CAy0FZVFUB1XFliRVR3UMdLLhDwQCgUAgGACBQCBwwxAWlAVp6/NUg91cozIgSg2lRseMAq3gY4/gPnDXDO18GcoMWm2iUtAqgH4P3Y3JNy6QFTnPPL/E60scKCUMy5ghApVohvkGSFu9hltc/PvScK017XabJEmeGK1MLzMKCMOnf2NRSsxJCdaW9d8mXZwzKBUhZRWe6JzAuarvQgiFlHrLdSCJooQoSigKw8rK2pNnz54Wy8sXnzamII41SgnyfIjWkv37F9a73Q5RpHDO4JxBCFdflNp+vJpfbd8uBd5fN2n6QHMVvpnm78V6M7RPSE13epb9B+5gft8iOkooSktRWqwT6CjBOkFpHAiFsbC8ssYbb57klVePsba+jrEWhMBYi7EWpTVSKYqyREiJVAohJdY5SmOwzmGdw4z6/OM4Zn5+nnvvvZcHH3yQd73rXUxPT9fjFL3B0DQRfOYCQux4aXTZTLzsNHZxpwT+Se0Ok0YeXk+TZtJFSjCmqPdzIRz79y+wf/+CqwwmOwrZg8qjsVhb1t8Vv42llBRFwdra2tfX19fJ87w2Yaampp6Ympo66k2pZpvKNb0nJ7GlQAClBBlDpNpsZJIsgf/84xO8eaKP0guUhQUpqjehNLLIaBlHlIMsenzqEwvMdviA8Kv+DsggdpB4sS9sNStQVd/mKJgAgUAgcNWEFoBAIBC4aqqwPyfqxfxanQgkMSklGWVZojWIAj79yffTkQXSi8phDnlJ5ICygFIgtWKlP+SVt1ZYzjifOwlWgxhVGGBQupqxfavjBe5I+B0VQsyNRNHctc7zavY8j4s6LzZ9ZYExhn6/T1EUz/Z6vUf7/f6yENUYvKoVoERryczMzP5ut3ssSZKpvYq7KxWDnmZC+/gYPecccRyTZRlFUdS5A80cgunpGWZmZuqE/0mGhF+Rv3jxIidOnODEiRP0+/2ntNZHV1eX5w4cOMAdd9xBp9OpKwH86v14BcAks6NpWDRXrVutFktLS/Vj+deX53mdRVCU5bV9+0bZBr4Kwo8m9FkEt9Ikgu2mYfjX6s2SOI5J05Q0jbeMV5zUv+8NNt8eYK1lY2PjEaXU9/znOTKanm3ub94IuNZKG6UiBA7nLMaCRuKIWM0zTl0yf/zW2f6X3n93lyhNcMZgnUUh0U6gLRCl9PM+s92Yz32a5/7n/4AQlDgHSoE0W4+zTcXvbb1QZxIIBALBAAgEAoEbeFYv8X34W0fySUBhyLG4KtxaQieCn/vEQzi7DFYipKTMMpRkUwuXFhPN8Ma5NV46dvJc34BUEmcdQlQrgDiHFBpLeUtvnknhf1LKOS9eqpXMq2fSjHMvnpuCqSxLBoPB04PB4KtZlh3PsmxUlSAbZoGk0+kwMzNzrt1u70kg7SXgbafr/HOMi39/u8o40rWI94nx7XabdrvNwsJ+4jiu+/W9aeArBZxzLC0tce7cOc6dO8f58+efXFlZ+bqvyFhdXebcuXMnLly4cM+dd97J4uIiU1NT9Qp9M+l/fLzf+Gv3LQWtVqt+jVmWsbGxUYv+pmC9HqvszjnSNMU5R5Zl5HlOmqYopciy7DJD5WoMm2sR+Lvdrrk9/O++nWN2dva/vXjx4u+Ot8k0928hRB1k6UcIrq2tPSuEeDSKom+3Wi201kgpDznnnvUmjM+xuDYDQCJ8nb4vRlIghKJwcP4iv/zCsbPuIw/u4552G2f6OFcCGukkOAXW4qxFY/jSox/k//W/PkcE5A6cFdUUgbqmym6JPBlLWwkEAoFAMAACgUDgBoj/uiF1tEJVr/5XfbklBiltvZr1kQ/g7t4fY4c5ykqQGudKIqHAlICjQLKWR/zwpZO8dYmDFtA6pjQOLcG5Apy8LcYANhPz4zh+zI/+8yuW19rq3wxJa4o7L1ZHSf7Hsyz7+mAw+Gae5/WKtA/xsxbiWDM3N/dPO53O73nxfKUCabcJBrsJz0l99/51+NeilKLVajE7O8vMzMyo/aGqhDDG1KvgWZaxtrbG2toap0+f5uTJk4c3NjaON0W8tZbBYECv17v34sWLnDt3zt15553s37+fffv20e126/J9f3ufH+Cv9+ZOM1DQ/y2OYw4cOIBSiuXl5bonPY7jOjjwehhMXjhHUVQHFG6GNNo9b//rLfzHTaid7ts0fZRSfiLA76ysrPxuNVLRMV7MML6/ebNtVOnydBzHT0kpH4vjmFar9Y319fVH/Od1JYbFtu8bsM4hnUa7rPYvdRxhC0W/MDz/xoCTlwruvnMG7BBBCQiEUDgnKIuMJEkZ9jf4yPsOc/+dz3375bM8SiTJczla3XfVY48pftv4/0AgEAgEAyAQCARuCAKBc3KrAQBI9OjU1IC0SAuxhd/40oO05AqR1pBJKEuwFpSAvABrMTLmxIWS7798idUCiBUOibMZSpbYqiEWY0E5eUufBHuh78v/m6vG1yPoz5d/jwtnX1a9vr5+uCzL4174NycMVMJVkCSabrf7S91u9/eSJKlXZH1/9bWK/+0eo1kdMT46sJn67kVsq9ViZmaG6elp4jhGCMFwmBHHMVEU1YJ3eXm5XvE/e/bsV7IseyrLsvq5mqJYa1UbCGfPnhVLS0t0u93/9q677vodbwa0221arVadWdC8vxoLeGwaAQDT09P1+1tdXa0/L/9Y4jqU6K+urqKUYm5uDillXXHQarV23M+ar/t6iv/x68bH+TV/blZDND+bOI6ZmZmh0+l8otfr/U2W5bXx0jS5jLF1WX/TgDHGsLKy8hWl1LH5+flDnU7nSBRF9Pv9LVkS12qK+JGnCREGgzEFMoqROsUUPV6/yB+9cqr35Q8cWmRKa6QcgLVVpkQpUHGVgxAZw1xH8aUv7D/66r88T6Q0uVMYyuoYit1iAFhCgFUgEAgEAyAQCARuuPivgqodk/pQRdWfqkYr9Rbuu4tvfOFTDxOZ8yA0GFcF2QlHHXwlY3LX4pWTq7x6nt/rA4UQYExVLotDKhBRgqtjsm9dnKt67JMkOaK1PrqbeLpSmqXp1lqKomA4HD45HA6/nueVaGrOuh8P1mu320xPT/9Zu93+rDcU4jgGIM/zzbC66yj+dwqr86+1ebs0Tel0OnS7XaampkjTtDY//Mi3sixZW1vjwoULvtT/q6urq9/0vd6+v3xccI5vk8FgQJZlv9vv93/37Nmzf7Z///7P7t+/v075T9N0S7Cj4PIpD+Mj6qanp30ZOpcuXarbAZRSuyZA7LaP+FaG4XDImTNnaLfbdZZBnudbSub3Yspcj/19r+Lfv37YbGVpivhWq8X8/Pwzzrn35Hn+8qTH9lUhzcfyRtBwOGR9ff1wq9VyURTRarWO9vv9p/13Msuy+r7XchC0gBIa4Sy5LbEGlJDkAs5u8Os/fvOS+7mH7+TQgkIpR9UP1a7etxaUWY+k1WGQrfKlL3yU/+Ff/q8UWQ50q9CUkfgXgKsPd7I5ICAQCAQCwQAIBAKBG4MCzIQsaoHDIcBWJ/ZawGc+PvP4ga5Ab/RhWIkfIQTO1pnmlGhWMvjha+c5v8H/KRfV4ytXFQmMAttRkaI0VbL9rW4CjELNvqaUOtQUt5VIvEb9sTmSbznP829mWfb14XC47MW/L533Zez++X3Y2sxM90edTueDWus6aM8Lsr0EyF1rBkDz+qZw9n3/SZLUIX/emGi+ByEEly5dqlf8l5aWvrq6uvpNP6Kw1WrVYt1vh+Yqsi/r90LSjwocDAasr298btQa8G8uXbr05bvuuov9+/czMzNTj55rCtjm629WMviSdv+6V1ZW6vDG67EC325XYvL8+fOsrq6ysLBAp9OhKIr6/dyqGQDjFRnNbSelZGFhgSzLvrexsdEtG4GJ498jf934+xwMBly6dOnRubm5b7darW8opQ5fr/wFW7k/WGMRzqGQOFdgnEOImBzFxcLw49cv8dbZNe6ZaaMScDZH6DZSyCrLxBooCxQ9Dt99kE98GPcnP0SAG006GTmsDhSyzgUI4j8QCASCARAIBAI3FHnZb00hPipSdQIloB3BJz96H6K/TGRKskFGkkzjsiqxXJbgrKJXCs6vGX5yYoWLJZhY4qSqV3BdabB2tGJYuNtiDpbW+kgURUebJe/XQ/wBZFl2vCiKpwaDwZNZltWBaF7gN0vO/Sq3lJJWqzXX7XaPtdvpnC/F9qLW3+daQtL2KrAmrUwrpUjTlCRJOHDgAEmSEEXRljaHampBzvnzZ32y/+H19fXjzdnwPghPKUUURfX794KzEoKuNgR8BYXfXlFUBQ9euHDh1y9dusSbb7752/fee+8fHD58mDvvvJOpqSnM2PZtithGAj1CCLrdbm0arKysVK/jGoWoX+mP45iDBw9y4cIFXn/9dTqdDnfccccN28evdT/x++V40N/MzAzLy8tTSinKsYkJlaGjLgu/9NvbT0RYW1t7ut1uL8dxfMjnQ1w/I8ThrKlS+yVo4ShkAUQYNOvW8OZF3nN2NX8pM11SAdYZlJQgqtop2UqxvT5xt0Xi1viVL9zHf/7hG2RkGNdI/3e+6kpgbgPjMxAIBG6fc9hAIBAIXNEJ8OVn9VWUH5QIIJHQjeFnP3IPLS0oexlJpLDFkNLkRO02LjcYYlw8y1/98FVePpkJqyKc0ODAjuZ/S1WN0jZ5cc3i6XowHgDnhYkvZW+1WsRx/LgXmNba4+Mp6JNCycZFuzcOfCm5MWZjOBz+4fLy8uHV1dUnB4NBPdrM9zc3+969MJJSMjU1dWh2dvZSt9uda66Ij69gj5e0bzcK70qFYrMtwZsVzeqEVqvFwsICd999N0mSbBll6AX1uXPneOGFF/jLv/zL+VdffVV48e/FvhCCoii2lIf7z2hcoDc/v/EMgmYewsrKyn///PPPiz//8z///e9+97u8+eabFEVRBwM2t4sPo/Mmihev3W6XAwcOsLCwUPfoN7eL3x4+3b657Sddmp+VUooDBw7wrne9C+cczz///D87f/48/X5/y77WvE+zbN63NjRHLm73vE0jZScx7W/nt8+kNonm/je+7aSUzM3Nsbi4uB7HMUWxWa3R3GfGP1P/OP57t7KyMt/v9785MzPzRKvVuj7l/1S9TUI5DA5jC4SoTipLV2KlhLjFesHLPzl+mqGLKJGodnsk/kdN/WWOjDSUfRLZ47Mff5i5CGKKzbNUsXnKKpHEURz+6QkEAoFrIFQABAKBwFWe/lansW6CF1CJ/whDbODvfAHXjQbYjQ0iEY1O8h3WgnMGkaRkA82JpR7PvbrEag6ZjOpnAIsTo59Edf4sxChc4GbaHxNmlI+NhZsTQsyNrl8eF0tlWZ6UUt7TFKPjj9F87CzLNnypf1EU542xtbid1NvuswF833O3232s2+1+qxJTBVrLt227jPf1+9fUFF6+f99aS5qmzM3NMTc3R5IkdQuDf7w8z+n1epw/f55jx45x8uRJkSStLQK8Kf6uR4XFuBGS5zlLS0u/WxTFU2fPnn3mfQ8/zMLCAouLi3XFhRfUzT5zL66jKGJ2drY2Bcyo6mBzKoSre/ebj7fb/udfq++dn5ubQ2v9e6+99tonZ2dnn7nzzjuZn5/HOVcH4U1PT9cGRpZltcHkDZPBYLCnDIir/c5M2sbjlTHeRJuZmZnq9XqfKIrib7zxUFUN7Pz6mtkYeZ5/Uyl1RGu9meFwDSaiBEw9AtVWOSij1XrpLEYoQLKWw4kLG5xe7rO4fwrMCggDsRoFoFaNVEiIGbKv63j0U/PuW396SeQOzCgiRQoQpavM0KIM/wAFAoFAMAACgUDgxlsAxktwd7k5EFESAS0BX/r8h0npUwwGJDpBlJUwUkKSDUpSPUOO4PVzS7z4Or+fCbB1yJ8BYbHNwVfCIhG3RAdAs2/Zr3b6HvY4jh9XSh1p3HauIW6WR6bAPU3zoCmWmyvUeZ7/0Sjg7+WiKEYCObpsZbXZQ+1XQaMoot1uH+l2u9/y/ei+T/56CP3dTAC/ncaNjrIsSZKEdrtNu92uQ/68GPbvYWNjg1OnTnHs2LGT586duzfPS5QS5Hl+WQn4+Gr+9cIL+TwvuHhx+W9WVlbE+XPnuOOOO9zhw4e57777WFhYwJsrvV6vrmDwoXRlWZKmKbOzs7TbbU6fOcPq6uqWVXq/Kn+1ExjSNEUpRbvdJsuyZ9bW1n7/lVdeWV5cXPy9gwcP1iGKvV6v/jz8ar9/bqiyK+weZm1eidFypRMJfCjl3Nwcg8HgmSzLxGAw2NPr8tvTOUdRFAwGg2fTNF2OouiIMebZZoXI1X8Bqv8YUQl0qNr2/bEKFZHncOxs+cyxM8uf/NAH78dlPZAgJFCODABX5QGAZTa1fPnRj/Lv/vRpBq7KP0WCsSBHvQCOqn3FhSCAQCAQCAZAIBAI3Ci2pv/by0wAMTrAPnwf7qG7FonsMtqJ6kx21H0lVYwpMwpryOhw/NQ6F3r8rtPxZokBFihxYvR8TlYVABjcTXYAxgVwc+U+iiLiOH5cSnnIVwAIIeYaAnhZa/3BkfDaGAmhqWapdlmWFEXxR6Nwv7/x8+6b6fX+56aJ0DQkRsL6a2maPuHFqDcFnDPXdRtM2h6TXl+z3H9qaoput0scx3VFgO/hHw6HnDx5kmPHjnHhwgUxGAxwDqKoKvUfDvN65Xs78bezeN5dXPtqAqXUKChwM7iu1+tx7Ngxcfr0aV599VV3+PBhDh06xL59++h2u2RZxnA4rFfmvenhH29xcbFua/D5A5PE+G7mU7M03z+GEIL3vOc9vPXWW7/z+uuvHzh+/Ph/MxgM3L333lvlF4wqR3z5f7N1xRtYu5lEexkDuBejYLu/+X09jmNmZ2fp9/v/Js/zXy+KEqXknvZN/988z1FKHY/j+EgzCPKaTKHRyy5ldbzzsaTOgRAOITVoOLPMz/7k5EX3i/lDtEQLQY4w5aifyeKExuQlWjiU6fOBB+7ggX389QvL/Gxem55ghSUSGmNLhBMhCDAQCASCARAIBAI3kDqcarTi6kZ6XWx6ATHwi59/gPk0IbESJxzOlAgVMRzkxNrghKRfWlaGhhffuMCGhUzYzeArPwJLgHUaiaxOvIXFOm66CeCF2FjpP1EUHVVKHWoI4blmBcC4GSClvMcLE2MMZVk+l2XZ17Ms+9dZllEURf3444K7mULfFFNe/E9NTT3hy7m9SKzuc/2NkHETYLwsX0pJHMfEcczi4uKW2/j+/X6/T6/X46WXXuLChQvvWV5eeVkISJKk7u8fDocIoSYaDLsJzqt5f82AQP+aW62qBaHX6/Paa8fFmTNnOHnypHv44Ye59957mZ+fJ8/zLdMCmpUKSZIwNzeHEILl5WWGwyFXklLfDM9rZhY0n+PgwYMkSXLuxIkTf37q1CmxsrLyiXe9613P3HnnnXVQnm878MaBbwG40hXyazEEJo0J9IaQEIJOp8Ps7OyXNzY2KIqNPU3RaI6BHFXRIKV81u+H1/SddwASB5TSVnknFqSr2pSkA5uXKJmwkme8dGKJE2f6PHjHNEqvU5h1oiTCDAtkKyHPDBqJyzeYjlb57MejT770xwUaKHR1mDXOEmuLtKCkpLAmmACBQCAQDIBAIBC4kcpXgrAIW40ELBvmgHCVAfCzH32AyFpc4SjzAqUEQrUwJiO3BVHcoRgq3jq3zEvHsz8eApmxkEpUWSKwIKuTaofGoNAiQzg7qqO9ucK/KTz9arQv/2/8bXlc3Agh5owxG178e6FSliWDweAfZ1n23/sebb8S2jQIjLEIISeKX/8a5ubmjkVRdMjfrykWy7JEXsfNN8kEGM81GE0goNvt0m63SdN0yzaz1rK8vMzJkyc5c+bMc6dPn/6QT+T3YrAoDFIy6pG3W7bpuAFyPVZ5m9t3XKj2+wPiOKLTadei+dVXXxWXLl365wsLC//4E5/4BPv27atX3Muy9PsGzjkGwyHtdrvutb948SLD4bD+DHcrdfdmTvP9Nj+DPM+JoojFxUWiKPqslPLE2bNn7z127Jjo9Xruvvvuq4MT/fv0j/l2if9JQn/89+Z+7E2NKIqYmppiamrq3wwGg18vS8NuL9EbJN4gM8bUZodvL7mGPQPhZGVASonDgq2OexJwCIS1iCjC6ow3L3DuxVfPHrjvwH1EOse6AThJ6SCWEQg1etSS2C5z9FMf4P/xx99nHVBKUlKZosOiRIV/eQKBQCAYAIFAIHBzFLA/Fd4Mq3ZO4xOy3/sA7u7FNq6/Xq3WO4NQGlsYIp3iDFUFgHE8//Ix3lrhlyUgpARh6rA/K/xKvwKngQyJxQj/7DfPABgP7RsJqqNa66PW2uXGbeea4njU770spbxnJOo3hsPhU6NV/7rPf5KwmySc/G211rRaLdI0/Vqr1To0qT2gORLweon+SX/zr8mv+rfbbTqdDp1Op+6Vj+MYIQSrq6ucP3+eM2fOcPbsWbG2tsH09BSDwYA89+F6kjSNGyXym9UF45/J9TY1xv9blfHLLQZNVZ1gOH/+/D9ZXl7+J6urq2ff/e53H3jooYfYt29f3ebghajf/nEcMz8/j5SS1dVV9trnPqnSovnfNE3JsgxjDNPT0zz44IP3tNttd/bsWXH8+HFRFIWbm5urpxL4cDw/RtKPzLtS4b/X2+5WBdAM6nPOkSQJs7OzXx4Ohw+trKy8vNfvZ7NKpiiKa97vYST06zL86ggora0qA0bGpHICjMMquLDCB3/80olzn/zg3ejEoaXEFQVCanJjkTqBrA9SkqgBDz9wF+95F+7Sm4hhZiGiroqq9nkT/v0JBAKBYAAEAoHAjabcUqZfTaeuxH8M/OLPLzLfGSJWB0ihkHEbIaG3OqDTmqJ0hkFpuNgT/PD4OhsASQdlS8o8r3tsraMxCssinB2dgDMyAW4uTQNgdDkkpZwry/JZX/o/Pu5vVHJ9T6M8+Zu9Xu93m+P7xoVM0xCIIsUkjRhFEa1W6xudTudxn6TvVzt9qnyzbP56iuRxvMmgtabT6TAzM0O73a5Xl/1ItosXL3Ly5ElOnz59YH19/bxzjjjWrK9voLUiSaL6/TeT8YWQE8cnThqteLU0R9g1haQxlkgrjKnCKrSuqhiU2uylP3fu3MGVlRVOnDjhHnroIQ4fPszc3NwoSyBBSEmVa+Bot9skSYJSivPnz9Pr9XZ9bZPaQZo0g+78c9x1111IKd25c+fe88Ybb4iVlZWHhsPhS4uLi3Q6nTqDYC8hkVfT77/b7Zs/V5Mq9JZ9aVQF8L319fXubk8zPmHAP45vDbjGPQPlwApvf2oKYYl8SxQGRMmwzLBSstS35196c43zKwVpYphugXMCqQVlMSSKNMNBTtrpgC6ZVYKPf/Bd/PDkm/TYFP5pqiiGZjSFIBAIBALBAAgEAoEbiQQKkEwRk1JyiXYMLoeDbeZ+8WcfJO+9wnzcBaspyghXOKZiDa5EkWNlm5fO9Hl5iec2gLwoSVKF6/fRaJyQlEKP2g0MiOKWefvjZe+jsLejSZI8MSp5PzTe6+9v65yb01ozGAye6vV6X/ErtX7DVkFim2LTC96m6JPSjsbgVavjnU6HqampP0vT9LNKecFT/b0q6966SrybIBufSDAurqXUI0HuRuJXbRnJp5Sk3W4zOzvL1NTUaPW7EsxxHLO6usqJEyd44403vrq2tvbN6n4KcDgnUErjHBjjGjvc5a9zUhDj3j6/vbhHAiE2AwPdKOhCKYl1IJWuTSrbeJ3GViXsvf6QV187Ls6cPc+Jk6fc+9//fu677z46nQ5ZlpEkrZEBVGUM7Nu3iFIRS0tLbGxsTOzr9+If7ESB2zQI/HXeDOp0Otxxxx202+2XXnnlNVEU5uVXXnlNnD599tADDzxw7MCBA6P97PLna1ZeNFsUxkv3/UfQ/Ciqv4mx7W93NACiKLrMtErTlOnp6aler/eJ1dX1v2m+/0km2yST7voc+ixSlmgBhWuBiCgklNIQ2xxJiYzBGnBxysD2eeEMX/7PPzz+R//w6EPoXDB0PWIFqelhckMSdaAQYEGKnF/74s/wf/tf3iRKoPCbxQiUD1EdTWIJBAKBQDAAAoFA4MZQglYSW2oyLLFOKfI+beAj7xWX9nUEU9KBK8EJhIiQSLBDKAzOGgqhOHZqjZMX+dAAQArKvCCRoKzFOFmNBHQjtwGLdF4MyltiMzSFspTykL9eKTU3WnE8PhIfh5q98RsbG0/mef7NPM/rdPjm35sj/SYJ982585IkSYjj+O9rrT/bfIxroSmqJgk0nxjvn2s4HNbhdmma1r3+URSR5zlpmtJut1lbW+PEiROcOnWKlZWVR9fW1p72K7zbzYS/Lb8eZVlPD+j3+7z44ovi0qVLl86fPz93//33c+edd9bb0a9KR1FEt9ut20nW1tbqSQLNvvwoiiiKbE/PP74SnqYpzjkeeOAB9/rrr88rpZaLojj+/PPPi/Pnz7vDhw/T7XbrdgCoVuN9joOvWtnJPNrtuqv5jvnvQpIkTE1NPbOx0RdNg8TnYzQNi7cP6/2hUQCqBulNjSoUcDjMUa2IPCuRAlYy/u1Lb1zgwvl7mTqgkDLGmWFlhjoDapSsaiVSWO5aSPjkB3B//BMEEqJIkmclKSlFnbhiw79DgUAgEAyAQCAQuIFIhyPDIpGjVoBYwuc/8wE6SQtdtiGXOFulY0lJVbdvJYYW633HK8feYj2rVkxdlFBmqyRxhB1Wo/6qu2xOG7BicwTXzWRS+r9S6ogQYs45t+yc8/9dHrUFeGF2vCiKpzY2Nr5eluVl4r8p9if1nvvntLYaiZemKa1W67fTNP2aH+t2Je9hNwNgpz7/5mP4Xv9RmTZpmtZCNkkSyrLk5MmTnDp1igsXLjy5vLz8dS/YvNDcusJ9+9NMos/znJMnT873er0jJ0+e/N773vc+Dhw4wOLiIq1WizzP6x716enpelzjysoKw+FwS0+8n0qwo0Qdrfr72/n7+5aMdnsKIcSlN99889GVlZWnrbWcOXNG5Hn+rQMHDjy2f//+Lff3I/mstbUpsZ3In5RVsd3tdvt53ABotVrMzMywsrLGYDDY0hbSDJy8IeafBScdjI5PVelO1Z4kgTSK2cgzpBIMCsdLxzZ49a0L3HPwbgRDhLE4C0JHVYWTHeUGRDDVFRz9+Q/yH59/jgyQSlAiyalGqdog/gOBQCAYAIFAIHDDGFX0lqUj1haMpTCWqRgWOvzaxz/yLmTRR5QJzhqscThhqlJqBzhFKVocP7nMq2/kzzpARwnF6BzaWjM6qZZbnm/kOuC4Nda+xpL3jzQNAJ8BoJQ64lck8zx/ajAYfDXLsmW/quqFzXhP97gpMD7qL4oqYd1qtX671Wr9gR+jN0lA7VX8N6/bTUT5lWBjTC0qW60WrVaLOI7r1zGabMDp06d54403vrqysvJNf38vMP3q7fh7vp1RStUhgVEUjSYXlKyurj67srIilpaWHjt8+PC3Hn74YQ4ePEgURfW0AGMMaZrWrRUXLlxgOBzWEwSyLCOK1I4Ce3wb+gyFzc9VctdddwF82zn3SJZlzxZFwblz576ysbFBlmVuYWGB2dnZuhy/OTLw8tL/7UcwXslEgE2Dy24R8z4bI4oinynhrLWiaoOxl1U7vJ1YMcomaR4PvQFgq1+lrEw6lMZJKEzJqSXin7x+Jv/kh+9nKtZI40YVTq7KDbAWY2Oq9o5LfOyR+5hvP0fRhyIzIGNKKxC4MAIwEAgEggEQCAQCNxZ/gmtkhpQCcoEr4ROP8EcHFgyslgiTACVC5OAMzhiENWBj+i7l+z95gVPneURr2CgdzmUgoDAWLbzIvzVPdcdX/6MoeqzZAtDMADDGLOd5/s3BYPDkcDjcEtDW7LFvCv3m84yP0xNCMDXV3h/H8eNJkjzRLMW/WhF9pbf3z6O19kYEaZrW/eH+8ZaWlnjjjTc4e/as8GXp4+/N/zxuhNzOWGsvC9XTWtcjD5eWlp4aDofi0qVL7tChQ9x///3s27cPrXVdyq61rscIrq2t1Y9TGQFmR5G9XVWFMWZ0XRUOeffddxPH8fdefPFFkec57XabwWDA8ePHxcbGxqW77757bnZ2FthsK4jjeEtQ4CQT4GraAZp/9waAf+0+y8B/3+bm5sjz/BuDweCrzUqLG7P6X63AO0D4aQDOoJytJqI4UBIGvT7EHUxZUlhYNxQ/Pr7MyQsbvPeAA121RllnUGWJswIh2jgpQKxy14H9fOajuP/vXyI2AJW0KIZDhJIhBTAQCASu+ggeCAQCgatEgANTQlE6lLAIC1969N3o8iKRc0AKMkKqUbibKaEsMFZwYc3y41dX6QNCxzhjwTlUrBFKYJsa0DV9gFun/78xx/6QUurISMQsj8TbXDUarni63+9/ZWNj48nBYLAlhbwp+r3AaQqf8VV/3yc+6qf/Vpqmv6e1nmqK/+3E1/US/40xhsRxzPT0NN1utxb/XrxtbGzw+uuv88ILLzx66tQp4cvbm4F24++tOa7tdmc8JHK8ZaLVatHr9Xj11VfFd7/73Ue++93v8uqrr9Lv9+vQRGstcRyzuLjIvn37UErVFQW7mTzjhtAkc8W/pvn5eQ4fPuz27dv3jaIo8KvqZ86cmX/ppZcOv/XWWxhj6ikOw+FwovjfSfhfy9SASdtxamqK6enpx9vtdr2tmpMabuhppDPgNieUCAfaVyMIAVZgVZXx99oZnnnh+DkGfVOJeBlVgZTWIhjdXpQk0ZDILfMrn/8QLaoVq2KYgxBYE9R/IBAIXC2hAiAQCASuEmscSmuMqXpwYwnvO4R7/4OLxHaVmGQU3gdVMFY5SvK3lCheOXGRV0/x+wYoXATSghRA1fvvPQaw9X8l4JCN8v+b1wiwmXav0FoflVIe8uJfCDE3mvf+zeFw+ORwOFz2onZSSN+4YNmuPD+OY9I0PRLH8eNxHF9z4N/VVAn4S7vdrkv+fQVCWZb0+30GgwFLS0ucPXtW9Pt9P56Q4XBInud1NsCkWfbN1Prb2h5rhNL5bAa/jcqyrKsByrJkeXn52X6/L5aWltylS5e49957mZmZqT/zKIqYmZnBWsvq6uqOBsl2QYrNn5VSOFc9dr/fR0rJfffdR5Ikjw+HwyeNMctRFDEYDFheXj5ujBHWWtdsVdhp+sJeBL8QO7cBjJtazcetWgGq6ohut/u9PM8fyfO8riJ52w0AV7UhGSdwwoITSAySygCoXuvIILCAihBK0C9zzvX47A9feSv/2ftbdCIgiXCuBFeAkkgchcuQ8v/P3p9GW3aVZ7rg880511q7OX1EnAgpIpA4AhQCJAQhbAQYMAiSxg22U3Kl8b2ZdtUVt4Yzf5T9Q/xwVuW93FEDaox0jro376iCMSrtqlHOUQn3Ol2ZNmRZAptegEI9UkgKnei7ExFnn243q5lz1o/VnHV2nAiFJJAQWq/G0t5n93uvOWfM9/2+7/1GqDjlfe94I2/e9dhjD1/gHbntoy2dBxs0aNCgwUtAkwHQoEGDBi9nE+wExBBKzu3f+65Z2gzpalvUw1rIEmyaIL7wAFCaVAUcPnGRc6v8CQKj1IEOIFB5umzqoUb0y6jazyPJK93/RWS2ICk9gNFo9LnhcPjZ4XDYK8nJdu3aLvuHqSDHdVJcvk+Rbn9fu92+d7t6/xcy7rsW8n+1coT6/Tt37qTb7eaUpKhdHwwGnD9/niNHjtxx9OhRSdOUKIrw3jMYDKrOAWXEtnz9kvSXZDkIgte+QFb7TmXkvmz32Ol0iOMY7z1RFBEEAaPRiOPHj8vDDz98x3e/+10uXLhQue/HcUwYhuzbt4/rrrvumsWR+nksz1FduBoOh5UwsbGxwczMDAcOHFienZ29dzAYVJ0b1tfXefrpp+Xpp59+YG1tjU6nc0VifzXyfTXR62qfvX7Ux3gURXQ6nYNBELykzJeXvPQJWHxuUprXARQmqL5KVspsPtZJMxCNUwEJ0EtJnzu5wfpAiBODR2NFARrQeOVxPkZsTCRD9s8H3H4Lt4WAkeLVlds0HmzQoEGDBo0A0KBBgwavzPKp8pZVLkAsTIbw4fcfYDoUtC02qW4EpIiyaA2jJIYo4nRvg0cPnyXVMPBCEHYgTSFLaXVbhcmfqt4nd9XOW2yVG/CfBxTmbneJyKxzbtF737PWHhoMBvcsLy9/sd/vVyn/9drkktDXo5zl7SVZK2vpy2j4xMTEwampqefb7fbdZcT9SseVBIHtSH+dWNWN1Op/p2la+RZMTU2xa9euLSnlo9GIs2fPcuTIkUMnTpyQlZWVQ3mU2W9pzbZdxL9+vTQVvJpA8pqZIbVzXnfg11pXWRBAlW5fCh/r6+uHjh49Kv/pP/0n+clPfsJwOKwyB7z3zMzMcMMNNzA9PV15DNSzCUpRYfz811sJWmsvK0UpvQna7TY333zzl6anp0nTlNFoRBAEKKU4d+7cR5977rnPnjx5shJwynNW/87183el0oArlazUTQDrJSXjr12+/9TUFDt37vRlZsL4977S3Hj56t+mgaXGoysRID+0FJkIhVlKklpUpPEBPH2UiUNPnsCpaTIVIEaTZrk4KtpiAofB0w4U/UvP85l//F7aAH4EKmvIf4MGDRo0AkCDBg0avFqLqKB9Xk91x634ty3M0lEKF1tIY/AZkOLJSNMUpwyJC1k8u8LxizzQt5CisUX/bLzFOYso8KLw6C2R/7wNoMPJqy8C1Mz7Zos2fwsAcRx/sd/vP/BCz98uollHlmWV63kURYRheK/WemE8tfulkpp6dLok+nX/gSRJKhIWhiFhGBJFURUV1lqTpikrKyucPn2a48eP33T27Nk7hsPhaz59/+dEQJh98MEH5W/+5m9YXFysRIAkSeh2u8zOzjI7O0sURSRJQpZlVeeA4XB4RWJdJ8j1cVjW0JdCxMLCgp+dnb23FHFKsWB1dfXLJ06cuOPcuXOMRqMqoyNJEpIkqbo5vFxcSxlB2V2hGJOzpTfFKwtXNCjZtCz15J0C8GozXd9D5hVDB31L/8iZDdbTkFQMGULQmSy2pa5YNzUuSehOCjfsm+SWm/Adgab7X4MGDRo0AkCDBg0avCqIwgjvMxQxEwK/9pEFdrYtklq06uQZAKEF5dB4nLUY02E1iTh0+AwnL/LREaDIe4vnUa2saFVWbJ5zT+0iqpY/xsvPR/lrQc5nwzC8Vym1kKbpVweDwT3D4XAxjuNrJuDbkfiSkCmlSnLzpSiK7jXGXEbmXqoQMB6BLSPvZR11q9Wq6tiNMUxNTTE3N0en00FEWF1d5fTp0zz77LMfPXr0qKysrCzWa7cbvDysrKz00jTl3Llz8s1vfvOj3/jGNzh//nxVHlGei0IcqiL4ZbbB+Pm9mkFfnbSXgs/111/P3r17vzQzM7NQjoMyG2R5efnQsWPH5MSJE1y6dKnyNCjH4EsVgK6lS0A9Q6AUKzqdDjMzM8utVquaNz9r+EKEFHLzPwrS7wVsIWCKFItVoWI6C4mDvocnFkec7KVkRKSZgzAA70BZtAKs4K0HnTK3Q/OR978J7aEdFCJAM8UaNGjQoBEAGjRo0OCVg8P5DCEjxDEdEbz/9gWy9YsYMSAKtICRnNiL5H4BusuZnuPHT8WsexATIKHBe4syKq8qyDzWQ95lYDvH/1IseHVDYQVRujcIgrustYc2NjY+u7a2tpgkyYsmQNvV3Jft9Vqt1hdarda9pfN7+bgrpTRfa6pzKSbUa9Vh04OgXn4wNTXF7t27mZqaYjQacfLkSRYXF3vHjx+XS5cuPZCmKcYY2u02QRD8QqTwv9oIgqDyDlhZWXng8ccfl2984xs8+uijrK+vY4xhbm6OPXv2MDk5iXOONE0r48DtSPO1kutyXMzPz3PjjTc+Pzk5uVBmCJRiw/r6OidPnpSjR49+dm1trTTDfEm1+NfynPH766JFGIbMzMwwOTn5hVe2C0A56TbXIyuCR3KDQO8R8Qiecko6r0mAY5e447HnL5BJBKJIkxG27O0nBjIhCNu44QBhwIc/8FZCYCJqyH+DBg0aNAJAgwYNGrwKSLOYVgABcNubSfbNtWn5DIIA0jxNP3MpLnNgQamAzLd57tSAZ88QJgBBmLe18hlaLFrq9v85+RefHxUREJc7b7/K6HQ6dymlFkaj0Rc3NjbuKVv8vdhe5OPR2vL5hcv+fVEU3Xclx/wr/X1N/wBuljBUNeRl3b5zjtFoRLvd5vrrr2fPnj0YY7h48SKLi4s8++yzcubMmbnhcFilYQOMRqPKK6DBy0Or1SKOY5IkodVq4b3n6NGj8oMf/OCe73//+5w6dQpjDHv37mV+fp5ut0ur1drWpf9KBH9cSKpngpS1//Pz8+zfv//5MhOgFIWMMaU48eWzZ88+cPHiRcrMlxeThn+t4sR247dentDpdJiYmLgvDMNXqAzAjR3gERwKK6bKEFDkLVI1HqWL7hAClzIO/eipU2wkiqA9wTCL0aHKRU+rQEUQdEitw9kRb1ro8N534dM+6MJroEGDBg0aNAJAgwYNGryiSLLcu/rXP/5WJiMhdB56q6DBKcH6gpx6jdEt+gPHT44ss56QOgWp86RZjHMpiEXhc9rvKa7VSG/BAZwUGbCv8g44DMN7kyT58urq6uc2Njbw3hOGIVprsiy7JuI/TsyUUgRBQKvVotvt3h9F0X1lavWVoqRXEwauhizLqijqeP90pRTXX389N954I3v27MFay5EjR3j00Uc/s7i4KGtr69VnKjMF6v4BDV4+NjY2Kt+F0WiEtZZWq0W/3//qI488It/73vd48MEHOXPmDDt37uRNb3oTMzMz1bm4krfEuFv/lfwAjDGVWeGePXu44YYbnu92u7NpmhLHMc45Wq0WSinOnz//0aNHj97U6/Xw3l+TAHS1koRrKVsoM1jK71CKAJ1O565X6hwJLi9NYnNtyr1LypUsFwrKxyny8hpnFAPgiedX/vro8XOIDlDGQyDgDaQalIHMooIWoh3a9/id33g74poe1g0aNGjwctCsoQ0aNGjw0ne/iIdb3oL/lfcdgGwASYaNY/TkJN5BhifSUV786jUXLg149KkzJIBTCmuTvIe2Jq93FYpU2SL93yugFu6SfENNabD1KmI4HH42juNe2c6t7lJ+rXXI9Xr50vCv1WothGF4b9Fd4Jpr6l9sFkCdsJekT2tNt9tlamqK6667jizLOH/+PMeOHeP48eOysTHI//E0qkpPL9P9y5T1V7Id2y/0BqWIsJcZGt570jSt2kE+88wzcurUKc6fP+/f8Y53cN1117Fjx45KPChbT15NmLlaCUkpAKRpShiG7Ny5kyzLlpVSd6ysrByql44UmQCLWut7gK/MzMy8pFaOL7YMoBQ6yvva7TYzMzP3j0YjSZLkFTtXitL0rzAAJP8NVV4MAN4hhRmgx+NRJGjOrqS/9cOHHvO3vPE2JicF7xOEKF8Enc89AcK8xaHNlnn3O2/iup1P/rPnL/IXCrDNNGnQoEGDl7RmN2jQoEGDnHJQ6aJSj72P1+FvXp/qwK/96jzXTQnJ6gqYCL1jljSOEZuhMgcINhP6ccjpCzE/OZrIBoIoA86hBAJd1qMXptm+sLuWsX7Xvui7/XOAlZWVXpIkW1Ln0zTd4pj+Ygh72aotDMN7W63WfVrrF3ydl9PWLAiCirSXiKKIXbt2ceONNyIinDlzhkceeeSvn3rqadnYGBBFAa1WiPe+ig6XnQHK28ruBQ1eHuqiUjXziutpmlaXTz/9tPzt3/7tZ5544gl27NjBm970Jrrd7lXb35VZH9uNp9IDIsuyisSXnR327t3Lvn37HpqcnKy6D6RpWmUCXLx48asnT568aWVl5adO/sdRZrDURbIwDJmcnKTT6dz7Sp4rt7k8FT+kRws56a99v/I7Wi9YLWw4eOjpIUs9h/YdkpHNyb8xeZ5/qLCicD5jKnDs7KS8/12Tf96ur9my2XpQyrW6vKG4TaPQ1Nb0Zno2aNCgEQAaNGjQ4HUIqW8EFUKEEFQ3B/neklbQAfI+4Pnjc8IYKJjt8Ju/9/E7SS+dImhPkOo2aeYQrTAO2mkGWYZuzbA8nOA/f/speg6ywmROa4WSole8V6gisq8QhBRkhJc0r/snzwgQr1BebWkP+KrIJUYh4vHeIuJRKt/wl9fr9cHeW5zLcC4DXPE42ZItUKT9f6Hdbt8XhuG2afV1Qlev4a9fr9823mu+rN3OW8o5tA7wXkhTy/T0LG95ywGuv34fSZLxgx/8kEceeeyOs2fP/5ZSuTN8mlpGowSlTNU60FpblTzUxZAGL3ODUpy7OnHcem4NShmcgwsXLv37b33rO3L//d9gdXWdd77zIG94w410OhOAIggigiDCWo/3Qhi28pR08Sjx4C3eZeBtdV2Jx7usehw+d6efm53mpoUbfVkCEARBVRJQlCssHj58WC5dusRoNNoyDuvjQimDiEZE473gveAc1VHedqUDHEqBcxnWptWcM0axa9eOLwWBRsRjbVrNu3IuWpu9/OWzyFAq0/09ChGNEo/GV79lLgzUHucFj2VkE1QEjx9l7sdPruGTGSIzB1qBsRA6UuWwWvDWEeCYylb4b+9+N91q6Q7odgQNRIBCoXSAhEG1tmsCDAGmEAFqakGDBg0aNAJAgwYNGry+l0Oprimg9NHKs3xVLWKoEUA7+PB7On/d1TFd7bBpjMWTuMLFP4nzQv2gzShVPHdmwCPPxl8dCqQieQstP/YZvNlcmiXbPHC1T/bqk/9rwThxHydCZfp02XYtiqK7wzC8tyTV5fNeKsrXMMYQhmHVwq3s1V72lddas2fPHhYWFpiYmOD48eP8/d//PadOnZKVlZVD4wT0lWix1oArtvErD601g8EAEWF2dnYhTVO+973vyde+9jUeeeQRbrzxRnbu3FkZNJbjTClVZWmMlwjUx1t9DNZvj6KIyclJbrzxRh8EAUmSVN0B0jRlNBohIiwuLsrq6uqWNpOlALXdPKnPke3G/biodKXfpSyRmJyc/NO8dIItHhf5b6d+iutm/Si11e26lIw/BoYOVmJ6jzx9htUVIDXYOIZQSH1G4gtDTW/BWYy2XDfteO/t+G4EiGM08IQGlJj8VbXCp2lF8vOVXVW2qtWbN2jQoEEjADRo0KDB6538p0C6Gbcu6llTm6CVB8kJgVa58/+Eh1//yHswIiitkXiN0A0hS1GqIPKtFjjNKAv4wRPP8/wK9zgNiH7Va/hfDRGgJDYl6VJKEYYh7Xb77na7/aUgCGbLzICrkf9rEQbKSHy9Tr98zzK1OwgCdu3axfXXX0+WZTz++OP8+Mc//uyxY8ekNDYsU8Lr36WJ8P/8jC1rLWmaLpaZGM8995x885vfPPR3f/d37Nixg9tvv50oiojjmFarRRRFlYBQH0d1YWfcmLIUpcoskk6nw/79+9mxY4cfN+Mrx/f6+jrHjx+XkydPkmUZ7XaeuF7vElE3kdxuXF/NCHBcuKh/3jAMmZub+3yr1bq5/pLlY34eulSYUHAeUguPP72+cerCOpgJsiz3OBFnEesIlM/VWJuBUsxMd/jUx95OFgOSd13Il1ONQ4F1+cJdmqbi8OQZVJUkUbu/QYMGDV5vaEwAGzRo0KDSQi2QVftDEY14jcfjfJqX5Hsw4jDAu2/Bv/NN1+Gzs4BF+wF4g3IeYwLQAlGb0arj3Lrj24+eJxHIUIio3ODqFxh15/46sclvA623J/8vZNh2rVkBZaS3JG31CKhzjk5ngp07dzI9Pc3y8jLPPvssx44dk9JtvswOKEnmS2lx2OBnKwCEYUiWZWxsbGCMYWpqiizLOH369B2rcWnhKwABAABJREFUq6ssLS35X/3VX+X222/n6aef5sKFC1W9PvjKd6JOxrfLBijvr7fXi6KI66+/Hu+9P3/+vJRtA0vzwlarxfr6OqPRSLz3ft++fVWLwtI/op4JM25IeTUx7UrzrJxrxhgmJiYYDAaHh8OhlFkvW9/z1QuDe8CLwfkUHcC5i0wePnbBH7z1DQTpMgwH6EDAWbSQl2VYjWDRyvJL77qZieBJ0BCPYBRDoDUei7cWHSisLVsTWmzB9j2Fx0ozfRo0aNDsehs0aNDgdYiaI5SgUGRbdqjeBygdAHmde5nA6l1CBPzOXTcxazZQLsPZFCQFNyByHvGKfP9pGNHl0SNLPH4GSUIhda+fGvHtWqzl5FyIomgL+S+Jdhl1Hyf+L4b8A1Vdfp38l3+HYciOHTtot9ssLS1x6NChzz3//PNSOqmXwkEZVc6yrIoaXylFu8GrIwKUGR0iwnA4rFz7h8MhTz31lPzn//yfOXz4MDfccAP79u0jjuNqfJREuxxv9cyUeolA+Zi650OapszMzLB//37m5ubuLwWnemZCGIZYazl27JgcOXKkNxgMMMZsaZO53Rx5oVaA9c9Yv63++YsyACYnJ/8o/9yuEjyy7NX2z1dk1pO4PBFq5OBHT51keQNU1IVRgnhBeyBLCMThReO8Q9kB1+8MuesDkVcZhDpfZ20V03J453L/VJ9nAGRkZIAttr3SKAANGjRoBIAGDRo0eD3rAFtrU321PPoqciQiaHKzKQPcuJt/d9edb0XHPYwqNvMqA5fkLv3W4ZQh8wEDJvneo4sMgQ0HKF2UCLy+iFpJpIwxJfm/N4qi++qR/3oac53wvxTCXUZCS0f3Mio7Pz/P/v37AThy5AgPP/ywLC0tfdEYU7n5l5HeMqJaNw90zm0hcA1+dmPmakdJ4Ov17fXbnHN0u93Zo0ePyn/8j/9RHnvsMaanp9m7d2+Vjl+KPPWI+3hWQJ1Qj3emEBEmJye5/vrr79qxY8e99e4Q9S4RWZZx5syZuSNHjnz54sWLVSZAOdbHyxGu5AEw7kdxpb/L2zqdDtPT0/+21Wr9/J1fDE4g85ApePxIxpPPnwXdBhOBza1ZSWMCo1HG5BF8F9NSQ377U7+MyfIOq0Yi0sLYMAwN3m6u6L5c3mVz27vp+NKgQYMGjQDQoEGDBq8X1r/1crvlUSy4BHTueK1cUDUK/Piv7vmDvTsNOltDe4v4wrobnz83A1GGWFocPrPOQ08P/9zp/HVFqfzxrwMCd9mvWhCiTqfziVar9QVjzMHt6q1/Wh4A5WsppZicnKyi/kmScPToUZ577jlZXV0lCAJarRbD4ZDRaEQYhhXZK8mfUmpLKUCDn4/x5ZwjSRK895Urf5IkTE1NsbKy0tNao7Xm7/7u7+Tb3/52lR4/NTVFFEVbXqse+b9aPX45Lsr3nZ2dZe/evV+am5s7mBvveYwxleFkKTicO3fusydOnPhor9cjjuMtQlI9gn95yYy/oqg2Ll7UP6cxhm63y8TExL8OAlPzMXh1t38ehReFNh0SB4mDk5eQb/3oGQYrCagIvMKIgTQBgQyPE1DGIeky7zwwz5v281iQ/xjF2ps7uJQEX5VrfOX638zbBg0aNGgEgAYNGjSorKHKJdGAONCFA7/3SLGDNMCuSWY/9CtvhnQZRYrYJN/UOgANSoEXnNeMfMRDh8+w2OMPReXRKbIMl6W/8FvR7Wqpi3Tt9xTkf3a8FWBJ2q9WInGt5LtM3S+jtHv27GFmZoZer8fDDz/8mSNHjoi1tjKF6/f7VdZASa5Kwl+mfZfkvySODV49BEFQnacyYj8cDonjGGMMa2trdLtdANbX19Fa8/TTT8u3v/3tsnMAnU6nem69S0U9s6C8rTAbrEh6mSlirSUIAubm5ti9e/dDExMTs/UU/XLslFkk6+vrDzz77LOSJAlpmlakvN728mrmf/X76s+pt8Csz78gCOh0On+clyPkn3m8E8Grsuo6j0PILAwyWEvgx09d5NSFDYgVuAARkxsAeodzYH2+Jrt0nbluyofe07qtqwBGiHKghSTJuMymo2n916BBgwaNANCgQYMG44uhoFEExS4xd6JGF73tEQIUswZuXmD5HW/bjbV9nE3R4hFj8KaD80Ge0wqkLmB1AA88+DRe5wkCksWExqFVXXh4bRP8euuyOjkpnfZLct/tdpmamvqjTqfzlSAIbvPeUvYyF/FVP/N6z/J67/Lxo3zvMjpfvlc9bV9EmJmZYe/evSilOHz4MD/5yU9keXn535dp42Uqdj29u04AS0JVf680TZtJ8zMaU1civpcTSLfFlLFe8lG+xmg0qs5tSbjPnDkjX/va1z67vLzM/Pw8O3bs2NIWcDQaVXX6QRBsifSXmSH1MVZmIARBwPz8PLt27VqOoqgy3auXE9S7BJTZJ/XvU+84URfHyueXYzUIgurx42aC5XsEQUCappXYMTMz81gYmi2fZbsuBK9UdosEATbN0EEbFUACPHucuR88cgTMDI4InwFBC4pMCWMM2BGtyBHJOnf/2q8QAQYHLs4ztqRs3br9CtuU/zdo0KDZ8zZo0KDB6xVS3xI6tvSpLu8LwDuHwhPhSDL4zY+/gVCtAhYVGLx32CQldQav2kUGgCaVNk8dXeL0Kvds2MJ4KgabZOBf+wSyHmkcj0IqpbbcZowhCIKbgyC4W2u9/2pk41pJSJli3e/3qwhrnWwB7Nmzh127drGyssJPfvITjh49KhsbGzjX0IBf+Om9zTiy1jIajej3+1/+h3/4hw8+9dRTTE1NsXfv3qo93+zsLP1+H+89cRzjva8yPkqTQWPMlo4B5ftFUcTMzAy7d+/2paDknCNN0y2tB9M0JUkSzp8/P3f69GlKc0ARqXwMSnJfilB1ke1aPCjq5oWFv8Vt3W53PgiC6vnjWQ7XKr78tMQeKbwQUgtOYD2m99TRZc6ve1ATiGpXRfwiHo8Fb8GnqGyNG6+f4Ffe0/EGiGqn2oRqk+j72lHc6hohoEGDBo0A0KBBgwavQ1Q7wDLSPHaHbN6cdwiIuW6Cf/aR978dna3iXQa6hYiQZBlIiEgETpFaRew6/Oixo5xf5aspEAZFXaqAMYrXegZAPZpZT/ev316S/1arNd9qtb4QBMEHr9RG78VGH+M4LtsIVlHY0uFfRNi3bx9RFHH+/HkOHz78L48ePS6DwaiIsjb//L0eBIDtxlaWZYxGI1ZWVr798MMPyw9/+EO899x0000YY1heXiaKIiYnJytCXu9OobWu/q6T2bIUYWpqij179jA7O/uF0oCyzBYoo/hlacDKykrv3LlzsrS0RL/f3xLt3y4bYrwzwQsJACXB11rT7XaZmZk53263A2s3WwbWs1xeSQEAl6fq5yUQuWdK38Gh5+CZMwOGLiq8AAz4orzBu3wBxeLjPrsmFb/+j95FBLQD8q4BgPVuc3X1Y4xfGvLfoEGDRgBo0KBBg9evAOBLAcCyNe28uC8Do6jc/3/r1/f/+VzHou0A5SwUxlRaa7QYvFXYzJMScmY55dHDp+lb8FojSuU5BopfWBO5em0y5FH6drs93263vxSG4ae3c/e/VuI/TuiiKCJNU7Is22L+FkURCwsLGGM4fvw4jz76qJw/f+F/UAqiKKjSxBv84gsAdUJbZoiUY1BrzXA45IknnpBvf/vbnDt3jvn5eebn57HWVmn/dXIcBPn4KUtAyrFbdobIsgylFO12m717997X7XbvrXcQKMdr2bbQGEMcx5w7d07OnDnz1cFgUEXkS5FhvFPBta4d474AURQxNTVFp9P5Sl24e9VaknqHs1m+vipF5nJy/vwF5EfPnGO174AA0OAUCo/zFi8CImgs2ajHL7/zDezfyf+kbb5OA2R2c3kXn5u4iqc0aml2vw0aNGgEgAYNGjR4/ZF/VVB6U0sKTRHS3AAQ8pzU3FcKBeyc5K7f/NQ7CLINWl4IlYHMY51HKYNxINaBCvHhFI88c45nTrEbyTfjoywXC7xAnL7228iNtyAbv71w1g86nc5Xoij6dFmrXCdO44Rtu2NcMCiRJEkV7e/3+yil2Lt3L7t27WI0GvHEE088vri4KHGcorXQbreLtO6kqqVu8Au8wdnGl2K8RCVJ8nT7EydOyj/8wz9MnDlzhvn5eaamphiNRlUdf0n8syyrSgDGx22Z6l+OrZmZGXbu3Pml6enphTLtv/xcZYp/6SmRJAmXLl26Z2lp6VBpRlk/tusQ8EJtEuuZOOX7tVotut3up9vtze4HV8rg+dmqMw6tBZ8mBFoRBRqbZUgIqxl859GjnL7QxzqTtwVUJo/+2wyvNF4UJgixozV2zzh+4+NT/xwLWoEubVyKtn+agACNxiGlt0tjCNigQYNGAGjQoEGD1yM0tWZRl8O2QDrYLH/EXXdx/769Qsc4VObBaLxNNyNoSYJygtIBa4nnxz85znKfJRMKKCGxCqcDnBLcL0AXwO2M8kqCEwQB7XZ7vtVqfSEMww/W3f3HycaVxIDtrtf/TtO03laQHTt2VC7/P/rRj+T06TPvyKOtujJEy7IM77mmFOoGr22Ml6OUkfRyDOZjMn9sGAZsbGz0v//978sjjzzC5OQk+/fvZ2ZmhjRNGY1GVdZIKQBs530xLozt2rWLPXv2PF9mDRhjCMOQJEm2tC8MwxDnHBcvXrxjaWnp0Gg02lJyMC5kvFihrvzeWmva7TZTU1N/WvfLeDVMAJXKhQClqVz7rFMMNTx6xMqTzx5nrV+0BFRBzte9xSuNdYAIoWTY5Dy//o9+mU7RvMVmQBBVy7rCoFAYxtoCNmjQoEEjADRo0KDB62z58yqvL72MOZRX2mBDFDA9CZ/61LsQllDeQSrgPDgLuniNJAbxjNKEZ4+e4ifPX+qNCkKstWBVCwkncErnm95fIKJVjzoWdflBp9P5ShiG95YkoxQHrtTm78WUAwBMT08zHA5RSvHGN76RbrfL448/zqFDh2RjY0AQmCpDIHeAzwpxYjMNvMEvLl6InMdxyuzszK15Gn5KGIZsbGzw+OOPyxNPPIFzjrm5OaampioCHYZh5bo/Pu7r5QUl6W61WszNzTE3N7fcbrer544795fPTZKElZWVO86fP79YGg5uR8xfrAhQn3NFKcDngyDYUgqzXQvBnyXy3wGwliy1GCDJPKlqcXEDfvDQUc6eX8alvlivC8FRh1ivIHWI8visx8IbZvjYRya9lOu3s1UGgEKhMWg2SwQaEaBBgwaNANCgQYMGr1eIu2xBlHLvqwRI6Ri4YQ/+l259A20Z4eIRSACZw3tBl23ofC4G9IaKxxeXOLnMXFIQEXEe7zQeg/MCWvCv8Q3odqRERAiCIGi1Wl9otVof1FpP1NuMXUkAeLEeAAD9fp89e/awb98+1tbWePzxx7917NgxsdbR6bQAqqh/XlctW9KhG7x+BIC6o34ZVTdGsbq6+kQemVdVRstoFPPkk0/K9773PUSEG2+8kcnJyS0R+foYGs9qKYl9afQXBAG7du2anZmZ+Yq1tvKsAKq2gkmSl6WUmQJLS0s3bWxsEMfxZYaD1zpf6kS+/vgyC6AUALbLtvlZCwDiAefQSmOtIwPCjiHxHmcCvIFHn+aLJy8k9EeCtQJO8np+ZUBpkPz3b4kl8gN+99ffTwuIAsBlRSdXV2sCoLYaAzZOgA0aNGgEgAYNGjR4XdEDIAMsSO4YLRg0BlVtDlfRQR/J4H/3u29Dr14kKomjMeADlIlwPmOQDqEVYJ3h/HCC+x86x8UUXKixFgKrCFG4JAVULgJUn+OlHj97gl8nOOOu5/U6amsdxhg6nU7Q7Xbv73Q6f3ylyGh52wtF/Ot90UvhoG7ktmfP9UxPz9LrrfL440/K6dNnPxSGLbrdCQaDUe4sLhql8uTf8rqIpqkAeB1scLbxACjHoHMOjwLRiDJ4FGmW36Z0LtKdPnNOvvq//NXcRn/IwTt+iVa7S5o52p0JrANr08LQ0+NcRprGOJehtWBMnmkyGg2wNmV2dpo9e+bvbrejgtDnpqPOZTiXAQ4Rj4iv5vfzzx+RjY01jMlb4JXvp7WQZckLttHcLkuhFBPa7TZ79uzxrVZroS5slB0P6h4HV19DX8ba5QScxqHAwLrN8C3wWUrm4PwGn/vmD0+z0he0apEOMoxqkSYJogOGaS64GgdhvMq73zTFB27DR+TLeuQgxGFJSHAkgBcDol/rDVgaNGjQoBEAGjRo0OClodhsS/mXJnedLja/kmEE3v4W/HvvuIGu8bC2gTIGazPwFucdUhCLxGuGvsUPf3KSY+f5TKrASh55AoX2DuXdZobBz/uvM9Z+bNyUb5NYgDGaKIqIoug+rfXBn8b7l+3W6tHUshZ7165dRFHE4cOHeeihh2RjY6PqCjAcDmm3283wbvCyBbAsy3p/8Rd/Ic888wzve9/72LFjR5WWH4Zh5fxfGF7ivSdNc1+QJEm21PB3u13m5+f95GSX0Si+bH6Vold5hGHAxYsX5dSpUyRJUmUNZFl2VYJ+rT4BYRgShuG9ZXvCUnC7UonOT3+ByddFj8n7sFRp+Q6PYS2Dw8c2eHaxh/dtAtPGpSnGCy7NkCAE0fg0xcfrdPQ6//U/fieMIJTNLH8tINpjAeuBzDcZAA0aNGgEgAYNGjR4nW7xa72iwGGxZDhcpQ3oFD75sV3csK8DRkgyQBcGVkU/au2zPGtAJlkZGH546HkurPDvxRflqFIIAYXQoPxro/x03Dl9vHXfZv1yZcT3p61W6/PGmImXSrjqh3OOVquFMYYkySOec3NzTE5OMhwOOXz48ANnzpyRep10SaIal/8GLxdJkrCxscHExMTsX/3VX8nf/u3fcssttzA3N0cYhpUYVRr4lYZ+ZbaLc64i/1mWEUUR1113HTt37vRKbWbXjM+vetr+6uo6586dk16vVwkP45k44/P1WgWAoiPAfVGUdwQo50y9W8fPdvnN0/Od5F4sqkoOyDMiHPDcUT/30GMnWVk3ELWwNkXEIF7hXQY2RtoGHTjSbIM777yVN+3lb9tUXVyxPsXbUVkxAIAJgmaAN2jQoBEAGjRo0OB1LAPkG2gyLCleHAK0PLxxN3/6iY+8k/76SfAJYdTCpiliBJTNhYAsRbwhVZM8dewSzx7jy5v00+FEYUXhJC87kFIEeA1EoLYzUNvsH55H6VutFu12+/eiKLrPGPOiXcS3ExfqrdqstWitmZycZGJign6/z+Li4oEzZ8581DnH5ORk5fJflgkkSdIM7AYvG5OTk6ysrPSstXzve9+T//Af/kMlQpWmfmUWwHibwbJcpZ4V0G63mZubY+fOnX9ad/cfH/dKqWLc5+0DL1y4IEtLS1VWQUnWt2uVuZ0YsN1hjKHb7TI5OfmVIAguE/x+1vBQ80ExiAsRrwCHVw5lDJdieg891uMnR5ZJbVHRn1m0z0shBoMN0B5CcPTRfp1/+jtv/6R2uUjrlMIXOq+IR0pxJmsEwgYNGjQCQIMGDRq8DlE40xdE3CrwOl8aFRAB93zqzZ+/5cZZSJbJshFEeQsvby3OpXlbqjRBe8NqHPK9R0+wtMFnXS3a78rXFgfikddQGcCWX2sL+fdorUrH/9+Loug+pdQWw79rJf/j10sCorVmOBzinGNmZoYgCDh9+jSLi4uysrLyTBRFOOfo9/tVv/by84Vh2AzvBi8L3W6X9fX1isyHYcgzzzwjX/nKVz7nvWfHjh1V3bzWeQlMfQyOt72sGwDu3r378/XHjxv91Q0EjTH0+32WlpaqTIAySr9dS83xeXU1tFotpqam7u52u3eV5ob1LIaf2VoirhBEHXhBOY24AG3Dam1MnSYFDh9j7kePnWK579FBCxsnqCwjDAOcT2C4DumIKHRgV/j0R97JTbv4fyN5kxcpygHKUiJo2oA2aNCgEQAaNGjQoFkMi05TZeGoBrrApz/6TmSwzEynhUtHIB4jCpfZPBplBKUCUB2ePzvgoacvMfSQ+jLV3+NF4QR8ZfD12ulAtZ0RYBmlbLVatFqt9xSR/9vKjfW1pg9fjfyXadOdTofp6Wmcc5w/f55Tp07JxsYApVRVBz1OoMrP2KDBy8HGxgZTU1OEYViVoIgIS0tLX3zwwQcXz549S6fTYc+ePWitGQwGAARBUJnpWWvLzhg5qS2yVCYnJ5mZmXms3W5fZlRYHmWkv7wexzEXL16UlZWVy8S4a037r6MsUSiyAO6PomhLRsLPfnEpRYB8O6q8QrxUG9Oh86Aiehm9J569yMnzQ5SZRCMo5ciGA9rtFhiN9xnKWqYCx/xExt2/vv8z3oG3DgsoA3iPsylGaaTZ/jZo0KARABo0aNDg9QZXI+PFUijFquhzG8CPvh+/sMeTra2Czw2+cFnlJJ9bgGvQEYOR8KMnTnDkLBKLwhJCkebvC1GhjHgp3GvGB2CcqJfEOwgCOp3OHxWR/4Xx+v2X8vrjzy3eA2stZ86c+bMzZ86ItZYoChAR+v1+1dKsjF6W4kRZL92gwctB3eRvNBqRpimtVovTp0/f9Nhjj33ywoULVbZKPfJfoi6alaQbwBjD/Pz8bVNTUyfCMNy2pWaZHVASdYDBYECv1zvQ6/Uq4Ws7IeBaxICyjCAMQ7rdLt1u9wvl93glIuR5RpQrewIivtiUFllTKEOqQ0bAc2fSx5969iKrfZ2vuZJh0yHaGDAhYiJ8nBKSwfAcv/bR29m7i7soXk8Vq7zGFV1BdLMFbtCgQSMANGjQoMHrDkWtf74ZLHelIN4RAJ+5+91E7hLtoIVft/nGUepRbkVmwWWaS+uWQ0+d5kIMMS1Sxly6C3dr5LWbelqvbTbGbHH8r2cG/DSih6Xh32Aw4MSJEweWlpb+JMvslmhpu92uzNeAiiTVCVODBi8VrVaL0Wi0xfCyHHNaa3q93tcff/xxefrppwmCgOuuuw6lFIPBoKr/L8drlmWVQFXeNjs7y+Tk5P4oigJjTFX7X8+6KW8r5wTAcDh8ZmlpSUryPy4AlM99QQJeEyfKDh5lVs3P3kTTVZe5EGBBMsT73AfAG8RohjZlCJxa5h0/ObLC+WVP6gCfEnU7ZGnKYDACFWIIwXlC1ee6XYr3vEvfP9Mps7s6VVcA733TAKBBgwaNANCgQYMGr0t4iMKIPD4UQt6am4kQbnsL/t3vuI7Ar0IqiExgpIVNHUYFKJ+3r1LBBCPb5rFnzvDEYvzRFIW0pmZTFF4ClK9F9STf7OaRrp9/gjpORkoC02q1Dk5OTj6klNpfHBN1QnGl7gEliSmPIAiw1lY1zWVdszGGqakpzp49y7lz5w6sra09kz/eVJ+lrL0uRYfx8oRXxMW8wS80siyrxlI5ZtM0rcSAIAhYXV3n+eefl2PHjjEajeh2u7Tb7Wps1lvqlZkCJcHOsozZ2Vmuv/76pNvt3jzuHVAn6vXsFmstw+GQU6dOfXIwGFzWdWDciPNKJoClgWGappXJ5uTk5BdKQ8D6fB2/fqUMgStlAtV/i+q1q6+YgSQgMUiCeIPyJu/KIhkSGfoOfvhoPzl6KiX1ISjBxwniBR1NkIwAQsg8KrBoevzv/+nHkSEYBXEiaCASyGzWDO4GDRo0AkCDBg0avB5hjCJOYjzQjrrgFG2V70X/q999JyFr4BNwHpzGuwB8gLhiE+sD4jRiaUPz6LPnudTngSGKQZb2fLXEqrzftXcI7jW19JbEo4wGBkFAFEWEYXhvGIYHy4391Z4/bmxWJxOrq6vfarfbdLvdKr16amqKVqvFxYsXuXDhgqyvrz9T709efp6mzV+DnweBoN2OyLKMZ599Vp5++mniOKbb7VZiQSkElKS87BYQBAHluG6320xMTDwUhuEWcv5CWFtb+/rq6uqfDYfDak6laYq1FmPMVUsB6mUJ5WPCMKTT6VRtAcfndv31XoxJ4LhZYX5btTrmXgCqLAdwuROr1+S5+5ZBmjH0cPoi0ePPLDF0LeJMI6JQyqB0iDYtwIBz4GOMGrKwS/hHd+JDBwpPpIXMgzFBs/1t0KBBIwA0aNCgwetzA5/3odZGMYz7GAImFLx5L/d//INvwfi4aBTgAI+4CKwBrxAnWG+IbZsjZxN++NSIvgOnNJnLECN4iv7WYy3/8rZUhTDwGhABSkJSOP7fF4bhvS+U6j9ubLbd605MTHwwTVPiOCaKIjqdDkmSsLS0tHHmzBnZ2OiTZbbyHahHFpsU/wY/DyjT8EejhJMnT8pTTz118ty5c1WLQGDbmvpyfmit6XQ6zMzMTExOTv7rsm3gtZTRJEnGysrKn1y6dOnPB4NBNdeuJpBtJ8qVtwVBwOTkJN1u9ytXml/jRP6lCAAikldD1dZFL2WnFAozQIWQofLlFmVgOYEfP36KpXVFQhdoIU6DDxEd5t4AzuHxGJWyq53ymd/4JdoCITGZ9SggzdK8NUCDBg0aNAJAgwYNGrz+EIaG1CZ4HAEZLoa7f33XXXOdIcrHeahKElA273vv8jpT74Us0awPFT9+6izPX0B8SJ5vKgn53l8AjXagvUOVlaf+tbP0lmQ7DENardbdJfnfjtBsd/1KZKAkHEmSkBv7RVhrOXXq1J0nT56aHA5jjNEYo6s07HqLsp91m7IGDa5lbiRJnk7e6bSw1nLy5Ok3PPfccweWlpbyTVYxTsuuAKUvQOlbUZa8TE5OMjs7+8eTk5OfKMtbXghRlM+f5eXlP7x06dKfxXFcvf52JpjjQlzdk6C8Xghxd7fb7S1z7qWae46n/tdfRztVmaSWR7mqCCDeoxC0ETAaBzxz3H70yecukTADvo3PBJcWAovO8gOHwaOSde689Qbec3vkDfnvqaLqx2gGcIMGDRoBoEGDBg1ed+Q/0CRJkpNKyWhhmY3gUx+6lTBdRtmc6DsV42SEuMKe2nnECd4FnL044tuPnuRSApkWvE/ADxGf4Ioov/agvKuiXU7AicL/nAehyg17EAS0Wq27Wq3WF4IgWICtJmFXIv/bOZvXj/X1dVqtFu12m7W1NU6cOCG9Xu9BkVyYKclT6RNQtkRzzjUu/w1edTjnCIKccMdxXBDogOFw+MxTTz0lFy5cIEkSSoO/eh1/mf5flrQEQcDMzAxzc3Nfa7VaOOcvq6cfnz+l0WAcp/R6vT9ZXl7+6ziOK6POq5H/8vPXr5eiQ6vVovD42PK47er4X3CTWRPrtmQeeFXV+kO+rFrJ10bEocgQ6/GpQ8QwTC0EmgvrPPCdQ8dZ3ujgZRIhQjmP8ylWj3BBBkoQ61FJzGSQ8M9+971EQNiCQQxK660pWQ0aNGjQCAANGjRo8PpAlhUk1qiclAMf++CEv+m6aVS2Ad7i8FhJcMQIPvcD8OCdwmaGI8+f59mTyFBB5gS8BQGlXZ7mj0E7CGzREpA8/f+1sP0sSUYURQuFQ/hCmfo/7kw+fr1OGMYfU5KCiYmJ0gvg8aWlJdnY6KOUqnqml+nV5fPqBmevRJuyBg2uLgBspupb67HWVfMiSRKOHz8uly5dIk3T2uNsFfUvyXR5W6vVYnp6mqmpqRNRFL7g+5fmmUGgSdOUXq/3W8vLy4/HcUxp5He1EpzxrgFlpwJjDBMTEwejKKqEhGstSxif/6UYsV0WgHI6d/ynngFgAI94T6g04jRiA7JU4ZUwAh7+yWry/PERWdYCFRKYAC2W1MSkQVL8OB6sYOyA996+i1sW8NYV72HtT6VTSYMGDRo0AkCDBg0avMbgPTlZD9s4D+0Afus37iRIh+jUFRtTh1UZmUrwxOCzwhdA0Vve4NDDT7OWQKJbZOIRDUpAVEFQvaB80YqK6iaKvoA/1yhN/4rI/1114v1CKcHbkf96C8EgCNBas7y8/C/Pnj37juFwRBBsGqWVpKguGNQJReMB0ODVhshmJkyesSIMhzFpmtLtdun3h5w/f17Onj3LxsbGFiJejt/tRICpqan9MzMz//qFBQi3JasgjmN6vd47VlZWiOP4Cmuev6zDQJ2Ul9fDMGRycvL+0hDwxUT96yjne17Gs5kFoNEIBuXq89jgMSAZigyNEEqEdwbEkEkGBk6dJ/rhQ0fprSaQOlAKrSyxGpKaJA/uZwJOo8TSUuf4r35vHzZ/i2LpbTIAGjRo0AgADRo0aPDa24ADsuklTdXoWco/DUJQXKraXUX02ggIuOGQyMN7b8MfPLCTwfpFCEOc91gE8SHa6TwDAAconI84vjTkR4fd1zID3ju8k9KHCpuV/a3L54DyUkS8JDe9EoUXheDQ5eE3OwX46n4Qii4C4opo2c9++S57g4dheHdpTpZlWe+FHPjrTv/jYkBu6BcSBAHHjp2QlZWV/yEnHVTmZXXX9HrktHRV3yRQjno/8Rd32eAXAz/981lmh49fjqNqt1d6WhhDFOXZK/1+n1YrZG1tg5MnT0qv16vG7XgrvrK1n7W54WWn02FycvKPX+hzGmOqdoKlMDYajVhbW9u9urp6DQLG9rX55TztdDp3BUFwsBT+Lhf/yjUqX5eMA+MU2hdrlvIo7QmUR4mvVrE8z19hUTgM4lTeAMDm5VIOhRXFKPNkKLx1hMZgiwYBqzE89NQJllYto1RAFODwNssztAjyI9DgNmhJj4+972ZumOcLYgEyvMu2jJ0t/3TIpiBRHU3CQIMGDRoBoEGDBg1effKviv+kXMpU7RBQBCjaaFpogtpdCghwPg/Xt3zGFPAnv38nE9lZoiDFZgneKGyqkA1DILPY1ENg8IllLdb8l0eOcyrhU6MMwsiDdTgXQNAiI8Bj8YywYrHkrQTzw2O94L3GImgB4yACptoB3U4H6xTOBzgMyju0B124Zpcb5JfrIVCvQQaqSKSI0Gq1mJiYuD8Mw3vLuvsiPX+2JDEAHosojwnUFrO+nCRobOGjoHVAEER0OhOkqeWZZ56Tjf6Q1DpQGtGmuvSiyJzHi8IhuQiiDcoEoDTWb0ZeS2FEif+ZHeV7jB8/HfL6co5fBPL+Mg5vwZeXdpvzs3mI+NpRClL53+PnW49dqiu8rrd5Lbvy5CJAZvP0ckArhbOWTjtCgJMnTsjRY89/MU6GhJEhs0lF+MtsmNJwL4oiZmdnmZ6e/r0wDKv6/LIMpiTuzpG3wVOGnJsrtA4YDuOlM2fOyXAYk2UOEY2IzoXJYj6C2jaqXzf963a7TExMPNRqtSoRbvPxCo/J16Ji+Y0ctK1gMo2yUpDsETOd8EsTQe7SLzoCWxgoiiIVhbaadgbtLCNwGY6AWLVJTYdEBFEZyg3QLj/dLoKHj6TyrUcOQ2cXPhNwihnp0I4DXBZCu0MyvAgzQjq8xP5pw//p3vfdN+sg0oByNaFYbf7TIWUGF4WQ0CouVfXvitDoAQ0aNGgEgAYNGjR4lZcw2XqTbP4hmGJ7V39UQZ4k3+0FwLsX8Dfvnyawa0RhTobT1KIJCHwLRh4t4JIECac5cmqVh4/0WBrmAS2xabE7DPMbUo9gQTKcbJK1zVKAPHW1aAgIDgKBKDTvcWlWRf9Lll/XNvKbXn4bwZLU16OSJSEJw/CgUmpBRGbLx28lDK6sxe+labqYpumWdGSlFGmaVu7+1lq63UnW1/scP35cqhL+a/gOUrRi3HpJjYS/lMtrJ9BNvfDPK3x1KS9g6nYt6ev1Up3yUpwfm7ebr1fLPbrseZB7jDjnqpKV9fX1z50+fXpxdXW1zK4hSRJK9/4gCKqIfhAEzM/P/2Wr1fpE6cVRzqk0zS4bk+P1/N57lpaWPluaApYR/CAIKn+AF/qNSgPQMAwXSuGhXipQyrDlwloKJeVv4jxkmUdj2T0zEbd8hkpGiPIkzuGUq8QD5cB4h/KuMAIU0Log3FmVSOU8xF4x8vD4s+c5c3GEN2HeVSFTaAlx1uPimLAbwdoyE7Mz9JfP8IGDb+C9t+KNpTRj2XYb7H0uNDTb5QYNGjQCQIMGDRr8nG39i9heZbZX3VjuTUnwJDhSIM3vFmqp+R7tHS3g4x+5hbkdk6Q+j4g7ayGRPJ1VO8j6gMVaz3oa8v1HFnlmEbEu36f6olm1klqYqCSakm92vWQ4leHF4sUjWsDaXAsQaLXAGHPXlhZg4outdZ22/nSW7noKcr01X7vdvqvdbn+pFAC2cyCHyuF7Vim1UL5OWatf70k+NTVFp9PhzJlTiydPHpckSfKIZhlV9WVPcLflUIVd4nhkt4zUjn+mF3tc+1hTILr4NJtHg1cbRSxWVGWsWT+23/K8uPN2JfFn6+3567oyu51NfdFamy9HSjEaJpw7u3TT+XMXTvY3htVrjI/LUkSbnZ1lZmbma+12G6DKzlFKrjifS6LvnGNlZeXLa2trh0ajUVF6Yyrh71pErVpbwK+EYXjZd1euEDyKVn6pQEaGxWHFkElAHAOpffy6yXa4y0DL59kYTgsoC5LiJcOrojuKciA2P7DV+lkS88yBdYrUweM/sV996sgSmVJk2PxDiMEEHoXN52ymIM1LiuZ2aH73H/8yoYeoIv8aj9tcX7cMngxIi8urDqwGDRo0aASABg0aNHhlRACHx1OF/Wu7/zwgaIEYT5pv8gqn6Zw3ZOAtJoU37+GxD77nTaTpBighTZM8d0AM3toiXdSCSwjCCZ4/N+K7j62wnoExoMTgbB6R95lFPIRBuWGutdoScOKwKt/Uap+ilcdamOwKk5PTD8Vx/EXv/SYJfgU2nPW2Yq1Wa7Yw/TtYb+FVf1xOAnSVwmyMqVKTS4KRZRlhGFaRy7W1NU6dOnXTcDgkDMNrIuCl90E9+q8QlN9ai/xSjxdNN5tMgJ8v+n+F8/hSz++LfR//AuPLGLOlrEbrfM4sLy+/4cSJE3++srJSGe5lWUYZrQ+CoKq3n5mZYceOHT6P/m+WDFzJh6Oco2Uqf6/Xu2N5eblXRv+zLCNJkm3bc273WmEYMjExcbDVah2sZxKUhVeq1to005Cp/HAieNXGWkiGo/85tAlv2dXxbQoX/kjla7BKceKxClyV8JTVDlutol5yUaUUe05f4p4fPnqMpV4CYSf3F8jiPJVKO8gcYlpksaXdaTHYOM17373ArW/ER4CuMsEYK6cqBGUsSJxfesAbct8Dfu5buDZo0KBBIwA0aNDgFxRu63LmCzMpXy5uDkhxZNg6+S+glScCfufj+257454Al/VBeYwCI0KoAnzi8o2osfkuN+hy6LkL/OQ0+zPAq4A49Tibb4l9kuLTrKodLzeXVZur6jNkKJ/SFtDA7Oysb7fbBzfWk3QzxXZc8Nj8nj+NSNRmLbGron0l+b8Wwmut3fBOwCucpXLvByqiYozhxIkTdxw7dkzCMKTVajEc9tFaxs6jqxlxFZH+QgBRHrTkR54R4CviMR6VfzHH5TXhYwKByGU/80+bXDZ4OQIg256f8XO1ec7G/QC2P++Krcd2Zpb5+HC42rHNBEOK7Jq6uWWaply6dOkPT58+/WcrKytYaysRrf7ZnXO0Wi1mZmaYnp7+I2PUFqPMK4lo9XKeOI5ZWVmZW11dJUmSKkOnFAiu1iLQWovWmna7Tbfbvb/eWlBEEO9zfxKXr7aZgkSDVQ6LASLwETbxxGs9btm7k30B71EevI2LSH+GU2CFXAQQioi/BZ9tCoDV+q0RMTgJGQE/emyFnzx/Ecw0XmmSeACS5r4QQRuXgOlMEo/WaAcxXbPG7//mHbTI19262piPJ4MnyG+Q8dKhYPxZDRo0aNAIAA0aNGjwikLqmzOFFJszVWMGZeRoi3NTcWlSuGGOez/14dvQbpnIWLIkxhiFzTLwGmU9+BS0xvuQ00sjHnzqFMsJpzIF1msyJ+jAEBX967UI3mZVpBqosg/qIoSyjsDDZAST3TZpaim6DxbmY76qc9+sdlY/NQOqetuvKIpot9t3h2F47zi52I5UAWitJ1SN4JRZBGEYEkURcRxz9uzZj/Z6vUPlc5Ik4YXFBbUtqRNfc2S/CoG7pkP5a8oQuFqUucHLJPA/pRKNFzpPVzuv13IoivaThRigrvF5dY+NutlmmVlz8eLFPzl9+vTuS5cuAVA3/Cvb55WtAefn5//t3NzcHznnq0yAF/r+pXFgkiRcuHBBlpeXq4yD7TIIrtQiUGtNp9OZ7XQ6d20agLrK/V8Kkc4KpDq/zD+AR8RggfX15LNznZAD+9s/aAEkljy9fnNttFtKKBy4FMVmFpRI7jDgRbBicCIsnkZ+/NhZehsGFbYQXTzXO/ABqfXgUpxLCHVK5Df42Ptu4eZ5ns4LImy+HnvIo/4ayc/0FdYlteXfkAYNGjRoBIAGDRo0eCXJv5Cn5xet+cCgMNXezI2natZKBLTP/Z1//cO7vnTjni6B24A0xuBJszh/zSzDBEH+8pkwtF2++/BxHnqm/+WBglQEREOR3uu9QylPGAi4zbrR0pbAVV4FOYkPLWgL1++e8SJCr9fLva4K4iDjGQ61Jfunsf8sN/vGGDqdTln3v8VMbDsiVaKe9l9GN0vSEscxy8sXD1y6dOkBrTUTExMkSYJzrioB2Eylzb9bmdpbfl+vNL6sd/ZSxP5z48aKnL1Ud/9im68lrwKuH1WEuK4Z1VOmmxTgn6MtjEJEb7udqWrVC9JeP6QU2WTzvNe7AJSHqOKQrYcSX2Wn1M0Dt3w62aSROWFXlQN/7tzvWF9fXzp//vyBpaUlBoPBJtF1rpqDWmsmJyeZnZ39txMTXa6mPY0b9ZVp+xsbG/R6vbmNjQ1eqI1nfX5bmxsZRlHExMTE/e12GxEhc7bIenBVd5JS3PSi8ui5SzHakzpYHvDlS71V3vqWm7hplv9+whVLd+khUBxuU99DiyB1EdUXuUHOkVlHqlpsOPjBoUs8eXiVYWrQrRCyNH+BJCUIIpJRn1aoSYdD2sqye2LEb39i/4GWAm3yzKN84dGAKcrKfC44sp157E9xEW7QoEGDRgBo0KBBg5cgAlTWeIotKZq+9hivagcYDztC+LWPvAvl1jFtTTbYIIgikiRGhxrnMwhb+XOSgH42ww+ePM3iOT47BJyoYufvyLKEJO7jXUaghczmooSTgrj7rYf2Lk8o9TC/Ywc2zVhZzwhMvsE1SiofAJfHwQoBQVWE4+XuP0uCHwRBmfo/W96+XYrxeISxdCwvCUUZHRwMBieXl5d3Ly+vPBNFeb3y+vr6Fudz59zWiP4V/1na5p+pgn3nEdmXdqmF6s2FrR/kcjLnmrn2WlwetghWrtb6b/NSS9H3vrjU1fM2/87jwR4lpWCUi0dbu0lc7tdRpsy7wisjDEOUUlUdfqvVKrsDPHP69GlZXl6uSmfSNL2s9V+r1WJ2dna92+2MteTbXqALioykUkyI47jX6/W+2O/3K0PA8bVgXAAoMxfKUoAoiu6uSggk91XRjqoMoFzrtHeowuOk72AVOLq0zPXX7+ONO6N/OW+glQFOobzGYXCE4EPwJnd18a5a4zxgKb0NLNY7Rs6TacUTzyKPPrXMxTXIJCLLMpD8cUopwqITSagEkgGBu8iv3fUO2gZClcf9ZWy++8J7AF/n+kVpQoMGDRo0AkCDBg0avNoCQOEWjeR1+IVrvuh8A9fqTIMPwAeI12V1Kr95V+RvmA9QkkGaEbQC0pVLdGdmGKYxibegFRBCZ55Hn13lW4eSP6Bd1KsqT2ITtMnLBIz2hBrieIjRuSs4XpFZQekIY1rg8s9ovGA8XD/Hn+6Ym+HU6XN5PK2IpDvntl+yvboCcd6eAJXp+eXr1V36lVJlfe+XjDEHNw3+ZMtj6xHF0gQsJxhR1WPcmBBQDIcxq6urb1hdXV0KgpxAGKPysgqbYm2K1jkBM8bgrcPbQgzAodUm8ai245JnA6BNdSjROG8Rb1FC7tugFUaBVlL0cOeKl3U3AF2UW5T9v0UV9yu29Imvor8UJo28vOPlw73M45Uh4C+1XOKFSwE26/mVAq0URmuMFowW8HbTSwJfXWrylp5Vx4liDGjK0pt8LBql8vPu8/tNKQCoXDAoL1U1Id2WTBKbxGidl9dopXA2xbvcH8RoIU3T6jsOh0OWlpZkaWmJ0WhEFEWVAFB2BZiammLPnj0Ts7OzJ+q/T32Oj7cC3OwckAsP6+vrn9vY2FjMsuyy+TzelaAsRSizCFqtFrt27frK9PT0XR5PJg5bpNsr68HlNf8igvKWwA/BDnERjAw8s2Tl2LlL/PaHP8gOx3smPIQOfCZgNSbo4AnwubkK4tVWUUUkT7hSIEbhjCKVgNjBX3998VtPPLuC0zsR08a5FNEZ3qe4zCMYvIVIWbRf5bo5z92/scNLCsZBKLmk02pFuTmhuCobKReWcz+Z3DyWphtAgwYNGgGgQYMGDV5dIaAkVGVHgHxpC0IDAqONEWDQGDSWjoaugg/feTM7JjKytI+1GSghCCKw+UbaRAFYBz7i0iXLdx87wfk+fzEsu/Qpl28Ia62qylBSSf5FG0QZrPX4zOaGdjbfMBvgLTft+/zG6hqpy2WMDMlbXVlbxf2hSDuv6k/L93MvSKDKCGJZM1yShDKiGIbhXVrrg+Xjx59fJxVlXbIxpjIYU0oRRREA6+vrDywvL8toNKqyAbYjcWUddRbHhEYx0WkRGoW4nKxpPEaojkBt1mDXa7G15NE7RZZHHMkw+OpvLRaD3/aynuZdigBa7CYprEWHy4ixugZvgAav4LTf9vffnBNlpoeozSh/KfQoPEZJLhyVgk89vV/l2l95qQuib1QhIhX35YegRaGV5OJRMW7CMER5yOIRcRznHUJEMKK2jKMywt/v9zl37pxcvHiROI5pt9tVOU1ZFhQEARMTE/t37tz5R3UfgHrHjnK+jRv9OedI05TBYHDP6urqlnm5nRCwnZhjjKHVan0haoVVYpNSkpdheFMc+Rxs6TyNPvEwEFjxsHj2Antmp/jIu2Z/EABd7whwhCYiHaQEpg1eMCrYslV1ovLSAjabojrxrCcJqYKlFT70wLef5dQ58GYSFUaVySBoxAeFaJoCQ0JWuetX3sr8JEEAiLe0g4DRaB3EoqNaRkMhAVxektWgQYMGjQDQoEGDBq8stjT9ttVNpRQQxxk6yCPTWgyajBCHZHDX+5R/7+1vJFIxzsabm2EtkFqMbiFGk6LI9CyHT27wrYdOJGtFM4Atq+dYTWhJ/q0HRKNU0TLPOyLlUXZE4GFHl7ve9MYbOX/+LGmWfwPrdUH2a5HausO4uIqkvuDPU+spXt/klxv5drt9XxRF92mtD5YR/u0Ie/3v8QwCESHLMgaDwaHV1dWPbmxskKYWrYNtCcRmRBM6IbS0xydDsjgBl7fmCkQIRNis+s+jt4JDnC0i6J6oiPiXDgJawCgpugVsdg54wUNtZgRUBK/6uxQCKHwBXJURsN33anD5GHyxhn7XLACMZVTosT4PWkktyyM/r+X5LYl/fQyUl0ZVl4HRQqCl+FuqMWYUBMV9m69VyygRSJMYwdOKQjpRmGcl2AzvMrAZqmbCmUfoHWtrG1UmQBzHlfBmrSVNU7TWTE1NsWvXrn/bbrcroW18/G03HkUEay39fv9Qr9eTUlioZwqVr1UXAsrzV7b87HQ6B6enp/+0njcvkhdGVJFxyQuWSoM9p0NWgaeOn/y32js++r5f5vqAT4Te08YhNgOE/K0UIqpaYl1d/CzWREWGMQonHhcY1hL41vftHz93LMOrHXgf4CVDsIgz4MM8rV/y9oKKmNsPzPOpD3WSCAgBsqT8xwSbuqozQF6I0GyXGzRo0AgADRo0aPBzhk3C7MuNp4AJg3yp8xmGlC4wY+D3f+eDTIUJWb+H0WCMApvkZnNWCHREllkSFbLhOvzo8FmePUPkVd7/u1IZoDKL2kxXzXtFOy9YX2ykvUWLJRCLBloCt91y/f1GeS5c2JDEghiTP14ZlFbVd/BsNZ4rMwPkRfCqevuuIAhot9sLURTdFwTBXaXxX52s1csA6k7/9VTjdrtNmqZlr/E7yoyAevR/OxFAKYUWuG5+xwllHS6DjobZjiApJKOUdiQEWAwW7TOMOEwhDOSXEBgh1BCo8vAEKi/DyG/3L3hoVaR2K9lSGlDPDlAF/SiFgO1EjfptDS4XjsbH4UsVBa7kuL8l0l8UAoErzqMUl5tCkSqyTPLz7vJaf8nFJ618Ps40B0Kl9mnlCZTCqFxU0MpvtqVUWy915S3gCXTx2cjHVxAEhEGwRUADKg+NMDRoLQwGA86cOSOnT58+GccxUZSn1cdxnNeyhyGdTqdsHVq9xrgnQDl3x38ray2j0YjV1dUvlyJDPZvgaudNKUWr1WJycvLzqvBKyM35iu4k3uVp9wJxVlRQYUCHpEpxatn+iyefPcKNN+znA+/e/7WQvBzL2wGtVkg2GhG0WnlGVqXzFutpsfJVgk+xAKZF+8GzK/ybRw6vsrwWkviJ4nukm58fCoM/hfiMrqxz9yfvpFsIAM4nhCbY3BkLl6m8m2uua8oAGjRo0AgADRo0aPDKMwzGsuAzHGVKfr5ni0eDnAiQ0SLf6H/k/fjbbp4hG/Ww8YBAWVBZLgBojbgAMkNqhUwinl0a8fePHKUPeB2ivIEExNec+ettB0vKqDXW56mqeRwpQzlLCMzP8M/e/a63c/rkCTZGxdcwAXiPxV/W5usyIjSeGXAFslRP4y/Jf6vVOthut7+ktZ6tR/7HSex2GQT1soI4Tun3h3+wvr5+aDQaAXlHgTIrYDySiLjKVV2JY89Md/8tN8753V3ytt+xZ+cU3dk2uIEjEggFIgUt5WlpR9t4IiPdlpFuIMwGAuVh8ATCbKhkNtJC/b7tDqPq0d0iFVwY8whwlRAg3hV/5/eXRnJ1Yjp+vcHVBYEXS/7HhYA8Gl+Sftki3uiifr86l1JkBRSXWtym0CM+HwdCYIQgUDJvhH3FMa8Vs1oxaxSz+eNdIQbIZgZJ3R/CO9pR2NXiSeIRNo1z4S8IaAUBpvC5GG8ZGEURSilGo4QLFy68YWlpaWN9fb0yESyFOK01O3fuZGpqajkIgi1tBrcbe/Uofvl+vV7vsxsbG19N07Sa59uJgNuJAO2oRdtEGG9IvSItovJC3trEK0gAMSG4IjNAOWLgOw89ziC1fOyDv8QNXf6nojcK+ASwGAOZTXCFyaCvGaBWgquHLB2iDSQuIxFIBL794PMcfn4dpXfiCQCLlxFIkkunPizfjY6KuWX/JB9+Dz4A2oDL8kykyhlQOTweh0JRisnNXG7QoEEjADRo0KDBq0P+L3NoLm6UXACQFnk9qjiEFAUEwD2/eZCIHpFyRIEBn2DtgFS73GROWrgRtIIWG7Hlh08e5/Hnq2r/PNVVDMoZlFd5imlZEFtsVPMOASb/PMojqiC5GUy34J1vf8Of79k1y9HnT+ZNDHUeSUMUzuUu1+Mo225dq4FcXQCokf/ZMvK/HSmrb/qdc7062apHFJ1zXLx4cWJjY+MvnHOVz8CVjMXGSbHycOb4id27Jjt84Jfe7t93+14/P8Xvra/Rj4ewc5r3hIUAkB+OQHwQiJ8PlF8IxO8z2EAruqGmW5C3rhIXBEpuDQP1iUDJPqOZ3/ZSyXxo1HuM0jdrLfNGSVAKArkoIOgiU6GM6Najy2Vkt0n/f2XI/zjxz036ZPOclPX4erM2P4/M5wRdK0GpvP7eSJ62r1R1utFagkDLgjZyW2DUBwOjPmi03KYV+42W24xiwSgWtDCvhXmjCLT4WVV2llDlpaq8A/r9Ud8oYXp66vcmuxOfUAhJkmCtxRiNc1mVMWOtJY7z+/Ja//y2c+fOTZ44ceKfD4dDwjCsIvhKKbrdLtPT07OTk5N3lx0Hxk0Ay+t1L48ScRyzsbFxz8bGBkmSXJadMS4M1kUGrQMmO5P/fWgirGicB3yGIgGBTIEVsBIiVtBJlq+MBp46SXj4xEnesrCbO9819c9bQFtDGm8ggSdLhnhvx5Z7hUdQhTGg9uCsxwSCFRg5iAUeOzyUHz98nOGog/etYqMbg4yKYqIg7zYABG5A6Fb5g3/ySQx5FlHek1Dl6VbVlC7XW4Mq+j80aNCgwWsZpvkJGjRo8NpESbghr+msbdbK1Pk8+xNtIEjzSs73vwv/9rfOo90ZxAdgIshWQBKcCUm9I3AByoJzmrPnLvHAD5/g0ghMC7IkQZkuRgx4W30G5YqIvFd4yauRUQKZQymN0kCWywP7rsd/5Fffy8qF85w7l2eV6sDgrAUdgPOXbYAv+/Y+32BfK7TWtFqtst3f3eOkbJzEFpH+2ZI8wGb0MEkSBoPBPf1+v58/rjQZdBXRyB97uahQCQIe5qbCw888eSrsdE798Z133vaFX/nlg3/56ONP/uUjjy7uJqPXMdzqIXFCikjXK2bzJF4XivKBoBDxoUYvWOyiOMErT6iDu1WgDqaj9MtOXE95NXv5JYlXMqE9G977nsUvOecWxcuG9yrF+54vai6kqE2WwqjRe49C8E6Kso8yi2Lzev4bXvl8uNcJi/iZ1f+XolTp6F8YxImoTUuOosG7RvLMk9wbYlZEZvNqEjVb9AvJ54ioBaXUglbqQDH2e1YkcM4vish8Pu98z3t61quew/eMyIL39JzzPaVyea78yt2OodPp/LsobP9BkiRfS0bx17M0QykIaoJZObecc5XzfllGkyQpvV7vf9ZaH7TW/kG73a7mIUC322Vubu4rWZbNra+v9+otPLfzBqiTe601w+Gw1FD9xMRE9Znqn228O0AuiClmJ2b+pUt4YjDqf9X5DE2GiKsa5XnTIklM3uDPWWzupMcapA8+/iR3vON67nr/bRxa/K5/4kx+urSxZEmal2RRb6Va1uH76lqgwVqfr5mkpAJD4HsPPsN73nYd77m1A3oZVB/EYG0biPDi0d5COqAthnfeejMfuiP0f/NQkjsPKANutPmWzpXvSG4ImOZys9BkAzRo0KARABo0aNDglYVs83e5caz2j2RJnnY/IfCZ330fLdujrRPi4ZCo087r87XGoUiSjMCDBF1WR3D0zICHn0JiA6GBJIbQ+lr6v8OLx0kV+8d7nUeoxOct7kSBpmhDBW/Z1eYD77yZL/35oyyTV6kqbSCxRSgMxAtujDyVHgNerq2JW0kESgEgDMN7gyAo+3j3tNazVyIJ9Rrl+t/ee0aj0edWV1e/qrUhy7Ki/thu8Quop8dD0SrN56xYJI+uDUbJ57ozfGnpAn94//2Pf/HXfyPyd//Wx3jvwWfO/+iH3+HE0ewwnsR7+hbfywQS0X0nrueU2xArqVb6ZlFqv3MsOpUdFpHZMOTuINDhyKV3F+epmydpk4ICcYlDYT3nrZee976n8T3nZd7iFj2kWjTWu8WC6OF9Xhsg3lcpwZacVPriNraJDZaGkKU4hDiUz8fNLwZ/cLU5p65K/sUXpMl5vBTmc/LCLS2lYPP5ZVVtXpgy1rIwvKuqYhSlG78qxqKaFfGBCLOi3ISIzBphgfzVAoUPtbhZreWgUnKrErM/sfYH5Qd33i8JLkHY7b1NlYfUSx884oseo5CWwp0XuOWWA/5Sb5ULF5c/udYfft0DrZbGIaTOEoYtRoURXxAEKKVI07Ty2cg7deQ97JeWlv4wTdOv7t+//2uTk5PF49KyKwDr6+tf6vf795Tt/caFku0yAtrtNoPBgI2NDVqt1mfb7faX6qVH9RKF+lpSvm6nM8H6xuj/gB5+FZvP+XqJPGiyLKWNwiiHVzBKoR3AY0fOsrHW4/YD+7nljSFPnk6YasNqmiIejJG8HWBxLq0AkubrrVc4HEpglIAKU7wSLBodOn70rJO/f+hZf/tt76BDkPt35N0K8V7hsWRiCY0iEk9/9Rh/8E/u4oGHvkZCRuKynOvXPF3yr1SkcTVo0KBBIwA0aNCgwauFkoCD86AoU/GLnaMGMoVG0ybjIx/Cv+f2HbST55G4T9SexMcDJIry3d4IOjoCBRuxZy3bwV/+p2+wmoFvQd+C6YLfsChMHu1SFltEv0Of5ZtXX9aJOlwASTJCFQkLIfCv/pt76PSXeOzIGYYhDBIIbF5TbIcbBIHGWanaXuWmVdWuOt+ICiAatqnfr7f90lpXdf9BENytlJqtfr2iN7hzrmeMmS1T+0vBQClFkiRV/XGWZaysrNyxsbFxyDkHLi+rEF33DMhJMeJwhWhQT5uX3DUM5yAOdXd1zf5h2CUQ2P83f/NjkfSk/9/+k/fy8YN3cuzwMwce+9ESzx+B9RGsJpZRpLEdIXYuUakGTyhaIDQHnQPrs5NGp2E71EyH7TuH/RFhEDEcjvACJgoYDPp/HbXan86cxjqw3p333veskr7z/nzq7A+s84sOtZA5Fq2Tk1bREy+pK34jcY5AFyUWFkRJEZuEzBfu7hikEA+8B6Sssc4dHUX5bdOJx93Xr0i9r1K+MU7YtnvMyw3O57HevM4e8ePNMBivilCFIKIUOFF5fbe4Kh2iJPYKnT+/ULxU4aOhEbwIRuWk3nuPMoJRZl4hs5K5UyIuCUTdphTzeNdTSi0oxW6UD1E+cOL7SrFblO8GKrgrjUf/pmX0p1uBvgsbHw4CfcDogI1B0sP6Ra9IlPb7jeKgEpnAu55PeTxzLDrre4GRD3ZVeO+lc/Edu2b47/EkU1N8/l3v/mV+9NgzDFYHnx+Nkq+rAAggyyxZqvFOgbUYrfFK4Z0jsxYhLyPIfwBNkmSF50bA+nr/60ePHp/btWvX8vz8PEmSlHObqampu+M4PjgYDA6VhoDj4l5dBCjFhjAMcc6xtrb2ZaXUws6dO+8LgoDSfPBKpo2O/JxHnejO6bT1nsHAPZilGd6D1uRpVz4FJaSAdRmuuG/FwbNnkSNPP+33Th/g7k+8j8ee/fvHfrLEOzQwOTndXVtf64fF+HCF34mTDCfgnEH5kCS1GJUSuHysDLIWy7FlZmrIVx8885fv++DsZ3717bN5bUC/j5ntMFjZoDXVYWRzkWbUX2GqBe960x7+649f7/+f/+WMjKQQHAoxSasA6wCyYpxLLvg10f8GDRq8RqGbn6BBgwavTRR5/oXBni6WtM0OAC5nIJmnjWVnBJ/9/bf+q5v3eboM0Vned88DmcvyNoFeSBOH121iNcsDPzrF/+8HZ756fp2vJibfEDoNKg0I0QgWpyxWA5K3qsujTVLUu2riNCFsK7LE09Hw2x/a43//Vw/y5ONP8//65uFPnxrIM14EbQKczdBKMFqTpilKadieIm65fbwOvb7hL/p2z4ZheK8x5v15+rMgIu1N0i7tshd5+fxSHAiCAGMMSZKwtrZ2R7/fP1Qalm22/NqkBXl03235bMpv1s8Lkvfx9jA1E33eizu7vuaPGBUFrdDeefHMxg0SH77xwMIMt7xhmnceuI6b9k4TikWJJQhBdIrx6JnQ6I4IoRJCAaMFLX5aF4ZkMxNt2oEhi0cE2tNpB2hviSJ/IDQa7YRQFAFMGMVOrfz1WtyUKGeVMI13F4u+8G1BjHi/Ic455fN/PJUIYIsWgQXjVeRZAiJ55keRhl4SYvFlS8FrCH2/APxVyP0VZ82Wx8jLfP/a9xIqdzYZe13lL+uUWXS1yLMgyucLkv+mpWN/keKfX+Z/V0aNyhe+EEIosmBgZ6B4sxFZ0Ip9RuRGLcwZ8bNG+d1auykjblqrLDTiZwPNm0OjfylU3N4y8s629rS02xmIzzsCKN1utdq3aSPvdC47n6XpX/nMPaGdt5Hml9oh9wSKBcn8Gdu3//eF6zkz1eKD73zbGz78gfe9n8eeeIqlCyt/vZFk/8fE0XeagrwCLkRJWPx6Vx4DovR2Nfgj7/1Za+2vT01NkSQJWZZhjEEpdW8cx/9dkiQ1kWdr/X99nSjFvto68IDW+l9prTHGXHH8VJ9JJBe+nP1wEo/+xzTNW/kJCpc5lCpYtLiig0leHmVFETrHGyfW/9UtN13P5GyXQbyy+9HD/f/OKFiP0zQKumBd5e/ild3sguIMHoPSGu8zjM3HROrboISRpAB/tau79q/evH83U0KuOiUpQTtilMb549KE6ckJGK0jTrFz/ga+/o3n/s+uhRuWHQGLrIFyfUPlLR69d80/wQ0aNHjNoskAaNCgwWuU/7tN0lkRjLjYzUY5U3cxoc+j7u+5PfLvfdeb8ckJRJe+0walDTbpQ6hAW7IMvA25sO75xj88wunz3OMEtFdY60ApxHhslqDI6jQHJ6ogO3krwsQV3QCsoy1wXcD8P/3tT+B1m3849CTnevx/Pb6Kwllrq1Tgl/3zFBv1IAiIoui+MAzvLeuagVlduJADl7n8l4SgTOnPsoyNjY2Prq+vH7LWbgoF1/gZtpBGX9TwKsAlj4eB/s3MuQeSrMNMZ/7+C8sn5Rvf9T7Qz3DPr93OdQvTvGN3ysRuxQ1nhxw5tcKzx1dYXwcdp1gPjhBnWvggIvWe1GdkPqFlhLAbksSrKAVRBINBSjsAm8Uo3c5d1TVkQCaO2Nvd2tu7EucPeUvfwAHr5LzO/KLLfICXPk76VqkgFb8kKJzLLcq8d3hRZCqPEeJtUSKQZwCUGRJlaNFeIwH3V/TrtS+K/Je//4t5/FXPb6G25W0uLxcmyncY9ztQRTaLkrHXKsg3lCQ/F7pUcZ+IKwz+FBpH5D0B2byI6yql9imlD/jcDD4EnxjFrQofGsWCEhcqfKDFT2jFglKC9RlhqPYr5zCSMdVpE5mAYezoxxkr/d4hHUQHp8PokxK1Pukyj03TDbL0kKTu8J5pPhNN85lOBG89MM/b3/puMjfJ/+cr3+Qnzy1J1paF2LPkTZ6sI1aD1WgborXBY6+aUL7d3EmSpGzf9+V2u+1FhDAMabfbOOcYDAZfieP4niRJMMZUhpylqFefk+OlPcPhEKXUnFJqeWpqaotAMD5eyvvCMKTb7S4MBoODo9HoUP21rwYr8OBTKR/6wAZv272Tj7337Xz3h9/0z1xA1p3DSQuHR5GCJHm5jGzOByEvrfIonPd4pzE6JfUppJ5+Ct/+fsydB9a47vZZtPa4wSg3hcyKFxONZA7lDK1IuPlNXX73t+aS//E/LEuYV2LVRBpXzcT83xuFpxEBGjRo0AgADRo0aPDKwRcigM9tmS6rivcGjWUmzGglcPenbmUmjPGDtGAgGnSUL4SSR7OdT9HRDKvDNj987BiPHs7+YOhyn0AvEdamoEO8pFhSyC2jitpuhSUsRIEMBKwTtDEEJEwo+MS7O+ff9aa9LB47y3cfX8q7TeWRO7Is20LCtb62BK3t0nvL21qtFmEYHjTG3FXW+49vzMfJf91ELAgCRqMRGxsbdwwGg0MUn7cUK4zS1ywAlCTR+1ytUQqMCT+9sTq6MwgjlI4+PczMRjS167F+cuFbX//m6IPt9sN8+M4F3nTgOm46uJsbNjLefG6OhefPc/7sBudOr5IMhP4wIc4cFostDBidGLwdMNOeJJgL6Q8TtE4xrZyZilZImnsXZAgZHotgvEY7mdDiPhgKd1qlQmc5mYn9tsMfsvjDoiS0ilCc+5ZCelZIvfdYLzhvMUrIfF4TX9qW+fI/KdtXCN65wuDs5Ys9L0Qgt2vp9nIzAK70vtXtVyhRkGo8bKYGKMoECpebSuZ2elXpiwBa8gwBJR4DhIoF45kVcbuNVncq4w7kS4M97707Hxh1W9HGb7cBNIIRjSmELSsQRQFkKZEK2T0zg1HCxUurxOmIPV1z0JGS2hFZli8bnQ4TUxPRB6c6cN1u4cBbruPGhf3s2LWP73znCP/xP/8ti2f45PSu3f7CYPWTTrKTSrkUUXgbopxCvCCuLJW5ugBQT+MviXqWZQyHQ44fPy67du3yZaq+1pqpqam7rbX3LS8vf7E+x8e9AOqCQHlerLUMBoNeFEVfbLfb99WzgrbzAyjXDGMM7Xb7S6PR6I44jrf4h1wJmcBzl5Cnji37m2/azRtmAn7zQ/v4v/2vp27uiTyzkWQYAqy4rQlPW4Qmi/eCJUR7jVYZeItzCvGOxRPIdx465W+/eZ7dkyEqtLjBOmFrgtQ6ImWIRyMCbxDJcKPj/G9+85f5X7/29btOrPMAClIF4kpDxAzvoF6w0lQBNGjQoBEAGjRo0OCVhlD0Z69LAHlcLUAjScanPoT/wLunUaPl3BLKF+3+nII0zVO1rSWxKWqiw+nTlvu/9zTn1/gLC6AivFVAB+U0rvCS01uMz3IDwjzaWZB5JSgsQQZ7J/jT/+Y3P4QZ9jj01FEOn0VUkCfM1iN05Qa/7sJ9rQRsnCxMTEzcp7U+qJRaqBHxqtZ/O3fwMuoPlGn/cxsbG706+a8Eipew+y0FAK0UnWhmoTc6t6QMqMjdujJYe0c3VH/UCWf/OPa93gPfSWYD/TxzOzvMXd/BdAfcsCDsu243Z8+3Ob3UZm0t4+K5DZaXRqz3MmwMPpPi83tmrWbfrinOX7rERuLREx36I9BBQGw28N5incJ5ReYMxmpCZ0gQnNFh6j2JtvtT0s+kknSVZp/F95S3vcBxUDnpWecXvfc960kdkLmCuEpeK+3J/RDK8pT8p/a4Kzi0bxIc9bKJ//jY+OmicN7nCpHiy0oc/KbxH1stA/MSgNLRv/zmm54SImCURymft/VD5rWYg0rJgtZyszZ+wQT+Ni02EDw4+ka53VogKAw6jRiMCghUABqCSKENtFSL2e4kk2Gb1d4l1LDPfAhBmKE0GJ1nj8zMwL7r2rxh3y5275jm+utm8zKZdsR3Hvw+3/gvx7iwxFenpme/dr4/+iJhcKeIpNalD3iv0KhZJbon4vAuyZ3pXmiujAkBZXcAgNXVVbTWdyilHup0OoRhSBG5/0KSJF9eX1/v1deWKxH5+tjIsozBYPC5IAjunp6eXiiFyHq2QH2NKTOCOp3OwSRJ7k3T9Mtpml6xhKAuAPSAHz59io/dsZepcMhdB2/gWw+eOnx2Mbc5zdv12XzOyOa2VXxeEuK8RZTBE+Uj0PbReAwGhbCaWL7/8Drv+6VlPnRwBx2TkMXrhEwimcOLIwrapMkIideYaDl2qZA/vPvN93/h3z0niStVKZ8LUrauQTTR/wYNGjQCQIMGDRq8KuR/u9RjAI0lwjKl4J/dcwuT+jwGDV5IylZbAt5bJNTgUpy0WB8oHnvuAo88k/1BH3A6wGWSawaEeaZAUUHgbb5NFa9q7y2bUV2X0Y7AjOAf3bnz829/4x4GGyv8/Y8eZdVBoqn6agdBgNaaLMuqVmDXQqbHDeOUUhhjytr/LxQp/zjneiX5rz9+i1N/jfxba1lZWZkbDAY95xzGGKy1pGmKiBBFETbNXpCg1snoJtlQKGVIEyEMgptjmz0zSC/9Cx1F8z6MJvrWH261uwfWR32++8OUyc6TfPwjB5iYE/AD9ATsaytm988yTDSD5Zi18wNWzo1YWxqydnFEf82RJNDyQ3ZMTBFlHS6uDPFBQJgIog2xMljvSG2ereEsJKJIRJN6wauAxHmGNmWERST4tNXZ4dT5J6zjpBK13ytJUsshh0q0p5c5WRRhqfzuZfODMkveV8IAlYP9tRD4FyWwXMN4+alPxau87lZvivwHKHtolCJBwbMq00gpxALlc4M3BRgFWsuCVupmLWohUOaDuhAAAm0ntHZo7QnEooQJXN4vPhAIVG7JGCiF0RpjHIGOMVj2TO/g+t0zZMOY5GKPvTOwb98kokdMTUfM75pmx84OO2ZDpqYMkxMhuhXAqA++y+LRC/yn/+UYF5ZhZiq8+9jyygelNXG3F7/hve85JzjrEe96RvsuPutnrgwlv/Dvtp0RXynCraysHIrjWObn5/2uXbsIgoB2u83s7OzyYDCQegnA+FyvZ/2UxN45RxzHrK6u3hSGoW+1WhhjqvvqY8gYs2U96Ha7XxoOh18ujEWvmgWQiTDC89hzwz8+d6H3Zzv2GvbOGO569xQ/XFxjhCdFYVG5yWuVAaCq1b4sqXEqX8dV5ouMMPAqIMNzZMnJAw8e87e8eTf7ukLYbYPLMFqTxRZaBmMUoi1ahkyYgE996K18/YHn/IMnkNh7XJ7AgSnOli3Gq2vC/w0aNGgEgAYNGjR4hcl/cWn9eJUmaDIi4JMfnvW3vnkOP3gO3E7wAV4cmYCWDNEOlGBTcGaW548P+cb3n+HCBn+RAF6HpFmMoAi0IbUJXhxK55v67dSHsiuAuJSOeG7exUP/+CN3kqwts3jiEoeeWv6zREHqNjfipWN/fdN/LWStTgpK8h9F0WxR8w8wWzyuV3/diqDWyFmNADwwGo0+t7Gx0avXCJd1v1dymH8h4llrEoZSZj6JLRa/JNriHLTag93ttrvL9v3XNoa+t2Nu7s6lpWUe/FHC9bvXeO97roeuBd+DrtAmIFQRO3cF8IZZ7BoMLliWT/bpnR8y6FuGg4xOx7Bz4jrORRv01mJmWiH9LCWNWsRekzlPagWbQWYgsZ5UBK+EoXW5mbkNCFxEijugrD1grU2w9Jxzi1pYyFsGSk8rFqyTJS0sZs4u2qL+P+8GsJkVn7fEy9sKbg6h/LqtUuhdcftYe728leFlAfZrOSc/fQ8AENGbJTm58jVG/Nm8FI+gUHi0EpSvGU+WpD/vCE+g1LzgUi1+VuEDozmgNPsCpe4UkdnQmE8aURij0MohymG0I9SeQHtcGmPyNhFESghFE2ihZRSRypiQITsnNfuvN8zMJgzW++x+S8TUzojr9k6y54YbCFuaqNVBhYKoGF+W+PgUJgwMNd+8/1FcDGEA55eTz++94bpvHbu49M+dlyeA86ro2iE+AfF9lC3GgbmqADC+BowLfqU5Z7/f59KlS6KU8pOTkxhjmJqaYjAYfGF9ff1zw+Fwi6dHPX1/vHNEuR7Fccz6+vpnReRL5bq0nSBR3qaUot1uMzk5+RVr7T2j0eiqY8dhiMVxet3+m8eePfFnb7vhAMau88tv28u7F/r+B4sD6RGQIVi1KfaKzxt6Cg7vbS4MqARnHdqbvNkneRmAUx3Wsw2+/fD6oXfdeubgJ9/dYq4jkKVAmJcwpRYJAbGQxESTih2jDX7vH7+DJ/6vjzG0Qia+mIqbinMT/2/QoEEjADRo0KDBq4iyDaAv4oqCYIAI+Ce/88v4wQkCE8EwhnaEaA0KsmyEUQI+o59BItM8c+w033tkJOsOUi1FNyuPLshFYrPcGTpQOLFI2dPdF3XL3mMlN6nqaA9DuOtDswffct0sg42L/OCRZ7i0zp+MHPhAY7Spov7jafgvROi228BrrQnD8N4oiu6z1i4qpRaKzfvsdjXh9U29c44syxYHg8E96+vrvfKzeO+rVN+y3jhNU7S8+BT1TQNxH0btkLPnsl57EiYm+USW8OBwMPpsR6lPREH3ztW1jLlOl5Ven+9/7xjTU8LbDs5BqwV+AxWFOJ/gfIZqa3R7kskd00zOz7N7WbG+CkunV0nTjF1ze4i6F2DxDLrbYnktZaQdsYc4c2QeEi2kHgLlSQEVgko8WBh5hTVC5jUhkHoJM5ftzhShwofWy6z10ks9i3jybpSekyKk3ikyVSdOuckdziEqrwl3Ne+FvL/EC5P5FxJirkb287HzM9boioh/Xt9fvl8u1Yl4jOiK/+Zp/wolgkie4m+03KZF5eRf3KxRcsAoFrTmgMbPtpQlUA6jTd5SUcAoQ6g1kQbnhEAckYJQeSKBlnG0TEJLjdgzJ9y4d4p918+SZo5BEHDzLTdx3f4Ab1YwnRESFKFfo0BiRBwoDYQwyLhwvsezz+f97ZWZQczwrkuXzn/NebdoFKGX4FYt5k6buUPOZ4veOxybDT25SplHGUUfF+tKpGlKFEVlGz+yLBMR8bOzsxhj2LFjx33OucUkSb5cL/kp5/O4N0C9VMB7z2Aw+HKr1fpCu92eLR9bHz9Zll0mSHS73bvjOD44Go0OXX3NVngxxH7Iw8/2+K2PRoSyyvWzIR9+5w08ubhInwEx0aYHgFOVgWRZXJMLMh5RGkNI4AXxMQmORIOXgOdOpXd864eL/n23vgtj1+kajfYxqAi8x2FJ4yFRt4td6TERKj72oQP8X/4fj31gMPDfXisSnZSYXHRo6H+DBg0aAaBBgwYNXqUFrG3IRhl4iDptRsMh4qFFi4CU3/3tlt+9a5VOuwNrMQQtyEa5M3wWg85dtY0JCLs7eer5mP/49cMsx0Db4LzF2RHGgPaWLF1FK4UzId460IJNMwKtSeKU0BgyHCZskY3WCB28bZ5zv/H+2wltwtJA8Q8PL7GagQqFzPnK/K+e8n+tEfZy010Rcq2JouiuMAzv9d73tNYLzrmetXZRRGaVUgvjBC3Lsp7WetYYQxzHvdXV1ZsKN/DL+obDZsmCUgrvNtuBXZWkOl99VufyFmVhaD7Tj9cOtbqQZaATDoXCzdrTDTW3KZ9iVAg+r+o9eTbjyPE+bzywl44eQUvDSGNaAYQjfJaBshAIsv86Wje9gZabZcdywvLSMvFqj307Ztizfw9nF4/jjl9ChRGDOGaQWOLMM0o9w8zhVABBSOpBK+i0NYkTRklC5hw+gpH29I0m8Xo2c/5gkjky6xYV7DNK3Zo5FkVk1np/MhP/jHH0rC/EFO/AgVEK63NP89wboDAJ9A7lPb5oAydFurOv1dzLNViQvXCU/+URGZF8zKqy/SObteWiSgJbSHJq6+dSRfp23hYxb5molZoXYcIoFhQ+0N6iReaNYiFUciBQcmug1H6jhYCMrhoQKjA6wpgALwEiQsu0aEUBThnExrSMZSoU2gbaxjHVDZicDtn/pja79kzTbk2gpM3+aCcmAqeXCNoeaaWgHFgF7QAkIYuHKBMi3uD0JN979HFWUkh0QCIBOuROY3zS9smpkecQLl1MrCwqx4Yjz2D35aVTl7VMHM/oGb9ty2+oFGmaAnkJUZZlnD9/Xqy1fteuXUxNTWGt/VKapl9dXV3tpWladRnJ24yqbUsLSgyHQ/r9/keDIHgoDEPK9oClWFj/fOXfURTR6XS+EsfxTf1+vzI5LbOc6uubSE7fnzjBXz5/Mf3MO/a2ieIhH7n9DTz0yDH/t4sjSUxAlqd2obVGOY9zebtUpYrfUSze5algvswFE3CSESvBhPCdh0YffeTOS/f/6sEd6NYI4iHgcc5ijRC0JyDxaC2IHjAVrPMv/tsPfOu+L35bIgNxphCtyGxK0NIkyRZDgAYNGjRoBIAGDRo0eCWQDTMkCPCpZTQcMjHZZrg2JGTADTu57yMfuIHduxxsOPDtPEfXjYpa9phQFOHEJCvrQ0Y+5IePneSZo4Qo6CcZvkwN9UUBt2QgCnyYX5Kn8lprmei0sfEIb1MQQwBMCXz8vbt3XzcRkKUxP3ryJIsX+KJXuVHcy3VhLw3ByvKBMAwJguDuwvSvVyPvC2X9/3j6rlJq1jlHv9//6nA4/GxJKMZNAl8KNiPQ438LKJnNXPotW2yijWNCQRpA12iZV96itSexlsAahqOM54/3eMvZPgdmpyFbRUyr+AlH+EDjjAHTxbT3wNRbILgBtS9i52AAg1UYXIALp9DTbfRsi9MnztKNAqIsI00dg2FMa5CS2hRxHq8DhtrhlMYrQxwFxC5jFKf0shEqaJOgSDJHJEKs9ELi/EIG51NhNwjWMa9gIkMvKnwvc9LDgdMerM+Hkcs7A3g8pUOeQxCfdwmoor+uuHss6+PleAa8PAFAilKEehlJ/p3EO7SAxhft/DaNEZV4RKkqgyQfmz4witu0MJ+37ZPZQPSC8X4i0P7mQNifk32fR/gRJhWEAlFgicKQQKtcSCDDeI8OhdC0aEeKVgBKUjptw97rdjG3bwd7b72Bzo4povYMqA7oGZA+jJ4mHS0SBOtAWljB5z3tReX97V0WsLQqPHNyjYGAbSlGwwQChfWcFw/aEThPYFy2kaJS5TWp11jvcF6qc/1yfv/6WLDWMhqNWF1dvQN4aOfOnXS7XWZnZ5fjOJbhcLhFWLiW+TscDg+FYfhlY8y9YRheJjyO+wp47wnDcKHdbt89Go2+WmYb1AUp73MpK1Aa8XBshd//7pMnP3PrG99CGFqum7S8723zfGfxHGvJen6StcZlHk3RRWPsK4gHJx5X3OWUywXBLCVWsDrigfu/8yzvuf2TtLNztEyRNuZU3g5QdG5C4RPwMeJ6fOh9b+b2A9/2Dx1GNJDZGGUga0h/gwYNGgGgQYMGDV4leIX3hXuYg/5gyEQAOoV/8um3fuEdt8wRscpw4GkRIaKK/gBF9MoBOiIzLZ4/MeSbP1hkKSF1gcJv9nvKnyGuKHq2iJfC0E0KMuAJ2+G+oR2cUoDxMeLgtjfgP/6eW5gKYH095h8eOcLz63wuM0UHtJeZgl26cHvviaKIdrt9bxiG9xYb8dl6CcDVSESapg9sbGzcU9YK/7SM4up+A+MCgFJqwWbyLe9AO4XY6GaD36/FzmvvJhQZSmfgPaIMTjQnT6ccPXaBm956ABgSKnLzRpXhtMKagNR0aLX2YLpvAfZCOA2TDliD7BLc+Eb2vPkt7FnusffpI5w7fpzTR46SXbrEjBJ2dVr4OMYmKU48sWRYMcSSseotIxxRZBE0fedIvCIRTyqeUCC2nqH3u8WRKKU+mCpZUJZZLX7eellSsOiQReuETG12Bqjs8WRri76ygaAlJ83FL1n7P6+YGHDZuJC6+79HSenmL0Uqf070dNH6UEl57vOSFKO4GUCLm1VKLWiRBaVlIRAWFD402DAUWQgVhECoICrq+yOl6GiYMEIn0rRVhrEJxnsmo4iJTgtlDF48XiukFRBOzLLj+j285Za3suvNb4Ub3watqbykRBvwBtx5WLEMLyyBDAh8Up4UcBnaa3AtSFosHhvy7AkYKHDtmFEc9zBTs24YpKKCD2jXP2w9CC4V73v4zrz3esk5VfSGSPhpVpOXmUBra2uHkiQRpZSfm5tj586dJEny0Pnz5+8oHfpfyKW/PN+j0Qit9WejKLo3DMNqjJVR/fH5LSKE/3/2/jzIkuw67wR/597r7m+JJSPXWjJryQJqA6oKYGEhQGwkAVGgxG1agNSiWiTVEjCjpmZa0rQRPWbqISWZNfCP/mlSbYSNDTUmE1sDTItNijvBpYoAAZJIoFBr1ha1ZGZl5RqZEfEWd7/3nPnjukdGZhUIUgAIEHhfWlhEvljeC7/uHvd85zvfV5aMx+NPTKdTqeualNKOv8mOCsAZmlpcCGw1kU8de5G//b57OOQHLBUN77jvMHd+9mW7eB6p1dBQIKnGOSF1XhJ0t/5kAXAgsUvcoItmNQjZtG87wae/YB/80tPTT3zXfcuUvkUaA1FMC1R8TnURBVpEZ1y3Z8b/5cffw3/3kT+gCo7tmA1DxS0YgAUWWGBBACywwAILfEOK/1BUxLbNu8DOntl7uP8O7Ef++usY6bO0kwkwQrp58TpFBhSUPtAmo55B6/bzuYce4UvP5JH+mRqu7EiAV9sY73RqlaIoaKIxnU5PKsLqeEg9m7E/wPd/516OrAYsRl48M+Hh5yafnO5srr969eg1OdzvHQwGH722u/dqcV+7Z37btj02m80+3G/Ur80c/2oLkmtnh68UDG4co35OE3irEAb3C2lNpC5FbC1hTdSmLMoK84EwGNG0W5w8tcHGuQl7D1ZEnUOYY77FFSV4R4pC2xYEhsB+IitEEolAEYwyVDA+AAdbDh56HQfPnOPws09z6pkn2HjxGdpL5xkmz9ALW5uXc0Sg88xU8BNlO8LASgoPRQvzBI1AK9lDYBaNAsdc7UitHPGqa8FkqRHWorLusCJlD4ATIK12xX+0XOhbNrPAd4dM89nW5aAZ6VVaxrsL/68XCXBt8X9lHTWPaLtuVFtylF8f4+ed4HeIAEHECufsqHNy1GVzv9KLHHZODwVv9wThSHb4N0qEQozKGSVKJY7KwzAIVXAsVSOGwVgpC4ZeGFiksMRSaQyHQBAaF7DhEkuHrmffzbdyw2vvYvk1d8D1r4HBYVotCb4T4ptkImDpEHFzmTpdQPCENnRj5y4bQ1CwtW089tgptqf5U1GAgjW1BqUaC/6oWjPG2lasN0yUEgtrhmwk6+f/9au+/vu16MeIehO/06dPC2D79+9n//7999d1/YHz589/sm1bhsPhzvjAl0OfSlLXNZPJ5IMhhE9UVXVVIkB/rvWFfe9fUlUVg8Hg/hjjsVdTAABEbVAqaiJPnUSefPGyHbhlTFu/xE2H9vCu+/fw3O9dOjxtORmddaRpNtXc8V8VEMveACaR1JECJg5JihuUpLZhrnBhxid/5be/yN1H38JwdYTTKaiizlA0E3AOnBYUlti+tM73vf0NfNfrP2OffrSVMkBU8viXfXVrt8ACCyywIAAWWGCBBf4LkNqId55kEQIsVSBT+Ed//x4OjC4wSIlSK2Rc5U5Qk4e6XTI0KkJFk0Y8e6rl9//kJBsJUlGAKNomnO8KGQtgYN2Gz/UWXpLD3Moi0LYR70vAKBW+8y7se954KzI9RxpczyPPvsALF/mgGxTMY4tannv+qn7/lPrYr7XBYPDREMJaPxLQd9lfrfu+K/N7fTKZvG86nW5cmdHXnYixfuP+NeFrOslDX6CmZMdT5DgWQIox5koVbXFyKAnbTihmmspRyC79pp6igAsvTTj57Gn277sBGxhaKN63OO+pLGIpEpoITf4Llw+xx1ijoSJRA5HCJ8L+Eva07L3pjex93TrNi49y8fnH2D71FM3ls5TLRjuviSoMU0kxXGJ7LkzmhpvOCJUx10jTCnXK3f/KO6bOKCL4pBTK0Ro76JRxNFtqnOHUJuKsEfNNFDvbDSyjZjvTJn0igEg/19wbBHbFn2QFyquRAF9PXE3m5NclXOn8i3SGfxiB7OwfsjKgcLDmvDsanL8/OI4KccOLrXmRI144WDi5P3hZKshGjAMHlYNKjIETKoGh94xKR1V6VkcVhRjLlWNlWLBUOAIJR8LEMdizhlvez9KNt3Do9tczvu31cOgmGK2BGwMjMIdqR7g0QFgF2YMLa0Q9Q74EhgSU5Kb4AG0LL53f4pmnTrNUBpppxBRCBduz+ri6as3wqBVLhq0pcTtfA/Gk4BCyYWj6GhWQu8m9ngQQEabTKS+//LKIiO3du5dDhw59omka2dzc/IrF/24SQFXZ2tr6pIh8eM+ePT/fGw9eSwrtTgrpSMmfb5rmTdc+1849Cce0bQmDwOV55POPv8h3vvbN4E5ShRnv/I5b+PzTD514eR3ZauY7fgnqu/PNXC7+8UAidSSUab4+nIHWCXBEUxoHD/zppXe/560nH/jh7z6K5zTONSiQVGmd4hGcOIIpe4uW7e3n+cc/9j38yf/wW5hAVUDTCLYTR7ggARZYYIEFAbDAAgss8JeCHBQGziTH7iWliXD/67C3v/F6iniSSkqwsis4ZyRpqaoASaGBYjSiiUP+8HNP8sQ6EgWmsWW0MiRuzfBOEA1AwOhkwKIIChJxZBO/0pV4H5BQMZlc4NYhd3z/249y8x5Ps7XNNAnHjj/PDJAwwnRKipHwVSrtO9M/RqPRJ4qiuH93oX9tt7+PAezTANq2PTafzz8ynU43mqbZMQfrRwq+FsXktT9j9+uJsfllI06QiIiVJpBMNhLhaPIcQuKZwocl9UJMETWhlEB9KXJm/SLpriOUo4rEFJcM0QakprA2O3y3W8AE3AANRVeoDjBGuYh25ErbTXJcxM1jyptu4bp73gjPPcLmiaeJWxe5fOY0m+cuopM5K14Zl56ZrymTsSnGdhTmlihQCpE8o6zWyeChSR4vtuSTvq1xHHJRiV6WvMnhWnkS8UcUXQc2BAeqXZAZCA7F0O7npt76z3Jxg/SjKPbqBdbXmBC4NjmipyrEdbP/ZLm/71QNXiA4WXNY4TsfisLL/cG5+4PTQx6aIBxyzg4Vzq0FL1TeUQgEgUqUoQgDD0OBSmBUOpYGgXERWAmOcVUwGhaEwoEz/GCJ1X37Wd5/kH0330ax9wbcDbfCoZth+UAu/F1FjEJwricn6JMbcju/RUxzpJylnWBRTwARppstLz73MtvnYVQus6UbzCNIgISdSS5O1HyTxBdq5UHMlkz0rEgLlhNDek+Br8V67Cb9dj9WFAWTyYTTp09LCMGWl5c5ePCgpZSkN+j7s9Ab+5lZHzf48Z5ofLUEgWtf13A4vL9pmg+1bfvxPuWk/3pFKKoR83oOyWgVHnr0RS69783csLSEtRNuu3Efb75rjeMnNu55oeWRBmjJIx1mDkdALJNMJnqFPOvU/5WvmM7rPOLhGrZSpJjz4G///uO8497XcsN4AK6l6Hw22m7cJpjgNBGcMWwv8aa7b+f73+Ptf/+DJFFgUA6Z1+3C/2+BBRZYEAALLLDAAn/ZKBCSJbxUJJ0xHMB/+2NvYOgusly2MHOgniTGTOf4MuGdhxYcJW0MrD9/gc/8yfNcmuXRXiIkWsSB1wBWoF28oIkDizjJDtJJc82QkuF8QaMeB7z9DUvH33zHDRTNGarRgIdfOM3xF9LDCjRtIlk2nMr+7//lRUA39//Rsizf22/Y+01538m/pmBYA3Zk/5PJ5Fgv+99dRPQ/62uB3WTClYJBie38QZGEdyDUGwm/DoxbyiKIL03skJVCrXOWy4DzilNDGtg+XbP1UsO+UYEfD8DNs0Gji3iZY81FZHISDl6Hx1HhiZQ4LXBpiI+52GuYESrFhTFYBTqC/Qdh3+tYecMcTjzF+PTzrJx6htnpdZqzJ7GtC6ifsRYiJ+eeMgamKBMxQrKcYW+GwyicY+4Fl8A7R0h6tBb3gdbxsEvypDp3yCETFVmLIg+LcBYnaOosAU2RLtbSzPBiJLNOOfJnjwJ83Yi33V1fJ520fTfBk2tbJ4LvZP5BOBxEjjqxsXdyZ+nduwvP2sB5vEScc5TekQkAT+ksz/yLY+Bg5ISRg4FzjMvAyqhktfDs9cq4UorlATZaIo32MDx0A4dufx1Lt7wWbjgKwxUol7rIt5JWIWnI3h1WZy8QAZLkCt62SPVZSOcp3WVKpkgqQDv3twjTlyecOn6WkcH25YbKhsxSzTQp4t3RGOtPqnBEpVxL6pdU9KDpfB1JOJe67jU4Cyj+60IC9Coe5xzT6ZSXXnpJDh06ZOPxmH379lnTNPLnTRrp0TQNW1tbtznnLo7H46tn+nc9b///siwZDAYfnc/nH08pXRVrmFQxJ+A8baxZdvD083zwC489+4lDbxxCc5lCJrz9nqN88fgzD5979rIkjFlKuKogRQMdIGY4maESSVzxVfTk+0UgAEOiQCuR1sEjj/GvPvOZp//FD7xjD8NhhMLjMLST9Sc0E2zTmmo0JjQn+PEffQ+f+sLvMtsEbTP524UTLLDAAgssCIAFFlhggT/35rXfZOZqgtzTt1yF76ozcpHhsN2fR2nJEnxSSwV8z5uwt73+EHuGL8PmFKjAFXgvBAsgSoyRUEfw+9iYDvj8oy/yzIsstWRhAKWj3o5UZYDm1W+RvUWbKIQyMJ9HPHN8nHKwgHfdcxuHRoG4HSn3rfHQc09ycov7hsPA5VmdM8WLkPPvvood5GAw+EBVVT/lvadtW8xsI4SwtntjvnsD32/Q27b95Hw+P1bXNSEEyrIkpbTjAdCnC/zF8GX8EgySGV5kx8E+qdEmpSyzVBdRjHhScWsILeYwcaUqzJuGtT0VwXWvz8Ns27jw0oS9h1eQEiirbnjXgBkpnUNnL1C2R8A5vF/BMwDXOYJ1i1hWZddtdyQpwI/IgmKHSAO3XE914xuo7jwNJx5n8thnufTiw7QXYWU05cClyLAWLpmjRBhEx0Cg0EQpyiwZnoRDcCa4LFle82rvFs+hqOlMJ6E/KObuVeGMqDyS55iN1BUjYld86F55zB1O8vjAVw4G/GouVkXwO4SVSFf8S3YpcGI4NJv/ddRWcP6oFzkYkCPeydEgHA5O7imcrJXOMwqOgMM7CB6qoFQ+ZQJAjFEIDL2w5B1DjLF4VqvAahVYqgr2LA1pDRiusXLkNvbffh/la+6E64/Cyj7wFUhBxNMiGIL3oaPzOr830Xzhpwh+AGyj7RaiM7wkRCPYBLSE1EJbMtkwzrwIw0HFS2cnhOU9iDia+eSzxbB4W9T6c+A3IBzK+Y6uVBwmXYL812iRvlJSR9M0jEYjmqZhc3MTQG699VZbXV1le3v7/s3NzWN/1s/vu//9XH+XFrIRQvhgVVWf6JMA4OoY092PlWW5VhTF/bPZ7NjVcYNCaiLFYEBb12gBL0355OceXeddr38DZQJtJ7zu1tfwusMv8cizl8dzmGTrBA8aSZ2KxxHzXw/rvBoljxfMmkgVRrRJQSPlALancKbhf/qtTx//F+/+jrcTxFG4lAlf6/w3tPN8KMeweYHxnlVuu2mVH3zfzfa//fILMosNVQhMo3YeBLtDCRy9ZgSJu//AdQMxeuWP34I9WGCBBRYEwAILLPDtVvzvnqI0ilywo8A0b8y7bo5LkHs6Q4yU3Z4FonpAGVpkVeCf/Z3v5JCehelmNoEKHoqK+dYWxajChxGz6UWCU1Tg6Zcdv/aHJ9lsmYQCYps7tUmgbqUT/qddHoMuy0zNIyYMC2HeppwRrjX7kvKOW8Teeut+QjNDy32cvOR48PgZNgSa6ChCSSv1nysBoC/k+w1430XrZP/vHQ6HP99/TVe0r/VFQT+7m1LacM6tFUWxZmZMp9OPbW1tfWw+n+9IgPtZ/z8rd/zVKwS7isLJH6Wd//pdEXYmQptSNoLzgUSiUcWF3uiuPeEcheDWLbnjXrgzzSNLozFt3aIDx3A0RtsJs0Y4e+4iN1yOLO0psgObFxgYbXOR6Cuc2wP1BSivA0bgBvmM80Zy4H0uCCHgd/qw3VlpDmyQfw+/BEt74fbrGd98J+Mzj/PyIw+y8difcmO1yeTsBsPoGVNweeqYYJQ+UWlNRcOwgG1zeBEcAdThnFA47kS3fqixdCxFGUcNS0o4LCKHnHFCJZ0UFydiidgVNnTmepZZk5yJLrlbadjO+94bwL3KSWaWlSe7KRsxdgz98lHQq87Bvsh0lq9UEUFQpCMdnMuHP0cAWi7oRQ6LWCHi1rzz95fOfWdwcqT0RuEdpXOMywqJcwprGTpjWBgDnxgUMArZ8K/QlhXxrBUle0Ng2Xv2BPCDIZeKVZZuuYPr7ryH8ujdcPg1sLIf/JA2GRKKnTMz0DvxNTvUozqXO8gUULhc6NcXEJ3jzIENadOMYigwn0FwbF1seOLRC6QkbDbGYN+YzWZOY4kQirfN6nSslPL9TbJjqvNHDJkgNgFfqEmbVEnmsVfR/ryimLevfH94tXXq/++co21bnHOEEJhOpzz33HOyf/9+u/nmmz//xBNPSK8cuFY90Bf+1547qsp8Pv/kpUuXPrJv376PXvt1u+JFiTFSVRVLS0ufr+taptPpFWNQA+dLUpPAw0yy1crnnt7kuVMT7j20n8rXbG+f4W++/VYeeer09unTyDAMmM5bCAFIJI0EU4JBsCzkaAkkCqQomFnCp5qSBqmhKGHbwQOPq/zGg4/bj//QG0hxA1+2DInEOuH8/sy4zS/CUkkzP894NObHf/itfP5zL3z+yVO8aRaz7wzicK0SOvq6DCtcjm0u9J3ma0p7kiC7x5jTP/caL7DAAgssCIAFFljgW44EgLwxSjt9uVd+ni/7qKMMShHhr78Te/1NKxTtOi44CCWxjfhU45whaqS54qSCwrM5C/zhQy/wwgXeN9NcQ+ayqshzv95jmhDTXV3P/JxJQo6fSkqMCgMHrbIHePNr9rO/UgbBM00rPPHSFicvcWYrkUkNp2CJLsvqzzw+u130d0toy7Kkqqqfcs6tXbtp370J74r6tf7767r++HQ6/UhK6c+dBf4XW9CvPDbQaTayjD2CieGdohKfxLk1xG97y4epDCWlL3Au/24p5kM3m0cuXLrMxsWGpT1jCIKGhHOKBYf4bcwuQHMOqkneZbcBPJgHo6XF6PrPr9yM9xKPXnDih8BBGJQwWOa60T4OHrmLjWOfoqxOEs9sw6UGrVucJIYehs6xFRyblkgpouIpioKq9Uznxiw2VCL3ijlapHTIWhImIpROKFpsw4xJ6l6PXFX4dfGXvVR5FxfjDPRrPArgdlqYtvN/6fqZrut+9tJ/LxDEHfbO3elxR0vn3x28uz84O1I6pfJCERKVSwRzDINnWDrGFQxcpLSWgRpVa6wEzzA4lgvHyrBiHIaMiiGDapm0vJ/b3voOqtteD7feDkv7gRK1CvVD1PfLaDgi0g3y5HPQdZ/JShenXQa8bEM6T0qbmNW0rTIsR9DMICVIgdMvXeLUqQmTbU80T+sSSRIqIOJx2GEnvvFOJymlJxHbSObOmNEmFZQSNUPFfd2rv2vvCX1M4Pb29kfM7KOrq6sf3dzc/EjTNIQQdgiD3hD02uSQXhHQJQN8rGmaj1ZVtUM27r5f7SYUOpXR0bqu16+QDR5LESXlcZyUHfbPbfETz5+e/cKdB5YprGVl6DiwNOetd4146OUpkzjHF4FkRp7lSWinxffZkoLoHIjDnANNOJrsF6N5RGAqA5zN+ezDF3nLvZe5++5VJpdfYFx5ilBgsxopqswW+EipDm81h5bm/OgP3XX///xvn8AEGiWrimgI3WrWcYYRwBdA/SrXUidCWigAFlhggQUBsMACC3w74kraeb81b7sSUXt/sZ2isdtedd8YOumnw8WWZYEf+zvvAqkJgxFpPseXgYBiTAlV3nGlGspqmdgqT57a5nc/8zQvX+RTrXQpa15APFc6oVcXtq6Tl7puRCHmF0GRjGGCm/djb773NQyKhDmhjgO+9PhjnD7LdTndLXYy9H7cIf25CAC4MpPfxWt9tCzL9345+e+1Zm2qStM0H9/e3v7wbDZjt+P/Xx7Vc/VrdZY71EE6X3RxBx2y5pFDDllzWCY9okOCYGqIZNNDJzDbnrF5MREPDwmDlZzO5nNcXKPKbHYeXzxHsXQY5DqwZVCfC1XnUdodsz3fS9ule0Q0zxPv2L+Rjf1kBaoRXH8Et/917Fs6wMVnP8/48cfRF16k0vPUoWGrEaRJ6MATk9I0LU2MSKwzCVE4RAo0ViDuXhE92vr0OUgPqxjmKJ3pUjLOOvXd0cvO40Iu/sXy8TBLf+Y58DVbQdk979/H+oU83kBWDQhCEDnqRe4I4u4tvHtXELlz4PRo6ZUqJKqgDIJmd39rGBSOQeEJIlRWsuLH7HEDlkQYWcuoVAYjg6qgHe4h7r+Z6pY3sHzLncg998Lavjzj7wvwVVbpcKX492hHWPT3mazE0O4R2z3IbRchniLFlxHdgtTAoMK2txD1xLlw+tQlNi9HinKZZjInJiG2SpuUmNhO6k6q6rqqrovIGmYbZraRC+Qr6Q5XqLCrr/ev9Zpd+3M7AuBjdV1/bHV11aqq+ljbthu9Cmh3Mf9qP68nAMyMyWTyce/9h3qyoFcivZoXwGg0+kTTNG+aTCYAFEXAUi7gyYp+nMD2lH/35Avnf+Hd9x0F3SKUxsqS563338HvPvlFO3sKUZSZK3bc/vr17j0Arpym3dp3YylYJhmiJOYKf/wY7/7so6cfOHrXAWaNMq4qCCW1zRgEyWxjhNKG1POWVT/jB7/3Pn7vgSfswccQb+D8EKVBXTdJQp1fiSvYMQmwK/SnXks0LrDAAgt8A+AWh2CBBRb4RpMAurMRjpkEuNpkvPtQMdpum1cAnoG0DIEP/k1v9991kOn0IuICQok1CpIQq/FBaXWOJcWFJU5egN/73HMcfwGZk39cC5hkt3h2Ome6E/l3hRBQxPJjSRxlWVDUcw6U8LZ71rj1+hUkzkkKZ7YTX3zmDJebfLc1D+ISiOTOs7mvSADs7uJ1kX8f6Lr/r/i6vuPWb/y7KL+Nzu3/w3Vd77j8/6Ws7TUdyFfSAr4LRZPCmVsTc0uYTboCarsMBUVREXyJcwERR/AFZrB5WTn38pzN83OYpqzsnjlIBaV3FH5O05yC5gWwC+BnO103ozfRcztvtiPiFYyE0RKZkJjRUhNdIqlls0C3lEcL7n43e7/j+7jxrd/DDfe9kdVbbmS4b8hoCcbDlooZ4yKxZwRrQxiGfOYORRkHYyiBgZQMPEulsztCaNeCb8fOp7FzHBTxh03KwkmF2AChwJnrpPj57ZXO/F8H+uZVpOaZEHB4PF7ySgZxB724o8G5ewsn95TOva10drT0MPDGyCVGXhmFfCyWhrBUCaNSGYuyLJE1L+wNnj1BWHaBqhhQjNYYHrqVtbvezHVv/z5W3vMjyHt+CK6/FQZjajPmCZpeYg2kRilMCOpwKoj67L5vYadK3KGlHMAM9GVS+wIWz1G6rghUIHlIJWdPzVh/ZsrGRdjanOVi0vLZYgpmTLpif13NzvTJFmY2uXItp69r0b8bfTG++6139J9Op0wmk/eVZfmh8Xi8ow7oPUFijK96He8mAba3tz88mUyONU2zoxDoxo6ueh1dJOD9VVXdf+VcUpCmu+dn9UgRHLMaHnthg5c2FfUVFhuGpXH08B7e9vrruXHIu1ybEzfy3wfp/obkZU1ypdgWdhMAeZ1F8ghNC5ye8eCnHz3L8Rc28dVeoMwpHK4B3xI1QWNASVEninaD/eOGH//A29nj88Ba6P48NApxh9uNkOruEnXIrvLfegJbw2ILvsACC3zD4BeHYIEFFvhGEwBX0s1bhLSrX5x9AaybwM/DygpUCMqAhrsO8Qf/z//bd9+yWl5gVCltM6MaLKFNjXMtSsSc0qZEcBWwxh8+fJ7/8Bsv8dwGP9MGIJS0UcAc0htfWcJ1kX+7S6s8Xi1ZZu0cg8JR1Ik79/Dif/PXXrd6yxqUNodiiU8/eYlf+cxLP3Gu5SEpHEmysZtogRd/TfvxldjdoffeMxqN1sbj8e+EEIa7P3ety/5uzGazn+k6fldJdL92q3d1Sb/jigU7ud1Xnk8QcV1mfB7LEFM8qMPmHlaCcL0T2e+R/Q5bCuIoCscoFKyMh6wujVgeDSnLxJEbVti/fw/VcNiZNChJFTcIiBeiRZwvcbIC5R5gNXcBk+XYxv4V70jsJZsJ7mzXU+4cEgHDOcP5lLXGYsAYxgcoDh1hae9e2kJoXUsZEqPKoJlTOkPoIstclccOkkdiZoTEdXPp0gwNJgqThJ1WPEZ5yCgPmYZk+BmiirTgGkRSNwbwytlv4yutr+xerV1r1K9bJ/U3cgaB6wrIvo/uJKs3zGUFgBjOMXaOvc7rWuHlDYXjztLr0cqZH3hl6IyRp3sTBs4xqkYMCs+yOFa9sdcbe0Jkyc8IMmdp74jB/jVWbruL67/jnRx66/cxuPedcN1tUA5ofE10DgsV5nNah5CXp5KcvpCLfd9tdzqtQq/4MXYiC/GnYfantJOHoX2JgZ8jTQuNIurBVji1Pue5py6S2oI6FdROaHFEze9bhIhvkrjWTOaqnFDsghkbEUO1d47vswflFQX21eTAV3d17vb02H2P6FHX9XoI4XQI4b2q+nhvAtoX+a/2/bvvH52c/+Pe+58eDAZXqQd2GwTuGmM62jTNv88jAD0h0p11CqUELCmx1vNHDq18/123rEGzQSgdFiOhWOLEy6d/4oWL/ExrieS6NbXOUUH6prvfcc10pGzE2Z2/Jo7ofB4RQJnM9PTKoP6Be++8hcpFLE5RlxBniLnsBUGBxJbCRVJquf7GWzh38eWffuKZ6c80phhK6saLdrxs1cCku/Z1F5ctmWjYmS/SxSZggQUWWBAACyywwLcRZPetSBDiNV9Q7XL+tyuVmgVK5iwD//TH7/6Fd967RohnKMvcy9W6yRv7zurbFXkS2IdlTp5TfuXBU/ze57dl5qD1A6K6budomAjeu87gTNldTl2Rl2ZTO0yoRFmJyne/pvw3P/SO2ximywx84FI75D8++AR//OzsR+aAhYJIQhN419nfy1cOknLO4b1nOBwyHo//c1mWrwNIKW2IyHB34bdb8tt19I5Np9Mfm81mpJTw3u+4dV+b3f21IQD6F3M1AfBq5IQT1xX/2SAveHfUO3dbEcL3FD681we/d3k0YjQYsDwesrI8ZM/yiLU9q+xZXWJpVFEVnrIIVFVBWF2CYYHrfBbaVIMTciFd4cMYwgpYhWLdGl8hAHb/StI56wu5S2eELo6vn34XRAKkADKAagn27md53z5W9q0xGHtCoawuFRQC9bRmPslrL1Yg5vLrMjLhZRFQr8JqggsKExU/Nnxp+BLzpRGfw8XOWTzLntX68HquLu7E/XkvvGu+92oCQHaKN3a6qLnTmwmA3PXvjP88R5xP48LrkcLb0cLpoTLIbQMHA3EMnWPoPEPnqXxB6TyFA68tA2lYLlpWB5GVJWHPvgEr1+1h/2tew6F77mP/W76b8r63weE7YbgXQsEUiJJTELpXkrUcCQrtfkN7JTdlrkue6AkOicB5mD9Bmn2eOHuGoJfw1g2lNwKyhG2WPPd0y8ULgjFg1hqbbZuVB7F7U1lvjaeT2pPR7ElFJoptqLKhZlh337DuCL9agX+VUz5fPVG3W85/7TUYY+zvI4+XZbkGzHuVUFVVV6UM7C7mdxMDHWnwmaqq/n4/VtTP/V/73GZ2NKX071NKGynF7LvYpVt475CUI0Lrmj8dlO1Pv/3ewwyYUHiwec3S0ioXNyc8e3L2W5caOxldrrZ3HdFO3ZOjM7E8EOLE8hUjgorHpMAkIGHA9lZzTOrJT7/+tYfZMxZCaAiFoZayOWQ0JEWQBC7laM86ctPNd/KpTz3xHydRLxiQimsuLQVv0lFSXed/52ZTdddtXBAACyywwDcECw+ABRZY4BtPAvQtIK5OBrj6VrXLG4AZBfDuN2Dvf/ft6OQEy0uB+WyTajhkMp0QhksgIdfYCiEUTGs49sQLfOaLL7OVIBYlKWWLdQkBSwk0EXy5M52vcmX233CYdDJjcaCGj5Hbx/zS2++8gVWZUllDTBVPv3iOzz914cQWgA/Elp2mT3CeJra4r0DB9rLazvX/E2VZvrffePfmftd2DrtN+Yaqrm9tbb2p7/xf07X7+q5pP9og9mcXoH0GuxNUXGki4yh2xqFPiso9l7Yn5WxqTCeOy14551pWBo6V0hOYcWBVeH7duOk1I974lqMMj6zkPDmEQiLOamI8x3z2JColg5US/K0Utqd3A3x1HkMBCXjAW9E38xDXU1HdGIg4aBO4UY4iPLzM4LrDlNcfIDy7l8Gll7nu1EusPX2aUycucXpDOTc3UsjeB6V2qhaUJFAaaxHuSbCRLB6P5jZEbFtMzogknLWopZ1IQHGdiOTLnDt/UXn5lys3d4iSnQKyHzcxcBTO25K41ARnR53nYDfCsFQ48OIp8JTOU5mjNKHSQCGRUmuWBsZ1ewtuODRg32rB8rhidf+NLB+8FX/93XDD6+CGuyGsgStpNaIEghPEKlDNowh9U71fP9tVcEnswh2sv4vsDH7AJYiPE2dfJM6ex+k2RQJiglBkkuei8ehDp3j8kSlnzrRc2LzAhQnMBeoUmEdlHnmgVfdkizsRE09GYx1kjLlCRAvnXKs77e4vc9l8jccBXq3rv/sx731v6EdVVRt9p74nEHvT0VcjF/tCP6XEbDb71NbW1ieBD4QQdh7vf1b/c/pEgBjj3rZtdm4BKUHhA6ltcMAW8NDz5//DMyc3fvRNNwyhnVJ5Y19oeNNrD3L8fPvZl/9kU1praLu/GCY5vcN2/T1x3bXV/85qhjpBsWzi5zzq4InnkN/8g6dt9a8f4dYbBjjJtKFLgqaEyLyr1x14xTUXuf3G6/ih9950/P/1qy+KkkcAbPcfL6EbQdg1RLYw/ltggQW+SbBQACywwALfuMJ/Z1PUm63tkrXTd8CuvPX93AIYAf/3H7/9p7/jtjFLZYvVE4oSmmbCaGkpb/rMk1QwBWXI2c2SX/vDZ/m1P04ylyH4ghRbEGEwqLDUYpoogieldqeTap1cNxf/rvs/kJQVM77rCP/xv/qu21jxm1RlyVY95A8ePcl/fmh7zwYQiiGzGBGfxwsG1YgU46u0Ka9G3/0fDAbvHQ6HH93dVdudu33tBj2l9HiM8VObm5uf2h3Lpao7s71fmxQA+woEBq94jTuO4vQfd7Wa6dlk6SFL+mTU9NmU0p+a2WbUuO6FO50T0Jil56UneEdQz/Zmok0tq3tH7F0e5mIvCOK6TraHRiNtainLAa7qIwGrK3ST0MVOpk6V4a6oc3WHo7jyXjo2QLKDOUXuKEYC3lXI6oDhvjGFqxnuH3HgwJiDKwVIZNpss9XMaVOTa38zTFPOLzdIsJLgvOXi6ayhZ5OlR0xUd+zO+rxzk1ft9pvIn/Piu2Z9rmFEdnf8d3sN9AoAJ+AcQ+d04L3d4B37Q+B1peeewnFn5cKwEqF0jgqh6uL/SmeUoWV5OOe6Q447Xr+fe99yC4fvvoHVm29keNNduFvfCHe8E9aOQlgCKTHnwZeYeEyhFMGnPIYgvcZau6LfdeNCLnWt/swK9P8CLU62wV6E5iHq7Yex+iVKm+KiwFyhaWFecf6k8SefOcHzzze0qWIyn+AHsNVArY46Ga3JCxG/mbv+HhUmZjID5gk7m0mkrldt0vWEv0IKyNdAAXBtAf9qn9t9X+gL+D4NwHu/4/6/m0S4Vh2gqp/03v/9six3Uke6aNIdArK7Zw3ruv73s9l8o+chTcn33JhwQUhhgLbxP91709JP33HjfgZpjlQFrp4xGo3ZtoovPXX+308iG9mUtVfCXBmrkN4DwHRnzEBFrqKZDaUMgfk8snVh+x33vO7g0esPLiPakN1gHKYNUuRviU3EuZLB0ojNy5scvvlWHvj0U+lizYN1RxoSSkgR6WIJO7qsUyCwo2C76gazwAILLPCXjIUCYIEFFvgmQN+Ty51+3dkU9aZ/Q0ZhSIwtrstsf9ebsPe+7RZ88zJJBOcDpJoqeFJsSOJBPWU1RpuWJi3xhSfP8ht/WP8bc5CsxFKTpadAnE9wKM5DivMcUwckdUjIZlopKjiHeA+xZeCUQwPe9d633szBcYPEKaYDttoBD6+fZ8uyNLRpW4LLnWTxgVk9Rbos+hivds/uDbT6uL/BYPDe0Wj0ic7Qb6d7f+37Xd+/vr29veO2vXvT3ktzv3Zwr7KOr/Z53XkNPWI33KFYVleY4swwYb0QD8LYiWyI84fmBl4TPhTUwHZrWIKKikDk4oXE8cfPs7JnmQO37wWrYb6FG1WUYuAmzPQ0s+3HWAolVCHvxN0qWJHPM1GyJLcL6koBvL/GxXt3jaHENCWEYue3MS0wN0TcIViuYe8pKLdgICwfXOJNtxh712H82BmOP61cii3RHJUPJDHmbcQrTRXcuww5FAbuvS7aL6vF46nlrBg4CSgBtTxHfe0a/xdxcb0evVsu3xdR7mpiyXdDHV4E5/KamXOleHfUOXdnCLyt9PLeIHLUaaT0AYci1uJLj/eRpDUSPHvXAnfdtsqdr1/jxnvXYMXYpkZGhxnvfSusvAnsCNgQyKZsQtsd/pBfSXvNmuysYcJMkZALraSdzFxy3kO2nqwhnkK3vkjTPoSzkzjbzslyVoEUoMaZZy/wpWObnDmTmM0CSVp8FdiaR5I4VALiDTHuBDYssZ6ws6aynZI+Ek0nqoqa5S51T3wBqvYKEuarWcdXJRHs1Z9j9+f6x3ab9/UE42610G4SqP98P/c/m83w3r+pqqqLg8Fg5+f3JEJvPliWJSsrK89ubW1J/5yF96hGnIOWrJDZbOCpk1tsvL6ikgGjkQPdYs+g4m333Mwbv/TUsy9/SWU0DlzYmlONRsQkNLFFTCmCwzReTUSK78Z4ABJBDDUFV/LSpeZ9n/i1h+zmG9/NndftRWdn8T77XZglcEJYWYVUEDc32TNYplw1/vt//Lp/9U//58f+dQ3UqQR1mazSZheRfS1V2mY/gkXxv8ACCywIgAUWWODbEp1c84rpXzcz2W3qBwNPPVVirAkoA2B1meIDP3AXQ7tAKVNUBleC0JUctYbLxXaTGFZ7ubRR8Cu/+yTPneefT4FQeWLMJnRu5xu7olr6lxbA50xpNXKrSg1JSkgtS2Lcf3T5gdtvWGK5jMQGai15+vQWx1+KG7XLrtROFGcONb+rIFZUZafY7+Wyu7Ozh8PhB8qy/JD3fq3feO/O5L42dqtpmvXZbPbhpml2ZLfflEve/Z7abc7FjOTybH0+Xg5gQ7DjlpfznsLcocaEOULQXAJuzSPLgzGzpuHkizXLe16mGHj2HBnCeBliBFEkzClki9ScYL5VMdAKhrkIQMZZErxTS2bbLrx9meI/m34phg8D+qR5M6NwruuiZ41+CgqDBl82sFzjBsqNgzFudJAD1yUeeugSp15uuXhZQaEQh1dZouZhsIdnTftzrWNDYBIETALJAqYOU8ldbfnGFRH5vEsbqqwnaE3CPc77w4NQUDlFYsOgEkYevJsjAfaswG23rHLnaw9y7x17qQ62cN0MhoYPa7ilNVg6AO4AxNVOHlKSI0DnvQNDznzv7x+i+drMQ/07RGLbf4FTMuUTM0GQWkjnoH6Sevtx2vYZSi7hY4BYQONhXtBuzHj2qcs89+yE6WxMOSjYrGvmbcQ8aONynzmrNybJ2EhmZ5NyIpqtK7vd/7MHgNJ//JUVAN/0tG2nAugVAXVdb0wmk4875z7UKwl2X++9f0BRFIzHy+PJdD7BJHNPdiUU1SznvTzx3FlOXYhcf90apAmEQPAta0XDe974Go49/hSnt+YMBZr5DPWDbOIaUzYZ7K7Zvuvfx3rupGjESPAe9SUX2oYnT/Hwp79w+t7D330LYxvi2xmIoa6gNSBGCiB4B9LSTp7lbfcf5m+8+zn7pQemkiwSbUBRVMQUOyJb0VcQpT3RuCAAFlhggQUBsMACCyzQBTex09WLqe1qL2PcEQV/7Z003/u2o5TT54GW5D0iRrAc7SZWIBTgA64YsjUf8OAfr/Pph9g7BdQHsBrXmTDJNRsxZ7lw16yBzhJSyxt2B/iUqNTYG+DNt1/PTXtLnF7AKNlKJY+cuMDzF9kbuztsVyYgVuStoDhMtJsvlVd0/oqioKqqtdFo9Indrty7CYL+63vyoG3bjel0+sHZbHasbduvayzcl8crO/75dTiunvno5nJd78puCGknGT1iJ3CyJsiGg0lrrNfKocIgpDzm77qioTCHa8bMz2/hj1/GFY675QB7b92bs+GJFD5QFI7GTWnnJ6ktUNgcN5oSOQCMgRGJIUaRu9yA78YChIYsH9duvDw7g6tW0BUuDkP8DNiE5hRMn8fiWRKX0LKmCApVyXBccnTPKtcf8ag/iXvsDPV6Qqdkv/JUYjHcm5IcHZfuRxvSscbSZ1tNn5tr/GSvAjERxNkrjOT+IusuX6HRLF+pRBWjKIr3D8rynwVszae0Qc1xTfFeAoxKTyk1ThKjJbjlCNx++17uvP06brppL8VqBUWEMGFKJPoKJ1MKm+K6OFDbMUqvEMpMjvW1c9nHgxrJelm32+Ft8utv8dQIE2AL2ssw34D2Jerth/DpeQIziBGpC7ARRIduKw8/9ALHH7/M6ZcNvMcCRGpmSYjOE/EkE6Ip0ex4UlmPyno0W0+qZ3u/DdXO7V4ysamaCSQRf9V1f+3HfyX4213+InVds7W19eEQwnuXl5eP9p/fTQCICEVRsLS8/MS01pusNcziFUdEId/TgfWX2tueOrH57H033sywmUDhQRJDJrzprht5w9Gn7PKT2avzYmuIV0Io6P0F+jtR793CrqcQUyoBi4noWiKwfob7fv2Bp+xNr7mO7zh6ANqzWSjkKkQSTZpl3xc3xGLNeFDjiwn/9Q++gwcf+G08Ddt4tDX6wYS80nr1/L/w5c07FlhggQX+EndrCyywwAJ/yTvHqwuNK9s1varqiC04WkoiATiyyk/96A98JyPZpLCWLKlNJBe7OjPgNCBaUs+VaukgT57Y4n/71ae4NGdDyiEuFKg1ryiCdkQEsnsz3nXmDcogFLSE1LAE3HUIe/0NSwxsSjOf02jBS5dbHjpxlo2+COk7lEQ8EUFR6YgOudLV72f7O7OsteFw+PO7u/vXFgm9XFdVaZpmYz6ff2Q+nx/bPbv7zVIgfLnC5qru6I5Xg2BmbVJOJJONqHIiqjuTjKZNRqPZcb2OQiOOzdqYtoIy5sIGPPHoGR774ikuPHsZ6iG0Y0gDSFBqTbANrH6B2dbjzKdPkHSdwDk8W3iaflqXpJDyaqEklAYldv/PbuOmeX1LgeBmwCVIp2D6FGnyOMoZkmzSWk2TumNQeljzDK8PvOt9d/Ge993BG9884sAh0NTSzCdnvDSsjqqlQq100TasiQ/Gpv2kxoRZwhVQDcL4y9blX2bm+2u+gXBuLcb4qXo2/UmL7WdLxz3j0u5dKY2VKlHJlLXVxNFbHW9+0yrf/b2v4bvecyu33j2k2DeDcosUalLwhLLCO0WbS8TmFHAK3KUryZL5F8sXVaIjXpS27/RLdnmX7gty4T+jYBPHS1h8BuZfwiafo938Q+Llz2DTJyjTRYqU8DOPNCNIK8zPw+OPvMTn//gEFy4I4leJOLbqCREDXzBrhKiQTFGzDUUaRVo12TazDbOrTRhNIPUGevJnXyt/VbD7HtOrjZqmYT6ff6S/D/X3qH6UoL9vDYfDI74IWbFhPZFAF/aSv/bSjPUvPnOC89NEbQ5cAA8hzjg0Ft5z/x3cMOCHfJuD9XKqiHSk7e5jn71btBvrElO8KYUEYoQ61fiRZ1vhoePIA59/jklcAbeKaUkTBe8rCh86X4nsRzIYFUwvneKeo6t84P2HrAJGzPBEqs5I1q5l0ewrE28LLLDAAl/3+/fiECywwALfaHR9+y50T3fZjucxbK+wEiAo/IMPHvz097/nNmT7Jaqco0brcw6zdt/kUgArURuz3Szxn37vcf73392UbYGZBQTDO8mdOddFSMmVjbp2HSPDZy+ApARRBkQkKhVwQ8X9/6e3HfzQd92+xlgvI8DMrXLsxW1+6fOnfvbUjN9IErpccuscqTsjqs5EzlmeMe03ySJCWZaMRqOfHg6HH7o2v/taNUAIgRjjxnw+/8h0Ov14v+ne/XXfuBXdbSp3dVEq/Sx095WezlzPcm9dxCHiSifukIisemG/E3coCKuBKzPqSjbOUwTnBUuJ6XZkPpkznyb2LK0xdAUMB/mcSjXOKcEnRGo0TnA6xfsWcYbD4fB4Ap4u4948og6xAFbgGOAYgniCA3Et6AzieWhegPopUvsYjT2LCxcQmzIwR4glMveQHHiXZ8mXhEMHxxy5+QBr+0rET0HSUttGNjcn/0co0lEzO5NMnyO4w877JXV22kioxVZNrp5Q6JUhX3GWXK4h3q5sCDrRy1VrduVxuWICCHiRFW9pXnruH5X6fUtFfOPQtxSWCbtbjsAb7zvE29/+Gu6//whHX7PMcE+DhE2Sq9GyQkMgFBXBDylTwLWG0xZncygMcQ24EpFuPEgT2BxoaEVI4rqwRiUQ8dQEpgS2EM6g8QVi/Qxp/hhWP4o1j0B8DJdeoJQJzGcwMyQuQVyhPm88/tAL/NEfPcm5sxC1wvyYOimTpqYBohVMG6VWaMwRlc1G5ZGk9kyLnFSzk9oRFn04XT6gbsfcNLvVy1cgAr65RwT6MaTdBEB33jwuIq8riuJ1/ePX3rt8KJi2zdNNUz8iKRFMUJd9KLzke74auGbrv/2OO25YvX5voHBzEKVwASwwGB3gxdMv/J31c/ozCDQoaSc2VnfuP5kAyNvdfFdPeDNEA2ZKG8ANPMk0T4dMNn/66JHruG7vCmKJtp5SBsM5xWIkhCqTtqmlKId4Kzl840383m8/9VuqnMxUoSP14id23AD/ig99LLDAAt8qWIwALLDAAt8ExX+/eYxX73stkLq5yzbCd7wW++vffQ++vUgpbRflFoAGE4geLDm8GT4Jo+XrePDTT/Hrf3CSuoBpC67M8X0xRpAupbkzdbtCAuSOkfSbVwxvkdBtdg+UcM8txeffcvsh9oY5oY5IMaZOFU+/dIoXtvgnTVUi0eEtdkZo4IjdU2QHenN9OzNvoEMIDAaD+8uy/JBzbseZu5fPvqLQM6Nt20/O5/OP93P//eN9DNc3E3pyYvd717EuIpm+sd4OH9swsQ2UDUXOqnA2YUeiQIrQGmhy+FGJ95FJPUedMSpKNi96nn18gjbPcPvrDnFLdQj2OigDThRkSqEtLs5xcQpxC8oLWLiAhAOI3wcyzn8ipQsr7+iB7BtgOGpgA/QyNJtQn4HmJKYnUDmBuEsgU8RFxAoQz47HBAl1DWm2SVkO2HfrHt556FZuf91hnn/+Mn/yhRf40y9c+uEz51tmqX3SlGMCGy4UR8UEjUaLdaZm8iqF41/Stas2qcriJ0ZFeq9L8Uzd8B/GQ370tlvhtTePuf8Nt3LLTWtcd8MYBjOQLbS9jBUtvhpgXonJaKdKURSIcwSJpNlL1G2k1DnJ3YS4m/DFwWza2JkugqOkQnF4GrJHwATiFNIWsE0zO4vGC6T4Mi6dAztLaRcQLoO0oAFaAdsDtsLll6Y8/tBJnnj0NOdOQ6iWmMyURreI4olWUKdEmxQVlwtGU6KynkzXk7kNM7bBjUEnf9Fr468adit4dvuSNE3D1tbWB8uytNFotPN4fw8zy+kcw/HwP0ynk1+0Zp7pJ83JGt7yvSABL1/ipudeOmVvOHorEYePEfEFpUVuXB1y/x238sePPU3TzX1EawiFw1JWFPSE7tXEV46ObMwoymUIW7QxZiXCAB57Hvm1333Ubrv+HRzZtzePkKQJYKSkeQ5JhDg3hisj3OwyNx86yIf+3i2f/egvPC8OMLoUGelm/Rdd/wUWWGBBACywwAILXNsN0SsPCoDL0m1ayrKmjPC3/9bdXHfA4+pNKlGyaSCYCaZG4yG4xMAUdMTll7b57d95hMeeQ5ql/OOLKhKnnpQ8ErpOPPEqWabSN+es61AbhSle8zPeet3I3vOWO7l5HwzSRVzwNBY4c3HG0yfPczlBKgtC7NLlJO7ImLPvwDBveHdszOmL/176v9ZLZa/t5u9WBMxms4/PZrMP13W9U/D3m+3eIPCboeD/cp/zOwQQXbA9iAminSoDPYFQmMmaGQ8nxzia3Rl9NmhQH2jNITYlaUtwAdUR9XyMtZGnHttgXs+Yp0vc+Npllg4OkeWiW+QZXgw05iK+fRkrn8fKvbiwisgYZAkYgx92a1bkIiWBsUXS51A9gzSbEC/h9SLoFsGmBEl5PlyhcQ3etZi2+Cg4BRcVxiNoZuj8FK4sOfSaMYduW+aWu27hDd95iV//ned5/gQfWj/B/RtbfDC27afESpxboXT+YJvmZ4109TX1l0j6hBDeq3H+QBRlZcTP33wQ7rtzxHvedgffcc/N+DCDooZ4Hp1PEZ+gcDipQErEGgaq2XU/FeBGSFESXEFwU+L0OCJnMX+CVB7EheugWIUwQjpPAE+b1y9ehPYcNBdBN0AnuHYb0SmS5jhrKK0FLSGtQKyhrqEBpg3nT5/mS184weOPXGDzYgBWiVGY1pepzaAYEuOYOibaNCOSiYCkbj0lOa7J1s2kUdOzChPFgcVdd7pOzSN/dvH/V4kI2H19737dvU/F1tbWm8qy/HxRFDsEwO5IwdFSxda2X0sTvyHmwDySHE7rXIwLTBM8/PRx3vGGvZR7ClJjVEARE5Vrufe1t3D3bc/ap59V8ZlBzPfLnRfZFeH9+MhVf3FKWg0d+RDBw9xgZvDAn5z9yTffsf6z+991M8NRyLNoKeDNgUSiQVnsQbcjlU+07Sk+8DffzG888Lz94Tp5nsn5XWR2fudwu1JuFlhggQUWBMACCyzwbQXXl36v3BAZO58LwbAGvue7gn33W46yp9zAp5QLMRIqHmcOl7LI02mWeyY35IEvPM/nHuXfxACTeR4hrWcNxIKqWqHWOZAQcztGgFftEbXBO8GL4MWBKZXBaw8WvPP1N7AnvITME4RlJhPH8xcmPHOOz9aQTcWsxFsi7fLAy88SswlUipjL3X/vPWVZfqgoivudc7Rtu+GcW+s31682DjCZTD7cNA0xxh3/gKu6bN9kRcKfTQM56GekXe61m9lGEs56XJPMzkbjZGtyuDZZUvMEHNvzOVVoGZdgzrFdJ6JFlocVvml47pkNLm1vcOu5Ebe9/jCHDu/Dr4zz4H4pWU5uDdgUFy+T7DTNvCQxRGxE4VcIxTL4JaDAWqibSJsu4cNLKOcQnVC4Gudb0AaigkZCLwCXTukhMUf3aYBkmf+RAW5I7ki3GxAKDt28zKGbb+UNb7mbP/7TF/nt33vy/i8+0j57+gw/eXm7+TlLEfPVWUV7zcwrSIC/8PqL8uUEyv3Muu8+9oC3xJCmcYm16/by8+986w2877vv5fW372epmiHpEha3EW1B57igUFUIKaczzLqIz6LMFyYCKWWpT5k9M0JogQZsm1ifY96eRts94JbAVRTRcKlG0qX8Fs+DbiC2BVJToGCpq787E7jkofYwr6CpSFvKiec3eeiLz/PEo3O2t8AoaGKioclKi9LRYsxjpIk5S2CeEq35jdbcmaR2UpE2qR7HbNu6OXbbde0my7L/HW8A+6uvB99tQtp7mOycM6pMJpNjKysrOOdIKV3tGQAslSWXffF3t3z4OVWHmuAsZsNEcljeVjIeftrOvHR+eujwvr34ogFziFNCusyt1+3ljUev54vPnmLuc/HuyKNd1t3QXR9zKRGR/POjcwQGzGKTz/0syiJOwC+N117Ymvzcrz7wpZ+9+479vP5mDzGnSXhXgCswSXk0JdaQJiyVJVM7y3//j97BF/7HT1MDrbZXe5/moNnORPRK6swCCyywwIIAWGCBBb5tCAAvA9QiypyycrR1lkr6ckBqIhQtEhtu3s9/96EPvpu9dg65/DK+GGbTOIm4KuCip0ieUXIYgTklZ+sB/58/eJLnW/75pdZRjMZY3Mpxa2VFE2PngqKEpPjO+T+5PqApIpJnQksc+JItm3NgzB3vv/86rg+nKQfKbF4yigUUK3z+xed5+iJvLyqhTSHLzCXRBkeD7lRSzmZZWRACbZs3xuPx+KdGo9FH++59WZZrKaWdzXNKad17f9R7T9M0653jf/55u8YDeuXAN0UEYO9yzm6T7ysyXOuSsK/kzQsihnQxYF5oBTaS6vHWG2YOVVdEkbdVWDm2iFMlpYK6NbYSDD041zDRBjUlNJ5LZxJPTaacXX+aw0cucc+9dzK6+wikyzC2HPWoCdjGhwrv56huoebwMoQYaGtPiuR8eIQgDSKXCW6eZf5ak1KN05jj5pxB02TH+jblAiJpF1MfwRVQV6AeGgU3AKtorcbcFIrI8orwvd97G29605184Usv85u/+qWf/ZM/3frZjXP67pnNPnvRXCuuuLpYV0UsdZ1Qd1WxtkMe7bZD30XE5FhG29U9NZxI58ZvnU+Fw1kg+EQx5eT73sbD73//O3nTG+9kz56Stt4gzmuqatAZNDQgIXfDW83xigg0LZSdosLaLnaxjzXstiZa58edEaTB9DJtEzANHT/XIrSY1YjO8DJDqDOZQsKaGinK7vkVouTni5F26tl+eYlHv3SSRx9+jjNnayZzMHNEM6apxryjpaCuE422NEmo1WhiS6OsNyrrtcnxaJw0ZXvnSJqilq/FZIJZ52/SGUEKDhPp7mH52P9Vmft/NaLp1cgmESHGyObm5pv27Nnz+cFgcNX9ydqET8qB5b0/O635d/PNrQme7nruvAF9wTQ2nLzMdV88fs7uuf469oQRrUSoGka6hdYN33PPTTz0+Cn7zVOIiZJUcS5zbOAISfCWwEWSg8Y7zAq8RlzPSTT59uwcXJi2G0OBTz9p8sYvPmN79h3mhvEyjnn+2tpR+AExNSgN5fISevEio1HFvbce4oPvOWC/+AfnxCwLTKJmcqEoB7RN6owEQ74PLEiABRZYYEEALLDAAt9WNyBx1CYMh0PmdS5my7KkqWPu1sTIwOBHf+CWnz28FlkqYi4qLG8w69QwMIe1RiEBxKMpEMt9/PpnHueJM/zkxQZwBWJZAlpmlzksNfkO2NdC5vAoZqCSuzNCHjmWKFliDrzx9n3HX3vDiOWipm4aVAJtLDg/VZ45t83MQRsNVLvZfyMpWQ7qApDyxtNANRJCQVVVFEXxgV7Cf6XYkh0fgKIojorITvFf1/Wxv8prbx0JlDvkgDjUFMHlKHfp0wHcdnJ2Vowlg9KwsSFHxDhapogzxVGQ61TLXgISs7ljKzgLWBSsidjUkHqLsj3FoY0JN7z1Bqj8lbny2IJNQBIaI2FQAZewRJbtO48Tnws6jXhT0LzGXXXX2b1LLvhbyZ1nDeTxAQE1bN7QzEDSgHqiXN6qubS1zcbWJpuzCbXWWIBqNGT/ocMcOHiU226+nR/7+/fx3e/Y5nd/+9gDv/KpR8U5fVX5+H+5+kP/zALUujGW3rvu+7/vxof/9t94C6+97SgvvPgMj3zpNKsrQ6oSptuXGY9KBpUwGhYMhgVlqZQFUFh2eWs0ZzoWrjtODhrLSoAiX6ckBdeCzAgGvntyh+ZFsTaTC9ZgqcEsdgQIufivE9QNRAcygGRsXZhz8Yzw+U+/yMnnp5w911I3jlY9STzRPLXTnCVgjlaFRo2GRGtGa2y06s/k7j8nk3Iimj6pygk1bVWtM6fsz2/X1Xm7s+C+9WFmTKfTY0VRfCyE8FNVVe2MJxXeU7SJ5DzFePhv5vPZh2myyZ9HcmKCE6LAZoQvPXmai2+8k/GekhhayiCITlkuhBtXlnnznUf40/Mn2G6y4l/tChkjvfO+7br3uJzg4Mn3kPy1gAVUPI04tkz51J88zxvu3MeB1++D7VNUAwe+QJtIGBa08xlMtnHDismli+w9cAP/4APfwx/96f/3X65P+J8ux2xVkwTaOMdVQ7RpQBeF/wILLLAgABZYYIFvOyitznBAPcty2aJyRBIgLFcBmUfefif2g99zN3uqDTQqzoZo2yJeCGWBxkgRgbIEbWG4j0efm/BrD5zk9Dl+ThUGgwiWqCO4UOJ8Tpvvi50kue3vNSAWUcnS/FRDNQjMolKqcrTi4PfedwsH96+R0sugRggVjQ44dWGbF17m45qjqnPEvSqJhKp0Ew3dHGq/ETWhqkqGw+FHi6K4f7dUflcxt+GcW+sc/5lOpx+cTCbH9FtoA7nTnaaXTOdtuubItBazdTE2ENsQ8yTSoVZku1G9V10iqUNVMA8EQTL/QlF4vBkNOZe7VaWOM+rmRV7aeJnLbot9Ny5x8IZDsDKEojPrcw3BK6Q5JEU04s1ykep9TitICu2VMZZc63XFf+uhcdlIcNbSzjS/zZWtrRkXzl/m8uWaEyc3uLyduHih5dIluLQJW9Ncs0bAfA3hEsqj+OA5eOgmrr/hKLXs4fojN9iFk2ek785/vUY+simjXFW8mhmtwnY6wL/7xDGm239A3Wwj0uZ6PEFVwOoYVpeFffuW2bc6ZmWlZHW5YnXPiPFY2L9/QDV0lKMKypBVEz5lli4BwyIfWAd5VEcR0Uy0aE+6JPJ4hSLOdy+xzAX3DLASrAD1tFPjzKkLPPH4szz71DZnTsLmZteIDSXRHI1miX+rntagIUdPtgptMtrIdpPsgah2tjU9ruo2VHVdTddVQU1zugjC7iXpI0W/nSAizOdznHMfGQwGP1WW5c7jeUUN52B5OPjQ1rD6MM2EpErlAzHFrIQKMG/hS0+k2557eePZ6/bsx2N4bTMx5x2rSwVvev2t3PbEKTv7kspcs5IrdIITk5Qd+ftTWLrzqSNorpbpR0SLLkVmzqPHkd/79HG77cZ3cGhlP027QTlocS6ibaIYDphvbTNYWmM0WqWZ1tx6eMQ/+nu3/4uf+fmn/qeafD1nFlfROEHMdSozXXgDLrDAAgsCYIEFFvj2IgAUGIQBTWwQHG1SUCgLD/PELWPe+48/8FZuWKpx9QbN3FF6j7Zzgi8JRUUzm2aJvkGrBVttxX/6nc/z2IuUjeXmbuESKYFZQK3M9YQ3RPtovgAmXSl3tXReLaA2ZwS8447hmbfcupfCtcxniaE4kgS2KXn8xHlOb/DhtujysTVhomi/8TeX57/NYZbrG+c9g8HgvYPB4KeujcvqC3zv/VqfCDCdTj82m82OtW02D/ymkPl/lcXlbnsAszwC0BdLakZECTii2oYIZ5KlY63IGk43amyiZocNjvQ7+/7nqQiF83j6WMRsujiPkYtbkYm2nH/wKfbfMObwzZscuH4vK3uGLO0ZwlIJgwLSJGeSdbFi9F1n1dzhL5byTHk/tKwCTYJpS5wrs+0J21s1ly5MubwxZ2uz5tLGhAvnt7m4BRdnsDWH6ST70bXNEvOmZJ48rQpb8+2PqMQTeC2TpeNPvvDcMeW5NiXYrMEq9wp/iL+sdYsEfuePnvhwmtQfb+pc8A+H/JBTKB33rI75V7Rsj0pbGo83GVebjCpYGsPK6pCVJbjx0JjVJc/q3lWW94wZLVUMlweMlwPFuIRJm6u40kPYtQ79DH0nJ0d7pYVCzNcy5iEWtHPh8qU5Z1/e4uypS5x+6QIvn97mwsU8mdHisOAxKZgrNMlI5qjNaDSPojRJaQ3aJButcbxRv56UkynZI9HSiWj6ZLKsGFDr5vzpiSy3QwT8VXT6/2rgvSelRF3XbG9vv68oit+pqmrn/pajWJVBVbI6Hv6/L2/KP9AE5vJoEKlFCiFinDPWH3n+Ze694xBr4pC2RTRLUkRmHLluhTffdohnXzrNixHcwCEpX7NZ0eVwNkBRhIhZ7II+uyL8Wm7GPBFPJPFbn578i9e+9oV/9SPvuwtrJrhmTnApj+/EknK0RIqKH62QNidsXjrD3/mbb+EP/ugZ+81HVByZFyQLwBh7R0yRzgVjgQUWWGBBACywwALfPjCUVlsK71EfaOIcDA4sD97VXpw8+He+d9/vfO99h6B+iiBTkg0wSrwvwDlSrQQJWQbc5u7/A3/yHL/+R5MPn5vRSpVHf4m5E1S6gmieJrU4L1kqjOsanC4rAbDsB2Ag1YBGc0f5+lXe//7vuIlbl2q0nlGEEqcNdWuc3lKOPXuWy8A8QVEYKTW5UblT6LosRVXDNBtnDQYjBoPBR0MIO7L/3lSrn68NIfSGWh/Z2tr6WNM033Txfl81CWAuF0xAn5werom3M4xkehLHRFI6JsZGI64w842JO4Ijz1QnsC5iUeeRUowUIOEpndEGR1sn5smQbWX78oTzJ08xXr3A2t4x+w4us//AMksrBatrY6QCipBn2VME2m62Hdpmm5iE2LTEmGjrSD1pmWzPmc+Ui+e2mc+Mra2W6SQxnwrTScv2FLZbOK+w3cCshjaVRA3M1TNr5USr9ogVo3dt1Vt/w1QJlTs619Q2bVaXhDHMor1iBMDMUHFf5npzryDhdiNTYLLzuHZJGN6ufAWdiV2L44WL9cf3LI0oB+5dkzh9sE76y1XgaBTQlp9drgY/ORNFa5g1LeXEKLdheHnOKBjnTs5YGTqWVucsLQ+ohp7RuGC8UjIcBfbuW6asYDgqqQaeImSCKP+uaaeQjDESo9K2iaaNpCho8ly+NGeypZw/O+Hl0xucOz+lqQVhSFVUbM6mTFIkqaKWssGfeXBCrY5aldaERj2t6nqb5HgyzrTGyWScVGjMdEO1L/pfjeb89uv8X7XJ7O5fW1tbn/Lef2Tv3r0fLYqClCKlc6SmxgfHymj4E/Vo/A/mm5s0mrJFrICq0Up25//jJ07xnre8ln3XCcQmp3NERXTGSlnxPffezMNPnrazZ5Fp0mz+h8NEMQJmBaA4y/Escm3s7M5Z3imGGNC6luc3m3/9S586/q+OHN7LW153HdacROMUV62wdXGD5YPXMZnWpMvnWFlZpcSj87P8kx/7Ph7/l7/xU5c3+VgqfGacBDRGPLyqgecCCyywwIIAWGCBBb7F4YiakALapsUXAdrI9OLkwXe/Fvvg930HtvkCo9EMKZQ6Rlo1Bgi05E3k8gjSFrEWzsWK//SbT/PSJT4+VQjOYaqI5hquLEtSNGJqcT4/nl9FPwpAN0ueR5S1CGg9ZdXDfTcPf/2+W1YZpg1m6igHJajSRuGZM5s8cbr5WNttJEVkRxGuBn1b2hmYGs6VFIVnNBr9fAjh/t3F284mtCMAVJW6ro9NJpOPzWazncSA/nv+Kq/9VQWoSTf3n6XTyVtel94t3brF6ZQAKDgnhw1QtdKi3A9WmvSRawIhZJvBZGhrtCEQLOGTUUSjlIK2hsmmUp6fcf6lmlPjLUZjT1Epo1HJcOgpKwFtSG2LWoMYea5bfI6CS4a2uQit55H53JjXUM+zt2CMgSZ6YuOom5Km1TxLTmKOMbNccEYz5sT12rljSXSdQo4aHI4iJxvSehSQKhcOTd2dV19m7v8rpy/8BUkakasi31qM8d7975o0zYOX57MHh1XF6rD6X2JsPlvX81+sVdabpBul455R4X54VI6RAC44agFJkXntkAizRrlwcYIQ8UEpSihKo6oCZQnDylMWgnOGI/seJBIhlDsz5W3MREATjTZCUk9sPHXrqGdC3QixWSLFQIrkmX4N1KrElA0Qo+U1jSbUSWlyhU+rdrxNHGtNziS19Zhk3cw2VDkbjbNqRuo6/maGiaDmds7uK9f2txcREGPEe0/nXcJkMvnYaDT6aAghqwMsi+CdtgyLwMrS8ifa6fyDGhsKD4V3xKhEhIE3vvQc8tjzZ+zOtRWGSkfIGY5Eadvcd9Mab33tMscnW8X6lBbXiUOEjgn2WSlCnvfvk190FwkgxhVPABmyqcraYMAfPz6XX/rUF+3O17yfQ4M90E4hRQrx1LMWH0oauQTR45eG1GfOcN9r7uZDf+/1H/0f/u2jH6ub1MVo5OdbbL4XWGCBBQGwwAILfFsW/+DBQZtacLAyKIlt5MYBd/zD/+pt3HrQMz1/AVkZYJowGpwE0ApaoXRlNvdyJedj4Fc+/RifexihLLDaEYn4rkaK0WOlIi7vwLI4PCK7jKGSy7ZdRQ4jIFoClJtW+PHvvucoB8YK7RbDcgmra8SEeQo8/PxpXtjmIzrIJmOmDb5LHbPETrydaS6kyqJiOB5+aDAYfQh0J0Krl/T3/xcRZrPZJ7e3tz9Y1/U3Zczf1+I86H/XV+aKX/nYIBuDiSDKSRw0asfUsaFGawYp6lqJuzObhxnisr+DOkjJqEmUzuF8wEelSgVBHEXhiVGoa+PypYiTGhFlaZwYlI4ieEwjpEi2ixBMlJYmdxd31ldIKbt+J3Mkc1khEANtEtrWM2si8yaxnWBTPVspG8y1xnakWW+9HYuinzOxZrtuP6LdpdLG/CYenFSoxK7DeeVcSFkP/UoyIAejfeVCvyefdpQCVysBQudWn3MEjIuXzz84Xl7Ch4Lt+ZSYZv9kaVAcLIbhvWpyMDpZc84dicHRuEzMxJTyXL0pPhlzLxTREwpHkJIiQFRHijDbbvEOCqc46UZ2rDc+VJxrdwwJk+VjHjvTTTWHiaduYDZXYnKYCmpCitCaEUOJ+T6lwhMTJBxJjXlUWtMmYutN1E+1xnpSPZOMs9HkjKqtYznuPVsSdOM90M3/d3oWM1SuVge4b5NJgP487I1N67pmc3PzTd77z48GQ6KmrBDIOinG4/EH6qXZwe3Ni2fVwJPNFE0KZl45nyKPPnea976mZDigS5UQvDeCzRiFine9/ia+cPZ48/LTSRqBKA5H/HIBl1d9tLMuoiAR9QOa6JkXg4Pz+fzsZx6a/cLv/NHxn/j++w+wLyzBdMJgNGTWtLghjJcc062LjGQvo9ESs8kJfvi9d/NLDzxqv/84YpVQt5Jn/8VhtjACXGCBBRYEwAILLPDtBum6wC57gNVbU/YB/+hv3Xn87ffeSL31DEsH1sBqmqgQoAj9vK8HH6i3ZjTDEWfngV/8tSdOXGggFUOwhIjhylyItVHz3KiH4LKMOo8Qu66jm82iMMVpNxaQGgYCt+/lF95+1w0M/HlcjFAF6ktTSj9kEguefnmDy0BNCc5om5qyi5TKDafOlloNRCiK4uBoNP75EDwxNjvS/36j3Hf+QwjMZrMPTyYTAIqiyN3PlK4iDL51ioVudhpBTPJ8bBYGYORUBMyIphtqrjG0UZgk5UwSzhRw1JIC3Nk6IdYtpRMq7whiFEEJXjtzMMFcgVeYN4ZrFHFQOE8RPEUZ2NpMTL10ha/DU+G9JzhBRTGf0M6zQLs1S120YVYHGHUy6kZpo9FaolFhnmA7wjQJjQVaVZIIET05j/XPtcmOtUA54I7pnCetSw1zCpoCyVw2KZOIaPpLWZtr1QRmxqCqunMxUpYFwcO8bc+28KlxNfy7UaRx5jZqE1JU5ilSBqhKzzAIpUFMSuEdRZvTGIOCbxXvoCoCTgyv+czwZPO00F0r0SyvQ3f8oykRJWq+1JqkmUwgEBEaTUTN8+AWPPMUaVIiaiAmZd7maMokgaSQ4Ew01pNxJr/pelR3NqmeMKM1676+K1T7RIuk9m0v/YcrZn+9CiDGyGQyOVaW5cfLsvyQamJYFqRkpBQZFBXD4fDnZxP/IxoTEruK3BfUzghEXrww4dI0cV3RdfMl3xclKq6+wH1HD3Lfk3t55LlznGRHWISYAqkjadw1xX/P1nadfyImjjZOKcdLXNrePjscBV7ejv/gl3/z8Z+489DbWD6yRoWCJYaFZ9rMEFczGBYwM5DIMAiXtk7y//gn38/6//jr73phwx4cVkPaumZqC/u/BRZY4BsHvzgECyywwDfs9uPLbJkfFFpYMfie12Ef/pHvZP9ggndT2naGhpJyNMRZi7YJZyPwOVfaV3s4VZf82//fH/PgQ+yZCzStEIqSRIsqGCXiyhwRZwkkYqZ4CmJMlNUAE0PTjMILQsA5EE0cXeX9/+f33/ujd+0Txr7GEaHJSoTImM+/cIlf/Mzpd1/y1Qt1K1AUOJ0TunFqc9lk0BkUPjAcDhmPl3+trKpbEEO7Ai6EzMf2sX9lWXLu3Dlp23a+O95ttxT7r7oXgFwlje6KTCF3sdGODLD8EC4TRkKXoa6tOS4oekLRFxGdINYoetrQeVTdEOduUINWDe1M2hJKMqHFSJpoJaEC0QlJjChZTtBoQnxJo+QuvnnUPK066iTMk6OOBfPomcfAvPXUyTFvHdNWmEbHpDWmMc/qTxJsx8SkjUxTYmbCdqO0yc60Mf1G0+qvtq39fjK3afjSCLQtJ80cYgFLATQgFIgFcF0H0UnuOHfnxe43NemO3pddgWveri70nbjsXSFdF7eXU3c/34tH1HCWfQLElEI8pS+PYkxEHYa0ZrKZE/z8Gk5QJySNGC2ttDTWMreGxhKtKCpGFCUmo9WuoMcRzdPSxfLFrsDPsXzUCo0m5ilRp8gsJeqk1ERqVWrLz1NbQ60Nc21QcbSaRxDqNnUKAiEmJRobUfVYNDseVf9UzU6q2rqaTNSYqOYxE+18EbLyojMBxOU10WxGafmgXemIZ2vKHWXLtyqcc6SUdiJNgd7c9FfN7B3D4eBoTG2+N4YCXAFwZ0rt/5raeiJAKEsiZXcHaCgaXfmuO/a97eZ9S9mgs/CZahHDV0Kaz1lauZ4n1k/+9Avb/EyqAqUqLiniArZD0El3ZQhYiVnIEaRY9pmQRHRKcgoh3xtcSmxd4Gdsfu6n77n9dlZGAq6lbbYJTimLitQqvlPQaDSGoxGDIdxy08pP/P6DL/9MnVqoRqQ+p5Crx776vwO2IAgWWGCBryMWCoAFFljgG4TOVd0MIpTAkSX+7n/9N+7n0GhOmbZJ3qF+RERp503XuQ05S10TpkLtR/zeF57h04/yqboCGKN1Q2VKC6hzuQg3CJYN/XzX/BGfC8rWFE0NziCIkoCQIssG9980+PXXHgishDltWyM4vAjOF1yaBx4/eYFzcx6cl3YlgFpBQo40N4CkKI5QBkaj0f9SDcp3wxXTPzMjxrgz3x9j3Nje3v5kjHFnA/21nOn+piIBdn6nXNBKX4xKPi59Tw7pSlkTpPPuNgURWudtA5N1VBvzTNRcU4jcI6r3OKQsOilwmXKigEPxQG2R4B0FQuhmgp1B4YTCCy2J3C+Uztehs8mTnFOOc31UYbdGnRQdIWEkcbRqXcGqNOqok9Goo0lCNDsRNT3Sqn42qqyryhnDt6bSmLKBBaQvHhWcSpb569XpCd+Q4s7Apb6gzYWM64kq0RMgjQoHYyYV1jC3ppq21eTeUjMxZskoFHwwgkGhSoFQpkTwQiFZBh4khwC4jqBwlt3bpUsFMOlHdoyoRqtGtEwUxS5TPlk29EuWqaVkBpqI6oimueNvuZPfqm3ElD4b0eNqup5Ms+u/uW3FWrO8vvTnYU9XiXSXf58uwlWjAN/O2G1sGmNkPp9/ZDQafL4qA0EcGg3zSlVVjMfj32nq6X3NtAWXshsgSuvg4ox//syZzX9235E1ViVCU2NFhVrCS8t4UPDafRXf+8ab+eIDL/DSvEHIP6JJcyRUCC43+6U7ETttifR/l0S7sZcENgPNJMMswkWF4y/U/MGfPMcPvOUgq6sDCjdDTZHoSC0gkcJ5HAVaz6lsi3e87kZ++F3P2icf3JKNegJhCeI8q9Q649fe0LI/XgsSYIEFFlgQAAsssMC3HAEg1mIaCcCSwN/6/j3/4e1vPMASM2wyIZYDrCiJTNGolH5I8CUas6xfw4hHX7jMr/7+Ok+c4H0yctlkj4SkFuc6Iy6Xpf1Eh7OASG8elTdaUbI8dOSgRJlIlke9dol/+ddefzM3rXnKMGM2SfgQ8JKLuLNzz7Fnz7Fl0GrKpmwxF5eajaTpGz3BecpqeP9gNPzJInhijKjFHUO/1EWaiQht235yc3Pzw23b7picXT0b/y16RkgXldj1rdUMj6CSK7zdH4t0hXCX/mZmJ82xoUIbxCaKnlFLE4esJXH3eG3XonNLQQ2nhu8iGQOB0nmcCagiplTeUYijSDl73ksuuN1O1Z1l5JogWV82XBkByDPoQnKSs+NVaFPnJh+FNiltSg+npMeS2cmUOJ6SPWkq28k4m1RQ850iOc+uCwbde+kKWCdX+/jvnBvid73OXZ+/NgVArkkBsGtSAHrFSRdld+UcVEDwptlDQ1JH5uUPzaw1504mbMPMHXVYacYJC3rUop1V7Gj0HG0pc3FvghchOCVoHtkoklC6/Dtm2X+3BvlqwbHLxZ0uIFDJig3L6gc1iCIkE5J6VIWYEqo5g166665Jipojqp1JqhtR7Xir+jmDJhrrqpxRZUMth8ip7urq9wQV1rvNQd9l/jKwfDC/7e74vSKgizE9tj0tfiEUyz9RuZI2tagoZVUxXhreW89H72pnlx9Uszz7Ynm8YmMOj6yf511338bSconXBh9KLMbsuBk8B4aRd7z+CL/5zAm78HTOxAgFzE3xXhH1aG+ugevO+6wwMnFXjAN9d41oNhA0l8+vJ04hv/VHT9k9R/dw78oQ8RGaCYjHuyKrcpwhzlNf3mLv2hplmvGT/827eOTpX/vSF05zX73LvyOllP9W6ZWzJoTQH6cFFlhggQUBsMACC3xrIDvtRwYud+Tfchf2I993PyMuQjNDQu4KeQ14J4g4nBVY8iQVYhiyncb85z84xheOI62DFANiylIo0BgR1xVCEkEcKg41oeg3XykXMoiCz4W7AKLKWOC77lj9F289eohKL0DMJnxIASkx1YLnLyWePMNPZPd/xVsCMxweTQnrHAiD94yGI4bj0SfEBaK2qLX0Bnh94W9mtG17bDabfbiu650N4m5Z97cKCSD26kWRWY56sy6cO5tzWVf4SxZP93JryWMEkiTnPBoTEsdNbEOFw2rgYC05PeONQ0n1qDM75FXXsozdUThPG0N2l08eh9CaUCL41Cc6KOK6VIKutDNRWr06gi91gpbUFaART9Iub94gqtBGadrkjqVkx8xkIyU7HpOuq+oJhTYrCbrzwlxXaLqd4lIsKx+cGMkr9iopAF+PBIBX/7ifpdadcfdEXpOkinNMMFuPxlow3WijPqnYURU7mswdjQze5ZCyUMnz/wI+GdEZpXPUnflfcOwU/+Ly8XemvUVkPk8snxNXDBglr4fkj80gaS6yNEHKVA0xpUbVTZJxRlU2otnJqBxvE8dMdDuZrqtyNnbu7cly5F+yLDvvu/2pk/PvqAvYCWh41evVuoL2W/oef809a/fHTazZnGz+g7IMP1qOqhLx3Xx+oigKxstLD8y2pzKPCSwTPVURaJvIoy/WzfrFVN6wOmSgM5zL5ELvCUDa4qa9+3jPPbfwzMl1zs/6Pzhk6UqUPIbR3YTE9KpRDLsy1UF/+XnzBF+gcc6FGr70vL772DPnHziw/yau37OKEnFqFD6gTohRcFozHo9ge5vKFxxZc/yzf/gd9/5f//UXuJC2UeeJXc3fF/+9r0tPCC+wwAILLAiABRZY4FsGHqiAJYVbDvBr/+hvvY3Da1DEGXUzoRrvoWwdaMKZopqL91aNJELtKz59/Ayf+vz02OUZVMMVpvMZvvJoiphkibAzOpfp7ApuAmiWECuCdJ1F80JMhjYwMLhxmX/69jtv4MhKwXyyjQ2EwlWkaDQuMHfLPPTiaU5P+HcyAlrD6YzCSswHohrajQMUZcHy8vKzYTg82sQWp7P1MoSjauyMAXjvaZpmfTKZvG82m11VwMm3aLdQxO8YMLJTzOXuOaKIkx1XdekM1nrDrtyZ7tzgzXLlmX/CxBzrip0x0cYha6py0jk5rMIZh62JUoqwZsjhoO6I93msQGJ+XwZHER2h60BnsgB6eXCPqF2HznrzxiwN15QLz2wIB0mlJwCaqHI8JTuetGg0FWNVjrTaPqmqS0ra6CXq2vX6kc69Ho9YJwsWh9JimjI30Becuzr8VxEC/PnMIq2fvrBrUgB2lAA9cuGfXJcv0Nk49H6Xyayzc5RMylh8xDQ94pytpcS6F+5wyrpLsi0SjrYiR7zTteCgECP6nP2eiT/wYjjXFZO7maOdCls6Mk1IalhHAAghd3Q7os20i55TRUnENF1PcCKTA7LRFfrrMcl6MreRzNaTyYaqZRKBjnhSh/Zn5a4UkZ60unLce4qiLzTdrqP6bUDy9l4UnYqpl7r3DPB8PmMymbxvEJYeGJYjkhipbTExlpaWmCzNfqjZ3Pxl2hoXDO+yMegLG1SPnLhsd9+wl/0eylhjltBQ4HyAecueQcO777iRz/3puv3RCWSSwHxO6BBNu5Iu8opIl0TQUzoKWJunulzsvlrAXGBikZdmPPhrf/wM19+wl6XVGxgXCdoLmaxwYyyRCQZJIAFp5ohN+L633MEPv+MZ++Qfbsq2JqQzdr1W+r9bDbDAAgsssCAAFlhggW8JuI4AWAV+7Afv+v533XsYmT+NhJZyPCA2NcE5tJ7jXTY7iyaEoqJNcOZyzX/61BdZv8SbLEA9q8EXlEXFdD5hWHqcJbz1MnzFXIvZLtmn5A1XDgQ0ZgalwYEC7r0p/JvXXr9M5eaY5EJHMWJqUJbZqOHY0y9xkU5xXYM3pSC7ijtfkXQG3jEYDO6pqsHR5AKJBoc1zisa3VWbvbquPzabzTZijIQQvqz7+rfqGMCVQrY3/bvS3VaRTgmwuwbMnXFDUFJn8m1Yjtye4NzZfmzAmU1U7KQz1rywpmKN87w3pYQ3OwLdaACGRYiq2RBS8vPITkaYwyyzDdH8VbWoZOf4HTM4nKHJiMaJPEOuG8k4k5IeS2obMQWSytlosq7GhnXmh0pWN6h0QvU+HWKnLrcrsvtvwBqJCCquE+Dn1+dM0W7JvJC9HLqRAlXb8OIwSxuijAFU9KRD17ylVhwTkpWorZmTo6pKcjkVwJnhPJjTbgRkF63RKyU634jUqQCsU0n00/iy+zxSJZmSSNtt0k8l7EyXLtgklY2U7MlkdkZhI5psqApqjtSNPSiCOenW+0pMYjb06wmaV87+Z0WHfUsTel/uXNltANiTACaKKkzmsweHoT5RhNGRULic9uKVUFaMxuP/YzKdStPO8YC1hni4FOELz7zM9969zIEDFZbm4BUl4KQkhimla7hz7wpvu22JR85ss9FC8oBGSkqwtHP1uJ49REl9KGG3RF4hWIFoVuAkDzHAlsFnnkDuuv0lO3xojbtvWALdRGdzXOHx4vEFbF68wMqBg4TJnKEzZpfO8A9/5Lt49NHf+J0vbPC+OkaKosB7T0pp0flfYIEFFgTAAgss8K1NAKwC73vrIfub77yLQTyNaENdtwyGSzT1LBu2NTUUPrdvnIKHc+cv8+AXXuYzj7G0RRfzREvlhpC6zmtQXNspwxWSgLk2d5fjIEurBaDdiX/CgTp4zQGx733DnexdKUjthKoYoO0M8TXeV8wa47FnXuKpk5t31mSLAZFMaDhaWjPED8A8g/GY8XD0CYCoCfEO7+yoasw9RPGo6kZX/H88pfQKqf9uQ6hvVTPA/Mt1FW4X7Xal2svrk7pSz3XtVi9d4SfWZXhbRw70M9m2rsIZZ1Y6sbGIlSJWOGENp5SuPRKpj6VEKQZB3J0mctBUDiWVtWRF6XaJg01s19lLJ8/f1W03RbENUzbMbENpN1Q5k4tMOxuNE2p2NiXWk3KiFV1KIhvR2l3u5FkBodLPkefPIZZjKuniJa1TSuB3Ovz2NS4wr5Vt78ytm4F4khV5iUxxxFysd4aF0m8xnMMlQ7HCiK04nYjqunO2Rph91rBjCodB1jrb/MPiOIq6o6raisiaw62h3cT/zrXgdoq0/P+0cxn3xhsppWM4WRORNSSfG6q6rpqORzhTK58z/DgZE01sJLUzqpzRPBCyoZ3JX8QwCfk5lY5k6Drcqjs5Fbuv0R07gK9wXL+V0XuXXHv/yldqJnaapmFrMn1PUQyfHY2L/LV57RiPx2xevjyezeaTQqBtYFBAq4EnXjj/E8+/tPYLtx/cR0DxTmgpmCdDvCA2Y6+rePfrX8OnTn3JXnjRsoQlCoX3pNjkBIdufCWPASh9qANA6Stc6yg6742WFhPFKmgSXJrCg188yQ0ryr533soNSwXOAiB4dWjrKKoxNj2LrKxgZ+dUhXH3Afj7P3jLe5/9xeeZxnwMROQqH4BrPQEWWGCBBf7/7P15sGTXdd4L/tbe+5yTwx3qFlCFwjzPJEgQ4CiK1AD5abAtyW3w2ZaeTTn6kbIt+YWk90xGWHa/sBzd4ms/uSMsRzTZ0daL161um7Qtym2RljiYpEhxEIoDOGAuEBMBFFDTHTLznLP3Xv3HPidv3ltVAIgqEiXW/ipO5L158946eTJz77W+9a1vZQIgIyPjFUcS3ZquWrLdA9zlKt2XnblSJ52W7YlvFMC+ZX7zv/vrP8T+QYvM1lOlzhRsnZgyGo2SqZPthqATaRuYUvGNx1r+wyfWOVKzVXfF0GFVEYDJZBM3LAC/MAM6xX59nhYlDXwK2gl5o00/l8i4UG66sOStN13CijsGYYY1jrpR3ECwwyEnppZ7H3mC5yc8IC71+xsDtgDf9hZxYK1jeTT+N4NqcFPrPT7qZlGaJatF2dTTj4ixb7amWPPeH5rNZu+r63qHbLZPFE5V9f9BcYnug+14mkRp/qZaQACMGqJIN987Oe/38byi3fg1BdUti90yyjExMha0NBoPK4KG+HElPCuRBsAZvc0ac6NRSlEzttHfYZSyu95rUdLjVPUYxC0w4/T1/HyfVNVj/SEia0F5VpVjQXkyookQ0NRTHow/FjSNJtSFZ6manoNqRzqopsRj4WrMP0qvkMu8qhK6d7oghFSjTamdpkkZaWJBNxZPQotYTFQUe8yiBO8/boWLTOSQiI4NjK3oRUF4wJiw38CSiI5F4lhE1kTs5aQe+ydAS8WU3fVqFs7r2PxW47OoLCXyR9ZAmxjjoagci8qxEOXZgKBqyt7sLyhbKGDMOKhvk/anU3V0C19//U1Mzv86fx1M5y1gIBu4zyv+fTLbr2PavZ/FCCEo0+nWoUlZfaCslt/lynSB27ZlWC1TluW7CsO/dA6auiNpqwHf2dj8377xxNHfe/3N+9hnFFuabjpIxDqLeAXTctu1F3PLJYe49+l1ng/pZbGFofVhIQTuWnv67gRNZKRId97djID5S5okH4QKvvYosn/4Hb31iv1ccOMylW2AQGhbxA0pujGa06eeZLj/RuKJGa05ws/+xG385y89rn/+WJTDkzTBoiwdTaOgFo2L/hon769p7435bZaRkfGyY/iMjIyM7xoWg8MSULz1qam/y85s6HOxQerZNgGo5yZ7lYHKw//jH9+pr7vUctXqEGYbaDtBqgrE0TYzisrS6pSiVGIrBHMhX3kc/pd/fy//5SubEksIuIXYqKuEiu9c0/uxZLLQB20woUi3TmjaABisCYhOuX0fn/oXf+11b3/dfmU0bJhurVOVK0QxbDQTzMo+7nl0i3/9h1/n008gx0RQUZxNTzNGiFiMs+zZu/quwWDw21VRrsUIIfZmcooScLZkMpl9fGtr6ydms9mOis+i8/8P7ga0/XxfKJDtr8PibV/77iN2WSADbPe4NGEhdl4D29VIa9jfvVmPWZHLmb8ztHDG3CYia6JxU0TWjMhFoM3i+RiljBKPidjLVHYmnSnxlPnXKmZJVY8F1SdUpe3uRzE0KFHMdlIUu7FyfYW7G4Mo3W36va7nXul6T8wusuR78Dq9yPsw/TxiJBk4WuyO1zi12aSqZvLcSK+VNQrisUiRrr+sidEli+wXYclZ+6ZEtJxsGikiaxFp9BRhzPz1CPGQSvd3RdbEsNZ9tg6FqIeaKA90/gDHovZJfpfIq9J/HFU6FdGu12b3NdeYpO3fj9fkHEnxX/L75lTXwhbJ6V6DYTgcsra2dt/q6vJN1gqpDaqkbVuefeY7S8ePr28VBThX0NSRcQy86TL0t/6PP87te47h4jqMVwjGMJtsMR4twwxqs8SXHl/n//z79/CZp5FJ165SOEvwsp3wz709tl8/1CTjSTXzNSpKxJuO9A6R/cuO6rjnr75xoL/2d97MVRcG/OwIlbXQWqhbKCN4D8UYXMGJ2Tp26VKeObrCr/zPf8CfHUa2bPo4hwYKlkk7WEgGtrbejtgDlDENJPVdy0JGRkbGd4usAMjIyDgDLEiie/1tN5osJftJmlsNK+pJzaAC61NM8z/8ndv11dcscdFgHYwFYxBTgk9uYoWtaGODK4dsrB9lsLKPxw9H/sMnvsZXHq1vmpgSlxz9toduSW/K1tluzSXLZluSTC/ljnjfOZmbggLFerjpovHbL121jOwmWk8pjMUHRcoKxNPIkIeeeZrHjvILbRfkGkkBWTRK0IC1QlFYnLF3WDFr88BSQ6oemfT42aw51DTNB7z356XcU8/wd1XTGMB5gtF9E/qRdX1/uPZJqHTGbXKsC/zbSDwkkhJQi7koKvcakYtETGlVCBIPp8cmQqDjuPqzaILq4Z3Jvym2CQHTKhzWaDbTz2l7o7igkowCu9Zw7RLQzu5wm2ygu19TtRntRTS6nai8wgRObw+YnPlT4jJXrqR0mSCSZqVHWegkSOoblfTBFZFjEmkjUojRNgbzALBpYAniZk8SdEn5s0FNe+rkv29bMMe6S3k4kTrSEQAciiqbQXUzqrb9+6cnWcK8l0Dm5o49+bKYzO42V0zrisnbwkuEbwLWONQqbVsznW794mg0uMeYak6yOOcYjZc/vbE5ubP1qdfKOEvTBJ44yk3ffOzI/TetlCwDaItGoSxLmrbBuYLCKFetlbz1lmW+8fwGdYyYwlLXAWuSF4z2Ph+9maXuJDiCLH4aTWorU0MxLjmyvsle4MsPzH7vY1948Jfu/slXsVQuEdvNZE6qAWKZegbCBEYVxirSbrJmlP/xl97C3/sXf8Z3IrQmDbjs7DO7PSzuWvQWzy0n/xkZGZkAyMjI+D4imSV1CUAo0GDAeHrvL68gWlNYR721zqgs8LOWEviR14i+464buaw6jq03mTVTCjFYV6USemrIpgiCnwWcXMiJyQp//JUH+KMvTd/87CYPFEV4AXfzl1I5V0KcYV1JNAbilBXgtqsPsLZnCH4DgsGVFbUHjGDdkM2Z4b5Hn+HwFv8f3xMAZrviZ4yhLEsGg8EdRVHcvSjV393bP5lM3tG27cG2bXf0y2ac5hVbaImY35dK5PP7F69xXBjTJ9KNFDQG2yWcxND9jBYiUeRJEbDIITG6FHT+u2tmZ/QNxE0V1k5WAMR28dyiLCSMUbpEX1FJKoBeXg5JSbK7srxtcvfKX/eX8vNTta3E5IqHkcW/E+lpuRi1N+prjZVjihwjRKLEQx1RA3SKDHRpvgapHlNMsTP5P+ncenKh6AkcVT0WY2hDl8T3qgvVfuqBbJ93l3jtJABOXmd+8Kv9L/+9c9o9JIS52WnTNGxtbR0cDocHnXN39G1QzjnG4/Edo9GI9fV1QgiUZYkIHJvwwL0PPsJfuvlVLA9HiejTiBuOqLcalIAxgQvXVnnj7a/mD778Z//q+ef5VVumqRyJmpq/C+dEwIul1T1RIN4QYyr0P3acv/uJLz31S7fcdD1vuPEi6lnDkDrtiWYIriJogxWhcgUzP6McLXHna6/mnX/5Uf2//+HTcrQFzwjPpHv3mW1fi44LMBjafhRpfntlZGRkAiAjI+P7CpmPJqfUVLHwndle0k12bQDBUxkwbUsBXDLkxvf+8s+y7J/B4fHTmlYUyhLrDBoUry02KEYss83IcM/lfPprT/BvP/k0T035ghRgNBAloi+wjG2bs+mctujmpoEkCbIxLT60aIi86jL05ivWcK7F+yTRRw3YNH4QO+bRp47z4JN1F6ItpINdj6tzjqqqrhmNRh90zq0tnoe1th/5dMx7//HZbHYwOz+//GQ0dGMeRXYlGnrSF9vu9YutFQuqi0QQpCQ1irQ2cqyPug32WJj/rdj5Dygq8XCU9H3QREcF7X+e/n9NDEEiq2Lq2hWdd8svjI/r+/71pMTpVPd9vyvNL8Vg8HTJ3uJ0h8XHxH60ImDmhooxeXQIRPSYIXbz3RVRPSyih/vnHjVNSjCdaaLp/BRO9b0aWos5HEW7aQ3aJfrbndTzVgzMjnePxm3juh3Libz4c87J/wvft/h5rOuazc3NO6uq0tFoNHfFL8uSpaWlj21sbPxEv1a6Uoi18tBjGzx5rOaSvXvw9XPYrmJunCARfDvDugGX7Vvlxovdrxx63v9q6z0mjZaYv87Se9XA3DvmxUiA6WTKoCrwtLQOvvEE1370sw88ctXFb+Gi4X6on0GlQaJCUaQWJQEXBRMaop3g68P84n/zBh765h/qRx5GIoHaRlTBxERBhdh5yuDSu7Ub13kSJ5mRkZHxEpG1ahkZGWdEAqSFxOPwFBhs7+RuQMoU5A+No1BYBn7jl950/60HHCvhGEU9Y2gqBlWBOmiM0johaKSua5hFimKNB58KfPjTj/DVJ5BJAW6QgqIXjX7UbDvLb4ecnSFhxBnQGCFGViv40dddxbV7B2icpPZqBD9rMdbSqjKJFQfvf5LHnkeaPlBcmHMNUBQFg8Hgt6uquqZP+Bednbtq1wcmk8k7Qgg7Kv+LVdScQLxwYtEfASVokv2jyYE+diMbVQwqvRHldt926I7YjXWLCEG7aeAqhJhMubxqIrWiElLLL0GTuiVoR3jF7rb7PiJ4VUJUYve4qAt/f+HwsfeMSLLzbS+A7efSqwiiMH8eYF4xpchuYmKRnAjIDk+D3YjbthyJwFElqHQHO16LdM3T9d9+HbaveauJzkvXOI1d9PHU3/ev4c7bXvbfS/zTeSRPgO1xgjHG9B7rmxlUXjTBzZ/dl0YIWGvna6e1FhFhMpmwtbX1vl5N1U9FWV5evms0GgHJNR/j8AKPHuairz16mKkZdsZ90M4mGAPGRkQbCDOWbODNN1/GRQ50Bs65OQkV58aOZvuQk49t2X1azwe2wDnHTGDDwpNbHPrEPU9/6JN//gQbzQqtWyLakia0qVvfGprGg29xREJ7gpXKs5d1fv2/+0vcto+NkinD0vWTLbFACRRzy116B96MjIyMTABkZGS8ckvIYseysF1ZCS1UFUTvGQE//+aR/uzbrqd+7mGWRzZJsI2lwEAbaEKDJ/XQO6mYzQwNe/j/feabfObe9XIm0ATDzPdV353J4O7jhcmLvn0BRhZedWWhP/yqq7hoySASMWVqR1ACRWmRYsCzE/jKI89yLPRjBd08sBWRXvp/V1mWd/dtAfP/riMK2rY9WNf1+2az2Y6qapb/n+IlWhgh9kKv7+l+9mL39URAkub396VENMRuHF+XQPaEQFCDB4KalOQHmSf7sUtcoy4ksvOvtUv0tSME5AXfu6c631eKaHmx+1/stTjJLG9+/3aPfVDFx4jvxuz1pM42+ZIMFLwuEixyEqmy+5i/nv3fmxMNHQEUmb8Xdlx3OT3Z8VIT3IwXvja7CQBjDG3bMplM3judTllcQ6uqYmVl5YMiQggBHyIeONJw+CuPPMuTx1vcYAyVow0NxgnYiLOKSM1SEXjzrVfwuqvRAiD4Hf31cdfSqy+680Wcha2tKWqhVqgLeOwo7/gPH/1zPvXnj3KiHsJgmVAo3vi0voeIURgUjnFVYHXCgC1uu+FC/uZ/86qlFSBMPYvbh+3+PyUm/xE5FbGdkZGRkQmAjIyM73lEZyCmQMQDNRDxKXCKFmIBWtA2MAJuO4D+xt95K3Lsa+wdOJj5VP70DTJrsW1LiDVRG6yCkYpJGPC5ex/nj7/87c0nW9pieCHEirqh8w2HHUL8vuKvLxYgdb2+MQVXB4as/fBtV3PtRSMGZpYqTyLJh2BYohoIpuD+Z0/wrWd4xxTwxs1H2IkIzjkGg8FaJ/3fMcZvofJ/aDqdvruu62MvllBkMuClJBUyP9IINk0VvS7hS1mczBUBu5PDvrIXYKESLQtJOzuUAb06oD8WH9OrAsI88ZSTlAHzv8t2NTwq80p/X/nv0VfUtyv/507ydjpS4FRKgJNIDQQlkSuJbNEdibqP28fOpL1XB3QEzG4Vxq7bnmhZvL//fvv16ckY6aYAyI7XJOjJz/9Uyuuc/H93JNKprlm/5jVNw/r6+jvatt3RtrO0tHT30lKygGij4l3BBPj6Y+29X33kOwRTgmpSExgD6sFFrLYsFS037B/x1lcdYH8F1gdMXDT8gyhmx9GrAU6V/EOkaSbp97RCpcQMhmwqHHxU5T/+yVf55qMbbDHCVhZlgjVpcg7iQArKomS2eYJi7wi/8Rh/5a2X8Ld/bKjLQBnS/xLYdppo6Lc1C2ozCZCRkZEJgIyMjFciuusSFZPM+1vo+mldcj62Q1xMBMDf/8XXcMl4k7WRh1CjPkAnw0ShEEtlAO/xTaAJJRtxlT/8zL08+DzLM0pm05aiGHSmXDtypZeB1GdZKVw04A/uuHofy7bGhBqDpfUpzmJgU29qCNz39DEem/Khev48t6v/1lqqqnpPVVVri5WtRZPAtm0/NJvNDnrvTzJK2x0QZwLg5SWpLyRRP+noE+8+KV1QlOwgA1TwCFHtzttgusdYNC7eLpAMc5l5qlprhPgS1Qzn4vX9bhO/UykatgkOnSfY89dCd5I1/WuQknXbvR52J8GisSNf9KTvE+Fy6tvF12beNrJwvlG+N9fmfPtMnu69EWNMoyG7JF+75D3GyNbW1ofqut7x2MFgwNLS0geLogCxaFFRA489z2u+9tAzbHmhnXqQAo2RGAJoIIYaZ2qWzJSbr9jLvjF/VJJa15LHRzyZTH4JCMDq6jI6TRb+3kemAVqBrz7i5eBDRzgyqWjF4tUDHmOk2ywjcVIzGg5BJyDr7L/A80s/9xZuWOXflDGmaQPd/xN6bjD3/mdkZGQCICMj45VDnI8Bc+Vw7v6vRegy54KiqRkB/+jd1+sdNy2hW8+Bs/hZg5QDtAvAcCXNZErZKktSMNnwaLHGnxw8xNef1Y8/F8EOBzgTkHrCsHK07emWtO3D+4gxrjPei2lGuU2zyo1JM54r4C03rr791otXaadHMTZSVQOMODweCiGIYbMVPvX1h5kWIKWABowx8yR/PB7fPR6P39NX+9MMeijLEmMMm5ub715fX39v//imaU4r+z9/2gHMCx6L1f1T/nwhFlZSxVcXfs9rTEdXYZ731AclBsX3lfs+KVSdy/jnsv6+p1856TZKpyJg521ckJvvkJ53lcX0/52qBSA913kFck5UCBq3VQj98b0mCxZbU071ftzRM32qcMI6sG6e5J1MDnSVd2NRI+lY6LneVl/sVAqc7LGwfRt7dcHC79H/zU5BsPjzxd+fH13P/6LCRFW698d32Wp0Hib9L0XdtPv9tMMcMkaapmFjY+MdkHxVILUMLC0t3T0cDvFBmUwb7LBiM8KXHzzOU0droluiHC0zbZJ6gOhxhYLfQmbHueHSNV530+pPDxRMgGFVQgxoaCmtw2hEQ5gTQL0/wKn2P+Ngc2sLZxxWBXzAFjDF8LyH//yph5uvPXCEWsdpxK0JUCjRAzJGqBBT0NTruCWgOc61Fzj+T7/ytl+6ZszPDoBIRS0Qyu2IfTAcZwIgIyMjEwAZGRmvHAlgDPi6BqBaHaRo2sLQtoyo+ctv3KM/+rrLuXiv4MTD5kaSxMewbX7mW6rxHtqNmnZLGC1fyifveYj//KUHefAYP9HQWS+FKWiNUUvp3ItKIBdNpMoyqQ2898l1P0ZshMvX+F9ff90lrEnN0tBgC8HXKTmndDTeY0arHHr6OI+dYGnLQNM5mYXQ4pxjOBwyHA7f3xtL9cFs3wpQ1zVt235o0Sxwt0dAxiubtJxqO+wr0/E0twrJrK//vv+5vHBidL4U8F7M42Cxuqu6XQXub3uake4697fbMz22jSBfzm3/OsUstjknMZlMPjSZTOjHpMYYKcuS0WiU1lpjqaMwAR57lmu/9e3nCG6FySxQuAqxBRoC2OQHgE7ZM1ReffV+Ll3l1wygvk6UkSoxJFbZyMnrs7JTcRZl+3uriouKiSBqaIxjKvDYMaqPfu5bPPjYBuVoP21dQ1NjVtZALWIrcA41Sgw1TNeRcII33LCHX/vbb/jwABg6QSW1sAyWBgDMttbJb9mMjIxMAGRkZLwysAaV1A/pnFCfmCU5v6kxfou332D0nT/zWq5ctTCdEG1BoxYzHBDaBmLAx8AkQowGCWO0HfHAU5v84Wce4AuHkONAWQ1xEhGTvLijVyRYZE4A7O6RTt8v9uIbY1ACISpiUpA3MvCqa5Z//Y03X8FQJ1gnIIJvmzSyzxqmapiaJf78W9/m6RNsITZ5B0iqJBdFwdLS0scGg8HaopS1JwCapmEymbyjaZpjfRDbn0/GGSaYu1z+T1YG9JXpdMw9AuQUpl8Lvesv9UhJK/OK/nZlf3fluD92VpD789r+m9157fKyUNnd7vLKegKc9vXYpQRY9ATYeX1eiARgx62qnPT7p7vO3/WxoF6Iu77XUyhMMr6/mM1mbG5u3tm3AsQYcc4xHo/f5aoSrCGIoRU4POXQn9/3FBOWabxgjAMxtDGk5F8C4BkNhDtvuZSbLpPfGQDaBgqBwgDaIqT2LKPxNGvO9kSO/r0uNNjeu0bTnthaOFbDp760JZ/4/GM8c6JEyyWCTeo4xRJjAJTCVBg3QK0lNBvsGU/5mbdcxTt+5BK1fkYxSMRyuzWj6vZbTU4i+U2SkZGRCYCMjIzvI3qXbGtSNSKmhsXSCkXbcs0a7/x7f+PNvOG6JcL682wdOwGuwpZDECFq6sSNqgRrODppsaN9PLdZ8MH/cg8HH+WnpwUwHALg2ynOgSuTRDSEFw/J+9FSQDdTGqwF5yyFwv4xb3rDrZdx8d4BErfQdopqkwI6B60aZLTGt0+0fOG+dbyQek8hjZkyUFXVNYPB4K7dff/WWrz3TKfT900mkw9573ckRpkA+D4kpC/iYP9SJwq8cOX61Pfv/tmp/nZAX/4Uix/A1+dsP//vZsrCS3nvZHyft5g0FvDgbDY7uPi6dIard0MAjYgztMCXH2x46liLdUt4H9AIYhyEANGnLF8brtg34PbrL2J1kJgdK1BYEAUjqUEkKbVOk2DrIrGYTAGFiJkTdjFNiRlanvPwx587/vmPff4xJmYNu3QBk+mUaISgAbxHA0CBDEcoLaw/zTg8yy//zbdy2+Vs6CQZ0ohPvoZlZXZMMMjIyMjIBEBGRsb3lQWYB8oelqyhapUrx9z4P/7Sbb9353UDRvocAwPD4VKqyBCJTYtgUB+wtsDYitaNeXpS8NGvPMZHvhzvfHrGR71N1fa6nhLaXsqZJJFFYU+zpG0va95vj5dKiTkYI6hGoodr9/H51123D+IGxgbatgb1DKoApkalhPE+Dj56hPufQUoH+JBMCCkZjpYYDofvL4oiJXQhpLMwBmMMk8nk4HQ6fW/TNHNiIJv7fQ8SSdl5LL4PtK+673h/pOq90Tg/JIaXnfSdLnE9qeIvEWR7JgHsUiLsml5x8vM5Nyv/J12PvoJ+msS7r+CLKLtnq5/KKyCe5jhzgkB2zXk/ne9ExisSoBpDXddMJpN39ARqbxw4Ho8/SEwJdAgRV8GDTyNfuf8pTLEE3uCDUBRV6vGPAQYDmjBlpOvcfsMBLrmAoxK7YQEkAsAZYbvCDhAXPqNm/rmcf14xO9oBpPs7CtQqBAv3H+Et//ETj/KFb66zqWvY4QAxDcamPqLYKDprgYCrDNBSyhYXjY7yj3/5x5cuBJZ9YND9/baN2/9ZRkZGRiYAMjIyvr/5f3LNsmX3rY/sAX7jna+9/6feeDVjjqCzo5iBwRRpxrMRi2IwxuFjqoQHD0FGfPLeb/PvPvXYs894Dm4aaIKgoUviHUQ1tF4JhOQz+CJVkLZtOwOypAQoCouq0rbKwMFrrx9z+YUO79cxlcUVBjFAEdA4Q4ohx2eOP7v/SY4rDKzgAqAObMny8uofDYfDu3qCAZib/7VtO5ev9j9bNFTLFcbvc1L6AmqAl6sAeOEZ9/n13W0i+GLH2b5+L6jeyFX/vzCf2+l0emgymRzqSQBrLUujAXZQJuJIUy6+BXzpm99mMg2U5SCFuC4ZCIoxUBSoRLQ5ynWXrXLdlfvWKtNNlOk4KNGump8aQ7bJvLkZ4HbYPOcB6NuKIirJtUKAae3xZcUM+Mq3kQ9/4n7u+/Ym1XiEqQLERDIUZbeBBt/55xqM9Yz9cd526wF+9a/frEs9HdWdL1lBlpGRkQmAjIyMV2YFURCIdgkljfv76z++pn/jx17NanOEoQZsZYlhg9pvUIjBadH1Z9rUZx/ATxoeeugJ/tMXH+DLRzkwGRTUMsJEQwmUpUNcQQwOtEQsNGH6kvpyRYTQuTonWX6Kna663G68/tbLWXKbaBGoaTHOAh5MjUhAbMXDjz/HVx459ruthThTBlERLOVg+Y5qMPrpvvq/OPKvbVtOnDjx7tlsNq9YATv8AXKycTayg5298vO7T6EEAOZKAD1NoiEx7FAFfDcfA3OKP9oPA+wr/9vvydM8h1Nu0T+42/TJRErccbwcMmbxeCmEw45zOUlJcn68DucqQgg45/Dec+LEiWtns9l8jbXWsrw8fhfOgMDMQwN886GNg488+jiiafpD9BHEpOkzTcAVBUWccOHIctst17O6wn678OoaEq+9+Nne8T7Z8V0EDEFKAiXBRMCnbTE6wNCoIwxXOQF87muT2z76X7/Fw489CjpLf9sHKAQpYiIEgqfVlqAt43GFOfYUv/zzd/JX7yy0Apo4f8PmN0hGRkYmADIyMl4++orFjm/EkISRDgvzY/tnBgLYwhCnmxTAnbei77z7TdjJk5TMUkVjMKalgQLcuKJpZvi6Sb9fLLHlHRttxZ997RG+8ggyM7DhHcFUgEFDS4gt3reEkNydXTHEe+ayXdE+aOuiI7WghsIaIBJiIKgiFDiFtQJedfny0s1X7kXCJq5UJu00PbeQ+kpxltpU3P/E8zz2PL8qg5IWKKxQ2ILxYPhvnLE7Epk+qajr+uMbGxsf6CtW/f2LBEDGK5d09oF8b7zXy3h7o8DemO/FsGgmeCon+V55Mk/uF24F86JTLM6fEKRv15BUjZ3L8L87AuHlegjkz+S5id71H2Bra4u6rj+0uJYOCvdOYyLGCHWbiv2PH+HOrz56lOfqAtQR6mn6tBvDrN7CFgZroZAJr756mUuWeaSX1ivgSXl42gY9SIPBd33+3eM6gmi+7/RGnbvWAVMUyQembfDG8fSUr3/sC4c/8idfeoxjfgUpl4mthzrtlRra9PuFTf1mWxOGpmXYPMF7f/nnuPESnhkApVkgAOZEp0Mw29v3qTb4Ha0MLqcAGRl5983IyDhvM3+261vS39drDamwMqCA+ZHiDQNSYKRAZpGRwhUr3PjP/tFPc/GeEwzKCYQZuBFszTBlgZbK1G9ih5aiLDA4NpsCu/caPnHvU/ynzzbvmHmwYgg+UpUOjKIm6TOdAWcV7z1t7TB2D1GHKEXvpd4ldga0QrRA1BNCk2KdylHXwhi4YczH/tqbruDCsceaFh9qytGw8xkok6q0GHA0WD779QdpA8xmihuXbITAeGRYWx3cVlbbfc5VVeGcYzqdsrm5+RNN08yl/n2CcSqZ84tVMPvfW5S/xhipqmquagDm4w6ttXNFwg/+2zfuPJRuGHx37Njqdvb/L7rAx123YYdz/4sfi4/f7Swf+37yrl94fos5qeJ8cgU6vshxjpMtJ7nqv/CB2EQuiu3MNndOcTh52sMLHy/0mmk3vpGo80Ru93HqkOlc8gb4bs8nfpdH6sP33s/Xov7r05Emp1NYvBw456jrGmPSRJfjx4+/48SJE52iKjIqizdXRUFUxVZCo7AOfOhLT/BE2EtAKKRNGb1GnDbQbqHWon6DW/Zv8DN3ri6NbPJ0aQVaLGVZQdCUMwudwV/EdaNj+ys5/4xKf7269UPSZzs2NcMCrM6w4pECvnWMn/n/fnaTP/izDeqwjAkCpkTrloDHOGE6a4hqaUVQPJXbYt/oCP/4l99w0eUlxTBA1SX0xTjtzEKBxTC2Dkeyy5m/R2TnJi/d43MKkJGRCYCMjIzzNPlHdn47/6Y7gqaaqN3xIAFTIUEZAgfG8E9+7Y7795THGdgNcB5tG2gbKAdYWxADFIXDWkWbGU2r2KWL+NzXn+Az9z7OMw0fmgDRVIBlOpnMZy8bpRux1EmqMemM5hXU/v5FEsBQuFTtATAWrFEK4I03lXfdsH/AUDyFFcQExERM4cCm9oSWgiee2+LQd5rPewVTlEzaFnWwtDT4g8JuJ5nJZ0Bommbe9382XP4XiYNF8kBEcM6d9JhTfZ/x4ttg3y6w8/a7eJ3kpWyzJm+7+fr8hcKpiEhrLUVRzNef7yV6U9XeYLWbqvLe2WxGYR3WWkpbpDa0qDQRZsATG9z51UcP49UkQinNlKRI5Xp8VKLWrJh1Xnf9GldfIqqhwRa2U5ZZBmU5J8UFXrAlSLqfJeJum9grCpv2paD4AMGk83v4WeTDn36Ye+57jlDsSWSDc7iipGkaRsNlfBsolsbUfhORLSo5wW1XjnjPu29qlgAXE0nVTlusLVEMK8t7rpkFn/br3iO3V+vpwtZNnCsaMjIyMgGQkZFxniKy0NvYt+JqJDne1aQJyinfNQqECuOVEZ4l4O/evV9/7I0Xs1q1lMZCABkt0ZoA1mBCQeEdLggSIq1GqMY8dbzlo5+7ly99A5kCNeDFUI7GEGOSYc9l030hI3bSzBbEw+I85L4SIy1qPEqSFKNgo0LYYmjhda+9ngv2LiFqMOKASIwNUkiaF20Fj+HhRw/z5NO8JQVUivfKeLTE8vLqz+2ugnnvmUwmH9ja2jrYtu28Mn82AvDd3xtjKIribhGZtxUs+gzkaQMZGRlnvC/sMi9dGMF3R1EU3xcCwhgzJwBCCGxtbb1va2vrmDEO50oGg6X3WzsgBoPGtBMcO87Br379W0zarroeJf3Auvl+Rzel4oZrr+DGq9dQhbKTfYTQJlJPwfQVf0nEcpyr5hb8PV7g/L33aWRu1yLgHGzW8JVvbcq///S3eOCoJQ7XUCPQeopocVqhwdDWm1Tjkqad4oxhyVn+8tvezC/+zCW6CgyTECKp3Igc3Th+yA4sYd6a5EALiFW61X4fbZG02+Y3eUZGJgAyMjLOK+huEqDvpzcQU9XESACJeIFWUqptKakwDJkxBn7+hy/Uv/kzb8BOn2BsG0z0tCFCWVAMR+Bb1CsFDto2BZTlCus65I/+9Bt87t6t33o+QiwgGEkmRzaZNmns+oFj59SsimpAaRBtMIQuCNuuwkaJRPGoRNqoBN/pBWLABrj6SvSaK9YoTJsM+rAIgag1mJagHoqCSSvc98B3aAFXgtcasSVLy2tfs2WBV08kye5jjGxtbR3c2tp6dwhhPgbwbGH35ICeAOjbAfr7dpufZWRkZJytJFxVKYqCqqre8/1YX3rDv8Xvm6Zha2vrJ9q2xZqK0XDpXWU56No+0tbRRHjo0cMc2WrADPBaoFExYkklcElqL1WWBo6brltltQATIoOywMfAtGnStBfdHv0XTN/7300K2GX+ubttJAQlxOSTYwuh8R0JUMBM4GMHNy//z1/8Nkf8kEaGNHVEigFh0mDFMZ1OkIHFGPDNBqbdwjXH+OW/+Zf463/pAq0C7B0JECjHAzBQt4HRsqX1vWCvV8u5+Z6fLS0zMjLyGpCRkbHgjG4xWGxnrBd9O48WUppZ4SgomDGm5fYD6D9854+zqke5sFLKdoKJNcZEJvUUXEnjFSGkyrppkfEK6+2ITx98gv/0qccOfvsY/3QK1M7R2gLVQNM2CzOWHKIOExfl/g1IkxQAsquKIRE1LVECYkrQgtIW2ADLBbzljgvYv9dSmBaJimoy9rPGE6UmGCW4Ec+diHzrgWNzOWVoAsPREsPxym0hRoKGNJ7QGJqmYWNj487pdDqX5/fy1bMRgJ+GBLimqqr5Y3a3CGRkZGScaQK+ey2y1uKcu+tsrW8vGKDuUjX141Ynk8nBEyc2ngVDNVyiKkd/y5gijZeV1Az29GHe8Z3nN2nMEtFWeCwYIWhMBICzVFWBMOHOWy/kpqtQ48GIohLB9JXzat6KFiQSJG1N9gUsOGLnSGMLl9ZrsWAsdUjTCrwKrYXHap788OcPHfr4wUdZD0PKwWpi2TVQSGQ0GjHb2KAYD2mnWywNFds8y6o+wz/8xb/ED92Chi1l6Dze12mjEseW32YiZFHfp51hLtu2ABkZGZkAyMjIOG8jvZ3LwtzxX9l2BzSGSAS2GNBwecVP/fLfvpMbLlWK2YkUELU11ghKoCgKYggYI6lh0baoHVCHAV97+Dj/7o++wUPPcWdbgJaWWRDUWCgMhHo+I7mvYsxd2ftqv3StAH3QJQtEhkkKAMWCWsSDaeHqSzj6htdcynLlKW3E2TQAyhnBmgjWEwto7IiHnjjOY4cRQfBdsLe8vHKftQWRbSl+27ZMJpP3zmazuRHfXPp5lgLw3W0Anez/2HA4/O3+/9vdkpCdzTMyMs40AV8kHjsFwN3OubW2U3N9r+G9P4ngbNuWo8eOHZjUM5xzDIfD9xeuSom3JiXAiU0+9MBjz7EVHVKOEOPSHiGKGkGNUlQFjoYbr1rmLbc7xgWEaY0quGpAxHWVc5fSaEMiB15S/3waVahi8D4SVbCFxVhDAGZq0OEK3/oO1/7bj3yL+x+f0ppVmknAlhVCxDlLvTWBKAyXh9Cus1w1lP55LhnPePc73s5VK/wt5yE2k8TSSwU1FGXZTS9oSQMS/Qu2K2RkZGQCICMj43wkALrgIFUHBNOpAOZLhRoMLQ647gI++Df/2iUf+ckfuZjJiW+wMi4J67PUOkDqmyyKEoLHFRHcFHVwPJR84ZuH+cNPPczBx5EGaM0SXgZ4tWAU6dkHSU0JqXly2/V72325O3VdHL20sKRJpPXJMNCEyEjgzlvN2g2XLVG5CZYW68w8aTcGorREZ9hoS75639NsAIGSxoMdGoZL45va4Lv+/iRHXV9ff9/6+vr7+pnVffJ/NqrwfQVst6w/xkgI4eBwOHxPL8/dTRxkAiAjI+OMtoVdU0z61qOzqXB6sf9/e302O76ezWYcP37810MIVFWxNBxVPwVCQFBgqvCVh57j+RlEVyLWYBwYE7GFYAuDGBhUgdXBhDfffjk3XY4WpDaC4LeTZcWhuLSxybb0X15kiW2DgnFEFbyPiHHYoiJKgdcCb0pmBg4+iHz4kw/wtUdOsBGqbgxFhGnLUjUmTmsYFMymR8CcYLwCG0/fz5tuWOK9v3zH74+BsZDMDoNQVCu0tV8YZdh2R0+Sb++lGRkZmQDIyMg437A4h1ygN9RLgYPpEvDucRIYORgJvOn24u53v/Nt1JOHGLgN1E+xgxHGFuAFUw4JG1sYE8AGmhiZ2BGHZyt84p6n+cSXN2UKBLPErI40rUeMQmjQdoalm72saQiYiszHtPWz13fMXdde5LjQ3SgRYqQwlorA2oD9r73+ABcuKyUNIU5Ta0MXNIkIKpHGGNabIQ89sZWCOCBEWF7ec3dVVSSDvwJVZTabba6vr793NpvNpf8xRmKMZ8UlezeJsFgFizEeKsvytERDJgAyMjLO1vrTE5DOubtORTp+TwPVzlOlbwXo19n19fV/6UNLYQ2Dsvx1a11K9LuWtQef5N4j00grFnUgVjAl2NJiSwPGMxgA/hi3XLWXW6+3rI1g4CA09XZ7mXY99LDtCqg7w+dFMqD3BYghUJYlRVEQgtI0yR/HRyVopJ5s4AbL1Ab+y2cn8pmvP01d7mdjBhgHEexgjDGOsL7JYGUIWqObz7NvjzD0T/O2V13I//wP79RRBKcto/GIdjLdIfGfj/ft9siIJWJzCpCRkQmAjIyM8/Pjv+CyL6DEjgRIdxS2Am+6YETBwxtei/4P/+Au2sk3GNgJRjzetQRpoBwCBWx57HAIcQYDQ1OssFVewifvPcF//MyxNz8fYSYDmqhYY3EimNhiiTiNSPBYAgZPn9pHBJXUCtD3ZC4qA3qppqjZ7gUwBmsUBa6/nGdvvno/A51QWUFDAALVcAhiCV4IBmQw5onnAw8+wa8k8WTL2p61a1ZXLvhg2zaUw4K6rmlqzzPPHF723lMUBSJCL4vtZ2efKUJIPgOLEtgYY//3P768vExZlkCSyvaS3bOlQMjIyDh/0a8/i20Aa2tra0ePHn33S5kCsNuM9LslDXrPgb7tqSdV27bFOiFGz9Gjz7+3LB0rq0t3jUbDpBKwSfS+BZ95bhowgwG2LJLR67DAlQJOwQaC38TqjD2jyI+++Sb2r/DB2EBVWaxpUOuZu+kTQXsC2qT96FRhtHRj9jp/mDYGpHAYWxBVQCzOClVpaKcTgi04DvyHTz3/kf/0p/cxc3vwsaRtQ9qYpSCoBSnB2GQ+axvGcoI1nuOv/eit3H3XBToGzPR5HPV8osHOCwp0O2vIb++MjEwAZGRkZCySAMk2yBADOGORdsZyAasV/L2/+3bG5TOMyuMY4xHrCMZT6wxPBGeThN9PYWIGvA4AAQAASURBVDRm84QnDq/kKw/P+A+f+DpPbfKFphow6ZJ4wXeOyjFZBdDFZp3EUliUYnbJfjeiSbvRTNAn/4LpjY4UUA9hkxULt99yGfuXSyoC1qRKUu2ngIc2UhQD6miYxgHffPh5jkz41w1QuIKqHP+21QLEY2zEt5HNzdkvfb9elt3jALv7jhVFwXA4fNeiQVYfqJ/NKQQZGRnn4XawqwXAOXdKX5JXCqqButl6Xz3bxDnDeDz+mFiL94mzPrLFr3778DpTD2JMcv43ENTT+hmIRyRgS8fQRa65dMxrb5a7iwg21kk2j+/Y5o5Y7vgMFU4pod+hBHgRkb02U5xVZhGOBnjiBD/zqa8+zee/8QytW6NYWoOgICVltUyMJU1rUWvSeRWBoZngjzzIr/7tn+KaNd5jfGRkIaiePN63UzFocrEha8QyMjIBkJGRcb5m/Lu+TXVx7ZoBwMSWvQODa+B/+ge362tvWmPgjlPYCTEYoqYKejSdLL90MAhJPtk6Bntu4asPCe///S/y+W9F2XSwEQUvhmhSLcLgsV3Sb2OSUHb+zygQRVFRoizIL7WX+ydSQEWQrjfTRoNVcKaFCJdfzMYb77iGC8YWGxqiD6hEjFNwsZtvPSTomPWZ40vfeIJ1kvy/Ghfj4Xh8tzEW1UDUhtls9sTGic3/TfXk6tb3qvJ+KgKgqiqWl5ffv0gA9KMBMwGQkZFxpgRAZzgKQFVV/UjAY+cEAUCgrqdsbq2/z4iyurp6VzkY4hVwcNzDg08+x6QFjIWyBCudhwtob4wngsVzxcVj3vbGG9k7gCJ2PLPx21l9pyzrk3/tVAAqu31pYrd7xr5xrSMD+iM9xiqUHSHhgaMePvvNKP/5sw/zradm1GZEHQIhKESHbytURpiySptlCOBnXLTs2Tc8wa/996//7RHdHtqdbtiR/NvuBFswHrILQEZGJgAyMjLOR+wMbLZJgEggogQMEGeRt96G/o2/8hZKf4QwOQoxIjiiGqwtusTTo7EFE2htwYau8vjxAf/Pf/dFPnHPTLSCWAg+RihsclSW0wQi8/OJydF/0cFYzfaUQDrXAk2eBaYLrKxCVabj9tv2LN1w1QqV8RB8qpQ7ix1YMBExEFoh6BLfebbhgUeP/X4LRAduUL6rKoc4V6Kq1JPp5mRr62eatnnBwPlsEAGnCrL7qlxvOri8vLw4GSAn/hkZGWedABARBoPBe7r7Dr3yBEAEVWLrmWxuvred1QyHQ5bGKx8zAm2AWuHR7xzn+OaMGBRUu4q6xRZFZzhroIlIVFYH8LpbLuU1N6FOwMjCDqMgarCxU8eZ04XSfYLf8wZxzh/s3hGsJU0IiIobDGA44liAz32zufNDn/wah440TGWEmgFtIxALSjtCbUmIBpoWBiUmnMBvPsEPvfZK/g8/uVejQjWEIIAkA0NBuv9/YQ5g7hLLyMgEQEZGxvmGiPTjjBYJAEMqIUhL4ZQCuLCC/+mX/1sGzRHM9ATjchnfWFwxRKPFRkuFRUPLLNTU1rLhlnl0fcDv/r/+Kx/93HMSDJiBEFvFuNTXqRIJJnZ9/WmEU38EMQSTZi+rRGLXV9kn90ZNCrYkzpcyIWDVY+N2C8HaHn7qzW+8ij3LnlIChVhUwJSGKC1NnICNNK0SdA/3P3SUp47wi14KTCkUlfsF6wSDEn3Dxsb6FZPN6dcLcduFoe9DMLy7DaCbBMB4PMZaO/cc6AmA74dLd0ZGxg82FpVNw+Hwt7u159A5YTLaEa2+adjc3PxQjMry8spdo+ESdQs18NTzs88fPrJOGySZ+TWBELuNzhpMUaTpNa7EtDMu3zfkh+68nLLL2NPI2RaDxwWHxGREG4TTSuhTbh13Htod3fcAwQqz0G+7Qog2nfOUg3/4Z0fe/idf/TbPzCrccA/OFJTGICh1E2hNAUtrMJuhYcbeJYPUR3nb62/DAK0HjAHZpsotIf3fOfHPyMgEQL4EGRnnNwmQAhazQwGQSAAIMSkAXnMjeu0ly+jWMwwlUsgYx2qqLgSP+IiJSmUMZTWkliWenpT8+08c5EOf+I40BorRMlvriissMbRoaIgSCZ2xXxCHUqJUBCmJuE7aT5L+9/OXFUw08+rKzrGAyUsgHRA9XHsNH7nh+gtwso6NDZiCGKHVSBtrVAI4xdqCthnxzfufZaIQnFCOxtcUVXkHKHVdM51Of2e6NTkW2nY+8u97GQgv/u3dLQYxRmazGePxmKWlpbW+/7+X/+cpABkZGWeWX6e1pnfhr6qqH3N67BU/NzVYBCNC9JGtjck7tjYmlMWI5aW1P1OEqIZjG7zjqe8cQdWCLUll/zSaL4RA1EhQA1LiZxMqaXj19ftZHfOmeT+/NIi02GgQLZPvjImp5U3NaffVdJ7b22r/vXRtBME4vIBzFvVKXTdIMaIdDnlsg8/82489uvmpg4d45vAmIjap5ZoZXkGKIRQVm75FxgWEGWujiofu+xajCmYeEJP2cvFpqg4e2xkZZhIgIyMTABkZGef9QmARiu1IpTuiwlIJQwNV3IB6k2o4ZnpUMcWFRC8gEYkthBZjQSg59J3ARz7zIP/+k0/9ypEAdkU4MdlAtGDk9hT4FqFBTUyBEI5A0R0lqgVRbEcOdIn9QjWlVwKk890OtoxGtp0BYHkJ7rzjCvasKLAOwXfBjxBQMEJRObSd4mzB0aOBhx7aTA8pDOV4+K+q4ZgYPRub6x/Z3Nz8jRC6/y/qCwbOZ9sLYJFs6CX/s9mMpaUlLrjggqO9D0AaU2jzmzojI+Ps7A8dAVAUxXzM6bmC/lzqumZjffohomE8WnlzWS2DHbEx5cmHDz3O5sa0c521CAYRS4iRtm1RW4KPmBhwccplFw+54Ro+T2/0JxHBY9Riop3vj7t7/08VYPdtaWlv2j5UoDEClUMoEN+ZBhrD1JZMC7j3MZb/4E8e40sH70frBqQBnTBwA6IdcKKuGV64h1jXGJIs4av3HGZSd8SECJhA75s7H5KrsKuHISMjIxMAGRkZ59sCEEmj9bp2x7kaIBrYbKBtoDCB1ZUl/IlNhuMl4iz1wDvnwBlQRdvI8U3ly994nn/7h0/+3nfW+de+gqMbihgo3Yh6s2kHzlK4XkO5vQzpSwiqdiTaajAKQgvSzqWZkOyOLtnP0TtffQlDV1MaTRUUoxTOMHAWIx7jYDJpqGPJE8/XfPuZ5EogIgwK99PVoAANTDe3fqaeNhg1GDEE/d5L7BcT/lP9rGkaOiPA+biufhxg9gLIyMg4G+gJzcWRfOcE1BGDQaMQQsusXv+F1k8oioJRNfopUcN0Cg88CU+dUHQWu0RfMVEpXQUYXGHRUCMl2KJl3yrcdqOhjOA6U1qIBBOIJoDG1H2m26Z+/U7Kru/6e6LsvAWgbSEKrQ8oUJQlQQM6nYIaXAnfehT5+v2HqcMsnYxTitLSNA1qwaOYakgMlknreORxro2QpvHQnevia9ldt20j3YyMjEwAZGRknD9BHZ30v5PZI4pTcGkMQPJYig4sbDVgC8dsBqYcEM2MIJuoUUw5JEwbcBUyGvG5g/fz4Y8+wuOH+bvTCB6QAowpUA0YNMkio+KC6fr1I4YWoUWou9uQqiVq0mi/mAIWnfspG8QXFFLhbEuIDWY0ZKrJ4Kk08KN3sHbzJcqqVfxkhjhAGszAEusNqiIQtjYYr13MVFf52Fce5mjHS6yNl9+/PB4QmwnrR498YLKxibYWoSJ0/3YYE+5Kzl+KBL9/3OmOxdF+i1X9XuovIhRFwaWXXkpVVTvmdbdtm9/kGRk/0Ii7jpcS8i0eL74+9bjgggvUWsvm5uZ3TTD269J3S0r2v3dqNZUhBgtaQGHxopyYHmmPbTz17tDOWBkNP2JCgxTwhYeRL357xrRcTaZ/NIivoTFUxRKEGS2b+KLBmwlWD/OzP3Y7117EPaaFwqd9py5nMJohTWSkBS72Y2p3Xv9+XG1/zD1uBKIqgQAxYFGsBqyxeAu1tqhpO7N+h6/hwiXuXj3gaEbd/zEYMKs3KGxDVYJGD41gzArfPhJ4JnJoJoC2EOJ8Lw/0vL7Z9v3JyMjIBEBGRsZ5zwaQuiNZMAWs8AqbmzRBLapdMGYDuIj3TQpkyhIEjm9NeProBt95jve22osJBMUS++WmS5qNJldi0W3DJMRvH3Pn5VTpXwxatxUCgnpNY5IE2q630oeWfRfwm7fdcCF7Bg22bRi6EpxA167gBIghPR/vOD6JPHlsyiSCtRWlLe92Ytja3GQymbzbYrBiiVGTieA5sHo2TUPbthhjWFpa+u1F4iErADIyMs54a+gSd2PMjkT8XPAYMSb5xITOB9ZYmExPfGAy3by/KArGoyGth3UP9z52nKObnhhI9vuiXXKcNhljFLWKmJblSjmwVnHrtUt3jAVM38hfgO/2SdPG+ajaFyNf9FS3omncbVehV+gI5QgakQgDhowG8g/WLtqDHRdpxK4zOGeoCgENOEnzd9UMefy5DWoS6d7v4RIBdSgVist5f0ZGRiYAMjIy+oADiNIXCxYil4gqPH+Ct0za5NovppOYW9u5+XsoCzApULRW8A2ft11yzymSdz1L7fHWGqJEREAcaABr0jlfeSW/ddttN1GVBRoaitJCV1FPGbyDKEQpaYJw5NgGT33n+MEgUA1Hl7mqXGt84NjR47K5OQFjEGtQjYgoYl75UGoymRycTqc457jwwgvfsxigZwIgIyPjTNCP/7PWnpPriZiAGO3UUInHnmwFTmyeuFkERkvD/3dQ8BHuv/9Znju6RVQHpuz8ALrRgIAxFhMU8VCWA/asLXPHbdcwqlLVPqLzFjkRiChn1AihgiqoJj8aVejuAA2IthhaBiVv37//wtRqB9C1XySyN2KtARQ1wkMPf/ukBD/ttZ1x7HelFsnIyMgEQEZGxg9mgNeTAF0vvpKKIgs/RBVOTDl4ZH2GWAXTdgOSDUXp8OqBgKpnvLzEFVdczt41Pm0AExOxgMo8iOqr1OEMaxEqMUn6u2DGiEF9RFQpHdxw/R4O7FvBxJbgZ+kJqaLGdu7IBUEt1g0JWvDc0XUOH+VOsVAMR79tbMHG1uTZja0Gr72zfkQ1zHthX2nMZrP3TqdTjDFccMEF8yCxbx/IyMjIOBMCwFqLc26tnywSYzxHJoxENLZYoxCVGJIqKypMp1MmzeReMeayoizAwLPP89PPPLNOlMF2Duz6tqq0n5kgxDYSfcDZwI3XXcDyiLujQoxJ0qY+katqzobRqnS9+NK14W1vvkYVj2dQwd4LVpPiTD0aGpRAjBErglhLEGgx3P/A46eR97su3I8LFj+ZBMjIyARARkbGeZn8x4Xwpw8JwnxssJk/ogEefeJ5KKQzCYh4jV04EcB4Gl9jreXSiy/i4ouK5KTfSfiT47B0QoOzFzz6WNMGTwig0RK8xyrs28ev3XLjPkrrkdDgXHeeAawpwZZENURTomaAV8fhI5ts1eAGI1xZ/UIdIkePnTjQejDiUFFCaBGjiCghhFf8NWzb9uOTyQRVZTweMxwO7wDOoSA9IyPjLzoBUJblu3o/Eu/9oXNlbQmhxUhAxKIRgkoiAWLkxPr6a7zGB6rx0n6cZVLz0YcfP0wdSny0RFt0RHbEdzJ5qwXOC9Er6qdcsq/g8ov4oJPUXkAAWhCxZ2XKSxpz24+6XWgQSANqMMD+/SP2rIwwTsBGxAri0vM0acQA0TkmPvL4k3w87uIXUrZv6Qn+1H4Q8xjAjIxMAGRkZJy3AV4nxzeAnZsBMq8g9F82wFfve5RgIFkYpcpFCAFXWqgKjIG2bRkOKy45sEoBWO0XmVRhiTLvNpiTEC8fESV0f7qr4IijquCG6/mdW2+5GEtNYWBQGMCnx7kSIniEaBxBCmat4ZnnjqMGisHwroA0m5Ot921s1hiTDBBjjGkclOg5k1x775lOp3jvsdaysrJyT28WmAmAjIyMMyUAnHNzAsB7T9u2HwohnPUxpy9n/RdA+z54HBot1jowwsZkg7ptPlAOhr8FFUHh0Le3OL7R4HGotRAjURWdz/UziLFpogqeC1bh5htgMEi2Ab1yIKgQzngSQtcWpwY9BSlugdUKrrzyAqpBJ/MXTca7nbrLmmTyr0XB8VnNkRP8RCS1KOxM8M38jrj4M8kqgIyMTABkZGScX1gIBGwXTC3eL4BF0ZQ685VvPUGjBo+iGMRajAXpmv1dVaKqDAcFV11+IRcs8SanqQ2gN/Gbj/k7iyuYFGBdCRisGAoHV1814tLLliitx5mUuKNpxjLG4qOitiTgaKNlUsPThzdSlceUr561ze+e2Nh8L5rIhV76muKumBJuU7ziL2GMkel0StM0hBBYWVnBOXcOBOcZGRk/CLDWrjnnrhER2ralbdsP9RNIXtn9K2IsaEi7iRWHBk3VfGOIKJN6djBiwA2IAkeOw7GNKdgqGeTHpOJKCgKb5G9qMGIxVlkatNxy4wFcuZCyS/rK65l72WiUzktAQTqf/kiajBPhogv42o3XHqAs0vPtJ89o5xVgSCMEvas4ttUyDWlvlVMRDT0BLzv3/oyMjEwAZGRknI8kAH19/uTAICkADAF49Cl+d4alVQNi5sZQMQRCPUkuzM4yGjgO7B+xtswHnaYRfwspK3FedXhpo6hOGzz1594FZLENxOiJLayuVgxKxRqPEECb1LwpAiL4GDGuACloo1A3yon1ZA2AmDXv/ceb2RSswRhH8EpUj7VdG0Nkx1i+Vwr9uL+2bfHeMxwOU/XqtKOzMjIyMl76+mKMuaZf67oWgIMxnhuV48LMPfHSeqyCduoEEfCzGT6Gg64Y3iVW8BFmdcAWBU3wHalrEFugKtDGVCIXQURx0nBg/xq2W/OJYG1xltfWk/+WVSgi7L+A2668fA9VoXO5f68ASCoASxsEb0acaCwtnUjhlKcXd/kMZGRkZAIgIyMjg7hrSTCYPkkXeOoIv/rY08cwgxViNKni4rvqS1mATT2Z1sH11x5g3xqXCzAqLFY0RVBGTpppf0YLmDHEFqwYnLNYEYKHrc11gm8wRlJVX4DCgkSi94gkOSvGYIshx05s4SO4UtiaTf/p1nTzo6mWYvBBEZtkoSEGRMA5h/cvLwjuTRDPhkS/bVv62dxt21JVFaurqx/03ue3c0ZGxounn10y269Hi+ShtZalpaV7ILUb9UaAZ7J29X//pSTRi2vlyUdPxKbHhRDSNya1phkjYC0bW5sfaNv249bayxCIGNqgKZEnbQ4hdM/JOVAlti0AIShPPvkk02n60z3ZcCYmq4vP32Aoy5JkTgPiLESoDCwP4JYbVtm/t2Q0ct1zSj4MpiyTR49xiCnxbpkvfu2hzpHHpPOUbX5hR96fCYCMjIxMAGRkZHQhzWkogWTz57HUAb7x4HfwskzUAqJgxHZmgdsjo4y0LA89l18MJYBvt8snMRDVE71CiJyJH6AohC4J975JBn2SphZMJwHfuRmKaC8T2A7ArCA2zbX23rO1OWNjPY1katsW3zapXUBOrVIQ7ZfPV3YJVVXqup4HxSLCYDC4O1f/MzIyXuoaskgELCbevcprkSTo15lzwWNkR6VbFm1tu/U5BLT1xNgwm/kn+0kBxG2CNMYIMZEbWDrVl0HEMmvh2cMb7OZ6z9bzN/3YAmsg+O383MOeMb921SWrLI8Doh7V0BnQSjIjDICPWDdmyw/44teeYQIoFmMTkbCd7Puk4+tdALM9TEZGJgDyJcjIyHn/jnGA8/ti6k0k2e154NNffJqWPRgZdtFXJ53sSAARxeFZXYZbbriI1Yo1CaCxASdgPGjogqczXX4MBtsZHqU+f2uFqHDiBDRtgdKZFIjpgqGYZkeLpgoRiveezc1Njhzh3SFEYtOQZAXpWoiaUxAV5swbQM8Stra23tt7FACMx+PtmdEZGRkZ301SvTBBpCiKOQEgIoQQzh1zUe1n23frf+/Qt9hipgqtR2NL20JVwnCQ+gYsMq+oqwZEOkNZQtratGB9Ynnksc5or3PLVenaBqKeMYFtegLCdHuNUawBo3DJfn7n2qvWWBp6NM7ofRdEbPfcHQSDKZZ4/PCUe+5DfMcL7Fz/Y9fE50+592dkZGQCICMj43xL/rsjVfoXKgTCPLhSQDUSBO75Oj99fDrEulFHAFiI3fQAI1hjEDzjquHG6/Zx4EKOWsBoxBmToh6bKihWzsby4yhsmcwKNRKkxSscPQLTiSOaAnUGXNERARFEEaMdERHS2CjvmXg+3Nak5J+YAsJdAduilNIA8goHUSLCZDJ5n/d+PpZwNBpRFEWeApCRkfHCW8CCnP9UVf6qqu7qVQAAIQT6CQBnY31ZlMOf6nhJe9j8j3mQgFHt1maDmBI0gLZYYO8arK1UWBMxohhxnZKt2xNi05EBguI4csLw+FPdf9V1yAUCtpsbcDaufwy+855JnLMjKecuP1Bw8YVDLFtoWycyY57TSxpNGx2Bis/d8yCbdSdYQ2jasCO6F9rkhbO472dkZGQCICMj43yNADt3fiKhr6DoPGroeiT72cHwzFE++uiTUwzDTobYj05yXV+kIDQUdsKlF4255nJh0Bffxc+bKM1ZWX4M0Sui6fxTgOpR4OhxOH4cAgVqOwLAurkKgJiSf40NpTMsjcaM4M1N6H5uAA2IRoyenOgbNXPVwysJay1N09A0DTFGYowURcFwOLw7v7kzMjJeLAHvE9Hd91trKcvyXYuP6Q0Az40WI4NiUSxRIiq6bWSrBqOCFZsq67FheYm1Ky93LI8dJQETNMnvgcJYxAiNBLwFKSyBgse/M+PwMd5MZzSLWdwez/wa9PtK71MToocAKwO4dP9eVkaKiVsIHotsv2YBMCWqljZWfOaLD9JaqJU0pSfGbfYeSC0ACwo/NZkIyMjIBEBGRsb5+/FPRzeAKIUYCwTAYnwQFbzCPV89RPBdySIKIgWIdBL0CNoQ4yary8KrbryK5SF3pL/bj1zq/ALimbUBiIJRi2pyfBab/pwY2Nzifc88OyXENPYvVf+lOxQkIhpAA84I+y68gOuu5sOmO7/CbUs0F67Aaa7fKxvAhxCYzWY7qnNLS0sfPBemFGT8xU8Qz6hCm3HOY3fyr5ped+ccRVHc3b/WHQHw8XOJAEBdOtjes3ql1vy5SZLqX7yPo9dfcykDp0j0yQdABY0yJ4ajUWxVgDVMpp5v3v8sm1O+oLpNAGCSbN+eJTc9JyAxpu20TfvvgQs5etUl+xkPBEuNswvGuWrmVv/GVqyvz3jgEe70Aq2a1P9v9KSdKqnXDGiRQ/+MjIy8CmRknNcBfvev17b3gcI2AaDzn0dJsdbnPv91ZjPfVRFSHz6azPTS73kkThlUyo03XM3aKn9k6cz4YC4n1TMuPxisKSAkOaYxKc+3JRw/wXsffuQZGp9G/s01lgIY7XQNXW+kei66cB+vftV1jMrdkxDjnAiYB1G9HOIcWT5Vlel0+vGeAFBVlpaWsg9ARkbGixI8pyIBjDE45+ZJZ98WsEgAnBstRpYds2wXbkUNGgLWCkUBl1yyxJVXHMDQgranIHdbohUohNA0HH72OF/5xmPMPMRo0wbo0n8ZQ4sROeMdQDRdy6gh/W1NPgXXXn3Z2rXXXEFZAOoRjRB1PrYQVfARjOO+Bw5xfJ2DyajQEEWxRbGTFNkR8ud9ISMjIxMAGRnncfK/sADoKX7YDRWKfRIcYWjhgQfi5RteUqatRVeBEZqoeFGU5Gxc0XL1JSP2LHHR0IHrqxLdqKbYtxy83MRXIuqg0QZtk79gbJKZ8vFNePjxw9TR4LULEo2kActWwJru+Vus9+xZMdx41T72FtxR7Tgts+MCqc6/AmnO6PzPJtq2/VBvBKiqDAYDsgIgIyPjpRAAi0m+SCIArLU37q70xxgPnVveInF7de5ataSTuCsQQ6AwMHZw8Z4BB/aMMaHpJrwacIqYADFAAImSzP9mnieeP8HDT+mvT2OS1YtCgcEpBI1Eq2e8+oduj+k9Zy1J/n/V5UtcddkeHIr6iPbkbixAXBpnq5FZrPjyt56g8en527KCEAkxLMggFvf7hT1BYv4AZGRkAiAjI+P8XQR0XtkOdK3tfRm88EQUwxiHgxo2t3jywWePsmHHYEYgA2ovuPESratoxBAapQw1F6+e4O13jll2UBEAIcwiapVYRHTRvfm7PILx1GxAGamAJaCKBXhDtQJ/9tXDv/fA40/j7RAGy9R1Q6stVIIiWC2o3JAw22Igx3n11WPeePXgntXkBYW4Ao02Vbq0Tv9vHKA6IJqGaKao+JcQoO48RHR+nCn6YLyu6w+0bYv3nrZtqaqK5eXle2KMWGtTlanzX+iD+pc7x/rcQjzDI+PF3l+7j50JpL6iR8aZwfuIc2VKQiNYm+ThqsJotPSRwWBAjBHn0hz6yWRyCJLL/NlpAziTz2cECSABxaHRYAPYkMjeaBUpLLGOXLbCx3741VdgphvYoKCK9zVIg3WRtm1AHUMZ024ptazw2Xsf4fF1/mVbAoViJVBuCUVtoXRMxRNNH0a/vEMo0OiwOGhguYCx42dvuali4J7DRoOEMbNpg6tKjA7QmaZ92UZmw0v53//T5m0ClGIJDSDlDimfm7dEGOaaBRN3S90yMjIyAZCRkXEehfg7FwI5RXxGBAqEal4/+PQ932BmR+Bb8DWqQhuUuvUglrIcpV70quGNr72Cm65CdQoGB26ALW2aHHBGVYgIRTpnDWCCw1ECBbMajm7wd7/05UeowwjEUgwqbOEITUqS0zglQ1k4sDUXLEdef/OlXDzkp4bCDtdlnScbFtQm4uIcCp6899R1PU/QVJXhcHhHVVVzc8B568U5NMc7IyPjlUOfxC96OvT9/865a/q1Yneyf+6sHX6bKFCHaDKCiQJIwNFSAVddxF2XrlXsXRqBsyCKKwwx1PjQJBLEOGgCogO+81zNNx4GL+ANxE695qLDRpf89c44ejZEhKCCFQc+CdQuuYgPry3VFHYDQsRSUBQFwXtCBLEOQqBV4WuPPMvxlq+n7bBz8VGZ7129yi/5/dkF4iTm6D8jIxMAGRkZ52vqf1KtRRd+sDASMNASUdruR5/8zDG8VETXQFFTWkNpCoz3FKpJptgELJZbbrqBV914gEJhgEFaiL49KwbE0jkVRsBjUXEIgm9hcwu+8MV1jp+wRARTGYwbIdFgBMQphBrTOf67yvK6117N1ZfxkYGAbT2IJ5hIEEvEgLSI1J3M9Bx4DbtAr21bZrPZsTk1EiNLS0uMx+O7ewLA2qRm6Ht4e0VARkbGeR4ILpCD1lqqqrqj9xAxxuwgDPs15NxBRLqkNoghiOm2LU+pgbUh3HL1Pi7YM4RSIDT4MAMJafQfIJKI40YDsag49Ng69z/Mu+dLvCYDnPS3DUbNGSvo0zYbwWgysBUYlHDLjSP2712hMAYTAxo8rrD4UKO0qFFQS5ARn/7CvWy2SbkX+8ReIoTtaT6LW7nu3uczMjIyAZCRkXF+kgCnvHMh+UeEiCcQ8KSayyNPIN85MiGUAFOSBLGkEsFq6iXQkJLMgXPcet1lXLTCz5YxYLynqSNnqkA32sU7AQKOQIEYh1ibDAEVHnmU37/v4eO0OIImM0AjjqKwaOh6+I0SNKI0XH7JmNtv2c+KhSqQZidLJIgjigFpEPzC8vnKLqF9ha6bBPDe3gOgbwNYWlr6YP+4rADIyMg41Rqy+LVzjqqq3uOcmxMCACGEU/7OKw7ZprJVIIpBJWKIVApXXoi++vpLWR0A7ZTG18S4rRwojE3jbdqAuoKNWrn3gec4ts4HovaG+mn9DyIEs11ZP9MuFHEWNb4b8wf7LuCe2199NfsvWKGIMe2lvgUjqAYCDV4C0QyIbg+fO/hkIuVt74OQTG0Xs36lm9jbkwSL4wAzMjIyAZCRkXG+kgDbpYy+VxB1dA2OoIoSCARaYAbUEb745YdordBS08xaqCOFgvEevCBuiDEOX29yy/UHuPYyPmy8Z2jsfKzymcQgAtigWDGoKfDGpQoOijFpNOCzR/nFz93zGBN1BGvAS5pGaAIhTokSwQm2chjXMh5s8fpbL+bAmA9WMJ8WgAhROuPAubnSueWm3DTNB7z3xBhp2xaA0WhE0TlC7w70MzIyMk5FAJRleXdPGPYEY280ei6RhzofAJBIgCBJ/h8lrd1D4NYrDLdedSHjKhJ8nQhiS0qogwdriaGhDZ7oCh5+6ij3fH2DmV9IktWh2NQO0I0aNGeqAJCYJg5oIKqnKuCaK7njhmsvZGXoUN+CUTR60M73wnm8RqJZ5uhWwf3fRmqBVno6oyMA2J38u27Ub9x+UpkEyMjIBEBGRsZ5HgQuGAIJBuk9iWN3v3iQVP1vSX2Rf/KpbzHTCjdcwdkB2kRM0CQ/DAouJZ5GWq66ZIlbr72AIVBJTVlagj/zJchExYigxtKK0sbklhyDECJszeDgN57lycMzZLAHxKBdKOQKux3IFoJ1LYVucN2lS9x8GXcPAbcwDaCf/pcmCTrOBQXA/OyM6dsA5hLdEAJlWTIcDq8xxsyl/8aYuQogIyPj/MWpkvmiKO4qy3L+c5E04rVpmg+ce+ohs80CpBPuDo9TuLDirldffQEHViyVNigBWzhEIPgmyfitxTiLFI4t7zh435PcdwjxpFZ66TbHIBCMEjt1gdUzVwAEAtASA+xZ4bJX3bCHA3sLitgiTZN2Y02SfiNpTq8XxTPka/c9xbEtCAK+m3oAHumm9tBNQ0hj/xbX+pgT/4yMjEwAZGRknBQWdkHDQoXbCUECIU1RZhbgq/chjz07I5gVbLWEiR2LIAXqFTTSxprCBZaGM15/26VcfTGPSwwYLBqqM1qCeuWnRCUKBJQoHhVBoyWEpOw89AQ/96d//iBbTQXGYCqbSADnELGoCiE0iPE4mbBaeX7oNVdw8YB3lotuT4tjldSAvvJj9haT+aZpmE6n8ypd3/c/HA7f37t49wH9YktARkbGeRoALqwBPTlYluW7iqLYQRJ200U+fs4Rh2pQMZhdCa3VpEa76Qo+9prrDjAyUyRMOhLUEqMiWKwtQSMMQJ3h8ecn3PPNIzw3gVgkXb1E1/0/EI0nGo9oTIn5mZ5+YhgYGLholftuvm4/S7aGeopDwAcwRedB0Dv4l0xay6c/9zUaADtCowEj89aEZCnQf2VBur4FSX1z/ZcZGRmZAMjIyDhfc/3uUPqadj9DaHF5SCUFxSB2QBPh2CZ86/6jHFu3EEq89+l3ihKsQUWJBGzhMXGd2269iJuu5XJRoFWsGZ2xjF4ioJGoLdiAKQy2sN04K0e0wnPr/OGffv5JnjkamWGgsjTBoyFiXImI0PoGJFAUMJCa1996BVdeyO8VgNOYgkRZrJyYeQD6ir58XTLfy3Trun5fn9z395dleZcxJhMAGRkZJ60fuwkAa+0dfd9/jxAC3vtzTDnUKbC6ubUyX4sDTqFUePXVFTddfgGlNkiYkRhjm55nUYBYmjrtHVsh8O2npzzw7U5SL46IW9gHI4hHTZhPrzmjFVQiop7CwsDBBSssXbFviUKnmNAiUkAIYIvUgtA/T1Mwaw1fuXfr2QBgqpTuG9Ml/ovatAWVmnTPYeHqZQ1YRkYmADIyMs5bxJODqkXYhYeIwQcl4FDgTz7+Tdp2L5OtlmptDWoPkxpZWmZa10SUGBt8e4yVcc3rbt/HRXt5p9WIRIfBzAPKF5s5ftLipWA7xScmgLQEakJs0+g7DAFFHHz+Hm76yjcOE4sBFBZTlEQVkJIYQY1iTISmZWk0YN8y/NDt+9ljYBAU/IxBafFtiqSC7lSenm28lOffB+a9u79zjrZtD04mE/oKnqqyvLzM0tLS3f3jgXmLwA/GFnYmR8bLfW+m9+cLX19VecHjbCSwpxpTl/HS0Lbt3OQvxshwOFwbDAbXLF7fGCPe+4P9evG9vuYvdf1P56wQDUKBiGDFIm1LGeDmK9C3v/5VmHodYpP2CQxBwZqiIw4sRTVk5hvaouKzf/4oDz2ODFdh6usuqbYYUcQkw1g1IKIYu3vv/O7etwbBESgFhhZe/6p9XLZvmVICflqnDcZW6TYoqMO3Bo0WjYZnDnPAArQNoEQf+q47AiDG5sA/IyMjrwMZGRm7o5B4igDGnEwM9HmiMaR5RQZJA/i475v8+vq6Ug7GTI4eheEArKFeX2e0uoIxQmGhMC1LI8/114658jJ+z8ZAEQXh9IHedxVgShrZl5yg40IwmcYBTmse+Nin7+PoxOC1oFXBDpaSxFMsIt15qAEiKyPh+iv3cukKf1YCSwWEetZVTarud4QznQV1uuf4UgPsxcf0vf/ee0II8yDaGENRFHf3Y72+62ubkZHxgxkAdkqhvl2oKIod5n89MRBCONhPGHmpyfn3A4Utt8mmGCglUAJLCrdds8yBPUNWSptGxaBY26+rHUllSjyOKQWHnlnny99saICNSdrqtp9vhBjSftGNnVVNrWcvZ30HECImeIoIt1yJ3n7z5Qy0oYyewrkk/Q8+yfexOHFYKoyW1NPZtj2Pi4iJlIWlbZNIbTioCDGwY8hvlvxnZGRkAiAjI2MH5o7Ai43ufufPe1NAYucEAEc3+ZffvPcBmsanSpIRIBAJEAOiQgwtwU+xZsJ116xx282wXIDVLSSGkwLKl1phSuOedhEaHakRu1tnknp/1sJnv+B/+puPnsAXqwQzgKJIqk5jsKJdRdxCgEEVufHq/bz2hrU3j4GxgLSKoSSoQ6zh5VZ/Xm6y/0IBZn8NO7fuQ71ct1cIDIfDu8uynAf7uWqakZFhrZ2ThWVZUlXVe3pFUb8+dPL/jy8SAOcOIgaZJ+IDaRkCFy/zD95w8xXsX62wFWk8nqTnK6Zz4LcGjKXVkpmu8oWvPs59jyGtQFSwbkHl1Rn/LSbS8SUun6daZ1UV0UAR097ymhvWePU1ByjaGuMjTgy0LfPePAFRg40FRXAUeK64kI0KcH6KCRG38N80wXeO/yGRH4umgLpNC2ROICMjEwAZGRnnY9K/awTgdmDgU/DQNxUiyW4YcMTeWiiNyfMNqgFXFuh0C0jViDCrseKIXkGVUE/Zs+S447aruOUqo44tSDZGLyloOl34pywYAs6fU5ybHVUl1C08f4KPfvwz93N0MsKVe6AN82drEAgQjUVjIMSai/ZWvPG2K7lmmT+ggUoAYwlYjIEQm7NGApzuOS+SIac7FtGP6/Lez30BRITBYMBgMLijl/RmZJyVJeQUbTvnWpU44wUCwG46SEcA3FFV1TWLLv/9GuK9nxsA9mvOuUAgBt8inZtd6QRtAsvA7dfxuzdftZdh0Y3Fi23XHB/T+D8UrCFEaLTi6eOOT35xylaAJqaNLcZUpYeIaLo1sVcACEEMeoYmthVw0Srvv+26fawNWkptsd6DKD40nfluhOjRCDQWaZU9Y8ePv61cqoAiJrte3wSGgyGIo2lDEutJ519DhAVvH5XvbQtbRkZGJgAyMjLOdRJgXv3ve3f7ysGC6Z0pQS0Ww8Amf2EH3HgJ+ubX30RlhXo6o/ZTMJHoG6yxSbIYHEM3wATFhcCrr7+CN99+BUPA6hmeuhgiDhsNdiGvVZPaAcQDQQjREi184rPT+7923wnK0T7qNhBoQRuMdn2Z1hKt4n3DoIjcdt1eXnOd+7mC1KcpYgkxgvVE9WeVAHi5QfVisK6qtG37ob7K31f8i6JgNBp9sK/uLf5eRkbG+UvgADjnqKrqPWVZnjTmryMAjvXtROcKASAaEQLOKEE9VhSJcMka7/+ROy7nsj0GoxOQlmikG2oTidokgtsoXiMzX/C5g8/ylfsQb0BtUoF1Ird5e5kANlhssEQxL1kBcDo40pjZm67iXbdetxfTPM/Y2TRG1yhSGqKFFo9KxBhBvEVnnnHp+Ykfvo3rLuKeAbCnSjv3dNYSulm1c0GfRATtCHvTTQcgOwBmZGQCICMj43yHLCwH2rkdz6cIAYVxCMll2IeGAti3yl3//TtvZN8aHDt6mMFgQOFIbvrWpBl8LdjgEFNisMRZw0VrY1578z4u2cNvOnnhwPTFlq8gaQyUaDqMmnlgM6czGnDFiFkQDj3JzZ/87MMc2+rmQZtIDHUX0FqiFUzhUCMY4zmwptxxy8WsAdZ352Ui4DkbJvovVvV/KQH8bgLAe38wTWTYruBZaxmNRtcMBoMdbQMZGRnnL/q1oaoqqqq6e9H9f6EF4Fi/niwSAOcCnGXu/eI9DAVedyPvev2tl7Nn0CJSgxOkdKg1YAJWUkIdYkSM4cjxmv/6ucc4tgV1ADsYgAcnZbe+phYJomBCAaEkqCWovGgV/XRKGJHkobMypLj95gNcvm9AoRsQW9QHNHhsYWjxRAJiI1jBaoGEiIQNrrtihV/4a9fcMQaauqfuO3+DQTnfBwWw3U9kt/d/JgEyMjIBkJGRcX4m/ilkMC+4QmiUzvovcQKrS/AzP7n2sR99281srj9KqCeYskQkpozbGGg9tIJoCXXAqiBecNFz/RXL3PFa81vGnNwD/91IiBUDagGHLI4U7P5coQMcQ8DQBscswJ/9+dN8/otfxWvEFIGoM0TSE/WxJtqIsRYjkaWq5rU3X8wdt4513jJhoQ5t8maSM1cAnGk//qI0N8ZI27a0bTsP7ns1wGg0YjAYvKcP8rMHQEbG+Y0YI845BoPB3WVZzhP8fiRgRyh+vPcU6Q0C+7aBV3bzilgDTetxzqAKV19O/fY338aleyucmWGkBSuoUbykfnjj0sQXJRmm3nvvg3zjPq4N1nassYIWOC2BSDTbd0usQCtQ+5Ik9KdqiemvrxV47a3D5vZbrqGyU4bOQzPDuoIYPa02+NimsYMmgG8QNRTGEZsNKjfhp3/8jfzsT16oI4ECEOnGFsawY5Kv6dr2Th4LmJGRkQmAjIyMv+Af5e9uvFlf9Tfd75h5fUD77Dr5ACp4n2SEQ2bsAd5wPfpLP/92No88wriMHDiwj63njxGaACKEegJFZwroStoGjBY4EQq/xaV7lbe8+hJGAQYasV0Df+pN3B4h1j8XIbULWE1mSCqp+h9P6mU0O0yaogrOOup6Mk+UH/428sd/+hjPT0ZgRt2vWXxUZn6aJKISUW0pbcs1lyzzupsvoQScmYJt0bZXV7qkPiAi+O6I3UxqA1qiOLQ3LJwTBt+bMXS98Z/3/uMhhHmPL0BRFJRl+a5zrYqXkZHxykBVsdZSluW7nHM75P09odhPANid1J4VL5G5cesp9q/O2CWtp8xVXqJ9b76mdixgWCSa98aLKd9w6yVUbgo6o5VkEOgVgu+mvNgSUzhaU/LMbMBnv36MZ9c5FKnAgp9OEISketg2zdter9MoAFEw0czXesWkfUNi1zIQIUoa24dLZLV4hBanLSXw1tdexS1X7YVmE1c6NERYXkGcTX38YhFTotHgG5825EqQMMM2m+wxJ/j7v/hTvO6GRIMbnYIz251pOziaZGQ433V0Yc/sKwFyurjCbX992sdmZGRkAiAjI+P7AunSdpmn77uDqFMf/d7ddfXjKLu5xEKFocLiIgzcAKIDhIKagsAtB9B//M4f4hL9DqvaIG0gbE0ZlRXODolBMJUlmpZYBNoYCGZA08LQesp4jEH9JD/62iv44RvR1ZBUnEVliEGJKlhTEYJ0JksGGw0uGIpgsGoI4lBjupF/oQu8+iCxhGhADVpEpmGDouiSc6ucqOETX+W3PvtNwOxlujUDN4SyxBWRyBRXFYTYgq8Z2yk/+ZYruPNatBCgbRgNltB2iIlDjFqsLhgjasSoQWKFUhGpUujVnSMSu/N0CxLTxZFNL/3o+/v7Ct3y8jIxRo4fP/4TfbXOGENvCrhnz55rlpeX7+oD+fn76BRtB7lFION7n4DKGR7ZcPCFr29IM+u72fWLa4dq6NYPy/Ly+K6isDTNDGOgqgratqZta2azyftElKKweN8Qo6co7Jm3QHVkqGr3PogWou0I1ZR1C4pR7dZTwXRtXg7FCqixDAcV9daMS5d408+99Tr2l0chHqc1EV8NqRngxFJJAXEIjWNrOqEuV/jYtwIff4B/MhGACVagckXyDZCQknocikvOOLZGTY3B42Iy4CuCQbUgiCHYSLCdEF8jVktKu0wMBeIKVFJ+Xkbl9Tc6/aFXrTHyT7JUVah3BFcSZw1qC8SWoAUER4gDbDkE20BYx5QVRTthj3+aK4qn+We/+nO86Vp0BEg7hViCDsCW9K+6Eoi06Tt16aCYj/Y9KU6Y9wAWC8epHpeRkZEJgIyMjO9vgEfc6eM335G7ynkXFy/e9l8bOudkGpIvsiUgeBSvaQ7AbNZQVQUlWyyJ56oR7/pHv/xWbtpnWArHGVqDEwc+0LaB4A0xJKM5pUXxGOtxhcVa051lQ+WU1TLwY3deyx7HeOigbSIUDltUNG3DsCoXvAlS1X+367JoCiTnz19T4k8XtDXeE0VxpjNBkvTjp4/zTz/950/x7WdmLO+9lMY3tH6GJUlffWi6UVEWGRSsDqbc9UMXcWCJN40dtJMGKJKwUk+zjKp5UatlOYt5S58E9RX+uq53jPPqJbyDweC3i6LYkTSdrk81IyPjLy76z/CiZH+R7CtLx2Aw+M3eHLQnDfvpIf2IwO/T2e5cL2UxQO1619XuyDl9ULRtuEDgx1534eevO7DEuGhxThAnRGNpNabnMxwBFo0WM1zjoSc3+fAn7+PQYf55tGn/iDXgE2niSssioZ5UXB6kQTRV03es37vWSyGZK6oqrqyISvLICTBycMvVe9i/GhgWNWiLCsSiSF4FYrEIhYBVJbYe9ZpIkxCSMs8UMDvGeNhw2Z4Z/5f3/gK3XcrRJSIj67vHKUiBN0JDJOCxzlAVZb9hziOHxS93KwfopwKRJ8hkZGQCICMj4xyI8OhklL0j/TYNIJ28X7S/dRgKDEMMY8Ax0yYFNUQMFcaMCFISiggDwEVCO2XNwEjht379be+/8/o9xPr4PBDrK3CiBokljgoTS2wUbDvB6gQnDZa2iyFK1I0oRgPe/KabuOV6NsV3IkPTuyt7RFuspiDLi6ExhsZGvPFY9Uj027OZd/fid0l5SoCTwZ9qGu1UONjags9+4dHf+cK9z8LoUlQ9JkxwUlHYMQSPtRakhCiMxo63vuHVvPZKPr9XQGgw1qCiBBMJXey6PV6pl4EGDL47dgdVZyeY6oP5/nVwLnkhbG1tfbzv/+/lvM45xuPxHYPB4Jrdgf2p+lQzMjL+YhMAp1NJiAjD4ZDxePxbfaK6SAAYY2ia5tOLJMDZJgNUduWac5VCt0oKRJGuEcAQOxJYu5VfxFKo8qpL0b/8Qzdy8b4LQUpi5+liqSltRHvL/nYTcYZJ3MsnvnCIe74yEd9CVfVKhO3jxVocUvuZJxoPElKCrGa+FalAkIY6bCFWUB8wndrt8gM8c8frrmJ1zwBbQtQJQWYYk9ZrE5PuoJCGyraU0mIEMGOiDmmjAzuEcglmWzg9wp7iaf71P/8ba9et8g+qpmXvqAsHjIGyglGBFtDEmtBOKOn2UfVpokKnShN1nRYQhBakO4zfngykdCq7/BnLyMgEQEZGxiuQ/LNd9JduZvGOXr++x99iKICSXs4XSf2RwUIk4gk0sUY1znPUwsGqhb0Fa7/7m2/V11w9YEmOM7SW0BUZVFPi7sRgVaCx0JAGKocZxCloDRqICiE6IgXGCJfss/z0j97EagFDAxobVD2ugKZtU6VFIYjgLbQWgokY9ZRd4LJ9PeJOIkAN1hYIFo3pPL1P8ZAATx/mN/7rFx/loadqysGYwoJVkyYgAsYaMAVN2zIYWi65cMhdr7uR/ZZ3jQSMjfPWgxTsdWm9QJSYgsKOBJC5C3P3cnWvlcrZIwFiTC0B1lpEhOl0+u6+ktf/3BjDaDRiOBy+Pyf4GRk/2DgVqdf378cYGQwGvzkcDudeIb16qCcO67p+Xz8B4KwrAdRsz6o7rYqqH/fKPPkPIoRu6SrFc8GI8Y+9/gC3X7eHsYXghagdkayeQSm4wqDTCeChGHH/EzV//KfrTFtwLl0b36a9wdkS5h4AO1L+nXsNkWj6nv8mtZjFbhKN9vtADdKiGrDGQAMrJbzljr0X3XbzRRROiUAb08xBMQrRpykARGi2gAY0zDdbsQ4VlyjlouLExnH2rFgu3QMXcJj//V/8/O/euMq/MlstK0Of9t7QgG9PGgDQu+xsax0WmwnjfGbASTuFLngCZGRkZAIgIyPjFSQD5kHKNhGwM/GMO0IZxc1/N9pAlI2O6VfQChtgMINVhX/5m68/+rprLXurDZzzbB7boKj2olRgXEqqNUKjMI0wI30tnZNgbCDGzhDPdTHUhKE9xptvv4S3vlbUNGAjiHqKwiHCvMKffJbSLGc1UGiaoSynqqQvJNXzilanJ42ahhMYmxL2z38r/pNP3vMEQZYoygFERZsWG0lfO8AJSMtIGn7k1qt49cW8f9VBaLaAVP0PYna2YszJmLYzBuzaLxZfgbOU/C/K/PvA3RhD27aH2radB//948qyZDAY3FVVVa7yZ2ScBwRAvyb0a0SM6b7BYPBbvWJoN0kQQqBpmo/2lfDda8XZJgRE09azmFb2prBhXvmXzmwv0drOK1dewOZdr7+KfcMtTDvBigM7QEyBlQBhhrGaprYsrfDMJnzyi0/wjYdS3V6AeqaogjWWGNNzda5caCk7xbXt1AuxI54NcW5Sa/qNwKSxsUpL4QSncPUBNn78zTdy8V4BrQkKSIWRARYLMWAIadysD53UAKKvCe0WmICUjlYjNYHh0hB8jdWaS4eBS4oNPvBbP/MrP3Q1Wk6UMnb7jS1BKhBDYLvboicBUoygJ8UK/Wsybx+c72N578jIyARARkbGOYqI4lFCZwLUEKhR6u3EeUcZQLHaMPA1qwFec4BH3vcbt+qrLh8x8EdxoSasbzIaDgl1ndJvlU4zmcYnYYZgl6FYBuPACGoMrUkVdWcKHBGrUyq7zt7xlL/y46/jAgdVBBMCTeOxhZ2b551kYqjg9MUXsFQBt2gUnHNYk1QAMUK08PQx/vlnv/IYh56Z4M0YXIloxKayEC0Ndig0zYSB1Fy+B976qovYO+CdjoBIS89QxIWgUHck+YuqhO9NkN8H6CGEHSRAXdc7Kln9zwaDAUtLS+9alPqfamRVRkbGX3zsbBMCaw1lWVKW5Y7P++Lnfjab0bYti21EZ3Xdkr5KvsAAEHeoulQWHPg7R//00IhTGAOvunKFay8eQ30UG7ZIEq4CT5HW+3oTtIHlMY1d4vP3PcMnv/gMW23aB9L1gcJZRCxN06Aq9ONSX3B/6Wxe+uRYOhIAXHfuiXjW2CJ+wkoFr7vlwqWbr1rF+aNonCEUOJZSW54Wiagxmp7zeD+YZShXMIMhwcyIZkpRJJJBRIkaaLcmxOPHodlib+G5/kL4v/3mz/Nzb0RvvIBfG7Ug0waJCtGi4ojWzbej7aEBsYsV4vz++Q6mLKT9ESHkD1ZGRiYAMjIyXhGoW5BSsoOUn7fqAUEiQTwqLZga7BRcDbZKSbtUQIkNnrFGrrLwI5ej/9dfueOan7htH3utZ220h8nEYO0qxd49RD/tkkqI0acoygxAh+jUsnmixVNQm5LalQRbdCZ+AbTGyRbWThjaLV5/44X82J3oBQ6qAMFDpNwen0foAsRUkZFdJMfp+ulDBONSVScGEFul66HQRpgofP1Q/ft//PlHObw1gLLomIU0EzqaFjUtRhRCzcBs8MbXXMptVxe/twI4bRYCoV40aRbOe3uGdH+cbS5gMeEPIfT9u9cURXHXbDZ7n/d+bgLW35ZlycrKyvtP5f6/SAZkZGT8xU/8+890+vynkaDj8fhvFUUxXxP69aN/7GQy+b00XYTTrhFnJQTVFwhDFZAdmoC5sq1UuGE/j7zttisopYEwTS75OkNVCF313lkBnYIIX3l8kw//6SHu/zYiTkAEwWFNQVFU8/3MiMO3L67QWvTNE3oFW9oHVEtC5y5o8KiHy/bxyA/feR17yhobNrBGsdZh4zLSjlNfvQgqkToozx+DR5/yHJs4dLRCHESi2QJpsLFBZzWDckAxWMUMV/HTBkxk4GbsiYf5X3/9v+Xv/9QVv/PqZf7ZhcCwbSiMBVPhQ0VgjFIRKEguBrGLFZJdT3p+Bk1SOJgPDe5MELMpYEZGJgAyMjK+38l/l/j3MsXezHehstJXpbcjlIVDSH2B3kAbKULDmMglFv7Wj67p//JrP85rLx2x0mwg0yntpGFpZY3a14QTRyhKQ2mSzF4xYAaojlifFjz8bM3XDx1lIw6ZSkErLvVtakj9iDoDacApS0uwVq3zV992C/uH/OZIoDQWH22Sfva9/Rrnz1VPmUCfmgiwpiDEgA9p3rSzBUaSuqD28MRz/OIn/vwZHjteUGuJoqAeoqcoheBnDIYVsd2Equa6K1Z4/U0HuHYvH6wiOPVYpev9dMSuT2F+3XXn9IV04mdn6e2reotfd33/a865u5qm+UA/InCRAHDOMRqNTjn673tl+JWRkfF9DvC6nv7tz3ZX7S4KRqPR7zvn5mvCbsPAuq7ft7i27CYUzvq56k5ReZLX9wtdalqzeCwtpcIgwmuu4po33XopNJPUzF8J8P9n78/DZTur81709zVzzupWt3ttaW9JW33fgzpEKzC4AWyDY+w4wScH4ti+T2KSC/e5dg62c2/g5NpOcpzEkENwB6axaUwjGwkjCQQCdajXlnbf96utqtl83zfuH9+sWrW2BMIIIcvU0LO01l6rVq2qmjXnGOMd73jfyMrSKo3K+c02aMt8N/DNJ45zxwOsn89BqTZIivdCWToiUBqV+5MkGYIhK1e1RtgJ6HitR4+sL9Q5SEwE1iUBDC3rSYFN69hy+QXryUKfpobEeIyqk7VTMRejKUWz6DPufuQIX33wCI/sL5gNHQqTUgQHPmADZFmDUNRCPK7CzkyCz5GFY0y3Fc3+If7FT17P773r1b/1uvORKSD1OanxMZ+i8CQjq2usFAdQtVUgCTJUChiT/8cxjjEAMI5xjOMFjtFszdMcfWyW1l1wUnvgjZz5AoSAlYKOVEwInNPmn7/rn54tv/5Pb2DTxBINKVBOkSqLsQrnTmDTHJPUlkTisQh5penrCWbNar76xHE+9uWHuPX+veydD9jWKpQxKPFYHXcySQSSuHnoyz6TaZerz1/FG1+x7ncngQSNIsF5h7IGrQJUJXiFUdFSqZSnt/txZzQMBQFrJWuMSTEmxXmpaZmRFZCmse6662HUZ25/gqN9g2p1oJ0CBRohSxPwfbTxIF0abccNl5zKNWc13pIIrG6nbZzDEi0RFRaPQis7EC84CbR5hu8/xwJ/sKertcY5R1EU9wEYY65aWFh4Z1VVaK1pNpuUZRlFG61l/fr1EkKgqiqMMUMBQa3HqWEc43ixx0DBf1kLAJLE0mw2f7PT6QyvHQMAYPDvqqooy3JrvIboIbA4vIyN6I48W5y8WrQSjFT1hP8ZMpsCpTQEj7UJBE+Co609mYcrz0V+8qaLmTJdms2U4AK4HGwgsQbtBZO2wBl8MsmuWccnbtnD0R5HdJJSuqgnoLXF2jSuA9QAs3MuXgO/k05Lff0WUUgwQxAgPu7Ba5mgQkbTZFDAhknOe+PrLmTdlMd6B6XDl31UQ+JufxpRkLwSJFvFE/t7fOr2vXz0tiN89q5dPHFYqOwpoGaiGm5IoCdobUB7SB3IEtiAamRQlSSZxvYOc8OF0/zeb/48v/nLF8n5M/xOs8xp0CdTAgMGmxkpJwxgbP3FQPDPrGj9k2R8fo1jHGMAYBzjGMcL2v4PxP5WhqUqFEgWpf5dLFS0AaqYzmc0TANTwLWbkP/j16748E+94gwSd5C0LVBWYFN0M0GZnBDmgUWQKi7TVyVKp9BYw74Fw9/ct4dP3LmVLz3s7ntgDzy84wSziwEkRXkBq6OonquiZgAabRXK9FjXqXjJ+eu5dIuSNFSoUIIxuFAhVYAAOiiUU3hl4pDl+xlFjFBOJUBeQJXBF+46/IcP7ZzHp9P0e11oZLhKkMpByEHnOOXBejavTbju4lPZPMmv9ufzbgYY5wjOE7yg0DgZ7LDqKLgo9cewoHr+LsEhBJxzt1lrXxNC2DFQ/fbekyTJsOHPsoxms7lC+XtUMHAc4xjHi7zI03oFoGeMIUmStxhjEBEGnwfnv/eeoigeeroK/vMV4Rm/I6pGAbTGVQWKkjSUKAdrG7QvP2sN55zaoW1ypMjRNoU0wzuHK/pkxoI3eDqcCJN87s7H2T/LdaI1hTP1Otp3ucZ9h8n/SpAi6gboYJetZ/HLeckLFD0mDLziJfaJs05r0NALZAawCUmqcEvHMA0HuqDyAd2YZtuhki9+7Qke2stnHtmPuu3euU/+xRce5Ov3H6Xn1kH7NLAzYFsRsChzuvkiZShqox/BuwKKBWAJ8oNMqWO89XUX8j/+w8/81q+86XRZq8FKF0ufRFWRvVBv2UX6YIi2CBowCmUVWps6n0GtLzuOcYxjDACMYxzj+GE3/wNt5Kc1uJLExl+3gCZGmijJMF6TlJB6aDloeJgB3vn6VP7Lb93EjRcpGmEXWRZYWOxTpS0q8YRqDq0WSLM+JnGgBVEagkZosn8evvjNnfzJrY9w+7ZCPbXI1d/ei7rjW9s4cKhLSoNE6Uj/N0RFYtvEqwRRJnoMN0uuvuAUbrxiM6syML5LYnzU0pPI7rQBVBA8lqAHmgJPv4xFe75lJsAzWQQiGnGRHLHkFFsP8ut/eeu3mWOaKm1DkqBVhhIbFZlTodSK0pesagtXnrOa6y9q/WEb6ACJBKyEwRJpnHTVegCIrV0XBqjFD/bSO6r2PWjmy7K8zRhzldZ6S57nA1AAa+3Q57vVajE5Obk9SZKhWOCgCRgDAOMYxz+CPDEC6mmtybIsybLs0lEAYHANMcbgvafX6731hwMAhBFV+cG1e1n8TyRgbAKhIsPRAJrABaeydMOlZ7BuKkHpClwBxkDaJNgEaxTKKLykVMkavvr4PH/9tWLp4BHuRjK0SXDPpMLyTLliRfOvlz+kNs1Ty98LAxFYEQiepo5w76oGb3zFteey5ZQG2s/HhBZCzCsqh3QBH2ah2WDBtbnjvr3c+vXwxZ0nePMJD1sP8tbPfflg+mefeoTPfXkvO3cUiJ4CnRGCgLE0O21IDL1yiUJyzEwDSRy0NTQDijk6cozLN3ne+RNn83vvukzOWc1vtoFUoCXQVGCqCFzYJINQAX2QHuK7eKnQOiGQELB1/h3HOMYxBgDGMY5x/BAjjHwOK3f4Bqf2UOi/IqOkhaMRYsM6DVy7Gfngv79RfvVtN9KqdjCRzDK5KqOo+pg0QTUUJTkudOuiyCClovIWSafw2Woe3TXP529/jM9+ZRvfeKKrjklG2Z487XgFdz/Ar9330H7mF8GYCXxZN99pG69TRCd4qQuussuqycA1F2/kgtO1NAFLwGpILBitUaFCiUcZQ/U90ei/s0XgIBpZE4+FBG6/j01/d+9u7PRmnKQY04pNOx6swVtLXpUQuqydgJuuOoeLNyJN4qZkqgWt6gJQDR2cIj9DzAj7IDzz4/sBFfs1AICIzGZZ9u5ut/vOgUNACIGB9VeWZXQ6nS1pmg6bgNH7Gsc4xvHibv5heRWg3v3/RJZlQ9BwlB2glKKqKoqi2DpYK/rh5rKTylIfr56JFhoKMuD0Dr93w0XrOW/jFMr1QAnKAN7jnSA6BaNxpaNQHfbNJ3zsCw+y/SATIuBKqVfjBFHyHfLpcl79jq8tEYBXI2ypqFugCQSEknbmyIDzT+cz5582yURWoV0v5qFQQZFjOw2879MNFVUywX1PHuFv7tzPnuP8eA/QrQTVSDm8QHXX/ZX6k08+dtsff+ab3P7AXuaqjK40KehQ+AxUhk0zMIG8XEA1FFXVxVVFzKFuAbW0hzMmF/jxazfwn37zx373p185LVNETYVmgEkTX2fJ+1ELZ+BkU4vxegkonSzbCI9jHOMYAwDjGMc4XuiKry5clAcchpK2cjRZokXFGmASuHg19/6nf3u9/Nf3/gyXnq5pyWE2zGQoH8hne2ibkLUNlT9OmvVJMwM+RfIpXFhLoaaYdS0e3Of4+Jef4OO3Hf7w4wdQPaXpVZb5QvZ5A4dm+W+3fXU/9zx8mJ6fQLLJ2PgrQxVicedFIGlAcBDmOH9Lm5ddsYFTJ7iJMvbeibZ1g1oBEQAY2hKtENkLKz4GTIBn+gCNwrK0VNJIM1wFcxX7PvTJb/H4vgJnVwMWglA5wYvGmgxdMxbazcDFW9bysis20qJmXuJINXFFQguiaxBg1O7qeyguv9f4TkJ9g53doijen2XZljzPPzhoAsqyJE1TQogaCY1Gg2az+Q6tNSeLfo1jHON4ERd4WterP0P7z3WtVutNg0n/MzGHqqra65z7IV0DpBbOY7mBhqEbPYB3JYn2aIEWcOVZ+jduuOQM1jR83aACRoOCqihxZdSvzzEcqxrccteT3P4tVK+CZkMjvqpda9xJ1+Lv9vHMoIWivh/latbCYCoeUKrA5V02TPHGV123nnWTikwcRhPH7IkmeAESShJCY4YnD5V87iuP8sCTqD5QOCicovIJyrQodMITs9z8l3fNrf+jz9zPX37lIbYdCvh0E06tY6mX4EqD1iAUVCHHiyOIRqmUJMuwqYYwTzW3jZdsafCb73wD/+nfXikvPQNpA00Pa1NoEIGARNdyAMP6whOGwMA4xjGOMQAwjnGM4wU6ffXK6b+mLm4KrMpBlmgTi6dJzbp/+0/Pkg//55+/6qbLppkxh1jVXKKRRSGo0huwDZQoyu4iNuQkOKg8ZV6BnSSZPJOF/gz3Pt7l//7s/dxyX/G7247zy7lYdNIBNMF5qqAwTbj3EdSX7trKkwf6ODuJaXRwXiAIIvW+pG1AliHSZ90qxfWXr+fK87mjYwAHrvKEwWKlquqp1bNYSK1otkdBkjAsPbVuE7C4vACgMHD3E6g/+eRXmes2QBlIQHSKCwmIxero7ZwYz7pJwzUXnc6Z6yILQHliUSi+9vwLT9cpULK8nvADAACeSbRvsNOb5/ltAMaYmcEawOjUb+AI0Ol0PtBsNldMBccuAOMYx4s/BpP8NE1ptVqfGLB9BmtAozaiZVmS5/l7fhgaIOokW9TRvBaIDT2JBS/oIGTAaTNsf8nFZ3LhadM0yckSg/cS5WSSjIZNSGpAoLIZD2w7xMe++DCLRdxZbzWmXg+BMu9FLZqnNfl/X2ZWBAEiMB2i/SsW0YLRUebmsgv5zA3XnMdMQ6FDQEkgUIEJ6GyCsKTQyRpymeH2b23jzvv7v7vooKR2cAgKV5QUzuHTNi7J2FNw5M6tqP/1mYOf+egX7udbjxyiH6ZodzYgIUFKoZk2SNCk2pImKYim7BWUSzlgmZqcIOsfZqo8yOtfuoU/+Pdv4d+87Uw5tcU7pITJen1BVRDKKMeAqo+LGgAfYxBgHON4sYYZvwTjGMeLNYYkxLpukpEVgLp+QkiANvCalxh57//zdf/uNddvQha3sqa5RNOWUHRZKiokaZO0Z/AerPM0Gg1M6cF5cA6nUwo9yYHjirvuOc4Xv7qbL9y/qA6UfCWYJo6U4D02AWsCoXBktkmvdOS9cCMsbVm1KmPVTAPrC6xyoH0ELyRFmxQlFaSKRmopRfHE7oVz5rp8qgxgbEoInsimT+IK5VD8UJaf9LCAE1Y6NcvIiyMoMYg0MWiC72FTKGpngWO7iw+dNqN+45wNmiQtUSolkKI8aO8xBMSDtS1M2mGx12XPgcVjJyruqbREvUWjhn9byYiCsvJR82BQBT8nUyX1jNZcg3+HEEjT9MZms/mBXq/31kaj8ZZWqzUs/mFZJKyqqmav17sNGOoEjJkA4xjHizmkBvkMnU7n2k6n87tJLd8+AP+ccxhj0FrT7XZZWFj42YF16PN+/itQouIufZ28RAlB1X6F1kLlyRSsbbDuFZeu/v++/roL2TjhsXRBgzcKry3WKBCHsYZC4InDS/zpLfdxx/2i0kThg0Vpu61wFaJBG4XCoVQtMjPq1zqklI166K4EKSJPwY9ICQpCSlAKZTxWC5echbzlDefykvPW0pQeBgcaSumjjUbpNlVucclGvvnocT76hSd4fC+vKDV4MoxOIuDsHUEcjoCzitwGKgNFj4/v2ul/e9fe3e9VkrNudYeZdkbiHOQVmCaqV4ILkCaYJKUkpdIdICNVjpbvYlyfdsNw4QXncNVVW34yuLn3Praj+9vNBMpaGzCIjVQAcbXnofygN9jGMY5x/BBjzAAYx498C62+hxZshTvOyIcaFQUafCie+WPFaaef9ve/82M5+W+Mlnd6WVxu+ZukAp364/pzkN//zevlvf/6Z9g01cPm+9i4SpHKApTzeJ/TbHfQacbcwiLOOZLEwvwcOKLdUHMVtnMKO2c9n/3aE3zkbx/i8w8eVUs2Izdt+iHFeYsOAel38f0cYxTz3YKgYfcxbv7inSfuu/vhg8z2UsqQgbKYuuzr9YtInUxAilmmJxxXXLiBzev4hXYSn12aCI0kKveHyg3Fo4YOCGrlNCeoZ37tltcFolK/MhmpjcYEECdFx7vs+8hfP8zOuZK+0zidoJTC4DF4UAqlAlniWdMRXnrpmazr8IcpYDwkWsUHKiFqSg0UopVHVKSt/iBK65Mp+4MJ/uB73nv6/f47O50OeZ5/0ntPmqZDK8DBtL/RaNBoNN49uI/BZHAc4xjHi7j9r68F1lqyLHv3QPtjcI6PMgCUUpRleUetHfK8M4DiWpTCK12zpAJGAkZg2Skl7p5nwLoOd1x53gbO3jiBFPOgA0Vw2EYTmxrKMociTrcPzQW++dB+bv16UN5CICNLmyz2FhAdaNRsp+UHo5/++Xtgl4lEmQKvwOv4WemAFU8jwCuvXsUrrzmLlC7i+6AVZBl6sN5QgU9WM9trcufdu3jocVQp0K8Ao/Ghosj7aPE0E43WUDqPhITSNFk0KSc03L8D9eHPPPXQn3zqLh7Z0cebUyHZGO1t0hakCqoFqmqJLEsxSYsiF+jnYAJp4sny46T9A1x6WoP/xy++lg/9zk/LJRuQzRntCaCFIwvFMqb+jEXLd65VVhRT3+W2z1xnnVwbjfzO3zuRPsvjG8c4fkRirOIxjh/p5n80BQyth+TpuUqflIjq0gSHqWcAtQjf8JfDyjsYJMxauG7w7cwaKrfsp6NVpA2G4T1pVJIizsdqA0iSBI1QVAF0XShJ7GxNcDQEpg1sXsft7/rfzn/5hZunOXNtB+v348oFTO4gaNApqBJvAlLlGGCiofFFiatybKsRJweqQR46PLK9y1/e/hS3fHPxTbsX+axPJiiCjzCIEkzwaOUJtdC9V4JuaHwwlNrz5EGu/txtB2TL6Zu55sJpRDyZ8xgfmOw0KYoemVGoVotqdp6Na9bx8mu38NBTO8hLUHmJUfGi5YNBK4MOcYIj9evGqIL0gEpaf0SCRIDgh9WbYCl9gTHRodDHAQ09BfftRn3obx6Wd//Ka0nz/TTDEmnShLzCi2CmJqG3QCfxXHxam1dftY79tx65pHQ8XBSCyRTKgVYKRYpXgtMF6EAyGDrVj/M7x7M34c/UqA+KW601CwsLO9asWcP09PT2oihYXFxkYmKCPM9JkmQoCjgxMcHk5OSWbre7Y7AfPI5xjOMfboQQ/eoH+/uj+/wRFFQkSUKz2Tyv2Wy+KUmSFWs+zoWhlV1VOfr94l3xezX9nGe7BujvqkMyeAzfCQBAKUgtvvTgKzJASUohSbxASpdGGkVrb7x04vwbz1tFVh5BdI5X4IzBKI9yfaTowsxqiqrB47sX+dhnj+zo5lDplIIALEIWH01RFCAGwYwkZ72cS592TdbP+NxDSGm0Mnq9xZpyV2KMp1nCdechP3XNmZzRKfC9LqYhOAJWFIltghj6tk1fT3Pbl5/ii185/s5SwAkYa1Hao5XDWDABlBcSFFolOFF4J3Qzw1IJSYD+LJcdva2bPPDI18qfesWFvP6mC5luJTSSRZBFQtXDmgz8AtrlNExdA7gKXIUFJiVAbw9N1eaUMzq89D/+M+55bM/SZ/7um9z2rZ46ESDVUBnI3WhBpMANQBMTSx38cg4b9OoKZHBbVL1XUCMpdX4eNP2D8mmANwxqIj86aBno/pz8FhO+y/HTf+8cO45xjAGAcYzjH3vIys5f6v8NUoQZBQtGfmEZAgiIhJXZ62mJSA1/q3DVMB2pQUFV/zdIVFKVKAzaRCunatSANxSgHFaitV9bwUsvQn7u9Zfy8ivPIK2OMp1WZO4I+BybAEkGHop+SZo2SDsWqoru4iyJNrQmpkAU/aUCk61ivsh4cNscn/rKw3zpW04ddeCbHUoSvPORhi884z6gQ/AogjNMZJ7Hd6A+c8s9svGUV3P2+lVIv8QoD0qjlNBbWqKZVbRbTbQYrjp/A9dcuENuuxeVNmCuC1qlJElKr8ijoNKzFKixqBscUD2EBgIBqBDcsAbUdS3hVEpfl3z53v5HTvv8Pb/wKz97FTK7E6oeTGSYfoVbWMC22ujFBaabipdcsolvPX7socO7gpIUFiuJO64SCMHF95A1KO1rHYDvob7+AURN7b2t0Wi8pqqqWWBmsAIw6v+dpimdTufePM9XlWU5dAoYxzjG8Q88bT2t8V/+/uj0/+SfiYThdaCqKpxz9/1QqP+jiLdzEAKJ1qgAFQ68HV6MrYdzNiKXbZlhKssh9FGZRhlBSUDj8T4nbTcpK8WhbsKnvvRt9h7lLIeOlnWqgNrSHgFdT/iV8oxq6XznZv+ZwxhDr9slm5ig6C9hEospPFMWXnLBNBec1sHPHcAkqs67hiCgXY9SK1w2wWM75/jsrQ8z3+eDfQdiMkRBmRck5qRcJnF4oEUIKhBcXImrtGXRC3nhq8XdqMW/eUwe2LqNt/+Tl3Pq2iaTTY0Wgw4eg2ClRKS2qNE6WhIO2HOqJFGOxJToco5XXbmeG6/9JR7eeVQ+fdvXueX2g284uMgtmYIu4BS1W4NHoRCEJElJkgbd3gLW1tk2EuIiUq9CzbIYvBmXmXvxngZLFifXW9F6URhp/p8hno4HhJOO6w8p+Y5jHGMAYBzj+IcYmmjedrI1W52QVJ2odPQj9nViWp7mA+Ki6FsNDgz2AVV9u0Ey8wwmHoM/Z2N7HAYIt6kTshlJUYFmYqmqHKFC6qyoEgvaYPG0cJgyKvZefxny9p+9lOsuPoOk6iH9Q0y005qn6Ibb8tp7kJTEtvHOUfWWaOBpN7P4hxfmKUKTKlvL1mOGv/3WDj5/124e240qgKyVQXC4fAmVJgQ0qp74I1GTIKgIYfgAeBWV8xPNwlLFHd/0519+2Y4nTrn5YhKbIVUOlZCmbYwvCCFgkha277lw8yQ/duNZPLZz+zv2zfPBAtAGUqq6edcELMuK//WRlbgCoGuf6eURRA3TCLVi30K0ZCbWm9Q1kVIlAHv28Yu3/M2BX3jVVRdyzoY19NweWlpBmmElTq10Crpa5Nyzp7j+6tPYenjPG/fmfDYBsJbKC4ECyDChifgMUYv1G+j5pSEOJn0LCws3dzodqapqUOgP/b8hsgiyLGN6enpmaWlpS1EUOwY6AOMYxzj+gWawEbHOARNgubmP38+y7Lxms/n2AaA3AAkGtzHGICLkeU5ZlsPbRGDw+c2+QRkoc5IA1ir6ysQJuCkjFJ7D+glmbjh3gqvPO42k7ehXjmbSQvuKtgmEfBGTQl8Z8mQtX7ztYW6/FzUbIi0fVaFxDFf90TWZ7u9zbQvP+D2TBCofCKEELySlJa0KrroYufnl59GZNLAUoNWCxQKrpqFpKdUxcmM5Oi986Y5HuOfbqKW6iNBJRnAlaI2oEPtlVev9KGLjrwMoh3aC1pAYRVIfx3kf+PZh1PZjJduO3io/cfN5vO6Gi1g/uY6kWECqRRIdUInCOYcnavsRJLbvIgTfJ/gCk3Vw1WHK/Bhnrkp49z97Jb/6VvfFb9zzAF+6+yluexh1JI+pLEnAe0cZHFXlqaoIkDhXgQJjIEssVeUIbqV+wrBOUvVRUSf16MIy+DFs8N3yz75T/ltx9MLQoWFM/x/HOMYAwDh+hGMlRXw0j4RhC77cOA4oZyPL2yo21vq7JB4ZKXa8EJVzh7uFgtYJWqnYKI9SKVVMxP2qj1WQaah8/dCCAxwJUdn/FVcg/+IXXs71l50GSwcw5X6ShgEKqHrLqw1GIyHEHX8FWie4EprNGaCCqoSgCXqSQ4uKbXuW+PjfPcrXHitu3jnHbWQGm7SZ7/cx3tNME/raDSnsJtTIPJZIdgSlDKI0yiYs9JZoKZjvs/VTX9zGhlUdXn3VDO0skHdzmm2DaU1Arw+VQ6qKiUbKDZefzX1bex/401sOfrDR0vQrT1UVGKVqi72R4yfLhZr+LkyMCBQ49ICH720EMvC1hWK8K2tg1z7Un3/qa/Kv/8WrmenM0Fs6Rksl0Gwii3OoiQnCbJ/EJFx/9SYe233wM0fvqZQDShTKKLSueR8hIVSOYOP06fmesw3sAHu9HlVVYYyZKYqCVqu1wkFgwALodDpMTk5u73a7arwCMI5x/MOOQSN/8jkvI+tizWbzA41GY6gJYoxZ8XtxFcDR7/ff45xbcd/P55RUCaRBUYUIngcvVMZBYmNTW3iawFWbpk689LzTOHUmRejiag2VEBxaebRU5Dalbyf49u45PvblvRwLQJLiQ3RbGbgNaLEgts4bz5H6rQKuCmQZFP0CaywN12fTDP/8zTdfxIVnTeOqo2RNC0oR8oBuN6EqKbSlSjp89YGdfOHWYx/0SdSeIWkStAHv0c0GwRV1+op1SqjtZL12KBF0FYt4MRWlUohR6MRQSKDywn17UIf+cuv7Hnvy+Lvf/Jqrufq8U9CVpciP0rEJoiNYjwdlFFaBVhoVQr122CWUC1gszbRFKp6JhuKnrj2DV770Iv75nJZbvvYIX/rykx/ec4RfdtTHUjvysPLt4z306/eXhghY1ADzinfZwG1gQNmQ5bosvmXdM9Za3xt0M2j+/75uD+MYxz++GLsAjGMcwxn9oMOOPsJDFWChnszb5Q9lQVQULRpZBvB1ehoVBQojuIEFrAhWoh2QlySq60r8m8p4dCqIjo9DZxYfAk6gk0Cz9kK+ZA23/9RLpz/8X37rpve+7XVb2JA58qP7aeOxUlB2j2NSB5ngKaiCx5gEaxOMEpTPwZeYxiQ4TZEritAiV6t5/Ijwqa88wYc+veuOu5/0Zx7N2UEzA9uh1y8RD8ok6MxQEf3u4/7ewJVADwEWrEUbSwhx2tBsaJwTDh/jt2fnDr33tI2TrF8/RUMJIe9GdQQfqZ8mtRgX6EysxjSneOSpHT+9/7j8kRhFYiyBgChDQEeQQZZ3CtXQSVoikaPmP4gaWa9QHjXEYhJEkqE4n5Z6ViAJwQcOHHR3nXJa8ktbzliLNQHjQBcVSgsYi5aA84GZmQm0Sdix89h7Z7v8dhGESmm0DmijIWhEPEE5lImvl3oWmOpZqtDv+tPR5j5JkrzVar3GOUen0xm6ABhjhjoCA4Xwfr//Z3mez45dAMYxjn+4obV6mhDo4FzWWtNqtdZ1Op0/zLKMEMLQ2WOZ/RO/LoqC+fn5m4uiGIoD/iCuP9/t+qEETAgxFxKp5KFOr+I1SRW4dIpPvOWGcy+64cLVTCR9PEsoXWG1QbxD+x40Mnq6yb68zX/96Nf46mOonoGQTuODj3vlEqF+JZZBphqqyH6/IIcK+ABZqgguYzKxTErFT77ilAfe8mMXMN2aJzELUPVRlUUlHbAJ4krcRIutBx0f+tij3P8kV+sMciAPhggLe0RrVFDoWoFIVFwdDNojOt6qJZpMa4IIuY8rd84mlDqlIKFXKhzpbXv2LPz2/Q9s+yezs8fXbDjlFFatXk1ZFUgoUL5EXEFwJUo8RgtGexSONLOkWjDKoXH4skco+hhxtBJh/YTm+otO5+brz73izHXhvb254+9dmOO3ncTtjlIgySzaJtHBB2g0GmilKZxD6uPu1QCUt0ACIavfCLYemKiRWi3+yysISiPaIsrED+LAYfgxvPXyV7E2kOEi5jjG8aMaYwbAOH6EY1SoL6yodxSDgfwIXWyoD6AjICC+3iNfuaMWu0p1UhPnVpRMA6VbweNrRoA2hqAUUlbDG4XS0WlAUoCt4Pz1bP+Z15695eYbrmHzGkUWdhN6x8myKcga+F4XWoZ0egbfnUd5B0aTaIMKEpO8dygTwDaoep5gp6gaHXYf6/HlbzzG5796gCcOonLAJ+BF4SsIrsBqRZI1CCHQ7y1Cc/CEBvt7qqZZWjQBVwZINFIWJI02uS8I4plqwF0PoDqdhyRrXMb1562JzIaiNhxWHoxDBY2q5rn0rGl+4qbNl2798z3kEjCJUJSh9nLW0VtZ6aETYnydV6L8y3TA2OVrarxAIq0SrVZgohI0BRoRzeFeuO3Df/UYMzPCyy/aQLtVQTUHaRa1ADpraBsoqiWuPHctr75qjhO3Hbq2V8ndeB/Fn3SBUeDrXUulnn8aotYa7z3WWnq93vsnJyfflyTJsMgfrAgYY/DeE0Kg1WoxNTW1vd/vq9GJ4DjGMY5/2DEq8Getpd1u32qtfZqq/yhoEEKgKArKslyxHhA/P4/XJkCCI1UGr32tkQK4gFSBSQ03nL/6Ldeft5pTJgxlvkDS8mA1PkThVpSF0lJ21vOl2x/ly/ehFhWQdJB+gTKmBttPXvPTQxc7eQ4YpzVQ9ISmTfD5EqsmeNsrXnoaqycLrCxhLHilwKSgUmThGGrVWnrS5NN/exvfeggVDJzoQ3NygmIpBx2wrRau14v7bjLyIAdriYOeViUolWCNI5GSciCIN6hRskmO93p0cfRzd8Gnbtv3jm8/uu8DN127nldfdz7rO206SZPEerzLweWIhOhU4yv63QWa7QmsSijyHto0aUx0QCxlb5FW0qOojnJq1uJtr72Un37dTTx1cFE+/3f38OkvbV91rM9sXjgqHKZu2vMiB9E0mm3yorvyHRHU0+ut4XGr83g9VImJ3gDpEJCpE/fy76jR+wor3nvj2f84xgDAOMbxoxqDxn9EqX90x0yflHwCDuqGMM79PVJP+WOStjUwUNvyDROYh/r2DhdFc1RU9k1wWByOegLtiQlNCqabHukLGzWXvOJl+qGffe3VXH7eOpKwCOUTNL1G9UqSrIXrL1KEEttMqSRQLXqaaYcir8isiRMfcZShiBNwpRCV4rJVbD9YcNdDD3H7A7t4dB9vmK24JW+m9CvBKgNVQcM6rBEq7ynyPtgMnaUEypWuCfWOpZIaOJGqzrQS/Y+dRukMlXZuWsqP3/mlb6JWr35MVjcu57x17diRGweqQHxA2RSKLutamtdevYFvfGuP3LcDtVCWoJb1GyIDYBmsUdS0TzWS6NXK3b+gFEYiHwBVH9ugURiUmOHvORtQWeC+raiPfe5xmc463HD2KmyzgCpHKQOqgUotqjzG2smUV129kSPHl74xd8+SqkToBXAEtO2ja1qjFrssGPl8QVwhDKd5RVHQ6/VuW7169WsGVODR2wzWBYwxTExM0O123zE7O/vB8YViHOP4h9vwDxr5UVq/tZZGo7Gu0WhcOjjPB5P/0f1/pSJAmOf5+6uqGt7PQCT0+Q+N0pYCT1CQKEVVChNacfHmjrziitM4Y41HyRKJ9mhtEV9SSYnJUlBtjs5rvrn9KH91y/7DC74m6ylAebRYdEhq/R1HqK/zOnyvpe93uT6LRidpdMxxjgx4yaV85PyzDImZI0kCeDBpJ9YDLqen+pR5yd/ee4TPfal8z2wf0skp/MIiVdA1CO2iZo6KIrJKRqsRP6xVBFhyAYNDhVoXQBNzrgdCIEsmsM2ZLaZq7Oi5eXYulR/c/xQffPLw4bd97b7DH3nba85jy4YJNm9cTac5g9Zd8EtAAUphZ6ag2wcCWWsKHyyzsz20aTE5OYO4RbJMyFRFVR0ilWNcc8oEV/7iS/n1n33JiVu//m2++JXHuesJVA/QTVj0irLS5IUDyUYa95p1KVVdl4VnJmfIYN1PnzS8eRZav1reshw3/+MYx3gFYBw/8gCArr1plili+iQQYKXdbVQOUPioLDvMzXqEqjZoQmVIRV+BMNR756KieF8k+AUSKTGUZFRsnggzF25U/Xf/b6967//+Mxf/yptffiGbZwJJcZCWmqdh+qhyCa1SxAkkCpslOAJeIDMZBEUjaaBFcFWJR2Nak/hshhNlxp5Zw999axefu/MJvnj3iQ8/fogrj1ZsO54bcpdC2qmFCWvVfO/wQTCJxlhF8FUE7CEqDItGiY1FS+TdY61CGcGkmirvYZKMNGkyt9Tf3Wo3KKTkxLHgN87oV52+YS2tREEioDxBC1orbALWOBrWoFA88O35316oQGVNgoTBgYzHRtTwGA1e74F0w+AYyPCYgxGJX9ZAgRKFwtbEfMFrjzOOEkFZOHaA3z51jXnv2ZvW0NIO7Qt0Z5IglqAUVldYFZhutbBpk3sfOWJ6ga/0QsSFEls/Hk/cEXnW6dNzo+AO6P8jav9/tn79+vc65xiogg+a/gFbYKAL4Jz7yYWFhd8eXyjGMY5/sBDACi2PQaRpSrPZ/DedTudVAxr+gPUzuN0AAHDOsbi4+K97vd7BAUCwDAA8fysAAEY0KjEUPjKNMm2wTji1QfLqSzf81htespHV2SJUcxHvTRIoK7zyhKRFt2pxpFzFf/mzb/Ct7UyUFkLahrxP0migXFwvCJooTFsrAWpU1NlBnuUpyHf5iaUqoWEz2qHPWWu49Rd/dvOWS85v0si6aOOAFniNy/voZgM7vYr7t83xXz/0KE/s5uYCKENK0mhQ9BexrZRQ5viqIDEWHTQaVeeluMKmlEfq9cREt1HK1h7FYbiOF9ltBl85gnOzLoA1CUkjwVEy2+fhQ8f47SceO37R/MKJi3RjFSaZxJMQgsFg0NpA4cDEgYZ3gmBoNdpok5LnS6hQID5Ha48xDut7qGqRxC9hfJdzT9/Aa195Fa+6Yct710yW7z1xZO6VS3P8sZZAZj14j6rXIaMi08CJQL4jYBRXOFRdj8VVhSjE7JcBkqF5oLDC2kmNaf/jGMf3dvUexzj+UYcm0sc0g/3/qEwbhm280bWSPSvpgsuU/3rarzSKgNQ7h8u3in9n6PWuTGw+dQK+IJGSFtGLoA2ctwG56ZoWr7zuYs7fsh6rSpTrEXyBDiVWKlI8RivQGqdN3IOrJzdGYndpBs65xkOoqAJU6SQuW8/BhYSvP7SXb357F1+9Z/ZN3YrP9krIPVQagm7ixSLB1I/eofFRSZll20Kv671NFFriVEWLQQUd1faVEHSJKL9M25MEJEFLCgSCLDBt4fzVbP/Nf/nSLTde3KJl5jCdlLw7S5IFjDbQVwSZYe/xhP/651/nw3/nVJmleGPI+xVps4krKoL3tJtNXNmLIlE1xBnUqJ+wRbBRk6G2PwraEZTG+BQlpmYPeArJsRMJLq+wqSJbEl5yNvLbv3oT1543QRJmke4Cvr0Kk1jK2cNkSkNocuiY4X/esoc/+dJ+dQjoBrApJDq6CaamRYV7FjGq8D28h08qTEd4u1prqqoaFv5JkrBhwwZZt27d8OejxfqAEuycw3vPzp07z8rzfEdRFENLscFtRtkF4xjHOF6ADKaXd/4HgJ8xhqmpqdfPzMx8MU3ToQ4IRGaA937oAtJotNi/f/8Hjx8//s4QwgowIV5Hvvv1R+S5lZBKRW0Y28jwRYERWKfhVecaeefP3sClZybo7j46tl9bu6SQJJS6pKcnmQ2n8Ad/8hU+e2eu5hQUaUYRAoY4BU/qPXKnFV4LospaE6AeNo+IAD/Tddf7QJomhBCoKo828TUXAaWaKDWFLefYYHJ+4Scm5Z3/7HIm20foTBQUvYJMTkGT4UIX1Z5kx3H4D7//VW69C9UNllw1cFojqgJVgvYoiU9VB4MOaWQAiEZ0qEEMh6/Fd1XIAI2mAuWiiO1wxmBQPgExkaU2mKqriqAcaRCaHiaATes5dM0lZ6x/6SWnc+7pU2yYFNppTip9tO9CqNBKUFoP652IoLt6DQ/Ee4IfCP+meEnANMiDRVSLYFss5o6t23Zz9z338+3HHI/sRi0SFyQH6kt9lnWU0HaUwgdSazqw7N+kR+qxETPDePzimwyll/PWCtadjLkA4/jRjfEKwDh+xGPQFi6LsQUiYd8pwYdaBWDETj6cDC5LNLgVBKUEqzWJURhjcVWJcwGjQtxZDA4XgJBjgVUpXHYOcsMV53DV+adw9vqUtQ1H4hcI849iVV2QGYtOUjBZTL4+TjOcVCgTqYJSCd5VJOiYlK1FehVqegNJYxWHj1Xc+9Bxvv7wfu55ZD9PHoi0vDIMHApAK1U3+jpyHJTGY/FxDoEBDNWwgFIojNhh0aJEhqrLYfh5pFVVVcT56wLFJFP0wwLbj8pZ//1j35TT3/N6zly/Fr9wjM7MJHl+EKMTSFJ08Gxc1eLlV2/hkd1Pyt3bS+UMpKmm6i+htaWZZeR5jhZI0gQfqlrxeYjYLO//iYqARF0u6BW7g0JQDp2CKyowKUEsjh7b96P+9muPyxkbr2fTVBvVKghpRTAVSbuWc/aLrJua5MYrNnL/tv1y5ElUu9WgV+SR0YDFxLLth4P01iwA7z1lWd7nnLtqsBs8epvB5wFtuN1u31pV1VmDveIBS2Dc/I9jHC98DBg+g+Zm0OQnSfKWge3f6Pk/qvyvtaYoCqqq+uSg8f+hZl4FYgRtLS73TGRtsqLLaW1+89VXnMo56zVFMcfq6SYsLsZEYlOqKuCyCfpqhj+/5dt8Y2v+yTnAiUK8xkggHTLTHF4FRKWIUqCiQ42cpPnzncKYCKCKEK/b9TXTe48Eh/M9OqbiorORV954Nu1mSSMDLw7TSNFVinOGRUno9RI+/eWH+cp9KCwUeYqYBKmn2OBH3ArqfFpXI5EmL2iJqkMm2HqtoRrmLCXL8oaD+xHlaoA71FICCkgIZIgKNNut8+Z6i1tPHC427Di2i68/vOveS86ZuerlV5/F5eefyrrJNplqktJFSREfp/hI06+ZjyGASC0umeno9+crVFmilcOicW4RnKGtDOvPzrjuzGvphyY7jiDf+PZOvvK1bTyyP9oMW6AkCggG76jQw8NkdRQA9s4RZCVT059U1QVA6frxjdrZKsAYDArvyvFFZBxjAGAc4/gRLJ8wFCzbAA5U7E3c00eBiRxyj0TYX4idr64taly5gmUmoqm8wnnB4LFEmn8ikLp4wq3KuOSay9OHXnL5Fq6/chNTWUXDWpTrY6pZTO7JqOq/ryF4cAUET9COQmeUYvHKk+iK1DuMKHTwkQpoDaDxTuFam9h32PDItjm+8ehB7n9iHzsO9tV8Dj0FpQVH3IVPVDTwU6EiiMMHDSZDtK1flzRaEAUwqqr1iCKDQktY3uWD2l6RITAAy1N4TbQxBAuVoJNJjuXzfH0b6n9+5j75Vz9/HadPrSFf2kPaasX7TQxSliTWcc0lW/ixAxW79uxkfwXNCcNcUYGvSNIWpQiiDV6EUSei4bBKwkiBVEMCksRbqhC9l3GIAm0VIRewGcEHlDXM9j2fv+Pob118/v7f/anrNtJqtfF6karKmcwakTLZ66I7jssvWMXN153F4/u3n3a0cPu8aKgSFBbvJR7f53EjcdC4j0728zx/T1EUt54MAIzuEw9+Z3p6ekue52/p9/ufHDQag9s+kwXZOMYxjh9iE12f3wMwQGtNlmVJo9F4+8nifwNq/+i6wNLSEmVZ3jZ6P6P3/fxiAoEgg2tggikr1ifM3HBB53evv+wU1kxUzC310UmboKJdLsERTINCr+Zbj8/xmTsO/uGTR/n1CjA2QfuYp83gqmoGdn+hZp9ZUJqg8nr/td7N+g7XYGsteV6i9MDT3jHoJZVUZGhWd/yWa65czaUXraGRHiNISaKaaJvhxdMPGslO5dbbH+fPPnX0g0eX6vs2aVwtw9U5cQCqP31IEVcXwjKALbXmjR6FkFX9XPRQmjgoDyrUawMM9Yl0rVl0rNvbmpiERGuOVX1OHObq3XOz7Dh+v5y/dTc3XHkOp0xqTl2VsaphaIYu1udYHUBnBNXAK4NSJb7qQVWQqChwqwXozaNtSmqb9cGIE5Us1XRMoLWxyQWbL+Gtr72Ep/ackHse3sE9D+/liV2cdbRiRwWUhCG53wXI65RjEqhcPZAZtWsevIIKsFkUFw6emp4QmZquGusAjGMMAIxfgnH8qMaoWrwM8icBEVP79qm4PKiIDb8hggC+tgv0frjWb4f2cQFDIAMyDR0TWXJrp/jClRemb7juyvO5YMtGZqYatEyOyg/Q8p5UZXE73cjyCoGyIK4eBdQjbC0YG0isItEZ1sWEWlUl2gtJ1gSVMteDAwvwyK49PLB1nm8+cpQdB4Lqh6hKrI2QWk2FRaHQwaHUcrscRFDi0bVmPWpwqdAElSBojICWpKbLxyJLThLaiwk5VkwD1eXhrp7o6HectfB2Atd0fOyLR9SamQflV37uCjI7SQgFlfRIlEIlQpmXrJ6Z5PpL1/HQYzvlr+9HKV+R6VgcVGVOYhLQmrzqYa1+Ror96CpgfPg2CgHWYlFSswYkxANsUPiiImlkID12HeM/fOq2+373jI0tLr+gg2048mKRoC3a2uhiQI9mmvDyl57Bkwfc3r+4dbfq2Iy+08Sj7Hm+5YhGJ4SDfxdFcVue57Tb7RVN/MlsAKXUQAzwE71eT+V5zsAVYNlGbBzjGMcLDQLEj2jj2Wq1PpFl2Ypze6XwnxoyeZaWlt5aFMUQPBhlATz/AECdhKvAdJZgiyXOW8eJn3jZ+ayfMZTVCSYyRej1EZ0RlKLwAp3V7Dws/MUX7mfXcX69rzSpjQw1EY9BY0xCCFU9JY/NsJII7kO8zsv3sBIeQkAbMCa+EANTlCQBK9AKBWdsYPs1l59KlvRoJCX9okSnk5S5ohKPbq/nwSfm+fjnn+SpA7yzNd1mca6P0QLi0SOWdANXQl03tbEuiStqy0w1jRa7Io9J/b8wXDdUMX8NHIh0RLvVEGiIedFajbIKlTQwmaIq+xx1wr3bg3rywNHk29uOlmdtSLjy3A1csmUdZ6xtM9No01AFKgTKSrBWMFZjbCOu6xlXeyK7yAYIxAGGDIYoPjIhSWg319IvS5pOuGhjk4tPfyk/+9ob2Ll/dvv2/Sf4+n2P88TupQ/vmuOXK6ACnMTxgQi1oHLCkAegVO2AEP+WVNVIlh/YAQ8XMlcMCMYxjjEAMI5x/CiiAAwG+VIrwg+mAjXnP0SKniGQEKloauBf62PCtkAGrMlYd8YGDp86DdddvpEzNq7hzFPXMtNuYYhotGYJXVRkagrlPTgPIYdQxGbaRhp6JQGTWZQ1+BBwUqKkwrhFJBi8b6BNC2XbFNpwuBvYc7jgwR0LPLF3kW89MfvQwTkuO9aLzyaxGo3Fu0iXzFKFwSMYAoqq9ur1SqLIriqxoglSIbW1kBA9dj0aLfUEW8VpgwxUeSUF0ajabgmiteEyCBAAR2I1Zb6ESTIWuiWi4Y8/tevSDavNQ2953cVUsoB3BkkrGu0mRlIklJy3OeN1L9vIIwcOfHrrId6sgYaF3JWYpI2XSPf0CiKhcBmWUENqpY4TEoiPVTRQDZv/QF07qQxdOAwK8Q6bQuXha4+IOvvOh6Q9dSWXnL+WVlZCVcbmP7EQBGv6nL5hhh9/2bk8tXWP3LenUBoLxuDC8z+DOHmyp5SiqiqKopgNIcwMRL9Gbz962yRJmJycpNfrva8oivc45xjYCDrnfui04XGMYxysOEcjJT1gjKbRaKxrNptvstYOwb+BDejg60GUZUm/3//kANT7YTN6lIAVhfaCrZbYlHHTK6+c4YrzpjHpElXf0cw0oczBdqhUClnGgSXF5+/exR2PoBYUBGsJKuDKAoXG6AbBKrxbXv9SAYyEepd+gPpSC/d+53De1RrBUr+OcS1Aa42pHJMpXHvZBBeet4bELqF0SdOmUFp8lSLNjP0nKj7wp7dz78ORsL/U86SNJnm+iLYNaj2/yJYbNPKSAHboXiB6ebc/ENADZwBZrmGitk3UA0J01AsQAaWj2G0NOyMhLp8J2CRQ+op+Ge/OGAUWcqDqU83vRm3bXXHvI3vfdu6mvR+56oJTuPT8TWw+ZS2rMuHUDqhykarsUoQKmwg2TQkIzhmyrElwgg8OrQLWSLQ/UhZLSr5U0Gg2aTYTcI7gjjCRKdaeobj41AleddlLOTJfvn3n4aW3P7l/lq17jvLU3u6H9x3ll7s1GFOq6qTjOcICMCZiAkEhQdAiyzLNg3XOcYxjDACMYxw/WjGc8rLM7l+OaEFjcZEWX58sCTXLvs4cGjhlhvddeN7qd190zqmctWmG01Y3WD9lmWoGJF9kqpmgpaS/eBxXlDTSBmmzGdHxqu6IdWxYsVEBH3FRJN5YvNF4H6hcgRJFag1aabxPcHo1C0XC8YUuuw6f4LFdJ3hw+zEe3cXv7jnBvy819CQ+eG0VIWjEeSwZVltCrb5cO9PXN4xaBorB3qGvFQEUgo2Fhpi6YY5kyzDyeoZYpaBlSLKs9+v98DWL7begjce5gtSk9J2iVE2OLvYf/tDHty9ZHTpvfNUVdFoJpTtG8EKwnlAsMD0tXHflZm7Ynr9p5+dPUAGZjZRAV1VUGJJGk8rHFQ9VP0YzsHqsNQqi1ZAeEW4cHv16QqTRXiG+omlSnOuyVEE2YTiRez5/59zvn7ph529smLmUtZ21oI5B6EEa3ynWa3T3BBdsWsubbr6Ypz70MH0c3vRxalR54vkHAoDh5K9eA/hAq9VaUfyPTgkHH61Wi+np6Xd3u933LC0tDW8/jnGM44UHAOL0XpFlGe12+9bB9H/Q+J9sFTj4nX6//1BVVSum/wMdgWXW0PPZIWmUNzQpyYDrL+GOG646jUTPk1qLZBn4PjpJoouJSlmUCW5/cDufvXPnHy7aegJsIVSRxWfQiBFKCZSiULWVXpyaB1RweCVDoTj9LCwArQegabxRo2EQEfLc0Ra45lLkdS87g7VrNFZV9LoLtFpTkGta2TTHq4SPffor/N3XUd0ASdag6DswDqVVFCJUtdVfVCWMeVgSRMUpfdBh6HinBQhS51SD14ahzbDSy3tutf6O1HWMUsvTDl1nX5QjdzWwYCKwobRBROFCoPKOTiNhIa9YmuWjB2b56CM7Dp529sOH9p579umctabBS8+YZNNMwuo1a2llgbJapF/2EHytMVFhTULaaMQ8FAqCKwjikCDYJMFXS1B6lHcYLaTakBpFWxtWpSmbVrU4d+MEL71wI4WaYKHg7Y89teft9z22jQe2HnliPuffL3b55FIJnkCouXWRhLBM9R+krKG05bj5H8cYABjHOH5UEYDoBY/oUZ+46H+rAlZ7jI8+AU1g2pKcuorynNMVF569mc0bVnHp2WfQMIEk1WgTMCoq5RuVk+CpdIkrc4w4GllAN7PYAedzdPM+rXabYCJ8HSe1saIJPp6aRixUIF5IpUGSpGhjKYuK2Z5i95zmiX2zPLh1L4/uOsq2Q6ijORTUQ3iiS4BRFm1MXMMzgb5z4B1WDMuThoCvEfLohsAyCBC7SJRUgIu7hBIgZIiOhYoo8GZZJsErjQlRjyAo0FJPx+vXOqhA5UuMEpJQkaQJi/0u09ON9qO784kP/cVOWb9qkpuuPhWjO+T9LsZ6gi7AaNatX8VNN17Jo3vukvse6qvgIDGW0tfCSYNJgNJILZI0PMQDEGCojDzCThBdF07R2cDWloA6+CiOKIFuEGwGO4/yrltu2/kbG22HH7v+TJpTGYEuLonOCFYUCSXTyTwvu2ID37x2l9xy/6I6io/bJUPmwfNUYteF/WDyNwAA+v3+B/v9/geyLPuuYn6DJmJiYoKZmZkT3vtVVVUNd4nHMY5xvPCRJAntdvtXG43GpQMF/0ETPwr+Db5XXwPeebKF4ChY8LyDF2KRkNLQJVeeitz8krWcvrmFd0uIa5IljciI0wrlC7xrcvdTB/n0HU/x5DF+3bdqsTxdYqoEIUFZRUmgCiUYjaiUECAJteUrBUggiK2Rf/0swClYa6gqN/xeUQS0hrNO5+s//fqzuOri1Ziki6sKDCqi0BSU3YJbv7aTT/7Vwi/0BZwBV+akjYwqL2hkDbyLzb8mrvsFpUEsQaU1CF0yOuwn1KAF4JVFpBmBbJan2koG4H1ASXzcotUQdPFK1ysQGp1oRAnihSoAZUBhsCrFmgZL3R6tpEEj0xAqDi9V+w48Juqep3Yxk3HaravZe+0lE9x47aWcc+ZqJjKFToVMSrQJkdkoJXhN8BLnHTpDZc0olOwdocwRHzBaxyGI97VgkFD1ejRanlUmoWU9wjx2VZPLX9riJy+5iMJfc/6h491PbN9zkCd37mXb3h67j3DH4XlescBKVwEn8d9KabyYevFz1DNgHOMYAwDjGMcPL9RyM84wjQ0aYcHgGMwhhq3ogGbOaAIPK2apeiiEMxphlBwWbf6C1NPtWhyWOIRvEBv/M09Fzj+9w1UXncmFZ57ChukGrURo2kBLB2yYBV8LAQZVP3Qh+IAvK5oNi3NRK0C0ihY0XlDW0J6apNIeHwQJHoPCqEir1/X02VUBpTMgQXSDJZdx/ETBU7uOs3Xvcb755DG2HfIf2X+cX+wBPjGUmcWjIDHRz1nAecFVZRTBMbF/1wbEK/TA9b6mOgqBOAgKUZ9pWLDVr5vUe4U1hX6g8h9OGhgpQr2Pt/zqD10BhsKAmiSDsurhPLRbbY7MdbttAzsOof7icw/K5tNP4fSNU4RQ0WyD6D64EitLXHbe6dx45WnsfOIpTpSgjQc0aWopin6s/OqjHVc8wggDoB66qFCvfejld4YsF8TGxF2PQgqSJCNRjrJwuBRcA+56FLV5codcsOU0zp9sxLdCCATxSKlIJqew811OnU746ddcyCPbv/nppTnejKbeyNTYEJbtFdXy7ufougJDKGZEcHFUAOmZTq+TRPsGU76yLBns/sJ33ukf/LzRaDAxMTGztLS0pSiKHSJCkiQrLMjGMY5x/JAx7HrFJ01TGo3G+5J6Wj7a8H8nBkBZlnePfn8UAPie/74KNYg5uOAM1Ob1kI4dr2EOTbSxi9d9gxJoUDCt4FVXZ1xx7io6SYVOE4pej6zdhGaK6/XRtFjyLW6/dzt3P4FiEvJ+TNjiQYeYa0QrfKj3vtM0+trCsNGTWudFiUUP19OWmYDDa259/fc+QALW1u69KKzAuhmSG19y2nU3XLOJZqfAhx5BObK16ymOddGhwWN7F/jARx5nzwk+GiagKuqhg6uYbHdY6vYwphHrBahzpR65xq8cVqxYV1QSgQylawZBGLLqIqstoAfaRsN8t2xHLHU+dsMdeV2vIGg0BgngxNPIOpTOkfeiM5C2LYxRdMWR94p9S0uoA/OLv/PArrt+69zNU5x3xjTnbl7FaWuaTDctDR0QKSF4lIHU6iHw3ytzmkaBVOiBv6LzBC9xtdAaGtMT0O9DuUQjTUE8YekIKgRW2QyhwYbVDS5ddyrVNWfSdcKxxerlh+ZzOd7zPLJ9P/uOLvLU7vm9B46yeTGAk/heGAgLhhX15cqvGakjV5wZKjIrzEhlOXj/nDxkGrZZiqcDDmMWwjj+AbRf4xjHC/Puq9+B1oCrIG1OU5YCXkiUwsoSBo8DKjReJXW/UyeuUKvNI1hRRFxX1d8ZfEjdOjkGpPWE2ORboAXMNPnVMzfzhxeeewrnb9nIaRummGoqJjNIVUkDT1Jv2RlxsWVWAmmCSIj+uDoK3oXBtNUogkSJwUhhjCI1StVFiVaUviIxghaHdjkm+FoVuWYmhIygJ+mGCQ4sCI/snOObD+/kgccPsPMoaj5AVWsReBUhE18XBSsTkV6ZvIZNvX56vhophAbJ6hkvFKKJvgHUwnluJYgzOt1Wg4nEKNmiLkhq1kT8+wolKSYYEunRNvBzb14j7/znN3DmxkA+t50p41E6gcVArmd4cr/h//Of7+SOB1F9wFlL3zmyRoMq5LUOQFoXWCXWQ+ZSAErjhsKFo49tyKSUkd1MllcDvAIxDgyYCjYEeMebN8i/ett5rJmcR3wfCQkSpnF9R6YDOMuRWctf37GdP/r8/vdsW+D980ZhWlOYhQUaWiNYehIwrSZlsUSiQ5xchZqaqWqxQu3iPqgAYp61QThZBCxJEpIkYcuWM8RaOwQATm4eAJxztNttQgjs3Llz7+HDhzeLSN38r9QXGG0wvPdjscBxjOM5xCg9/2THjsG/syxjYmLi3VNTU+9rNBrD22odLewajQZlWeK9p91u45zj0KFDH5yfn39nWeZPAwu/9+a/xrwFbIiq9KIDXsBpBZKBS6ItbughVGgbh7wFTcj7nNmAm85R8u9+6XLOWF1hCRhro6UfJUmjYmHBYdsX8LEv7eD//OhWtcdBv10/iAqMBx1qp5o6tw01XOomX8uglQu1G41GiSWJZvOUBrz2oMr4fHwar/0GgnYEBVXpaJrIBrziIuTdv/ISXnV5C6OO1M47ivluQXNiM0/ugf/4X27lC3dFq91KmzrHOKzXpC4FFF57vD55Cq1hRUMZalHZQU5aVvuXZyzowzJgP5Lr5SSgWJ7hcKsRQPk7r0aEYWvcUAGqKK3YSaGTcu36ab5xyfkzXHruRl5yyVmsndJMNzxSzUI1R8NW0b0gBEJICD4yVozSaG1jXVF6QuXQaYPahglCwEmo3/dxUGJcPNChrvI8gleaoCxeGcQ2KCSlX2hml0oOHe9y4PAsh4/McnwpZ9veJY4t8ZFj8/ziElEtyNfjjVjNZDgCvn73CCE6QxnBiCepInBfkETOpKmG4AASGZxe6sXRzILvgnKYrIHv9Vc4SI1jHD/sGDMAxvHCgwASaW2pAt+fwwIphoZ4TH2TCAAE+lJEG7qobYNRAQn15L5u7ge/M9g1H/xsoslp61axd/OpU2zZtJ5TZjpccsZGWgbaDU2nqWklQqILlOuB76FctLwxesQneTAu17HRqQiooEiVBQ3aDDqzyEPQtfmdiBBE4cURvOARkkYSIYog+JAiBEywhJDQ94ZulfLU/nnuffIJHnjyKFsPhk8eWOCtXQ/OWEoVE94zJ/KnJ+2no87hmRHBFYyM75CjFMM0Gf+mffrfPAkRl5NEFwMKUXq4n6elnmyQ4WghSc5f/+2xVWeete3ET918NqsbM6AWKeZmySanSJeOcsa6tfzka8/j8Z1b37h7gc+mVpFkHRa7fbS1KB0Q7YaPRZQeWj5qCTVAcNIWiKx8zP6kZ2YEvLeIAZ0FlorAX3/10CfP2KTf8tbXX4D1R7FW48sCCS4+W1Wxbs0U111xGo9uP/K+E9+q3l9YoXQubi4GHR0EfElZdNF2pUqRYFFSv17fR9Ew2jQMKPz9fp9OpzNsNkbdAoyJ+67W2mEzv27duk1FUfzqiRMn/lukDeun3fcoiDCOcYzjOaTHkcn8M03yvfckSTKc/o+efwMQYAD6GWMIIZDnOUVRvH9UEPD7emzyzNyjFY1l/XeNMgQfrWOj7EzBRAKndtj+c2+4klUTGkWJyQwh76GNQTdSlro9spnT+dpDx/jC15/kaAk+bYDPB66tcZVArcxlajidDSddw/VJuS+peYGh1qkJ9fgggpvOBbAJYjXNhoF+wVQbbrwi5dLz2hi7SNXvkUxtICyVmMY0R3ttPv7Fr/Hle1B9BZUyEYCGuDY3TJ+y3OA/LVeHoSNA/D3zHW6jvytA813ZYc/S4Muz4EEeTV+nBOOxOlAhzHb93XuXUE8dmuWO+2fffdHdW9932XkbufayMzjr1Gmmmy08XVToRvRGKWzDxuFJ4Sh7fcRDahN0e4JyfiG+f0wK1mK1Au+pXMAFh1aGuNHgUcFHocFa0EkphfIZohNoNdjUbnDxhlW4C9bhROHEUqiExSr8wly3+oXDs4vsPjzHU3uOsH33EQ4fK39/oVu8q/RQhjhyqohbDb52XG7Vh8hSUdY/Q0ESMQJEHMZ4el5wRT15EvC9PlrX2tLjGMcL2H6NYxwvWOiawjdIkRM65sSsbtoty6SpAV1r0NwPgAGroZ1x1XSbD6yZ5Kq1M7B6skGnkbDplLWsmZnglPXTrJtu0U7BKoeWHBsCvleRmCROKkMAX+FdSQghWgplNlLmlUKM1AgztVCeIkvTqIYeBKMHIj0h0hlq39lI31Ogoz0dg8ZJCVXRR6UJOpnAqyb9KuXInGPX4SX2HS/52gNb2T9bsudY8aajS3x2yUOhIGgFykQTvxcpgizoyIogoFUxUpQolG9igibIEqsyWDPBv/nVf3HZ7//cGy/AlLuYSOfAF+BaOJli73zG//lHX+EzX0bNVaB0EydZBF50H5/0GRgWGK/Rvh0nDboYYS78PR+/Aq0sVZkzmSlMIVx7HvKud7yMl182gcn3orSCqgKV0q8COuvgmOKO27fxF1/cxm1Poo65wcU4QxlDUA4XShrNWCxLoBZ0MPVUJ06qUBCC+q5F3igDIL6nZfg9rTVr167+9Lp1697UaDRwzg2b/hACAzrxgOrfaDTIsox9+/axbds2VVUVSpkVDcdok6K1Hq8IjGMczxEAOPm8OjlWr179vpmZmXenafo0lsDgfB4AeSLCsWPHdhw9evSsqP4fngY2/D2y9wiDLIK9okI0zam1dVQwEYRwFYkKpIlQxksXZ05y7dtfufobv/TGl5CpRSZbnpCfwEoBWULZ87hsHbvnm/zhx+/lU3cuqgVAsgalzmMTJs8EPH+vF3CLkho00QWKcnlFUGrOoKSISQlVoGELJnXFTVcgv/GOq3jpFVNo5iCFfLGPbW6k59bxob/4Kv/zz/a9c/dRPujqLQQh7t3poDES4sqXBCrzXAfALxzIGhkgoZ6PK6xWGATlhcTHXnd1h6tUxeFVLT584Vm85oYrL+Dyi89i/eopWqZL0x1Eu/lYA+oErdP4nEqPFA7Vbsdu25XgSrx4BF+vKmqUbRLERLGGIKggUVOhFvv13g/rDIHIrtQKrSxaG6xOUMrglKFSihIoRBNIEGUpnVDkjoWlnNmFLsfm5jg6O8fs3AJLecnOPRV5Bd0+9y0W/H635KOlWz6rEqKjQkPDYojaTMpCt944LMOYADCOFy7GDIBxvKDok/JgFTQzWNM2r3n3O95y68Z2RSM/TDuDsnJ4UpyKF2qDwkiIiUYHWtMp2jiM0iRGYxWkOq4PJFToUJLgMCyBO4bkORIqjA4YbbCiUc5AVQMAwWC0xmQNSFpQ5MRdd4UQEHXS1MSHaGVUK99HdMJEOoNSxAX3EooKyireQGswCeiMZHItB+dzdu2cY+eBvew42GP7wS5PHezvPTjL5q6HpQpyBTpJUZklUYrSl+DDs8P0/8CP/7ImgBmhOQqiqzjx9hkew75jvT/48J8++AuthKt+4rVnEjKolg6TGY9UC0xPT/Dam8/l/sef3NPdzeYyVLTSVTN5Wc0G0diw7PYA4HR0Jngur54O8T4smqI0dBrC/dud+tNPPyTrp6/mglOmMP44SA5ZigBz5SytJlxx/hRFfxMHTuyVBw6hnNGUJqEoK9KGIg1xOhCoX5+a8qgIqCARAPoe93VP9gIffA4hsLi4+OaZmRkZKIef3HCc3NhnWcbatWuZnZ3dc+jQoc2jDf7Je8RjkcBxjOMHCwaMno9KKdrtNs1m891pmo44AsSmcNQGUGuNMYZ+v0+32725LMvnzNBRsuz04vWAdq8RZHmabjy+noqKSdAipDhWZ3DpZr7xuhvOIQ3HMVm0bK1cibEB5T1ONVmStfzFLV/jS/csqlxHrZLclzHnBnkarf3v18AO2F8Oi8NIBBQGzW2l4p54miRUrkRcxZYtyOtfdQ6Xn7cOyQ/jbYVptClRLHQz7rjrST76sX137D/CB9sTMF+wvEonIe62i0ZUidcyMs54MUbURwAITihDBJazJMFZwbmK3fPc11Sw5Lj58IPwzUcff81p6x+/9fKLz+Oyc9dz1ZYpprKMViMlUSBVgbiKVBt0O0HKHkrqjXyjMcrEwUrtmlCpENmDQdXrlWpkjw+SLKvfrNFWOYIHHi95LDf69SDFGoyNg6e2USitMcbiQ0C1DXQsckoLJ5MEOZ1KNKUYdHsVhTNUVbiqKMNHShc+UolEYUUV8K5k7+5dTExNsHPfEY4VmsM9y0f/+kG14MfXtHGMAYBx/IiDAEGgm4Mp/G29E3u54pKzaSwdRbsFVNqiQkcAICia3mODRORfCd3+QRCF0gNlO4U4QYJDhYDGIQiiIxVRZRNE2T+oQoVWJVrFxGyUAW+iiq6PKvkoBT76x+oQMNTq5wPJ3TLUE30igDBU3bGIVvQXeug0Jc2m0RNNgsBCr8/swiLHuiVfeeBhdh11bN9/hP1HefmJkjv7An0UFSk6beB07AZFHLboo0To1LVDRcCrF+tpXO8SikZJWtMha6q+qvA6kNk2vSraFm4/UFz9Pz704OMu5Of/zJvOIclKgltCmR6Z1lxx4XquvXLnpmPHKo53wZfFrKLCUA1pJH5QpOoKj8KE5wYCGAlMtadOO9Ht7VsqLEan/M035tWpa78t/+aXXsJaNQ/OIb4ibWXYosQVJ1jbNlx/wRr231Ry4nOHX7OjH26zmaEoIxPCaihKIBnsbkY3BxWiO4OWWpxIfe/NPzCkBA++VxQF/X6fRqMxbAhGVcGjBVY1ZAH0+31arRbr16/fdPz4cYqiYlRJfNRx4IfpKT6OcfxjjNFmf3Dujlr1TUxM3DsA7wbfH5y7g/NwAAoMzt+BiGcE+57Lo9OooGsBPR+baaVjQpfaScaArwVyldG4oqAFXLZJyRuu3cKpk57JLKdKEsqqpN1OyZcWSVQHn67n83ft4q++MnvpgT4k7Q6uzNE+4J2QJBb3HDDwoAKia1ebEDAhahkIGqddzRjzeFXSbjkmFVxzqeWGq9fTzEpA4ZViccnRnD6bv/n8Q/znDzzO3qO8IihYWDJgQy2aG1fbBqKuIX4Ry4UX8WUyOI+ytSSBVwQx9L2KXPlgaTVb9MuC0jlSq5gv3G2HdqIe3LuVydu2bjlzhu3nnz7FFZefy0Xnncr61TM00x49N4dxCzQzT+I8yoXo+VjfL5KAFZKkBFUtqzgOGXEalMb1FhGl0Da+/+J+aEDrAGLxOsGQoKgBdeWg8jjXxwVHotP6nW5BGZROETRWJ6RKUS11saoeBiiLJCmiU8RYRAfSxHPN6Wdy9Mghrjn3QmbDar766FH+xD9IahWVG+fIcYwBgHH8SIZGqwQv0b21kMBnPncX152lueZUKGZnwecYSahooANkriLx0eMWEdLIuUeCJYjDh9h4ayUoE7AagnP40iFKE4wFm6JUpIe7QBQH1JogikTXCLLyiB/s2IVhglFK6smrXm6+jIkTfal9BJQhqISKBNtp0XdwuOc4emSRvYeOsW3XXrbtmmPfMdg7y5tmS/XZpaLeMUtSSl2LxgiEwtcLjZpEJyRBUKXD+jg0dy/2IetAMIek3nPUQIloD8qT+yU6zWmKLjQSy1MHuhf84f+99X91VjXefvONm2hOzBMWD2G1Y8MqwxteeT6PP/aw5NudmnNzaKUJBLSvd9V1rRupI+8+jEx9vp/Hrg0sdOf2ZWYiTgVQzPkef/ON4x8+a9MTb//515xBq2lxvkB5R6fRwrklrHasm0q5+aXncPeDh2/dvxXVreZRJjIerYmFYRAiZ1Bi8T+QfQrop+29PuNDPMkFYLRBiE2CY3Fx8ReazeZHBkJ/8S1tnrbTX1UVzjmmp6eZmppiZmbm9mPHTrzCOfe0/eSTWQTjGMc4fnCAgLWWLMvodDpXWWuj68iIhsfgXBw974uioNvtvn+w6vO8oPmiY36sp97OxUbXpAaqAgNs6vDPb7z0NF5+xelMZScwqqCseqSpAaOpdAvT2MTt39rHhz/z6N69XR6m0WSp8GgfaCUp3bLC6AwXKp6TjZuKcm96KPZqCUPBNyCx+P4iJoMLzkFeed2pnLUpgfI4NBNMOoVRM3z5rm382Sce59HtcSsi2A5FVZEAKrhaUwAGmjmihkPsF3cFV0+xIzhVSyzrBJUZtGhyL4QQ19fKoGvJ4IDxQiFux+x+p544NM+dW+/5v87c9NivXXzuBi7YsobTN7RY1VzLRFJFjSYLJpM4cClCnRjrIY2uazJRDJF+RZzst229HhAQovZSGNnKTJptpBJKVxCq6FSQWItNbTw4LtT3rSODo8prW+UKZRRpZmI21iHuqEoTvMWFhECBqpYIpWPtqhkOHTlEXyf8j//+6fcHoDtu/sfxQpff45dgHC8s/pQwkOuz9FkL/Ms3ZPLvfv5GsuIQ4iq8aDwJBEXqAyaE2oM+qtBH6xxD3GisBciUw1ChrUSRAUK84g8azaCpxJI0mtH2Thz4ElElChdX9lW9w68k0vpr1XqlNOhauCaUYCzoBE+CU036wTJXaOZyxZ7Di+w92ufxXYfYtucI+49Vb5/r8se5g9KDMhmlB0dAdESova4bN8NwcqODxwRqBZoQXe6txqGeUQTwxRFh+D5QvgmYuGKhCsT0CbomYBSwprP2pnxh4c5ECjILZ25G3vWr1/Oq6ydp6aMkyoMkzHebfPhj9/CJz/fve/wAV3sNHguhGY+fLnCmxJt6ihY0Jujv8+IZMCrgKmimE4gx9Mo+1hRMWjhvPfIbv3gRr7xiPW07R3ALNJqT9TpIDtKim6/is1/dyf/60i4ePIDqSgR1jI0bHhVpjVrYuG4gUWXYf59X7qfT8gPWWk499VRZvXr1UBwwTVPijr/CWjuc7Btjho4Ac3NzbNu2Y1W/35+tqgpj4r6v936FANk4xjGO59b0j4r+iQjtdpuJiYlPrF69+i0nn9cnn+OD319aWuLw4cMqz3OMMTVD4PvXAFCi0fUOvTNV9KMXi4hCS1T3DVKCFlKjsUVgfQI/dd1aedvrLuCy01MyPQ/5IZzuYTtt8jxl0a3msX0Z/+XP7uTLW1FVokmakywuLpKJ0ExbLJXRLtCH8vsGAKKTS2wYGxXYAEZSPJrCxDUxYxRS9jl7DW97209OfOSX33o2p52iYLEHaYcFmeDxfYH/+J/u4I67UboJsz0LKiFpZEhVohCMRHabqDj9D0rVDgr6OYIAL2TuD2S2FkL2ARGFD7EWM7rWVUITgiNIdGDSZlBFBZQOVBJZItaDFLEanEnhtNXqxPrJbOaCMzewaU2b805fxeYNbSZbkJCjJceECluBCSDia1FFh1IjBn+qnuyLie8SqSf5yqDQFE5QmHh+mWiCKCI148ChjV22Aqp9BjAKsXFNoFdEUMuqAqM1SAukASoBXeFkFttM6eaGqr2Jd/6/P8tX96GOAjQ7uH7vuQFY4xjHc+zAxjGOF/hdaEBbXNXHK7jlq8X73/zK/N1nTHTIpIsOVd3E1xRIBK1qlNdHnX9lNFbrOOVXvhYHCuD6NbV8gBDXu/kmIdEZPi/QxmCshiQZKK4hEkCZGqmPPgLRBDBBqRRNgteW0ip6LrC0UHFisc+JhRPsP77Atn3H2XN0iT2HPbN9fuNYlz9YLKBUEEyCshkYPdyV1NrEYkM8+HK4LxhCGFrziLaITggEvGiU1PYJL+YEonwNx4cIzEhkUKyACFI4vnT0zsQkJLZJr+izbQ/qD/7o6zI9cxM3XHkaWs3SO76fqeYkb3njZWzdcfdVRxdIjvSopPaHCOrpkKd+DsWXqEAVYHIyY2FhkYAmaxmKMgr+PLoP9T8+9qisXbuWa85cFfUkVA1amTjiT9KS17/6MnbPLnDwiye2HMzZURjwwVJ5PZz+R70CDypE6qpIFCHEPGvD/92m8Vor8rykKIqHgEsHdOEB8DSwDCzLEuccWZZRllEkc82aNezbd+B9zrl3VlX1tL9zsnXZOMYxjr8/YDfKxBmcn0mSbGm1Wm8ZnfIPztnRnf9RVkBRFPfleb7CIvC5yADEnf/YaCkJNZMq1KJsUXjN2BQVCjJf0lJw7gbkpqs2ccnZq2FpL+KXUK0Uaz39pT59PcXRfJIPf/br3P0UimaK85ZiaYFmYqASumWOyZrkZRGZUs+hdfaih1ZsQsDjcNoSVLw++7zPKTNw6Xl85MZrNrBxnYb8OKRToCbZc9Dzv/70Dh56nPW5gC8saWeSIu9SuoIEU2vFqCjaqsqY19SL3yFFAVXuUSIYrbE2RYymCoLU65AiDq1q5mT0/Km3RALOB1QDCoFKIGkaLCmLTnj8YLHqiYM539y6i/Vt3rFpg/7AqesabFibsnFDm40bV7FhcoJTmqtJBZQqUapCU6F1iZESrR3iKrQSrLZoVa+JBuqhkWASFZkYKq4N+FDnVGvQthHFnAfKkKpCBCpVIXUx0UjS+JwGQsIhgFQ16OCxSUpRCD6d5p5HD3Dfvqg76RxRE6p2wRrHOF6oc3gc43iBQkekNE3jBbNaIhNYp+EXXzMj/+ZtryWd38FUR1MuLGDSaOmixNNfOEFn1QyUwuLcIu3JKYJRFJUnTS0+lKRa0OJqcb+o0CdYRKUEHfcmcUXsxayK6G5wOIlFkzYJRQXKNFGmQQgpeaXp9ioWlyrmneaJ4zkH5nrsO3iIg4ePc2zOPzHX49cXcm7ruUhScCpOEzxx6uCViUwCAmnwQzE8WKYEKgFBDRVso7etJqAi8WHAmgh+hF74Yrv6uLowUCjfikr3KET5mgFQxuF3vWOngsIGgwkWEwKpKrn6MuT/9zs/x4WbFtHVbjAeV2R8/s7D/Lc/OcS3HkX1aOEQklTjXZcgkDVSqiqqF3//EUZe++hBPXi8CFiBtoOffvmk/MbPXc0ZkznthgLrQBVxzF9lLOWGQ/Pw55+7m7/4UqmOlLCkElxogdbRb1g7gs+pCJF8YhVVJZjnKCJljKIsHTMzU+tOOeWUw41GA2PM0Ppv1DFgdIUgSRKSJGF2dp7du3e/Z3Z29v3AsPmw1hJVxscxjnE8lxg08QNGjbWW1atX37t27dqrns1lw3tPq9Vifn6eAwcOqAEAMLD5fK7gsfOBRjNBu0BZ1tofyuJ1A60bWJ0gxXGmKNmyig+89dVr3vGW117GhnaFdQvoEMB4UF36us2hYi1/9Fff5n9+fk75pEHfK0QJljzeNxqvLL4GPjXPLf8FMTSzBnmvi1WCSYXcBUzaocr7ZOK59kLkF9+0mje9ZjNrZnrx4q7WsfuQ4Q8+dAdf/Ao3HzjGbbqRsFhGlx/TNPi8hyXDerMMjuiobeNUXOEyEl60DABVr88NapcBqDF4OmGwoqZqDydV33Yk5UZ1/ugmMbCVjOKSAY0ntYCTWL7VP2+3YcM6Fk9b1elcsuk0Jq1leqLBqukGa2aarJ5KmW5pmolDuRwTCozztWCvivv8xKFDqUqcirVhZALEVU4VFNSrpkoLRil6VR9tBdXQ5FVJI2mQ+pTgSnK3SKOVoSVBHJikBVUJDcuRhRK7/lLe8i//132PzXP1McCZBIyKSMDYKWccL1CMGQDjeAEbwIDNNK7oAoFmIwNXMVcF7np0trzmoYPpG6/YQnViJ4lKURgqUSz2CmZOOYX+saM025O0JpvopsXlOYJDWYNUgb6rsKq2KlIatEFh8coSJBB8wGpLGTxSRvaAqGZstoOmCgmltywtBY7N9zl45CgHjpzg0NF5Zud6zJWwfZb3z1b8bj+nW7iY3JSu9/PTuEIWhediMy8sC7hpQqT7syzobsJy8z+wWdL17wmgldTrbn7oa//ihyAFdFGj5kn8VrA1K8ANiwmtJepLKY2oDAg8vtutf89/+Pjh//Y7P87pZ26GuaewLcvLbziTR7bN8ciOnLyfk6QplethDDSThKJXYa0drox8v8WXFh2tkFT9GOunI8Q1xb6Cr9yzoDa275X3/qufhqXdUPVgJiPv90iAVpayoe14/XVb2HvwCfnivSiaCXN9S4JGiUf5isTECshBFA/6AUwP4vQQnHNHiqLgZEGxUc/xwSRysG88aC6azeb75ufnV+wWD3QBxk4A4xjHczs/B3ocIys4r2k0Gld9LxabSimcc0MGz+g6wXN+bLVfb+4qkgpSHcFBr+JqWiAQipIMx/oGW156XvaO6y85henGEv3FWaYmOoS+Q5uMfpkwqyb4y7/byl/dPtdxKfRDnK7aUKFVXI1zKuBVqJvE5z7BsirQ7y2hSVDW0ndLiIAWT6o96ztwxQUTXHXJDKtW1QnermLnPuETn/s2f/dV3n/oGLd5wNhWZO8RCOIjai0uTv4lsgilPqYxd7/483cEZJ4BWBnUJs/0PAcggICRgYJgWP49HXkloMhDAB0dlI2JAjlLJRw7yMSOI13uvO8JWkCnyXmrprh104bWpjNOXcvmDdOsmUhY3U6ZaltWdSaZbCZkgHcVoSzwrke700SpeF5UEhDvMCi0UhirUCiqqkQnhkbTgobClfiqAJMhTrA6IWt0COJwoRaUrKL141LX01l3Dh/49FfZPs/VS4Ajq5mPvmacjmMcYwBgHD9y1Q2I60ckGQhFgcfgga37yT7+xXvlxvPfQlKkTM+0oT9HEKHT6URRF6PpF30AUtcnhBwtAakEi0ZnLYrKIUpFC0Fj0DrBiBCqisoHKtOh8prKKwqvWOh5Ds4use/wLIcXcg7Pdlms4Hg359hC/tDcEr+8WHBf7iJtzRNVjoMMfOFrECAoRFRcH5BIL1sWm4sZ0ytLZV1dKOhaZHCwW1mzzoRakggMDiWBZEAJVRANEfWL+S1QOyG5WuHeEYgqv9onhODQuiJoByIEFdDa1XMfzZFFjjywFfV7//0W+T/e9UZWt9dB5mkHz2tfezHffORe+bu7g6rI0TbBuwqdqEjbkwizfL8q0ko0yidoHahsFQsXiSDO8GllmsNLgS98deHXzjvzgT98y6vOBLeEcZ6kmeByR2YVnWbJleet5idedga7Du2SBw/0VIapxyglgSq+P0yk+RJiUUT13F7/OF2Esizp9Xof7nQ6bx8AAKPK/qMNCSwrjLdaHVatWsXi4uJVi4uL9w2mlAMtgXGMYxzPDQAYUPtDCDQaDSYmJm5ttVorLP++UxhjKMuSfr///qqqhpP/5dWB5/b4kkRT9eMFz2pDCB4vJUELKlS0SOgQuOT0dPvLrzyD8zdPMpEskScejCDWkIcWRbqe277xJH92y8Hf2Nel6xJQJpA4X3PdNF4FvAXEoX0EX5+LC67CRZFgwOo2QoL4Aixo50gDbF6DvOYVmzj7LOgXR0mbp3HgsOVjn3uUP/vE/Nv3HeWPS0CnitL1a1E6hRKDNgZ8zF2aRlyLkIxYNRQvXubeEAAiOhSt+Obg/ahHSp1a50DC8jOWgf6BjVbAmvooBwbtv9SFYSRwKpzSGJXgEYoS+nimJwxLrmChYuuBw2x+/HCP5sO7aSW72w3FVasn+MLaGdM5bf0Mp6ybYu1Mh5mpFjMTbWYak0zOLdFJFI1Wk4ZRBO3wvozaTgjBeyiL+DhrPaiW0aQYrBekrCAxGKOpfMAY0KmhzAtUMolkM2w/lPOJW556/wLgTDM+IRXGzf84xgDAOH60w3toZVGM1/loJxQwLOL5+hM99Ve33Sdve9WF4I6DKFKtUAaKXk7aaNU78oIi0MgaoBTBK7ollC4hVxP0naZbBorKUxQV/X6X3sI8vbxg98EFFvPAwmLFQhcWc5jv8cRsl7fPF9xdACVxd9/peppvITRAo1AufjY1pQ/RMWHVO3+DhKiGTeOw7a2tZ5IVAHnUHJBasGZAhas/S7QUqlnzUdz2RbxKGBkRkdtnhi9OFQuCoStABFB0INr9UKv/qsiKKDzkAp/4QlA6fEZ+5//1U0x2SpK0zznnNHnrz17Gtn0P/t7O/bwra2mWKiiKkqxWzuY57WIORChZ7sRDo6Yq1uJUyqKykoNL/Lf/688fPH/9OvtrL7t6A73yCG1jsTaAK0Hl6NLxkks28+OHC3Z/8iC4RcqalljVAshKwnBn1fwASsjRfeBut/vLVVW9vdFoPE3E7+TPowyB1atX0+v17i2KQo3S/scigOMYx3OLARgXQhTrbDabr2m1WiRJQlU9O/qntR5Yfb5nANqN3u9zBQDiNZTIplKaynkCkFBhqWiQc+56I6+65hyuOm89aTiOkpJmp0l3aQmdraXPGu5/qstffP5hdhzjD5JJQ5F7qLpkZGgUTlmklvlFg/IxL4bnCAIMLk86sfQLDzqlmTiSqmDDKl7z46+d4eLzJ2h1liiKDofmMj5321N86m9OzO4+yh/bJCXRDcrQpSxKlAZlTDQXUDJsZL12dXI3iNJPW/l7sQIAgZUAunrGHAmalesBSsATmSgDFp6oZeaAqKhxY4bgl0BwKG2wNiVJ4j3OdefRJt7OGo1F4QP0qtDVwd95sM9EcsRjnzqGVsewCpoNXj/R4ffXZJx/03mrWDeRsnrtKqZn2jSbCY1GQqfRpJVAJ1UYm6OMRfIu4h3aNLA4yD1KW1xZ1HnOk5gElKbnBUlScjvDh//qr9m1yHv6gB+ISru4yhfG6XEcYwBgHD+qYQz0S0hrFoC2itJ5SjSLBP70i4+8/xXXX/5uQTGVtVD0KeaOk03NUFQVqUniHnlVRvE4k1JUiid2HeUbjz3GgX6DEy7jeGlYLIS8cuR5j3wp/7W84JOV4kjuoCyhGujRaVDaQJLgQtzpC7oe70tA8EjlCCKoKk46lR40/ApB6jsJkSZZW915tbwzrus/ZENGXcoMm38Gv6OINMqa7qjFEoIeatJELCG8iJU8dL3qEBBC/TSiWJCWQEBjUEjQBD3yrJXU1MqASWF2ESYNfPyLoqZWf03+1f9+M2vWtEllkVe/4lTuf/jB3/j4X/GuuW5BqiMdUyeG4OS5U+iJBYwiIAJGVM3gSAnKURQliYUlYM8iv/4/PnHfr63aeDPnnLqKXn6MiSyBUACChJJ1k4rXvOQstu+ak9vv7286lvt93kp8/3nBjexQuoJnnQB+T0dBa7wPFEVBnue0Wq0V9oHficovIvT7fSYmJli7di1zc3Pvm52dfc/JdmTjGMc4vt/8aHDOoZSi1WrR6XRuHawEfK8AW57nO8qy/K5OAd8XOCEaKQI6QFWD4yQqSuUGyARWW3jFVRu47tKNrJtWJEERSg/GU2EpVJtthws+9Fd3ce9ulLZQOU0zhX7la7hX4wc8OCmHKeAH0sRKdPB1lAiQaEGVBeunuenHXpnd+uafvJBWawknDRaKSf7yi0/wJx87fseO/bzC2YQqtBAJOO8xFlqNBO+gn/sIbKdxdQFxNXAbmQtqtBv+RxVhReM/+BxWaNXo4VdOCUrFhcio0TxYB4iDAVcGjFJYozBKoaRCuTJuC0qglWk8QvBCFTxlMJioy19r1yg0AZGKQBUZlRW32HluaQEP7z7BlOWSdvvQb2Vt3tJpKaYmMtavarGqnXDWhlU0pWTLKWtYOzlN20ILA5QEXaJtzb90QoIGHBWBoJsUZpLbH9rFX921qCoFTsC5HLRgJDoflIw1AMcxBgDG8aMYCkRniC/wRPp78PFy6NAUKvDUEu/5yN/c9e5/99broNgHriRrJOAFbTJyV9JMLBIMwTlMmmFsk+NzFX/zleq2Q1L9xnEWH54VTaGboBVGG0yIdMWeBwyYRKMyC1iCh+BDTb/WEAJKFNoPHAKkpucrmlkDLcQkJIogdTITQVhunEQtJzUYCMV5bPD1vwe7/XGffOATvNxo1gWQYkj5VzVo8KINqcUSCHVhJ8PnhapqOuCAABqGu4NKVK2boGk0Erq+oNAtlOrx3//0uGpNfFPe+uYLOXPLJNij/PQbLmDbU4/LV+6KuI43Kb3aCus5TY8Ar6P1kK0n81qqyOqQBDAE8fgQb2ct3LMV9aef/Jr8+i+9nM3T0/h8EeMBrbFTTfKFWU5bNcXPv/5KThy9a+/XnkLNVoHcQEhUPTKwJDalKssaDXjuVMJaB4But/tbnU7nd5vN5rDJH93/HwUGAPr9Pq1Wi3a7zfT09Lt7vd57+v3+ituMYxzjeG6RJAmdTufWVqsV82Ott/Fs51g9/X+nc24IFv6gtDlUvBIRtKZ0HgwkjQah6qM9TBh41Uu0/PhN53LaWoPvH6c10cT1C6qiR2f16ew4Bh+55Rvc/vCiKgGtM4pegTaQZVBWargjrkUPLd6ps8Jzu35rQPBBcFJgMkWqSpoKrrqMO/7JT1/O+tWe6TVr2X+w4C8/9zB/8om5bzyxh1c4DUFnyMCPXkVNNyqPLwNGDDZt4aRElEN0ZLfFMqDWJcKO1AUvwvJtYEIkz/SzujYZ/kzXeb7+PPi3cvVrMAofxJVJLUTWh4r2suIdIfjheqQMEBx0XJ1UGtFRVBBlCUpRVtGeEGXROomuFyrQ8xULPtBAMet5WBblrSwIiJDonMkkZ8rytkl1+C0bJ3nTj91Y8LIrL6CVagpXYEOBSQ3O97HWxumRTqDqo7Ql6axlf57w0S/cxSKwJOBNrCUTq1BlnPFowI8vb+MYAwDj+FF8+wWvwcRE6bzD1oUFVtGPzn987O92qjdcd45ctkbRchVMdcjnHcnkBEqnVDoqvJsM8Jq0OcGWM8/m/PP3vubAoxz2GrxKcV7x/2fvv+Msu8o7X/i7wg4nVK5OklqhlSOCloQCIMBCIMIgjIV9YTy2r9+R3/sZ35k7vvNe/M7rua9kPB6YcZgZR+GAAZMkY7IESIDAJAMiSAQJUANKnbu6qk7ae69w/1h7n9pVXVI3tITUaD98Nq2qOlV16py113qe3/N7fj9hDUIYtA86wqlOyJG43OK9AfKQyCiJVKHg8j4AAN77sZ2P8BIvITfDQMUPJ1CoMIUKc4AoVoSaZKmCO1b5CyCCyJFOorwsQQFZnpmyBAJkDUAAhMHKFRaBKPUFjs2QJdUfhFfB5s6Xs3EiH/cM3NiDN7w+wmmkj3DCUwwLMDBSgpGL6cqcP/u7H4jJSeNf3TqLbrfg/DM2cu3LFnl41yMPfPeHnBh+bwxeIYX5iRMwLxxW5Qhf0PLBR9phcB4KWjgkQjpkZLDWsDjyRCl85JNDsW3Tl/11LzqXDREoJfGyFbyJfZ+pOOaCk6a45rnH83D/4QMLjzBrIdBlTOgkaZ0GMURfHLUYZCU0Zq2l3+//XpZlb2i324fM8a8VDwvFR/AXT5KE2dlZBoPBgaIoZqt548eDodBEE0/XqFT/2+329k6nc1Ucx2MV/yMRARwMBgwGgzustURRhHNuDZh3ND6oEu1jkJpcjEB4CqHAwMYOXHo2/pUvegZnb0vRox6Fz8HEKNnG2Jw9B3p8+J/u5cNfPCj6gNQSm2e0ZRjtiropmQvML2El2kNcMulzIbFSBj/5n/RP8AnGtcLZKheRyhNJOOtU/EtfNMuzLmgh7CKYDXzyUw/z9nce/MJ3H+Ry0dIIrfEmQ8Yx3nmUUQhnKfLQ606kREpFbhO81yCHAbwXYWxDmjb4CCeLVQXwsQYAqPoM4vjvCO+JFysl/Ti3EdTyFYMU5bx/CSlJVNAAKv0dkAlOBLcJZzwCgdYSpcJZNMoKpNTIUoASb3E+w9ohzkGahDXvLHjn8WiEUEginBT0cKAkCFEyKw2Ry8ly6GW8sw/vPG4ev2HjFqanOkhzAO0WUWKANzByEZ1kEjGyIFUA/kWLg5nmji99h89/DzFUULgKMQFvPZqgZbDCdmiiiScjA2+iiSc1w1kRyROq7KqG6gpExNBLdufwntu/wJKehvYsLA1ItMJnGRGSbDAitwa0ZDTKMKM+p5ywkZe84Nlo2BQFPCFQwhArh5MEVziE8SghieOEJI2JtcJ5R5ZZjHWhJi37BaI05/NYvLfISCO0RFRiaVIEVfhSJb1+m8mqWPeqhDlE7eB0Jc0/WOsIL1EuXKL8eHWi4wNr4JhmWq/8zbJiA6ya6azGIcaTg6sAD+lFaL4ISdRKEUmLno3Y14M//vMHL3vXP3wFpTaRpikvfMHpPOdytsYCtBuQxAlS6qBDIOrJSrjEOtfq4r9MaoQNAhZr/q7qaPfWBmtgAVEqWcrgYA63fHT/3V/8xh6cmAY5gdeTLBzMSFotVFeiRw/z0stP57JzOzNbpjlTCNBx6WFsgyCioFpH5f2z7jpZYZOs93dWRUbo8oeOYTVbXFH5H43+X80lD4dDjDFMTEwwOTk5E0XR46Y03kQTT+eoCvc0Td8YRdEqUc4jAQCyLLsly7LxyED9fpdS1k6hUs8EXbqssDK+JlZAbFGJvInAyjJuGL6uSu90b0gcnLkJ/6rnX8AzT51F5nvRqk93MiHLc6yeZKiP4467HuZtH9gz23eBCm2rXcnB5ERCb2m04hIjwliYGNP/5RiEqO+7a/e2am9cucrHCRPsZkXwr4+ERxtoC7jwbLjs0q2IaEC84SRu+8z9vOU93+E7D3L5CCh8ijce8gKXD/D5sDqdEAKSKNioDvOsPPNX6Hw1+PRnZo1Wa6h6b8ZWxrhV5zyiOksN4eB2q35GBSpIHw4t4cv5f4KIs1AaEcV4pTHOMxhlaJUihcZ7gbW2tK51SCXQERhT4JwFYZGqfG7Oh5+NgKQDKgERGJZWKLxOkbFESWjFbN920hynnbSJVOUUw/0onUMnLu8jiZARNh+BK0AoBj7m+3uGvOfW79zRB0ZOQ9wqXY6C+H+atFe9Qk000QAATTzNin8IfPsCXI4vWfdelJCxS8An5MB7PrssvvTwgIeKDiPdRUQS7UYoM6IbaXQkKLDIyQ5Oe8j3csnZG3nx5epubUAyQkiLcwVxmtAvLdqUMsSiQMoC73IKZym8xIkIoSO8iEolf1Uq7qsw8S0FXgqM9aXFT5lguOAhK0uRtnqBK2oXXuPRWDSF0BRSllc5TykdVjqcqNP8S1tAHzrg0ke1gvgnvZ7MxMEhfY70OZDjMVgs1gsMIsx+eoXzAu9U0ALwAofFYvDeEDlJSoQb9PEmgxiKFPYO+OKb/nxB/M27vsbAtNm4WfPKl57CxRfgtfG0pccYC0pibejQB0pFZQ/pkc6hfLikXwEBgviRHGM30ksKIJNQCCikBDlEyj6RFnjjkVbiTUh9esD9fZ7xB2+79wtfv2+JgwdAiBl0PI21GlxOWw+Y1we57ucu4MxN3NuR4IYjNNBNBLYYUngT6I2+Whcrl/ASIdRYqClYFVbraSVT01pjjMM5iKIYYxz79y+IXm9AmrZDt0SGjkyoNyTei/LxCd5btJaMRgOMydmwYY7Z2WkPruzKBLpycHNYSdJX/ruJJp6+4ZxBCI+U4L3FOTO+P4TwKCWYnOz+7czM1FVaS4zJx/ec1rKcc5ar7Dor4CDLMvbt2/capVR5nwegsnIVwPmVs8mFsSXvIxw67BVyZQxNjBXby70FECUIEEdF4IILkNmIszdz07964Sm86JwNzOkhrUSCH1K4PiLx7M8Ft34z588+uPsLewcs9EdBWDcj0KSdkiwPC7SSCFcgfIakwAlHISVGVABw+Rp6gfcWX2rJVJdzBu+Chky4wtnhxmN2OVb2MGaRxMCkhfNPxP/81c9g22kbGOmUj3zyQd745m/zme8gBhp8DEIM0EbQEm20i1BCgxNYBEZJRs4zsEV4gj5HWYOwAlGALAlnFosV+THb/V8BwYMtY7goLzm+HBJX/utrV2iElOd5eXkny/PMIrxB+ByNQdgMXBY4Ac7ibQHOEymN8wbnTXj/y3EAvArCC1aVTYVwhfffhzVQEe9taDRhC/AZnchjhyNi4RAO5jrc/OLnbmdLt8D3HmSy5YNadZ5Q+Ak6YgJ3cBk1GYMuOGAzisl53vPxL/PdfbwoQ4NPITertCuWsuWG+t9EAwA08bROfwIS7O1qdNzXkH0dkwND4M///nbU3EnYZAasA5+BL6imqDwyKPUrg5ADYpa46tnncebxeFlALCxJ2mJ5OEIlUbDpCU62gZpf6yh4IcvZw9Kn1utwYAlwot41PrSgFo9yrdeRCN0WWeu6rNexXX3LrgISjvFbuCr1q8Jw/HfXkwWvDwEsqu6UxKOcK80jw2CdpcXITzGy8Pt/8APxV3/zSaSY4owzT+GFL9zIcVv4HTNaZqqVYvMCnaboJMK54EqhS6Fe71eSzNVrtv5uuDAOUoI5VuhSzKhAUITHOw9OoFSE0jGFlOzPIn60xOVv++A/s7OfstQPoJf0QH8AU13wI06eT3jdS5/BGXPcnI6gpSDLPChBK41qz8eNQRVBNR5S92JeP6z1h8z1l5aAY9/wVe9XrcioWC6VUKC1Fiklc3NzTE9PX2OMLQuO0sO5/J61jgJNNPF0jUpfoxqXqbr0VXe/3W4Tx/Gv1Tv/9fu1GtOpVP2rcR7nHP1+f8dhf78fM5PD7y2Faw/LLCv1U9sdydJgRDvVqGLIhIGXXX7C9VdetI3p1ghhl2C0hEpTskzQ913u3V3w9tu+wjcf4fJMgCWA4cFTPlxVkRgA2HBG+FpxWe11h9vfDjse5SzTE1EkHRy3gb+9+oUxp5zapSgi7vn2Mv/jprv40t0EonraLmfSHL7I8cas6nhX55WtHIFKpoHAlWw+jXAhl/CVQPDPgBXgo14Vu+5RtRpkLbfSq8538SgsPHHIyMd6r+GRNDxC7oD3kI9AKaQU9HsjYgmMoAW88NknbDtuOkK7ZSJGIb9w4EhQqoPPC2SkwRkGhUdOb+Kr9z/M7V9cEgawRKtuGOnrmUMjANhEAwA08bTNfkp6t1ixNlvZIE2wfbOD0EUEvrkD8ekv3IOa2MjIqnAgC0OwjlNlh8IjsFhpENJy4ZnbuObybUwDyozIcPg0xQwLkrI0d0KMi/p6YjSmHa53s3g5FuNr4smDj/y42i2QwoduuBVlN01jC/irv1qc/cubvkB74hRe/upLeeazeUO7BaPhfoS3CAO+EGHG0AmEinFeIpUKnaJD3n3Hkc7uVQl+dVVJvjGGhRF86Kte3Pzpe1g4OKAjBMIMIQpdAzuxgSSFF164jVdcMHnd8TKQZYxMcN6TF/1wj1Q6BqL2vEqARPj6mAUoB9IpRHlVNP+62n+WZSwtLb1mOByuKtjrAEBVtNT/tqIo8N4zMzPD/Pz8rVUhUwcNmpq/iSZqCdjY5syNafnV/aaUYnJy8oFWq4VSal0NjrWAWvWYPM9ZWlo69fAFXEXpL0BkSJEFULaSXSnB+FDUmTEjrYTNWSrF7ektsknALz5v0r/q+ecxtTHCtBxMaNDgFgvS1lbu3dXhrz/wVb78HSselw6oWGFlecQ6nnRlHlHuk8JrhIsQNkLYlFRPsrzYK47bzL85+3x+7TkvOY4NJ2nu+27B79/4Nb74TwiTgYo0wgW9GWdBSIfQxTrjX00cM+knjtgNAwPRueA0JMI0C8B5J+JfdMkFbOpqbJGDikHFFCLC+tLDSFnA4lWLPm2GYpr33vZFemMNBLNyRldjg+PFeew3cJpoAIAmmjiKqLq/KyitqLRRRQHC0uqkwSUAeMu7/pkH9o7wk5sAHQbmcTg00guUNyhflNPRlsQX/Nwlz+B5F3a9suDJ0HEcfOcLC16WHYhDEWJRFv/Cu0qDPyQbrO3+N/GkgQACnAzS0BKPdBqcBOexTmOJWVhm4S9v2vmiv/6b25ndsJFffN3zmZjiuqk2tCJwhcEZg0ASRQlCKDLjQcZYdKDEhn7BOL+UmCMSoKoK/qpbXiX6SimI4ICAd92x+4JPfulb9EYSVApolqygiCK0cnT8Iq9+7gVcdb7wMRBJQORYV5SdJFu6R7hVc/7SgxS+HFwRYSQFtep/EjF+fvXuYa/Xu6XX660qKqoio64iXi9YrLUURUEURUxNTTE1NRmtBQlWFR8NGtDE070IWaOTEYr6cB+22+0zu93u1jiOH1VPow4gKKVQSlEUBYPB4JbBYHD4J1AW906YskipgMSqOxuH7rxwQc2+Ygig8cTkuWNqIiF18LyzU//r1z6X07ZonFkgp48nBxmTiUl+dEBxyx338pF/7otMQWvy8eh/u5X8YczYi+qzC6VOi10BbH0EroVwCSYfMJFA5rjr5dedx4mnn8x931/gxjfcwZe+gpBAGqdEUuEzAzaoyQvFevSwJo4pAMCgzZBO5MDmYD1xJ6YoYHPC+S977vmcPJ8SmT7eGoSKsTLGiRjhPd7moDzWW3pWoyeP4+Ofv5c7v1q2pXyVLWZjGmg1khesEDWNSk4TDQDQxNN5F64tRbWyJKtupvL0eiMcYQzgvr2I99z2eQbxHAPZASFBejwC6wXaWyKXIzFoCmSxzPHTEb/44ivY2uGqGIMZ9pjoJFjrV+j3FSWrljfIEgSQ9Y6vD48Pn5UNhetJjND1CeCNkCWm7hTKRfhSR2CxMOQCDva440//4gHx5r+5lWdccBG/8OrTb1YSpHVE3tGJ0+Dja0GE7I7CVImuHq+TcdIpKgrqY6ewdcGtirI79vDWCVkMD/a55y0fenjHJ77+CEM7iTGadqdDlvdotSXKDzh/6wyves4zuHgzvmUyvHHEbT0WI7QyiELaEggY31UlvVdWTAAqwabwNyoVrSrsK6px2UF8TX1ueK0dYPV3VR9XzIaiKOh0Opx44ol5HMdjcCC8FnVWRLOGm2gAgDr1vxKOTZKEycnJe+M4Hu8d643jaK3HAIDWwdSp3+/T7/dfcziRQC9W5rMJJjYIUe0XIL1edSY7sWJT61A4BEncwvUzLj0R/8svfgZnHCeI3V5mu4ZIZWTZkJ5P2C8389Zbv8HNt98vMmAkYGnIUbLoVqx1KwHU8cw3eoVfLar6q3yc0wifoJC0yVACnvN8vnDRZafy8M5Jfuu37ubzXwwZiBGAyMiGOVhNpCfAJeQOMtNQuI/p4seXfgOmKH0FPSbPSYAXXDR/9+XnbKVdHEDniyRK4qSisAqURvvQBIACqxQDOuwcpLzt/d/ZsUgYSg0npzlkDtQ3pVcTDQDQRBPrIQFibQUFImyoo3JTvfm2h8Wn7/khtrsZRBuQ2LLrKXzQFJDeooFYW5TtcdYJk/zii8+8PRlBZApUOR/typk9J+oz/G7c3a06/4cqq8tjXIH/Z2P7MkgMispdUdZmMp2AtDvB0EMhYw4swV/86SPi797yEa677hVceknLh2XgSLVHYbEuD6tCKrwQK9earfJIraeqArrqzlWzuqFQthijEG341i5OfctH7uOfvnOAUbwBYxyp8vi8TysVYJa5/IKT+cUXnc9JCeengM3NqsTCCVEDs2SNblg9rGQsjJWzxaq54qowr4r9wWBwS7/fJ8/z8WNWvfq14r9+FUWB1prjjz+eubm5O5MkGRf79WKmMQlo4mkPYtYYNhU7KEliOp3O33Y6nVWPW3sPrgXgqnuv1+v99mg0OjILznUOsZW5dlGyANRY9LS+p2hvEdmQ49ps/1+uOZvnPGMDqV+gFWVQ9Im8Ik43smQnueXT3+Y9n35w034PvtXBiRhnaiMIR5M2rEer9urQ9LZiRpXsLckQcJx5Jv5f/+sXs9ST/F+v/yBfu7t0dYvaWA/GhllxJSVKSIwBKTRKNxvYsZ5xShGAnCSNQRhkDmccx50vf9525mJDbHtIadBa4RwYFxyjEBahBaiIvpG4zjzv+8SX+e4BTu0DfQKztGnxN9EAAE008Zg7cX0Z2tXUakdpMRRjgT6wx8Pb3v8Zvr+nIJcTIBKs9EHpDxN8hCzgXPBh1xktv8TLLjuXy7fiN3rIBgU+qkTmxDgXWlXYiRVLuHq+NFa0HW/u7hi+juXsWeJ9hPfJWD9CEeZYIXTCl4aLtGZjFkY5MtEsLcH/+IPviE/c/ll+6Zeu5ZwzWl4BxWiIlGGcxHuLkCUdvnqlBCt2lay2Ozpcgr9W9G4somcs0jmyHFxX8U/3If7u9u9z146M5YNDEhx2tAyiIPNDOlOOl1y8iV98fvvuszZwU1SUEzC11yMAWjpoWowVmCu2BGN7r7E7AH5MH64KiAqwyPOcxcXF3x6NRquAgfrfUI0NVP8tpcRaizGGOI45/vjjr+x2u6+t6pa63sARFShNNPGzfvzV7gmtNe12+8x2u/1rFXvmscZwrLVUKv/WWvr9PsPh8E2VOODh639/qPbNIf8tS1p9jPQS5UBhSVzOFgWvvnLjV573rOPpxAeJ0xFoR7HYh1GLfQdTPvnVR/jrW+/9rfuH7BFdxXA0JBIpSnZWbAV/0tdu1T7sS9mCCgTQCC/GwHAYibIIMUTQQ8oRW7bwb177uguY6pzK/+/17+OrX0Y4kTBAsmyGyEigdEiUY1XgbAZ4lOogRJtgndjEMZk+ENx7PCBdsK/c0oGrLznjyrOOm6IjhkSysiEOFoNKgKYUDvTgVcyAFt/+0UH+8fYfvC7TMECSo8PYqh//shpdRJZ5paFxwmmiAQCaeJruwHKsrh92R7t6Q/SAisB6nAg2QUMCLe9z33Hiji9/l76aJlPtULxjx16r1eV8TqwtMx3BrB7yuqsuouMhhkMKkNXCfyUIcUiV19wyT5nlI8Di8U6CT0KiJwqEGJRznw4SQS/PIZH0DbS605Fz8Mb//CVx37d28HMvfB5THTAOkhjSCKzLMCZH1ASmKEGA1R30I9hga9Teit5bJexaa6QHk0GvSMhaEbd9aSDe/fFvk4sN5H2Pbk+AzUgmNcNsNxunc173iot40bO61x+XQsuCDpMyYWV6BSicUCtAgFgBMcZ2gNXrV1LzlVKruvNVId/r9d5U+YiPvcPXCJFV1OO6oGCWZWRZxvz8PJ1O5x1rbcrqOgJNNPG03cPW6GNorWm1WjclSbLuyM3ae8YYM95PiqJgNBrdUbGOfiyNjdqZKXzVuPTjM096jXIK6STaO2KX0/Zw+Rn4Vz7nVOYnh9h8L7g+ZJYo3kJvNMfn7z7AW9/3He7fzx/bGIZ4ZDulyDO046gBgJVwNf2CKoeoGAyi+ih0faVHqgwl4aXXTPzpFZddwn974zv43D8hcqsofAsZdXE6pvACa8vvUx4lHCKUjOSZaUYAjuFwSHKvidMINzCkBVx4ovTPO+8kdLZAt61DTuoc1hhwhkh6lDf4PAPrWM40Np3nw5/+Cg/2eeeCASsiVKs17v6vFdSk0riiaN6EJhoAoImncwZUzuyJddBQL8Me6RXeGnzpBjDwAQz4k7d9TTw0TOjLCay1xJGEogBVWsp4h/cOm/eI3ICNbcdlp83y6ksnvQISLbBmNPaXxZlg3es9xpQ7dsPzf4rvYK7Ej5LQpRLBdg6RBdqqa4FtlY8zLA8HhfdBSO8v/uyfhRaSyy4703faMBhBkgaVZynAE0QoRS0RptZd+nFEIOt03WpmF+cRFmIRQeFwLmEQJXzgM3vEn/79Z+mL43EZkEiMXSDpFoiox5Y5xa+85Jm84kJ8y8N8WwYnA2ODfoHxoBK8jMaWWiv2TA4nHU56vAiFvlJqLFCotR7P8leCYktLS789GAzGs8p1MKB6rBCCKIrGAIdSiuFwiNaaE044gdnZ2dcaU7csYwwcNNHE0zWKon5PBDBtYmLiyjRNybJsleVmJahZB+HSNMUYgzGmYgC8aDQaHQIwPFoJNPah9zE4jXRyBeAUDqkcQnisdUgraAuNtJA4OGWem3/x6pM593hP5BeIVFnQFDEH+xv40ncdf/nue7h/L7GRhGa5AmdyEjztEmw/2hAChPQI4QNoKxweEERYJ5nozp0pRYS10G6Fx3sBl1yW+Be/+GW88T//Nbd/dFHEGkgsGQfJjMXaKOi/ONAKjPE4n6OUJ7cjhJY/4fNdAXPWs3GMoog4jsfMqiZ+8qjOpEoPYxWophNc3KE/MrQ1nDzFr157xTmcvTmh5Qf4wXK4F5QO55vwaBfM/UScgEgoojm+9v19vP/OAyKj1IyQElM2IMY6gE6C0yVAD2DwPwsszCYaAKCJJn7y5VcrolbN8xGyBcpCq/yalZCJcPWBt7z/Tmx3C54IO8ggSsOmbT1ohZaghcCbPsouc8K04DkXnMSFJwpv+gWp9ETKo2Qg9gsRZv20Zp0OpVzZsIUbMwaaeJJCGJAZyKxG/Szp+pVLQ9DNH68hLxxWKKwD7+Dmf7jt2hO2buLsczb6SMGgD90OZQJpw7yod2MRvVXr9nHoXsVSkyiNRGC9JHcJe0fwT9/s7XjLB75Mz0ySDy0oi4wKesMFsuFeztqS8Es/dyFXnIbPlxwdYLaTImyBSpKyvR/Use0af+bwGrmx5/djhXOOoihuyfN8zGCoJ7KHC2MMnU6HDRs2vKPdbo3BAikZjxs00cTTNbSW4/uq3W7R7XbvrNg3RzIiU7luAAwGA/I8XwU2Hn4PrQAAtULzdxUrz1EUOXGkCCoABW1lSYHjp3jlz7/4pOsuPH0abfehzDICj+97evkUX/+R5c3v/TL37kLsWqaw1TYjg8qgxqCxq8brfqL8ob4HVy4GlMWXgDTqsrS4fJ+3AfQd9MPeftzx/PtfvO5abrnldr7xDd4wyGFQQFYAkUBEutQ7MCtWsL4STLRI7ArL7ChCKTUWh61EHav3rnFJOfrI83xdhlt5rmEdTHRapBaed0H3LdtPmWPK9UikQUQRJC28DfdTpBXFqM9waRk6UywMBHtGMX/9ns/SB5wCZAxaQDZaU9yrlTykKfubaACAJpp4rCV4qC1fFR4wPmIIvPsTD4qv7thL2t6IK4JtESLCRBp0UAIWUiKsRfqcuFXwrPO3cs0l57JFQwvQ1gRBIxzeBdaA9+CcH89S18WKKneAZht/ssMgRAZyGCwjUThfvi1VpetFSG5dDMgSAAAjYgoPu/fygY/c+plrzzrrDM4+e8YLCUUGrQSs8SvjIJSq/z4knWvXxE8azpWJnvAIb0ll+Nn37OTU99y565bbv7aHnpgN3axBn+70FHGiIF/gotM38dqXXsrp0/xJAqhsRORzsBnYchwmtMfWrNQjX7vOObIs2zEYDBaqUYC1YwCPFVmWkaYpW7ZsYW5ubrn63iiKOJxKeRNN/MyfflLiXLinJiYm/nBiYuLKyorzsYr4OjOgov8vLS2dmuf5+P48snt0XJkH1f9yhGj8NW/xriDGERMq5HkBV5zfev/VV5zF3HyMThzSFpAJhnaOr3x/xN999G4+/p1FsdtCUXqrC0FgJ/lQqBel4OpR5w+rgNgKBAgHwagYEasU6y1RBGkSKNm/8i9f8Ef33Xc/H//YfvHgTv5vS2jSWicRvh1eez/Aq8Awc2icT8CrMCIhciR5mQccHQAQ2B2hSI2i6FFdH5r48WM9hsXYwUZ4IuFwwwGnbeT+l1x6NqdMa1q+j/IGvKAoHELHOBMYqs45WtOz9A5mRHMn8t47vsTXHgqTLKNSdwpnS0YroelARX9ZyWkr956GYNpEAwA08TSOyl6v9lGFuJcWP3h3iN+OA3JgwcDfvPdjLGQJUXsjI6PJrUcnCdbkoQvqPEKCFxZbLDHbEVxx3laec86kb3kQxiGdJyqJBlVdYl2VRqwYAVaiQ0cqAtfEExjVsKoARB5Wi2/hXQJel/TSMNqBCyCAE2CEp0CRI1AR7NrDBz5++2evfOZFF7P1+PbnbQGtRIGtbPPcSqJ3SMdHHuXqN6Ej4T3WGqQ0JGmLoYrZscBr3vLhe/jGDzKGZhJjWyjVDl2j4UFkscDl527lV1954W9uTbhGGpjUgBmG7tTjILInpSTPc5aXl08dDAZj0bEqST0SAMAYw8TEBFu2bOlOTU1dUxUujQZAE097CNMYpBS0Wi06nc5vJUlyRIV/FZUNYGn9t2MFVDjS+0seAgq6mjCgiiRF1ifRlpignXPZBfhXPv8cNncN2XCZrHCgOoyKLl+7f8A7P343H/nSIyLTMU5H6CRGKxEw2pFDmVBs5+qJKoDKvyUY+YEwREqBgyyDX/j58/yeR/Zyy3u+cuqB5fDoqEWp6t/COx2YZcqNizS/plirhAWP+pmWyYbWiiRJiKLozLpdbBNHf35Vr3Nd70ZrTSw9HTGi7eCqi4/bdsHJG/DD/WifIQUUpiC3DqSkMBl4S9LuktmIUTzDfXsz3n7rg6IH+LhmCW0tKHlYB4DxeEATTTQAQBNPz+I/zFSNd8SxWmpF5bPhtPVrvx4mqIjhE18aiA9/7tvk7S24eBLrJN66UPhJwGQ4PDLSjAqDzfucMa+5evspbGrzqzEgLcQysLdC01QjdbSOB3x4bsq7NUyAxgXgpx6rMrKwVpxPcL6NJ9BipegDwxJEUkgX49HksqCQnpGD9gTs3M1nPnH7Z99y/nnPumx6SmJHwUZSOda814zppY/b2a3AK4Vzlizv4clAw7KDz38P8dYPfYNvfN8g41MY9iT50CAmu4goY4L9XLP9ZF56affWzZozEw9tCZEyQRmwFMWUq4AriSyvw4lwVfoAg8FgYXl5+a46xfhIOvhCCKqZ5I0bN7J58+Zboygazz430cTT+gR0YY5/YmLiG1EUjTuU1fz3evdI3YkjiiKGwyGLi4sXWWvHuhprx3UeHUOVtf2zKJlUYXTIC0kSxQg8zhhSAeefiH/ZlWdx+bmbabGMQLGcJeRuA/c8YPmbj3yDj3xlIJYAn0gKX1BYR5bHuJEkKgKIYLRgqCjtex+HNNbLmsAapSBgQZoIctPHU5AVcO6Z8352+nje9w/fFAcOsMNrMBryoo0pppB0SkHVASqmFBIGLwxeFngRBADD/nn0Lm8V0yNNU+I4vqYChY70/WviyACAum7NGHgpCtp5wRWn4F944TYmRUYsiqAFpTQIRTuJsXlGLEtxId1m57Iln9zKn7znNnYDNoXFUbhnuq1OuKkLV2tOOKBAkI/ZhE000QAATTQAAMG6r74p+nW+Hnh44ZAXyPHsoCMIAr791q8vfHPXANWZRasEXxQoFSp643IMHqE1KmqhvGFSLPPMk2Y5++T2W6ZbZbVowi8PzGmBF2o8AoBfAQHGnurNCMCTGsJLpAPp6vZ2rsQFgl2fdBbtDYoC5QsQJowBIChQSC1YWg6jqTt3Dv7Xu75y9x9deP5FXglJKyl/hg/v9yoQgLX//mRhCXJAUnlQDusgdwYnDFYElsunvzwS//DRe/n2jgIdbSLSXYzJELGjLRbZkPT4Fy+4kIvP5l5vA2hBkaP8iqtG3bpQlIW/OIL2W0WXNMbQ6/Uu6vV64zn+I+lQKaUwxpDnOa1WqxoFeECpJg1qookoUnS73d/pdrsXVN386r47nANAVdgsLS3R7/fvqgqeI+8cr9DnJQZEXl4lfdkHgU9dNjO3zPG3P/e847j43C1MykWmIksrSom7x/GVHxa8/fbv8Im7vTjgQLVhWIxKOR4BPkKLlFQoVFkKeQdWPF4p6Bo9obKBYNwojB4I2LK58zunnXom//Cuj4msX571CnIPQyPwPkYLgRQGa+pkr9JOteYyMHZKeDx0YOKYJEmukVJus9be13T/H2+QrWJZ6PHIhTFB8HlLzFXXPf8CTp6JMf39tCYmyAobcgilw/vtLCJNcIXl4NAwd+IZvO+TX+Zjd+eiL6CXg0Gi0OSDAW0dr+6viCq5LLUjxutG0qABTTQAQBNP3yKu2h+RQFR2bsuNUXKIKKBAIZFIHApwOcQtuHsXs3//0U9zoJejhEa68hulwyiBjxSZBaVaRDJCZgc4bsZz5WXb2Xr8dK4JTeKqU2q8wzqLL0v91bVSGE0Q3jcigE9qaLCTYLvBKUIWeDUEETrOwimU02VHxyBkSG4tBiciLC1Qk2Es1QuSOGHfnuX/8557vnPReWdf4IVxKLfiIS2o2UyNk8GfPLwApzSFtwifobSHCKwCIR1aQRLB0MMdX1yK3/nBb3L/D3pYWiwNRzjXR8cZSbaH04/r8MJLz+Ls4/AtVYIiNkN4Ny78w98Ruleq9Mc+LEBRUv6FEFWn8c3D4fDHovBXYwRFUTA7O8vWrVu3zs7OvrZRuW7i6R5TU1PXdLvdNyRJgtZ6XPgfziaz+tpgMGB5efnUoijGqvJVsXNkRWTlVeZW6mexogtgjENJ2DzPKy979syvXX7xNjZOWcRoL9ghvjfikUdG/P2dP+K9X3fiACDiAKhiQcQKdEyEJpExQqbkxMFFRenHQUfFrQYAxiyAUKE7D1LDzLSITtx6/Bvu+vLdf7rYA+cE3kscEV4nBMZDhtY9pOxDEaQKqMiHPg6XcCVI8vic+1EUkSTJmUqp7dbau4qiaMajHs/8sgakVeBYxZTZ0IGXXDJz+8WnzTMVGbQvoDDIKCJ3QRDamyKYSglPYRy5i9i5aPjbf7z72h5gFKAkUdxCIdFIMA5NSRGUK0muxCEw1TtPoP41JVgTDQDQRLMUf4JDP3xXYYIjwLs+vlN8b9cifSsDXavI8c4hI00URZg8w1uCWnE+oBNZfu4ZWzlnc4uJKAgVaQ1KSRQqaAeURVP4LrnCCChzp0YH4EkMX+/6VOun7GRVa8TLQIGvUl2xugLvDUZMdGc7Bskgt1gUy73hXT984ME3bT5uq7c1qr9fZ/0d1dNHopMUhwzrtPbjnQtGFrkNLIBdjuLWzz8s3nPbP/PAfmjPnYZhAqxBMSIe7eUFF57Ez195MidNcNOshth4tAvr1wmJrX5B6WAhy9fHU61puQqc8EiM9UgVIVVEURQMBoPfyLMh3hnkESz+yk7QGMNoNBqzAGZmZt7R2AA28XSPycnJW9M0HVtnVqrwhwMAqhj0l8mz4Q5Rstas9TgvkCrCebFyVh1y1lZstqJWlKw+Y7VztLxhAth+Wvv9Vz/7LE7d1KIlRyDBZIJdwy7v+6f7+dAX94l9DjIJIxNs84QnCOkUBmczrC3IncNYH87nuPW4n5/VSEPVWFAK4hiSVuemHz3w0G8+tGf5fweBFF0sCYUp9z4p8OR4huEVEqDFapq/WLv3Pw7FWxRFaK2vEkLMGGO+aIwZF6tNHAl8FZiY1XllhV5lfSuECp93JRPAZETOMRdbTpqR/pUv3M6kGNBNFJ12m4MHDhB3JrB4hJJIrYKoX1Ygog565gT+8t23snPIB4YrbyJFnuFwBL+MksUjOWRO0D/qB0008dOPpgXTxFOpoqOS3Vv14ardMny9+pIAWp1J+kWBEJ6d9++44dqXPhtfLBFFHlsO8bm8IPKCKI7BGMhzhIIZnTM/0+X+gwdv2LE7vzE34LxERxHCC5STIAROeKwUOBFKyWADBEJIEBohZPjvlcGvI7qEWE3xfLyvIzlCj+HTf5wABKE+gSipIx5fWtxVyYEP68WHd08CUniU9OR5ViA81vtg/SQlg3x0x9JgcGPcauGlpMAHhwGhkFIhAO/8UXZqBNZ5hJDBbcCVZXhNYLIgIveeWCuGzvPAA6M/8GLwH4/bvI1ItdE4lDRELqc1WuaETTN0U7v9/vt7OwvLXSrqMChccPlKJKawaOlIdUJmCryMsDK8ZqKW6johQndOKqwxCKWRQlJkGQpnJ1vpC+NYY5xFqZVCvqJYVsyB6mOt9ViEacuWLbTbbR5++OGPjUbZQxXDoFJprn/cdMKaOKYLlLIDWc31Vx3INE2ZmZm5aX5+bnvFhKnPKVf7t9aaLMuCDVnNOUMIQTYa8MgDPxLS2nBGOT8WrA0CtgKkqE4aAogtEEKBkAgRdHKSyONLrVShZbhnrSV2lg0azt+M/3+9bDuXbJsgyfeQxIKsEDySzfK3n9nJOz7z0EsfWeL7Ukus9QgBUgkKQ2DrBSMSnHQ4GZBHjwdrUT/BTHSd2SAqMRbvV05VUQG+njiKEUIx6BcfWOplX8YLvNIUwmG8QSiB8B4pHFI6PC48NyFxPrxuggoI8OPn6oUYF5lH8nyllKvAHa017XZ7Jk1bNwghp4rCvCfPi53WunC+CEn4Mw+XQzy9i3/lLUJ4jIiwIsKLUrOpeu0dCK3xQqAEqMIyKWBrx7/xV1/6zOdcceokE3qIswa8p5NovDU4GeO8Q8vStcLDSE7yiW8f5H/ccr/YA5ioE8CBwpTQkMNgGK8izyF57Mp/utW5bhNNPAnRwIxNPEXiSITp3KriPyD3CQvLQ/AKK+HrDyA+8qVvsyjbDL3GO4H2gkiEeXBGvWCTpkuFn/wgp29IuPL8UzhlXtwUK4iUJB8Ow/fUNul6t2LsMneUt1CVEDxR18/8mhFmZWb1kBnQlc6ARwfaqddh/n1Mxwscfy8IXSARZvKtkBgEmXXkzpdmEk9kwhWSTO3CDL/wEu9jonYXIxRLxmIi2O/of/BTu1/3nlu/yp6lFgM3QeY0+BwVZ8zLHs89YwPXXr75pq4Hky2TxAmg8IUl7cQYB/28HwSLSipr5U4cWBIr+gZSBgDMOhdmIqVgMBj8Xq/XQyFWWQKuN7NceS5XxY21Fmstk5OTnH766V9otVpjwKD6WVWR04wINHGsR0XJr9Z1BYy12+3rJicnrz/sDleCZ8BYe0MpRZZlLC0t3SXc6n0+3Ity/N8rSvVBv2RsZ1p+TquAh0stEXFMlod6pq2hDZw6S/arL9vO6bOeSd8jkZr+QLDk5/jw57/PP35ux5u+f4DbjAyz7FKEosuUdKMwfuRq+ixhdEqN97nH/0wQnpL5pXFW4qzCWIV1CoPA4DHYMNM/BpBNmVuEs8LXmGXCr9X8kUdc/Nffx0rwT2tNHMdEUXRd+bUd5bUuyNHEEZyenpXxPFbGSnUSY0trTOUNbQmph+dfsOH120+dRzNESoPyFiX8GNipcoGiyKE9wcDF9PUM7/zIF1gAcnQ5wyfHotUehy2vVX2rdYv/xka6iQYAaKKJowrjw7aqKLAW+gJ+/6/uPmvXaIKhmsE6hXA+aAdIWQ72WUTcwqqEQiWknZSrLziJ558xc31bgXVFmNByYKXDSo/yEu0IFjHkZedBHFLMN3FsxaOxJarCtSgKjDE8kcmZ9KsFJUUJLDkhGWUFMk4wSAYOCgUPDXnnrZ9+8Dduue1zHFiKyNw0iyqlSCJiZThtrsM1zz6bF22f9THQim1QucwFrvAIrbBIRjZDeI/yFult0EnAIL1BlZceu3CETouUkuXBkH0HD/7msChCglwDANZ7neqU5qIo6Pf7tNttzjrrLObm5nwFDNQp0M391MTPQlTd36qA996TJAkTExM3T0xMHBGAEEXRGDyr5ph7vR4LC4sXGYIAmfViZZ5eBNtbJUJhKwn3cvWv8tU9HhqYzsPAQ64jSLoYE8aHzjmO7JdefHL8nAsm2DpvkSKHdAOP9CZ4/50/4F23PfLpHz7Cb3sHcRzGfIwpjUe8R+snv0NdgS4VCFnfj34qCXZNhb5aC1EUEUXRVVrrq7z3C9bau4wxC/Xn2Ox/R3BvAVYEaEZg0D4jchnaZ+UadxjrQEh8ecZpB6fOcf/zt5/NSRunAkiNRFEgfYETCYVK8eW5FiUxo0GGmzqZd93xVT5/f/DJEIRxgqaIb6IBAJpo4kk7BUKSkShII1j2sLvgvj9824cx3ROxsoPzAlsUY6s4vMVGkkwobNymGA05bU5x9TOO5/R5ssRCWxEyI1wo0LxDeY/2lopg5tGAfNSEounQHxsAwHr/Xb0/9e51HSh4PN47Ua6teuF/yIZcFKATUAkjK3GJwkj40YA3f+CTuy/76Gfv5aGDYNJ5+k5RYFD0OXFGcN1Vz+L55075CdtHFhmxiihyj7OSOEkY5RmIkChJqn+DFoGqZiutIVK+dECwCBXmKZd6oz9bWOxj10ms6x+vTYDzPGdpaYk8z5menubkk09mYmJie/3xFXOgscJq4liPurAfhC55t9t9Y6vVGo+6PNZV3RPVVRPjjAfDIdaHrrYXgakjhEcRLlHa1apx53+lk63KuX/rBDLuBDl8L0jTVhRj2DrBv7/2uWfEL73iZNrsBNFHtts8siT5+Jce4u23/vDe7+7l+TKCVisIDmaZCU5pmiPWMPhpAAD1PfzR9v4n8nypxjqq7n8URduklNucczvK4n8s/tfEj1e+OKHxaASOyFliXxC5AoHDCbB5RtppI22GKmBCwNWXb912zgkzqHwx3A9CEhQrPVYoLOGeFR680AzkFF99eMibP/CwGAAq1YxtqhsAoIkGAGiiiSergiv/8WHuMRewrOEjX7HiQ5/7LiM9i4wn8NaBDR7HhTXYkubtpCaKJVG+h2dvm+DaS46LT+7ySuugkBblHdq7EjwwKAeRW7l1Hqvwb+LYAwLqBX698K9T3R//JbwaCKg+B0AU4/ICZAxJl4O5YtHBENhr+eJbP/rD3/jQ5+5j4WCEFFOYNMZ1DLHfx9nzgl97wYVs35z4BFCiII00zloKY4jTqLQ3DPTX1VaBlSC4RQtQYoXOLFVEZjx79h/4zSwrxtTW9V6jOgBQRalcTpZlnHbaaWzduvUraZqOnQKOXL+iiSae+vtKNfYSRRFTU1PXT09Pvz5JkiMCuKqOf0X9L4qCxcXF9/d6vQIkFjEWPlu1n5Td/rC3lA4g5aklvUdW92MUY2QMUQcs+MFycepMdP3LLz3hj1727BOYUbuZao+wAvYMJB/53Pd4ywe+91vf38fZhQx258Hm0yEEJK0YqRWm8Ljanyf8kyeYW9/L6/oKPw2hvfGeudL531aJ/llr7yoBgCeNoXAsh0diibBCls0Zxte4MJfhjEt8GGm55Ez81ZeczYY0R44Olla5lIp9KwLP2hdIHD0T04838j/+4U4ecjACBiODbMbTmmgAgCaaeAocA0pQOBhZSCZnyXKNbQv++1s/e+39e3OsnkIn7VIdSAQ19FLxvygyWt0UMzzAbMty7WVncdkZ6v3Kg/O2nFV0gfaPWaH+e7nu/P+Pe3A3GgBP8uo5zGu0Nml8ohO0OgwgvQtr1pVS1FJhrcCqCFoxix4eGPLmd39891kf/advs6enGEUTFCoi0obZeMBFWyf4xedewEVbpdeFwxUjkiSIifnSKtOVxcN6M63eg/BB8V/4kKTKSOOl4OBy788Wl5fIsgwIM/v1bqWUctzVqhLcqqCpQIC5uTlOPfVUtmzZ4qWU1D2wG5eAJo71qM9+dzqdbdPT0zd1u90jXtv1e8h7T7/fZ3Fx8VXGOKRWpSuNWFX8rwUU3Vi5rpw8FuCECB1SrTHZCC0UicmZLAY8/5wNN/3C88/kpLmCiCEi6TKQM3zgM9/mnbd9744fLvHHfSQu6uCkCnuECML+1lqMCUVVFEVPCQCm/t8/bWCxPvdf+tBvV0pVjKcFY8xCteetPWMaEPTIQICqjJFrQCaPRMaK0fISkxq2zXH7Sy49m5NmYlLbpy1ytM/BOTwKR9AG0t6gbIFFU3Q288F//h53fHMk+nLF+MEHi4GmhGrimI4GxmrimN7+VSRw1uBlUD82WUHa7dIf5PRH/r7UL99w2taNzLYdmCHoBAvEcQRYvDHEGrzpI4VkZmIKhOT+A/tv2LvMjZRKvFJU4oMRjhgnK/LB0c7sPbFF+uGTiCbJWC85XO/jeofm8UsmS3Ku8OurTDsbvi5LOyIgSlOc0GR5xmRbsZj5/bt29S5UUXZWt5PSjjSdWKMjRVzknLBlA0oqfvjQ3tHeEZ+TiUeLCJvb8HNhrJwc1P+DKGJpiIBzwTFBlGKAQmqkVGG21hZvT+Lo3yVJsi57Ym0iW2cJOOdotztMTk7inGNhYeFzeZ7vqATT6noATTRxTJ5Q5fpvtVrMzMwcmJiYQGtduz/cEf+MLMvYv3//S3u93veD0r7G1mzvpCCo2R/yM2XpYCPCcIBQQexUSLwMonxJXrBFFbzwjJb/peefwrNP12i7D9IuP1qQfOLuRf72Qw/e/a09XK67CYM8CKTGsRp7rHrAFEH9XKnVAGB1zqyMIoT97vHaPsfy/+LQzwVVfxBSIKTA+XCWC/nEn31aa5IkIY7jbWXxf265933bGPPhOvW/Pv5UfdzEY7/5TijAo70Zv+VWgpFROdvviI3hjBn+/ppLjrv2mkvOZEYO0PkyWoXRTi8FhdA4oVAYtCsQ3jGUXf75Ec8b33Hnbz8w4HOehEhaWrFgZKryydP4+TVxrEazwzRxTIctTLBAkhFeRuAdo+UlEBHE8K5P7BZ3P9SjV6QYG+FcUO/1LsPmfTotyWDpAKo7HcyL8wUuOecEXvCMU5lLQOFX+aYHuqUKM5NrkrQmju1EfT3A5NHm248MXDkc9BOE/lzpW+zKItyzIgwolQzqxrYIXxGQD0ZkgyFpZ4J9A0trMt72rYO86u8/ufs/feX7y/TcDDKewQ2HRC3HXNLnOefM89KLZt64MQY/cLQlJCoGX3kna6yIsUJjhMYJiRWglMCWo46Rknjr8LYYd/iXlpZ2DAYDqkS2fq31M6/EuCDQhrMs48CBA3S7XU444QRmZ2dvb7VaVEyAyhO7iSaO5Sgt317f6XSIomg8EvDj2rhmWUa/37/N2mAjF+6lsB9VM//14t97Vu5nNEbEOKHDhQ6MH5vT7QhSm3Fi6t933XNP48pz55D5fhyCPb0W39uX8tfv/d6D39rFM1RHsK+XEbVSvHCMsow8t7jSElVrRZLEKKUYjfKnzN7+WPv4ExlpmpIkyXVxHF+vlNpeE/27wxjD2u5/HQBoGABHggGU7BgRmC1GQiEEFh3cJvIhG1twyiyve9HFZ3PCdETihuBy8C4M0Tgf7gmv0M4gsDgUA9XlHR/7Avft403IBKTCWDC5D6WTbPqnTTQAQBNNPNknfGhTWo8O/XmEKxjlMAD+4x99XuwquvjJLWTWk8YR2IxEOyCjnUa4UZizttIyPaF52SVn8oKzp71zELcVzkIrTvFAITxCagSKuuXST34L/viXEKq8jjyBfDoU8UeT3K33veuxAh5PIUA/7oUdOlKivEG6AoVDiaDQL4RDaIFSgnw0JFIxDy/lO5ZjuK/H773toz+44zNf383AToPogDbQzjhhtuDnrzybn790wm8AoiLD2SFRFOGNBxXjvcJ7hW5PYH2ERZO7MCpTgW2xFEg8Ns/w5fzknj17xMGDB1eJ91UWfnUWQEX/r1sC9no99uzZw/z8PNu3b2dqauorxhiSJBmDDOM7paamXlFrm2jiSa0/hCc4ZVZ2sSuXc6a0vOy+dm5u5o1xrDEmRwiP1hJw6wpn1jvCzjmiKKrAsrNGowylajRxQjcdH8Rt63uSkxoRpVjrcXEHEbeDnanUGC9QQtJOJO5Azhldfue6F2689pknCyKzD+slQ7GZr/1I8Cfv+BLf3MWJhYQDA4/Q4KRBysDS0UohhcK7cK9XhW34G+Vh08z6vhHcA/QYBHy0xx/pWVcXUawr8VcfPz5rQKz7N7RaLeI4vr4EP+8q39Nt5R62UI1O1RlR1b5Wt0Nt4tGLf+EcSkJWgFWKTEbkTpG022AypiPYlPKHL7n0DE7bmEJ/PzYfBNcMWTFxPEgdAGdvwTqGeoLPfvNBPvLP+0UmSqs/V4Tzp1o2rhGpbaIBAJpo4kk8BMaVFGDH6UZUipqNgCUFf3LzJ1iUs4x8hMlzZNoKB28xAu8QKgKd4KUCn3P6XMK1zz2Pi86MvekZYgXD4QhnM3AFaZqekBfNAdDE4xN1FsAhIEBp5aV9vmLjVap4Z4BMWtikxUDCfft40c2f/Ca3f/F+5PSJQdxr2GNiAk7ZkvCSi0/nJc9s+ZaFFh6bD1CRxhcWVARxi6KXgwMdtVaBEhJWjSlUM5d5nnPw4MHX9Xq9sguojxgUs9bS7/fJ85z5+XlOO+207bOzs9c558a2aVVRVCXXldZAw7pp4ilx79YE3NbOcE9MdGi32++I43gVoFWt6apwrNO+q7UdimhNnuf0ej1Go9F99SUfvmcFcJA1tf9qPykKQzQxjTcON8ogitFaEscRssgQy46Tu2y/6HTe8JxnbmDDLAyKIZnaxB1f2cXf3PIVvn6/Fxmg21PEicJLKFyOcW5d3ZCfBHitRA6FEGMA4VgA+NaCwTWlf6Io2i6EmBFCzFSFv3NuhzHmjooB0sRRvPYekkhgiwylNSrqYFxoynib0xYgM7j87MnfOv+kedJiEYo+kRJIHWFcOEWVihj2+wFwiVL6JuJbjwz58/d8/cEBAGFcFG+D9WC462mo/000AEATTTypxX9V8hervNQ1YULLAH0J7/psX3z2e/uRrWl03IbMgopBKJDlWIAH4zU2t0zFGZedtYlrLz+X+TgQDISSxDjawlE4+xCsLwTYRBNHvoRXJxHrgwArdl7aG3TpcYxwFBiMUvgM8C16WvC5HyHe/alv8Kmv/IjCTkA6jfWOJLZc8YxTeM2LLuHibcq3gMhZOrEEm4M1CB2FG0snFKaAYAC4apVX4wmCIPxnrWdhYeGd+/fvf9AYM+5cridIufZzFQtgeXmZTqfD6aefztatW2+OomhVUl2nxlaFQmMT2MRTCQCo1mhV2MdxzNzcnO92u0RRtMr2r140rldEVj9LKVXZ/m3KsqwU2yudAcbq/uF+XCvn4gTliI8KB1iSIATk/WUSnzHh4TgBZ83wlVdefSJbT0oYSkM/meMDn9/Fm9/7bT77/VwccCBkhLdDnA1FUIGDOPwOL+T4OpStdmjRVr/W/t0VKFi3EH2qR/19jKKIOI7HtP9yv9oupdzmvV8oiuKWPM8Xmr3rcTo/nQ0OTzoisx6ERCgFw2USA+dswv/c9tM4bXMXXfSQLgMcVggKL8gsZKYg0YJWmtIfOpajOd768a9xz35OLM0yA/COw6KxRATXHENjA9hEAwA00cSTcvKuJBnCh4L/EFxWxywZGGj4o7fejulsJPMxudW43IFOS3X1gsLkRCpGSbCjg3RZ4gXnn8xzzml74UErRyqhpWHY6yHSVvMeNHE02UvooteFJFmfCcCalFpU61wpnHdQGLx1xK0pjIZ//qEXf/qPn+ez39pNEW8ip0VRFCS64NxT57nuqmdx9jTf6QA6WyaRBQqDHw1ASUQUg/G4RzkihF/5vNYSYxwLCwsn9vv9cUL8WBTWOihQFAULCwv0ej0mJibYunUr8/PzvgIB6t3BetesYQA08ZS4jWtrMtC4gwL+xMTEv5mYmCBN00OK2ToIVrekq9PUlVIYYxgMBg8Oh8M9znmUWhHRrL5nPXs9X+0YSuF6yyAlrTQ5U5pRGJOzOZGDU6dY/vWffyYnbJpkYHL6yQw33/kt/vIfv/npr+5CWDroaBqA4SjHuyA2iCcwhvzRpZB1jZCK8VMp5h9r4I/Welz8a62vklJuqxgAQogZ59yOoigW6sJ/TRxdFEWB1hIhNSbPEFrSjh2xgRMneO21zz+Vc7fOovJlcBmRVuQ2rDOLRwqNKQKDxgjFftfmY1/7AR/8Si6GMnT7hTfo8sxFKBCaSv+/4XA0cSxHo2LRxLGcepVWLL4UQQob9nhEC7ClR5GTngML3LihM7zhwvPOwRUjlAA51vL3eO+IdIzSCmf6eCzTrQlaaYdvfP8htX+ZT7UEWOcYekmUtsCuZh789JNOf/SvYRNP1uotPbvdmneh1AQoVa0r2r1nteawFwonQ8deCI/wBrIRChgJ2LXEjQsL+26Ynpply9w8nW6bpWKAUJbjJ7skfjS/44dL31vMuSeRoDRkuQlUGCVBSpS3Y5UC4YM7Qeg5arwQOGeI4yBsVhQFSZL8h06nE68dA1j778o6lmParzGGNE1ptVpkWcbS0tLbR6PRwmMV/g2NtoknN1YAqsBo8SglmJiYuHRmZuYf2+32qhnvas3W58brtP+KPVCBAouLiywtLb1kOBw+BH7NLHt16omVe5TSpRaFFxIRRWFW2TtMf3F/yxsmJMQGTurw+n91zckvvfQZJzO5YYJdQ3j/Z77L3334wOvuO8j/STzByIETDuMypIA0iUEIrC2V9b1YvXdVpiaHAIbrnzQeaq9d0A5ptVoopSiK4rD3tz9E9f/Hu45296jev6r4j+N4XPyXDxkBI+fct4uieHue52Ogo9EweTzOUE8UJVgkzhg6sUKOhmzS8PLL5u6+9rnnMh/nyMEBElU6VThPlKTYIidJI6zzDEaGLJriW3s8v/+Wr77moYJvD0rh56r4d4AXcbnuDZJmCKCJYzuaHaiJYz3/GvsbV8WRBXLAlCMCMg3iRyKFv/qH7112z4NLqNYcKuliXfBR1nGM9gVkfTAjJJZEeFK7xGXnncCLL978n7oEvGFgIdIaWwxpKGBN/OQRaP2VdzcwdgWoZnjXugPY8mtW6OBzjIasIJKGduTAeYwHm7ZZlvDJ72biL9/3Rf75O3vp5SlxHDOZOuaiJa5+9jZe9OyZd8wBwoLKDIk0JLGGbIRY1WEvM+Yx62ZF2R9A6+AHvrS0NNvr9cb05Xrxvp5gV/X93nt6vR5LS0ukacqWLVvYtGnT/XEcjx9XHyOgLByaaOJJPX7KQm6Fsi9ot9tMTk5+odvtrisYupb6vx7AZa0da2sMBoMvVsBABSQ453F4XKl+Xp2Fa2fyhQe0AAo0jskItINpAb94zbY3vurqZ5GqjOWsxW3/9AP+7D37xI5l3unaigU7YsCQ3OcgBVLpMDdtAOfR4ujvv/prUBXR5ez8McHwqRf/SZJcXxX/3vsF7/1CrfN/SyVe2gCXjycCoDDOYguDVhJZ9IksnHci/uVXPIMtbUHseqRRYJXk1iCVIlJBXweTYa0lak+y5Nq87WNf5vsDbhkAvuz0U+aUK7P/Zpx6NtFEAwA00cSTVEBVBbhHMp6qExJkBCKBSOOyAQjoZbA754v//W0fZuf+ZTAeEcUYF2xdpPTgemD6iNwjhAZGzLYMr7z0LK6+IPI6CcJrcSSgyJ6U7n8TPyO5C4EBsBYEqHp5VihsadlVWfU5Vj52KJwNCsXCOLSEOAEdgbOKnCn2k3DnjpH461u/wEc/+w36e5ZIhgNiscjmec9Lr3wWV18662cJdLDJWJJIDz7Y/YEMRf+Y6itxY+0LMaYphy6oYDAYFAsLC58ejUarkvy1xX+9MKoEsZxzLC0tMRwOmZqa4qSTTmJ+fv7+NE0fVWStiSaebACg/m8cx0xOTt7Z7XaJ43jVul9L81+7nitQSwhBnucsLS3R7/ffWRTFukWj934MEgagcOVUHJ+NzoAxRBRMxRA72Bhz5sueN+evvfrZRHKB1kTEX731Y7z1ll1iCegJGCiPkwUisQht8DIltzGjwuOdIFISWXZBx/uDX7tXHBkAUAn+dbvdmU6nc71zbkee58fE/V2b+V9V/K/KUgIAsKMoilWMjyYehzNUCKzxeBxaOkQOp2/kIy+57CzOOm6KxPaIXUGcRmNQXWuNz4fEwuLzAXhLJlt8/Mvf4dav9UXRSvBCk5YjnqHk10AEvgBfjPPNBgRoogEAmmjiSQUB1lvOMlRYJiC+WJAaFg188h7EP3762xwQM6DaFFkOJgctIfEQg9AKlEZpKIb72H7KDK++8nxmEq6fjEAUI5QLvyd0XdwqMGDFWz10akOhFxTcRQ20aKIJCGJe1b9inbSibhO4og8gwXmSNEUpGI3AGLA2dMyl0hBPYtM2n/pOLt77qe/w9fv28MiePqI1CTjOO6HLdVeey7NOxncAlTnyQR8JxGkbK8Aoh5cWJzzSO1RF5/WSOA42Y5SJVVFYlpeXnz8cZqtE+tYr/quCp6LECiEYDAYsLy8TRRGbN29mfn5+W7vdfmPVZa0S57ryehNNPFWAgDiO6XQ6V6ZpOl7rVcFXreH649cKB1aPK4qCfr//n8b3Rg00lFKiSjtOQbAH9QLwGlwMPiYQlx3OjcBlwbJcgDVwxTPje3/jl17EdBtMZ5a/+IdP85HPDbu7DYzoQNzBFg7ZDtqBxjqs97iSXpAkCVop8pFbV3/gxy7gSgCg0+ncnqbpG40xC8cSABBF0VV12n8FANRn/ytnA2DVOnja3zfj/Kla3yUYPhaJXE9QcsX5QgiPVoKWErR8wSRwyRlzL73q4rNouyU60hBhw9iKc0SJRkjHsN9DaY2PJqA1z/d39fjrd3/31CEwHFlUkjIaDldG7gTlE3IrVb/QTQnVxDEdDYeyiZ8xDKs6OUIXU0iPN5ZIh2ZIrCF38OV7l2884aTjbzhrU5e26AMGtIWiD+2UkVUYofEIIuEQ+UE2bZzCCfOK+76zdGNhPY4YkcTkeUakQAuBsRbnJd6rIDBYTm9HvkD76tn6kuatVnycf4LEafz3HuUR/OReR5sIrQx/iFISIrw0j9fPfyJDhHldEWb+q5lUUevrBS6Aq834rnh/izIxsc6CN+O/3ZcFhsNibYb1OTjPIwe48cFH9t8wMT/LzMZTkB4msr2cNCuZnCzYu6d3w65FbiwAi6LwCsjxcXiNFaC9BwvOaSLdojA5QkmEVHg81oLDo3XyH1qddpykLawLCuU60gjEuOCP4xjn7Pi9klKglMRag5SCqalJkiSm3+89Z2lp8UbvHUpJvHd475BS0GhYNPFEhjEGpdR4Tr3OPHHOles1jKe0223m5ub85OQkWmvqVm/1713lBCAkUmlkDRwzxrC0uLBj4cD+X3A23Neq3B+kL5k3SBAWqUrveECS4FyC8BqBx4oc2VZ44Wi1wPRh+zb8v/+VF3HeZo/xlt99++d452cXtz40ZD+RZGTDvZUmCUXfoIREokrHD4+UYG2GcxYpKbv95f5bu8ancwloOO8x1oz3AakU1lmcc0RRxHHHHeeTJDnukUceaY9GI9rtNlmWHbZTfpQSAIfVE6m/Z3XmRhzHpGlKkiTXx3F8vZTyOOfcDu/9TqXUdiHEjPd+Z57n/zPP889V3f+K4VExn57OTACPxIoAAIQzr3K6qc44RZiYKE87IRDShXUnbNCqwSGtpQPIwnH1M6f9r197BRv1AjNqCKMhQumAZCmQ2pJlfRIpEPEki2qe/XKe3/uLj/G9g/wfBshw4UcriXe2XM0rbNPw5NSa/KmJJo796qmJJn4WThbwLlw2CKxFMmzYhQUr4QDwtx/6PHvzFrnoQBSX7VeHH/SIkgihAi1ZpgolR3TUgKueeTJXb+/4jod2FDo1CIUQCuctkRTEkQpjCFVCUYO4x9ZHza3XBCud/ZUlsjIOINawSlaS3urz5SU8Hr06FxEOhAHtg25AApmGrz+MePtt3+JDX7iXgyZFtlLMaB/PPG2On3/BJNsmuLMLTCaleFgkwz2hwJbSx0JoFB5bZKuPER86W87CcDj8jcWDy+H+KZPcaga2Kgqqjli9SHLOjeefR6MRExMTbN68mbm5uW8IIciybJxIN0raTTzhCdI6jJN6pz4Uc4HJ0ul0fqfdbo9tMB+ty1v/vNa6nOl3Y5ChtMU8tShMsPmrsYPWJm1+zEOWKBWFcwiJlxFaJ7iRIVVgluDCU/G//Avb2bxpgkwk/M+3fpAPf3H3lfcv8dBAgE9ShPBhJMlIpNcIX3U5q/3G/Fivn7V2fJ9XQEr1egKkacr8/PztQggWFxd/u3p9sizWBMT0AAEAAElEQVT7qToBPFrxv/b9r2sVxHF8nVJqe/n1HXXqv/d+oaT+37FWv2Tt+MfT+vwTK3lRtb7DiJkOTLdSJFYJCd7ijKUwFuuD9oVSgk6iUIXhnHm+cc2l53D6fEpHDCAfQKwphiMK64NTgAs2Fmpyhr29gkG8gXd+9Et860GEKVe3AHQUEYSj5LjmVw3c3EQDADTRxLETWlfFRynh4kGW0wHf/MFAvPkfP0UxcyqLAwdRAq0JAvZcEItAr8R6nEpBCs45aQMvf875nHO88NoMcLYArYMYTQHeebQ3CDdCuhHCGSShCDMCjAxCbk008fhkroGWXwcKhA81QZhQ0XjrGFmBj2EAfONBxPtv/ybv+/RXue+goJfOMTvd4bkXnMS/umbTlefO433Wp4VDmxxZhMzIeBiQUEQJQgkEBUI6vLer7My89/QHy+/ct3/Pi4bD4bhgr3e9KgBgrfiZcw5jDKPRiH6/T7vd5rjjjuPEE0+8YGJi4tKq5m9maJv4aURVsNYLt7VFohDQarWYnJx8Q6fTGa/1+to+1P2i1AXA460Zr+lK+K/XG+BcTRSU6qpK8dDzl7IsTLzGOYNTA6wYYACPZlJDqw8XzvC+33jF6VzzvHMQ7YT/8Ge38nd3WvHAAT4DEMcRRVGM2QyVHd/jUuSt0TeoimmtNZOTkzfNzc1dZYxhYWHhTVXRbYz5qQAAawUY1z7ntY/VWpMkCUmSvD5Jktdrra+qAwBCiJnqY2PMHVm2ehSqvo6e9nuYcOVI2cr5ZdEYqTFSYYQCKRDSo31OhEF6TyChpVjZJncRRW7Z0uWVL3/OWRdcfuYG2naBFBsSPRSi1UHoCIvAFIL27HEcODAgnT2Oz3z9Pt7/iR++9CBBODonsHKMMdRHD2S9YKoaTE000QAATTTx1A/rgrMZQGEgigQF8JaPPSJu//qDiMlNVXWOiNPQVc0HxJGkyIahyFdQ9Pdy4anz/IsXPIO5hG0pFq106AQRsjPhHMpbYpejfbAJDHQ3jSmF3IBDCrcmmvix8ifcuGsSPmbVx2O1fhXhvCDzmnhSkAm4+2HEOz/6wG+9+1N384OD0LfQbSuuvuJsXn7FZk6MOL/jhrSMJzKl97cKE8eZtzjlENodYnFWdUWNMfR6vTv27dtHnudjb+/1nADWAwGKomA4HDIajeh2u2zdupXjjz/+C91ue/yYBgRo4qcVdSp4td4rQKvVajE1NfVAt9sliqJHnfFe73MVCCaEoCgKer0evV7vncaE8YJQb5T/jgllsrT6kwgLkZQ4Z8jsCKstpBKUITYDWgM4f45v/PvXnX7tCy8+jz37e7zhf/497/1sTzyYg48FrVaEc44sK8ZFbsVKeDwAlLWuH1VxPzExcd3k5OT13nsGg8FrKpr8T3UPfRQAoPp89T5LKce0/zRNX6+1vqqa8a/P/FcigMaYO/I8H3f/14pANhGAauUN0gcgwImwti0KI2Kc0HihwFmkN0QeEinQMgKVgEqCHo2B7WdMvv8lzz6DeT3AHtwZXGmEIPcelcToSIJ1SJGSDQR5PMsjg4i//9BXeGjIbRnQB5yKCGJ/EpJ4zXm7+t8AAjT5WxMNANBEE0/JMMYhRLlNK4HWoVDPCk8OLAC//5aPfWGv6bLkUnqZxRsTrJPMCFSYTXbeEkcSnx9krl3w4mdv47nnTdw/FYE0A4Q1KAlagRSeCIiFJfIG5R0ejSXCiAgrVFBsFs3h0cTjAQSsLfzXJCmtNkRtskKwWCiyCJaBHy3zx+/71MJlt3zym9x3ICNPIpJogasu3syvv/jEu89MeP1kOUmA18i4DcoDGYWwmHLeIEguePAeWYoyCQ/eOvbs2SOWlpbGFGehJA4f5j6VXNURWztfnec5i4uLGGOYnZ3l5JNPZsuWLT6KIoyxTSLdxE+l8F9L2a6K46ownJiY+MPp6emtQdNiBQhbr4Be64jhvR+DBr1ej4MHly7KcwNCIFVUGxFa8y8S4TXWSiQRKAPSgo4hionsgAnjOSPhd3/1RfMXXHXFOSz0h/y7///7+MDnEPsF2LakcB5jDEURZvpbrRZKKYoiw5icVbPPR/k6Whtm/rXWdLvd6+fm5m6O45j9+/ffsry8fEsd0FNKreqcPyn7agkACCGIoohWq7W91WrdFEXRdZW4n3NuxziZLkUArbV35Xl+S57n677nDQhQnVEOPWYAlAARCid1QJylAOlx3uBtKFaUkAhRzqMVnsTknDHHTS+48EROnjGk5gCdVtALKIxDKBhlPfAFWoBWLXYvWOTc6bz5/Xfy1YcRfaAvIENCOgFpG1CQm0PP03E0uVsTx340IoBN/AyUP6tSjUO+miQR1jqcAy2DSlpFkfaR5sBB9zfF8KEbtp9/FrPdCDcaIIUMYkbWIyPNKOsRJZo4kjhj6CZtdJzy7R8+/L/tX/R/UFiHUgKhFHiBd35MF/OAEwonVLjlRBB1k97yk06VPX4igE+19+/HTi2f4J//VI7Q4a8ElERZWEMQFgwOFQLG+gAe6xzGOYSEOIY846EfPZD9gZF7/+OGzdNMtgUbpztsnJhEM7rqwYcHP1q2fH1kHV4leDx4i4oA4RF+tRBfECJcSXSHoxFKqXPjODq3KnTqFFjv/LoFUpUkG2OQUpIkCWmaYoxheXnZDofDz4THNxh2E08sALDeugy2l4putxPNzs7eOjk5OVa0r3ePV+/V6wMBSinyPGf//v3vP3hw8Y8r4UEvwB9iqSdX7WzKg44URhqcL2/A4YAJCye3eOW/ue64v3jh5RdycGC44Y8/xufvR+z3oNtpmIe2KyBeKMDFWKtjLQU//B3l/Sp8KQD42PtrXTuh6qJ3u93tU1NTH+p2uwwGA3bv3n1elmVUAEpd4+OJnpOvQJj6+1p166v/Ljv/20vK/3OEEC3v/U7n3I7qv6WUx1VCgFmWvSnP84Vq71pvDTTz/0HaT/vAYvMoXOmahFClfpJFCR/GKMtRG5BYK7BOkricWWd43YvO+NDLn30SXbOHxPUhibCZQ8YJQllwI5QE4QR92ybeeAbv+sTX+JuPPCCWgBGEcQMR4a0INjpaBw0cTHm+rsk4KgXeRgCwiQYAaKKJpyYAEDoJrlSMLUcBIhUUlZXGWog7nm99Z3Tj1q3xDWefvJnIZkhTgNLBN0k6sCOUlhClmMKiTMb0RJd+4bsP7zz4o17G14WEzCmMl8GBwJcFEaIEAErFZOFRFIgxA+DHTwYaAKABANboWZfigBUA4EPxLxTkRXhMpIOokgydRGsc7ShiuXDFjl3+fw7cvtdv3jjBdEcxRcYpW+Yw2fDaxYXRuQcybjEmqHkjLFrbAAbYqpgJ78XazpZ3HlOYW5y3v54kyVSSJOPCQFSWBRyqkl5PyCsf9DiOq2LphaPR6C+MMf2mkdbET+VOW9O5jaKINE3ZuHGD7XQ6RFF0iE7AeraXaz+WwlMUOYuLSywsLJw9HAXle6mi8siSOCGCU4gQtd0sAH6RcHglyXwUfG5tRsfChRv4xiuu4N+9+AXPwMg2r3/TbXx2B6KYEIwU2MJC4UjjGCnkmLFQFGbMSqi0DNYFAA4lRD/ma1cV/xMTE6+fmpq6OUkSrLUcOHDgNYPB4Nt1nZDDKfP/NICeSqckTVPiON4ex/H1WuvnlHvXjvKxM+Xcf6ui/hdF8fbRaPQ5Y8whe9laF4inOwigvEeVr7uTYTzSS1UqJQdnG4lFuCB0K2SE9QLnPC0h2ZTkPP/01L/2587njI0ekR1AS/C5wxCjYw2uj04kFDmQcrCY4jt7PL/zF58Suz3kAozQoCKI01L4D7BFoNU5ewgAEIwJZM0asIkmjs1o2idN/MwnbqGbIUmSCICisFjry89H9AeeoYK/uPmeN9zzwDJDNQXxJFjCHJjJiDoxuJzecISINVoOmYmGvPzSM7hgC2+ZAlJK32Q0RB2IWuOjI5wVFZ3Sjr1um2jiaKAPJyhnJ4NgmC//W5brTckySdGEcYC8wCNRUUzu4GBeEKWanT0W/uGTXrzvs9/nBwdz1IRm0xy89mXP5MqzJ647QcGEHxGZ0n7JgcvBebsqca5TfZ1zJEnCcDhk//79J/Z6vXDolCyAtRTpteMA1deHwyGLi4vkeU6n02F+fp6pqandURQ1i6CJn1rhX1+TWmvSNH399PT02PKvft48mkbFekXfcDhkaWnp10ajUSg+9crcvFu3RnQlyOcwwpMVBRhLKhxzAjZruOQcLrju1S9mmRa/8ycf4a4HEEtI+iOPRID1dLsT5HleCp6tLtS11mRZ9ri8flLKSjxvW7fbfWO73Qag1+stLC0t3aK1Rik1fh7AT9Uiby1oWS/Q0zRdJfZnrb2rAgAqu79K+K+a/a9sTusOAhWzYa045NP+/ir/36LxFZvLO6TL0H4ENgvnnEqxMsF5QYJhVo84MbV3vuYFF3LarGS0sJMkkZCm5A7idhuTjUIhj8NlBT6ewrQ38V9vei+7HeRKU1QsFushGwEW3U4D+CAFldxmZbDjVpVOsmTBNNHEMQrCNS9BEz8LR8jqj1c6FVXC5pzHWLf25CfyFjy4CA4u86kDe35ww5WXX0xLCZS3UPQh1eRLB1GTU1iZUhhL7HN0EjETx0xPdXngkd03PLjAjUM8XsT4OKWwFlWaswvECvWfIHqz+vn++EnpShn42I99rOupUcYezfXjro/DJ38/TtL45L6GomSVrHQGpXfjPzkoJge6v7Q+sFKkQHgL1qKExHtBZiBtx/Qzy/0/5Eapl2449ZTNTHYkk2rE6SduYjga3PDgQ6Mbe97hUUTSo8vfUxQWcGitxqObQoD34XPOWUxhMIV5t470b7bbbaIoqI6PV3/p/azKzhtlsuxLn3DvPcPhEKUUFd261+vNDwbD2+rq4hXAcDgrtiaaOJKo1pGUclWHenJy8rotW7bcFMerRf/WzvevN+u9Yh/oGY2GLOzb/5b9Cws3WmtRKtjueS9C599apFLhvvYOrSTeGZwLBbJVGmssCsesMkzk8IrL8b/+y1fz0IEB/+EP77z76zvZvN8A0tMWEnKPEWDLc0kgS7aBQIiwrzpnUUqWIz2MGT4gy7GbcOfWwbyq6K2/HtVrNzs7e9Pc3NzbKoHBLMtYXFw8Psuy0VrmT10w72ij2gPWCjNWv7P+nOvPt9VqzUxMTLxNSnlc+S2jquhXSp0LjCoNAKXUdu/9ztFo9H8Mh8Od9Z+93hncRFVC+3BGjUX/ZJkjFSQ+D8WJA50mZEZgvCRRDm0t2zr+D1/zvDP+lxc/YwsTboF2KzRXTO6IorS0DvQICorCoKe2smvQ4h0fu4cPfn2/WAKIW1hranmEL8GCAeDxtjikQHJV8T++B440D2miiQYAaKKJJxgAOLLCuFr8lbdrqXPGQw9z42R3dMMVz3wG2cIeohgY9lHzc5jCM7Qw0e0gsNBbRmlBS8X4JOWHjxw46cCID4h2FzPKQMcIbwPVX/hQeAmHwI5R5ScaAGhC/ISv6+Ef++Qnc2Kla1LRg4VHVEWHCElWRRcOOgGukhUDBEnSYWgcWSGQCYys55Hd5t023/ObW4/byIZ2zFQnZtPmDRw4+NAN9+/0N2rlkR6yHLRWxEkynmM2xgEeVXb18jwfU/eLotjvvL8wTdOz4jgORbsxxHFMFEVjhfCq2Kon5NVrXnmJl4n7JUvLvRuDiFmxqvCvRAebaOJooupE1+f7u90us7Oz35qYmGC9LWBtoVl1uOsAlfeeoig4sHfvp5eXl181ynM8Eil1KKirbnySBHs/Y5EizEFL4VHSI1WYm/YuZ3PbkwzhynPx1//Ky3nkQI///Oefze89yPH7MokVHi0hcqEwLUptGrlqrCCcJ4+9r4lHBVDroEf1+Xa7Tbfbvb7b7d5Qv6cHg8EtvV7v7Y+H08CRArbrCTrWgYZK7K+0+ft3URS9AhgJIVrl11ve+4X6VYEBxpgPZ1n24Tqboin2D3d8eaQPNpdG6nLExaJ9Qex8UPhXkBmL1y10pImKHvMCXnjOxMde9uxTOG1WoN1BbDFCSFAqBucQ1pQCUDGyNcuDyzE/6LX4j2/+vFgGhI4YFnk5NleNz7nxx6rkborHLP5pAIAmjnEQrokmfmaXtjxsaagI7OhYC6yFvAv/8933i9u/cB/x5HFgI9AtcBFWxkx3Wywd2A3GQbsFrs+WOcnPXXw6V5y/4demNcjsYDgurMGLUHKJ0vJPedfcdE/FXOQnKP6fCgmeWJN8eGTJCqgBXR5Uqbasy6tyFc8Kg4oSLJAbCbHg4QXue++d5tS3fvBbPFJMs3O5z9mnt/iN117Iqy/HzwnwBbT1LEUO3hR4E1SW41iilMBZO+7iV69ZURQcOHDwVTt37mZpqYdS0bi7X6dQW2vHxVZVMFSPGY1GjEYj0jTlhBNOYMOGDT6O43FyXxVX1UxxE00cbeFYL1zjOGZ2dtZPT08TRdGj7gV1gb9qTVfrUwjBaDRiYWGB/fsXnj8cZuDlKpu4cRfZFLjCoJVAawm+wFuLsB5TFDhr0R7ow6Vn4f/t//5ydi31+a3//E+bvntAJgeGgHKoCKQCKySeiEhINP7Rx9CEW309xutT77DX78MoipiYmLh9ZmbmplarNX58nuf0+/3XVCr5T2gWUOv8r9eRr7/e5VjHTKvVemMcx9dX1P61NH/n3I5y9n9GSrnNWntXKfy3aqypUfo/3M0lsVJiRTUmGeyTK1cASWku4zxCWIRZJrFw7lb8C555AuedNInLDyK0QMVR+A7vEL4IB5RWDEaSZbWBfdEJ/H//5IN3LQAFkswUdLUfN4GqqzQBPKQt49Yt85v3t4kGAGiiiWPz/Cn/TbWgyDwIGHrNPgP/9c2fufeBRUehprCqg5MtBqOMwfIBJjspxFEpLFOAH7JxAl58+Tmcczw+Np4Nk2qjtNm4G+vXFGWOFV/nJp7cwv+xVLrryVx9Pv0pkdyJoKBcBwEqizAn5CH5iWTFLrBK/HNboHUMUuKcR8ZtVAo7l9nx3k+NxO/+xW2Yia0sDJc4fpPg16+7gMvOxM8BzoxIpcIYS16Ejns7SYEwFlCJieV5TlEUaK0xxrB7926xa9cuBoMBSZJgjGE0Go3nj6vuaNX9ryjGFXV4MBhgrSVJEo4//njm5uZ8ZRtWFWxrBcyaaOInCa31+H4vC9rXT01NkabpY86O17+/YqhUBWmWZRw4cODBPXv2iPq8eAUWjM+I0gpTUDrM4MZ2aEkEiYCONkwqeNllXf9/v/7X+PZ3H+L/83uf2rq7YM+eYQJaoyJQCgoPfW8olCBSMYmIjlqHZu3IQ/U3t9ttJicn39hqta5K03RVsT0ajd40HA5/KgBqXc2/YgitB7RorYnjmCRJXl/Z/HnvF2p/58yav3umekxRFLfkeb4KxKzevyYeI/8SFSAloSz+pXfj88wSZGvSWBHbAXFmOG2em3/uolN45ukbaMkezvYhkgiVUhiCCFMUBSwgNxg9xZKf4aZ//DR37+GigYAekESSwvhxm2htu0jWcsSV4n+NF4Bv3t8mju1oWiRN/AyU8fXr0TQB1rvC3HHhQGhwWoERxKljeZE/s4OdNzz/eVew98B+dByRxgKfLRFNdMiWhygZI5QEU4CQzM1toCgyfrhj4Uu9Xv4NLywIgRvfZoKKSOYkpYDMj4/BNSMAP9ardZSv7/qdnKdG95+S0u/W/JWi9AwX44/G04orwvs4FJFKsK6sKjT4fIgzILzAAd/bxY279u284fzztqLEMtMdxdmnncS99+69Yc/S6EZUWMulu2YQALSupGMGuqQxFggFlCcwAay1N1prb2iXxUHVTV1rnVbv6NdFBquiqd3uYK1lMBh8eDgc7qzsy6SUQWOgoeE2cZQFZKXoPjExsW3Dhg0fmpycrNnUrV/41z9XAVlRFJFlGXv37n1w//79Jw6HIyIVIYQsrcVEOV8vxwLjWskgRuYNtnBoII1ASxAWROH5Fy/Y6v/t9T/Ppz/7Bd705/eI/Y6lnhZYCmI8kZVYqzDW4TU4bUkKhbSiFBCtq/uXIwCHIANrVf9L7RGxAlZU92Sr1WJycvL+ycnJV1TWn5W1oDGGgwcPPnc0Go3ZP080wPtYgK5SijiOabVa29M0vaGk/QOMSgCgGgEYlT+nVRb/rQB0Fm/PsuzteZ6v0hOovx5NPFrmJsfCtQqHpEARrJGdCBdCkCpPnHlO6HD+yy/d8Kcvv+xMTplVMFogioNeTJF7nJcoKRFKg/MMbYztnsgn79nFH73rq2IRsCqCKMIVYb7f8tgKQ7a21lfnXLYEKpr8q4lj+HxrXoImns4HkCfGIlFxC4ogCDgagtNw86cWxfs/fQ9zJ5zNaJQTS09rehq7bx/O5IhOB2SEF5JEGiZVj5dcfAovvSi9NfHQBpQ3499lhcShw6FXV719Iv/G2uzjelcTHJK0r/3cWgGpp044lDcIDKICloQcX2M2AHr837b8mhVh/QnpcDYnEoLIe3wRUp2oPc1QTDASHT7w+UXxn//sTh5ciGh1pjlxywS/8UuXcd4GMmssReHDnL+U5EUoiuI4Is9D5zOKNFEUjYuASgBw58OPiB/96EcURUGapuMOfwUI1JXX187uVqwBpRTT09Ns2LDhK+12e9Xjmw5cE0d9h5VrKI5jpqen75+cnKRynzgS5lBRFCilqNnesWfPnhMHgxFKBZDOluvcWh9cyMZ7jsf7MPvvbehWpnFwph2NAAevuGLW/79/5Vpuef+H+a9/9W0xVJDRJs89OpJ4G36u8QRb24iA1gEOe9Qp4FoBwDRN6XQ6N7fb7W1pmq5iUBhj6Pf7vz0ajR4VWH28owIL1z7fCtxJ05RWq3Vdq9W6KUmS66WU28rHLZTv58zaj6vOv7X2rtFo9KaiKFYV/825+mPcX0KUbZucyNlSFFBSiJRctDBEFCPPfAzPOye++8XbT+G0jTHSDfDkQI7Jh0iVkLanKYjIRgaiNsn0Jr77wAK//8e3CxmBF8EGF+9wqtR9ehQQwNaLf1HN/ddGFdaBBZpoogEAmmjiGFr+lgihuoyGDmQC3qAkHDRwAPgvb/7ilT/cP6SdxgwP7IVSibw1PY3v97Fe4ZMOSIsc7efUGc3LLj+Ly0/FT6qgxA5ghcIS4YQOIEA5hd2MATx1iv/1Qim1ikZ6JN/zU3vO5aU8q0AAX/b8rVBYoXFCY8srrL3qYxiZIULmxM6gcxv0MFotcuUZOMPAS1Apn7ob8aa//Bqfvms/VijOO2HAv37VSfHJG/hdKSHLcpSSpQOAKLtgrLK9qgqFqiua5zm7d+8We3ftZvngIlhHrDQKgXBBaBAbxhykB+H8qs8XRTEeI9i4cSPz8/O+KrQaEcAmHo/w3pOmKdPT07dPTk5SiVdWBeThNACqx5Wdf/bu3SuyrBgzByqVeiHU+PeFAjJ8PowIWISHWIfa3TmY6cCLrjjB/8d/+xo+/sF38A+3PtItUuh5Re4GTEcJDB1WQh55iIFIo22HpEgwwmKlxYnHByRTStFqtZiYmLi52+1eF8fxqiJfSkme5zuWl5ffVN2bFWX+p7W3V8V/BTC2Wi3a7fZNpc3f9qrQX6/Yr3+uKv7zPH/zetT/6m9u9p/DFf8rJYjyK6J7DomRKU62sChaCp55mvIvufgMztyUEOUH8HaIlODtAHyOSlKIWgyNolBdBqT8cPcSf/Lmj1IAwyL8Kj09AbjwO4QK9oNoLBKLLE2aKccSNKAYe+tSMe5WNAOaaKIBAJpo4tit/CisRUQKbBb8zS1YARnw4JDP/Ic3vIM9o5TW3FayQsDEFCwfREiLERaZJGA9WgpkscizTp3nl192IXOa61sONCMkFi9DQmZXjZLJ+vmyOvkUKzPdfhVYsKJY28QTvEHW5kafynZO1Wz/Wk2A8Voqdf8Z6wOUxUmZxViTI4VEqoj+IGfYHxC32yRpi4EVoDVf/C7iv/zFPe/4xD/fT2vDRi659Hyuveq8/3TSJNu1A+EKIgnWeLzxaKXROsUUEmNAqQQlJCbP8NaQtjR5nvPQzkfEg488TOEsaaeNxVN1CeuJdSUOWOkBGGMY9gcIIZienmZubm7MJKgE25po4miLx3a7fd3U1NRVrVZrXLSvx6Bab0+omCxLS0vs2bNH9PtDtJbEcRRGY4RDKlCqtL5zFTsryKBJrYiiKNynFsghBS49/1T/737j1/mHf/wQN3/wQHfXkP6BkaRnLUmUkucZiRIIrSkrJXAeCoctLMYZnPL4RwMAKn9zf3iv82q8odVqvb7b7V7XarXGBX6lil8CAG8eDodIKUmS5KfC0KnP/9c/F0URaZq+Po7j65VS251zC8aYu6y1d9VV/usMgDoQYK29qyiKu6r9qA4YVR8/HQAAsU4usipneYxrZfJerClKXLCFdZYOIzZP8NrLztnCxWcdx6R0+GGfSMrAYEu7KJ2AyRguH8Q6Rzo9z86h5v3/9C2+tBNxoFrO3mEWDwAO3eqGT4rVpZCvqwHUn5ao1ABqAEazPTZxzN+/TTTxtMa/orCVi8B9ruyOvQeBJMXRAv7l1bP+9de/gk7+EO18L5HKwRYY2ULoDsqm0BuEn9OZ4aHdBR/56oP895t/JA5q2GfAtyJsVgQqZu5Io5TMGnw5cik9K4rLXob5zDHtLBw5QSHXoMrc0ys9fsx6cfgkyz1q8vrTCH8YCsThn5c7zM/3h/k5j53cVjOiQgiyLBvb1FWU1sq+rlKt11qPi4S6hd0TmYDVEy/Ghf56m7xb/XUR1lLIb2QJRkl8OZEpvSRSGp8PSGRBIh3WwIYOJ7zixac/+IsvfyEz0ZC3veNm3ve50UsfWOY2B0QtyaBQFC4CEeEdKC0RGLzLiLVDKk+WWaIkZjDMabdbnHTSSX7Tpk1hvrq0X6t3Cb0PDICVGiWoq+vSuivPc3bu3MkDDzwwLrTqc7hrC7bARmj6OMd2HF0aXu+81/eJqpBrt9ts2rTJb9iwgSiKVmlU1P3r693lan+w1tJqtXjkkUd4+OGHxXA4XLX2pLBoWSmdA2gEUcncqTA6iy+GzE4oXN8SWXjVC07zr/v5f8EHPvwR3vWx+8RAQiYg8HdWdjUnXBgHqu9nXpbj/a4s/uVjvrZCHCpMWBX01Z44OTnJzMyMb7VaY/2N+v7tnKPX67Fv3z4xGAzGr1llsXh054c9ZLa//ruVUhhjsNajlKDVapGm6TVRFF0X6P6ye5j9f7u19i7n3I5K9b8oilsGg8FvByHDo6X7H7s9uEq1XxIm4t2qEccV/Zl137dSpwaniNII09vHZApKQn9AKVKZ0zbw66/a6l99yUkclxqmvUZKh/HLSC2RIsJbB3aAFRIbdTnoJ/jMvcv8X3/2JbEA9JCh6SKr3IqyCyPX7B/uMO+NO6RoaoY9mjjWK6AmmniaJ5B2LLq0sqMHlHqEJBNw8+0HxG1f+D59MUNGO/DXhEBgMMUQvAnqTN7A6CAbpzw/d/FpXHPZpNej0LWxowLdSQFH2mqt6nKOC7IyOVttvVTJuIXbVdY6Ms2M/xMbRVFUHvPb2u329opibq1Faz1O+uvK83Xa6xMOoKzqqJRJ+5qL8bXm6zUVYyeCmJ8tCwZZrsMs72MoMB5yKSgE7Bnw0G1f/NEt/+3Nt7Bvz37+9etezcueM3PrvIKJGEZDhzcFkZLEOkJrvaqoyjKDyS1JoiisQceawhoe2bVz0549ewCI4phsHZuwtQVapSeQZRlJkjA7O8vU1NT74livC/w090YTa+/v6l51zq1yn1BKMT8/77vd7ngN17vJ1RqsQKrq/q9o4VEUsWvXLhYWFt40Go1WgQcV7d+51XVHoEWXj/OONBJEAkZLFmnh4vNm/Wt+/pXc8p53ctvt94m+gL7UGKHHTLKgrh72BuErG1BK0DgU/l4cSfonxwV8KKLtKoDDGEO326Xdbt8Ux/EhLgZVlHodt1Q2eU8Eg2otO6u6KpcFrQPrII7jM7XWV0kpt61V9l8vjDF3VECAEGKmKIpbsix7U8VsaAqItcXwSvG/6nHeIWvnjQimS0EgcjQkTiJ6BSwNoJNCV+YkBl75nEl/ybZZNrYgcRnSWbAO4SUCSWEFhXV4qRBxTK5SfrB3yH/96y9du1QV/yIBoVYk/V3FXDC1s9E9Sm546NfrWgFNNHEsh25egiae3uFX/bMaE3ZoJTHWkQH/5Q8/Jy75y1/yMpqk243xvX2odgsxHII7CJGGVGGFJFawtdXil158BQcHX/Tvu2tBpFrgeiO0EOTWjPnXyptQ+Au3AkQQDilfIur1I3elb+PW0NiaeKKKBKXUjna7/Xop5Tbv/S2Vh3VVLFRFQX3OvSoqjoUQfvUYihNh1lFKiRQa5w2FLV0zPDz4SP6a3Y8cYLTwEf+rr34J//ZX/hWRf5f/q4/uEe0YhgayoodQOc6XK1lr4iihKCCzBleO26hI4oxlcWFxj0ScFcfxvdPT0+u+fvW6vV7IV1TcTqfDli1brjXG/Jv9+/f/2dpObd2urIkmqk50BeBVBX0cx3S73evn5+fHDKA6sLeW6l19vdIMKZ0p2LVr10X9fv+uEkRc3a12AuFCj9QpgZcCVzJygmWnwfc9GzqaYd9w7qnz/lf/13/N/3jzX/HVe/aJgjXjZE9A1Dv+1T1X/c1RFDEzM3MgTdOZOI4fFfDM85zBYPCaSim/fv8+noX/ej/XOY/WgcWVpumlFeV/hdrPnsfMDrxfqMACa+1dWZa9aTQaLTQAQAhbcRPFSkddjBsVK6MB1b/S1yz1vERLyMwIEUucASUVzglSYXjGacK//MoLOG9zyrSyiKEAOQQpA2PGCZQbIVsp/QGYaJY9ozb/7S0f5uGMD4wAiwNhwvhL9fya7b+JJg4B8Jpo4mkWK8ju+o6wruxQSgwwAH7n99/NSG1gKGcZ0IbcIb0N1H+fUWiBjxTWjij6+zj7pCl+/dVXcfEpHT8fCVIDIvc461FxEqQAy4NSudoz8Cud2go9l96VVm6yFBHUP/MigodjODzRDIiK9jsYDMiy7E1RFF03OTl5U6vVGiegdZ/6tc/9Kb/9j2d8JcLL0KURHoTHCY9QAqkVQkmMA1vmUSoK+NUX70Pc9LaPcudnv8YvvPJV/PIrzvE6h9jDzIREiRwpM7zLsS5DKkUUpzgUWQZIVbNJ0/R6vft++MMfbtq9e/e4sK/P/a99X4ej0Zh23O/3McYwNzfH5s2b/7TVaq1aC3VHh7VzwU08PaOaRTfGoJQad/rTNN22ZcuWm5IkWWVFWS88q8K/mvWu7AKjKGI4HPLAAw/8dr/fv6v6fB0oCOsZPDFOJngRBb9x4fAUSAoi72kLyPuGyy441b/smpfzu7/3X3/r8/fsE7TDeWSe4CW83miTEIJWq7Vtdnb2/m63O1Op/df3vLpuR2n7uerzdXHQJ/KsqBf/SZK8vl78H9EOWboCVKJ/WZYtVEDG091itLLxqxxnqkJfeVO607jax2FcIFy1x9icJBKlW4yi225jc8MJs9z/y6+8grM2dZiNLMoUwRxTO5B5OappkZGjv7RENH0cB5nlT99zJ197ENEDSKpUzo5b9srXMrymcdJEAwA00cTTOMZUe0XQA4io8wCEEIzyYJjkBHztAcQf/vUH2GenyKIZ8lHAmYkVVocOTl4MsLYgjTw638szTmzzv117OadNuF2TMvz0dtwC58ez/7KkxJW1V6DHeVDerULSq4N3xUawuYWf6KgS/OFwSJ7nb9ZaX9XpdG6qZl7rM/9l0hjgo2Og+y98KPxXHQp+hfZoTI4xOU6EOX4UYRzABsZAIuGehxD/5a8+c9Ynv/x9fuHq5/IvX7TFJx5GfUesIAnWyzhrGY765NYh4zYqSkNBZMPrVI1UHDy4uGf37t2X7du37xALQCfA4rH4Q9TYi6Igz3OEEExNTbFlyxZfWbbVf069WGji6R1V1x5WxgG63S5zc3P3T05Orlp7dTeL+n1e2VtWwncLCwvs2rXrzXv37n1TVTBX+8Sq3y3ASo2VOliUAdJbtIfIQyKgE8PZp2zwJ564lb9769sue+CA/WOZwqKDLAL7BO//1VhDZacXRRGdTmfb5OTk/RMTE9vWghpr76lydOCu6jWofl71ujwRxX/1fkkp6XQ6UavVuqZe/DvndjjndlSCfof5+7c753aMRqPfHg6Hd1Rr5Ole/K/OReQqHaI6CKC8Laf9fU3yr/KpceBytFQ4C8I5GC6zJYGXPPv4bc85dxPTLKNGy/hiFPQWpANpUDiEtxT9HunUDPtHLT725R/x4S/3xE7AtDWDiqRRNViQY3ZC7ck20UQDADTRRHMryPGpMD4XSquYHE3PwxD40Gd74g//9kP47gnEkxtAaYa5IbcCrRTaC7wX6DQiUQOi4iGuetYWnnvO/CYsdBDY4QhpVtPR1nrRrjwzV4ICbvy8vCiP1UYD4AmNysc7juNKzOqO4XD4G0qp7RMTE19ptVozSZKMu3uPRkV9qq/9VSCAqAYlDVGssN6SFwaLQEhdiYkzMLDswj2xJ+O+P33bJ8T7P/IxXnLVC3jtK8/2EwJ8Bv8Pe38eb9l1lnfi3zXs6Qx3rEEqDZZLNh5ky0N5xDI2RooxRNjglkJM2iQhLTeBxMShP9Kvge6qQBorP9wJDiRIaYaOgQRXICYRGJAA27HANiqPWHhS2RpLNdz5DHtaa/Uf+6xz9z11b9VVDaqSar/+XF/Vvfecs/fae629nud93ucthhBISGKwpcGMjBSFUJUMutYWsCICFIPB4FMPP/yw6PV6ZFm2IeNWv7/jOKYsy1EGKUBKSZqmSCnZs2cP09PTPx3HMbBeJrCVYqOJSy/yPCcIKp8KXwqwe/duNz8/v6F0xHsCTIJd3+feA9x+v89jjz1264kTJ97jwW59PaiXCAmpK88NUXV4kVQJzpDKMyZScPll0649M8VH//Rj4vE1+6mopVlOoV+AEcGIBD5/4c/PlzBMTU3dNjs7+1Cr1TrJj2Oj9N6Os/9lWd5XL4/wc/dcKXAmVT5+vY6iiCRJ7vLgf3Rchycd/U8V1trDeZ7fnabpIZ/5nyzlaAiAjeC/Sli4sQFg/Srb8euq3xYOSmsIEMSlY8rBTa/quh9404uIBk/SFjkBBiEtTjmMsxjjQFSKEp1MMRQJn//WCf7Nb/6VeMJAGiQM83VwL9xoDwWnNExuoomGAGiiiUsyLFBS9Voy/mk2MrRROBGTodFJyCrw23+yKA7e91lW8hArYwo0RelQVhPKCE0EWYmMciJ5gq54lJtvuIZ9V+J2t/R3aDICWz2OTK1P+7hfey27L0aCf+XWFQJNPI2bnNrGtixLRpmgg0EQ7Gu32/e2Wq3bkiTBZ5tP33ngIn4EjMF/9V1ogVKVbMVYKFGgI6SKcDpGBBFOSvrAQgm/9kffEr/zR/fzXftezN//3ue4q+Z5lwJsBi0lCXSlMNA4bJnDyMW7AgzrSgBnLf3egCeeeOJNi4uLDIfDDYC9Xvvrs5O+FMBnZMMw5PLLL//ZmZmZj9X7kteBXRNN+Gx0GIbMzc19eG5ubtxOcrL2vX7f1AGntZalpSWOHj16cGVl5aA3CfWvmwSplZrFgjQVmHEWZSqX/9hALCvlTGpt768PPySOZ+BiWBqWOK0RNkQ6fZJ653yMjZSSOI6Zmpq6ZWpq6q5WqzWW/G9YOmplNXXjwKIoDnpzxcn5ey7X6Dr4T5Lkde12+wNKqX1exj8J+LdDAGRZdmee5wfrZQzPJIXX0xX1csVJ53+DwCAohBp1uFBYITFCUgaSEkfkJDsDuOl64W79jr1822xJODyBHim9RCixoaB0GocGUX3ison5xgnD+/+fj3/8yRJSArABuGBU3rbeaNBhR5bPcmS2SePk10RDADTRxKWL7uT4MQXFiASoau1xckRZS9ABToacGOYMABPAv/h3XxCHDi+zYqdoT+1GiRAzKMFplAxwGMhWQaeQH2Pfi3bzo++6kR1B8c92KtCk1WeNHJs3EACEGLG+yaqAvx0x2bZ5cj1NEQQBZVmSZdmGzX5RFAfLsjwcRdG+OI7fH8fxbUEQjMEsPDP6QEsnx10lhFtXpHjH5nyY4aQjDOMqY2nBOkmJJLeOvoM1a7GBwAbQB/77nz8sfuO3f5dXvOTlfNdrXvRbezrMBoDJLcJUppcKW3XMqAEwrdUG5+4oClhYWPrE4uKiGAwGG+qIPdgoimIDEeCl2FCVbOzcuZPp6ek31U3K6hndJi7t8O0jy7Jkenr6tp07d97ifQE2A7OTxJ73DkjTlMcff/zWJ5988lbnHGEYjteMU4JdV4IrkbZA2orkVaJaO6SO3vbI0bXu0VUoQxgYcFqCUGgdVIzceQ6vkJiZmblrZmbmw1EUjX9XVz15I9R6mYSfx2VZHhopAc6bKsofx8iccFcURbfHcfw+D/TrYF8IMbtdH4A8z+/eysOgUdhtJADq4F+OhqYC/JpShFWLwNqXExKEIJCO2BmubPOF77vhhbz22+Yolh6m1Q1hdM84YSvQLxVWhjgRMaDFqtrJ//UfPsE3lnjzAECG1X5NVF2TlFtX+Vu/r6Nx8W+iiYYAaKK5/f0UGLVGsoJaXZikapQhMUWKsQWlgBxYKSqw869+/QGy+FoWlzJiEaLa07jCVrs4k4J2FOkatEOsWeO1L5jhn//wd7zj8il+Mxg9OK0BEYS40uFUhIo7GOOQQYwRupKtCTvu2y4pJ1q8NbHZZvC0m+9thN/g18H9SK5+uNfrvcqD/SRJ7pqbm3NTU1M31rPQpzvGi5scAKGrzW5elhgcTooxYeWkpFAWE0ImHKmo+pGvAZ/5FuL//g+/f98rn/dcvvfV1yxeNSPeXuSjzKYSFGmPUDqkcEghTvryLdmSJGJ1dY1HHn1ULC0vV5s2ITDWIiZAx2Zt2YqiYOfOnVx99dWu3W5jzHqLtzwvNq0drr9fE8/8tWDSvb8s7fg+8JnjdrvNrl277pqamhpL1z1BpLUez3//Pp5w8q3+Dh8+fO3q6upB37miLMsNiqDNVEESixAlyhUEwhIoidIKKyW93LLQzz86tFVCM3eM+qyPJPTWoHAbWnmeSXhpfp1A01qP/TimpqaYmpq6q9vt3pYkyYZOCX5s8jwnTdPxWHqyRGvN0aNHRZZlGz6j3rnjtGvQaKzrZTuTZoz+7+I4ptvt/nS3230oDMN3WGt7m4F9/zMp5V7vC1AnCZxzS2VZ3pem6R39fn9c/uDvh7oHRFN2txH8j3sBiAr854UjbHUpZUhZgguSagdTmqotozDownJ1h9v+7lv3Xf+G667CrR0hVgZMBno05qbE2BKlQ0qVsOJaLKkd/Mtf/ShfOIJYAUoNyALIwBqUKUe7txHg93s7UTe/baKJhgBoookmxOi5MCYB1rljRDmSa1Z/Y5CkwAOPIO7+3ftJZq/BkEBhEYHCpH1EpwVSE0RtXJpBmTKlB7zy+TP87Tc/94dmQggsTHVCTJZCpBFaUQ4zSDrkaTZy2l0HZP54znbj18SZbZb9d2MMZVkupWl6txBi1tcRJ0ly1+zs7G2dTmfTGtd6hmw7G+DzHVZMkkgbfSmqe27jefi/NgKcK8BV+plyNDcy4EQKjy5x02/9pz/sXbHrSr77jd/+kau68nXCAKYyv4y1hJrDf71G32fzKiBRAfknn3xy9/HjxxFCEMfxhuz/5NckYEiShNnZWddut8YAT2u1oSvAZmRAE8/sqJvNeUf7MNRorSjLctzLfn5+3kVRtKFbhL8XPKD194hXDEgpefLJJ1laWrp7OBwe9n+zXeJROktgLIG14Kr8ZAlkCDKhyYSmFBrrNLgKykgnR8RviR2R1me1ARypaCrFTYTWmizLMMbQbrfpdDr3tlqt24Ig2ND60I/FYDAYj3GdaCnLktXV1YObdU/w47Kd+eUJg7rKYHJNDoKAVqsVtNvtD4RheNvodY9aaw9v4/4YGwJ6YsA5t1QUxcEsy+5rZtBT3EKNuypXdEDQ6tAf5JVpTJjghBxdS4HLB7SAroPvevVz7nrDy55LUA6IhIA4hrLAZUNEqLFFiZaazDgWhhBe9kJ+694v8vG/ceLxDAYCjAJcDi4jFhCMvJyEf2YJKhNBAZXps2ogUBMNAdBEE5c06vffxMYfbYQ8xSgL73+myAnoAb9y8GviTw89xprrQhSBS1HTIWU6oCgUBFMIQnQUgO2za9Zy81uez5teiesADAdIWxJLizMlePmpkBXIQla9osXkw7YhAS4ECVA3uBoOh+9xzi35DFcYhnunp6fvmpmZeci3EPOvuzjrz+0mJACj2mI5Ah2+NeUkceBAi2ofJQApUDpASkEBLJfw+RN0P/LnnyWxGd//pn1/edl08PbSwVQrpCgLhDg5617f8FvnEKO+6qPuALuXl5fHWbnJjFu91V8dfCRJwq5du5ifn3dVdnPdzGszEqAhAJ4983WddKuuq/eKsLZSiczOzrqdO3fi20aO773ROuzvs3pLPGMMq6urHDlyZG5paek9WZZtALjbuXeks0QGQlvhklI4hgL6QjKQktQqrAuQTqONJjBy3BHGyRIrz74XfV2679c2pRRJkjAzM7PY7XZvrGf+/Zh4NdRgMFjyr6nP4SzLDi0tLd26VWZ8u2NUJxUm/977NiRJ8oJ2u31vFEXvk1Je5bP525H5T4L/EXlwKM/zQ8PhsJlAp909bexQtOHaUbWOxTiIImQQYNMhwhREgSAoLVM5vPIq3FvfcC3XXB5hCguqA4SU1uFkDiYlCmOkrUoJmLmMX/+jB/jNex+99pEc+mgIZKX6d1U3gQAz2jVNyv1Hx9p0UGqiiWYGNHGpP8DcKTrBONaNAdmkcExTig6rwM/86//xwr8+krKSAnGMLXKK0uBEiDOj9oJBQGkz8nyJ5+2WvPMtL+Zle3FBAS1AlkOkGUIoscNeZZsOW2Z5XINPnjYQMblp9ZvloijGJld16Xkcx3u73e69cRyP5cOT4PKiqUH3rTDFJAlQIwJGcknpbK1XpUUq7R2WsNZVVZZSI1UEKmZIyJePDcS9n3jgZ1ZWl/muN7zmI9+2ZzbrD/Jqs1bL7E3K+T0Y86Bj1B3g2KOPPrr7+PHjJxEAp5Lyj1qCMT8/z9zc3K9FUTjO7DZmXs/i9b2Wmfb40ZfnSAkzMzO3T01NUTe2m1SSeBLPG9kJIej3+zzyyCNz/X5/yStRvMt9HUyf+tlTbcCUr5d2UAiHla56Ko06A0gr0Ha9h7l/FFlBVRt9NvSfteP1yZMYMzMzt+zcudO12+3ZzVr3+XmXpinW2sP1cx+ZpNLv92/yZQGTc/KpEKCblQB4EicMQ7rd7k8nSXKX1vpNI/D+xdExzSqlrtrmPbIh8+/r/pt1YZvPxxqMcGLUQNZ3tyjKqgesENgiQ7iCRBkimxMbeP40j/xPb7qGF13ZZrD2WHWv6RZZJtBRggx19VxSISsDi4nn+OI3F/jAb3xefCvlcCYSUDGIAMrqsRRLcKYcOSVVZTMbtnTYxgCgiSYaAqCJSzvW+51XO6oawBdUsn8MXhY9KsMf4SQDlBhX4HTIwxlf/Re/8qccLyKOreW4ICJIWoRxF5MbTJFBPkQmGh1YgmyB1+yd55a3vJjr9+BaQJBDTIFyWUU82KrkwI43e+sbPyubljZPF/ivg8xJoGqMYTgcvidN04P+b7zZVZIkN05NTT3U6XRu82qASRntxQH+xzd1dds7efIX6yIZ6X0onIXc+ikCBsrSUlqDwVAqR44l6k7t+vIaP/eHn/q6yFef5JV7d4bznSDIDFgLGIuwrvIc2AS4e+ARBAHW2koJcPzY608sLmwwXKyDvTpx42Xc1lo6nQ6XXXbZP5iZmfmAB0D1soOnAuCauPjDZ67rLfvyvJqfnU6HXbt2vT+O4zERVJeY+5p1n/lXSpFlGcePH+fJJ5+8dXl5ecnfo/X7b7t14A6JlbX1fMNyUI6eOw5Z+ZZX2f+R6mu9S8zZPQO8X4HvmjE9PX3j3NzchzudDt44s16u5NewLMsYDocHwzDcVyc+0jRldXX11uFwuDQ5H8/mGP31qWX993Y6nfcnSfKzQRC8yTnXs9Y+OgHot0sy7BVCzPq6/zRNl4wx56xN4bMd/FdlinK8o/Lyf4cAHYJSkA4gHzCbCBJriXN4Tosf+97XdK/6W/uupat62GyFKAkprMRKDUECSkIQMsjARDt48NEB/+43P84iYHSAkwqsweUZlBVJZi2jJ5SmRGL8s8vv7+zoYSVMcwGbaAiAJpq4FKMCMxU/vKG1ntsIkMTob9SGL0sldC7InGEA/PXjiH/1q39ItON55C5EKwFlgRQOFSfkpsQqSxwJGC6zI7R85yuex02vvpIdAiIqOajLc4I4rBqoj4CZqxMBo6P2pEAT5/Ee2cQQbrIFXZqmZFl2Zx1w+A1kq9Xa2+l07up2u3e1Wq2xMdjF0Ye+Lv33RJisPRp8dwA/P0atAV31XTkLhSMwmlCGBCJAInDCUlKS2xzdDjnWWz1mWx3WdMAff/IhceTJY7zyJdflu7utK1WtpGKSGPEg3IOQoigAvBLgUw8//LDwJl2T/bnrCoI60NFaMz09zezs7Pva7fam5QL17G8Tz765DBDHMfPz8256enrc6aPuF+DvpzoBpbWm3+/z6KOPioWFhYOTrfDqBnXbIfcsklJpclm1RsONXMutRTtH4AxC5CBKrFiv+Xesd+84Fy1hveHhjh077t21a9e9YRie5HpfL4vIsow8zzHGHIrjeEyspGlKr9e7c21t7WDlsaHPCfivZ/3jOKbdbt/S6XQeaLfbt29UeIhZpdT1SqnrR0Z+H9/GPTHrTf/yPL/b+zv4tbyJ0xBYYuRR5OQI+Ivx7wAwRVUioKAdgjYFooTLEm686bXzv3TzG1/G7sQi0hVmujFaC9JsQKBCMAJnHblxpDpGzl/Fr/6Xj/PZbyFEAGlpqv6yFAgHwagazQAZEqs0ZkRG+P2bdtX3imAraUyUm2gIgCaauOQjABdVlsvjzgA1mSYg0SjkBvuYMLEYZ1BRRM/CH3wacfBP/5rSxZjBEPJVJDkujigCjSkHiHKAFgqM4/KW4jv3vZDverVylyd8hyohFBApC67qDz1+4Ho/AK8GaMD/0wIaTpXZq8leDw2Hwzv95rG+MQ2CgHa7fVu3232g1WrtDcPwogGYW91H0m1sEQg1EmBEigksgVOENiCwAQEaJaukjZNghaMgBwGpych0zBHgcw8vi4XHvsnzdrYe7USyRoqcPMZ1EG+MweIQqvIE6Pf7HDly5GeWlpbGxmWTAKye2feAAvCu7y6Kog0S50mCp4lnOEipeW54IJ8kEbOzs4/Mzc2NM/ta64lyAbHh3imKgsXFRY4dO3Zrr9fDt/qrf84k6XRacCskqQhIVYhxCuEkgYGktMSlIcKgXOXRUSpbddwQ1bZN2urrbLdwI5KSubm5D8/MzNyYJMmG0hp/LkqpsSnnSNq/1Ol03u/HzhhDr9c7tLa2dkdZlpuOwWZeH9s9xpHRH91u9652u/3hIAhma6RLb/T+nac6Z6WUe40xh7IsuzPLssP1VoUNAbgdEmCU7Rc1FYCQdQYHZ0raoSSSFlKYk3DDy2bv/dtv3sfe3VO44TJaQKgltlwlFBnaGCgsTkT0rWJVJvz3+7/An36pECkwLBh5DxQoURIB2gkkCoPGCVWlbaQc7+N07atZ2ZtooiEAmmji5CmxSXsYX0fmxtYyVeQ5iBCy3JBrzRLw83d/Wfz1I33KZA7iBGNz0v6gAlTWgXXQisH2iOUqL3/eDLd+92t4/i4+HgPTAeS9YWVUM6rzNKPWNWICiDVx/gmAzTb5/stnuUbZrzuyLLuvXt+f53ndqXpfq9X6cBiGG0yzLsbHgRXe6G99Bmy+A6yM+oqy2FAjrUetmK21qFjhnKU3yDBhh1UjOfzYijhy5EQnaXd/LIgrEG4Fm9b0exWAJwp8xj+OY44ePf5zi4uLPz4YDDZkLevEjb8eSlXO7z47OTc3RxRFe+vg7+IzaWzibKJuWufvj1ar9bqpqamrOp3O2EzSy90nCQCv5BkOhzz22GPixIkTB33LuSzLNpSNbPbZpyYAPAG3DjiFrTpkrK/z60TduuLr3Mj/PbCfnZ19YH5+/pYgCMadNeotDOtzajR/DiqlZqempsYA3VpLv9+/yRvnyZFx52braH1+b+f4tNZEUUSSJHclSTLuSFAUxZIH/qP36xljHnXO9aSUV3lfgNOFMeZQURSHPXnrycKLoUvLRf1sxKJcRVIJZ0dkcX3/5JCxBpdh0j7l0NIC9j0P95ZXP48XXdGFfBkpSqIoJBv0sUVG0oqwpYEwodRdimQX31qD//OXPy2GwACNoaosGLcdBEocVki09sSc2bBHchPfm2iimcNNNNFMgJPr6cW6UYw4CSCty/LDlibPStAtyAy4gjaWF+/g1/7VT77mH7zkCsGOBNygRBCADMmzVcIdIcPlE8SuhQimMWWbP/rUt/il//I1Dh1HDND0hYSorOQGGQjjSLTAYklH0gRhJcqezUbQnhL0ng4InW2W5OyzLPK0wP28w+bRZtc5R7vdZnZ21gVBQJ7n+Gx/HdD67gHD4fBuD2brYGGSdNjqZ08l27i9679J20InNzEaqx2r0xt+XgGU9fmxGbEmnSV0I5ltnFAicKbyDniq94NSgjwv6HTaXHXVVW7Hjh3jzbvP7NfHyMu0/ef0+0OOHDlyx/Hjx++ESq1RJx2aLODFHf4619v21edbWZaEYTguAZmenubKK69009PTY8d7/xpP5vkssJSSKIp4/PHHeeyxx8RwONygJKkbBJ6KNNxy7RtJp62gKqcZgX5Zm19W1ICL8KacJz+LJtcD/72+NtU9SLxvwdVXX+2CIBgTknW1RL0LQlmW9Pt9yrJciqJoNkkStNYEQUCv1+PEiRN3LC8v3+nLCTwpcCYEq/+5P8YkSfa1Wq0PB0Gwt36N6/4Ok+ti7T29wz/W2iVjzCHn3JKUcq+Ucm+WZXemaXrncDgct3b090T1ZU75XBHi0i0TEFiEM1XmPheU1iJkgFOSnLJa7qWAomBOQ6eA503z0N/7nr17v++NL6BtllD5KkGnTT5IEVISJAk2L8hSQzK7iydTxWNZwj/9+d879NdP8qoy1gxTUanQpMGZk0GMqyk4PeIXNStA25AATTRR7Z+aIWiiidFTYsPXqf6mtgEtR5ucIAJjQUcIUdDr8/tHjz6+/zvfvI9yOKAlg0qyZgxqqsWJ448wPddBKKAYIoHpzhxOBjz+2OJzjmX291UrobQWRICwghBBgEZKRSGrJ5+yYtTt9mzO+8KB5/PFYT5d5zAJOEYb00QpdYPfoE4e12hTfbNSak9ZlvfUAcXkBvxUZMy5Oce6vd9mv3anfs24I4CrvUX1u43/8x03qr8zQmLESDpqLaYGzJ9Kn3DnLForb0z2n4UQP97tdgnDkCzLNgC0zdzIldJYa28siuJAvQ68rh5o4uKNevbdz7W6QsfPQSklnU6Hubk5NzU1taE+3YNf3xXCq0UAjh8/zuLi4p1ra2v3bWYSeDZrj58TGzRlApwQ46/6XNu4zp/8LNrsc72BoQf/HuROTU3tnZ+fX/RqJH9em8n06x4cUsqk0+kQRdGYVFldXWV1dfWmuvR/20aIm5Ts+GuilKLb7d4ehuFtQRDsm1RobKeMSgiROOeWrLVHgHREBiTW2sMj078DvoPLZOlP9d7ulOMrxKUsonVYf484jZYxQqrKE1ZY0BYlHJFwBBlcPc2//b43XPXW79r3XK7s5AR2BRVIcA6lNDiLdFAaRzg1x4lMsqZ28IFf/298+uvlFWtAbt2ohR8EOsSacht7ObfFjGmiiYYAaKKJJs4YPo3sm0sD0gAFSlfl+0ePcSBfeWL/G153A1m+RqAz5JxmuPAI07t2k6720aEmLy2g6c7Ns3s2YbV39BVfP1ocOJHlIGNwEUlp0RaMlRRO4oRad2w/a+KjIQDOlgCogxDn3H1KqeuiKLpuMxDvN9xKqX2jTemD1tq0ns3aDsh4NoDTyYz8Uz23igDQvhvDgjHmP4dh+OO+tdlWBn/+S+vAZ/z2Z1l2wEugGwfwZw4BUAf/k/eQB69RFLFjxw43Pz8/rt2vt/mrg2MvhV9dXeWxxx6bW1tbu8eXCpxLAuB8r0uTx+IJkXa7zdzc3OLc3NwGAmSz4/d1/3meI4QgjmPiOB6Pw8rKCktLS6LX6wGMDQEnyZJTAPQNa4F/jyiKiOP4xk6n8x+11nsnCYJTjfHk75xzR0ZKgEQptdc5lxZF8aE0Te8ctTI8aW2YfD5ufa0v3XXCCIUJY4yRIDRKa0xpKG0G0oJzJIFDF7An5gU3vfLy//iO73gZL7qyjSoWMHkP6wKkDACLDDSUJYXQZKqS/v+//+0TfPhPF0ShIbNV9l4GUdXmz5gG0jfRxNk8P5shaKKJMwf/YZWTr8z6XPXQy0swEgrgP927Jn77Dz9HsPO5FEmb1cUnSKYCKAsiGZKWFuJgJPM/wRXzOX/7O5/Pm18VusSCsDkUDmUVCl3VulmLsBJp9Tlxgb6gYzgByM6kV/SFPv66HLjWIus9eZ5vaBvoa4p9phmg0+m8v9PpPJAkyV4PWusS12d7bGUGtt0MYr22WylFr9f76iOPPLL72LFjW9Yd170FfPuzqakppqenPxxF0YbMZxPPDBKpTq55gs3Px1G/+Pd3u12iKDqJFPKt/rz8O89zTpw4wWOPPXZtr9dbqkvDn2qrv6cL6G/2Mw/4/bqjtWZmZuaW+fl512q1NvgjbLUuSynJsoyiKIiiiHa7DTD2+1heXn7VcDjcMK+eyhyur43eeyBJEjqdzoc7nc699ZacdXXO6d5/E7XUrBBi1lq7VBTFwSzL7k7TdMNavBnJsNVzqPEJ8RdQg9AUKHIjKBwIGRAoTeRAZdAq4NXf1vrK295wPVftCDGDRTDVPWMsoAPywQCkIisNMuyy5tp87HMP8av/9RExAErf/QKgzCqDmSaaaOKsolEANNHEGU8e3wXXAZYg0JhRLaeREVV1gOMznz924CXXze3fubuFs4vEyiAGFhF3KJXEikreT95HiIz5y+YI2iHLyyf2Lx63B0pjgRCtklHrwRIhNUJW8rmzY8EbBcBZ7X9qstSJbGTqnLsnDMPbJlvN1TfKI8Ayq5R6t1JqyTl3aDJjfSHP7+kmgJ7quQnBGLxprSnLksEg7RtT/nsp5f/mzczqvco3gr/1Fm9a6+uMMUmWZffVPQSauPgJAA/+J80clVJMT0+/f35+/vYkScYAbxLAecIgyzIWFhY4duyYWF1dXar7A9R9Bi6WubkVOPXf/fGPSK7bZmdn/2On00EIMW7/VyfG6qoZ3/LPm5gmSTJWT/T7fVZWVpYWFxd/wr9us/fYjoeMJ9vCMKTdbt84Mkq9cbPx3i4BUDv/JSnlntF9cjjP87uzLDvgu4ZMGoaefA72NGN+6QJRJwTOGBACMdoNSSmJgoBAGQJjiAvY9xzcO97wQl7/gsvo0MNkS0jlkHGE1C0kEldm2KwgnN/D40sFj/Rj/vn/dW94zGJNAIOqAyyhVlT7oWpOWtsYNTbRxBnvX5shaKKJs9p+jloCKsrcjDyZJBBQEtMnZgi878Cfib95rI/qXIGM5zG2MscJdESel1XNQBJgKQnEkFc/b4Z/8L0v4frLcDMUODJKYRGq8rvFlU+LS/FmzvebZXsu1ZjcjHqQWQHRwaE0Te/O83xD9qrmAzB2tI+iaLbdbt/V7XbvSpJkgznZZE3us2nsTwX+t3OOdeWF77iglGAwGBx7+OGHxcrKCsPh8KTN/uTnBkFAt9tldnb29m63u6/aXDZdNp5Jc9CTAXUvh06nc8vMzMztnU5n3AVicl7578PhkGPHjvHEE0+IXq839gmoA+LtSNAvhvHwigVjDEmSMD8//8Ds7OxdcRxvWIM2W0u8YqAoCnq93qEoipiamhq/nzGGwWDAE088MedLZurky1MZH69CiOOYTqdze6fTuTeKon0ARVEcrq+VZ9pGcPT3S0VRHBwOh2PDv/p6/VTWqiaqUM5CmaKlQUiHxYHU5HlOMchoW3j5Fbi/810v4Q0vupyoWCCUGVEU0DdQigikoNcboLtzqM48R5dyXHcPP/ZTH7n+yZIil7BWQAlILSlKQ6iqsscK+zcQpokmzngON0PQRBNny6A57KjTrEMhgmR9g+MkBQVCwgOffvi6G9/0kutsVtBtJZRZClKijEOjQAUYBNY62spy+ewUyjkWl1b3P7FiDhQYDHnlYiuqkoOz34+cnQLgwm+ILo4M+WY1tCPZ6j1CiFQpdeNmwHOy9l0ptU8pdYOU8kEp5ZE6CL0UCZfTZxDXndytdQixXoecZQXGlP/eWvu/1Z3O6/3dQWwAFyNn89ustUfyPD/UkFwX//3hwX5djTPKWM/Ozc090G63qRM6/nr7fxtj6Pf7nDhx4vDi4uJclmXjv9ssu11XklzotWcr2boHza1Wi+np6Yemp6ev89n7SRf9ybXLdyrJsowwDPf4zL9zjjRNWVtbY2lpSQyHww2O+fWyCz9+p4tRe7/ZVqv1i1EU3V7vVDB6j2SSnBg/e7fnMZCMwP+HfObfmxX612/lP1I3Adz6ml66hIByJRGQaENWOJwTqCDEFj3aOF56Oe7vftcL+K6XPYeruuCyJXQgsVozKB1WKrK1PtOzc2SFYCELGES7+Gc/+zs8uMQ/HgBDB4iAOGnjTNWVQUqFdbIiHBprvyaaOEv80kQTTZwRdLaiqvWvNgISLSIoXGUKKBxIiw00vQK+eYxbf+bn/5BUXUXfdVHtGUyaE7VbEAXkaYYQikArdJkzK4e888aX8toXxOyMIRA51oERoLRAqWf+5uOZ7gEw6Ro/uREfDodkWXanMebwZP25r08GKIpiXGs8Mr96oNPp3DU5DvXPeDaA01MpGrZz/f24K6UIAj1WXwAkScTS0sqx5eVlMRgM8G7fkzJfbxRnrSWOY+bn55mZmbnrUvBgeDbcP5P3g1LK16vf2263x3L3es27tXasoMqyjMXFxUMnTpy4Nk1TwjDEt/HcLENcVwRcLOvn5M88GJ+fn3dTU1N7fTvSyRr9SfDr17SyLCmK4tD8/DzAeCzKsuTEiROi1+sRRRFBEGzwUPCqie2aAHY6ndvb7fa9cRzfNnr/w0VRHBqVLcz69/bXq+63crr5Weuocrgsy/uKotigAPHzfrN1+2K5vhf1sxtHACgL1hQgLGHgiLE8Z4q//4YX7+K7XvY8Ztwa5Ku0IkVWpORFURlJIui0E7I0p2cTivbl/OJv/zGfehQxBIYAQiPDkHQ4pDQl7Vab0tiq/LGJJpo4yzncRBNNnPnsGc0gYUGigWDUZ9aCMKAMWIey0AI6wG3f/xz3z257K2bpK8zpPlCSW0UYx5CmoBWs9aE9TWYUT6YR//pDf8p/+ThiOYB+BjhJu9NhOOiNN6n1fs+TWa6tN9BmW6Dr2St9PP8bCSEESZLQ7XYfiqJob93QarN65DooHhlW3TkcDg/5coF6hso74E/WQW/WRvDZGae+v307wCAIuOyyy9zu3buJ43gMWoRQeJ8A3zNea83q6ipHjx7liSeeEB4o+MyhzyYXRbGhnVwTFxYEe9AWBAGzs7Mfnpubu8UDPX9d/XXzdfG9Xo/jx4/fubCwcIc3yvNzaztt5p6Oc9uM5KgD1roCwv/39PT0LXNzcx+udzzY7HtZliRJMm6BaK1l5H2wtHv37r1QqSmEEKytrXH06NH3LC4u3u3NM7ci8CZVAHXSLQgCoiiaDcPwtjiO33+68z8dAVRXf4zWvcNSyr2jsVkaDAa39nq9+/I8BzipXGE768vWxyEv6vXvfD7/FAXhqOrRJW36WY4qC66I4LtfnLh/+s7v4MpowPSUAJMzzAeIMMJJgTMZWipCpVkeKrLZ5/E7f/7X/Nyvf06sATZQ5EVNmTI+T980UzBKwZyDMWiiiUszmhRHE02cDQGgNj6M5bhbs38wOeJ2RJG7UR90+Nbhlf8r7hQ/86p9L6FYPU7Y0qQmJUv7RK0Y1nowtQPSHN0NKYse1zxnN73Bk/sfepgDItTkpaAoDGEY4CVwXuY86Zp86nDb2mw9e4Hk+T2vic36EaXULfVN8emM77TW1402sw8CRza7JlsZWT27r9vJ9+9m4VUV1loGg8GBoiheHgTBC6MoGmUsK/DvCQEPgpRSdDodrLX7B4PBgSzLUEoRhuFYSeABUBMX8OrXgLoH/9PT07dPT0+/NwzDcVs/350DII5jnHOsrq5y4sSJO3q93gFviFeXtF8s5AZwklN9HWT7khdPSM3Nzb1/dnb2F71x4VYt/vxre73eSEETsLa2hhAimZubmw2CYPz6NE1ZXFw8vLa29sM+278Z+J9ck+rj6UmXJEn2JUlyVxRFt52tAmyLUqpZ59yScy4dDofvKYriHp/5r4/HdkwKL/4SgLO9T8XZvdY5giSiN0hJtKUL7LtGuNu+5/U8f04y07YUK8cRYYiKI3JTIm1BZFICpchKzSpd/uKrJ/g//91nRD+EvogwRiLCCEyOwoz2TmJUajnZprFZg5tooiEAmmjiad2dSRCqSv8LXwRgEbgREeBQ2pGnhiRpUZYGiWNosJ/73NEDL3zxZfuff+3lFIMF4rAkDgzYEnIL0RQgKUyPVkuze36Wualpjj7x5P4nnrAHZNghNxIloSzzseSyvjHbXhuz7QHFhgA4+w28tfbBEQlw81Yu2ZvVoyql9mqtbxn1w77fOZdOgvzNMm2XhmHV6Z3APQjJ85IsS39HSvkjYRhOVwCesRS87vTugWMUReR5ft1wODxYz7ICTZeAiyTqdeftdnt2fn7+Xt+uzs8Lbwzos79ra2scP378ppWVlQ/VM8N1sH2xXN/JeV5f1+sgfER+3DY3N/f+Vqu1AezWCcL6a+uqgeFwSJqmh9rt9p6pqSmstWitKYqC5eVljh8/PjccDtFajw0BJ9eqSUKyLtmP45hWq3Vbq9X6j2EYXuc9CM7F+DjnloDEj40x5sGiKA6ura19sK6cmlwXGwJAnMUnK0rVYpiVBBoSZ3nl1bh3v/WVfMfz55kRawiTYmyJDWMyWxm0JqFCpqtQONbkNN9aC7nt5/5c9AQsWwkiRra6uHSAoqyBFIdD0mT/m2jiHD07myFooomzePZaBXYkGxX+cbz+YDKj9jVpOsAATkZkwEIJP/9LHz36ma+vULZ2UzoglGBSiDUuH0KgyYsCpRxmcIKXPneWv3vTy3npZbgwXyVRApzZsMktimIDmNkOQG36HJ+/qEv9syxjMBjcnef53ZMZ+q2yjsaYpdHmfjZJkts6nc4DSZLsm5SeT5qUTQKFSzXq5m9hWI3Z4uLi1UePHv3iysrKBgBS7yPvW6CFYchll112y2WXXfaA7xHvlQBPRxeOJrZHsGmtabfbdLvdh+I43kAK1Dpt4JxjYWGBJ598cm51dfU+TxL4OerLqOqk2oUG/5N+FZNrs7WWKIrYvXv34q5du+4KgmBcrnIqAsP7ZXS7Xe+DcGscx/va7fZYLeENEldWVm5K05T6eJ3Kob9+bEopkiSh0+nc1Wq17gqCYNY/r87V9a//t7V2Kc/zu4fD4R15nm+4ppOEShNnBx+EDME5wtJw1TQ/9re/fS9vftmVBMUJhB1Qpj3CqS65M2RlAUJRZiUQQTjHNxYcP7b/T24ihJ4DwjaoANsfVAmW+rN0/P+m+i4a8N9EE2cTjQKgiSbOfPtRTSE3ejCJ9Z9WVWsShyUIFFBt5IwzOEAqOL7ML3zj8Df2v/61r6SrU3S+hlAaZCV/K/KUuNUiG1Y1zMo69sx2aUWKL3918f5enh82wqDDeJyRqcsc/Sbw9CzG1puqU/3s2XMNz+8Gvl6XP7o+9yul9vk61UlTv4mygLEL9sj4anZURrAkpTzkAUL92td7e18aLNypCRivjqlLpfM8/5Usy77ebnfe6UG/MeYkh3BjDK1WiyAI9mRZdmQ4HB6qkTMNiLgICDYpJUmSzE5PTw87nU5Sz9z7+eeJoNXVVRYWFkSv10u958PkOvdUes0/LTCrBrLr5V3eRDRJEubm5tzc3FwSRdH499tZt6WU5HnO2traIa31DXNzc3s8geDLAxYXF+9eWVn5oK/7n8zsb2Wc570XkiTZ2263PxxF0S31ErXtSfC3TQQk/hjyPP/gcDi8M03TTVup1q/zdteXRgGw+StFWTIdFMzjeOcb5z/zA298ITvUGt3AgjMIpRBRxDDtEycxRWFY6RXocJ6vLSp+6v/5JF9a5odXDKhYUeQlKA0mJ4lCTFngRue4/v+jr2bpbaKJhgBoookLBR7FqOZfYKvnkvBKADeeYtZWpQDWARKUVmSlQEnHk8c5sLr06P43vfp6OpHElENkpEBITFkCEiEUyhkwOe1IsGvXLI783V//xtqBlbLqkbuZO7Kv1dzuBuJUm6KGADhzAmCy7hRIhRAPCiFmhRB7PMjfrDe5B63W2iXnXDICskkQBDdHUbS/LMsD1K7/5Ga88QCwBEElWfZO8N70bzAYfKksTaKUuiFJkg3y/kkTzREIu9kYc89wODxSN4xr4sLGqE/9J6enp/eEYTieC17J4UHxwsLC0okTJ1pZlm2qvPFrp78PLgaCZ9LfY3Kdn56evn1+fv6TMzMzYyNY/7vN5PWTNfZSSh5//PGbpJR7L7/88hu9ssWbix47duzgysrKD2dZtkH678emTrTUx3HUTpPp6el74zjeH4bhdZPtFP1z6mw8AOokgrX2cJ7nd6dpekeappRlOSZftxqHhgA48+PX1qBtzg4cb//2Kfd3/9bL+bYdkqhYQeJw1iJ0SJGnOEqSJCYrJbK1k0dWYv71f/oY9x52YplqX2SNq1obmxyoTFfdKJEyNmP0R9yA/yaaaAiAJpq4cNDRoQCNAAJAV0+mqiXA6OGsiOKEosgJY0mcSNLMEEVtssKSBIJvPJQe2Dkd7L/qyl20ZB8p+mBKUAH9oSOJWpTZCjqwGFKiRHPVZfP0+sf2P3SsPLBWivGGLAiCcQZoe23MGg+A872Bn8zsjzbxR4BDWusbgXT0++QUNaoblAD+Syn1bqVUMvIG2AASnt3XbXsbYCHYQIh5UsX/u98f3GeMuV9K+W7f/m0yw+mlylEUoZS6rSiKA0VRbJCZN3FhotVqMTU1de/09PQN3uxvElSWZekN/1r9fn8D+Kw76E8Cy3OZoT7bNaR+TL7cYWpq6q7Z2dnb2+32GJjXWx36taI+HpMeAL1eD2PMkenp6du63e54/cjznKWlJRYXF1/iy8r8e9XVBZOeJbWs/74kSfYnSXKLUiqZHNPNjucs19iloig+NBwO70jTdPw8rHujPDXg3xAAp4vQllylCd70bYG57Qdez0uuDAiy46hIkg5LSqGRUmFdQRIYTJlTqC6PD1r85p9+nd/89AnR6+zAWI3FoZwhHu2i5CiFYkf/8ll/1RAATTRxzqJJYTTRxFmFz7Ko0YPKrn8XILQiS1OiJKYoUvKsenhZa3EoVgpDC/iX/+FLYudc173zzc9l9fgX6c5oyrKg3Z5iOFglaSeQr2FKQ5TEzCWWd73jtXzxiY87+4QRx1ZBSoUSmqJIcRi0lpT+8JyceOSXzaV7mjbvfjPqs4vGGEbGY4eTJFka/d3s5EbTOTeWpNdbV9Vrz1ut1t4gCN4vpdwLvMdnvhoPhyqCIBjXgHvgn2WV6VsYBlgLKysr95VlKYwxbm5uDq31SQDKv35UL+2MMWI4HDZjfOEJgPdPTU3dmCTJuITDzxWfyV5cXGRhYUH4Tg6TWfR6uUcdOF4MJoAe0Pt70DvpT01NLXa73dlOp0OWZWPJvle6eKKr3iVhs2z9iRMnxLXXXuviOKbX6xHHVTnZ8ePHWVhYEGmajjsE1FUR9TGrA2ulFFEU7W21Wh+O43hvvVyh7mHg3+tc+Sw455bKsrwvy7Jxm0df9rFZlwJPdFzaPilyZKq3vi8Q9X2Bkzix/jeCEkGJxKEctCxcfxX5P3r763nJlR1EegSXDxBWEs/sIO3niDBClA6UZDh0rMmI+z79N/zan3xDrJJghhZ05fZvXbV7UqPdiVSaxmaliSbO4/60GYImmjgXE8g/KCfMacbA25708EUA2oKBaQs7Bfy///r73EueK4jDBYrhCUIjCZyDsoSkBbkjLxy62+GJVfjyw44P/sdP8VffRPRdSF5aIh1hxZC0sBBWxyWcrmoTkChhkaQIAcY5cHLbcstJkLqdTcap3uvpBOLnlwA6s1BKMTU19WPtdvuX6pv8yc3/1uexXh+c5zmDweA9g8Hg7izLxi7ePjPoP6/eKeJcjetW73ehAfLpNvh1UiUMQ3bt2uUuv/xywjAkTdNxuUDdSyDPc44fP86xY8eENwWsqwbqfckbhcDZX786iPXt3OI4pt1u37hr1657/X1dV3p4MLqwsLC0srIy1+v1xqCwXh5z4a+P3dJvwN9HFTFhkVLQ6XSYnZ113W53BMpPvab6e9urI4qiIEkS8jznkUceEddcc43z4+LXipWVFY4fP37tysrK4Tpon6zdr77Ws/pRFNFut386juOfPRMfki1MUB+VUl410d720VH5VEdKSZqmv97r9f5hlmUnlW2cbv1xTpyT9e9Mf+/c2SJc+ZTHdPw7JEZWrvrCSpQzaFKU8A2MFeguaW5BOiJtcPkAbWFnC54/jfvZv/9aXnS5ZnoqApdi0xWkEpB0GKwOMSpGBzHWwtAlfPLLR/n//eLnxCPAgMQbCYA1Y7H/+NpvOD+7Yb/VrKpNNHH20ZQANNHEOQnflsZt8nO3+d8LB5EC63AWpIBPf/qre65/+fP37Zxvkw9XSLRBYsEoGBqQAUprhvmAdjtmppMw1Qr4xkMLb+31zK9KFTA0JUEc4ESJxVXtCZ1COIVAIkcGOtXmTTxloPbUQN3FwTGePyB69lsR59xfAUZr/ZY6YJ3MQG5+DmIDWNBa36yU2iOEuMeTAvUNfh3MnutxOZMa3gsdPmPsJdR5nh+w1u4PgoAkScbyf38dPIEyOr+b8zy/22eO6204Lw3/hadhVd3EIDMIAtrt9r5ut/tJrTVRFCGlHGe+vYndysoKq6urLS8Jn/R1uBgy/EJsnI91VYIQoqZeUXS73V3z8/O9mZkZpJRUioZTizi9cZ9XBcVxzOrqKsvLywdnZ2c/nCTJhvu61+tx9OjRa9fW1g5P+iEA43XEkzFQKWNarVbQarX+/3Ec/9RWdfdnSABN+2tmre0BuZRypxAiHK1vH8nz/IN5nj/m5+pmXirn6/l09ud54ST8IHAjp33hHIoSiUWKamvihCYtHZ2pqZfm6fCYKVJ2dgVB5nj+PIs/8s7XJG96yU66YYYtBoiR4tHhEFIhhUJHLTKrWcpCHlqC/+ODn/yZozmfWAOsDMBl4AybWPydZv/URBNNNARAE008k6MQxIGktI7CwVrKPV/84td+9Du+/SWdPfMzlL0llC0R7Xls5iicQSUhtsgIpCIINLt3zDMXm6sef2TlRx7vmX9tohaZMVhnKmcCn+V3Cu1M1UVXKCxq/IB9OgmAC7HpvpgJgFFW8xNBEHyn1voaPz71FnZbHb+U67XMvv42CIJ9Sqn3SimXiqI4NJmlf2p9sLcH0M7UxOtCX/d6zbQxhizLyLLsgJRyfxAEG0D9pMlZFEV78jxPi6K4vyzLMXird2Ro4tyRAD6rH8cx3W73y51OJ6l32fD3tjGG1dXVpYWFhdZwONxgjFd3qr84PBw2zp/JbLsxjlYrYX5+/mOzs7O/1Gq1xvdV9benv8fqKoqRH8Ih59zSzp07r6vL+QeDAcePH79jcXHxHq8e2myO1yOOI1qt1gva7fa9SZK8o37PnwuFRe2aPeqcOyKlvKq2nvV6vd6r8jx/xBt8Tq5F5xdAP7MJAIFAOIl0DilShLBIV8ECR4gVCqcgM4NjUkoCl6NSxwt38sDfuenb9t78Hdeh3QAtDCYfoDAgq3tMCoXUIVmaYXSHb64G/Itf+SifP8Z3rQFRpDBl3oD7JppoCIAmmrj0QgAhCmkshQSCSqW/uMIvHH/sK/tf84pXMNdtMej1CIVGaI2xJUoJtJDYMqfMB7RDzQuvvpI0XZ3+2mP9Px6Y4rHcOhCCcFSvJ1xVoCBdVennpMIKQBjE00QAXMjN9sVKANSd54UQfymEeKkQYofPcG117Os1t3qcoavLz6WUSRAENyulUufc/b4ftlcDnOvxuNhap233uvuacJ+x9wCyKIoDw+EwabfbN3jgaW3lTO1Jg5Gs+kbn3JGiKA7VAUgD/s/d9fPki5TSS//varVaN3jDRl8WoLWmLEsWFhbuXFxc3NC3vt4d5XyoX86c3LAneXzU6+a73Q6zs7OPzM7OXu+7GdRLHE431byJpVcBLCwsHAzD8MZdu3Zd58dVKcVwOOTJJ5+8dXFx8W5PPvo1xbdRBDZ00kiShKmp7n+N4/j9YRheVS+DOVcEgF8fnXOrUso9UspwVMrwkSzL7hwMBl+olzg9dfLxwhIAztmzev+zG16BcAKJRWHGYnuBxqCxQoESuHxIEglia5izcMt3XnPX3/vuV9JhmTwfEMUajUVoAWGIQiJQFFZSiBZHBgEf/J37+NMvG9HTUKAQzuBcA/+baKIhAJpo4hKdfC1CDCWlgHhaMkgdUQzffJgDK8ce3//Kl72MOArJsmW0NugopEyz8aY2JEcrh0oNV175HCz2H33tG0sHMuEwMgAMUoC2DonBSImRAidKhDQI99Q3w2dCAFx4qe3FqwDwGbqiKBacc78VBMEtWuvdW7mQb8zgn+xeXn9frfWNUso9wD1+w38+rsWkeeH5H/dzRwB4UF+XN+d5TpZl90kp3+ucS4IgGGcj6wBnZLx2c1mWH0rTdMm/jwcuTRnA2QLkdfAfRRGtVuv2drt9uwek9ax+nuesrKzcubS0dIdvW7eZu3+dqLrw9+fG7iBlWZWRjZz02bNnj0uSZNqvEXUlQ6U6Uae9vz1AHhmEHpment7b7XbHxoFpmnLixImDCwsLB7wXhp8XdTDt72dfgtHpdD6ZJPHrpZThZvP+XKwztbk27T+nLMuPp2n6E8Ph8GOe/JkkIbe//lzcCoDze/yjUkAs2lXZf+nACYGRilJKnLGEUQCDjN0h/OBbdrgffMtLuKZboItVwnYEo1IVLQW4EooChCazEct6F//+dz/Jf/rEmigSSAtdtTi2FiGpWiM30UQTDQHQRBOXUkhAIVBocgxF7kBDVlQP4m88kh4waW//9S99EfPzEelwgUAKpLWVuaAY+Q4YhygFU50ZLt+5C+d6+x8+svafV3pmQahKVSBdtVewwmGFQ1BUrxXVL84XAbDVHvDpblN3sRIAflNfMzizQRDs0Fq/ZbOWgJPnYYzd0GGgnjH1WbEwDPclSbI/CILEWnufB7znYkxOpU54JmTB6wDTg3Y/Nkop1tbW7jTGPKiUuiUIgrF6wo+v9w+w1r43z/MDky70DQFwduEJlSiKSJLkllardZd3qq+b0aVpysLCglhaWrrPm955Mmdz87qL47pIKUbz2GAtSAlJkjAzM/Nrs7OzH0mSBE8+Tbr5V+chTzt+o/uYsizZsWPH3iiKyLKMOI4xxnD8+PHDJ06ceGPdLLBe0uJVB0qpcfvBVqt1VxAEs87ZDaVFk0qGsx1na23Pq6FGx/XxNE3vSNP0C6NOKhvWnMnre6EJgNOTIBeSAACHqNoZu8rGGMBKKJSsTImcI6Fgh3Lc9PLQ/cO//WpedFmAWzmCVA6nFFlZAI5AKUiHmNwikzmyaBe//gef5d//98fEKpCqqNr1uEqd2BikNtFEQwA00cSlu8FFUuKI42RsYhV1JMNMoHXA57964kAn0fuv2BOTBBmyHCCVA6KqV46xFY6fvgyTZexsab7tOZezvHTsx48vZL/XMxzLRfUstwKMdCBslXmqbSIulAfApU4AbLFp/IQQwkgpX+OzXlsdf7WXElsSBPWWZkqpG4QQiRDivu1tTs9snP3neRnxxU4A1HuST5r95XlOWZYPFkVxD3Cbb7XmwVU9KwvcbK29e1KS3MTZ3U9JktDpdO5KkuT9dTAMlSR9MBiwurp6ba/XW5qs99+MaLy4rsn6MQaBpt1uMzMz88j09PSb2u32uJWh9wPx95b3oTjdFC6Kwpe0EEUR09PT1M1BFxYWWFxcnBsOh2Myy2fV/Tj71oOtVmtvt9t9oNVq3bhuoOhO6ftxDsZ6DP6LovjIcDj84eFw+FVv+HcqcvTZ4AFwPgkAh8QKCUi0EwhXGRM7BUZIEJZYOGZFydteMeX+3k0v5brLBFG5iECAsxTCorQgDgNQCkqDjGY4kSf8yeef4Od+40tiwYFLWpjcgCmJWhGmtCD1KEPQEAFNNHEhoilUbKKJC7b1k5SADiOydFhJ6CxkPYtuT7NcKlaBX/jQIfF7f/J5cjWHCWKMA6SCKIEghiCBMkW3FNhlrpgt+Qff+0re+AK+2DYQOjASSolv9osbfV0IwNXEengwCYzrbIfDIYPB4OfKsrxvu6/3PdA94K6B/rG5nbWWdrt9+/T09GKr1dp3LjP0daBVJwAu+gfghGrCAyuAPM/HnQCWl5cPLSwszK2trY3roOvu7aOs7b5Op3OXr4VufADOPrTWxHF8W7vdvi2O47Gywo97nucsLi6K5eXlw97l3v/cS9j9vbhZFv1iIKA82G61WsHMzIybnp6+Ko5jpJQkSYJzjsFggG856RUQ9Qz4VmGModfrLY2ME/G+CO12m7W1NZ588slxK0tgw5jV22N2u93bp6amHorjeG99vtfHte6RMbm2nQ3AHl2zXlEUB9M0PZbn+djz4VTXsSHftnMDCiwCI6CUEiPBIlCuJLYFrbzg+itw3/eGF/K6F+4hLPu4tA9JCAK0dGgsLhuSraxRuJiyfTn3f22JOz74GbFgwYUtitSMVIuWbDAAB/IZ8HxooolnczQrZBNNXDj4ASgQDuFKJKNGggIQQfXAdIauKJl2cOCfPNe94y3PIcxP0NHTowI6gykzVLsLpcX0hqipOSgDPvPgUf7Vb3+WLx7j9d9Y4lNOQieRFIUlK0AojcQi3LnfLK1vzC4+ELTxXO0FJTpOl7XatWvXF4IguN73o6/L9yuAKbf1+ZOdAPzX4uKiKIpiDGq9FB7WHfLrct56K7W6m3q9XZg3a4uiaJ8QYjbP8/vqJoT119f7hU8aCV4sNfR+rLTWJEnC9PS0m56eptVq4cGIP/Ysy1haWrpvaWnppjRNN8jQJwmHaqzOxRryzI2623zdYNGDyrm5ubuiKLrN16X7+zHLMobD4cHjx4/fetFvsjYpy/HAOU1TkiRienr6A9PT0+9LkuSke+ZUc9sYNy5LqbfBK8uSNE3p9/sHd+zYcUuSJOR5Pu4Usry8zGOPPSayLBuThvXSFX+vdrvdfVEU3R7H8S2b3cvWlpse1+mOfTMVWN03YF0VETAcDj/e7/dvStO0OFeKoov5+XS650R9jM5ufZRAiBVgzRCwBDrClimBhfkArunyB//8H7zie77zuisIhgtErkQHgJI4V2IxKC0oBym6u5O+2MFH/+pR/s//8FfXPjrk8ACoehHV0YYBZ6t/N/mAJpq4YNGUADTRxIXk30ZSu0oPAAKJQ1dPRlHJ9QscSQyf/+LyPXuviW+76oorCKWit7pCGGtQDlcOELJEtis1gBmssmtuhisum+f48aP/6PiyO2AkZANHaSBKZilLicQhOJ9A6+LjGDee68VlTrjJdfg9YIdS6hX1jPJ6e7rTv/9W7vwjE7sblFKplPLBOjHgwf5mwHUrx+36a0c/OxLH8e1SykQI8aAHvfVMu3+vzQDPxQL+6yUCI+Lig86524wxSRiG47Hx46SU2mutTfM8v9+fXx3wemKjAlT2WTe/ntIGZJTJ9v3qPZEUBAHT09O3t1qt2+uS/5EUnF6vd8fq6upPTI7vxRaTHhNelePvhW63Tbfb/bWpqal/nCTJhqz5Zvf/5BzROhirf+o1+3meUxQF09PT1/m/DcMQgOXlZU6cOHFTmqaH634XdfBfOfxP3d5qtT4chuF1de+LiSM6b+ufc66XpulvZVl2Z5Zlj9TVBecGAD9z5s9W53l25y/AWpRWGFWlH6yBwFkuC+GaLh/7x//Tc2569bUztF0PYXKisIVDktsMg8FZixASlUxzYqD59Df7/NQv/uVV38p4uE9V4jgmWcT4wqFw4ybETTTRREMANNHEJYb/RyZ+IzfekagSgURgwBmqHn4wKGGQc+RLXzxx5DWvfvHN7VjQboEphwQtidCGwhVYLbEStFToKOSanfN0Ak2vt7x/YdEc6BdQEmNNC5xEyhKBaQiAi2hjV/9ZWZZ94A+llN+hlLrGg811ULq995/MrNVqe/cGQXCLUuo6KeUh59zS5CZ7UhVQJwhOFSNQt0drfUMQBDdLKY84547UM4ybZf6fboPI00Vd4VCWJWVZpmVZ3pnn+f1BELzb12j7Yx61p7vRWnt/mqaHJ8erTgBYa5518+up3v+TSpKRHH5vt9v9777mHyo5e5qmS71e74d7vd7dw+Hwoi+z8IqYupLGS/6jKGLXrp2u2+2+ot1ujw346uNxOiWREHJDBt+7/RdFgZSSTqezAeD3ej2OHTt27erq6qFJgtDfk0mS0O127+12u7fVx38zgq4+Rc/EZ6FOKkx0HHjUGHN/r9d7V5Zlj9XB/7n1c7h0CQCBQZqSQEsKI0BpwjggLnKu34n74Zsuv+Ztr7ySPV1weV7V7AcxQ1OpdKJAo6whdwGrbo6/WVT8rwf+VDxRspoCqGB0bUd1h+OMvyEc0QKNA0ATTTQEQBNNXKIkwAaoAUgUbpSZdzggagvKsvL8E5ZDn/jY177+1htf+s5uRyMwFFmfIA4QkWBtOCAIQ1SSUK6uIU3BNZfvJIlCjh0/tv/oMgcKp1FOoqQAChANAXCxbu5Gm2ML/OWIBNi9EUjK04LXOpjfuHkX9Zr967TW7x4BhfuNMad0sZ9UCEx6AHggY4w5JKU8EkXR7WEY3ialXHLOHfJZy7rR2MVYs1vP7tcJihEZcLgsy/uBd9dbzvkxiKLo3cPh8EC93MGPzTrR4Z518+uphHPOEyZjsDw1NXVLp9P5ZH08nXMMh8NDI7O/B30Lu2dC1CX6NXXDbfPz8w90ux2iKBqfy1P1JzDGbjDcHAwG+NKTTqeDtZYoihBCsLy8zPHjx6/t9/uH/bh60gCo1/p/Mo7jvZPKlzqRtT4n3JaAfDvzeTMDQWttL8/zD+Z5/sE0TRe8ash/dp0EfTY+n54uAkA5g3LgRInTERJLmA94/g7+7Q++6bLX/OBbXkY8PE6gLBIJOqSQVQs/JaAoLVq3GMgun3+i5Cfu/JMfejzjS31AaFntYjYQAFXCQ43UjlUBYxNNNHFRwI8mmmji6X6wjyCA01R8XIHCokaoz1BZAahYYVJDZGEKeOnVuH/1U9/N9VfGDFceRiaCpKsps1VMYdByGlUolFNQagZpwB/+1cP8m//2jd4XH6Ub6YhhaSmVwwjbeACcB2BzLjZ5/mdKKZIkeUG73b43iqKr1gkAdcrPPxlwbl0W4LOxeZ4fGgwGt6Zpetg7gtezkqdTFdSBjHPOu7i/P0mS2wGGw+Gd/X7/jjRNJ/wMOAkEXfg+7eKU9cyj68LU1NTi1NTUrAdb/jWLi4ssLy/Pra2tLfm/r4CbGb3+bM/vme0B4MfEX/NWq8XMzIyLomhMCIzq2e8eDAbvGQ6HY7l7EARMusFfjARSvVtEHMdMTU09MDMzs6/dbuOc2XDPb1ZOc6r1xJiKQLHW0u/3x+C/3W4Tx/H4dWtraxw9evTatbW1w36+1dUJQRDQarXe3+l0bg/DcEMrwHrZymQpkBAn1/2fygtgszWjPs9G4P/u4XD4z30ZwyRRcCZEyTPp+XS6Z8O58gAQlCQK8hySOKIcZswJ+JG3X+F+5Htewk63QlBkIKBwAoKQTFRlAqEIWRsUyPYO/uZYzk/9yr355x4nGgogUJSFqTY2olYC4Er06F+GsfaxiSaauEDRKACaaOICM3CithFRE5y4589t6cBJQt0iswXHVjhw9Ilv7H/l8/dy2dwcBJr+YIVWJFEC8tQQhTEIBdmAIBbs2rUTdBCeOLbw3sUVc6fFYqXFntfsa6MAOBsSwGdGR4BxQQjxFSnl26WUYQWan1r7xsn+2HWCwGcElVJ7lFLvDoJgL3DPVhvuSZO+zTL5tQ37fUKIPVrrfSPfgT1SyvvLskzrBMPkcV4MUQdAPovvx0RKSZZlZFl2J3CD1npvvWZ95Ep/e1EUB3yte72k4uxP85lfAuCBZrfb3dvtdh9QSs2ueyQ4er3eHSsrK3d4B/s6iXKxO717IA3Q6XTYuXOn27Fjx54kScbXfxJgb+YDsFWfe6UqH43hcEiWZQRBwNTUFHEcY60lSRKWlpZ48skn54bD4RH/uroXR7vd3jc9Pf1Eu92+Yb2938mfWb9v19eM7RGZ2yHZjDFfzPP87jRNfzrLsg2mhueCYH0mz5/z4wEAuXWEAkRuuDJk9ta3zA9/4M0v5aoumOEyQRhjywKLIwg1Jk+xxtBqdSiDaT7zrR6/9Dt/xme+ic4DyC1YJ5CBxlk7Gl+DcFVSYz2xoWvwo6EBmmiiIQCaaOISJQE0Fj2yzAHPkEvCoIMxgkTHYEuszREaBhYeO8KBoL+w/6r5GeZnO5R5HykKgkCjjUM4hykBHWCcIWkFXHN5l0QPk+MLvf2rAw5kDkxDADwjNnsjoPAN59yfSynfqpSa3u74btWreyslgFIqCYJgn1LqZq31rJTy/skWanWJ9mYZKg/WfHcA59w9SqkbgiDYOyICblFKPSiEOFzvKnAxgbp6lm3yHOtjN+q1/iFjTCqEuNFnSr08W0q5vyzLA77Nmh/LS50A8JL4drs92+12vxxF0Z56l4h+v3/nYDA4kKYpdQXFxeYTcar7J4oipqam9s3Pzz8xMzNDFEXje8Yf/mSpyanm7sb7UZCmKVmWeTA/boVorWUwGHD8+PE7VlZW7qvPx5H/B91u95ZOp3Nvq9XaUA7g41QeC9Uxb75uPVUPAGPMF7Msu3M4HP5yvTPB5PtsYjTaEABnem+iMFYQKctz27z9+9/Q/dw/fNur2DurGK6t0mp3SU1J4QpCLZDC4tIcLRXWCR480ufffOSzfPwrpSgdlBZ0rDAqxpVA0oIiQzkIYNzlqBx1H6jUAd4HqYkmmmgIgCaauMTQvxg9HEUNko6gEMZWrgDSVpI9h8MIcK6NEIpvfHPtgCtW91/73CvZtXMakw2gGKKisHoXFVA4iwokzhUkouC5V15GK4KHvrl8w8qADznhKn8eMfLmFSBwI3WCRYyO0AlRpayEQwg7qukTpz/BhgA442Osm/B5Ezrn3GNKqVxr/T1Sqm0B2M0AxGbS/skuAFEU7QmC4EYp5c3W2oPGmLSeDT+diZ+XGvtsrdY60VrfPMqkz8Zx/G4hxB5jzD3+fS8mULdZ5rM+ZmVZEkURSimGwyHD4fB+IcSDURTdEgQBRVEQRZGXq+/J8/weLwmvJNiXhonZVmGMYXp6et/09PRDSqmk3t99MBjcubi4eMekw70nUcIw5GLvAqC1ZnZ29q7du3ffNTs7O67V92SGtWZDTbsnPia7b2xG3AkhyPOCPM+ByrnfkwteafKtb33r2uFwOJ5b9Xr/drt9y8zMzId9dwD/u8mOAPV5XT+uSj1kTwvut7POlWX5h1mW3ZmmqfWZ/7o/yCSxWF+vLmUCACnGe4jRD6pzcgrvKSSolIVy1FnICYeRlSNfNxIkmeXvvKH9lffc/FquSDLCskcyNc1gmKEijQ4U2hRQ5AgRoDo7+MrxjP/4J5/nvz2QiaXRJWi1JL3UgjXQmoI0BWfwRwJe9j/SAgjbEABNNHFh4UcTTTRxsU1Et+GBLhHY8YPSdwsAQYSkRcbfe2PX/e8/+jZmg6NEagViRZn1MU7g0EgR4IxElxKlYp589AT/40vHuPPgifc8WXL3Uga5CJBRm7LMoRgSaZDOYYWgJMYIgROAKFAU1TE7UZkUbAI8txdnW4NpT7lZ2u5xnDnolFsC73MRk+ZxHkiHYUgURXtnZ2cfmsxQb+ez1//m1Fn3erbaGEOWZR8ZDAa3DofDIs8LtA5OWbM/+e+Ry/i+brf7QJIkZFnmZdKH0zS9o9frHUzT1JMPpGl6kux+svTgQoYnaOrgzTupJ0ly186dO2/zf1uWJWtra4cXFxev9edYv74eENfl4Gd/H53vzfWp568niSaBuj+vdrtNu93+cLvdvkUp5e+xpV6v96rBYHD49H3fz+/5VSZ769d3koioS/Yrkz+HUnIMXq+++moXxzH1DHudQKqD/c3KbOqvqX+WJ9VWVlbGBJQH9lpr+v0+i4uLHzl27Nj3+/vLmxCOFAkf6HQ676uXG2y1/pxqbdvOmlO/pyeIjl4Yxp3BYHDf2traTX4tqJucnn79ehbuBbaxtjnncALMyARWW4two3p7p7AEozHMCLEEMkcqRw6kFtCaKHRMrRn+yfdc7v7nN34b10yVIPqAoSDCBhF5ntPtJri1E+R5jprayddWFL/5iSf45Y8cFimQsy7td+PNjK5+4uw4wbFOAHhfAPs0rVFNNNHEps/nZgiaaOJiDsfmdjkWkBginDAcfjg9EMnl/a/Z9zJsmaJFidQjibEwSKmrB7ExCKXoRLBzuks8k9z8+NHl/31xlZ+TwjEsHE5oOp2EIk9RcpToRwEah0AgcKIcKQTEWfKI4hyMz9mD+TMHlOcfiJ6iRd4SkAghbgiCYINhlwcY2x2/051/bfP+QinlS7XWq1EUrhZF2a9vyCeVBpMtBUd/c2TUdvA6f5xCiFkp5T6lVKqUOmStJcsy6v3HtzIyvNCb9cm6aP9VluU9xpjrnHPXhWFIEAQAs8aYI8aYQ8aYsfv7qL3gmNzxgO3sz/F8AyVxGgBtTrqHfavEkQT9w1EU3aKUoigKhsPhweFw+J4syx4simIb5+/O8/Vdz0R7IsPf0845wjAky3KMsf76UpaWTqfNlVde6TqdzhiUT5bQ1OfEZoD2FC3y8F006vX5/nOyLGNhYeHji4uLb6sTUyN/gLdNTU39WRzH372dVp5bkXrbnX/eaHByDEefHfb7gzvTNP2JoijSybXibE3uns0EwPrUq7oFydHNKpwcZdirzH+kI4zNkc5gLFgLUQI6UsjVkne/sePe8ern8uIr24hsGco+JBFKK4ZZhnQQKolwDht0OeFm+aPPHeHn/9PXxUBDYbeahRv3LO6kf1maJoBNNNEQAE000cQZhUWTI3AUwGcfXDugxPL+FzxvL50YXNoHIShsWSn3cbgsQ+QlQsZE3Wkuu2ongc7V8uLq/uVlDjg0QrdITYZxBqEqEkFb0FYirQQhsULhhEAgEWf1EG8IgO0A70mQUGtFd58Q4oiX1ddB1vbO6dQEwKScX0qJ1vqFYRj+UBiG/5tzfEhKuTT593UAU1cR1ADQfaPs9w3+faWUs0EQ3ByG4budcx/0ALD+uou1ZeCk6sSDtCzLDlpr75FS3hYEAXEcEwTBzdbaNMuy+yezv/Us77lROlxYAqBuelg/x1FW/PZOp/NepRRlWTIYDO7o9/s/MRwOjxRFsU0AeH7Pr952rsrWb5yX1flVcmpjLFor5uZm37V79+4vTk9Pj1v8bXYfbwb8Jwm0yXu+Dv6NMeMWf/5rOByysLDwkZWVlbfleT4+9pHPwru63e7vtVqtaU88PZVa/TOdd5u10TTGfNEY85Xl5ZW/VxRFOqn0OBUB8GzO/j+VayKxaGdQzuJEBfwrPx+LoESIsmrxqxWZqcoHZzoBtm+Zyizf/dLQ/eObX8e1u0NkYsiDEqkl0hkK54jCkKjVIl3tIYM2aXA5v/uXixz4tc+KPpA32L2JJhoCoIkmmrgAGwUqIV2cQCEEmYWvfHnlQF4c3//SF1xLpEFgsCYDIAwUSgVYKzBOI5UiSkquuHwHkYh48vGFdy8NzAeNrWoEXSDHmX5lHcqtuxUYKXFCIrEXNQGwWf37qczwLjYCYDNAUgdXo43zISFEIqW8od6qa3s1sqcmADbb9NezjlEUv1drfbMQ4pBz7kg9w+m/1yXuXvJsrU2NMfeNugHs88c6akk2q7V+r5TyYFmWS5OkxqRXwcUQkz3S69nasiyP5Hl+wDn37iRJZtvtNkKIG8uyvCdN0yN+jDxQ9JLp7Sk4Lm4CYNLcTghBFEW0Wq3bkyR5v5SSoigYDAbvGQwGH/SdEibv9Qt1fpNZeyE2HpcxFQFQgWzN3NzcB/bs2fML09PTG15fd/o/XTu7SaO/SfDv7w//e601SinSNGVhYeFnlpaWfqwoirGSJEmSXd1u9w9ardb76i0XzyT7/1TJAF/WUZZlzzkXjs6jNxwO39Pr9X46y/INZTST530pAf+n+iwSOLSrsv9GSKxgXOMvKUAYCpMThCHGWiLlaGNISnjjc3H/9Nbv4mVXtgjcKqkdQqgQSpCVBThLEERgHIYWPTfPfZ87ys/8h78Qy0AB2JHKv4kmmmgIgCaaaOJpZgAEld9PXoDUktQ4/uarwwO9lcf2v/pVryRSBcoMseUAYS1SJzgZYl2AEJZA9gikYef0TpQRs9/82tKvDly5GiQRpXNYYXBUFX1gx7L/UlYOvhc7AXCuN10XggDYzBCsDjpHG+z7nHMPBkFwy8h1fpsGadt3U5+U4QOEYeTbBt6mlEqUUoeFEEse9GymRvDvMfr9PUqp65RS1/mfj8BwEgTBe4UQ9yulDtff71z1wT5XhMzkmNTP11+HoigoiuKDwLu11rMjNcBtxph7jDFHiqIYy6RHRo9jM7xnMgFQB9De1yFJklviOH5/EARJlmWHB4PBrf1+/6A3s3tqmebzTwBsVlZT/ayq9zfGkiQxl19+udu9e/frwzAcX796jf9mBNZmc68Ogjd+nj2pnt4TRWVZsrKy8ujq6ur3l2U5JpSSJHlbu93+761W63p/P23lsH+e16/QOdcry/Iv0zT9icFg8NHK30NvSVieiZfLpUYAqA3jYsfZf6TDCgcCSlvQikJkVpKU8D3Xhe7H3vFGXnl1F10sEOqSQCnysqBvC3SsSYTGpiX9gcF1nsNHP9fj9l/5uFgDMiAXGgioJDGNFKCJJhoCoIkmmnhaw0mqTgFK4YzG4ChxfOVwcSAOB/tf9LwraCcSrRxFllFagRMaHDiXoUWONCUzrWl2ze0k0PZ9C0eXnnO8l/9+Xpag1IhlGO31hR1vLKoSgIYAeLo2hZtlyGoZNpxzD0opE6XUDU8VQJ2uBGArcGKMHWchwzC8IQzD92qtrwMO1j0AtpLwj4zU7lNK3SiE2DP5+a1W691KqZuB+4wxS5sBqothsz6petjMsXxU4/7BsiyPBEFwc6fTIYqi2/I8v2c4HB4xxmxwPj8353ZhCYD6dQ/DkFardUscx+9XSu0Ztam7dTgc3pfn+UnlItubl08PAVCfBtU5Vf+ttWJ2duZtl1122ddnZmbwjvoetG/m4r9ZKcBW17ye+Z8k1EbZfbIs48SJE7++sLDw5qIoSJKEdrv9riiK3t7tdn9Vaz3tiYR6ScOZguqn8jpvlDgiKb7S7/ff2O/3v+p/LoQ86V7Zzmc9U9pAnlcCwFUleN54T47q6p0EKyp/XhUHuMIi85IO8O1X4/7nt76SN73wcuTwOFKUOFtUpUdSVuoBpQhlREFCkVzJHz/wGD/z7z8hTgDpiABASpAanGkIgCaaaAiAJppo4undKVRfcTvBpjkSg0VTAkI7Pvv55QOX7RD7Z7ttZuem0DgsECiBlCCEwxlJoFsoYL4Tcs2Vu4lC+4rFE4s/2Uv5eePACI1RDqNGpv/CITBIzDk6iYYA2M6xnc5hf5Qlv885d0QIcfPpHL63QwCc6lgqcLIufVdK+a/rtNbvDYJgr1LqfillOgle6hJ5a21qrb1bCJForW+oZ0hHsvg9UsoblFJLQogHz811O0cE3GnIiHobR4CiKMjz/BBwRAhxc5IkALdZaw/4zL8vmXg2eABMZP5vjON4vxAiybLszsFgcGuapg96d/pJM8WLoQRgXX2zsStDGAYkSUK32/2xyy677LdmZ2e98SPekNOrOiYB7mb3zFbX2QN/3zpwUkVgjGFpaemLS0tLbyuKgjiOabfbH2i327+QJMlb6v4Dm5WonA/QP/k6Ywxpmv76cDj84TRN17x5YTU2YtMxOdXxbaUSuNQIAITECI1Do5xBiZHpL2AEgARraEmYMfDtz8P9w+95Oa/ZO4tKj6FVCUFElhukA6U1kbMoK+ihebLs8JeHFbf/mz8TC0AhYTB6W6RFKoczTQ1AE008kyFEE0008QydvSpOMOmQdqjJshKhWxhnsSanhWUOeN//vMf9nb91HXNhH2yPMKo2UKaEQHaxmUFqBy7AlDHH+20++ulH+NX/9vmPf2WBN69pKFTVAlDgUBakq77sugfxGW4Yz28bwNNtpuq1tGcW57cNYP3YJjfKHiT6Tb2X9kZRRLfbvavdbt92+k306c//VOeidXhKd/40TRkOh+/p9/t3e4l3XdbsJe9SSjqdDt1u96EwDPf6zy3LckkpNevboaVpenCUNR6/7kKGdzmvZ1Uns5P1tn4ezAVBBSAvv/xyp7VmOBxy7Ngxsba2hi/hODfnd2HbAFprCcOQJEn2tlqtD2ut9+V5fnBtbe3WwWCwgSSYbK8XBAEXQxvAeicA34az3W7T7Xa/cNlll13vwWz9+vqfTRp31st56mU6m3lnAGOzP38P+ePwn3P06NEf6vV6v+2co9vtvqvdbv+Wn4NBEJxkwlhvKbidMqHN5v5TaQMohKDX6/36ysrKP8yybMO4VOOkNvxt/X4/VfvIS50AcM7h0BgRgbNEbohyJYgK/Jej5IDIYT6E112Du+U7vo23vvw5zKsBbrCMDCMgBK1BWhgOsKZATu/gYdPi0KMZP/pzfyYyCUNb1fyXdrTvUGAKmuR/E000BEATTTRxISew2+J3EdAFfvIHr3LvettLuXKqDyyRZ2uEYQvsNKDIBieIkgispHQzPLna5nf/5Et86I++9Z4jBXc/mYPVEhGFuDyDwhHqqgwAd+YgxbmzXYLODsCfDqifvg716Qegk8c0WVeslCIIAoIg2Ltjx46HTi2btycBj3pW8nQEyeQGfqvxNcYwHA7v7vf778mybAxo/PH7761Wi6mpqcUgCGb9cddbiHlQ1O/3b+r3+/f5zOhmfgD1995s/M5GBn2uIgxDLr/8ctftdllZWWFhYUEURTH2Dah3X6hfx/r5XWgCwB9Xvd2bB5paazqdzo2tVuvDzrml0XU77ImTsx9/e07n0lZ+DvW5NTU19bqdO3f+5czMzBkTiKeq//fg2N8D3rHfEwtSSobDIb1e74sLCwsvC8OQOI5/Ooqi24Mg6NQVJ2c7vqd7fb1spX5OxhiKouhlWXZnmqY/Vyfs6gTghVg/ny0EgBEapxIoSxQloTBYkyMsBIEkFBaZw/e8bta9/XV72XfNFHtaBQyXKMs+cdyGcIq1E4t0Oy2IYtKVIWlyBX/2TfjxD/yBWBCQK07qRKyqKkCaAoAmmmgIgCaaaOICTN5g9GwukSBqm+FRzX4QtAjLAV0LP/uj17tb33I1OnuE1pyCYR9btJFxgit7iAAwhjIPQOzkkeOSP/wfhzn4Z1//yueP8yKXxPSMwElBEkiyfo/tycwbAuDpIgB8dk9rjdaabrd7r9b6xiAITspQVxvx80sA1H8+aot3OE3TO9I0PVgUxYYstweFIxLgoSRJ9nq58MZjhjzPl0bvc3dZlngZ+SRgOzcg8/yFL5uYm5t7aH5+fu9gMOCxxx4Tw+GQJEnGYLAO/jbrJ3+hCADnTj6metnD9PT07UKIWWvt4TzP786yjKIoxtfyYiAANlOw1EmlCXLqC1NTU9cnSbJh7TuVh8Z21qZ6Jt17evj72RNBcRwD0Ov16PV6Hy+K4iDAaH6/w8v9z013k+2tj/UxqpesePDf7/d/zs/zyXKYhgA4BwSAERDGRFpghgMwKR0JbQWygO98ecd97w0v4rXfNk9SLhC5VdqxQ1IpS/LM0e7O4kpHQYss3MOffPZxfvpXPi1OKDjhHYDt+pceXTXbEABNNPGMjsYDoIkmnsGTV40fxm7sCVCn9azTlBYclk8/cPTAjp1y/4te9DxkuoSiQDgDypJRklqD1QKkQNqU6VbI1ZfvJhbsWDmxvH9puThgTYAVMYWxOGTlJXARmACeLyno6d/36edQt2rL5zeGdUBfFMWHgCNa65u99LbuaO7c6UsoTtUKrH7+m/2d3+x7o8AoimaDILhFSnmdEOJQnudLm9U1Ax8C9mmt906SE7UuATcrpW6QUh4xxhzerE66fqyT43Q+75unEnmek2XZB51zN7Rarb3tdns/cM9wODzi68r9WFbGi2acjd5um8fzdy9uzDZ7omJU878vjuP3l2V5z2AwuNtngevA+0J7HEze63Uyw7v8K6VotVrMzs66ubm53Z1O56QSjdOZaJ6qvd3kvT8p+6/7IWRZRq/X+2Ke5x8UQiSdTueXwjB8ofcdmATt5+P+PtU9N1ItPDoYDL6v3+//tlf71Mf3Qq+fzwYCwI+cEyAUlMMUh2MqDKAs2eHghufj3nXTK3nZ1V12dSSaFCFKEAZkiQ4g1A6LIRMRC8zzR1/O+D/+XWX4N3Rg3cjof7TUawsKDURYFA5B0wuwiSaeoWtNMwRNNPHMnbzBCP4bRsY/kzUBLgIgiQLCskdi4F/+0xe6W99yDUl5HEUOGIogJHOGIFBEgcat9CkHkiC6khMrCR/5Hw/zn/74C/kXjtuoj6bQAUiJIEe4M98AXGgFwNlvfC++EoDJ1ntRFNFut98fRdHtPku4DsLMWX1+/fy3IgrqhIPPmvqsfb/fv2M4HN7pXeA9iPA14LOzsw8ppfb6121mZpamKf1+/6bBYHBfURQb/sYD0vrxnaoF29MdHtRnWYZzjh07dtyye/fuDxdFwdGjR0Wv19ug6vCycCklYRiOAfXp5sf5uxdVvaUjSqlxq78wDG8bDofvyfP8sAeCk/XoZz/+9pzOqck53m63SZLkA91u933tdpsgCDb83ekIgDr4PZW53ST4r8/lOI6x1rK2tka/3/+/hRCzQRDcopTq1LtGbHZvn4v7+1TO/PW1xhhDnudfHHl+fCrLcrRWm8699WNsclBnQgD48dOhIh1mIDWdQBCkBTsU/K2XRe4db3wJr3juHIHtIUSB0hapLdYOESZDKkMUalaKgDV1JX/+xRVu/+VDYpXK5D8bTa2CqtUwgDASRQBEOCyWFEfZXLQmmngGRrP6NtHEMzYkhgCLRGLHGYExOwDoUYY+Lw2Zq4iCT3z6xIHLdrD/eXuvJUSQZxkyjBFKkeUZ0jgUAiUkWEusBFdcfhlJotVjjx39zrWh/Y0wVmRFjhRnm2G8uBUA5//4z36DeKqMtwchZVne55y7X2v97no5wFPJoG4OKE4vN96sjMIrAtrt9o1Syvc65w4CSx4I1UDGPUKIPUEQXOdJAA+qPPjRWhMEwbu11tcJIQ56MOq/b0bcXAwtBOsEiSdHsix7sNfrHZBS3rxz5867yrK8Bziylbphu/Pj/B3/uiIhCAJarRZJktwmhEiMMfevra3d7+XfdeLmHNJy5+waGGOx1iGl8A7/75qfn//i1NTU67vdLkEQbCAutlsCcDoCwKs8fKnHJIE3apfIYDD4dWvtg3Ec/1SSJKEnhLaaX+fKIPNU12uivOcjg8Hg1sFg8FVf5uHNETcjKKvja3JQZ0IAePLLliXCwlxbEuQliYWbX991P/L2b+fFe2LaYo1I5UhhKMsCax1BECKBQZYztIJecBkf/bLhp3/p02IFKCWgNKW1yBFIECM1AFJh0QgEAofD0CgAmmjiGbrWNEPQRBPP1NAwcgEWDMd1ec4rAUb4Lgxj8tyAhEAWBCVMAQd+9Dr3Qze+mKA4hlMpQhtKM8QVOYmMkEJDIcBEEM/y6LLj9z72IP/lzx959MEjXN0DpBYY8cw1AXxqx3rxKQC2Qw54UDFSAtzWarXuWgcvdlv1y1t/5qkVAHUTPw9m6qClnhksioJ+v/+efr9/d90AL0mSvZ1O54E4jmc92PAZ8TzPx34H1lpvjjZWA2x23S4mE0BPZmitUUrh66W73S7z8/NOa83q6uody8vLd3pDOK21N1nbhgfH+fcA8EAvjmPiOL4dIE3TO4fD4YZrPQn+6uqQs53/ZzOX1t3xQWtJu91mdnbWdTqdsQ/DZln1ujT/VAqAzdr9TTr91zP/k++1srLy6HA4fE8Yhre1Wq13eAXFZp85qTg41+vfpF+IlJI8zxkOhz8+HA5/uSrzsChVdSGoK1Tq57x+/Zun+JkQAGNz1bJkKgaXVs/0d76x437oe17Li3eHqOFxYgpMmSJVhJOKLB91ipGSTGmWVIt7v3SUO375q2IRIAzJrYPSoHEbRP45srL/R4IBjcVgRs2Fm2iiiWdaNAqAJpp4xu4UJAhd6fVwOOzYoGdct6cCjLUErQjlClzpcICNJX/+qWMHnr+7vf+5l+8iCSzaDgmSgNA5BDG4uHL4Dxy4RaIkZ9fl00iZTi8sDn4yzfn5wnJWBECjADi7DeJWJoVbgQNjzCFr7T1CiH1KqT1CnLo+eauM7XY9ADarva+DKQ9iwzD0nQtu1lrfLIS4zzm3NCIMloBDQoibpZRJXf4/mRUfmeq9W0qZSinv36qf/MWiAKjX8vua8jiOcc6xsrJyII7j90op92itl5xzD9YBs1cObGd+nL/jx3s7EATBPmvt4SzLDmZZNj6frbwXzg0Bc27OryIwIqanp39sdnb2M9PT0yRJsoEg8PfSpMnkUyXl6uHBf10l4YmRsizJ85w8z/8cIEmSfxxF0QYibXJ8Jwmu8w1G8zzvDQaDd/T7/d/O83xDuY8vwamTiScrIZoc1JkQAOP1WQV0QpjBcePLhPtf33kDL7kqIV95jFAXKO0o8gwpQAYhga16BDoTsGJm+IuHJT/1b/9KLLnK7b+UXSgkCkNbC4St9gs5VHsNJGBAFNjJ1gBNNNFEQwA00UQTTxMBIOXICciAA4kb52Td6G9EEmMGfax1RBqMEKRliMHwF5954sBrX/mc/Ttn22SDJaJQQllijUIoDVpgygFS56hAEAYBV11+OW0twkcOL1/XG3DQjbIETgjciIKooKFDOVt1JxDghMNKh0AwFn86cZZ7wLMjACY3pZtvUi9eAuB07b6stWOneZ9lN8Yc0VoThuHNkwTAdjejm23gt3p9va2Z/5mXBodhiHOONE3Jssxn/PeEYfheIURSluV9I7BzeJT1v7F+zmEYjrPh9Vr5IAhu1Fq/N8/zOzfLul4sBIBv8VbPrNaNGvv9/p1JktzY7Xb3A2mWZfd7dcT2OnCcfwIgDEPCMNzrnDuSpunhNE1xzo1VGXUiaTMy4EISAD5DH0UR09PT/3V2dvZ9U1NTY7m/B/leoVGfK3XyZTvlL5PEjycAvPS/Pp/LsqQoCnq93o8nSfK+TqfzFk+YbWfen6v7+3Tv0ev13jEYDD7qPSy01ki5Pufr192TAhu7BlzaXQDc+ElYfQlGXRXG3KoE4ZBYlDNI7Ejpp1DO0BUlrczxzhtm3D/6/ht4zkyJGh6n04lRCmxpCcIAoSR20CMvHWH3MpbKLp/5VsY//zd/LpYVDCygR10FnCAJFEWZjbP/JX6v4YCyOramgUMTTTyzIUQzBE008UwNWZEAAK7q0SNO2hrL0Sy3+EYB459jCYHdIfzC+17tvve1V9GWCzBcxEmFUArjbNVhwEmkDMhygbQRqws9PnboUe7678cOf2OZa1csmDBmSIApDEo5WoHA5QOcgExB6Y2ErCAuJNJBKURlXnjGG9SLOwNxtiDnbDfxdem9Bw6+3lxKyfz8TueNAet/UwdHZzP+T6XN4maRZVlvZPD3qVFbw//qZdBlWY5B8OT71A0Fe73ez6yurv6cJxi01qx7DWyufqhnfC/oA3p0XK1Wa7bVan24LMv7VlZW7szz/KxbcI7O9KxeHQTRSeTF9lsUnovxOVmWPkk++euolBpl1iuwrVQlpZ+dnX3b/Pz8H7bb7Q0gf/I9Ny+J2agAmCQ3NpO9j8zyqAwrzWZ+HWNiIAzD87pmSKnH9/pm4xYEwZi882tHWZYMh8NDaZresbKycl/zHD5z8G/ESFIvLDiHogQsFokTEhVEmMEakYJIQFmADqAMp7H9FV6keen/8vYrv/jW1z2fy6YtoetjygwZJGAdgZRkKwtEbQVastSz5NPP54FH2vyzf/k74okSMmrt/IQe7RMssrY2mNq9flK74SaaaOIZGY0CoIkmnsFbiPUGve4Uf+M2/7kAowENH/vYEweuf8nO/dNJSCAFuh1TDNYQSmJQGKuQaERZEglDuyXY1Y4JEz376ONrP7Aw5FdUHNAvFDhBOwow6RpKVFUExUiogAsQTqLtqLbQZzvOGAA8u6/wuSIAtgLnQsgjQogbpJTJZDu+7bRpO9vxP937a61DKeUPSikfBo465444566UUl7js+eneh9rLVrrt8Rx/ANa689bax/L8xxjqjkjpTopK1kHjBfaI6AGrFPgfufcEeCIz6heaAm9EPIk0F//fv5VFierOiZLQqrSFze63hIp17PRO3fu/LWpqalfaLfb1O+nrY7/ZAJge+U4/lr5zP56vf/633tZ/9ka+T2VMfeHOdlZw//MKxM8YViWJYPB4L5+v//GwWBw+GKYH8/g1R0n9JiIE5RISsCNn4muLAhbCa4scAaSAEwBosh43jTv+qffd+19N15/GXvmFKEaAjnWOSQhzghkXqCn21CmZE7j5p/HX3xjjZ/8wB9c9UTOajoG93VCsFob3Um7B0eD+JtooiEAmmiiiWf89qPq62tLQMIf/NnDB17x0j37r7n6CkRvkSAUSBEgUVgEgQJZpFDkiDim3W7z3Ct2IPVw90PH+s9/dKn8PRfEKB1j05Uqg6Ar8G9QYNsIm6BsAMJipa0ysA0B8LQSAHWZeVGUh4D7lFK3KKWSScBxoQmAUTvAMAiCdwohXmOMud85d0Qp9T2+fOB07xOGIVEU7Q6C4B8BX7fWfqkCWidn/s99jfrZj49XKxhjloAjdYXGhSYAnOOkjP/57kO/8fPtluAf1g0jlarGrCgMQkCn0wlmZ2c/t2PHju9utVrjTPsk6H8qBMBm127yWPI8pyzLmrpmfS5OlsmcqfrkqY25OOmzJq+lJwZG4P9gr9f7vsFgMG5H2cRZEACyEtlHLkVjkW79dxIBzlTdKQggDHHCoo3jFbt46F1vuvIf/cANL+KKHTG5SEmFgUAjUEQiRDmLCASUGQMtGbav5K8e0vzsv/2T33p4ld/Ioanib6KJhgBoookmLkkCAIiUpG+rhj5/ef8jB55/7fT+a/bsJogjbJpVm5C8INAKIcGUKc4YrCtptxRXPecKjFLXP3FkUfX62Z87Y5AuJ04EpfN5gxBhIwQK4cDJSnR41k0EGwLgKb3XJNitWp/ZI8B9Qoh9Qog9PjtaNzjb2iPh/JY4eCO5IAhQSl0jpXy7EGJWSnnNdmqwvdzfA7swDN8ZBMF3CiF+C5y11p2Uca2D7gsNcPx1qLdH9MeX5/k5OL6zJwCejnv3dMe/mbdA3ane/05rRafTCebm5vL5+fndQRAwSaicqn5+KwJgkoiaPJ66rN9n1f3xb1Y2cTY1/GdCAPjjnGydGYYh1lqyLKPX672n1+vd4T0ezk0JyqX8AK7GWLuCwDmkq55nYnxfOQIdYkqDiGKUsIi04GWX8zf/4Ka9z3/76/ayMy5wrk+vGCJCjQ4CsBBYC86ADugXgkHnKj77mOGnPvCHP/vQMv+kGH2EaQiAJppoCIAmmmjiUiMAJEnUZVg4LBKpLKmBv/iLxw4873k79u/oThNRorTDDPsIVyKTGKkUTjiENKTFGp1Omxde9Vzmo/BNRx47+oOLvfKXiaGQAdYIpNMoq0BY3Cjzv751PjsQ2RAApwNoblNQUgcwo+zjEWvt3VLKG5RSe+s10+cTQJ7u/OqfP6rfD5VS1/jfnc6F3TuRG1PVWgdBQBiG12itf0ZrbZzjE/696i3bJl3eL1TUa6/rANVnjC80ATCexWdkoHku5sfm/g8ewPpWdGVpiaKQnTt3fmH37t2/1Ol0TnpN/fpvlwCoEyCbzTN/nXx7x/p8rI7x5BaDZzt+T5UAqBMYdSLME08j8H9Tr9c7mOf5GPxfLCUyz9SQWDQlysvtRcUJCED5Nj4qRmiNcAVhnnH9bj7299/6wld9/+ufy84oRYkhyByrBGEcgbW4PCO0DpyjAPLuc7j/Ifipf/sHdz60yk+tWUYV/nok/2+uYRNNNARAE000cUlN/8JoLBqJxjqLEJahhb/81KMHBEv7n//cK+nMdtGUlPkQqSRWCoRwSCUqmyBr6YYhV++cpduSO1ZXT+x/8gQHBoVFyhDndLXNFCXIAjfqCuD3HqIhAM4bAbAZaNlYI63HAHm0mb8H2CuEuG57n31+CQCfZaxnv+sO6Nttw1bP7MO4dd1blNI3SykPG2MOT37GxSBv9sRF/dgn//tCEgBCyE1l8k8XCVD/iM1ArCcB2u0WMzMzX5iZmbm+3W6P69s3I3nqAH27JQBbkRDGmHHmv04wrP/dyaTD2XZJeKoeAPV7qW6C6JxjbW3t4GAw+OHhcHh/vQNB3TS0iTN8+jqDdiAdWAFWrHcEcIhR5xyBLIeEheFll/M3/8v3vvRV3/uavcwFA5RZQ4gCpENIQSAc5BnSWXTSohARa3o3/+OrK9z+ix991deX+FAfsAqsDWFMPTTXsYkmGgKgiSaauMSmfwQqQoucQEJqHRZHz8JnH+wfmE56+6/ZvYNuJwKTYhE4V2CtwaKI4lmcEdh0gXbseN6eeWaSiN7K8v6VFXsgdRojNFYVIIqqTaGwWGEZtz06RwCgIQC2//p1sLERQFtr07IsDzrnjgghbp40Rnu6CYCtapM3Myw71WdsBqKVUmgd7FFKvVsp5U32NnRDuNAZzq0UHOeKHDpXCoALNz823hse+PsMtdaamZmZX9u5c+dHut3u7rqqxV/feonA1kB/awJgEsB7J38P/jfrirB+vGxqnvj0rRliU5IsyzKGw+HBlZWVW7MsO1KW5Ul/s50uIU2cYm3DIquue5RCYwgxQuOExqGQOLTNmQZeuQv3Q2/as+N/ev1z2Rn3SQcr6DgkLTLAosoCZQy6KNA6oAwjvrka8D++Lrj9F+8VDw84kkmqrkE2RIkArRWlzWkUAE000RAATTTRxKUUQoLQqCigLHoYZwmihMI6CixKw2e/1D9wzdXx/udcsRutQCuQAoQUSKWRLqTI+oRtBYEhLFKeu+cKds/vYfHE8f1PHBsesKLASoP3+/Oif4EbSR7PRu7aEACne/2pM4piw8be1yoDh6SUSRRFN1xIAsADj8nMpBBiXN9/qvfxIM+DPu9m7rOzWgcEQYDW+kYp5XXGmIM+W/v0uNifOjwBs1l5wrkhAc49AfB0mgBOvr2/V/zXjh07XLfbfUWSJBtaRtZB7GagdisTvpPVNCcRaGNFjScB6vPLl5qsv2Yd9G/Wju98rxlSqg0EAECe5/R6vVt7vd4BL/nf6r0bAuBsp46rsv/oSgEgNA6JEI7A5cQWrpvjC3/3O+Z3f+++q5iTq7hiGRXG5GWJDhWBVEjnqlbAQpLLNo+nCX/1SM5P/MKfi+OmasMr2xEuF+AUTpQYW9A4+zfRxCW+BDXRRBOX6uzXE0vBemtBAUQOdoXwz3/oue7vvvXldO0xQtFHRjFlniKdRUjLIBvQ3rEDeiV2ECGT5/Dpzz/Bb/zxZ/njz/fEExbkVMRwkCGVoBMFrK3lSCkQYp2HnOxXv9Ew63xsQC8d+ePmBIA8JYCYmZm5LYqi25Mk2auU2tATXClFWeYb3n9SQj95/Z4OYmQrV//NAZDe8HdFUTAcDg+ura3dOhgMTsq4b/bem/Wf998v/hrps73/z2+ZRJ302Xws1wG8v9fiOGZmZuZjU1NTb4qi6KTrv9m9sNXvvUJg0ohxvU3kxsy/r/Wvg/z6fXJyxwRzmvl5lldnwjvCE2nrhIPYYIKYZRmDweDWfr9/MMuyxuX/fK7HSIyQYAxRGOCkIk9LkIokhHba49W7cT/ytmt504tmmZY9jB0ilEQkbYyFUKqqw8VwAEpThjEn3Dy//1dL/B//z1+JZQG59Bhfgh1dT1GuM/EN/m+iiUsyGgVAE01c0iSArb4kIz0qI3fiandQShga+KvPLR9IgqX9+65/CUU6pMgt8XQbylWELgnn51l+8ig2LwnnZigXj3L1FTvYNT8Nrrf/W4+nB3pDgw4CnBUUw4JuK6S0blxHvJWD9nY37me6DWtYoK3H1BhzyFp7jxDiZqXUrAcQXuastdrSAO58gt/TlTZsBdpP/tuNEuhR5vg6pdQNQRAcKcvycB24bZY9rn/OMy8jenGXAPh7re7oX/9Sah3gRlHEzMzMj83Pz3+m2+1e41v7nQ7kn+p3k8DflxX4e0CIdYWJz/hP3icXcv2pH0sd6K+TAhtl/6urq3O9Xu/QxdAB49keVghwGt1qUeRDTD4kSWKk7dN1OS+/EvfjP/AKXnlVzIzsEekSHccIKUBYhHMEOqboZ6ikzcAkrAaX87uf+Dr/4je+JExLsOZGHJ0DrENhcdhq5y+bx18TTTQEQBNNNHFJYj9FVYPoWxKNbYjdaHMaaIy1GODQX/cPLC8f3v+qV72OqShksPQE0Y6Q/tpxAitJWtOoMECIEqFyRFhyxXSXPfPzuHy4/+gT/QO93CJEgHACY0b2f9sATtsFfA0BcG4JgFE2c8la+yEhxI1KqT11IKGU3LR9WR0wP13gf7v3w0ayaR3A1+vGgyDYG4bhu51zD0opH9wImk5WBWxFflz8hMAzxwNg8wx2RcJEUcTU1NSvzc3N/VSn0yEIgvE9Wr8O26n1n/zvSX+ByfOvy/0nHf1PX9d//gmA+jlNHp+1VYvC4XB439ra2rWDwSD1Zn+Ny/95nnlCgI6wWYZQkiRUuOGQWQs3vTR0t9zwPN74wp3MJ4ayTHFCYKQkKwo0jkAIymGJTqY4kUt68dX8u488yP/9u18TeQyLmWcaQNt1rZ8VbBTuNJe4iSaa3V8TTTRxac1+4QmA8c+8TLAmDRYWJUGXMA3c9vZd7id+6G8xFSywsvYVduxs41KJsxKhJEWZEwiLyRyySJDBHr7xuOQ//8nn+Z1PPHLtkYzDNopZzkqUFJWL8RY9vM8f8Gd9d3SpbDjPoATAgxgPslqt1l1JktwWBMG4BGCyJv2pEACn+/12a6K3ez9M/l29BGCyw4BzjqIoyLJsqd/v3zQYDA4VRbHBOK5uhLaZXP3iJwAu7hKAeo1+/Wd+jINA0el0XjA9Pf2VTqcz9kzYrGTgVGB/KwKgIrnUliUARbFe77+Zy3/dKX8zMuB8lwBMjsWkeeZgkC4NBoNbe73efUVRjEmWyWNv4jxcFyQiCCnznDAQhGVGt4Q3vxj37re+hNe+YDeud4ypTkjhzSSx4ApaGsrCgOqwYtqccPP88sFP8uH7F0UPwUA6RAQuBeUq8C+AEigF66k/0xAATTRxqUajAGiiiUs5Rvt3Zce7xeqHrmpJJDAIB9aBigSpgQe/2j+Q9p/Yv/ea57Dniis4fmwBEWjAMuyv0opjhA7IC4OMIqww7OgmPHfnHGHRf+/xY70dx4flR8tAYJ3dsDHeyvH8/IB/mt3PaRQA9Wz/KMt5D5AqpW6sTPjsltdou9n4MwHup/uczX6+2d95E7RJELbeJlERBEGitb5NKZU45+6rA9CtatOfOeUAF78CYPIeFEIQBAFxHDM7O/Nfp6enf2lqagpf7++d97dq7/dUCIDN1B714ymK9RZ/kwSYJwRODeyfnvWnrnBxzpHnOWmafrzX63/7cDh80Jv9aa3HBECT/T/fj16DLDNmWopikDNt4ZY3xO7vv/UlvPJKxaxcqVrmKk3qNKUAYQ0Ci5QBa7mlaM/x0LLm33zoAX7/gUWxCgx9ZZPZCP69u88Gwr+5xE000RAATTTRxCWI/YQE55AjLqAqCxyzAQRCIJUijBKyLK/sAQV8+euDA489+rX9L3reC5jpTqOEI1CCAINzJTJqkxYlKgywRYrO1piebXPtVVeQmd5rvnak93srQ3dMKYdDbqhVfSqgriEAzi8BMGlmNpLC3++cO2KMuS4Mg9m6y/kkiD5bAuCp3gubtco71d96jDMp8/bffS10GIYEQXCDUurdwIestWndA+B0QLMhAM4e/PtrEccx09PT75+Zmbl3fn7uhb7Wf7L+fjvX5HQEgNYaYwxeFu/r//M8ZzAYYO3J6hd/vJsB6JN/9vR4ANTBf5qmvV6v96a1tbWfGw7T1J+X/31d5dCQAOdx8+0M2gG5YU+L4J1vvsz80I3X88rnJHTEKi5fRShJ5iA3DqkUZZFTlpYgSMiCKT7z6Cp3//5n+OMvDEUPSToC/1IHuNKiNoB/jfXF/6JRdzTRREMANNFEE5doSCAANCMYTjj6icQhcJRoVBCRZ0MEjk4IhYEyhG88zoEvfuorP/mOv/XmcLYTs3L8CdpTMVmeMSgMSbtLMSyIhEW4DGROe67DzM45nBj86OJif6pf8CdWhtsCdhcnAHp2EwCTgMpnvI0xh4qi+KDW6ieBcLM2fdsBEGdyXc+lB4BzGzO7mxEGdTWA1npWa327lPKIUurQZpnm80dWXZoEgL+fgiCg0+nMTk1NfXJqauqWVqtFEOgxaJ2s95+8d0/V0eFUBoF1hVJZlgwGA3q9HoPB4NfDMHpFnaiYNIy80CaA9fu6KAr6/f5Her3eqwaDwSMVqbHesaN+/M8cAuuZ/PS1dEO4LGHf33nTFY/+w7e9khftlOh8ASENIpA4Z9BaogNJqEOsDHAyJMsNf/Nkn1/4vQf55DcRawWUOAIZI1BQ5sQhGFOp/A1tLAkQjuZsUfP6aaKJJprdXxNNNHGJEQDR6L9LNAV69FPLqF5wRAcEAdgiQ1MpAAo0sXJMlYZXX4776X/yFl79kmmywaOEsaGfWuIgIhIKN+whIgFFyfLQEc08h4eOOz780c/z2390VPRs1WkgB0qhQagqQ2HdujehUJV00clKFilGrQrdaOM6rkWugzE7WuDs+N+XcpypB8AkMPCAR0pJu528Lo7j9ydJ8ial1Nhh3APm07UBfKog41z7APg2blu9NgiCscHbeuu3yjE9z3MWFxdFvff7ViZwF29c/G0AvTS91Wrt63a7D7Tb7bHJn3Pr1wUYEwFPBeCf6vdlWRKGIUopsixjeXmZ1dXV7ymK4qMAu3df7upk12QrzNPV0T8dbQCFEJ64+Mjq6ur3p1XSf2SoqMb3bt1ksa64aKJ6zjix8TvCjkvnjJAjab2tJPojbseisUKPn0RSFEhXEriqxe5lCS/44e99/lfeccMLuKKd02IF4QYYW1b3T1GitSYrLLkLKIIpMmK+9JVv8Vt/9A0+8iBitaq+q7L9NhiR+SUqgKwcVfXRHj3rbQX+6TcEwP/H3p/HWXaV973wdw17OENN3a3WhEATCIQRBolBzIMECHAYciXbeHZuhB3w68TEL7pJnAsx9wblTUjimLwX3sQDNo5BiRktMGqDxSQQEgKZQQLRAs09VlfVOWdPa3j/2Huf2lVdPavVknr9Pp/q03XOrn32Xnufddbv9zzP7wkICAJAQEDAyQvdIctuHX3uEmvH2tLBumAgRpFS8NKn4f/1b7+ap50ukflepBXEUlEWY5J+ChrKfXuIekNEMmDnKGffZIa/vfFePv2Fu/jmg4hcwEhpjJeoWCGsIfIeb0HIBOsFFoGMAFlQFSVaKfAaJyQe1TleEDiUr2smwSBw0/rHdt3TCghBADg6Mu29ZTgcRnNzc2WaptN+7Ksu46smbqvO7X4NuTuc6OvhkLUj2cfh/u2hRARjHMvLyx/ct2/fW/M8RwgxTRPfiPwd7rE9biTGhgS3Y9EllPW19wccj3YMB4MBc3Nz3x4OhxfFcfywdgwRQk1fW2822B6PtZaiKFhZWWFxcVGUZclwOLxs06ZNN2z0N4e6tmufd8f4md6/+0T3vkvTlMlkwvLy8lWTyeS61h/hcN//0PfnY3v+bL8vxLpxWPu7Q3qJE2sfla8FAAEYEVNJkKpCSY804BxYoSl8AiKFSCDVBDGZsCWCCzbx0D9+/amnXnrB6ZyxdQve5SBKvHRYW6GdJLagRYQ3hkKkTNIt3Lx9D+//y6/w1R8gRkAppieD6Hxfs4bf685y31PL+wEBASczQglAQMBJDTel+u3SwK9ZOKz9jTXPSywJhpKHdvPur371R73nXnzui07dshlMRUSJThOoSrKlJdJ+HyEhn4yZm0kYJpozNi2web7H8uKud+1Z5N1oh1eaqsgRUbO4FhLhIyDCe4e1JV7Uzsk4j0AgaCMwsvY1aEoY6lIGi2jPQ6w9G3HSa6DHZrTY9GF3ZVm+2zk3q5S6NIqiKXlbbyjW7eF+NO97OMZ+x2IseKR/a60jiqKL0zT97SiKbnXObW8zBtaXFQD7CSAn1Z224XjY/Qhsp9yChYWFtw2Hw//V7/ef0t5XR3sNN95W7mfc1z2GPM8Zj8fs2bPnrfv27fsHVVXR7/cX5ubmvtvv99d0gThaCnpMCzil12QetNkQ7TlNJhOyLLs2z/M/qKpqP0+PY78FxeNi/hPrrkP7u/St8O33e5SA9iBQGBVhhcA4g2va7gkA70gGQyoD+IpBbEhLwzNOx//6688YvvLCLTxpS0SkPKXJ8VohoxiJREmBxmOsoRIppreF7+2w/Mc/+TxfugtRSCj9RveTP8j3vONkz4QLCAh4fMzeAQEBJ3DyUECqBcZ4BsCCgj98zyv8857sSasdpEKBcTjhkXMLTHbvI0lSqCxGeJL5Tdy/x/CN25f5xN9+n7/9din2AaavyZxp1ioRykQkMkZLQWHGlKIkjkGYdnmjcELi0ODbOIhHegfCIL3DidoB2SOxQiJ8XYcpTpI0yOORASBlnSYNdbRxZmbmPwyHw99piX8bAe4S4m669Poo+aEi5EdDAI9nBoBzTAlXEyX+4MrKyltbV/X1fggbucWfLPdd119hlbTaNeJIx+E/SpLknZs2bfr91sCu3ddGpntHKwAoFe0nTrW1/sYYdu/evW0ymVw1Ho8XvfcMh8OF+fn5vUmS7Ne15HDuuf1fOzYyJqWeZlh0S1SqqsIYw759+4QxhqqqpuU4a8W3kzsD4MDfbYe+LtJLlJM4qci1AOGbgntDz1fEoo6zFw5kf4CylrjIednTtP9HVzyFS58yz5bEgajIq4rCOuJkSKQ0mBxFQWFXSGY3sWgW+P79jn/zB1/gtvsQBZBTJ/OHLP6AgIAgAAQEBDziAkAkwPiICMOM9kQG/vO/PN+/5oXnIEZ7MKN9zGzazGjPEsOFU/CTDBHH+HKZKraMrcbbM/nWHRM+9LGb+cr3SrFbwRJAqvEugswSeUUviXA+J7MlStftC6UHK+oiBd+4GNSk3tUEH1e7IHfIv5P1Nso7hD85IiLHqwSg3V5K2ZK3K4bD4fVtScB6R/T1JoOHSx6PlsQfTwFASr1m/9Za8jxnNBpdlWXZdW299XpzwY16wj/eyX/3sSXySok1Ufc4jun3+1cMh8PrkyQhSZIDRuiPNIvkQAJA690QRRFKKcqyZGlpiZWVlWua6DneewaDAQsLC77X601bEmqtT6gA0C0BaMeoKAomk8k1RVFcm+f5flknaz9/9pjf//EuAHhY5wGwOncKFJX3oCQoXbfPtZbYl8SUeOuJFJQGNifw6uec5n/2Fc/g+edohnIJqhJ8hZXgtUaLBJwBW4J0mESwzIDv79L8v/71F3/nx0v8R68kEwta95iYrNO1JyAgICAIAAEBAY/A5JFGMWVV4olRTaS9B8wB//odT/OvecGpLEQZSeawkxztBWJmiB8tIjal2GqZ0nh8tYAXp3HHvRX/4/pv8MmvL4odFfhehBERprSYqkLhUcqDEgjpUW0GQJva7wVO1KKAAGSz8K1fFxipG8MmBR60r4IAcIwCwPoa/yiK6Pf7z+/1eh9I0/QipdSUrLUmbW209VAmaYci4Ifz2vEWANpzatPWnXNkWUaWZdvG4/HlZVlSluWa8z4ZyP/B7sHVqHtLxBVJkjAcDj/W7/ffmCTJmg4ABxr/Yy8BUBuJN7cuLS1dMplM6PV6VFVFFEXMz8/fMhgMLm63bw0i1+//cEWth0MAkFJPP3vGGIqiWJxMJldlWbatLMuDZszUx3HsAsTj/p4V6wSA9soJh9cSjAMXg47rG9qW4CqULxlGAnLH6THRG14yU77ltRdz0VkLMFnGjPai46iuF1AKsFCM8ViE1vhoyB475Oa7l/mn/9ctYpeFTEBhNRKJx+OxhJT+gICAo0HwAAgICDja5SeCCCEinK+QGipXxyOSIXzuxt3vLsr733XhBc/AZCUzZzwBVpaxk32ozQOyxV1EUYLyCi0VkVQszM5w5umnE+viXXt3LveWVtw2W1Vo4YjiiMpZHHWfY2tr00LfresXjarZPIr2EfCidgWoeyGrulTA+8NK93x8yzhHLwAoJdf0Dm8jjMaY+/I8/3+UUj8thHhqKwKsT7du3+tw2+YdznaPpAeAc6vn001tV0qRpum5Wut3KaV61tpt3VZ1R/p+j+k7bL+oczeC71vB6ILZ2dkfD4fDi5IkacbW7Uf0j4cHQCtErayssHv37vP27t17bVEU03T6KIqYm5u7YXZ29kVKKaqqmtbbH8wD4EDixbqtjmlstY5wzlGWJePx+IPj8fjFWZZtb4WJjd5/bbeC4zN/PF6Ify2Qig3P1Qtfk3dnaxd+LxDe4a0Fb5HSIkvP6RH8/OWz9lev+GnO3WSQk90IfC2eKEstTTswBc7myDSFZJa95ZDPfv1B/uX7bhcPWRj5OuUfKdFpgjWGA9f8BwQEBJyss3dAQMBxhgYi6uT7AqkgTjRZZlAadAULwAWb+faH3vfzF+nJXZyxNYGowo12I6MEO9EoGcOwj51YViaWmfkzuH+H4ZPbbuVvvno/392J2AfIQY+l0mGondZNPiKKBMJ7fNcZ3lOb//lm+ebrxZwVYImwQuOa49a+QpwkjsjHywOg23qt20bMOUev1yNN0yv6/f5HkyQZdtO2N6qBP1T09HBFgsPZ58PlAbDe16Alh21HhLIsybJs22QyuSrP88XWif1kMQFcn/bf3idSSpIkipIkeedgMPj9NE2npLtNW29T7A80XhuVARyJAOC9oCxLRqMRy8vLm0aj0aK1liiKiKK6PGB+fv4Ds7OzV7dtLdtj6x7fge65AxHwVRx7BL5J+b8qy7LrWu+JA3lM7O+p4Y/5/R/bC2C3To7Zv62s65yi7GaLCYOXDm9rHUBLgbUx1jsipZlJC7bG7sr//WfO++hrnrnAWcOSQT+iWllhXEjmz3oCPl8GXzVdbX1TUzfD9x4suPH2vfynD90ldjqYICmRIA2ir/G5qUsOShP4f0BAQBAAAgICHlkBQBLjqZCywvpmRpH1ujYSMbH1DKh4wTn4//KetzAX7cSM72NhUw+fVwg7BDTOW4QCEUW4wlFmAiPmuf7G7/I/PrOdb+xE5BL2ObAqJemlFNkEqTwIV9dediit8A6FnYoA7VLbCoUjxjapvyoIAMckALimX3U3rb1L1srSkKYxw+HwisFgcH03tbslyt3jOpgAcLSR/eMpAAihpoSwHYeuANJu65ybegN027GdDGUA61PjpZRorVFKsWnTvO/W+rc96VtDu+491e6rm1FwrBkAWVawuLh47Z49e64xxjSixOo9Ojc399G5ubkrpZQsLy9vr6rqusFg8M4kSaiqak0Wy4kQAEajybaiKK6dTCbbupkJ61ts7l960d6n5pgEN/cYT57aSADwgun3iRNrDROl7/6twfs6Cy0ClABr6hl1IYats/yXt/38xW9//lNnecqmCia7UNZCkuJdxNgYkr7GW0tsBZ6Ygh73LQk+vO07/LdP7xFLwIQET4zXDs+4JvypgKIxHQwCQEBAQBAAAgICHsnJI0LiANNEJ6Z80iQINBGGWe3AVFzyZPwfvveX2BLvRk92MFAeCuoC/XSAc4ayGBNHEtlPKfeMcNGpbLv5Hj5yww/58h2IPYCRPZyWFM6gowhTFvUiKImRSuGqCuEssfQIV01FgLrZocIKjUfhAEV1TIvwoyVwJ1P0t619b2q8/6jf7/9at1VgN4rbNXk7Wpf8Q5kMbvT6kZDGtaRWHHS7Nk28PSfvPVmWsby8fMl4PL61m6otpVxDgKMo2tDArY2Qd9ssnmhy3z3/boS8jaK3DvRRFDEYDM4dDoe3pGm6EEXqsK/fRuS/e49s1GWgHaPua61Hw2QyGe3ZszhTFMUa0aEd+yiKLn7CE55wy8rKClmWfVApdXGaphe3Uf/DudcOLW65/e6XrujR9UFoSbsxhjzPR0VRXLt37973nFgx8bHdBUDgmg4xq5H/OvpfR/7b+0W4+v6QHdFESYeoPEkCWQWxgJ4EWcFzzsD/ypufxQufsYmZeBnciEh7hKtb+6lIkY9HiN4QoWK06rOUJTywr88ffOhv+eRtmRgDK+i6jq2t9W9FdjFVLIIAEBAQcFQIHgABAQFHLQAoPAKPnS4EfbMoiaF5JXcVBnhwL+/+whduf9Jzn/PkZw3SPibPSOd6+CrD2gIVSXQqET1Jte9B4tkEZ3JOP/N0zjjzCXg7edfenZM/m1RmUTqHkorSVKheD91LcQ58Udb5/lLgm9XS/mmutTGAnK6eHvkV1MmY/t2Q1k8As1LKS1uyZa3FGDMtI2hJ0NH2WD8aj4CjFQCmfcQPsl2XwLUkTil1dRRFZwghPt09/zYyDkxJ84HI8IFc8E8EGexGmNtja+vlAbTWpGnKYDC4rN/vfzRN0zNqEejIrs96P4EDtVVsj6EdU6311CF/ZWWFffv2vXbfvn2/XlVmKlS0WQiN4//Vp5xyyqeWl5cXy7L8tBCiF8fxZVrr/dpZHgukFIcUQLrCRVmWTCaTj4/H48uzLPvM+nvkxHwLPFbhULVzbOMPs7okds01qOcoUEIicDhnETi0ksRaIqSjKkFrQewhNnDxGfhffNW5vOqSM5nTSxTjnaSDHqUxSKWItCDbu4PeKVuxlaKUM+yaCB7Mh/wf/5+/5u/uNGIFwYhBk1FnpkJRy/2nX2mB/AcEBJyEs3dAQMAJnjwkcrXNHgBJE0GpQBiIJNg6cpEK2CRAGfjDd73Yv/w5Z1Luvp3NCwqqAoSjLAqKyjCzZSvZpARiknQTpRvy3Tv38slt3+OzX1p8+48nvN8Sk8easasACSqq2zE1JkxC+LrNHwbVLtR9fdSuTfU85hrckAFwuOPUEvokSRgMBm/p9Xof6PV6w27ZwEat8o5FfHikMwDWv2c3ots9tzaCP5lMWFlZuWQ0Gt1qjNnPQ6FL8tfvt93u0XJ9NzLsa7tCpGl6btMV4rIoiqbHv9Hn72DXZyMBoEvG2/FQSk39BNrSgslkwmg0+uPxePzrk8kEY+pt+/0+WmvKsmzd/vemabrgnGP37t0ijuOrm2NfE5FvPQEONhccKgNAyv1LHLqiSnsOjZfEvVmWvTXLss90u0qciGvdOYPHgQBQZwDUZ6WblrHNedn6M6mVwjmDsxXC+cZUtvaVme2n2JWcHnD5hcL/8mt/mksvmKHPMkWxQv+UTexd3EucRvRSRb5vL4M4wZUaZs/j/nHMt36yyP/733053mOplix1vb9QIDou/16Clyhck79WmwIGDSAgICAIAAEBAY8wagFANWIAJFjAiqwOprQhCwezKfgRzOs6qPF7//SZ/o2veBIyv5uFWc3y7vuZXZgDoVledvRnNmGNYTKZkEiNjjfzgx+XfPqGO/jsF3df94MRV1kNSw4KB+gIGad1VwDnwFoktqb7jXlTW8PpRL2Y8iIIAMebLGxUFx9FEVprZmdnP5YkyRu7NeAtsdFac6gI5/qo+JGO/cMhAGyUBt+ttT4YUXbOUVUVk8lk+8rKynnj8Zi2Fr2NWq8nhd0o+4kWAA415sPh8Nwoiq5M0/S9SZKgtV5TFrERf90oAr7+tUM573dT5puo/73Ly8tPzLIMY0xHSJBTIz+tNQsLC3tnZ2cXsixj9+7dQmt9cZqm7x0MBpe1JRnW2g0zMI62BOBgJQxSytZE8n2TyeQdRVHQLRt5JOeRI/EQeXwIAK4h+2303dVtaGVtPOtcTc2Fg7N6RK97/qnlz112IU87TSLLB0mYgNQgBdFgwMpkBW8r+ukAXzqM3MSucjOf+vIdXPvhu0ShYZcF35N1xr919WNzXPVFqL0HouZZS2eTgICAgCAABAQEPCKzh6gXJdonTfJkhcVhJNMCI5HE+HFJ7OsayXrVBJGHd/zqWf5X3nQJLrubrbMeO14m7Q8YjyN0NIMzJVIYsMv1YlNt5cGHIj59w918fNv2bd8dc7nT4BSMTC0EiCjBK413DoFDeIek/f/aheuxRk+CAHDo8Vkf1e+OWRzHJEmytekS8NI2/f1QRO9A43+kXQKOlwCwftsuqVuf7dCWQYxGI5aWls4bj8fb22yJ9YLBo9E4sDuGSqlpyr1S6uK5ublburX167slKHVkRozrX1srJsg1GRRt1H88Hv/eaDR6T5ZlTdeG1QwBrWNGoxFJknDWWWf5fr/Pnj17bl1eXr5EKbUwNze3txWr2v2uJ+zHIgB4b9fsq1v+0hhH3p7n+TWTyWRN1P+Rnj8OfM89PgWAFkkcU1UFpqpqeVuBliBFTfydgbM38c9+4VVnve9NL72AU6Ix0iwRxxrrSuIElhYX2TwzA8SMxg7V38RYJOyYRPzlp77Fn352p1gGSg3ZWs9BMCCI8Oj6CVH73eiOABAyAAICAoIAEBAQcEJmEOWjRguosK0wIKlVAC9Q1tDTgsrUlfkVtXPyJuCy5+L/zf9xJX27g/koY7JnNwvzp2Myg7GedC4FRqwsLxLrBZL0NO7+UcYXv/kAf/q5H9x7126eOK7XbrhIsS+3gCQZDijLsj7MVgTwaye94714OhIH+sfl7dGJ/Hdrp9ux6WYEDIfDt8zOzn44SRKcc7Qp8Uc6vkfiAXCsAkBLgA60Xfe8NypJ6BK6TsvAW0ej0SXj8XiNaLJ+P48WIaA9DqUUSZLQ7/ff2+/33xnH8TSFff21WiXP7ijGfK0AYK2dpsu371eWJWVZsnPnTlGW5dSxv1sq4JxHyvqYN2/evHdubm5hPB6zc+dOIYRg8+bNPk3TDbsYbHTvHYsJ4PrykKqqsNbeu3fv3icaY2i7RrRCSitwHG8TyAPdY6ufm8e2jVQd3XfQmP/5dYKGkmBNiQLiSIGxGFt/6mcFPPf8yL/hZRfwmueexpzei833MBikiHjI8miFOPIk3mFXRsTDU/FiE7tNnx8slnzo01/mkzfmQvVgV9ak/ccCvK2/pAwIJ1GNku6xuKbcbq3w4ggICAgIAkBAQMAjNnlM3fVlZ03iAafBC1Khcd7g8HgcFlCJxlYlSkFUQR947nn4f/d7P88T0n0s6AlMliBqWh3FEU5pcl+n3sZSIPKKxXyGv7ppic9+dTu33LEkSgGiD4s55A6i/mA1XbZp11T/n0ds8RQEALGG6LcEdn0tfMcb4G39fv8P2y4BR5oBcKRE8uEWANaT/AO1r2tfa9PJN8oGGI1GlxdFsc0YQ7fFWzdK/Gi4vkqpts7/6jRN35um6UJL/ltyfqBWfm0E/FBjfiiTxXbfzjmKomA8Hv9enufvGY/H03Fqyw9aw8X6uZjTTz/dDwYDFhcXr9u3b99VcRwzNzfn23Poigbt+QLTa/dwCQDee4wxlGV5Y1EU15Zl+ZlWBOp+drqfmxMhAKwVch4PAgBNORj7CQDWlAigFwnSWFPlFVg487TBRy86s3/lP3nVuVxyVkQkVzBukf4pAypTsmslY25unsSAG2XEvQHVsmGvX+DORc0ffOwmPnebETaBSdn53kSj4gG2tKgowlYraMzUrdvWugDIpPkbC/7kaGMbEBAQBICAgIBHyeShkDWxVx0BwEmwEoWYpipGUUJuK4yv7QKjmYRqNEa4lBnl0bbg6Vv5/n/6l29+6jPOijG77qQ3n9Y5lpWlkhFEMToC7ARR7qNwQ/ZwIV+5fSef/psv8ZXbS7EMyBhyHbOUlcgoQjYCwGrnpNVWT6sRIDYwBZSsbyAgphGYIAAcCUnsjsdGjvHdsUrTlLm5uW/PzMxcdCiS23WBP9xxPt4CwPr9bhT5Xh/V7xLMNsJbVRVLS0sfbIzfpt4A67c/kdBat+0db+n3+xcnSTK9Lusj1Btnaxw8g+NQ59e9d4wxbYvFp66srNxZVZY0jae+Et1xb0WLLVu2+jiOyfN8++7du88zxrBp06Z3zs3Nvbe9Dt2oe/ue7fsd6vwOtwSgvZ5lWd6YZdlbJ5PJnUVRorXa8PNzLG0yj0UA2L/k5gS3oewcjhf7l3WJAwq8rXTdzB8dBbsWApr7Wwl8VRB7SADlYessV7zipRde/8aXPJXnLuxjEO0Dn4PNKZXDKoFVCiU0unJEROQrFaJ/JrfdV/HeD32Zz/8QsSKbL9EogqoCB5FMqayizo9zwASFWZPyX7fcjRpvnSAABAQEBAEgICDgBE0gvuMHUD8hV6sAmqXMmqWjqNMu8Qng6FGQAk/fyrd/962vvOhnXnIBk113EDMiSjVmNEInCSQaM15CRx4vY8Z2jtzMcccP9/Cx62/mb242Yg9gYxh7iZAxpiyIRW04VlooBVg1AAdaCAQWL8AJhxcOL+qFpfAS6WWnbKAuI3CiIxo8xvtgH38canzchs7ncRwTx/Hzt2zZctPB6vyt9fs55W/UUeDApN4dEeE/kvr0wyFVByNx7Xnkec5oNPq9lZWV9+R5jvegtWqc682GnRO6reMOLqCY/aLcXVHFOY9S+7vst+0KFxYW/i6O45cmSTIlw22d/OFkcBzOmG1UMtIKIUpFlGXJeDxmZWXl8vF4vK2qqjUu/d3U+aqqcM4xGAyYm5u7ZXZ29uKdO3devnfv3m3N+Vw9MzPzgSiKDvM43UEJvrV2v7KN7vhGUdQKF7c3rf12tiaFj4TJY9vF4jH53eNB+dX0fSskXnQov/DIRvgV3k3nIy+YGsBab0ijGO0kVVnh8SgdU2mBMQVaK1RZsAD0HZwzx7fffMWTLnr15c9iIZkwq5aQZkRZlkhXiwjxzABfTEBYnDCIeMhiPuTv77X83x/8Gl+7BzFKIrzR4KuawK/xppGdb9a67eB+36NtlwK//xwWEBAQEASAgICARzc5FAo8xFqjTEYMnJGy9ZfedPaOX33zC5lXi6hyF7Gq6mwAZ0EorPNYD1qlZKUiL3rc/VDJ9V/5AX9z054//uESv54DMu5RWofyTS9lKZBxQilj8klOJBUCjxM1sXeyIaUN8ZdeI/1q9wCEmQoAXnjwKlzGYxAArK32M4frmsklSfL8fr//0cFgcFbbFaCth66Jodwwon8gF/7HmgDQlgRUVTU1hMuy7DN5nmOtJ47jNcLHkR6TlKvp5Osd9FdFArcm/T1NU9I0fVscx1cnSXJRa/rXNck73Aj14Yz3RuUD7TlPJjllWW7PsuyteZ5vawl+u621ljYrIc9zAIbDIXNzcz9K0/Tc3bt3byqKYtF7T7/fv3hmZuaWtiPFRq0Nj1QAWN/9Yr0XRJ7no6qqrsvz/JqiKHZ2yxMeieyOx7sAoHxtAotou8DIhkRrvHAoLTCmRFmPlgqkorIeg0RJgbQ5m2OYMfD0M/BXXnY2L37O2cwPcnBLRNohBcTJLFQe4j7jhx5gsHkOa0qMjliyfX64Q3D1NV8aPlgxXgasSqA/A6N9IYIfEBAQBICAgICTjB4KaNfNEuhHCirLqTG8+gUz/nd+/XI2J3tIzEOkfQ9O4DKPjLfgco/0TXi+F1H4lO/eM+bzt97H5256kFt+XAmRzLC3MCAEcRqDKXHVhERDpKCwAo/GNtF/J8ALj/AC6UF43QgBEoSrF5eNWIDwCBcEgGMRAIypphHmlmyuJ5CDwYDZ2dl7er3eWV2hYKP9r88meDwIAN1zKsuS0Wj08eXl5TdlWYZS0Rpn+i7BPJw+8VrXAkPbbnG9SWP3mkRRRK/X2zoYDG7o9/sXRVG037XqOvIfTgT7QOn+3XNev8+uyd/S0sp5VVVtbx3y1/tLaK2n5RRCCObm5s6dm5v7EUCWZdfu2LHjmiiKmJ2dvWxmZuaGVizYqDRk4+t7aAGg29qyHdvG12G0vLy8qaqxxg+i3d/xFgEeywIArAoAjtUafteUcrXtX6V305Wu8I1FTZNU773HeIvQIGJwDihB02NWJcTlMnPS8byfwl95xUU8/6JTiP0i0kwYDmK8mZCNc5QbksxvYbzjPgann4J3Fcs2ZSJP40u33c8/f+83hEphZ95koGld837vCBH8gICAIAAEBAScVJOPAvo9xUpm8UAc9dHeoEzJDPD6S/G/+5uv4/ThCmZ8P3PzszA22KKHigdQTkB7wLBSOQo1w2I+yxe/+SCf+sL3+codmah0ShUPmZQl2IIkdvRlRZHVCQhWiCnxr0sBaMg/UyGgJZr1dq7udADTEoGAoyMY3tsDdgbokh+tNb1e74LhcHhLr9cbrrZ/WxshPpwWaY81AWB9On3TKWBUFMW1S0sr7+lGjden8x9KAGj70K/vQd9GrdvWenEck6bp23q93h/GcUwURVOCvxFZX59FcKgxO9D4tin83ZKGoigYjUZvz7Ls/UVRrfFDWO8poZQiz3OklCwsLFw5MzPz0aqqti8vL5+XZRlN5J/Z2dkf9Xq9c7uRf6XUhgLGge6fja5j915u910UBVmWvT3P8/cXRbFf2cX6kpYgABz8/u3W7q+5Tt7VAoFY7xUAeHBCgnVYCS5mtW1tCb0SBsCZCc9/1QtOvekNr3oyT35ShDI7iX1OX8dIZyHWuEmGjIeYrEDP9DBesVglVL0n8Cf/8xb+8C/vFj6GfSWg60QB5QWV86GFX0BAwAlDCF8FBAScMAFAUtdxi6heyllvqZzDUi+OfnQf777tth++65xzz+CMM5/EeHFEpCK0b/okMQFrwNa9kiMJMylsnROcf9YC2dLud01G5Vf2jCfbkRGyH9cdCaxFSWitAaceBqJ58J0JsllYOuFrkYDa5xAB0ougoh7yKh8YUu7vjN9tF7hqiGcwptrjvf/3wEuAs2thINqQmB2s/nzt8/4RFwCO5G/WR9aFEGitiaIojuP4FVKqpyulbvXeL3Yd9w93/9aaDfvPt2JK09bvipmZmdsGg8EbW+K/3tn/QALG4YoxG12vbgZHY5DHZDK5fWVl5aXj8fgzdUq/WNMesUuahRAURUGapszPz7+z1+t9IMuya/bs2XNVlmVIKZmfn7+y3+9/KE3Tp3fP60BtG/cfV3+I+3tt1D/P89vH4/FLx+PxZ4qiWJPZ0BUuHimTv8d6DMgLMZ232wp50dTNCzxiI/LfnLbwHhkprAcvEhApWElUWbYqOKvPO9/4sv5fXnXF03jquTEUO5mJoSclblQgScGlCCTIFeRsxHKRscws+zibf/3vP8mff263mABLFkQiKJpKtKgRlYMEEBAQ8OhcnQUEBAQcR6RxQlEWeCDpxZTG4V2zaHOGBJjX0LNwzW9c4K96zXOwi/eweaGH33sfQpYNE5/DyXhaU+6FY6XU3Lsn4s8+fRufuGlZ7CihjCPy0iGFJ00iXFWvyOrIfmuw1BAIX7s+C1+/5poFpxVMjaTa1wMORAIPRQAP3CO+jfh2iZH3fpoNkCTJO2dm5n5tfeT6yASAR3cGQBuFXp+S3hL1JOkxmUxYXl6+ZjQaXdumwrfbHioK771ds8+uCWMURdFwOLwljuOL4jhmNetibUR+PQHvXqvDEQA26qDQnm9tdFgymUyYTCa/kGXZX7Tp8vX+1ZrSgG7GQDt2s7Ozl8VxfPVkMrmqbavXtvibn5/fG0XRgtZ6w+t46C4RB3f5b30riqJgMpn8XpZl7ymKYlpy0RUJusd/uCUUx/vz+egm/51Pr3B11hZuzXy85u6vK8j2E2gqJ3AM6/nerrAJxysv0v6yS07jVZeeRT9aQcmcRAlSnUJRQVZB1IdCwDCGdMKebEyZnMpPFvv81r/4u/dt38s7MsBHs+RVBsKS9hJMkYP1RCoit1WQAAICAoIAEBAQcDJBIpMerqoQ3oK30wWbSiTWQdqfZby8j9TDZgG/8Oot/rd+8ZVsVjtwo3sZpLI2EZADjI/BKHQcg8sx+Qg9O8uPdpX8zc27+Ksv3Ms370X4pI+NFSujFaImgrxmMUldVTo1mRK+IwLU5QKucWGWQQA4LgJAC2vt1HG+reUGiKKIKIqYmZn7aBRFV7aEbn07vce6ALDRPrsZAf3+kKqq2rTy7XmeX5Pn+XXdmvJDjX+XrEdRRJIkW9M0fW8cx7+WJMl+LvYtcep2Gdio68LhRK/X/103s6AlxFmW3buysnJenudVlzi3AsBGZL39SdMUKeW5jVEgAP1+nzRNr5RSnjsYDN7bGhiuN45sHfwPdn0PJQA0JQujxuH/a2VZHlaGwaPl8/noFwDqdn7tfC1wU8NWN20LuPaxXvi65voYtEzQrk/PGU7vm6tf+PSFD7zhZafy4osXGOg95JM9RPEQV0nyfTmzcwuQatixAwabYDjH3myZLJ3nm9snvP1f3iT2OSBWLJceiBjMzkbj5VFVv7dBKYO1If4fEBAQBICAgICTbvaRtQ25kAgHylVEeBofpjrKLnt1z2Nr6bkxc8DlF+H/5T95OedtFWi3gh3tw4mYKJnDlwJbFOjIQgyYMT6ZY08xxxdv38Of//V3+NL3KzEBkpk+47zACdksJCW+mRIFfmogJTv9ol1jNGVbAWBdxCngyAjGgQLU3aj3RiS8fS2KEvr9/mXD4fCGriN+N6r6WBYA1hvbrSfORVERRRFtBLtpGbhtNBpdnuf5YZjwrZLmJEno9XrTOv+NiP/6Gvv1x384rf8OJQC01957z9LS0h9PJpNfn0wmGGNRSk7FIGstUZRMTfagjrh3sxG01lRVteZYhRAMBoPLZmdnb2g9E1rC32ZAtPdg+/8DXeNDCQArKysfz/P8mslkcmd7HN3jW985oXvfHu/o/+NHAKiF2i75nxoDIrFitcxLeDrtAevuMH2liUvDKYrBa55/9ugtr38WzzjPQX43Wk+wVY7zfaJ4FqyGfAS+gP4AS59l1yePF/jI527m3/3RT8QIcKlgnNddBeopRhLrmMqUQIWKDMZAUAACAgKCABAQEHDyzT66WQQZiUaiG0JmcBg0qKhZRHmkMsy5gsTA85+Mf8c/egHPOqdHVC6hZdQsqh22KmpCJCVECa6wVICN5/j29kX+5K9uYtvXEctAFSmWjUVHfdCaKjegFHEUU5U5ylsEphEBWgGgXtDVC8pHrmXXsZDOwyGjDy+x2Nil/0AE9FgIjJSSOI7p9/vvHA6H743juHb37vRTX19TvTpu7hAETxz2eB8PAeBQz0up19Tst20Dsywjz/PrlpaWrmpbJ7bbtKSzzq6QLfF/S7/f/3Ab8T/Y+x/aGX9/sWYjktu+1hL4NtPDGMNoNBqNx+PLV1ZWvnbw0VxbetAlzd0yhW6GQ6/Xu2wwGEwFo4Od13pfgf23XXteQoi21n9UFMW1e/fufc+jR4zzG47fY1pgpM3EctM5epX8K4wF1R9gjYGqQkSCOJLYYoL2hvlYQ2a4YBO3XPmqcy9+/Yuewin9DKo99FMJDqqiIkqHIBzGFDhZEQ8ScqeY6FN5cGXAf/+zG/no53eLEbXLfwaIOMEXqyaFAkvtW9PxIggCQEBAwAlCMAEMCAg4cQLA6uoUOX2qjtw4BEgNkQZr8L7E4ak8PLiXd99y271Pvuinzr1oftMpgMJ7i/cF0ewAU1mkijGlQyUx2uXYYpmFuT5PftKTSGX5roceGH1vpfDf6w01VVlQlhW9wQzGeGxRkvZ6WFs1CziPwDekX9bGT6yu4k6UAPDYusgbEcWHZ/8NkfyKtfYr3vsXKaUWWoK3kcngatTZHzHhPzxvgUdGwOmef5dYN+79T1dKvUhrnQshvuecmwoBURSRpimzszNvS9P0N9M0/f3W4O9QqelHIgC0/1dKTaPpbXS/6zkQRXU7w9FoxNLS0tvH4/GbyrK879BR8P19Aw50HZtzvrjX6/3nKIrOWF8istF5dctJ1o9NLS6s9VDI85zxePx7KysrV4zH4y+e6BT/Y/18PhaWsAKP8mJq7IcQeBQeRX92/oJiNN6DlPRmBluryfLYlRn9yDMjQeSOVz9rxv/C659yxgsumuHU4W5S9hIrh5AKSFA6xUzGyDRGRAKXpuwsLJPeKXzjRyN+7z98js/fNhFSwsRLSjRJmmLKcvrdUQuNph7tJhMhfGMEBASE2T8gIOCkn4lEJ30TFL7p1ayUxNoMhENFoCWUBfQ8bBHwjl9/lv/511+EX97O5qTClhlxOsRUFqUUQgLG4K1C9BZAz/HdH93PDbfcxX/75P2X7Cy5tajACLAiBp3iZB2JbFNF6+hNW3HaHmPdEhBcEADW4ZHMAOi+p5SSXq/HcDi8od/vX9aN/neJ4upzR5YBcDTCwIHH5tgzAIRQ+6Xnr0+nbyLSjMfjy/M83yaEoNfrXZ2m6XvTNF7YqBXfwyUAtCaOXTf/tQTaTR8nk8m9Kysr500mk6r1LziUiWF7/gcy62v3r7UmTdNzB4PBDUmSrGn3d7Dzan0A1mdFdO+fNtukKIrbsyx7a1vrv1EJwaPjM9mFfIxPNLr+XnCr9f9OSCwKJzRWSIRW+KoEm5MqQyJBmfr747IL8Ve+6pm8+Dlb6bEDXz5IHAFyiCskrgApNHI2ZbK4iFrYyiia5aEi4Qvfuo9//9/+ftOuRRYBejphbCweQRQljKu8LikTHprvCRrir5pLYQlJAAEBAUEACAgIOKkmH4lsKLXD4dugugecBhQKicAgMJgmAl+X6ycgBGmV0/fwyp/C/5+//XrOGpbM9hwuz+r6cuExeYWWMeg+FA6DoFSO3WXMX3/9Pq777Hf43o8RcQoTAysGKiKkipuFm6+PYY1AUR93EABOvACwnly2LvZxHF88MzNzi9Z6Whve3a7e9ugJ/+GS4eMtAKx/rZvh0CXiRVHQmNAtxnHcZEisEvKNIuiH8lA4HAGg+9x6j4CyLMnz/N7RaHRJnuc7u60Mu/X4BxMA1p93V/xoSwt6vd5Cv9//aJqml7VmkdbaNfs/0Hmt7y7RFZWsraiqiizLfi/LsveUZTl1+H8kXPxPbgFAUn9prHoAtLBC44TAoQGDNwUzsWOgwGZwap+LX3JRdMvPXfZsLjhdMz8zwZU7kEyI0whEirMKGQ2wWcEkz5jZehb3rUh22zk+9Jlb+PD1u8SeAqKepBg7IiQxCRaLw6GjiHGVNW0Km3H2tWdM27y0CgJAQEBAEAACAgJOrslHExEBhooKrzrrUVuLAD0Z41wFWCSeDF8XLsmoXvx5h6ZixsLTNvPX1/7uZa+96Nw+sd9NRIGSUd2qSfYBhbUFKpJ4bVnMPStuE9/4zv1c98lbuOkORAUYBRMLuj9gUlarJL/p3Sy8ZDUDwAQB4AQKAC0B7BLpLtEZDofnxnF8dZqm70ySZE0aeh2dPjyif6DXTrQA0NbAr2/l1/U86EbRW1K8Wh9vjmLMj6wEoOtR0JJvYwxVVTEajX5vMpm8ZzKZYK1Hazk1NDycLgbT+up1wkKX/Kdpuh/5b38O5PLfzYZY31qwPTZjDFk2/r2iKK7NsqyqTf7qjKVD+SgEAeDhEQDWewC0nixWSLyQCCmxVc58X5A4Dxk89VRW3vyqJw1f9Mwnce6CZSjGeF+Ar1DaYb3BYdFJRF6UeJWieqewYxxx38os/+mPrmfbbYgxUKUCbxUYg/KShASLwWNR2pO5JuTvIvAxdclCRkQVBICAgIATiuABEBAQcIIEAFBNjaTD1U9016Pega+QQNRYPFk8Io4gisEZ8JpkMEtRZCxn/MXNX9++fP5TTnv1mWeeRlFkpEkfPHjnEcIhtQftEL6EKkdUOec84VROP2WWydID79q1k3d7XycYZHmFl7YxbHKdws1O/X+bIXCCBIBjJRjH/7iPrweAUno/k7luFLgsy0Vr7Tbv/VeAFwkhFtrzrsmgO+LxOFTa+CM5/u3l70bXW/K53viwa1a3+jsbZgwcKKX+SAWAjh/B9H3LsmQ0Gt24srLymqWlpY+1Zo1aqzVdBw5nbKx1+0Xru2R9OBxe2ev1PtDr9V7UCgvtuR3M4b87Du24KKWmJn9Zlm0bj8dXTSbjjxRF4Ywxa8h/a7J4qBKGR8cs/BgVGRE4IWpfFjwIW5driaaXizBYYxjGQA66gkufgn/rzz4zvuLSC9iajEnsHiJRNN0DYoTsIYjq1H0Zk1tFGW1mok7jtu0Tfufdn3/t39/DL8oIChTWKBCKOI1x1lJ52xybw7rpgVKr27XCLabfZIH8BwQEhNk/ICDgJJx8VpvpyXoxJFxDqpttPMQKpFdU1tZtnVqxAEiTPkWeE2lFrAyi8AyA33jTmf63f/V1iMm99MQIKUuUqKP4pqzQDkhSkILxUoFJTuXefYqP/M23+PSX7nvrvUt8cExdYmqaNXxb+y+drhdyvl5knsgMgEerAPBIZQC0Lvj712bXMMaglEJrTRRFxHF8ZV37np4bRRHe26Maj43aAj4aSgAO5GHQRuH33+fa59cT/2MtAej+31pLnudMJpO3TyaT95dlWftsNAJB+37ddPtDjalza4WONqofxzFRFJ07Nzf3o/X7X58hcTgCQHv8RVFsz/P8mizLrquqak0GRVdcaTMQHk0CwOMtA6DbjlVhOlkAq9tEcV3vPyPgZc+K/T9644t41tmzRJMHSVkBVyAUlKXEO02S9EApsJZKJOTRLHvtHP/z89/hD/7se2LJtz7+9WOUzDAucryoWusa2q6xWqRY25rbVoBr7AAlnqgZ+4rVPQYEBAQEASAgIOAkmoBqw7929WRBtiSgeapZ1CUqobQlHo9q/AK0jsiNbfbn6AGzwDlzfOA//5vXXn3uGREzSYHJ9xB5V9df5gU4C1qBV1QmpYy38GCW8rmv38nHv/Ad7rgfsVRCKcG27f983f4Pr+tok6/lCy89XvimN3WzrG4MC4SXaxal04yCIAA8LB4AG0Wuu1HeloxB7X7f7/cvHg6Ht6RpekQlAI9GAUDreHp+66PmXUK8vjZ+lWD7NSnxtagi17S0OxYBoD2mpjXhqDH529nuN45jrLXTNPv2vTdK0T+ABLSGoHvvp9e41+t9YDAYXNzNEOke38EMH9e/1hz/ttFodHldrmCn9++B9hU8AA6F1br9ev5vU/prEXjaYnV6At3Sq+a6iHr71gNA+sYMENBNtdjpC7zl1S+Y+/AbXvosLtiaMOeW6fkJ+KIm31LjrQShESqhMoLSalxyCg9MYv7Th67nr24aiwmQN+0Fo2m7WoHFIbRDRGBNfcBCKHwhEcRN3H9cH2/zA4PmzPIgAAQEBAQBICAg4GSFXLMwXKcOrJmwfOf/cqoPrC4OBYYESIBTewx+/52vGL3sknNhfB9bew6Wd+HGe5HDGRAJdmkZ1etBnDLOHGM1y63bl/mL62/hS99CTDwUQOWg8qBiAVJQ5o6B0nhnsLr2DjCAiOsjsTlIoVBOo5yanowTDiebzAF/dAvwwyXYhyayj+8k1G4Utmssl6YpcRxfsWnTlusP5DZ/IHLeJXuHE+A9GJHf6H272x9K4FlPPNdvf6jfj0QgOhCJXt9hoRUR2tcmkwnLy8uXjsfjr7XEf6MI/IazQiMGrDcTXD2X1dZ8rev+YDBYaASecw9WSrC+E0C7j7ZrgNaaoijIsuzW0Wh0SZZlHeLf/q0/RlHtWAm4e9jm3Ufar0BgpjWo1muciHBovHAIKiQlOEgkaKGxRlA6gUcipEAqga9KokjVBrHeI2UMpiD2hvkUnvIE/FWvO4NXPueJLOicXlGRWIcwqjHmK3GizixzUuF0RCVm2ZVF3Lek+efv+dz7Hhjxjl0GChIECb4RqQUG8PiWwK+/7I1gIRqpgDVfZ7pz/RwBAQEBjzSCB0BAQMCjAL7zc3TLyTr0Uj/UNkyQG6ov3Hj3u/tp/q5nP/OnWdq9m16iUf0UihyzMkHPz4Kw2NE+Ii0Y9FMWZob81AVPgWr3u0b78hctjfmzRIOKIC/BOM/s3ABTOirncKLxJGxCPF7UmaS1dYCqa0oRTeSqTgStycPD0wf+6AWAx/dddaAIbEP27nLO95xzTxdC9LTW01Txtoa7rRs/EKmT8ljHXzxsBP14ELjuPrukfn3afddfoI34G2NYXl7+48lk8k+yLDti8t99//Xvu5qBIdcIO71ej8Fg8Kk4ji/uZmkc+O/rY22FojiOkVJijGEymSyORqNfyfP8nxZFsYb8rz4eqwAgHoZ588TNH8f2zq6j8db589JLBH4aydd1Nj6muT5aRyhZk2rnHVEq8MJTlQacZ8ug/xKZT35y5iyXveHlCz/6rV9+Hhc/eciCXkYX+4gxKNF0D1AaUk2ZF0TDOZzs8dDIk0Wn8NXv7uR3/++vxLsqPrOnggIJJJ0J0yPwzbeMP8i1ORDBb58PLgABAQEnag4OCAgIeExCItqU0CZttDujKQepgNhDH3jNc5T/F7/18wzUMjFL6GKRmRQwhizLcbrPYLCJSWaoMsNwbhO7xiVf+uZdfOqr9/D1HzJ8MGNsIo2VEWVZkQ5nKIqCSHgiDabKMdZP0xO8AC9qdUB42aSq1m2rPHXP6iNdAq53gT82Avr4zwA4ECmr08UTkiRhMBjc0Ov1LouiaA2x7daOb0T0Hu4MgCON2B+sVv9w9ncosto68R8o0t/+3iX/TVu82/M8v2Y8Hn+mTfHvkvHu3x1q7DYqt1h9fTWKnyQJMzMzHx0MBle2JH4jl//1pojdchEpJWVZMplMPphl2VuzLFvTOaE9x9VsgZABcNTShaBJ1q/nQ+1AuTpq7lE44RCJJjMTwCIiUAK8oUm1EljlQUkWolNfIpcXvxiT8/xz8W954zk864IZTt/SI8HiSou3jkhLhLNUZZ3MXxUT0uEmlrOIXG1hRz7gT/7XjXxk214xos78KppjRahGo67lXCUVxlXhazggIOAxiZABEBAQ8JiEQCDRjQjQRFOaDIBaFKCp0a8TLrc/4N99w+duz5960VmXzZ1yKlEvRk72IX2F7s8jVJ/xuCCONIOeRmSLDLXhvHPO5Nzzn4hU2b/YsWv84GTibtUK0DGF9WAc1pg6BdkJUqmItJo6lLcigJcW6X0d2WqOy9V21UdB/FdH4dgEgMe5RNSpf19P4GoSN+0X/2fW2gebbICFxjBwvxr4rtN+/f9jvIePkMAfnUh06Pc/nNfXewW0Akk3ol9VFePx+I9XVlauGI1Gd3W330hIONyuCwfKdPCettUfvV7vnb1e77e7Ik7X6X8j4aLbocBay3g83ra8vHzJZDJpTP7WdpdYX06y0eGHDIDDFx+cqCvkaxtYg8Qjmv4wHoXxDq8dRLW461xzzaVARRFWWJJEICcrPzklMdGbLp23v/Gzz+blz9rCllmLWNlTewH4COvqbjBeOWQMMhII3WM51xTxaXzzrhXe90c38OlvZGIMWKnIvW/IP0jlm7YbdfRfCIcPAfyAgIDH7Bo6ICAg4DE5eUlkbemHo2qyAFjjHSC8JMIRAxEwq8BY+OWfO9e/5fWXcH78EIx24nwPJWOcr+glCpTHZxlCJFRigBhsZsdE85mb7uB/bfsO39mO2GvB9GYpvUI5gzAl0lVoIZGRpLAOr0TTk7pO+ZTeon29ngWoBPjD0GEPTOhCBsDBoJSapnhvlLre1pC3bd6iKKLX67231+u9M0mSDdPGj3T8DkbuD0QW15sZHgmBP9jfHGkGgBBiWg6xnoy3BNs5R1VV5Hn+8TzPr8nz/M6yLLHWEUV6Q6f9wxUo1rd23L/jg6Lf79Pv9z8ax/GVrYlg6x2gtZ5e//WGiN3zK8uSJuL/waIo1twvG12rVQEgZAAcy3t7FMJ7EKYx8WvS832EE1C5gii2CO0pm1PVGjwDqDyJL9DGcuFZ7L3yNVsX3vySp/PE+QgxWkQUBfQSqKqGwQsqU2FtgRcTHDEiOZ1lO8env/Bd/vh//uS6HyxyVSUEYz9TV+1LwOdAiZC1oOy6q2cbvocDAgKCABAQEBDwCAsATdst3KoAMF3YSvCKXhxjywyBQQO9qF4TvvLZ+N/9hRfy5M2KQaSgmpDoCldNKIsJcZKiZk6hWilwIkUNt7Cvirn1Bzv52Odu4fqvjMQeoNKSNIpRQlPlBZXzCKmpnEVGuvYHEA4wKGxTAtAs371o6l+PnDzWZOPYkrge7wJAG9ltSwG6deytALB++6Zl4ILW+rK5ubmPtlHiNtrdJYDHWgJwpCZ+ByObR1JTfyRktdtFoSXX7b6qqqKqqtFkMrlqMpl8Js9zvAel5JR8r71f19blH45LfnfbbkmHlJIoShgMBu8cDAbvba91K/y017obxe8KAM45jDFkWfbB8Xj81qIo1oyTtXbNua4/nvp5GwSAo517PDXhB6x0eFF7qbTmedID3iKFRfiaaysFQiuKyqErzxbg+Rfif/lnf4qXPP8M4nInKp/QlzOQGZAKV2bIRE/FgKzIQUoqPcf3flLx8S98h0/eUMS7KqpSQC6HlLbpSiMs+AxBsfrdIle7EBzUAiAgICDgUYxQAhAQEPAYRW2y5HF4WjKnmh+9uo2EyhkcnuFcn32Tigq470Hefef3733XYHbIWWdtAcaU4z30UkU0M4+MY8b7Fol7CZGOyUcTIg/nnLGZc85MOGXT5F07Hsh6+dhvc8bgTYlQCkOEkzFSxfXbe183uPIO0awWnWjS//2RT8FrycixZgA8zu+QA/R578pI6yPMDTHMq6r6nvf+e8aYRe/9xV0BYZUIHiMJEg+PieDxIm/dGvlu+YQxhrIsGY/Hb59MJldlWXZnWZZ4X99TrViytuWgOOpj6B5H16V/MBi+M47jq5VSC10RZ73JYDeLo434F0Vx62g0+gdZln0wz/Op38FGpH+jMQ8mgMf+ztpbEA4nBFb62rhFOVAWLy2RlAgjUS4i9hHSClxl6Ck4Y8DgdU+n/J23PIfnPuM0ypUHSBNH2tPkZUGUxCAkQkuQDmsySueQySzjcoY77/P854/czMe+aMWiw+U0Tfm8QSmJ9xaBRdWzRG08KFb9XR6W4Q8ICAg4gXNwQEBAwGMT3YWYbwWA9kmHVBLnKoSuI5e2LBFCo3UM5YQ+MAP8wqu0f+vPvYwzhgV+tIM0VuA8pD1c7hA+RegexjpKazAyZywGfOG2Xfz1393BTbchRoDVgrFLsCSIKMLbHCEqBCXgay8AJK7pey0x037XhyKwG/0eMgCOleCq/dzsuyTSWkscx/T7/SsHg8FH0zRFa90heYeOwB5uBsBG2x0qQn4osnq4x3IoAaD7d8YYiqK4vSzLD66srLy/m2GxvotCN+Oiff/143wkAkDr1h9FEVpr5uc3rTmhtpNDm53Q7eLQ7qMx+XtrnucfnEwmazI7rLVrsgXaUoDu+K3NZnDHKACc3BkAyju8ACvAKLc6fTcNYYSRyFLSY8BAaqzbC3jOOIV/dfH5/P7/8XPP4ewFTzTUGJ9hZIn3FThBJCN86Yj6CXjL8iTHxQuI6Axu+MKd/MGf3nHj3+/lZSPqjoAygqJcHRXv6xKz2mdGYLFYKpBmdeUcjPwDAgKCABAQEBDwCM9e3RlsKgLIzurMbTDL6WkOp8Iyqx3KwMXn4P/t776SZ56lYO9dSGlBDWHsIJmDJCIvl1EaIi1YmVSIwal8+669fObGH/C5L0+uuXuFa0s0Vg2ZWIOOHdZOULpOX61KcC5G6ZnmmCeNOHB08P5Yp/DHOoE5cnK79vzkIQl2m1aeJAnD4fC9w+HwnUmSNHXmdk0bvPVkd71p3JGSrONNylq3fDdts6anwkdLoNtzstaS5znj8fi1k8nkM2VZPiwZDAfqsNB2FGjLDlqRIYoiBoPBFb1e7wMgh0qphfY4W5Ggu++W4DcGhddkWXZtVVXNtuaYxl8ccwrNyewBAMZ6oihCSEtpqnqujprDKkHJIbKKSF1Mz0/oscLZm7jlVS/fcvHPvPR8ztuU0Y/K+o+kgliBzTDVBB05kAJizb5xjo1PpdBP5MN/dRsf+KMfi90elonwQgMFCDc1jW110VqsjfCN10yd818haoeAwP0DAgIeswglAAEBAY9tAUB0fsfX7QA3Cs209aWiyVNG4EnJncRg2Tfi3V/88t29c86eedF5Zz8R4QWUgNRYb/GiIorBmgm+mtAbxpTjPZxx2hbOP/scZmfkZZN9e9+1tM+92/qcJBZ4X+Ka7gQeUCIiiQcon1CUGUr6us70mAbhmGjzMZKaE53CfHSk83CPv0vmm6j2Nmvt95xzl3nve1GkpwR1vWFca0R3uIZ+JwJtlL6NlLct+4QQRFE0NVFsiP/7JpPJG4ui+Ha7zfFEN0OiHTutNUmSkCTJb2qtXxRF8Ryslm60okvXq6CqKiaTyQdHo9HlWZZt67r7H+v9d+xjcPKWAHgBUZJSGYOtavKvZDMdOokkRlqFsgbJPjZFJc97mvZvftWTznjtC5/EU8+K8NUutPZ4I6hyi7QglEBqA5GlImdsFTZ9Aj/aGfN//ZfP8aef2CeWgTERjl4tHGAB16T7r46sXVNaVpd8KDzRtIFhEAECAgIeu0vogICAgMcgZJ27KdZF+v1qBKdendULON94BqzZVg7BeuLUoGxBVMEmCf/6bRf7lz37LOb1XhbSCqjIVhbxTtAf9kBbbD5G9QZUpYL4NDI3z81/v5PrPvt1vvzt/NTdBTsZwu5JXU2g4hhvBN46YiKiSFH6vDEIPFqSFDIAuoTxyEmbPOzt2/Twtu1ckiRXz8wMPtC2DOwa1XVTyI+F/B+raHCov+8S5lbk6AoYjbv/vePx+PIsy+40xqzJdjheoka3RKDNwGjHPU3TfxXH8dVSyrOUitaMeWv+155LVVXb8zy/ZjweX9ea/HWzNA5VAhMyAI4vjK3T6ZUCpSKkT7BGIrxCec8gBlvs49QeW196idrxplc+ledeuIVZNaYY76Y3SBmPM4bxZkgGsLyMFTlqWDD2Y/I4Qc1dwBdumvCe/3DTB+/ayVt1MmCpGGMV4HW9DHYW0QgANHKAF1C7fDZ1CQ6Ed8R4EgweyAATvogDAgKCABAQEBDwCAoARA2hr9ZkA4g2uOehNgRsl3YV4PDT8E3UGPGVtBGgfrPX179ozv/jn30Bp6YrnDYwzMS23r+pwBXgbSNCaCqncXKI1fP8+KGCj3/+W3zqi7uu276Hq2wCVqeMMot1llTHJAqyIsdH6pgiSEEAOL4CgHNuDalsRYC2M0CaxlGapu/t9/u/05YFHMlxHm/Sdaj9twS7TZVv6+eLoqAsy9FkMrmqLMvPFEWBMWa/EocjG+tDb9vNluhmACiliOOYNE3fkiTJO5VSF9XXh0UhxEJ7PVqhpizLbcaYbZPJ5FpjDG3Kf1sOsOon8GiYw05WAcDVpDtSOOepSg8+JhU9Ii/QjNGUPPMs/KtfspWXPvc0zj0jImUFbQokksoqenObMEslZZ7Tn58FUbFULeFnZnlgnPBnf3UL/+0vrcgAFZ/CSjkBPa7nXbf6PbEa42+6+0nZDE8zRt4hLCRAXOd1BQEgICAgCAABAQEBJ0YAAJo2TS3f8HQFgKgRARyiEQBasUA6mJudYWl5BYdGKF3XBQuD9nD2PM/4V297xe2vesYW9OhutgwMAkM+zkkH85iiRPdT8DllliGjHiQL/Oihkm//cIk//+R3ueN+xK4CVJIgdERWZThj6/aAsk4qDQLAo1MA6EbDu8R09b0cURSRpunWfr//0V6v99I2df5ALf66veyPNw5HAOimzgOtu//7six7R1EUrDf5awn04ZQBHEuEvB3nTtr/W6IoulJKea6U8tzm/q+UUgutcFGW5fY8z68piuK6xqxwTfu/breH+tr6R8EcdnIKAAIHztWt/ZQGr7GFQ1MyB2xJecZLnzW8/eWXnsGLL9nMwmBMme2uLVTlAO8ShIvI85JeL0GlkqVsiUzETOQ8DywPeP8ffZXP3DQRBWBEH+NLlDZoAcbU3w9OULccBBwaP1WRacrFmqyx5r9RZ9SqViwICAgICAJAQEBAwCOzeFaohuWbeincFQBgXWcAR1vriag3Vc2Gm+Y3vWTXvuUvyjjBGgMSVCoRo4xZ4J+8Yav/jateyoLcgxk9xOygX0eIvMCZEqnKemVoK7LcY8Q89J/ALd9b5LrP3Mrffm1F7AMKAZkHIyHtC6qyPcYgADwaBYC2Br5NQ+/WltdE0kyfb7oFvK3f7/9h2y1gvdN/l3xu9NojLQB0iX9VVWRZduNkMrmqKIqdbcS/TbFvz3O9o/+xCAAblRGsbbNXmy+mafq2KIquFEIseO8XhRALQogFpaKz2jEtiuLaLMuuaUWL9R0d1hJ/cUAX/yAAPHJo77FepFFUUMIAeOEzUv/K553Dz7zkycyle+nJPQi7DMKjZExlY4rcMezPkY1H6H5MhmfZetTck/j81+/n3/y7bw93ZIyRm1l2ljjWeJYpq5JYrpqy+ukoykaM7ZrI2kYAWP/BCd++AQEBQQAICAgIOCGTV5fa1ws5uW591ngEeLkx2QVmhjMsj1bq7QREvYQqK8BDT4B20ANe/ezI/9NffTUXnd3HLP6AVBSUThCnKeCoyrqlmOz1oVIsLVnS2Sdy1wMZN9z8Az72+e3bv7OT83wPTG/IytIErdRB2wAGAeDECgBthLwbJV9fQ94llU2d+tY0Td8bx/Gv9Xq9DbsDPFoMAdsOAFVVjbIse2uWZX9RFMUBjQzXj+Oh2hQeboZAVxBpx1hKSZIkW7XWl0VRdKVS6mLv/aL3frH52wXvRWWtvbUoimvLstxeluWaLgBdr4L1LfzaLg5BADgxAoAVGtWbxxQFuthHH89ZM7zkBRdx489e8Qxe+cLzqUb34LLFuvZex3gXURYWpSJ0P6Xc9yBxv0euYnK9ie/eV/CBP7+ZG76KMEBFSo7C4XFUOCriJKIoKxpv1ub7Qq4Zi/q7xaE642sB0/3SgToFIIgBAQEBQQAICAgIeGQFADqLOIdcTeFsYzuis1CeRtslIIijmLIqkLHCi9rgDFOne6a6LvdX1AJABDxphn/2G7/41Pe9+RU/hS53MFAZ0pVYoacRRUEbNFKYUuHjOZbLITffsYPrPv8t/u72sXgoB5dA5RNAIjGAWZ2Qm+P0YjUa5ZoXZfOa8KwhMGu1gHab1W33385tSCKCALB2nwcjklKu9rLvmtFFUUQURWzdutVvlIJ+uELA8c4QMMYwmUxuXF5eflme5/u1LuwaGq6v0T+cMT/U8XcN+7rEvPVdmJ2d/Vgb7e+M22L7+3icvamqqu1VVU2jyd1j7QoU6zML6n3ZYzr+YyfNJ/LzIxsTvM69jmvmhzrt3XfnTmQzj9SPXqydc4RfnauEpyO8rr5fd38eibUSRcm8dFxwOg+94WVnnvrGy5/Geac77OQ+YlETdW801ii06IOMoSoZFznJTI+lymKSeb5y+7381z/9EbffjUDDstHT9n0Og5SOyjWZPI155Or1WysUt4aAuvtZ6QoAq4lnJz6JJCAgICAIAAEBASfzBOb3W1C7VWen9nHNwtsdfCZszKESBbEAb2Ao4R+8+jz/Kz9zCc8+dS9ifD+lTEAlaK1RGHw5QkvAenwFyDmcWmD7jpJt3/gBf/O1n3DLTxD7+jOMrQYmRNIgnJ12LihLh9Bx073A1j2tlUIKjTAOVxYo7aek3rULct8sxr1EOY3wYioaADjhmsW7n/azPjLS/HDi+EYwD5Revvr78SVwWmv6/f5lMzMzN/R6vf0i6lrLtr3gmuj04Y571wV/vVjRRujXZx+0JQ3OOXbt2iHa91+f6n8wgnukxPdA52GMqz8zSk3fXylFv98/t9frfcA5t705nnOVUhcLIRaMMduyLHtrURTbq6p42AWkh1cAc8f49xyX/dfnKhEuaUxQ6wJ36R1O2loMFQYnV0m+8LVnimjmFSegkhUIgfAa4URdMo9DCYuS4CoHUiJljPMC4x1eOISCRBri3LO1z9YXPSvd8b+97tlc+sxT6bMI+S4i5fDGILzEGIVWSS1YVAa8JJM9diVb2McsH77us/z5R3aKca27MrZgieq5c9oWlmnUXzbU3jW5ARtliol1ozdtLNttPXvsnSQDAgICggAQEBAQcEJnQy/XzIo6UpiymjpEt4+DCM7fwlevffullz7nKXMgHKaakETgihViWSFNhkgSsBJKjbEpRJuZ2JSbv3UXn/jqD/jk7YXYC1gHlasfdSSROqWypnZltw6PxXuLs74uS9UxaRRjykm9jJXNAlUybYMovUY6ifQK4RpCJ10d25N1doQ4TAL+eBAANjqH4y0AtOQ7iiL6/f47B4PBe9M07USozYaR6aN5/26WQisIRFE0JfdtZLwsS1ZWVq4dj8fXWFut2X5tffzxFwDaEpZ1JRQL/X7/o3EcX2atXQRwzm13zm03xmwry/KDbcT/4UzhPxkFAHw0jdxLDwiDE74WAKTBrvtzZUE6jfISK8BoixcgXYy0EuUAb5CiQDRzknUS7zUChdYCJQ1Qokt4xhns/YevOnfhisufwembHap4kJi8pueVAR9DFIFUFMvLKJ0iRcJ4VCE3ncu2u1b49//9b/juHQgkZK4OyieDGcZ5USu2wq0h68KDajIDLLYRAAICAgKCABAQEBBw8nD+NRkCct3M6KZRIw1EnSyCCDgthl+78nx/9VUvJirvo1q+h4XNae0u5Twuy0An+GhAYSLKMmamtwmXwb0P7eOGW7/L9Tfv4ev3IAoFeTwgLy1Ii+pF2HxSexC4OgvBOcgsFFqgoh6UDunbqH7940T9nPAS5VfTdtvXPGBlMe5fPwAAaBhJREFUE+n1spO6+/gVAA50/I+EANAaCMZxzGAwuHIwGHw0juMm6m3WGAt2I/lttsDBSavYTwBYv5/Wub+qKsbj8fbxeHx5lmXb65R5v6FQ8kgJAFGUUFUV1lq01vR6PXq93gcat/+FRpzYXlXVdWVZfjDP8+2tb0F9nA9f+PVkEQC6HSx8Q45FMw9086JW5xOmc0UtKEqUk1jpKGILCITpERuFxiFEgZMFFkiGCctjA6ZPoiK0HSEpOX2OZ5x3Brf/zq++jPOfmHLqqR5X7saZZfpao9wQcg8GTDFCJwJmUnbtXUH1tuL1qXzkr7/Of/2LB176wApfdEAUw0oJFkmUDsnyDKRdO0atOLpfBkBAQEBAEAACAgICTroJ0K9fMDdkX0rqdFbj1mQCaAHWw6yAFz0d/8//95fz3AvmWH7wDgaxQ2kJSUyVVXid4kVMsWKJ0aQqxRWG3Hm+dseDfOobD/J338t+5weL/MciSXFa4/MRWkNUQdK2n9JghGQFT2kkCWldjysdTthmQe9A1HW4yq89PyvBdmp3lXt8CwCHPp+H7/03fHVNxwA3FQL6/f7VaZq+t9dLFtp6924pwPpuAwc+D7Vf6n7X9d4YM30cj8cfHI1Gb83zvL72SmFMeVQZCA+XACClnpL5NE3p9/sfiOP4au/9orX2VmPMNmvtrVVVbSvLson6Hx8X/8e7ALD+mrUp/jW5bzre+dZjpPFTacqFurX/yoN0EqsMhTL1HGl6xF6j8aBKrCypRG2ngpIkagZVZkSm5OwF3vaGy075w9e//Blc+MR5sLuRch8qypHC4UuPNH2U74HuUSztI5lPGVvHWAy4Z6/jj/7ii3xqG2LiQUaQVbVJXxIPGJcWi0BphbGT/V38HbVJADTkPwgAAQEBQQAICAgICAJA21tACPB2Wg8q10+aAgYxiAIWBPz2LzzB//KbnovMf8JMapgUOd5Bogd1/WxeISIFSuKyCqmHOJuwfXfF33zzJ3z85vv47kOIJSspraSnIfIeZyylrZeqcZSCMJSlQ5LUC3XpcKJxpWpqedvjlH7VH8CKugVh+6KyJ58AsPZcjq8A0I2mG2Ow1q4xCZyZGfyHOI6vTpJkqJSansfhZgAIodaZEso151dVFSsrK9ctLy9fVRTF1GDPOUebAbBeAOga/B04df/h8wCIoog0TRkMBh9NkuTK5rhvrarquizLrjXGUFXVhp0JQgbA4e1/w+wYYbCNoikcKLdaOsRUBBCNV0j9XrKp8ZcenDS1KR40qf/1vW6lw7TeARG1fUkJWxN44QXC/8yLn8Irnn06Z21NyfbtotcTEJc4XyBxtcpZRVSFR4oeKplnb+YQs6fxhdt+xL/9w5u2/fABLq+AtAeTrM3u10h6VNRlTnGsKMrRtLvLmoney9U5PggAAQEBQQAICAgIOHkmP7nfUlquFQJqq30AIiXREmwTVZUactPWlMKMgL6Hlz4D/46rX8q5pyUkMkeWE0RVEkO9GrYFXgmETsHEmInHJUNW/AxfuXM3n/ryHdz8/aW371jh/aPaYwuhJZWt+wRoodE0/dlRjQFgXdPvhWsW6BsIAICRde0uUtYGh25th4DHswCw8Tkc/wyA1nSvJd+tOV/9HPR6PQaDwX/o9/u/E0XRNPLfdd0/MGkVU1LcEuOWMBtjGI1Gl+d5vi3P86kPgNZ6Wve/UZLBIykAaB2TJMlC0zbxau/9YpPqf00rmFhrpw7/Wuvp+B3o+IMAsPb+ONC5euFw2q8TAOoUf+E0Xqw6hHjhm6wit0ZgFKLRSH19JMbRzC/1BBtHQAlnb+ItV7zglA+/6aVP41lnzzLrFrGTvaher56gfIGzJVJLSFIgpigVlR8gelt5cDniv/7JJ/kf1y+JQkEpoXDgbT2PJ3qIsQLjPaLuZYCnAorVTgVdE9ggAAQEBIQ1cEBAQEAQADYSAKRS+CYDwDuzZskulMA4j9IS5RxYiFRddnrmgHP/2a9c8qM3XXoOm8QeRLELqSqYHYIpWF7eixYJkZhDyhSnYyovKErBjr2GL992P5/92t18b4947UO5/syKdUitiKTAVI6qqo2xpChBmP1a+0nfRutWF7xeSCwaKwReaMChfHVYRoCPdQHgwMf/yAgAXZO7rihgjEFrSZIkpGn6/IYIv7R1xj90G7q1LQqNMeR5vphl2VvLsrxuPB6zUYmBUmrqQXA0hP7hEgDm5zddLaU8Vwix4JzbXpblB4uiWGwj/krtn+EwJbAhA+CoBICpwCPANVknwtWp/aoNlnu52lkEpv4hCFNz+2ZuUVYipQbpqTAY5xEeYgU9BamFZ56Pf/3Lzuby51/AExcEfrSDnrcwO4ClJYgk9HqgNZQZVVZSRgn0tlDGp3HjrffyX/7733HbDxBW1NYAFRo/beNqaPOzelGPsioAgxIO64vGz2A/6akZjCAABAQEBAEgICAg4KQTALqBoVURQG640JYIokjVBM5ZVBxhqgoApcE2GQEzwBzwup8W/tff8AKefeEm8tEDoAqSQYywJVLElIVAyQSBw5ZVvQjXs+waae540PDxr93NV+98iO/cm4tSQJxqykpQWoWINPgchFlzzLXJVUcEaE7Oo7FC1f23RQR4FMVhtQIMAsDREbhuPX+bdt+2uqsJvu9kA9RCQL/ff0u/3/9wHMdorQ9xXdT076uqoizLbVmWvTXLsu1lWRJF0Rp3/y6Brn0D3H5j90iaAM7NLVzZuPvfWlXVfqn+G7Ux7B5jK2AEAeDwBIDudfNInIzrdqHeIbDNYz0fdsuGvKDTTs81pQLgqxglE6R0eEq8q0iAuQgWIl7yMy/ZcuNLnvVEnvP0UxioCRT7SHXdztSUGbqfABaMxyMQuoeNB2RiwD47w4c++WU+8tf3ve9HD/EOK6Dy4IiIVEJpq9UxVArhBN4bBI5EKSqbT8dnfxEgCAABAQFhDRwQEBBw0goAGy2n/RovgI0X223kvF4c6zoX1no0hgSmP6elXParV55/w8+99jkMxB5EtUiv12MyGaElaOFRZVWvtKM+iITcSMYuYt9E8uVvbef6r23nG3dZ8WAJVkukFhSFJe5HVJWtF/pCgvEQRUgErsiJlKzraptzcU3kzBPjRJ0BUAsIRzmGIjTBPib5oEnbb1372xT9phQgmp+fL7XW09T3lsy35QQgmUwmrKysvDXLsg+2Jnkt2Ts0UXcPC8E/ENoIfmtS2BL7NisB5DSdf30rwkdGQDrmK/ioEQA2vmYH3r9Hg0+a2v0KgUVSAm5K/lWS1qS7bK5fHNetF6sCiJFqFleBshU9WRK7MQsanv9U/OWXnM0rn302W/uGWBt8uYJxDtXrIZIISwVyjI48RDFZISj8EDk4i1u+t4c//8RX+MQXczEBCrkq0gpXl1x5wAq9uoz19T8C15nz2EAAkIBqtrdBAAgICAgCQEBAQMDJKgK4NYtjeYAFtFvz/2kbwdqjH3xNsRVmOrnGwKkx/Pxrn+R/+WeexylDR7a8i82zGsmIarxIIhJQMXaUUXlIZ4YQ98lXJixVfe7aKdh2273c8M272b7LirxpB1hZ8AqS/hDrJGVWAhIVa3AWfIFsoly1F4Cs03vbCJg4tghYEAAeHgGgS9bb6LYQguFw+Pw4jq9O0/TXer3elFC3jviTSf7Bpmb+1i75bwnhoYn08RUAuufXfW7VrHD19VYkaMfg8I4jCABHKwDgNfh63hKUICqkMFPy7wFrAaVAJUz7n5gSrEWqCGccvSRGFRnKV5wzw1te/MyFD7/m+efwgqedwiz7KJd3kKYaZmegNDjn8WlKSYWIKpJBn1HhKeUcIzvHpz7/HT503Q+vu2snV2VAIdZG79tOBLUAwNTPpI7mr26zfl5f3Yfu/BIEgICAgCAABAQEBJz0E6A/igW6BiQS2+QFeDwIw8wwolypiIEUOH8TH33bL7/syje/8pnku76HLu9nZiahKhymMPTmZ+rV7cqemt0Pt1LZGKMWWMw0N31nO5/7yrf4xg95+wNLvD+ZV1sf2md3WkBFA5xIMNbWi2HlEFRIylU5w69bFE97GwQB4ITehx3C2yXDbalAr9fbOhgMbkjT9CLvPZPJ5I+zLHtrUVRVtw1g1w+gTZ8/kQLAwc63FQA2er/VFH93VMcfBIDD2b8ErxB4ECUSN20L2JLrJE3Jc1fn3kcpkdBU+QSFY74fU2ZjEgELPRaecR57X33pU3ne08/irHnJjJwQuRG4HFyBKTOc98Qzs6ASlkcZ6eZTuGdPTm/TOfzg/oz3/f8+w1f/HlFJyKkTmprA/hqxVjTUfcMGJr4zt/v1T8s6U6rtbRhKAAICAsL6NyAgIODknQj9IRfqboMFtUTh0M0i0qCxiMZcoCbiw77G5wZhYChAe3jFhdL/i7f/LBec7hnt/TEy0qRakO17iIQKPdMD6/GFRySzoHpkRjKxEQ/tq/jsl7/NX92weO3dY65BgVea5dJREKGjASLS5NkSQnskZe3W3RUB/MH8DoIA8EhhvbldN82/KwRIKYnjmDiOI4CyLKuyLJFSr8kcaPfTigKPVgGgfQ8p9Zr367YkDALA8RYAaFqAumnkn07031G77MfpkDIzYA2plMwN0if4cnKfKQybNDz76fjnX3w6z7rwDM47bZahMohsgrQFvUhSlstIVdEbJOA8k1GGpEc8ewYPFDF7zAz/89O38Kcfe0AsAS6CzINdVSlRvknbbzKXHA6PrcuXDq3idn7vCp6B/AcEBAQBICAgICCw/yP8s7hZTBocds2M2tamSqBCeUcM9CVIVxcMzMcs/N5vvXLvTz95ltNmLNrsoR+V+HyMy0ui4RwYA5HCe8G49Ohkljie4567d/DV237En35u1+I9i2xabpayldJUIqUUktKVeGlWnbtZNQSUQQB4dN6KHQLckroDueDXbfD0Ac3rHg0lAAc6rvUCwEYiwJES4CAAHI0AQF0GJNx0Umv0wUYAkE3bUU+CJfZNtxPg1ISXvPaF3Piql5zPM37qNHBLVJN9xDJCMwAfg3UIWVH6fXhREkc9vI0xxZCJ3MK22x/kv330O/fe+SBPtICPt7JYjkGMVwv9HSgfAT0gajKsCqBqfprWBYclBMhA+gMCAgKCABAQEBBmwIMsGA+CNh7lm2XoGpdpr5stJEiDcFUnflUvQRNgALz6OQP/K29+IRc/ZRN+/ACRy+jHCjsZoQYp1fIyPoqIB/M4q8lGJbEVOL2Zr9y1l09+8Vt8+ZbxS/dUfDEHRkCJhijGUuLEqimWaLoCSK8P0B4rCAAngvCvr5PvpvKvd8HvEuXW5f3hjqA/XALAgcj8qqCh93u/9eMQBIDjLADAmlaiXjRE2WuSKMVVGdJU9BsKPqOJnvFUypdf/ARe9ZwnsXW2QkbLlMUikYZED7BViisVaX/I3sWd9OZjSmDnYsbCKU/hnvsq3v+hL3D9txDjZg6Vagsr1uPxSDVGxxVl6Wp+7yM8vWYGddAIAKITxffr5/OusOvXOgKII5/uAwICAoIAEBAQEPD4gGxmQbehEHCgCbJdLK+22Guh102ujiROqKoC6x06VnWNPtDvx5iVkhTYIuDNl2/yv/j653D+qRE+30HChKrMiaMUHc9gCrBWkCR9EJI8N+TRLDvHgm9+934+9YVb+er3nFgBfBIxNh4j6fQAAOFqYaJ+BC+L0AXgUSgAdEld1xRwf7InNyTJ7XOPVgFgI4LaCh5HS4CDAHB0HgDtDOZF91gVwku8LZlLNZHN0BU883z8a192Ps9/1pM4a1PMvBkjqhWMz4kTUEpSjEfIAqJen3LfEvHW05ksj1kWQ/ymJ/NX277DB/7H319+z4hteQKVrG0ChI9QaBQKS47HdLKqmi4r3gNmWpGlvEQgm0QBh2+zAaYCwLouLh0vAdfuLiAgICAIAAEBAQFBADikANC+KFbXlnXAqU79F82SVFFHtFybai+oawDaxbaFYRLh8zrC9sKn4H/zl17IC595OtXKfcwkClvkSKdRXiOsq12vhaCsDC4eMLERRg758c6M62+8jU//3QNvv2eF9xeAUVCJxvW/raP1ul74CwciB1EeERHpZg1IBCGl9ujRTdM/UAr/Rh0CVp+T+wkD6x33T6QAcGjhQxzw/A/vOE5uAaCeUxzCO/B2v6alnvqz70T9Sm0C6lbnNa+az7OfHqvwEuEFyntme5JqMmFBweUvmPFvuvyZXHj2kIEe0RclYpyRKIX3lsqWKAnSWYTzICNI+kyWC/T8E7lrj+UP/vJG/uqmQiwDhY5AVNMJNRIJrrIoIJKKwlWYdp5tT8y7NeF75UAQNXNsVwCQG1+LRgBoswMC/w8ICAgCQEBAQMDJOgs+bCvBtUvwtammzWuiG5OPQAgiKRAmIwWetMCv/sqbz/vjX3rDi4jynSR2mZ632GyEc4643wM8hXFE0QzWeoqiwMuYpRK+dNtdfOxvd3Db3YiRg4mn7g6AxHiLkBFCR5S2RKsCcE0qeX18SjR15c6vORffGIQ5wMu65aHynTTigxC9Ry+BOzyiejACf3wJ5CMrRhw53FFc84fz/B/r4tPRn79HYkQEwqFtjvYO1ZnOrAAjFcZrkHFNyJ2FqkR6S6TrriVKCYzNAUccRdi8QjiYTxUitzz1Cfifeck5vPJ5Z/OE+YqBWCb2ObYoiHSfqrIo4ZFJBKbCO4+IemQl2GgO2zuVm+/cwQf+15f5/O2IZQE2HTR1U1lN6hvjAbGueZ8/xCq1nnsaX4zuvXA4fgABAQEBQQAICAgICHjkF/+qaUvlkNqhrCX2sDmGJy7w/X/xT1781IvO3cJCnNMXGbiMYryEjiTOC6zRCCFIEoWvCkZ5iepvYfsuy7avbefjf7vr1nsXuWTZg1MpOZLCWpz0oEBipgKA92I1ZdYJPJ5IrRIUL9yqACBWe20/ngWARzMBDAJAEACsqJ3ylCtQ1IIczWfUAl4nGCfAyZoAC5Deop3DCYfQEZUtkAJiJdDOkQqYkRAbeNPlZ/pLLzqL5zz9VOaiEW78AD1domIPpQHfr8WFCPKVJaRWRIM5RrnCJVvYOYq57rM389G/eeiN9474xAgoFSCi+txt1bTiCwgICAgIAkBAQEDASYBIgzN1PaqkLnOVrnYSSIBZ4CUX9/xv/tKrefIZMXblHhZigzYZUgjQQ8oipyjHRJEmTVJcJSirCBvN8+279/LRv/0213+9FDssVESUQqC0JUo0ee6b9GA3bSPXTcmuKov0rXGWm5puSd/qBAfvIhAEgCAABAHgeJ2/QzWfTVtb52GFxIu21Z2ou4hISSQFUng0Hik80nsq75kYR29+Hpsb3GSFGWCzgBdeiP+HrzyP51x4OnOpQFJnCUhlUdrgxaR+74lG65iCDNWL2Z2NyNUQkZ7JN7+7h//nj7/JD+6lTvkHpO4xMlmtM2qgDN8BAQEBAUEACAgICDiJJl8FKAFKgfVgbPO8TFESnMlJgDNStv7GWy7c8XNXPBc9foCkWmKgLbbKUP0+psgoKksvTjBFiS0renNbcXqOn+zz/O13dvJXX/g2X7/TiBKIEhiV4GSERdW14qJpOYdFirp+3FqLxNXdA2BK/IVvywHkMXYSODiBOzIyGQSAIACcPNdf4JC1TR7GS6zQeKFA6Cal3oGpSGJBLD1VWeLs6tzjJKg0wVQFsYGBh6edwvf/4SvPeerrXnQOZwwLemoCWFzpcICMIzJT4GXBcHYOxp4sr3CJZsl41Pwp3L2r4P1/8iW+eDNixdQcX9LDoKga9/62GZ8lZOYHBAQEBAEgICAg4CQTACJVr9WdrxfEFlmXBQhHb2aGbHmJeQkzDp79RPyvvukFPPeCzZzaz1DFfVTZClF/C6QzFOMxQgviWJJPSqJ4llEpKfWQB0aOG27+Pp+48SeLd97PphwwSmFEglASlMA6hzUFeIOUjUDhV4m/a4iGI2rIXnWMJCwIAEEACALAUZ+7cLXRnxc49NShU9Kk+uNRwuKdw7h6flEapNZIKSkmJZtiOC3hDS/+qfjjv/L6F/CMczdBuZtUF4xHexjMpOArqDKIIvCQlxYjFF7FlKKHj7ey4mb4o7/8An/yid1ihTrin85KVnKHrWqmr2h/FA6PwTUSRkBAQEBAEAACAgICToLJV8t6sW4bHuORoBROg0eAdei0jxmN6OOYBQbAmy6d8b/0hudx0dkSP9mJLSWicfpGglAO4x1lYUh6fYTSLOaexSrhoRXFjd+4h+u/+MPr79vH65arerHutMTrpOEQjkg4fFmhqMsSfCNOGJFgRALCo3yBwBzDKDy6BYBDkeJjP74gAAQB4Civl6iN/kCC81NDzjZjR3qHFALrLB6IIomMJA5fl/ZUcEoEP302/k2vfCavfO65bE4niGIvkTAoYUB6vC8w1RiEJ0p6QISrIBcp1XAzu7KIr3/zHj7wp9+/6a49vMBKWHbg4pTS5FOrExxgQHvQxEgkBSU2dBEJCAgICAJAQEBAwMkBSV3pD0kkEL7C2qrOBGhm5ngwpBznCAExBu2g34gApw34V7/5Cxf+/kuffQZb04LJrvvZlPYQc3NQOTJTEM9oMpPhKot3EUovoNQMO/aO+cF9e/nUF+/gzgcL7rwfsehgBPgoBSmRwqFMTtRkALTO4pXoYUUCAoTPUT4IAEEACALAI339rZA42ZgA2orI1fPDNFsHEDqhdB4vBVI5vKnAQizhjISF/+3ieO+Vr7qE859yBuPxDhKZMdsXiHKMK3NkmtTu+lGMFYI8NwgjGIgeZbyJ20cpf/TxL3H9ZxdF6ep0/wyNF30yX4EsEXEtQDR+o03X1dqnwDeeIgEBAQEBQQAICAgIOAmgkXqIMwaa2lgFKAltFz6HRCDwWIQALcC5VelgFrj82fhfev2zuPQpZxFni7hsRJRqvLIUYkKJIY5jIpXiM4kwAiUFhY3YbWa48Zvbuf4rP+Bb93DRjpK/H0tBQYrzoL1FedOY/zWkA42VTQmAr6ZGZEEACAJAEAAeYQGgyfrRtkB7NxUAHOCEpkTj8CgN2hdIA1tSuPjCnn/Jhafzi5eex4xcglgi0zpzyLkJ0hYo6cFaiGKMSFjOAT3H7Oyp7HpomRu/fTf/8a9+eOPde3nZpKgFQkddHuSQSKUwLsdRrjY8EXU1AYCKYmwRXAADAgICggAQEBAQcNKgcesW1CYAwoGXqIb01z29PWCmhllWtJwhAiqGEUQ5PGHAS3759U+98edeeRFnDHLE6CcIldVvk0RMTIWOI4RxqMoh4yGMcohSMjnkh7sMn/36D/nUTTu3/3A352VSk/les6D3CAxaeqwrsLaO+Gst6vYFbR/udQTykSDvQviH4RocCyk+0QT4RJD+/c//6K/1Y1sAONR5H3p8j60EwHtbd+5wFm88zoNHoXQPVIIXAmdzIjtiIYKnnop/4U9t4uXPPpefPnuOXrmD/kCCdVhrUP0ejoLMjOn3UzAVwmu87WPUZsbyFG6/Z5m/+MzXuO4Le8WYVSP/uu+AXre09HgcDrdqFirXXb7gAhgQEBAQBICAgICAk20C9gLwmrpYVtY9vbHopr6+KZ/FSOoUAalqScA6ZmKwk7os4DU/nfh//OYX85zze+hyJ1pWjFcWGWyap8gnSOGI4h5ux15kkkAaAymVnueBFcVXv7uTL3zzJ9z6w6Vrf7KHa3KZ4JM+pbOYIgNR0e9HeFeR56AV+Omi/0QQsCAABAHgsYxjMwGUCpyrx0CrGESEMZ7KeqSHWHsil3HmLFc874JN119+8Vk85/xNnN4ricwiad+DN3XnAOcx3qEHMcSCSZETyRjjUjxbuH9R8Mkv3sn/+Ozd1/xwiWsnEoynNiz1UPf2E4ipGOAbCcA1PL/J/+/eKj4IAAEBAQFBAAgICAg4iSbfqPm/RWLpseqWVSCoiDoUwQGlmGoENUxt/AWQKNAGNil4/fPn/M+/7hLO2ZJz5ikRbmUPVTYh6c9RjibgLPFpp0BZYkqLcBoVzWHp8eOdBX/3je3ccMtdfP2HiBUgjyKsjqlMhrW1yViSgKmoycM6EnjsxDIIAEEACALAoWC9QeoY68GXtZ9+HEdEVMjCsGUATz9L+xf91BN57gWncN4WySlJQU/kICuQjgqQKkElKQBFmWFdgdc9kvmz2LESccM37uHDn/423/wRomgmr8I3gmTb08+1hUndGcsAVTchAGiFTurXggdAQEBAQBAAAgICAk4GqGYpLACDxBA1koCnXmYblF9dKjvAtBE0ubqXSEgqUy+ypYeegMTBnIBffP2c/9krLuHUnqHnMgZpiqtypPZkVYGVEVpIEhyUBuEkRLMsTRR37Sj55Ffv4KY7dnPbfYgM0CmUDpwFHUFR1SnHLQlsiaD3Hu/9I1AGcKzk4eEnoEEACALAI3b+UlCVJUprBv2YcjKBCs6c4wk/fe7svc972pmcvyXhqWcOOHNOMRBjlBmBL+v+o3EfEym891hrcQ6EjEEPKPQ8N33vAT7yuVv59Ne8GAMigrKq56QkhpFps5fan6iZ1WRHALBNeRMIJHI684Gjwh9TF5GAgICAgCAABAQEBDyGJt8IiQBs0w/bT1NkZe0L4GvjrG5MzdMutBv/AGqjvrQ2DaAw9TZK1kLA2Zt52z//lZf84cuffRY6u5fZuELYCuMs0cw8RZbToyKRFrIVqAzEM5Bs5p69lm/etYdt39zO17+f//4DS/zrUoGVYKQmNw7nxZTstz/ee5xzSHm8CW4QAIIAcPIKAFKCVgJlS0QBswoufCL+5ZeczXMuOI0LzhgycGNSkRGJEiVq130vFE4luMFmduzayWzf00s1eeGJ5p7IDx8S/Omnb+Yjf/uQ2Odh7Oq5SVB3EGg5eztnuXbumt5YTWqAF/vNebJucAo4LC5UAAQEBAQEASAgICDgZIFEoJpmWAZEZ708ramljp51F9BNJM2jsEiU0mAzVFNrG/UEpVfYSoL1xFTMAi+6AP+bP38pl1x4Gi7bwzBRKOEpJyO0NyQaEKZ+v8pRZQaRbmJs+9y7T3DLnbvY9o3tfOP7E7G7hBxAa0pW65CllEEACALASSMAHHuXiKM/f4GBytOXMKvh9Bn+/IXPmPuF11x6IRedvcCMmuAne0h1VXcWsSVlZTEIdNxDpEMeWpxw+llPxJRjRnlJwZAbbvohf/KJn9z+vd08cxkohW58RxxUBtFkJcWRpKjq8XeiI176dUKAbyP+rukmYpHNdQsegAEBAQFBAAgICAg4uWbfTmhf+NY8q4ZtSP5qSm2dTqsx07IASwQqxti6ZEDKuk0gU1NBwTCJscWYlLpt4FVXpP5tv/I60uwBZrM99HoKerMYYxiXFXGaEEcCk+fESMrCY/2QXGzizvst277+I/7u5h/x/d1G5EnEBIkxBu/9VACgEQVCCUAQAIIAcHzOP/YV8xI2R1z2vKf1bnjDK57NC552OkOWEZOdaFGAljhXUTkBUqF0jBACay3GGOJeynIOrn8at9+9wv/3L7/EV+5A5NTV+bIXs5KV1HF7idISJxzemobc95qjKRrxsJ57RFMS4FsRoDNjIdxaT4CgAAQEBAQEASAgICDgpIBkv9x+7VerZz0SOxUA1HShraimvvt1LE3jhK8X1y0h8pI0rg25irKApjv3bASigqefhf+373gZzz+zj1t8iNyDHPQxEgwVkhJpC3pKIK3C2QhjZ8j9Zh7Y4/jat+/hq9+/ly98d2dtEljV8oRXgNBYIbGOdQqHQ/g6Crh6jnFNEITDN69vNFD7ef01WRH+YbkIQQAIAsDRHbtfk+Lu1j6KdQKYl+vOu42It3X08qD3vMSgvEcCykPfwSXn4t/w0qdz2aXP4JSkQI4eIBFjiBp3f2sxMsbKhMoLjPPgPFqAVzGZ7PPQCD5y/S1c97mRWASKxuCvjc4rKZAiprC2/rwJQFlwClzanEsBFIiuy3+H3Hs62UzdbUIKQEBAQEAQAAICAgJOutm3Y6K1fkL2a1QCpqRhrW7QWVz7AxEsR9tAoP0ZAv/oFT3/S294MWeetoByI7LxTmYHkjiylMWYyhqUTIijGUwZUWaQRrP4SvKT3Tnf+PEyn//mHdz0rX3DXYaxk1BImFiNlXH9TlqCMAhbIH1tdaioMxWs7OGI8FQ4USGbUghY7W4gvER6ORUKGsvx+qyEXD3/R/OlPiBBPrEZDMe7W8OhhIFjjaAf6/Ef2/4l3idTMo8wiFaEE6bZPx2C36b81PeywCCxpDEYKZlkDu8gjhUKhS0rlFIIIXDOEWFJXe3r8ZRT2Hvp0+YWfuENl3La0NEXJZEdI5UBk4EtodfHIilEROEkpQWFItIa5R177Rz/69a9/Mmnv/6HP36Q3xIKCltH/oUSWOvXnuuGY9CJ7OM2msAOvuoM5D8gICAgCAABAQEBAY8MEmCuEQJ+59ee6n/uDS9jKBbJFu/BZDuZm0mJej2K8RhrJJFMEJXEG4f2CitTJvEpPLBs+OLN3+MTf3sXf78D4TSYtM+eicXJXk1xhQUqtCimhQ3Og/cRnggvLH6aweBWtRFPTf47RLelzP4x9O0VBIDHqwAQdQSAur69K1IJIVYXWV4i/Nq0H0GFaQz10n6E9zDJKoQQ9HsJRVGQKE/qIapga8rFL35mcsvrX/JsnvXkrSTlQ8wPFdgKOxmjpK+dAb2DSFFUFpXOIHuzLOWOsdHIaMj37/wxf7ntNj5xmxe7mvfXWmJMfT8mSf3eh77PQgu/gICAgCAABAQEBAQ8Zib/SMBcCjaDJ5/KDf/nP33lZZdeeDpDswc52YmfLKG0AuPAOlAJxCkIjReKSZ6hk1mcmOdH94359Be/w6e+suN9d414RynA9+ZZyR3OWRAeEYGXVV2HICCydTqza1qIOa+biD8dQmUAhxMSJyS2LYkQDuXsNI36sSkCBAHgsSsAuHWlKBLXRvyb6yIRyOZ+lr6+10XzY6RCDecvKMrsTp2PUFi01lilmAiFxYGdMJSwqYQXPA3/yz/zbJ711NOJZMFc4pg8dC+zgwR0H+cEQii8NUhb1PVEWFyWM/YpVf807tgt+ci2W/nUl/eKHTmU1KU7aRpjraWqLABKKay1QQAICAgICAJAQEBAQMDjZ/aXIBVgkd7Rc7AAXHYx/nd//Wd4wtAyKyZQLUE2glRBfwB5zkpRkKY9oiihGpdkpULG85R6Mz98YMRff+U7fP6W+27cvpuXjQGvI0iHFN5RljkIj0wEsipqcuQArxAuwTuFROJweGlwwuKFwwrwQtbHjQIPylWPGQFgY9L5+BYAHt9wazp0tO3w6nR53fxPNeTfNQKAq130PRihGXsFQtNXDmkLjC/w1K76SsGchovOkf7nXnERr3z2k9gUZyizjJCOqlhhdmEOlkaMJhXolDgZ4IxFeEusFSKOqSq4b8nwib/7Nn/06cnwQcd4EsHESHppQlFkOLfxfbp6fwQBICAgICAIAAEBAQEBj/3Zf2YWJhMQoJwlsZ4BMA+8+tna/+YvvoazNkHsF6lGD6GkJY3rtmBC9Sknkni4Cedy9q3sQ+uYwcwW9q0Y7rx3H5+76ft888cZ3/gJYtGC0SD1DNLHgKOSS+Ad2oJyCm11Q/4FFkElwUjwsq0vbq3FWyL12CQgqyJAEAAeywLAqvgkp1kAq54UEiHqnvfC12KB9G15iwcESg0ZFSVIT9Lv1ak4WckpCs5b4PtvfOlZT33lcy/giadGCLvETF9hTUm2PKKXRFTlBK0kUZSAjMAKrFcYNSCTA/YWEX/95dv4y+u3b7trN5ejYGTryL/UCZUp1pTha60xTU1CmqbkeX6I+y0IAAEBAQFBAAgICAgIeOzM/rJZ0HsFDhSehUhjq5wZYAD83BVb/T983fM4/4w+qtyFm+xEmAkChXUzGCeRyhEnAuUNZVkiSFDJPIv///buK0iyK7/v/PeYe9OUad/wDe8xcAPMAMPB+OEYkqJGXJFccje0Umxw92H1IOlBjA1xX8gH8UHch9UL9SBFbJDBlUiRQ1GcoRnvBwPvPdDoRgPdaFsuM+89Zh/Ozays6sZgKFIDM79PRKO6s7KyMu/Nwq3/75zzP03Nd584xF/+4BnuezZ+6ZUzfHJlAm23mWHsGbIJ+AQu5tkU6UzZSaAxnjjdG9EkyBGTEy4HDOkcTRLfXqYF9htNNTfmb1uAKwB4S3+E8g8/F+W8lx0ugPJx7otyC3VdY7whTib4Fq7cyf/y8+8//z985s4rufnSnQxYxw4SqdlgdfUMdV0zWBhCCIR2gvcejKNpINCDwR6OrFkeO7LGv/ujr/LwC5iTLcTpFqHAwNU0saEFqrrMVihT/u22qf9v9n5TACAiogBARETeUReAQd2jaSYMBzUbowaAYX/IeLzBcn9IM95gF/CLnz6Q/4dPXsv1FzgG4QhhdAZbLeJsjUu+W8hvwRoCkZAyOVlstcza2PP4C6f5+kMH+fbjr/HUcczpAI3tE40r3dNNIOfQFUqGjCdkD/huwDThcsTSzEb+49t8F4D5AvtcIYACgHe47Ge/RG2O7pe/J1POebSJTFeAm7lTZsoeHmYEiwkuquBTt9f573/4Rt571W6W+i3ECbSBjfUGX/epd+2AjTNMVo7SW+yBq0gBolsm1jt5fdznscOr/PFXH+SPv3nSrFN25cDYbo/OMtOnIlN7z3po2V7uO+fmAgEREVEAICIi75r/+U+3BOx7GIeyY1+LoUk1uD5EAzYxSKv0ydx8Aav/6+euXvzpu65kkRVM2MCFgMkeZzwYW4rKrr2AyZAC5DygNYscb3o89MJRvvDdB/nmQ6ObT454dGIMrc0EB60p3zIZU7b9SxUmTRupJWwXFBhSt+b6nRMAnCsEUADwDq//zXRA33Y7Vkx/ttLsfGcD0aTuY7ecBTBk+gmu3Mfvfuja83/tE++5lPdfusAFwxaTT0EYl8K9twC5TxsTLiesz2DGkBMh95jYIY3fwxOHzvBHf/0AX/zeqnm1gQ0g9z2xpfyU+womEyBTFuAkImm2BGB747+tPQBEREQBgIiIvOP/59+10ysz7LvbS5ldEbFQVWUUkgk9A/1YGgV+7M7F/Ll7buKj1++il04RTcJ6gzVATLiYwRiaSaBeWGbiKtaagKsXsbbi5RcO89ATh/nmoyd46tXm64fO8JFVC6seJgYwdamuQqLC4lOCGAhkMJboDAb3jmsAeLazn/+bdab/uwgAVNj9XRT/CVwmk0ld3Wyzm9vuz1B5R2wmYBKVB1IiRBj0YN8id91z7QXf/eQdV/Deq/ew16+xkzPYNIYQwHvwA3COjRiJRPreUtkEbSCZAafNXl44GfjKvU/xp199+QvPnOBnNoBUwbh9o9/wPOSq+3tL2QdAREQUAIiIyE9MCDA/M7kEAF1TM9ftKU7AWqi7bft6wF7g791G/pkP38gdd9yAt2Mmq68zdFA5QxpPsLt20W5ssNomql5NbRw0LT5GrFvmmePw7ccO8s1HnuWxV9LvHFrlX6xBmQ2QHTlkvHXUtoxGxhgJGJJ1WGshpnd4CKAA4J0cAKRuej8ZcB5rawye1CYILaSWgYFB1TW6jLB7kQ9dd/W+r7/nsr38wj03cMFgwoAzVHEF7yOkCCFDtQCuZty2+GEfU3lW1zcYNxFreqykBf7gSw/xjQdf5/FDmAlABevBMMmm+/kuzTNtLssP8uw90+tehAIAEREFACIi8hPClooBoJtav+WqkMFZQ46QcbOgwGAwRDyJBWBfxcIn7tix9iuf/SluvXInceMITXOSHcs1J06fYmlpiZ5fIo8n5CZgrSvTl2Mi9ndwunW8emLCA08e4Wv3vcAjL3H3iTHfG1kI/R6jkGlCBGdx3mNMJjUtKUa88+/wc6AA4J0bAEAyCesc2VakkEstnQHrGNSWPFlhIcOigT01P3/Ffj5/6zU7uevWa7nx0l30xofYtVSVLxo1Zcq/r4jeka1lMmlZWNrNZG3MagPDvZdy6EzgD/7ym/zZN1/79YMr/PZ62vpuiN1T6A36rI3GZLP1Zxo2+xDms95DauonIqIAQERE3uUBgAUC2Li5r/m0UEjlHs71CDGRsIDHOgcmEcIGPRKLwBVL/Kuf+eD5v/mZj9zClRcPse1phn5CWF/Bt4G6rkqB08RSgdQVK5MxthpSVTtYWXM8e/AMDz3zOt974gj3v9TUrwXakYVYV0RjibGFlKiA2nmamN7WPQAUALzbf4NyhJC6JpUG6z2Vs9g4xobAALhkF//q+ovcb9562V5uvWIf1160gz1DxyCtYN0K0EKsIVqy65N8jyZDYwzDwQ7WNiLZ7+SloyP++Ev38qX7Tv7zQxv832eAdcDWA2praMcbOKYzehwNsSzjmQYAXeNMk8uyH2ZhgQIAEREFACIi8hN2JfDd5cDPFQIRcpg1CyzlpiXhNpcImABETGVxOeFaOL8Hv/Chi/Mvf/x2bjrPM4jHIa0C41KdZMckGSYx0R94JqMxLjhqN8CZZU6tGx5+4STff/YoX3niVQ6ucuXhNV6YAK6C2oHPZab0JEE07+RZAAoA3rksKVj6vqauHKQJodmgyrCzDzv7/LObLqt/5/pLd3H7VRdw1fmL7B/Agptg2zXyZB0zcOS2wfSWYWkHBNhYG0My2HoH63nA8ycSf/i1R/mv3z6y+/iYUw0lb4hA4wwhmrn3gsHZijhtSsB028EAebPx5/Rd054VACgIEBFRACAiIu/+K0C2bLYEnIpUtadtxmA2pw1bY3E4jHdM4gSMAdOVFTniYmAvcKDPr/yTn7vy9z9y+6Vcd+kik7XXWF87ycLCgF5/yHhSmqOZFOlhIRpyA9gBY7PAsYnngRdPct9zR/jWo0fWXjjG0looa5nTdLa1UwCgAOAt+tHJFhsNPWOweYwBFoHLz+Pl992w/5IbLtvL1Rft5IJlz56hw8d18mQVT2BQV1A5SIGcDBsYRgGS9Sws7ibS49iZzH/91qP8l28dOfTwcQ6sAa1xkB0DLIFxKeANZUZO9qQ4He43eG8JYdJFBWlLnw/ThQhpGuQpABARUQAgIiLvdrZMyQfIAc/mjgDTEcaAL7MDqhpyhDABwuaFI4N1Bu89KSXaNs5GGWtKq7E7rjL5c5+4kw++5wAHliO9yUmqySlcDmQ7oEkZ68BaAyScqwDDuIGQexw9E3n6lVUeePZ1vvfMqzx+GHM6gRn2WRs3WgKgAOAt4XJi4CyxKVP9r9zLn9/znn2fvefWy7jpwB7OXzKY0Wl6pluVnyBlS8yOmLot9nLCG6gGfagGrCXLodMNf/WDp/nTb7689thRlhoLG7mM1s9X676CkEr+liOzEM+7qiyVASxp9h5LTEf7HZszfdo3KPYVAIiIKAAQEZF3YQDggIzJYdYNwHa//iegwYPtdWucE9Biq4wjlv3FM+S8dd5AmGs6VnkwDSwABxb5+X/wob2f/9zH3stV+4aktWMMbSSGMdlbjLdMUoM1mZ4DmzLYmtx6JmGBE5Mejx8Z8Y3HDvKtxw7y/KvZrCdou+7mZZ91O+t2Xhqhpy0XO5MtZIvN5X7TP5bN9dHTXQXsXLGVzDTvKAV312R9NitCAcBb+B6eO455/tDlbcfGpO58pVmvi/JvO2uGt/28mrxZRG8/K3WCxQxXX8jk/TcdqO+66TJuuGSR8xciw7iKb1cxJkFsIXqSrcmmT8iehCfaGlMvsDqasDgYshYyf/2dB/mjL73AA69jVoCRgzZ3hb9zzPYbPAfvSyPClMpz7Veepm22vNPyLObz3S0KAEREFACIiMhPVgjQ/cJvOLsfeJ5FAmw2EttSPG0rLM9xVZluG1hRPl53Mfnv/+wn+OWP38KuU/fSj8eh6hGsZ5IC2EzloUoRQy4VPgNS7DGKA9Zjn2cPneDbjx3iqw++wsHjyZwuS5yZOBgbQ2shzD1BA1Sma1kQDJaK7DwTB9lmyBGTUuljQMKlrS8jA9FAMrb86Y6dfaM62qRzFlRnH7MfXsBvDwO2/zvn+Lcs+t9esyfy3+Q3kmxLoEPZkm8a1Gw+RrdvRbdPnyFhyyaSs3PrzfTsWCKGEICcsdbRqz2mbTExlFF6AymV5Sc9D3v73PXLH7zsu3dctYf3XH8ZexYNjF8nN6eoGeNsacDXtgnMAOf7hFDOgbOZjTzk1OBi1swOHn70Kf7zn32F+57HjIBgYS1BA3P9OfJcNDf/A/ej/XK3teP/fHCiYl9ERAGAiIjI3/ACks9RUHpvySngulHMaZywd9lw7X6f/89fvo2bLuoxHNRMmjV6dabnIbUbmNhAaHHGY3qLEB3NRsS6BXw1ZKUd8vTrie88/CLfuu9xnjyUzLEMYyBWELwl+m67tpCgLfuw++zwuSIaQ1OVvdxtApNjKQ675zlfrOeu/krGdrML7KwIVQDwFgUA88ffJFJ3zGfvQ2NLk4g8HcnPGAKGMHvjhu7wOe/wviYbR4yZEBpsigy8ITeRITDsBuCHwPtv3ZM//YH38FNXL7O/P8HlhsnoNN40DJaqcljHI7CONhlwfVKuWB9HEhX9/pBJbzdfeuoE/99ffJvvPzI2LeB7sDYp7+HsHDHOLdOZNub8EQMAERERBQAiIvJjDQDmZxY400087gpsT5kR8L6ryf/oc/fw4VsvYrhxCDs6ynBYl5nKLTRNC1WPejCE5MswbJuJbcYt7OTEeublYyPuffI1vvLAizzyUjSvBVgDgqnBdrujG1NGdp3FxkxoR3ibZ9P7ozGkbIjGbhb409fZTQW3qXw0eXPJwTl7EPx3CgC23/aTHACUgj/N9rmfNanMc+FA9t0sAbN57Lu/JAP14vLCaDRep5mUc+QszjmMMVgCLrbYkNjh4Ko9vHzXtTsu+eBNl3PzFfs5f0eFiacwqaGyDuo+xEg7GpFSoKotk2aVXr9PyLDR1vjlA6Te+Xz53uf4vT/9Et9/AdN0P0iTrrFlKG97rK+JITNblLOtm7/qfxERUQAgIiI/Vm6uvM1vWFDOhQCUademCwKydxAiew38wkd25v/9Fz7ElXs945MHsXHEwo4dhGZCSAlcxiWwOeGsAWMIocXUS7jePk6Pejx1aMT9Tx3jWw8f5P5nXjcnI4wxtMYTLKQYwSSscyz0e+SNjdks8WgMwZZJ4mXU1W5JN0xOuFyav02LyWDfoIv631EA8EYhwPT2n+wZAN2ov5kr/KdBwCwE8JjcTQM5R7+A6QyAetCjchBDQzPZKMtWfAmozlvi5++5ad/nf+5Dt3DHFftYTmeom5O4KkIelUdsM5NxxPoBveEiOEtoW/ygz4mTp3HDnfjlC/nu46/y+3/yNb79eDRrwIjNVfiZ0pIjWUcbIGdzjogtsP2VKAQQEREFACIi8tYGAKYbtcxlGYAxhhjarsneZgGTPaRQdgyoKdOrP3L7IP/Pf+9u7rzuPMz6q+yoAj5FaMelunOGnCZshIBb3snGJGFbT98tUpllJuOKZ18+waPPHeNr9z/Bk6+F33xpg/+rsWAW+6wH2Bi3kDM938ekTDKJbMpo8nQqeZormE22ZVlA8uX559IqMJu8rdhPb1LQbv28yT96AX7uIOBHX7/9dgwA3qzgf7Mmi2b7GnYzVxDnbp7JOZoB0vUCGNiye0UMZZ2AsdCzsFzBjopfuefW3b//iTuv484bDrDIGoxOslBlTG6ZrJ5i4MBYC/0B1D2ImdGkKdvx+SXWwwCzeAmPHFrl//38l/nygydN0x31EUAPVppp9c/mdpwGbFWRmjD7yZq+1rP7dIiIiCgAEBGRtzwAoDQNnCtXnIXKGgyZlKBJYD3EUO5feXAhsQO4Yg9/8i/+ye1//9YDu7lkV40Zr0C7gfOpjJR6y3o3Xb+fHaYxMILaL0C1RGgdr51u+MbDT/NXP3iKRw5yx5GW+zcozdXqxWGZ+Z0N2WRyt/FhKRDzlvLapOmMgG5d+WyvhB9fAHDuEOAnOQCwc8evNPgrU+WnD17uk7ru/hlbegV0IYDPiWGAXt48ij3gmkvIH77jWu68/iLuuOYCeukMvbROlcbEUKb3u8pT1V16NZ4wiZFsa0yvT7R9JmHIWl7g4edO8x+/8D2++sTIjNmc3g9lZ80zjQXrNp+vMVR1j7ZtIYbZazOz13j22VcAICIiCgBEROTtEQA4V7ZBy5vFqpn72uFCzcpGU27sG2jyrNn57gp6DfzCR8/LP/eh67nmgiF7ey393ECIOJvBjWlTi3UDrKlI0WGoMEA7bql8TbI9TmxEHn7+KF954Fm++/jqd18+yQdWgYm3NKY/G13NXZO16cT+ac08Lb1muyLMNZ/7UYrwNyp0/1u2EdwaArw7A4Af5bhkPCn3AYvLLY4JjoZzTpy3ELGlZ4O1ZZA9NuyLUEVYBG6/mvyxu6/jrhuv4OLdfQZug41Tr7I0rPEOQjMGa/D9PjEm1tbXsdayuLhIagOraxOqhfNo+vv4+qOv8vmvPcxf3n/abFBa98XuuVS+hBIbIYHplQDAds80hC40yywsDNhYXz9n4a/iX0REFACIiMhbcgGxc2XoZghgt1xdrDVYa0kxklLobusaAvru66fVjK0gGEiBHokhsADcdAH5lz5zOR+/6xb29GuYnGJYT0iTNZJx4CtCBmttmWUQp9OnPSnXbOQ+Z5oezx5Z4Zs/eJJvPnSEx49iRrbbKYBSeyVbKtNU2v1tFv9mWnalv3EB/XcZAGwNAX7SA4Ae2RhcbjHELgAovRrYFgJMtwhM3fftJ7h8wCduuZS/vuf267nzhgNctqtmkFfpx42yvr/nYDwu7/S6JmfDRtOCsVSDIRNj2ZgkKr9IMIvc9/hh/tMX7+frz2DOANPZJt55Ern0oAAwjpwtmBqc7Ub7E+RUJgTEEka9UeHPLKLSFn4iIqIAQERE3qILSJ7emLfNBJgWK/OFmUmbUwi64VHH1hnczoGJ5fYesAzcdjX5c59+L5/9wHvY0ZygatfIOWBcABcgR6KJYBzGVYwnqcwQcAuE4MnJs7o+4dCJdb7z7BEeevEITz23/qWjJ/nkWigz/IPrMWo9DWWJQVV5MA0xbGBNxNkyWGsNxGAwxuC9Ly8lRhIZa+2bFrw/zhkA5w4D3uImgDb/0OMRY8Rai+1eszFm9vpTSqSccc6RDbQpkuN0KwCPNb40jUyRvolUOUIqvSYu2MO/ueLC4T//9N3XcOuV53PpeUuY0Snc6BQ7+pQ33fpp8F0DQeuh6oN1pJwpu0p6RrbPmTjg3ieP8kd/9SDffxYz7p77iDLlP1J2i9iynd90aUyu2LKcpIuc3Ll+rmb3mm9QmVAIICIiCgBEROStCwC2FJZ223zsrQ3bsKncpyvyXbfeOU9Lm9LsvxR9MVMDFbBvkV2X7ebkP/7Mzbz/2gNcdtEOwug4uT1Bf7ECF4lra5hqQKQmJkPbZgiZhbqPtY6NJjHqLfH8sRWefPZV7nvsJR54fPIfDp3hn4yACYZquHf/mdHoWMyxPFcbqKuMsYl2AsNej9BCCGFWVBtjYDrjISUFAH+LAKCqKnIuI+dtG2ZLMkz3vrDdeyRbML4ie0/KDmKGmPAxU8Uxwy48Om/AP7v+Ev8777/9Om67/iIuv3BAu/YaVWxYHlT0aAijFXxOsDCAtgVfQ6qZJEdjemTfp8GxHiv+9Cvf51sPH+feFzCrwKT7k7GUThd5s2g33RYFZi4ASLb7Udic5m+2nZU09/OwueWkK4+VFQCIiIgCABERebtcXd6kyZ3DdgV/2jaxvoyKmrlbfWmyTtvNonYJljJcs4d//7MfvuIf/8NP38k1+xyj489imhWGu5Zg3JKSJeCo6h6mqmA8JrYjnPekekAwPSZxyOHjIx579nUeef51Hnv+OM8ebi45PuHwBoCvSFXFqB2V3QFq8NaTxxG/Za2DxxhTOsvHiHF2W0Bitx2iv3nx9pMUAKTpDABbdpKYv7sxhpwCISaiMWTnScZAjGAsfWfwk4a9fbhyt823HtjNe6/az40X7+CCHZ7FuoF0hl5djkEIAe89tu5BaAkbG/iqR6JibIaE/k7W3U6ePnKaL3z9B/zlt0/cfGzCoxtshhLJwiiWkX/fWyRMYneey1yATDfrxTLd1Q//Q87C/NIaBQAiIqIAQERE3jlBgElbAgED1F0AkEhdozQ3K0wNidoaYmq67fnmZkybXimCRhv0cmkYeN1F5M/efYBP3X0DV+wdYManMc2IwbAHOZKbCcYlQmzIOVAtLDA+vYJ1PXxvJ9kvst72OL6WefrgKR574TUefOYwzxze+PVDZ/jtERAd5BpaLGGSMAl63mGtJedc9m7vRv4VAPztA4CcEjlnjDE457C5LAuIqdzR25oun8EQCU3EZljwsG+Rz1x1weIXbrpkD7ddeSFX7O+zvx/ZUU1YcBOsaSFtdIW0I4RIkwzGeqp6gOstst5AvWM/J5uabz7yPH/2tQf43hPZnEgwMbCeK4zvU9GQwmRW1yfniNGwWe1PFwOkWYsMMrjIWdP9txf+sL3hn922y4YCABERUQAgIiJvkwvLbIvzuY90pZHvbkt4EoaI7yZNp1KY2QQpbX3Aub8Pe31GG+PZ49XADg8fvW0h//Qd1/DZO65jl1nHtychbkAFbZzQkBguLmFCKskClrYJxORx9QItfU6uR547fIL7nj7E/U8e5bmj/PrRdX57I0NrYRzBOYOzZZp6GwMxZawB62uMMYQUtxTa+azjpADghwUAvbqmaRpSG7HW4O1muWxsTWRAaiZY1hgCez1cvod8wwHHVefv4KbLz+fCPQvsW17A5jFts4YzCV+Bd5Y8meDIOAvWe3AV0GMjVZxJAzbqPfzFd5/gT776OI++Utb35xrGCdpowQ82l+HngCdjCRgSmbLlXzaUjpfTtf45MZ0I4Ladybw9ADDbkoDtoZqKfxERUQAgIiLvlAuLm5VFlowlTiMCk7ot9roi1VblrzFBbkuRbSEnT8qG7B2mcuTQQGgZZtgFfOhq8v/0M3dzzy1XkNePQlphed8SuMSZ14+yPFgqz9UayBHaSSkCTcXGJNKaIa+vJV451fLUyyd44KlXePbQRnP8DB84Oeb+U7l0eTeA75rR5ZxJlGnrMScFAH+LAMAaQ4wRR2myaCn/zjlTW0NqAwNg74ArrtjP87dcuovbrtrLDRfv4sIdnr4J2DiBVLrsu34N3jGajFlfX2f/zt3kmJg0gTZbbG+Z9dzn6ddWefzwGf7jXz999OAZzj82KWv7k4WU5/pb2K4BgavxzkPbkOMEQ8A7mMRpAECJuzKQSty1ffeMWQBwrrArb/34RrmAiIiIAgAREfnvWcGdsxA1P0J5Od2O7U0vUtZisiWlzV0Cpq3T2tmMgQgE6BrDOVN6BCw4sBFuvZj8iz99Jx+69RL2DkYM02l6NmB8j3YywZqE87l0f/fl0dumoap3MI6OSeyxOq44cXLCwSNnePLJF7nvhZM8vOI//OrIfmPSNFTe4ypPCIEmpFkzQAUA/+0BwLTrX2UdxhjaSUPXNpK9fbhuiZPXX8CuG645wPWXncflF+xg/1KPXp6QxiuYNuC7wxVDoI2BbAy+rqi8pdlYZ9waYm8H48Eenj3W8lf3PcWX7z/0hWde52c2KKP4EbDeYDKkWBZyVA68d6QMoyZ272UL3oFxZZuInOaK9nTWEU/b3xdm7ofHsLVpZt48RvM/dQoBREREAYCIiLwtAoD5e6VtH+P2gmdL4Td9HFPWgHffx2Go8BhMV/I7IgFDizGpFGhs3Y6wItEDhsBVy/zuL3z8ol/77Edu5dK9A6owIjUbOJuwLhLDGpkG68rac4sjZUtmSEp9SAvEVHPq5AZPv7bOH9//Io+8cpKXDk3MKJXXNJkGG/WQNqQtIUeazWoopZ/NqauBp2u6bVmRMAtH0ra/21kAUIrltO3wvXkgkLGzwvqcTRqnvRre4OP20OYNQ5xsN98L06+fFfqJbBLYTDJdZ4RsNmvfbMuxMQaXEy6XQMdl2DGguvTAvuaGCxf49M27uHpfzf7dy3giudmgsglvLSaV900MoYRHXSP+lAIhNoTkmPgdpP5uHj94gv/8le/z1/e35jiwDowB6kEJS2KZQUAu583lzbduLm9MkoWQp6/bls+m3G1vudnQMs/Okt22rj+d/bE7x/NVvgIAERFRACAiIm/7C805ewGYs4v+N79g2bmd06d/S1u+z6ysspacEpWBniszwT1w/WX9/NHbr+QffeR6LlpO9CpomhVMWsfaBscES0MzGTNY3gkTGK239OtdGAaEESTf49RoxFOHj/HIc0d49KVTPHaQ33l+lX+xDtTDXaxMAqaqydYQ4wTCBEwAl/BAnSwmJGI2GBzOVBjrCDnREjEOskldcJBmTQRNLsfAJrBshgpmS6V47kObMJh07ku/yVsDgHyO6GYWUADZ2G4mR5r7nl0BnCzOVBATJpemjikFEhEPUEdaMsaXiQBm2vYBg01gQqbvoIqwCFywzO/dcuXCr77vpiu58YqLuHh3xQ53htycpjYG1/Ol4MYCnqZNZFdjfE0IDTEFvAmYNIEwZr23n794JvPn33uO79x31KyzGeBMgGzt3HT/+YClFOTn3ALTbAvGto3+v/Fb/Q0Clzf4Ii0BEBERBQAiIiLbVFVF27blYmfMbIs+gB3Ae/fy2mfvPv+8T3/yHi48f5F2/VV6boPFKtBsnGDQrxmvnKFf9aFegtVAaA2+WiCFgHWZBsta6HP4dOLRg6f47hOv8P0nT/76Syv89hgYYwlYfFVR9StimtA0E4jdqLYBZ0s3hNjtC4+zWOeIqe2K6/Jnvm632WKT7UrNxOZsgFIWbh+Zn0YkGVt2K2DrlHs7d69zSyRzjqUMJnX/7sKBbMnGQu46PLShnIvaU/uyaWKMLTE3tARyt1LCATQl1BgAOyrYWfOZay/pfeGu6w9w8xXncdneIXuGhqFtqPIIY5uybAOgaWiaRNXrY+oebZsZBWizobe4gzZbxk2D7w947oWX+IO/eII/fBhzuns91nbbTOb54nqu4/6WYjxtOaoiIiIKAERERN5GrLU4160lb1uqnBkAPWBvj/0f/+Ceo7/0s3dxxQU1dvQaA8YMTSBsbND3fbCedq3Fux5msAQhMjGWjC8z6m2NcUOOnWn5/qMv8P3HX+L+5zeeemWV619vSrPA5KBJZYl43a8YNxGMIbuMsV1TuZTJIUPIeOu6Ij/Nps0nm0uzQcCkCrLvRou3FqV5OpV8dmsZmS8BAFsDAJO7pQhpVtSfKwCYfzxDwHe72k1H7zOebCzRWKKBalgzSQ0ptJDibADdGo93NcnWxJRwFvou4sI6vQgXL/EvL9/Nv/6lT93CFXtqLt8/ZPcQyC2EdrNCb9uynKHqgYGQI84ZyImNjTUWFpZYm0Rybzcbdidff/gIf/DF7/G9FzAjyvr+RDnsoVs+EgFryrmIcXqg7LbCHwUAIiKiAEBEROTtpqoqjDE0TTO7zTmHc462CTgSNdAHdhr4ex8b5l/6zAe56qKdDNMGA9swOn2C1ExYXF6CHGnW1sFXNMFR9fq4nGkmE2w2uHqRJvU41VqePbLOvU8d4hsPvcjTRzArsRSdE0ogwFJV9rQPYXNtxByfqxIATLd8M4FkInQBQKYLAKbFaFe4n7WN3KzZXLc2Pc/N45+tNc+z4n9rM75tRW43Rd0RqFO3DCGXrRzBk4FoINpAm0pjRtODqnKQLTEmaA0uOxaoIYyAwJKDi/bwtVuuOe/DH3nvldxx7XnsrUYMzRpVHkHYKLtAlCPTzTBwTJqErTx4R9NGYk5UVQW+JtLj9Njylfue5o+/8jIPvYI5BWzgcPUAwhrOlJ0mQ/eafa8ixEwIgTdvYykiIqIAQERE5J1x9et1HyfgEywa8LmEAdfvJ//iz93BXbcc4JLdnjA6St+O6NmGNFkvzemSh6oGU0MbmTSRlB2u6uPqBUZNZmIXOHK65f5nXuFbjzzPoy9u/NvXVvinpxKsulLLUkFlwMWyG2Hqurtl40phnV1XxmcMCZcDyXQj7vMl6baR+1mdbzabDJYAYDrPPW8t7LcVtrOeAGcVvhaXyjGz2ZKMJeK675PARFwO9HqZFDKxLbMeki0j7MlaFmJiVwtX9flPN1y1/A/vuOlSbr/pYi6/eJmeHTEZnSQxweaAIeNMxmNx1kAMhJDJw2WaBFVO2JQJTSTQY5QXOT4Z8Ptf/A5/dd/R33hxhd8qyzHK93feE0OYxiHltXaHJU5zEWNmSyVU8IuIiAIAERGRdxDnHNZaUiod/o2DmFO5CiYgeUx2LFc9Fry5eDw6c3gBOLCD3/vcpy//1Z/7+O3sHDS0q6+wWCWWaottA3FjRIiGXr8PvUGp3icNISS8r6FeJJgFTrcVr48qXjy2zn2Pv8i9z77MCysbv3F8nd9aWynFZ23BVdBEGAewlSOa6Zp6W7ZAzGCTAZPJJm024JsLAWyGs/r8zTW0K4VtOue6/619BjhH8T/7LCbVgCud7c10x4PNkIKQGFgY1GWp/rgtxfXiEC4a8LufvW7/r33whst4701XsHMRwuQoOaxQVRHjM1hDto6UoG0iKSQqY6msJVrP6expsuuetGfUGF44coY/+/IDfOHBZBoDJzJs4LH1AjEEMAFvIYUJ/X6Ptp2QQ3mIPLf+v65rmiacs/hXEz4REVEAICIi8jZjrcXaUuaWKd3nuI93pNg1knMVhPL3vgWbEhVlC8FF4ObLyb/489fzvtuuJq6dYG+/phcDnoTJE3I7Iocxla+g34dxIFLRUhMYYOplohuwNgqc2Wh57IWXeOql17jviWM89TLmJGV5QDIDWmvItmx2WDY9NN2IfwW5pjT9a8E0W+t8M781YD7nxX7WtH9a8Jpzl/j5h/yGEPFkswA4MBPK4oaw2cU+ewa+j2lbqnZED9jvWLjpctY+cOuVvPfqC7n5kj300oSYRkBD7TO2TuSwTjNex1uDq3rgPKSKnBxkT8qWFk/sLbJOzcunJnztgaf5s689f/SJ1zh/1OUdTSpfGsO0S78nTvftm634746XMXjvyTm/4XvlnJ3/RUREFACIiIi8fUKAnHMZ9e+KvJQSMUYMFoPBOEtM3W4B3mOMI7WTUoDGXLbso6wY8MCNl5P/4c/eyT23XEcvjejnMX0zYWDH1KaFOCl/yj5+ZFOTTUXKnhQtxlicG4IbstZ6Dp0Y84NnXuVbD7/IIy8e/Y3XVvitsS0d6WO3ZD8ayF3Hglx65oPpiu6uWDe5+7jZBaCbxt9ttXeOAGBa5G/pGzCbQWDP2r5xeu9gPNkOugZ5TQkAcsDl8rg+QxVgwcKlu9yf33HNRZ/9wI0HeM+BPZy/bFn0YxyrONOA65YOpEDKLZUDKld2EEgZkidSk90iyQ0YB8dKcDz4zEH+9MsP8vUnMevAKrA+bXFgLK6uiOMJFqidKcsGsNT1AuNmXPodmDx7f/xNf2FSACAiIgoARERE3mFXwNLB3mJm+9130+MNs2n3Zu6CaYEKuHIn//IDt17wrz/14ffxnivPZ9muYTaO4/MKCy6Vde+jDVICX1VgPbmNmGTALRHzEjn38D1PA5xYXeWVE+vc++RLfOOBF3nqFW4+1vDoOoD1GO+YhBZSwngwVY8mljAjA945jHOQEm3bYkymrhzOGHIM5FTWupvU9Rmg+zeQrcFYT7aGGDJtTDhbYb0jx0QbSs/8qqqw1hJSi+2VHRXIDuc8LmZM07BsYV+fa2+51D1125X7ueuGy7l8/w4GBmzK1KbC9xKtPU1yExyG2hpMTtiUsDmD99AmcH3aaFkLNXmwi9dHmS9/8wd8/ssvH33iVDfa38Ug0zgkzE6W3VKtm1zO63T8P7DtPnMBx4/yi5ICABERUQAgIiLyDgwAmCvut5SCcw3zyzr6CujhmDBkQq+75e4b6vzzn7yLu2+5gl39lrD6OrY9w1Jl6dmIibE0nstgnQMGYBbJIWH6tnQBDCNisqzFmtfXHfc+eZTHDp7hgWeO8NLRjfrUhLYBXNdZ/8wYkjNle0PnSRFCt1XddOYDQI4tOZXu/lUFlZu+KEfOhjZmQkxdQWvB2K4JXqaua2pfEWOgDRNy14nfEkrfAl96F/gEVYIDO/n3d15/4T++85rzuO3KPewwayz6loGJeFvhTE2MFePU4HdkcIEUW2jL53u+R+nub5hQ4Ya7WQmeh597lb/49n1864H1zx6b8MUJcAZo8DgSdq5oj10Jn7vXUk5yglyOQTd/ogQAxr/p9n5Gxb+IiCgAEBEReRddAM22wi5DmfDvulhgc3YARByBATB05WvHoQQBN1zh82c+fBs/ddvVXLQMO/2YXrNCXD9NZTLD4RCAycY6vcpBbEnkMm3dWtxwCWzNZD2QzCKnR3Dw2AaPvXiUh557lcdfPtm8cpze6RZSDZNMWdduLG22hFAWvruqJlsD2ZJywKSEMQZjMzkGUkiAx1iPtWU3gdRNCzDGYK2lto7xaB0IWBKDuqaypivYAz1g0cH+Bf7NNRf1/vntV13Aey7fzxX7Ftk5BNOeoe8T3uVue4OIM7YsjXCWU6unWNq5hO8PoImkYEhukcYusZKHHDwd+fPvPMQXvvXcb7x4mt9qgcaUEf44PUe5ojQeZEtXf5i2I8zd+v/wBnP4u20U8zl2QVCxLyIiCgBERETeHdxcyTdreDe7KtpSXOZp8Q+GAEQsCVM26JsViHnzq6gpWwneeQ35E3ddw8fffxMX7qgJqyfJzRrDumKhlzHtcWxloB5AyDTjQEzgnMdQ4X3dNRHsM0o9To0czx0+xX2PPs+Dzx3iyVfDHSc2uH+cyjJ6V0OwniZCNJ7xJJQRcOPA2i7LMBAjxESJLGz5nDFlXUBoIUcMmcpkapupvcHFliaU17dg4YKd/D+3XLLz/7h83zJXH9jLlRfs4uJdNTt7Gdo14niNqraQAm1qyaHFO6h7vmtCYGDHPpq1CWsbE3y9hF/Yx9G1xPcefZFvP/4yf33fGXM6wwqlOWK2lOkPNpez15gtnQo3l2jkuTObutkA2xKCzJZzWwKAH6Xb//wcEW0NKCIiCgBERETeERc/NyvwbBlRNnP13bRT3rT6i+X+DoudBgLOEFLLfP840/3HApUFH+HCnXzmnpt3f+GzH7yFO6+9hGXfENdeZXmwQjM6TWw9vf4yxi8waSLJVgyGi6xNRsQYiSFhcSzUi1g8KydWOXhixDeefZ2nXj3NCweP8dpJ7l6b8L1xKsVysGDqioAnYGhz6aeX6RoaWIsxNbkNpfC3pXB2RCqT6LtMHAWqLswYGFhwXLtvN09dd/WFvOfi3bzvgiGX7h6wc88yyQTWR2u0sZktqTAx0atqam/JaUKKYzINxrZEKlZHPaqlCxhXyzx9+BR/9f0n+Or9r/zbg2f4p8HCeirT9DPQTtf1G0qgkQwube3nn0mb523+XOfN5oabszq6At7ks0b/37jZ39ySgjcIDURERBQAiIiIvA0vftNCPmG7SeRdtWjmCknDdEF56XDfhQCZ0nQuk7CUFvwmMzfabCCVfv0VsADsreA9l5E/dc+NfOiOq1lyp9iz6LAJJhsN3tdUVY+mGTMajah6nl6/whlDOxoTRg0+O3rVAKolTptlXj414vmDr/D0i4d59uXXeenV5tCRUxw41RXPDRAt4Cuic7Qxk3KCZLDed1sgJmprsKmFkMvWhxaWHAwMV+wb8idXXmxuvunKA1xz+SVcct4e9g8se+JpbB5DjkxS6ebvqh7ZlKUIBl8aCraRNkVsbbF1RbaZcao5vtrjq/c+wV9++yBPn8KsASNKgNFQliJkcjn2zmCtp40BUingfbf2P2GJdD0MDNvXAcz1eLClLwBV9+/wNwgA5ov/Lk1QACAiIgoARERE3gmm079nQ8OYrqA0ZxV/ZRu+s66aefvjuVnzPJNj15yujDf7ue+46OGiPXztZ+++/MP33Ho1V196AT6u08trDE2DTxuQWmgbyBlsDXUf6iEYz2TSMh41VMZTV0OC73FmDEdOjnj28Akeee4ITx9+nScOTnafbji1RhkhNxUka4kZErk0CowRO31+bXmuu2rYu8jvXn/J4NeuvXAPN191AVdcuJN9g4q+bfG5gRhoTcZ5S8+U8MCEFsKkFMbZkLJllC2NG5IHuxnZRV46usL3H3qKB548zMMH2/OOtxxrSimO82Xmwkbo1vg7UxocZIvFY3KYdWRwWDYI8ysAtjRzfKNzXpoF2s2gZov0Qxr+TQOA6TSRVPoaKAAQEREFACIiIu+AAMDYubnhCdcVgNvGeTe7ym/vNNfNCMjZbH6yezxnwOQwu/u08X7oZgnUwCKw18It11b5Zz56Jx++40qW7RpsHGd5ADRNtyafsk7fVgTrCLbCZqhTCwlSsjTZQbVMawe8emLMwWOneerl13nuyDEefeH15tWTLK60tK0pOxtkW55/juAzDDzsHvArl53H79927SXcdNmFXHvJPnb3YOgCPo5wqaFnMsYZck6MvadJER8jfdNNrE8RYgAcowhmcTcn2gEPPv8aX7rveX7wxKl/d2SF/22VMtofqDEmE3PbnYXuEE7n9mPLk83gMdSUXgyRzNhsyW9mAYCdleWWrbek2S1pvrCf3fKjTv/XDAAREVEAICIi8s4LAWbOHv21c+VdfqOrZp4PBM79eG/UNq6yDpMiNWWJwFX7efiDt+66+VMfuInbrztA1ZwhrZ1m4MF6aDc2SCnR6/XIxoC3xBhJIWKjwdsKTEWOhnFriW7AsbUxLx47wzOHj/Pwi4d58qVw/7EV7ogZvGNXbXnPxXv4+m3XXMztV13IVecvcuGSZVcvYWlhsg6xBV+BrcB4kuthvWM8Ok2vshjvSU1D2wTq3gL4PqfGkbXc59uPPMtffPc5HnyexdcS6xuUpRPR1KQczjoq5zzO2c5u2r7d33wAwLbg5lxn8m/X2f+sTSL1IyQiIgoARERE5EcoJo0Fk7E54jP0gF0ezt/J7+1f5Fd/7Vc/xk1XnMeuOmMnZ1geekhj2pVTGJuZJIOrPD1jMCnApC2j774P/T5pZUyuB7R+gdXgOHxqnUefO8QDjz/P8y/C7mW4+46rueu2m9i/VLOQ11lkjEsb5NEZjLPQ82X2QZsgO5KtaSJM2oYdy0Oa8Tpt9tjeAvSWWE8Vz716hsdffI3//MVHOXyK844Gjk3omhMCAd/NvggqokVERBQAiIiIvPsvvo6y+x7dDnxldfpmz4AecO0F3PeZn7rxvffcdiUHdlkW3AZLvkzFt1Ssr6xjCCwuL4BNhNUVSBE/HJDbSHY1MTlC9mQ7pAmGY8fPcOz1V7n84v0sDhy9ypLaMSk0VM7j6wqsZ2M0wfuy2WEMAZNbBr4qWxcaQ2oMjesz8Ts4shK49+nX+PojL/DdJ09e98oaT0+YNkq0WDKVLesfpiP0ZVNFERERUQAgIiLyLr/49m3p8RcovQEwvdKpz1V4B6lZpU6BJWC3hxsPkP/Bp27hp+68kUEa4TfW2bM4ABNYOX2CGDZYXOjjK5hsbFDVDoMjRgitIZuKyvcxVOQ4gXSGnEc453D1AIylbVoCDlv1cNWASUzkBNZaTE607QRCS7B9WreT+x4/xDcffIJ7n2rvf+Y0d6wBYwsMdzKJtnRPTLGM9scxroz/4wxMsgIAERERBQAiIiLvehbT9bTfXPduu6tyAlOKZmugiqVpYI+ygd3FO/nXP/3+y/7l//jRmzh/kBgOHNYGqtxibSid/eKE3DblYX0FtiZHGE1aUrRYl+j3IphIExJN02Cto19VOGuJsWW0ts7C0k4CFSst2IXd5N4yT714mG888Bz/9ZtHP//yST63ObW/1PujDNl4wHWN87Z1QTAGiKW3gJYAiIiIKAAQERF5d5tO8u8mxFtK0W8y5LbbSg+8725O3VZ9BlIuTQMvhv13XsHRj9xzPe+9+Rp2LVmYrGDTOos11D4RxmOIiaoqDQJTKGv5beUJcZ1MIGWDtRZrHTlnYsy0MbOwtJvVSSRUy6ylHt959Dn+5C8f5tHnMBseTpuyZZ8xBmMMIaZptkFd1zRtJNJtOWDKLgZgyvz/nCCNuz4AIiIiogBARETkXcuCG5biP7WQA46Eg9le97WHUSj1cq/fZ3XckLFQ9ahTph83GFBmBeyruetjP7Xzu5/71N1cfckCee0oi67FxxE+RBwWki1rDdpMSpEmtdQ9h6174Cw0iXGyhGqJONjL8abHoweP84VvPMBXvnfcrOQyeJ8drAYYG1+WLeSAcRaTWkwKs60UrYHYLXHIpgs9rAfruv0VJwoAREREFACIiIj8JFx9u6nxJmNzpsqbzQGnamdpUurWy1elkDYessUbD2kDT8uw+7oe8P6ryR+7+xI++r4b2dXLLJmAa9axbUNtMhjXdR3M0B9Cm1gZtVSLe2G4m0dfPMbXHn6eL37nxUMvHefAyVwePLmaUVMKduv7tLkbzbemhBipxZDodQ8/XduQKUsDMpTtC/P0V4/037ofn4iIiCgAEBEReedcfG33F/MmRXDeLJe3/Ht+U/tpcOApMwJ6wF4P77uhn3/6Azdx540XcuGyoQpnMJPT5DZg8oBkl5jUOziyCt957GW++J2HeejZYE5ROvi30wIeWwIIurX9RAwTLGHuedktz3T69Oz219zdI6L6X0RERAGAiIjIT8DFdzrVfzpYPhs0N5R187PPpi0F9PTCHQybe+rhIVezEtvTUNPSA4bAxYv8q3tu87/5yXtu4YarL2DYG7KyAj948Dm+/N0Huf+Z/IuHx/zhCJgA1nsmIZCwc9/VdkW+BQKeyTmev932StPsebutmcUsXBAREREFACIiIu/6AAC6kXAzV+HPF9HThnm5zBRwc+V4Pqv49nOPmnDekcKYgYOBhzApn73+cvJtd9zJf/nKfZecXs2Hm7JZAN6CtdCErqP/rEAvZf58f4LcfX5+G7/8Rr9d5HP/wqHiX0RERAGAiIjITwi7+XFLALC9Sk5lUX0+exSduRCgLAAw267umVLOd0W+K9+iyYAp2wOSW4jNbCmBzSWQSPPfxIDLWwOAsOV7bwsuzGZwsCmp8hcREVEAICIi8hN49TWU7fFyN6afuwI6221Fcyp7Ac4X06Yr4LFzIcH8p8u8gMo7jDFM2qb0G5jePc/lA7PwwYHzEBOE9oc//7yZVyTmuvxPb50GADmVPQxzLn/vlgQoBxAREXlrOB0CERGRtyAAsNP19F0FnfOWytwQu0K++2Py1vBgtuZ/7j7dmLwh4siklEgpYgzUlS8TCXLGAANXpv3n3H3rZMqc/jQ/FSFvhgTTj9iyH2D3XDf7FtDdDlsXKOS51MF0r0lERETeql9BRERE5Mdq2hZvejEuk+rtOS7OZ+8CUIIDN7s1bY7Cb7uqD/qWGDPtZPOralPT5gmGtGUiQHkki7MVznsm0+YA256BYftOBN3teWuTwnM9/80mgmnbqxIREZEfB80AEBER+bEzGGw3mJ+xpNnIuHnDrygFtOmKf0fCzU2p33LHbrp/22ZihLoyVK4mp0Qm4zDdWPxmmz9nPSYnck6EmOaeyWy9wuy5zr7B3IT+6byBzT0DzhVkmLk/8zMeRERE5MfzG4iIiIi8BezcxfhHGwmfluvl4p22jKXns9OCc17wbfdV6Yd+H/sGn0lzD93dx6Rzdvrf3gLw7GaBGv0XERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERGRH5v/H5ACjPXaFfNVAAAAAElFTkSuQmCC" style="height:130px;width:auto;filter:drop-shadow(0 0 24px rgba(250,176,5,.4))">\n  <div style="display:flex;flex-direction:column;align-items:flex-start">\n    <div class="logo-title"><span>GRID</span>PHANTOM<span>DEV</span></div>\n    <div style="font-family:\'Share Tech Mono\',monospace;font-size:14px;color:#fab005;letter-spacing:4px;margin-top:2px">COMMAND CENTER v2.6</div>\n  </div>\n  <div class="logo-sub">\n    <span class="live-ind"><span class="live-dot"></span><span class="hb-dot" id="hbD"></span><span id="lB" style="color:#22c55e;font-family:\'Share Tech Mono\',monospace;font-size:14px">LIVE</span></span>\n    <span id="clk" class="m" style="color:#71717a;font-size:14px">--:--:--</span>\n  </div>\n</div>\n\n<!-- ROW 2: TICKER -->\n<div class="ticker-bar">\n  <div class="tk"><span class="tk-l">BTC</span><span class="tk-v amber m" id="bP">--</span><span id="bA" style="font-size:12px;color:#3f3f46">•</span></div>\n  <div class="tk"><span class="tk-l">P&L</span><span class="tk-v green m" id="tP">$0.00</span></div>\n  <div class="tk"><span class="tk-l">Win%</span><span class="tk-v m" id="tW" style="color:#d4d4d8">0%</span></div>\n  <div class="tk"><span class="tk-l">Trades</span><span class="tk-v m" id="tT" style="color:#d4d4d8">0</span></div>\n  <div class="tk"><span class="tk-l">Bankroll</span><span class="tk-v amber m" id="tB">$0</span></div>\n  <div class="tk"><span class="tk-l">15m Entry</span><span class="tk-timer" id="t15" style="color:#52525b">--:--</span></div>\n  <div class="tk"><span class="tk-l">5m Entry</span><span class="tk-timer" id="t5" style="color:#52525b">--:--</span></div>\n  <div class="tk"><span class="tk-l">Late Window</span><span class="tk-timer" id="tLW" style="color:#3f3f46">--:--</span></div>\n  <div class="tk" style="margin-left:auto;border-right:none"><span class="tk-l">RTDS</span><span id="rD" class="hb-dot" style="margin:0 4px"></span><span id="rSt" class="m" style="font-size:10px;color:#3f3f46">--</span><span id="rDt" class="m" style="font-size:9px;color:#3f3f46;margin-left:6px"></span></div>\n</div>\n\n<!-- ROW 3: ENGINES (horizontal) -->\n<div class="engine-row">\n  <!-- 15m -->\n  <div class="eng" id="e15"><div class="eng-h"><span><span class="eng-d on" id="e15d"></span><span class="eng-name">15m DIR</span></span><span class="eng-badge" style="background:#3b82f618;color:#3b82f6">CORE</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Trades</span><span class="eng-stat-v" id="e15t">0</span></div><div class="eng-stat"><span class="eng-stat-l">W/L</span><span class="eng-stat-v" id="e15wl">0/0</span></div><div class="eng-stat"><span class="eng-stat-l">P&L</span><span class="eng-stat-v" id="e15p" style="color:#22c55e">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Win%</span><span class="eng-stat-v" id="e15wr">0%</span></div></div><div class="eng-bar"><div class="eng-bar-f" id="e15b" style="width:0%"></div></div><div class="eng-status" id="e15l">Waiting...</div></div>\n  <!-- 5m -->\n  <div class="eng" id="e5"><div class="eng-h"><span><span class="eng-d" id="e5d"></span><span class="eng-name">5m DIR</span></span><span class="eng-badge" style="background:#a855f718;color:#a855f7">FAST</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Trades</span><span class="eng-stat-v" id="e5t">0</span></div><div class="eng-stat"><span class="eng-stat-l">W/L</span><span class="eng-stat-v" id="e5wl">0/0</span></div><div class="eng-stat"><span class="eng-stat-l">P&L</span><span class="eng-stat-v" id="e5p" style="color:#22c55e">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Win%</span><span class="eng-stat-v" id="e5wr">0%</span></div></div><div class="eng-bar"><div class="eng-bar-f" id="e5b" style="width:0%;background:#a855f7"></div></div><div class="eng-status" id="e5l">Waiting...</div></div>\n  <!-- LW -->\n  <div class="eng" id="eLW"><div class="eng-h"><span><span class="eng-d" id="eLWd"></span><span class="eng-name">Late Window</span></span><span class="eng-badge" style="background:#fab00518;color:#fab005">DRIFT</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Trades</span><span class="eng-stat-v" id="eLWt">0</span></div><div class="eng-stat"><span class="eng-stat-l">W/L</span><span class="eng-stat-v" id="eLWwl">0/0</span></div><div class="eng-stat"><span class="eng-stat-l">P&L</span><span class="eng-stat-v" id="eLWp" style="color:#22c55e">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Win%</span><span class="eng-stat-v" id="eLWwr">0%</span></div></div><div class="eng-bar"><div class="eng-bar-f" id="eLWb" style="width:0%;background:#fab005"></div></div><div class="eng-status" id="eLWl">Scanning...</div></div>\n  <!-- Arb -->\n  <div class="eng" id="eA"><div class="eng-h"><span><span class="eng-d" id="eAd"></span><span class="eng-name">Arb Scanner</span></span><span class="eng-badge" style="background:#10b98118;color:#10b981">ARB</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Scans</span><span class="eng-stat-v" id="eAs">0</span></div><div class="eng-stat"><span class="eng-stat-l">Trades</span><span class="eng-stat-v" id="eAt">0</span></div><div class="eng-stat"><span class="eng-stat-l">Profit</span><span class="eng-stat-v" id="eAp" style="color:#22c55e">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Markets</span><span class="eng-stat-v" id="eAm">0</span></div></div><div class="eng-bar"><div class="eng-bar-f" id="eAb" style="width:0%;background:#10b981"></div></div><div class="eng-status" id="eAl">Idle</div></div>\n  <!-- MM -->\n  <div class="eng"><div class="eng-h"><span><span class="eng-d"></span><span class="eng-name">Market Maker</span></span><span class="eng-badge" style="background:#ef444418;color:#ef4444">MM</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Quotes</span><span class="eng-stat-v">0</span></div><div class="eng-stat"><span class="eng-stat-l">Fills</span><span class="eng-stat-v">0</span></div><div class="eng-stat"><span class="eng-stat-l">P&L</span><span class="eng-stat-v">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Spread</span><span class="eng-stat-v">--</span></div></div><div class="eng-bar"><div class="eng-bar-f" style="width:0%;background:#ef4444"></div></div><div class="eng-status">Off</div></div>\n  <!-- Hedge -->\n  <div class="eng"><div class="eng-h"><span><span class="eng-d"></span><span class="eng-name">Hedge</span></span><span class="eng-badge" style="background:#6366f118;color:#6366f1">PROTECT</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Active</span><span class="eng-stat-v">0</span></div><div class="eng-stat"><span class="eng-stat-l">Hedged</span><span class="eng-stat-v">0</span></div><div class="eng-stat"><span class="eng-stat-l">Saved</span><span class="eng-stat-v">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Status</span><span class="eng-stat-v">Off</span></div></div><div class="eng-bar"><div class="eng-bar-f" style="width:0%;background:#6366f1"></div></div><div class="eng-status">Off</div></div>\n</div>\n\n<!-- MAIN 3-COLUMN -->\n<div class="main">\n  <!-- LEFT: Equity + Positions -->\n  <div class="col-left">\n    <div class="eq-wrap">\n      <div class="eq-title"><span>EQUITY CURVE</span><span class="eq-pnl" id="eqP" style="color:#22c55e">$0.00</span></div>\n      <canvas id="eqC"></canvas>\n    </div>\n    <div class="pos-wrap">\n      <div class="pos-h">\n        <span class="pos-title">POSITIONS</span>\n        <div style="display:flex;gap:4px">\n          <button class="tb a" id="tabO" onclick="switchTab(\'open\')">Open <span id="oC">0</span></button>\n          <button class="tb" id="tabC" onclick="switchTab(\'closed\')">Closed <span id="cC">0</span></button>\n        </div>\n      </div>\n      <div class="pos-cols"><span>TIME</span><span>DIR</span><span>SIZE / PRICE</span><span id="colL">EXP</span><span>P&L</span><span>RESULT</span></div>\n      <div class="pos-body" id="pB"><div style="padding:16px;text-align:center;color:#3f3f46;font-size:10px">Waiting for entry...</div></div>\n    </div>\n  </div>\n\n  <!-- MID: Signals + Oracle + Strategy -->\n  <div class="col-mid">\n    <div class="conf-wrap">\n      <div class="conf-num" id="cfN">0<span style="font-size:18px">%</span></div>\n      <div class="conf-dir" id="cfD" style="color:#52525b">HOLD</div>\n      <div class="conf-label" id="cfL">No trade</div>\n    </div>\n    <div class="sig-wrap">\n      <div class="sig-h"><span class="sig-title">SIGNALS</span></div>\n      <div class="sig-body" id="sigB"><div style="padding:8px;text-align:center;font-size:9px;color:#3f3f46">Waiting...</div></div>\n    </div>\n    <div class="oracle-wrap">\n      <div class="oracle-title"><span>ORACLE SOURCES</span><span id="rL" style="color:#3f3f46;font-family:\'Share Tech Mono\',monospace;font-size:9px">--</span></div>\n      <div class="oracle-row"><span><span class="oracle-dot" style="background:#22c55e"></span>Chainlink</span><span class="m" id="oCL" style="color:#d4d4d8;font-size:11px">--</span></div>\n      <div class="oracle-row"><span><span class="oracle-dot" style="background:#3b82f6"></span>Binance</span><span class="m" id="oBN" style="color:#71717a;font-size:11px">--</span></div>\n      <div class="oracle-row"><span><span class="oracle-dot" style="background:#a855f7"></span>CoinGecko</span><span class="m" style="color:#71717a;font-size:11px">--</span></div>\n    </div>\n    <div class="strat-wrap">\n      <div class="oracle-title" style="margin-bottom:4px"><span>STRATEGY</span></div>\n      <div class="strat-row"><span class="strat-l">Direction</span><span class="strat-v" id="sD" style="color:#71717a">HOLD</span></div>\n      <div class="strat-row"><span class="strat-l">Window Open</span><span class="strat-v" id="sA">--</span></div>\n      <div class="strat-row"><span class="strat-l">Drift</span><span class="strat-v" id="sAsub">--</span></div>\n      <div class="strat-row"><span class="strat-l">Detail</span><span class="strat-v" id="sDsub" style="font-size:9px;color:#52525b">--</span></div>\n      <div class="strat-row"><span class="strat-l">Risk</span><span class="strat-v" id="sR">0/20</span></div>\n      <div class="strat-row"><span class="strat-l">Risk Detail</span><span class="strat-v" id="sRsub" style="font-size:9px;color:#52525b">--</span></div>\n    </div>\n  </div>\n\n  <!-- RIGHT: Activity Feed -->\n  <div class="col-right">\n    <div class="feed-wrap">\n      <div class="feed-h"><span class="feed-title">ACTIVITY FEED</span></div>\n      <div class="feed-body" id="fdB"><div style="padding:8px;text-align:center;font-size:9px;color:#3f3f46">No activity</div></div>\n    </div>\n  </div>\n</div>\n\n<!-- Hidden elements for compatibility -->\n<span id="sB" style="display:none"></span>\n<span id="sP" style="display:none"></span>\n<span id="sPsub" style="display:none"></span>\n\n<!-- TOASTS -->\n<div class="to-wrap" id="toasts"></div>\n\n<script>\nfunction autoScale(){\n  const sw=window.innerWidth,sh=window.innerHeight;\n  const sx=sw/1920,sy=sh/1080;\n  const s=Math.min(sx,sy);\n  document.body.style.transform=\'scale(\'+s+\')\';\n  document.body.style.width=\'1920px\';\n  document.body.style.height=\'1080px\';\n}\nautoScale();\nwindow.addEventListener(\'resize\',autoScale);\nlet ws,state={},eq=[],tab=\'open\',lp=0,tc=0;\nfunction tmr15(){const n=new Date(),m=n.getMinutes(),s=n.getSeconds(),total=m*60+s,boundary=Math.ceil(total/900)*900,raw=boundary-total,t=Math.max(0,raw-60);return{text:`${Math.floor(t/60)}:${String(t%60).padStart(2,\'0\')}`,s:t,c:t<15?\'#22c55e\':t<60?\'#fab005\':\'#52525b\',active:t<=60&&t>0}}\nfunction tmrLW(){const n=new Date(),m=n.getMinutes(),s=n.getSeconds(),total=m*60+s,boundary=Math.ceil(total/900)*900,left=boundary-total;if(left<=150&&left>0){const t=left;return{text:`${Math.floor(t/60)}:${String(t%60).padStart(2,\'0\')}`,s:t,c:t<30?\'#ef4444\':\'#a855f7\',active:true}}return{text:\'--:--\',s:999,c:\'#3f3f46\',active:false}}\nfunction tmr5(){const n=new Date(),m=n.getMinutes(),s=n.getSeconds(),total=m*60+s,boundary=Math.ceil(total/300)*300,raw=boundary-total,t=Math.max(0,raw-55);return{text:`${Math.floor(t/60)}:${String(t%60).padStart(2,\'0\')}`,s:t,c:t<15?\'#a855f7\':t<55?\'#52525b\':\'#3f3f46\',active:t<=55&&t>0}}\nfunction ft(ts){if(!ts)return\'--:--\';return new Date(typeof ts===\'number\'?ts*1000:ts).toLocaleTimeString([],{hour:\'2-digit\',minute:\'2-digit\',second:\'2-digit\'})}\nfunction switchTab(t){tab=t;$(\'tabO\').className=\'tb\'+(t===\'open\'?\' a\':\'\');$(\'tabC\').className=\'tb\'+(t===\'closed\'?\' a\':\'\');$(\'colL\').textContent=t===\'closed\'?\'Result\':\'Exp\';if(state.positions)rPos(state)}\nfunction $(id){return document.getElementById(id)}\nfunction mkRow(p,cl){const up=(p.direction||\'\').toLowerCase()===\'up\';const sz=p.size_usd||0,ep=p.entry_price||0,cf=p.confidence||0;const pnl=cl?(p.pnl||0):0;const pc=pnl>=0?\'#22c55e\':\'#ef4444\';const tm=ft(p.timestamp);let last=\'\';if(cl){const w=p.outcome===\'win\'||pnl>0;last=`<span class="rp" style="background:${w?\'rgba(34,197,94,.08)\':\'rgba(239,68,68,.08)\'};color:${w?\'#22c55e\':\'#ef4444\'}">${w?\'WIN\':\'LOSS\'}</span>`}return `<div class="tr"><span style="color:#3f3f46" class="m">${tm}</span><span><span class="db" style="background:${up?\'rgba(34,197,94,.08)\':\'rgba(239,68,68,.08)\'};color:${up?\'#22c55e\':\'#ef4444\'}">${up?\'\\u25B2\':\'\\u25BC\'}</span></span><span style="color:#52525b">$${sz.toFixed(2)} <span class="m" style="color:#71717a">@${ep.toFixed(3)}</span></span><span style="color:#3f3f46;text-align:right">${(cf*100).toFixed(0)}%</span><span class="m" style="text-align:right;color:${pc};font-weight:700">${cl?(pnl>=0?\'+\':\'\')+pnl.toFixed(2):\'--\'}</span><span style="text-align:right">${last}</span></div>`}\nfunction rPos(d){const op=d.positions?.open||[],cl=d.positions?.closed||[];$(\'oC\').textContent=op.length;$(\'cC\').textContent=cl.length;const items=tab===\'open\'?op:cl;const b=$(\'pB\');if(!items.length){b.innerHTML=`<div style="padding:16px;text-align:center;color:#3f3f46;font-size:10px">${tab===\'open\'?\'Waiting for entry...\':\'No history\'}</div>`}else{b.innerHTML=items.map(p=>mkRow(p,tab===\'closed\')).join(\'\')}}\nconst SC={price_vs_open:\'#fab005\',momentum:\'#3b82f6\',rsi:\'#a855f7\',macd:\'#10b981\',ema_cross:\'#ec4899\'};const SI={price_vs_open:\'\\u25CE\',momentum:\'\\u2192\',rsi:\'\\u223F\',macd:\'\\u2261\',ema_cross:\'\\u2573\'};\nfunction rSig(d){const sigs=d.signals||{};const k=Object.keys(sigs);if(!k.length){$(\'sigB\').innerHTML=\'<div style="padding:8px;text-align:center;font-size:9px;color:#3f3f46">Waiting...</div>\';return}let h=\'\';for(const n of k){const s=sigs[n];const c=SC[n]||\'#52525b\';const dc=s.direction===\'up\'?\'#22c55e\':s.direction===\'down\'?\'#ef4444\':\'#52525b\';const w=Math.round(Math.min(1,s.strength)*100);h+=`<div class="sigr"><div class="sigi" style="background:${c}18;color:${c}">${SI[n]||\'\\u25CF\'}</div><div style="flex:1;min-width:0"><div class="sign">${n.replace(/_/g,\' \')}</div><div class="sigv" style="color:${dc}">${s.direction.toUpperCase()} (${s.raw_value})</div></div><div class="sigbw"><div class="sigbf" style="width:${w}%;background:${c}"></div></div></div>`}$(\'sigB\').innerHTML=h}\nfunction drawEq(){const c=$(\'eqC\');if(!c)return;const x=c.getContext(\'2d\');c.width=c.offsetWidth*2;c.height=440;x.scale(2,2);const W=c.offsetWidth,H=220;x.clearRect(0,0,W,H);if(eq.length<2)return;const mn=Math.min(...eq),mx=Math.max(...eq),rng=mx-mn||1;const pts=eq.map((v,i)=>({x:(i/(eq.length-1))*W,y:H-6-((v-mn)/rng)*(H-12)}));const last=eq[eq.length-1];const pos=last>=0;const gd=x.createLinearGradient(0,0,0,H);gd.addColorStop(0,pos?\'rgba(34,197,94,.12)\':\'rgba(239,68,68,.12)\');gd.addColorStop(1,\'rgba(0,0,0,0)\');x.beginPath();x.moveTo(pts[0].x,H);pts.forEach(p=>x.lineTo(p.x,p.y));x.lineTo(pts[pts.length-1].x,H);x.closePath();x.fillStyle=gd;x.fill();x.beginPath();pts.forEach((p,i)=>i===0?x.moveTo(p.x,p.y):x.lineTo(p.x,p.y));x.strokeStyle=pos?\'#22c55e\':\'#ef4444\';x.lineWidth=1.5;x.stroke();const lpt=pts[pts.length-1];x.beginPath();x.arc(lpt.x,lpt.y,3,0,Math.PI*2);x.fillStyle=pos?\'#22c55e\':\'#ef4444\';x.fill()}\nlet feed=[];function addF(ic,txt,col){feed.unshift({ic,txt,col,ts:Date.now()/1000});if(feed.length>30)feed.pop();rFeed()}\nfunction rFeed(){const el=$(\'fdB\');if(!feed.length){el.innerHTML=\'<div style="padding:8px;text-align:center;font-size:9px;color:#3f3f46">No activity</div>\';return}el.innerHTML=feed.map(f=>`<div class="fi"><span class="fic">${f.ic}</span><div><div class="ft" style="color:${f.col}">${f.txt}</div><div class="fts m">${ft(f.ts)}</div></div></div>`).join(\'\')}\nfunction render(d){state=d;const pnl=d.risk?.total_pnl||d.stats?.total_pnl||0;const pp=pnl>=0;$(\'tP\').textContent=(pp?\'+\':\'\')+`$${pnl.toFixed(2)}`;$(\'tP\').style.color=pp?\'#22c55e\':\'#ef4444\';$(\'tW\').textContent=`${(d.stats?.win_rate||0).toFixed(0)}%`;$(\'tT\').textContent=d.stats?.total_trades||0;$(\'tB\').textContent=`$${(d.risk?.capital||0).toFixed(0)}`;$(\'sB\').textContent=`$${(d.risk?.capital||0).toFixed(0)}`;$(\'sP\').textContent=(pp?\'+\':\'\')+`$${pnl.toFixed(2)}`;$(\'sP\').style.color=pp?\'#22c55e\':\'#ef4444\';$(\'sPsub\').textContent=`${d.stats?.completed||0} completed`;const ap=d.anchor?.open_price;$(\'sA\').textContent=ap?`$${ap.toLocaleString()}`:\'--\';const dr=d.anchor?.drift_pct;$(\'sAsub\').textContent=dr!=null?`Drift: ${dr>0?\'+\':\'\'}${dr.toFixed(4)}%`:\'--\';const dir=(d.strategy?.direction||\'hold\').toUpperCase();$(\'sD\').textContent=dir;$(\'sD\').style.color=dir===\'UP\'?\'#22c55e\':dir===\'DOWN\'?\'#ef4444\':\'#71717a\';$(\'sDsub\').textContent=`conf=${(d.strategy?.confidence||0).toFixed(2)} | vol=${(d.strategy?.volatility_pct||0).toFixed(3)}%`;$(\'sR\').textContent=`${d.risk?.daily_trades||0}/${d.risk?.max_daily_trades||20}`;$(\'sR\').style.color=d.risk?.cooldown_active?\'#ef4444\':\'#d4d4d8\';$(\'sRsub\').textContent=`Loss: ${(d.risk?.daily_loss_pct||0).toFixed(1)}% | Streak: ${d.risk?.consecutive_losses||0}`;const cf=d.strategy?.confidence||0;$(\'cfN\').innerHTML=`${(cf*100).toFixed(0)}<span style="font-size:18px">%</span>`;$(\'cfN\').style.color=cf>=.7?\'#22c55e\':cf>=.5?\'#fab005\':\'#52525b\';$(\'cfD\').textContent=dir;$(\'cfD\').style.color=dir===\'UP\'?\'#22c55e\':dir===\'DOWN\'?\'#ef4444\':\'#52525b\';$(\'cfL\').textContent=d.strategy?.should_trade?\'TRADE SIGNAL\':\'No trade\';if(d.oracle){const hasCL=d.oracle.sources?.includes(\'chainlink\');$(\'rSt\').textContent=hasCL?\'Streaming\':\'Buffered\';$(\'rSt\').style.color=hasCL?\'#22c55e\':\'#fab005\';$(\'rD\').style.background=hasCL?\'#22c55e\':\'#fab005\';$(\'rL\').style.color=hasCL?\'#22c55e\':\'#fab005\';if(d.oracle.chainlink)$(\'oCL\').textContent=\'$\'+d.oracle.chainlink.toLocaleString(undefined,{maximumFractionDigits:2});$(\'rDt\').textContent=hasCL?`CL $${(d.oracle.chainlink||0).toLocaleString()}`:\'REST fallback\'}const bp=d.oracle?.price||0;if(bp>0){$(\'bP\').textContent=\'$\'+bp.toLocaleString(undefined,{minimumFractionDigits:2,maximumFractionDigits:2})}rSig(d);rPos(d);eq.push(pnl);if(eq.length>120)eq.shift();const ep=$(\'eqP\');ep.textContent=(pp?\'+\':\'\')+`$${pnl.toFixed(2)}`;ep.style.color=pp?\'#22c55e\':\'#ef4444\';drawEq();const es=d.engine_stats||{};const e15=es.dir_15m||{};const e15w=e15.wins||0,e15l=e15.losses||0,e15pnl=e15.pnl||0,e15pp=e15pnl>=0;$(\'e15t\').textContent=e15.trades||0;$(\'e15wl\').textContent=`${e15w}/${e15l}`;$(\'e15p\').textContent=(e15pp?\'+\':\'\')+`$${e15pnl.toFixed(2)}`;$(\'e15p\').style.color=e15pp?\'#22c55e\':\'#ef4444\';$(\'e15wr\').textContent=`${(e15.win_rate||0).toFixed(0)}%`;$(\'e15b\').style.width=`${e15.win_rate||0}%`;$(\'e15l\').textContent=`Cycle #${d.cycle||0}`;const e5s=es.dir_5m||{};const e5w=e5s.wins||0,e5l2=e5s.losses||0,e5pnl=e5s.pnl||0,e5pp=e5pnl>=0;$(\'e5t\').textContent=(e5w+e5l2)||0;$(\'e5wl\').textContent=`${e5w}/${e5l2}`;$(\'e5p\').textContent=(e5pp?\'+\':\'\')+`$${e5pnl.toFixed(2)}`;$(\'e5p\').style.color=e5pp?\'#22c55e\':\'#ef4444\';$(\'e5wr\').textContent=`${(e5s.win_rate||0).toFixed(0)}%`;$(\'e5b\').style.width=`${e5s.win_rate||0}%`;$(\'e5l\').textContent=(e5s.trades||0)>0?`${e5w+e5l2} resolved / ${e5s.trades} placed`:\'Waiting...\';$(\'e5d\').className=\'eng-d on\';const eLWs=es.late_window||{};const eLWw=eLWs.wins||0,eLWl2=eLWs.losses||0,eLWpnl=eLWs.pnl||0,eLWpp=eLWpnl>=0;$(\'eLWt\').textContent=(eLWw+eLWl2)||0;$(\'eLWwl\').textContent=`${eLWw}/${eLWl2}`;$(\'eLWp\').textContent=(eLWpp?\'+\':\'\')+`$${eLWpnl.toFixed(2)}`;$(\'eLWp\').style.color=eLWpp?\'#22c55e\':\'#ef4444\';$(\'eLWwr\').textContent=`${(eLWs.win_rate||0).toFixed(0)}%`;$(\'eLWb\').style.width=`${eLWs.win_rate||0}%`;$(\'eLWl\').textContent=(eLWs.trades||0)>0?`${eLWw+eLWl2} resolved / ${eLWs.trades} placed`:\'Scanning...\';$(\'eLWd\').className=\'eng-d on\';const a=d.arb_scanner;if(a){$(\'eAd\').className=\'eng-d on\';$(\'eAs\').textContent=a.scan_count||0;$(\'eAt\').textContent=a.arb_trades||0;$(\'eAp\').textContent=\'$\'+(a.arb_profit||0).toFixed(2);$(\'eAp\').style.color=(a.arb_profit||0)>=0?\'#22c55e\':\'#ef4444\';$(\'eAm\').textContent=a.markets_live||0;$(\'eAl\').textContent=a.running?\'Scanning...\':\'Stopped\';$(\'eAb\').style.width=`${Math.min(100,(a.scan_count||0)/10*100)}%`}addF(\'\\u26A1\',`[15m] Cycle #${d.cycle||0}: ${dir} conf=${(cf*100).toFixed(0)}%`,dir===\'UP\'?\'#22c55e\':dir===\'DOWN\'?\'#ef4444\':\'#52525b\');if(a&&(a.scan_count||0)>0&&(d.cycle||0)%5===0)addF(\'\\uD83D\\uDD04\',`[ARB] ${a.scan_count} scans, ${a.markets_live||0} mkts`,\'#10b981\')}\nfunction hPT(msg){const p=msg.price||msg.chainlink||msg.binance||0;if(p<=0)return;const el=$(\'bP\');const prev=lp||0;el.textContent=\'$\'+p.toLocaleString(undefined,{minimumFractionDigits:2,maximumFractionDigits:2});if(prev>0&&p!==prev){el.style.animation=p>prev?\'prUp .7s ease\':\'prDn .7s ease\';setTimeout(()=>{el.style.animation=\'\'},700);$(\'bA\').textContent=p>prev?\'\\u25B2\':\'\\u25BC\';$(\'bA\').style.color=p>prev?\'#22c55e\':\'#ef4444\'}lp=p;if(msg.chainlink)$(\'oCL\').textContent=\'$\'+msg.chainlink.toLocaleString(undefined,{maximumFractionDigits:2});if(msg.binance)$(\'oBN\').textContent=\'$\'+msg.binance.toLocaleString(undefined,{maximumFractionDigits:2});tc++;pHB()}\nconst EL={directional:\'15m\',directional_5m:\'5m\',late_window:\'LW\',arb:\'ARB\',mm:\'MM\'};function showToast(msg){const c=$(\'toasts\');if(!c)return;const t=document.createElement(\'div\');const res=msg.action===\'resolved\';const win=msg.outcome===\'win\';const up=(msg.direction||\'\').toLowerCase()===\'up\';const dir=up?\'UP\':\'DOWN\';const eng=EL[msg.engine]||msg.engine||\'\';let cls=\'to op\',ic=\'\\uD83D\\uDCC8\',ti=\'\',dt=\'\',ph=\'\';if(res){cls=\'to \'+(win?\'w\':\'l\');ic=win?\'\\u2705\':\'\\u274C\';ti=(win?\'WIN\':\'LOSS\')+\' \\u2014 \'+dir+\' [\'+eng+\']\';dt=\'$\'+(msg.size_usd||0).toFixed(2);const pnl=msg.pnl||0;ph=`<div class="to-p" style="color:${pnl>=0?\'#22c55e\':\'#ef4444\'}">${pnl>=0?\'+\':\'\'}$${Math.abs(pnl).toFixed(2)}</div>`}else{ti=\'OPENED \\u2014 \'+dir+\' [\'+eng+\']\';dt=\'$\'+(msg.size_usd||0).toFixed(2)+\' @ \'+(msg.entry_price||0).toFixed(3)}t.className=cls;t.innerHTML=`<span class="to-i">${ic}</span><div style="flex:1"><div class="to-t">${ti}</div><div class="to-d m">${dt}</div></div>${ph}`;c.appendChild(t);const em={directional:\'e15\',directional_5m:\'e5\',late_window:\'eLW\',arb:\'eA\',mm:\'eMM\'};const cid=em[msg.engine];if(cid){const cd=document.getElementById(cid);if(cd){cd.classList.remove(\'fl\');void cd.offsetWidth;cd.classList.add(\'fl\')}}if(res){addF(win?\'\\u2705\':\'\\u274C\',`${win?\'WIN\':\'LOSS\'} ${dir} [${eng}] $${(msg.pnl||0).toFixed(2)}`,win?\'#22c55e\':\'#ef4444\')}else{addF(\'\\uD83D\\uDCC8\',`OPENED ${dir} [${eng}] $${(msg.size_usd||0).toFixed(2)}`,up?\'#22c55e\':\'#ef4444\')}setTimeout(()=>{t.classList.add(\'to-x\');setTimeout(()=>t.remove(),250)},6000)}\nlet hbT;function pHB(){const d=$(\'hbD\');if(d){d.style.background=\'#22c55e\';d.style.boxShadow=\'0 0 6px rgba(34,197,94,.4)\'}clearTimeout(hbT);hbT=setTimeout(()=>{if(d){d.style.background=\'#fab005\';d.style.boxShadow=\'none\'}},5000)}\nsetInterval(()=>{$(\'clk\').textContent=new Date().toLocaleTimeString([],{hour:\'2-digit\',minute:\'2-digit\',second:\'2-digit\'});const a=tmr15();$(\'t15\').textContent=a.text;$(\'t15\').style.color=a.c;if(a.active)$(\'t15\').style.textShadow=\'0 0 8px \'+a.c;else $(\'t15\').style.textShadow=\'none\';const a5=tmr5();$(\'t5\').textContent=a5.text;$(\'t5\').style.color=a5.c;if(a5.active)$(\'t5\').style.textShadow=\'0 0 8px \'+a5.c;else $(\'t5\').style.textShadow=\'none\';const b=tmrLW();$(\'tLW\').textContent=b.text;$(\'tLW\').style.color=b.c;if(b.active)$(\'tLW\').style.textShadow=\'0 0 8px \'+b.c;else $(\'tLW\').style.textShadow=\'none\'},1000);\nconst EI={\'15m\':\'\\u26A1\',\'5m\':\'\\u23F1\',\'lw\':\'\\uD83D\\uDD2E\',\'arb\':\'\\uD83D\\uDD04\',\'mm\':\'\\uD83C\\uDFE6\',\'hedge\':\'\\uD83D\\uDEE1\'};const EC={\'15m\':\'#3b82f6\',\'5m\':\'#a855f7\',\'lw\':\'#fab005\',\'arb\':\'#10b981\',\'mm\':\'#ef4444\',\'hedge\':\'#6366f1\'};const EA={\'hold\':\'\\u23F8\',\'blocked\':\'\\u26D4\',\'entry\':\'\\u25B6\',\'skip\':\'\\u23ED\',\'no_markets\':\'\\u2205\',\'scan\':\'\\uD83D\\uDD0D\',\'trade\':\'\\uD83D\\uDCC8\'};function hEE(msg){const eng=msg.engine||\'?\';const ic=EI[eng]||\'\\u2699\';const col=EC[eng]||\'#52525b\';const act=msg.action||\'\';const actIc=EA[act]||\'\';const detail=msg.detail||act;addF(ic,`[${eng.toUpperCase()}] ${actIc} ${detail}`,col);pHB()}\nfunction conn(){const p=location.protocol===\'https:\'?\'wss\':\'ws\';ws=new WebSocket(`${p}://${location.host}/ws`);ws.onopen=()=>{$(\'lB\').textContent=\'LIVE\';$(\'lB\').style.color=\'#22c55e\';pHB()};ws.onmessage=e=>{try{const msg=JSON.parse(e.data);if(msg.type===\'price_tick\')hPT(msg);else if(msg.type===\'trade_notification\')showToast(msg);else if(msg.type===\'engine_event\')hEE(msg);else{render(msg);pHB()}}catch(err){console.error(err)}};ws.onclose=()=>{$(\'lB\').textContent=\'RECONNECTING\';$(\'lB\').style.color=\'#fab005\';setTimeout(conn,3000)};ws.onerror=()=>ws.close()}\nconn();drawEq();\n</script></body></html>\n'
+    return '<!DOCTYPE html><html><head><meta charset="utf-8"><title>GRIDPHANTOMDEV Command Center</title>\n<link rel="preconnect" href="https://fonts.googleapis.com">\n<link href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Share+Tech+Mono&family=Rajdhani:wght@400;500;600;700&display=swap" rel="stylesheet">\n<style>\n*{margin:0;padding:0;box-sizing:border-box}\nbody{background:#0a0a0f;color:#d4d4d8;font-family:\'Rajdhani\',sans-serif;overflow:hidden;transform-origin:top left;width:1920px;height:1080px}\n.m{font-family:\'Share Tech Mono\',monospace}\n\n/* ── ROW 1: LOGO BANNER ── */\n.logo-bar{height:160px;background:linear-gradient(180deg,#111118 0%,#0a0a0f 100%);border-bottom:2px solid #fab005;display:flex;align-items:center;justify-content:flex-start;position:relative;gap:16px;padding-left:20px}\n.logo-title{font-family:\'Orbitron\',sans-serif;font-weight:900;font-size:52px;letter-spacing:10px;color:#fff;text-shadow:0 0 30px rgba(250,176,5,.3),0 2px 4px rgba(0,0,0,.5)}.logo-title span{color:#fab005}\n.logo-sub{position:absolute;right:24px;top:50%;transform:translateY(-50%);display:flex;align-items:center;gap:16px;font-size:13px}\n.logo-ver{color:#3f3f46;font-family:\'Share Tech Mono\',monospace;font-size:10px}\n.logo-left{position:absolute;left:20px;top:50%;transform:translateY(-50%);display:flex;align-items:center;gap:8px}\n.logo-left img{height:32px;width:32px;border-radius:4px}\n\n/* ── ROW 2: STATS TICKER ── */\n.ticker-bar{height:110px;background:#0d0d14;border-bottom:1px solid #27272a;display:flex;align-items:center;padding:0 16px;gap:6px;overflow:hidden}\n.tk{display:flex;align-items:center;gap:8px;padding:0 16px;height:80px;border-right:1px solid #1a1a2e;white-space:nowrap}\n.tk:last-child{border-right:none}\n.tk-l{font-size:15px;color:#71717a;text-transform:uppercase;letter-spacing:1px;font-family:\'Share Tech Mono\',monospace}\n.tk-v{font-size:38px;font-weight:700;font-family:\'Share Tech Mono\',monospace}\n.tk-v.amber{color:#fab005}\n.tk-v.green{color:#22c55e}\n.tk-v.red{color:#ef4444}\n.tk-v.dim{color:#71717a}\n.tk-timer{font-size:36px;font-family:\'Share Tech Mono\',monospace;min-width:42px;text-align:center}\n\n/* ── ROW 3: ENGINES (horizontal) ── */\n.engine-row{height:130px;background:#0d0d14;border-bottom:1px solid #1a1a2e;display:flex;padding:6px 12px;gap:8px}\n.eng{flex:1;background:#111118;border:1px solid #1a1a2e;border-radius:6px;padding:8px 12px;position:relative;overflow:hidden;transition:border-color .3s}\n.eng:hover{border-color:#27272a}\n.eng.fl{animation:engFlash .6s ease}\n@keyframes engFlash{0%{border-color:#22c55e;box-shadow:0 0 12px rgba(34,197,94,.2)}100%{border-color:#1a1a2e;box-shadow:none}}\n.eng-h{display:flex;align-items:center;justify-content:space-between;margin-bottom:4px}\n.eng-name{font-size:14px;font-weight:700;color:#d4d4d8;letter-spacing:1px}\n.eng-badge{font-size:10px;padding:2px 7px;border-radius:3px;font-weight:700;letter-spacing:1px}\n.eng-d{width:6px;height:6px;border-radius:50%;background:#3f3f46;display:inline-block;margin-right:4px}\n.eng-d.on{background:#22c55e;box-shadow:0 0 6px rgba(34,197,94,.4)}\n.eng-stats{display:flex;gap:12px;font-size:11px;margin-bottom:4px}\n.eng-stat{display:flex;flex-direction:column;align-items:center}\n.eng-stat-l{color:#71717a;font-size:10px;text-transform:uppercase;letter-spacing:.5px}\n.eng-stat-v{font-family:\'Share Tech Mono\',monospace;font-size:19px;font-weight:700}\n.eng-bar{height:3px;background:#1a1a2e;border-radius:1px;margin-top:auto}\n.eng-bar-f{height:100%;border-radius:1px;transition:width .5s;background:#3b82f6}\n.eng-status{font-size:11px;color:#3f3f46;font-family:\'Share Tech Mono\',monospace;margin-top:2px;white-space:nowrap;overflow:hidden;text-overflow:ellipsis}\n\n/* ── MAIN 3-COLUMN AREA ── */\n.main{display:flex;height:calc(1080px - 160px - 110px - 130px);overflow:hidden}\n.col-left{flex:1;display:flex;flex-direction:column;border-right:1px solid #1a1a2e;min-width:0}\n.col-mid{width:280px;border-right:1px solid #1a1a2e;display:flex;flex-direction:column;overflow:hidden}\n.col-right{width:320px;display:flex;flex-direction:column;overflow:hidden}\n\n/* ── EQUITY CURVE ── */\n.eq-wrap{height:260px;padding:8px 12px;border-bottom:1px solid #1a1a2e;position:relative}\n.eq-title{font-size:10px;color:#52525b;letter-spacing:1px;text-transform:uppercase;margin-bottom:4px;display:flex;justify-content:space-between}\n.eq-pnl{font-family:\'Share Tech Mono\',monospace;font-size:13px;font-weight:700}\ncanvas{width:100%;height:calc(100% - 20px);display:block}\n\n/* ── POSITIONS TABLE ── */\n.pos-wrap{flex:1;display:flex;flex-direction:column;overflow:hidden}\n.pos-h{display:flex;align-items:center;justify-content:space-between;padding:8px 12px;border-bottom:1px solid #1a1a2e}\n.pos-title{font-size:11px;color:#52525b;letter-spacing:1px;text-transform:uppercase}\n.tb{font-size:10px;padding:2px 10px;background:transparent;border:1px solid #27272a;color:#71717a;cursor:pointer;border-radius:3px;font-family:\'Share Tech Mono\',monospace}\n.tb.a{background:#22c55e18;border-color:#22c55e;color:#22c55e}\n.pos-cols{display:grid;grid-template-columns:70px 36px 100px 40px 50px 50px;padding:4px 12px;font-size:8px;color:#3f3f46;text-transform:uppercase;letter-spacing:.5px;border-bottom:1px solid #111118}\n.pos-body{flex:1;overflow-y:auto;padding:0 12px}\n.tr{display:grid;grid-template-columns:70px 36px 100px 40px 50px 50px;padding:4px 0;font-size:11px;border-bottom:1px solid #111118;align-items:center}\n.db{font-size:9px;padding:1px 5px;border-radius:2px;font-weight:700}\n.rp{font-size:8px;padding:1px 5px;border-radius:2px;font-weight:700}\n\n/* ── SIGNALS PANEL ── */\n.sig-wrap{flex:1;display:flex;flex-direction:column;overflow:hidden}\n.sig-h{padding:8px 10px;border-bottom:1px solid #1a1a2e;display:flex;align-items:center;justify-content:space-between}\n.sig-title{font-size:10px;color:#52525b;letter-spacing:1px;text-transform:uppercase}\n.sig-body{flex:1;overflow-y:auto;padding:4px 10px}\n.sigr{display:flex;align-items:center;gap:8px;padding:5px 0;border-bottom:1px solid #111118}\n.sigi{width:22px;height:22px;display:flex;align-items:center;justify-content:center;border-radius:4px;font-size:12px;flex-shrink:0}\n.sign{font-size:10px;color:#a1a1aa}\n.sigv{font-size:11px;font-weight:700;font-family:\'Share Tech Mono\',monospace}\n.sigbw{width:40px;height:3px;background:#1a1a2e;border-radius:2px;flex-shrink:0}\n.sigbf{height:100%;border-radius:2px}\n\n/* ── CONFIDENCE + ORACLE ── */\n.conf-wrap{padding:10px;border-bottom:1px solid #1a1a2e;text-align:center}\n.conf-num{font-family:\'Orbitron\',sans-serif;font-size:42px;font-weight:900;line-height:1}\n.conf-dir{font-size:12px;font-weight:700;margin-top:2px}\n.conf-label{font-size:8px;color:#3f3f46;margin-top:2px}\n.oracle-wrap{padding:8px 10px;border-bottom:1px solid #1a1a2e}\n.oracle-title{font-size:9px;color:#52525b;letter-spacing:1px;text-transform:uppercase;margin-bottom:4px;display:flex;justify-content:space-between}\n.oracle-row{display:flex;justify-content:space-between;align-items:center;font-size:10px;padding:2px 0}\n.oracle-dot{width:5px;height:5px;border-radius:50%;display:inline-block;margin-right:4px}\n\n/* ── STRATEGY INFO (in signals col) ── */\n.strat-wrap{padding:8px 10px;border-bottom:1px solid #1a1a2e}\n.strat-row{display:flex;justify-content:space-between;font-size:10px;padding:1px 0}\n.strat-l{color:#52525b}\n.strat-v{font-family:\'Share Tech Mono\',monospace;color:#d4d4d8}\n\n/* ── ACTIVITY FEED ── */\n.feed-wrap{flex:1;display:flex;flex-direction:column;overflow:hidden}\n.feed-h{padding:8px 10px;border-bottom:1px solid #1a1a2e;display:flex;align-items:center;justify-content:space-between}\n.feed-title{font-size:10px;color:#52525b;letter-spacing:1px;text-transform:uppercase}\n.feed-body{flex:1;overflow-y:auto;padding:4px 8px}\n.fi{display:flex;gap:6px;padding:4px 0;border-bottom:1px solid #111118;align-items:flex-start}\n.fic{font-size:12px;flex-shrink:0;margin-top:1px}\n.ft{font-size:10px;line-height:1.3}\n.fts{font-size:8px;color:#3f3f46}\n\n/* ── TOASTS ── */\n.to-wrap{position:fixed;top:130px;right:16px;z-index:100;display:flex;flex-direction:column;gap:6px;pointer-events:none}\n.to{display:flex;align-items:center;gap:8px;padding:8px 12px;border-radius:6px;font-size:11px;animation:toIn .3s ease;pointer-events:auto;min-width:240px}\n.to.op{background:rgba(59,130,246,.1);border:1px solid rgba(59,130,246,.3)}\n.to.w{background:rgba(34,197,94,.1);border:1px solid rgba(34,197,94,.3)}\n.to.l{background:rgba(239,68,68,.1);border:1px solid rgba(239,68,68,.3)}\n.to-x{opacity:0;transform:translateX(20px);transition:all .25s}\n.to-i{font-size:16px}\n.to-t{font-weight:600;font-size:11px}\n.to-d{font-size:9px;color:#71717a}\n.to-p{font-weight:700;font-size:13px;font-family:\'Share Tech Mono\',monospace}\n@keyframes toIn{from{opacity:0;transform:translateX(20px)}to{opacity:1;transform:translateX(0)}}\n@keyframes prUp{0%{color:#22c55e}100%{color:#fab005}}\n@keyframes prDn{0%{color:#ef4444}100%{color:#fab005}}\n\n/* ── LIVE INDICATOR ── */\n.live-ind{display:flex;align-items:center;gap:6px}\n.live-dot{width:7px;height:7px;border-radius:50%;background:#22c55e;animation:pulse 2s infinite}\n@keyframes pulse{0%,100%{opacity:1}50%{opacity:.4}}\n.hb-dot{width:5px;height:5px;border-radius:50%;background:#3f3f46;transition:all .3s}\n\n/* ── SCROLLBAR ── */\n::-webkit-scrollbar{width:3px}\n::-webkit-scrollbar-track{background:#0a0a0f}\n::-webkit-scrollbar-thumb{background:#27272a;border-radius:2px}\n</style></head>\n<body>\n\n<!-- ROW 1: LOGO -->\n<div class="logo-bar">\n  <img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABAAAAAQACAYAAAB/HSuDAAEAAElEQVR42uz9eZylZ33feX+u67q3c05Vd1er1RJCQkICtLAjAWIVi8ALeCGOcGyPY5PEMPGSOE6ewPN6ZWZgyDMvyJPlNTPOApnHTmLjcSTHK4YYZMwuEMggIQkJSa2l1VpavVbVWe77vpbnj/ucU6dKvUkC2Ux/369XqatOnX3RXb/f9fv9LhAREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREREROS0YPQUiIiLf3wfwdKxfppNfPj2FPxiSXgIRERElAEREROR7f/C2Cz/HxYD8WEf21J1uFqJ2O73cPJg3Wy4/Pe/sMnb+q+6WA1FJABERke8zTk+BiIjI96e0EPifLKNvjvFz2nrCCa7ETv/r5rer8F9EROT7jSoAREREvu9Yuhz+bB0/YYhY4nELAOI0hE9YwG8s9JtjXafduCCRjRqDiCNurhwQERGR7xuqABAREfm+Y4CMxUYAg5ku4j++u99gp6fajQSBSZv7CJKb/lmQsdFksCWdYBLJJC0fiIiIfB//BSEiIiLfdyybI/jFw3ra9JOdrtmb6b8JCLOLTxf3TbJYLAYzL/eP0z7/ME8YzNb+45bBAyIiIvL9QBUAIiIi34fMtCQfIphpYG5mjfxmU4o/Tc+72Oaftmwj4DC4aY2AnV6/mScNEsmEWaZgMccgIiIi31d/P4iIiMj3/xH8cUf0rX38zHcD2HSxaSDvppeZVQHMev7T9LLzBX+z8L2SACIiIkoAiIiIyPeYPc5R/VhBeTrGedLmPwS6VX87vdp43JvdGAeo+F9EROT7jVoAREREvt8YMLntQvC0EMFP43aXdd0AaRbHW9vV/BvTDftzBcQcTAEuxyRIRCxp2gYwvZgB58Cn6VVbRzSOqOV/ERGR79c/IUREROT7+kieLNY5TJYTmmaaCTBA6Nr26TL+eQbJgwcCxbTLv9s+0BI2dQiUJUzqjZV+YwtSNAuZhkB3TSIiIqIEgIiIiHxPOKACMgOTZPA4AjmzbfxsvySOhkBLRkOfNN/gL5texwho2Qjwk9kI69O0uACArCArKnydwEdIBpfnhHZNCQARERElAEREROR7KQN604O4BzwWky3TYok+AJE8d7h2jZxID+gDF23j629708WXv/6Nb+ITn/86n/78127Z8xgv9oDrwaEx1Abyfk7TBDAZhGkmIHb7AzhrCaEhETjRrAARERFRAkBERES+SwmAvoUGGMfZ6n3Xve+IlEAJnFWw+40vW3n07a+/nJc991x6Zsx47SitdQxbwzfvvI8//tytfO0uzKEE6wbGADYDm4Ox0NaY5OkZcKmrEqjp/hURERElAEREROR7ePAuFr63QJVB8JADZ+Rw3i7SW193MW+68kWcvZThxgep0oReFslMwOUZtYeaPmO3zP2HPV/61h7+/Ot3ctue2hxqu+RCopsd6AyEuDEBoFUCQERERAkAERER+V4fvbNukr9NmDCmCLAM7AR+6ErS33jrlVywa8CugaG0Hj8ZQQqUZU5KiclkQgxh+odAtxuAtX3amLNaOw6PDZ/+0je4ec/DfP0ezP4IQ6C2EKzZGBiQ1AIgIiKiBICIiMj/4w+gdv79xoZ48bgH2bT1xHT8A3E6zgHbTv9NQDDTYYAJnrubf/U33/y8X/uxq17EecuRcPghdlaJOFmFFLBlCUDbeoKxFEWF9xGTwASP8RFH1u0fGDLa1jK2PY6GitsfXuPTN32bz9xy4Nf2HOHfjIGUQ2zZ9Ki7+2y33OvF58NueTxx4bHa4zzH8fHPiznBkyQiIiJKAIiIiHy3g/8cB1gCcRoApy7gNXG+9d5iwB7pFs43gt1IZhzEWfhssViS6a4vpIjNHBZD8H4+xd8B2+lmALzqOaQfePPzufwFz2bX9owirOP8iDw02BTJksFEQ0qBZA3GGXzy+JhwtiKlBKnFhJbCGnC2uz9NwKeCkPdpswGjWPHoKHDrvfv47A23cMMt7NwXONzStQl4IK8q2mQJzTQz4GzXk2AiBkeybmG7gYCjnQ4xtN2cAdxCpB8xJFz3W6BrNwjzv1ymjQhKAoiIiCgBICIi8r0+eFosYOdr1Gn63eKq9eK69tZVcucMIYSunz8vCG1LIhGnwW1VVjT1BAcs5WA9mAQ7C7jiOb307ne8gvN2wK6dyxRFINRDCBMsicIafNtSuKxrF4iRFD2JSEoBHwNl3ifFSAqemBpMCCQCzjmMc6RoCSajjY5kCiiWCOQcXh3y4JHIH914H5/6yoM/89Aav2MsrMeNuQA2z2nb6YQAYyClLshPZvqXR8KkLrjvzjVLbcwmDETcdJcBs5AA6CoAsnmSQLsQiIiIKAEgIiLyvTVbsDbTyDRClmZr2LYr0ccuDMnrAlW3ENCW/YrheLJxJDaAtVhXECcNGZHtBWRNFx4/e4U/fccPX/DDb3zNCzhnpccg1VRETEw0TUPwLZZE7hLOJiwtoR3j6wmkRJlVkJUQEqkZYWyEUHcPxuVgcogJH6AhkfWWCMYSQsT7iDOWft7DWUcTMx4aO2K1k1vv2ssffepzfO1WzCowsbAWIViILidESwwB5wz5tMKg9i1poxACh8XNKwASkUgiEsyWv1SS7foPgC7doASAiIiIEgAiIiLf6wRAtiUBEBcTAJYwXcPeSAAEHBHHRjVAmPUIZHZ6QrefX89AFWEAvOg80o9ffRmvf+VzOHNHIvrDJD/G1FDYnMwUONMF0NYkoq8JfkRKNUVhsVlGCom2scSYY02PjECcHCbLE1gLPhIxWJeTnAPrGNc1Li8wxhB9wKRAlgzE1AX15Xa861EHaEyPfYeG/PFnbuCPP3f0rAOR/et0WwXOwvTZQ3XTp8y7jacmS5aM2fp/nO8ykCwbZRQJiJZNmQMlAERERJQAEBER+Z4fPWcR7UYPACbN4tXFknaIeKDtZgCYjatY3pazNo4kn6bBracP7DRwzVVnpjdd/mxe/cJzWS5rJpNDYFrIDDF2Q/tyMmyyOO+xs4n8fgyhhcKSQmQSDK3rQ75Ck5Y4OkwMjx7hmdtylkpDsp7JeBVMYFBaXPQ066tUWdE9INw0cs8gyyHLgBxMj6ZuKRxgDN6Dz5e48+FV/vymu/jtTz58xaMtN63SVe0nDK1PZNMEwMRmYBzEgEmRfNr8kKZfLWw8XwvPs1no+9cIABERESUAREREnoYDqJ32pMfNR9Ro57/fGALou1X/2Yp2ApvAxo1ugoHtruoVF9r0d955NS+9YJkd2ZC+HWL8UWJqwNmuLD9aMldgsZgQsN6TE8BNo2VjSD7hXUUsdtBWKxyuK27d8wifu+FWbr55H5dekPOKF1/Ky154MdsHwOQwRVhnm/M46m6AX2ggdgMKcRnYnGQcwRhisORZhnF0gwPbSMorGtvnaOxxwA/4xBdu5g8/c/vn7jrAGzzdsEA7De6HZF3bAR5SwEwTAGzKqUxP2TJYcXYeJQBERESUABAREfmeckA+DUYbLJ4cyKbRqQcCJN8FrAmiWdjCztiu7z1FKroy/7MM+Vsu3978xA++mkuffQaxPsj2ZUPdrOLbCZlLFNZiY8J6jzGO6BzWdXP0CU13m8ZAtPhYkC0/k9Wm5O79Y2684yFuuO0+brv30EcfPsJ7hi3YHM4YcPGlz6zueM0l5/O6y87lkrMHDNJR4vAxelXoKg6Mmc4IyCBl00qFBMZDb0CoG1pyquWd1E3LeDRh244Vmjriqm3sHwa+ePNd/OFnvsEX78Cs0e0cEIB2nkSx0+fGbJQAJDAE7MLcBOaJASUARERElAAQERF5mhIA5fQg6oGGnEQxbQuYdrAbPw9kXdpcul4AO4AKePsrz04/9fbX8txdjiWzTpk3xHoVbwLGWZKzEA02BrLINPieBsouEfAkEzEuI9mSSSpZ9z2+c/8a3967xldve4Cb7z70aw+t8m/GBkIBwWYEYwh1yyDA2SX5s7fTvPBZlqtechGXX3YeO3oJE0eYVGNT6roAksWYbNrd0HatBuUy0eYMJwGb5fTyDD8Zk1uLsY5gK8ZuG0fYzrf3rfL7f/FVPvX5+81q3VUCtHSzAgI52NkkACB2aYLZ3AQWgn4F/yIiIkoAiIiIPG0HTwdkputT93EalBrAuS5ItwZSmA8ILIHeNOhfAv7GlWemt131Up5/8bmYcATrj1DmDSZMIDRkriA2LdYW3XW206F3lm4LPJuDtbTG0OYlI1PxyKrn5nse4/b7DvPlb9zP/lXecmCV68cJcBnBQDKRlBLG5KQUMIQung+wlMF5O/n0s3dy9Rsvfx4Xn3MGz33mDlb6DhtGmNSAabEmkGWG2NZELFlRdPMBvCf4iDGuq1KwDp8yWjJS1idlPUYe1hvLx/7wU/z5DY99bs8h3jAGajKG5ECOKXOSXwdTd4UNdBF/npXEWOCjn6YOvN6MIiIiSgCIiIh8b5VlTlO3AOQ5GGOo225d2uQWjCO1Ldtyw4AEdVfu/5YX7Ug//fareN6ZhjO2BVKc0DarZM5jrYfgcVkOrenq5G3epRvCdJsBZ6l9wJXbaEzGwXHk3v1HuGXPfm6+51Fuf3D86L5DnD0MMPQOHxzYHOcMJkUwHpMiNoFPkegMxkEbAjHAwMHOEqoWLtpNuuJ5u7n8svO47Nln8YydfZyrSc0ahWkxoYYUSLG73wbI8hzyanp/i252wHTLhEAi+ESdLPTO4tv3HuDTX7qVT37hoY/uWeM9EyBmFau+IZm4eeuAxkIq6QYQWkjDaRJARERElAAQERH5npmN7gPMdB/AbtofFigsELpV/z6wE/jBK5fS3/qR1/O8c7fRrj7M8lLCpgn4msyE7urqtlv1L3oQsq7v3pXEmBi3LSbPyIqcYcy556Dn7oeO8K07H+K2ew5wz8NcsX/ETUOmJfXGgXGYzJFbh4mJ5AMugrGBZFp86mJpmxWkVNB4TwwBSBRlJI+RJQtnL/Hei8/mQ1dc8kxe+YKLuez8XZTpIGWqsSbgTMQYuqmGbQ1tM31uTFe9YCwkRzQWmxVQ9EkhZzQx1PTYd7DmU1+6nY9//t7P3XmUNwyBUMIw0E1OtNP5A346RdEAaYQqAERERJQAEBER+Z4nAKwrcHlOTIHQjDCpW+eerlHTA553Bt+++soLLvnB176Ii86uMPVjmHCUpR5M6qNkOZhkITpyXBfwG9ut+odEnLRMkiNmFaEcsN4m7n7wEb517yPceNcB7nkkHb5/HzvHsxYEl+NNgbeGZBLJdh3zJqWuTyGAJcO6RGRCnDbT27zE2BKfctqUut0EbMSahjwOyRooPZxVsfuyZ5tHn3/Bbt766kt4xkrBzuUeWRhiJkcpUk1eGMhs9xV81xdhp8kS74kYrMkYrTf0t50JWcl45KntgCOx5BNfvJnf/MM73rdnlQ8PgXo2ODF1lQyWSAy+S7rM9wsQERERJQBERES+R9xCMiAzDpsCOZEV4LztXPuev3X5NS+4YIlnn5ljw2FSPaRXZbisoPUjysoTvCeEHok+JvWwyZKiJzYTityQDDSu5NFR4PaHhtxy32G+dsfDfOveeNHDI/aMpwF8kVuc7eHbaX+/g0QNJpEShATGWIwtMBSYFMnsBKKnjRBtTmumtfbJgrXQ1hgiZW6oMgu+pm273MBSARefQ7r4nB289LnP4IUX7OR5Z/Y4o5/AD4njo9jegJQCyTpsXnYXjB7qESEkXLEN6qZ7IovudsfJcaTpsb+p+M9/8Dm+fOvR67/zKG/Bgassq8M4K7SgRYMARURElAAQERF5Gg6epZuW+vsuEi2Bl51fpJ/84Vfxttc/n3TkbrYXIyo3hDCCkEhYPBnee3pFYjKZkOXbyXo78I2lbhLJGGzmCClycG3C/QdWuenOfXz25iPcvhdzqIEREEtLazNs6nYJSE3XimANVEVG8JNuswDTrZNbm2NsRogW7xtyl3AYgoGIwcdIottdwCbo93o0k5rga6DbytA4cEVGmSXcONCLsJKz+6IzefQVF/d49Ysu5AUXncNZZ/TxzZhES/SemBoym8gdXctEiKRgCCGQ2Qg2kbwnuZyYLzNhidqtsO9I4lNfvpVrP377B/ce5X9u6GYNDluY0I1IEBERESUAREREvqcHz5yNUv8XX0C65i0v4K2vuozdvZrJwb2s9C2xHUGMkCw+WkI0GJdRZCWZLWEy7lbGHbRtjc8qQrHEauxx+wNHuOGW+/jCLXu5ex/mcDcQH+MMTTK0xhGtASLOGKwFay0hBLyP5LbC2m5LvZg84LEOYvS0AZLNumn904DfmtR9JUjR0/pEkVuyvCQaaGOgDYmYIvjQPfbCUJoELVQWnnUmD1z5wnPOe9nzzubyi5/BWcuOHZWHZp3QDLE2Ypwj4vEkYow4l5ObvBsaaIEQacZj8qpHKrYRqp08cLDlTz5/G//tz+656e7HuGJElwTRBAARERElAERE5HQ6gqXZj9P947GkWX/44lFuy/mSOUb/eLILP8TH3dTstzndcL8XnU96+xtfzNWvfC7P3gll/RhZewSXG2gmEB0pZYTU9fcbclJKpJCwqcBEg80T3kQaa6mzijsePMJnb76HL33rAHc9wiUPrXJnayHZnGQshTVEwAeDzQwxedq2wVjIc4vBEoIheINzGSRLiA0GT5YnXJaICXwqCdGCD5gUya2hsIZEIPnQrfhbi0+R1gPWkBUFxjhCCOTW4b0npYTLDDZ5ChNZKWF3xW+/+rJtP/PKS8/lFc8/l7O3Z5Q0OBsgtfhQY11L27Y4V+BsTmwjNgZcTjdM0NfgHD5mNHYHoXc2ew9E/uTTN/J7f3b/L+9Z599O2JgEEJhVBNhjvFXiptPTpvM9fpbA1j+O1GogIiJKAIiIiPxVHr2y6fe+G6Tnut3sAUvAkwhdIGk24jyTwJGRgGADuLQR+8XpoLlZsO8gxXY+2X92c7mFc5e58ld/8tIbXvv8Z3D+7hUYHyFrV8nxOBrIMkgG78G4brCfbwImQWEdCUtLRkNGa3JWvePe/at87Tt7+fIte/n2vm6if22hNYZATpw+Dpe6gNXEbvXemFlmo+v/T9MzGuOw1pKSIcZuaJ513WD+lCAmhzUZxhhS9IQQIE6DeWu760qJmBIpmWnSpNvu0JgupE7Gksw0cWIiJnnyFCgjLBl4xjL/60uem/1PV13+PC6/5Fk8Y0dJTkMW17HNAcp+0W0VGCMpGXyKJBPJ84wYY/fYoiEEwOQYCnwLh9sev/vZO/j4Fx7g9r2YGmgMjBIkMnDTigIihoQl0sv7NG1DIJHnPSbtrIGgmaYO4uMSPfNUkNmSBEgWDSAUERElAERERJ6uo9csVg8bgT2YLrgngfGbI7lpAiAnJ5Lw+C6qn8ZxruwRmggxYouCWI+xJjLIwLbdqv9KCW9768XpZ3/k1Twrf4Qdbo3Y1CTvKfMMUugG3ZUFofG0IU6D7G7Sf2ZzDJZJC3VvG/vXPfc8eIC/vON+vnrbY3znQZYONgybvAtLG5uRyIgG7CzwJ2ABkwwpGmKM04DfzEv+U0rzIL4LpA15ntPr9a7M8/wagMOHj/5j7z0xRqy1ZFmXDPDe470nz/NjP/XGTJ/OMA2MMxK2yywAJiYcDWUMWA9LwAW7+exLnlNc9dJLzuclF1/Ac5+5jR3ZOsQxbT0iJk85KKDI8PWIpmlIKZG7jDzLulc1TZM5MYDtc9SdxX2HAn/x5du59hP3X3/3Y7ylNmB6BUdHvttRISWss8QQuoGGLoeU8DHhZ28OE1hsJpjlU45dCzKN//UJFBERJQBERESePo5uFTYuBmRm4chmFn6Rui+DxU4vZ4gUhSMkR91OkwWZo1tujmQmo4cn9zAA3v5y0k+97RU8//zdVGGdkhGOSMBi8gJb5NRNTV2PyFzCpBZSojA5pIK2dRg7IISCgxPLF+58mG/ueYRv3vYw9z+CWU9dEcLEwDgayHokup0ATEo4PAaPnYajDYaYTDf1fxr8G2M2Bf3QzQXI85zBYPDPlpaWPpjnXRvC+vropvF4/J7hcHhT0zQYY3DOza8jpfS4oH+WXDBEihSnwbEjmIxoHHEaNlsiWQyU1lMSSG2Xazmj4uKXXNa/4yXPfQZvetmzOXdXyVIfkl/HhFUcY5wLuMJCE7upgziiSTQxdc92kZOVBclljBoHbhcPHzL80adv5Xf/9N53PbDKfxoDYwBnoSihrSFFMmdITfe45qv6act7ZqFipFvpLzE4LAFDO08WBCUCRERECQAREZGn4+BlyafBZujWomfV/5sCftLGii4s9n5HiulpXe+4nQZ/3fXYBFWAHQZe/0LST//Qy3nDi8+j3zwGo8dwvRzqAOUSuJymDQRjcXmGsR5Si8HTjCfEkOGybQSzzKF1y6137OOrtz/IZ28/eMfDQ644MmLYMF1Az0sCBR7bVbDT9a9bIi612OS7pIOBcYTk7DxoB4gxEmOcJwWKoqCqqot7vd5Her3eVWVZdo85BIzpevjH4/Ge9fX1K0aj0WHvPdZ21xlCeFzwP0sAuNQlAGyaplJMRjAZwXTtDWBxBkgtmfEUJpBFT5p2XfQtvOZSm177sot45eXP4byz+2zL1rH+MDRHcSZ2gXtIYCw4SzSRMYGUQZ4bfD2iypewdhu1H1Czk32HE3/45zfzsT++46pHJnz+sJ/G8LPAftru3+vBZLTwnjDH+KsoAbEb89gljloMNRY/nzmgBICIiCgBICIi8jQcvGYJgJbY9aHPAr1p4O/iRpdAZLpua+lOTOB8921W5LQJ2rZbZa8MlAle+VzST7/t2fzQKy9mh62xo/VuBTg2XZl/1geTQ7RMvCcBRZljTKJuxuTOEm1Jayr2r8Kt9x7lL+94lBu/9TDfeAAzBIIz2KwCkzNpAm2MGHJmq/SGLtg2eFwK83+TgREJsmxe6h9CmJf+O+fI85x+v//P+v3+B4uimFcIxBjnCYBZ8sB7z3A4vGl9ff2K8Xg8Hc7nNj/n095/gIyE822XADCQplUAAde1BBhLSJBCC0ScTZSF66oX2hYTPD3got189vkXLV31oovP5OWXnslzzhmwo2jIXIDxsHuerYEqgwK8bWlSQ0iRXraNDAchEtppyX+5wsGh5TsP13z0v36RP78Rs24gVDAcda+/61WE4WSjrn9r8D9PHlm6xg9L9/by0wqAjcSREgAiIqIEgIiIyNNw8HLYab//LPiP8wDOxFnotpEAaGZzA6YJAOstA+sY+xYL7NpmGa9Gzt/BL/2Dd73i1990+dmcWY2p/GHS8CguAtZ2E/Sw+GjwAcqihyl70AZCiBiXk8hocOxfa7n7kaPccPtePveXh7ljL2Ytdf39lBWTNpEi2Dwny8v5qnz0AWstlohNcVp+3n1v6Ableee6Rerpqn+MiSxz9Ho9yrL86V6v95GyLJdmvfyzFf0Z5/L5/IBZcqCua4bD4XWj0eidk8lk4bo3zmetxZpEFvz81YhYgulmASQc0VhijGR5TuYcbVsTmqZLBmQZgyrDNOvkMZF52FGxcsl5HHr5pQNe8+Jn86LnncNK3wAjCCN8GhFtQ8oD2EQMQOqR24rMBUI9IvqWvL8ExRLDsWWdHXz9jv38xn/7Sz77dUyTd++BxgNFH+qmmytg48abaiH4NyfYJQAF/yIiogSAiIjI030EW6z77yI4kyL5tBt9NqvdA94Ame0SABFMKsjbCT3bVQv0gHf/5Pb07p/6AZbiGtl4hK1H5NSYQQk2MFlbpwkZ27Zvh9gS6gZnMkg5TCKJiugGHG0LvvPQET53y9185psPccdDmAMt+AxMVeAxGL95cF+M4L2fBuduUw8+dG0J3cPsglFn2FTun+c5VVVd2ev1PpLn+YuKopiv8IcQ5nMBZreX5+V84J8xZj4EMMaI956jR49+2Ht/fV3X19d1vanCwBjTBeLzVfPFkXnd993ttt38gmlFgrWWpmlomwaXdzsqZAFooQBWHLz0Ypte/sJzeMvrL+HsnZ4zlgM2rmLCCGdT19dPBjgmTSR3Ba4sIXjwE2Zr8z6Cz7ZRnXkxX7n5Yf7lR67nc3+JWQdaetNRihGo58+pSWCnwyS7EN93FQ6LswGSnX4dOzEgIiKiBICIiMh3le16w2f96bNpbgkcEbewpdusSiAYuhV820XbWYA+XeD/g6+q0i/97Ju4+Jk5/ugeViqH8RFsQWo9k6bGlRlZXlG3hrZtKbOI8ZHMluBzYhzQpGW+fd9BPveNPdxw5z7ufCS96oERX2lyCEWJt5aYgLbB2kQK00SFNfPhe6QuSI8xTsvru1RGNLA4m75IiRS64L0sS5aWln6j1+u9a3F6/6xkf3FQYJdsiITQBeaLOwcsns9aO6sIuGk4HL5lMpkcniUosAZvN8/JN9OhgF2lAt312+6xdde9cX+CsRibEXz34vSKgsJEwnhIz8IzV/hnr3rp9g++8oXncOVLzuMZO6FijcLUECYQGuj1iE1LMjmYnBQimZv2fvgRVCU0ibotCMW5DDmHP/nzO/j3//kLv37PQX5lRFeJYVlMJM22kvRE2se3lgDEaYIgBSUARERECQAREZHvvQxMuRGImRaSx7ouXgsBjJ0GzjHinCOzBt82GGA5B9fCm19B+um3v5orLj6LFTMmb1axcYixDTGriQai7dG0jlTn9LKS3BpSaKiDx2UVzi2xNim5e+86X/7GfXz2Gw9w2wPRHEwwcn1qlxNsF1RiZoP8NjrI7SyHkTb/6xzEBCEZgjXdvIFkujPEBCHQL3L6/f4P9Xq9jxRFcd7WgH4xCfC4PwCMe1yiYFFKiSzL5gMBR6MRq6ur71lfX//ouGkhz7s7mSL4FlLAmEhmDSZ1yRhjuq+Upl9xli4oSCwTycCOMabG2AZHwiYoIuzIYGfJLz3/wv6vX/2qi3nNS87mmWcGSneIjLUu+E4JjCNaR8CBNdhoccbQjibk1TKYkmaYSMUyWW+Fb96+h9/7s6/xG58MZjwN4QOWSJ9ARqDFukBMk+nOEN1L1/VbQFn2qSeTeeJDRERECQAREZHvdQKAqgugnccaT4i+C55nRzZXTgO3iCFQElkyUKXuLP/LP3xBetmlu7noGQPM5CBueIR+L4PMQL0OReToaESyA7Yt7cbGPn7kSZMRTUwU23fz2HrLPQ8c4mu37uWGbzzGtx7AHIlQZwUjejQ2n1YqREgtjhaXGgyRSOp2oLPdNn9bD8rTUQMwHagXkyFhwHal+jt6vcuLzP1QWZbvzfN8aXELv8Wg/skmAIqimLcYzCoCvPeMRiPGk+aWhx478GKCh5QwucOZ6dC/FOd1CnZriGxcd7umIPqSiCXZmuRqsC2QsMngIqQ6slI4qhQYWAZXvID1d7ztJbz65c9i11JNffBeBks5uIx6UhONpewNIEZG62OW+kvgPeA2JvaVJSTD/lW47bGcf/HvP8M3b8MEoCZnQkFLItm2yxDNtiOM0B+sMF5dBxKly6lDTVICQERElAAQERH5XrNU+RJ1O8ZOJ7NHM21FzyxkAxibboU6NJRxyDKwBLzpRaRfftebOH93oucmZBYII2JcJbctNk9ADnUGpgIKoo9M6oDLe1jbZ7UpuePhCV+78yG+dNNdfPt+XnRgwrfGBiYmp0kOm+V0m+QlXNwojTfJkoyhxRAsXem8STgTMNMhf5DmgXeXDEiElLAmoyxLiqK6enl58Gnn3DHL+IH5aY8P/M1CeH78BIBzbp4AyLKM2UyBWfvAkcOrHD58+Ir19fWbDJGUAiEEMgt5VdLUHrDTRIeF5EjWYXAYG7CpwaRIMnY6d88xq7m3RMo8px4dwSWoHGQRztjOla991e4bfvD1F/PGlw4o4n6y5MgshNbj2wlFaSmWesR2yHi8TpZlXWLAJ6hTlxBwy+wfGZr8bP7oT7/Jf/ite654aMRNI2CCharq2gwMkBXQemgTDkuBJZFoabrtJ0VERJQAEBER+d4evBybp/wn120b350hB9eH0FKEEQPgBbv59t/9iedd8rbXXsyyPUzJEUKzRrIVWb8HmaeZrEI7obAFsAytheDwMSPmA2rb5669h7nxtof5ky/u5cGjvOuRo/ynYQJfZFAMiMYQUsC0NQ6PSxEXDSQ3LX3PiTi8hTgdO2+mowotCWu6if/GGGzaCDCttZRlmQ8GyzeUZXk5zmKmA/lmK/+Lq//HCuo3n3biBID3fp5cmF3/bJhfkeUMqgFHDh/m4MGDrK+vv2oyGX2lbpvumrOiC/5TIqZuD4OExRhLSgZDS27WcSRSMl0rgClIZPPbz3Jo2iHORqrSYqKnnUCvgrO286G3XGHf++ZXPpuXv/AylgowzREGZQQzZjw+SG97RfD1NIlhMMGRpQzTdi0irreNw+NEb8dz+MvvHOF/+/U/48u3YnwBax6K7cs0a8OulSHLSXUgw1DSI9DS0hLw+jCKiIgSACIiIk9HAsABWQZthHa6hZs13QqySVACOzN4x9Vnpb/3ztdx4a5AfehOthU1NtZQZmArmsYQyMnzkixGYj3E+km3atxbgWwXdz2W+PzND/IXX7+bm+4KFz00ZE8LpMwRXUUTI8QANlBkCRcjLk2n9ye6rfLo4ekRsRjbNZWnFEl0A+XsdPW/W1FPOAO5MxRFQa+sPlSW5XuLoiDLMuroYSHQX1z53xrQH7sN4MQJgFnAb63tKhCm2wjmeU7uMpaqHg6D957V4Tpra0OGo9GHV4fr7xuOR+RFRSCRogVrMHQVACklbGzJzQhHhGlrQ0puvndDAtrgybJu+GGMfl6FEL2nHo85o4JnrvAbr3hh+a4ffN3zefmlZ3JGf0yeDpPZMU27TtGrwOQ0bYSUkWcVFgchQjOBvGB1HAi9s1hPZ/A7f3wj/9fv3H/eo6s82ADVUsm4bWiaRJE5bHDE2A1ZbKlJSgCIiIgSACIiIt/7g1eRdUPlQtx8eka3pVwPuOplNv3kj76GV77gHAYcJPOHWcoboCYM17uSdpPRREdKPTJXkmdl15hPSxssB4eWm+7Yzye/uIcv3urfuW+N69aB/srSYDjxw7oOYBx5WXQD7/yI4D1l1t0fm6YVCskSqYiURCA3kGjnK/fJpGkgHudb9+WFo1dWFw761W/3er1XOecw0RCjB9cFysda/V8s/z/eDICTJQDyPO92IojTbQenMwZijKQQKbKM5cESZVnS+JZxXdP4ltX1NVZXV993dG3twyEEQugmABprsbZb4Tcx4EzYVOEQSNPgv0sCZHnJZDIBZ6mqirquiW0LRLatbN89Hq7tz6KnDHD2dq5+7Qv59NvfeCGveNHZnLXdEv0RMhvxwRNJFHmfEBN1m8hSpHAQx2vY5WXq1nBg7Ohtfw7f+PZR/vePXM9Xb8W0dDsFtMBs5n8ixxpLTC0aAigiIkoAiIiIPB0s3WC3lJPZChsbMmq2AWcv89O/+Lef+7HXv/xczj/T0QwfITeJ3DnauhuAVxYZoR2TxQB5Nl0VDkxCTshXWGMHf3nXAa7/+j184RuPfu6ufbyhNeAqqAP46RD62eZxpNlQ+hyXZzQxkUw3m6Dr/Z+ub6eITbErdp+eJ5DAWKIzWJMRp6v+WV7+dFVVH6qK8jzn3CxSJhFwZnPgvrX8//jD/2YVA+aECYDFGQCzpMI8AZASzuXkRUFeOJgOCbSZwYeGpmk4cOAx6sno1yfD0a/Uk3G3M8P0+UoRMAWQkYwHIpGwsdVhshiTk3yXbLDW0C8NLgPfThjWUAy204RAEWvy1JI1cN4OfvpH37TjY++4+iVc8qw+g2Id6kM07RpFWYLLaCJkrsA2NZQ5qR7hUySvljg6iqyPK4ql5/C7f3AjH/v9Pb++5wi/EoC6zBi2nnmXglf8LyIiSgCIiMhpFYEvemLR0OwAlI57wglux9CF3SmRYSgIZMBOCz/6pl3pJ9/2Ul50UY8yPorzh7pBgbbEx4I2FGBzUjuhKjNsCPhJjbMWU62w2pY8tJbzyRvu4fqv38tX72jNagBXdIPquqqDMN8Bz0W6/e4T+GhIZATrCMYRjZ3e14hNAZd89y8JG6YP13TPnHF0E/6dA2PYeebuZJ3Dua7kfD6Qz+Y4ZwhtjeXxwf4sWJ8lBJ5sAiCEQJ7nONeV7bdtOx8ImGUZbfCE6c+9Xo+yV2CtJSZPSpHMGdbX1zly8ACrRw9fMRmPbordJgHECImKhCOZAMYTCBuvd7LEYMhdhsUQQwuxwdnuuW4jNGa5G/zgIDMe065TRXjWGfz8RWfzm+9484W84oVn85xzlsjMKtZOwLS0ocHaDEfOZDymLA0mM8S6xroeuO2M1gu8O5tv3nGY3/6jL/HxG0ZmHRg6iDmzvQMhZtP3a5y+fTc+A+l4f2Ul+6Q+L0/18yYiIqIEgIiIPIXg304PI2khMD9JUDINfgyR2SZ0YRoEb900LnMWHyLYLmDHe0iRosxo6jGGjBxPSbch4AufSfrFn30hb7/qBfi1Bxm4CcQJxOkm7q4iuYI6GHw7Ycl1S7gp9WjMEq3bwcFJjxtv28eff+1uPvXFR8wQGEZoMYCZjuzrtoWbldmbtCVAS5ZkINH1r8+340sB4nQz+RRwmC64tl25f0qJvCzYvm3lD5aXl388pHjM4N0YhzFpel3HD/BPXgGQTpgAONkcAWMMsxyCtXbeo1+WJVlmCSF0FQMhMB6POHLkCEcPH3nX2traf2oaT170aNtACG3XXuBmuxhMkxrTBE93Wwk7faJj9KToSGapexeZlkQDZkJmoEiQJ9jd54UvfwG3/NDrn8+rX/xMzt7pycMBbDqCtdDEJbK8JKYxTT2CaKmyZWxYItYWWw5og+NwE/nvX76Z//N3HvnNex7j74wdTBJgcky5jVTX3bBJErOyAGOnGw6Yha/pLAhi9vgA/pQ+N3bhT7fp+0hJABERUQJARESengSAW4xQTp4ASJtXMN00EZCmSYB5oMRCTmEh8HFZRgjtNCiMlHR9/ssG3vhy0i/+D6/lZc/dia3348pAPHwI2+uBLYiTlqYNuKIkz113lW1LWycau8x63M539o34wjf38sWbH+C2e1szTFCT0YRuK7su+A7T+nW61WfscR/urIR+sYx+88T+MD+9KAr6/f5P93q9j2RZtmStna+8z3rwt271N28JOE6Q/t1MABzr94tVBsaY+Q4BeZ537QCzBMm0IsF7z/r6OocOHWJ1dfWStbXhnYvtBd32gmF+XbPHvfjcze9LyuaBdLSegCfZBmOmcyASmBq2ZXDZuaQ3vGIXV7/6Al5w0TLL+SqhWSNzJT5FsB6XWyw50YNrM4iWOBljd+wA37AWKr79cOTf/c6X+NPPY9wAhqbP+npLN7QRHIl+VTKajLr3tNnynp7F/JuC+VNMAqTFhNssURaUABARESUARETk6UoA2C0R+6kmADavZDriRiJgvlqaYbOK1DaUNPNLeKA1BmsTu3K46Bmkn/3xy3j761/MsjnIsh1iy8TaYw+yvOtMJqMJbYCqqsizDMYjGK/ReoNZOp+10OOhAyNuvOVerv/SA9x8FxcdmrBnCJBDS4GfbmFnTcCY2ZZ9EJM5YQJgFtRunc6/MbCvG/aX5zlLS0v/amlp6deKoiDGiPd+HmAf6/IxxsclAE5t8v/mBMDxBwSevJJgcdDgYhJgdj+Xlpbmt+GcwzmH957xeMxkMuHRRx+7aX19/Yr19XVijGRZNn/OYoybrn/2PMwSAc5k06xRJNhufkCw3fNpksVFqJwlTlp6wFk9Ln7pJdzx2pefx5WXX8hlz1omGz6AsTVkOYFEaz2JltIYrLFACTVQLpNay5rZhtn2LP78K3fzz//Nn39sz6P8D2XPcmQcu3V/17U2YG33jdkc16fZe2V+gmVT1cspJQA2PjeqABARESUARETkaU4AzJx6+f/8cmbaRE/otoObhjPzdoDkMCRKPPlC2GMNLPXg7/2tC9Lb3nAZ5+7skU8Os2u7Iw0Psr5+gOWzdtHUddezb3JMTNgm4hqPDS0+LbOv3cXX7nyEL3zlm3z9Fj7xwEHeFgF6MGyhJcOTd1vUTQN/Y8JGKfpJEgAxxk3D8xYD2ZQSRZFRVdWVg8Hg02VZLm1dcffez7/fGoyfSrB/sgTAyX53sssf7z7M/q2qijzP54H94vmstayvjzh48CD79++/aH19fU9KaVPSY+vztmkgIWa6ZWLstgkkEUw33JFUYJMhtIEll9E3Lck3OOCcHfyzV7x4+YNXXLKTd7zqPFaWPBSBpj0KuadYLiF62qND8rxPqsEUfSiWGI8TtR3QsMSBYcXHfu8GfveP7zdHPEyA2kAqph0ns5xYApc2Pi+R2LWQmCeYAHhcEgAlAERERAkAERF5upMAHD94SSdLGrgugLHt5oBp4eDU75eMRjUOGNANYH/pBaRfetdree0rz8b4/dA0ZMlTmECRJcgCZFCP1yl6fZo2MlwLFG6ZQbnC8HDNXQ+P+MOv7+OLNz/CnfdgfATyrsKgSeBTTjAZmGwagIbuzhk/TQSk+XZ1xxNCmK+IL5byz4bo9fvVP6uq6oNVVc0D/tnKd5ZlNE0zv/ysPB661oIsy+YJhqcS5J/o9CcyF+B4QwTLsqTf71MUxbx6Yf72SN3sg9FoxIEDB3jsscfMcDjEGLPp8R0reUIK5NMCiGi6cQjJQDIOYtlF4sFgcZQm4WKDYw0L9EvYVfDzP/PGM3/z9S89i5e8bCf5YJU4PkCKHmf7QE5MEbu0RLO+xmjSsn3bmRgKmrEn6+/ioXXDF7+xl3/7m7ccvmMfO8fAyEDWc7R16AL26KZF+7P5ABshe5pvJ3CcYP6EAwRR8C8iIkoAiIjIX6MjSDpWssA+/jrsNPhJFiK46YDAzEEIUOWQWthp4O//1AvS337Hq+ilhyDuI7Nj8qykyHNiCIRQY63H5UCZMRnWtLGk6p9FYhd79hzhC1+4jS9/62G+cC/FoYbWWHA51DVMPBhTkEwG1nXb0dlZv34k0XYD+JiuNp/o6VkIimfBf57n9Hq9q8uyfG+vV159rCB6MeCdrZyHEOYVAbMEwhMN/J9IYL/1tJMlFI6VCJhtGTibcdDr9SiKYv54wJLn3Q4Hs9kAhw4d+vDa2tr76rrelCx4XBVF9JsSACnNpu4bIhWknF617eJ6Eu6MbYvBk7sGZ1ucbeklOCPAq19E+uG3nseVL3sGZ21LJL+Ow0FRgTUcPnqQwfY+Ra9icmgV5yN5sYSftGRnnsPegy0H1rbx+5/8Jr/zxw+Yx0Zd10DTvdos9usb4sK73xKnaYHNwXx8kp8vERERJQBEROSv4ghy0m38pkGRicxK/bvrC4sN0/ScwfrEAPiBK4r0yz/3Azzn7Aq/up9dywabjkDPQIi0dd0Fk6WB5MFEgo/4VBDcGRydDLjplsN84vpbufHmtXc+NOa6SQm1s6RoaJoAKaM/WAYMa+tDcld2wa3t+q1D6rarg4jlxOX/s6B1sZy9KAqqqnpvVVUf6rbXM/N+91mf/OKMgMWV/8V2gllVwJMJ/p9oYH+i8yzOEDhWEqAsS+q6pm1bjDH0er15EqB7nOZx1zerBjhw4MBFdV3v8d7PEx+zwYLdc+bJ3LSChDQfsI8FkiNSEJsINiPLSowN+DAmhQYc9HJYtlB4uGg36a2veiZvfc0FPPdZA3rZkJBG2KLEJ99tU0hNFhqqzEHogYeJSWTLy6yOEmO/wk3fGvIbv/MlvnJrY4YYJrhuzd/6TW37bvruCfMEwNaV/PgkP2ciIiJKAIiIyF+7BMBCoDMd+Nddn59fZxa7Cf/P3s5Pv+tHL/vYj77hUrbnhyjiUZZ7BSnVGDzNZI1i0IeqIo5HYA22LKmbCNkyFLu456Exn/jMbfzZ5/exZx9mHB1j16PODePQkjmHsxltXRNDIsty8iyjbVusnW13N60CIJCMwZnULT2fwOK0/qqqGAwGn66q6uqN6f5+UzC/qcd9mjxo25a2bW8xxqwURXFeURSbqgKeSgLgqbQCHO9yi9c9a2dY3A3AOUdRFGRZhnP5pvPPnpfRaMT6+jp79+59Z13X100mE0IImxIAIYSFKohI6iYC0l1dN7Qxz3rUviWGrq/EuUS0XSUHqXtX5gEGCc7q8/rnn28+9+qXPJPXvPw8nnfRTsoyEppVsDVVHjGhJvqAC9PAPe/aDnyCmLaTV8/jO/dGPvpfvsC1f3GfGQEjwM9mZc5a/ZOd1wWk430ulAAQERElAERE5K/1ESQd/2yGrq87hND1VpuMzFia2JAM5KWhbRPEbh/3HvD6i0k/9dbn8eaXnM+yXcOGIS5vCLYlGSiyHoSIzc105TdCVhLNgLXQZ7XdwWdv3MOffvZWbr6redHhEd9qTUagwhtHY3w3OC4tpinS/OdZNcL8YZk4H1JoEjhj5ufduqWeMYamaaiqin6/f8101f/CxSDZWjZN+V/8HcDa2tq/ds5dXhTFVV3FwOYKgafa/794u08mUXCqVQiL0/tnQby1ln5/aV7av7UqwRjD0aNHOXr0KI899tg7jxw5cp33fr7zQQiJouzNqwFILZguAWBZqL4w04V3k0h2OmByuhqfWYMfJ3IH/SInjFq2OXj95dvTD1x1EW951TM4c7mhSEOa8RCwmMxB5rEu4OtVynJAfSRQliuQDZiEAY+u5nzyc3fwLz9ym1mNsEbXFmBzSwgR4sYWjyl6DF3ywwfPQhZj03vqiXzeRERElAAQEZG/kgSAcw6TIMTw+ACSDJcZjGvxDfSLLlK6cCf/6O9e87J//dpLV3jmcsMSq9h2jSK3mMwTsoas12d8tKHXX4bC4euGJliodnF4nHPXQy3/9598jbv2eb7zUGsOTyDajGhzIqHbTcBaorHYBBDnD8ekjansiY1dCebD22bbu4WIM3bTkL9Z6b61lrIsyfP8mrIs35vn+eVbJ+FD3BQcG9MNxWvbdm/bttfleX6Nc+68Wc//7PJPNgFwqiv5W8/7RBIAxzr/1gTA7N88L8myjDzPNz22xURBXdccPnyY/fv37zly5MhFTdN11xubUbfTrQJNwsSAs5HMOWLb0PpEni/uKtH9G83Gz4Vx1G3E2AKblYRJxIQRK1nk/F38xt95x7Pf9aoXnsmLLzqTLPOkekwdRrRmTJZ5ejZ07SuTDLIBsW2ok6G3/UweGxbctqfhX/37T/HVOzC2gMNNVw1gbNElApJ/3EfIWQd2YwcIJQBEREQJABER+WueAOiCOWcgToNpa8EmyLJucv6k9aRpsGhTYmcFbgJ/43VZ+oWfeC3P2mZYdh4XxoybIThPUQVCHGF8TVHkmGrAeNziTYEb7GaUtnHXwzWf+cq9fP7GB7htD2bdQ0sFZYErDD6O8TTdanFrNuYPzB9OxC5U989WkMFunIbFJDApYTHzcvfFXv8sy1aWl5fvsdaubB1gtxEgb0y5jzHivV/33l8fQrgJYHl5+YOLwbA53srwKQb5T3RA4BNJJBzrtFliZPE8m78ceZ5TVdWmoYaLsw6cc4QQWFtb4+DBgxw8ePC6I0eOvHM8riGftkOkRGwbrDHkzpJZS/RhU7Kme7YXkjdEbAzEBC0lZDkmz8iMx4UhZZPYXTB43Yuq9bdd9RyufMkzeMaZBt8eIsSaslfAaBVChHwA5QBqz6SeYAqINsdTcWCt5No/vp1f/9ijZgQMgdYUpMyS2gm9vPs8hBAIJOIs99TtNbFwz5UAEBERJQBEROSvXQJgY1W4X5WMJ+MuGeCAsDlmMQ5c6Lb36wMf/PvPT++46hLK8QPY8QGIButyJibRpkBWBMo8kE8D55QVTFLJJN/Ow+uOL37rET79lT3cdFva+ehRDmd5QaBHsg7jIoGaOoxJtrs/ru36sTfSFo+fyZ5mQfdiEmB6mcxaUojzCf+zXv9er/eRoijePZtwv7h93WIAnFKYl/RPJpM/rOv6wwBVVX2o1+tdNQuKj1eKvzW4fiqB/7HOd6qB/vF+t7iqv/VxdN/b+UyAPM/nVQ6zZEeMcb7l4awa4NChQ+zdu/emhx995IpoLBjTJWFiIoaASVC4jLIomFULdHfCToP/bha/JZDbmmigCQVtSGACpjCUWSKPnmzcvTfP28m1V79q6Zqf+OEX88JLd2LDKvXafsp+D3wLRQZtIEawmcW3Y2JqsJkBt8Kh8Qo3fPMw/8u/uOmqvWM+PwEazHR04fS5Ml2SrJkWylRlxbheuP+zeRlKAIiIiBIAIiLyV3YEScefhG9JJBJ2y8HGWShKaMZd4P+CM/jyv/ynV73q8nNLwuEHiO061XKfiMGn6bT06eq6cxBNy6hpyartHGoLbt835s9uvJv//tXJO+87yHXRgc0qTMxIMWJjS6LFG4gWYg5ZZrCThFtYIo4LD2x+8qbHZzetKBM3+venE/4v7/f71xZFceHiDgDHCv4BYvR47/c2TfPRtm2vs9ZeWBTFu3u93o+XZTm/7q3T9mf/zhIPT7YV4GQJhCe6W8DjXv+TzAhwLp+/rnmez1om5pfL83xeWTFLBLRt220XeOQw9z94vxmNRhCgyCusMbS1hxTJXf74O5TcNEFlwTRgxhgLjpKUDG3bEunmQlgHeQ55BGrYaeGtV+5If+MHLuWVLyxZ2RFoVtdwzuLyyKQZ4UwiL8puKqB1UI8ZjicMdp3JatPj9vsT/+YjX+YLN2NGABmMPPMdDJyFGCGwtQLgWE96VAJARESUABARkaeTPc7P08CU2JX8h0hMkDtwGdQ1lMBZDv7mm3enX/mZN1IM72dbOkJlasgzsIYYAhMfyLMeeV7RtIkmJqI1TEzB3iOGz33zXq7/6n6+9QDmsRZiCRTLtE0kNwkbW7LUYqZZiGAyvOkCQeNrXEqQzKaS/9lqsUmPf5xmIejyMcxXsPv9/nt7vd6HZqv+s237tg75mwXeKSW8b26ZTCbva5rmk3meX7m0tHRDr9frrtv7TWXxs8svJgCO1wrwdM0AOFnFwPEqF2Y/Z1mxKcAvioKyLOfDDrMsY/PQRDufk+B9w0OP7OPhhx/+4IEDh/7nFKbXF+iSPhYc3etqid2qf5q+CZIl2kBgTAhQYugVPRyGNjQ0piUVUDdAZijTgLwZs4PAJeeRfvytZ/L2tzyfXUuJwjVEP8Y5T+YM1BOoIzBtLSkco/EqxfKZrNbLHFzfzu9e+01+79MPvureMV8ZA0UBMUAbuiQANqf17TR19vjPFcdIWYmIiCgBICIiT1MC4FhVABFDpNcrqcc1MJsJ0P32wmUu/Dd/98X3vP7SXUQ8ZeXwfh3ShFSvUZhIUVXQtGAKfLAMG/C2YhIsD64V/NZn7uIr3z5w3b2PpndGCynPGMVESJFku+nus6Hv3TJrTgoFPmSEFChz360ET4v/N1b3u4F/dh70d5u2menWcSZNdwJwjqIqV/r9/rVlWV49C9gXt/NbDP5ngwK993u899c3zeRfAzjnLu/1eh/p9XpLs50StiYATjaR/1SC/O/2DIBTaRE41nk3Avpsy89dJcCsHSClNP956/XE6DE2cuDAAfbte4j9jx4w43E7307QmEQMLclEzHQ3gC55YzZe7yzhQ8S0jiw5MgzReIILeAvFUkUznEDIKIqSIowwdeL8XfzSy5/Pr//iz7+Mi85x2LalIlGaAE0NhYUQwBbQGMi3c3h1QtXbQVn1OXRklU/ccDcf/K2HLrnvCHdC1wIQpp+NoqyY1JNpAuDYny0lAERERAkAERF50geAdKxA/phlxgvnMdPvU9zy+3n9PEVmCL4lA8ppz/8LL8rTP/ibr+ftz46U4TEoBqy1vuuldpGMMUVssU2NwYGtaELBmGWOhj5fuWUP133mO9z0IOZACyEajM1oE5jM4Arwsdm467G7izblWNODVJJSADsBs3G+ZKaBf+p6/W3a/DyZFDclAJa2bbum7FUfqqrqwtn+9DHG+QC7rZPcY4y0bbunrusPt217XdNMDi8tLf3S9u3bfz3P824QXOiqCvI8x3t/ymX4343g/6kkAE503uPPMOhW+WfBfghhvnvCrB1gc8uAmydFQmjJM4tzlqNHV9mz5z4e3PewqesWYxIhtFi38c7edJ9SN9uhTQmX5WSpJLURYsC6SMoinkjwCdPrkaKFeoIzidJCFiN9By9/Punnf/I5vOy553NmZajao5jmCHa5gPV1QjC4aoVkBviYEZuaMgfMKutpJ5/4Zs5/+L+/yDfvbEwwMEnT8n/X5Q8gm36KjvX5stMEQJr+G0/8193Ce3nxkiIiogSAiIicJv/zzzfi467PHrvlqDBNAJhpcJEs81p67PRnD7RdaOIMMWSQMroS6ATUOOcpA2wD3nEl6Rfe/jou211QhlXw6yTAZwU+c3gTMClSuESRPL72GNOjyc7g7gOOT33jQf70q/fyzfsb4zPwplsljfPS/Y0t/LaMHJz282ddUgFIBLZuxYc18wA/tH5ejj4Pzo2lqiqqqrpmefu2a09U5r5Yoh9jZDKZXD8cDt8yC/JXVlbS4rT7rS0CJ99mL54w8D7VGQFPtMT/RKX/J6oKWEwGwEZJ/9bZCLPz9vv9TdsEzp7P2aDAlBJZluGcYzgcs2/fPh588MGPHjly5D3dY4/z52HWkjFLNnjvMV29/XwQpJluB5lM7LYM3FThEnFpOkIwRYxJZA4uOIs/+IFXnv3jP/6GS3jZBRU9DkNzdFruYvBY6thVJVR51g0NbCdgl/HtLr6zr+HfXfcZfv9LmHULYwM+djMAspQTiUR8t2uFM2ArYjP7fHWfXGi6f008/l91qXt8buGT2SoJICJyWnJ6CkRETs8EQDb9N82C/9lvzGLUsFgFYKYhQ7f3+qxX35pASmAjOCJlVhCix+DJ8JQJtgM/95Z+evePvYaL+iN67UGoh5DnmNwS2oYYAr3cUVhL29SEYEnFdkZ2B7c+OOaPvnw3f/yl+z5268PhxU1R4o0hmoWBfWZLwD8voV6sSogYE8GEeYC9GHym6WC/FOOmlelZsFn1KvqDwYfKqnq/c663WL6+das+5xwpJdq2ZTwef3g8Hv9cCIGyLK9eXl6+Zxa8LgbCJwrAH396+q4E90/0PN+tBMDjtwU0x7zvx7r+2TaCIUTatmuXWFlZYWVl5XLg/evr6x9omhYwZFlOnhfEmJidVpYVMSQ29niYRsjTnQIMZuHdkxanQEwrRXI8JavD9r8++vD6XY8deOgnytxy1u5dVP0BoR7hgyfvlxS5wTcj8A129nkKNTaMOHP3Mi94wUX0+0fe/+07xx9o22lyLrc00WMzulGapqtiSaH7061XDfC+ZmP1P228/0+y+m8f/ysRETnN/gYUEZHT8H/+XQbYTouIt2yCNw1UDI8fQTYPh6ar7S7LqCyk2s9XGFu6tckCOH/A63/xmks+92OvvJCleIhBHrB+QqhrcAmTVdjckkJLqGusCdhiwJovGea7+Nq9a1z76b/k8zfXZi1AymHYgC02h2an/NjnQeTmHPjiwL7ZCvysnz/LMqqqmvf7z4L7xVXp2Sr+7PTpqv+e0Wj0zrZtbzLGUBTFNYPB4NrZsL9jBc1bhwYePzA/cQXAsYYEPtXhfqf6u9ntnyio35qAOVaFwGwuwKxVYPYcd5fPNj3OsiwxxnDw4EEefvhh7r33XjMajfDez9sJ2rarVimKghDCU/j8REwIXZF+hGUHL72E9MNvPI83v+J8Ljzb4eoDZLHuPgg277YVaFvaVGOLnDZApCIx4Mhoia/dus6/+Hdfvm7PId55FKizadHKND8x6PUZDyfzyo5ZZYJZ+AkWyvu37NJhpjUNs/MHJQBERJQAEBGR0+kAsLEeuCn4n0/x53Fb+KWFc5msm17uUldNULAxdC+nm/R/+cWk//HH38hLnzVgB0eo7ITV4RF6vZzMuY2AzGWQAqH1YHJCvp27DwU+9Y0H+JOvP8odj2JWI7SmSzDkec6kCU8pAZCSOebK+4z3HmvtbIu/a/r9/rWzQHJxyN/s+8X962OMrK+vv28ymXy4bVuKomB5efmefr8/nxcwqzBYDPpPFJg/1QTAqVQYnMqq/5PZMvBYK/xbWwCOdx8XhwPmeb6QBOhmJQA0TTNP1MxaNu6//3727dt33SOPPPLOlNJ8hwHvPd537R1PJQHgQqAqukREPWkxEZ59Dh952+sH737LK87n5c/ZSS8cxTVjsBaqAqKnpsaUOT4zTMaeoikYVM/k8JElvvNQ4P3/9k+48T7Mej5rrpl+8EJ3NYZuu0B4/JyK2VnjvG7BsDgn4FifZRERUQJARET+H+9YE8a7yf1sCfztpnN0At3iYq80xHFitsP6bAO0FQNvfznpl9/5Fi5ctjA6SG4trR+SDwyTdoK1lqosSZOa8XBEvxzA8pk8erjl5vuO8kdfvYsb7w4fvvMw76sd5P0+49YTfUOZZ9Ny6Cdx4DtGAmDrdn2zIL0oCnq93nurqvrQYvC/ODdg9jUd8kdd1x9tmuaj4/H4pmnwujIYDD49GAwun608t227acr/1tXyU9vm79QTAE82aD+V8x3vvMf73fESAFsvO+vzn7VT5Hk+Hw7YJQHcfDV8NkdhVnkxe+yPPvoo999/P/v37zdN08yTB7OZAE8lAVACbRsImSUrHD60uBaetcLVl57Np9/zE8/nVZfuZscZFlYfIjSruEFByC3D2BILyChZituIRyI228GhsWPvpORf/Oaf8vEvY4YWTA4RR2y7N/ygZxiN0nwg5eM/o11zT5ruZgGR1E3aWNgWA20iICKiBICIiJxWCQBjZxvfHzf4P5bZemKy3fZlWdgYKJMBZw0Y/Ohrd63/jz/0Ulb8QXb1cxiPoMihcKytPcryyjLNpCVzBTYmQnIEM+DBI5FP33Q/n/rLR7jhXkyoYOIK1iaehMFWJRCJk5o8c5vb/p9kAmAWgM+Cwllffq/XuzrP82uKonj34mrxrDR9NrV+Fqg2TcNwOHznaDS6rq5r8jxnaWnpmuXl5WsXg/1Z4Hu8FfrvVgLgVJ6DE513cQjhsc5/rFaF78YQwMUEweKWis45iqKgKIppS8BGGX9RFPPXZNa+4ZwjhMDBgwe599572bt3r2maBmMMZVk+tRaA1G0W6VPEG4txGcYkbGgYRFiO8JqLSX/zBy7lB153EctLE2gfI8Q1vEuQGaKJjI6O2FnswhTbaQ8cIj/7XB49VHPEnMG//50b+KPP7DePrHVZNc90dwCzOejf/BmYTfZYrOyJREK3m8BiAiChMgARkdOQhgCKiJyWDJjZwL+N8uBjlfzHhVhh8assHd4nAhkJyEk8bxf/6l1vu/RP3vX2V/KMqsG1I2gb3NIAPx4Rw4Terh0MDx6gV/Ro20QTC46GHjfdP+S/fvEufu/GQ7/+9Yd4pR9UrHqHD4mqLMisoR1PSMlRLW0j+RbzJCKYjSDUPC44zbKMoigoy/LqwWDw6TzPL1+c0D877+LqdNu2jEajjw6Hw7eMx+ObZomBpaWlqweDwZ/0er15MLuYQFgMoE82tO/Y9z894QTA1ts6Ubn+qVQAnKxN4KnMANhaZbFYeQHgXDbfGjDGON92cbZzQNu23fT9btcGnHPv997/HzHGyWIC48lIFppkcFVBXjhCaEmNx8SMKluizItz73+k+cePHjj8/kPrQ2yR01sqsZkBWqosI59E+stnYprAeLhGeeYZjFcP0asgjzWve8WLGLjh+/c9cMStDfmLmCCRk4g4Z4hx62cyI03HFxo2PtddBUCcf+y19CMiogSAiIicrgkAABPmBwSzJfDfqAmYFflv7BYQ/Kz82pCnyGVn8pFfeufrfvln3nAp5do+ijDCELB5TvQRa1PX5z9cp6r6RJ9BucIhP+DL3znI737hDj7xjYnZs8on/dISYxxYhyUQ2habYjfMzRW0dY016SklAGLc3Ls/W2Hu9/sf6fV6/3uWZZum+y+uWM9WmUMIjEaj96ytrX1gOBxOQgiz67h8aWnpi7OV/1l/+qxnfTZf4FjB76kPAXxyCYBTPc+JpvGfSjLgZAmBrd8fLwGwWImwGLRb6+Z9/LPntyzL2fwFyrKkaRoAtm/fzs6dO8my7L2TyeTh0Wh001NpAcBAzBwxtATvybOMMitwKce3lolPq8k4Hj7UfOCOPau/++ihh35527Zlzj5nN72ypB0NyaKD9RGUOXm/Yn19larMyV2kZz1MjvDqK17CGTv7V915275taxM+5YzDYAmpC+s3Pptu/gnukgERQ5h+pfkkAAX/IiKiQ4GIyGn7f/9pYJXiwq4AnW5CuMUWJbGN3fQxgOjBWfAB6xwu1hQJnreTf/bPf+nqD772whXafbdzxraSZBzjlJhgyAtH3yZsO8SMh91U9MG57F0zfPKbe7n2c9/hxr2YumeJ+QA/qcGBSxE726Et2XnfczIQTTxh+L81mNz6O2M2esadc/T7/cunq/4rs77z412vMYb19fXr19bW3jKZTOanO+cYDAbXbNu27drFFe5jBcyLge2JAvLj/y6eUoB/omn8J7p/J0sabE1UnOjxnagC4FSSDse6jTwvKctytro/H744mwcwq8SYnZ7nOSEE9u3bx3333XfTww8/fEWe51hr8d5vaumYzQk4nmAguml6LFiyaHGzt1iypGmSqCwMzo/IPFzxPNLf+1sv4i2vuYCldAizvh96GcTEJEFRDqAN2GbaLtM0xFASly/ihttX+Rf/8TN8+duYGmjJaDBkZY8QIbUt5EX3nmgnZLkltPUxP9Mbn/SABgGIiJx+VAEgInI6ZwHM40v/Z6v/rux1wX9Z0kUZkaJXEuoJGYEsBXrAxTv4X//5r7z5/c8ZrDOoH2HlGTvh8H5MiuRFjssdk3rMpJ5gs5KsGNCYFW7ZO+G6z93BdV/Ye913jvCC9aqkCY7oW2yVY2KNI2LTbL92i0kWlww2JaI9tdX/rVP6gWlvOfNV/6qqLq+q6kNlWT5/ccV/Fjxaa+dD++q6Zjgcfng0Gv3cLHAEZiv/1/T7/XnP/6mWzz+5BMCpb/N3KgH1E00AHG+V/3i/O9ltn0pyYvO/m6sGZsH71td8/gfPdJBgnucMBoNzmqb5kfF4/NHJZDKfCzC77GKLxrGfE7py+2TIUhf8dzM0AsEFokk0BoJ1GFcSUsORw3zgsccefb+1ll27zmTbyjZoJ1DmZHnOpF4ntxGTWzhyCPoVhobR2gHOOmuFl7/8csbrj77/rj3jD0Akywrq1ndvg8x1WwM4ILPEdtJ9vBc+12b+39mcgIiGAIiInJZ//YmIyGl7BEgbpf+zKf7zlUKTQ1VB7bvfpBaSJwP6wA7g/GV++//7T676mWfvaNnuJpTWE4e+G9bnIuHAQ7jlCpZ3cGiYMPkKoS24+d41Pnb97dx0//qP37fGH40Bs9SniRFCjbWQTQN/Nx9CkHXBS3JAIlhPMvGEgf9iILl1mz5juv7wfr//kTzPr8mybGWxpHxxEN+WQX9vGY/H19d1vdCP7lhaWrp6eXn500VRHDN4PFGA/OQSAE+tAuBkJfyLlzve748XqB8vaN86BPBEvz95AqGbzZDn+Wxuw3wngBDCvN1iccDj7DZjjOzfv5/777+fvXv3Gu89s10eZgmdE7cIWEh24Y8oD8aTTJpWp4B1Gb6NFFhKC0w8JXDZBaQ3v/p83vHWCzj3DE/pGjKGFIWHeghNgt4OWPPQG0Co8WTEwTO4+5HIf7726/zWHx82PoPDHjwZWDdt6UlgArbMiOMJJnXbdNp5uJ8RyKf3ue3ut4iIKAEgIiKnewIgg6yA2AV51aCkXjtCAewaQBzCD19q0q/+zA+yu3eUM3oNLk1oRyPychu0bRdghCHkCVyP1Ww3R9IKn//Gg1z76Vv40v2YxmWYzOFNIllDsokYA20bKFwXvLhZnJsskWIewCR74gDmZFP287yk3+9/qNfrvXcWOC5edlbSb4yhaRpGo9H7RqPRh73382TArDKg1+utLC0tfb3X6104CyJPNkX/r1MC4FQn+R/vek+W4DjelP8T/f5EiYR5EA6btggsimJTcmJr4mcW3GdZRkqJQ4cOcd999/Hggw+a0WjEYkvA1haNTfcpWVzYeB9G64k2EM10Yw3AYCAmUgu93NLPMuphN5Ng1xK86sWkd//slVx+yRk0R+9nKV+jyCDVAZNvhybHr4/JljKInkPrDb1dF3DPQ4n/9Htf4bc+MTHeQMhhtYFkLZQVNE33uZgO/d+cALBbEgBqARAROd2oBUBE5LRl53uI2Y18AJtOSd2KYqhHnFFB5sG18MbnkT7w82/gwqWafg6TSY2JiXz7Dpqjh3Fl1u1Z1h9AgMCAo22P3//C7fyHT97z4b98lNeNqx2MoyX4lsJFclpCE4gxkWcFKXW375jOACARDbQ2Jxg7HXAWTxg0L265N+vpngaLea/X/9/Ksnzv4krxLDBdvNxse7+1tbWPTiaT+WryLBAtioJt27Z9sd/vPx943O9PNdB+ulsAnkwbwKlc/4nK9p9IhcCJrnseYh9jeOIsKbO4JWCWZfOZDrMtAgF6vR69Xo8Y4/snk8kHZkMDZwmC4+fOHDYV049RS3CeMNtVE4OJjtREytxhSAQ/XYrPCiYhpw6BPffzgYNHHn7/yhlLPPuCZ5A5Qz2eEFNF9N2QzixzXTlBdPSyAS5FqnLC857zLB55cO/773+ID4QAZQZ1mDbvuLzL4hGn2xVufLa7qRmLn3S1AIiInG4yPQUiIqehecO/nYcFjwulU6DoVTSjNQogD1ACl55N+vs/9QYu2JFg7THob8c3nsHObbSrqxSDqitHLpYZTVpccTaPrMMffO5bfOwvjv7MHWN+Z9xbwubdyiYpEaeVBjGAsRnOFMTUbV8WaDDTREW3whqIJuJSPGH8sjixfzEwLMtyd1mW7y2K8tdmK//HmxMwGo2uW19ff2dd1/NZACklvPc457DWUhTFhVVVXZ5lGW3bzifSzxIBpxLg/5W9DZ7gDIAnknB4qjMAjlW5sPm2zKbXqm3bTYmfxSB+awvA7Hx5nnPmmWfOEgTp/vvvN8Ph8BRerzhtP4kEQxf5pwTGYGKGSRZjgWixNhCBiY8kAjGviFlJimt86ovBrB69Ka2+8/lcdfl59IsS2wypskQzGdJbWoZhpB63lL0lLIZtaY1sueAf/d0fJnOfSn/2VW9GHnoWRj4Alry/RDsaMhv0t6nb33jmNQGK/0VETjuqABAROS1ZMHbaNxyPUQEArizx9ZAM2D2ANIEXn0f6f//Kj3LxWQMmj91Nf9d26iNDBkvbmQzHZLmjbSdkVc563VIXK9xxqM9vfupO/n+fPmgeiXyrOmPnjw3Xj95JPWIpbyjLEp8cdczAFWQmJwYzLU6wRJPjbUYwjmjAmAaLP+mW5rNgfbYKXBQFvV7vyqqqPpTn+TXOZcVisLlYKt62Levr6+8cj8cfGI/HhBDmLQGLwWlZliwtLV1bVdWFs0BzcYX5iQTbT3cFwIl2ITiVFf/vdQXAyYcEmk1D/xbL/lNK83L+zXMfzKbfG2Pm2wdWVUWWZe+PMT7ctu1NJ6oAwCSS9UQX5u9Rk3JMynDJYjAUWYlvI4YClxUEYwimBdPg2xqLocgtjzyaPnDLrY9tW10fveqss89mZVtGbA4zWC4YHjhAbBzVYAXahB9PcMHgQsb2Hbu59AXPJzOH3/+tO9Y+4BMUpaMJhth20/4NZroN4EYCrfvgKPIXEVECQERETiNmGvxvBJMbc8G7KeEpBiyRAZC38Npnk/7Jz7+By565HTN8lDNXKprDBymqPikk8l5FDAHrLONoqd02Hm238R8/fhMf+/x+MypKRq7H2tranduWSkrjiQEmjSfiMC4nJgMJrLFYZgPVLMnYafAfcQt7m58oBTAL/GYr8r1e78per/eRPM+vstYWxmwEj4uBZdM0eyaTyfsOHz78W977x7USzJILAIPB4OqlpaX3Lw6PO17v+BPZbu/pSACceq/9qV33qQTtT+T3W2/78ec9dgJj1u4xa+WYvR6zxMyscmPWEjJ73bZt28bOnTux1v7I+vr67XVd3378z0+cVqJ08wAMdhpsm2m7CpASPgSMyUjG4H2Lybrd+qKH3ELdREy5xOqo+dQ3vrX2gdX1h97/nPOfwZk7lmA8IjeWoloG4whtS+YcuAJ8pPEtKzu2ce6ZO2hHe99/733+A6OQ8MaAzSDNuv67HQpmCb5N2T4RETkd/wIUEZHT8//+FpwDH+iVFeN6BGQYk5MSYCNZrNkFXLGb9P/5hZdx8dklk8mEpX5JCEOcM5g4DXqMJfpApMD3dnLXEcNH/+hLfPwv181hMtYpCG1L4TwuJbBmmnBwgJ2GKgvblqVpZfWm+x0xqQvcuiBvo5NtFtDNAr1Z8G+tpaqqlX6/f21RFFcvBuuLwWBd19ePx+P31HW9Z9Y/vthHPksAzJIAeZ6zffv2Dy0vL7939rvZ0MCuYiCdMIA+WUXAsabsP5HEwYkC/K0B9ckC8KeaGDjW7R5rF4Anmsw40WMvy5Jer0dZlo/bzrGrDtn8es7uT9M0TCYTbrjhho+ura29Zzwez38/qyLoWjw8ydh5pcrJzFoGIGJIZKl7b09SSZ7nZGHIICb+xuuW0j/+uTdz0c4JdvIoppfDZEjbpq60v44Ym5OVAw4/dpjlfInVZpl/+n/+KX98M+aAgeSybgigy7BtQ0bE0Y39ax2QO6iDkgAiIqchq6dAROQ0lhLWwqQeUWWOqiqYxZ3WQI9uu79/8rev5LxBoDQTtmcel2qKqmI8HmNNwBQZoa6x+YDU381dj3o+9omv85Vvr3/wsRpG0RBTwmaWPM8wzhJxJPL5oahbpdwIkmYBk1n8mgdbdlPwvxgQznr0Z2Xeg8Hg6n6/f61z7vLFSfCz4X9t2zIejz86C/699/PzHC8on/WPO+cu3xrYPtmA/QnncE4SAD+RpMCp3NZTOc+TqXp4qrz3NE1D0zSbWjNSSrRtu6liY5bgmbWK9Pt9XvnKV7777LPPTtANBayqCmvtwnvDLlTSx5N+mTStFkgZJk2TXxYg0AZozYA1D1/51vr7/sNvfZZv3rmO6Z9PWA8QDflSn+HqYbxtSS6yfuRRVrYXZGGVYvIY//Tv/SgvOYc0cIDzYD0p1hgipc3m7T0mc9AG/b9PROQ0pRYAEZHTku32Dk+RzEVchB6Jpm0J1kCZ4dox5xj48C++ML3k3IIzty/T1h5XlgQC1hqyaWkxbUtIBbG3i289NOLaz9zCn3zl0FkPDPl4C2R5RootzoC1GY0PGPPUDkFbp79vnQg/XQG+pt/v/5c8z58P9GKMewCccz1jDG3b7hmNRu8cjUb/x2QyOTwb4je7vlmv/9ZA1VrLYDC4pqqq92ZZdswkxOLy6hPpr38qQf7Jzn+sFfhj3acnW+K/9XZOVGlwKjMITvX2j/VYZxUgs9dwthPArLLDGDuvAFl8TmZtAtu3b6eqKmKM719bW/vAZDIhyzKyLKOu62POeXgin7+mjdgsI8WISS1lBsYEjqzzpfv21h+Y1PvfP+j3eObuXdDW2NBSlA5fNxS5o3SGMPFY26fobcP4mje96ZX8+ZdudYfG/EUoLARLnhJZiiRT0GC6pENKWv0XETl9/wIUEZHT0mz7Ow+V6VqGLYCNmMmQ3Q7+8c+/Or35JRdwRtkyHq0y8QHykhAtflJjs5LUeHzIsIMzuG3vEX77v9/IH375kHmkYf8EyKq8C7RSJAZPGzz+uxB8bO3dn/2cZRlFUbC0tPSRqqo+ZK1dmQaCh6fnXwEYDocfHg6HbxkOh9dPJhO895uC0+MNgZuVkVdV9aEsyzYFoYsB58kC2FNNcJwoiD/Z+Z/I7Z5sq8BTHdZ3sts/2X3/blULzCpBZlUATdPMX+PFVX9gniyYtQqklBgOh5xzzjm85CUv4dxzz02zFoDFyz21P79yrKnIrYEQibGGDJoCDgF/+IXa/Mfrvs639qyTsl0kn0PKyVMiNRMILW6pYjgaMx6tsnP3Er36Uf79B376f7pwiddn40hmAwZoAJ9iNzchJMhL/f9PROQ0pRkAIiKn5f/9LZgcTKIKDfn0iOBKGE1gGfjVn3hu+rmrX8TO+hEGWaBt1smXljmyOmLb0jJpdARnDD5lhGIbdx0I/Paf3cgffKUxBxI0RcE4OizgsgS+xqdEshZshnuKSYDF1flZ4D0L/ouiePdgMPjINKDbY4xZmSUCvPfXhxBuWl9ff5/3ft4usHVVemsCYHaeoigoy/LClZWVe2YryMfq108pHDOwfrKJgSca4J8sgXAqgwFPdD9PdeDg1ts+1ven8pw80cqJxdfMOTef9l+WJUVRkNLm987i6x9CmFcDWGs5cuQId955J3fddZcZj8dUVXXcNpFTe/NmYAqsheiH+OAxrjs5WUNlDQwjux289cWkf/izV/OC8yqatfsplhxxfKRrKSiXaYaGotpBWB/ilnexf+T48j2H+dV/fYN5pIZqULE69DgiZVExbJvur784a08QEZHTiSoARERO50NAjMwK2NsEeNgGvPttl6aff+sLKVbvZtBzTFaPkA8qiC3WgEndIDKKZdLgLG57aMx/+tMv88kbm7MOJfC9gjYbEHC0MdFEQ3JFl3iICRufeg/yYtBtrSXPc4qioKqqD1VV9aHZqv9s5X8a2N00mUzet7q6+r6maTZt77e4pdxsoODWoHLaI77S6/U+Mhv4d7xhfScKqJ/oCvJ3oxrgVCb/n2rA/t2qAPhezk1YTA6FEObD/Wav++Jq/+LrO/sqy3JeObBz506e97zncf7556eqqqjr+ikm4CLOWHzd4EPEZkDWDb0kZkxahx0UHArwmW9g/uN1X+Smuw7h+udCqrC2wlhHHA4plnoQa4wN0BxlZ9jPW19wJr/2U89LuyyMhxOsdUDEh2Y6WVPrPyIip6tMT4GIyGkoAVkGradZOBgYD2+5jPQLP3gxu9v9FNtzJkcepdo+IE66AGrbGbsYr65R2B6jNOBb969y7Wdu5eNfj+axBFSOJjiijTiXEYwjpoi3CWMj+BabAhgzn/z/pNIXCyvvzjnKsrywLMv3Zll2tTFmJcY4L/mPMe5pmub6uq4/PJlMDjdNMy/l3jrd/1hB7uLtFEXx7qqqrl683MnKwp9syfh3I1FwvPOc6v19siv0J6t4eKq3/0STRLPhf7PrKIrqcYmfxUqApmnIsgzvPcPhkF6vxyWXXEKWZemee+4xs3aCJ/W6pogJE7q5/A5cRXJp2ptvIASiy/G2Yc3Cf/vyxIzaG9K7f+I1PGenZWVpGVjHmgn4BoIBZ8EPyfqOdOhufv4tL+Whh4+k/+vP95tDviYHfPDTyh80A0BE5DSlCgARkdOVb8BaWrq9yQvggj4/9g/+1lXsTPspmsMwXqXqW9pmSMLQ376T+shh8qJPk+/grsdafu8vvsWf3jgyRxy0ZcaRSQKX0dbdDgHWAN4TgicZR+7A2qe+ArkYuE0TAO8ty/LdzrkLZ8P+rLUr1toLvffXj0aj9w2Hw8NN0zxu9XwW/C0OjDteYOqcu3y2g8Di5RYDzePND3iqMwBOJXh+qp5MD/4T2U3gZOf9bj22xddmtqqfUqJpGkaj0XxLv1klR4xxvjvA7HyzeQ+zYP+MM87g/PPP51nPetZTDp+NbcktFEUJyZHGESYBm8A6x6QJkPdYczlrFv70a8l89Novsu9oybjdTpg46C0zXhtCYbGFhVBDPSQvA8XwIX71Z3+QH3n12WmJjZ7PzBmI2gVAREQJABEROc10MUwyGXXbbff3//rZl/7hswct2/MaSgdNDZklt4m1cUMbDHnRo44Z3zno+c1Pfo1PfH1t6YiFteQYhhxXLtE0DYUzGD/BpQlZBtYYTApEDOEEQ8hnQeKsDH9xdX1xz3bvPVmWMRgMVnq93mzlf3a+w865laZprjt69KhZXV19X13X84Bva5C4WP4NzEvEF2+zqipWVla+vrS0dM1CMmC+r/xiYuJYE/aPlzA4WQB7qqcv3tdjPZ+nmjg43nVsva5jPb7vRtJi8TXZeplTed4Wzzt7XWfl/rPrm63qj8fjTf3+s8GBIQSKotj0vTGGuq4ZDAZcdtllnHPOOamqKtq2nV93CIEQwsl3CDCRRACbSDFgQiSzGbkpyH3ChUDuLI0PTNqE7+WEctoO8Ptf55HJTnxxNpORobf9DGIbwY+gl8Gkhayi6hnK0UP8z++6mledSyqAzEHyzcJ2myIicrrRNoAiIqclg7HdDIDeoKBoWv7Rjz0r/ejLL+DMYoytj9JOhrht24hHV8E4etvPwKeMOuU8cDTxX66/hc/ftva+vSP+ojaGxvUIOKzNwCRs8jg8loDFT4OORDKOZCzmODnoUykhn636V1W1Mp3Gf7UxpjcNEHvW2nMmk8mH67r+cNM0h2eD/rauCp/wGVoo8c/znH6/f02v1/uHs+qAk/fep5MGxScKnJ/oFoAnu0+nErif6r+n8hieyHU9kV0NvlszB1I69paFWxNOW7eFnP28vLxM0zTvHw6HH4Bu94nFrSNPlnxLpvuydC0BeTS4lLAJojVEZ7qI3UQiiRQidYTRpDlnfVRffv75z2DXGTuZDNcxfoQzvkvYDc4AU+LX1xhsXyauH+DSyy7kptvue+7BdX7fAFnmCFE9ACIiSgCIiMhpous3zgiUbctbL+un9/zoi3lWf0yeWmJb43ol3gdSdLhqiegDtSm4f9Vy3efu5A+/euiie9b5eANkVUGIlpAS0WSQwJqIJZClRJ7ATgPi1pREckzqEgLHC5YWS/wXA9jZ+fv9/oVFUfztLMuuttZeaIzpAcQYb/fef3w0Gv1q0zSHZyu0W1ePTyUBMFsd7vf7K0tLS18vy/KUguHu5yc2XO9Ug/knG/yfLBlwKgH6qSYTnmrw/3QkAGJMxxwAuDX4XxwIufge3L59Oykl6rr+kclk8lHv/abqlRMlAZIxeGtJBrIUyGIgI+JIRCzBdu89U1hINYRI1u0WyOERH9/7yOE/6y8v/71nnH0GO6tI7tfBRCAnZDuYtJYyczA+Sr+C3TuWWDlz5UVfufGhDzQJmpg0AkBE5DSlFgARkdOQAUob6QMXVlz5Cz/2ap7Zh8mRR6EeYfMcU/ZZG7Xkg+3EmDNqIgeGgU985W7+25ceu2Jfw56RMdgix9gMUguxhRRIJNI05Lepuz2zeOgxlmg2B/iPC5K29NXPArFpvz+9Xu8jWZZdHWPcE0K4aXq+w5PJ5H1Hjx59z2zf960l/lu3+ztukLaw7V+v1/tIVVXzy50s+D9RUuFUAvwnsiJ+suD/eEH8EwmoT+Xyx0sKnGoS4lSSHN/VP4CmrQFN01DXNYuJoq2r+FsrAZxzNE3D7t27ueiiiy7fuXPntbPdBhYHC57w/WUsCYtNCZfAEQFPnA/p75J0NgIBjHPk/R51vswDa+Yr1/7Ft5pPfPkugulD0Se2CaolxnUkkHXVA5khDQ9Q+YO84fm7+YUfPy/16YZ+2lN8n4qIiBIAIiLyfc4B2wysAL/8jvNveNHuyI6yoKqWqOMEssj46ISlwRk0WNZjpM3P4IZb9/M7f/HQzzzQcNPYFaSsJJCo6zHEltyBsxFcJBqIxhJMN6R8U5ifusTAsQKsrQmAxWBktg1fv9//kDFmxVp7oXPucoCmaT46Ho/fMx6Pr59MJvOEwWJZ9xMJLmOMZFlGr9e7utfrXTMbIrfYPnCqwfpTHX73RHvrn2pQfyrXdayV/uOdfrJWgr+KwHP2Gnrv50mAxYTR/5+9PwuS7DrvPMHfWe7i7uGxZURmYiWQCRAkuDMhLhJXMSFKlEqiugR2WamsqzTTBtqYqmxmpAfgoWpsZtQP5EOrH0ptbaTNlHqsqqtniBkrVfWUpqsIlbaSIIoEFxAg1kwAmcg9MmP15S7nnHm4fm7c8PRYckEuxPnRnIjw8PX69Zv3/z/f9/8mGTLNfdQYQ6vV4q677uLQoUOP7d+//1vNwMCd1b9EWIlwEjv6fhhG3xNRVcagFNJUBoACytKQl5YSQaYSXnwrS/74r1/ib3/yFoXrYKI5jNEoKWgnimyQwVQXKxVCFHTdEn//0Q9y5F5ci1ACGggEAsEACAQCgcA7Bg3EBn71o7H75Y+/hym7DkWvWt1MEkpTiZ84isiLAhdP86M3VvjW069xfJ1/nUddLBopHKUxFNaBEiglUBRIWyIpcUApBIUQlEJg0ShnkK5kUgjZdmn6PqQtiiLiOH48iqLHyrJ8Wkp5SGt9yFp7vN/vP7m+vv50nud1oNtOK7l7EYhpmvpKg8tMib2uXl/JaL5Jj3Ulq+RXO15vN2NgLwbElVYAXKlBcr1prvZ7EyDPc4wxW17X+IjHZihkWZZIKWsTYGZm5glr7ZbHmLjdsKiRCWaEoJSQKSgUWFmCKNE4hCmRUqGVwjhBXhY4cqQUDJ3kxTeG4v/9Jz/g+IpBd/eRFSWtSOKyftWOszFEdWfIsgFTsWMhLfnNL32UKaqpH9tt8ysJWwwEAoHA7UUwgAOBQOAdSBt4uM03nvhHnz5yIHV0taEYLGPKDJl0KY0kTSRl1qM0gtfPZ/zf/8MP+fZrThRJh36piMmJlMFRzSCXWoNzOJOjnUGMAv8KkVCKBCNiBALpSjSjUL5dxKUXIlprkiSZS5Lkf6+UOuL7/YFhnuf/cjAY/B+Gw2HVNz0Sk5OS5CdVFWxHFEV0Op2vdTqdv+MNhZ3aB0IGwO6PdbVhf1dqYlxJCGAza8L37o9/zpPen5SybhtIkoQkSQCO5nl+piiKZ3c0AOqS/yozI5eVCWBk1TgjnUUYg3AgZQoyxlqBlJZUFWhRoK2kKB1LK/xp2ip+612LHWajEmkLXJ4hoxZDW1JkPeJ2yjB3KJ2wb3ofZ8++/n9+6az9v2SjqpZAIBAIvHMIFQCBQCDw03I4F7q6jA7tW/vuKxSQAh3gf/dfvvvxB/fHRLZPWQyJIk3SbjMsQcYpRZFTOMGGa/EfvvMi/+k5K/oSMlKEkBhbwKjM3iJxbhR+5kCpzX9e3Kjn3yGxiNH/21Fo2Q4iqVF2PSr9fzyO48ellIfKsnw6juPHiqJ4am1t7cn19XWMMfVIvu3KsK+kDSCKIqIoeqw50q05T/5auR4j867m8a/2dnu5/ZVWGNxsmmMcjTHkec5wOCTLsonBkc39J89ztNZEUYS1llarxb333ss999zzjU6nc2jX7egsEkZZGJvfXTf64ko5MsEQGAvGVeaEFFXURhRFOKU5sc5f/M9Pn/n6M8+/hUvnsXmJSiMiKRClJZIJlBLtBGV/nTu6jv/qVz/FNJBaS7TllFBuPW4If2xh22NKIBAIBIIBEAgEAoEbjZAgIhBJ9V8kETDTUlsO9wkwC/yDT0+7z77vTqbdGm2dU5Y5Q6cpVIrSmqIoGJgIMXM3/+kn5/l33x/+0UUFWTRFkfWRwiJkjHGVaJCAM7Z6HqkorQChkAgiqnGAESVKWJxQWKlAqMv6q5sl/341P45jkiQ5Olr5nxNCzCmljqysrIiNjY2vF0WxZdXfOVeLup1KnJsVAs3f/crvzMyMi+P4UFP4+fLu6ndXXyqx5rZcdmO7doSd2hSa108aYTcedjgp/2B8m+z0XDsZHds9/6TLuOifVJ2x033HjYPqb2pTtAq15TLpuubtq787jCkoyxxrS6SsRHdZ5vR66+T5EGMKwI4+T4tzBucMYNG6egxrS6wtEcLRaiXccccBHnrowWNay/q2fv9QSiAl5GVBicA4h7AGZS3CWpStsgGcq0IynRBYVwA5WgmcE2QlWAHDwtIvQM9O8coFnvxXf/IGPzpVUCYzUBiwho7UqIFA9iGWES0KsrW3eM89LZ78Rw+5OaCrvahXKCKiyo4Yqf3RRhGVMeC3XjABAoFAIBgAgUAgELjRmn/LiXgluKkFk0UA+dCM/AGJour7fWCGb/3qZz9MRwzAbACGJI3QWmOMwdkSEaXI9j6++9JZvv2DNzi+wq9nkpFwd0iqFXbnqw2agX5VETOblQgW5UoEJQKLE6PbjMRlU/R7gefT1KMoIkmSI3EcP+4T/4uieCrLsq8XRbEltK0pGJuj23bCr/L6VX4/ym1qaurQpJFw17Nc+krL+a/m+r2+jmu53dVmHNzq+MkAzbaR7QyYpjE0NTXF4uIi733ve938/Pxvl6WhKAoA/GSKViupvgei+n74TIDqe1R9d5yvBsA2LuDQGKGxUiHjhLVeQTwt+clbTP2rf/8MZ3sRVk7BMIc8R8UJIophkKGcpZNoRLbMJ993gE+/FyfLqipIiwjDWDKHr9Jp7PY2HHoDgUAgGACBQCAQuPHiX+GDXEZi2zlwBpxBj27j9YqkpCWrE/1/8Gsffuz9992J1pLSOKx1SKWIXIHKBlCWOBdxMW/zJ99/g79+zoqeAy0V2uYoBVJeHyE83pPfFNxaa+I4PpQkyRNRFD0GUBTFU4PB4Ml+v//0pDF/TbG+VwOgKe588v/09PSx8XFub2fZ/7WYAjvdZi+98Ff7eDfCnLjRNI2e4XBIcx8bfy8+L8BXXPjf0zRldnaWd7/73dx///1/MD3dxbnN218vE6l0FicstsiIdbL/4ga9p/9mePiZl86zLOYo02kKY8BlIC2lM1gUQqUIU/Ku/bP8l7/yMdpUxiDOoHWLEk3pl/kd4Moqi6BpTITTx0AgEAgGQCAQCARu7MFbXXYQt+Cqcns5One3o/P4GIgtfPBO3Bd+5r24/jJSOKwQWBwYA8WQiBKJZL2QPPPiGZ55dZUlCzKuEsvLfIAUBrtNiv/VCOKm+PZivrnyL6U8ZIx5Nsuyrw+Hw683e7QnmQlXtB1HAt+ntsdxTKvVejxJki3z3MdXfq/2fV6tOXCtwnu3n3cK/tvp/ew2veBWSfy/Gqy1FEVRVwI0AwL9330+hd9XnHMYY7DWkqYp9913H4cPH3atVooxliiqKm0Gg+zajAoBVjkKLFoKNlYH53UCqwXHn/qTH/O919fIkznKOKEsh2AyRBTh0NjCkEiNHSzz8fcd4u98fN61AI1BOAFC1DkEOFCuOtZU6R1q1BZA6AMIBAKBYAAEAoFA4Eay2QLgKwAsODM6Wa9EQgl0WhppYQr4P/7WLxEPzpO4HsIZUFWvvCtyMDkiThEy5cylkj/+zqu8eA7RA1w0RVEYpAMlLWWeX5/3MEFQaa1ptVqHkiR5Qil1xBjz7HA4fHIwGHzdC38hRC26mj38zRX9KzUAlFJ0u92jnU7nG5NE7tUK12spkd9JRO9V5O/FFLiS211Jkv/V3u6GfH/G8h/GLz6HYjgcMhwO62DJ5oSJ8X3O/16WJVmWMTMzw3333cf+/fudUlWVwHZTJK7InACEVjhXkkSS0kAuUgaR5i9edOL/+SfP8fzJS5ikg2qnDPMeTgqcVBRDQ6okutigZVb5h1/+PA92+VctSqwZQtoa9f1XxxE9uoDCoUMSYCAQCAQDIBAIBAI3C1dbAZX4F3WfcCX+LWCykhbwm0cPug/cO0Ni1mlLg8CM/iEQdQgYOuXiuuOHr53nB6+tPbqUCQrZZlCCAVoxaK243oPDvKBSShHH8ZwX/9ba43mefzPLsqezLKv7rJVSlwn08RDBKxGBQgiSJGFqaurbSZLUJsN2t71Sc2O7x7nSVfLtQvWuVLDvZCZcy/jBt3uywQ09QRrtQ17M+0oAY0xtEDRX/JttAlrr+r7dbpe77rqLdrtNnpejsYHRdfnOYKvnjmLFRuZYyTVZK+bPn7sk/u2f/4Az6wbRmatyA0bfncpBcHTTCDYu8eBCyuOPfeo3O0DEAPJBfXoo3abWD2X/gUAgEAyAQCAQCNwk7Ejgm1oNWBQlPvO/CvOKQEmkhcOz/POvPPox3KUT7O/G2HJQJZubsqockBJEwqAHP3xjmf/4nZc4u8HTZTSNVQl5CVIphFJYa1H62t+DXzH1wmRU9k8URY9JKQ8VRfHUSPw/m+d5Lby2CKA9itztBJ43DZIkodVqPRFF0WUrw1cj/ncT21dqGuz1PYYMgGsX1c1qEv+zNwGGw2EdDDhpTGDTgKpK/QdIKdm3bx9TU1P/ZtK+e9Unb0UOQlCWDqkirIwwTlEks52lHP7k2bWn/valsyyvGWTURiGQtkBpcK4a19nWlqh3hi9+7BCfOqzdnKCaMegAVx1nRj9uNvw46vGfgUAgEAgGQCAQCARuhFAZiXxTd/ubOhSwvj5u4YylBTz68bv+8b5oyMEpsEW/Sr5H1Kn/CM3Qpby1LvnBiVX+8zEneg6EipFewEnNoDD0hyVSXrsD4NPTfQl1FEXEcfyYUuqIc245y7Kv53n+bDPt34snY0y98jpJoO9FYAkhmr3/c0mSPOGF/3j4324r9tdD/F9v3q52hebtbsd0/73i941mJYAPBfRl/n6ChNZ6yzQAb2r5EZVpmpKm6ZfTNEYpRZ6X1/bZuqpyJ1URONgYDInTCCLNYH29V0YRr1/kK9996TzHz/RxahqlIjAlowmcmNISxxGdZEjUf5N/8g9/idhBm5HAt5vHmRJwfhKBs5uuQCAQCASCARAIBAKBG3P4diJBt7oAKOzmAV0pkAoKQ6xgTsIXPvYeZlhHDFeRwlGUlYBppSlFYTAiYdha5E9fOMUf/dXp3xoCyBauyFA2JxIG48DJCBlFGDcKCtuDSJzUX+0FlBf+rVaLNE0f11of9T3/Gxsby8PhsO6bbo7la863307wN1Pax2fQN80ErTXtdvtbaZrO+fv5sYDb9YlPMh0mvf+dbjPpMa9k3OD4/bZ7zO3uu9v1k1oVJr2nt6u8f9K23s6U2cvjTNoHm6v8k4weL+ibPf9ZltHr9baU+fuqAL+fAhRFQZIkZFmGUorDhw8zOzv73w4GGUkS1fulrxbwmQOT2k8mGQCRc7iirKp8Ik1e9EBkoGFYGoYK/uwHa7/5ty+chWSBPLMI6ZCtiMIashxI29C7wEy8yofvS/ivf/mgSx1oaxEuQukWVkVYKUFYolaEqqIAQwxAIBAIBAMgEAgEAjcMIUFoyrxapVQCEn9EFwqcRCQCbeDox7ruXXMaOVxByQKHRMYJUkrywhC3phnIDt9//RJPP/cm5wz/4wpViKCiQLsMRYlDYtA4sbd/OsZLpMdFoxc9DcE1Z609PhwOv7mxsXH8mv+B22YsoBdpxhg/ahCt9dHma7G7lDhfb8F7o6sKrjUkcDfh/9NQGTDJZPKmgTEGn0nRNBrGK1L8PiilpNPpsLCw8DudTqsW+t4I81UF46Mnd0JZULYayVdN+8iBIVDggA0DZ9f519996Rw/eOkMUWsOax2UOVIL2tMLDC9cgv3TCLVBuXqML33mYe6f4vEqD8Bgy2pMqFOANFhb1iNIA4FAIBAMgEAgEAjc0CO4GjXmWrSAwpfs2lFLwHCDe6c58os/9wEWEkssiqrnXygQGqVGPcMqZbmM+PYPj/Pd1524aDSl7AAW5XKUKxCUWAGuFna7//MxLrwn/a61JkkStNZHy7J8ejAYfN33WV8PA2C8V7tpQDjniOOYdrv9rSiKtvx9fBX2avrnr6eIv9Lk/XFxvtcxgHt57it53rfbyHi7DYDmf/3+60v8m+MBm3/31QLjTE1Nceedd7Jv3771cYOpGSwopdzVgJKAcCODC40Tm6NBlSsRWJxOWXHwnZfz+T959jXWTIrRbUrnqnYAB1LFkPUhMrRUj0OLir/3xQe+MQUkWCL/NgSgBcYM6wmA4QQyEAgEggEQCAQCgRtKJfQlDuc2QwGFMGhKOg7+/i9+6HvvuWMa279E3GlhjN0UHFYgZMSlgeSFkyv81fPnX1oD+k4j4gQrAGFGpb4O6UaRYG5v/3TspYx9tAL/OMBgMHi21+thjCGO4+u3lRql3c3yb6UUrVbr8Var9ZhSak8TBK6nUN1r0v9exP/1GO+32+PvdZrA9doGN/3bNdZeMS7yfem/X733+46vIGne3+9vc3NzzM/PT0VRVOcHNMdZ7jXDwlJV6NhRNY4YpfVLWyX3SwcqbmFkxJmc5f/8/Hm+d+wMZTyLlUllZBQFcacDeQ5Yom5CuX6BX/3cR3h4nkspkMpR/J9zYMwoF6CaAxhiAAOBQCAYAIFAIBC4YerEQjkEV6KEIHeQA0JrImdpOXhomv/rL3zkXmZEH10OQCicjClNjpCjlUyZslwmfPu7L3H8PO/NlQBnQBqcsBgJVlZiQ2CRzo7+W4mOvYi7SWP6hBC0Wi2UUnNFUTw1HA6f9n3U16unfFJJdrMiIE1TkiSpk//99c3S7RstRncT6JO2zV7ucyXPfTUjBa/Xqv+tNC5wuxyF5v5sjKmDAZstA+P7um8bSJKE2dlZZmdn/2mzWsDvb74tYNdcAwGFlJjR91K5qiXAi3/hJM4UGKUoFDx/FvHv/urHnM9irGqNRmlCWfShuw9jqoqAbidif9vy2C8+PNcGMFnVYODs5kgApShDAkAgEAgEAyAQCAQCNw6BJZYWTYl1tkr91yl21BbQAv7uZ+/4Z4tynS59Ou2EbJChWm3KMifVEiEkhY04vWb4qx+v/f5AQq+oqgqEKDDSYoSgEIx6jEuUK1EjE2AvAm88uM1fr5Si3W5/A6Df7y8PBgOgCgQUQpDn+TVvo6agb4oyP3Kw0+l8K47jQ/5vVyKG3442gKtZYb8S8X8tP+9k7lyvFfzrvU23C/+70pDFSUGEzawI38Pv8wD8fXwLijcF/GSA6elpDhw48HtqNFLTTxNo7od7yQGworoAKAfCysqUcxKQmDyrwvrbKcsO/urF7Mkfv7lEVipElOLyPlparJW4dIY8MyRpgigu8YVPPsyhGf46AbQDrKtT/62QGMIQgEAgEAgGQCAQCARu6MFbO0M8KsitQgFjbGHRwEOL/OgLHznMjFsjdUPQgtyAkylaCXAWpSLWh4a//uErnFrjdwvlF/gswgxxQCk0pVQ4IZA4tDOVAXCFZ/9NEaW1JooiiqJ4qiiKZV9CPSmx/3oLQW8ytFqtI2maPuZFWnMVdlIfd8gAuLrnvVni/3obM+Ovr1lJ4kV8URSMV7E0e/v97TudDouLi8zMzDymtd5iVPnH3rUCAImREiMkYvR9lE6DTbHE4DQIA8owQJDHcKrP17/9nec5e2GtEvSmD52UlV6BUdOUok1ZlLS0ZWFK8Es//8AnW0AM6NHqv5AS40bHm3AKGQgEAsEACAQCgcCNw7hqZV5rVZXokgEFizF8/pF7PnjPjGbftELYAvISFSUUpiTWmrIw9GhxeiB4+jsnnysE9AvQSVSt8BWWatQgdc9/NXscwILYvQJgu9F5o7FnR9bX158uiqKeo+77qoUQ1zUDoPlaAB88WJf+Nw2A8f7tW0WE3mwx/XYK9NtN/I/vT/73Zpq/36/Gx/o554iiiKmpKebm5r6VJMnmCdlYG8DOL84CFkFZfxctEiMUjpFhpxTCWexggFRVRshffn/1q6+czejlMaKdgh3Q6UyR5YYkaaGVBDfEFBf5pc9/kLu7/PM2o3BBRscCa0Gzp2NAIBAIBIIBEAgEAoHrgEXiREKBprQghEXbjK6DO9v8iy9/9uO0ZQ6DHkJo0BHGFiRxNcCrKBSXogP8L997g5MrfKhvQceS0mrQXVApziqEcShboEwVNGgcGATWiV1LrJsiyYt8X/Y8HA6fbc5h3/LeRv3S11Nc+pVaIQRJkjzW7XYf265ne7cqhO1mxu9UFr+X213p44xfNy6mx2fe79bmsFPw4CRDZC+l9Ff6/vYqwCcZTFdS5r8X06FpDDXL+puj+vzj+CwAnwfQNJs83tRyztHtdrnnnntotVpf88/hzQKl1O7tIM4S2RztSqQDI6CUUEpLKavfhVBQGmIlUFkl4JfW+ea/+PaPOa3uANWC/gZJp01kDcrmYIdYnRMlGXfN9PgHf+eufxyNxL8mGfUclNU0kUAgEAgEAyAQCAQCNwYHOKGxKErr0LoKAetK+IWPH/ytA1OOthDVDaMInKUVR7gyh2FOPL2P1y8OefbVs6wbiJNqnBhW4HIDqlqZVK4KGPP/WDjhn3vv4rsp1vwItesl8HcTcM2xaj54MEmSJ7YThz8N8+tvB26n7TxeHTLertI0KZrtAONmhBf43ljodrt0u90nfPVLM1dgV2OFqu9fObDC4gQYaXFilNrvDRQHkRMIW4X4Dxy8uWKe+svn3sSkXZAa+uuk0uDKAutKnLBY2ydy63z6Iw9w7zT/PAIcRWUFjCYOhBCAQCAQCAZAIBAIBG6UKAEia6qEbqUobFWiv9jhsV/9+Y/SFRtIGQEpxBJjc3SkMEYwsJpcpXz3Ry/yk1cHwgBCCQpTglLVFABrRsO+tlKNH5N7GgU4PgHAi6cbaQA0n19rTbvd/lqSJEd2SncPwnznz/JqHmu73IFrubztJ0ijlX8v+MeDJCe9Fm8A5HleC/7x/d+/99nZWQ4cOMDU1NSh5vV7bT9xtQaX2/6lfigBpa3aAM5fsl/5T3/9XS72NUSzUAwRVYogTmniKCISEmkE999zF7/wqXv/cWv0LN74c0H8BwKBQDAAAoFAIHAjD94WR4HAgRAgIAI+fWTft959sENcXqqEvKrW7hwjwe0kdGZ58a0l/vxvX6QPCAXDwuEMaC0h0lBkSGfxq4m2PvmvxL8VErfHf0K2m6N+IwScF11a63rsX7OE+50u/rcLAdzt+uttMNyS37HR/tPs659U1TK+rxtjtpgAk0ZbjlpROHDgAIuLi8eklJRlWVes7Pb9cFTfwep7WH03JdV0Dn/BlpvbXFbiH1llfbzw6vpXv/PSKcp4dlQhlI8CQCOkg1gotFQU/TW+8qXPMCchjmxtLIhgAAQCgUAwAAKBQCBwg8UbBj36iUiwf5r9/8UXP0U0PE8ih2AKiJKqZFdJMAYRJeTJDH/2/Zf58ZsIHVe9w5mpEr5daZASEAKBRbotqqMWHo699VCPCxkvcPYy5ux6CDi/CpskCa1W6xv+eZs93NdrjN3tKv63E/1XMhngp0X0j79u59yWdH+lFEqpbQMu/X5vraUoii0j/pr7vTcK5ufnueOOO2i1WnV1gFJqT6/PUZlwTsjGSZ1FYlGuxJkSJStzwDIaG6jAKDi3wTf/4zM/YWkYQ9KCcoh1lWFgswLlIFYaij4P3DXFrx1ddLYAqEI7BaFaJhAIBIIBEAgEAoEbfgC3lCAFZI5f+Ln7zj1wsE1s+tXqvyhBC3ACKTRIgdUxr53r8Zc/XqIPlBoyC0hJlCaYPMPmOXEkRiuJm/9QWOEzAK5uzNtOIXNvJ6PU/6NJkjzeHPu3nfB/p1UD7Bo4dw1VADdqlOLbvW28mPfXNUv7tzMB/H3KsqxbXpr7V1mWxHHMwsIC+/btcz4gc6/bxonLsziqkYC+CsCh1KgKhirAs3BQCsEAePbljad//OYSuAhUFdCJNQg7Gi9SFsx2ElbPvcZvfOlTzMTU1QUuGACBQCAQDIBAIBAI3FgKqh79VBQsKPi7j36UKL+AkBIMoEpgUK3mOwVasl46/vwHr/HSaYRVsDoEKxVOKqwFqTWYavWwagHY+k+Gxc//3vs/H5MS5W9EC4C1liiKaLVaRFH0WDPBfdKYtZABEDIAxvcfv+JvjCHLsonZFX5fntQO4FsBiqLYYgI0QwWnpqY4cOAAnU6nzsfY7f1Vq/qj72NjTCejY4J01UVLQWFc1cijFZmFoXGUEk4v8+iffOdF3rzQB9VBoKAskEpXj2JNdZTJljl8d5fPf6zr2q5yEtwVHgMCgUAgEAyAQCAQCFyLOKEqAe62EqLM8HMPp+79d3eYiTIoS5BRpQDKDBAYC1YlLBeCZ35ykgsF0IopLEidVgFhWUa7naIklIWpEwB9//+VSvbxEMC9jmi7XhhjiOOY0cr/IWCLoAsE82M3A0BrjU/pHx/x1xwXOckEaOYBeAOgWX2ilKIsS7TWzM7O0mq1vubbB/Z6Cle15DQ+R6iNO1d/D6qqHRUn2NHkECsUKyX81Q/OPffSmR4bYorCSUyWg1RgLGjFcPUSiwdnsYMlfv3zH2ZOMmo72swHCQQCgUAwAAKBQCBwAw7fBokwGdPAf/2rn6Q1PIsdXIJ2l7ygCgCMIuxwgEpbDESLv/zRa/ztywgbw9rAIqKUrDQIoRBaMtjoIUQ1VnALzv+TIUHY6rILN1LsTzIckiTxgv9IFEVHfW91czrAdq93L695tznzk1ar97KiPZ44v1uIYvP3Sa/9WlfO/WP68XTbbZ9bZQW/mdQ/aZvsVIEwTlEURFFEmqbkec76+nod1ucfw1eWND8zbxD4ahNfBeD/XhTFltGB+/fv5+DBg09EUUSSJNf+nRFVZ1BZGLSujIphXlZj/1RMbgUOOHGRD/37v36ZU/0UoTuoOIG8BB1BnpFOd8gHPWzZ47Mfvo+ffS8uBuTo+9+sqgkEAoFAMAACgUAg8LZRrcDlOXzmIdyH7m4hexfoxAJMQTzVxY4af2W7TVZaTi6X/KfvniST0DeSUmpcNUeg+gfBsdn3P7rS9xk3VxkbU8ZuKju1FjSE2RGl1JHx4MFbocT8Rm2Xt+N+VxIYeD1e226Gz07XX+1zevFujEFrTRzHGGMYDodbJkyMj/ebZCb5aQI+R0BrXRsJSiniOOaee+5h//7938uybO/HgC1GnN36HWWU2wFbggKrP0tkBH0Df/ta77nn3lhjo9AgEigdOAuxoOytIySkkYWNM/y9L32YBIhcVW3gt0/z/YdqkkAgEAgGQCAQCATeBiIsCfB3H32Qe6ZyoqIPFnI7pIxEFe4lE4gVuU74/msXeOYFRKEgs2IsyMuLiUZp70jo+3YDJ6ryYrHFNrg12Eb8o7U+GkXREa31FnF/u6xY7lVQ7dS7P+nve33M8fDGnR5jUsjjdve/EUbA9TIejDEopWi32zjn6Pf7dTn/dlUjk1oB8jwnz/M6W6D5GFJK7rzzTu6+++4jsPdJAMKxZVKHg3o84OaozvF93YGwCFWFAb52jg/95Y9P0iunsCYejQ41IA2ly1BaEwmLzlZ59OMP8/CdZDEQiRtj9AQCgUAgGACBQCDwjkcBMfD+O3Gf/MB9ZKunSGJZzf5WgrzMQChQLYaZYd0l/MUPj7EClE4ixGaNv1/xr9LDG5aAoBYRW0aNOTsyAm69HuAx8X9Ia31Ua72lRPt2ESg7rW7vJV1/tzF/V2IwbHf7nUyCnYL/xu97PUIA91K9cSUVC9baLUZRmqbEcUxRFKyvr28J82v27o/nAvjffZCgzxLwGQC+RUBrzYEDB5idnT2ym0El3ObIv/F2HFdfKvHvJwVIbJ3iL5wlKxwlYGP43gunObXq2HAtrIzAlVAWJIlGKnCmpKVBFOv8xi88FLepBoyMf5Y3suUnEAgEAsEACAQCgXeUAZAAv/aFDzDfUZi8B7ECKdHSogQ4W4IQ9NUUL51b529fzn6nEFCUDiUkwoHAjYl5W4v/KmBsq/hHbIqIm812fehKKaIoYiT+jzZnr9/oXIK32xDYy9+vpILgSlogtmsDuFEVADsZAns1A3a6+JX65s/tdhshBKurq3XOwKT9q/m7fy4/FWA4HDIYDOo2AKUUzjkGgwHT09McPHjwe3sJAhSuMfbPWdzou1pfGuK/Pm44ixoZfZmpzgKtSDl2MhPfef40Qz1PgQQMiAIhDZgchUNJTX/lEkc/+V7uSPiEsFy2Da7n5xsIBAKBYAAEAoFAoGEAHIjY//mfeQ95b4W0nWCyPsRQZHnlBSiHQ1DqWb7z/AneWuW/6ztwMiJRGuU2xf+4qPer/pbNSy06uHVX/4UQaK2JouhoHMeP+9L/qxGAt7r432sP/HaPcyVtAbtVE1xNBcCVCvzdPqOdQhW3e417eQ1eoFtrSdOUVqtFWZb0+32KotjymE3xP6kywFcB9Pv9evXfG1ZlWRLHMQcOHEBflsI54bWN8jouezdu8/vqRwRW313/PS8BCxJ0GrPRL+mX8KfffZlzPUGJAq1AQVFkmGJIpDS5sbRaCXd0BUfewzOqYcSNGxbBAAgEAoFgAAQCgUDgOhsAv/jZ/ecOTo/CxOIOQ5ODMEjrEMYhtKFwJScuDnjmR6foO7C6CjfDbhX+VVn/1uewozFjdR+xk9W1t2ALgBcco/L/Q1rro0mSHJlU+n87iZOf1gyA67193o4MAKUU1tp6hdsYg5SSdrtNmqZcunSJXq+HMWbiyMtmiGCz4qQsS7IsY319vS7/b6bpz83NsbCwsEuJylheR+M769t2qhwAL/43RwQqN5rnoau8P5xFS8ELx9bFXz77MoUTVVuBtehIYfMMsGRWEiUtVL7ML3/+Iabiy42P+nXYMCIwEAgEggEQCAQCgcnipPmDaIp8jRpN3fZ/E1Sl/y3gyz9/hCi/REtpnJFEcQtQREkLZx0oQc85fnLsIi+fIM4AGbUxriQre1vEQzPlv9nzP3GF8RZhu3F3UspDo/T/y8LUbjfxf6WmwJWW2V+vUvyref3XuwLjen+23gBo/uzHS7bbbdbW1v58MBhgjLnsc2lWADRT8r04NsbQ6/Ww1jIYDLa0ArRaLRYXF6/hdG5v5lxRQjbMUZHAKcm5DJ7+q+fo54oys9Wowk4LZ0psWSKkJh9ukLg+nz3yIAc7/NPp2FF9wzQSUR8rHK5x4PDjQ6v/CioDM9QIBAKBQDAAAoFA4B0m/KuTYVmfDI9OkkdCXxMREaNG588qBSVgQcJv/OyUe/d+wYxep4XDDUGLKYxJKKyk1DF9JxioDn/6Ny+zMqQgamFkDGoU9jcKD/Or/M3U8DpkzI2v+I8njN9cgeyFlg/6G4m1I+12+6j/3a/g+sC2zZ5lu+NFCFdfJt+GHVPgd7veC8q93nf87+Oic9JYxN2E96TH2Km83m9H3/O93WPulLHgX/+1hgA2Px9/kZItP0+6bH6mO28bv4rv30uSJD5ckn379jE/P//Zt95665PLy8sANMf3+X5/KWVdzu9NAL8f5vmQwaCHEA5jCpwz9b51zz130e129htTUm1qW7+n2izYUqGzNRiw/u5i8W/Vf8fNqLUnUgkARhv6ypAjOHam/PIzzx5Diumq6mF9lbjVpigtVhqUKohsjyl3kd/5hw/+XpqBBgQpuKrxoNUS9TFMiOo4BxFIBUISVb+FE9BAIBAIBkAgEAi8sw6/WwS0GAnyesldjtb/FX7x0FpIRtW5v/Cz76fFOsL0wJVIBFLECKIqtExqhjbm+ddO8+b5NfpAaSOscZTWomLYWj58+ciwZr//ZfkAt8g/H15wNldqtdZHb/ce5N1WwvdS8v52b4OrzRO4nT6DncyX2dlZlFJHLl68uLG0tESaprWxMW7kNH9vGj/D4ZB+v1+3Gvh9uN1uMz8/fy6Oo7rCoGmsVP+9fMRfFQzY+O6O+TBN00A4kEJiHBQOSpWw0uffPvfKGU4vZwiZolQl1Z0UaGmRGLA52vT48EOLvO9eXAqokYVpgaxwm8c0aNicgLTN3wKBQCAQDIBAIBB4Z3GZkHYWnAYUFgOYzSTvArSFe2b5F0c+9ABKgrMWJzLQ1eqhsNV9jLMYOc1zL57k9DJTiGr1E2Ox5U9P+W1zDBtAHMdHoyg6utsYtVtNYO61dP9KRu5dqTjf6/XbVQvczBDFq32+a3mt8/Pz7Nu37w8uXLjQXVpaYjgcAtRZAZcL9q0mgJSyDgTMsqw2BpRStFot7r77blqtVmTMeLUCW0yBq3rfDrAlURSBE2AlUkLfwHdeyJZfPLHK0MaAphz1ByVCoIzBOUWJ4+475vnUx/dVE0lENVLAicqoRAKuGi9qa2ugAGdxgCEQCAQCwQAIBAKBd/LB2NWOADiFQ1NQMKCPVKAURLbqnf17/8XDv5XQQ43uJJQDVeLKIbbMwRVYJzi3annulSVWhvREVJ2Eby19vr3/CRgvm5dSEkXRY3tJUL8dTIGrEblXmhtwpYn4u6X/34yV/93GEV5JzsBuwYfN/S2KIu6++24ANjY2Pnnq1CmGw2Fd+r9T+0azUqAsSwaDAcPhsK4EEEJw8OBBpqenL40bCErJ6zLGUjiLMxZECjIGU0n14yvM/+D4RVZ6AkNM4arn1dYgrcEpjdMSW2zw85/6MNMClOtjfZWQ765xUDUIjMYK+komwCAJMYGBQCAQDIBAIBB4hyFAbJ4IC7f1pLmkxAiwQiCMIALuaPHQ5z72EBQXEbaowvu0A2WxtkAKg9KC0mme/ckpnn+DL/eBDLCuQAmI46pr93anWV49Ev9EUfTYePDf7Sz6r9UY2Mvq/17GCe5kHmwnvG/Edruez7PbqMNxBoMBMzMz3H333a7f7//N0tJSfP78+YnZDZNMCV8F4JxjMBjQ7/friQLWWqanp5mfn59KkmiLcXBdqluERSqqcD8ScDGlzRExrAHffe0Sby0X5DZB6gglHBKDsAVECqckwg547/0L/OJn5pxidFypeosqpxLpfwA/stAxqmsaHeoCgUAgEAyAQCAQeCfp/+aP0m2V5SIeHaVLAcYRA7/wqXtfaosNZlsOZw3W19kqixIGEWmE1KwOLD946QwX+vzbQlYp/5ISTI4Qgqxwt0wf/7UINi+0oigiSZIntNZzt2vS//jPu61U7+X+Vyqer6SEf7egv5u5Pa90H7iSMYL+vQ0GA7Is413vehdKKYqiKE6fPi3yPK/7+scDG5uUZVn/XBQFg8GAPM+3BFseOHCAmZmZ3/ZGQdPwulYqae5QKHBVykcuJUMJL7zFe148scp6kSCiGKVcZRrgEJFGaslUW9ES6/z93/gUCaBEOeEZJH4qgXKgXNVx4G7l8SKBQCAQDIBAIBAIvD1qxV12ulydlFug3DxJdtUwwA7w6GffR0f1iUSBpur7txKsK7HSgFb0Mzh5boNXT68yVOBiMAK0cliT46zAudv/8O9FkRCCJEmOpGn6tdup/P92zwDwYni8v/1miP8bnQHge/XX19dJkoQ777zTOefo9/ucOXOGS5cuYa3ddtKDfwwfXimEoCzLOg/Am1v79+9nfn7+DzYzBa7t/W4xIJxDa4G0BoocFSt6xjKQEReGvPzdl89yZq3EWIdSBoSpJojEEqEFWlmUWeXD753hQw/iynL0Ausm/0r8u9Fav7cDKrczNAAEAoFAMAACgUAgUJ3cU4Io6p7ZWLVIga6Ch+5tccfCFMPVi0hZ9QtbJygtmNFYv5WB4OSFPieWikc3DGRG4UqBUpXnoFSEkrf/IK7mKDqt9dEoirZcF7h2gfx2Pc6tIv6vxGTxot2Tpil+tf+ee+6hKAqUUpw6dUqsrq7+4Xji/7hp0mxVUUrVrQA+TNC3AUxNTaGU2jJd4No/B0thIIo1zuaAJW63KC3kQlEoeP7NIWfWLJmx1YhCaatqoxhk5KAY0o4KEi7w85+ZHmn6grjVBtccs1nidX/jIBcIBAKBYAAEAoHAO0mRjU6OhW2M1fOXYnMkoANtHBr4r35j0c201llfOk3a7gAWHWmEUGTGoZKEgREs92P+4nuvcn6dp02UgOiATCkLS6SrcmPErX/490nnXtT7FdWmkJJSEscxfvW/uao6LriaP1+PVepJj9W8btLlah7/WoRxUzROErGTnmuvoXlCiHoKw/j9/PWT7nutvfu7Pa6UcuLz73VKwfh2n7QNhRAYY5iammJ9fR1jDPfcc4/zK/eXLl3637z55psn/X2HwyFRFKGUIs/zKn1/bH+x1lKWJXmeMxwOa4Pgnnvu4cCBA64s7ZbnvqZ9V4CMIM8LpMvRStAfDiHSIC1DCyeWEd976S0GJSAFxApSDbFAaQvOgCqx5Wm++IWHaUnotCV5r48QmroUQPgjm0Qgq19CC0AgEAgEAyAQCATecThbXQDbCMyqS/9VdQ4dk9MGPvahe4ndMt2pBIqCssxBCsrCIWTM0Ck2jOZHx8/xyslyOZdgxOhxXbM0/vYqvx0Xpv5nn8SeJMnjXiw1A9YCN+6z2YvJ8NPyfv17U0oxHA5J05T19XXm5uZot9v7ra1uc/HixXsvXrzoW1QYDocURUGSJBO3j9+nfR6ArxJot9tMTU2RpnFthF0XA2skwJW1VdURciTKLVbAUh9eObPOpZ7ByKQq5W/HmKKPMRkkMWR9Uj3kzgXJrzyauHKj6vV3tjI4LbbudLIonA8FDOI/EAgEggEQCAQC7yzldPmvdvzqHJQFRcYH78V96N2LyGINpKW0BjFqqrUWlEwpZJuloeS7L57i2AXmSzF6PCcRVtYn/dXl1hdoXhA1g8/GV26TJDnUarW+0ez9b4YD3ojXeCUBcrfytr6a0MBxUXyzMgBuhhFgjEFKSZIkZFmGUoqFhYVzUaQxxjAYDDl9+nS8srJSl/j7+5RluW2lgW8rGA6HOOeYmppiYWGB6enp35ZS1KMCr+0NSHBVOKgY2Y/VwULiS/YHFl57a423ljJMMk2hIujE1TQRWYUC2nIIMqeblvzGL/0MbQfdGNSo/N+bDFUxk6yeyRFGAAQCgUAwAAKBQOAdagI0ToQNjbX50d8SATHw5S9+gG5UoG1JORwi4wgVaVxZIhxYp8npcPxsnxdODtgASumnC1iUs1WPbv18llu9EmAz+Ozy8n2/+t9qtb6RpilSyi2BajdKNG8nlK80qO9mCv+r/X1S+8Okn2+2qXG1l53Ev1+pb7fbCCFotVqsrKwwMzPD3NzcPwVIkpiVlbXixIkTB9bW1oiiCK01RVHUIr5pcvltZq0lz3PW1tbI85w0TVlYWGB2dvYPqjYXuB6jLt3o/5zwI0gluGpcnxMQxXBuhcMvvrHMgC5lnIIzKCWq6iSTI9MYbInJV/nQA3N8/P04WVQGgBs70XSN5wwmQCAQCAQDIBAIBN5R+Ap/0bjCYXBelDsQTiEd3DHFP/rsJw4jBgMSmVJgcbHASUc27BMrTWk0q4OE7798ntcvMpWraviWdKBdgXIWXIxF4oSFy0Z23YLbaIf+dSklaZoeSZLk6Hjvv+8Dv5XE9O0g/ieJ56u57/US6Lca44aHF+HOOaanp7HW0uv1mJub+71WqzV6H7C8vHr+1KlTvz8YDOr9cnz/nDQusNfr4e8zOzvLvn37SNO0Ctq/ZoNFAhqHxqJxyKoVwFQ5fzgQQrLe4/gPXj7P6TWBjVoMsyFS6yrtXwDtFkUpUM6yrz3k1794b3XMmfDxmdH/NqcEBAKBQCAYAIFAIPAONAGqX2wj+E+Ci4hFjAKOvJ8/XJwpUMaBi1Fak5l8M/QsSRDEvHWmz49ePsuFIb1cg0MjHUTWoJwBVHXCLyxW2MoIuA0MgPGVUh/812q1vuFLq69XX/TbIaavt3C+kcbFTr9PCuG7ld/ntYr/cbGeJAmDwQAhBFEUMT8/z8rKyh9qrel2u/8iz3NarRStJUtLS7975swZ+v0+Ukp8y0pz3x7fpsYYer0ew+GQVqvF4uIis7OzTmtJWV5jCCASnMYRYYQGJNqCdpvHBFNYyhxePpE9+/wblxhaWdmTUQTWjTJKLHkuSHVKwhqffuR+5tvM1cc1tzltxFBWxqOrnhsXTkEDgUAgGACBQCDwjj0A2810bCIgQVhJC/iFLzwE5SVkKcCllMJRCosTjjiOwRmKwvD8S6d49SS/NRBQ6uokXzqBoERgsS7GuWjTfbhNRNf4yvCo9P/xOI6PNBPRmyuyIQPg+r6Pnf4+3vLw0zyCsblflWVZTxwwxtDtdpmamvqtjY0Noih6zIf9eZPq3Llz4vz58+R5jjGmbgPwj9Hcd/1lY2ODtbU1lFIsLi5y8OBBOp0O12X3dgqLxhJhEWhriQx1ab4eLfKfWeaRv/r+Mc5eXEbFshLuQuAEGGNBpOA0UbnK3QsRP/+Z7iVbvz5NbXPWxzeJQBEIBAKBYAAEAoHAO4rGufZYP6xGYFD0uHeBf/Wpn3mAWA6qe6gEUwraSQtnHELHDAc5F/sFPzp2jlMr/I+5A2PVaNKWAVHiRImTJVaAdBJlQdwmPbjj4+W01iRJ8kRz9b85em58XODb+bquRCz/NArjd0oFwCQjoNfr0el0kFJSFAXOOe688042Nja+ZK09Pjc392eDQYYxhlarxXCYs7S0JPr9Pnmeb2lZaW4vv/865+j3+6yvr+OcY2Zmhvn5eTqdzr+5Hh0udjSK1NaiXNbT+RwgVDUbYGUA33/+DG+dGVLaNpQFUOKERWhFq9XCmiFQ0I0yfvHn309LcJnEF3UGiQjt/4FAIBAMgEAgEHhn4QQYWV0SIVBudCUaBMRqQBf43/7d+36zUy5DvgGpICuGpHEbCoXNHKiYnox56cIa3zs++Gd5JBFqCrIEaQsEGaVwFMpS6h5OZmgTo8sUsWU04K1HM+28LEuMMWitSdP0iTRND/kgQyGqGQrOGawtAUslkOy2FyHcjkbDpNn2u82532ne/aTrt7vPdvffaZV9t4qH7R737TQpdttu8gouSsr64q/b6Xn28j6uJAxwfNtX6f8t8rzEOUEcp8RxihCKhYX9f7y+3vuQc6JYWFh4zDnBxkafNE0ZDDJOnHjrcFEYtI5xTmCMwzmBGI31EEIhhMIYRxxX9zlz5hzd7gz333+YKEq+3G5P1e0w/jX5tgI/aWDnN29xMsPJAuksILGo0dhQsBJ6zlGkMSqJOf4m4rmfrNMbTIMWONFHxoo8H2JZR7YcFCU2W+dnPzDHpz6CSwEokFUtEjGgnQSlG9UAgUAgEAgGQCAQCLxT8COynEMhwSqQCijBwFxM50Pv3kc3EURSUJoMoS0KBaVAxy2cUfRsxA9fOcnFPv9Nr1C4QoGI8Cn/TlQn9NVJd4lwAjUKGLzlN1GjP1opRRzHRFH02J5Mliusk77ZyfXXIr5/2lfcb8kTqAkmUBRFTE1NMTc354bD4ZPGmGe11nWVwCjh//jS0hJlWW757JxzW0wS/7eyLOtKgCiK2L9/fz31onkxxtSPsQd7bbQkX44mhTAaBrh5WugElEKznpUMSnjp1SXOnC9AxAglyYdDlBbVVABTQhQhpWN+2vDrXzqMBiJK7GisoPKPrgAZUgADgUAgGACBQCDwTjQARifelmpmn9QCnEEDj3yYjXcfugtT2krQS4eUFmdzFA50RIlkrS/4wQsbDDLq1XCpqpN5SzXr28JosoAEHK4u/b19iKKIdrv9jTiOj1yNqN/LmLq3wwS4kaXxwQi4Ofj9RmvN1NQUi4uLWGuPO+eWoyhCKVWX9RdFwYULF8T6+jp5nk+cdtH8PMuypNfrcf78eQDuuece0jR9Yrw6odkK43MxdtxXRj3+wtnaENgSDCpAKFmX67/4ysYfv/b6aXKT4kQH4SASCkGCywEZgzG4IuNTH/swdy7w9/1CvxBiNObUgihAbBl6GggEAoFgAAQCgcA7QTX4/0jMqBxA4tCUdAR8+ZceIYkg62cYY9GRAlEgTIHQClcaCmKOn1rhzdP8lnGVAIk04AqsACPYFPpWIl01BtDK2+MEfCz5fy5N08ejKLoiob6T2J/0t7crRPBKMwOC6L899k1/8T39cRwzNTVFt9s9ppQ64svzfdiftZZ+v8/58+ef2tjY2NLqMv5Yfj80xrC0tMTGxgbz8/PMzc19LYqiy0IE/b50dRkYY/u8UhhjUDpBRXDuAr/8w+dfZ2lVYOkSRSkYizMC63Ql9SUMB+t0W5bPf3ruf4oZDQtwrjH9r7z8uQKBQCAQDIBAIBD4qRf/FnCSEgdSjoIBMmLggbu59PGPvIfBxkWiKAER4aRByhIpLThDbh0bheL7L57l0noV/iecQQqLKzKskNVldLhXTiKcxAqLkeVts6m8gIrj+HGt9TUJ3u0E/9v1urcLA9ypV/1KDIF3agjfrWIA+G3tBbgX3lprFhcX55IkecKvxnsTwN9naWnpK6urqwyHw+obOvYYXshLKVFKsbGxwcWLF7HWsrCwQBRFden/eM7CXvdp6RiVAviWAIsTozgSKTBZgVQaIzQ94NkfZ7z6xjqF64JQ2DxHiASl2+AsJBFtDZHr8SuPfpTWqN3fYJFaVY9rg/4PBAKBYAAEAoHAO5AqhE/icPVIbFnClIDPPLJ/rhuXuHJAND2FUoqiyKoSfylwZYlMOpxZGfDjVy4xmhGAtSVaGJS0WMAIOZr5LRFWIxy4UanvlnLfW1T4Q9X7n6bpoSRJnmgKpCsR+7uV/1/Nqv9ewuOuRJBfaSVAEP+3xj7qV+DHP4OZmRk6nc5RX8bfXOWvvs8Fa2tr86urq2RZNnGfMsaglKorB9bW1lhZWWF6eppOp/M151zd++8fu2lIbH/sqaqBGt8ANkMyR8ei0VhN6wRF6bDAG2eY/9FLF1gbprjCVWGbMgKdkg2HYHOktKRyyEce2s9H34eLqNoASq/6gwEQCAQCwQAIBAKBd5xwQI4Gb8l65Q1AOdg/w2OPfup92OEK3SSCIkPozR5inAEkRia8cOwsb5zld3JAqVH5r8mI1OgMW0gQEickwo1iuES1ynfL/wM1ElVRFNFqtb4Rx/GcL4+We5yDFjIAAm/ntvbG0aQpDVEUMT09TRzHh8qyrI0r/18pJf1+f9lXAvhQQL8fNlfyrbVorTHGsLy87CsMnkiSZMtr8ceIPVeQOFkLfyfGckGsA63JjaVEIRSsZyx/54dv8ebpDUojII2htGBAKgFmCGUP7QZMRev82i8+QEtVJ5tlaUf9AMEACAQCgWAABAKBwDv0ECxQoxPwAoUjBvZ1+NZHHr6D2GUkacLGyhJCVCuBzgkoS0SUsF4IXnz9Akvr/HcDJEK3ATClq8px61TvqgIAJNKJaiqAYGQ83NoCSwjh0/+Paq1rkfPTJnSDcL/98PuivzTNIy/I2+02aZp+rbnf+p+TJCHPc1ZXV59aX1+nKIotmQL+OZxzlGWJDxPs9/t1G0C73T7aLPs3xlxl///l2DxHag3GYJ3ASskQeO4Vvvzqm8vkRoKOGQwG4EqiTgq6amPSMqMcnOPopz5EJ4HIH/GU2jQAggkQCAQCwQAIBAKBd9bhtyr/9x6AoiQCfvM37kOaJTQW8oKpbgq2IJIRSsQYJ8md5sK640cvr7NuQUcz9LIcJwVSbPYTVyfZt+bQ7fEVVGDLCqYxhlarxdTU1Pd8GbXvh272Se9mIOwk4MZX/PeyWt98rf717tRCsJcQwvFAuWZ/+fjK8vUwDK6mDeJqqiO2a4tofvbbfQ7N24/fZqcMhe2ee7fshd22x/j9/b7YrEYZ/4zSNGV2dvaxVqtV7y/+PmVZEscxzjkuXLggzp49S1EU+HC/PM/xppff//M8J45j8jyn3W4zOzv7baVUfb1vLdj7/lGt/tuGGegjAbACW5Yk7Ta5sxRO4SSsDPm3f/Xsq5SiBYOMVqeNNQWuyAADsQSbM5PCdJzzC5854CQQK7CFRbhw8hkIBALBAAgEAoF3GA4QRFgcchSg3VGw0Obu9x5epBOXKGlxxoDJquA/JDiFkylGd3jx9SXOrfNHGdU0bycEDolzgK2GC26utFVZAHZ0gi9vg9W3KIrQWh+VUh7aTjC+XQF+exXuexXBV2pQ3IxWgd2e80ZWKbydn+uN3J5RFNHtdpmamnq8GQDoWwKaowHX19cfWV5eZjgc1iaBb4NpXvxKvzGGNE3xbQBNI+2KP6uxaiDpAKXAOqwtAUnhYAisZ/Dm6YyzlwpQUzgr2MwPMGAtCIMohnR0yS994WeIgEQD1qFkhHOSUPMSCAQCwQAIBAKBdxRm1Pdvy6r3Xxr48Hs5+cC75pFuiFICh8WaolLtBqzVOD1Fv0j5mx+9wdkVfr2kCvZDyiogUIA1IJ1FOYtv+K/TvUcmAO7m/hPQXOWeJJ5ardaROI4fV0rNjYvvq03zn3TfnbIBrudIwLcjCHAvBsNOonC3sMKrCTN8u7bN7WACjFc5SCnpdrvMzc19I47j6sRrQkq/MYa1tbVnl5aWvrq+vr5F7HujwN/X374sSz9u8BtAnY2x13wM4SaJf1n/VwkJxuCcAeEoHFgpGAKvvcVnf3LsEoWYARkh/N2crLIDpAJTos2QT37kEHfN8Y8oqmInYSVVU0A4BQ0EAoFgAAQCgcA7CEd1Yo2FRFYnx0c/8wFmWhHFcFCdeCuQQlQR/0WJlDFGpLy1NOAHL6+wlgMChCyrfD9UlfsnQNlqJc+LfTMK/xOj625FydUsrY7j+PEoih7zgmZSWfxOAv5KzILdRP61lL9fyfXXIpz32r6wl1XivZTXv9PF/04TH/x1vqR/dnaWVqt11N9GKbUl48K3BKytrX1zbW2Nfr9f77t+1F9z//dVA61Wi263+7jWek9tMbsflPy0EInwK/vCodRoeojSWAEX1/mL7z53mtVBCxF1RiMLqUYDSlUVA6gYVw5IxSpf/NzMH0oLqYZqnoAMp6CBQCAQDIBAIBB4JzEqmRUCQSX+59vc/cmfuZ9ICKTT5GaIEKZa2TfgCgc6oSDhpTeXePMcIgOkBseg6ptHYNFYJGpUAaD8Sr+wGOGQTqJu0QprKSVRFJEkydyo/P8yYTtJdF2NgN/JHLjaCoOrFbk3Qvzv9blvVBXAdibD9ay6uJlmgNaasixxztHpdOh2u99ujvZrGjH+99FowEeXlpbq0MBxA8xvH/84nU6HVqtVHVUaQYNXfkTyolyD09WwEQeSkkrTm6p1KdJkFp59fsAbJ3NwLbCquogYIROcVSA0iYJyeIpf/oUPk1DFA0jMKPw0EAgEAsEACAQCgXcSwoIzREpACR9/hJMH9kk0DoHG2AwnTRXZ71S1Yi8V633Lj158k5UBVZ+uAGsNDoMxFmMlzgmUA23tZqmvtCBtNQPcypveAjBJRI1W/ufSNP2a7/2/UQJ+L1UBuwX+XalQv57VADvdby+i/loqAq4Xt5Pw3yngsLmyD5AkCbOzs7Tb7S1p/ZPK+3u93tNLS0uPDIfDOjRQa10L/OY2staSpindbveYlLI2AK54EoBrTgwRCCeQo/eANThX4BwUpsQJiQGOn0A8++NTbKwXOAuCGIzAygiLgqFBSEk76fPQ4Vne/15cmUOiI1wVfxoIBAKBYAAEAoHAO8kAqOK2XemQwKNfeBApNsjzEms0KEfhBlA6kDE4sIOM0+cu8cMXLjEAiNoYwFgQwgGyCgMUjCoL7MTAP+HkLfEPwLhwUkoRRdFjaZo+7lf/JyXlTxI4IQNge4G63e1ulQyA20387+WzM8YQRVHdlz87O8vCwoJLkmTL/tuchCGlxBjDxsbGs0tLS/R6vVrUj297n/gfRRHT09OHoijCObfnDIAqE8RWOaGNh5YjM0BQteIYY3BUbQAWR2ktTlZhgH/77HHOX1ihLECqBFNIjFU4kQAxlIZEZUwlGV989P7KxBQlYAkEAoFAMAACgUDg9jrhZ6yPXoxfqYEIQYSgmXrtV9oAHMLBXQv8o49/6BCxW6cc9nG2pK0FqjSYwgEJzklWeyUnLxa89GZ1Gi2UwlnAUYV2VQ3/CNTmAABhEViag7fdLdB2PUlMSinRWh/1o9D87cZF+riA2qvYv9Fi80b2t9/Ivvzr8Vy3e/DfbtUWRVGgta4FeafTYW5ujlardWQ8ANP/7k0vay1LS0tifX2doigue3yfk+HbANrtNkqpLZMArvY0sBoJWPX+SwTGVDklWutRvojAKUUGvPTG8LnzywVlGYFuUxauDiOkPYUrSzAbJGqNL3z8IeZSsKXBUV52MBUTX9v4JRAIBALBAAgEAoGbJP79Kamo0ve2nqcKgBRBF0kLSbR5NQqBIkYTW0ci4Wc+2v3DbpQRlT0ilSGKHvQH6MzhCgW26v23yTz/n6dfYFWAUJBnfRCgJDhjUM6gZHUSnylJpiRWGCQFwlqUtRgBhbx11uB8onkcx8zMzBxrt9uPlWW5RRyNj0RrhqhtFwg46bqt95E7XpSKEEIBVUuFEKq+gNwSujaeVTBuQOw0h367VoDxEXDjArP2mpwD53DWgnPVrijElkvzdv7v/v5Kyst+10rV1zX/1nyu5t8n/bzbZfyzmrR9Jm23620c7OVzmXRxzrA5/m7rRQiH1hJry2o4h6wqdBYW5rnjjgPfU0rUQt/vz97Y8oZXlmWcPXt2fmNjo17tN8YQxzHOOfx3xDmHUoqpqalvxXFM87uz4/t2EuE2hbUTtrpIg5MGi6G0lYkhkJjCIp1EOEdpDX0JZ/t87vlXL6LTu8j6ghJB2k4o8z75yhqi08aWfUS2xAfvTvnVT+NiDVDUp6GicTzdfNmSym2Q1YEOVX8vLzNeA4FAIBAMgEAgELg1TALJ9tOuJcJVNQLKwtHPfYCWtsRS4PKcOIohB2SMRJINc6xs89zLZzh2Nnu276BqHLDgqtCuKtm/EiBOgBESIyRuVAGgXJUH4McB3gpVAH7FMooi4jg+IqU81BS5N5Nxgb9FfAtBHMd1ybYXZ9tNKrhZxop/D6PWCqIoqlelm8bFdkbKT8N4vpv2/R8zMUbVLbTbbWZmZj4xXqHSbHHxUwGKolheWlp6dmVlhTRNSZKEPM8vq44Zjc18LIqia/zcxs2M5umiHJkGo1sqWBuy/OOfnOLk6R6GGK1jXJaDM8StBDfoVd9vJTAb5/nVox+FArTwz1V9r6RrqHrB5mhCb9SJpu0aCAQCgWAABAKBwI0Wro1TZIesRLivsq/P6QsgG/23qLL8BIDBYUeF+nDoHv7sk0fuR1qDKSTSyGqJvoxAtpAaSlvQs22e+cFrnDrLIz8tssyLnZG4ecLPSN+LgLnSEMCmsL1SA8DftxnC5kuzvbD212VZRpZlN90IaIbQNV+7Hyu30+r6bp9BMAaubl8frdSzuLj4jFLqMrOlmQfg96elpaVHlpaW6vv7yQL+dj4ocGpqina7/fiN+nyUgryEn7yW8eob53FOooXE5iWxrDJMrCkQIgWrKF3Gz3z8/TxwF3/dFt6s3HosnbDRwNnGMTVkBwQCgUAwAAKBQOBmndALf146GuTnNg0A4UDWBkCGHa3Kb65uVavyEvjSF/Z/thOvY02JzR1at7FDC2UChcJhEFHMG+f7fP+lFXoOdKSwPyUaTClFkiSPJ0nymDcArkSo70Xs7xT0t5vIbQYPehHtS7D9YxljyLKM4XBYl2Bfy2i+64HWuhaVxpi6QmHSaLndzIqb/V5uV8Hf3Gf8f9M0ZW5ujna7PVeH7I0+F79trbVEUYS1lizLWFlZERcvXiTLMpRSW4wob+aMxgF+42rHAF7Zm5M4B1LB+VW+9OKxC2QZozYBAVLgsnVUrIGEbGCJ2gohevzGlx76ZGKrov7RaJPmoZPaFaiF/9a/hukBgUAgEAyAQCAQuHkIfyiVQFSV4Tt/cC2BAou9vAEag6RkWsEXP/seZHYG5Uoi3YESpIjBJjC0VXm5jPjbn5zmldN8sAScULfcGL+rEUhSSr+C/lhzRfRKBcxeRv9dqQkwbgA0w9dGpgVFUbC8vLxx8eLF3+/3+38ohCBN03ou+80Uy82WhObr9u0Anmag4iQTIIj/7feP3S7jBpJzDq01U1NTzM7OXvL9/D44z38H/O/+v1mW8dZbbz2yurq65bNrPr7WmjRN8dMA3m7KsjrCrWX8/557+QxLywNsCUJGMByAyauDoUuwRqFiyLIL/PJnPsQ0IwMARj/phvCv98xtLsEECAQCgWAABAKBwM0Q/lvSqCQCjURffmD1pf9bzlotGsN7H8AduiOhJTeQGJAas9EDFUHUAhFjRcxqv+TZn5xiaciPx0Xb7Uwcx6Rp+pjW+uhehfluRsBertvrYzXbALx49tt/OByyvr7+R+vr64eNMc+2Wq3fmp6eJkmSelW2KZpvdDuAMQaoKgF8NYC11veW1y0Ck1aMJ40ODOL/Ck+wGrkRze3s8yP27dtHq9Wq9/txw8AbOFprjDEsLy8/e/HixWezLLvMVPCXNE1pt9uP3agWgNJBz8KrJ8vjx9+4BC4BNC4vEVrhBjmUiki3yMohnRbcPSt5z904XYt8WZkALto8LRX+8Grr/4by/0AgEAgGQCAQCNz8I2gdZgVylO7f9AWsGNP9zt+yWvc6+rmHaNMjMRkKh8uGKGHBFNXjRi1QU7xxZo0XT/af3QBEEmHc7X8yPBJCc2mafs2XNTeF014E+tuZAdC8jxfvDeHPpUuXPpll2dfTNP3azMzM/+TFv3OOoiguS7O/Wdt4fJv4leI4jreYADuJ/+0eN7C3fXR83J8QgpmZGdrt9rfGWzV8ZYxf/W/us8vLy4+cO3eOPM/r2zfvmyQJ3W73W96oensNDgUCBk5wfo1Hvv/cG6yvOWx/iNBVW5QtLC53KKXJ8yFa5CTlBX75MwvVmr8P+0OPLnJLxH9VW2UbE1TC6WsgEAgEAyAQCARuqoodP6Rq5Pih1a/+u1FYoKvE/1QEn/vkg7SlQeYlsZJkww2YaUE5wOUDEJLCTfH6Wz3OrvPIALBSUVh7S6T4X6s4jaLosSiKDjVXR9+OlfJrqSxoirc8z+n1ek+trq6K4XD4N1rro9PT07/V6XRwzjEcDrHWkqbpLSNAfR+6b0+Yn5/n4MGDdWXAdpMAgvi/Nvx2b/brj2cBxHE816zOaBoAPvTPV3IkSUK/3+f8+fPCVwF408wbAFprWq0Wb78BIDGlwxCRy5T1kuXnXxxw7mLG8sp6VR6QGZRMMHVWhqS3dpHU9fjcJ9/DZiODaRw/xcRDrGj+Nex+gUAgEAyAQCAQuGnivxqOvuUktZ6rLTczrHTSARehVVr9DnzqY7h7D0hiK9AuxWUFcSQh2wBRIBIYlpZ+McULxy6xMoCokzIsi9viJHg82MyLR/97q9WiWfo/nrI/Xt48Hqp2NSJ+O2Hf7PG3tspdaJb/G2NYW1tjaWnp8MrKyleyLGP//v1uZmbm97TWW8RY8zEnXSZti+bvO828b67ON0f8KaW2pMh7Eelfi9aabrfL/Pw88/PzzMzMcPDgQfbt20en06mD5ZpVGJO2d/P1SCm3mAfN0YLjVQWT9o3dLrvd73oYUNvtF3vt79/pPRlj6s/Ai/jx/XphYYGZmZmv+c9Ra12n+vvb+scoy5I4jrHW8sYbb4g8z+vPyYt/rbWfCPCEH1HZ3Bf859N8PVdLlKQ4JAWSzMGJM3zz5dcu0p7eh80tuBhcjJaCIs/QTpJIDaLP4XumefgBXCRAUSIQaF1ZAkqHf1oCgUAgGACBQCBwS3P53GzHaIS1AEREmTkgwpYlGksEfPrjB5nt5FAaKDQYkM6CLSEGpCOXmlMXc147uUrmYDAcYiS3xer/pLFmzTL0UfDfkUlC6kZkHHgR5MVzczxeHMfEcYwQguFwyPLy8tcvXrwoer3e8SiKmJub+1Ycx7XgGhfDN2KVvCkum8LdGwLNcLl2u83s7Cyzs7PEcYwxhlarxdTUFHNzcywsLDA3N0eapjjnyLJs20A7YwxlWW4rgP3EgcDun1+73WZmZuYJnxvhvxvNSRKTsgHKssRPBfDfs6IoMMYQRRGdTudrzdyB7TIeroUsyyitweEYGljL+f1zK5CZmNIoMAoMOFeinEUahbaiMjfFBp/72X3EIzM0AsqyQOgYY/d6dhpOYQOBQCAYAIFAIHAjqROrLZJyNMxq0wqoT7lFBE4jkGhKEuCuRR7//CceIpFDygKsjRBOVkdlY0AICukwUcQrb63w2lvuszKqHtSLzdvJAGgKeyklSZKQJMkTSqlDTWPgRhoAwJay6/GwtsFgwOrq6tNLS0vi0qVLT2ZZRpIkzM3NucXFxceiKKpL6G/W9h3/3b92X/KfJAkzMzPMz88zPT1NmqY0Ry1GUVSbAPv27WN+fp7Z2Vmmp6drY8Nvp2bFgRepZVlumTbQfB3vdPZiBvmWjE6n8zVvAPjxf9t9n3yQ49LSktjY2Khv6z8PbyxEUbRl37ye1RP1d1YIlJYYJ1grePnV02tc6itK0cGUEmctWIuwBlUqpFHgDE70+dzPvY/EQQpIMgQW50xdWeVGR9Ytp6qXhakGAoFAIBgAgUAgcKNNgPqHSvo7qv58W7cIVIfaCEdEiQI+87HkG/cuTmF7azgnMHUAVlzd0UhKK+mVkhfeOMOFAX+hI4mKNc4KnFC3RRXAJLExGqH3RBRFR3aqEni78avkZVnWxoQQgjzPWVtbe3ZpaWl+aWnp0bW1Nay1zM7OPnbgwAE3PT29pcR9Uqn8jXgP46ZF83n9XPj5+XkWFxeZmZlBKVWvEvtWh6aoT9OUmZkZFhcXufPOO5mdnaXb7ZKmKc2gOv/43ogar3y4XQyqm/V9aLazALTbbaanp5/w5f87mTvN/W0URvn1Xq9Xl/l7Q0ZrTZIkW0Zr7mQeXdUJpJQIUT2vUJo1C88fX+GN031y08YJWaX4C4dyoAyIUgIOK3IO3dvlfQ9UcwMUBQo3Mj+p+6kcEhdOVQOBQCAYAIFAIHBLMFrq3zqmqmxeWV1s9TdJhqSq7n/0Mx8kKjOK3gCpFUYInHFQChAphYkpaHNhecgLb56gD5S5JRYRJi+5XaYAjgtTP4M+iqJ6VNn4aqcXkTfKBNC6ajrOsoz19fXllZWVR1dWVh7Z2NhY9snqc3Nzj83NzX2r0+kghGAwGFwm6q6XsLpaMelNjDRNmZ6eZmFhgdnZWdrtdt3j780OL+DGt/PInKHdbnPw4EEOHDjA/v37mZ+fZ2pqijiOgWq12bcaNLMGmq8lsLsZ5rfj9PQ03W73CEBRFJfdZzxnwe9na2trTy4vLz+d53mdG+ArCdI0/Zo3bnZ6DVf/3XY4UyJGbTMZ8OppxAuvLtPPO9XqvSxBOHCKqNRgJEZISgztJOdXfn4WSVUFAKPbahoZJ9UgwGACBAKBQDAAAoFA4CafzW9eNotU7Wj9n7HYakeVdJ2jgXffj/vgew4is5zIaKwUFFhsAQwdiA6GFCvaHDtxluNn7JMoyEtQVoNTCKGqlMFbXPA0x+c1eusf973/zRXPGz1z3vex+5XT1dXVrywtLc2vrq4+PRwO6z75hYWF7/mefy9yx4XVePjdjXj94wbKqPe7XvX3Pf1e+Esp67JwnxswafKC/zlJkro9YHFxkQMHDrC4uFhXBnix73v+m48Z2L0Vorm9R5/b95IkoaxT8ycbTP5+UkqGwyErKyuPbmxsXDZ6stVqHYqiaG5SlsA1f7eFxcnR47iqosRIWCvhJ68tsbxiRqNKR2aGk+AkykpyFEaCsht84dMfpQOjsaiWNE02q6pEOFUNBAKBt4OQtRoIBAJXfRasR+tTTVegsfJZtwBUFQBqdND94i/MM9eV6A2AhMwWlBRIkVBkhihJcC5ibcPw7I9f4twaX5cpyJ7AZYIoSjGYrc91ixoAvszeC804jg/Fcfz4dkLEGwXj88/fLgMgz3OKonhqMBh8dTAYLHsR1VhJ/3a32z0SRVEteDfT2suJgu56iay94sv3p6am6Ha7dDqdWug3cxeaK8TNEvTxsD9vZHjTQGtNHMd0Oh2MMeR5TlmWrKysYIyhKAqKorhMuAa2/17444X/fiRJwvz8PBsbG9/I8/yr/nPZbqpDs2UmyzJWVlYOSymPTU1N1e0dSZKgtT4qpXzq7fhchACtBcpZrAMRSYS1vHxsnWMnlrln3pGIIVK0KxFfAlLgZIRRBumG3H/nHXzmE2337/+mLwSVUUWzdUpInJNYJJJQVRIIBALXg2CrBgKBwDUcPqsiAFv/z/f/VwpzpNFliV8JSyUc/cTDJGYVrAMnKPMChUAohTBVfGDpIk4tlfzwZUOvoFoxEzElJVoprCluj63UCNUD0Fof9av/46uaI2GzfCNFZK/Xe3RpaekrKysry0VR1On/Sin27dvnut3u0SiKLhu/l+f5tuLOr4rfCHxVxdTUVB3glyQJQL0inKZpfV0z76A5wWBcWE7KFdBa1zkB8/PzPPjgg9x///3cdddd9ThBPxIxTAHYmwHVXM0fGTiPJ0lST6Zofi6TxiRGUTU6b2Nj4/j6+vqT/jGttf7zPfJ2VaS40o6eKycvcowVWAnHzyBePXmJolC4UowSUd1odEn1OjQO7SypzPniox9CAy0FZVFUB1XFliRVR3UMdLLhDwQCgUAgGACBQCBwwxAWlAVp6/NUg91cozIgSg2lRseMAq3gY4/gPnDXDO18GcoMWm2iUtAqgH4P3Y3JNy6QFTnPPL/E60scKCUMy5ghApVohvkGSFu9hltc/PvScK017XabJEmeGK1MLzMKCMOnf2NRSsxJCdaW9d8mXZwzKBUhZRWe6JzAuarvQgiFlHrLdSCJooQoSigKw8rK2pNnz54Wy8sXnzamII41SgnyfIjWkv37F9a73Q5RpHDO4JxBCFdflNp+vJpfbd8uBd5fN2n6QHMVvpnm78V6M7RPSE13epb9B+5gft8iOkooSktRWqwT6CjBOkFpHAiFsbC8ssYbb57klVePsba+jrEWhMBYi7EWpTVSKYqyREiJVAohJdY5SmOwzmGdw4z6/OM4Zn5+nnvvvZcHH3yQd73rXUxPT9fjFL3B0DQRfOYCQux4aXTZTLzsNHZxpwT+Se0Ok0YeXk+TZtJFSjCmqPdzIRz79y+wf/+CqwwmOwrZg8qjsVhb1t8Vv42llBRFwdra2tfX19fJ87w2Yaampp6Ympo66k2pZpvKNb0nJ7GlQAClBBlDpNpsZJIsgf/84xO8eaKP0guUhQUpqjehNLLIaBlHlIMsenzqEwvMdviA8Kv+DsggdpB4sS9sNStQVd/mKJgAgUAgcNWEFoBAIBC4aqqwPyfqxfxanQgkMSklGWVZojWIAj79yffTkQXSi8phDnlJ5ICygFIgtWKlP+SVt1ZYzjifOwlWgxhVGGBQupqxfavjBe5I+B0VQsyNRNHctc7zavY8j4s6LzZ9ZYExhn6/T1EUz/Z6vUf7/f6yENUYvKoVoERryczMzP5ut3ssSZKpvYq7KxWDnmZC+/gYPecccRyTZRlFUdS5A80cgunpGWZmZuqE/0mGhF+Rv3jxIidOnODEiRP0+/2ntNZHV1eX5w4cOMAdd9xBp9OpKwH86v14BcAks6NpWDRXrVutFktLS/Vj+deX53mdRVCU5bV9+0bZBr4Kwo8m9FkEt9Ikgu2mYfjX6s2SOI5J05Q0jbeMV5zUv+8NNt8eYK1lY2PjEaXU9/znOTKanm3ub94IuNZKG6UiBA7nLMaCRuKIWM0zTl0yf/zW2f6X3n93lyhNcMZgnUUh0U6gLRCl9PM+s92Yz32a5/7n/4AQlDgHSoE0W4+zTcXvbb1QZxIIBALBAAgEAoEbeFYv8X34W0fySUBhyLG4KtxaQieCn/vEQzi7DFYipKTMMpRkUwuXFhPN8Ma5NV46dvJc34BUEmcdQlQrgDiHFBpLeUtvnknhf1LKOS9eqpXMq2fSjHMvnpuCqSxLBoPB04PB4KtZlh3PsmxUlSAbZoGk0+kwMzNzrt1u70kg7SXgbafr/HOMi39/u8o40rWI94nx7XabdrvNwsJ+4jiu+/W9aeArBZxzLC0tce7cOc6dO8f58+efXFlZ+bqvyFhdXebcuXMnLly4cM+dd97J4uIiU1NT9Qp9M+l/fLzf+Gv3LQWtVqt+jVmWsbGxUYv+pmC9HqvszjnSNMU5R5Zl5HlOmqYopciy7DJD5WoMm2sR+Lvdrrk9/O++nWN2dva/vXjx4u+Ot8k0928hRB1k6UcIrq2tPSuEeDSKom+3Wi201kgpDznnnvUmjM+xuDYDQCJ8nb4vRlIghKJwcP4iv/zCsbPuIw/u4552G2f6OFcCGukkOAXW4qxFY/jSox/k//W/PkcE5A6cFdUUgbqmym6JPBlLWwkEAoFAMAACgUDgBoj/uiF1tEJVr/5XfbklBiltvZr1kQ/g7t4fY4c5ykqQGudKIqHAlICjQLKWR/zwpZO8dYmDFtA6pjQOLcG5Apy8LcYANhPz4zh+zI/+8yuW19rq3wxJa4o7L1ZHSf7Hsyz7+mAw+Gae5/WKtA/xsxbiWDM3N/dPO53O73nxfKUCabcJBrsJz0l99/51+NeilKLVajE7O8vMzMyo/aGqhDDG1KvgWZaxtrbG2toap0+f5uTJk4c3NjaON0W8tZbBYECv17v34sWLnDt3zt15553s37+fffv20e126/J9f3ufH+Cv9+ZOM1DQ/y2OYw4cOIBSiuXl5bonPY7jOjjwehhMXjhHUVQHFG6GNNo9b//rLfzHTaid7ts0fZRSfiLA76ysrPxuNVLRMV7MML6/ebNtVOnydBzHT0kpH4vjmFar9Y319fVH/Od1JYbFtu8bsM4hnUa7rPYvdRxhC0W/MDz/xoCTlwruvnMG7BBBCQiEUDgnKIuMJEkZ9jf4yPsOc/+dz3375bM8SiTJczla3XfVY48pftv4/0AgEAgEAyAQCARuCAKBc3KrAQBI9OjU1IC0SAuxhd/40oO05AqR1pBJKEuwFpSAvABrMTLmxIWS7798idUCiBUOibMZSpbYqiEWY0E5eUufBHuh78v/m6vG1yPoz5d/jwtnX1a9vr5+uCzL4174NycMVMJVkCSabrf7S91u9/eSJKlXZH1/9bWK/+0eo1kdMT46sJn67kVsq9ViZmaG6elp4jhGCMFwmBHHMVEU1YJ3eXm5XvE/e/bsV7IseyrLsvq5mqJYa1UbCGfPnhVLS0t0u93/9q677vodbwa0221arVadWdC8vxoLeGwaAQDT09P1+1tdXa0/L/9Y4jqU6K+urqKUYm5uDillXXHQarV23M+ar/t6iv/x68bH+TV/blZDND+bOI6ZmZmh0+l8otfr/U2W5bXx0jS5jLF1WX/TgDHGsLKy8hWl1LH5+flDnU7nSBRF9Pv9LVkS12qK+JGnCREGgzEFMoqROsUUPV6/yB+9cqr35Q8cWmRKa6QcgLVVpkQpUHGVgxAZw1xH8aUv7D/66r88T6Q0uVMYyuoYit1iAFhCgFUgEAgEAyAQCARuuPivgqodk/pQRdWfqkYr9Rbuu4tvfOFTDxOZ8yA0GFcF2QlHHXwlY3LX4pWTq7x6nt/rA4UQYExVLotDKhBRgqtjsm9dnKt67JMkOaK1PrqbeLpSmqXp1lqKomA4HD45HA6/nueVaGrOuh8P1mu320xPT/9Zu93+rDcU4jgGIM/zzbC66yj+dwqr86+1ebs0Tel0OnS7XaampkjTtDY//Mi3sixZW1vjwoULvtT/q6urq9/0vd6+v3xccI5vk8FgQJZlv9vv93/37Nmzf7Z///7P7t+/v075T9N0S7Cj4PIpD+Mj6qanp30ZOpcuXarbAZRSuyZA7LaP+FaG4XDImTNnaLfbdZZBnudbSub3Yspcj/19r+Lfv37YbGVpivhWq8X8/Pwzzrn35Hn+8qTH9lUhzcfyRtBwOGR9ff1wq9VyURTRarWO9vv9p/13Msuy+r7XchC0gBIa4Sy5LbEGlJDkAs5u8Os/fvOS+7mH7+TQgkIpR9UP1a7etxaUWY+k1WGQrfKlL3yU/+Ff/q8UWQ50q9CUkfgXgKsPd7I5ICAQCAQCwQAIBAKBG4MCzIQsaoHDIcBWJ/ZawGc+PvP4ga5Ab/RhWIkfIQTO1pnmlGhWMvjha+c5v8H/KRfV4ytXFQmMAttRkaI0VbL9rW4CjELNvqaUOtQUt5VIvEb9sTmSbznP829mWfb14XC47MW/L533Zez++X3Y2sxM90edTueDWus6aM8Lsr0EyF1rBkDz+qZw9n3/SZLUIX/emGi+ByEEly5dqlf8l5aWvrq6uvpNP6Kw1WrVYt1vh+Yqsi/r90LSjwocDAasr298btQa8G8uXbr05bvuuov9+/czMzNTj55rCtjm629WMviSdv+6V1ZW6vDG67EC325XYvL8+fOsrq6ysLBAp9OhKIr6/dyqGQDjFRnNbSelZGFhgSzLvrexsdEtG4GJ498jf934+xwMBly6dOnRubm5b7darW8opQ5fr/wFW7k/WGMRzqGQOFdgnEOImBzFxcLw49cv8dbZNe6ZaaMScDZH6DZSyCrLxBooCxQ9Dt99kE98GPcnP0SAG006GTmsDhSyzgUI4j8QCASCARAIBAI3FHnZb00hPipSdQIloB3BJz96H6K/TGRKskFGkkzjsiqxXJbgrKJXCs6vGX5yYoWLJZhY4qSqV3BdabB2tGJYuNtiDpbW+kgURUebJe/XQ/wBZFl2vCiKpwaDwZNZltWBaF7gN0vO/Sq3lJJWqzXX7XaPtdvpnC/F9qLW3+daQtL2KrAmrUwrpUjTlCRJOHDgAEmSEEXRljaHampBzvnzZ32y/+H19fXjzdnwPghPKUUURfX794KzEoKuNgR8BYXfXlFUBQ9euHDh1y9dusSbb7752/fee+8fHD58mDvvvJOpqSnM2PZtithGAj1CCLrdbm0arKysVK/jGoWoX+mP45iDBw9y4cIFXn/9dTqdDnfccccN28evdT/x++V40N/MzAzLy8tTSinKsYkJlaGjLgu/9NvbT0RYW1t7ut1uL8dxfMjnQ1w/I8ThrKlS+yVo4ShkAUQYNOvW8OZF3nN2NX8pM11SAdYZlJQgqtop2UqxvT5xt0Xi1viVL9zHf/7hG2RkGNdI/3e+6kpgbgPjMxAIBG6fc9hAIBAIXNEJ8OVn9VWUH5QIIJHQjeFnP3IPLS0oexlJpLDFkNLkRO02LjcYYlw8y1/98FVePpkJqyKc0ODAjuZ/S1WN0jZ5cc3i6XowHgDnhYkvZW+1WsRx/LgXmNba4+Mp6JNCycZFuzcOfCm5MWZjOBz+4fLy8uHV1dUnB4NBPdrM9zc3+969MJJSMjU1dWh2dvZSt9uda66Ij69gj5e0bzcK70qFYrMtwZsVzeqEVqvFwsICd999N0mSbBll6AX1uXPneOGFF/jLv/zL+VdffVV48e/FvhCCoii2lIf7z2hcoDc/v/EMgmYewsrKyn///PPPiz//8z///e9+97u8+eabFEVRBwM2t4sPo/Mmihev3W6XAwcOsLCwUPfoN7eL3x4+3b657Sddmp+VUooDBw7wrne9C+cczz///D87f/48/X5/y77WvE+zbN63NjRHLm73vE0jZScx7W/nt8+kNonm/je+7aSUzM3Nsbi4uB7HMUWxWa3R3GfGP1P/OP57t7KyMt/v9785MzPzRKvVuj7l/1S9TUI5DA5jC4SoTipLV2KlhLjFesHLPzl+mqGLKJGodnsk/kdN/WWOjDSUfRLZ47Mff5i5CGKKzbNUsXnKKpHEURz+6QkEAoFrIFQABAKBwFWe/lansW6CF1CJ/whDbODvfAHXjQbYjQ0iEY1O8h3WgnMGkaRkA82JpR7PvbrEag6ZjOpnAIsTo59Edf4sxChc4GbaHxNmlI+NhZsTQsyNrl8eF0tlWZ6UUt7TFKPjj9F87CzLNnypf1EU542xtbid1NvuswF833O3232s2+1+qxJTBVrLt227jPf1+9fUFF6+f99aS5qmzM3NMTc3R5IkdQuDf7w8z+n1epw/f55jx45x8uRJkSStLQK8Kf6uR4XFuBGS5zlLS0u/WxTFU2fPnn3mfQ8/zMLCAouLi3XFhRfUzT5zL66jKGJ2drY2Bcyo6mBzKoSre/ebj7fb/udfq++dn5ubQ2v9e6+99tonZ2dnn7nzzjuZn5/HOVcH4U1PT9cGRpZltcHkDZPBYLCnDIir/c5M2sbjlTHeRJuZmZnq9XqfKIrib7zxUFUN7Pz6mtkYeZ5/Uyl1RGu9meFwDSaiBEw9AtVWOSij1XrpLEYoQLKWw4kLG5xe7rO4fwrMCggDsRoFoFaNVEiIGbKv63j0U/PuW396SeQOzCgiRQoQpavM0KIM/wAFAoFAMAACgUDgxlsAxktwd7k5EFESAS0BX/r8h0npUwwGJDpBlJUwUkKSDUpSPUOO4PVzS7z4Or+fCbB1yJ8BYbHNwVfCIhG3RAdAs2/Zr3b6HvY4jh9XSh1p3HauIW6WR6bAPU3zoCmWmyvUeZ7/0Sjg7+WiKEYCObpsZbXZQ+1XQaMoot1uH+l2u9/y/ei+T/56CP3dTAC/ncaNjrIsSZKEdrtNu92uQ/68GPbvYWNjg1OnTnHs2LGT586duzfPS5QS5Hl+WQn4+Gr+9cIL+TwvuHhx+W9WVlbE+XPnuOOOO9zhw4e57777WFhYwJsrvV6vrmDwoXRlWZKmKbOzs7TbbU6fOcPq6uqWVXq/Kn+1ExjSNEUpRbvdJsuyZ9bW1n7/lVdeWV5cXPy9gwcP1iGKvV6v/jz8ar9/bqiyK+weZm1eidFypRMJfCjl3Nwcg8HgmSzLxGAw2NPr8tvTOUdRFAwGg2fTNF2OouiIMebZZoXI1X8Bqv8YUQl0qNr2/bEKFZHncOxs+cyxM8uf/NAH78dlPZAgJFCODABX5QGAZTa1fPnRj/Lv/vRpBq7KP0WCsSBHvQCOqn3FhSCAQCAQCAZAIBAI3Ci2pv/by0wAMTrAPnwf7qG7FonsMtqJ6kx21H0lVYwpMwpryOhw/NQ6F3r8rtPxZokBFihxYvR8TlYVABjcTXYAxgVwc+U+iiLiOH5cSnnIVwAIIeYaAnhZa/3BkfDaGAmhqWapdlmWFEXxR6Nwv7/x8+6b6fX+56aJ0DQkRsL6a2maPuHFqDcFnDPXdRtM2h6TXl+z3H9qaoput0scx3VFgO/hHw6HnDx5kmPHjnHhwgUxGAxwDqKoKvUfDvN65Xs78bezeN5dXPtqAqXUKChwM7iu1+tx7Ngxcfr0aV599VV3+PBhDh06xL59++h2u2RZxnA4rFfmvenhH29xcbFua/D5A5PE+G7mU7M03z+GEIL3vOc9vPXWW7/z+uuvHzh+/Ph/MxgM3L333lvlF4wqR3z5f7N1xRtYu5lEexkDuBejYLu/+X09jmNmZ2fp9/v/Js/zXy+KEqXknvZN/988z1FKHY/j+EgzCPKaTKHRyy5ldbzzsaTOgRAOITVoOLPMz/7k5EX3i/lDtEQLQY4w5aifyeKExuQlWjiU6fOBB+7ggX389QvL/Gxem55ghSUSGmNLhBMhCDAQCASCARAIBAI3kDqcarTi6kZ6XWx6ATHwi59/gPk0IbESJxzOlAgVMRzkxNrghKRfWlaGhhffuMCGhUzYzeArPwJLgHUaiaxOvIXFOm66CeCF2FjpP1EUHVVKHWoI4blmBcC4GSClvMcLE2MMZVk+l2XZ17Ms+9dZllEURf3444K7mULfFFNe/E9NTT3hy7m9SKzuc/2NkHETYLwsX0pJHMfEcczi4uKW2/j+/X6/T6/X46WXXuLChQvvWV5eeVkISJKk7u8fDocIoSYaDLsJzqt5f82AQP+aW62qBaHX6/Paa8fFmTNnOHnypHv44Ye59957mZ+fJ8/zLdMCmpUKSZIwNzeHEILl5WWGwyFXklLfDM9rZhY0n+PgwYMkSXLuxIkTf37q1CmxsrLyiXe9613P3HnnnXVQnm878MaBbwG40hXyazEEJo0J9IaQEIJOp8Ps7OyXNzY2KIqNPU3RaI6BHFXRIKV81u+H1/SddwASB5TSVnknFqSr2pSkA5uXKJmwkme8dGKJE2f6PHjHNEqvU5h1oiTCDAtkKyHPDBqJyzeYjlb57MejT770xwUaKHR1mDXOEmuLtKCkpLAmmACBQCAQDIBAIBC4kcpXgrAIW40ELBvmgHCVAfCzH32AyFpc4SjzAqUEQrUwJiO3BVHcoRgq3jq3zEvHsz8eApmxkEpUWSKwIKuTaofGoNAiQzg7qqO9ucK/KTz9arQv/2/8bXlc3Agh5owxG178e6FSliWDweAfZ1n23/sebb8S2jQIjLEIISeKX/8a5ubmjkVRdMjfrykWy7JEXsfNN8kEGM81GE0goNvt0m63SdN0yzaz1rK8vMzJkyc5c+bMc6dPn/6QT+T3YrAoDFIy6pG3W7bpuAFyPVZ5m9t3XKj2+wPiOKLTadei+dVXXxWXLl365wsLC//4E5/4BPv27atX3Muy9PsGzjkGwyHtdrvutb948SLD4bD+DHcrdfdmTvP9Nj+DPM+JoojFxUWiKPqslPLE2bNn7z127Jjo9Xruvvvuq4MT/fv0j/l2if9JQn/89+Z+7E2NKIqYmppiamrq3wwGg18vS8NuL9EbJN4gM8bUZodvL7mGPQPhZGVASonDgq2OexJwCIS1iCjC6ow3L3DuxVfPHrjvwH1EOse6AThJ6SCWEQg1etSS2C5z9FMf4P/xx99nHVBKUlKZosOiRIV/eQKBQCAYAIFAIHBzFLA/Fd4Mq3ZO4xOy3/sA7u7FNq6/Xq3WO4NQGlsYIp3iDFUFgHE8//Ix3lrhlyUgpARh6rA/K/xKvwKngQyJxQj/7DfPABgP7RsJqqNa66PW2uXGbeea4njU770spbxnJOo3hsPhU6NV/7rPf5KwmySc/G211rRaLdI0/Vqr1To0qT2gORLweon+SX/zr8mv+rfbbTqdDp1Op+6Vj+MYIQSrq6ucP3+eM2fOcPbsWbG2tsH09BSDwYA89+F6kjSNGyXym9UF45/J9TY1xv9blfHLLQZNVZ1gOH/+/D9ZXl7+J6urq2ff/e53H3jooYfYt29f3ebghajf/nEcMz8/j5SS1dVV9trnPqnSovnfNE3JsgxjDNPT0zz44IP3tNttd/bsWXH8+HFRFIWbm5urpxL4cDw/RtKPzLtS4b/X2+5WBdAM6nPOkSQJs7OzXx4Ohw+trKy8vNfvZ7NKpiiKa97vYST06zL86ggora0qA0bGpHICjMMquLDCB3/80olzn/zg3ejEoaXEFQVCanJjkTqBrA9SkqgBDz9wF+95F+7Sm4hhZiGiroqq9nkT/v0JBAKBYAAEAoHAjabcUqZfTaeuxH8M/OLPLzLfGSJWB0ihkHEbIaG3OqDTmqJ0hkFpuNgT/PD4OhsASQdlS8o8r3tsraMxCssinB2dgDMyAW4uTQNgdDkkpZwry/JZX/o/Pu5vVHJ9T6M8+Zu9Xu93m+P7xoVM0xCIIsUkjRhFEa1W6xudTudxn6TvVzt9qnyzbP56iuRxvMmgtabT6TAzM0O73a5Xl/1ItosXL3Ly5ElOnz59YH19/bxzjjjWrK9voLUiSaL6/TeT8YWQE8cnThqteLU0R9g1haQxlkgrjKnCKrSuqhiU2uylP3fu3MGVlRVOnDjhHnroIQ4fPszc3NwoSyBBSEmVa+Bot9skSYJSivPnz9Pr9XZ9bZPaQZo0g+78c9x1111IKd25c+fe88Ybb4iVlZWHhsPhS4uLi3Q6nTqDYC8hkVfT77/b7Zs/V5Mq9JZ9aVQF8L319fXubk8zPmHAP45vDbjGPQPlwApvf2oKYYl8SxQGRMmwzLBSstS35196c43zKwVpYphugXMCqQVlMSSKNMNBTtrpgC6ZVYKPf/Bd/PDkm/TYFP5pqiiGZjSFIBAIBALBAAgEAoEbiQQKkEwRk1JyiXYMLoeDbeZ+8WcfJO+9wnzcBaspyghXOKZiDa5EkWNlm5fO9Hl5iec2gLwoSVKF6/fRaJyQlEKP2g0MiOKWefvjZe+jsLejSZI8MSp5PzTe6+9v65yb01ozGAye6vV6X/ErtX7DVkFim2LTC96m6JPSjsbgVavjnU6HqampP0vT9LNKecFT/b0q6966SrybIBufSDAurqXUI0HuRuJXbRnJp5Sk3W4zOzvL1NTUaPW7EsxxHLO6usqJEyd44403vrq2tvbN6n4KcDgnUErjHBjjGjvc5a9zUhDj3j6/vbhHAiE2AwPdKOhCKYl1IJWuTSrbeJ3GViXsvf6QV187Ls6cPc+Jk6fc+9//fu677z46nQ5ZlpEkrZEBVGUM7Nu3iFIRS0tLbGxsTOzr9+If7ESB2zQI/HXeDOp0Otxxxx202+2XXnnlNVEU5uVXXnlNnD599tADDzxw7MCBA6P97PLna1ZeNFsUxkv3/UfQ/Ciqv4mx7W93NACiKLrMtErTlOnp6aler/eJ1dX1v2m+/0km2yST7voc+ixSlmgBhWuBiCgklNIQ2xxJiYzBGnBxysD2eeEMX/7PPzz+R//w6EPoXDB0PWIFqelhckMSdaAQYEGKnF/74s/wf/tf3iRKoPCbxQiUD1EdTWIJBAKBQDAAAoFA4MZQglYSW2oyLLFOKfI+beAj7xWX9nUEU9KBK8EJhIiQSLBDKAzOGgqhOHZqjZMX+dAAQArKvCCRoKzFOFmNBHQjtwGLdF4MyltiMzSFspTykL9eKTU3WnE8PhIfh5q98RsbG0/mef7NPM/rdPjm35sj/SYJ982585IkSYjj+O9rrT/bfIxroSmqJgk0nxjvn2s4HNbhdmma1r3+URSR5zlpmtJut1lbW+PEiROcOnWKlZWVR9fW1p72K7zbzYS/Lb8eZVlPD+j3+7z44ovi0qVLl86fPz93//33c+edd9bb0a9KR1FEt9ut20nW1tbqSQLNvvwoiiiKbE/PP74SnqYpzjkeeOAB9/rrr88rpZaLojj+/PPPi/Pnz7vDhw/T7XbrdgCoVuN9joOvWtnJPNrtuqv5jvnvQpIkTE1NPbOx0RdNg8TnYzQNi7cP6/2hUQCqBulNjSoUcDjMUa2IPCuRAlYy/u1Lb1zgwvl7mTqgkDLGmWFlhjoDapSsaiVSWO5aSPjkB3B//BMEEqJIkmclKSlFnbhiw79DgUAgEAyAQCAQuIFIhyPDIpGjVoBYwuc/8wE6SQtdtiGXOFulY0lJVbdvJYYW633HK8feYj2rVkxdlFBmqyRxhB1Wo/6qu2xOG7BicwTXzWRS+r9S6ogQYs45t+yc8/9dHrUFeGF2vCiKpzY2Nr5eluVl4r8p9if1nvvntLYaiZemKa1W67fTNP2aH+t2Je9hNwNgpz7/5mP4Xv9RmTZpmtZCNkkSyrLk5MmTnDp1igsXLjy5vLz8dS/YvNDcusJ9+9NMos/znJMnT873er0jJ0+e/N773vc+Dhw4wOLiIq1WizzP6x716enpelzjysoKw+FwS0+8n0qwo0Qdrfr72/n7+5aMdnsKIcSlN99889GVlZWnrbWcOXNG5Hn+rQMHDjy2f//+Lff3I/mstbUpsZ3In5RVsd3tdvt53ABotVrMzMywsrLGYDDY0hbSDJy8IeafBScdjI5PVelO1Z4kgTSK2cgzpBIMCsdLxzZ49a0L3HPwbgRDhLE4C0JHVYWTHeUGRDDVFRz9+Q/yH59/jgyQSlAiyalGqdog/gOBQCAYAIFAIHDDGFX0lqUj1haMpTCWqRgWOvzaxz/yLmTRR5QJzhqscThhqlJqBzhFKVocP7nMq2/kzzpARwnF6BzaWjM6qZZbnm/kOuC4Nda+xpL3jzQNAJ8BoJQ64lck8zx/ajAYfDXLsmW/quqFzXhP97gpMD7qL4oqYd1qtX671Wr9gR+jN0lA7VX8N6/bTUT5lWBjTC0qW60WrVaLOI7r1zGabMDp06d54403vrqysvJNf38vMP3q7fh7vp1RStUhgVEUjSYXlKyurj67srIilpaWHjt8+PC3Hn74YQ4ePEgURfW0AGMMaZrWrRUXLlxgOBzWEwSyLCOK1I4Ce3wb+gyFzc9VctdddwF82zn3SJZlzxZFwblz576ysbFBlmVuYWGB2dnZuhy/OTLw8tL/7UcwXslEgE2Dy24R8z4bI4oinynhrLWiaoOxl1U7vJ1YMcomaR4PvQFgq1+lrEw6lMZJKEzJqSXin7x+Jv/kh+9nKtZI40YVTq7KDbAWY2Oq9o5LfOyR+5hvP0fRhyIzIGNKKxC4MAIwEAgEggEQCAQCNxZ/gmtkhpQCcoEr4ROP8EcHFgyslgiTACVC5OAMzhiENWBj+i7l+z95gVPneURr2CgdzmUgoDAWLbzIvzVPdcdX/6MoeqzZAtDMADDGLOd5/s3BYPDkcDjcEtDW7LFvCv3m84yP0xNCMDXV3h/H8eNJkjzRLMW/WhF9pbf3z6O19kYEaZrW/eH+8ZaWlnjjjTc4e/as8GXp4+/N/zxuhNzOWGsvC9XTWtcjD5eWlp4aDofi0qVL7tChQ9x///3s27cPrXVdyq61rscIrq2t1Y9TGQFmR5G9XVWFMWZ0XRUOeffddxPH8fdefPFFkec57XabwWDA8ePHxcbGxqW77757bnZ2FthsK4jjeEtQ4CQT4GraAZp/9waAf+0+y8B/3+bm5sjz/BuDweCrzUqLG7P6X63AO0D4aQDOoJytJqI4UBIGvT7EHUxZUlhYNxQ/Pr7MyQsbvPeAA121RllnUGWJswIh2jgpQKxy14H9fOajuP/vXyI2AJW0KIZDhJIhBTAQCASu+ggeCAQCgatEgANTQlE6lLAIC1969N3o8iKRc0AKMkKqUbibKaEsMFZwYc3y41dX6QNCxzhjwTlUrBFKYJsa0DV9gFun/78xx/6QUurISMQsj8TbXDUarni63+9/ZWNj48nBYLAlhbwp+r3AaQqf8VV/3yc+6qf/Vpqmv6e1nmqK/+3E1/US/40xhsRxzPT0NN1utxb/XrxtbGzw+uuv88ILLzx66tQp4cvbm4F24++tOa7tdmc8JHK8ZaLVatHr9Xj11VfFd7/73Ue++93v8uqrr9Lv9+vQRGstcRyzuLjIvn37UErVFQW7mTzjhtAkc8W/pvn5eQ4fPuz27dv3jaIo8KvqZ86cmX/ppZcOv/XWWxhj6ikOw+FwovjfSfhfy9SASdtxamqK6enpx9vtdr2tmpMabuhppDPgNieUCAfaVyMIAVZgVZXx99oZnnnh+DkGfVOJeBlVgZTWIhjdXpQk0ZDILfMrn/8QLaoVq2KYgxBYE9R/IBAIXC2hAiAQCASuEmscSmuMqXpwYwnvO4R7/4OLxHaVmGQU3gdVMFY5SvK3lCheOXGRV0/x+wYoXATSghRA1fvvPQaw9X8l4JCN8v+b1wiwmXav0FoflVIe8uJfCDE3mvf+zeFw+ORwOFz2onZSSN+4YNmuPD+OY9I0PRLH8eNxHF9z4N/VVAn4S7vdrkv+fQVCWZb0+30GgwFLS0ucPXtW9Pt9P56Q4XBInud1NsCkWfbN1Prb2h5rhNL5bAa/jcqyrKsByrJkeXn52X6/L5aWltylS5e49957mZmZqT/zKIqYmZnBWsvq6uqOBsl2QYrNn5VSOFc9dr/fR0rJfffdR5Ikjw+HwyeNMctRFDEYDFheXj5ujBHWWtdsVdhp+sJeBL8QO7cBjJtazcetWgGq6ohut/u9PM8fyfO8riJ52w0AV7UhGSdwwoITSAySygCoXuvIILCAihBK0C9zzvX47A9feSv/2ftbdCIgiXCuBFeAkkgchcuQ8v/P3p9GW3aVZ7rg880511q7OX1EnAgpIpA4AhQCJAQhbAQYMAiSxg22U3Kl8b2ZdtUVt4Yzf5T9Q/xwVuW93FEDaox0jro376iCMSrtqlHOUQn3Ol2ZNmRZAptegEI9UkgKnei7ExFnn243q5lz1o/VnHV2nAiFJJAQWq/G0t5n93uvOWfM9/2+7/1GqDjlfe94I2/e9dhjD1/gHbntoy2dBxs0aNCgwUtAkwHQoEGDBi9nE+wExBBKzu3f+65Z2gzpalvUw1rIEmyaIL7wAFCaVAUcPnGRc6v8CQKj1IEOIFB5umzqoUb0y6jazyPJK93/RWS2ICk9gNFo9LnhcPjZ4XDYK8nJdu3aLvuHqSDHdVJcvk+Rbn9fu92+d7t6/xcy7rsW8n+1coT6/Tt37qTb7eaUpKhdHwwGnD9/niNHjtxx9OhRSdOUKIrw3jMYDKrOAWXEtnz9kvSXZDkIgte+QFb7TmXkvmz32Ol0iOMY7z1RFBEEAaPRiOPHj8vDDz98x3e/+10uXLhQue/HcUwYhuzbt4/rrrvumsWR+nksz1FduBoOh5UwsbGxwczMDAcOHFienZ29dzAYVJ0b1tfXefrpp+Xpp59+YG1tjU6nc0VifzXyfTXR62qfvX7Ux3gURXQ6nYNBELykzJeXvPQJWHxuUprXARQmqL5KVspsPtZJMxCNUwEJ0EtJnzu5wfpAiBODR2NFARrQeOVxPkZsTCRD9s8H3H4Lt4WAkeLVlds0HmzQoEGDBo0A0KBBgwavzPKp8pZVLkAsTIbw4fcfYDoUtC02qW4EpIiyaA2jJIYo4nRvg0cPnyXVMPBCEHYgTSFLaXVbhcmfqt4nd9XOW2yVG/CfBxTmbneJyKxzbtF737PWHhoMBvcsLy9/sd/vVyn/9drkktDXo5zl7SVZK2vpy2j4xMTEwampqefb7fbdZcT9SseVBIHtSH+dWNWN1Op/p2la+RZMTU2xa9euLSnlo9GIs2fPcuTIkUMnTpyQlZWVQ3mU2W9pzbZdxL9+vTQVvJpA8pqZIbVzXnfg11pXWRBAlW5fCh/r6+uHjh49Kv/pP/0n+clPfsJwOKwyB7z3zMzMcMMNNzA9PV15DNSzCUpRYfz811sJWmsvK0UpvQna7TY333zzl6anp0nTlNFoRBAEKKU4d+7cR5977rnPnjx5shJwynNW/87183el0oArlazUTQDrJSXjr12+/9TUFDt37vRlZsL4977S3Hj56t+mgaXGoysRID+0FJkIhVlKklpUpPEBPH2UiUNPnsCpaTIVIEaTZrk4KtpiAofB0w4U/UvP85l//F7aAH4EKmvIf4MGDRo0AkCDBg0avFqLqKB9Xk91x634ty3M0lEKF1tIY/AZkOLJSNMUpwyJC1k8u8LxizzQt5CisUX/bLzFOYso8KLw6C2R/7wNoMPJqy8C1Mz7Zos2fwsAcRx/sd/vP/BCz98uollHlmWV63kURYRheK/WemE8tfulkpp6dLok+nX/gSRJKhIWhiFhGBJFURUV1lqTpikrKyucPn2a48eP33T27Nk7hsPhaz59/+dEQJh98MEH5W/+5m9YXFysRIAkSeh2u8zOzjI7O0sURSRJQpZlVeeA4XB4RWJdJ8j1cVjW0JdCxMLCgp+dnb23FHFKsWB1dfXLJ06cuOPcuXOMRqMqoyNJEpIkqbo5vFxcSxlB2V2hGJOzpTfFKwtXNCjZtCz15J0C8GozXd9D5hVDB31L/8iZDdbTkFQMGULQmSy2pa5YNzUuSehOCjfsm+SWm/Adgab7X4MGDRo0AkCDBg0avCqIwgjvMxQxEwK/9pEFdrYtklq06uQZAKEF5dB4nLUY02E1iTh0+AwnL/LREaDIe4vnUa2saFVWbJ5zT+0iqpY/xsvPR/lrQc5nwzC8Vym1kKbpVweDwT3D4XAxjuNrJuDbkfiSkCmlSnLzpSiK7jXGXEbmXqoQMB6BLSPvZR11q9Wq6tiNMUxNTTE3N0en00FEWF1d5fTp0zz77LMfPXr0qKysrCzWa7cbvDysrKz00jTl3Llz8s1vfvOj3/jGNzh//nxVHlGei0IcqiL4ZbbB+Pm9mkFfnbSXgs/111/P3r17vzQzM7NQjoMyG2R5efnQsWPH5MSJE1y6dKnyNCjH4EsVgK6lS0A9Q6AUKzqdDjMzM8utVquaNz9r+EKEFHLzPwrS7wVsIWCKFItVoWI6C4mDvocnFkec7KVkRKSZgzAA70BZtAKs4K0HnTK3Q/OR978J7aEdFCJAM8UaNGjQoBEAGjRo0OCVg8P5DCEjxDEdEbz/9gWy9YsYMSAKtICRnNiL5H4BusuZnuPHT8WsexATIKHBe4syKq8qyDzWQ95lYDvH/1IseHVDYQVRujcIgrustYc2NjY+u7a2tpgkyYsmQNvV3Jft9Vqt1hdarda9pfN7+bgrpTRfa6pzKSbUa9Vh04OgXn4wNTXF7t27mZqaYjQacfLkSRYXF3vHjx+XS5cuPZCmKcYY2u02QRD8QqTwv9oIgqDyDlhZWXng8ccfl2984xs8+uijrK+vY4xhbm6OPXv2MDk5iXOONE0r48DtSPO1kutyXMzPz3PjjTc+Pzk5uVBmCJRiw/r6OidPnpSjR49+dm1trTTDfEm1+NfynPH766JFGIbMzMwwOTn5hVe2C0A56TbXIyuCR3KDQO8R8Qiecko6r0mAY5e447HnL5BJBKJIkxG27O0nBjIhCNu44QBhwIc/8FZCYCJqyH+DBg0aNAJAgwYNGrwKSLOYVgABcNubSfbNtWn5DIIA0jxNP3MpLnNgQamAzLd57tSAZ88QJgBBmLe18hlaLFrq9v85+RefHxUREJc7b7/K6HQ6dymlFkaj0Rc3NjbuKVv8vdhe5OPR2vL5hcv+fVEU3Xclx/wr/X1N/wBuljBUNeRl3b5zjtFoRLvd5vrrr2fPnj0YY7h48SKLi4s8++yzcubMmbnhcFilYQOMRqPKK6DBy0Or1SKOY5IkodVq4b3n6NGj8oMf/OCe73//+5w6dQpjDHv37mV+fp5ut0ur1drWpf9KBH9cSKpngpS1//Pz8+zfv//5MhOgFIWMMaU48eWzZ88+cPHiRcrMlxeThn+t4sR247dentDpdJiYmLgvDMNXqAzAjR3gERwKK6bKEFDkLVI1HqWL7hAClzIO/eipU2wkiqA9wTCL0aHKRU+rQEUQdEitw9kRb1ro8N534dM+6MJroEGDBg0aNAJAgwYNGryiSLLcu/rXP/5WJiMhdB56q6DBKcH6gpx6jdEt+gPHT44ss56QOgWp86RZjHMpiEXhc9rvKa7VSG/BAZwUGbCv8g44DMN7kyT58urq6uc2Njbw3hOGIVprsiy7JuI/TsyUUgRBQKvVotvt3h9F0X1lavWVoqRXEwauhizLqijqeP90pRTXX389N954I3v27MFay5EjR3j00Uc/s7i4KGtr69VnKjMF6v4BDV4+NjY2Kt+F0WiEtZZWq0W/3//qI488It/73vd48MEHOXPmDDt37uRNb3oTMzMz1bm4krfEuFv/lfwAjDGVWeGePXu44YYbnu92u7NpmhLHMc45Wq0WSinOnz//0aNHj97U6/Xw3l+TAHS1koRrKVsoM1jK71CKAJ1O565X6hwJLi9NYnNtyr1LypUsFwrKxyny8hpnFAPgiedX/vro8XOIDlDGQyDgDaQalIHMooIWoh3a9/id33g74poe1g0aNGjwctCsoQ0aNGjw0ne/iIdb3oL/lfcdgGwASYaNY/TkJN5BhifSUV786jUXLg149KkzJIBTCmuTvIe2Jq93FYpU2SL93yugFu6SfENNabD1KmI4HH42juNe2c6t7lJ+rXXI9Xr50vCv1WothGF4b9Fd4Jpr6l9sFkCdsJekT2tNt9tlamqK6667jizLOH/+PMeOHeP48eOysTHI//E0qkpPL9P9y5T1V7Id2y/0BqWIsJcZGt570jSt2kE+88wzcurUKc6fP+/f8Y53cN1117Fjx45KPChbT15NmLlaCUkpAKRpShiG7Ny5kyzLlpVSd6ysrByql44UmQCLWut7gK/MzMy8pFaOL7YMoBQ6yvva7TYzMzP3j0YjSZLkFTtXitL0rzAAJP8NVV4MAN4hhRmgx+NRJGjOrqS/9cOHHvO3vPE2JicF7xOEKF8Enc89AcK8xaHNlnn3O2/iup1P/rPnL/IXCrDNNGnQoEGDl7RmN2jQoEGDnHJQ6aJSj72P1+FvXp/qwK/96jzXTQnJ6gqYCL1jljSOEZuhMgcINhP6ccjpCzE/OZrIBoIoA86hBAJd1qMXptm+sLuWsX7Xvui7/XOAlZWVXpIkW1Ln0zTd4pj+Ygh72aotDMN7W63WfVrrF3ydl9PWLAiCirSXiKKIXbt2ceONNyIinDlzhkceeeSvn3rqadnYGBBFAa1WiPe+ig6XnQHK28ruBQ1eHuqiUjXziutpmlaXTz/9tPzt3/7tZ5544gl27NjBm970Jrrd7lXb35VZH9uNp9IDIsuyisSXnR327t3Lvn37HpqcnKy6D6RpWmUCXLx48asnT568aWVl5adO/sdRZrDURbIwDJmcnKTT6dz7Sp4rt7k8FT+kRws56a99v/I7Wi9YLWw4eOjpIUs9h/YdkpHNyb8xeZ5/qLCicD5jKnDs7KS8/12Tf96ur9my2XpQyrW6vKG4TaPQ1Nb0Zno2aNCgEQAaNGjQ4HUIqW8EFUKEEFQ3B/neklbQAfI+4Pnjc8IYKJjt8Ju/9/E7SS+dImhPkOo2aeYQrTAO2mkGWYZuzbA8nOA/f/speg6ywmROa4WSole8V6gisq8QhBRkhJc0r/snzwgQr1BebWkP+KrIJUYh4vHeIuJRKt/wl9fr9cHeW5zLcC4DXPE42ZItUKT9f6Hdbt8XhuG2afV1Qlev4a9fr9823mu+rN3OW8o5tA7wXkhTy/T0LG95ywGuv34fSZLxgx/8kEceeeyOs2fP/5ZSuTN8mlpGowSlTNU60FpblTzUxZAGL3ODUpy7OnHcem4NShmcgwsXLv37b33rO3L//d9gdXWdd77zIG94w410OhOAIggigiDCWo/3Qhi28pR08Sjx4C3eZeBtdV2Jx7usehw+d6efm53mpoUbfVkCEARBVRJQlCssHj58WC5dusRoNNoyDuvjQimDiEZE473gveAc1VHedqUDHEqBcxnWptWcM0axa9eOLwWBRsRjbVrNu3IuWpu9/OWzyFAq0/09ChGNEo/GV79lLgzUHucFj2VkE1QEjx9l7sdPruGTGSIzB1qBsRA6UuWwWvDWEeCYylb4b+9+N91q6Q7odgQNRIBCoXSAhEG1tmsCDAGmEAFqakGDBg0aNAJAgwYNGry+l0Oprimg9NHKs3xVLWKoEUA7+PB7On/d1TFd7bBpjMWTuMLFP4nzQv2gzShVPHdmwCPPxl8dCqQieQstP/YZvNlcmiXbPHC1T/bqk/9rwThxHydCZfp02XYtiqK7wzC8tyTV5fNeKsrXMMYQhmHVwq3s1V72lddas2fPHhYWFpiYmOD48eP8/d//PadOnZKVlZVD4wT0lWix1oArtvErD601g8EAEWF2dnYhTVO+973vyde+9jUeeeQRbrzxRnbu3FkZNJbjTClVZWmMlwjUx1t9DNZvj6KIyclJbrzxRh8EAUmSVN0B0jRlNBohIiwuLsrq6uqWNpOlALXdPKnPke3G/biodKXfpSyRmJyc/NO8dIItHhf5b6d+iutm/Si11e26lIw/BoYOVmJ6jzx9htUVIDXYOIZQSH1G4gtDTW/BWYy2XDfteO/t+G4EiGM08IQGlJj8VbXCp2lF8vOVXVW2qtWbN2jQoEEjADRo0KDB6538p0C6Gbcu6llTm6CVB8kJgVa58/+Eh1//yHswIiitkXiN0A0hS1GqIPKtFjjNKAv4wRPP8/wK9zgNiH7Va/hfDRGgJDYl6VJKEYYh7Xb77na7/aUgCGbLzICrkf9rEQbKSHy9Tr98zzK1OwgCdu3axfXXX0+WZTz++OP8+Mc//uyxY8ekNDYsU8Lr36WJ8P/8jC1rLWmaLpaZGM8995x885vfPPR3f/d37Nixg9tvv50oiojjmFarRRRFlYBQH0d1YWfcmLIUpcoskk6nw/79+9mxY4cfN+Mrx/f6+jrHjx+XkydPkmUZ7XaeuF7vElE3kdxuXF/NCHBcuKh/3jAMmZub+3yr1bq5/pLlY34eulSYUHAeUguPP72+cerCOpgJsiz3OBFnEesIlM/VWJuBUsxMd/jUx95OFgOSd13Il1ONQ4F1+cJdmqbi8OQZVJUkUbu/QYMGDV5vaEwAGzRo0KDSQi2QVftDEY14jcfjfJqX5Hsw4jDAu2/Bv/NN1+Gzs4BF+wF4g3IeYwLQAlGb0arj3Lrj24+eJxHIUIio3ODqFxh15/46sclvA623J/8vZNh2rVkBZaS3JG31CKhzjk5ngp07dzI9Pc3y8jLPPvssx44dk9JtvswOKEnmS2lx2OBnKwCEYUiWZWxsbGCMYWpqiizLOH369B2rcWnhKwABAABJREFUq6ssLS35X/3VX+X222/n6aef5sKFC1W9PvjKd6JOxrfLBijvr7fXi6KI66+/Hu+9P3/+vJRtA0vzwlarxfr6OqPRSLz3ft++fVWLwtI/op4JM25IeTUx7UrzrJxrxhgmJiYYDAaHh8OhlFkvW9/z1QuDe8CLwfkUHcC5i0wePnbBH7z1DQTpMgwH6EDAWbSQl2VYjWDRyvJL77qZieBJ0BCPYBRDoDUei7cWHSisLVsTWmzB9j2Fx0ozfRo0aNDsehs0aNDgdYiaI5SgUGRbdqjeBygdAHmde5nA6l1CBPzOXTcxazZQLsPZFCQFNyByHvGKfP9pGNHl0SNLPH4GSUIhda+fGvHtWqzl5FyIomgL+S+Jdhl1Hyf+L4b8A1Vdfp38l3+HYciOHTtot9ssLS1x6NChzz3//PNSOqmXwkEZVc6yrIoaXylFu8GrIwKUGR0iwnA4rFz7h8MhTz31lPzn//yfOXz4MDfccAP79u0jjuNqfJREuxxv9cyUeolA+Zi650OapszMzLB//37m5ubuLwWnemZCGIZYazl27JgcOXKkNxgMMMZsaZO53Rx5oVaA9c9Yv63++YsyACYnJ/8o/9yuEjyy7NX2z1dk1pO4PBFq5OBHT51keQNU1IVRgnhBeyBLCMThReO8Q9kB1+8MuesDkVcZhDpfZ20V03J453L/VJ9nAGRkZIAttr3SKAANGjRoBIAGDRo0eD3rAFtrU321PPoqciQiaHKzKQPcuJt/d9edb0XHPYwqNvMqA5fkLv3W4ZQh8wEDJvneo4sMgQ0HKF2UCLy+iFpJpIwxJfm/N4qi++qR/3oac53wvxTCXUZCS0f3Mio7Pz/P/v37AThy5AgPP/ywLC0tfdEYU7n5l5HeMqJaNw90zm0hcA1+dmPmakdJ4Ov17fXbnHN0u93Zo0ePyn/8j/9RHnvsMaanp9m7d2+Vjl+KPPWI+3hWQJ1Qj3emEBEmJye5/vrr79qxY8e99e4Q9S4RWZZx5syZuSNHjnz54sWLVSZAOdbHyxGu5AEw7kdxpb/L2zqdDtPT0/+21Wr9/J1fDE4g85ApePxIxpPPnwXdBhOBza1ZSWMCo1HG5BF8F9NSQ377U7+MyfIOq0Yi0sLYMAwN3m6u6L5c3mVz27vp+NKgQYMGjQDQoEGDBq8X1r/1crvlUSy4BHTueK1cUDUK/Piv7vmDvTsNOltDe4v4wrobnz83A1GGWFocPrPOQ08P/9zp/HVFqfzxrwMCd9mvWhCiTqfziVar9QVjzMHt6q1/Wh4A5WsppZicnKyi/kmScPToUZ577jlZXV0lCAJarRbD4ZDRaEQYhhXZK8mfUmpLKUCDn4/x5ZwjSRK895Urf5IkTE1NsbKy0tNao7Xm7/7u7+Tb3/52lR4/NTVFFEVbXqse+b9aPX45Lsr3nZ2dZe/evV+am5s7mBvveYwxleFkKTicO3fusydOnPhor9cjjuMtQlI9gn95yYy/oqg2Ll7UP6cxhm63y8TExL8OAlPzMXh1t38ehReFNh0SB4mDk5eQb/3oGQYrCagIvMKIgTQBgQyPE1DGIeky7zwwz5v281iQ/xjF2ps7uJQEX5VrfOX638zbBg0aNGgEgAYNGjSorKHKJdGAONCFA7/3SLGDNMCuSWY/9CtvhnQZRYrYJN/UOgANSoEXnNeMfMRDh8+w2OMPReXRKbIMl6W/8FvR7Wqpi3Tt9xTkf3a8FWBJ2q9WInGt5LtM3S+jtHv27GFmZoZer8fDDz/8mSNHjoi1tjKF6/f7VdZASa5Kwl+mfZfkvySODV49BEFQnacyYj8cDonjGGMMa2trdLtdANbX19Fa8/TTT8u3v/3tsnMAnU6nem69S0U9s6C8rTAbrEh6mSlirSUIAubm5ti9e/dDExMTs/UU/XLslFkk6+vrDzz77LOSJAlpmlakvN728mrmf/X76s+pt8Csz78gCOh0On+clyPkn3m8E8Grsuo6j0PILAwyWEvgx09d5NSFDYgVuAARkxsAeodzYH2+Jrt0nbluyofe07qtqwBGiHKghSTJuMymo2n916BBgwaNANCgQYMG44uhoFEExS4xd6JGF73tEQIUswZuXmD5HW/bjbV9nE3R4hFj8KaD80Ge0wqkLmB1AA88+DRe5wkCksWExqFVXXh4bRP8euuyOjkpnfZLct/tdpmamvqjTqfzlSAIbvPeUvYyF/FVP/N6z/J67/Lxo3zvMjpfvlc9bV9EmJmZYe/evSilOHz4MD/5yU9keXn535dp42Uqdj29u04AS0JVf680TZtJ8zMaU1civpcTSLfFlLFe8lG+xmg0qs5tSbjPnDkjX/va1z67vLzM/Pw8O3bs2NIWcDQaVXX6QRBsifSXmSH1MVZmIARBwPz8PLt27VqOoqgy3auXE9S7BJTZJ/XvU+84URfHyueXYzUIgurx42aC5XsEQUCappXYMTMz81gYmi2fZbsuBK9UdosEATbN0EEbFUACPHucuR88cgTMDI4InwFBC4pMCWMM2BGtyBHJOnf/2q8QAQYHLs4ztqRs3br9CtuU/zdo0KDZ8zZo0KDB6xVS3xI6tvSpLu8LwDuHwhPhSDL4zY+/gVCtAhYVGLx32CQldQav2kUGgCaVNk8dXeL0Kvds2MJ4KgabZOBf+wSyHmkcj0IqpbbcZowhCIKbgyC4W2u9/2pk41pJSJli3e/3qwhrnWwB7Nmzh127drGyssJPfvITjh49KhsbGzjX0IBf+Om9zTiy1jIajej3+1/+h3/4hw8+9dRTTE1NsXfv3qo93+zsLP1+H+89cRzjva8yPkqTQWPMlo4B5ftFUcTMzAy7d+/2paDknCNN0y2tB9M0JUkSzp8/P3f69GlKc0ARqXwMSnJfilB1ke1aPCjq5oWFv8Vt3W53PgiC6vnjWQ7XKr78tMQeKbwQUgtOYD2m99TRZc6ve1ATiGpXRfwiHo8Fb8GnqGyNG6+f4Ffe0/EGiGqn2oRqk+j72lHc6hohoEGDBo0A0KBBgwavQ1Q7wDLSPHaHbN6cdwiIuW6Cf/aR978dna3iXQa6hYiQZBlIiEgETpFaRew6/Oixo5xf5aspEAZFXaqAMYrXegZAPZpZT/ev316S/1arNd9qtb4QBMEHr9RG78VGH+M4LtsIVlHY0uFfRNi3bx9RFHH+/HkOHz78L48ePS6DwaiIsjb//L0eBIDtxlaWZYxGI1ZWVr798MMPyw9/+EO899x0000YY1heXiaKIiYnJytCXu9OobWu/q6T2bIUYWpqij179jA7O/uF0oCyzBYoo/hlacDKykrv3LlzsrS0RL/f3xLt3y4bYrwzwQsJACXB11rT7XaZmZk53263A2s3WwbWs1xeSQEAl6fq5yUQuWdK38Gh5+CZMwOGLiq8AAz4orzBu3wBxeLjPrsmFb/+j95FBLQD8q4BgPVuc3X1Y4xfGvLfoEGDRgBo0KBBg9evAOBLAcCyNe28uC8Do6jc/3/r1/f/+VzHou0A5SwUxlRaa7QYvFXYzJMScmY55dHDp+lb8FojSuU5BopfWBO5em0y5FH6drs93263vxSG4ae3c/e/VuI/TuiiKCJNU7Is22L+FkURCwsLGGM4fvw4jz76qJw/f+F/UAqiKKjSxBv84gsAdUJbZoiUY1BrzXA45IknnpBvf/vbnDt3jvn5eebn57HWVmn/dXIcBPn4KUtAyrFbdobIsgylFO12m717997X7XbvrXcQKMdr2bbQGEMcx5w7d07OnDnz1cFgUEXkS5FhvFPBta4d474AURQxNTVFp9P5Sl24e9VaknqHs1m+vipF5nJy/vwF5EfPnGO174AA0OAUCo/zFi8CImgs2ajHL7/zDezfyf+kbb5OA2R2c3kXn5u4iqc0aml2vw0aNGgEgAYNGjR4/ZF/VVB6U0sKTRHS3AAQ8pzU3FcKBeyc5K7f/NQ7CLINWl4IlYHMY51HKYNxINaBCvHhFI88c45nTrEbyTfjoywXC7xAnL7228iNtyAbv71w1g86nc5Xoij6dFmrXCdO44Rtu2NcMCiRJEkV7e/3+yil2Lt3L7t27WI0GvHEE088vri4KHGcorXQbreLtO6kqqVu8Au8wdnGl2K8RCVJ8nT7EydOyj/8wz9MnDlzhvn5eaamphiNRlUdf0n8syyrSgDGx22Z6l+OrZmZGXbu3Pml6enphTLtv/xcZYp/6SmRJAmXLl26Z2lp6VBpRlk/tusQ8EJtEuuZOOX7tVotut3up9vtze4HV8rg+dmqMw6tBZ8mBFoRBRqbZUgIqxl859GjnL7QxzqTtwVUJo/+2wyvNF4UJgixozV2zzh+4+NT/xwLWoEubVyKtn+agACNxiGlt0tjCNigQYNGAGjQoEGD1yM0tWZRl8O2QDrYLH/EXXdx/769Qsc4VObBaLxNNyNoSYJygtIBa4nnxz85znKfJRMKKCGxCqcDnBLcL0AXwO2M8kqCEwQB7XZ7vtVqfSEMww/W3f3HycaVxIDtrtf/TtO03laQHTt2VC7/P/rRj+T06TPvyKOtujJEy7IM77mmFOoGr22Ml6OUkfRyDOZjMn9sGAZsbGz0v//978sjjzzC5OQk+/fvZ2ZmhjRNGY1GVdZIKQBs530xLozt2rWLPXv2PF9mDRhjCMOQJEm2tC8MwxDnHBcvXrxjaWnp0Gg02lJyMC5kvFihrvzeWmva7TZTU1N/WvfLeDVMAJXKhQClqVz7rFMMNTx6xMqTzx5nrV+0BFRBzte9xSuNdYAIoWTY5Dy//o9+mU7RvMVmQBBVy7rCoFAYxtoCNmjQoEEjADRo0KDB62z58yqvL72MOZRX2mBDFDA9CZ/61LsQllDeQSrgPDgLuniNJAbxjNKEZ4+e4ifPX+qNCkKstWBVCwkncErnm95fIKJVjzoWdflBp9P5ShiG95YkoxQHrtTm78WUAwBMT08zHA5RSvHGN76RbrfL448/zqFDh2RjY0AQmCpDIHeAzwpxYjMNvMEvLl6InMdxyuzszK15Gn5KGIZsbGzw+OOPyxNPPIFzjrm5OaampioCHYZh5bo/Pu7r5QUl6W61WszNzTE3N7fcbrer544795fPTZKElZWVO86fP79YGg5uR8xfrAhQn3NFKcDngyDYUgqzXQvBnyXy3wGwliy1GCDJPKlqcXEDfvDQUc6eX8alvlivC8FRh1ivIHWI8visx8IbZvjYRya9lOu3s1UGgEKhMWg2SwQaEaBBgwaNANCgQYMGr1eIu2xBlHLvqwRI6Ri4YQ/+l259A20Z4eIRSACZw3tBl23ofC4G9IaKxxeXOLnMXFIQEXEe7zQeg/MCWvCv8Q3odqRERAiCIGi1Wl9otVof1FpP1NuMXUkAeLEeAAD9fp89e/awb98+1tbWePzxx7917NgxsdbR6bQAqqh/XlctW9KhG7x+BIC6o34ZVTdGsbq6+kQemVdVRstoFPPkk0/K9773PUSEG2+8kcnJyS0R+foYGs9qKYl9afQXBAG7du2anZmZ+Yq1tvKsAKq2gkmSl6WUmQJLS0s3bWxsEMfxZYaD1zpf6kS+/vgyC6AUALbLtvlZCwDiAefQSmOtIwPCjiHxHmcCvIFHn+aLJy8k9EeCtQJO8np+ZUBpkPz3b4kl8gN+99ffTwuIAsBlRSdXV2sCoLYaAzZOgA0aNGgEgAYNGjR4XdEDIAMsSO4YLRg0BlVtDlfRQR/J4H/3u29Dr14kKomjMeADlIlwPmOQDqEVYJ3h/HCC+x86x8UUXKixFgKrCFG4JAVULgJUn+OlHj97gl8nOOOu5/U6amsdxhg6nU7Q7Xbv73Q6f3ylyGh52wtF/Ot90UvhoG7ktmfP9UxPz9LrrfL440/K6dNnPxSGLbrdCQaDUe4sLhql8uTf8rqIpqkAeB1scLbxACjHoHMOjwLRiDJ4FGmW36Z0LtKdPnNOvvq//NXcRn/IwTt+iVa7S5o52p0JrANr08LQ0+NcRprGOJehtWBMnmkyGg2wNmV2dpo9e+bvbrejgtDnpqPOZTiXAQ4Rj4iv5vfzzx+RjY01jMlb4JXvp7WQZckLttHcLkuhFBPa7TZ79uzxrVZroS5slB0P6h4HV19DX8ba5QScxqHAwLrN8C3wWUrm4PwGn/vmD0+z0he0apEOMoxqkSYJogOGaS64GgdhvMq73zTFB27DR+TLeuQgxGFJSHAkgBcDol/rDVgaNGjQoBEAGjRo0OClodhsS/mXJnedLja/kmEE3v4W/HvvuIGu8bC2gTIGazPwFucdUhCLxGuGvsUPf3KSY+f5TKrASh55AoX2DuXdZobBz/uvM9Z+bNyUb5NYgDGaKIqIoug+rfXBn8b7l+3W6tHUshZ7165dRFHE4cOHeeihh2RjY6PqCjAcDmm3283wbvCyBbAsy3p/8Rd/Ic888wzve9/72LFjR5WWH4Zh5fxfGF7ivSdNc1+QJEm21PB3u13m5+f95GSX0Si+bH6Vold5hGHAxYsX5dSpUyRJUmUNZFl2VYJ+rT4BYRgShuG9ZXvCUnC7UonOT3+ByddFj8n7sFRp+Q6PYS2Dw8c2eHaxh/dtAtPGpSnGCy7NkCAE0fg0xcfrdPQ6//U/fieMIJTNLH8tINpjAeuBzDcZAA0aNGgEgAYNGjR4nW7xa72iwGGxZDhcpQ3oFD75sV3csK8DRkgyQBcGVkU/au2zPGtAJlkZGH546HkurPDvxRflqFIIAYXQoPxro/x03Dl9vHXfZv1yZcT3p61W6/PGmImXSrjqh3OOVquFMYYkySOec3NzTE5OMhwOOXz48ANnzpyRep10SaIal/8GLxdJkrCxscHExMTsX/3VX8nf/u3fcssttzA3N0cYhpUYVRr4lYZ+ZbaLc64i/1mWEUUR1113HTt37vRKbWbXjM+vetr+6uo6586dk16vVwkP45k44/P1WgWAoiPAfVGUdwQo50y9W8fPdvnN0/Od5F4sqkoOyDMiHPDcUT/30GMnWVk3ELWwNkXEIF7hXQY2RtoGHTjSbIM777yVN+3lb9tUXVyxPsXbUVkxAIAJgmaAN2jQoBEAGjRo0OB1LAPkG2gyLCleHAK0PLxxN3/6iY+8k/76SfAJYdTCpiliBJTNhYAsRbwhVZM8dewSzx7jy5v00+FEYUXhJC87kFIEeA1EoLYzUNvsH55H6VutFu12+/eiKLrPGPOiXcS3ExfqrdqstWitmZycZGJign6/z+Li4oEzZ8581DnH5ORk5fJflgkkSdIM7AYvG5OTk6ysrPSstXzve9+T//Af/kMlQpWmfmUWwHibwbJcpZ4V0G63mZubY+fOnX9ad/cfH/dKqWLc5+0DL1y4IEtLS1VWQUnWt2uVuZ0YsN1hjKHb7TI5OfmVIAguE/x+1vBQ80ExiAsRrwCHVw5lDJdieg891uMnR5ZJbVHRn1m0z0shBoMN0B5CcPTRfp1/+jtv/6R2uUjrlMIXOq+IR0pxJmsEwgYNGjQCQIMGDRq8DlE40xdE3CrwOl8aFRAB93zqzZ+/5cZZSJbJshFEeQsvby3OpXlbqjRBe8NqHPK9R0+wtMFnXS3a78rXFgfikddQGcCWX2sL+fdorUrH/9+Loug+pdQWw79rJf/j10sCorVmOBzinGNmZoYgCDh9+jSLi4uysrLyTBRFOOfo9/tVv/by84Vh2AzvBi8L3W6X9fX1isyHYcgzzzwjX/nKVz7nvWfHjh1V3bzWeQlMfQyOt72sGwDu3r378/XHjxv91Q0EjTH0+32WlpaqTIAySr9dS83xeXU1tFotpqam7u52u3eV5ob1LIaf2VoirhBEHXhBOY24AG3Dam1MnSYFDh9j7kePnWK579FBCxsnqCwjDAOcT2C4DumIKHRgV/j0R97JTbv4fyN5kxcpygHKUiJo2oA2aNCgEQAaNGjQoFkMi05TZeGoBrrApz/6TmSwzEynhUtHIB4jCpfZPBplBKUCUB2ePzvgoacvMfSQ+jLV3+NF4QR8ZfD12ulAtZ0RYBmlbLVatFqt9xSR/9vKjfW1pg9fjfyXadOdTofp6Wmcc5w/f55Tp07JxsYApVRVBz1OoMrP2KDBy8HGxgZTU1OEYViVoIgIS0tLX3zwwQcXz549S6fTYc+ePWitGQwGAARBUJnpWWvLzhg5qS2yVCYnJ5mZmXms3W5fZlRYHmWkv7wexzEXL16UlZWVy8S4a037r6MsUSiyAO6PomhLRsLPfnEpRYB8O6q8QrxUG9Oh86Aiehm9J569yMnzQ5SZRCMo5ciGA9rtFhiN9xnKWqYCx/xExt2/vv8z3oG3DgsoA3iPsylGaaTZ/jZo0KARABo0aNDg9QZXI+PFUijFquhzG8CPvh+/sMeTra2Czw2+cFnlJJ9bgGvQEYOR8KMnTnDkLBKLwhJCkebvC1GhjHgp3GvGB2CcqJfEOwgCOp3OHxWR/4Xx+v2X8vrjzy3eA2stZ86c+bMzZ86ItZYoChAR+v1+1dKsjF6W4kRZL92gwctB3eRvNBqRpimtVovTp0/f9Nhjj33ywoULVbZKPfJfoi6alaQbwBjD/Pz8bVNTUyfCMNy2pWaZHVASdYDBYECv1zvQ6/Uq4Ws7IeBaxICyjCAMQ7rdLt1u9wvl93glIuR5RpQrewIivtiUFllTKEOqQ0bAc2fSx5969iKrfZ2vuZJh0yHaGDAhYiJ8nBKSwfAcv/bR29m7i7soXk8Vq7zGFV1BdLMFbtCgQSMANGjQoMHrDkWtf74ZLHelIN4RAJ+5+91E7hLtoIVft/nGUepRbkVmwWWaS+uWQ0+d5kIMMS1Sxly6C3dr5LWbelqvbTbGbHH8r2cG/DSih6Xh32Aw4MSJEweWlpb+JMvslmhpu92uzNeAiiTVCVODBi8VrVaL0Wi0xfCyHHNaa3q93tcff/xxefrppwmCgOuuuw6lFIPBoKr/L8drlmWVQFXeNjs7y+Tk5P4oigJjTFX7X8+6KW8r5wTAcDh8ZmlpSUryPy4AlM99QQJeEyfKDh5lVs3P3kTTVZe5EGBBMsT73AfAG8RohjZlCJxa5h0/ObLC+WVP6gCfEnU7ZGnKYDACFWIIwXlC1ee6XYr3vEvfP9Mps7s6VVcA733TAKBBgwaNANCgQYMGr0t4iMKIPD4UQt6am4kQbnsL/t3vuI7Ar0IqiExgpIVNHUYFKJ+3r1LBBCPb5rFnzvDEYvzRFIW0pmZTFF4ClK9F9STf7OaRrp9/gjpORkoC02q1Dk5OTj6klNpfHBN1QnGl7gEliSmPIAiw1lY1zWVdszGGqakpzp49y7lz5w6sra09kz/eVJ+lrL0uRYfx8oRXxMW8wS80siyrxlI5ZtM0rcSAIAhYXV3n+eefl2PHjjEajeh2u7Tb7Wps1lvqlZkCJcHOsozZ2Vmuv/76pNvt3jzuHVAn6vXsFmstw+GQU6dOfXIwGFzWdWDciPNKJoClgWGappXJ5uTk5BdKQ8D6fB2/fqUMgStlAtV/i+q1q6+YgSQgMUiCeIPyJu/KIhkSGfoOfvhoPzl6KiX1ISjBxwniBR1NkIwAQsg8KrBoevzv/+nHkSEYBXEiaCASyGzWDO4GDRo0AkCDBg0avB5hjCJOYjzQjrrgFG2V70X/q999JyFr4BNwHpzGuwB8gLhiE+sD4jRiaUPz6LPnudTngSGKQZb2fLXEqrzftXcI7jW19JbEo4wGBkFAFEWEYXhvGIYHy4391Z4/bmxWJxOrq6vfarfbdLvdKr16amqKVqvFxYsXuXDhgqyvrz9T709efp6mzV+DnweBoN2OyLKMZ599Vp5++mniOKbb7VZiQSkElKS87BYQBAHluG6320xMTDwUhuEWcv5CWFtb+/rq6uqfDYfDak6laYq1FmPMVUsB6mUJ5WPCMKTT6VRtAcfndv31XoxJ4LhZYX5btTrmXgCqLAdwuROr1+S5+5ZBmjH0cPoi0ePPLDF0LeJMI6JQyqB0iDYtwIBz4GOMGrKwS/hHd+JDBwpPpIXMgzFBs/1t0KBBIwA0aNCgwetzA5/3odZGMYz7GAImFLx5L/d//INvwfi4aBTgAI+4CKwBrxAnWG+IbZsjZxN++NSIvgOnNJnLECN4iv7WYy3/8rZUhTDwGhABSkJSOP7fF4bhvS+U6j9ubLbd605MTHwwTVPiOCaKIjqdDkmSsLS0tHHmzBnZ2OiTZbbyHahHFpsU/wY/DyjT8EejhJMnT8pTTz118ty5c1WLQGDbmvpyfmit6XQ6zMzMTExOTv7rsm3gtZTRJEnGysrKn1y6dOnPB4NBNdeuJpBtJ8qVtwVBwOTkJN1u9ytXml/jRP6lCAAikldD1dZFL2WnFAozQIWQofLlFmVgOYEfP36KpXVFQhdoIU6DDxEd5t4AzuHxGJWyq53ymd/4JdoCITGZ9SggzdK8NUCDBg0aNAJAgwYNGrz+EIaG1CZ4HAEZLoa7f33XXXOdIcrHeahKElA273vv8jpT74Us0awPFT9+6izPX0B8SJ5vKgn53l8AjXagvUOVlaf+tbP0lmQ7DENardbdJfnfjtBsd/1KZKAkHEmSkBv7RVhrOXXq1J0nT56aHA5jjNEYo6s07HqLsp91m7IGDa5lbiRJnk7e6bSw1nLy5Ok3PPfccweWlpbyTVYxTsuuAKUvQOlbUZa8TE5OMjs7+8eTk5OfKMtbXghRlM+f5eXlP7x06dKfxXFcvf52JpjjQlzdk6C8Xghxd7fb7S1z7qWae46n/tdfRztVmaSWR7mqCCDeoxC0ETAaBzxz3H70yecukTADvo3PBJcWAovO8gOHwaOSde689Qbec3vkDfnvqaLqx2gGcIMGDRoBoEGDBg1ed+Q/0CRJkpNKyWhhmY3gUx+6lTBdRtmc6DsV42SEuMKe2nnECd4FnL044tuPnuRSApkWvE/ADxGf4Ioov/agvKuiXU7AicL/nAehyg17EAS0Wq27Wq3WF4IgWICtJmFXIv/bOZvXj/X1dVqtFu12m7W1NU6cOCG9Xu9BkVyYKclT6RNQtkRzzjUu/w1edTjnCIKccMdxXBDogOFw+MxTTz0lFy5cIEkSSoO/eh1/mf5flrQEQcDMzAxzc3Nfa7VaOOcvq6cfnz+l0WAcp/R6vT9ZXl7+6ziOK6POq5H/8vPXr5eiQ6vVovD42PK47er4X3CTWRPrtmQeeFXV+kO+rFrJ10bEocgQ6/GpQ8QwTC0EmgvrPPCdQ8dZ3ujgZRIhQjmP8ylWj3BBBkoQ61FJzGSQ8M9+971EQNiCQQxK660pWQ0aNGjQCAANGjRo8PpAlhUk1qiclAMf++CEv+m6aVS2Ad7i8FhJcMQIPvcD8OCdwmaGI8+f59mTyFBB5gS8BQGlXZ7mj0E7CGzREpA8/f+1sP0sSUYURQuFQ/hCmfo/7kw+fr1OGMYfU5KCiYmJ0gvg8aWlJdnY6KOUqnqml+nV5fPqBmevRJuyBg2uLgBspupb67HWVfMiSRKOHz8uly5dIk3T2uNsFfUvyXR5W6vVYnp6mqmpqRNRFL7g+5fmmUGgSdOUXq/3W8vLy4/HcUxp5He1EpzxrgFlpwJjDBMTEwejKKqEhGstSxif/6UYsV0WgHI6d/ynngFgAI94T6g04jRiA7JU4ZUwAh7+yWry/PERWdYCFRKYAC2W1MSkQVL8OB6sYOyA996+i1sW8NYV72HtT6VTSYMGDRo0AkCDBg0avMbgPTlZD9s4D+0Afus37iRIh+jUFRtTh1UZmUrwxOCzwhdA0Vve4NDDT7OWQKJbZOIRDUpAVEFQvaB80YqK6iaKvoA/1yhN/4rI/1114v1CKcHbkf96C8EgCNBas7y8/C/Pnj37juFwRBBsGqWVpKguGNQJReMB0ODVhshmJkyesSIMhzFpmtLtdun3h5w/f17Onj3LxsbGFiJejt/tRICpqan9MzMz//qFBQi3JasgjmN6vd47VlZWiOP4Cmuev6zDQJ2Ul9fDMGRycvL+0hDwxUT96yjne17Gs5kFoNEIBuXq89jgMSAZigyNEEqEdwbEkEkGBk6dJ/rhQ0fprSaQOlAKrSyxGpKaJA/uZwJOo8TSUuf4r35vHzZ/i2LpbTIAGjRo0AgADRo0aPDa24ADsuklTdXoWco/DUJQXKraXUX02ggIuOGQyMN7b8MfPLCTwfpFCEOc91gE8SHa6TwDAAconI84vjTkR4fd1zID3ju8k9KHCpuV/a3L54DyUkS8JDe9EoUXheDQ5eE3OwX46n4Qii4C4opo2c9++S57g4dheHdpTpZlWe+FHPjrTv/jYkBu6BcSBAHHjp2QlZWV/yEnHVTmZXXX9HrktHRV3yRQjno/8Rd32eAXAz/981lmh49fjqNqt1d6WhhDFOXZK/1+n1YrZG1tg5MnT0qv16vG7XgrvrK1n7W54WWn02FycvKPX+hzGmOqdoKlMDYajVhbW9u9urp6DQLG9rX55TztdDp3BUFwsBT+Lhf/yjUqX5eMA+MU2hdrlvIo7QmUR4mvVrE8z19hUTgM4lTeAMDm5VIOhRXFKPNkKLx1hMZgiwYBqzE89NQJllYto1RAFODwNssztAjyI9DgNmhJj4+972ZumOcLYgEyvMu2jJ0t/3TIpiBRHU3CQIMGDRoBoEGDBg1effKviv+kXMpU7RBQBCjaaFpogtpdCghwPg/Xt3zGFPAnv38nE9lZoiDFZgneKGyqkA1DILPY1ENg8IllLdb8l0eOcyrhU6MMwsiDdTgXQNAiI8Bj8YywYrHkrQTzw2O94L3GImgB4yACptoB3U4H6xTOBzgMyju0B124Zpcb5JfrIVCvQQaqSKSI0Gq1mJiYuD8Mw3vLuvsiPX+2JDEAHosojwnUFrO+nCRobOGjoHVAEER0OhOkqeWZZ56Tjf6Q1DpQGtGmuvSiyJzHi8IhuQiiDcoEoDTWb0ZeS2FEif+ZHeV7jB8/HfL6co5fBPL+Mg5vwZeXdpvzs3mI+NpRClL53+PnW49dqiu8rrd5Lbvy5CJAZvP0ckArhbOWTjtCgJMnTsjRY89/MU6GhJEhs0lF+MtsmNJwL4oiZmdnmZ6e/r0wDKv6/LIMpiTuzpG3wVOGnJsrtA4YDuOlM2fOyXAYk2UOEY2IzoXJYj6C2jaqXzf963a7TExMPNRqtSoRbvPxCo/J16Ji+Y0ctK1gMo2yUpDsETOd8EsTQe7SLzoCWxgoiiIVhbaadgbtLCNwGY6AWLVJTYdEBFEZyg3QLj/dLoKHj6TyrUcOQ2cXPhNwihnp0I4DXBZCu0MyvAgzQjq8xP5pw//p3vfdN+sg0oByNaFYbf7TIWUGF4WQ0CouVfXvitDoAQ0aNGgEgAYNGjR4lZcw2XqTbP4hmGJ7V39UQZ4k3+0FwLsX8Dfvnyawa0RhTobT1KIJCHwLRh4t4JIECac5cmqVh4/0WBrmAS2xabE7DPMbUo9gQTKcbJK1zVKAPHW1aAgIDgKBKDTvcWlWRf9Lll/XNvKbXn4bwZLU16OSJSEJw/CgUmpBRGbLx28lDK6sxe+labqYpumWdGSlFGmaVu7+1lq63UnW1/scP35cqhL+a/gOUrRi3HpJjYS/lMtrJ9BNvfDPK3x1KS9g6nYt6ev1Up3yUpwfm7ebr1fLPbrseZB7jDjnqpKV9fX1z50+fXpxdXW1zK4hSRJK9/4gCKqIfhAEzM/P/2Wr1fpE6cVRzqk0zS4bk+P1/N57lpaWPluaApYR/CAIKn+AF/qNSgPQMAwXSuGhXipQyrDlwloKJeVv4jxkmUdj2T0zEbd8hkpGiPIkzuGUq8QD5cB4h/KuMAIU0Log3FmVSOU8xF4x8vD4s+c5c3GEN2HeVSFTaAlx1uPimLAbwdoyE7Mz9JfP8IGDb+C9t+KNpTRj2XYb7H0uNDTb5QYNGjQCQIMGDRr8nG39i9heZbZX3VjuTUnwJDhSIM3vFmqp+R7tHS3g4x+5hbkdk6Q+j4g7ayGRPJ1VO8j6gMVaz3oa8v1HFnlmEbEu36f6olm1klqYqCSakm92vWQ4leHF4sUjWsDaXAsQaLXAGHPXlhZg4outdZ22/nSW7noKcr01X7vdvqvdbn+pFAC2cyCHyuF7Vim1UL5OWatf70k+NTVFp9PhzJlTiydPHpckSfKIZhlV9WVPcLflUIVd4nhkt4zUjn+mF3tc+1hTILr4NJtHg1cbRSxWVGWsWT+23/K8uPN2JfFn6+3567oyu51NfdFamy9HSjEaJpw7u3TT+XMXTvY3htVrjI/LUkSbnZ1lZmbma+12G6DKzlFKrjifS6LvnGNlZeXLa2trh0ajUVF6Yyrh71pErVpbwK+EYXjZd1euEDyKVn6pQEaGxWHFkElAHAOpffy6yXa4y0DL59kYTgsoC5LiJcOrojuKciA2P7DV+lkS88yBdYrUweM/sV996sgSmVJk2PxDiMEEHoXN52ymIM1LiuZ2aH73H/8yoYeoIv8aj9tcX7cMngxIi8urDqwGDRo0aASABg0aNHhlRACHx1OF/Wu7/zwgaIEYT5pv8gqn6Zw3ZOAtJoU37+GxD77nTaTpBighTZM8d0AM3toiXdSCSwjCCZ4/N+K7j62wnoExoMTgbB6R95lFPIRBuWGutdoScOKwKt/Uap+ilcdamOwKk5PTD8Vx/EXv/SYJfgU2nPW2Yq1Wa7Yw/TtYb+FVf1xOAnSVwmyMqVKTS4KRZRlhGFaRy7W1NU6dOnXTcDgkDMNrIuCl90E9+q8QlN9ai/xSjxdNN5tMgJ8v+n+F8/hSz++LfR//AuPLGLOlrEbrfM4sLy+/4cSJE3++srJSGe5lWUYZrQ+CoKq3n5mZYceOHT6P/m+WDFzJh6Oco2Uqf6/Xu2N5eblXRv+zLCNJkm3bc273WmEYMjExcbDVah2sZxKUhVeq1to005Cp/HAieNXGWkiGo/85tAlv2dXxbQoX/kjla7BKceKxClyV8JTVDlutol5yUaUUe05f4p4fPnqMpV4CYSf3F8jiPJVKO8gcYlpksaXdaTHYOM17373ArW/ER4CuMsEYK6cqBGUsSJxfesAbct8Dfu5buDZo0KBBIwA0aNDgFxRu63LmCzMpXy5uDkhxZNg6+S+glScCfufj+257454Al/VBeYwCI0KoAnzi8o2osfkuN+hy6LkL/OQ0+zPAq4A49Tibb4l9kuLTrKodLzeXVZur6jNkKJ/SFtDA7Oysb7fbBzfWk3QzxXZc8Nj8nj+NSNRmLbGron0l+b8Wwmut3fBOwCucpXLvByqiYozhxIkTdxw7dkzCMKTVajEc9tFaxs6jqxlxFZH+QgBRHrTkR54R4CviMR6VfzHH5TXhYwKByGU/80+bXDZ4OQIg256f8XO1ec7G/QC2P++Krcd2Zpb5+HC42rHNBEOK7Jq6uWWaply6dOkPT58+/WcrKytYaysRrf7ZnXO0Wi1mZmaYnp7+I2PUFqPMK4lo9XKeOI5ZWVmZW11dJUmSKkOnFAiu1iLQWovWmna7Tbfbvb/eWlBEEO9zfxKXr7aZgkSDVQ6LASLwETbxxGs9btm7k30B71EevI2LSH+GU2CFXAQQioi/BZ9tCoDV+q0RMTgJGQE/emyFnzx/Ecw0XmmSeACS5r4QQRuXgOlMEo/WaAcxXbPG7//mHbTI19262piPJ4MnyG+Q8dKhYPxZDRo0aNAIAA0aNGjwikLqmzOFFJszVWMGZeRoi3NTcWlSuGGOez/14dvQbpnIWLIkxhiFzTLwGmU9+BS0xvuQ00sjHnzqFMsJpzIF1msyJ+jAEBX967UI3mZVpBqosg/qIoSyjsDDZAST3TZpaim6DxbmY76qc9+sdlY/NQOqetuvKIpot9t3h2F47zi52I5UAWitJ1SN4JRZBGEYEkURcRxz9uzZj/Z6vUPlc5Ik4YXFBbUtqRNfc2S/CoG7pkP5a8oQuFqUucHLJPA/pRKNFzpPVzuv13IoivaThRigrvF5dY+NutlmmVlz8eLFPzl9+vTuS5cuAVA3/Cvb55WtAefn5//t3NzcHznnq0yAF/r+pXFgkiRcuHBBlpeXq4yD7TIIrtQiUGtNp9OZ7XQ6d20agLrK/V8Kkc4KpDq/zD+AR8RggfX15LNznZAD+9s/aAEkljy9fnNttFtKKBy4FMVmFpRI7jDgRbBicCIsnkZ+/NhZehsGFbYQXTzXO/ABqfXgUpxLCHVK5Df42Ptu4eZ5ns4LImy+HnvIo/4ayc/0FdYlteXfkAYNGjRoBIAGDRo0eCXJv5Cn5xet+cCgMNXezI2natZKBLTP/Z1//cO7vnTjni6B24A0xuBJszh/zSzDBEH+8pkwtF2++/BxHnqm/+WBglQEREOR3uu9QylPGAi4zbrR0pbAVV4FOYkPLWgL1++e8SJCr9fLva4K4iDjGQ61Jfunsf8sN/vGGDqdTln3v8VMbDsiVaKe9l9GN0vSEscxy8sXD1y6dOkBrTUTExMkSYJzrioB2Eylzb9bmdpbfl+vNL6sd/ZSxP5z48aKnL1Ud/9im68lrwKuH1WEuK4Z1VOmmxTgn6MtjEJEb7udqWrVC9JeP6QU2WTzvNe7AJSHqOKQrYcSX2Wn1M0Dt3w62aSROWFXlQN/7tzvWF9fXzp//vyBpaUlBoPBJtF1rpqDWmsmJyeZnZ39txMTXa6mPY0b9ZVp+xsbG/R6vbmNjQ1eqI1nfX5bmxsZRlHExMTE/e12GxEhc7bIenBVd5JS3PSi8ui5SzHakzpYHvDlS71V3vqWm7hplv9+whVLd+khUBxuU99DiyB1EdUXuUHOkVlHqlpsOPjBoUs8eXiVYWrQrRCyNH+BJCUIIpJRn1aoSYdD2sqye2LEb39i/4GWAm3yzKN84dGAKcrKfC44sp157E9xEW7QoEGDRgBo0KBBg5cgAlTWeIotKZq+9hivagcYDztC+LWPvAvl1jFtTTbYIIgikiRGhxrnMwhb+XOSgH42ww+ePM3iOT47BJyoYufvyLKEJO7jXUaghczmooSTgrj7rYf2Lk8o9TC/Ywc2zVhZzwhMvsE1SiofAJfHwQoBQVWE4+XuP0uCHwRBmfo/W96+XYrxeISxdCwvCUUZHRwMBieXl5d3Ly+vPBNFeb3y+vr6Fudz59zWiP4V/1na5p+pgn3nEdmXdqmF6s2FrR/kcjLnmrn2WlwetghWrtb6b/NSS9H3vrjU1fM2/87jwR4lpWCUi0dbu0lc7tdRpsy7wisjDEOUUlUdfqvVKrsDPHP69GlZXl6uSmfSNL2s9V+r1WJ2dna92+2MteTbXqALioykUkyI47jX6/W+2O/3K0PA8bVgXAAoMxfKUoAoiu6uSggk91XRjqoMoFzrtHeowuOk72AVOLq0zPXX7+ONO6N/OW+glQFOobzGYXCE4EPwJnd18a5a4zxgKb0NLNY7Rs6TacUTzyKPPrXMxTXIJCLLMpD8cUopwqITSagEkgGBu8iv3fUO2gZClcf9ZWy++8J7AF/n+kVpQoMGDRo0AkCDBg0avNoCQOEWjeR1+IVrvuh8A9fqTIMPwAeI12V1Kr95V+RvmA9QkkGaEbQC0pVLdGdmGKYxibegFRBCZ55Hn13lW4eSP6Bd1KsqT2ITtMnLBIz2hBrieIjRuSs4XpFZQekIY1rg8s9ovGA8XD/Hn+6Ym+HU6XN5PK2IpDvntl+yvboCcd6eAJXp+eXr1V36lVJlfe+XjDEHNw3+ZMtj6xHF0gQsJxhR1WPcmBBQDIcxq6urb1hdXV0KgpxAGKPysgqbYm2K1jkBM8bgrcPbQgzAodUm8ai245JnA6BNdSjROG8Rb1FC7tugFUaBVlL0cOeKl3U3AF2UW5T9v0UV9yu29Imvor8UJo28vOPlw73M45Uh4C+1XOKFSwE26/mVAq0URmuMFowW8HbTSwJfXWrylp5Vx4liDGjK0pt8LBql8vPu8/tNKQCoXDAoL1U1Id2WTBKbxGidl9dopXA2xbvcH8RoIU3T6jsOh0OWlpZkaWmJ0WhEFEWVAFB2BZiammLPnj0Ts7OzJ+q/T32Oj7cC3OwckAsP6+vrn9vY2FjMsuyy+TzelaAsRSizCFqtFrt27frK9PT0XR5PJg5bpNsr68HlNf8igvKWwA/BDnERjAw8s2Tl2LlL/PaHP8gOx3smPIQOfCZgNSbo4AnwubkK4tVWUUUkT7hSIEbhjCKVgNjBX3998VtPPLuC0zsR08a5FNEZ3qe4zCMYvIVIWbRf5bo5z92/scNLCsZBKLmk02pFuTmhuCobKReWcz+Z3DyWphtAgwYNGgGgQYMGDV5dIaAkVGVHgHxpC0IDAqONEWDQGDSWjoaugg/feTM7JjKytI+1GSghCCKw+UbaRAFYBz7i0iXLdx87wfk+fzEsu/Qpl28Ia62qylBSSf5FG0QZrPX4zOaGdjbfMBvgLTft+/zG6hqpy2WMDMlbXVlbxf2hSDuv6k/L93MvSKDKCGJZM1yShDKiGIbhXVrrg+Xjx59fJxVlXbIxpjIYU0oRRREA6+vrDywvL8toNKqyAbYjcWUddRbHhEYx0WkRGoW4nKxpPEaojkBt1mDXa7G15NE7RZZHHMkw+OpvLRaD3/aynuZdigBa7CYprEWHy4ixugZvgAav4LTf9vffnBNlpoeozSh/KfQoPEZJLhyVgk89vV/l2l95qQuib1QhIhX35YegRaGV5OJRMW7CMER5yOIRcRznHUJEMKK2jKMywt/v9zl37pxcvHiROI5pt9tVOU1ZFhQEARMTE/t37tz5R3UfgHrHjnK+jRv9OedI05TBYHDP6urqlnm5nRCwnZhjjKHVan0haoVVYpNSkpdheFMc+Rxs6TyNPvEwEFjxsHj2Antmp/jIu2Z/EABd7whwhCYiHaQEpg1eMCrYslV1ovLSAjabojrxrCcJqYKlFT70wLef5dQ58GYSFUaVySBoxAeFaJoCQ0JWuetX3sr8JEEAiLe0g4DRaB3EoqNaRkMhAVxektWgQYMGjQDQoEGDBq8stjT9ttVNpRQQxxk6yCPTWgyajBCHZHDX+5R/7+1vJFIxzsabm2EtkFqMbiFGk6LI9CyHT27wrYdOJGtFM4Atq+dYTWhJ/q0HRKNU0TLPOyLlUXZE4GFHl7ve9MYbOX/+LGmWfwPrdUH2a5HausO4uIqkvuDPU+spXt/klxv5drt9XxRF92mtD5YR/u0Ie/3v8QwCESHLMgaDwaHV1dWPbmxskKYWrYNtCcRmRBM6IbS0xydDsjgBl7fmCkQIRNis+s+jt4JDnC0i6J6oiPiXDgJawCgpugVsdg54wUNtZgRUBK/6uxQCKHwBXJURsN33anD5GHyxhn7XLACMZVTosT4PWkktyyM/r+X5LYl/fQyUl0ZVl4HRQqCl+FuqMWYUBMV9m69VyygRSJMYwdOKQjpRmGcl2AzvMrAZqmbCmUfoHWtrG1UmQBzHlfBmrSVNU7TWTE1NsWvXrn/bbrcroW18/G03HkUEay39fv9Qr9eTUlioZwqVr1UXAsrzV7b87HQ6B6enp/+0njcvkhdGVJFxyQuWSoM9p0NWgaeOn/y32js++r5f5vqAT4Te08YhNgOE/K0UIqpaYl1d/CzWREWGMQonHhcY1hL41vftHz93LMOrHXgf4CVDsIgz4MM8rV/y9oKKmNsPzPOpD3WSCAgBsqT8xwSbuqozQF6I0GyXGzRo0AgADRo0aPBzhk3C7MuNp4AJg3yp8xmGlC4wY+D3f+eDTIUJWb+H0WCMApvkZnNWCHREllkSFbLhOvzo8FmePUPkVd7/u1IZoDKL2kxXzXtFOy9YX2ykvUWLJRCLBloCt91y/f1GeS5c2JDEghiTP14ZlFbVd/BsNZ4rMwPkRfCqevuuIAhot9sLURTdFwTBXaXxX52s1csA6k7/9VTjdrtNmqZlr/E7yoyAevR/OxFAKYUWuG5+xwllHS6DjobZjiApJKOUdiQEWAwW7TOMOEwhDOSXEBgh1BCo8vAEKi/DyG/3L3hoVaR2K9lSGlDPDlAF/SiFgO1EjfptDS4XjsbH4UsVBa7kuL8l0l8UAoErzqMUl5tCkSqyTPLz7vJaf8nFJ618Ps40B0Kl9mnlCZTCqFxU0MpvtqVUWy915S3gCXTx2cjHVxAEhEGwRUADKg+NMDRoLQwGA86cOSOnT58+GccxUZSn1cdxnNeyhyGdTqdsHVq9xrgnQDl3x38ray2j0YjV1dUvlyJDPZvgaudNKUWr1WJycvLzqvBKyM35iu4k3uVp9wJxVlRQYUCHpEpxatn+iyefPcKNN+znA+/e/7WQvBzL2wGtVkg2GhG0WnlGVqXzFutpsfJVgk+xAKZF+8GzK/ybRw6vsrwWkviJ4nukm58fCoM/hfiMrqxz9yfvpFsIAM4nhCbY3BkLl6m8m2uua8oAGjRo0AgADRo0aPDKMwzGsuAzHGVKfr5ni0eDnAiQ0SLf6H/k/fjbbp4hG/Ww8YBAWVBZLgBojbgAMkNqhUwinl0a8fePHKUPeB2ivIEExNec+ettB0vKqDXW56mqeRwpQzlLCMzP8M/e/a63c/rkCTZGxdcwAXiPxV/W5usyIjSeGXAFslRP4y/Jf6vVOthut7+ktZ6tR/7HSex2GQT1soI4Tun3h3+wvr5+aDQaAXlHgTIrYDySiLjKVV2JY89Md/8tN8753V3ytt+xZ+cU3dk2uIEjEggFIgUt5WlpR9t4IiPdlpFuIMwGAuVh8ATCbKhkNtJC/b7tDqPq0d0iFVwY8whwlRAg3hV/5/eXRnJ1Yjp+vcHVBYEXS/7HhYA8Gl+Sftki3uiifr86l1JkBRSXWtym0CM+HwdCYIQgUDJvhH3FMa8Vs1oxaxSz+eNdIQbIZgZJ3R/CO9pR2NXiSeIRNo1z4S8IaAUBpvC5GG8ZGEURSilGo4QLFy68YWlpaWN9fb0yESyFOK01O3fuZGpqajkIgi1tBrcbe/Uofvl+vV7vsxsbG19N07Sa59uJgNuJAO2oRdtEGG9IvSItovJC3trEK0gAMSG4IjNAOWLgOw89ziC1fOyDv8QNXf6nojcK+ASwGAOZTXCFyaCvGaBWgquHLB2iDSQuIxFIBL794PMcfn4dpXfiCQCLlxFIkkunPizfjY6KuWX/JB9+Dz4A2oDL8kykyhlQOTweh0JRisnNXG7QoEEjADRo0KDBq0P+L3NoLm6UXACQFnk9qjiEFAUEwD2/eZCIHpFyRIEBn2DtgFS73GROWrgRtIIWG7Hlh08e5/Hnq2r/PNVVDMoZlFd5imlZEFtsVPMOASb/PMojqiC5GUy34J1vf8Of79k1y9HnT+ZNDHUeSUMUzuUu1+Mo225dq4FcXQCokf/ZMvK/HSmrb/qdc7062apHFJ1zXLx4cWJjY+MvnHOVz8CVjMXGSbHycOb4id27Jjt84Jfe7t93+14/P8Xvra/Rj4ewc5r3hIUAkB+OQHwQiJ8PlF8IxO8z2EAruqGmW5C3rhIXBEpuDQP1iUDJPqOZ3/ZSyXxo1HuM0jdrLfNGSVAKArkoIOgiU6GM6Najy2Vkt0n/f2XI/zjxz036ZPOclPX4erM2P4/M5wRdK0GpvP7eSJ62r1R1utFagkDLgjZyW2DUBwOjPmi03KYV+42W24xiwSgWtDCvhXmjCLT4WVV2llDlpaq8A/r9Ud8oYXp66vcmuxOfUAhJkmCtxRiNc1mVMWOtJY7z+/Ja//y2c+fOTZ44ceKfD4dDwjCsIvhKKbrdLtPT07OTk5N3lx0Hxk0Ay+t1L48ScRyzsbFxz8bGBkmSXJadMS4M1kUGrQMmO5P/fWgirGicB3yGIgGBTIEVsBIiVtBJlq+MBp46SXj4xEnesrCbO9819c9bQFtDGm8ggSdLhnhvx5Z7hUdQhTGg9uCsxwSCFRg5iAUeOzyUHz98nOGog/etYqMbg4yKYqIg7zYABG5A6Fb5g3/ySQx5FlHek1Dl6VbVlC7XW4Mq+j80aNCgwWsZpvkJGjRo8NpESbghr+msbdbK1Pk8+xNtIEjzSs73vwv/9rfOo90ZxAdgIshWQBKcCUm9I3AByoJzmrPnLvHAD5/g0ghMC7IkQZkuRgx4W30G5YqIvFd4yauRUQKZQymN0kCWywP7rsd/5Fffy8qF85w7l2eV6sDgrAUdgPOXbYAv+/Y+32BfK7TWtFqtst3f3eOkbJzEFpH+2ZI8wGb0MEkSBoPBPf1+v58/rjQZdBXRyB97uahQCQIe5qbCw888eSrsdE798Z133vaFX/nlg3/56ONP/uUjjy7uJqPXMdzqIXFCikjXK2bzJF4XivKBoBDxoUYvWOyiOMErT6iDu1WgDqaj9MtOXE95NXv5JYlXMqE9G977nsUvOecWxcuG9yrF+54vai6kqE2WwqjRe49C8E6Kso8yi2Lzev4bXvl8uNcJi/iZ1f+XolTp6F8YxImoTUuOosG7RvLMk9wbYlZEZvNqEjVb9AvJ54ioBaXUglbqQDH2e1YkcM4vish8Pu98z3t61quew/eMyIL39JzzPaVyea78yt2OodPp/LsobP9BkiRfS0bx17M0QykIaoJZObecc5XzfllGkyQpvV7vf9ZaH7TW/kG73a7mIUC322Vubu4rWZbNra+v9+otPLfzBqiTe601w+Gw1FD9xMRE9Znqn228O0AuiClmJ2b+pUt4YjDqf9X5DE2GiKsa5XnTIklM3uDPWWzupMcapA8+/iR3vON67nr/bRxa/K5/4kx+urSxZEmal2RRb6Va1uH76lqgwVqfr5mkpAJD4HsPPsN73nYd77m1A3oZVB/EYG0biPDi0d5COqAthnfeejMfuiP0f/NQkjsPKANutPmWzpXvSG4ImOZys9BkAzRo0KARABo0aNDglYVs83e5caz2j2RJnnY/IfCZ330fLdujrRPi4ZCo087r87XGoUiSjMCDBF1WR3D0zICHn0JiA6GBJIbQ+lr6v8OLx0kV+8d7nUeoxOct7kSBpmhDBW/Z1eYD77yZL/35oyyTV6kqbSCxRSgMxAtujDyVHgNerq2JW0kESgEgDMN7gyAo+3j3tNazVyIJ9Rrl+t/ee0aj0edWV1e/qrUhy7Ki/thu8Quop8dD0SrN56xYJI+uDUbJ57ozfGnpAn94//2Pf/HXfyPyd//Wx3jvwWfO/+iH3+HE0ewwnsR7+hbfywQS0X0nrueU2xArqVb6ZlFqv3MsOpUdFpHZMOTuINDhyKV3F+epmydpk4ICcYlDYT3nrZee976n8T3nZd7iFj2kWjTWu8WC6OF9Xhsg3lcpwZacVPriNraJDZaGkKU4hDiUz8fNLwZ/cLU5p65K/sUXpMl5vBTmc/LCLS2lYPP5ZVVtXpgy1rIwvKuqYhSlG78qxqKaFfGBCLOi3ISIzBphgfzVAoUPtbhZreWgUnKrErM/sfYH5Qd33i8JLkHY7b1NlYfUSx884oseo5CWwp0XuOWWA/5Sb5ULF5c/udYfft0DrZbGIaTOEoYtRoURXxAEKKVI07Ty2cg7deQ97JeWlv4wTdOv7t+//2uTk5PF49KyKwDr6+tf6vf795Tt/caFku0yAtrtNoPBgI2NDVqt1mfb7faX6qVH9RKF+lpSvm6nM8H6xuj/gB5+FZvP+XqJPGiyLKWNwiiHVzBKoR3AY0fOsrHW4/YD+7nljSFPnk6YasNqmiIejJG8HWBxLq0AkubrrVc4HEpglIAKU7wSLBodOn70rJO/f+hZf/tt76BDkPt35N0K8V7hsWRiCY0iEk9/9Rh/8E/u4oGHvkZCRuKynOvXPF3yr1SkcTVo0KBBIwA0aNCgwauFkoCD86AoU/GLnaMGMoVG0ybjIx/Cv+f2HbST55G4T9SexMcDJIry3d4IOjoCBRuxZy3bwV/+p2+wmoFvQd+C6YLfsChMHu1SFltEv0Of5ZtXX9aJOlwASTJCFQkLIfCv/pt76PSXeOzIGYYhDBIIbF5TbIcbBIHGWanaXuWmVdWuOt+ICiAatqnfr7f90lpXdf9BENytlJqtfr2iN7hzrmeMmS1T+0vBQClFkiRV/XGWZaysrNyxsbFxyDkHLi+rEF33DMhJMeJwhWhQT5uX3DUM5yAOdXd1zf5h2CUQ2P83f/NjkfSk/9/+k/fy8YN3cuzwMwce+9ESzx+B9RGsJpZRpLEdIXYuUakGTyhaIDQHnQPrs5NGp2E71EyH7TuH/RFhEDEcjvACJgoYDPp/HbXan86cxjqw3p333veskr7z/nzq7A+s84sOtZA5Fq2Tk1bREy+pK34jcY5AFyUWFkRJEZuEzBfu7hikEA+8B6Sssc4dHUX5bdOJx93Xr0i9r1K+MU7YtnvMyw3O57HevM4e8ePNMBivilCFIKIUOFF5fbe4Kh2iJPYKnT+/ULxU4aOhEbwIRuWk3nuPMoJRZl4hs5K5UyIuCUTdphTzeNdTSi0oxW6UD1E+cOL7SrFblO8GKrgrjUf/pmX0p1uBvgsbHw4CfcDogI1B0sP6Ra9IlPb7jeKgEpnAu55PeTxzLDrre4GRD3ZVeO+lc/Edu2b47/EkU1N8/l3v/mV+9NgzDFYHnx+Nkq+rAAggyyxZqvFOgbUYrfFK4Z0jsxYhLyPIfwBNkmSF50bA+nr/60ePHp/btWvX8vz8PEmSlHObqampu+M4PjgYDA6VhoDj4l5dBCjFhjAMcc6xtrb2ZaXUws6dO+8LgoDSfPBKpo2O/JxHnejO6bT1nsHAPZilGd6D1uRpVz4FJaSAdRmuuG/FwbNnkSNPP+33Th/g7k+8j8ee/fvHfrLEOzQwOTndXVtf64fF+HCF34mTDCfgnEH5kCS1GJUSuHysDLIWy7FlZmrIVx8885fv++DsZ3717bN5bUC/j5ntMFjZoDXVYWRzkWbUX2GqBe960x7+649f7/+f/+WMjKQQHAoxSasA6wCyYpxLLvg10f8GDRq8RqGbn6BBgwavTRR5/oXBni6WtM0OAC5nIJmnjWVnBJ/9/bf+q5v3eboM0Vned88DmcvyNoFeSBOH121iNcsDPzrF/+8HZ756fp2vJibfEDoNKg0I0QgWpyxWA5K3qsujTVLUu2riNCFsK7LE09Hw2x/a43//Vw/y5ONP8//65uFPnxrIM14EbQKczdBKMFqTpilKadieIm65fbwOvb7hL/p2z4ZheK8x5v15+rMgIu1N0i7tshd5+fxSHAiCAGMMSZKwtrZ2R7/fP1Qalm22/NqkBXl03235bMpv1s8Lkvfx9jA1E33eizu7vuaPGBUFrdDeefHMxg0SH77xwMIMt7xhmnceuI6b9k4TikWJJQhBdIrx6JnQ6I4IoRJCAaMFLX5aF4ZkMxNt2oEhi0cE2tNpB2hviSJ/IDQa7YRQFAFMGMVOrfz1WtyUKGeVMI13F4u+8G1BjHi/Ic455fN/PJUIYIsWgQXjVeRZAiJ55keRhl4SYvFlS8FrCH2/APxVyP0VZ82Wx8jLfP/a9xIqdzYZe13lL+uUWXS1yLMgyucLkv+mpWN/keKfX+Z/V0aNyhe+EEIosmBgZ6B4sxFZ0Ip9RuRGLcwZ8bNG+d1auykjblqrLDTiZwPNm0OjfylU3N4y8s629rS02xmIzzsCKN1utdq3aSPvdC47n6XpX/nMPaGdt5Hml9oh9wSKBcn8Gdu3//eF6zkz1eKD73zbGz78gfe9n8eeeIqlCyt/vZFk/8fE0XeagrwCLkRJWPx6Vx4DovR2Nfgj7/1Za+2vT01NkSQJWZZhjEEpdW8cx/9dkiQ1kWdr/X99nSjFvto68IDW+l9prTHGXHH8VJ9JJBe+nP1wEo/+xzTNW/kJCpc5lCpYtLiig0leHmVFETrHGyfW/9UtN13P5GyXQbyy+9HD/f/OKFiP0zQKumBd5e/ild3sguIMHoPSGu8zjM3HROrboISRpAB/tau79q/evH83U0KuOiUpQTtilMb549KE6ckJGK0jTrFz/ga+/o3n/s+uhRuWHQGLrIFyfUPlLR69d80/wQ0aNHjNoskAaNCgwWuU/7tN0lkRjLjYzUY5U3cxoc+j7u+5PfLvfdeb8ckJRJe+0walDTbpQ6hAW7IMvA25sO75xj88wunz3OMEtFdY60ApxHhslqDI6jQHJ6ogO3krwsQV3QCsoy1wXcD8P/3tT+B1m3849CTnevx/Pb6Kwllrq1Tgl/3zFBv1IAiIoui+MAzvLeuagVlduJADl7n8l4SgTOnPsoyNjY2Prq+vH7LWbgoF1/gZtpBGX9TwKsAlj4eB/s3MuQeSrMNMZ/7+C8sn5Rvf9T7Qz3DPr93OdQvTvGN3ysRuxQ1nhxw5tcKzx1dYXwcdp1gPjhBnWvggIvWe1GdkPqFlhLAbksSrKAVRBINBSjsAm8Uo3c5d1TVkQCaO2Nvd2tu7EucPeUvfwAHr5LzO/KLLfICXPk76VqkgFb8kKJzLLcq8d3hRZCqPEeJtUSKQZwCUGRJlaNFeIwH3V/TrtS+K/Je//4t5/FXPb6G25W0uLxcmyncY9ztQRTaLkrHXKsg3lCQ/F7pUcZ+IKwz+FBpH5D0B2byI6yql9imlD/jcDD4EnxjFrQofGsWCEhcqfKDFT2jFglKC9RlhqPYr5zCSMdVpE5mAYezoxxkr/d4hHUQHp8PokxK1Pukyj03TDbL0kKTu8J5pPhNN85lOBG89MM/b3/puMjfJ/+cr3+Qnzy1J1paF2LPkTZ6sI1aD1WgborXBY6+aUL7d3EmSpGzf9+V2u+1FhDAMabfbOOcYDAZfieP4niRJMMZUhpylqFefk+OlPcPhEKXUnFJqeWpqaotAMD5eyvvCMKTb7S4MBoODo9HoUP21rwYr8OBTKR/6wAZv272Tj7337Xz3h9/0z1xA1p3DSQuHR5GCJHm5jGzOByEvrfIonPd4pzE6JfUppJ5+Ct/+fsydB9a47vZZtPa4wSg3hcyKFxONZA7lDK1IuPlNXX73t+aS//E/LEuYV2LVRBpXzcT83xuFpxEBGjRo0AgADRo0aPDKwRcigM9tmS6rivcGjWUmzGglcPenbmUmjPGDtGAgGnSUL4SSR7OdT9HRDKvDNj987BiPHs7+YOhyn0AvEdamoEO8pFhSyC2jitpuhSUsRIEMBKwTtDEEJEwo+MS7O+ff9aa9LB47y3cfX8q7TeWRO7Is20LCtb62BK3t0nvL21qtFmEYHjTG3FXW+49vzMfJf91ELAgCRqMRGxsbdwwGg0MUn7cUK4zS1ywAlCTR+1ytUQqMCT+9sTq6MwgjlI4+PczMRjS167F+cuFbX//m6IPt9sN8+M4F3nTgOm46uJsbNjLefG6OhefPc/7sBudOr5IMhP4wIc4cFostDBidGLwdMNOeJJgL6Q8TtE4xrZyZilZImnsXZAgZHotgvEY7mdDiPhgKd1qlQmc5mYn9tsMfsvjDoiS0ilCc+5ZCelZIvfdYLzhvMUrIfF4TX9qW+fI/KdtXCN65wuDs5Ys9L0Qgt2vp9nIzAK70vtXtVyhRkGo8bKYGKMoECpebSuZ2elXpiwBa8gwBJR4DhIoF45kVcbuNVncq4w7kS4M97707Hxh1W9HGb7cBNIIRjSmELSsQRQFkKZEK2T0zg1HCxUurxOmIPV1z0JGS2hFZli8bnQ4TUxPRB6c6cN1u4cBbruPGhf3s2LWP73znCP/xP/8ti2f45PSu3f7CYPWTTrKTSrkUUXgbopxCvCCuLJW5ugBQT+MviXqWZQyHQ44fPy67du3yZaq+1pqpqam7rbX3LS8vf7E+x8e9AOqCQHlerLUMBoNeFEVfbLfb99WzgrbzAyjXDGMM7Xb7S6PR6I44jrf4h1wJmcBzl5Cnji37m2/azRtmAn7zQ/v4v/2vp27uiTyzkWQYAqy4rQlPW4Qmi/eCJUR7jVYZeItzCvGOxRPIdx465W+/eZ7dkyEqtLjBOmFrgtQ6ImWIRyMCbxDJcKPj/G9+85f5X7/29btOrPMAClIF4kpDxAzvoF6w0lQBNGjQoBEAGjRo0OCVhlD0Z69LAHlcLUAjScanPoT/wLunUaPl3BLKF+3+nII0zVO1rSWxKWqiw+nTlvu/9zTn1/gLC6AivFVAB+U0rvCS01uMz3IDwjzaWZB5JSgsQQZ7J/jT/+Y3P4QZ9jj01FEOn0VUkCfM1iN05Qa/7sJ9rQRsnCxMTEzcp7U+qJRaqBHxqtZ/O3fwMuoPlGn/cxsbG706+a8Eipew+y0FAK0UnWhmoTc6t6QMqMjdujJYe0c3VH/UCWf/OPa93gPfSWYD/TxzOzvMXd/BdAfcsCDsu243Z8+3Ob3UZm0t4+K5DZaXRqz3MmwMPpPi83tmrWbfrinOX7rERuLREx36I9BBQGw28N5incJ5ReYMxmpCZ0gQnNFh6j2JtvtT0s+kknSVZp/F95S3vcBxUDnpWecXvfc960kdkLmCuEpeK+3J/RDK8pT8p/a4Kzi0bxIc9bKJ//jY+OmicN7nCpHiy0oc/KbxH1stA/MSgNLRv/zmm54SImCURymft/VD5rWYg0rJgtZyszZ+wQT+Ni02EDw4+ka53VogKAw6jRiMCghUABqCSKENtFSL2e4kk2Gb1d4l1LDPfAhBmKE0GJ1nj8zMwL7r2rxh3y5275jm+utm8zKZdsR3Hvw+3/gvx7iwxFenpme/dr4/+iJhcKeIpNalD3iv0KhZJbon4vAuyZ3pXmiujAkBZXcAgNXVVbTWdyilHup0OoRhSBG5/0KSJF9eX1/v1deWKxH5+tjIsozBYPC5IAjunp6eXiiFyHq2QH2NKTOCOp3OwSRJ7k3T9Mtpml6xhKAuAPSAHz59io/dsZepcMhdB2/gWw+eOnx2Mbc5zdv12XzOyOa2VXxeEuK8RZTBE+Uj0PbReAwGhbCaWL7/8Drv+6VlPnRwBx2TkMXrhEwimcOLIwrapMkIideYaDl2qZA/vPvN93/h3z0niStVKZ8LUrauQTTR/wYNGjQCQIMGDRq8KuR/u9RjAI0lwjKl4J/dcwuT+jwGDV5IylZbAt5bJNTgUpy0WB8oHnvuAo88k/1BH3A6wGWSawaEeaZAUUHgbb5NFa9q7y2bUV2X0Y7AjOAf3bnz829/4x4GGyv8/Y8eZdVBoqn6agdBgNaaLMuqVmDXQqbHDeOUUhhjytr/LxQp/zjneiX5rz9+i1N/jfxba1lZWZkbDAY95xzGGKy1pGmKiBBFETbNXpCg1snoJtlQKGVIEyEMgptjmz0zSC/9Cx1F8z6MJvrWH261uwfWR32++8OUyc6TfPwjB5iYE/AD9ATsaytm988yTDSD5Zi18wNWzo1YWxqydnFEf82RJNDyQ3ZMTBFlHS6uDPFBQJgIog2xMljvSG2ereEsJKJIRJN6wauAxHmGNmWERST4tNXZ4dT5J6zjpBK13ytJUsshh0q0p5c5WRRhqfzuZfODMkveV8IAlYP9tRD4FyWwXMN4+alPxau87lZvivwHKHtolCJBwbMq00gpxALlc4M3BRgFWsuCVupmLWohUOaDuhAAAm0ntHZo7QnEooQJXN4vPhAIVG7JGCiF0RpjHIGOMVj2TO/g+t0zZMOY5GKPvTOwb98kokdMTUfM75pmx84OO2ZDpqYMkxMhuhXAqA++y+LRC/yn/+UYF5ZhZiq8+9jyygelNXG3F7/hve85JzjrEe96RvsuPutnrgwlv/Dvtp0RXynCraysHIrjWObn5/2uXbsIgoB2u83s7OzyYDCQegnA+FyvZ/2UxN45RxzHrK6u3hSGoW+1WhhjqvvqY8gYs2U96Ha7XxoOh18ujEWvmgWQiTDC89hzwz8+d6H3Zzv2GvbOGO569xQ/XFxjhCdFYVG5yWuVAaCq1b4sqXEqX8dV5ouMMPAqIMNzZMnJAw8e87e8eTf7ukLYbYPLMFqTxRZaBmMUoi1ahkyYgE996K18/YHn/IMnkNh7XJ7AgSnOli3Gq2vC/w0aNGgEgAYNGjR4hcl/cWn9eJUmaDIi4JMfnvW3vnkOP3gO3E7wAV4cmYCWDNEOlGBTcGaW548P+cb3n+HCBn+RAF6HpFmMoAi0IbUJXhxK55v67dSHsiuAuJSOeG7exUP/+CN3kqwts3jiEoeeWv6zREHqNjfipWN/fdN/LWStTgpK8h9F0WxR8w8wWzyuV3/diqDWyFmNADwwGo0+t7Gx0avXCJd1v1dymH8h4llrEoZSZj6JLRa/JNriHLTag93ttrvL9v3XNoa+t2Nu7s6lpWUe/FHC9bvXeO97roeuBd+DrtAmIFQRO3cF8IZZ7BoMLliWT/bpnR8y6FuGg4xOx7Bz4jrORRv01mJmWiH9LCWNWsRekzlPagWbQWYgsZ5UBK+EoXW5mbkNCFxEijugrD1grU2w9Jxzi1pYyFsGSk8rFqyTJS0sZs4u2qL+P+8GsJkVn7fEy9sKbg6h/LqtUuhdcftYe728leFlAfZrOSc/fQ8AENGbJTm58jVG/Nm8FI+gUHi0EpSvGU+WpD/vCE+g1LzgUi1+VuEDozmgNPsCpe4UkdnQmE8aURij0MohymG0I9SeQHtcGmPyNhFESghFE2ihZRSRypiQITsnNfuvN8zMJgzW++x+S8TUzojr9k6y54YbCFuaqNVBhYKoGF+W+PgUJgwMNd+8/1FcDGEA55eTz++94bpvHbu49M+dlyeA86ro2iE+AfF9lC3GgbmqADC+BowLfqU5Z7/f59KlS6KU8pOTkxhjmJqaYjAYfGF9ff1zw+Fwi6dHPX1/vHNEuR7Fccz6+vpnReRL5bq0nSBR3qaUot1uMzk5+RVr7T2j0eiqY8dhiMVxet3+m8eePfFnb7vhAMau88tv28u7F/r+B4sD6RGQIVi1KfaKzxt6Cg7vbS4MqARnHdqbvNkneRmAUx3Wsw2+/fD6oXfdeubgJ9/dYq4jkKVAmJcwpRYJAbGQxESTih2jDX7vH7+DJ/6vjzG0Qia+mIqbinMT/2/QoEEjADRo0KDBq4iyDaAv4oqCYIAI+Ce/88v4wQkCE8EwhnaEaA0KsmyEUQI+o59BItM8c+w033tkJOsOUi1FNyuPLshFYrPcGTpQOLFI2dPdF3XL3mMlN6nqaA9DuOtDswffct0sg42L/OCRZ7i0zp+MHPhAY7Spov7jafgvROi228BrrQnD8N4oiu6z1i4qpRaKzfvsdjXh9U29c44syxYHg8E96+vrvfKzeO+rVN+y3jhNU7S8+BT1TQNxH0btkLPnsl57EiYm+USW8OBwMPpsR6lPREH3ztW1jLlOl5Ven+9/7xjTU8LbDs5BqwV+AxWFOJ/gfIZqa3R7kskd00zOz7N7WbG+CkunV0nTjF1ze4i6F2DxDLrbYnktZaQdsYc4c2QeEi2kHgLlSQEVgko8WBh5hTVC5jUhkHoJM5ftzhShwofWy6z10ks9i3jybpSekyKk3ikyVSdOuckdziEqrwl3Ne+FvL/EC5P5FxJirkb287HzM9boioh/Xt9fvl8u1Yl4jOiK/+Zp/wolgkie4m+03KZF5eRf3KxRcsAoFrTmgMbPtpQlUA6jTd5SUcAoQ6g1kQbnhEAckYJQeSKBlnG0TEJLjdgzJ9y4d4p918+SZo5BEHDzLTdx3f4Ab1YwnRESFKFfo0BiRBwoDYQwyLhwvsezz+f97ZWZQczwrkuXzn/NebdoFKGX4FYt5k6buUPOZ4veOxybDT25SplHGUUfF+tKpGlKFEVlGz+yLBMR8bOzsxhj2LFjx33OucUkSb5cL/kp5/O4N0C9VMB7z2Aw+HKr1fpCu92eLR9bHz9Zll0mSHS73bvjOD44Go0OXX3NVngxxH7Iw8/2+K2PRoSyyvWzIR9+5w08ubhInwEx0aYHgFOVgWRZXJMLMh5RGkNI4AXxMQmORIOXgOdOpXd864eL/n23vgtj1+kajfYxqAi8x2FJ4yFRt4td6TERKj72oQP8X/4fj31gMPDfXisSnZSYXHRo6H+DBg0aAaBBgwYNXqUFrG3IRhl4iDptRsMh4qFFi4CU3/3tlt+9a5VOuwNrMQQtyEa5M3wWg85dtY0JCLs7eer5mP/49cMsx0Db4LzF2RHGgPaWLF1FK4UzId460IJNMwKtSeKU0BgyHCZskY3WCB28bZ5zv/H+2wltwtJA8Q8PL7GagQqFzPnK/K+e8n+tEfZy010Rcq2JouiuMAzv9d73tNYLzrmetXZRRGaVUgvjBC3Lsp7WetYYQxzHvdXV1ZsKN/DL+obDZsmCUgrvNtuBXZWkOl99VufyFmVhaD7Tj9cOtbqQZaATDoXCzdrTDTW3KZ9iVAg+r+o9eTbjyPE+bzywl44eQUvDSGNaAYQjfJaBshAIsv86Wje9gZabZcdywvLSMvFqj307Ztizfw9nF4/jjl9ChRGDOGaQWOLMM0o9w8zhVABBSOpBK+i0NYkTRklC5hw+gpH29I0m8Xo2c/5gkjky6xYV7DNK3Zo5FkVk1np/MhP/jHH0rC/EFO/AgVEK63NP89wboDAJ9A7lPb5oAydFurOv1dzLNViQvXCU/+URGZF8zKqy/SObteWiSgJbSHJq6+dSRfp23hYxb5molZoXYcIoFhQ+0N6iReaNYiFUciBQcmug1H6jhYCMrhoQKjA6wpgALwEiQsu0aEUBThnExrSMZSoU2gbaxjHVDZicDtn/pja79kzTbk2gpM3+aCcmAqeXCNoeaaWgHFgF7QAkIYuHKBMi3uD0JN979HFWUkh0QCIBOuROY3zS9smpkecQLl1MrCwqx4Yjz2D35aVTl7VMHM/oGb9ty2+oFGmaAnkJUZZlnD9/Xqy1fteuXUxNTWGt/VKapl9dXV3tpWladRnJ24yqbUsLSgyHQ/r9/keDIHgoDEPK9oClWFj/fOXfURTR6XS+EsfxTf1+vzI5LbOc6uubSE7fnzjBXz5/Mf3MO/a2ieIhH7n9DTz0yDH/t4sjSUxAlqd2obVGOY9zebtUpYrfUSze5algvswFE3CSESvBhPCdh0YffeTOS/f/6sEd6NYI4iHgcc5ijRC0JyDxaC2IHjAVrPMv/tsPfOu+L35bIgNxphCtyGxK0NIkyRZDgAYNGjRoBIAGDRo0eCWQDTMkCPCpZTQcMjHZZrg2JGTADTu57yMfuIHduxxsOPDtPEfXjYpa9phQFOHEJCvrQ0Y+5IePneSZo4Qo6CcZvkwN9UUBt2QgCnyYX5Kn8lprmei0sfEIb1MQQwBMCXz8vbt3XzcRkKUxP3ryJIsX+KJXuVHcy3VhLw3ByvKBMAwJguDuwvSvVyPvC2X9/3j6rlJq1jlHv9//6nA4/GxJKMZNAl8KNiPQ438LKJnNXPotW2yijWNCQRpA12iZV96itSexlsAahqOM54/3eMvZPgdmpyFbRUyr+AlH+EDjjAHTxbT3wNRbILgBtS9i52AAg1UYXIALp9DTbfRsi9MnztKNAqIsI00dg2FMa5CS2hRxHq8DhtrhlMYrQxwFxC5jFKf0shEqaJOgSDJHJEKs9ELi/EIG51NhNwjWMa9gIkMvKnwvc9LDgdMerM+Hkcs7A3g8pUOeQxCfdwmoor+uuHss6+PleAa8PAFAilKEehlJ/p3EO7SAxhft/DaNEZV4RKkqgyQfmz4witu0MJ+37ZPZQPSC8X4i0P7mQNifk32fR/gRJhWEAlFgicKQQKtcSCDDeI8OhdC0aEeKVgBKUjptw97rdjG3bwd7b72Bzo4povYMqA7oGZA+jJ4mHS0SBOtAWljB5z3tReX97V0WsLQqPHNyjYGAbSlGwwQChfWcFw/aEThPYFy2kaJS5TWp11jvcF6qc/1yfv/6WLDWMhqNWF1dvQN4aOfOnXS7XWZnZ5fjOJbhcLhFWLiW+TscDg+FYfhlY8y9YRheJjyO+wp47wnDcKHdbt89Go2+WmYb1AUp73MpK1Aa8XBshd//7pMnP3PrG99CGFqum7S8723zfGfxHGvJen6StcZlHk3RRWPsK4gHJx5X3OWUywXBLCVWsDrigfu/8yzvuf2TtLNztEyRNuZU3g5QdG5C4RPwMeJ6fOh9b+b2A9/2Dx1GNJDZGGUga0h/gwYNGgGgQYMGDV4leIX3hXuYg/5gyEQAOoV/8um3fuEdt8wRscpw4GkRIaKK/gBF9MoBOiIzLZ4/MeSbP1hkKSF1gcJv9nvKnyGuKHq2iJfC0E0KMuAJ2+G+oR2cUoDxMeLgtjfgP/6eW5gKYH095h8eOcLz63wuM0UHtJeZgl26cHvviaKIdrt9bxiG9xYb8dl6CcDVSESapg9sbGzcU9YK/7SM4up+A+MCgFJqwWbyLe9AO4XY6GaD36/FzmvvJhQZSmfgPaIMTjQnT6ccPXaBm956ABgSKnLzRpXhtMKagNR0aLX2YLpvAfZCOA2TDliD7BLc+Eb2vPkt7FnusffpI5w7fpzTR46SXbrEjBJ2dVr4OMYmKU48sWRYMcSSseotIxxRZBE0fedIvCIRTyqeUCC2nqH3u8WRKKU+mCpZUJZZLX7eellSsOiQReuETG12Bqjs8WRri76ygaAlJ83FL1n7P6+YGHDZuJC6+79HSenmL0Uqf070dNH6UEl57vOSFKO4GUCLm1VKLWiRBaVlIRAWFD402DAUWQgVhECoICrq+yOl6GiYMEIn0rRVhrEJxnsmo4iJTgtlDF48XiukFRBOzLLj+j285Za3suvNb4Ub3watqbykRBvwBtx5WLEMLyyBDAh8Up4UcBnaa3AtSFosHhvy7AkYKHDtmFEc9zBTs24YpKKCD2jXP2w9CC4V73v4zrz3esk5VfSGSPhpVpOXmUBra2uHkiQRpZSfm5tj586dJEny0Pnz5+8oHfpfyKW/PN+j0Qit9WejKLo3DMNqjJVR/fH5LSKE/3/2/jzIkuw67wR/597r7m+JJSPXWjJryQJqA6oKYGEhQGwkAVGgxG1agNSiWiTVEjCjpmZa0rQRPWbqISWZNfCP/mlSbYSNDTUmE1sDTItNijvBpYoAAZJIoFBr1ha1ZGZl5RqZEfEWd7/3nPnjukdGZhUIUgAIEHhfWlhEvljeC7/uHvd85zvfV5aMx+NPTKdTqeualNKOv8mOCsAZmlpcCGw1kU8de5G//b57OOQHLBUN77jvMHd+9mW7eB6p1dBQIKnGOSF1XhJ0t/5kAXAgsUvcoItmNQjZtG87wae/YB/80tPTT3zXfcuUvkUaA1FMC1R8TnURBVpEZ1y3Z8b/5cffw3/3kT+gCo7tmA1DxS0YgAUWWGBBACywwAILfEOK/1BUxLbNu8DOntl7uP8O7Ef++usY6bO0kwkwQrp58TpFBhSUPtAmo55B6/bzuYce4UvP5JH+mRqu7EiAV9sY73RqlaIoaKIxnU5PKsLqeEg9m7E/wPd/516OrAYsRl48M+Hh5yafnO5srr969eg1OdzvHQwGH722u/dqcV+7Z37btj02m80+3G/Ur80c/2oLkmtnh68UDG4co35OE3irEAb3C2lNpC5FbC1hTdSmLMoK84EwGNG0W5w8tcHGuQl7D1ZEnUOYY77FFSV4R4pC2xYEhsB+IitEEolAEYwyVDA+AAdbDh56HQfPnOPws09z6pkn2HjxGdpL5xkmz9ALW5uXc0Sg88xU8BNlO8LASgoPRQvzBI1AK9lDYBaNAsdc7UitHPGqa8FkqRHWorLusCJlD4ATIK12xX+0XOhbNrPAd4dM89nW5aAZ6VVaxrsL/68XCXBt8X9lHTWPaLtuVFtylF8f4+ed4HeIAEHECufsqHNy1GVzv9KLHHZODwVv9wThSHb4N0qEQozKGSVKJY7KwzAIVXAsVSOGwVgpC4ZeGFiksMRSaQyHQBAaF7DhEkuHrmffzbdyw2vvYvk1d8D1r4HBYVotCb4T4ptkImDpEHFzmTpdQPCENnRj5y4bQ1CwtW089tgptqf5U1GAgjW1BqUaC/6oWjPG2lasN0yUEgtrhmwk6+f/9au+/vu16MeIehO/06dPC2D79+9n//7999d1/YHz589/sm1bhsPhzvjAl0OfSlLXNZPJ5IMhhE9UVXVVIkB/rvWFfe9fUlUVg8Hg/hjjsVdTAABEbVAqaiJPnUSefPGyHbhlTFu/xE2H9vCu+/fw3O9dOjxtORmddaRpNtXc8V8VEMveACaR1JECJg5JihuUpLZhrnBhxid/5be/yN1H38JwdYTTKaiizlA0E3AOnBYUlti+tM73vf0NfNfrP2OffrSVMkBU8viXfXVrt8ACCyywIAAWWGCBBf4LkNqId55kEQIsVSBT+Ed//x4OjC4wSIlSK2Rc5U5Qk4e6XTI0KkJFk0Y8e6rl9//kJBsJUlGAKNomnO8KGQtgYN2Gz/UWXpLD3Moi0LYR70vAKBW+8y7se954KzI9RxpczyPPvsALF/mgGxTMY4tannv+qn7/lPrYr7XBYPDREMJaPxLQd9lfrfu+K/N7fTKZvG86nW5cmdHXnYixfuP+NeFrOslDX6CmZMdT5DgWQIox5koVbXFyKAnbTihmmspRyC79pp6igAsvTTj57Gn277sBGxhaKN63OO+pLGIpEpoITf4Llw+xx1ijoSJRA5HCJ8L+Eva07L3pjex93TrNi49y8fnH2D71FM3ls5TLRjuviSoMU0kxXGJ7LkzmhpvOCJUx10jTCnXK3f/KO6bOKCL4pBTK0Ro76JRxNFtqnOHUJuKsEfNNFDvbDSyjZjvTJn0igEg/19wbBHbFn2QFyquRAF9PXE3m5NclXOn8i3SGfxiB7OwfsjKgcLDmvDsanL8/OI4KccOLrXmRI144WDi5P3hZKshGjAMHlYNKjIETKoGh94xKR1V6VkcVhRjLlWNlWLBUOAIJR8LEMdizhlvez9KNt3Do9tczvu31cOgmGK2BGwMjMIdqR7g0QFgF2YMLa0Q9Q74EhgSU5Kb4AG0LL53f4pmnTrNUBpppxBRCBduz+ri6as3wqBVLhq0pcTtfA/Gk4BCyYWj6GhWQu8m9ngQQEabTKS+//LKIiO3du5dDhw59omka2dzc/IrF/24SQFXZ2tr6pIh8eM+ePT/fGw9eSwrtTgrpSMmfb5rmTdc+1849Cce0bQmDwOV55POPv8h3vvbN4E5ShRnv/I5b+PzTD514eR3ZauY7fgnqu/PNXC7+8UAidSSUab4+nIHWCXBEUxoHD/zppXe/560nH/jh7z6K5zTONSiQVGmd4hGcOIIpe4uW7e3n+cc/9j38yf/wW5hAVUDTCLYTR7ggARZYYIEFAbDAAgss8JeCHBQGziTH7iWliXD/67C3v/F6iniSSkqwsis4ZyRpqaoASaGBYjSiiUP+8HNP8sQ6EgWmsWW0MiRuzfBOEA1AwOhkwKIIChJxZBO/0pV4H5BQMZlc4NYhd3z/249y8x5Ps7XNNAnHjj/PDJAwwnRKipHwVSrtO9M/RqPRJ4qiuH93oX9tt7+PAezTANq2PTafzz8ynU43mqbZMQfrRwq+FsXktT9j9+uJsfllI06QiIiVJpBMNhLhaPIcQuKZwocl9UJMETWhlEB9KXJm/SLpriOUo4rEFJcM0QakprA2O3y3W8AE3AANRVeoDjBGuYh25ErbTXJcxM1jyptu4bp73gjPPcLmiaeJWxe5fOY0m+cuopM5K14Zl56ZrymTsSnGdhTmlihQCpE8o6zWyeChSR4vtuSTvq1xHHJRiV6WvMnhWnkS8UcUXQc2BAeqXZAZCA7F0O7npt76z3Jxg/SjKPbqBdbXmBC4NjmipyrEdbP/ZLm/71QNXiA4WXNY4TsfisLL/cG5+4PTQx6aIBxyzg4Vzq0FL1TeUQgEgUqUoQgDD0OBSmBUOpYGgXERWAmOcVUwGhaEwoEz/GCJ1X37Wd5/kH0330ax9wbcDbfCoZth+UAu/F1FjEJwricn6JMbcju/RUxzpJylnWBRTwARppstLz73MtvnYVQus6UbzCNIgISdSS5O1HyTxBdq5UHMlkz0rEgLlhNDek+Br8V67Cb9dj9WFAWTyYTTp09LCMGWl5c5ePCgpZSkN+j7s9Ab+5lZHzf48Z5ofLUEgWtf13A4vL9pmg+1bfvxPuWk/3pFKKoR83oOyWgVHnr0RS69783csLSEtRNuu3Efb75rjeMnNu55oeWRBmjJIx1mDkdALJNMJnqFPOvU/5WvmM7rPOLhGrZSpJjz4G///uO8497XcsN4AK6l6Hw22m7cJpjgNBGcMWwv8aa7b+f73+Ptf/+DJFFgUA6Z1+3C/2+BBRZYEAALLLDAAn/ZKBCSJbxUJJ0xHMB/+2NvYOgusly2MHOgniTGTOf4MuGdhxYcJW0MrD9/gc/8yfNcmuXRXiIkWsSB1wBWoF28oIkDizjJDtJJc82QkuF8QaMeB7z9DUvH33zHDRTNGarRgIdfOM3xF9LDCjRtIlk2nMr+7//lRUA39//Rsizf22/Y+01538m/pmBYA3Zk/5PJ5Fgv+99dRPQ/62uB3WTClYJBie38QZGEdyDUGwm/DoxbyiKIL03skJVCrXOWy4DzilNDGtg+XbP1UsO+UYEfD8DNs0Gji3iZY81FZHISDl6Hx1HhiZQ4LXBpiI+52GuYESrFhTFYBTqC/Qdh3+tYecMcTjzF+PTzrJx6htnpdZqzJ7GtC6ifsRYiJ+eeMgamKBMxQrKcYW+GwyicY+4Fl8A7R0h6tBb3gdbxsEvypDp3yCETFVmLIg+LcBYnaOosAU2RLtbSzPBiJLNOOfJnjwJ83Yi33V1fJ520fTfBk2tbJ4LvZP5BOBxEjjqxsXdyZ+nduwvP2sB5vEScc5TekQkAT+ksz/yLY+Bg5ISRg4FzjMvAyqhktfDs9cq4UorlATZaIo32MDx0A4dufx1Lt7wWbjgKwxUol7rIt5JWIWnI3h1WZy8QAZLkCt62SPVZSOcp3WVKpkgqQDv3twjTlyecOn6WkcH25YbKhsxSzTQp4t3RGOtPqnBEpVxL6pdU9KDpfB1JOJe67jU4Cyj+60IC9Coe5xzT6ZSXXnpJDh06ZOPxmH379lnTNPLnTRrp0TQNW1tbtznnLo7H46tn+nc9b///siwZDAYfnc/nH08pXRVrmFQxJ+A8baxZdvD083zwC489+4lDbxxCc5lCJrz9nqN88fgzD5979rIkjFlKuKogRQMdIGY4maESSVzxVfTk+0UgAEOiQCuR1sEjj/GvPvOZp//FD7xjD8NhhMLjMLST9Sc0E2zTmmo0JjQn+PEffQ+f+sLvMtsEbTP524UTLLDAAgssCIAFFlhggT/35rXfZOZqgtzTt1yF76ozcpHhsN2fR2nJEnxSSwV8z5uwt73+EHuGL8PmFKjAFXgvBAsgSoyRUEfw+9iYDvj8oy/yzIsstWRhAKWj3o5UZYDm1W+RvUWbKIQyMJ9HPHN8nHKwgHfdcxuHRoG4HSn3rfHQc09ycov7hsPA5VmdM8WLkPPvvood5GAw+EBVVT/lvadtW8xsI4SwtntjvnsD32/Q27b95Hw+P1bXNSEEyrIkpbTjAdCnC/zF8GX8EgySGV5kx8E+qdEmpSyzVBdRjHhScWsILeYwcaUqzJuGtT0VwXWvz8Ns27jw0oS9h1eQEiirbnjXgBkpnUNnL1C2R8A5vF/BMwDXOYJ1i1hWZddtdyQpwI/IgmKHSAO3XE914xuo7jwNJx5n8thnufTiw7QXYWU05cClyLAWLpmjRBhEx0Cg0EQpyiwZnoRDcCa4LFle82rvFs+hqOlMJ6E/KObuVeGMqDyS55iN1BUjYld86F55zB1O8vjAVw4G/GouVkXwO4SVSFf8S3YpcGI4NJv/ddRWcP6oFzkYkCPeydEgHA5O7imcrJXOMwqOgMM7CB6qoFQ+ZQJAjFEIDL2w5B1DjLF4VqvAahVYqgr2LA1pDRiusXLkNvbffh/la+6E64/Cyj7wFUhBxNMiGIL3oaPzOr830Xzhpwh+AGyj7RaiM7wkRCPYBLSE1EJbMtkwzrwIw0HFS2cnhOU9iDia+eSzxbB4W9T6c+A3IBzK+Y6uVBwmXYL812iRvlJSR9M0jEYjmqZhc3MTQG699VZbXV1le3v7/s3NzWN/1s/vu//9XH+XFrIRQvhgVVWf6JMA4OoY092PlWW5VhTF/bPZ7NjVcYNCaiLFYEBb12gBL0355OceXeddr38DZQJtJ7zu1tfwusMv8cizl8dzmGTrBA8aSZ2KxxHzXw/rvBoljxfMmkgVRrRJQSPlALancKbhf/qtTx//F+/+jrcTxFG4lAlf6/w3tPN8KMeweYHxnlVuu2mVH3zfzfa//fILMosNVQhMo3YeBLtDCRy9ZgSJu//AdQMxeuWP34I9WGCBBRYEwAILLPDtVvzvnqI0ilywo8A0b8y7bo5LkHs6Q4yU3Z4FonpAGVpkVeCf/Z3v5JCehelmNoEKHoqK+dYWxajChxGz6UWCU1Tg6Zcdv/aHJ9lsmYQCYps7tUmgbqUT/qddHoMuy0zNIyYMC2HeppwRrjX7kvKOW8Teeut+QjNDy32cvOR48PgZNgSa6ChCSSv1nysBoC/k+w1430XrZP/vHQ6HP99/TVe0r/VFQT+7m1LacM6tFUWxZmZMp9OPbW1tfWw+n+9IgPtZ/z8rd/zVKwS7isLJH6Wd//pdEXYmQptSNoLzgUSiUcWF3uiuPeEcheDWLbnjXrgzzSNLozFt3aIDx3A0RtsJs0Y4e+4iN1yOLO0psgObFxgYbXOR6Cuc2wP1BSivA0bgBvmM80Zy4H0uCCHgd/qw3VlpDmyQfw+/BEt74fbrGd98J+Mzj/PyIw+y8difcmO1yeTsBsPoGVNweeqYYJQ+UWlNRcOwgG1zeBEcAdThnFA47kS3fqixdCxFGUcNS0o4LCKHnHFCJZ0UFydiidgVNnTmepZZk5yJLrlbadjO+94bwL3KSWaWlSe7KRsxdgz98lHQq87Bvsh0lq9UEUFQpCMdnMuHP0cAWi7oRQ6LWCHi1rzz95fOfWdwcqT0RuEdpXOMywqJcwprGTpjWBgDnxgUMArZ8K/QlhXxrBUle0Ng2Xv2BPCDIZeKVZZuuYPr7ryH8ujdcPg1sLIf/JA2GRKKnTMz0DvxNTvUozqXO8gUULhc6NcXEJ3jzIENadOMYigwn0FwbF1seOLRC6QkbDbGYN+YzWZOY4kQirfN6nSslPL9TbJjqvNHDJkgNgFfqEmbVEnmsVfR/ryimLevfH94tXXq/++co21bnHOEEJhOpzz33HOyf/9+u/nmmz//xBNPSK8cuFY90Bf+1547qsp8Pv/kpUuXPrJv376PXvt1u+JFiTFSVRVLS0ufr+taptPpFWNQA+dLUpPAw0yy1crnnt7kuVMT7j20n8rXbG+f4W++/VYeeer09unTyDAMmM5bCAFIJI0EU4JBsCzkaAkkCqQomFnCp5qSBqmhKGHbwQOPq/zGg4/bj//QG0hxA1+2DInEOuH8/sy4zS/CUkkzP894NObHf/itfP5zL3z+yVO8aRaz7wzicK0SOvq6DCtcjm0u9J3ma0p7kiC7x5jTP/caL7DAAgssCIAFFljgW44EgLwxSjt9uVd+ni/7qKMMShHhr78Te/1NKxTtOi44CCWxjfhU45whaqS54qSCwrM5C/zhQy/wwgXeN9NcQ+ayqshzv95jmhDTXV3P/JxJQo6fSkqMCgMHrbIHePNr9rO/UgbBM00rPPHSFicvcWYrkUkNp2CJLsvqzzw+u130d0toy7Kkqqqfcs6tXbtp370J74r6tf7767r++HQ6/UhK6c+dBf4XW9CvPDbQaTayjD2CieGdohKfxLk1xG97y4epDCWlL3Au/24p5kM3m0cuXLrMxsWGpT1jCIKGhHOKBYf4bcwuQHMOqkneZbcBPJgHo6XF6PrPr9yM9xKPXnDih8BBGJQwWOa60T4OHrmLjWOfoqxOEs9sw6UGrVucJIYehs6xFRyblkgpouIpioKq9Uznxiw2VCL3ijlapHTIWhImIpROKFpsw4xJ6l6PXFX4dfGXvVR5FxfjDPRrPArgdlqYtvN/6fqZrut+9tJ/LxDEHfbO3elxR0vn3x28uz84O1I6pfJCERKVSwRzDINnWDrGFQxcpLSWgRpVa6wEzzA4lgvHyrBiHIaMiiGDapm0vJ/b3voOqtteD7feDkv7gRK1CvVD1PfLaDgi0g3y5HPQdZ/JShenXQa8bEM6T0qbmNW0rTIsR9DMICVIgdMvXeLUqQmTbU80T+sSSRIqIOJx2GEnvvFOJymlJxHbSObOmNEmFZQSNUPFfd2rv2vvCX1M4Pb29kfM7KOrq6sf3dzc/EjTNIQQdgiD3hD02uSQXhHQJQN8rGmaj1ZVtUM27r5f7SYUOpXR0bqu16+QDR5LESXlcZyUHfbPbfETz5+e/cKdB5YprGVl6DiwNOetd4146OUpkzjHF4FkRp7lSWinxffZkoLoHIjDnANNOJrsF6N5RGAqA5zN+ezDF3nLvZe5++5VJpdfYFx5ilBgsxopqswW+EipDm81h5bm/OgP3XX///xvn8AEGiWrimgI3WrWcYYRwBdA/SrXUidCWigAFlhggQUBsMACC3w74kraeb81b7sSUXt/sZ2isdtedd8YOumnw8WWZYEf+zvvAqkJgxFpPseXgYBiTAlV3nGlGspqmdgqT57a5nc/8zQvX+RTrXQpa15APFc6oVcXtq6Tl7puRCHmF0GRjGGCm/djb773NQyKhDmhjgO+9PhjnD7LdTndLXYy9H7cIf25CAC4MpPfxWt9tCzL9345+e+1Zm2qStM0H9/e3v7wbDZjt+P/Xx7Vc/VrdZY71EE6X3RxBx2y5pFDDllzWCY9okOCYGqIZNNDJzDbnrF5MREPDwmDlZzO5nNcXKPKbHYeXzxHsXQY5DqwZVCfC1XnUdodsz3fS9ule0Q0zxPv2L+Rjf1kBaoRXH8Et/917Fs6wMVnP8/48cfRF16k0vPUoWGrEaRJ6MATk9I0LU2MSKwzCVE4RAo0ViDuXhE92vr0OUgPqxjmKJ3pUjLOOvXd0cvO40Iu/sXy8TBLf+Y58DVbQdk979/H+oU83kBWDQhCEDnqRe4I4u4tvHtXELlz4PRo6ZUqJKqgDIJmd39rGBSOQeEJIlRWsuLH7HEDlkQYWcuoVAYjg6qgHe4h7r+Z6pY3sHzLncg998Lavjzj7wvwVVbpcKX492hHWPT3mazE0O4R2z3IbRchniLFlxHdgtTAoMK2txD1xLlw+tQlNi9HinKZZjInJiG2SpuUmNhO6k6q6rqqrovIGmYbZraRC+Qr6Q5XqLCrr/ev9Zpd+3M7AuBjdV1/bHV11aqq+ljbthu9Cmh3Mf9qP68nAMyMyWTyce/9h3qyoFcivZoXwGg0+kTTNG+aTCYAFEXAUi7gyYp+nMD2lH/35Avnf+Hd9x0F3SKUxsqS563338HvPvlFO3sKUZSZK3bc/vr17j0Arpym3dp3YylYJhmiJOYKf/wY7/7so6cfOHrXAWaNMq4qCCW1zRgEyWxjhNKG1POWVT/jB7/3Pn7vgSfswccQb+D8EKVBXTdJQp1fiSvYMQmwK/SnXks0LrDAAgt8A+AWh2CBBRb4RpMAurMRjpkEuNpkvPtQMdpum1cAnoG0DIEP/k1v9991kOn0IuICQok1CpIQq/FBaXWOJcWFJU5egN/73HMcfwGZk39cC5hkt3h2Ome6E/l3hRBQxPJjSRxlWVDUcw6U8LZ71rj1+hUkzkkKZ7YTX3zmDJebfLc1D+ISiOTOs7mvSADs7uJ1kX8f6Lr/r/i6vuPWb/y7KL+Nzu3/w3Vd77j8/6Ws7TUdyFfSAr4LRZPCmVsTc0uYTboCarsMBUVREXyJcwERR/AFZrB5WTn38pzN83OYpqzsnjlIBaV3FH5O05yC5gWwC+BnO103ozfRcztvtiPiFYyE0RKZkJjRUhNdIqlls0C3lEcL7n43e7/j+7jxrd/DDfe9kdVbbmS4b8hoCcbDlooZ4yKxZwRrQxiGfOYORRkHYyiBgZQMPEulsztCaNeCb8fOp7FzHBTxh03KwkmF2AChwJnrpPj57ZXO/F8H+uZVpOaZEHB4PF7ySgZxB724o8G5ewsn95TOva10drT0MPDGyCVGXhmFfCyWhrBUCaNSGYuyLJE1L+wNnj1BWHaBqhhQjNYYHrqVtbvezHVv/z5W3vMjyHt+CK6/FQZjajPmCZpeYg2kRilMCOpwKoj67L5vYadK3KGlHMAM9GVS+wIWz1G6rghUIHlIJWdPzVh/ZsrGRdjanOVi0vLZYgpmTLpif13NzvTJFmY2uXItp69r0b8bfTG++6139J9Op0wmk/eVZfmh8Xi8ow7oPUFijK96He8mAba3tz88mUyONU2zoxDoxo6ueh1dJOD9VVXdf+VcUpCmu+dn9UgRHLMaHnthg5c2FfUVFhuGpXH08B7e9vrruXHIu1ybEzfy3wfp/obkZU1ypdgWdhMAeZ1F8ghNC5ye8eCnHz3L8Rc28dVeoMwpHK4B3xI1QWNASVEninaD/eOGH//A29nj88Ba6P48NApxh9uNkOruEnXIrvLfegJbw2ILvsACC3zD4BeHYIEFFvhGEwBX0s1bhLSrX5x9AaybwM/DygpUCMqAhrsO8Qf/z//bd9+yWl5gVCltM6MaLKFNjXMtSsSc0qZEcBWwxh8+fJ7/8Bsv8dwGP9MGIJS0UcAc0htfWcJ1kX+7S6s8Xi1ZZu0cg8JR1Ik79/Dif/PXXrd6yxqUNodiiU8/eYlf+cxLP3Gu5SEpHEmysZtogRd/TfvxldjdoffeMxqN1sbj8e+EEIa7P3ety/5uzGazn+k6fldJdL92q3d1Sb/jigU7ud1Xnk8QcV1mfB7LEFM8qMPmHlaCcL0T2e+R/Q5bCuIoCscoFKyMh6wujVgeDSnLxJEbVti/fw/VcNiZNChJFTcIiBeiRZwvcbIC5R5gNXcBk+XYxv4V70jsJZsJ7mzXU+4cEgHDOcP5lLXGYsAYxgcoDh1hae9e2kJoXUsZEqPKoJlTOkPoIstclccOkkdiZoTEdXPp0gwNJgqThJ1WPEZ5yCgPmYZk+BmiirTgGkRSNwbwytlv4yutr+xerV1r1K9bJ/U3cgaB6wrIvo/uJKs3zGUFgBjOMXaOvc7rWuHlDYXjztLr0cqZH3hl6IyRp3sTBs4xqkYMCs+yOFa9sdcbe0Jkyc8IMmdp74jB/jVWbruL67/jnRx66/cxuPedcN1tUA5ofE10DgsV5nNah5CXp5KcvpCLfd9tdzqtQq/4MXYiC/GnYfantJOHoX2JgZ8jTQuNIurBVji1Pue5py6S2oI6FdROaHFEze9bhIhvkrjWTOaqnFDsghkbEUO1d47vswflFQX21eTAV3d17vb02H2P6FHX9XoI4XQI4b2q+nhvAtoX+a/2/bvvH52c/+Pe+58eDAZXqQd2GwTuGmM62jTNv88jAD0h0p11CqUELCmx1vNHDq18/123rEGzQSgdFiOhWOLEy6d/4oWL/ExrieS6NbXOUUH6prvfcc10pGzE2Z2/Jo7ofB4RQJnM9PTKoP6Be++8hcpFLE5RlxBniLnsBUGBxJbCRVJquf7GWzh38eWffuKZ6c80phhK6saLdrxs1cCku/Z1F5ctmWjYmS/SxSZggQUWWBAACyywwLcRZPetSBDiNV9Q7XL+tyuVmgVK5iwD//TH7/6Fd967RohnKMvcy9W6yRv7zurbFXkS2IdlTp5TfuXBU/ze57dl5qD1A6K6budomAjeu87gTNldTl2Rl2ZTO0yoRFmJyne/pvw3P/SO2ximywx84FI75D8++AR//OzsR+aAhYJIQhN419nfy1cOknLO4b1nOBwyHo//c1mWrwNIKW2IyHB34bdb8tt19I5Np9Mfm81mpJTw3u+4dV+b3f21IQD6F3M1AfBq5IQT1xX/2SAveHfUO3dbEcL3FD681we/d3k0YjQYsDwesrI8ZM/yiLU9q+xZXWJpVFEVnrIIVFVBWF2CYYHrfBbaVIMTciFd4cMYwgpYhWLdGl8hAHb/StI56wu5S2eELo6vn34XRAKkADKAagn27md53z5W9q0xGHtCoawuFRQC9bRmPslrL1Yg5vLrMjLhZRFQr8JqggsKExU/Nnxp+BLzpRGfw8XOWTzLntX68HquLu7E/XkvvGu+92oCQHaKN3a6qLnTmwmA3PXvjP88R5xP48LrkcLb0cLpoTLIbQMHA3EMnWPoPEPnqXxB6TyFA68tA2lYLlpWB5GVJWHPvgEr1+1h/2tew6F77mP/W76b8r63weE7YbgXQsEUiJJTELpXkrUcCQrtfkN7JTdlrkue6AkOicB5mD9Bmn2eOHuGoJfw1g2lNwKyhG2WPPd0y8ULgjFg1hqbbZuVB7F7U1lvjaeT2pPR7ElFJoptqLKhZlh337DuCL9agX+VUz5fPVG3W85/7TUYY+zvI4+XZbkGzHuVUFVVV6UM7C7mdxMDHWnwmaqq/n4/VtTP/V/73GZ2NKX071NKGynF7LvYpVt475CUI0Lrmj8dlO1Pv/3ewwyYUHiwec3S0ioXNyc8e3L2W5caOxldrrZ3HdFO3ZOjM7E8EOLE8hUjgorHpMAkIGHA9lZzTOrJT7/+tYfZMxZCaAiFoZayOWQ0JEWQBC7laM86ctPNd/KpTz3xHydRLxiQimsuLQVv0lFSXed/52ZTdddtXBAACyywwDcECw+ABRZY4BtPAvQtIK5OBrj6VrXLG4AZBfDuN2Dvf/ft6OQEy0uB+WyTajhkMp0QhksgIdfYCiEUTGs49sQLfOaLL7OVIBYlKWWLdQkBSwk0EXy5M52vcmX233CYdDJjcaCGj5Hbx/zS2++8gVWZUllDTBVPv3iOzz914cQWgA/Elp2mT3CeJra4r0DB9rLazvX/E2VZvrffePfmftd2DrtN+Yaqrm9tbb2p7/xf07X7+q5pP9og9mcXoH0GuxNUXGki4yh2xqFPiso9l7Yn5WxqTCeOy14551pWBo6V0hOYcWBVeH7duOk1I974lqMMj6zkPDmEQiLOamI8x3z2JColg5US/K0Utqd3A3x1HkMBCXjAW9E38xDXU1HdGIg4aBO4UY4iPLzM4LrDlNcfIDy7l8Gll7nu1EusPX2aUycucXpDOTc3UsjeB6V2qhaUJFAaaxHuSbCRLB6P5jZEbFtMzogknLWopZ1IQHGdiOTLnDt/UXn5lys3d4iSnQKyHzcxcBTO25K41ARnR53nYDfCsFQ48OIp8JTOU5mjNKHSQCGRUmuWBsZ1ewtuODRg32rB8rhidf+NLB+8FX/93XDD6+CGuyGsgStpNaIEghPEKlDNowh9U71fP9tVcEnswh2sv4vsDH7AJYiPE2dfJM6ex+k2RQJiglBkkuei8ehDp3j8kSlnzrRc2LzAhQnMBeoUmEdlHnmgVfdkizsRE09GYx1kjLlCRAvnXKs77e4vc9l8jccBXq3rv/sx731v6EdVVRt9p74nEHvT0VcjF/tCP6XEbDb71NbW1ieBD4QQdh7vf1b/c/pEgBjj3rZtdm4BKUHhA6ltcMAW8NDz5//DMyc3fvRNNwyhnVJ5Y19oeNNrD3L8fPvZl/9kU1praLu/GCY5vcN2/T1x3bXV/85qhjpBsWzi5zzq4InnkN/8g6dt9a8f4dYbBjjJtKFLgqaEyLyr1x14xTUXuf3G6/ih9950/P/1qy+KkkcAbPcfL6EbQdg1RLYw/ltggQW+SbBQACywwALfuMJ/Z1PUm63tkrXTd8CuvPX93AIYAf/3H7/9p7/jtjFLZYvVE4oSmmbCaGkpb/rMk1QwBWXI2c2SX/vDZ/m1P04ylyH4ghRbEGEwqLDUYpoogieldqeTap1cNxf/rvs/kJQVM77rCP/xv/qu21jxm1RlyVY95A8ePcl/fmh7zwYQiiGzGBGfxwsG1YgU46u0Ka9G3/0fDAbvHQ6HH93dVdudu33tBj2l9HiM8VObm5uf2h3Lpao7s71fmxQA+woEBq94jTuO4vQfd7Wa6dlk6SFL+mTU9NmU0p+a2WbUuO6FO50T0Jil56UneEdQz/Zmok0tq3tH7F0e5mIvCOK6TraHRiNtainLAa7qIwGrK3ST0MVOpk6V4a6oc3WHo7jyXjo2QLKDOUXuKEYC3lXI6oDhvjGFqxnuH3HgwJiDKwVIZNpss9XMaVOTa38zTFPOLzdIsJLgvOXi6ayhZ5OlR0xUd+zO+rxzk1ft9pvIn/Piu2Z9rmFEdnf8d3sN9AoAJ+AcQ+d04L3d4B37Q+B1peeewnFn5cKwEqF0jgqh6uL/SmeUoWV5OOe6Q447Xr+fe99yC4fvvoHVm29keNNduFvfCHe8E9aOQlgCKTHnwZeYeEyhFMGnPIYgvcZau6LfdeNCLnWt/swK9P8CLU62wV6E5iHq7Yex+iVKm+KiwFyhaWFecf6k8SefOcHzzze0qWIyn+AHsNVArY46Ga3JCxG/mbv+HhUmZjID5gk7m0mkrldt0vWEv0IKyNdAAXBtAf9qn9t9X+gL+D4NwHu/4/6/m0S4Vh2gqp/03v/9six3Uke6aNIdArK7Zw3ruv73s9l8o+chTcn33JhwQUhhgLbxP91709JP33HjfgZpjlQFrp4xGo3ZtoovPXX+308iG9mUtVfCXBmrkN4DwHRnzEBFrqKZDaUMgfk8snVh+x33vO7g0esPLiPakN1gHKYNUuRviU3EuZLB0ojNy5scvvlWHvj0U+lizYN1RxoSSkgR6WIJO7qsUyCwo2C76gazwAILLPCXjIUCYIEFFvgmQN+Ty51+3dkU9aZ/Q0ZhSIwtrstsf9ebsPe+7RZ88zJJBOcDpJoqeFJsSOJBPWU1RpuWJi3xhSfP8ht/WP8bc5CsxFKTpadAnE9wKM5DivMcUwckdUjIZlopKjiHeA+xZeCUQwPe9d633szBcYPEKaYDttoBD6+fZ8uyNLRpW4LLnWTxgVk9Rbos+hivds/uDbT6uL/BYPDe0Wj0ic7Qb6d7f+37Xd+/vr29veO2vXvT3ktzv3Zwr7KOr/Z53XkNPWI33KFYVleY4swwYb0QD8LYiWyI84fmBl4TPhTUwHZrWIKKikDk4oXE8cfPs7JnmQO37wWrYb6FG1WUYuAmzPQ0s+3HWAolVCHvxN0qWJHPM1GyJLcL6koBvL/GxXt3jaHENCWEYue3MS0wN0TcIViuYe8pKLdgICwfXOJNtxh712H82BmOP61cii3RHJUPJDHmbcQrTRXcuww5FAbuvS7aL6vF46nlrBg4CSgBtTxHfe0a/xdxcb0evVsu3xdR7mpiyXdDHV4E5/KamXOleHfUOXdnCLyt9PLeIHLUaaT0AYci1uJLj/eRpDUSPHvXAnfdtsqdr1/jxnvXYMXYpkZGhxnvfSusvAnsCNgQyKZsQtsd/pBfSXvNmuysYcJMkZALraSdzFxy3kO2nqwhnkK3vkjTPoSzkzjbzslyVoEUoMaZZy/wpWObnDmTmM0CSVp8FdiaR5I4VALiDTHuBDYssZ6ws6aynZI+Ek0nqoqa5S51T3wBqvYKEuarWcdXJRHs1Z9j9+f6x3ab9/UE42610G4SqP98P/c/m83w3r+pqqqLg8Fg5+f3JEJvPliWJSsrK89ubW1J/5yF96hGnIOWrJDZbOCpk1tsvL6ikgGjkQPdYs+g4m333Mwbv/TUsy9/SWU0DlzYmlONRsQkNLFFTCmCwzReTUSK78Z4ABJBDDUFV/LSpeZ9n/i1h+zmG9/NndftRWdn8T77XZglcEJYWYVUEDc32TNYplw1/vt//Lp/9U//58f+dQ3UqQR1mazSZheRfS1V2mY/gkXxv8ACCywIgAUWWODbEp1c84rpXzcz2W3qBwNPPVVirAkoA2B1meIDP3AXQ7tAKVNUBleC0JUctYbLxXaTGFZ7ubRR8Cu/+yTPneefT4FQeWLMJnRu5xu7olr6lxbA50xpNXKrSg1JSkgtS2Lcf3T5gdtvWGK5jMQGai15+vQWx1+KG7XLrtROFGcONb+rIFZUZafY7+Wyu7Ozh8PhB8qy/JD3fq3feO/O5L42dqtpmvXZbPbhpml2ZLfflEve/Z7abc7FjOTybH0+Xg5gQ7DjlpfznsLcocaEOULQXAJuzSPLgzGzpuHkizXLe16mGHj2HBnCeBliBFEkzClki9ScYL5VMdAKhrkIQMZZErxTS2bbLrx9meI/m34phg8D+qR5M6NwruuiZ41+CgqDBl82sFzjBsqNgzFudJAD1yUeeugSp15uuXhZQaEQh1dZouZhsIdnTftzrWNDYBIETALJAqYOU8ldbfnGFRH5vEsbqqwnaE3CPc77w4NQUDlFYsOgEkYevJsjAfaswG23rHLnaw9y7x17qQ62cN0MhoYPa7ilNVg6AO4AxNVOHlKSI0DnvQNDznzv7x+i+drMQ/07RGLbf4FTMuUTM0GQWkjnoH6Sevtx2vYZSi7hY4BYQONhXtBuzHj2qcs89+yE6WxMOSjYrGvmbcQ8aONynzmrNybJ2EhmZ5NyIpqtK7vd/7MHgNJ//JUVAN/0tG2nAugVAXVdb0wmk4875z7UKwl2X++9f0BRFIzHy+PJdD7BJHNPdiUU1SznvTzx3FlOXYhcf90apAmEQPAta0XDe974Go49/hSnt+YMBZr5DPWDbOIaUzYZ7K7Zvuvfx3rupGjESPAe9SUX2oYnT/Hwp79w+t7D330LYxvi2xmIoa6gNSBGCiB4B9LSTp7lbfcf5m+8+zn7pQemkiwSbUBRVMQUOyJb0VcQpT3RuCAAFlhggQUBsMACCyzQBTex09WLqe1qL2PcEQV/7Z003/u2o5TT54GW5D0iRrAc7SZWIBTgA64YsjUf8OAfr/Pph9g7BdQHsBrXmTDJNRsxZ7lw16yBzhJSyxt2B/iUqNTYG+DNt1/PTXtLnF7AKNlKJY+cuMDzF9kbuztsVyYgVuStoDhMtJsvlVd0/oqioKqqtdFo9Indrty7CYL+63vyoG3bjel0+sHZbHasbduvayzcl8crO/75dTiunvno5nJd78puCGknGT1iJ3CyJsiGg0lrrNfKocIgpDzm77qioTCHa8bMz2/hj1/GFY675QB7b92bs+GJFD5QFI7GTWnnJ6ktUNgcN5oSOQCMgRGJIUaRu9yA78YChIYsH9duvDw7g6tW0BUuDkP8DNiE5hRMn8fiWRKX0LKmCApVyXBccnTPKtcf8ag/iXvsDPV6Qqdkv/JUYjHcm5IcHZfuRxvSscbSZ1tNn5tr/GSvAjERxNkrjOT+IusuX6HRLF+pRBWjKIr3D8rynwVszae0Qc1xTfFeAoxKTyk1ThKjJbjlCNx++17uvP06brppL8VqBUWEMGFKJPoKJ1MKm+K6OFDbMUqvEMpMjvW1c9nHgxrJelm32+Ft8utv8dQIE2AL2ssw34D2Jerth/DpeQIziBGpC7ARRIduKw8/9ALHH7/M6ZcNvMcCRGpmSYjOE/EkE6Ip0ex4UlmPyno0W0+qZ3u/DdXO7V4ysamaCSQRf9V1f+3HfyX4213+InVds7W19eEQwnuXl5eP9p/fTQCICEVRsLS8/MS01pusNcziFUdEId/TgfWX2tueOrH57H033sywmUDhQRJDJrzprht5w9Gn7PKT2avzYmuIV0Io6P0F+jtR793CrqcQUyoBi4noWiKwfob7fv2Bp+xNr7mO7zh6ANqzWSjkKkQSTZpl3xc3xGLNeFDjiwn/9Q++gwcf+G08Ddt4tDX6wYS80nr1/L/w5c07FlhggQX+EndrCyywwAJ/yTvHqwuNK9s1varqiC04WkoiATiyyk/96A98JyPZpLCWLKlNJBe7OjPgNCBaUs+VaukgT57Y4n/71ae4NGdDyiEuFKg1ryiCdkQEsnsz3nXmDcogFLSE1LAE3HUIe/0NSwxsSjOf02jBS5dbHjpxlo2+COk7lEQ8EUFR6YgOudLV72f7O7OsteFw+PO7u/vXFgm9XFdVaZpmYz6ff2Q+nx/bPbv7zVIgfLnC5qru6I5Xg2BmbVJOJJONqHIiqjuTjKZNRqPZcb2OQiOOzdqYtoIy5sIGPPHoGR774ikuPHsZ6iG0Y0gDSFBqTbANrH6B2dbjzKdPkHSdwDk8W3iaflqXpJDyaqEklAYldv/PbuOmeX1LgeBmwCVIp2D6FGnyOMoZkmzSWk2TumNQeljzDK8PvOt9d/Ge993BG9884sAh0NTSzCdnvDSsjqqlQq100TasiQ/Gpv2kxoRZwhVQDcL4y9blX2bm+2u+gXBuLcb4qXo2/UmL7WdLxz3j0u5dKY2VKlHJlLXVxNFbHW9+0yrf/b2v4bvecyu33j2k2DeDcosUalLwhLLCO0WbS8TmFHAK3KUryZL5F8sXVaIjXpS27/RLdnmX7gty4T+jYBPHS1h8BuZfwiafo938Q+Llz2DTJyjTRYqU8DOPNCNIK8zPw+OPvMTn//gEFy4I4leJOLbqCREDXzBrhKiQTFGzDUUaRVo12TazDbOrTRhNIPUGevJnXyt/VbD7HtOrjZqmYT6ff6S/D/X3qH6UoL9vDYfDI74IWbFhPZFAF/aSv/bSjPUvPnOC89NEbQ5cAA8hzjg0Ft5z/x3cMOCHfJuD9XKqiHSk7e5jn71btBvrElO8KYUEYoQ61fiRZ1vhoePIA59/jklcAbeKaUkTBe8rCh86X4nsRzIYFUwvneKeo6t84P2HrAJGzPBEqs5I1q5l0ewrE28LLLDAAl/3+/fiECywwALfaHR9+y50T3fZjucxbK+wEiAo/IMPHvz097/nNmT7Jaqco0brcw6zdt/kUgArURuz3Szxn37vcf73392UbYGZBQTDO8mdOddFSMmVjbp2HSPDZy+ApARRBkQkKhVwQ8X9/6e3HfzQd92+xlgvI8DMrXLsxW1+6fOnfvbUjN9IErpccuscqTsjqs5EzlmeMe03ySJCWZaMRqOfHg6HH7o2v/taNUAIgRjjxnw+/8h0Ov14v+ne/XXfuBXdbSp3dVEq/Sx095WezlzPcm9dxCHiSifukIisemG/E3coCKuBKzPqSjbOUwTnBUuJ6XZkPpkznyb2LK0xdAUMB/mcSjXOKcEnRGo0TnA6xfsWcYbD4fB4Ap4u4948og6xAFbgGOAYgniCA3Et6AzieWhegPopUvsYjT2LCxcQmzIwR4glMveQHHiXZ8mXhEMHxxy5+QBr+0rET0HSUttGNjcn/0co0lEzO5NMnyO4w877JXV22kioxVZNrp5Q6JUhX3GWXK4h3q5sCDrRy1VrduVxuWICCHiRFW9pXnruH5X6fUtFfOPQtxSWCbtbjsAb7zvE29/+Gu6//whHX7PMcE+DhE2Sq9GyQkMgFBXBDylTwLWG0xZncygMcQ24EpFuPEgT2BxoaEVI4rqwRiUQ8dQEpgS2EM6g8QVi/Qxp/hhWP4o1j0B8DJdeoJQJzGcwMyQuQVyhPm88/tAL/NEfPcm5sxC1wvyYOimTpqYBohVMG6VWaMwRlc1G5ZGk9kyLnFSzk9oRFn04XT6gbsfcNLvVy1cgAr65RwT6MaTdBEB33jwuIq8riuJ1/ePX3rt8KJi2zdNNUz8iKRFMUJd9KLzke74auGbrv/2OO25YvX5voHBzEKVwASwwGB3gxdMv/J31c/ozCDQoaSc2VnfuP5kAyNvdfFdPeDNEA2ZKG8ANPMk0T4dMNn/66JHruG7vCmKJtp5SBsM5xWIkhCqTtqmlKId4Kzl840383m8/9VuqnMxUoSP14id23AD/ig99LLDAAt8qWIwALLDAAt8ExX+/eYxX73stkLq5yzbCd7wW++vffQ++vUgpbRflFoAGE4geLDm8GT4Jo+XrePDTT/Hrf3CSuoBpC67M8X0xRpAupbkzdbtCAuSOkfSbVwxvkdBtdg+UcM8txeffcvsh9oY5oY5IMaZOFU+/dIoXtvgnTVUi0eEtdkZo4IjdU2QHenN9OzNvoEMIDAaD+8uy/JBzbseZu5fPvqLQM6Nt20/O5/OP93P//eN9DNc3E3pyYvd717EuIpm+sd4OH9swsQ2UDUXOqnA2YUeiQIrQGmhy+FGJ95FJPUedMSpKNi96nn18gjbPcPvrDnFLdQj2OigDThRkSqEtLs5xcQpxC8oLWLiAhAOI3wcyzn8ipQsr7+iB7BtgOGpgA/QyNJtQn4HmJKYnUDmBuEsgU8RFxAoQz47HBAl1DWm2SVkO2HfrHt556FZuf91hnn/+Mn/yhRf40y9c+uEz51tmqX3SlGMCGy4UR8UEjUaLdaZm8iqF41/Stas2qcriJ0ZFeq9L8Uzd8B/GQ370tlvhtTePuf8Nt3LLTWtcd8MYBjOQLbS9jBUtvhpgXonJaKdKURSIcwSJpNlL1G2k1DnJ3YS4m/DFwWza2JkugqOkQnF4GrJHwATiFNIWsE0zO4vGC6T4Mi6dAztLaRcQLoO0oAFaAdsDtsLll6Y8/tBJnnj0NOdOQ6iWmMyURreI4olWUKdEmxQVlwtGU6KynkzXk7kNM7bBjUEnf9Fr468adit4dvuSNE3D1tbWB8uytNFotPN4fw8zy+kcw/HwP0ynk1+0Zp7pJ83JGt7yvSABL1/ipudeOmVvOHorEYePEfEFpUVuXB1y/x238sePPU3TzX1EawiFw1JWFPSE7tXEV46ObMwoymUIW7QxZiXCAB57Hvm1333Ubrv+HRzZtzePkKQJYKSkeQ5JhDg3hisj3OwyNx86yIf+3i2f/egvPC8OMLoUGelm/Rdd/wUWWGBBACywwAILXNsN0SsPCoDL0m1ayrKmjPC3/9bdXHfA4+pNKlGyaSCYCaZG4yG4xMAUdMTll7b57d95hMeeQ5ql/OOLKhKnnpQ8ErpOPPEqWabSN+es61AbhSle8zPeet3I3vOWO7l5HwzSRVzwNBY4c3HG0yfPczlBKgtC7NLlJO7ImLPvwDBveHdszOmL/176v9ZLZa/t5u9WBMxms4/PZrMP13W9U/D3m+3eIPCboeD/cp/zOwQQXbA9iAminSoDPYFQmMmaGQ8nxzia3Rl9NmhQH2jNITYlaUtwAdUR9XyMtZGnHttgXs+Yp0vc+Npllg4OkeWiW+QZXgw05iK+fRkrn8fKvbiwisgYZAkYgx92a1bkIiWBsUXS51A9gzSbEC/h9SLoFsGmBEl5PlyhcQ3etZi2+Cg4BRcVxiNoZuj8FK4sOfSaMYduW+aWu27hDd95iV//ned5/gQfWj/B/RtbfDC27afESpxboXT+YJvmZ4109TX1l0j6hBDeq3H+QBRlZcTP33wQ7rtzxHvedgffcc/N+DCDooZ4Hp1PEZ+gcDipQErEGgaq2XU/FeBGSFESXEFwU+L0OCJnMX+CVB7EheugWIUwQjpPAE+b1y9ehPYcNBdBN0AnuHYb0SmS5jhrKK0FLSGtQKyhrqEBpg3nT5/mS184weOPXGDzYgBWiVGY1pepzaAYEuOYOibaNCOSiYCkbj0lOa7J1s2kUdOzChPFgcVdd7pOzSN/dvH/V4kI2H19737dvU/F1tbWm8qy/HxRFDsEwO5IwdFSxda2X0sTvyHmwDySHE7rXIwLTBM8/PRx3vGGvZR7ClJjVEARE5Vrufe1t3D3bc/ap59V8ZlBzPfLnRfZFeH9+MhVf3FKWg0d+RDBw9xgZvDAn5z9yTffsf6z+991M8NRyLNoKeDNgUSiQVnsQbcjlU+07Sk+8DffzG888Lz94Tp5nsn5XWR2fudwu1JuFlhggQUWBMACCyzwbQXXl36v3BAZO58LwbAGvue7gn33W46yp9zAp5QLMRIqHmcOl7LI02mWeyY35IEvPM/nHuXfxACTeR4hrWcNxIKqWqHWOZAQcztGgFftEbXBO8GL4MWBKZXBaw8WvPP1N7AnvITME4RlJhPH8xcmPHOOz9aQTcWsxFsi7fLAy88SswlUipjL3X/vPWVZfqgoivudc7Rtu+GcW+s31682DjCZTD7cNA0xxh3/gKu6bN9kRcKfTQM56GekXe61m9lGEs56XJPMzkbjZGtyuDZZUvMEHNvzOVVoGZdgzrFdJ6JFlocVvml47pkNLm1vcOu5Ebe9/jCHDu/Dr4zz4H4pWU5uDdgUFy+T7DTNvCQxRGxE4VcIxTL4JaDAWqibSJsu4cNLKOcQnVC4Gudb0AaigkZCLwCXTukhMUf3aYBkmf+RAW5I7ki3GxAKDt28zKGbb+UNb7mbP/7TF/nt33vy/i8+0j57+gw/eXm7+TlLEfPVWUV7zcwrSIC/8PqL8uUEyv3Muu8+9oC3xJCmcYm16/by8+986w2877vv5fW372epmiHpEha3EW1B57igUFUIKaczzLqIz6LMFyYCKWWpT5k9M0JogQZsm1ifY96eRts94JbAVRTRcKlG0qX8Fs+DbiC2BVJToGCpq787E7jkofYwr6CpSFvKiec3eeiLz/PEo3O2t8AoaGKioclKi9LRYsxjpIk5S2CeEq35jdbcmaR2UpE2qR7HbNu6OXbbde0my7L/HW8A+6uvB99tQtp7mOycM6pMJpNjKysrOOdIKV3tGQAslSWXffF3t3z4OVWHmuAsZsNEcljeVjIeftrOvHR+eujwvr34ogFziFNCusyt1+3ljUev54vPnmLuc/HuyKNd1t3QXR9zKRGR/POjcwQGzGKTz/0syiJOwC+N117Ymvzcrz7wpZ+9+479vP5mDzGnSXhXgCswSXk0JdaQJiyVJVM7y3//j97BF/7HT1MDrbZXe5/moNnORPRK6swCCyywwIIAWGCBBb5tCAAvA9QiypyycrR1lkr6ckBqIhQtEhtu3s9/96EPvpu9dg65/DK+GGbTOIm4KuCip0ieUXIYgTklZ+sB/58/eJLnW/75pdZRjMZY3Mpxa2VFE2PngqKEpPjO+T+5PqApIpJnQksc+JItm3NgzB3vv/86rg+nKQfKbF4yigUUK3z+xed5+iJvLyqhTSHLzCXRBkeD7lRSzmZZWRACbZs3xuPx+KdGo9FH++59WZZrKaWdzXNKad17f9R7T9M0653jf/55u8YDeuXAN0UEYO9yzm6T7ysyXOuSsK/kzQsihnQxYF5oBTaS6vHWG2YOVVdEkbdVWDm2iFMlpYK6NbYSDD041zDRBjUlNJ5LZxJPTaacXX+aw0cucc+9dzK6+wikyzC2HPWoCdjGhwrv56huoebwMoQYaGtPiuR8eIQgDSKXCW6eZf5ak1KN05jj5pxB02TH+jblAiJpF1MfwRVQV6AeGgU3AKtorcbcFIrI8orwvd97G29605184Usv85u/+qWf/ZM/3frZjXP67pnNPnvRXCuuuLpYV0UsdZ1Qd1WxtkMe7bZD30XE5FhG29U9NZxI58ZvnU+Fw1kg+EQx5eT73sbD73//O3nTG+9kz56Stt4gzmuqatAZNDQgIXfDW83xigg0LZSdosLaLnaxjzXstiZa58edEaTB9DJtEzANHT/XIrSY1YjO8DJDqDOZQsKaGinK7vkVouTni5F26tl+eYlHv3SSRx9+jjNnayZzMHNEM6apxryjpaCuE422NEmo1WhiS6OsNyrrtcnxaJw0ZXvnSJqilq/FZIJZ52/SGUEKDhPp7mH52P9Vmft/NaLp1cgmESHGyObm5pv27Nnz+cFgcNX9ydqET8qB5b0/O635d/PNrQme7nruvAF9wTQ2nLzMdV88fs7uuf469oQRrUSoGka6hdYN33PPTTz0+Cn7zVOIiZJUcS5zbOAISfCWwEWSg8Y7zAq8RlzPSTT59uwcXJi2G0OBTz9p8sYvPmN79h3mhvEyjnn+2tpR+AExNSgN5fISevEio1HFvbce4oPvOWC/+AfnxCwLTKJmcqEoB7RN6owEQ74PLEiABRZYYEEALLDAAt9WNyBx1CYMh0PmdS5my7KkqWPu1sTIwOBHf+CWnz28FlkqYi4qLG8w69QwMIe1RiEBxKMpEMt9/PpnHueJM/zkxQZwBWJZAlpmlzksNfkO2NdC5vAoZqCSuzNCHjmWKFliDrzx9n3HX3vDiOWipm4aVAJtLDg/VZ45t83MQRsNVLvZfyMpWQ7qApDyxtNANRJCQVVVFEXxgV7Cf6XYkh0fgKIojorITvFf1/Wxv8prbx0JlDvkgDjUFMHlKHfp0wHcdnJ2Vowlg9KwsSFHxDhapogzxVGQ61TLXgISs7ljKzgLWBSsidjUkHqLsj3FoY0JN7z1Bqj8lbny2IJNQBIaI2FQAZewRJbtO48Tnws6jXhT0LzGXXXX2b1LLvhbyZ1nDeTxAQE1bN7QzEDSgHqiXN6qubS1zcbWJpuzCbXWWIBqNGT/ocMcOHiU226+nR/7+/fx3e/Y5nd/+9gDv/KpR8U5fVX5+H+5+kP/zALUujGW3rvu+7/vxof/9t94C6+97SgvvPgMj3zpNKsrQ6oSptuXGY9KBpUwGhYMhgVlqZQFUFh2eWs0ZzoWrjtODhrLSoAiX6ckBdeCzAgGvntyh+ZFsTaTC9ZgqcEsdgQIufivE9QNRAcygGRsXZhz8Yzw+U+/yMnnp5w911I3jlY9STzRPLXTnCVgjlaFRo2GRGtGa2y06s/k7j8nk3Iimj6pygk1bVWtM6fsz2/X1Xm7s+C+9WFmTKfTY0VRfCyE8FNVVe2MJxXeU7SJ5DzFePhv5vPZh2myyZ9HcmKCE6LAZoQvPXmai2+8k/GekhhayiCITlkuhBtXlnnznUf40/Mn2G6y4l/tChkjvfO+7br3uJzg4Mn3kPy1gAVUPI04tkz51J88zxvu3MeB1++D7VNUAwe+QJtIGBa08xlMtnHDismli+w9cAP/4APfwx/96f/3X65P+J8ux2xVkwTaOMdVQ7RpQBeF/wILLLAgABZYYIFvOyitznBAPcty2aJyRBIgLFcBmUfefif2g99zN3uqDTQqzoZo2yJeCGWBxkgRgbIEbWG4j0efm/BrD5zk9Dl+ThUGgwiWqCO4UOJ8Tpvvi50kue3vNSAWUcnS/FRDNQjMolKqcrTi4PfedwsH96+R0sugRggVjQ44dWGbF17m45qjqnPEvSqJhKp0Ew3dHGq/ETWhqkqGw+FHi6K4f7dUflcxt+GcW+sc/5lOpx+cTCbH9FtoA7nTnaaXTOdtuubItBazdTE2ENsQ8yTSoVZku1G9V10iqUNVMA8EQTL/QlF4vBkNOZe7VaWOM+rmRV7aeJnLbot9Ny5x8IZDsDKEojPrcw3BK6Q5JEU04s1ykep9TitICu2VMZZc63XFf+uhcdlIcNbSzjS/zZWtrRkXzl/m8uWaEyc3uLyduHih5dIluLQJW9Ncs0bAfA3hEsqj+OA5eOgmrr/hKLXs4fojN9iFk2ek785/vUY+simjXFW8mhmtwnY6wL/7xDGm239A3Wwj0uZ6PEFVwOoYVpeFffuW2bc6ZmWlZHW5YnXPiPFY2L9/QDV0lKMKypBVEz5lli4BwyIfWAd5VEcR0Uy0aE+6JPJ4hSLOdy+xzAX3DLASrAD1tFPjzKkLPPH4szz71DZnTsLmZteIDSXRHI1miX+rntagIUdPtgptMtrIdpPsgah2tjU9ruo2VHVdTddVQU1zugjC7iXpI0W/nSAizOdznHMfGQwGP1WW5c7jeUUN52B5OPjQ1rD6MM2EpErlAzHFrIQKMG/hS0+k2557eePZ6/bsx2N4bTMx5x2rSwVvev2t3PbEKTv7kspcs5IrdIITk5Qd+ftTWLrzqSNorpbpR0SLLkVmzqPHkd/79HG77cZ3cGhlP027QTlocS6ibaIYDphvbTNYWmM0WqWZ1tx6eMQ/+nu3/4uf+fmn/qeafD1nFlfROEHMdSozXXgDLrDAAgsCYIEFFvj2IgAUGIQBTWwQHG1SUCgLD/PELWPe+48/8FZuWKpx9QbN3FF6j7Zzgi8JRUUzm2aJvkGrBVttxX/6nc/z2IuUjeXmbuESKYFZQK3M9YQ3RPtovgAmXSl3tXReLaA2ZwS8447hmbfcupfCtcxniaE4kgS2KXn8xHlOb/DhtujysTVhomi/8TeX57/NYZbrG+c9g8HgvYPB4KeujcvqC3zv/VqfCDCdTj82m82OtW02D/ymkPl/lcXlbnsAszwC0BdLakZECTii2oYIZ5KlY63IGk43amyiZocNjvQ7+/7nqQiF83j6WMRsujiPkYtbkYm2nH/wKfbfMObwzZscuH4vK3uGLO0ZwlIJgwLSJGeSdbFi9F1n1dzhL5byTHk/tKwCTYJpS5wrs+0J21s1ly5MubwxZ2uz5tLGhAvnt7m4BRdnsDWH6ST70bXNEvOmZJ48rQpb8+2PqMQTeC2TpeNPvvDcMeW5NiXYrMEq9wp/iL+sdYsEfuePnvhwmtQfb+pc8A+H/JBTKB33rI75V7Rsj0pbGo83GVebjCpYGsPK6pCVJbjx0JjVJc/q3lWW94wZLVUMlweMlwPFuIRJm6u40kPYtQ79DH0nJ0d7pYVCzNcy5iEWtHPh8qU5Z1/e4uypS5x+6QIvn97mwsU8mdHisOAxKZgrNMlI5qjNaDSPojRJaQ3aJButcbxRv56UkynZI9HSiWj6ZLKsGFDr5vzpiSy3QwT8VXT6/2rgvSelRF3XbG9vv68oit+pqmrn/pajWJVBVbI6Hv6/L2/KP9AE5vJoEKlFCiFinDPWH3n+Ze694xBr4pC2RTRLUkRmHLluhTffdohnXzrNixHcwCEpX7NZ0eVwNkBRhIhZ7II+uyL8Wm7GPBFPJPFbn578i9e+9oV/9SPvuwtrJrhmTnApj+/EknK0RIqKH62QNidsXjrD3/mbb+EP/ugZ+81HVByZFyQLwBh7R0yRzgVjgQUWWGBBACywwALfPjCUVlsK71EfaOIcDA4sD97VXpw8+He+d9/vfO99h6B+iiBTkg0wSrwvwDlSrQQJWQbc5u7/A3/yHL/+R5MPn5vRSpVHf4m5E1S6gmieJrU4L1kqjOsanC4rAbDsB2Ag1YBGc0f5+lXe//7vuIlbl2q0nlGEEqcNdWuc3lKOPXuWy8A8QVEYKTW5UblT6LosRVXDNBtnDQYjBoPBR0MIO7L/3lSrn68NIfSGWh/Z2tr6WNM033Txfl81CWAuF0xAn5werom3M4xkehLHRFI6JsZGI64w842JO4Ijz1QnsC5iUeeRUowUIOEpndEGR1sn5smQbWX78oTzJ08xXr3A2t4x+w4us//AMksrBatrY6QCipBn2VME2m62Hdpmm5iE2LTEmGjrSD1pmWzPmc+Ui+e2mc+Mra2W6SQxnwrTScv2FLZbOK+w3cCshjaVRA3M1TNr5USr9ogVo3dt1Vt/w1QJlTs619Q2bVaXhDHMor1iBMDMUHFf5npzryDhdiNTYLLzuHZJGN6ufAWdiV2L44WL9cf3LI0oB+5dkzh9sE76y1XgaBTQlp9drgY/ORNFa5g1LeXEKLdheHnOKBjnTs5YGTqWVucsLQ+ohp7RuGC8UjIcBfbuW6asYDgqqQaeImSCKP+uaaeQjDESo9K2iaaNpCho8ly+NGeypZw/O+Hl0xucOz+lqQVhSFVUbM6mTFIkqaKWssGfeXBCrY5aldaERj2t6nqb5HgyzrTGyWScVGjMdEO1L/pfjeb89uv8X7XJ7O5fW1tbn/Lef2Tv3r0fLYqClCKlc6SmxgfHymj4E/Vo/A/mm5s0mrJFrICq0Up25//jJ07xnre8ln3XCcQmp3NERXTGSlnxPffezMNPnrazZ5Fp0mz+h8NEMQJmBaA4y/Escm3s7M5Z3imGGNC6luc3m3/9S586/q+OHN7LW153HdacROMUV62wdXGD5YPXMZnWpMvnWFlZpcSj87P8kx/7Ph7/l7/xU5c3+VgqfGacBDRGPLyqgecCCyywwIIAWGCBBb7F4YiakALapsUXAdrI9OLkwXe/Fvvg930HtvkCo9EMKZQ6Rlo1Bgi05E3k8gjSFrEWzsWK//SbT/PSJT4+VQjOYaqI5hquLEtSNGJqcT4/nl9FPwpAN0ueR5S1CGg9ZdXDfTcPf/2+W1YZpg1m6igHJajSRuGZM5s8cbr5WNttJEVkRxGuBn1b2hmYGs6VFIVnNBr9fAjh/t3F284mtCMAVJW6ro9NJpOPzWazncSA/nv+Kq/9VQWoSTf3n6XTyVtel94t3brF6ZQAKDgnhw1QtdKi3A9WmvSRawIhZJvBZGhrtCEQLOGTUUSjlIK2hsmmUp6fcf6lmlPjLUZjT1Epo1HJcOgpKwFtSG2LWoMYea5bfI6CS4a2uQit55H53JjXUM+zt2CMgSZ6YuOom5Km1TxLTmKOMbNccEYz5sT12rljSXSdQo4aHI4iJxvSehSQKhcOTd2dV19m7v8rpy/8BUkakasi31qM8d7975o0zYOX57MHh1XF6rD6X2JsPlvX81+sVdabpBul455R4X54VI6RAC44agFJkXntkAizRrlwcYIQ8UEpSihKo6oCZQnDylMWgnOGI/seJBIhlDsz5W3MREATjTZCUk9sPHXrqGdC3QixWSLFQIrkmX4N1KrElA0Qo+U1jSbUSWlyhU+rdrxNHGtNziS19Zhk3cw2VDkbjbNqRuo6/maGiaDmds7uK9f2txcREGPEe0/nXcJkMvnYaDT6aAghqwMsi+CdtgyLwMrS8ifa6fyDGhsKD4V3xKhEhIE3vvQc8tjzZ+zOtRWGSkfIGY5Eadvcd9Mab33tMscnW8X6lBbXiUOEjgn2WSlCnvfvk190FwkgxhVPABmyqcraYMAfPz6XX/rUF+3O17yfQ4M90E4hRQrx1LMWH0oauQTR45eG1GfOcN9r7uZDf+/1H/0f/u2jH6ub1MVo5OdbbL4XWGCBBQGwwAILfFsW/+DBQZtacLAyKIlt5MYBd/zD/+pt3HrQMz1/AVkZYJowGpwE0ApaoXRlNvdyJedj4Fc+/RifexihLLDaEYn4rkaK0WOlIi7vwLI4PCK7jKGSy7ZdRQ4jIFoClJtW+PHvvucoB8YK7RbDcgmra8SEeQo8/PxpXtjmIzrIJmOmDb5LHbPETrydaS6kyqJiOB5+aDAYfQh0J0Krl/T3/xcRZrPZJ7e3tz9Y1/U3Zczf1+I86H/XV+aKX/nYIBuDiSDKSRw0asfUsaFGawYp6lqJuzObhxnisr+DOkjJqEmUzuF8wEelSgVBHEXhiVGoa+PypYiTGhFlaZwYlI4ieEwjpEi2ixBMlJYmdxd31ldIKbt+J3Mkc1khEANtEtrWM2si8yaxnWBTPVspG8y1xnakWW+9HYuinzOxZrtuP6LdpdLG/CYenFSoxK7DeeVcSFkP/UoyIAejfeVCvyefdpQCVysBQudWn3MEjIuXzz84Xl7Ch4Lt+ZSYZv9kaVAcLIbhvWpyMDpZc84dicHRuEzMxJTyXL0pPhlzLxTREwpHkJIiQFRHijDbbvEOCqc46UZ2rDc+VJxrdwwJk+VjHjvTTTWHiaduYDZXYnKYCmpCitCaEUOJ+T6lwhMTJBxJjXlUWtMmYutN1E+1xnpSPZOMs9HkjKqtYznuPVsSdOM90M3/d3oWM1SuVge4b5NJgP487I1N67pmc3PzTd77z48GQ6KmrBDIOinG4/EH6qXZwe3Ni2fVwJPNFE0KZl45nyKPPnea976mZDigS5UQvDeCzRiFine9/ia+cPZ48/LTSRqBKA5H/HIBl1d9tLMuoiAR9QOa6JkXg4Pz+fzsZx6a/cLv/NHxn/j++w+wLyzBdMJgNGTWtLghjJcc062LjGQvo9ESs8kJfvi9d/NLDzxqv/84YpVQt5Jn/8VhtjACXGCBBRYEwAILLPDtBum6wC57gNVbU/YB/+hv3Xn87ffeSL31DEsH1sBqmqgQoAj9vK8HH6i3ZjTDEWfngV/8tSdOXGggFUOwhIjhylyItVHz3KiH4LKMOo8Qu66jm82iMMVpNxaQGgYCt+/lF95+1w0M/HlcjFAF6ktTSj9kEguefnmDy0BNCc5om5qyi5TKDafOlloNRCiK4uBoNP75EDwxNjvS/36j3Hf+QwjMZrMPTyYTAIqiyN3PlK4iDL51ioVudhpBTPJ8bBYGYORUBMyIphtqrjG0UZgk5UwSzhRw1JIC3Nk6IdYtpRMq7whiFEEJXjtzMMFcgVeYN4ZrFHFQOE8RPEUZ2NpMTL10ha/DU+G9JzhBRTGf0M6zQLs1S120YVYHGHUy6kZpo9FaolFhnmA7wjQJjQVaVZIIET05j/XPtcmOtUA54I7pnCetSw1zCpoCyVw2KZOIaPpLWZtr1QRmxqCqunMxUpYFwcO8bc+28KlxNfy7UaRx5jZqE1JU5ilSBqhKzzAIpUFMSuEdRZvTGIOCbxXvoCoCTgyv+czwZPO00F0r0SyvQ3f8oykRJWq+1JqkmUwgEBEaTUTN8+AWPPMUaVIiaiAmZd7maMokgaSQ4Ew01pNxJr/pelR3NqmeMKM1676+K1T7RIuk9m0v/YcrZn+9CiDGyGQyOVaW5cfLsvyQamJYFqRkpBQZFBXD4fDnZxP/IxoTEruK3BfUzghEXrww4dI0cV3RdfMl3xclKq6+wH1HD3Lfk3t55LlznGRHWISYAqkjadw1xX/P1nadfyImjjZOKcdLXNrePjscBV7ejv/gl3/z8Z+489DbWD6yRoWCJYaFZ9rMEFczGBYwM5DIMAiXtk7y//gn38/6//jr73phwx4cVkPaumZqC/u/BRZY4BsHvzgECyywwDfs9uPLbJkfFFpYMfie12Ef/pHvZP9ggndT2naGhpJyNMRZi7YJZyPwOVfaV3s4VZf82//fH/PgQ+yZCzStEIqSRIsqGCXiyhwRZwkkYqZ4CmJMlNUAE0PTjMILQsA5EE0cXeX9/+f33/ujd+0Txr7GEaHJSoTImM+/cIlf/Mzpd1/y1Qt1K1AUOJ0TunFqc9lk0BkUPjAcDhmPl3+trKpbEEO7Ai6EzMf2sX9lWXLu3Dlp23a+O95ttxT7r7oXgFwlje6KTCF3sdGODLD8EC4TRkKXoa6tOS4oekLRFxGdINYoetrQeVTdEOduUINWDe1M2hJKMqHFSJpoJaEC0QlJjChZTtBoQnxJo+QuvnnUPK066iTMk6OOBfPomcfAvPXUyTFvHdNWmEbHpDWmMc/qTxJsx8SkjUxTYmbCdqO0yc60Mf1G0+qvtq39fjK3afjSCLQtJ80cYgFLATQgFIgFcF0H0UnuOHfnxe43NemO3pddgWveri70nbjsXSFdF7eXU3c/34tH1HCWfQLElEI8pS+PYkxEHYa0ZrKZE/z8Gk5QJySNGC2ttDTWMreGxhKtKCpGFCUmo9WuoMcRzdPSxfLFrsDPsXzUCo0m5ilRp8gsJeqk1ERqVWrLz1NbQ60Nc21QcbSaRxDqNnUKAiEmJRobUfVYNDseVf9UzU6q2rqaTNSYqOYxE+18EbLyojMBxOU10WxGafmgXemIZ2vKHWXLtyqcc6SUdiJNgd7c9FfN7B3D4eBoTG2+N4YCXAFwZ0rt/5raeiJAKEsiZXcHaCgaXfmuO/a97eZ9S9mgs/CZahHDV0Kaz1lauZ4n1k/+9Avb/EyqAqUqLiniArZD0El3ZQhYiVnIEaRY9pmQRHRKcgoh3xtcSmxd4Gdsfu6n77n9dlZGAq6lbbYJTimLitQqvlPQaDSGoxGDIdxy08pP/P6DL/9MnVqoRqQ+p5Crx776vwO2IAgWWGCBryMWCoAFFljgG4TOVd0MIpTAkSX+7n/9N+7n0GhOmbZJ3qF+RERp503XuQ05S10TpkLtR/zeF57h04/yqboCGKN1Q2VKC6hzuQg3CJYN/XzX/BGfC8rWFE0NziCIkoCQIssG9980+PXXHgishDltWyM4vAjOF1yaBx4/eYFzcx6cl3YlgFpBQo40N4CkKI5QBkaj0f9SDcp3wxXTPzMjxrgz3x9j3Nje3v5kjHFnA/21nOn+piIBdn6nXNBKX4xKPi59Tw7pSlkTpPPuNgURWudtA5N1VBvzTNRcU4jcI6r3OKQsOilwmXKigEPxQG2R4B0FQuhmgp1B4YTCCy2J3C+Uztehs8mTnFOOc31UYbdGnRQdIWEkcbRqXcGqNOqok9Goo0lCNDsRNT3Sqn42qqyryhnDt6bSmLKBBaQvHhWcSpb569XpCd+Q4s7Apb6gzYWM64kq0RMgjQoHYyYV1jC3ppq21eTeUjMxZskoFHwwgkGhSoFQpkTwQiFZBh4khwC4jqBwlt3bpUsFMOlHdoyoRqtGtEwUxS5TPlk29EuWqaVkBpqI6oimueNvuZPfqm3ElD4b0eNqup5Ms+u/uW3FWrO8vvTnYU9XiXSXf58uwlWjAN/O2G1sGmNkPp9/ZDQafL4qA0EcGg3zSlVVjMfj32nq6X3NtAWXshsgSuvg4ox//syZzX9235E1ViVCU2NFhVrCS8t4UPDafRXf+8ab+eIDL/DSvEHIP6JJcyRUCC43+6U7ETttifR/l0S7sZcENgPNJMMswkWF4y/U/MGfPMcPvOUgq6sDCjdDTZHoSC0gkcJ5HAVaz6lsi3e87kZ++F3P2icf3JKNegJhCeI8q9Q649fe0LI/XgsSYIEFFlgQAAsssMC3HAEg1mIaCcCSwN/6/j3/4e1vPMASM2wyIZYDrCiJTNGolH5I8CUas6xfw4hHX7jMr/7+Ok+c4H0yctlkj4SkFuc6Iy6Xpf1Eh7OASG8elTdaUbI8dOSgRJlIlke9dol/+ddefzM3rXnKMGM2SfgQ8JKLuLNzz7Fnz7Fl0GrKpmwxF5eajaTpGz3BecpqeP9gNPzJInhijKjFHUO/1EWaiQht235yc3Pzw23b7picXT0b/y16RkgXldj1rdUMj6CSK7zdH4t0hXCX/mZmJ82xoUIbxCaKnlFLE4esJXH3eG3XonNLQQ2nhu8iGQOB0nmcCagiplTeUYijSDl73ksuuN1O1Z1l5JogWV82XBkByDPoQnKSs+NVaFPnJh+FNiltSg+npMeS2cmUOJ6SPWkq28k4m1RQ850iOc+uCwbde+kKWCdX+/jvnBvid73OXZ+/NgVArkkBsGtSAHrFSRdld+UcVEDwptlDQ1JH5uUPzaw1504mbMPMHXVYacYJC3rUop1V7Gj0HG0pc3FvghchOCVoHtkoklC6/Dtm2X+3BvlqwbHLxZ0uIFDJig3L6gc1iCIkE5J6VIWYEqo5g166665Jipojqp1JqhtR7Xir+jmDJhrrqpxRZUMth8ip7urq9wQV1rvNQd9l/jKwfDC/7e74vSKgizE9tj0tfiEUyz9RuZI2tagoZVUxXhreW89H72pnlx9Uszz7Ynm8YmMOj6yf511338bSconXBh9KLMbsuBk8B4aRd7z+CL/5zAm78HTOxAgFzE3xXhH1aG+ugevO+6wwMnFXjAN9d41oNhA0l8+vJ04hv/VHT9k9R/dw78oQ8RGaCYjHuyKrcpwhzlNf3mLv2hplmvGT/827eOTpX/vSF05zX73LvyOllP9W6ZWzJoTQH6cFFlhggQUBsMACC3xrIDvtRwYud+Tfchf2I993PyMuQjNDQu4KeQ14J4g4nBVY8iQVYhiyncb85z84xheOI62DFANiylIo0BgR1xVCEkEcKg41oeg3XykXMoiCz4W7AKLKWOC77lj9F289eohKL0DMJnxIASkx1YLnLyWePMNPZPd/xVsCMxweTQnrHAiD94yGI4bj0SfEBaK2qLX0Bnh94W9mtG17bDabfbiu650N4m5Z97cKCSD26kWRWY56sy6cO5tzWVf4SxZP93JryWMEkiTnPBoTEsdNbEOFw2rgYC05PeONQ0n1qDM75FXXsozdUThPG0N2l08eh9CaUCL41Cc6KOK6VIKutDNRWr06gi91gpbUFaART9Iub94gqtBGadrkjqVkx8xkIyU7HpOuq+oJhTYrCbrzwlxXaLqd4lIsKx+cGMkr9iopAF+PBIBX/7ifpdadcfdEXpOkinNMMFuPxlow3WijPqnYURU7mswdjQze5ZCyUMnz/wI+GdEZpXPUnflfcOwU/+Ly8XemvUVkPk8snxNXDBglr4fkj80gaS6yNEHKVA0xpUbVTZJxRlU2otnJqBxvE8dMdDuZrqtyNnbu7cly5F+yLDvvu/2pk/PvqAvYCWh41evVuoL2W/oef809a/fHTazZnGz+g7IMP1qOqhLx3Xx+oigKxstLD8y2pzKPCSwTPVURaJvIoy/WzfrFVN6wOmSgM5zL5ELvCUDa4qa9+3jPPbfwzMl1zs/6Pzhk6UqUPIbR3YTE9KpRDLsy1UF/+XnzBF+gcc6FGr70vL772DPnHziw/yau37OKEnFqFD6gTohRcFozHo9ge5vKFxxZc/yzf/gd9/5f//UXuJC2UeeJXc3fF/+9r0tPCC+wwAILLAiABRZY4FsGHqiAJYVbDvBr/+hvvY3Da1DEGXUzoRrvoWwdaMKZopqL91aNJELtKz59/Ayf+vz02OUZVMMVpvMZvvJoiphkibAzOpfp7ApuAmiWECuCdJ1F80JMhjYwMLhxmX/69jtv4MhKwXyyjQ2EwlWkaDQuMHfLPPTiaU5P+HcyAlrD6YzCSswHohrajQMUZcHy8vKzYTg82sQWp7P1MoSjauyMAXjvaZpmfTKZvG82m11VwMm3aLdQxO8YMLJTzOXuOaKIkx1XdekM1nrDrtyZ7tzgzXLlmX/CxBzrip0x0cYha6py0jk5rMIZh62JUoqwZsjhoO6I93msQGJ+XwZHER2h60BnsgB6eXCPqF2HznrzxiwN15QLz2wIB0mlJwCaqHI8JTuetGg0FWNVjrTaPqmqS0ra6CXq2vX6kc69Ho9YJwsWh9JimjI30Becuzr8VxEC/PnMIq2fvrBrUgB2lAA9cuGfXJcv0Nk49H6Xyayzc5RMylh8xDQ94pytpcS6F+5wyrpLsi0SjrYiR7zTteCgECP6nP2eiT/wYjjXFZO7maOdCls6Mk1IalhHAAghd3Q7os20i55TRUnENF1PcCKTA7LRFfrrMcl6MreRzNaTyYaqZRKBjnhSh/Zn5a4UkZ60unLce4qiLzTdrqP6bUDy9l4UnYqpl7r3DPB8PmMymbxvEJYeGJYjkhipbTExlpaWmCzNfqjZ3Pxl2hoXDO+yMegLG1SPnLhsd9+wl/0eylhjltBQ4HyAecueQcO777iRz/3puv3RCWSSwHxO6BBNu5Iu8opIl0TQUzoKWJunulzsvlrAXGBikZdmPPhrf/wM19+wl6XVGxgXCdoLmaxwYyyRCQZJIAFp5ohN+L633MEPv+MZ++Qfbsq2JqQzdr1W+r9bDbDAAgsssCAAFlhggW8JuI4AWAV+7Afv+v533XsYmT+NhJZyPCA2NcE5tJ7jXTY7iyaEoqJNcOZyzX/61BdZv8SbLEA9q8EXlEXFdD5hWHqcJbz1MnzFXIvZLtmn5A1XDgQ0ZgalwYEC7r0p/JvXXr9M5eaY5EJHMWJqUJbZqOHY0y9xkU5xXYM3pSC7ijtfkXQG3jEYDO6pqsHR5AKJBoc1zisa3VWbvbquPzabzTZijIQQvqz7+rfqGMCVQrY3/bvS3VaRTgmwuwbMnXFDUFJn8m1Yjtye4NzZfmzAmU1U7KQz1rywpmKN87w3pYQ3OwLdaACGRYiq2RBS8vPITkaYwyyzDdH8VbWoZOf4HTM4nKHJiMaJPEOuG8k4k5IeS2obMQWSytlosq7GhnXmh0pWN6h0QvU+HWKnLrcrsvtvwBqJCCquE+Dn1+dM0W7JvJC9HLqRAlXb8OIwSxuijAFU9KRD17ylVhwTkpWorZmTo6pKcjkVwJnhPJjTbgRkF63RKyU634jUqQCsU0n00/iy+zxSJZmSSNtt0k8l7EyXLtgklY2U7MlkdkZhI5psqApqjtSNPSiCOenW+0pMYjb06wmaV87+Z0WHfUsTel/uXNltANiTACaKKkzmsweHoT5RhNGRULic9uKVUFaMxuP/YzKdStPO8YC1hni4FOELz7zM9969zIEDFZbm4BUl4KQkhimla7hz7wpvu22JR85ss9FC8oBGSkqwtHP1uJ49REl9KGG3RF4hWIFoVuAkDzHAlsFnnkDuuv0lO3xojbtvWALdRGdzXOHx4vEFbF68wMqBg4TJnKEzZpfO8A9/5Lt49NHf+J0vbPC+OkaKosB7T0pp0flfYIEFFgTAAgss8K1NAKwC73vrIfub77yLQTyNaENdtwyGSzT1LBu2NTUUPrdvnIKHc+cv8+AXXuYzj7G0RRfzREvlhpC6zmtQXNspwxWSgLk2d5fjIEurBaDdiX/CgTp4zQGx733DnexdKUjthKoYoO0M8TXeV8wa47FnXuKpk5t31mSLAZFMaDhaWjPED8A8g/GY8XD0CYCoCfEO7+yoasw9RPGo6kZX/H88pfQKqf9uQ6hvVTPA/Mt1FW4X7Xal2svrk7pSz3XtVi9d4SfWZXhbRw70M9m2rsIZZ1Y6sbGIlSJWOGENp5SuPRKpj6VEKQZB3J0mctBUDiWVtWRF6XaJg01s19lLJ8/f1W03RbENUzbMbENpN1Q5k4tMOxuNE2p2NiXWk3KiFV1KIhvR2l3u5FkBodLPkefPIZZjKuniJa1TSuB3Ovz2NS4wr5Vt78ytm4F4khV5iUxxxFysd4aF0m8xnMMlQ7HCiK04nYjqunO2Rph91rBjCodB1jrb/MPiOIq6o6raisiaw62h3cT/zrXgdoq0/P+0cxn3xhsppWM4WRORNSSfG6q6rpqORzhTK58z/DgZE01sJLUzqpzRPBCyoZ3JX8QwCfk5lY5k6Drcqjs5Fbuv0R07gK9wXL+V0XuXXHv/yldqJnaapmFrMn1PUQyfHY2L/LV57RiPx2xevjyezeaTQqBtYFBAq4EnXjj/E8+/tPYLtx/cR0DxTmgpmCdDvCA2Y6+rePfrX8OnTn3JXnjRsoQlCoX3pNjkBIdufCWPASh9qANA6Stc6yg6742WFhPFKmgSXJrCg188yQ0ryr533soNSwXOAiB4dWjrKKoxNj2LrKxgZ+dUhXH3Afj7P3jLe5/9xeeZxnwMROQqH4BrPQEWWGCBBf7/7P15sGTXdd4L/tbe+5yTwx3qFlCFwjzPJEgQ4CiK1AD5abAtyW3w2ZaeTTn6kbIt+YWk90xGWHa/sBzd4ms/uSMsRzTZ0daL161um7Qtym2RljiYpEhxEIoDOGAuEBMBFFDTHTLznLP3Xv3HPidv3ltVAIgqEiXW/ipO5L158946eTJz77W+9a1vZQIgIyPjFUcS3ZquWrLdA9zlKt2XnblSJ52W7YlvFMC+ZX7zv/vrP8T+QYvM1lOlzhRsnZgyGo2SqZPthqATaRuYUvGNx1r+wyfWOVKzVXfF0GFVEYDJZBM3LAC/MAM6xX59nhYlDXwK2gl5o00/l8i4UG66sOStN13CijsGYYY1jrpR3ECwwyEnppZ7H3mC5yc8IC71+xsDtgDf9hZxYK1jeTT+N4NqcFPrPT7qZlGaJatF2dTTj4ixb7amWPPeH5rNZu+r63qHbLZPFE5V9f9BcYnug+14mkRp/qZaQACMGqJIN987Oe/38byi3fg1BdUti90yyjExMha0NBoPK4KG+HElPCuRBsAZvc0ac6NRSlEzttHfYZSyu95rUdLjVPUYxC0w4/T1/HyfVNVj/SEia0F5VpVjQXkyookQ0NRTHow/FjSNJtSFZ6manoNqRzqopsRj4WrMP0qvkMu8qhK6d7oghFSjTamdpkkZaWJBNxZPQotYTFQUe8yiBO8/boWLTOSQiI4NjK3oRUF4wJiw38CSiI5F4lhE1kTs5aQe+ydAS8WU3fVqFs7r2PxW47OoLCXyR9ZAmxjjoagci8qxEOXZgKBqyt7sLyhbKGDMOKhvk/anU3V0C19//U1Mzv86fx1M5y1gIBu4zyv+fTLbr2PavZ/FCCEo0+nWoUlZfaCslt/lynSB27ZlWC1TluW7CsO/dA6auiNpqwHf2dj8377xxNHfe/3N+9hnFFuabjpIxDqLeAXTctu1F3PLJYe49+l1ng/pZbGFofVhIQTuWnv67gRNZKRId97djID5S5okH4QKvvYosn/4Hb31iv1ccOMylW2AQGhbxA0pujGa06eeZLj/RuKJGa05ws/+xG385y89rn/+WJTDkzTBoiwdTaOgFo2L/hon769p7435bZaRkfGyY/iMjIyM7xoWg8MSULz1qam/y85s6HOxQerZNgGo5yZ7lYHKw//jH9+pr7vUctXqEGYbaDtBqgrE0TYzisrS6pSiVGIrBHMhX3kc/pd/fy//5SubEksIuIXYqKuEiu9c0/uxZLLQB20woUi3TmjaABisCYhOuX0fn/oXf+11b3/dfmU0bJhurVOVK0QxbDQTzMo+7nl0i3/9h1/n008gx0RQUZxNTzNGiFiMs+zZu/quwWDw21VRrsUIIfZmcooScLZkMpl9fGtr6ydms9mOis+i8/8P7ga0/XxfKJDtr8PibV/77iN2WSADbPe4NGEhdl4D29VIa9jfvVmPWZHLmb8ztHDG3CYia6JxU0TWjMhFoM3i+RiljBKPidjLVHYmnSnxlPnXKmZJVY8F1SdUpe3uRzE0KFHMdlIUu7FyfYW7G4Mo3W36va7nXul6T8wusuR78Dq9yPsw/TxiJBk4WuyO1zi12aSqZvLcSK+VNQrisUiRrr+sidEli+wXYclZ+6ZEtJxsGikiaxFp9BRhzPz1CPGQSvd3RdbEsNZ9tg6FqIeaKA90/gDHovZJfpfIq9J/HFU6FdGu12b3NdeYpO3fj9fkHEnxX/L75lTXwhbJ6V6DYTgcsra2dt/q6vJN1gqpDaqkbVuefeY7S8ePr28VBThX0NSRcQy86TL0t/6PP87te47h4jqMVwjGMJtsMR4twwxqs8SXHl/n//z79/CZp5FJ165SOEvwsp3wz709tl8/1CTjSTXzNSpKxJuO9A6R/cuO6rjnr75xoL/2d97MVRcG/OwIlbXQWqhbKCN4D8UYXMGJ2Tp26VKeObrCr/zPf8CfHUa2bPo4hwYKlkk7WEgGtrbejtgDlDENJPVdy0JGRkbGd4usAMjIyDgDLEiie/1tN5osJftJmlsNK+pJzaAC61NM8z/8ndv11dcscdFgHYwFYxBTgk9uYoWtaGODK4dsrB9lsLKPxw9H/sMnvsZXHq1vmpgSlxz9toduSW/K1tluzSXLZluSTC/ljnjfOZmbggLFerjpovHbL121jOwmWk8pjMUHRcoKxNPIkIeeeZrHjvILbRfkGkkBWTRK0IC1QlFYnLF3WDFr88BSQ6oemfT42aw51DTNB7z356XcU8/wd1XTGMB5gtF9E/qRdX1/uPZJqHTGbXKsC/zbSDwkkhJQi7koKvcakYtETGlVCBIPp8cmQqDjuPqzaILq4Z3Jvym2CQHTKhzWaDbTz2l7o7igkowCu9Zw7RLQzu5wm2ygu19TtRntRTS6nai8wgRObw+YnPlT4jJXrqR0mSCSZqVHWegkSOoblfTBFZFjEmkjUojRNgbzALBpYAniZk8SdEn5s0FNe+rkv29bMMe6S3k4kTrSEQAciiqbQXUzqrb9+6cnWcK8l0Dm5o49+bKYzO42V0zrisnbwkuEbwLWONQqbVsznW794mg0uMeYak6yOOcYjZc/vbE5ubP1qdfKOEvTBJ44yk3ffOzI/TetlCwDaItGoSxLmrbBuYLCKFetlbz1lmW+8fwGdYyYwlLXAWuSF4z2Ph+9maXuJDiCLH4aTWorU0MxLjmyvsle4MsPzH7vY1948Jfu/slXsVQuEdvNZE6qAWKZegbCBEYVxirSbrJmlP/xl97C3/sXf8Z3IrQmDbjs7DO7PSzuWvQWzy0n/xkZGZkAyMjI+D4imSV1CUAo0GDAeHrvL68gWlNYR721zqgs8LOWEviR14i+464buaw6jq03mTVTCjFYV6USemrIpgiCnwWcXMiJyQp//JUH+KMvTd/87CYPFEV4AXfzl1I5V0KcYV1JNAbilBXgtqsPsLZnCH4DgsGVFbUHjGDdkM2Z4b5Hn+HwFv8f3xMAZrviZ4yhLEsGg8EdRVHcvSjV393bP5lM3tG27cG2bXf0y2ac5hVbaImY35dK5PP7F69xXBjTJ9KNFDQG2yWcxND9jBYiUeRJEbDIITG6FHT+u2tmZ/QNxE0V1k5WAMR28dyiLCSMUbpEX1FJKoBeXg5JSbK7srxtcvfKX/eX8vNTta3E5IqHkcW/E+lpuRi1N+prjZVjihwjRKLEQx1RA3SKDHRpvgapHlNMsTP5P+ncenKh6AkcVT0WY2hDl8T3qgvVfuqBbJ93l3jtJABOXmd+8Kv9L/+9c9o9JIS52WnTNGxtbR0cDocHnXN39G1QzjnG4/Edo9GI9fV1QgiUZYkIHJvwwL0PPsJfuvlVLA9HiejTiBuOqLcalIAxgQvXVnnj7a/mD778Z//q+ef5VVumqRyJmpq/C+dEwIul1T1RIN4QYyr0P3acv/uJLz31S7fcdD1vuPEi6lnDkDrtiWYIriJogxWhcgUzP6McLXHna6/mnX/5Uf2//+HTcrQFzwjPpHv3mW1fi44LMBjafhRpfntlZGRkAiAjI+P7CpmPJqfUVLHwndle0k12bQDBUxkwbUsBXDLkxvf+8s+y7J/B4fHTmlYUyhLrDBoUry02KEYss83IcM/lfPprT/BvP/k0T035ghRgNBAloi+wjG2bs+mctujmpoEkCbIxLT60aIi86jL05ivWcK7F+yTRRw3YNH4QO+bRp47z4JN1F6ItpINdj6tzjqqqrhmNRh90zq0tnoe1th/5dMx7//HZbHYwOz+//GQ0dGMeRXYlGnrSF9vu9YutFQuqi0QQpCQ1irQ2cqyPug32WJj/rdj5Dygq8XCU9H3QREcF7X+e/n9NDEEiq2Lq2hWdd8svjI/r+/71pMTpVPd9vyvNL8Vg8HTJ3uJ0h8XHxH60ImDmhooxeXQIRPSYIXbz3RVRPSyih/vnHjVNSjCdaaLp/BRO9b0aWos5HEW7aQ3aJfrbndTzVgzMjnePxm3juh3Libz4c87J/wvft/h5rOuazc3NO6uq0tFoNHfFL8uSpaWlj21sbPxEv1a6Uoi18tBjGzx5rOaSvXvw9XPYrmJunCARfDvDugGX7Vvlxovdrxx63v9q6z0mjZaYv87Se9XA3DvmxUiA6WTKoCrwtLQOvvEE1370sw88ctXFb+Gi4X6on0GlQaJCUaQWJQEXBRMaop3g68P84n/zBh765h/qRx5GIoHaRlTBxERBhdh5yuDSu7Ub13kSJ5mRkZHxEpG1ahkZGWdEAqSFxOPwFBhs7+RuQMoU5A+No1BYBn7jl950/60HHCvhGEU9Y2gqBlWBOmiM0johaKSua5hFimKNB58KfPjTj/DVJ5BJAW6QgqIXjX7UbDvLb4ecnSFhxBnQGCFGViv40dddxbV7B2icpPZqBD9rMdbSqjKJFQfvf5LHnkeaPlBcmHMNUBQFg8Hgt6uquqZP+Bednbtq1wcmk8k7Qgg7Kv+LVdScQLxwYtEfASVokv2jyYE+diMbVQwqvRHldt926I7YjXWLCEG7aeAqhJhMubxqIrWiElLLL0GTuiVoR3jF7rb7PiJ4VUJUYve4qAt/f+HwsfeMSLLzbS+A7efSqwiiMH8eYF4xpchuYmKRnAjIDk+D3YjbthyJwFElqHQHO16LdM3T9d9+HbaveauJzkvXOI1d9PHU3/ev4c7bXvbfS/zTeSRPgO1xgjHG9B7rmxlUXjTBzZ/dl0YIWGvna6e1FhFhMpmwtbX1vl5N1U9FWV5evms0GgHJNR/j8AKPHuairz16mKkZdsZ90M4mGAPGRkQbCDOWbODNN1/GRQ50Bs65OQkV58aOZvuQk49t2X1azwe2wDnHTGDDwpNbHPrEPU9/6JN//gQbzQqtWyLakia0qVvfGprGg29xREJ7gpXKs5d1fv2/+0vcto+NkinD0vWTLbFACRRzy116B96MjIyMTABkZGS8ckvIYseysF1ZCS1UFUTvGQE//+aR/uzbrqd+7mGWRzZJsI2lwEAbaEKDJ/XQO6mYzQwNe/j/feabfObe9XIm0ATDzPdV353J4O7jhcmLvn0BRhZedWWhP/yqq7hoySASMWVqR1ACRWmRYsCzE/jKI89yLPRjBd08sBWRXvp/V1mWd/dtAfP/riMK2rY9WNf1+2az2Y6qapb/n+IlWhgh9kKv7+l+9mL39URAkub396VENMRuHF+XQPaEQFCDB4KalOQHmSf7sUtcoy4ksvOvtUv0tSME5AXfu6c631eKaHmx+1/stTjJLG9+/3aPfVDFx4jvxuz1pM42+ZIMFLwuEixyEqmy+5i/nv3fmxMNHQEUmb8Xdlx3OT3Z8VIT3IwXvja7CQBjDG3bMplM3judTllcQ6uqYmVl5YMiQggBHyIeONJw+CuPPMuTx1vcYAyVow0NxgnYiLOKSM1SEXjzrVfwuqvRAiD4Hf31cdfSqy+680Wcha2tKWqhVqgLeOwo7/gPH/1zPvXnj3KiHsJgmVAo3vi0voeIURgUjnFVYHXCgC1uu+FC/uZ/86qlFSBMPYvbh+3+PyUm/xE5FbGdkZGRkQmAjIyM73lEZyCmQMQDNRDxKXCKFmIBWtA2MAJuO4D+xt95K3Lsa+wdOJj5VP70DTJrsW1LiDVRG6yCkYpJGPC5ex/nj7/87c0nW9pieCHEirqh8w2HHUL8vuKvLxYgdb2+MQVXB4as/fBtV3PtRSMGZpYqTyLJh2BYohoIpuD+Z0/wrWd4xxTwxs1H2IkIzjkGg8FaJ/3fMcZvofJ/aDqdvruu62MvllBkMuClJBUyP9IINk0VvS7hS1mczBUBu5PDvrIXYKESLQtJOzuUAb06oD8WH9OrAsI88ZSTlAHzv8t2NTwq80p/X/nv0VfUtyv/507ydjpS4FRKgJNIDQQlkSuJbNEdibqP28fOpL1XB3QEzG4Vxq7bnmhZvL//fvv16ckY6aYAyI7XJOjJz/9Uyuuc/H93JNKprlm/5jVNw/r6+jvatt3RtrO0tHT30lKygGij4l3BBPj6Y+29X33kOwRTgmpSExgD6sFFrLYsFS037B/x1lcdYH8F1gdMXDT8gyhmx9GrAU6V/EOkaSbp97RCpcQMhmwqHHxU5T/+yVf55qMbbDHCVhZlgjVpcg7iQArKomS2eYJi7wi/8Rh/5a2X8Ld/bKjLQBnS/xLYdppo6Lc1C2ozCZCRkZEJgIyMjFciuusSFZPM+1vo+mldcj62Q1xMBMDf/8XXcMl4k7WRh1CjPkAnw0ShEEtlAO/xTaAJJRtxlT/8zL08+DzLM0pm05aiGHSmXDtypZeB1GdZKVw04A/uuHofy7bGhBqDpfUpzmJgU29qCNz39DEem/Khev48t6v/1lqqqnpPVVVri5WtRZPAtm0/NJvNDnrvTzJK2x0QZwLg5SWpLyRRP+noE+8+KV1QlOwgA1TwCFHtzttgusdYNC7eLpAMc5l5qlprhPgS1Qzn4vX9bhO/UykatgkOnSfY89dCd5I1/WuQknXbvR52J8GisSNf9KTvE+Fy6tvF12beNrJwvlG+N9fmfPtMnu69EWNMoyG7JF+75D3GyNbW1ofqut7x2MFgwNLS0geLogCxaFFRA489z2u+9tAzbHmhnXqQAo2RGAJoIIYaZ2qWzJSbr9jLvjF/VJJa15LHRzyZTH4JCMDq6jI6TRb+3kemAVqBrz7i5eBDRzgyqWjF4tUDHmOk2ywjcVIzGg5BJyDr7L/A80s/9xZuWOXflDGmaQPd/xN6bjD3/mdkZGQCICMj45VDnI8Bc+Vw7v6vRegy54KiqRkB/+jd1+sdNy2hW8+Bs/hZg5QDtAvAcCXNZErZKktSMNnwaLHGnxw8xNef1Y8/F8EOBzgTkHrCsHK07emWtO3D+4gxrjPei2lGuU2zyo1JM54r4C03rr791otXaadHMTZSVQOMODweCiGIYbMVPvX1h5kWIKWABowx8yR/PB7fPR6P39NX+9MMeijLEmMMm5ub715fX39v//imaU4r+z9/2gHMCx6L1f1T/nwhFlZSxVcXfs9rTEdXYZ731AclBsX3lfs+KVSdy/jnsv6+p1856TZKpyJg521ckJvvkJ53lcX0/52qBSA913kFck5UCBq3VQj98b0mCxZbU071ftzRM32qcMI6sG6e5J1MDnSVd2NRI+lY6LneVl/sVAqc7LGwfRt7dcHC79H/zU5BsPjzxd+fH13P/6LCRFW698d32Wp0Hib9L0XdtPv9tMMcMkaapmFjY+MdkHxVILUMLC0t3T0cDvFBmUwb7LBiM8KXHzzOU0droluiHC0zbZJ6gOhxhYLfQmbHueHSNV530+pPDxRMgGFVQgxoaCmtw2hEQ5gTQL0/wKn2P+Ngc2sLZxxWBXzAFjDF8LyH//yph5uvPXCEWsdpxK0JUCjRAzJGqBBT0NTruCWgOc61Fzj+T7/ytl+6ZszPDoBIRS0Qyu2IfTAcZwIgIyMjEwAZGRmvHAlgDPi6BqBaHaRo2sLQtoyo+ctv3KM/+rrLuXiv4MTD5kaSxMewbX7mW6rxHtqNmnZLGC1fyifveYj//KUHefAYP9HQWS+FKWiNUUvp3ItKIBdNpMoyqQ2898l1P0ZshMvX+F9ff90lrEnN0tBgC8HXKTmndDTeY0arHHr6OI+dYGnLQNM5mYXQ4pxjOBwyHA7f3xtL9cFs3wpQ1zVt235o0Sxwt0dAxiubtJxqO+wr0/E0twrJrK//vv+5vHBidL4U8F7M42Cxuqu6XQXub3uake4697fbMz22jSBfzm3/OsUstjknMZlMPjSZTOjHpMYYKcuS0WiU1lpjqaMwAR57lmu/9e3nCG6FySxQuAqxBRoC2OQHgE7ZM1ReffV+Ll3l1wygvk6UkSoxJFbZyMnrs7JTcRZl+3uriouKiSBqaIxjKvDYMaqPfu5bPPjYBuVoP21dQ1NjVtZALWIrcA41Sgw1TNeRcII33LCHX/vbb/jwABg6QSW1sAyWBgDMttbJb9mMjIxMAGRkZLwysAaV1A/pnFCfmCU5v6kxfou332D0nT/zWq5ctTCdEG1BoxYzHBDaBmLAx8AkQowGCWO0HfHAU5v84Wce4AuHkONAWQ1xEhGTvLijVyRYZE4A7O6RTt8v9uIbY1ACISpiUpA3MvCqa5Z//Y03X8FQJ1gnIIJvmzSyzxqmapiaJf78W9/m6RNsITZ5B0iqJBdFwdLS0scGg8HaopS1JwCapmEymbyjaZpjfRDbn0/GGSaYu1z+T1YG9JXpdMw9AuQUpl8Lvesv9UhJK/OK/nZlf3fluD92VpD789r+m9157fKyUNnd7vLKegKc9vXYpQRY9ATYeX1eiARgx62qnPT7p7vO3/WxoF6Iu77XUyhMMr6/mM1mbG5u3tm3AsQYcc4xHo/f5aoSrCGIoRU4POXQn9/3FBOWabxgjAMxtDGk5F8C4BkNhDtvuZSbLpPfGQDaBgqBwgDaIqT2LKPxNGvO9kSO/r0uNNjeu0bTnthaOFbDp760JZ/4/GM8c6JEyyWCTeo4xRJjAJTCVBg3QK0lNBvsGU/5mbdcxTt+5BK1fkYxSMRyuzWj6vZbTU4i+U2SkZGRCYCMjIzvI3qXbGtSNSKmhsXSCkXbcs0a7/x7f+PNvOG6JcL682wdOwGuwpZDECFq6sSNqgRrODppsaN9PLdZ8MH/cg8HH+WnpwUwHALg2ynOgSuTRDSEFw/J+9FSQDdTGqwF5yyFwv4xb3rDrZdx8d4BErfQdopqkwI6B60aZLTGt0+0fOG+dbyQek8hjZkyUFXVNYPB4K7dff/WWrz3TKfT900mkw9573ckRpkA+D4kpC/iYP9SJwq8cOX61Pfv/tmp/nZAX/4Uix/A1+dsP//vZsrCS3nvZHyft5g0FvDgbDY7uPi6dIard0MAjYgztMCXH2x46liLdUt4H9AIYhyEANGnLF8brtg34PbrL2J1kJgdK1BYEAUjqUEkKbVOk2DrIrGYTAGFiJkTdjFNiRlanvPwx587/vmPff4xJmYNu3QBk+mUaISgAbxHA0CBDEcoLaw/zTg8yy//zbdy2+Vs6CQZ0ohPvoZlZXZMMMjIyMjIBEBGRsb3lQWYB8oelqyhapUrx9z4P/7Sbb9353UDRvocAwPD4VKqyBCJTYtgUB+wtsDYitaNeXpS8NGvPMZHvhzvfHrGR71N1fa6nhLaXsqZJJFFYU+zpG0va95vj5dKiTkYI6hGoodr9/H51123D+IGxgbatgb1DKoApkalhPE+Dj56hPufQUoH+JBMCCkZjpYYDofvL4oiJXQhpLMwBmMMk8nk4HQ6fW/TNHNiIJv7fQ8SSdl5LL4PtK+673h/pOq90Tg/JIaXnfSdLnE9qeIvEWR7JgHsUiLsml5x8vM5Nyv/J12PvoJ+msS7r+CLKLtnq5/KKyCe5jhzgkB2zXk/ne9ExisSoBpDXddMJpN39ARqbxw4Ho8/SEwJdAgRV8GDTyNfuf8pTLEE3uCDUBRV6vGPAQYDmjBlpOvcfsMBLrmAoxK7YQEkAsAZYbvCDhAXPqNm/rmcf14xO9oBpPs7CtQqBAv3H+Et//ETj/KFb66zqWvY4QAxDcamPqLYKDprgYCrDNBSyhYXjY7yj3/5x5cuBJZ9YND9/baN2/9ZRkZGRiYAMjIyvr/5f3LNsmX3rY/sAX7jna+9/6feeDVjjqCzo5iBwRRpxrMRi2IwxuFjqoQHD0FGfPLeb/PvPvXYs894Dm4aaIKgoUviHUQ1tF4JhOQz+CJVkLZtOwOypAQoCouq0rbKwMFrrx9z+YUO79cxlcUVBjFAEdA4Q4ohx2eOP7v/SY4rDKzgAqAObMny8uofDYfDu3qCAZib/7VtO5ev9j9bNFTLFcbvc1L6AmqAl6sAeOEZ9/n13W0i+GLH2b5+L6jeyFX/vzCf2+l0emgymRzqSQBrLUujAXZQJuJIUy6+BXzpm99mMg2U5SCFuC4ZCIoxUBSoRLQ5ynWXrXLdlfvWKtNNlOk4KNGump8aQ7bJvLkZ4HbYPOcB6NuKIirJtUKAae3xZcUM+Mq3kQ9/4n7u+/Ym1XiEqQLERDIUZbeBBt/55xqM9Yz9cd526wF+9a/frEs9HdWdL1lBlpGRkQmAjIyMV2YFURCIdgkljfv76z++pn/jx17NanOEoQZsZYlhg9pvUIjBadH1Z9rUZx/ATxoeeugJ/tMXH+DLRzkwGRTUMsJEQwmUpUNcQQwOtEQsNGH6kvpyRYTQuTonWX6Kna663G68/tbLWXKbaBGoaTHOAh5MjUhAbMXDjz/HVx459ruthThTBlERLOVg+Y5qMPrpvvq/OPKvbVtOnDjx7tlsNq9YATv8AXKycTayg5298vO7T6EEAOZKAD1NoiEx7FAFfDcfA3OKP9oPA+wr/9vvydM8h1Nu0T+42/TJRErccbwcMmbxeCmEw45zOUlJcn68DucqQgg45/Dec+LEiWtns9l8jbXWsrw8fhfOgMDMQwN886GNg488+jiiafpD9BHEpOkzTcAVBUWccOHIctst17O6wn678OoaEq+9+Nne8T7Z8V0EDEFKAiXBRMCnbTE6wNCoIwxXOQF87muT2z76X7/Fw489CjpLf9sHKAQpYiIEgqfVlqAt43GFOfYUv/zzd/JX7yy0Apo4f8PmN0hGRkYmADIyMl4++orFjm/EkISRDgvzY/tnBgLYwhCnmxTAnbei77z7TdjJk5TMUkVjMKalgQLcuKJpZvi6Sb9fLLHlHRttxZ997RG+8ggyM7DhHcFUgEFDS4gt3reEkNydXTHEe+ayXdE+aOuiI7WghsIaIBJiIKgiFDiFtQJedfny0s1X7kXCJq5UJu00PbeQ+kpxltpU3P/E8zz2PL8qg5IWKKxQ2ILxYPhvnLE7Epk+qajr+uMbGxsf6CtW/f2LBEDGK5d09oF8b7zXy3h7o8DemO/FsGgmeCon+V55Mk/uF24F86JTLM6fEKRv15BUjZ3L8L87AuHlegjkz+S5id71H2Bra4u6rj+0uJYOCvdOYyLGCHWbiv2PH+HOrz56lOfqAtQR6mn6tBvDrN7CFgZroZAJr756mUuWeaSX1ivgSXl42gY9SIPBd33+3eM6gmi+7/RGnbvWAVMUyQembfDG8fSUr3/sC4c/8idfeoxjfgUpl4mthzrtlRra9PuFTf1mWxOGpmXYPMF7f/nnuPESnhkApVkgAOZEp0Mw29v3qTb4Ha0MLqcAGRl5983IyDhvM3+261vS39drDamwMqCA+ZHiDQNSYKRAZpGRwhUr3PjP/tFPc/GeEwzKCYQZuBFszTBlgZbK1G9ih5aiLDA4NpsCu/caPnHvU/ynzzbvmHmwYgg+UpUOjKIm6TOdAWcV7z1t7TB2D1GHKEXvpd4ldga0QrRA1BNCk2KdylHXwhi4YczH/tqbruDCsceaFh9qytGw8xkok6q0GHA0WD779QdpA8xmihuXbITAeGRYWx3cVlbbfc5VVeGcYzqdsrm5+RNN08yl/n2CcSqZ84tVMPvfW5S/xhipqmquagDm4w6ttXNFwg/+2zfuPJRuGHx37Njqdvb/L7rAx123YYdz/4sfi4/f7Swf+37yrl94fos5qeJ8cgU6vshxjpMtJ7nqv/CB2EQuiu3MNndOcTh52sMLHy/0mmk3vpGo80Ru93HqkOlc8gb4bs8nfpdH6sP33s/Xov7r05Emp1NYvBw456jrGmPSRJfjx4+/48SJE52iKjIqizdXRUFUxVZCo7AOfOhLT/BE2EtAKKRNGb1GnDbQbqHWon6DW/Zv8DN3ri6NbPJ0aQVaLGVZQdCUMwudwV/EdaNj+ys5/4xKf7269UPSZzs2NcMCrM6w4pECvnWMn/n/fnaTP/izDeqwjAkCpkTrloDHOGE6a4hqaUVQPJXbYt/oCP/4l99w0eUlxTBA1SX0xTjtzEKBxTC2Dkeyy5m/R2TnJi/d43MKkJGRCYCMjIzzNPlHdn47/6Y7gqaaqN3xIAFTIUEZAgfG8E9+7Y7795THGdgNcB5tG2gbKAdYWxADFIXDWkWbGU2r2KWL+NzXn+Az9z7OMw0fmgDRVIBlOpnMZy8bpRux1EmqMemM5hXU/v5FEsBQuFTtATAWrFEK4I03lXfdsH/AUDyFFcQExERM4cCm9oSWgiee2+LQd5rPewVTlEzaFnWwtDT4g8JuJ5nJZ0Bommbe9382XP4XiYNF8kBEcM6d9JhTfZ/x4ttg3y6w8/a7eJ3kpWyzJm+7+fr8hcKpiEhrLUVRzNef7yV6U9XeYLWbqvLe2WxGYR3WWkpbpDa0qDQRZsATG9z51UcP49UkQinNlKRI5Xp8VKLWrJh1Xnf9GldfIqqhwRa2U5ZZBmU5J8UFXrAlSLqfJeJum9grCpv2paD4AMGk83v4WeTDn36Ye+57jlDsSWSDc7iipGkaRsNlfBsolsbUfhORLSo5wW1XjnjPu29qlgAXE0nVTlusLVEMK8t7rpkFn/br3iO3V+vpwtZNnCsaMjIyMgGQkZFxniKy0NvYt+JqJDne1aQJyinfNQqECuOVEZ4l4O/evV9/7I0Xs1q1lMZCABkt0ZoA1mBCQeEdLggSIq1GqMY8dbzlo5+7ly99A5kCNeDFUI7GEGOSYc9l030hI3bSzBbEw+I85L4SIy1qPEqSFKNgo0LYYmjhda+9ngv2LiFqMOKASIwNUkiaF20Fj+HhRw/z5NO8JQVUivfKeLTE8vLqz+2ugnnvmUwmH9ja2jrYtu28Mn82AvDd3xtjKIribhGZtxUs+gzkaQMZGRlnvC/sMi9dGMF3R1EU3xcCwhgzJwBCCGxtbb1va2vrmDEO50oGg6X3WzsgBoPGtBMcO87Br379W0zarroeJf3Auvl+Rzel4oZrr+DGq9dQhbKTfYTQJlJPwfQVf0nEcpyr5hb8PV7g/L33aWRu1yLgHGzW8JVvbcq///S3eOCoJQ7XUCPQeopocVqhwdDWm1Tjkqad4oxhyVn+8tvezC/+zCW6CgyTECKp3Igc3Th+yA4sYd6a5EALiFW61X4fbZG02+Y3eUZGJgAyMjLOK+huEqDvpzcQU9XESACJeIFWUqptKakwDJkxBn7+hy/Uv/kzb8BOn2BsG0z0tCFCWVAMR+Bb1CsFDto2BZTlCus65I/+9Bt87t6t33o+QiwgGEkmRzaZNmns+oFj59SsimpAaRBtMIQuCNuuwkaJRPGoRNqoBN/pBWLABrj6SvSaK9YoTJsM+rAIgag1mJagHoqCSSvc98B3aAFXgtcasSVLy2tfs2WBV08kye5jjGxtbR3c2tp6dwhhPgbwbGH35ICeAOjbAfr7dpufZWRkZJytJFxVKYqCqqre8/1YX3rDv8Xvm6Zha2vrJ9q2xZqK0XDpXWU56No+0tbRRHjo0cMc2WrADPBaoFExYkklcElqL1WWBo6brltltQATIoOywMfAtGnStBfdHv0XTN/7300K2GX+ubttJAQlxOSTYwuh8R0JUMBM4GMHNy//z1/8Nkf8kEaGNHVEigFh0mDFMZ1OkIHFGPDNBqbdwjXH+OW/+Zf463/pAq0C7B0JECjHAzBQt4HRsqX1vWCvV8u5+Z6fLS0zMjLyGpCRkbHgjG4xWGxnrBd9O48WUppZ4SgomDGm5fYD6D9854+zqke5sFLKdoKJNcZEJvUUXEnjFSGkyrppkfEK6+2ITx98gv/0qccOfvsY/3QK1M7R2gLVQNM2CzOWHKIOExfl/g1IkxQAsquKIRE1LVECYkrQgtIW2ADLBbzljgvYv9dSmBaJimoy9rPGE6UmGCW4Ec+diHzrgWNzOWVoAsPREsPxym0hRoKGNJ7QGJqmYWNj487pdDqX5/fy1bMRgJ+GBLimqqr5Y3a3CGRkZGScaQK+ey2y1uKcu+tsrW8vGKDuUjX141Ynk8nBEyc2ngVDNVyiKkd/y5gijZeV1Az29GHe8Z3nN2nMEtFWeCwYIWhMBICzVFWBMOHOWy/kpqtQ48GIohLB9JXzat6KFiQSJG1N9gUsOGLnSGMLl9ZrsWAsdUjTCrwKrYXHap788OcPHfr4wUdZD0PKwWpi2TVQSGQ0GjHb2KAYD2mnWywNFds8y6o+wz/8xb/ED92Chi1l6Dze12mjEseW32YiZFHfp51hLtu2ABkZGZkAyMjIOG8jvZ3LwtzxX9l2BzSGSAS2GNBwecVP/fLfvpMbLlWK2YkUELU11ghKoCgKYggYI6lh0baoHVCHAV97+Dj/7o++wUPPcWdbgJaWWRDUWCgMhHo+I7mvYsxd2ftqv3StAH3QJQtEhkkKAMWCWsSDaeHqSzj6htdcynLlKW3E2TQAyhnBmgjWEwto7IiHnjjOY4cRQfBdsLe8vHKftQWRbSl+27ZMJpP3zmazuRHfXPp5lgLw3W0Anez/2HA4/O3+/9vdkpCdzTMyMs40AV8kHjsFwN3OubW2U3N9r+G9P4ngbNuWo8eOHZjUM5xzDIfD9xeuSom3JiXAiU0+9MBjz7EVHVKOEOPSHiGKGkGNUlQFjoYbr1rmLbc7xgWEaY0quGpAxHWVc5fSaEMiB15S/3waVahi8D4SVbCFxVhDAGZq0OEK3/oO1/7bj3yL+x+f0ppVmknAlhVCxDlLvTWBKAyXh9Cus1w1lP55LhnPePc73s5VK/wt5yE2k8TSSwU1FGXZTS9oSQMS/Qu2K2RkZGQCICMj43wkALrgIFUHBNOpAOZLhRoMLQ647gI++Df/2iUf+ckfuZjJiW+wMi4J67PUOkDqmyyKEoLHFRHcFHVwPJR84ZuH+cNPPczBx5EGaM0SXgZ4tWAU6dkHSU0JqXly2/V72325O3VdHL20sKRJpPXJMNCEyEjgzlvN2g2XLVG5CZYW68w8aTcGorREZ9hoS75639NsAIGSxoMdGoZL45va4Lv+/iRHXV9ff9/6+vr7+pnVffJ/NqrwfQVst6w/xkgI4eBwOHxPL8/dTRxkAiAjI+OMtoVdU0z61qOzqXB6sf9/e302O76ezWYcP37810MIVFWxNBxVPwVCQFBgqvCVh57j+RlEVyLWYBwYE7GFYAuDGBhUgdXBhDfffjk3XY4WpDaC4LeTZcWhuLSxybb0X15kiW2DgnFEFbyPiHHYoiJKgdcCb0pmBg4+iHz4kw/wtUdOsBGqbgxFhGnLUjUmTmsYFMymR8CcYLwCG0/fz5tuWOK9v3zH74+BsZDMDoNQVCu0tV8YZdh2R0+Sb++lGRkZmQDIyMg437A4h1ygN9RLgYPpEvDucRIYORgJvOn24u53v/Nt1JOHGLgN1E+xgxHGFuAFUw4JG1sYE8AGmhiZ2BGHZyt84p6n+cSXN2UKBLPErI40rUeMQmjQdoalm72saQiYiszHtPWz13fMXdde5LjQ3SgRYqQwlorA2oD9r73+ABcuKyUNIU5Ta0MXNIkIKpHGGNabIQ89sZWCOCBEWF7ec3dVVSSDvwJVZTabba6vr793NpvNpf8xRmKMZ8UlezeJsFgFizEeKsvytERDJgAyMjLO1vrTE5DOubtORTp+TwPVzlOlbwXo19n19fV/6UNLYQ2Dsvx1a11K9LuWtQef5N4j00grFnUgVjAl2NJiSwPGMxgA/hi3XLWXW6+3rI1g4CA09XZ7mXY99LDtCqg7w+dFMqD3BYghUJYlRVEQgtI0yR/HRyVopJ5s4AbL1Ab+y2cn8pmvP01d7mdjBhgHEexgjDGOsL7JYGUIWqObz7NvjzD0T/O2V13I//wP79RRBKcto/GIdjLdIfGfj/ft9siIJWJzCpCRkQmAjIyM8/Pjv+CyL6DEjgRIdxS2Am+6YETBwxtei/4P/+Au2sk3GNgJRjzetQRpoBwCBWx57HAIcQYDQ1OssFVewifvPcF//MyxNz8fYSYDmqhYY3EimNhiiTiNSPBYAgZPn9pHBJXUCtD3ZC4qA3qppqjZ7gUwBmsUBa6/nGdvvno/A51QWUFDAALVcAhiCV4IBmQw5onnAw8+wa8k8WTL2p61a1ZXLvhg2zaUw4K6rmlqzzPPHF723lMUBSJCL4vtZ2efKUJIPgOLEtgYY//3P768vExZlkCSyvaS3bOlQMjIyDh/0a8/i20Aa2tra0ePHn33S5kCsNuM9LslDXrPgb7tqSdV27bFOiFGz9Gjz7+3LB0rq0t3jUbDpBKwSfS+BZ95bhowgwG2LJLR67DAlQJOwQaC38TqjD2jyI+++Sb2r/DB2EBVWaxpUOuZu+kTQXsC2qT96FRhtHRj9jp/mDYGpHAYWxBVQCzOClVpaKcTgi04DvyHTz3/kf/0p/cxc3vwsaRtQ9qYpSCoBSnB2GQ+axvGcoI1nuOv/eit3H3XBToGzPR5HPV8osHOCwp0O2vIb++MjEwAZGRkZCySAMk2yBADOGORdsZyAasV/L2/+3bG5TOMyuMY4xHrCMZT6wxPBGeThN9PYWIGvA4AAQAASURBVDRm84QnDq/kKw/P+A+f+DpPbfKFphow6ZJ4wXeOyjFZBdDFZp3EUliUYnbJfjeiSbvRTNAn/4LpjY4UUA9hkxULt99yGfuXSyoC1qRKUu2ngIc2UhQD6miYxgHffPh5jkz41w1QuIKqHP+21QLEY2zEt5HNzdkvfb9elt3jALv7jhVFwXA4fNeiQVYfqJ/NKQQZGRnn4XawqwXAOXdKX5JXCqqButl6Xz3bxDnDeDz+mFiL94mzPrLFr3778DpTD2JMcv43ENTT+hmIRyRgS8fQRa65dMxrb5a7iwg21kk2j+/Y5o5Y7vgMFU4pod+hBHgRkb02U5xVZhGOBnjiBD/zqa8+zee/8QytW6NYWoOgICVltUyMJU1rUWvSeRWBoZngjzzIr/7tn+KaNd5jfGRkIaiePN63UzFocrEha8QyMjIBkJGRcb5m/Lu+TXVx7ZoBwMSWvQODa+B/+ge362tvWmPgjlPYCTEYoqYKejSdLL90MAhJPtk6Bntu4asPCe///S/y+W9F2XSwEQUvhmhSLcLgsV3Sb2OSUHb+zygQRVFRoizIL7WX+ydSQEWQrjfTRoNVcKaFCJdfzMYb77iGC8YWGxqiD6hEjFNwsZtvPSTomPWZ40vfeIJ1kvy/Ghfj4Xh8tzEW1UDUhtls9sTGic3/TfXk6tb3qvJ+KgKgqiqWl5ffv0gA9KMBMwGQkZFxpgRAZzgKQFVV/UjAY+cEAUCgrqdsbq2/z4iyurp6VzkY4hVwcNzDg08+x6QFjIWyBCudhwtob4wngsVzxcVj3vbGG9k7gCJ2PLPx21l9pyzrk3/tVAAqu31pYrd7xr5xrSMD+iM9xiqUHSHhgaMePvvNKP/5sw/zradm1GZEHQIhKESHbytURpiySptlCOBnXLTs2Tc8wa/996//7RHdHtqdbtiR/NvuBFswHrILQEZGJgAyMjLOR+wMbLZJgEggogQMEGeRt96G/o2/8hZKf4QwOQoxIjiiGqwtusTTo7EFE2htwYau8vjxAf/Pf/dFPnHPTLSCWAg+RihsclSW0wQi8/OJydF/0cFYzfaUQDrXAk2eBaYLrKxCVabj9tv2LN1w1QqV8RB8qpQ7ix1YMBExEFoh6BLfebbhgUeP/X4LRAduUL6rKoc4V6Kq1JPp5mRr62eatnnBwPlsEAGnCrL7qlxvOri8vLw4GSAn/hkZGWedABARBoPBe7r7Dr3yBEAEVWLrmWxuvred1QyHQ5bGKx8zAm2AWuHR7xzn+OaMGBRUu4q6xRZFZzhroIlIVFYH8LpbLuU1N6FOwMjCDqMgarCxU8eZ04XSfYLf8wZxzh/s3hGsJU0IiIobDGA44liAz32zufNDn/wah440TGWEmgFtIxALSjtCbUmIBpoWBiUmnMBvPsEPvfZK/g8/uVejQjWEIIAkA0NBuv9/YQ5g7hLLyMgEQEZGxvmGiPTjjBYJAEMqIUhL4ZQCuLCC/+mX/1sGzRHM9ATjchnfWFwxRKPFRkuFRUPLLNTU1rLhlnl0fcDv/r/+Kx/93HMSDJiBEFvFuNTXqRIJJnZ9/WmEU38EMQSTZi+rRGLXV9kn90ZNCrYkzpcyIWDVY+N2C8HaHn7qzW+8ij3LnlIChVhUwJSGKC1NnICNNK0SdA/3P3SUp47wi14KTCkUlfsF6wSDEn3Dxsb6FZPN6dcLcduFoe9DMLy7DaCbBMB4PMZaO/cc6AmA74dLd0ZGxg82FpVNw+Hwt7u159A5YTLaEa2+adjc3PxQjMry8spdo+ESdQs18NTzs88fPrJOGySZ+TWBELuNzhpMUaTpNa7EtDMu3zfkh+68nLLL2NPI2RaDxwWHxGREG4TTSuhTbh13Htod3fcAwQqz0G+7Qog2nfOUg3/4Z0fe/idf/TbPzCrccA/OFJTGICh1E2hNAUtrMJuhYcbeJYPUR3nb62/DAK0HjAHZpsotIf3fOfHPyMgEQL4EGRnnNwmQAhazQwGQSAAIMSkAXnMjeu0ly+jWMwwlUsgYx2qqLgSP+IiJSmUMZTWkliWenpT8+08c5EOf+I40BorRMlvriissMbRoaIgSCZ2xXxCHUqJUBCmJuE7aT5L+9/OXFUw08+rKzrGAyUsgHRA9XHsNH7nh+gtwso6NDZiCGKHVSBtrVAI4xdqCthnxzfufZaIQnFCOxtcUVXkHKHVdM51Of2e6NTkW2nY+8u97GQgv/u3dLQYxRmazGePxmKWlpbW+/7+X/+cpABkZGWeWX6e1pnfhr6qqH3N67BU/NzVYBCNC9JGtjck7tjYmlMWI5aW1P1OEqIZjG7zjqe8cQdWCLUll/zSaL4RA1EhQA1LiZxMqaXj19ftZHfOmeT+/NIi02GgQLZPvjImp5U3NaffVdJ7b22r/vXRtBME4vIBzFvVKXTdIMaIdDnlsg8/82489uvmpg4d45vAmIjap5ZoZXkGKIRQVm75FxgWEGWujiofu+xajCmYeEJP2cvFpqg4e2xkZZhIgIyMTABkZGef9QmARiu1IpTuiwlIJQwNV3IB6k2o4ZnpUMcWFRC8gEYkthBZjQSg59J3ARz7zIP/+k0/9ypEAdkU4MdlAtGDk9hT4FqFBTUyBEI5A0R0lqgVRbEcOdIn9QjWlVwKk890OtoxGtp0BYHkJ7rzjCvasKLAOwXfBjxBQMEJRObSd4mzB0aOBhx7aTA8pDOV4+K+q4ZgYPRub6x/Z3Nz8jRC6/y/qCwbOZ9sLYJFs6CX/s9mMpaUlLrjggqO9D0AaU2jzmzojI+Ps7A8dAVAUxXzM6bmC/lzqumZjffohomE8WnlzWS2DHbEx5cmHDz3O5sa0c521CAYRS4iRtm1RW4KPmBhwccplFw+54Ro+T2/0JxHBY9Riop3vj7t7/08VYPdtaWlv2j5UoDEClUMoEN+ZBhrD1JZMC7j3MZb/4E8e40sH70frBqQBnTBwA6IdcKKuGV64h1jXGJIs4av3HGZSd8SECJhA75s7H5KrsKuHISMjIxMAGRkZ59sCEEmj9bp2x7kaIBrYbKBtoDCB1ZUl/IlNhuMl4iz1wDvnwBlQRdvI8U3ly994nn/7h0/+3nfW+de+gqMbihgo3Yh6s2kHzlK4XkO5vQzpSwiqdiTaajAKQgvSzqWZkOyOLtnP0TtffQlDV1MaTRUUoxTOMHAWIx7jYDJpqGPJE8/XfPuZ5EogIgwK99PVoAANTDe3fqaeNhg1GDEE/d5L7BcT/lP9rGkaOiPA+biufhxg9gLIyMg4G+gJzcWRfOcE1BGDQaMQQsusXv+F1k8oioJRNfopUcN0Cg88CU+dUHQWu0RfMVEpXQUYXGHRUCMl2KJl3yrcdqOhjOA6U1qIBBOIJoDG1H2m26Z+/U7Kru/6e6LsvAWgbSEKrQ8oUJQlQQM6nYIaXAnfehT5+v2HqcMsnYxTitLSNA1qwaOYakgMlknreORxro2QpvHQnevia9ldt20j3YyMjEwAZGRknD9BHZ30v5PZI4pTcGkMQPJYig4sbDVgC8dsBqYcEM2MIJuoUUw5JEwbcBUyGvG5g/fz4Y8+wuOH+bvTCB6QAowpUA0YNMkio+KC6fr1I4YWoUWou9uQqiVq0mi/mAIWnfspG8QXFFLhbEuIDWY0ZKrJ4Kk08KN3sHbzJcqqVfxkhjhAGszAEusNqiIQtjYYr13MVFf52Fce5mjHS6yNl9+/PB4QmwnrR498YLKxibYWoSJ0/3YYE+5Kzl+KBL9/3OmOxdF+i1X9XuovIhRFwaWXXkpVVTvmdbdtm9/kGRk/0Ii7jpcS8i0eL74+9bjgggvUWsvm5uZ3TTD269J3S0r2v3dqNZUhBgtaQGHxopyYHmmPbTz17tDOWBkNP2JCgxTwhYeRL357xrRcTaZ/NIivoTFUxRKEGS2b+KLBmwlWD/OzP3Y7117EPaaFwqd9py5nMJohTWSkBS72Y2p3Xv9+XG1/zD1uBKIqgQAxYFGsBqyxeAu1tqhpO7N+h6/hwiXuXj3gaEbd/zEYMKs3KGxDVYJGD41gzArfPhJ4JnJoJoC2EOJ8Lw/0vL7Z9v3JyMjIBEBGRsZ5zwaQuiNZMAWs8AqbmzRBLapdMGYDuIj3TQpkyhIEjm9NeProBt95jve22osJBMUS++WmS5qNJldi0W3DJMRvH3Pn5VTpXwxatxUCgnpNY5IE2q630oeWfRfwm7fdcCF7Bg22bRi6EpxA167gBIghPR/vOD6JPHlsyiSCtRWlLe92Ytja3GQymbzbYrBiiVGTieA5sHo2TUPbthhjWFpa+u1F4iErADIyMs54a+gSd2PMjkT8XPAYMSb5xITOB9ZYmExPfGAy3by/KArGoyGth3UP9z52nKObnhhI9vuiXXKcNhljFLWKmJblSjmwVnHrtUt3jAVM38hfgO/2SdPG+ajaFyNf9FS3omncbVehV+gI5QgakQgDhowG8g/WLtqDHRdpxK4zOGeoCgENOEnzd9UMefy5DWoS6d7v4RIBdSgVist5f0ZGRiYAMjIy+oADiNIXCxYil4gqPH+Ct0za5NovppOYW9u5+XsoCzApULRW8A2ft11yzymSdz1L7fHWGqJEREAcaABr0jlfeSW/ddttN1GVBRoaitJCV1FPGbyDKEQpaYJw5NgGT33n+MEgUA1Hl7mqXGt84NjR47K5OQFjEGtQjYgoYl75UGoymRycTqc457jwwgvfsxigZwIgIyPjTNCP/7PWnpPriZiAGO3UUInHnmwFTmyeuFkERkvD/3dQ8BHuv/9Znju6RVQHpuz8ALrRgIAxFhMU8VCWA/asLXPHbdcwqlLVPqLzFjkRiChn1AihgiqoJj8aVejuAA2IthhaBiVv37//wtRqB9C1XySyN2KtARQ1wkMPf/ukBD/ttZ1x7HelFsnIyMgEQEZGxg9mgNeTAF0vvpKKIgs/RBVOTDl4ZH2GWAXTdgOSDUXp8OqBgKpnvLzEFVdczt41Pm0AExOxgMo8iOqr1OEMaxEqMUn6u2DGiEF9RFQpHdxw/R4O7FvBxJbgZ+kJqaLGdu7IBUEt1g0JWvDc0XUOH+VOsVAMR79tbMHG1uTZja0Gr72zfkQ1zHthX2nMZrP3TqdTjDFccMEF8yCxbx/IyMjIOBMCwFqLc26tnywSYzxHJoxENLZYoxCVGJIqKypMp1MmzeReMeayoizAwLPP89PPPLNOlMF2Duz6tqq0n5kgxDYSfcDZwI3XXcDyiLujQoxJ0qY+katqzobRqnS9+NK14W1vvkYVj2dQwd4LVpPiTD0aGpRAjBErglhLEGgx3P/A46eR97su3I8LFj+ZBMjIyARARkbGeZn8x4Xwpw8JwnxssJk/ogEefeJ5KKQzCYh4jV04EcB4Gl9jreXSiy/i4ouK5KTfSfiT47B0QoOzFzz6WNMGTwig0RK8xyrs28ev3XLjPkrrkdDgXHeeAawpwZZENURTomaAV8fhI5ts1eAGI1xZ/UIdIkePnTjQejDiUFFCaBGjiCghhFf8NWzb9uOTyQRVZTweMxwO7wDOoSA9IyPjLzoBUJblu3o/Eu/9oXNlbQmhxUhAxKIRgkoiAWLkxPr6a7zGB6rx0n6cZVLz0YcfP0wdSny0RFt0RHbEdzJ5qwXOC9Er6qdcsq/g8ov4oJPUXkAAWhCxZ2XKSxpz24+6XWgQSANqMMD+/SP2rIwwTsBGxAri0vM0acQA0TkmPvL4k3w87uIXUrZv6Qn+1H4Q8xjAjIxMAGRkZJy3AV4nxzeAnZsBMq8g9F82wFfve5RgIFkYpcpFCAFXWqgKjIG2bRkOKy45sEoBWO0XmVRhiTLvNpiTEC8fESV0f7qr4IijquCG6/mdW2+5GEtNYWBQGMCnx7kSIniEaBxBCmat4ZnnjqMGisHwroA0m5Ot921s1hiTDBBjjGkclOg5k1x775lOp3jvsdaysrJyT28WmAmAjIyMMyUAnHNzAsB7T9u2HwohnPUxpy9n/RdA+z54HBot1jowwsZkg7ptPlAOhr8FFUHh0Le3OL7R4HGotRAjURWdz/UziLFpogqeC1bh5htgMEi2Ab1yIKgQzngSQtcWpwY9BSlugdUKrrzyAqpBJ/MXTca7nbrLmmTyr0XB8VnNkRP8RCS1KOxM8M38jrj4M8kqgIyMTABkZGScX1gIBGwXTC3eL4BF0ZQ685VvPUGjBo+iGMRajAXpmv1dVaKqDAcFV11+IRcs8SanqQ2gN/Gbj/k7iyuYFGBdCRisGAoHV1814tLLliitx5mUuKNpxjLG4qOitiTgaKNlUsPThzdSlceUr561ze+e2Nh8L5rIhV76muKumBJuU7ziL2GMkel0StM0hBBYWVnBOXcOBOcZGRk/CLDWrjnnrhER2ralbdsP9RNIXtn9K2IsaEi7iRWHBk3VfGOIKJN6djBiwA2IAkeOw7GNKdgqGeTHpOJKCgKb5G9qMGIxVlkatNxy4wFcuZCyS/rK65l72WiUzktAQTqf/kiajBPhogv42o3XHqAs0vPtJ89o5xVgSCMEvas4ttUyDWlvlVMRDT0BLzv3/oyMjEwAZGRknI8kAH19/uTAICkADAF49Cl+d4alVQNi5sZQMQRCPUkuzM4yGjgO7B+xtswHnaYRfwspK3FedXhpo6hOGzz1594FZLENxOiJLayuVgxKxRqPEECb1LwpAiL4GDGuACloo1A3yon1ZA2AmDXv/ceb2RSswRhH8EpUj7VdG0Nkx1i+Vwr9uL+2bfHeMxwOU/XqtKOzMjIyMl76+mKMuaZf67oWgIMxnhuV48LMPfHSeqyCduoEEfCzGT6Gg64Y3iVW8BFmdcAWBU3wHalrEFugKtDGVCIXQURx0nBg/xq2W/OJYG1xltfWk/+WVSgi7L+A2668fA9VoXO5f68ASCoASxsEb0acaCwtnUjhlKcXd/kMZGRkZAIgIyMjg7hrSTCYPkkXeOoIv/rY08cwgxViNKni4rvqS1mATT2Z1sH11x5g3xqXCzAqLFY0RVBGTpppf0YLmDHEFqwYnLNYEYKHrc11gm8wRlJVX4DCgkSi94gkOSvGYIshx05s4SO4UtiaTf/p1nTzo6mWYvBBEZtkoSEGRMA5h/cvLwjuTRDPhkS/bVv62dxt21JVFaurqx/03ue3c0ZGxounn10y269Hi+ShtZalpaV7ILUb9UaAZ7J29X//pSTRi2vlyUdPxKbHhRDSNya1phkjYC0bW5sfaNv249bayxCIGNqgKZEnbQ4hdM/JOVAlti0AIShPPvkk02n60z3ZcCYmq4vP32Aoy5JkTgPiLESoDCwP4JYbVtm/t2Q0ct1zSj4MpiyTR49xiCnxbpkvfu2hzpHHpPOUbX5hR96fCYCMjIxMAGRkZHQhzWkogWTz57HUAb7x4HfwskzUAqJgxHZmgdsjo4y0LA89l18MJYBvt8snMRDVE71CiJyJH6AohC4J975JBn2SphZMJwHfuRmKaC8T2A7ArCA2zbX23rO1OWNjPY1katsW3zapXUBOrVIQ7ZfPV3YJVVXqup4HxSLCYDC4O1f/MzIyXuoaskgELCbevcprkSTo15lzwWNkR6VbFm1tu/U5BLT1xNgwm/kn+0kBxG2CNMYIMZEbWDrVl0HEMmvh2cMb7OZ6z9bzN/3YAmsg+O383MOeMb921SWrLI8Doh7V0BnQSjIjDICPWDdmyw/44teeYQIoFmMTkbCd7Puk4+tdALM9TEZGJgDyJcjIyHn/jnGA8/ti6k0k2e154NNffJqWPRgZdtFXJ53sSAARxeFZXYZbbriI1Yo1CaCxASdgPGjogqczXX4MBtsZHqU+f2uFqHDiBDRtgdKZFIjpgqGYZkeLpgoRiveezc1Njhzh3SFEYtOQZAXpWoiaUxAV5swbQM8Stra23tt7FACMx+PtmdEZGRkZ301SvTBBpCiKOQEgIoQQzh1zUe1n23frf+/Qt9hipgqtR2NL20JVwnCQ+gYsMq+oqwZEOkNZQtratGB9Ynnksc5or3PLVenaBqKeMYFtegLCdHuNUawBo3DJfn7n2qvWWBp6NM7ofRdEbPfcHQSDKZZ4/PCUe+5DfMcL7Fz/Y9fE50+592dkZGQCICMj43xL/rsjVfoXKgTCPLhSQDUSBO75Oj99fDrEulFHAFiI3fQAI1hjEDzjquHG6/Zx4EKOWsBoxBmToh6bKihWzsby4yhsmcwKNRKkxSscPQLTiSOaAnUGXNERARFEEaMdERHS2CjvmXg+3Nak5J+YAsJdAduilNIA8goHUSLCZDJ5n/d+PpZwNBpRFEWeApCRkfHCW8CCnP9UVf6qqu7qVQAAIQT6CQBnY31ZlMOf6nhJe9j8j3mQgFHt1maDmBI0gLZYYO8arK1UWBMxohhxnZKt2xNi05EBguI4csLw+FPdf9V1yAUCtpsbcDaufwy+855JnLMjKecuP1Bw8YVDLFtoWycyY57TSxpNGx2Bis/d8yCbdSdYQ2jasCO6F9rkhbO472dkZGQCICMj43yNADt3fiKhr6DoPGroeiT72cHwzFE++uiTUwzDTobYj05yXV+kIDQUdsKlF4255nJh0Bffxc+bKM1ZWX4M0Sui6fxTgOpR4OhxOH4cAgVqOwLAurkKgJiSf40NpTMsjcaM4M1N6H5uAA2IRoyenOgbNXPVwysJay1N09A0DTFGYowURcFwOLw7v7kzMjJeLAHvE9Hd91trKcvyXYuP6Q0Az40WI4NiUSxRIiq6bWSrBqOCFZsq67FheYm1Ky93LI8dJQETNMnvgcJYxAiNBLwFKSyBgse/M+PwMd5MZzSLWdwez/wa9PtK71MToocAKwO4dP9eVkaKiVsIHotsv2YBMCWqljZWfOaLD9JaqJU0pSfGbfYeSC0ACwo/NZkIyMjIBEBGRsb5+/FPRzeAKIUYCwTAYnwQFbzCPV89RPBdySIKIgWIdBL0CNoQ4yary8KrbryK5SF3pL/bj1zq/ALimbUBiIJRi2pyfBab/pwY2Nzifc88OyXENPYvVf+lOxQkIhpAA84I+y68gOuu5sOmO7/CbUs0F67Aaa7fKxvAhxCYzWY7qnNLS0sfPBemFGT8xU8Qz6hCm3HOY3fyr5ped+ccRVHc3b/WHQHw8XOJAEBdOtjes3ql1vy5SZLqX7yPo9dfcykDp0j0yQdABY0yJ4ajUWxVgDVMpp5v3v8sm1O+oLpNAGCSbN+eJTc9JyAxpu20TfvvgQs5etUl+xkPBEuNswvGuWrmVv/GVqyvz3jgEe70Aq2a1P9v9KSdKqnXDGiRQ/+MjIy8CmRknNcBfvev17b3gcI2AaDzn0dJsdbnPv91ZjPfVRFSHz6azPTS73kkThlUyo03XM3aKn9k6cz4YC4n1TMuPxisKSAkOaYxKc+3JRw/wXsffuQZGp9G/s01lgIY7XQNXW+kei66cB+vftV1jMrdkxDjnAiYB1G9HOIcWT5Vlel0+vGeAFBVlpaWsg9ARkbGixI8pyIBjDE45+ZJZ98WsEgAnBstRpYds2wXbkUNGgLWCkUBl1yyxJVXHMDQgranIHdbohUohNA0HH72OF/5xmPMPMRo0wbo0n8ZQ4sROeMdQDRdy6gh/W1NPgXXXn3Z2rXXXEFZAOoRjRB1PrYQVfARjOO+Bw5xfJ2DyajQEEWxRbGTFNkR8ud9ISMjIxMAGRnncfK/sADoKX7YDRWKfRIcYWjhgQfi5RteUqatRVeBEZqoeFGU5Gxc0XL1JSP2LHHR0IHrqxLdqKbYtxy83MRXIuqg0QZtk79gbJKZ8vFNePjxw9TR4LULEo2kActWwJru+Vus9+xZMdx41T72FtxR7Tgts+MCqc6/AmnO6PzPJtq2/VBvBKiqDAYDsgIgIyPjpRAAi0m+SCIArLU37q70xxgPnVveInF7de5ataSTuCsQQ6AwMHZw8Z4BB/aMMaHpJrwacIqYADFAAImSzP9mnieeP8HDT+mvT2OS1YtCgcEpBI1Eq2e8+oduj+k9Zy1J/n/V5UtcddkeHIr6iPbkbixAXBpnq5FZrPjyt56g8en527KCEAkxLMggFvf7hT1BYv4AZGRkAiAjI+P8XQR0XtkOdK3tfRm88EQUwxiHgxo2t3jywWePsmHHYEYgA2ovuPESratoxBAapQw1F6+e4O13jll2UBEAIcwiapVYRHTRvfm7PILx1GxAGamAJaCKBXhDtQJ/9tXDv/fA40/j7RAGy9R1Q6stVIIiWC2o3JAw22Igx3n11WPeePXgntXkBYW4Ao02Vbq0Tv9vHKA6IJqGaKao+JcQoO48RHR+nCn6YLyu6w+0bYv3nrZtqaqK5eXle2KMWGtTlanzX+iD+pc7x/rcQjzDI+PF3l+7j50JpL6iR8aZwfuIc2VKQiNYm+ThqsJotPSRwWBAjBHn0hz6yWRyCJLL/NlpAziTz2cECSABxaHRYAPYkMjeaBUpLLGOXLbCx3741VdgphvYoKCK9zVIg3WRtm1AHUMZ024ptazw2Xsf4fF1/mVbAoViJVBuCUVtoXRMxRNNH0a/vEMo0OiwOGhguYCx42dvuali4J7DRoOEMbNpg6tKjA7QmaZ92UZmw0v53//T5m0ClGIJDSDlDimfm7dEGOaaBRN3S90yMjIyAZCRkXEehfg7FwI5RXxGBAqEal4/+PQ932BmR+Bb8DWqQhuUuvUglrIcpV70quGNr72Cm65CdQoGB26ALW2aHHBGVYgIRTpnDWCCw1ECBbMajm7wd7/05UeowwjEUgwqbOEITUqS0zglQ1k4sDUXLEdef/OlXDzkp4bCDtdlnScbFtQm4uIcCp6899R1PU/QVJXhcHhHVVVzc8B568U5NMc7IyPjlUOfxC96OvT9/865a/q1Yneyf+6sHX6bKFCHaDKCiQJIwNFSAVddxF2XrlXsXRqBsyCKKwwx1PjQJBLEOGgCogO+81zNNx4GL+ANxE695qLDRpf89c44ejZEhKCCFQc+CdQuuYgPry3VFHYDQsRSUBQFwXtCBLEOQqBV4WuPPMvxlq+n7bBz8VGZ7129yi/5/dkF4iTm6D8jIxMAGRkZ52vqf1KtRRd+sDASMNASUdruR5/8zDG8VETXQFFTWkNpCoz3FKpJptgELJZbbrqBV914gEJhgEFaiL49KwbE0jkVRsBjUXEIgm9hcwu+8MV1jp+wRARTGYwbIdFgBMQphBrTOf67yvK6117N1ZfxkYGAbT2IJ5hIEEvEgLSI1J3M9Bx4DbtAr21bZrPZsTk1EiNLS0uMx+O7ewLA2qRm6Ht4e0VARkbGeR4ILpCD1lqqqrqj9xAxxuwgDPs15NxBRLqkNoghiOm2LU+pgbUh3HL1Pi7YM4RSIDT4MAMJafQfIJKI40YDsag49Ng69z/Mu+dLvCYDnPS3DUbNGSvo0zYbwWgysBUYlHDLjSP2712hMAYTAxo8rrD4UKO0qFFQS5ARn/7CvWy2SbkX+8ReIoTtaT6LW7nu3uczMjIyAZCRkXF+kgCnvHMh+UeEiCcQ8KSayyNPIN85MiGUAFOSBLGkEsFq6iXQkJLMgXPcet1lXLTCz5YxYLynqSNnqkA32sU7AQKOQIEYh1ibDAEVHnmU37/v4eO0OIImM0AjjqKwaOh6+I0SNKI0XH7JmNtv2c+KhSqQZidLJIgjigFpEPzC8vnKLqF9ha6bBPDe3gOgbwNYWlr6YP+4rADIyMg41Rqy+LVzjqqq3uOcmxMCACGEU/7OKw7ZprJVIIpBJWKIVApXXoi++vpLWR0A7ZTG18S4rRwojE3jbdqAuoKNWrn3gec4ts4HovaG+mn9DyIEs11ZP9MuFHEWNb4b8wf7LuCe2199NfsvWKGIMe2lvgUjqAYCDV4C0QyIbg+fO/hkIuVt74OQTG0Xs36lm9jbkwSL4wAzMjIyAZCRkXG+kgDbpYy+VxB1dA2OoIoSCARaYAbUEb745YdordBS08xaqCOFgvEevCBuiDEOX29yy/UHuPYyPmy8Z2jsfKzymcQgAtigWDGoKfDGpQoOijFpNOCzR/nFz93zGBN1BGvAS5pGaAIhTokSwQm2chjXMh5s8fpbL+bAmA9WMJ8WgAhROuPAubnSueWm3DTNB7z3xBhp2xaA0WhE0TlC7w70MzIyMk5FAJRleXdPGPYEY280ei6RhzofAJBIgCBJ/h8lrd1D4NYrDLdedSHjKhJ8nQhiS0qogwdriaGhDZ7oCh5+6ij3fH2DmV9IktWh2NQO0I0aNGeqAJCYJg5oIKqnKuCaK7njhmsvZGXoUN+CUTR60M73wnm8RqJZ5uhWwf3fRmqBVno6oyMA2J38u27Ub9x+UpkEyMjIBEBGRsZ5HgQuGAIJBuk9iWN3v3iQVP1vSX2Rf/KpbzHTCjdcwdkB2kRM0CQ/DAouJZ5GWq66ZIlbr72AIVBJTVlagj/zJchExYigxtKK0sbklhyDECJszeDgN57lycMzZLAHxKBdKOQKux3IFoJ1LYVucN2lS9x8GXcPAbcwDaCf/pcmCTrOBQXA/OyM6dsA5hLdEAJlWTIcDq8xxsyl/8aYuQogIyPj/MWpkvmiKO4qy3L+c5E04rVpmg+ce+ohs80CpBPuDo9TuLDirldffQEHViyVNigBWzhEIPgmyfitxTiLFI4t7zh435PcdwjxpFZ66TbHIBCMEjt1gdUzVwAEAtASA+xZ4bJX3bCHA3sLitgiTZN2Y02SfiNpTq8XxTPka/c9xbEtCAK+m3oAHumm9tBNQ0hj/xbX+pgT/4yMjEwAZGRknBQWdkHDQoXbCUECIU1RZhbgq/chjz07I5gVbLWEiR2LIAXqFTTSxprCBZaGM15/26VcfTGPSwwYLBqqM1qCeuWnRCUKBJQoHhVBoyWEpOw89AQ/96d//iBbTQXGYCqbSADnELGoCiE0iPE4mbBaeX7oNVdw8YB3lotuT4tjldSAvvJj9haT+aZpmE6n8ypd3/c/HA7f37t49wH9YktARkbGeRoALqwBPTlYluW7iqLYQRJ200U+fs4Rh2pQMZhdCa3VpEa76Qo+9prrDjAyUyRMOhLUEqMiWKwtQSMMQJ3h8ecn3PPNIzw3gVgkXb1E1/0/EI0nGo9oTIn5mZ5+YhgYGLholftuvm4/S7aGeopDwAcwRedB0Dv4l0xay6c/9zUaADtCowEj89aEZCnQf2VBur4FSX1z/ZcZGRmZAMjIyDhfc/3uUPqadj9DaHF5SCUFxSB2QBPh2CZ86/6jHFu3EEq89+l3ihKsQUWJBGzhMXGd2269iJuu5XJRoFWsGZ2xjF4ioJGoLdiAKQy2sN04K0e0wnPr/OGffv5JnjkamWGgsjTBoyFiXImI0PoGJFAUMJCa1996BVdeyO8VgNOYgkRZrJyYeQD6ir58XTLfy3Trun5fn9z395dleZcxJhMAGRkZJ60fuwkAa+0dfd9/jxAC3vtzTDnUKbC6ubUyX4sDTqFUePXVFTddfgGlNkiYkRhjm55nUYBYmjrtHVsh8O2npzzw7U5SL46IW9gHI4hHTZhPrzmjFVQiop7CwsDBBSssXbFviUKnmNAiUkAIYIvUgtA/T1Mwaw1fuXfr2QBgqpTuG9Ml/ovatAWVmnTPYeHqZQ1YRkYmADIyMs5bxJODqkXYhYeIwQcl4FDgTz7+Tdp2L5OtlmptDWoPkxpZWmZa10SUGBt8e4yVcc3rbt/HRXt5p9WIRIfBzAPKF5s5ftLipWA7xScmgLQEakJs0+g7DAFFHHz+Hm76yjcOE4sBFBZTlEQVkJIYQY1iTISmZWk0YN8y/NDt+9ljYBAU/IxBafFtiqSC7lSenm28lOffB+a9u79zjrZtD04mE/oKnqqyvLzM0tLS3f3jgXmLwA/GFnYmR8bLfW+m9+cLX19VecHjbCSwpxpTl/HS0Lbt3OQvxshwOFwbDAbXLF7fGCPe+4P9evG9vuYvdf1P56wQDUKBiGDFIm1LGeDmK9C3v/5VmHodYpP2CQxBwZqiIw4sRTVk5hvaouKzf/4oDz2ODFdh6usuqbYYUcQkw1g1IKIYu3vv/O7etwbBESgFhhZe/6p9XLZvmVICflqnDcZW6TYoqMO3Bo0WjYZnDnPAArQNoEQf+q47AiDG5sA/IyMjrwMZGRm7o5B4igDGnEwM9HmiMaR5RQZJA/i475v8+vq6Ug7GTI4eheEArKFeX2e0uoIxQmGhMC1LI8/114658jJ+z8ZAEQXh9IHedxVgShrZl5yg40IwmcYBTmse+Nin7+PoxOC1oFXBDpaSxFMsIt15qAEiKyPh+iv3cukKf1YCSwWEetZVTarud4QznQV1uuf4UgPsxcf0vf/ee0II8yDaGENRFHf3Y72+62ubkZHxgxkAdkqhvl2oKIod5n89MRBCONhPGHmpyfn3A4Utt8mmGCglUAJLCrdds8yBPUNWSptGxaBY26+rHUllSjyOKQWHnlnny99saICNSdrqtp9vhBjSftGNnVVNrWcvZ30HECImeIoIt1yJ3n7z5Qy0oYyewrkk/Q8+yfexOHFYKoyW1NPZtj2Pi4iJlIWlbZNIbTioCDGwY8hvlvxnZGRkAiAjI2MH5o7Ai43ufufPe1NAYucEAEc3+ZffvPcBmsanSpIRIBAJEAOiQgwtwU+xZsJ116xx282wXIDVLSSGkwLKl1phSuOedhEaHakRu1tnknp/1sJnv+B/+puPnsAXqwQzgKJIqk5jsKJdRdxCgEEVufHq/bz2hrU3j4GxgLSKoSSoQ6zh5VZ/Xm6y/0IBZn8NO7fuQ71ct1cIDIfDu8uynAf7uWqakZFhrZ2ThWVZUlXVe3pFUb8+dPL/jy8SAOcOIgaZJ+IDaRkCFy/zD95w8xXsX62wFWk8nqTnK6Zz4LcGjKXVkpmu8oWvPs59jyGtQFSwbkHl1Rn/LSbS8SUun6daZ1UV0UAR097ymhvWePU1ByjaGuMjTgy0LfPePAFRg40FRXAUeK64kI0KcH6KCRG38N80wXeO/yGRH4umgLpNC2ROICMjEwAZGRnnY9K/awTgdmDgU/DQNxUiyW4YcMTeWiiNyfMNqgFXFuh0C0jViDCrseKIXkGVUE/Zs+S447aruOUqo44tSDZGLyloOl34pywYAs6fU5ybHVUl1C08f4KPfvwz93N0MsKVe6AN82drEAgQjUVjIMSai/ZWvPG2K7lmmT+ggUoAYwlYjIEQm7NGApzuOS+SIac7FtGP6/Lez30BRITBYMBgMLijl/RmZJyVJeQUbTvnWpU44wUCwG46SEcA3FFV1TWLLv/9GuK9nxsA9mvOuUAgBt8inZtd6QRtAsvA7dfxuzdftZdh0Y3Fi23XHB/T+D8UrCFEaLTi6eOOT35xylaAJqaNLcZUpYeIaLo1sVcACEEMeoYmthVw0Srvv+26fawNWkptsd6DKD40nfluhOjRCDQWaZU9Y8ePv61cqoAiJrte3wSGgyGIo2lDEutJ519DhAVvH5XvbQtbRkZGJgAyMjLOdRJgXv3ve3f7ysGC6Z0pQS0Ww8Amf2EH3HgJ+ubX30RlhXo6o/ZTMJHoG6yxSbIYHEM3wATFhcCrr7+CN99+BUPA6hmeuhgiDhsNdiGvVZPaAcQDQQjREi184rPT+7923wnK0T7qNhBoQRuMdn2Z1hKt4n3DoIjcdt1eXnOd+7mC1KcpYgkxgvVE9WeVAHi5QfVisK6qtG37ob7K31f8i6JgNBp9sK/uLf5eRkbG+UvgADjnqKrqPWVZnjTmryMAjvXtROcKASAaEQLOKEE9VhSJcMka7/+ROy7nsj0GoxOQlmikG2oTidokgtsoXiMzX/C5g8/ylfsQb0BtUoF1Ird5e5kANlhssEQxL1kBcDo40pjZm67iXbdetxfTPM/Y2TRG1yhSGqKFFo9KxBhBvEVnnnHp+Ykfvo3rLuKeAbCnSjv3dNYSulm1c0GfRATtCHvTTQcgOwBmZGQCICMj43yHLCwH2rkdz6cIAYVxCMll2IeGAti3yl3//TtvZN8aHDt6mMFgQOFIbvrWpBl8LdjgEFNisMRZw0VrY1578z4u2cNvOnnhwPTFlq8gaQyUaDqMmnlgM6czGnDFiFkQDj3JzZ/87MMc2+rmQZtIDHUX0FqiFUzhUCMY4zmwptxxy8WsAdZ352Ui4DkbJvovVvV/KQH8bgLAe38wTWTYruBZaxmNRtcMBoMdbQMZGRnnL/q1oaoqqqq6e9H9f6EF4Fi/niwSAOcCnGXu/eI9DAVedyPvev2tl7Nn0CJSgxOkdKg1YAJWUkIdYkSM4cjxmv/6ucc4tgV1ADsYgAcnZbe+phYJomBCAaEkqCWovGgV/XRKGJHkobMypLj95gNcvm9AoRsQW9QHNHhsYWjxRAJiI1jBaoGEiIQNrrtihV/4a9fcMQaauqfuO3+DQTnfBwWw3U9kt/d/JgEyMjIBkJGRcX4m/ilkMC+4QmiUzvovcQKrS/AzP7n2sR99281srj9KqCeYskQkpozbGGg9tIJoCXXAqiBecNFz/RXL3PFa81vGnNwD/91IiBUDagGHLI4U7P5coQMcQ8DQBscswJ/9+dN8/otfxWvEFIGoM0TSE/WxJtqIsRYjkaWq5rU3X8wdt4513jJhoQ5t8maSM1cAnGk//qI0N8ZI27a0bTsP7ns1wGg0YjAYvKcP8rMHQEbG+Y0YI845BoPB3WVZzhP8fiRgRyh+vPcU6Q0C+7aBV3bzilgDTetxzqAKV19O/fY338aleyucmWGkBSuoUbykfnjj0sQXJRmm3nvvg3zjPq4N1nassYIWOC2BSDTbd0usQCtQ+5Ik9KdqiemvrxV47a3D5vZbrqGyU4bOQzPDuoIYPa02+NimsYMmgG8QNRTGEZsNKjfhp3/8jfzsT16oI4ECEOnGFsawY5Kv6dr2Th4LmJGRkQmAjIyMv+Af5e9uvFlf9Tfd75h5fUD77Dr5ACp4n2SEQ2bsAd5wPfpLP/92No88wriMHDiwj63njxGaACKEegJFZwroStoGjBY4EQq/xaV7lbe8+hJGAQYasV0Df+pN3B4h1j8XIbULWE1mSCqp+h9P6mU0O0yaogrOOup6Mk+UH/428sd/+hjPT0ZgRt2vWXxUZn6aJKISUW0pbcs1lyzzupsvoQScmYJt0bZXV7qkPiAi+O6I3UxqA1qiOLQ3LJwTBt+bMXS98Z/3/uMhhHmPL0BRFJRl+a5zrYqXkZHxykBVsdZSluW7nHM75P09odhPANid1J4VL5G5cesp9q/O2CWtp8xVXqJ9b76mdixgWCSa98aLKd9w6yVUbgo6o5VkEOgVgu+mvNgSUzhaU/LMbMBnv36MZ9c5FKnAgp9OEISketg2zdter9MoAFEw0czXesWkfUNi1zIQIUoa24dLZLV4hBanLSXw1tdexS1X7YVmE1c6NERYXkGcTX38YhFTotHgG5825EqQMMM2m+wxJ/j7v/hTvO6GRIMbnYIz251pOziaZGQ433V0Yc/sKwFyurjCbX992sdmZGRkAiAjI+P7AunSdpmn77uDqFMf/d7ddfXjKLu5xEKFocLiIgzcAKIDhIKagsAtB9B//M4f4hL9DqvaIG0gbE0ZlRXODolBMJUlmpZYBNoYCGZA08LQesp4jEH9JD/62iv44RvR1ZBUnEVliEGJKlhTEYJ0JksGGw0uGIpgsGoI4lBjupF/oQu8+iCxhGhADVpEpmGDouiSc6ucqOETX+W3PvtNwOxlujUDN4SyxBWRyBRXFYTYgq8Z2yk/+ZYruPNatBCgbRgNltB2iIlDjFqsLhgjasSoQWKFUhGpUujVnSMSu/N0CxLTxZFNL/3o+/v7Ct3y8jIxRo4fP/4TfbXOGENvCrhnz55rlpeX7+oD+fn76BRtB7lFION7n4DKGR7ZcPCFr29IM+u72fWLa4dq6NYPy/Ly+K6isDTNDGOgqgratqZta2azyftElKKweN8Qo6co7Jm3QHVkqGr3PogWou0I1ZR1C4pR7dZTwXRtXg7FCqixDAcV9daMS5d408+99Tr2l0chHqc1EV8NqRngxFJJAXEIjWNrOqEuV/jYtwIff4B/MhGACVagckXyDZCQknocikvOOLZGTY3B42Iy4CuCQbUgiCHYSLCdEF8jVktKu0wMBeIKVFJ+Xkbl9Tc6/aFXrTHyT7JUVah3BFcSZw1qC8SWoAUER4gDbDkE20BYx5QVRTthj3+aK4qn+We/+nO86Vp0BEg7hViCDsCW9K+6Eoi06Tt16aCYj/Y9KU6Y9wAWC8epHpeRkZEJgIyMjO9vgEfc6eM335G7ynkXFy/e9l8bOudkGpIvsiUgeBSvaQ7AbNZQVQUlWyyJ56oR7/pHv/xWbtpnWArHGVqDEwc+0LaB4A0xJKM5pUXxGOtxhcVa051lQ+WU1TLwY3deyx7HeOigbSIUDltUNG3DsCoXvAlS1X+367JoCiTnz19T4k8XtDXeE0VxpjNBkvTjp4/zTz/950/x7WdmLO+9lMY3tH6GJUlffWi6UVEWGRSsDqbc9UMXcWCJN40dtJMGKJKwUk+zjKp5UatlOYt5S58E9RX+uq53jPPqJbyDweC3i6LYkTSdrk81IyPjLy76z/CiZH+R7CtLx2Aw+M3eHLQnDfvpIf2IwO/T2e5cL2UxQO1619XuyDl9ULRtuEDgx1534eevO7DEuGhxThAnRGNpNabnMxwBFo0WM1zjoSc3+fAn7+PQYf55tGn/iDXgE2niSssioZ5UXB6kQTRV03es37vWSyGZK6oqrqyISvLICTBycMvVe9i/GhgWNWiLCsSiSF4FYrEIhYBVJbYe9ZpIkxCSMs8UMDvGeNhw2Z4Z/5f3/gK3XcrRJSIj67vHKUiBN0JDJOCxzlAVZb9hziOHxS93KwfopwKRJ8hkZGQCICMj4xyI8OhklL0j/TYNIJ28X7S/dRgKDEMMY8Ax0yYFNUQMFcaMCFISiggDwEVCO2XNwEjht379be+/8/o9xPr4PBDrK3CiBokljgoTS2wUbDvB6gQnDZa2iyFK1I0oRgPe/KabuOV6NsV3IkPTuyt7RFuspiDLi6ExhsZGvPFY9Uj027OZd/fid0l5SoCTwZ9qGu1UONjags9+4dHf+cK9z8LoUlQ9JkxwUlHYMQSPtRakhCiMxo63vuHVvPZKPr9XQGgw1qCiBBMJXey6PV6pl4EGDL47dgdVZyeY6oP5/nVwLnkhbG1tfbzv/+/lvM45xuPxHYPB4Jrdgf2p+lQzMjL+YhMAp1NJiAjD4ZDxePxbfaK6SAAYY2ia5tOLJMDZJgNUduWac5VCt0oKRJGuEcAQOxJYu5VfxFKo8qpL0b/8Qzdy8b4LQUpi5+liqSltRHvL/nYTcYZJ3MsnvnCIe74yEd9CVfVKhO3jxVocUvuZJxoPElKCrGa+FalAkIY6bCFWUB8wndrt8gM8c8frrmJ1zwBbQtQJQWYYk9ZrE5PuoJCGyraU0mIEMGOiDmmjAzuEcglmWzg9wp7iaf71P/8ba9et8g+qpmXvqAsHjIGyglGBFtDEmtBOKOn2UfVpokKnShN1nRYQhBakO4zfngykdCq7/BnLyMgEQEZGxiuQ/LNd9JduZvGOXr++x99iKICSXs4XSf2RwUIk4gk0sUY1znPUwsGqhb0Fa7/7m2/V11w9YEmOM7SW0BUZVFPi7sRgVaCx0JAGKocZxCloDRqICiE6IgXGCJfss/z0j97EagFDAxobVD2ugKZtU6VFIYjgLbQWgokY9ZRd4LJ9PeJOIkAN1hYIFo3pPL1P8ZAATx/mN/7rFx/loadqysGYwoJVkyYgAsYaMAVN2zIYWi65cMhdr7uR/ZZ3jQSMjfPWgxTsdWm9QJSYgsKOBJC5C3P3cnWvlcrZIwFiTC0B1lpEhOl0+u6+ktf/3BjDaDRiOBy+Pyf4GRk/2DgVqdf378cYGQwGvzkcDudeIb16qCcO67p+Xz8B4KwrAdRsz6o7rYqqH/fKPPkPIoRu6SrFc8GI8Y+9/gC3X7eHsYXghagdkayeQSm4wqDTCeChGHH/EzV//KfrTFtwLl0b36a9wdkS5h4AO1L+nXsNkWj6nv8mtZjFbhKN9vtADdKiGrDGQAMrJbzljr0X3XbzRRROiUAb08xBMQrRpykARGi2gAY0zDdbsQ4VlyjlouLExnH2rFgu3QMXcJj//V/8/O/euMq/MlstK0Of9t7QgG9PGgDQu+xsax0WmwnjfGbASTuFLngCZGRkZAIgIyPjFSQD5kHKNhGwM/GMO0IZxc1/N9pAlI2O6VfQChtgMINVhX/5m68/+rprLXurDZzzbB7boKj2olRgXEqqNUKjMI0wI30tnZNgbCDGzhDPdTHUhKE9xptvv4S3vlbUNGAjiHqKwiHCvMKffJbSLGc1UGiaoSynqqQvJNXzilanJ42ahhMYmxL2z38r/pNP3vMEQZYoygFERZsWG0lfO8AJSMtIGn7k1qt49cW8f9VBaLaAVP0PYna2YszJmLYzBuzaLxZfgbOU/C/K/PvA3RhD27aH2radB//948qyZDAY3FVVVa7yZ2ScBwRAvyb0a0SM6b7BYPBbvWJoN0kQQqBpmo/2lfDda8XZJgRE09azmFb2prBhXvmXzmwv0drOK1dewOZdr7+KfcMtTDvBigM7QEyBlQBhhrGaprYsrfDMJnzyi0/wjYdS3V6AeqaogjWWGNNzda5caCk7xbXt1AuxI54NcW5Sa/qNwKSxsUpL4QSncPUBNn78zTdy8V4BrQkKSIWRARYLMWAIadysD53UAKKvCe0WmICUjlYjNYHh0hB8jdWaS4eBS4oNPvBbP/MrP3Q1Wk6UMnb7jS1BKhBDYLvboicBUoygJ8UK/Wsybx+c72N578jIyARARkbGOYqI4lFCZwLUEKhR6u3EeUcZQLHaMPA1qwFec4BH3vcbt+qrLh8x8EdxoSasbzIaDgl1ndJvlU4zmcYnYYZgl6FYBuPACGoMrUkVdWcKHBGrUyq7zt7xlL/y46/jAgdVBBMCTeOxhZ2b551kYqjg9MUXsFQBt2gUnHNYk1QAMUK08PQx/vlnv/IYh56Z4M0YXIloxKayEC0Ndig0zYSB1Fy+B976qovYO+CdjoBIS89QxIWgUHck+YuqhO9NkN8H6CGEHSRAXdc7Kln9zwaDAUtLS+9alPqfamRVRkbGX3zsbBMCaw1lWVKW5Y7P++Lnfjab0bYti21EZ3Xdkr5KvsAAEHeoulQWHPg7R//00IhTGAOvunKFay8eQ30UG7ZIEq4CT5HW+3oTtIHlMY1d4vP3PcMnv/gMW23aB9L1gcJZRCxN06Aq9ONSX3B/6Wxe+uRYOhIAXHfuiXjW2CJ+wkoFr7vlwqWbr1rF+aNonCEUOJZSW54Wiagxmp7zeD+YZShXMIMhwcyIZkpRJJJBRIkaaLcmxOPHodlib+G5/kL4v/3mz/Nzb0RvvIBfG7Ug0waJCtGi4ojWzbej7aEBsYsV4vz++Q6mLKT9ESHkD1ZGRiYAMjIyXhGoW5BSsoOUn7fqAUEiQTwqLZga7BRcDbZKSbtUQIkNnrFGrrLwI5ej/9dfueOan7htH3utZ220h8nEYO0qxd49RD/tkkqI0acoygxAh+jUsnmixVNQm5LalQRbdCZ+AbTGyRbWThjaLV5/44X82J3oBQ6qAMFDpNwen0foAsRUkZFdJMfp+ulDBONSVScGEFul66HQRpgofP1Q/ft//PlHObw1gLLomIU0EzqaFjUtRhRCzcBs8MbXXMptVxe/twI4bRYCoV40aRbOe3uGdH+cbS5gMeEPIfT9u9cURXHXbDZ7n/d+bgLW35ZlycrKyvtP5f6/SAZkZGT8xU/8+890+vynkaDj8fhvFUUxXxP69aN/7GQy+b00XYTTrhFnJQTVFwhDFZAdmoC5sq1UuGE/j7zttisopYEwTS75OkNVCF313lkBnYIIX3l8kw//6SHu/zYiTkAEwWFNQVFU8/3MiMO3L67QWvTNE3oFW9oHVEtC5y5o8KiHy/bxyA/feR17yhobNrBGsdZh4zLSjlNfvQgqkToozx+DR5/yHJs4dLRCHESi2QJpsLFBZzWDckAxWMUMV/HTBkxk4GbsiYf5X3/9v+Xv/9QVv/PqZf7ZhcCwbSiMBVPhQ0VgjFIRKEguBrGLFZJdT3p+Bk1SOJgPDe5MELMpYEZGJgAyMjK+38l/l/j3MsXezHehstJXpbcjlIVDSH2B3kAbKULDmMglFv7Wj67p//JrP85rLx2x0mwg0yntpGFpZY3a14QTRyhKQ2mSzF4xYAaojlifFjz8bM3XDx1lIw6ZSkErLvVtakj9iDoDacApS0uwVq3zV992C/uH/OZIoDQWH22Sfva9/Rrnz1VPmUCfmgiwpiDEgA9p3rSzBUaSuqD28MRz/OIn/vwZHjteUGuJoqAeoqcoheBnDIYVsd2Equa6K1Z4/U0HuHYvH6wiOPVYpev9dMSuT2F+3XXn9IV04mdn6e2reotfd33/a865u5qm+UA/InCRAHDOMRqNTjn673tl+JWRkfF9DvC6nv7tz3ZX7S4KRqPR7zvn5mvCbsPAuq7ft7i27CYUzvq56k5ReZLX9wtdalqzeCwtpcIgwmuu4po33XopNJPUzF8J8P9n78/DZTur81709zVzzupWt3ttaW9JW33fgzpEKzC4AWyDY+w4wScH4ti+T2KSC/e5dg62c2/g5NpOcpzEkENwB6axaUwjGwkjCQQCdajXlnbf96utqtl83zfuH9+sWrW2BMIIIcvU0LO01l6rVq2qmjXnGOMd73jfyMrSKo3K+c02aMt8N/DNJ45zxwOsn89BqTZIivdCWToiUBqV+5MkGYIhK1e1RtgJ6HitR4+sL9Q5SEwE1iUBDC3rSYFN69hy+QXryUKfpobEeIyqk7VTMRejKUWz6DPufuQIX33wCI/sL5gNHQqTUgQHPmADZFmDUNRCPK7CzkyCz5GFY0y3Fc3+If7FT17P773r1b/1uvORKSD1OanxMZ+i8CQjq2usFAdQtVUgCTJUChiT/8cxjjEAMI5xjOMFjtFszdMcfWyW1l1wUnvgjZz5AoSAlYKOVEwInNPmn7/rn54tv/5Pb2DTxBINKVBOkSqLsQrnTmDTHJPUlkTisQh5penrCWbNar76xHE+9uWHuPX+veydD9jWKpQxKPFYHXcySQSSuHnoyz6TaZerz1/FG1+x7ncngQSNIsF5h7IGrQJUJXiFUdFSqZSnt/txZzQMBQFrJWuMSTEmxXmpaZmRFZCmse6662HUZ25/gqN9g2p1oJ0CBRohSxPwfbTxIF0abccNl5zKNWc13pIIrG6nbZzDEi0RFRaPQis7EC84CbR5hu8/xwJ/sKertcY5R1EU9wEYY65aWFh4Z1VVaK1pNpuUZRlFG61l/fr1EkKgqiqMMUMBQa3HqWEc43ixx0DBf1kLAJLE0mw2f7PT6QyvHQMAYPDvqqooy3JrvIboIbA4vIyN6I48W5y8WrQSjFT1hP8ZMpsCpTQEj7UJBE+Co609mYcrz0V+8qaLmTJdms2U4AK4HGwgsQbtBZO2wBl8MsmuWccnbtnD0R5HdJJSuqgnoLXF2jSuA9QAs3MuXgO/k05Lff0WUUgwQxAgPu7Ba5mgQkbTZFDAhknOe+PrLmTdlMd6B6XDl31UQ+JufxpRkLwSJFvFE/t7fOr2vXz0tiN89q5dPHFYqOwpoGaiGm5IoCdobUB7SB3IEtiAamRQlSSZxvYOc8OF0/zeb/48v/nLF8n5M/xOs8xp0CdTAgMGmxkpJwxgbP3FQPDPrGj9k2R8fo1jHGMAYBzjGMcL2v4PxP5WhqUqFEgWpf5dLFS0AaqYzmc0TANTwLWbkP/j16748E+94gwSd5C0LVBWYFN0M0GZnBDmgUWQKi7TVyVKp9BYw74Fw9/ct4dP3LmVLz3s7ntgDzy84wSziwEkRXkBq6OonquiZgAabRXK9FjXqXjJ+eu5dIuSNFSoUIIxuFAhVYAAOiiUU3hl4pDl+xlFjFBOJUBeQJXBF+46/IcP7ZzHp9P0e11oZLhKkMpByEHnOOXBejavTbju4lPZPMmv9ufzbgYY5wjOE7yg0DgZ7LDqKLgo9cewoHr+LsEhBJxzt1lrXxNC2DFQ/fbekyTJsOHPsoxms7lC+XtUMHAc4xjHi7zI03oFoGeMIUmStxhjEBEGnwfnv/eeoigeeroK/vMV4Rm/I6pGAbTGVQWKkjSUKAdrG7QvP2sN55zaoW1ypMjRNoU0wzuHK/pkxoI3eDqcCJN87s7H2T/LdaI1hTP1Otp3ucZ9h8n/SpAi6gboYJetZ/HLeckLFD0mDLziJfaJs05r0NALZAawCUmqcEvHMA0HuqDyAd2YZtuhki9+7Qke2stnHtmPuu3euU/+xRce5Ov3H6Xn1kH7NLAzYFsRsChzuvkiZShqox/BuwKKBWAJ8oNMqWO89XUX8j/+w8/81q+86XRZq8FKF0ufRFWRvVBv2UX6YIi2CBowCmUVWps6n0GtLzuOcYxjDACMYxzj+GE3/wNt5Kc1uJLExl+3gCZGmijJMF6TlJB6aDloeJgB3vn6VP7Lb93EjRcpGmEXWRZYWOxTpS0q8YRqDq0WSLM+JnGgBVEagkZosn8evvjNnfzJrY9w+7ZCPbXI1d/ei7rjW9s4cKhLSoNE6Uj/N0RFYtvEqwRRJnoMN0uuvuAUbrxiM6syML5LYnzU0pPI7rQBVBA8lqAHmgJPv4xFe75lJsAzWQQiGnGRHLHkFFsP8ut/eeu3mWOaKm1DkqBVhhIbFZlTodSK0pesagtXnrOa6y9q/WEb6ACJBKyEwRJpnHTVegCIrV0XBqjFD/bSO6r2PWjmy7K8zRhzldZ6S57nA1AAa+3Q57vVajE5Obk9SZKhWOCgCRgDAOMYxz+CPDEC6mmtybIsybLs0lEAYHANMcbgvafX6731hwMAhBFV+cG1e1n8TyRgbAKhIsPRAJrABaeydMOlZ7BuKkHpClwBxkDaJNgEaxTKKLykVMkavvr4PH/9tWLp4BHuRjK0SXDPpMLyTLliRfOvlz+kNs1Ty98LAxFYEQiepo5w76oGb3zFteey5ZQG2s/HhBZCzCsqh3QBH2ah2WDBtbnjvr3c+vXwxZ0nePMJD1sP8tbPfflg+mefeoTPfXkvO3cUiJ4CnRGCgLE0O21IDL1yiUJyzEwDSRy0NTQDijk6cozLN3ne+RNn83vvukzOWc1vtoFUoCXQVGCqCFzYJINQAX2QHuK7eKnQOiGQELB1/h3HOMYxBgDGMY5x/BAjjHwOK3f4Bqf2UOi/IqOkhaMRYsM6DVy7Gfngv79RfvVtN9KqdjCRzDK5KqOo+pg0QTUUJTkudOuiyCClovIWSafw2Woe3TXP529/jM9+ZRvfeKKrjklG2Z487XgFdz/Ar9330H7mF8GYCXxZN99pG69TRCd4qQuussuqycA1F2/kgtO1NAFLwGpILBitUaFCiUcZQ/U90ei/s0XgIBpZE4+FBG6/j01/d+9u7PRmnKQY04pNOx6swVtLXpUQuqydgJuuOoeLNyJN4qZkqgWt6gJQDR2cIj9DzAj7IDzz4/sBFfs1AICIzGZZ9u5ut/vOgUNACIGB9VeWZXQ6nS1pmg6bgNH7Gsc4xvHibv5heRWg3v3/RJZlQ9BwlB2glKKqKoqi2DpYK/rh5rKTylIfr56JFhoKMuD0Dr93w0XrOW/jFMr1QAnKAN7jnSA6BaNxpaNQHfbNJ3zsCw+y/SATIuBKqVfjBFHyHfLpcl79jq8tEYBXI2ypqFugCQSEknbmyIDzT+cz5582yURWoV0v5qFQQZFjOw2879MNFVUywX1PHuFv7tzPnuP8eA/QrQTVSDm8QHXX/ZX6k08+dtsff+ab3P7AXuaqjK40KehQ+AxUhk0zMIG8XEA1FFXVxVVFzKFuAbW0hzMmF/jxazfwn37zx373p185LVNETYVmgEkTX2fJ+1ELZ+BkU4vxegkonSzbCI9jHOMYAwDjGMc4XuiKry5clAcchpK2cjRZokXFGmASuHg19/6nf3u9/Nf3/gyXnq5pyWE2zGQoH8hne2ibkLUNlT9OmvVJMwM+RfIpXFhLoaaYdS0e3Of4+Jef4OO3Hf7w4wdQPaXpVZb5QvZ5A4dm+W+3fXU/9zx8mJ6fQLLJ2PgrQxVicedFIGlAcBDmOH9Lm5ddsYFTJ7iJMvbeibZ1g1oBEQAY2hKtENkLKz4GTIBn+gCNwrK0VNJIM1wFcxX7PvTJb/H4vgJnVwMWglA5wYvGmgxdMxbazcDFW9bysis20qJmXuJINXFFQguiaxBg1O7qeyguv9f4TkJ9g53doijen2XZljzPPzhoAsqyJE1TQogaCY1Gg2az+Q6tNSeLfo1jHON4ERd4WterP0P7z3WtVutNg0n/MzGHqqra65z7IV0DpBbOY7mBhqEbPYB3JYn2aIEWcOVZ+jduuOQM1jR83aACRoOCqihxZdSvzzEcqxrccteT3P4tVK+CZkMjvqpda9xJ1+Lv9vHMoIWivh/latbCYCoeUKrA5V02TPHGV123nnWTikwcRhPH7IkmeAESShJCY4YnD5V87iuP8sCTqD5QOCicovIJyrQodMITs9z8l3fNrf+jz9zPX37lIbYdCvh0E06tY6mX4EqD1iAUVCHHiyOIRqmUJMuwqYYwTzW3jZdsafCb73wD/+nfXikvPQNpA00Pa1NoEIGARNdyAMP6whOGwMA4xjGOMQAwjnGM4wU6ffXK6b+mLm4KrMpBlmgTi6dJzbp/+0/Pkg//55+/6qbLppkxh1jVXKKRRSGo0huwDZQoyu4iNuQkOKg8ZV6BnSSZPJOF/gz3Pt7l//7s/dxyX/G7247zy7lYdNIBNMF5qqAwTbj3EdSX7trKkwf6ODuJaXRwXiAIIvW+pG1AliHSZ90qxfWXr+fK87mjYwAHrvKEwWKlquqp1bNYSK1otkdBkjAsPbVuE7C4vACgMHD3E6g/+eRXmes2QBlIQHSKCwmIxero7ZwYz7pJwzUXnc6Z6yILQHliUSi+9vwLT9cpULK8nvADAACeSbRvsNOb5/ltAMaYmcEawOjUb+AI0Ol0PtBsNldMBccuAOMYx4s/BpP8NE1ptVqfGLB9BmtAozaiZVmS5/l7fhgaIOokW9TRvBaIDT2JBS/oIGTAaTNsf8nFZ3LhadM0yckSg/cS5WSSjIZNSGpAoLIZD2w7xMe++DCLRdxZbzWmXg+BMu9FLZqnNfl/X2ZWBAEiMB2i/SsW0YLRUebmsgv5zA3XnMdMQ6FDQEkgUIEJ6GyCsKTQyRpymeH2b23jzvv7v7vooKR2cAgKV5QUzuHTNi7J2FNw5M6tqP/1mYOf+egX7udbjxyiH6ZodzYgIUFKoZk2SNCk2pImKYim7BWUSzlgmZqcIOsfZqo8yOtfuoU/+Pdv4d+87Uw5tcU7pITJen1BVRDKKMeAqo+LGgAfYxBgHON4sYYZvwTjGMeLNYYkxLpukpEVgLp+QkiANvCalxh57//zdf/uNddvQha3sqa5RNOWUHRZKiokaZO0Z/AerPM0Gg1M6cF5cA6nUwo9yYHjirvuOc4Xv7qbL9y/qA6UfCWYJo6U4D02AWsCoXBktkmvdOS9cCMsbVm1KmPVTAPrC6xyoH0ELyRFmxQlFaSKRmopRfHE7oVz5rp8qgxgbEoInsimT+IK5VD8UJaf9LCAE1Y6NcvIiyMoMYg0MWiC72FTKGpngWO7iw+dNqN+45wNmiQtUSolkKI8aO8xBMSDtS1M2mGx12XPgcVjJyruqbREvUWjhn9byYiCsvJR82BQBT8nUyX1jNZcg3+HEEjT9MZms/mBXq/31kaj8ZZWqzUs/mFZJKyqqmav17sNGOoEjJkA4xjHizmkBvkMnU7n2k6n87tJLd8+AP+ccxhj0FrT7XZZWFj42YF16PN+/itQouIufZ28RAlB1X6F1kLlyRSsbbDuFZeu/v++/roL2TjhsXRBgzcKry3WKBCHsYZC4InDS/zpLfdxx/2i0kThg0Vpu61wFaJBG4XCoVQtMjPq1zqklI166K4EKSJPwY9ICQpCSlAKZTxWC5echbzlDefykvPW0pQeBgcaSumjjUbpNlVucclGvvnocT76hSd4fC+vKDV4MoxOIuDsHUEcjoCzitwGKgNFj4/v2ul/e9fe3e9VkrNudYeZdkbiHOQVmCaqV4ILkCaYJKUkpdIdICNVjpbvYlyfdsNw4QXncNVVW34yuLn3Praj+9vNBMpaGzCIjVQAcbXnofygN9jGMY5x/BBjzAAYx498C62+hxZshTvOyIcaFQUafCie+WPFaaef9ve/82M5+W+Mlnd6WVxu+ZukAp364/pzkN//zevlvf/6Z9g01cPm+9i4SpHKApTzeJ/TbHfQacbcwiLOOZLEwvwcOKLdUHMVtnMKO2c9n/3aE3zkbx/i8w8eVUs2Izdt+iHFeYsOAel38f0cYxTz3YKgYfcxbv7inSfuu/vhg8z2UsqQgbKYuuzr9YtInUxAilmmJxxXXLiBzev4hXYSn12aCI0kKveHyg3Fo4YOCGrlNCeoZ37tltcFolK/MhmpjcYEECdFx7vs+8hfP8zOuZK+0zidoJTC4DF4UAqlAlniWdMRXnrpmazr8IcpYDwkWsUHKiFqSg0UopVHVKSt/iBK65Mp+4MJ/uB73nv6/f47O50OeZ5/0ntPmqZDK8DBtL/RaNBoNN49uI/BZHAc4xjHi7j9r68F1lqyLHv3QPtjcI6PMgCUUpRleUetHfK8M4DiWpTCK12zpAJGAkZg2Skl7p5nwLoOd1x53gbO3jiBFPOgA0Vw2EYTmxrKMociTrcPzQW++dB+bv16UN5CICNLmyz2FhAdaNRsp+UHo5/++Xtgl4lEmQKvwOv4WemAFU8jwCuvXsUrrzmLlC7i+6AVZBl6sN5QgU9WM9trcufdu3jocVQp0K8Ao/Ghosj7aPE0E43WUDqPhITSNFk0KSc03L8D9eHPPPXQn3zqLh7Z0cebUyHZGO1t0hakCqoFqmqJLEsxSYsiF+jnYAJp4sny46T9A1x6WoP/xy++lg/9zk/LJRuQzRntCaCFIwvFMqb+jEXLd65VVhRT3+W2z1xnnVwbjfzO3zuRPsvjG8c4fkRirOIxjh/p5n80BQyth+TpuUqflIjq0gSHqWcAtQjf8JfDyjsYJMxauG7w7cwaKrfsp6NVpA2G4T1pVJIizsdqA0iSBI1QVAF0XShJ7GxNcDQEpg1sXsft7/rfzn/5hZunOXNtB+v348oFTO4gaNApqBJvAlLlGGCiofFFiatybKsRJweqQR46PLK9y1/e/hS3fHPxTbsX+axPJiiCjzCIEkzwaOUJtdC9V4JuaHwwlNrz5EGu/txtB2TL6Zu55sJpRDyZ8xgfmOw0KYoemVGoVotqdp6Na9bx8mu38NBTO8hLUHmJUfGi5YNBK4MOcYIj9evGqIL0gEpaf0SCRIDgh9WbYCl9gTHRodDHAQ09BfftRn3obx6Wd//Ka0nz/TTDEmnShLzCi2CmJqG3QCfxXHxam1dftY79tx65pHQ8XBSCyRTKgVYKRYpXgtMF6EAyGDrVj/M7x7M34c/UqA+KW601CwsLO9asWcP09PT2oihYXFxkYmKCPM9JkmQoCjgxMcHk5OSWbre7Y7AfPI5xjOMfboQQ/eoH+/uj+/wRFFQkSUKz2Tyv2Wy+KUmSFWs+zoWhlV1VOfr94l3xezX9nGe7BujvqkMyeAzfCQBAKUgtvvTgKzJASUohSbxASpdGGkVrb7x04vwbz1tFVh5BdI5X4IzBKI9yfaTowsxqiqrB47sX+dhnj+zo5lDplIIALEIWH01RFCAGwYwkZ72cS592TdbP+NxDSGm0Mnq9xZpyV2KMp1nCdechP3XNmZzRKfC9LqYhOAJWFIltghj6tk1fT3Pbl5/ii185/s5SwAkYa1Hao5XDWDABlBcSFFolOFF4J3Qzw1IJSYD+LJcdva2bPPDI18qfesWFvP6mC5luJTSSRZBFQtXDmgz8AtrlNExdA7gKXIUFJiVAbw9N1eaUMzq89D/+M+55bM/SZ/7um9z2rZ46ESDVUBnI3WhBpMANQBMTSx38cg4b9OoKZHBbVL1XUCMpdX4eNP2D8mmANwxqIj86aBno/pz8FhO+y/HTf+8cO45xjAGAcYzjH3vIys5f6v8NUoQZBQtGfmEZAgiIhJXZ62mJSA1/q3DVMB2pQUFV/zdIVFKVKAzaRCunatSANxSgHFaitV9bwUsvQn7u9Zfy8ivPIK2OMp1WZO4I+BybAEkGHop+SZo2SDsWqoru4iyJNrQmpkAU/aUCk61ivsh4cNscn/rKw3zpW04ddeCbHUoSvPORhi884z6gQ/AogjNMZJ7Hd6A+c8s9svGUV3P2+lVIv8QoD0qjlNBbWqKZVbRbTbQYrjp/A9dcuENuuxeVNmCuC1qlJElKr8ijoNKzFKixqBscUD2EBgIBqBDcsAbUdS3hVEpfl3z53v5HTvv8Pb/wKz97FTK7E6oeTGSYfoVbWMC22ujFBaabipdcsolvPX7socO7gpIUFiuJO64SCMHF95A1KO1rHYDvob7+AURN7b2t0Wi8pqqqWWBmsAIw6v+dpimdTufePM9XlWU5dAoYxzjG8Q88bT2t8V/+/uj0/+SfiYThdaCqKpxz9/1QqP+jiLdzEAKJ1qgAFQ68HV6MrYdzNiKXbZlhKssh9FGZRhlBSUDj8T4nbTcpK8WhbsKnvvRt9h7lLIeOlnWqgNrSHgFdT/iV8oxq6XznZv+ZwxhDr9slm5ig6C9hEospPFMWXnLBNBec1sHPHcAkqs67hiCgXY9SK1w2wWM75/jsrQ8z3+eDfQdiMkRBmRck5qRcJnF4oEUIKhBcXImrtGXRC3nhq8XdqMW/eUwe2LqNt/+Tl3Pq2iaTTY0Wgw4eg2ClRKS2qNE6WhIO2HOqJFGOxJToco5XXbmeG6/9JR7eeVQ+fdvXueX2g284uMgtmYIu4BS1W4NHoRCEJElJkgbd3gLW1tk2EuIiUq9CzbIYvBmXmXvxngZLFifXW9F6URhp/p8hno4HhJOO6w8p+Y5jHGMAYBzj+IcYmmjedrI1W52QVJ2odPQj9nViWp7mA+Ki6FsNDgz2AVV9u0Ey8wwmHoM/Z2N7HAYIt6kTshlJUYFmYqmqHKFC6qyoEgvaYPG0cJgyKvZefxny9p+9lOsuPoOk6iH9Q0y005qn6Ibb8tp7kJTEtvHOUfWWaOBpN7P4hxfmKUKTKlvL1mOGv/3WDj5/124e240qgKyVQXC4fAmVJgQ0qp74I1GTIKgIYfgAeBWV8xPNwlLFHd/0519+2Y4nTrn5YhKbIVUOlZCmbYwvCCFgkha277lw8yQ/duNZPLZz+zv2zfPBAtAGUqq6edcELMuK//WRlbgCoGuf6eURRA3TCLVi30K0ZCbWm9Q1kVIlAHv28Yu3/M2BX3jVVRdyzoY19NweWlpBmmElTq10Crpa5Nyzp7j+6tPYenjPG/fmfDYBsJbKC4ECyDChifgMUYv1G+j5pSEOJn0LCws3dzodqapqUOgP/b8hsgiyLGN6enpmaWlpS1EUOwY6AOMYxzj+gWawEbHOARNgubmP38+y7Lxms/n2AaA3AAkGtzHGICLkeU5ZlsPbRGDw+c2+QRkoc5IA1ir6ysQJuCkjFJ7D+glmbjh3gqvPO42k7ehXjmbSQvuKtgmEfBGTQl8Z8mQtX7ztYW6/FzUbIi0fVaFxDFf90TWZ7u9zbQvP+D2TBCofCKEELySlJa0KrroYufnl59GZNLAUoNWCxQKrpqFpKdUxcmM5Oi986Y5HuOfbqKW6iNBJRnAlaI2oEPtlVev9KGLjrwMoh3aC1pAYRVIfx3kf+PZh1PZjJduO3io/cfN5vO6Gi1g/uY6kWECqRRIdUInCOYcnavsRJLbvIgTfJ/gCk3Vw1WHK/Bhnrkp49z97Jb/6VvfFb9zzAF+6+yluexh1JI+pLEnAe0cZHFXlqaoIkDhXgQJjIEssVeUIbqV+wrBOUvVRUSf16MIy+DFs8N3yz75T/ltx9MLQoWFM/x/HOMYAwDh+hGMlRXw0j4RhC77cOA4oZyPL2yo21vq7JB4ZKXa8EJVzh7uFgtYJWqnYKI9SKVVMxP2qj1WQaah8/dCCAxwJUdn/FVcg/+IXXs71l50GSwcw5X6ShgEKqHrLqw1GIyHEHX8FWie4EprNGaCCqoSgCXqSQ4uKbXuW+PjfPcrXHitu3jnHbWQGm7SZ7/cx3tNME/raDSnsJtTIPJZIdgSlDKI0yiYs9JZoKZjvs/VTX9zGhlUdXn3VDO0skHdzmm2DaU1Arw+VQ6qKiUbKDZefzX1bex/401sOfrDR0vQrT1UVGKVqi72R4yfLhZr+LkyMCBQ49ICH720EMvC1hWK8K2tg1z7Un3/qa/Kv/8WrmenM0Fs6Rksl0Gwii3OoiQnCbJ/EJFx/9SYe233wM0fvqZQDShTKKLSueR8hIVSOYOP06fmesw3sAHu9HlVVYYyZKYqCVqu1wkFgwALodDpMTk5u73a7arwCMI5x/MOOQSN/8jkvI+tizWbzA41GY6gJYoxZ8XtxFcDR7/ff45xbcd/P55RUCaRBUYUIngcvVMZBYmNTW3iawFWbpk689LzTOHUmRejiag2VEBxaebRU5Dalbyf49u45PvblvRwLQJLiQ3RbGbgNaLEgts4bz5H6rQKuCmQZFP0CaywN12fTDP/8zTdfxIVnTeOqo2RNC0oR8oBuN6EqKbSlSjp89YGdfOHWYx/0SdSeIWkStAHv0c0GwRV1+op1SqjtZL12KBF0FYt4MRWlUohR6MRQSKDywn17UIf+cuv7Hnvy+Lvf/Jqrufq8U9CVpciP0rEJoiNYjwdlFFaBVhoVQr122CWUC1gszbRFKp6JhuKnrj2DV770Iv75nJZbvvYIX/rykx/ec4RfdtTHUjvysPLt4z306/eXhghY1ADzinfZwG1gQNmQ5bosvmXdM9Za3xt0M2j+/75uD+MYxz++GLsAjGMcwxn9oMOOPsJDFWChnszb5Q9lQVQULRpZBvB1ehoVBQojuIEFrAhWoh2QlySq60r8m8p4dCqIjo9DZxYfAk6gk0Cz9kK+ZA23/9RLpz/8X37rpve+7XVb2JA58qP7aeOxUlB2j2NSB5ngKaiCx5gEaxOMEpTPwZeYxiQ4TZEritAiV6t5/Ijwqa88wYc+veuOu5/0Zx7N2UEzA9uh1y8RD8ok6MxQEf3u4/7ewJVADwEWrEUbSwhx2tBsaJwTDh/jt2fnDr33tI2TrF8/RUMJIe9GdQQfqZ8mtRgX6EysxjSneOSpHT+9/7j8kRhFYiyBgChDQEeQQZZ3CtXQSVoikaPmP4gaWa9QHjXEYhJEkqE4n5Z6ViAJwQcOHHR3nXJa8ktbzliLNQHjQBcVSgsYi5aA84GZmQm0Sdix89h7Z7v8dhGESmm0DmijIWhEPEE5lImvl3oWmOpZqtDv+tPR5j5JkrzVar3GOUen0xm6ABhjhjoCA4Xwfr//Z3mez45dAMYxjn+4obV6mhDo4FzWWtNqtdZ1Op0/zLKMEMLQ2WOZ/RO/LoqC+fn5m4uiGIoD/iCuP9/t+qEETAgxFxKp5KFOr+I1SRW4dIpPvOWGcy+64cLVTCR9PEsoXWG1QbxD+x40Mnq6yb68zX/96Nf46mOonoGQTuODj3vlEqF+JZZBphqqyH6/IIcK+ABZqgguYzKxTErFT77ilAfe8mMXMN2aJzELUPVRlUUlHbAJ4krcRIutBx0f+tij3P8kV+sMciAPhggLe0RrVFDoWoFIVFwdDNojOt6qJZpMa4IIuY8rd84mlDqlIKFXKhzpbXv2LPz2/Q9s+yezs8fXbDjlFFatXk1ZFUgoUL5EXEFwJUo8RgtGexSONLOkWjDKoXH4skco+hhxtBJh/YTm+otO5+brz73izHXhvb254+9dmOO3ncTtjlIgySzaJtHBB2g0GmilKZxD6uPu1QCUt0ACIavfCLYemKiRWi3+yysISiPaIsrED+LAYfgxvPXyV7E2kOEi5jjG8aMaYwbAOH6EY1SoL6yodxSDgfwIXWyoD6AjICC+3iNfuaMWu0p1UhPnVpRMA6VbweNrRoA2hqAUUlbDG4XS0WlAUoCt4Pz1bP+Z15695eYbrmHzGkUWdhN6x8myKcga+F4XWoZ0egbfnUd5B0aTaIMKEpO8dygTwDaoep5gp6gaHXYf6/HlbzzG5796gCcOonLAJ+BF4SsIrsBqRZI1CCHQ7y1Cc/CEBvt7qqZZWjQBVwZINFIWJI02uS8I4plqwF0PoDqdhyRrXMb1562JzIaiNhxWHoxDBY2q5rn0rGl+4qbNl2798z3kEjCJUJSh9nLW0VtZ6aETYnydV6L8y3TA2OVrarxAIq0SrVZgohI0BRoRzeFeuO3Df/UYMzPCyy/aQLtVQTUHaRa1ADpraBsoqiWuPHctr75qjhO3Hbq2V8ndeB/Fn3SBUeDrXUulnn8aotYa7z3WWnq93vsnJyfflyTJsMgfrAgYY/DeE0Kg1WoxNTW1vd/vq9GJ4DjGMY5/2DEq8Getpd1u32qtfZqq/yhoEEKgKArKslyxHhA/P4/XJkCCI1UGr32tkQK4gFSBSQ03nL/6Ldeft5pTJgxlvkDS8mA1PkThVpSF0lJ21vOl2x/ly/ehFhWQdJB+gTKmBttPXvPTQxc7eQ4YpzVQ9ISmTfD5EqsmeNsrXnoaqycLrCxhLHilwKSgUmThGGrVWnrS5NN/exvfeggVDJzoQ3NygmIpBx2wrRau14v7bjLyIAdriYOeViUolWCNI5GSciCIN6hRskmO93p0cfRzd8Gnbtv3jm8/uu8DN127nldfdz7rO206SZPEerzLweWIhOhU4yv63QWa7QmsSijyHto0aUx0QCxlb5FW0qOojnJq1uJtr72Un37dTTx1cFE+/3f38OkvbV91rM9sXjgqHKZu2vMiB9E0mm3yorvyHRHU0+ut4XGr83g9VImJ3gDpEJCpE/fy76jR+wor3nvj2f84xgDAOMbxoxqDxn9EqX90x0yflHwCDuqGMM79PVJP+WOStjUwUNvyDROYh/r2DhdFc1RU9k1wWByOegLtiQlNCqabHukLGzWXvOJl+qGffe3VXH7eOpKwCOUTNL1G9UqSrIXrL1KEEttMqSRQLXqaaYcir8isiRMfcZShiBNwpRCV4rJVbD9YcNdDD3H7A7t4dB9vmK24JW+m9CvBKgNVQcM6rBEq7ynyPtgMnaUEypWuCfWOpZIaOJGqzrQS/Y+dRukMlXZuWsqP3/mlb6JWr35MVjcu57x17diRGweqQHxA2RSKLutamtdevYFvfGuP3LcDtVCWoJb1GyIDYBmsUdS0TzWS6NXK3b+gFEYiHwBVH9ugURiUmOHvORtQWeC+raiPfe5xmc463HD2KmyzgCpHKQOqgUotqjzG2smUV129kSPHl74xd8+SqkToBXAEtO2ja1qjFrssGPl8QVwhDKd5RVHQ6/VuW7169WsGVODR2wzWBYwxTExM0O123zE7O/vB8YViHOP4h9vwDxr5UVq/tZZGo7Gu0WhcOjjPB5P/0f1/pSJAmOf5+6uqGt7PQCT0+Q+N0pYCT1CQKEVVChNacfHmjrziitM4Y41HyRKJ9mhtEV9SSYnJUlBtjs5rvrn9KH91y/7DC74m6ylAebRYdEhq/R1HqK/zOnyvpe93uT6LRidpdMxxjgx4yaV85PyzDImZI0kCeDBpJ9YDLqen+pR5yd/ee4TPfal8z2wf0skp/MIiVdA1CO2iZo6KIrJKRqsRP6xVBFhyAYNDhVoXQBNzrgdCIEsmsM2ZLaZq7Oi5eXYulR/c/xQffPLw4bd97b7DH3nba85jy4YJNm9cTac5g9Zd8EtAAUphZ6ag2wcCWWsKHyyzsz20aTE5OYO4RbJMyFRFVR0ilWNcc8oEV/7iS/n1n33JiVu//m2++JXHuesJVA/QTVj0irLS5IUDyUYa95p1KVVdl4VnJmfIYN1PnzS8eRZav1reshw3/+MYx3gFYBw/8gCArr1plili+iQQYKXdbVQOUPioLDvMzXqEqjZoQmVIRV+BMNR756KieF8k+AUSKTGUZFRsnggzF25U/Xf/b6967//+Mxf/yptffiGbZwJJcZCWmqdh+qhyCa1SxAkkCpslOAJeIDMZBEUjaaBFcFWJR2Nak/hshhNlxp5Zw999axefu/MJvnj3iQ8/fogrj1ZsO54bcpdC2qmFCWvVfO/wQTCJxlhF8FUE7CEqDItGiY1FS+TdY61CGcGkmirvYZKMNGkyt9Tf3Wo3KKTkxLHgN87oV52+YS2tREEioDxBC1orbALWOBrWoFA88O35316oQGVNgoTBgYzHRtTwGA1e74F0w+AYyPCYgxGJX9ZAgRKFwtbEfMFrjzOOEkFZOHaA3z51jXnv2ZvW0NIO7Qt0Z5IglqAUVldYFZhutbBpk3sfOWJ6ga/0QsSFEls/Hk/cEXnW6dNzo+AO6P8jav9/tn79+vc65xiogg+a/gFbYKAL4Jz7yYWFhd8eXyjGMY5/sBDACi2PQaRpSrPZ/DedTudVAxr+gPUzuN0AAHDOsbi4+K97vd7BAUCwDAA8fysAAEY0KjEUPjKNMm2wTji1QfLqSzf81htespHV2SJUcxHvTRIoK7zyhKRFt2pxpFzFf/mzb/Ct7UyUFkLahrxP0migXFwvCJooTFsrAWpU1NlBnuUpyHf5iaUqoWEz2qHPWWu49Rd/dvOWS85v0si6aOOAFniNy/voZgM7vYr7t83xXz/0KE/s5uYCKENK0mhQ9BexrZRQ5viqIDEWHTQaVeeluMKmlEfq9cREt1HK1h7FYbiOF9ltBl85gnOzLoA1CUkjwVEy2+fhQ8f47SceO37R/MKJi3RjFSaZxJMQgsFg0NpA4cDEgYZ3gmBoNdpok5LnS6hQID5Ha48xDut7qGqRxC9hfJdzT9/Aa195Fa+6Yct710yW7z1xZO6VS3P8sZZAZj14j6rXIaMi08CJQL4jYBRXOFRdj8VVhSjE7JcBkqF5oLDC2kmNaf/jGMf3dvUexzj+UYcm0sc0g/3/qEwbhm280bWSPSvpgsuU/3rarzSKgNQ7h8u3in9n6PWuTGw+dQK+IJGSFtGLoA2ctwG56ZoWr7zuYs7fsh6rSpTrEXyBDiVWKlI8RivQGqdN3IOrJzdGYndpBs65xkOoqAJU6SQuW8/BhYSvP7SXb357F1+9Z/ZN3YrP9krIPVQagm7ixSLB1I/eofFRSZll20Kv671NFFriVEWLQQUd1faVEHSJKL9M25MEJEFLCgSCLDBt4fzVbP/Nf/nSLTde3KJl5jCdlLw7S5IFjDbQVwSZYe/xhP/651/nw3/nVJmleGPI+xVps4krKoL3tJtNXNmLIlE1xBnUqJ+wRbBRk6G2PwraEZTG+BQlpmYPeArJsRMJLq+wqSJbEl5yNvLbv3oT1543QRJmke4Cvr0Kk1jK2cNkSkNocuiY4X/esoc/+dJ+dQjoBrApJDq6CaamRYV7FjGq8D28h08qTEd4u1prqqoaFv5JkrBhwwZZt27d8OejxfqAEuycw3vPzp07z8rzfEdRFENLscFtRtkF4xjHOF6ADKaXd/4HgJ8xhqmpqdfPzMx8MU3ToQ4IRGaA937oAtJotNi/f/8Hjx8//s4QwgowIV5Hvvv1R+S5lZBKRW0Y28jwRYERWKfhVecaeefP3sClZybo7j46tl9bu6SQJJS6pKcnmQ2n8Ad/8hU+e2eu5hQUaUYRAoY4BU/qPXKnFV4LospaE6AeNo+IAD/Tddf7QJomhBCoKo828TUXAaWaKDWFLefYYHJ+4Scm5Z3/7HIm20foTBQUvYJMTkGT4UIX1Z5kx3H4D7//VW69C9UNllw1cFojqgJVgvYoiU9VB4MOaWQAiEZ0qEEMh6/Fd1XIAI2mAuWiiO1wxmBQPgExkaU2mKqriqAcaRCaHiaATes5dM0lZ6x/6SWnc+7pU2yYFNppTip9tO9CqNBKUFoP652IoLt6DQ/Ee4IfCP+meEnANMiDRVSLYFss5o6t23Zz9z338+3HHI/sRi0SFyQH6kt9lnWU0HaUwgdSazqw7N+kR+qxETPDePzimwyll/PWCtadjLkA4/jRjfEKwDh+xGPQFi6LsQUiYd8pwYdaBWDETj6cDC5LNLgVBKUEqzWJURhjcVWJcwGjQtxZDA4XgJBjgVUpXHYOcsMV53DV+adw9vqUtQ1H4hcI849iVV2QGYtOUjBZTL4+TjOcVCgTqYJSCd5VJOiYlK1FehVqegNJYxWHj1Xc+9Bxvv7wfu55ZD9PHoi0vDIMHApAK1U3+jpyHJTGY/FxDoEBDNWwgFIojNhh0aJEhqrLYfh5pFVVVcT56wLFJFP0wwLbj8pZ//1j35TT3/N6zly/Fr9wjM7MJHl+EKMTSFJ08Gxc1eLlV2/hkd1Pyt3bS+UMpKmm6i+htaWZZeR5jhZI0gQfqlrxeYjYLO//iYqARF0u6BW7g0JQDp2CKyowKUEsjh7b96P+9muPyxkbr2fTVBvVKghpRTAVSbuWc/aLrJua5MYrNnL/tv1y5ElUu9WgV+SR0YDFxLLth4P01iwA7z1lWd7nnLtqsBs8epvB5wFtuN1u31pV1VmDveIBS2Dc/I9jHC98DBg+g+Zm0OQnSfKWge3f6Pk/qvyvtaYoCqqq+uSg8f+hZl4FYgRtLS73TGRtsqLLaW1+89VXnMo56zVFMcfq6SYsLsZEYlOqKuCyCfpqhj+/5dt8Y2v+yTnAiUK8xkggHTLTHF4FRKWIUqCiQ42cpPnzncKYCKCKEK/b9TXTe48Eh/M9OqbiorORV954Nu1mSSMDLw7TSNFVinOGRUno9RI+/eWH+cp9KCwUeYqYBKmn2OBH3ArqfFpXI5EmL2iJqkMm2HqtoRrmLCXL8oaD+xHlaoA71FICCkgIZIgKNNut8+Z6i1tPHC427Di2i68/vOveS86ZuerlV5/F5eefyrrJNplqktJFSREfp/hI06+ZjyGASC0umeno9+crVFmilcOicW4RnKGtDOvPzrjuzGvphyY7jiDf+PZOvvK1bTyyP9oMW6AkCggG76jQw8NkdRQA9s4RZCVT059U1QVA6frxjdrZKsAYDArvyvFFZBxjAGAc4/gRLJ8wFCzbAA5U7E3c00eBiRxyj0TYX4idr64taly5gmUmoqm8wnnB4LFEmn8ikLp4wq3KuOSay9OHXnL5Fq6/chNTWUXDWpTrY6pZTO7JqOq/ryF4cAUET9COQmeUYvHKk+iK1DuMKHTwkQpoDaDxTuFam9h32PDItjm+8ehB7n9iHzsO9tV8Dj0FpQVH3IVPVDTwU6EiiMMHDSZDtK1flzRaEAUwqqr1iCKDQktY3uWD2l6RITAAy1N4TbQxBAuVoJNJjuXzfH0b6n9+5j75Vz9/HadPrSFf2kPaasX7TQxSliTWcc0lW/ixAxW79uxkfwXNCcNcUYGvSNIWpQiiDV6EUSei4bBKwkiBVEMCksRbqhC9l3GIAm0VIRewGcEHlDXM9j2fv+Pob118/v7f/anrNtJqtfF6karKmcwakTLZ66I7jssvWMXN153F4/u3n3a0cPu8aKgSFBbvJR7f53EjcdC4j0728zx/T1EUt54MAIzuEw9+Z3p6ekue52/p9/ufHDQag9s+kwXZOMYxjh9iE12f3wMwQGtNlmVJo9F4+8nifwNq/+i6wNLSEmVZ3jZ6P6P3/fxiAoEgg2tggikr1ifM3HBB53evv+wU1kxUzC310UmboKJdLsERTINCr+Zbj8/xmTsO/uGTR/n1CjA2QfuYp83gqmoGdn+hZp9ZUJqg8nr/td7N+g7XYGsteV6i9MDT3jHoJZVUZGhWd/yWa65czaUXraGRHiNISaKaaJvhxdMPGslO5dbbH+fPPnX0g0eX6vs2aVwtw9U5cQCqP31IEVcXwjKALbXmjR6FkFX9XPRQmjgoDyrUawMM9Yl0rVl0rNvbmpiERGuOVX1OHObq3XOz7Dh+v5y/dTc3XHkOp0xqTl2VsaphaIYu1udYHUBnBNXAK4NSJb7qQVWQqChwqwXozaNtSmqb9cGIE5Us1XRMoLWxyQWbL+Gtr72Ep/ackHse3sE9D+/liV2cdbRiRwWUhCG53wXI65RjEqhcPZAZtWsevIIKsFkUFw6emp4QmZquGusAjGMMAIxfgnH8qMaoWrwM8icBEVP79qm4PKiIDb8hggC+tgv0frjWb4f2cQFDIAMyDR0TWXJrp/jClRemb7juyvO5YMtGZqYatEyOyg/Q8p5UZXE73cjyCoGyIK4eBdQjbC0YG0isItEZ1sWEWlUl2gtJ1gSVMteDAwvwyK49PLB1nm8+cpQdB4Lqh6hKrI2QWk2FRaHQwaHUcrscRFDi0bVmPWpwqdAElSBojICWpKbLxyJLThLaiwk5VkwD1eXhrp7o6HectfB2Atd0fOyLR9SamQflV37uCjI7SQgFlfRIlEIlQpmXrJ6Z5PpL1/HQYzvlr+9HKV+R6VgcVGVOYhLQmrzqYa1+Ror96CpgfPg2CgHWYlFSswYkxANsUPiiImlkID12HeM/fOq2+373jI0tLr+gg2048mKRoC3a2uhiQI9mmvDyl57Bkwfc3r+4dbfq2Iy+08Sj7Hm+5YhGJ4SDfxdFcVue57Tb7RVN/MlsAKXUQAzwE71eT+V5zsAVYNlGbBzjGMcLDQLEj2jj2Wq1PpFl2Ypze6XwnxoyeZaWlt5aFMUQPBhlATz/AECdhKvAdJZgiyXOW8eJn3jZ+ayfMZTVCSYyRej1EZ0RlKLwAp3V7Dws/MUX7mfXcX69rzSpjQw1EY9BY0xCCFU9JY/NsJII7kO8zsv3sBIeQkAbMCa+EANTlCQBK9AKBWdsYPs1l59KlvRoJCX9okSnk5S5ohKPbq/nwSfm+fjnn+SpA7yzNd1mca6P0QLi0SOWdANXQl03tbEuiStqy0w1jRa7Io9J/b8wXDdUMX8NHIh0RLvVEGiIedFajbIKlTQwmaIq+xx1wr3bg3rywNHk29uOlmdtSLjy3A1csmUdZ6xtM9No01AFKgTKSrBWMFZjbCOu6xlXeyK7yAYIxAGGDIYoPjIhSWg319IvS5pOuGhjk4tPfyk/+9ob2Ll/dvv2/Sf4+n2P88TupQ/vmuOXK6ACnMTxgQi1oHLCkAegVO2AEP+WVNVIlh/YAQ8XMlcMCMYxjjEAMI5x/CiiAAwG+VIrwg+mAjXnP0SKniGQEKloauBf62PCtkAGrMlYd8YGDp86DdddvpEzNq7hzFPXMtNuYYhotGYJXVRkagrlPTgPIYdQxGbaRhp6JQGTWZQ1+BBwUqKkwrhFJBi8b6BNC2XbFNpwuBvYc7jgwR0LPLF3kW89MfvQwTkuO9aLzyaxGo3Fu0iXzFKFwSMYAoqq9ur1SqLIriqxoglSIbW1kBA9dj0aLfUEW8VpgwxUeSUF0ajabgmiteEyCBAAR2I1Zb6ESTIWuiWi4Y8/tevSDavNQ2953cVUsoB3BkkrGu0mRlIklJy3OeN1L9vIIwcOfHrrId6sgYaF3JWYpI2XSPf0CiKhcBmWUENqpY4TEoiPVTRQDZv/QF07qQxdOAwK8Q6bQuXha4+IOvvOh6Q9dSWXnL+WVlZCVcbmP7EQBGv6nL5hhh9/2bk8tXWP3LenUBoLxuDC8z+DOHmyp5SiqiqKopgNIcwMRL9Gbz962yRJmJycpNfrva8oivc45xjYCDrnfui04XGMYxysOEcjJT1gjKbRaKxrNptvstYOwb+BDejg60GUZUm/3//kANT7YTN6lIAVhfaCrZbYlHHTK6+c4YrzpjHpElXf0cw0oczBdqhUClnGgSXF5+/exR2PoBYUBGsJKuDKAoXG6AbBKrxbXv9SAYyEepd+gPpSC/d+53De1RrBUr+OcS1Aa42pHJMpXHvZBBeet4bELqF0SdOmUFp8lSLNjP0nKj7wp7dz78ORsL/U86SNJnm+iLYNaj2/yJYbNPKSAHboXiB6ebc/ENADZwBZrmGitk3UA0J01AsQAaWj2G0NOyMhLp8J2CRQ+op+Ge/OGAUWcqDqU83vRm3bXXHvI3vfdu6mvR+56oJTuPT8TWw+ZS2rMuHUDqhykarsUoQKmwg2TQkIzhmyrElwgg8OrQLWSLQ/UhZLSr5U0Gg2aTYTcI7gjjCRKdaeobj41AleddlLOTJfvn3n4aW3P7l/lq17jvLU3u6H9x3ll7s1GFOq6qTjOcICMCZiAkEhQdAiyzLNg3XOcYxjDACMYxw/WjGc8rLM7l+OaEFjcZEWX58sCTXLvs4cGjhlhvddeN7qd190zqmctWmG01Y3WD9lmWoGJF9kqpmgpaS/eBxXlDTSBmmzGdHxqu6IdWxYsVEBH3FRJN5YvNF4H6hcgRJFag1aabxPcHo1C0XC8YUuuw6f4LFdJ3hw+zEe3cXv7jnBvy819CQ+eG0VIWjEeSwZVltCrb5cO9PXN4xaBorB3qGvFQEUgo2Fhpi6YY5kyzDyeoZYpaBlSLKs9+v98DWL7begjce5gtSk9J2iVE2OLvYf/tDHty9ZHTpvfNUVdFoJpTtG8EKwnlAsMD0tXHflZm7Ynr9p5+dPUAGZjZRAV1VUGJJGk8rHFQ9VP0YzsHqsNQqi1ZAeEW4cHv16QqTRXiG+omlSnOuyVEE2YTiRez5/59zvn7ph529smLmUtZ21oI5B6EEa3ynWa3T3BBdsWsubbr6Ypz70MH0c3vRxalR54vkHAoDh5K9eA/hAq9VaUfyPTgkHH61Wi+np6Xd3u933LC0tDW8/jnGM44UHAOL0XpFlGe12+9bB9H/Q+J9sFTj4nX6//1BVVSum/wMdgWXW0PPZIWmUNzQpyYDrL+GOG646jUTPk1qLZBn4PjpJoouJSlmUCW5/cDufvXPnHy7aegJsIVSRxWfQiBFKCZSiULWVXpyaB1RweCVDoTj9LCwArQegabxRo2EQEfLc0Ra45lLkdS87g7VrNFZV9LoLtFpTkGta2TTHq4SPffor/N3XUd0ASdag6DswDqVVFCJUtdVfVCWMeVgSRMUpfdBh6HinBQhS51SD14ahzbDSy3tutf6O1HWMUsvTDl1nX5QjdzWwYCKwobRBROFCoPKOTiNhIa9YmuWjB2b56CM7Dp529sOH9p579umctabBS8+YZNNMwuo1a2llgbJapF/2EHytMVFhTULaaMQ8FAqCKwjikCDYJMFXS1B6lHcYLaTakBpFWxtWpSmbVrU4d+MEL71wI4WaYKHg7Y89teft9z22jQe2HnliPuffL3b55FIJnkCouXWRhLBM9R+krKG05bj5H8cYABjHOH5UEYDoBY/oUZ+46H+rAlZ7jI8+AU1g2pKcuorynNMVF569mc0bVnHp2WfQMIEk1WgTMCoq5RuVk+CpdIkrc4w4GllAN7PYAedzdPM+rXabYCJ8HSe1saIJPp6aRixUIF5IpUGSpGhjKYuK2Z5i95zmiX2zPLh1L4/uOsq2Q6ijORTUQ3iiS4BRFm1MXMMzgb5z4B1WDMuThoCvEfLohsAyCBC7SJRUgIu7hBIgZIiOhYoo8GZZJsErjQlRjyAo0FJPx+vXOqhA5UuMEpJQkaQJi/0u09ON9qO784kP/cVOWb9qkpuuPhWjO+T9LsZ6gi7AaNatX8VNN17Jo3vukvse6qvgIDGW0tfCSYNJgNJILZI0PMQDEGCojDzCThBdF07R2cDWloA6+CiOKIFuEGwGO4/yrltu2/kbG22HH7v+TJpTGYEuLonOCFYUCSXTyTwvu2ID37x2l9xy/6I6io/bJUPmwfNUYteF/WDyNwAA+v3+B/v9/geyLPuuYn6DJmJiYoKZmZkT3vtVVVUNd4nHMY5xvPCRJAntdvtXG43GpQMF/0ETPwr+Db5XXwPeebKF4ChY8LyDF2KRkNLQJVeeitz8krWcvrmFd0uIa5IljciI0wrlC7xrcvdTB/n0HU/x5DF+3bdqsTxdYqoEIUFZRUmgCiUYjaiUECAJteUrBUggiK2Rf/0swClYa6gqN/xeUQS0hrNO5+s//fqzuOri1Ziki6sKDCqi0BSU3YJbv7aTT/7Vwi/0BZwBV+akjYwqL2hkDbyLzb8mrvsFpUEsQaU1CF0yOuwn1KAF4JVFpBmBbJan2koG4H1ASXzcotUQdPFK1ysQGp1oRAnihSoAZUBhsCrFmgZL3R6tpEEj0xAqDi9V+w48Juqep3Yxk3HaravZe+0lE9x47aWcc+ZqJjKFToVMSrQJkdkoJXhN8BLnHTpDZc0olOwdocwRHzBaxyGI97VgkFD1ejRanlUmoWU9wjx2VZPLX9riJy+5iMJfc/6h491PbN9zkCd37mXb3h67j3DH4XlescBKVwEn8d9KabyYevFz1DNgHOMYAwDjGMcPL9RyM84wjQ0aYcHgGMwhhq3ogGbOaAIPK2apeiiEMxphlBwWbf6C1NPtWhyWOIRvEBv/M09Fzj+9w1UXncmFZ57ChukGrURo2kBLB2yYBV8LAQZVP3Qh+IAvK5oNi3NRK0C0ihY0XlDW0J6apNIeHwQJHoPCqEir1/X02VUBpTMgQXSDJZdx/ETBU7uOs3Xvcb755DG2HfIf2X+cX+wBPjGUmcWjIDHRz1nAecFVZRTBMbF/1wbEK/TA9b6mOgqBOAgKUZ9pWLDVr5vUe4U1hX6g8h9OGhgpQr2Pt/zqD10BhsKAmiSDsurhPLRbbY7MdbttAzsOof7icw/K5tNP4fSNU4RQ0WyD6D64EitLXHbe6dx45WnsfOIpTpSgjQc0aWopin6s/OqjHVc8wggDoB66qFCvfejld4YsF8TGxF2PQgqSJCNRjrJwuBRcA+56FLV5codcsOU0zp9sxLdCCATxSKlIJqew811OnU746ddcyCPbv/nppTnejKbeyNTYEJbtFdXy7ufougJDKGZEcHFUAOmZTq+TRPsGU76yLBns/sJ33ukf/LzRaDAxMTGztLS0pSiKHSJCkiQrLMjGMY5x/JAx7HrFJ01TGo3G+5J6Wj7a8H8nBkBZlnePfn8UAPie/74KNYg5uOAM1Ob1kI4dr2EOTbSxi9d9gxJoUDCt4FVXZ1xx7io6SYVOE4pej6zdhGaK6/XRtFjyLW6/dzt3P4FiEvJ+TNjiQYeYa0QrfKj3vtM0+trCsNGTWudFiUUP19OWmYDDa259/fc+QALW1u69KKzAuhmSG19y2nU3XLOJZqfAhx5BObK16ymOddGhwWN7F/jARx5nzwk+GiagKuqhg6uYbHdY6vYwphHrBahzpR65xq8cVqxYV1QSgQylawZBGLLqIqstoAfaRsN8t2xHLHU+dsMdeV2vIGg0BgngxNPIOpTOkfeiM5C2LYxRdMWR94p9S0uoA/OLv/PArrt+69zNU5x3xjTnbl7FaWuaTDctDR0QKSF4lIHU6iHw3ytzmkaBVOiBv6LzBC9xtdAaGtMT0O9DuUQjTUE8YekIKgRW2QyhwYbVDS5ddyrVNWfSdcKxxerlh+ZzOd7zPLJ9P/uOLvLU7vm9B46yeTGAk/heGAgLhhX15cqvGakjV5wZKjIrzEhlOXj/nDxkGrZZiqcDDmMWwjj+AbRf4xjHC/Puq9+B1oCrIG1OU5YCXkiUwsoSBo8DKjReJXW/UyeuUKvNI1hRRFxX1d8ZfEjdOjkGpPWE2ORboAXMNPnVMzfzhxeeewrnb9nIaRummGoqJjNIVUkDT1Jv2RlxsWVWAmmCSIj+uDoK3oXBtNUogkSJwUhhjCI1StVFiVaUviIxghaHdjkm+FoVuWYmhIygJ+mGCQ4sCI/snOObD+/kgccPsPMoaj5AVWsReBUhE18XBSsTkV6ZvIZNvX56vhophAbJ6hkvFKKJvgHUwnluJYgzOt1Wg4nEKNmiLkhq1kT8+wolKSYYEunRNvBzb14j7/znN3DmxkA+t50p41E6gcVArmd4cr/h//Of7+SOB1F9wFlL3zmyRoMq5LUOQFoXWCXWQ+ZSAErjhsKFo49tyKSUkd1MllcDvAIxDgyYCjYEeMebN8i/ett5rJmcR3wfCQkSpnF9R6YDOMuRWctf37GdP/r8/vdsW+D980ZhWlOYhQUaWiNYehIwrSZlsUSiQ5xchZqaqWqxQu3iPqgAYp61QThZBCxJEpIkYcuWM8RaOwQATm4eAJxztNttQgjs3Llz7+HDhzeLSN38r9QXGG0wvPdjscBxjOM5xCg9/2THjsG/syxjYmLi3VNTU+9rNBrD22odLewajQZlWeK9p91u45zj0KFDH5yfn39nWeZPAwu/9+a/xrwFbIiq9KIDXsBpBZKBS6ItbughVGgbh7wFTcj7nNmAm85R8u9+6XLOWF1hCRhro6UfJUmjYmHBYdsX8LEv7eD//OhWtcdBv10/iAqMBx1qp5o6tw01XOomX8uglQu1G41GiSWJZvOUBrz2oMr4fHwar/0GgnYEBVXpaJrIBrziIuTdv/ISXnV5C6OO1M47ivluQXNiM0/ugf/4X27lC3dFq91KmzrHOKzXpC4FFF57vD55Cq1hRUMZalHZQU5aVvuXZyzowzJgP5Lr5SSgWJ7hcKsRQPk7r0aEYWvcUAGqKK3YSaGTcu36ab5xyfkzXHruRl5yyVmsndJMNzxSzUI1R8NW0b0gBEJICD4yVozSaG1jXVF6QuXQaYPahglCwEmo3/dxUGJcPNChrvI8gleaoCxeGcQ2KCSlX2hml0oOHe9y4PAsh4/McnwpZ9veJY4t8ZFj8/ziElEtyNfjjVjNZDgCvn73CCE6QxnBiCepInBfkETOpKmG4AASGZxe6sXRzILvgnKYrIHv9Vc4SI1jHD/sGDMAxvHCgwASaW2pAt+fwwIphoZ4TH2TCAAE+lJEG7qobYNRAQn15L5u7ge/M9g1H/xsoslp61axd/OpU2zZtJ5TZjpccsZGWgbaDU2nqWklQqILlOuB76FctLwxesQneTAu17HRqQiooEiVBQ3aDDqzyEPQtfmdiBBE4cURvOARkkYSIYog+JAiBEywhJDQ94ZulfLU/nnuffIJHnjyKFsPhk8eWOCtXQ/OWEoVE94zJ/KnJ+2no87hmRHBFYyM75CjFMM0Gf+mffrfPAkRl5NEFwMKUXq4n6elnmyQ4WghSc5f/+2xVWeete3ET918NqsbM6AWKeZmySanSJeOcsa6tfzka8/j8Z1b37h7gc+mVpFkHRa7fbS1KB0Q7YaPRZQeWj5qCTVAcNIWiKx8zP6kZ2YEvLeIAZ0FlorAX3/10CfP2KTf8tbXX4D1R7FW48sCCS4+W1Wxbs0U111xGo9uP/K+E9+q3l9YoXQubi4GHR0EfElZdNF2pUqRYFFSv17fR9Ew2jQMKPz9fp9OpzNsNkbdAoyJ+67W2mEzv27duk1FUfzqiRMn/lukDeun3fcoiDCOcYzjOaTHkcn8M03yvfckSTKc/o+efwMQYAD6GWMIIZDnOUVRvH9UEPD7emzyzNyjFY1l/XeNMgQfrWOj7EzBRAKndtj+c2+4klUTGkWJyQwh76GNQTdSlro9spnT+dpDx/jC15/kaAk+bYDPB66tcZVArcxlajidDSddw/VJuS+peYGh1qkJ9fgggpvOBbAJYjXNhoF+wVQbbrwi5dLz2hi7SNXvkUxtICyVmMY0R3ttPv7Fr/Hle1B9BZUyEYCGuDY3TJ+y3OA/LVeHoSNA/D3zHW6jvytA813ZYc/S4Muz4EEeTV+nBOOxOlAhzHb93XuXUE8dmuWO+2fffdHdW9932XkbufayMzjr1Gmmmy08XVToRvRGKWzDxuFJ4Sh7fcRDahN0e4JyfiG+f0wK1mK1Au+pXMAFh1aGuNHgUcFHocFa0EkphfIZohNoNdjUbnDxhlW4C9bhROHEUqiExSr8wly3+oXDs4vsPjzHU3uOsH33EQ4fK39/oVu8q/RQhjhyqohbDb52XG7Vh8hSUdY/Q0ESMQJEHMZ4el5wRT15EvC9PlrX2tLjGMcL2H6NYxwvWOiawjdIkRM65sSsbtoty6SpAV1r0NwPgAGroZ1x1XSbD6yZ5Kq1M7B6skGnkbDplLWsmZnglPXTrJtu0U7BKoeWHBsCvleRmCROKkMAX+FdSQghWgplNlLmlUKM1AgztVCeIkvTqIYeBKMHIj0h0hlq39lI31Ogoz0dg8ZJCVXRR6UJOpnAqyb9KuXInGPX4SX2HS/52gNb2T9bsudY8aajS3x2yUOhIGgFykQTvxcpgizoyIogoFUxUpQolG9igibIEqsyWDPBv/nVf3HZ7//cGy/AlLuYSOfAF+BaOJli73zG//lHX+EzX0bNVaB0EydZBF50H5/0GRgWGK/Rvh0nDboYYS78PR+/Aq0sVZkzmSlMIVx7HvKud7yMl182gcn3orSCqgKV0q8COuvgmOKO27fxF1/cxm1Poo65wcU4QxlDUA4XShrNWCxLoBZ0MPVUJ06qUBCC+q5F3igDIL6nZfg9rTVr167+9Lp1697UaDRwzg2b/hACAzrxgOrfaDTIsox9+/axbds2VVUVSpkVDcdok6K1Hq8IjGMczxEAOPm8OjlWr179vpmZmXenafo0lsDgfB4AeSLCsWPHdhw9evSsqP4fngY2/D2y9wiDLIK9okI0zam1dVQwEYRwFYkKpIlQxksXZ05y7dtfufobv/TGl5CpRSZbnpCfwEoBWULZ87hsHbvnm/zhx+/lU3cuqgVAsgalzmMTJs8EPH+vF3CLkho00QWKcnlFUGrOoKSISQlVoGELJnXFTVcgv/GOq3jpFVNo5iCFfLGPbW6k59bxob/4Kv/zz/a9c/dRPujqLQQh7t3poDES4sqXBCrzXAfALxzIGhkgoZ6PK6xWGATlhcTHXnd1h6tUxeFVLT584Vm85oYrL+Dyi89i/eopWqZL0x1Eu/lYA+oErdP4nEqPFA7Vbsdu25XgSrx4BF+vKmqUbRLERLGGIKggUVOhFvv13g/rDIHIrtQKrSxaG6xOUMrglKFSihIoRBNIEGUpnVDkjoWlnNmFLsfm5jg6O8fs3AJLecnOPRV5Bd0+9y0W/H635KOlWz6rEqKjQkPDYojaTMpCt944LMOYADCOFy7GDIBxvKDok/JgFTQzWNM2r3n3O95y68Z2RSM/TDuDsnJ4UpyKF2qDwkiIiUYHWtMp2jiM0iRGYxWkOq4PJFToUJLgMCyBO4bkORIqjA4YbbCiUc5AVQMAwWC0xmQNSFpQ5MRdd4UQEHXS1MSHaGVUK99HdMJEOoNSxAX3EooKyireQGswCeiMZHItB+dzdu2cY+eBvew42GP7wS5PHezvPTjL5q6HpQpyBTpJUZklUYrSl+DDs8P0/8CP/7ImgBmhOQqiqzjx9hkew75jvT/48J8++AuthKt+4rVnEjKolg6TGY9UC0xPT/Dam8/l/sef3NPdzeYyVLTSVTN5Wc0G0diw7PYA4HR0Jngur54O8T4smqI0dBrC/dud+tNPPyTrp6/mglOmMP44SA5ZigBz5SytJlxx/hRFfxMHTuyVBw6hnNGUJqEoK9KGIg1xOhCoX5+a8qgIqCARAPoe93VP9gIffA4hsLi4+OaZmRkZKIef3HCc3NhnWcbatWuZnZ3dc+jQoc2jDf7Je8RjkcBxjOMHCwaMno9KKdrtNs1m891pmo44AsSmcNQGUGuNMYZ+v0+32725LMvnzNBRsuz04vWAdq8RZHmabjy+noqKSdAipDhWZ3DpZr7xuhvOIQ3HMVm0bK1cibEB5T1ONVmStfzFLV/jS/csqlxHrZLclzHnBnkarf3v18AO2F8Oi8NIBBQGzW2l4p54miRUrkRcxZYtyOtfdQ6Xn7cOyQ/jbYVptClRLHQz7rjrST76sX137D/CB9sTMF+wvEonIe62i0ZUidcyMs54MUbURwAITihDBJazJMFZwbmK3fPc11Sw5Lj58IPwzUcff81p6x+/9fKLz+Oyc9dz1ZYpprKMViMlUSBVgbiKVBt0O0HKHkrqjXyjMcrEwUrtmlCpENmDQdXrlWpkjw+SLKvfrNFWOYIHHi95LDf69SDFGoyNg6e2USitMcbiQ0C1DXQsckoLJ5MEOZ1KNKUYdHsVhTNUVbiqKMNHShc+UolEYUUV8K5k7+5dTExNsHPfEY4VmsM9y0f/+kG14MfXtHGMAYBx/IiDAEGgm4Mp/G29E3u54pKzaSwdRbsFVNqiQkcAICia3mODRORfCd3+QRCF0gNlO4U4QYJDhYDGIQiiIxVRZRNE2T+oQoVWJVrFxGyUAW+iiq6PKvkoBT76x+oQMNTq5wPJ3TLUE30igDBU3bGIVvQXeug0Jc2m0RNNgsBCr8/swiLHuiVfeeBhdh11bN9/hP1HefmJkjv7An0UFSk6beB07AZFHLboo0To1LVDRcCrF+tpXO8SikZJWtMha6q+qvA6kNk2vSraFm4/UFz9Pz704OMu5Of/zJvOIclKgltCmR6Z1lxx4XquvXLnpmPHKo53wZfFrKLCUA1pJH5QpOoKj8KE5wYCGAlMtadOO9Ht7VsqLEan/M035tWpa78t/+aXXsJaNQ/OIb4ibWXYosQVJ1jbNlx/wRr231Ry4nOHX7OjH26zmaEoIxPCaihKIBnsbkY3BxWiO4OWWpxIfe/NPzCkBA++VxQF/X6fRqMxbAhGVcGjBVY1ZAH0+31arRbr16/fdPz4cYqiYlRJfNRx4IfpKT6OcfxjjNFmf3Dujlr1TUxM3DsA7wbfH5y7g/NwAAoMzt+BiGcE+57Lo9OooGsBPR+baaVjQpfaScaArwVyldG4oqAFXLZJyRuu3cKpk57JLKdKEsqqpN1OyZcWSVQHn67n83ft4q++MnvpgT4k7Q6uzNE+4J2QJBb3HDDwoAKia1ebEDAhahkIGqddzRjzeFXSbjkmFVxzqeWGq9fTzEpA4ZViccnRnD6bv/n8Q/znDzzO3qO8IihYWDJgQy2aG1fbBqKuIX4Ry4UX8WUyOI+ytSSBVwQx9L2KXPlgaTVb9MuC0jlSq5gv3G2HdqIe3LuVydu2bjlzhu3nnz7FFZefy0Xnncr61TM00x49N4dxCzQzT+I8yoXo+VjfL5KAFZKkBFUtqzgOGXEalMb1FhGl0Da+/+J+aEDrAGLxOsGQoKgBdeWg8jjXxwVHotP6nW5BGZROETRWJ6RKUS11saoeBiiLJCmiU8RYRAfSxHPN6Wdy9Mghrjn3QmbDar766FH+xD9IahWVG+fIcYwBgHH8SIZGqwQv0b21kMBnPncX152lueZUKGZnwecYSahooANkriLx0eMWEdLIuUeCJYjDh9h4ayUoE7AagnP40iFKE4wFm6JUpIe7QBQH1JogikTXCLLyiB/s2IVhglFK6smrXm6+jIkTfal9BJQhqISKBNtp0XdwuOc4emSRvYeOsW3XXrbtmmPfMdg7y5tmS/XZpaLeMUtSSl2LxgiEwtcLjZpEJyRBUKXD+jg0dy/2IetAMIek3nPUQIloD8qT+yU6zWmKLjQSy1MHuhf84f+99X91VjXefvONm2hOzBMWD2G1Y8MqwxteeT6PP/aw5NudmnNzaKUJBLSvd9V1rRupI+8+jEx9vp/Hrg0sdOf2ZWYiTgVQzPkef/ON4x8+a9MTb//515xBq2lxvkB5R6fRwrklrHasm0q5+aXncPeDh2/dvxXVreZRJjIerYmFYRAiZ1Bi8T+QfQrop+29PuNDPMkFYLRBiE2CY3Fx8ReazeZHBkJ/8S1tnrbTX1UVzjmmp6eZmppiZmbm9mPHTrzCOfe0/eSTWQTjGMc4fnCAgLWWLMvodDpXWWuj68iIhsfgXBw974uioNvtvn+w6vO8oPmiY36sp97OxUbXpAaqAgNs6vDPb7z0NF5+xelMZScwqqCseqSpAaOpdAvT2MTt39rHhz/z6N69XR6m0WSp8GgfaCUp3bLC6AwXKp6TjZuKcm96KPZqCUPBNyCx+P4iJoMLzkFeed2pnLUpgfI4NBNMOoVRM3z5rm382Sce59HtcSsi2A5FVZEAKrhaUwAGmjmihkPsF3cFV0+xIzhVSyzrBJUZtGhyL4QQ19fKoGvJ4IDxQiFux+x+p544NM+dW+/5v87c9NivXXzuBi7YsobTN7RY1VzLRFJFjSYLJpM4cClCnRjrIY2uazJRDJF+RZzst229HhAQovZSGNnKTJptpBJKVxCq6FSQWItNbTw4LtT3rSODo8prW+UKZRRpZmI21iHuqEoTvMWFhECBqpYIpWPtqhkOHTlEXyf8j//+6fcHoDtu/sfxQpff45dgHC8s/pQwkOuz9FkL/Ms3ZPLvfv5GsuIQ4iq8aDwJBEXqAyaE2oM+qtBH6xxD3GisBciUw1ChrUSRAUK84g8azaCpxJI0mtH2Thz4ElElChdX9lW9w68k0vpr1XqlNOhauCaUYCzoBE+CU036wTJXaOZyxZ7Di+w92ufxXYfYtucI+49Vb5/r8se5g9KDMhmlB0dAdESova4bN8NwcqODxwRqBZoQXe6txqGeUQTwxRFh+D5QvgmYuGKhCsT0CbomYBSwprP2pnxh4c5ECjILZ25G3vWr1/Oq6ydp6aMkyoMkzHebfPhj9/CJz/fve/wAV3sNHguhGY+fLnCmxJt6ihY0Jujv8+IZMCrgKmimE4gx9Mo+1hRMWjhvPfIbv3gRr7xiPW07R3ALNJqT9TpIDtKim6/is1/dyf/60i4ePIDqSgR1jI0bHhVpjVrYuG4gUWXYf59X7qfT8gPWWk499VRZvXr1UBwwTVPijr/CWjuc7Btjho4Ac3NzbNu2Y1W/35+tqgpj4r6v936FANk4xjGO59b0j4r+iQjtdpuJiYlPrF69+i0nn9cnn+OD319aWuLw4cMqz3OMMTVD4PvXAFCi0fUOvTNV9KMXi4hCS1T3DVKCFlKjsUVgfQI/dd1aedvrLuCy01MyPQ/5IZzuYTtt8jxl0a3msX0Z/+XP7uTLW1FVokmakywuLpKJ0ExbLJXRLtCH8vsGAKKTS2wYGxXYAEZSPJrCxDUxYxRS9jl7DW97209OfOSX33o2p52iYLEHaYcFmeDxfYH/+J/u4I67UboJsz0LKiFpZEhVohCMRHabqDj9D0rVDgr6OYIAL2TuD2S2FkL2ARGFD7EWM7rWVUITgiNIdGDSZlBFBZQOVBJZItaDFLEanEnhtNXqxPrJbOaCMzewaU2b805fxeYNbSZbkJCjJceECluBCSDia1FFh1IjBn+qnuyLie8SqSf5yqDQFE5QmHh+mWiCKCI148ChjV22Aqp9BjAKsXFNoFdEUMuqAqM1SAukASoBXeFkFttM6eaGqr2Jd/6/P8tX96GOAjQ7uH7vuQFY4xjHc+zAxjGOF/hdaEBbXNXHK7jlq8X73/zK/N1nTHTIpIsOVd3E1xRIBK1qlNdHnX9lNFbrOOVXvhYHCuD6NbV8gBDXu/kmIdEZPi/QxmCshiQZKK4hEkCZGqmPPgLRBDBBqRRNgteW0ip6LrC0UHFisc+JhRPsP77Atn3H2XN0iT2HPbN9fuNYlz9YLKBUEEyCshkYPdyV1NrEYkM8+HK4LxhCGFrziLaITggEvGiU1PYJL+YEonwNx4cIzEhkUKyACFI4vnT0zsQkJLZJr+izbQ/qD/7o6zI9cxM3XHkaWs3SO76fqeYkb3njZWzdcfdVRxdIjvSopPaHCOrpkKd+DsWXqEAVYHIyY2FhkYAmaxmKMgr+PLoP9T8+9qisXbuWa85cFfUkVA1amTjiT9KS17/6MnbPLnDwiye2HMzZURjwwVJ5PZz+R70CDypE6qpIFCHEPGvD/92m8Vor8rykKIqHgEsHdOEB8DSwDCzLEuccWZZRllEkc82aNezbd+B9zrl3VlX1tL9zsnXZOMYxjr8/YDfKxBmcn0mSbGm1Wm8ZnfIPztnRnf9RVkBRFPfleb7CIvC5yADEnf/YaCkJNZMq1KJsUXjN2BQVCjJf0lJw7gbkpqs2ccnZq2FpL+KXUK0Uaz39pT59PcXRfJIPf/br3P0UimaK85ZiaYFmYqASumWOyZrkZRGZUs+hdfaih1ZsQsDjcNoSVLw++7zPKTNw6Xl85MZrNrBxnYb8OKRToCbZc9Dzv/70Dh56nPW5gC8saWeSIu9SuoIEU2vFqCjaqsqY19SL3yFFAVXuUSIYrbE2RYymCoLU65AiDq1q5mT0/Km3RALOB1QDCoFKIGkaLCmLTnj8YLHqiYM539y6i/Vt3rFpg/7AqesabFibsnFDm40bV7FhcoJTmqtJBZQqUapCU6F1iZESrR3iKrQSrLZoVa+JBuqhkWASFZkYKq4N+FDnVGvQthHFnAfKkKpCBCpVIXUx0UjS+JwGQsIhgFQ16OCxSUpRCD6d5p5HD3Dfvqg76RxRE6p2wRrHOF6oc3gc43iBQkekNE3jBbNaIhNYp+EXXzMj/+ZtryWd38FUR1MuLGDSaOmixNNfOEFn1QyUwuLcIu3JKYJRFJUnTS0+lKRa0OJqcb+o0CdYRKUEHfcmcUXsxayK6G5wOIlFkzYJRQXKNFGmQQgpeaXp9ioWlyrmneaJ4zkH5nrsO3iIg4ePc2zOPzHX49cXcm7ruUhScCpOEzxx6uCViUwCAmnwQzE8WKYEKgFBDRVso7etJqAi8WHAmgh+hF74Yrv6uLowUCjfikr3KET5mgFQxuF3vWOngsIGgwkWEwKpKrn6MuT/9zs/x4WbFtHVbjAeV2R8/s7D/Lc/OcS3HkX1aOEQklTjXZcgkDVSqiqqF3//EUZe++hBPXi8CFiBtoOffvmk/MbPXc0ZkznthgLrQBVxzF9lLOWGQ/Pw55+7m7/4UqmOlLCkElxogdbRb1g7gs+pCJF8YhVVJZjnKCJljKIsHTMzU+tOOeWUw41GA2PM0Ppv1DFgdIUgSRKSJGF2dp7du3e/Z3Z29v3AsPmw1hJVxscxjnE8lxg08QNGjbWW1atX37t27dqrns1lw3tPq9Vifn6eAwcOqAEAMLD5fK7gsfOBRjNBu0BZ1tofyuJ1A60bWJ0gxXGmKNmyig+89dVr3vGW117GhnaFdQvoEMB4UF36us2hYi1/9Fff5n9+fk75pEHfK0QJljzeNxqvLL4GPjXPLf8FMTSzBnmvi1WCSYXcBUzaocr7ZOK59kLkF9+0mje9ZjNrZnrx4q7WsfuQ4Q8+dAdf/Ao3HzjGbbqRsFhGlx/TNPi8hyXDerMMjuiobeNUXOEyEl60DABVr88NapcBqDF4OmGwoqZqDydV33Yk5UZ1/ugmMbCVjOKSAY0ntYCTWL7VP2+3YcM6Fk9b1elcsuk0Jq1leqLBqukGa2aarJ5KmW5pmolDuRwTCozztWCvivv8xKFDqUqcirVhZALEVU4VFNSrpkoLRil6VR9tBdXQ5FVJI2mQ+pTgSnK3SKOVoSVBHJikBVUJDcuRhRK7/lLe8i//132PzXP1McCZBIyKSMDYKWccL1CMGQDjeAEbwIDNNK7oAoFmIwNXMVcF7np0trzmoYPpG6/YQnViJ4lKURgqUSz2CmZOOYX+saM025O0JpvopsXlOYJDWYNUgb6rsKq2KlIatEFh8coSJBB8wGpLGTxSRvaAqGZstoOmCgmltywtBY7N9zl45CgHjpzg0NF5Zud6zJWwfZb3z1b8bj+nW7iY3JSu9/PTuEIWhediMy8sC7hpQqT7syzobsJy8z+wWdL17wmgldTrbn7oa//ihyAFdFGj5kn8VrA1K8ANiwmtJepLKY2oDAg8vtutf89/+Pjh//Y7P87pZ26GuaewLcvLbziTR7bN8ciOnLyfk6QplethDDSThKJXYa0drox8v8WXFh2tkFT9GOunI8Q1xb6Cr9yzoDa275X3/qufhqXdUPVgJiPv90iAVpayoe14/XVb2HvwCfnivSiaCXN9S4JGiUf5isTECshBFA/6AUwP4vQQnHNHiqLgZEGxUc/xwSRysG88aC6azeb75ufnV+wWD3QBxk4A4xjHczs/B3ocIys4r2k0Gld9LxabSimcc0MGz+g6wXN+bLVfb+4qkgpSHcFBr+JqWiAQipIMx/oGW156XvaO6y85henGEv3FWaYmOoS+Q5uMfpkwqyb4y7/byl/dPtdxKfRDnK7aUKFVXI1zKuBVqJvE5z7BsirQ7y2hSVDW0ndLiIAWT6o96ztwxQUTXHXJDKtW1QnermLnPuETn/s2f/dV3n/oGLd5wNhWZO8RCOIjai0uTv4lsgilPqYxd7/483cEZJ4BWBnUJs/0PAcggICRgYJgWP49HXkloMhDAB0dlI2JAjlLJRw7yMSOI13uvO8JWkCnyXmrprh104bWpjNOXcvmDdOsmUhY3U6ZaltWdSaZbCZkgHcVoSzwrke700SpeF5UEhDvMCi0UhirUCiqqkQnhkbTgobClfiqAJMhTrA6IWt0COJwoRaUrKL141LX01l3Dh/49FfZPs/VS4Ajq5mPvmacjmMcYwBgHD9y1Q2I60ckGQhFgcfgga37yT7+xXvlxvPfQlKkTM+0oT9HEKHT6URRF6PpF30AUtcnhBwtAakEi0ZnLYrKIUpFC0Fj0DrBiBCqisoHKtOh8prKKwqvWOh5Ds4use/wLIcXcg7Pdlms4Hg359hC/tDcEr+8WHBf7iJtzRNVjoMMfOFrECAoRFRcH5BIL1sWm4sZ0ytLZV1dKOhaZHCwW1mzzoRakggMDiWBZEAJVRANEfWL+S1QOyG5WuHeEYgqv9onhODQuiJoByIEFdDa1XMfzZFFjjywFfV7//0W+T/e9UZWt9dB5mkHz2tfezHffORe+bu7g6rI0TbBuwqdqEjbkwizfL8q0ko0yidoHahsFQsXiSDO8GllmsNLgS98deHXzjvzgT98y6vOBLeEcZ6kmeByR2YVnWbJleet5idedga7Du2SBw/0VIapxyglgSq+P0yk+RJiUUT13F7/OF2Esizp9Xof7nQ6bx8AAKPK/qMNCSwrjLdaHVatWsXi4uJVi4uL9w2mlAMtgXGMYxzPDQAYUPtDCDQaDSYmJm5ttVorLP++UxhjKMuSfr///qqqhpP/5dWB5/b4kkRT9eMFz2pDCB4vJUELKlS0SOgQuOT0dPvLrzyD8zdPMpEskScejCDWkIcWRbqe277xJH92y8Hf2Nel6xJQJpA4X3PdNF4FvAXEoX0EX5+LC67CRZFgwOo2QoL4Aixo50gDbF6DvOYVmzj7LOgXR0mbp3HgsOVjn3uUP/vE/Nv3HeWPS0CnitL1a1E6hRKDNgZ8zF2aRlyLkIxYNRQvXubeEAAiOhSt+Obg/ahHSp1a50DC8jOWgf6BjVbAmvooBwbtv9SFYSRwKpzSGJXgEYoS+nimJwxLrmChYuuBw2x+/HCP5sO7aSW72w3FVasn+MLaGdM5bf0Mp6ybYu1Mh5mpFjMTbWYak0zOLdFJFI1Wk4ZRBO3wvozaTgjBeyiL+DhrPaiW0aQYrBekrCAxGKOpfMAY0KmhzAtUMolkM2w/lPOJW556/wLgTDM+IRXGzf84xgDAOH60w3toZVGM1/loJxQwLOL5+hM99Ve33Sdve9WF4I6DKFKtUAaKXk7aaNU78oIi0MgaoBTBK7ollC4hVxP0naZbBorKUxQV/X6X3sI8vbxg98EFFvPAwmLFQhcWc5jv8cRsl7fPF9xdACVxd9/peppvITRAo1AufjY1pQ/RMWHVO3+DhKiGTeOw7a2tZ5IVAHnUHJBasGZAhas/S7QUqlnzUdz2RbxKGBkRkdtnhi9OFQuCoStABFB0INr9UKv/qsiKKDzkAp/4QlA6fEZ+5//1U0x2SpK0zznnNHnrz17Gtn0P/t7O/bwra2mWKiiKkqxWzuY57WIORChZ7sRDo6Yq1uJUyqKykoNL/Lf/688fPH/9OvtrL7t6A73yCG1jsTaAK0Hl6NLxkks28+OHC3Z/8iC4RcqalljVAshKwnBn1fwASsjRfeBut/vLVVW9vdFoPE3E7+TPowyB1atX0+v17i2KQo3S/scigOMYx3OLARgXQhTrbDabr2m1WiRJQlU9O/qntR5Yfb5nANqN3u9zBQDiNZTIplKaynkCkFBhqWiQc+56I6+65hyuOm89aTiOkpJmp0l3aQmdraXPGu5/qstffP5hdhzjD5JJQ5F7qLpkZGgUTlmklvlFg/IxL4bnCAIMLk86sfQLDzqlmTiSqmDDKl7z46+d4eLzJ2h1liiKDofmMj5321N86m9OzO4+yh/bJCXRDcrQpSxKlAZlTDQXUDJsZL12dXI3iNJPW/l7sQIAgZUAunrGHAmalesBSsATmSgDFp6oZeaAqKhxY4bgl0BwKG2wNiVJ4j3OdefRJt7OGo1F4QP0qtDVwd95sM9EcsRjnzqGVsewCpoNXj/R4ffXZJx/03mrWDeRsnrtKqZn2jSbCY1GQqfRpJVAJ1UYm6OMRfIu4h3aNLA4yD1KW1xZ1HnOk5gElKbnBUlScjvDh//qr9m1yHv6gB+ISru4yhfG6XEcYwBgHD+qYQz0S0hrFoC2itJ5SjSLBP70i4+8/xXXX/5uQTGVtVD0KeaOk03NUFQVqUniHnlVRvE4k1JUiid2HeUbjz3GgX6DEy7jeGlYLIS8cuR5j3wp/7W84JOV4kjuoCyhGujRaVDaQJLgQtzpC7oe70tA8EjlCCKoKk46lR40/ApB6jsJkSZZW915tbwzrus/ZENGXcoMm38Gv6OINMqa7qjFEoIeatJELCG8iJU8dL3qEBBC/TSiWJCWQEBjUEjQBD3yrJXU1MqASWF2ESYNfPyLoqZWf03+1f9+M2vWtEllkVe/4lTuf/jB3/j4X/GuuW5BqiMdUyeG4OS5U+iJBYwiIAJGVM3gSAnKURQliYUlYM8iv/4/PnHfr63aeDPnnLqKXn6MiSyBUACChJJ1k4rXvOQstu+ak9vv7286lvt93kp8/3nBjexQuoJnnQB+T0dBa7wPFEVBnue0Wq0V9oHficovIvT7fSYmJli7di1zc3Pvm52dfc/JdmTjGMc4vt/8aHDOoZSi1WrR6XRuHawEfK8AW57nO8qy/K5OAd8XOCEaKQI6QFWD4yQqSuUGyARWW3jFVRu47tKNrJtWJEERSg/GU2EpVJtthws+9Fd3ce9ulLZQOU0zhX7la7hX4wc8OCmHKeAH0sRKdPB1lAiQaEGVBeunuenHXpnd+uafvJBWawknDRaKSf7yi0/wJx87fseO/bzC2YQqtBAJOO8xFlqNBO+gn/sIbKdxdQFxNXAbmQtqtBv+RxVhReM/+BxWaNXo4VdOCUrFhcio0TxYB4iDAVcGjFJYozBKoaRCuTJuC0qglWk8QvBCFTxlMJioy19r1yg0AZGKQBUZlRW32HluaQEP7z7BlOWSdvvQb2Vt3tJpKaYmMtavarGqnXDWhlU0pWTLKWtYOzlN20ILA5QEXaJtzb90QoIGHBWBoJsUZpLbH9rFX921qCoFTsC5HLRgJDoflIw1AMcxBgDG8aMYCkRniC/wRPp78PFy6NAUKvDUEu/5yN/c9e5/99broNgHriRrJOAFbTJyV9JMLBIMwTlMmmFsk+NzFX/zleq2Q1L9xnEWH54VTaGboBVGG0yIdMWeBwyYRKMyC1iCh+BDTb/WEAJKFNoPHAKkpucrmlkDLcQkJIogdTITQVhunEQtJzUYCMV5bPD1vwe7/XGffOATvNxo1gWQYkj5VzVo8KINqcUSCHVhJ8PnhapqOuCAABqGu4NKVK2boGk0Erq+oNAtlOrx3//0uGpNfFPe+uYLOXPLJNij/PQbLmDbU4/LV+6KuI43Kb3aCus5TY8Ar6P1kK0n81qqyOqQBDAE8fgQb2ct3LMV9aef/Jr8+i+9nM3T0/h8EeMBrbFTTfKFWU5bNcXPv/5KThy9a+/XnkLNVoHcQEhUPTKwJDalKssaDXjuVMJaB4But/tbnU7nd5vN5rDJH93/HwUGAPr9Pq1Wi3a7zfT09Lt7vd57+v3+ituMYxzjeG6RJAmdTufWVqsV82Ott/Fs51g9/X+nc24IFv6gtDlUvBIRtKZ0HgwkjQah6qM9TBh41Uu0/PhN53LaWoPvH6c10cT1C6qiR2f16ew4Bh+55Rvc/vCiKgGtM4pegTaQZVBWargjrkUPLd6ps8Jzu35rQPBBcFJgMkWqSpoKrrqMO/7JT1/O+tWe6TVr2X+w4C8/9zB/8om5bzyxh1c4DUFnyMCPXkVNNyqPLwNGDDZt4aRElEN0ZLfFMqDWJcKO1AUvwvJtYEIkz/SzujYZ/kzXeb7+PPi3cvVrMAofxJVJLUTWh4r2suIdIfjheqQMEBx0XJ1UGtFRVBBlCUpRVtGeEGXROomuFyrQ8xULPtBAMet5WBblrSwIiJDonMkkZ8rytkl1+C0bJ3nTj91Y8LIrL6CVagpXYEOBSQ3O97HWxumRTqDqo7Ql6axlf57w0S/cxSKwJOBNrCUTq1BlnPFowI8vb+MYAwDj+FF8+wWvwcRE6bzD1oUFVtGPzn987O92qjdcd45ctkbRchVMdcjnHcnkBEqnVDoqvJsM8Jq0OcGWM8/m/PP3vubAoxz2GrxKcV7x/2fvv+Msu8o7X/i7wg4nVK5OklqhlSOCloQCIMBCIMIgjIV9YTy2r9+R3/sZ35k7vvNe/M7rua9kPB6YcZgZR+GAAZMkY7IESIDAJAMiSAQJUANKnbu6qk7ae69w/1h7n9pVXVI3tITUaD98Nq2qOlV16py113qe3/N7fj9hDUIYtA86wqlOyJG43OK9AfKQyCiJVKHg8j4AAN77sZ2P8BIvITfDQMUPJ1CoMIUKc4AoVoSaZKmCO1b5CyCCyJFOorwsQQFZnpmyBAJkDUAAhMHKFRaBKPUFjs2QJdUfhFfB5s6Xs3EiH/cM3NiDN7w+wmmkj3DCUwwLMDBSgpGL6cqcP/u7H4jJSeNf3TqLbrfg/DM2cu3LFnl41yMPfPeHnBh+bwxeIYX5iRMwLxxW5Qhf0PLBR9phcB4KWjgkQjpkZLDWsDjyRCl85JNDsW3Tl/11LzqXDREoJfGyFbyJfZ+pOOaCk6a45rnH83D/4QMLjzBrIdBlTOgkaZ0GMURfHLUYZCU0Zq2l3+//XpZlb2i324fM8a8VDwvFR/AXT5KE2dlZBoPBgaIoZqt548eDodBEE0/XqFT/2+329k6nc1Ucx2MV/yMRARwMBgwGgzustURRhHNuDZh3ND6oEu1jkJpcjEB4CqHAwMYOXHo2/pUvegZnb0vRox6Fz8HEKNnG2Jw9B3p8+J/u5cNfPCj6gNQSm2e0ZRjtiropmQvML2El2kNcMulzIbFSBj/5n/RP8AnGtcLZKheRyhNJOOtU/EtfNMuzLmgh7CKYDXzyUw/z9nce/MJ3H+Ry0dIIrfEmQ8Yx3nmUUQhnKfLQ606kREpFbhO81yCHAbwXYWxDmjb4CCeLVQXwsQYAqPoM4vjvCO+JFysl/Ti3EdTyFYMU5bx/CSlJVNAAKv0dkAlOBLcJZzwCgdYSpcJZNMoKpNTIUoASb3E+w9ohzkGahDXvLHjn8WiEUEginBT0cKAkCFEyKw2Ry8ly6GW8sw/vPG4ev2HjFqanOkhzAO0WUWKANzByEZ1kEjGyIFUA/kWLg5nmji99h89/DzFUULgKMQFvPZqgZbDCdmiiiScjA2+iiSc1w1kRyROq7KqG6gpExNBLdufwntu/wJKehvYsLA1ItMJnGRGSbDAitwa0ZDTKMKM+p5ywkZe84Nlo2BQFPCFQwhArh5MEVziE8SghieOEJI2JtcJ5R5ZZjHWhJi37BaI05/NYvLfISCO0RFRiaVIEVfhSJb1+m8mqWPeqhDlE7eB0Jc0/WOsIL1EuXKL8eHWi4wNr4JhmWq/8zbJiA6ya6azGIcaTg6sAD+lFaL4ISdRKEUmLno3Y14M//vMHL3vXP3wFpTaRpikvfMHpPOdytsYCtBuQxAlS6qBDIOrJSrjEOtfq4r9MaoQNAhZr/q7qaPfWBmtgAVEqWcrgYA63fHT/3V/8xh6cmAY5gdeTLBzMSFotVFeiRw/z0stP57JzOzNbpjlTCNBx6WFsgyCioFpH5f2z7jpZYZOs93dWRUbo8oeOYTVbXFH5H43+X80lD4dDjDFMTEwwOTk5E0XR46Y03kQTT+eoCvc0Td8YRdEqUc4jAQCyLLsly7LxyED9fpdS1k6hUs8EXbqssDK+JlZAbFGJvInAyjJuGL6uSu90b0gcnLkJ/6rnX8AzT51F5nvRqk93MiHLc6yeZKiP4467HuZtH9gz23eBCm2rXcnB5ERCb2m04hIjwliYGNP/5RiEqO+7a/e2am9cucrHCRPsZkXwr4+ERxtoC7jwbLjs0q2IaEC84SRu+8z9vOU93+E7D3L5CCh8ijce8gKXD/D5sDqdEAKSKNioDvOsPPNX6Hw1+PRnZo1Wa6h6b8ZWxrhV5zyiOksN4eB2q35GBSpIHw4t4cv5f4KIs1AaEcV4pTHOMxhlaJUihcZ7gbW2tK51SCXQERhT4JwFYZGqfG7Oh5+NgKQDKgERGJZWKLxOkbFESWjFbN920hynnbSJVOUUw/0onUMnLu8jiZARNh+BK0AoBj7m+3uGvOfW79zRB0ZOQ9wqXY6C+H+atFe9Qk000QAATTzNin8IfPsCXI4vWfdelJCxS8An5MB7PrssvvTwgIeKDiPdRUQS7UYoM6IbaXQkKLDIyQ5Oe8j3csnZG3nx5epubUAyQkiLcwVxmtAvLdqUMsSiQMoC73IKZym8xIkIoSO8iEolf1Uq7qsw8S0FXgqM9aXFT5lguOAhK0uRtnqBK2oXXuPRWDSF0BRSllc5TykdVjqcqNP8S1tAHzrg0ke1gvgnvZ7MxMEhfY70OZDjMVgs1gsMIsx+eoXzAu9U0ALwAofFYvDeEDlJSoQb9PEmgxiKFPYO+OKb/nxB/M27vsbAtNm4WfPKl57CxRfgtfG0pccYC0pibejQB0pFZQ/pkc6hfLikXwEBgviRHGM30ksKIJNQCCikBDlEyj6RFnjjkVbiTUh9esD9fZ7xB2+79wtfv2+JgwdAiBl0PI21GlxOWw+Y1we57ucu4MxN3NuR4IYjNNBNBLYYUngT6I2+Whcrl/ASIdRYqClYFVbraSVT01pjjMM5iKIYYxz79y+IXm9AmrZDt0SGjkyoNyTei/LxCd5btJaMRgOMydmwYY7Z2WkPruzKBLpycHNYSdJX/ruJJp6+4ZxBCI+U4L3FOTO+P4TwKCWYnOz+7czM1FVaS4zJx/ec1rKcc5ar7Dor4CDLMvbt2/capVR5nwegsnIVwPmVs8mFsSXvIxw67BVyZQxNjBXby70FECUIEEdF4IILkNmIszdz07964Sm86JwNzOkhrUSCH1K4PiLx7M8Ft34z588+uPsLewcs9EdBWDcj0KSdkiwPC7SSCFcgfIakwAlHISVGVABw+Rp6gfcWX2rJVJdzBu+Chky4wtnhxmN2OVb2MGaRxMCkhfNPxP/81c9g22kbGOmUj3zyQd745m/zme8gBhp8DEIM0EbQEm20i1BCgxNYBEZJRs4zsEV4gj5HWYOwAlGALAlnFosV+THb/V8BwYMtY7goLzm+HBJX/utrV2iElOd5eXkny/PMIrxB+ByNQdgMXBY4Ac7ibQHOEymN8wbnTXj/y3EAvArCC1aVTYVwhfffhzVQEe9taDRhC/AZnchjhyNi4RAO5jrc/OLnbmdLt8D3HmSy5YNadZ5Q+Ak6YgJ3cBk1GYMuOGAzisl53vPxL/PdfbwoQ4NPITertCuWsuWG+t9EAwA08bROfwIS7O1qdNzXkH0dkwND4M///nbU3EnYZAasA5+BL6imqDwyKPUrg5ADYpa46tnncebxeFlALCxJ2mJ5OEIlUbDpCU62gZpf6yh4IcvZw9Kn1utwYAlwot41PrSgFo9yrdeRCN0WWeu6rNexXX3LrgISjvFbuCr1q8Jw/HfXkwWvDwEsqu6UxKOcK80jw2CdpcXITzGy8Pt/8APxV3/zSaSY4owzT+GFL9zIcVv4HTNaZqqVYvMCnaboJMK54EqhS6Fe71eSzNVrtv5uuDAOUoI5VuhSzKhAUITHOw9OoFSE0jGFlOzPIn60xOVv++A/s7OfstQPoJf0QH8AU13wI06eT3jdS5/BGXPcnI6gpSDLPChBK41qz8eNQRVBNR5S92JeP6z1h8z1l5aAY9/wVe9XrcioWC6VUKC1Fiklc3NzTE9PX2OMLQuO0sO5/J61jgJNNPF0jUpfoxqXqbr0VXe/3W4Tx/Gv1Tv/9fu1GtOpVP2rcR7nHP1+f8dhf78fM5PD7y2Faw/LLCv1U9sdydJgRDvVqGLIhIGXXX7C9VdetI3p1ghhl2C0hEpTskzQ913u3V3w9tu+wjcf4fJMgCWA4cFTPlxVkRgA2HBG+FpxWe11h9vfDjse5SzTE1EkHRy3gb+9+oUxp5zapSgi7vn2Mv/jprv40t0EonraLmfSHL7I8cas6nhX55WtHIFKpoHAlWw+jXAhl/CVQPDPgBXgo14Vu+5RtRpkLbfSq8538SgsPHHIyMd6r+GRNDxC7oD3kI9AKaQU9HsjYgmMoAW88NknbDtuOkK7ZSJGIb9w4EhQqoPPC2SkwRkGhUdOb+Kr9z/M7V9cEgawRKtuGOnrmUMjANhEAwA08bTNfkp6t1ixNlvZIE2wfbOD0EUEvrkD8ekv3IOa2MjIqnAgC0OwjlNlh8IjsFhpENJy4ZnbuObybUwDyozIcPg0xQwLkrI0d0KMi/p6YjSmHa53s3g5FuNr4smDj/y42i2QwoduuBVlN01jC/irv1qc/cubvkB74hRe/upLeeazeUO7BaPhfoS3CAO+EGHG0AmEinFeIpUKnaJD3n3Hkc7uVQl+dVVJvjGGhRF86Kte3Pzpe1g4OKAjBMIMIQpdAzuxgSSFF164jVdcMHnd8TKQZYxMcN6TF/1wj1Q6BqL2vEqARPj6mAUoB9IpRHlVNP+62n+WZSwtLb1mOByuKtjrAEBVtNT/tqIo8N4zMzPD/Pz8rVUhUwcNmpq/iSZqCdjY5syNafnV/aaUYnJy8oFWq4VSal0NjrWAWvWYPM9ZWlo69fAFXEXpL0BkSJEFULaSXSnB+FDUmTEjrYTNWSrF7ektsknALz5v0r/q+ecxtTHCtBxMaNDgFgvS1lbu3dXhrz/wVb78HSselw6oWGFlecQ6nnRlHlHuk8JrhIsQNkLYlFRPsrzYK47bzL85+3x+7TkvOY4NJ2nu+27B79/4Nb74TwiTgYo0wgW9GWdBSIfQxTrjX00cM+knjtgNAwPRueA0JMI0C8B5J+JfdMkFbOpqbJGDikHFFCLC+tLDSFnA4lWLPm2GYpr33vZFemMNBLNyRldjg+PFeew3cJpoAIAmmjiKqLq/KyitqLRRRQHC0uqkwSUAeMu7/pkH9o7wk5sAHQbmcTg00guUNyhflNPRlsQX/Nwlz+B5F3a9suDJ0HEcfOcLC16WHYhDEWJRFv/Cu0qDPyQbrO3+N/GkgQACnAzS0BKPdBqcBOexTmOJWVhm4S9v2vmiv/6b25ndsJFffN3zmZjiuqk2tCJwhcEZg0ASRQlCKDLjQcZYdKDEhn7BOL+UmCMSoKoK/qpbXiX6SimI4ICAd92x+4JPfulb9EYSVApolqygiCK0cnT8Iq9+7gVcdb7wMRBJQORYV5SdJFu6R7hVc/7SgxS+HFwRYSQFtep/EjF+fvXuYa/Xu6XX660qKqoio64iXi9YrLUURUEURUxNTTE1NRmtBQlWFR8NGtDE070IWaOTEYr6cB+22+0zu93u1jiOH1VPow4gKKVQSlEUBYPB4JbBYHD4J1AW906YskipgMSqOxuH7rxwQc2+Ygig8cTkuWNqIiF18LyzU//r1z6X07ZonFkgp48nBxmTiUl+dEBxyx338pF/7otMQWvy8eh/u5X8YczYi+qzC6VOi10BbH0EroVwCSYfMJFA5rjr5dedx4mnn8x931/gxjfcwZe+gpBAGqdEUuEzAzaoyQvFevSwJo4pAMCgzZBO5MDmYD1xJ6YoYHPC+S977vmcPJ8SmT7eGoSKsTLGiRjhPd7moDzWW3pWoyeP4+Ofv5c7v1q2pXyVLWZjGmg1khesEDWNSk4TDQDQxNN5F64tRbWyJKtupvL0eiMcYQzgvr2I99z2eQbxHAPZASFBejwC6wXaWyKXIzFoCmSxzPHTEb/44ivY2uGqGIMZ9pjoJFjrV+j3FSWrljfIEgSQ9Y6vD48Pn5UNhetJjND1CeCNkCWm7hTKRfhSR2CxMOQCDva440//4gHx5r+5lWdccBG/8OrTb1YSpHVE3tGJ0+Dja0GE7I7CVImuHq+TcdIpKgrqY6ewdcGtirI79vDWCVkMD/a55y0fenjHJ77+CEM7iTGadqdDlvdotSXKDzh/6wyves4zuHgzvmUyvHHEbT0WI7QyiELaEggY31UlvVdWTAAqwabwNyoVrSrsK6px2UF8TX1ueK0dYPV3VR9XzIaiKOh0Opx44ol5HMdjcCC8FnVWRLOGm2gAgDr1vxKOTZKEycnJe+M4Hu8d643jaK3HAIDWwdSp3+/T7/dfcziRQC9W5rMJJjYIUe0XIL1edSY7sWJT61A4BEncwvUzLj0R/8svfgZnHCeI3V5mu4ZIZWTZkJ5P2C8389Zbv8HNt98vMmAkYGnIUbLoVqx1KwHU8cw3eoVfLar6q3yc0wifoJC0yVACnvN8vnDRZafy8M5Jfuu37ubzXwwZiBGAyMiGOVhNpCfAJeQOMtNQuI/p4seXfgOmKH0FPSbPSYAXXDR/9+XnbKVdHEDniyRK4qSisAqURvvQBIACqxQDOuwcpLzt/d/ZsUgYSg0npzlkDtQ3pVcTDQDQRBPrIQFibQUFImyoo3JTvfm2h8Wn7/khtrsZRBuQ2LLrKXzQFJDeooFYW5TtcdYJk/zii8+8PRlBZApUOR/typk9J+oz/G7c3a06/4cqq8tjXIH/Z2P7MkgMispdUdZmMp2AtDvB0EMhYw4swV/86SPi797yEa677hVceknLh2XgSLVHYbEuD6tCKrwQK9earfJIraeqArrqzlWzuqFQthijEG341i5OfctH7uOfvnOAUbwBYxyp8vi8TysVYJa5/IKT+cUXnc9JCeengM3NqsTCCVEDs2SNblg9rGQsjJWzxaq54qowr4r9wWBwS7/fJ8/z8WNWvfq14r9+FUWB1prjjz+eubm5O5MkGRf79WKmMQlo4mkPYtYYNhU7KEliOp3O33Y6nVWPW3sPrgXgqnuv1+v99mg0OjILznUOsZW5dlGyANRY9LS+p2hvEdmQ49ps/1+uOZvnPGMDqV+gFWVQ9Im8Ik43smQnueXT3+Y9n35w034PvtXBiRhnaiMIR5M2rEer9urQ9LZiRpXsLckQcJx5Jv5f/+sXs9ST/F+v/yBfu7t0dYvaWA/GhllxJSVKSIwBKTRKNxvYsZ5xShGAnCSNQRhkDmccx50vf9525mJDbHtIadBa4RwYFxyjEBahBaiIvpG4zjzv+8SX+e4BTu0DfQKztGnxN9EAAE008Zg7cX0Z2tXUakdpMRRjgT6wx8Pb3v8Zvr+nIJcTIBKs9EHpDxN8hCzgXPBh1xktv8TLLjuXy7fiN3rIBgU+qkTmxDgXWlXYiRVLuHq+NFa0HW/u7hi+juXsWeJ9hPfJWD9CEeZYIXTCl4aLtGZjFkY5MtEsLcH/+IPviE/c/ll+6Zeu5ZwzWl4BxWiIlGGcxHuLkCUdvnqlBCt2lay2Ozpcgr9W9G4somcs0jmyHFxX8U/3If7u9u9z146M5YNDEhx2tAyiIPNDOlOOl1y8iV98fvvuszZwU1SUEzC11yMAWjpoWowVmCu2BGN7r7E7AH5MH64KiAqwyPOcxcXF3x6NRquAgfrfUI0NVP8tpcRaizGGOI45/vjjr+x2u6+t6pa63sARFShNNPGzfvzV7gmtNe12+8x2u/1rFXvmscZwrLVUKv/WWvr9PsPh8E2VOODh639/qPbNIf8tS1p9jPQS5UBhSVzOFgWvvnLjV573rOPpxAeJ0xFoR7HYh1GLfQdTPvnVR/jrW+/9rfuH7BFdxXA0JBIpSnZWbAV/0tdu1T7sS9mCCgTQCC/GwHAYibIIMUTQQ8oRW7bwb177uguY6pzK/+/17+OrX0Y4kTBAsmyGyEigdEiUY1XgbAZ4lOogRJtgndjEMZk+ENx7PCBdsK/c0oGrLznjyrOOm6IjhkSysiEOFoNKgKYUDvTgVcyAFt/+0UH+8fYfvC7TMECSo8PYqh//shpdRJZ5paFxwmmiAQCaeJruwHKsrh92R7t6Q/SAisB6nAg2QUMCLe9z33Hiji9/l76aJlPtULxjx16r1eV8TqwtMx3BrB7yuqsuouMhhkMKkNXCfyUIcUiV19wyT5nlI8Di8U6CT0KiJwqEGJRznw4SQS/PIZH0DbS605Fz8Mb//CVx37d28HMvfB5THTAOkhjSCKzLMCZH1ASmKEGA1R30I9hga9Teit5bJexaa6QHk0GvSMhaEbd9aSDe/fFvk4sN5H2Pbk+AzUgmNcNsNxunc173iot40bO61x+XQsuCDpMyYWV6BSicUCtAgFgBMcZ2gNXrV1LzlVKruvNVId/r9d5U+YiPvcPXCJFV1OO6oGCWZWRZxvz8PJ1O5x1rbcrqOgJNNPG03cPW6GNorWm1WjclSbLuyM3ae8YYM95PiqJgNBrdUbGOfiyNjdqZKXzVuPTjM096jXIK6STaO2KX0/Zw+Rn4Vz7nVOYnh9h8L7g+ZJYo3kJvNMfn7z7AW9/3He7fzx/bGIZ4ZDulyDO046gBgJVwNf2CKoeoGAyi+ih0faVHqgwl4aXXTPzpFZddwn974zv43D8hcqsofAsZdXE6pvACa8vvUx4lHCKUjOSZaUYAjuFwSHKvidMINzCkBVx4ovTPO+8kdLZAt61DTuoc1hhwhkh6lDf4PAPrWM40Np3nw5/+Cg/2eeeCASsiVKs17v6vFdSk0riiaN6EJhoAoImncwZUzuyJddBQL8Me6RXeGnzpBjDwAQz4k7d9TTw0TOjLCay1xJGEogBVWsp4h/cOm/eI3ICNbcdlp83y6ksnvQISLbBmNPaXxZlg3es9xpQ7dsPzf4rvYK7Ej5LQpRLBdg6RBdqqa4FtlY8zLA8HhfdBSO8v/uyfhRaSyy4703faMBhBkgaVZynAE0QoRS0RptZd+nFEIOt03WpmF+cRFmIRQeFwLmEQJXzgM3vEn/79Z+mL43EZkEiMXSDpFoiox5Y5xa+85Jm84kJ8y8N8WwYnA2ODfoHxoBK8jMaWWiv2TA4nHU56vAiFvlJqLFCotR7P8leCYktLS789GAzGs8p1MKB6rBCCKIrGAIdSiuFwiNaaE044gdnZ2dcaU7csYwwcNNHE0zWKon5PBDBtYmLiyjRNybJsleVmJahZB+HSNMUYgzGmYgC8aDQaHQIwPFoJNPah9zE4jXRyBeAUDqkcQnisdUgraAuNtJA4OGWem3/x6pM593hP5BeIVFnQFDEH+xv40ncdf/nue7h/L7GRhGa5AmdyEjztEmw/2hAChPQI4QNoKxweEERYJ5nozp0pRYS10G6Fx3sBl1yW+Be/+GW88T//Nbd/dFHEGkgsGQfJjMXaKOi/ONAKjPE4n6OUJ7cjhJY/4fNdAXPWs3GMoog4jsfMqiZ+8qjOpEoPYxWophNc3KE/MrQ1nDzFr157xTmcvTmh5Qf4wXK4F5QO55vwaBfM/UScgEgoojm+9v19vP/OAyKj1IyQElM2IMY6gE6C0yVAD2DwPwsszCYaAKCJJn7y5VcrolbN8xGyBcpCq/yalZCJcPWBt7z/Tmx3C54IO8ggSsOmbT1ohZaghcCbPsouc8K04DkXnMSFJwpv+gWp9ETKo2Qg9gsRZv20Zp0OpVzZsIUbMwaaeJJCGJAZyKxG/Szp+pVLQ9DNH68hLxxWKKwD7+Dmf7jt2hO2buLsczb6SMGgD90OZQJpw7yod2MRvVXr9nHoXsVSkyiNRGC9JHcJe0fwT9/s7XjLB75Mz0ySDy0oi4wKesMFsuFeztqS8Es/dyFXnIbPlxwdYLaTImyBSpKyvR/Use0af+bwGrmx5/djhXOOoihuyfN8zGCoJ7KHC2MMnU6HDRs2vKPdbo3BAikZjxs00cTTNbSW4/uq3W7R7XbvrNg3RzIiU7luAAwGA/I8XwU2Hn4PrQAAtULzdxUrz1EUOXGkCCoABW1lSYHjp3jlz7/4pOsuPH0abfehzDICj+97evkUX/+R5c3v/TL37kLsWqaw1TYjg8qgxqCxq8brfqL8ob4HVy4GlMWXgDTqsrS4fJ+3AfQd9MPeftzx/PtfvO5abrnldr7xDd4wyGFQQFYAkUBEutQ7MCtWsL4STLRI7ArL7ChCKTUWh61EHav3rnFJOfrI83xdhlt5rmEdTHRapBaed0H3LdtPmWPK9UikQUQRJC28DfdTpBXFqM9waRk6UywMBHtGMX/9ns/SB5wCZAxaQDZaU9yrlTykKfubaACAJpp4rCV4qC1fFR4wPmIIvPsTD4qv7thL2t6IK4JtESLCRBp0UAIWUiKsRfqcuFXwrPO3cs0l57JFQwvQ1gRBIxzeBdaA9+CcH89S18WKKneAZht/ssMgRAZyGCwjUThfvi1VpetFSG5dDMgSAAAjYgoPu/fygY/c+plrzzrrDM4+e8YLCUUGrQSs8SvjIJSq/z4knWvXxE8azpWJnvAIb0ll+Nn37OTU99y565bbv7aHnpgN3axBn+70FHGiIF/gotM38dqXXsrp0/xJAqhsRORzsBnYchwmtMfWrNQjX7vOObIs2zEYDBaqUYC1YwCPFVmWkaYpW7ZsYW5ubrn63iiKOJxKeRNN/MyfflLiXLinJiYm/nBiYuLKyorzsYr4OjOgov8vLS2dmuf5+P48snt0XJkH1f9yhGj8NW/xriDGERMq5HkBV5zfev/VV5zF3HyMThzSFpAJhnaOr3x/xN999G4+/p1FsdtCUXqrC0FgJ/lQqBel4OpR5w+rgNgKBAgHwagYEasU6y1RBGkSKNm/8i9f8Ef33Xc/H//YfvHgTv5vS2jSWicRvh1eez/Aq8Awc2icT8CrMCIhciR5mQccHQAQ2B2hSI2i6FFdH5r48WM9hsXYwUZ4IuFwwwGnbeT+l1x6NqdMa1q+j/IGvKAoHELHOBMYqs45WtOz9A5mRHMn8t47vsTXHgqTLKNSdwpnS0YroelARX9ZyWkr956GYNpEAwA08TSOyl6v9lGFuJcWP3h3iN+OA3JgwcDfvPdjLGQJUXsjI6PJrUcnCdbkoQvqPEKCFxZbLDHbEVxx3laec86kb3kQxiGdJyqJBlVdYl2VRqwYAVaiQ0cqAtfEExjVsKoARB5Wi2/hXQJel/TSMNqBCyCAE2CEp0CRI1AR7NrDBz5++2evfOZFF7P1+PbnbQGtRIGtbPPcSqJ3SMdHHuXqN6Ej4T3WGqQ0JGmLoYrZscBr3vLhe/jGDzKGZhJjWyjVDl2j4UFkscDl527lV1954W9uTbhGGpjUgBmG7tTjILInpSTPc5aXl08dDAZj0bEqST0SAMAYw8TEBFu2bOlOTU1dUxUujQZAE097CNMYpBS0Wi06nc5vJUlyRIV/FZUNYGn9t2MFVDjS+0seAgq6mjCgiiRF1ifRlpignXPZBfhXPv8cNncN2XCZrHCgOoyKLl+7f8A7P343H/nSIyLTMU5H6CRGKxEw2pFDmVBs5+qJKoDKvyUY+YEwREqBgyyDX/j58/yeR/Zyy3u+cuqB5fDoqEWp6t/COx2YZcqNizS/plirhAWP+pmWyYbWiiRJiKLozLpdbBNHf35Vr3Nd70ZrTSw9HTGi7eCqi4/bdsHJG/DD/WifIQUUpiC3DqSkMBl4S9LuktmIUTzDfXsz3n7rg6IH+LhmCW0tKHlYB4DxeEATTTQAQBNPz+I/zFSNd8SxWmpF5bPhtPVrvx4mqIjhE18aiA9/7tvk7S24eBLrJN66UPhJwGQ4PDLSjAqDzfucMa+5evspbGrzqzEgLcQysLdC01QjdbSOB3x4bsq7NUyAxgXgpx6rMrKwVpxPcL6NJ9BipegDwxJEUkgX49HksqCQnpGD9gTs3M1nPnH7Z99y/nnPumx6SmJHwUZSOda814zppY/b2a3AK4Vzlizv4clAw7KDz38P8dYPfYNvfN8g41MY9iT50CAmu4goY4L9XLP9ZF56affWzZozEw9tCZEyQRmwFMWUq4AriSyvw4lwVfoAg8FgYXl5+a46xfhIOvhCCKqZ5I0bN7J58+Zboygazz430cTT+gR0YY5/YmLiG1EUjTuU1fz3evdI3YkjiiKGwyGLi4sXWWvHuhprx3UeHUOVtf2zKJlUYXTIC0kSxQg8zhhSAeefiH/ZlWdx+bmbabGMQLGcJeRuA/c8YPmbj3yDj3xlIJYAn0gKX1BYR5bHuJEkKgKIYLRgqCjtex+HNNbLmsAapSBgQZoIctPHU5AVcO6Z8352+nje9w/fFAcOsMNrMBryoo0pppB0SkHVASqmFBIGLwxeFngRBADD/nn0Lm8V0yNNU+I4vqYChY70/WviyACAum7NGHgpCtp5wRWn4F944TYmRUYsiqAFpTQIRTuJsXlGLEtxId1m57Iln9zKn7znNnYDNoXFUbhnuq1OuKkLV2tOOKBAkI/ZhE000QAATTQAAMG6r74p+nW+Hnh44ZAXyPHsoCMIAr791q8vfHPXANWZRasEXxQoFSp643IMHqE1KmqhvGFSLPPMk2Y5++T2W6ZbZbVowi8PzGmBF2o8AoBfAQHGnurNCMCTGsJLpAPp6vZ2rsQFgl2fdBbtDYoC5QsQJowBIChQSC1YWg6jqTt3Dv7Xu75y9x9deP5FXglJKyl/hg/v9yoQgLX//mRhCXJAUnlQDusgdwYnDFYElsunvzwS//DRe/n2jgIdbSLSXYzJELGjLRbZkPT4Fy+4kIvP5l5vA2hBkaP8iqtG3bpQlIW/OIL2W0WXNMbQ6/Uu6vV64zn+I+lQKaUwxpDnOa1WqxoFeECpJg1qookoUnS73d/pdrsXVN386r47nANAVdgsLS3R7/fvqgqeI+8cr9DnJQZEXl4lfdkHgU9dNjO3zPG3P/e847j43C1MykWmIksrSom7x/GVHxa8/fbv8Im7vTjgQLVhWIxKOR4BPkKLlFQoVFkKeQdWPF4p6Bo9obKBYNwojB4I2LK58zunnXom//Cuj4msX571CnIPQyPwPkYLgRQGa+pkr9JOteYyMHZKeDx0YOKYJEmukVJus9be13T/H2+QrWJZ6PHIhTFB8HlLzFXXPf8CTp6JMf39tCYmyAobcgilw/vtLCJNcIXl4NAwd+IZvO+TX+Zjd+eiL6CXg0Gi0OSDAW0dr+6viCq5LLUjxutG0qABTTQAQBNP3yKu2h+RQFR2bsuNUXKIKKBAIZFIHApwOcQtuHsXs3//0U9zoJejhEa68hulwyiBjxSZBaVaRDJCZgc4bsZz5WXb2Xr8dK4JTeKqU2q8wzqLL0v91bVSGE0Q3jcigE9qaLCTYLvBKUIWeDUEETrOwimU02VHxyBkSG4tBiciLC1Qk2Es1QuSOGHfnuX/8557vnPReWdf4IVxKLfiIS2o2UyNk8GfPLwApzSFtwifobSHCKwCIR1aQRLB0MMdX1yK3/nBb3L/D3pYWiwNRzjXR8cZSbaH04/r8MJLz+Ls4/AtVYIiNkN4Ny78w98Ruleq9Mc+LEBRUv6FEFWn8c3D4fDHovBXYwRFUTA7O8vWrVu3zs7OvrZRuW7i6R5TU1PXdLvdNyRJgtZ6XPgfziaz+tpgMGB5efnUoijGqvJVsXNkRWTlVeZW6mexogtgjENJ2DzPKy979syvXX7xNjZOWcRoL9ghvjfikUdG/P2dP+K9X3fiACDiAKhiQcQKdEyEJpExQqbkxMFFRenHQUfFrQYAxiyAUKE7D1LDzLSITtx6/Bvu+vLdf7rYA+cE3kscEV4nBMZDhtY9pOxDEaQKqMiHPg6XcCVI8vic+1EUkSTJmUqp7dbau4qiaMajHs/8sgakVeBYxZTZ0IGXXDJz+8WnzTMVGbQvoDDIKCJ3QRDamyKYSglPYRy5i9i5aPjbf7z72h5gFKAkUdxCIdFIMA5NSRGUK0muxCEw1TtPoP41JVgTDQDQRLMUf4JDP3xXYYIjwLs+vlN8b9cifSsDXavI8c4hI00URZg8w1uCWnE+oBNZfu4ZWzlnc4uJKAgVaQ1KSRQqaAeURVP4LrnCCChzp0YH4EkMX+/6VOun7GRVa8TLQIGvUl2xugLvDUZMdGc7Bskgt1gUy73hXT984ME3bT5uq7c1qr9fZ/0d1dNHopMUhwzrtPbjnQtGFrkNLIBdjuLWzz8s3nPbP/PAfmjPnYZhAqxBMSIe7eUFF57Ez195MidNcNOshth4tAvr1wmJrX5B6WAhy9fHU61puQqc8EiM9UgVIVVEURQMBoPfyLMh3hnkESz+yk7QGMNoNBqzAGZmZt7R2AA28XSPycnJW9M0HVtnVqrwhwMAqhj0l8mz4Q5Rstas9TgvkCrCebFyVh1y1lZstqJWlKw+Y7VztLxhAth+Wvv9Vz/7LE7d1KIlRyDBZIJdwy7v+6f7+dAX94l9DjIJIxNs84QnCOkUBmczrC3IncNYH87nuPW4n5/VSEPVWFAK4hiSVuemHz3w0G8+tGf5fweBFF0sCYUp9z4p8OR4huEVEqDFapq/WLv3Pw7FWxRFaK2vEkLMGGO+aIwZF6tNHAl8FZiY1XllhV5lfSuECp93JRPAZETOMRdbTpqR/pUv3M6kGNBNFJ12m4MHDhB3JrB4hJJIrYKoX1Ygog565gT+8t23snPIB4YrbyJFnuFwBL+MksUjOWRO0D/qB0008dOPpgXTxFOpoqOS3Vv14ardMny9+pIAWp1J+kWBEJ6d9++44dqXPhtfLBFFHlsO8bm8IPKCKI7BGMhzhIIZnTM/0+X+gwdv2LE7vzE34LxERxHCC5STIAROeKwUOBFKyWADBEJIEBohZPjvlcGvI7qEWE3xfLyvIzlCj+HTf5wABKE+gSipIx5fWtxVyYEP68WHd08CUniU9OR5ViA81vtg/SQlg3x0x9JgcGPcauGlpMAHhwGhkFIhAO/8UXZqBNZ5hJDBbcCVZXhNYLIgIveeWCuGzvPAA6M/8GLwH4/bvI1ItdE4lDRELqc1WuaETTN0U7v9/vt7OwvLXSrqMChccPlKJKawaOlIdUJmCryMsDK8ZqKW6johQndOKqwxCKWRQlJkGQpnJ1vpC+NYY5xFqZVCvqJYVsyB6mOt9ViEacuWLbTbbR5++OGPjUbZQxXDoFJprn/cdMKaOKYLlLIDWc31Vx3INE2ZmZm5aX5+bnvFhKnPKVf7t9aaLMuCDVnNOUMIQTYa8MgDPxLS2nBGOT8WrA0CtgKkqE4aAogtEEKBkAgRdHKSyONLrVShZbhnrSV2lg0azt+M/3+9bDuXbJsgyfeQxIKsEDySzfK3n9nJOz7z0EsfWeL7Ukus9QgBUgkKQ2DrBSMSnHQ4GZBHjwdrUT/BTHSd2SAqMRbvV05VUQG+njiKEUIx6BcfWOplX8YLvNIUwmG8QSiB8B4pHFI6PC48NyFxPrxuggoI8OPn6oUYF5lH8nyllKvAHa017XZ7Jk1bNwghp4rCvCfPi53WunC+CEn4Mw+XQzy9i3/lLUJ4jIiwIsKLUrOpeu0dCK3xQqAEqMIyKWBrx7/xV1/6zOdcceokE3qIswa8p5NovDU4GeO8Q8vStcLDSE7yiW8f5H/ccr/YA5ioE8CBwpTQkMNgGK8izyF57Mp/utW5bhNNPAnRwIxNPEXiSITp3KriPyD3CQvLQ/AKK+HrDyA+8qVvsyjbDL3GO4H2gkiEeXBGvWCTpkuFn/wgp29IuPL8UzhlXtwUK4iUJB8Ow/fUNul6t2LsMneUt1CVEDxR18/8mhFmZWb1kBnQlc6ARwfaqddh/n1Mxwscfy8IXSARZvKtkBgEmXXkzpdmEk9kwhWSTO3CDL/wEu9jonYXIxRLxmIi2O/of/BTu1/3nlu/yp6lFgM3QeY0+BwVZ8zLHs89YwPXXr75pq4Hky2TxAmg8IUl7cQYB/28HwSLSipr5U4cWBIr+gZSBgDMOhdmIqVgMBj8Xq/XQyFWWQKuN7NceS5XxY21Fmstk5OTnH766V9otVpjwKD6WVWR04wINHGsR0XJr9Z1BYy12+3rJicnrz/sDleCZ8BYe0MpRZZlLC0t3SXc6n0+3Ity/N8rSvVBv2RsZ1p+TquAh0stEXFMlod6pq2hDZw6S/arL9vO6bOeSd8jkZr+QLDk5/jw57/PP35ux5u+f4DbjAyz7FKEosuUdKMwfuRq+ixhdEqN97nH/0wQnpL5pXFW4qzCWIV1CoPA4DHYMNM/BpBNmVuEs8LXmGXCr9X8kUdc/Nffx0rwT2tNHMdEUXRd+bUd5bUuyNHEEZyenpXxPFbGSnUSY0trTOUNbQmph+dfsOH120+dRzNESoPyFiX8GNipcoGiyKE9wcDF9PUM7/zIF1gAcnQ5wyfHotUehy2vVX2rdYv/xka6iQYAaKKJowrjw7aqKLAW+gJ+/6/uPmvXaIKhmsE6hXA+aAdIWQ72WUTcwqqEQiWknZSrLziJ558xc31bgXVFmNByYKXDSo/yEu0IFjHkZedBHFLMN3FsxaOxJarCtSgKjDE8kcmZ9KsFJUUJLDkhGWUFMk4wSAYOCgUPDXnnrZ9+8Dduue1zHFiKyNw0iyqlSCJiZThtrsM1zz6bF22f9THQim1QucwFrvAIrbBIRjZDeI/yFult0EnAIL1BlZceu3CETouUkuXBkH0HD/7msChCglwDANZ7neqU5qIo6Pf7tNttzjrrLObm5nwFDNQp0M391MTPQlTd36qA996TJAkTExM3T0xMHBGAEEXRGDyr5ph7vR4LC4sXGYIAmfViZZ5eBNtbJUJhKwn3cvWv8tU9HhqYzsPAQ64jSLoYE8aHzjmO7JdefHL8nAsm2DpvkSKHdAOP9CZ4/50/4F23PfLpHz7Cb3sHcRzGfIwpjUe8R+snv0NdgS4VCFnfj34qCXZNhb5aC1EUEUXRVVrrq7z3C9bau4wxC/Xn2Ox/R3BvAVYEaEZg0D4jchnaZ+UadxjrQEh8ecZpB6fOcf/zt5/NSRunAkiNRFEgfYETCYVK8eW5FiUxo0GGmzqZd93xVT5/f/DJEIRxgqaIb6IBAJpo4kk7BUKSkShII1j2sLvgvj9824cx3ROxsoPzAlsUY6s4vMVGkkwobNymGA05bU5x9TOO5/R5ssRCWxEyI1wo0LxDeY/2lopg5tGAfNSEounQHxsAwHr/Xb0/9e51HSh4PN47Ua6teuF/yIZcFKATUAkjK3GJwkj40YA3f+CTuy/76Gfv5aGDYNJ5+k5RYFD0OXFGcN1Vz+L55075CdtHFhmxiihyj7OSOEkY5RmIkChJqn+DFoGqZiutIVK+dECwCBXmKZd6oz9bWOxj10ms6x+vTYDzPGdpaYk8z5menubkk09mYmJie/3xFXOgscJq4liPurAfhC55t9t9Y6vVGo+6PNZV3RPVVRPjjAfDIdaHrrYXgakjhEcRLlHa1apx53+lk63KuX/rBDLuBDl8L0jTVhRj2DrBv7/2uWfEL73iZNrsBNFHtts8siT5+Jce4u23/vDe7+7l+TKCVisIDmaZCU5pmiPWMPhpAAD1PfzR9v4n8nypxjqq7n8URduklNucczvK4n8s/tfEj1e+OKHxaASOyFliXxC5AoHDCbB5RtppI22GKmBCwNWXb912zgkzqHwx3A9CEhQrPVYoLOGeFR680AzkFF99eMibP/CwGAAq1YxtqhsAoIkGAGiiiSergiv/8WHuMRewrOEjX7HiQ5/7LiM9i4wn8NaBDR7HhTXYkubtpCaKJVG+h2dvm+DaS46LT+7ySuugkBblHdq7EjwwKAeRW7l1Hqvwb+LYAwLqBX698K9T3R//JbwaCKg+B0AU4/ICZAxJl4O5YtHBENhr+eJbP/rD3/jQ5+5j4WCEFFOYNMZ1DLHfx9nzgl97wYVs35z4BFCiII00zloKY4jTqLQ3DPTX1VaBlSC4RQtQYoXOLFVEZjx79h/4zSwrxtTW9V6jOgBQRalcTpZlnHbaaWzduvUraZqOnQKOXL+iiSae+vtKNfYSRRFTU1PXT09Pvz5JkiMCuKqOf0X9L4qCxcXF9/d6vQIkFjEWPlu1n5Td/rC3lA4g5aklvUdW92MUY2QMUQcs+MFycepMdP3LLz3hj1727BOYUbuZao+wAvYMJB/53Pd4ywe+91vf38fZhQx258Hm0yEEJK0YqRWm8Ljanyf8kyeYW9/L6/oKPw2hvfGeudL531aJ/llr7yoBgCeNoXAsh0diibBCls0Zxte4MJfhjEt8GGm55Ez81ZeczYY0R44Olla5lIp9KwLP2hdIHD0T04838j/+4U4ecjACBiODbMbTmmgAgCaaeAocA0pQOBhZSCZnyXKNbQv++1s/e+39e3OsnkIn7VIdSAQ19FLxvygyWt0UMzzAbMty7WVncdkZ6v3Kg/O2nFV0gfaPWaH+e7nu/P+Pe3A3GgBP8uo5zGu0Nml8ohO0OgwgvQtr1pVS1FJhrcCqCFoxix4eGPLmd39891kf/advs6enGEUTFCoi0obZeMBFWyf4xedewEVbpdeFwxUjkiSIifnSKtOVxcN6M63eg/BB8V/4kKTKSOOl4OBy788Wl5fIsgwIM/v1bqWUctzVqhLcqqCpQIC5uTlOPfVUtmzZ4qWU1D2wG5eAJo71qM9+dzqdbdPT0zd1u90jXtv1e8h7T7/fZ3Fx8VXGOKRWpSuNWFX8rwUU3Vi5rpw8FuCECB1SrTHZCC0UicmZLAY8/5wNN/3C88/kpLmCiCEi6TKQM3zgM9/mnbd9744fLvHHfSQu6uCkCnuECML+1lqMCUVVFEVPCQCm/t8/bWCxPvdf+tBvV0pVjKcFY8xCteetPWMaEPTIQICqjJFrQCaPRMaK0fISkxq2zXH7Sy49m5NmYlLbpy1ytM/BOTwKR9AG0t6gbIFFU3Q288F//h53fHMk+nLF+MEHi4GmhGrimI4GxmrimN7+VSRw1uBlUD82WUHa7dIf5PRH/r7UL99w2taNzLYdmCHoBAvEcQRYvDHEGrzpI4VkZmIKhOT+A/tv2LvMjZRKvFJU4oMRjhgnK/LB0c7sPbFF+uGTiCbJWC85XO/jeofm8UsmS3Ku8OurTDsbvi5LOyIgSlOc0GR5xmRbsZj5/bt29S5UUXZWt5PSjjSdWKMjRVzknLBlA0oqfvjQ3tHeEZ+TiUeLCJvb8HNhrJwc1P+DKGJpiIBzwTFBlGKAQmqkVGG21hZvT+Lo3yVJsi57Ym0iW2cJOOdotztMTk7inGNhYeFzeZ7vqATT6noATTRxTJ5Q5fpvtVrMzMwcmJiYQGtduz/cEf+MLMvYv3//S3u93veD0r7G1mzvpCCo2R/yM2XpYCPCcIBQQexUSLwMonxJXrBFFbzwjJb/peefwrNP12i7D9IuP1qQfOLuRf72Qw/e/a09XK67CYM8CKTGsRp7rHrAFEH9XKnVAGB1zqyMIoT97vHaPsfy/+LQzwVVfxBSIKTA+XCWC/nEn31aa5IkIY7jbWXxf265933bGPPhOvW/Pv5UfdzEY7/5TijAo70Zv+VWgpFROdvviI3hjBn+/ppLjrv2mkvOZEYO0PkyWoXRTi8FhdA4oVAYtCsQ3jGUXf75Ec8b33Hnbz8w4HOehEhaWrFgZKryydP4+TVxrEazwzRxTIctTLBAkhFeRuAdo+UlEBHE8K5P7BZ3P9SjV6QYG+FcUO/1LsPmfTotyWDpAKo7HcyL8wUuOecEXvCMU5lLQOFX+aYHuqUKM5NrkrQmju1EfT3A5NHm248MXDkc9BOE/lzpW+zKItyzIgwolQzqxrYIXxGQD0ZkgyFpZ4J9A0trMt72rYO86u8/ufs/feX7y/TcDDKewQ2HRC3HXNLnOefM89KLZt64MQY/cLQlJCoGX3kna6yIsUJjhMYJiRWglMCWo46Rknjr8LYYd/iXlpZ2DAYDqkS2fq31M6/EuCDQhrMs48CBA3S7XU444QRmZ2dvb7VaVEyAyhO7iSaO5Sgt317f6XSIomg8EvDj2rhmWUa/37/N2mAjF+6lsB9VM//14t97Vu5nNEbEOKHDhQ6MH5vT7QhSm3Fi6t933XNP48pz55D5fhyCPb0W39uX8tfv/d6D39rFM1RHsK+XEbVSvHCMsow8t7jSElVrRZLEKKUYjfKnzN7+WPv4ExlpmpIkyXVxHF+vlNpeE/27wxjD2u5/HQBoGABHggGU7BgRmC1GQiEEFh3cJvIhG1twyiyve9HFZ3PCdETihuBy8C4M0Tgf7gmv0M4gsDgUA9XlHR/7Avft403IBKTCWDC5D6WTbPqnTTQAQBNNPNknfGhTWo8O/XmEKxjlMAD+4x99XuwquvjJLWTWk8YR2IxEOyCjnUa4UZizttIyPaF52SVn8oKzp71zELcVzkIrTvFAITxCagSKuuXST34L/viXEKq8jjyBfDoU8UeT3K33veuxAh5PIUA/7oUdOlKivEG6AoVDiaDQL4RDaIFSgnw0JFIxDy/lO5ZjuK/H773toz+44zNf383AToPogDbQzjhhtuDnrzybn790wm8AoiLD2SFRFOGNBxXjvcJ7hW5PYH2ERZO7MCpTgW2xFEg8Ns/w5fzknj17xMGDB1eJ91UWfnUWQEX/r1sC9no99uzZw/z8PNu3b2dqauorxhiSJBmDDOM7paamXlFrm2jiSa0/hCc4ZVZ2sSuXc6a0vOy+dm5u5o1xrDEmRwiP1hJw6wpn1jvCzjmiKKrAsrNGowylajRxQjcdH8Rt63uSkxoRpVjrcXEHEbeDnanUGC9QQtJOJO5Azhldfue6F2689pknCyKzD+slQ7GZr/1I8Cfv+BLf3MWJhYQDA4/Q4KRBysDS0UohhcK7cK9XhW34G+Vh08z6vhHcA/QYBHy0xx/pWVcXUawr8VcfPz5rQKz7N7RaLeI4vr4EP+8q39Nt5R62UI1O1RlR1b5Wt0Nt4tGLf+EcSkJWgFWKTEbkTpG022AypiPYlPKHL7n0DE7bmEJ/PzYfBNcMWTFxPEgdAGdvwTqGeoLPfvNBPvLP+0UmSqs/V4Tzp1o2rhGpbaIBAJpo4kk8BMaVFGDH6UZUipqNgCUFf3LzJ1iUs4x8hMlzZNoKB28xAu8QKgKd4KUCn3P6XMK1zz2Pi86MvekZYgXD4QhnM3AFaZqekBfNAdDE4xN1FsAhIEBp5aV9vmLjVap4Z4BMWtikxUDCfft40c2f/Ca3f/F+5PSJQdxr2GNiAk7ZkvCSi0/nJc9s+ZaFFh6bD1CRxhcWVARxi6KXgwMdtVaBEhJWjSlUM5d5nnPw4MHX9Xq9sguojxgUs9bS7/fJ85z5+XlOO+207bOzs9c558a2aVVRVCXXldZAw7pp4ilx79YE3NbOcE9MdGi32++I43gVoFWt6apwrNO+q7UdimhNnuf0ej1Go9F99SUfvmcFcJA1tf9qPykKQzQxjTcON8ogitFaEscRssgQy46Tu2y/6HTe8JxnbmDDLAyKIZnaxB1f2cXf3PIVvn6/Fxmg21PEicJLKFyOcW5d3ZCfBHitRA6FEGMA4VgA+NaCwTWlf6Io2i6EmBFCzFSFv3NuhzHmjooB0sRRvPYekkhgiwylNSrqYFxoynib0xYgM7j87MnfOv+kedJiEYo+kRJIHWFcOEWVihj2+wFwiVL6JuJbjwz58/d8/cEBAGFcFG+D9WC462mo/000AEATTTypxX9V8hervNQ1YULLAH0J7/psX3z2e/uRrWl03IbMgopBKJDlWIAH4zU2t0zFGZedtYlrLz+X+TgQDISSxDjawlE4+xCsLwTYRBNHvoRXJxHrgwArdl7aG3TpcYxwFBiMUvgM8C16WvC5HyHe/alv8Kmv/IjCTkA6jfWOJLZc8YxTeM2LLuHibcq3gMhZOrEEm4M1CB2FG0snFKaAYAC4apVX4wmCIPxnrWdhYeGd+/fvf9AYM+5cridIufZzFQtgeXmZTqfD6aefztatW2+OomhVUl2nxlaFQmMT2MRTCQCo1mhV2MdxzNzcnO92u0RRtMr2r140rldEVj9LKVXZ/m3KsqwU2yudAcbq/uF+XCvn4gTliI8KB1iSIATk/WUSnzHh4TgBZ83wlVdefSJbT0oYSkM/meMDn9/Fm9/7bT77/VwccCBkhLdDnA1FUIGDOPwOL+T4OpStdmjRVr/W/t0VKFi3EH2qR/19jKKIOI7HtP9yv9oupdzmvV8oiuKWPM8Xmr3rcTo/nQ0OTzoisx6ERCgFw2USA+dswv/c9tM4bXMXXfSQLgMcVggKL8gsZKYg0YJWmtIfOpajOd768a9xz35OLM0yA/COw6KxRATXHENjA9hEAwA00cSTcvKuJBnCh4L/EFxWxywZGGj4o7fejulsJPMxudW43IFOS3X1gsLkRCpGSbCjg3RZ4gXnn8xzzml74UErRyqhpWHY6yHSVvMeNHE02UvooteFJFmfCcCalFpU61wpnHdQGLx1xK0pjIZ//qEXf/qPn+ez39pNEW8ip0VRFCS64NxT57nuqmdx9jTf6QA6WyaRBQqDHw1ASUQUg/G4RzkihF/5vNYSYxwLCwsn9vv9cUL8WBTWOihQFAULCwv0ej0mJibYunUr8/PzvgIB6t3BetesYQA08ZS4jWtrMtC4gwL+xMTEv5mYmCBN00OK2ToIVrekq9PUlVIYYxgMBg8Oh8M9znmUWhHRrL5nPXs9X+0YSuF6yyAlrTQ5U5pRGJOzOZGDU6dY/vWffyYnbJpkYHL6yQw33/kt/vIfv/npr+5CWDroaBqA4SjHuyA2iCcwhvzRpZB1jZCK8VMp5h9r4I/Welz8a62vklJuqxgAQogZ59yOoigW6sJ/TRxdFEWB1hIhNSbPEFrSjh2xgRMneO21zz+Vc7fOovJlcBmRVuQ2rDOLRwqNKQKDxgjFftfmY1/7AR/8Si6GMnT7hTfo8sxFKBCaSv+/4XA0cSxHo2LRxLGcepVWLL4UQQob9nhEC7ClR5GTngML3LihM7zhwvPOwRUjlAA51vL3eO+IdIzSCmf6eCzTrQlaaYdvfP8htX+ZT7UEWOcYekmUtsCuZh789JNOf/SvYRNP1uotPbvdmneh1AQoVa0r2r1nteawFwonQ8deCI/wBrIRChgJ2LXEjQsL+26Ynpply9w8nW6bpWKAUJbjJ7skfjS/44dL31vMuSeRoDRkuQlUGCVBSpS3Y5UC4YM7Qeg5arwQOGeI4yBsVhQFSZL8h06nE68dA1j778o6lmParzGGNE1ptVpkWcbS0tLbR6PRwmMV/g2NtoknN1YAqsBo8SglmJiYuHRmZuYf2+32qhnvas3W58brtP+KPVCBAouLiywtLb1kOBw+BH7NLHt16omVe5TSpRaFFxIRRWFW2TtMf3F/yxsmJMQGTurw+n91zckvvfQZJzO5YYJdQ3j/Z77L3334wOvuO8j/STzByIETDuMypIA0iUEIrC2V9b1YvXdVpiaHAIbrnzQeaq9d0A5ptVoopSiK4rD3tz9E9f/Hu45296jev6r4j+N4XPyXDxkBI+fct4uieHue52Ogo9EweTzOUE8UJVgkzhg6sUKOhmzS8PLL5u6+9rnnMh/nyMEBElU6VThPlKTYIidJI6zzDEaGLJriW3s8v/+Wr77moYJvD0rh56r4d4AXcbnuDZJmCKCJYzuaHaiJYz3/GvsbV8WRBXLAlCMCMg3iRyKFv/qH7112z4NLqNYcKuliXfBR1nGM9gVkfTAjJJZEeFK7xGXnncCLL978n7oEvGFgIdIaWwxpKGBN/OQRaP2VdzcwdgWoZnjXugPY8mtW6OBzjIasIJKGduTAeYwHm7ZZlvDJ72biL9/3Rf75O3vp5SlxHDOZOuaiJa5+9jZe9OyZd8wBwoLKDIk0JLGGbIRY1WEvM+Yx62ZF2R9A6+AHvrS0NNvr9cb05Xrxvp5gV/X93nt6vR5LS0ukacqWLVvYtGnT/XEcjx9XHyOgLByaaOJJPX7KQm6Fsi9ot9tMTk5+odvtrisYupb6vx7AZa0da2sMBoMvVsBABSQ453F4XKl+Xp2Fa2fyhQe0AAo0jskItINpAb94zbY3vurqZ5GqjOWsxW3/9AP+7D37xI5l3unaigU7YsCQ3OcgBVLpMDdtAOfR4ujvv/prUBXR5ez8McHwqRf/SZJcXxX/3vsF7/1CrfN/SyVe2gCXjycCoDDOYguDVhJZ9IksnHci/uVXPIMtbUHseqRRYJXk1iCVIlJBXweTYa0lak+y5Nq87WNf5vsDbhkAvuz0U+aUK7P/Zpx6NtFEAwA00cSTVEBVBbhHMp6qExJkBCKBSOOyAQjoZbA754v//W0fZuf+ZTAeEcUYF2xdpPTgemD6iNwjhAZGzLYMr7z0LK6+IPI6CcJrcSSgyJ6U7n8TPyO5C4EBsBYEqHp5VihsadlVWfU5Vj52KJwNCsXCOLSEOAEdgbOKnCn2k3DnjpH461u/wEc/+w36e5ZIhgNiscjmec9Lr3wWV18662cJdLDJWJJIDz7Y/YEMRf+Y6itxY+0LMaYphy6oYDAYFAsLC58ejUarkvy1xX+9MKoEsZxzLC0tMRwOmZqa4qSTTmJ+fv7+NE0fVWStiSaebACg/m8cx0xOTt7Z7XaJ43jVul9L81+7nitQSwhBnucsLS3R7/ffWRTFukWj934MEgagcOVUHJ+NzoAxRBRMxRA72Bhz5sueN+evvfrZRHKB1kTEX731Y7z1ll1iCegJGCiPkwUisQht8DIltzGjwuOdIFISWXZBx/uDX7tXHBkAUAn+dbvdmU6nc71zbkee58fE/V2b+V9V/K/KUgIAsKMoilWMjyYehzNUCKzxeBxaOkQOp2/kIy+57CzOOm6KxPaIXUGcRmNQXWuNz4fEwuLzAXhLJlt8/Mvf4dav9UXRSvBCk5YjnqHk10AEvgBfjPPNBgRoogEAmmjiSQUB1lvOMlRYJiC+WJAaFg188h7EP3762xwQM6DaFFkOJgctIfEQg9AKlEZpKIb72H7KDK++8nxmEq6fjEAUI5QLvyd0XdwqMGDFWz10akOhFxTcRQ20aKIJCGJe1b9inbSibhO4og8gwXmSNEUpGI3AGLA2dMyl0hBPYtM2n/pOLt77qe/w9fv28MiePqI1CTjOO6HLdVeey7NOxncAlTnyQR8JxGkbK8Aoh5cWJzzSO1RF5/WSOA42Y5SJVVFYlpeXnz8cZqtE+tYr/quCp6LECiEYDAYsLy8TRRGbN29mfn5+W7vdfmPVZa0S57ryehNNPFWAgDiO6XQ6V6ZpOl7rVcFXreH649cKB1aPK4qCfr//n8b3Rg00lFKiSjtOQbAH9QLwGlwMPiYQlx3OjcBlwbJcgDVwxTPje3/jl17EdBtMZ5a/+IdP85HPDbu7DYzoQNzBFg7ZDtqBxjqs97iSXpAkCVop8pFbV3/gxy7gSgCg0+ncnqbpG40xC8cSABBF0VV12n8FANRn/ytnA2DVOnja3zfj/Kla3yUYPhaJXE9QcsX5QgiPVoKWErR8wSRwyRlzL73q4rNouyU60hBhw9iKc0SJRkjHsN9DaY2PJqA1z/d39fjrd3/31CEwHFlUkjIaDldG7gTlE3IrVb/QTQnVxDEdDYeyiZ8xDKs6OUIXU0iPN5ZIh2ZIrCF38OV7l2884aTjbzhrU5e26AMGtIWiD+2UkVUYofEIIuEQ+UE2bZzCCfOK+76zdGNhPY4YkcTkeUakQAuBsRbnJd6rIDBYTm9HvkD76tn6kuatVnycf4LEafz3HuUR/OReR5sIrQx/iFISIrw0j9fPfyJDhHldEWb+q5lUUevrBS6Aq834rnh/izIxsc6CN+O/3ZcFhsNibYb1OTjPIwe48cFH9t8wMT/LzMZTkB4msr2cNCuZnCzYu6d3w65FbiwAi6LwCsjxcXiNFaC9BwvOaSLdojA5QkmEVHg81oLDo3XyH1qddpykLawLCuU60gjEuOCP4xjn7Pi9klKglMRag5SCqalJkiSm3+89Z2lp8UbvHUpJvHd475BS0GhYNPFEhjEGpdR4Tr3OPHHOles1jKe0223m5ub85OQkWmvqVm/1713lBCAkUmlkDRwzxrC0uLBj4cD+X3A23Neq3B+kL5k3SBAWqUrveECS4FyC8BqBx4oc2VZ44Wi1wPRh+zb8v/+VF3HeZo/xlt99++d452cXtz40ZD+RZGTDvZUmCUXfoIREokrHD4+UYG2GcxYpKbv95f5bu8ancwloOO8x1oz3AakU1lmcc0RRxHHHHeeTJDnukUceaY9GI9rtNlmWHbZTfpQSAIfVE6m/Z3XmRhzHpGlKkiTXx3F8vZTyOOfcDu/9TqXUdiHEjPd+Z57n/zPP889V3f+K4VExn57OTACPxIoAAIQzr3K6qc44RZiYKE87IRDShXUnbNCqwSGtpQPIwnH1M6f9r197BRv1AjNqCKMhQumAZCmQ2pJlfRIpEPEki2qe/XKe3/uLj/G9g/wfBshw4UcriXe2XM0rbNPw5NSa/KmJJo796qmJJn4WThbwLlw2CKxFMmzYhQUr4QDwtx/6PHvzFrnoQBSX7VeHH/SIkgihAi1ZpgolR3TUgKueeTJXb+/4jod2FDo1CIUQCuctkRTEkQpjCFVCUYO4x9ZHza3XBCud/ZUlsjIOINawSlaS3urz5SU8Hr06FxEOhAHtg25AApmGrz+MePtt3+JDX7iXgyZFtlLMaB/PPG2On3/BJNsmuLMLTCaleFgkwz2hwJbSx0JoFB5bZKuPER86W87CcDj8jcWDy+H+KZPcaga2Kgqqjli9SHLOjeefR6MRExMTbN68mbm5uW8IIciybJxIN0raTTzhCdI6jJN6pz4Uc4HJ0ul0fqfdbo9tMB+ty1v/vNa6nOl3Y5ChtMU8tShMsPmrsYPWJm1+zEOWKBWFcwiJlxFaJ7iRIVVgluDCU/G//Avb2bxpgkwk/M+3fpAPf3H3lfcv8dBAgE9ShPBhJMlIpNcIX3U5q/3G/Fivn7V2fJ9XQEr1egKkacr8/PztQggWFxd/u3p9sizWBMT0AAEAAElEQVT7qToBPFrxv/b9r2sVxHF8nVJqe/n1HXXqv/d+oaT+37FWv2Tt+MfT+vwTK3lRtb7DiJkOTLdSJFYJCd7ijKUwFuuD9oVSgk6iUIXhnHm+cc2l53D6fEpHDCAfQKwphiMK64NTgAs2Fmpyhr29gkG8gXd+9Et860GEKVe3AHQUEYSj5LjmVw3c3EQDADTRxLETWlfFRynh4kGW0wHf/MFAvPkfP0UxcyqLAwdRAq0JAvZcEItAr8R6nEpBCs45aQMvf875nHO88NoMcLYArYMYTQHeebQ3CDdCuhHCGSShCDMCjAxCbk008fhkroGWXwcKhA81QZhQ0XjrGFmBj2EAfONBxPtv/ybv+/RXue+goJfOMTvd4bkXnMS/umbTlefO433Wp4VDmxxZhMzIeBiQUEQJQgkEBUI6vLer7My89/QHy+/ct3/Pi4bD4bhgr3e9KgBgrfiZcw5jDKPRiH6/T7vd5rjjjuPEE0+8YGJi4tKq5m9maJv4aURVsNYLt7VFohDQarWYnJx8Q6fTGa/1+to+1P2i1AXA460Zr+lK+K/XG+BcTRSU6qpK8dDzl7IsTLzGOYNTA6wYYACPZlJDqw8XzvC+33jF6VzzvHMQ7YT/8Ge38nd3WvHAAT4DEMcRRVGM2QyVHd/jUuSt0TeoimmtNZOTkzfNzc1dZYxhYWHhTVXRbYz5qQAAawUY1z7ntY/VWpMkCUmSvD5Jktdrra+qAwBCiJnqY2PMHVm2ehSqvo6e9nuYcOVI2cr5ZdEYqTFSYYQCKRDSo31OhEF6TyChpVjZJncRRW7Z0uWVL3/OWRdcfuYG2naBFBsSPRSi1UHoCIvAFIL27HEcODAgnT2Oz3z9Pt7/iR++9CBBODonsHKMMdRHD2S9YKoaTE000QAATTTx1A/rgrMZQGEgigQF8JaPPSJu//qDiMlNVXWOiNPQVc0HxJGkyIahyFdQ9Pdy4anz/IsXPIO5hG0pFq106AQRsjPhHMpbYpejfbAJDHQ3jSmF3IBDCrcmmvix8ifcuGsSPmbVx2O1fhXhvCDzmnhSkAm4+2HEOz/6wG+9+1N384OD0LfQbSuuvuJsXn7FZk6MOL/jhrSMJzKl97cKE8eZtzjlENodYnFWdUWNMfR6vTv27dtHnudjb+/1nADWAwGKomA4HDIajeh2u2zdupXjjz/+C91ue/yYBgRo4qcVdSp4td4rQKvVajE1NfVAt9sliqJHnfFe73MVCCaEoCgKer0evV7vncaE8YJQb5T/jgllsrT6kwgLkZQ4Z8jsCKstpBKUITYDWgM4f45v/PvXnX7tCy8+jz37e7zhf/497/1sTzyYg48FrVaEc44sK8ZFbsVKeDwAlLWuH1VxPzExcd3k5OT13nsGg8FrKpr8T3UPfRQAoPp89T5LKce0/zRNX6+1vqqa8a/P/FcigMaYO/I8H3f/14pANhGAauUN0gcgwImwti0KI2Kc0HihwFmkN0QeEinQMgKVgEqCHo2B7WdMvv8lzz6DeT3AHtwZXGmEIPcelcToSIJ1SJGSDQR5PMsjg4i//9BXeGjIbRnQB5yKCGJ/EpJ4zXm7+t8AAjT5WxMNANBEE0/JMMYhRLlNK4HWoVDPCk8OLAC//5aPfWGv6bLkUnqZxRsTrJPMCFSYTXbeEkcSnx9krl3w4mdv47nnTdw/FYE0A4Q1KAlagRSeCIiFJfIG5R0ejSXCiAgrVFBsFs3h0cTjAQSsLfzXJCmtNkRtskKwWCiyCJaBHy3zx+/71MJlt3zym9x3ICNPIpJogasu3syvv/jEu89MeP1kOUmA18i4DcoDGYWwmHLeIEguePAeWYoyCQ/eOvbs2SOWlpbGFGehJA4f5j6VXNURWztfnec5i4uLGGOYnZ3l5JNPZsuWLT6KIoyxTSLdxE+l8F9L2a6K46ownJiY+MPp6emtQdNiBQhbr4Be64jhvR+DBr1ej4MHly7KcwNCIFVUGxFa8y8S4TXWSiQRKAPSgo4hionsgAnjOSPhd3/1RfMXXHXFOSz0h/y7///7+MDnEPsF2LakcB5jDEURZvpbrRZKKYoiw5icVbPPR/k6Whtm/rXWdLvd6+fm5m6O45j9+/ffsry8fEsd0FNKreqcPyn7agkACCGIoohWq7W91WrdFEXRdZW4n3NuxziZLkUArbV35Xl+S57n677nDQhQnVEOPWYAlAARCid1QJylAOlx3uBtKFaUkAhRzqMVnsTknDHHTS+48EROnjGk5gCdVtALKIxDKBhlPfAFWoBWLXYvWOTc6bz5/Xfy1YcRfaAvIENCOgFpG1CQm0PP03E0uVsTx340IoBN/AyUP6tSjUO+miQR1jqcAy2DSlpFkfaR5sBB9zfF8KEbtp9/FrPdCDcaIIUMYkbWIyPNKOsRJZo4kjhj6CZtdJzy7R8+/L/tX/R/UFiHUgKhFHiBd35MF/OAEwonVLjlRBB1k97yk06VPX4igE+19+/HTi2f4J//VI7Q4a8ElERZWEMQFgwOFQLG+gAe6xzGOYSEOIY846EfPZD9gZF7/+OGzdNMtgUbpztsnJhEM7rqwYcHP1q2fH1kHV4leDx4i4oA4RF+tRBfECJcSXSHoxFKqXPjODq3KnTqFFjv/LoFUpUkG2OQUpIkCWmaYoxheXnZDofDz4THNxh2E08sALDeugy2l4putxPNzs7eOjk5OVa0r3ePV+/V6wMBSinyPGf//v3vP3hw8Y8r4UEvwB9iqSdX7WzKg44URhqcL2/A4YAJCye3eOW/ue64v3jh5RdycGC44Y8/xufvR+z3oNtpmIe2KyBeKMDFWKtjLQU//B3l/Sp8KQD42PtrXTuh6qJ3u93tU1NTH+p2uwwGA3bv3n1elmVUAEpd4+OJnpOvQJj6+1p166v/Ljv/20vK/3OEEC3v/U7n3I7qv6WUx1VCgFmWvSnP84Vq71pvDTTz/0HaT/vAYvMoXOmahFClfpJFCR/GKMtRG5BYK7BOkricWWd43YvO+NDLn30SXbOHxPUhibCZQ8YJQllwI5QE4QR92ybeeAbv+sTX+JuPPCCWgBGEcQMR4a0INjpaBw0cTHm+rsk4KgXeRgCwiQYAaKKJpyYAEDoJrlSMLUcBIhUUlZXGWog7nm99Z3Tj1q3xDWefvJnIZkhTgNLBN0k6sCOUlhClmMKiTMb0RJd+4bsP7zz4o17G14WEzCmMl8GBwJcFEaIEAErFZOFRFIgxA+DHTwYaAKABANboWZfigBUA4EPxLxTkRXhMpIOokgydRGsc7ShiuXDFjl3+fw7cvtdv3jjBdEcxRcYpW+Yw2fDaxYXRuQcybjEmqHkjLFrbAAbYqpgJ78XazpZ3HlOYW5y3v54kyVSSJOPCQFSWBRyqkl5PyCsf9DiOq2LphaPR6C+MMf2mkdbET+VOW9O5jaKINE3ZuHGD7XQ6RFF0iE7AeraXaz+WwlMUOYuLSywsLJw9HAXle6mi8siSOCGCU4gQtd0sAH6RcHglyXwUfG5tRsfChRv4xiuu4N+9+AXPwMg2r3/TbXx2B6KYEIwU2MJC4UjjGCnkmLFQFGbMSqi0DNYFAA4lRD/ma1cV/xMTE6+fmpq6OUkSrLUcOHDgNYPB4Nt1nZDDKfP/NICeSqckTVPiON4ex/H1WuvnlHvXjvKxM+Xcf6ui/hdF8fbRaPQ5Y8whe9laF4inOwigvEeVr7uTYTzSS1UqJQdnG4lFuCB0K2SE9QLnPC0h2ZTkPP/01L/2587njI0ekR1AS/C5wxCjYw2uj04kFDmQcrCY4jt7PL/zF58Suz3kAozQoCKI01L4D7BFoNU5ewgAEIwJZM0asIkmjs1o2idN/MwnbqGbIUmSCICisFjry89H9AeeoYK/uPmeN9zzwDJDNQXxJFjCHJjJiDoxuJzecISINVoOmYmGvPzSM7hgC2+ZAlJK32Q0RB2IWuOjI5wVFZ3Sjr1um2jiaKAPJyhnJ4NgmC//W5brTckySdGEcYC8wCNRUUzu4GBeEKWanT0W/uGTXrzvs9/nBwdz1IRm0xy89mXP5MqzJ647QcGEHxGZ0n7JgcvBebsqca5TfZ1zJEnCcDhk//79J/Z6vXDolCyAtRTpteMA1deHwyGLi4vkeU6n02F+fp6pqandURQ1i6CJn1rhX1+TWmvSNH399PT02PKvft48mkbFekXfcDhkaWnp10ajUSg+9crcvFu3RnQlyOcwwpMVBRhLKhxzAjZruOQcLrju1S9mmRa/8ycf4a4HEEtI+iOPRID1dLsT5HleCp6tLtS11mRZ9ri8flLKSjxvW7fbfWO73Qag1+stLC0t3aK1Rik1fh7AT9Uiby1oWS/Q0zRdJfZnrb2rAgAqu79K+K+a/a9sTusOAhWzYa045NP+/ir/36LxFZvLO6TL0H4ENgvnnEqxMsF5QYJhVo84MbV3vuYFF3LarGS0sJMkkZCm5A7idhuTjUIhj8NlBT6ewrQ38V9vei+7HeRKU1QsFushGwEW3U4D+CAFldxmZbDjVpVOsmTBNNHEMQrCNS9BEz8LR8jqj1c6FVXC5pzHWLf25CfyFjy4CA4u86kDe35ww5WXX0xLCZS3UPQh1eRLB1GTU1iZUhhL7HN0EjETx0xPdXngkd03PLjAjUM8XsT4OKWwFlWaswvECvWfIHqz+vn++EnpShn42I99rOupUcYezfXjro/DJ38/TtL45L6GomSVrHQGpXfjPzkoJge6v7Q+sFKkQHgL1qKExHtBZiBtx/Qzy/0/5Eapl2449ZTNTHYkk2rE6SduYjga3PDgQ6Mbe97hUUTSo8vfUxQWcGitxqObQoD34XPOWUxhMIV5t470b7bbbaIoqI6PV3/p/azKzhtlsuxLn3DvPcPhEKUUFd261+vNDwbD2+rq4hXAcDgrtiaaOJKo1pGUclWHenJy8rotW7bcFMerRf/WzvevN+u9Yh/oGY2GLOzb/5b9Cws3WmtRKtjueS9C599apFLhvvYOrSTeGZwLBbJVGmssCsesMkzk8IrL8b/+y1fz0IEB/+EP77z76zvZvN8A0tMWEnKPEWDLc0kgS7aBQIiwrzpnUUqWIz2MGT4gy7GbcOfWwbyq6K2/HtVrNzs7e9Pc3NzbKoHBLMtYXFw8Psuy0VrmT10w72ij2gPWCjNWv7P+nOvPt9VqzUxMTLxNSnlc+S2jquhXSp0LjCoNAKXUdu/9ztFo9H8Mh8Od9Z+93hncRFVC+3BGjUX/ZJkjFSQ+D8WJA50mZEZgvCRRDm0t2zr+D1/zvDP+lxc/YwsTboF2KzRXTO6IorS0DvQICorCoKe2smvQ4h0fu4cPfn2/WAKIW1hranmEL8GCAeDxtjikQHJV8T++B440D2miiQYAaKKJJxgAOLLCuFr8lbdrqXPGQw9z42R3dMMVz3wG2cIeohgY9lHzc5jCM7Qw0e0gsNBbRmlBS8X4JOWHjxw46cCID4h2FzPKQMcIbwPVX/hQeAmHwI5R5ScaAGhC/ISv6+Ef++Qnc2Kla1LRg4VHVEWHCElWRRcOOgGukhUDBEnSYWgcWSGQCYys55Hd5t023/ObW4/byIZ2zFQnZtPmDRw4+NAN9+/0N2rlkR6yHLRWxEkynmM2xgEeVXb18jwfU/eLotjvvL8wTdOz4jgORbsxxHFMFEVjhfCq2Kon5NVrXnmJl4n7JUvLvRuDiFmxqvCvRAebaOJooupE1+f7u90us7Oz35qYmGC9LWBtoVl1uOsAlfeeoig4sHfvp5eXl181ynM8Eil1KKirbnySBHs/Y5EizEFL4VHSI1WYm/YuZ3PbkwzhynPx1//Ky3nkQI///Oefze89yPH7MokVHi0hcqEwLUptGrlqrCCcJ4+9r4lHBVDroEf1+Xa7Tbfbvb7b7d5Qv6cHg8EtvV7v7Y+H08CRArbrCTrWgYZK7K+0+ft3URS9AhgJIVrl11ve+4X6VYEBxpgPZ1n24Tqboin2D3d8eaQPNpdG6nLExaJ9Qex8UPhXkBmL1y10pImKHvMCXnjOxMde9uxTOG1WoN1BbDFCSFAqBucQ1pQCUDGyNcuDyzE/6LX4j2/+vFgGhI4YFnk5NleNz7nxx6rkborHLP5pAIAmjnEQrokmfmaXtjxsaagI7OhYC6yFvAv/8933i9u/cB/x5HFgI9AtcBFWxkx3Wywd2A3GQbsFrs+WOcnPXXw6V5y/4demNcjsYDgurMGLUHKJ0vJPedfcdE/FXOQnKP6fCgmeWJN8eGTJCqgBXR5Uqbasy6tyFc8Kg4oSLJAbCbHg4QXue++d5tS3fvBbPFJMs3O5z9mnt/iN117Iqy/HzwnwBbT1LEUO3hR4E1SW41iilMBZO+7iV69ZURQcOHDwVTt37mZpqYdS0bi7X6dQW2vHxVZVMFSPGY1GjEYj0jTlhBNOYMOGDT6O43FyXxVX1UxxE00cbeFYL1zjOGZ2dtZPT08TRdGj7gV1gb9qTVfrUwjBaDRiYWGB/fsXnj8cZuDlKpu4cRfZFLjCoJVAawm+wFuLsB5TFDhr0R7ow6Vn4f/t//5ydi31+a3//E+bvntAJgeGgHKoCKQCKySeiEhINP7Rx9CEW309xutT77DX78MoipiYmLh9ZmbmplarNX58nuf0+/3XVCr5T2gWUOv8r9eRr7/e5VjHTKvVemMcx9dX1P61NH/n3I5y9n9GSrnNWntXKfy3aqypUfo/3M0lsVJiRTUmGeyTK1cASWku4zxCWIRZJrFw7lb8C555AuedNInLDyK0QMVR+A7vEL4IB5RWDEaSZbWBfdEJ/H//5IN3LQAFkswUdLUfN4GqqzQBPKQt49Yt85v3t4kGAGiiiWPz/Cn/TbWgyDwIGHrNPgP/9c2fufeBRUehprCqg5MtBqOMwfIBJjspxFEpLFOAH7JxAl58+Tmcczw+Np4Nk2qjtNm4G+vXFGWOFV/nJp7cwv+xVLrryVx9Pv0pkdyJoKBcBwEqizAn5CH5iWTFLrBK/HNboHUMUuKcR8ZtVAo7l9nx3k+NxO/+xW2Yia0sDJc4fpPg16+7gMvOxM8BzoxIpcIYS16Ejns7SYEwFlCJieV5TlEUaK0xxrB7926xa9cuBoMBSZJgjGE0Go3nj6vuaNX9ryjGFXV4MBhgrSVJEo4//njm5uZ8ZRtWFWxrBcyaaOInCa31+H4vC9rXT01NkabpY86O17+/YqhUBWmWZRw4cODBPXv2iPq8eAUWjM+I0gpTUDrM4MZ2aEkEiYCONkwqeNllXf9/v/7X+PZ3H+L/83uf2rq7YM+eYQJaoyJQCgoPfW8olCBSMYmIjlqHZu3IQ/U3t9ttJicn39hqta5K03RVsT0ajd40HA5/KgBqXc2/YgitB7RorYnjmCRJXl/Z/HnvF2p/58yav3umekxRFLfkeb4KxKzevyYeI/8SFSAloSz+pXfj88wSZGvSWBHbAXFmOG2em3/uolN45ukbaMkezvYhkgiVUhiCCFMUBSwgNxg9xZKf4aZ//DR37+GigYAekESSwvhxm2htu0jWcsSV4n+NF4Bv3t8mju1oWiRN/AyU8fXr0TQB1rvC3HHhQGhwWoERxKljeZE/s4OdNzz/eVew98B+dByRxgKfLRFNdMiWhygZI5QEU4CQzM1toCgyfrhj4Uu9Xv4NLywIgRvfZoKKSOYkpYDMj4/BNSMAP9ardZSv7/qdnKdG95+S0u/W/JWi9AwX44/G04orwvs4FJFKsK6sKjT4fIgzILzAAd/bxY279u284fzztqLEMtMdxdmnncS99+69Yc/S6EZUWMulu2YQALSupGMGuqQxFggFlCcwAay1N1prb2iXxUHVTV1rnVbv6NdFBquiqd3uYK1lMBh8eDgc7qzsy6SUQWOgoeE2cZQFZKXoPjExsW3Dhg0fmpycrNnUrV/41z9XAVlRFJFlGXv37n1w//79Jw6HIyIVIYQsrcVEOV8vxwLjWskgRuYNtnBoII1ASxAWROH5Fy/Y6v/t9T/Ppz/7Bd705/eI/Y6lnhZYCmI8kZVYqzDW4TU4bUkKhbSiFBCtq/uXIwCHIANrVf9L7RGxAlZU92Sr1WJycvL+ycnJV1TWn5W1oDGGgwcPPnc0Go3ZP080wPtYgK5SijiOabVa29M0vaGk/QOMSgCgGgEYlT+nVRb/rQB0Fm/PsuzteZ6v0hOovx5NPFrmJsfCtQqHpEARrJGdCBdCkCpPnHlO6HD+yy/d8Kcvv+xMTplVMFogioNeTJF7nJcoKRFKg/MMbYztnsgn79nFH73rq2IRsCqCKMIVYb7f8tgKQ7a21lfnXLYEKpr8q4lj+HxrXoImns4HkCfGIlFxC4ogCDgagtNw86cWxfs/fQ9zJ5zNaJQTS09rehq7bx/O5IhOB2SEF5JEGiZVj5dcfAovvSi9NfHQBpQ3499lhcShw6FXV719Iv/G2uzjelcTHJK0r/3cWgGpp044lDcIDKICloQcX2M2AHr837b8mhVh/QnpcDYnEoLIe3wRUp2oPc1QTDASHT7w+UXxn//sTh5ciGh1pjlxywS/8UuXcd4GMmssReHDnL+U5EUoiuI4Is9D5zOKNFEUjYuASgBw58OPiB/96EcURUGapuMOfwUI1JXX187uVqwBpRTT09Ns2LDhK+12e9Xjmw5cE0d9h5VrKI5jpqen75+cnKRynzgS5lBRFCilqNnesWfPnhMHgxFKBZDOluvcWh9cyMZ7jsf7MPvvbehWpnFwph2NAAevuGLW/79/5Vpuef+H+a9/9W0xVJDRJs89OpJ4G36u8QRb24iA1gEOe9Qp4FoBwDRN6XQ6N7fb7W1pmq5iUBhj6Pf7vz0ajR4VWH28owIL1z7fCtxJ05RWq3Vdq9W6KUmS66WU28rHLZTv58zaj6vOv7X2rtFo9KaiKFYV/825+mPcX0KUbZucyNlSFFBSiJRctDBEFCPPfAzPOye++8XbT+G0jTHSDfDkQI7Jh0iVkLanKYjIRgaiNsn0Jr77wAK//8e3CxmBF8EGF+9wqtR9ehQQwNaLf1HN/ddGFdaBBZpoogEAmmjiGFr+lgihuoyGDmQC3qAkHDRwAPgvb/7ilT/cP6SdxgwP7IVSibw1PY3v97Fe4ZMOSIsc7efUGc3LLj+Ly0/FT6qgxA5ghcIS4YQOIEA5hd2MATx1iv/1Qim1ikZ6JN/zU3vO5aU8q0AAX/b8rVBYoXFCY8srrL3qYxiZIULmxM6gcxv0MFotcuUZOMPAS1Apn7ob8aa//Bqfvms/VijOO2HAv37VSfHJG/hdKSHLcpSSpQOAKLtgrLK9qgqFqiua5zm7d+8We3ftZvngIlhHrDQKgXBBaBAbxhykB+H8qs8XRTEeI9i4cSPz8/O+KrQaEcAmHo/w3pOmKdPT07dPTk5SiVdWBeThNACqx5Wdf/bu3SuyrBgzByqVeiHU+PeFAjJ8PowIWISHWIfa3TmY6cCLrjjB/8d/+xo+/sF38A+3PtItUuh5Re4GTEcJDB1WQh55iIFIo22HpEgwwmKlxYnHByRTStFqtZiYmLi52+1eF8fxqiJfSkme5zuWl5ffVN2bFWX+p7W3V8V/BTC2Wi3a7fZNpc3f9qrQX6/Yr3+uKv7zPH/zetT/6m9u9p/DFf8rJYjyK6J7DomRKU62sChaCp55mvIvufgMztyUEOUH8HaIlODtAHyOSlKIWgyNolBdBqT8cPcSf/Lmj1IAwyL8Kj09AbjwO4QK9oNoLBKLLE2aKccSNKAYe+tSMe5WNAOaaKIBAJpo4tit/CisRUQKbBb8zS1YARnw4JDP/Ic3vIM9o5TW3FayQsDEFCwfREiLERaZJGA9WgpkscizTp3nl192IXOa61sONCMkFi9DQmZXjZLJ+vmyOvkUKzPdfhVYsKJY28QTvEHW5kafynZO1Wz/Wk2A8Voqdf8Z6wOUxUmZxViTI4VEqoj+IGfYHxC32yRpi4EVoDVf/C7iv/zFPe/4xD/fT2vDRi659Hyuveq8/3TSJNu1A+EKIgnWeLzxaKXROsUUEmNAqQQlJCbP8NaQtjR5nvPQzkfEg488TOEsaaeNxVN1CeuJdSUOWOkBGGMY9gcIIZienmZubm7MJKgE25po4miLx3a7fd3U1NRVrVZrXLSvx6Bab0+omCxLS0vs2bNH9PtDtJbEcRRGY4RDKlCqtL5zFTsryKBJrYiiKNynFsghBS49/1T/737j1/mHf/wQN3/wQHfXkP6BkaRnLUmUkucZiRIIrSkrJXAeCoctLMYZnPL4RwMAKn9zf3iv82q8odVqvb7b7V7XarXGBX6lil8CAG8eDodIKUmS5KfC0KnP/9c/F0URaZq+Po7j65VS251zC8aYu6y1d9VV/usMgDoQYK29qyiKu6r9qA4YVR8/HQAAsU4usipneYxrZfJerClKXLCFdZYOIzZP8NrLztnCxWcdx6R0+GGfSMrAYEu7KJ2AyRguH8Q6Rzo9z86h5v3/9C2+tBNxoFrO3mEWDwAO3eqGT4rVpZCvqwHUn5ao1ABqAEazPTZxzN+/TTTxtMa/orCVi8B9ruyOvQeBJMXRAv7l1bP+9de/gk7+EO18L5HKwRYY2ULoDsqm0BuEn9OZ4aHdBR/56oP895t/JA5q2GfAtyJsVgQqZu5Io5TMGnw5cik9K4rLXob5zDHtLBw5QSHXoMrc0ys9fsx6cfgkyz1q8vrTCH8YCsThn5c7zM/3h/k5j53cVjOiQgiyLBvb1FWU1sq+rlKt11qPi4S6hd0TmYDVEy/Ghf56m7xb/XUR1lLIb2QJRkl8OZEpvSRSGp8PSGRBIh3WwIYOJ7zixac/+IsvfyEz0ZC3veNm3ve50UsfWOY2B0QtyaBQFC4CEeEdKC0RGLzLiLVDKk+WWaIkZjDMabdbnHTSSX7Tpk1hvrq0X6t3Cb0PDICVGiWoq+vSuivPc3bu3MkDDzwwLrTqc7hrC7bARmj6OMd2HF0aXu+81/eJqpBrt9ts2rTJb9iwgSiKVmlU1P3r693lan+w1tJqtXjkkUd4+OGHxXA4XLX2pLBoWSmdA2gEUcncqTA6iy+GzE4oXN8SWXjVC07zr/v5f8EHPvwR3vWx+8RAQiYg8HdWdjUnXBgHqu9nXpbj/a4s/uVjvrZCHCpMWBX01Z44OTnJzMyMb7VaY/2N+v7tnKPX67Fv3z4xGAzGr1llsXh054c9ZLa//ruVUhhjsNajlKDVapGm6TVRFF0X6P6ye5j9f7u19i7n3I5K9b8oilsGg8FvByHDo6X7H7s9uEq1XxIm4t2qEccV/Zl137dSpwaniNII09vHZApKQn9AKVKZ0zbw66/a6l99yUkclxqmvUZKh/HLSC2RIsJbB3aAFRIbdTnoJ/jMvcv8X3/2JbEA9JCh6SKr3IqyCyPX7B/uMO+NO6RoaoY9mjjWK6AmmniaJ5B2LLq0sqMHlHqEJBNw8+0HxG1f+D59MUNGO/DXhEBgMMUQvAnqTN7A6CAbpzw/d/FpXHPZpNej0LWxowLdSQFH2mqt6nKOC7IyOVttvVTJuIXbVdY6Ms2M/xMbRVFUHvPb2u329opibq1Faz1O+uvK83Xa6xMOoKzqqJRJ+5qL8bXm6zUVYyeCmJ8tCwZZrsMs72MoMB5yKSgE7Bnw0G1f/NEt/+3Nt7Bvz37+9etezcueM3PrvIKJGEZDhzcFkZLEOkJrvaqoyjKDyS1JoiisQceawhoe2bVz0549ewCI4phsHZuwtQVapSeQZRlJkjA7O8vU1NT74livC/w090YTa+/v6l51zq1yn1BKMT8/77vd7ngN17vJ1RqsQKrq/q9o4VEUsWvXLhYWFt40Go1WgQcV7d+51XVHoEWXj/OONBJEAkZLFmnh4vNm/Wt+/pXc8p53ctvt94m+gL7UGKHHTLKgrh72BuErG1BK0DgU/l4cSfonxwV8KKLtKoDDGEO326Xdbt8Ux/EhLgZVlHodt1Q2eU8Eg2otO6u6KpcFrQPrII7jM7XWV0kpt61V9l8vjDF3VECAEGKmKIpbsix7U8VsaAqItcXwSvG/6nHeIWvnjQimS0EgcjQkTiJ6BSwNoJNCV+YkBl75nEl/ybZZNrYgcRnSWbAO4SUCSWEFhXV4qRBxTK5SfrB3yH/96y9du1QV/yIBoVYk/V3FXDC1s9E9Sm546NfrWgFNNHEsh25egiae3uFX/bMaE3ZoJTHWkQH/5Q8/Jy75y1/yMpqk243xvX2odgsxHII7CJGGVGGFJFawtdXil158BQcHX/Tvu2tBpFrgeiO0EOTWjPnXyptQ+Au3AkQQDilfIur1I3elb+PW0NiaeKKKBKXUjna7/Xop5Tbv/S2Vh3VVLFRFQX3OvSoqjoUQfvUYihNh1lFKiRQa5w2FLV0zPDz4SP6a3Y8cYLTwEf+rr34J//ZX/hWRf5f/q4/uEe0YhgayoodQOc6XK1lr4iihKCCzBleO26hI4oxlcWFxj0ScFcfxvdPT0+u+fvW6vV7IV1TcTqfDli1brjXG/Jv9+/f/2dpObd2urIkmqk50BeBVBX0cx3S73evn5+fHDKA6sLeW6l19vdIMKZ0p2LVr10X9fv+uEkRc3a12AuFCj9QpgZcCVzJygmWnwfc9GzqaYd9w7qnz/lf/13/N/3jzX/HVe/aJgjXjZE9A1Dv+1T1X/c1RFDEzM3MgTdOZOI4fFfDM85zBYPCaSim/fv8+noX/ej/XOY/WgcWVpumlFeV/hdrPnsfMDrxfqMACa+1dWZa9aTQaLTQAQAhbcRPFSkddjBsVK6MB1b/S1yz1vERLyMwIEUucASUVzglSYXjGacK//MoLOG9zyrSyiKEAOQQpA2PGCZQbIVsp/QGYaJY9ozb/7S0f5uGMD4wAiwNhwvhL9fya7b+JJg4B8Jpo4mkWK8ju+o6wruxQSgwwAH7n99/NSG1gKGcZ0IbcIb0N1H+fUWiBjxTWjij6+zj7pCl+/dVXcfEpHT8fCVIDIvc461FxEqQAy4NSudoz8Cud2go9l96VVm6yFBHUP/MigodjODzRDIiK9jsYDMiy7E1RFF03OTl5U6vVGiegdZ/6tc/9Kb/9j2d8JcLL0KURHoTHCY9QAqkVQkmMA1vmUSoK+NUX70Pc9LaPcudnv8YvvPJV/PIrzvE6h9jDzIREiRwpM7zLsS5DKkUUpzgUWQZIVbNJ0/R6vft++MMfbtq9e/e4sK/P/a99X4ej0Zh23O/3McYwNzfH5s2b/7TVaq1aC3VHh7VzwU08PaOaRTfGoJQad/rTNN22ZcuWm5IkWWVFWS88q8K/mvWu7AKjKGI4HPLAAw/8dr/fv6v6fB0oCOsZPDFOJngRBb9x4fAUSAoi72kLyPuGyy441b/smpfzu7/3X3/r8/fsE7TDeWSe4CW83miTEIJWq7Vtdnb2/m63O1Op/df3vLpuR2n7uerzdXHQJ/KsqBf/SZK8vl78H9EOWboCVKJ/WZYtVEDG091itLLxqxxnqkJfeVO607jax2FcIFy1x9icJBKlW4yi225jc8MJs9z/y6+8grM2dZiNLMoUwRxTO5B5OappkZGjv7RENH0cB5nlT99zJ197ENEDSKpUzo5b9srXMrymcdJEAwA00cTTOMZUe0XQA4io8wCEEIzyYJjkBHztAcQf/vUH2GenyKIZ8lHAmYkVVocOTl4MsLYgjTw638szTmzzv117OadNuF2TMvz0dtwC58ez/7KkxJW1V6DHeVDerULSq4N3xUawuYWf6KgS/OFwSJ7nb9ZaX9XpdG6qZl7rM/9l0hjgo2Og+y98KPxXHQp+hfZoTI4xOU6EOX4UYRzABsZAIuGehxD/5a8+c9Ynv/x9fuHq5/IvX7TFJx5GfUesIAnWyzhrGY765NYh4zYqSkNBZMPrVI1UHDy4uGf37t2X7du37xALQCfA4rH4Q9TYi6Igz3OEEExNTbFlyxZfWbbVf069WGji6R1V1x5WxgG63S5zc3P3T05Orlp7dTeL+n1e2VtWwncLCwvs2rXrzXv37n1TVTBX+8Sq3y3ASo2VOliUAdJbtIfIQyKgE8PZp2zwJ564lb9769sue+CA/WOZwqKDLAL7BO//1VhDZacXRRGdTmfb5OTk/RMTE9vWghpr76lydOCu6jWofl71ujwRxX/1fkkp6XQ6UavVuqZe/DvndjjndlSCfof5+7c753aMRqPfHg6Hd1Rr5Ole/K/OReQqHaI6CKC8Laf9fU3yr/KpceBytFQ4C8I5GC6zJYGXPPv4bc85dxPTLKNGy/hiFPQWpANpUDiEtxT9HunUDPtHLT725R/x4S/3xE7AtDWDiqRRNViQY3ZC7ck20UQDADTRRHMryPGpMD4XSquYHE3PwxD40Gd74g//9kP47gnEkxtAaYa5IbcCrRTaC7wX6DQiUQOi4iGuetYWnnvO/CYsdBDY4QhpVtPR1nrRrjwzV4ICbvy8vCiP1UYD4AmNysc7juNKzOqO4XD4G0qp7RMTE19ptVozSZKMu3uPRkV9qq/9VSCAqAYlDVGssN6SFwaLQEhdiYkzMLDswj2xJ+O+P33bJ8T7P/IxXnLVC3jtK8/2EwJ8Bv8Pe38eb9l1lnfi3zXs6Qx3rEEqDZZLNh5ky0N5xDI2RooxRNjglkJM2iQhLTeBxMShP9Kvge6qQBorP9wJDiRIaYaOgQRXICYRGJAA27HANiqPWHhS2RpLNdz5DHtaa/Uf+6xz9z11b9VVDaqSar/+XF/Vvfecs/fae629nud93ucthhBISGKwpcGMjBSFUJUMutYWsCICFIPB4FMPP/yw6PV6ZFm2IeNWv7/jOKYsy1EGKUBKSZqmSCnZs2cP09PTPx3HMbBeJrCVYqOJSy/yPCcIKp8KXwqwe/duNz8/v6F0xHsCTIJd3+feA9x+v89jjz1264kTJ97jwW59PaiXCAmpK88NUXV4kVQJzpDKMyZScPll0649M8VH//Rj4vE1+6mopVlOoV+AEcGIBD5/4c/PlzBMTU3dNjs7+1Cr1TrJj2Oj9N6Os/9lWd5XL4/wc/dcKXAmVT5+vY6iiCRJ7vLgf3Rchycd/U8V1trDeZ7fnabpIZ/5nyzlaAiAjeC/Sli4sQFg/Srb8euq3xYOSmsIEMSlY8rBTa/quh9404uIBk/SFjkBBiEtTjmMsxjjQFSKEp1MMRQJn//WCf7Nb/6VeMJAGiQM83VwL9xoDwWnNExuoomGAGiiiUsyLFBS9Voy/mk2MrRROBGTodFJyCrw23+yKA7e91lW8hArYwo0RelQVhPKCE0EWYmMciJ5gq54lJtvuIZ9V+J2t/R3aDICWz2OTK1P+7hfey27L0aCf+XWFQJNPI2bnNrGtixLRpmgg0EQ7Gu32/e2Wq3bkiTBZ5tP33ngIn4EjMF/9V1ogVKVbMVYKFGgI6SKcDpGBBFOSvrAQgm/9kffEr/zR/fzXftezN//3ue4q+Z5lwJsBi0lCXSlMNA4bJnDyMW7AgzrSgBnLf3egCeeeOJNi4uLDIfDDYC9Xvvrs5O+FMBnZMMw5PLLL//ZmZmZj9X7kteBXRNN+Gx0GIbMzc19eG5ubtxOcrL2vX7f1AGntZalpSWOHj16cGVl5aA3CfWvmwSplZrFgjQVmHEWZSqX/9hALCvlTGpt768PPySOZ+BiWBqWOK0RNkQ6fZJ653yMjZSSOI6Zmpq6ZWpq6q5WqzWW/G9YOmplNXXjwKIoDnpzxcn5ey7X6Dr4T5Lkde12+wNKqX1exj8J+LdDAGRZdmee5wfrZQzPJIXX0xX1csVJ53+DwCAohBp1uFBYITFCUgaSEkfkJDsDuOl64W79jr1822xJODyBHim9RCixoaB0GocGUX3ison5xgnD+/+fj3/8yRJSArABuGBU3rbeaNBhR5bPcmS2SePk10RDADTRxKWL7uT4MQXFiASoau1xckRZS9ABToacGOYMABPAv/h3XxCHDi+zYqdoT+1GiRAzKMFplAxwGMhWQaeQH2Pfi3bzo++6kR1B8c92KtCk1WeNHJs3EACEGLG+yaqAvx0x2bZ5cj1NEQQBZVmSZdmGzX5RFAfLsjwcRdG+OI7fH8fxbUEQjMEsPDP6QEsnx10lhFtXpHjH5nyY4aQjDOMqY2nBOkmJJLeOvoM1a7GBwAbQB/77nz8sfuO3f5dXvOTlfNdrXvRbezrMBoDJLcJUppcKW3XMqAEwrdUG5+4oClhYWPrE4uKiGAwGG+qIPdgoimIDEeCl2FCVbOzcuZPp6ek31U3K6hndJi7t8O0jy7Jkenr6tp07d97ifQE2A7OTxJ73DkjTlMcff/zWJ5988lbnHGEYjteMU4JdV4IrkbZA2orkVaJaO6SO3vbI0bXu0VUoQxgYcFqCUGgdVIzceQ6vkJiZmblrZmbmw1EUjX9XVz15I9R6mYSfx2VZHhopAc6bKsofx8iccFcURbfHcfw+D/TrYF8IMbtdH4A8z+/eysOgUdhtJADq4F+OhqYC/JpShFWLwNqXExKEIJCO2BmubPOF77vhhbz22+Yolh6m1Q1hdM84YSvQLxVWhjgRMaDFqtrJ//UfPsE3lnjzAECG1X5NVF2TlFtX+Vu/r6Nx8W+iiYYAaKK5/f0UGLVGsoJaXZikapQhMUWKsQWlgBxYKSqw869+/QGy+FoWlzJiEaLa07jCVrs4k4J2FOkatEOsWeO1L5jhn//wd7zj8il+Mxg9OK0BEYS40uFUhIo7GOOQQYwRupKtCTvu2y4pJ1q8NbHZZvC0m+9thN/g18H9SK5+uNfrvcqD/SRJ7pqbm3NTU1M31rPQpzvGi5scAKGrzW5elhgcTooxYeWkpFAWE0ImHKmo+pGvAZ/5FuL//g+/f98rn/dcvvfV1yxeNSPeXuSjzKYSFGmPUDqkcEghTvryLdmSJGJ1dY1HHn1ULC0vV5s2ITDWIiZAx2Zt2YqiYOfOnVx99dWu3W5jzHqLtzwvNq0drr9fE8/8tWDSvb8s7fg+8JnjdrvNrl277pqamhpL1z1BpLUez3//Pp5w8q3+Dh8+fO3q6upB37miLMsNiqDNVEESixAlyhUEwhIoidIKKyW93LLQzz86tFVCM3eM+qyPJPTWoHAbWnmeSXhpfp1A01qP/TimpqaYmpq6q9vt3pYkyYZOCX5s8jwnTdPxWHqyRGvN0aNHRZZlGz6j3rnjtGvQaKzrZTuTZoz+7+I4ptvt/nS3230oDMN3WGt7m4F9/zMp5V7vC1AnCZxzS2VZ3pem6R39fn9c/uDvh7oHRFN2txH8j3sBiAr854UjbHUpZUhZgguSagdTmqotozDownJ1h9v+7lv3Xf+G667CrR0hVgZMBno05qbE2BKlQ0qVsOJaLKkd/Mtf/ShfOIJYAUoNyALIwBqUKUe7txHg93s7UTe/baKJhgBoookmxOi5MCYB1rljRDmSa1Z/Y5CkwAOPIO7+3ftJZq/BkEBhEYHCpH1EpwVSE0RtXJpBmTKlB7zy+TP87Tc/94dmQggsTHVCTJZCpBFaUQ4zSDrkaTZy2l0HZP54znbj18SZbZb9d2MMZVkupWl6txBi1tcRJ0ly1+zs7G2dTmfTGtd6hmw7G+DzHVZMkkgbfSmqe27jefi/NgKcK8BV+plyNDcy4EQKjy5x02/9pz/sXbHrSr77jd/+kau68nXCAKYyv4y1hJrDf71G32fzKiBRAfknn3xy9/HjxxFCEMfxhuz/5NckYEiShNnZWddut8YAT2u1oSvAZmRAE8/sqJvNeUf7MNRorSjLctzLfn5+3kVRtKFbhL8XPKD194hXDEgpefLJJ1laWrp7OBwe9n+zXeJROktgLIG14Kr8ZAlkCDKhyYSmFBrrNLgKykgnR8RviR2R1me1ARypaCrFTYTWmizLMMbQbrfpdDr3tlqt24Ig2ND60I/FYDAYj3GdaCnLktXV1YObdU/w47Kd+eUJg7rKYHJNDoKAVqsVtNvtD4RheNvodY9aaw9v4/4YGwJ6YsA5t1QUxcEsy+5rZtBT3EKNuypXdEDQ6tAf5JVpTJjghBxdS4HLB7SAroPvevVz7nrDy55LUA6IhIA4hrLAZUNEqLFFiZaazDgWhhBe9kJ+694v8vG/ceLxDAYCjAJcDi4jFhCMvJyEf2YJKhNBAZXps2ogUBMNAdBEE5c06vffxMYfbYQ8xSgL73+myAnoAb9y8GviTw89xprrQhSBS1HTIWU6oCgUBFMIQnQUgO2za9Zy81uez5teiesADAdIWxJLizMlePmpkBXIQla9osXkw7YhAS4ECVA3uBoOh+9xzi35DFcYhnunp6fvmpmZeci3EPOvuzjrz+0mJACj2mI5Ah2+NeUkceBAi2ofJQApUDpASkEBLJfw+RN0P/LnnyWxGd//pn1/edl08PbSwVQrpCgLhDg5617f8FvnEKO+6qPuALuXl5fHWbnJjFu91V8dfCRJwq5du5ifn3dVdnPdzGszEqAhAJ4983WddKuuq/eKsLZSiczOzrqdO3fi20aO773ROuzvs3pLPGMMq6urHDlyZG5paek9WZZtALjbuXeks0QGQlvhklI4hgL6QjKQktQqrAuQTqONJjBy3BHGyRIrz74XfV2679c2pRRJkjAzM7PY7XZvrGf+/Zh4NdRgMFjyr6nP4SzLDi0tLd26VWZ8u2NUJxUm/977NiRJ8oJ2u31vFEXvk1Je5bP525H5T4L/EXlwKM/zQ8PhsJlAp909bexQtOHaUbWOxTiIImQQYNMhwhREgSAoLVM5vPIq3FvfcC3XXB5hCguqA4SU1uFkDiYlCmOkrUoJmLmMX/+jB/jNex+99pEc+mgIZKX6d1U3gQAz2jVNyv1Hx9p0UGqiiWYGNHGpP8DcKTrBONaNAdmkcExTig6rwM/86//xwr8+krKSAnGMLXKK0uBEiDOj9oJBQGkz8nyJ5+2WvPMtL+Zle3FBAS1AlkOkGUIoscNeZZsOW2Z5XINPnjYQMblp9ZvloijGJld16Xkcx3u73e69cRyP5cOT4PKiqUH3rTDFJAlQIwJGcknpbK1XpUUq7R2WsNZVVZZSI1UEKmZIyJePDcS9n3jgZ1ZWl/muN7zmI9+2ZzbrD/Jqs1bL7E3K+T0Y86Bj1B3g2KOPPrr7+PHjJxEAp5Lyj1qCMT8/z9zc3K9FUTjO7DZmXs/i9b2Wmfb40ZfnSAkzMzO3T01NUTe2m1SSeBLPG9kJIej3+zzyyCNz/X5/yStRvMt9HUyf+tlTbcCUr5d2UAiHla56Ko06A0gr0Ha9h7l/FFlBVRt9NvSfteP1yZMYMzMzt+zcudO12+3ZzVr3+XmXpinW2sP1cx+ZpNLv92/yZQGTc/KpEKCblQB4EicMQ7rd7k8nSXKX1vpNI/D+xdExzSqlrtrmPbIh8+/r/pt1YZvPxxqMcGLUQNZ3tyjKqgesENgiQ7iCRBkimxMbeP40j/xPb7qGF13ZZrD2WHWv6RZZJtBRggx19VxSISsDi4nn+OI3F/jAb3xefCvlcCYSUDGIAMrqsRRLcKYcOSVVZTMbtnTYxgCgiSYaAqCJSzvW+51XO6oawBdUsn8MXhY9KsMf4SQDlBhX4HTIwxlf/Re/8qccLyKOreW4ICJIWoRxF5MbTJFBPkQmGh1YgmyB1+yd55a3vJjr9+BaQJBDTIFyWUU82KrkwI43e+sbPyubljZPF/ivg8xJoGqMYTgcvidN04P+b7zZVZIkN05NTT3U6XRu82qASRntxQH+xzd1dds7efIX6yIZ6X0onIXc+ikCBsrSUlqDwVAqR44l6k7t+vIaP/eHn/q6yFef5JV7d4bznSDIDFgLGIuwrvIc2AS4e+ARBAHW2koJcPzY608sLmwwXKyDvTpx42Xc1lo6nQ6XXXbZP5iZmfmAB0D1soOnAuCauPjDZ67rLfvyvJqfnU6HXbt2vT+O4zERVJeY+5p1n/lXSpFlGcePH+fJJ5+8dXl5ecnfo/X7b7t14A6JlbX1fMNyUI6eOw5Z+ZZX2f+R6mu9S8zZPQO8X4HvmjE9PX3j3NzchzudDt44s16u5NewLMsYDocHwzDcVyc+0jRldXX11uFwuDQ5H8/mGP31qWX993Y6nfcnSfKzQRC8yTnXs9Y+OgHot0sy7BVCzPq6/zRNl4wx56xN4bMd/FdlinK8o/Lyf4cAHYJSkA4gHzCbCBJriXN4Tosf+97XdK/6W/uupat62GyFKAkprMRKDUECSkIQMsjARDt48NEB/+43P84iYHSAkwqsweUZlBVJZi2jJ5SmRGL8s8vv7+zoYSVMcwGbaAiAJpq4FKMCMxU/vKG1ntsIkMTob9SGL0sldC7InGEA/PXjiH/1q39ItON55C5EKwFlgRQOFSfkpsQqSxwJGC6zI7R85yuex02vvpIdAiIqOajLc4I4rBqoj4CZqxMBo6P2pEAT5/Ee2cQQbrIFXZqmZFl2Zx1w+A1kq9Xa2+l07up2u3e1Wq2xMdjF0Ye+Lv33RJisPRp8dwA/P0atAV31XTkLhSMwmlCGBCJAInDCUlKS2xzdDjnWWz1mWx3WdMAff/IhceTJY7zyJdflu7utK1WtpGKSGPEg3IOQoigAvBLgUw8//LDwJl2T/bnrCoI60NFaMz09zezs7Pva7fam5QL17G8Tz765DBDHMfPz8256enrc6aPuF+DvpzoBpbWm3+/z6KOPioWFhYOTrfDqBnXbIfcsklJpclm1RsONXMutRTtH4AxC5CBKrFiv+Xesd+84Fy1hveHhjh077t21a9e9YRie5HpfL4vIsow8zzHGHIrjeEyspGlKr9e7c21t7WDlsaHPCfivZ/3jOKbdbt/S6XQeaLfbt29UeIhZpdT1SqnrR0Z+H9/GPTHrTf/yPL/b+zv4tbyJ0xBYYuRR5OQI+Ivx7wAwRVUioKAdgjYFooTLEm686bXzv3TzG1/G7sQi0hVmujFaC9JsQKBCMAJnHblxpDpGzl/Fr/6Xj/PZbyFEAGlpqv6yFAgHwagazQAZEqs0ZkRG+P2bdtX3imAraUyUm2gIgCaauOQjABdVlsvjzgA1mSYg0SjkBvuYMLEYZ1BRRM/CH3wacfBP/5rSxZjBEPJVJDkujigCjSkHiHKAFgqM4/KW4jv3vZDverVylyd8hyohFBApC67qDz1+4Ho/AK8GaMD/0wIaTpXZq8leDw2Hwzv95rG+MQ2CgHa7fVu3232g1WrtDcPwogGYW91H0m1sEQg1EmBEigksgVOENiCwAQEaJaukjZNghaMgBwGpych0zBHgcw8vi4XHvsnzdrYe7USyRoqcPMZ1EG+MweIQqvIE6Pf7HDly5GeWlpbGxmWTAKye2feAAvCu7y6Kog0S50mCp4lnOEipeW54IJ8kEbOzs4/Mzc2NM/ta64lyAbHh3imKgsXFRY4dO3Zrr9fDt/qrf84k6XRacCskqQhIVYhxCuEkgYGktMSlIcKgXOXRUSpbddwQ1bZN2urrbLdwI5KSubm5D8/MzNyYJMmG0hp/LkqpsSnnSNq/1Ol03u/HzhhDr9c7tLa2dkdZlpuOwWZeH9s9xpHRH91u9652u/3hIAhma6RLb/T+nac6Z6WUe40xh7IsuzPLssP1VoUNAbgdEmCU7Rc1FYCQdQYHZ0raoSSSFlKYk3DDy2bv/dtv3sfe3VO44TJaQKgltlwlFBnaGCgsTkT0rWJVJvz3+7/An36pECkwLBh5DxQoURIB2gkkCoPGCVWlbaQc7+N07atZ2ZtooiEAmmji5CmxSXsYX0fmxtYyVeQ5iBCy3JBrzRLw83d/Wfz1I33KZA7iBGNz0v6gAlTWgXXQisH2iOUqL3/eDLd+92t4/i4+HgPTAeS9YWVUM6rzNKPWNWICiDVx/gmAzTb5/stnuUbZrzuyLLuvXt+f53ndqXpfq9X6cBiGG0yzLsbHgRXe6G99Bmy+A6yM+oqy2FAjrUetmK21qFjhnKU3yDBhh1UjOfzYijhy5EQnaXd/LIgrEG4Fm9b0exWAJwp8xj+OY44ePf5zi4uLPz4YDDZkLevEjb8eSlXO7z47OTc3RxRFe+vg7+IzaWzibKJuWufvj1ar9bqpqamrOp3O2EzSy90nCQCv5BkOhzz22GPixIkTB33LuSzLNpSNbPbZpyYAPAG3DjiFrTpkrK/z60TduuLr3Mj/PbCfnZ19YH5+/pYgCMadNeotDOtzajR/DiqlZqempsYA3VpLv9+/yRvnyZFx52braH1+b+f4tNZEUUSSJHclSTLuSFAUxZIH/qP36xljHnXO9aSUV3lfgNOFMeZQURSHPXnrycKLoUvLRf1sxKJcRVIJZ0dkcX3/5JCxBpdh0j7l0NIC9j0P95ZXP48XXdGFfBkpSqIoJBv0sUVG0oqwpYEwodRdimQX31qD//OXPy2GwACNoaosGLcdBEocVki09sSc2bBHchPfm2iimcNNNNFMgJPr6cW6UYw4CSCty/LDlibPStAtyAy4gjaWF+/g1/7VT77mH7zkCsGOBNygRBCADMmzVcIdIcPlE8SuhQimMWWbP/rUt/il//I1Dh1HDND0hYSorOQGGQjjSLTAYklH0gRhJcqezUbQnhL0ng4InW2W5OyzLPK0wP28w+bRZtc5R7vdZnZ21gVBQJ7n+Gx/HdD67gHD4fBuD2brYGGSdNjqZ08l27i9679J20InNzEaqx2r0xt+XgGU9fmxGbEmnSV0I5ltnFAicKbyDniq94NSgjwv6HTaXHXVVW7Hjh3jzbvP7NfHyMu0/ef0+0OOHDlyx/Hjx++ESq1RJx2aLODFHf4619v21edbWZaEYTguAZmenubKK69009PTY8d7/xpP5vkssJSSKIp4/PHHeeyxx8RwONygJKkbBJ6KNNxy7RtJp62gKqcZgX5Zm19W1ICL8KacJz+LJtcD/72+NtU9SLxvwdVXX+2CIBgTknW1RL0LQlmW9Pt9yrJciqJoNkkStNYEQUCv1+PEiRN3LC8v3+nLCTwpcCYEq/+5P8YkSfa1Wq0PB0Gwt36N6/4Ok+ti7T29wz/W2iVjzCHn3JKUcq+Ucm+WZXemaXrncDgct3b090T1ZU75XBHi0i0TEFiEM1XmPheU1iJkgFOSnLJa7qWAomBOQ6eA503z0N/7nr17v++NL6BtllD5KkGnTT5IEVISJAk2L8hSQzK7iydTxWNZwj/9+d879NdP8qoy1gxTUanQpMGZk0GMqyk4PeIXNStA25AATTRR7Z+aIWiiidFTYsPXqf6mtgEtR5ucIAJjQUcIUdDr8/tHjz6+/zvfvI9yOKAlg0qyZgxqqsWJ448wPddBKKAYIoHpzhxOBjz+2OJzjmX291UrobQWRICwghBBgEZKRSGrJ5+yYtTt9mzO+8KB5/PFYT5d5zAJOEYb00QpdYPfoE4e12hTfbNSak9ZlvfUAcXkBvxUZMy5Oce6vd9mv3anfs24I4CrvUX1u43/8x03qr8zQmLESDpqLaYGzJ9Kn3DnLForb0z2n4UQP97tdgnDkCzLNgC0zdzIldJYa28siuJAvQ68rh5o4uKNevbdz7W6QsfPQSklnU6Hubk5NzU1taE+3YNf3xXCq0UAjh8/zuLi4p1ra2v3bWYSeDZrj58TGzRlApwQ46/6XNu4zp/8LNrsc72BoQf/HuROTU3tnZ+fX/RqJH9em8n06x4cUsqk0+kQRdGYVFldXWV1dfWmuvR/20aIm5Ts+GuilKLb7d4ehuFtQRDsm1RobKeMSgiROOeWrLVHgHREBiTW2sMj078DvoPLZOlP9d7ulOMrxKUsonVYf484jZYxQqrKE1ZY0BYlHJFwBBlcPc2//b43XPXW79r3XK7s5AR2BRVIcA6lNDiLdFAaRzg1x4lMsqZ28IFf/298+uvlFWtAbt2ohR8EOsSacht7ObfFjGmiiYYAaKKJJs4YPo3sm0sD0gAFSlfl+0ePcSBfeWL/G153A1m+RqAz5JxmuPAI07t2k6720aEmLy2g6c7Ns3s2YbV39BVfP1ocOJHlIGNwEUlp0RaMlRRO4oRad2w/a+KjIQDOlgCogxDn3H1KqeuiKLpuMxDvN9xKqX2jTemD1tq0ns3aDsh4NoDTyYz8Uz23igDQvhvDgjHmP4dh+OO+tdlWBn/+S+vAZ/z2Z1l2wEugGwfwZw4BUAf/k/eQB69RFLFjxw43Pz8/rt2vt/mrg2MvhV9dXeWxxx6bW1tbu8eXCpxLAuB8r0uTx+IJkXa7zdzc3OLc3NwGAmSz4/d1/3meI4QgjmPiOB6Pw8rKCktLS6LX6wGMDQEnyZJTAPQNa4F/jyiKiOP4xk6n8x+11nsnCYJTjfHk75xzR0ZKgEQptdc5lxZF8aE0Te8ctTI8aW2YfD5ufa0v3XXCCIUJY4yRIDRKa0xpKG0G0oJzJIFDF7An5gU3vfLy//iO73gZL7qyjSoWMHkP6wKkDACLDDSUJYXQZKqS/v+//+0TfPhPF0ShIbNV9l4GUdXmz5gG0jfRxNk8P5shaKKJMwf/YZWTr8z6XPXQy0swEgrgP927Jn77Dz9HsPO5FEmb1cUnSKYCKAsiGZKWFuJgJPM/wRXzOX/7O5/Pm18VusSCsDkUDmUVCl3VulmLsBJp9Tlxgb6gYzgByM6kV/SFPv66HLjWIus9eZ5vaBvoa4p9phmg0+m8v9PpPJAkyV4PWusS12d7bGUGtt0MYr22WylFr9f76iOPPLL72LFjW9Yd170FfPuzqakppqenPxxF0YbMZxPPDBKpTq55gs3Px1G/+Pd3u12iKDqJFPKt/rz8O89zTpw4wWOPPXZtr9dbqkvDn2qrv6cL6G/2Mw/4/bqjtWZmZuaW+fl512q1NvgjbLUuSynJsoyiKIiiiHa7DTD2+1heXn7VcDjcMK+eyhyur43eeyBJEjqdzoc7nc699ZacdXXO6d5/E7XUrBBi1lq7VBTFwSzL7k7TdMNavBnJsNVzqPEJ8RdQg9AUKHIjKBwIGRAoTeRAZdAq4NXf1vrK295wPVftCDGDRTDVPWMsoAPywQCkIisNMuyy5tp87HMP8av/9RExAErf/QKgzCqDmSaaaOKsolEANNHEGU8e3wXXAZYg0JhRLaeREVV1gOMznz924CXXze3fubuFs4vEyiAGFhF3KJXEikreT95HiIz5y+YI2iHLyyf2Lx63B0pjgRCtklHrwRIhNUJW8rmzY8EbBcBZ7X9qstSJbGTqnLsnDMPbJlvN1TfKI8Ayq5R6t1JqyTl3aDJjfSHP7+kmgJ7quQnBGLxprSnLksEg7RtT/nsp5f/mzczqvco3gr/1Fm9a6+uMMUmWZffVPQSauPgJAA/+J80clVJMT0+/f35+/vYkScYAbxLAecIgyzIWFhY4duyYWF1dXar7A9R9Bi6WubkVOPXf/fGPSK7bZmdn/2On00EIMW7/VyfG6qoZ3/LPm5gmSTJWT/T7fVZWVpYWFxd/wr9us/fYjoeMJ9vCMKTdbt84Mkq9cbPx3i4BUDv/JSnlntF9cjjP87uzLDvgu4ZMGoaefA72NGN+6QJRJwTOGBACMdoNSSmJgoBAGQJjiAvY9xzcO97wQl7/gsvo0MNkS0jlkHGE1C0kEldm2KwgnN/D40sFj/Rj/vn/dW94zGJNAIOqAyyhVlT7oWpOWtsYNTbRxBnvX5shaKKJs9p+jloCKsrcjDyZJBBQEtMnZgi878Cfib95rI/qXIGM5zG2MscJdESel1XNQBJgKQnEkFc/b4Z/8L0v4frLcDMUODJKYRGq8rvFlU+LS/FmzvebZXsu1ZjcjHqQWQHRwaE0Te/O83xD9qrmAzB2tI+iaLbdbt/V7XbvSpJkgznZZE3us2nsTwX+t3OOdeWF77iglGAwGBx7+OGHxcrKCsPh8KTN/uTnBkFAt9tldnb29m63u6/aXDZdNp5Jc9CTAXUvh06nc8vMzMztnU5n3AVicl7578PhkGPHjvHEE0+IXq839gmoA+LtSNAvhvHwigVjDEmSMD8//8Ds7OxdcRxvWIM2W0u8YqAoCnq93qEoipiamhq/nzGGwWDAE088MedLZurky1MZH69CiOOYTqdze6fTuTeKon0ARVEcrq+VZ9pGcPT3S0VRHBwOh2PDv/p6/VTWqiaqUM5CmaKlQUiHxYHU5HlOMchoW3j5Fbi/810v4Q0vupyoWCCUGVEU0DdQigikoNcboLtzqM48R5dyXHcPP/ZTH7n+yZIil7BWQAlILSlKQ6iqsscK+zcQpokmzngON0PQRBNny6A57KjTrEMhgmR9g+MkBQVCwgOffvi6G9/0kutsVtBtJZRZClKijEOjQAUYBNY62spy+ewUyjkWl1b3P7FiDhQYDHnlYiuqkoOz34+cnQLgwm+ILo4M+WY1tCPZ6j1CiFQpdeNmwHOy9l0ptU8pdYOU8kEp5ZE6CL0UCZfTZxDXndytdQixXoecZQXGlP/eWvu/1Z3O6/3dQWwAFyNn89ustUfyPD/UkFwX//3hwX5djTPKWM/Ozc090G63qRM6/nr7fxtj6Pf7nDhx4vDi4uJclmXjv9ssu11XklzotWcr2boHza1Wi+np6Yemp6ev89n7SRf9ybXLdyrJsowwDPf4zL9zjjRNWVtbY2lpSQyHww2O+fWyCz9+p4tRe7/ZVqv1i1EU3V7vVDB6j2SSnBg/e7fnMZCMwP+HfObfmxX612/lP1I3Adz6ml66hIByJRGQaENWOJwTqCDEFj3aOF56Oe7vftcL+K6XPYeruuCyJXQgsVozKB1WKrK1PtOzc2SFYCELGES7+Gc/+zs8uMQ/HgBDB4iAOGnjTNWVQUqFdbIiHBprvyaaOEv80kQTTZwRdLaiqvWvNgISLSIoXGUKKBxIiw00vQK+eYxbf+bn/5BUXUXfdVHtGUyaE7VbEAXkaYYQikArdJkzK4e888aX8toXxOyMIRA51oERoLRAqWf+5uOZ7gEw6Ro/uREfDodkWXanMebwZP25r08GKIpiXGs8Mr96oNPp3DU5DvXPeDaA01MpGrZz/f24K6UIAj1WXwAkScTS0sqx5eVlMRgM8G7fkzJfbxRnrSWOY+bn55mZmbnrUvBgeDbcP5P3g1LK16vf2263x3L3es27tXasoMqyjMXFxUMnTpy4Nk1TwjDEt/HcLENcVwRcLOvn5M88GJ+fn3dTU1N7fTvSyRr9SfDr17SyLCmK4tD8/DzAeCzKsuTEiROi1+sRRRFBEGzwUPCqie2aAHY6ndvb7fa9cRzfNnr/w0VRHBqVLcz69/bXq+63crr5Weuocrgsy/uKotigAPHzfrN1+2K5vhf1sxtHACgL1hQgLGHgiLE8Z4q//4YX7+K7XvY8Ztwa5Ku0IkVWpORFURlJIui0E7I0p2cTivbl/OJv/zGfehQxBIYAQiPDkHQ4pDQl7Vab0tiq/LGJJpo4yzncRBNNnPnsGc0gYUGigWDUZ9aCMKAMWIey0AI6wG3f/xz3z257K2bpK8zpPlCSW0UYx5CmoBWs9aE9TWYUT6YR//pDf8p/+ThiOYB+BjhJu9NhOOiNN6n1fs+TWa6tN9BmW6Dr2St9PP8bCSEESZLQ7XYfiqJob93QarN65DooHhlW3TkcDg/5coF6hso74E/WQW/WRvDZGae+v307wCAIuOyyy9zu3buJ43gMWoRQeJ8A3zNea83q6ipHjx7liSeeEB4o+MyhzyYXRbGhnVwTFxYEe9AWBAGzs7Mfnpubu8UDPX9d/XXzdfG9Xo/jx4/fubCwcIc3yvNzaztt5p6Oc9uM5KgD1roCwv/39PT0LXNzcx+udzzY7HtZliRJMm6BaK1l5H2wtHv37r1QqSmEEKytrXH06NH3LC4u3u3NM7ci8CZVAHXSLQgCoiiaDcPwtjiO33+68z8dAVRXf4zWvcNSyr2jsVkaDAa39nq9+/I8BzipXGE768vWxyEv6vXvfD7/FAXhqOrRJW36WY4qC66I4LtfnLh/+s7v4MpowPSUAJMzzAeIMMJJgTMZWipCpVkeKrLZ5/E7f/7X/Nyvf06sATZQ5EVNmTI+T980UzBKwZyDMWiiiUszmhRHE02cDQGgNj6M5bhbs38wOeJ2RJG7UR90+Nbhlf8r7hQ/86p9L6FYPU7Y0qQmJUv7RK0Y1nowtQPSHN0NKYse1zxnN73Bk/sfepgDItTkpaAoDGEY4CVwXuY86Zp86nDb2mw9e4Hk+T2vic36EaXULfVN8emM77TW1402sw8CRza7JlsZWT27r9vJ9+9m4VUV1loGg8GBoiheHgTBC6MoGmUsK/DvCQEPgpRSdDodrLX7B4PBgSzLUEoRhuFYSeABUBMX8OrXgLoH/9PT07dPT0+/NwzDcVs/350DII5jnHOsrq5y4sSJO3q93gFviFeXtF8s5AZwklN9HWT7khdPSM3Nzb1/dnb2F71x4VYt/vxre73eSEETsLa2hhAimZubmw2CYPz6NE1ZXFw8vLa29sM+278Z+J9ck+rj6UmXJEn2JUlyVxRFt52tAmyLUqpZ59yScy4dDofvKYriHp/5r4/HdkwKL/4SgLO9T8XZvdY5giSiN0hJtKUL7LtGuNu+5/U8f04y07YUK8cRYYiKI3JTIm1BZFICpchKzSpd/uKrJ/g//91nRD+EvogwRiLCCEyOwoz2TmJUajnZprFZg5tooiEAmmjiad2dSRCqSv8LXwRgEbgREeBQ2pGnhiRpUZYGiWNosJ/73NEDL3zxZfuff+3lFIMF4rAkDgzYEnIL0RQgKUyPVkuze36Wualpjj7x5P4nnrAHZNghNxIloSzzseSyvjHbXhuz7QHFhgA4+w28tfbBEQlw81Yu2ZvVoyql9mqtbxn1w77fOZdOgvzNMm2XhmHV6Z3APQjJ85IsS39HSvkjYRhOVwCesRS87vTugWMUReR5ft1wODxYz7ICTZeAiyTqdeftdnt2fn7+Xt+uzs8Lbwzos79ra2scP378ppWVlQ/VM8N1sH2xXN/JeV5f1+sgfER+3DY3N/f+Vqu1AezWCcL6a+uqgeFwSJqmh9rt9p6pqSmstWitKYqC5eVljh8/PjccDtFajw0BJ9eqSUKyLtmP45hWq3Vbq9X6j2EYXuc9CM7F+DjnloDEj40x5sGiKA6ura19sK6cmlwXGwJAnMUnK0rVYpiVBBoSZ3nl1bh3v/WVfMfz55kRawiTYmyJDWMyWxm0JqFCpqtQONbkNN9aC7nt5/5c9AQsWwkiRra6uHSAoqyBFIdD0mT/m2jiHD07myFooomzePZaBXYkGxX+cbz+YDKj9jVpOsAATkZkwEIJP/9LHz36ma+vULZ2UzoglGBSiDUuH0KgyYsCpRxmcIKXPneWv3vTy3npZbgwXyVRApzZsMktimIDmNkOQG36HJ+/qEv9syxjMBjcnef53ZMZ+q2yjsaYpdHmfjZJkts6nc4DSZLsm5SeT5qUTQKFSzXq5m9hWI3Z4uLi1UePHv3iysrKBgBS7yPvW6CFYchll112y2WXXfaA7xHvlQBPRxeOJrZHsGmtabfbdLvdh+I43kAK1Dpt4JxjYWGBJ598cm51dfU+TxL4OerLqOqk2oUG/5N+FZNrs7WWKIrYvXv34q5du+4KgmBcrnIqAsP7ZXS7Xe+DcGscx/va7fZYLeENEldWVm5K05T6eJ3Kob9+bEopkiSh0+nc1Wq17gqCYNY/r87V9a//t7V2Kc/zu4fD4R15nm+4ppOEShNnBx+EDME5wtJw1TQ/9re/fS9vftmVBMUJhB1Qpj3CqS65M2RlAUJRZiUQQTjHNxYcP7b/T24ihJ4DwjaoANsfVAmW+rN0/P+m+i4a8N9EE2cTjQKgiSbOfPtRTSE3ejCJ9Z9WVWsShyUIFFBt5IwzOEAqOL7ML3zj8Df2v/61r6SrU3S+hlAaZCV/K/KUuNUiG1Y1zMo69sx2aUWKL3918f5enh82wqDDeJyRqcsc/Sbw9CzG1puqU/3s2XMNz+8Gvl6XP7o+9yul9vk61UlTv4mygLEL9sj4anZURrAkpTzkAUL92td7e18aLNypCRivjqlLpfM8/5Usy77ebnfe6UG/MeYkh3BjDK1WiyAI9mRZdmQ4HB6qkTMNiLgICDYpJUmSzE5PTw87nU5Sz9z7+eeJoNXVVRYWFkSv10u958PkOvdUes0/LTCrBrLr5V3eRDRJEubm5tzc3FwSRdH499tZt6WU5HnO2traIa31DXNzc3s8geDLAxYXF+9eWVn5oK/7n8zsb2Wc570XkiTZ2263PxxF0S31ErXtSfC3TQQk/hjyPP/gcDi8M03TTVup1q/zdteXRgGw+StFWTIdFMzjeOcb5z/zA298ITvUGt3AgjMIpRBRxDDtEycxRWFY6RXocJ6vLSp+6v/5JF9a5odXDKhYUeQlKA0mJ4lCTFngRue4/v+jr2bpbaKJhgBoookLBR7FqOZfYKvnkvBKADeeYtZWpQDWARKUVmSlQEnHk8c5sLr06P43vfp6OpHElENkpEBITFkCEiEUyhkwOe1IsGvXLI783V//xtqBlbLqkbuZO7Kv1dzuBuJUm6KGADhzAmCy7hRIhRAPCiFmhRB7PMjfrDe5B63W2iXnXDICskkQBDdHUbS/LMsD1K7/5Ga88QCwBEElWfZO8N70bzAYfKksTaKUuiFJkg3y/kkTzREIu9kYc89wODxSN4xr4sLGqE/9J6enp/eEYTieC17J4UHxwsLC0okTJ1pZlm2qvPFrp78PLgaCZ9LfY3Kdn56evn1+fv6TMzMzYyNY/7vN5PWTNfZSSh5//PGbpJR7L7/88hu9ssWbix47duzgysrKD2dZtkH678emTrTUx3HUTpPp6el74zjeH4bhdZPtFP1z6mw8AOokgrX2cJ7nd6dpekeappRlOSZftxqHhgA48+PX1qBtzg4cb//2Kfd3/9bL+bYdkqhYQeJw1iJ0SJGnOEqSJCYrJbK1k0dWYv71f/oY9x52YplqX2SNq1obmxyoTFfdKJEyNmP0R9yA/yaaaAiAJpq4cNDRoQCNAAJAV0+mqiXA6OGsiOKEosgJY0mcSNLMEEVtssKSBIJvPJQe2Dkd7L/qyl20ZB8p+mBKUAH9oSOJWpTZCjqwGFKiRHPVZfP0+sf2P3SsPLBWivGGLAiCcQZoe23MGg+A872Bn8zsjzbxR4BDWusbgXT0++QUNaoblAD+Syn1bqVUMvIG2AASnt3XbXsbYCHYQIh5UsX/u98f3GeMuV9K+W7f/m0yw+mlylEUoZS6rSiKA0VRbJCZN3FhotVqMTU1de/09PQN3uxvElSWZekN/1r9fn8D+Kw76E8Cy3OZoT7bNaR+TL7cYWpq6q7Z2dnb2+32GJjXWx36taI+HpMeAL1eD2PMkenp6du63e54/cjznKWlJRYXF1/iy8r8e9XVBZOeJbWs/74kSfYnSXKLUiqZHNPNjucs19iloig+NBwO70jTdPw8rHujPDXg3xAAp4vQllylCd70bYG57Qdez0uuDAiy46hIkg5LSqGRUmFdQRIYTJlTqC6PD1r85p9+nd/89AnR6+zAWI3FoZwhHu2i5CiFYkf/8ll/1RAATTRxzqJJYTTRxFmFz7Ko0YPKrn8XILQiS1OiJKYoUvKsenhZa3EoVgpDC/iX/+FLYudc173zzc9l9fgX6c5oyrKg3Z5iOFglaSeQr2FKQ5TEzCWWd73jtXzxiY87+4QRx1ZBSoUSmqJIcRi0lpT+8JyceOSXzaV7mjbvfjPqs4vGGEbGY4eTJFka/d3s5EbTOTeWpNdbV9Vrz1ut1t4gCN4vpdwLvMdnvhoPhyqCIBjXgHvgn2WV6VsYBlgLKysr95VlKYwxbm5uDq31SQDKv35UL+2MMWI4HDZjfOEJgPdPTU3dmCTJuITDzxWfyV5cXGRhYUH4Tg6TWfR6uUcdOF4MJoAe0Pt70DvpT01NLXa73dlOp0OWZWPJvle6eKKr3iVhs2z9iRMnxLXXXuviOKbX6xHHVTnZ8ePHWVhYEGmajjsE1FUR9TGrA2ulFFEU7W21Wh+O43hvvVyh7mHg3+tc+Sw455bKsrwvy7Jxm0df9rFZlwJPdFzaPilyZKq3vi8Q9X2Bkzix/jeCEkGJxKEctCxcfxX5P3r763nJlR1EegSXDxBWEs/sIO3niDBClA6UZDh0rMmI+z79N/zan3xDrJJghhZ05fZvXbV7UqPdiVSaxmaliSbO4/60GYImmjgXE8g/KCfMacbA25708EUA2oKBaQs7Bfy///r73EueK4jDBYrhCUIjCZyDsoSkBbkjLxy62+GJVfjyw44P/sdP8VffRPRdSF5aIh1hxZC0sBBWxyWcrmoTkChhkaQIAcY5cHLbcstJkLqdTcap3uvpBOLnlwA6s1BKMTU19WPtdvuX6pv8yc3/1uexXh+c5zmDweA9g8Hg7izLxi7ePjPoP6/eKeJcjetW73ehAfLpNvh1UiUMQ3bt2uUuv/xywjAkTdNxuUDdSyDPc44fP86xY8eENwWsqwbqfckbhcDZX786iPXt3OI4pt1u37hr1657/X1dV3p4MLqwsLC0srIy1+v1xqCwXh5z4a+P3dJvwN9HFTFhkVLQ6XSYnZ113W53BMpPvab6e9urI4qiIEkS8jznkUceEddcc43z4+LXipWVFY4fP37tysrK4Tpon6zdr77Ws/pRFNFut386juOfPRMfki1MUB+VUl410d720VH5VEdKSZqmv97r9f5hlmUnlW2cbv1xTpyT9e9Mf+/c2SJc+ZTHdPw7JEZWrvrCSpQzaFKU8A2MFeguaW5BOiJtcPkAbWFnC54/jfvZv/9aXnS5ZnoqApdi0xWkEpB0GKwOMSpGBzHWwtAlfPLLR/n//eLnxCPAgMQbCYA1Y7H/+NpvOD+7Yb/VrKpNNHH20ZQANNHEOQnflsZt8nO3+d8LB5EC63AWpIBPf/qre65/+fP37Zxvkw9XSLRBYsEoGBqQAUprhvmAdjtmppMw1Qr4xkMLb+31zK9KFTA0JUEc4ESJxVXtCZ1COIVAIkcGOtXmTTxloPbUQN3FwTGePyB69lsR59xfAUZr/ZY6YJ3MQG5+DmIDWNBa36yU2iOEuMeTAvUNfh3MnutxOZMa3gsdPmPsJdR5nh+w1u4PgoAkScbyf38dPIEyOr+b8zy/22eO6204Lw3/hadhVd3EIDMIAtrt9r5ut/tJrTVRFCGlHGe+vYndysoKq6urLS8Jn/R1uBgy/EJsnI91VYIQoqZeUXS73V3z8/O9mZkZpJRUioZTizi9cZ9XBcVxzOrqKsvLywdnZ2c/nCTJhvu61+tx9OjRa9fW1g5P+iEA43XEkzFQKWNarVbQarX+/3Ec/9RWdfdnSABN+2tmre0BuZRypxAiHK1vH8nz/IN5nj/m5+pmXirn6/l09ud54ST8IHAjp33hHIoSiUWKamvihCYtHZ2pqZfm6fCYKVJ2dgVB5nj+PIs/8s7XJG96yU66YYYtBoiR4tHhEFIhhUJHLTKrWcpCHlqC/+ODn/yZozmfWAOsDMBl4AybWPydZv/URBNNNARAE008k6MQxIGktI7CwVrKPV/84td+9Du+/SWdPfMzlL0llC0R7Xls5iicQSUhtsgIpCIINLt3zDMXm6sef2TlRx7vmX9tohaZMVhnKmcCn+V3Cu1M1UVXKCxq/IB9OgmAC7HpvpgJgFFW8xNBEHyn1voaPz71FnZbHb+U67XMvv42CIJ9Sqn3SimXiqI4NJmlf2p9sLcH0M7UxOtCX/d6zbQxhizLyLLsgJRyfxAEG0D9pMlZFEV78jxPi6K4vyzLMXird2Ro4tyRAD6rH8cx3W73y51OJ6l32fD3tjGG1dXVpYWFhdZwONxgjFd3qr84PBw2zp/JbLsxjlYrYX5+/mOzs7O/1Gq1xvdV9benv8fqKoqRH8Ih59zSzp07r6vL+QeDAcePH79jcXHxHq8e2myO1yOOI1qt1gva7fa9SZK8o37PnwuFRe2aPeqcOyKlvKq2nvV6vd6r8jx/xBt8Tq5F5xdAP7MJAIFAOIl0DilShLBIV8ECR4gVCqcgM4NjUkoCl6NSxwt38sDfuenb9t78Hdeh3QAtDCYfoDAgq3tMCoXUIVmaYXSHb64G/Itf+SifP8Z3rQFRpDBl3oD7JppoCIAmmrj0QgAhCmkshQSCSqW/uMIvHH/sK/tf84pXMNdtMej1CIVGaI2xJUoJtJDYMqfMB7RDzQuvvpI0XZ3+2mP9Px6Y4rHcOhCCcFSvJ1xVoCBdVennpMIKQBjE00QAXMjN9sVKANSd54UQfymEeKkQYofPcG117Os1t3qcoavLz6WUSRAENyulUufc/b4ftlcDnOvxuNhap233uvuacJ+x9wCyKIoDw+EwabfbN3jgaW3lTO1Jg5Gs+kbn3JGiKA7VAUgD/s/d9fPki5TSS//varVaN3jDRl8WoLWmLEsWFhbuXFxc3NC3vt4d5XyoX86c3LAneXzU6+a73Q6zs7OPzM7OXu+7GdRLHE431byJpVcBLCwsHAzD8MZdu3Zd58dVKcVwOOTJJ5+8dXFx8W5PPvo1xbdRBDZ00kiShKmp7n+N4/j9YRheVS+DOVcEgF8fnXOrUso9UspwVMrwkSzL7hwMBl+olzg9dfLxwhIAztmzev+zG16BcAKJRWHGYnuBxqCxQoESuHxIEglia5izcMt3XnPX3/vuV9JhmTwfEMUajUVoAWGIQiJQFFZSiBZHBgEf/J37+NMvG9HTUKAQzuBcA/+baKIhAJpo4hKdfC1CDCWlgHhaMkgdUQzffJgDK8ce3//Kl72MOArJsmW0NugopEyz8aY2JEcrh0oNV175HCz2H33tG0sHMuEwMgAMUoC2DonBSImRAidKhDQI99Q3w2dCAFx4qe3FqwDwGbqiKBacc78VBMEtWuvdW7mQb8zgn+xeXn9frfWNUso9wD1+w38+rsWkeeH5H/dzRwB4UF+XN+d5TpZl90kp3+ucS4IgGGcj6wBnZLx2c1mWH0rTdMm/jwcuTRnA2QLkdfAfRRGtVuv2drt9uwek9ax+nuesrKzcubS0dIdvW7eZu3+dqLrw9+fG7iBlWZWRjZz02bNnj0uSZNqvEXUlQ6U6Uae9vz1AHhmEHpment7b7XbHxoFpmnLixImDCwsLB7wXhp8XdTDt72dfgtHpdD6ZJPHrpZThZvP+XKwztbk27T+nLMuPp2n6E8Ph8GOe/JkkIbe//lzcCoDze/yjUkAs2lXZf+nACYGRilJKnLGEUQCDjN0h/OBbdrgffMtLuKZboItVwnYEo1IVLQW4EooChCazEct6F//+dz/Jf/rEmigSSAtdtTi2FiGpWiM30UQTDQHQRBOXUkhAIVBocgxF7kBDVlQP4m88kh4waW//9S99EfPzEelwgUAKpLWVuaAY+Q4YhygFU50ZLt+5C+d6+x8+svafV3pmQahKVSBdtVewwmGFQ1BUrxXVL84XAbDVHvDpblN3sRIAflNfMzizQRDs0Fq/ZbOWgJPnYYzd0GGgnjH1WbEwDPclSbI/CILEWnufB7znYkxOpU54JmTB6wDTg3Y/Nkop1tbW7jTGPKiUuiUIgrF6wo+v9w+w1r43z/MDky70DQFwduEJlSiKSJLkllardZd3qq+b0aVpysLCglhaWrrPm955Mmdz87qL47pIKUbz2GAtSAlJkjAzM/Nrs7OzH0mSBE8+Tbr5V+chTzt+o/uYsizZsWPH3iiKyLKMOI4xxnD8+PHDJ06ceGPdLLBe0uJVB0qpcfvBVqt1VxAEs87ZDaVFk0qGsx1na23Pq6FGx/XxNE3vSNP0C6NOKhvWnMnre6EJgNOTIBeSAACHqNoZu8rGGMBKKJSsTImcI6Fgh3Lc9PLQ/cO//WpedFmAWzmCVA6nFFlZAI5AKUiHmNwikzmyaBe//gef5d//98fEKpCqqNr1uEqd2BikNtFEQwA00cSlu8FFUuKI42RsYhV1JMNMoHXA57964kAn0fuv2BOTBBmyHCCVA6KqV46xFY6fvgyTZexsab7tOZezvHTsx48vZL/XMxzLRfUstwKMdCBslXmqbSIulAfApU4AbLFp/IQQwkgpX+OzXlsdf7WXElsSBPWWZkqpG4QQiRDivu1tTs9snP3neRnxxU4A1HuST5r95XlOWZYPFkVxD3Cbb7XmwVU9KwvcbK29e1KS3MTZ3U9JktDpdO5KkuT9dTAMlSR9MBiwurp6ba/XW5qs99+MaLy4rsn6MQaBpt1uMzMz88j09PSb2u32uJWh9wPx95b3oTjdFC6Kwpe0EEUR09PT1M1BFxYWWFxcnBsOh2Myy2fV/Tj71oOtVmtvt9t9oNVq3bhuoOhO6ftxDsZ6DP6LovjIcDj84eFw+FVv+HcqcvTZ4AFwPgkAh8QKCUi0EwhXGRM7BUZIEJZYOGZFydteMeX+3k0v5brLBFG5iECAsxTCorQgDgNQCkqDjGY4kSf8yeef4Od+40tiwYFLWpjcgCmJWhGmtCD1KEPQEAFNNHEhoilUbKKJC7b1k5SADiOydFhJ6CxkPYtuT7NcKlaBX/jQIfF7f/J5cjWHCWKMA6SCKIEghiCBMkW3FNhlrpgt+Qff+0re+AK+2DYQOjASSolv9osbfV0IwNXEengwCYzrbIfDIYPB4OfKsrxvu6/3PdA94K6B/rG5nbWWdrt9+/T09GKr1dp3LjP0daBVJwAu+gfghGrCAyuAPM/HnQCWl5cPLSwszK2trY3roOvu7aOs7b5Op3OXr4VufADOPrTWxHF8W7vdvi2O47Gywo97nucsLi6K5eXlw97l3v/cS9j9vbhZFv1iIKA82G61WsHMzIybnp6+Ko5jpJQkSYJzjsFggG856RUQ9Qz4VmGModfrLY2ME/G+CO12m7W1NZ588slxK0tgw5jV22N2u93bp6amHorjeG99vtfHte6RMbm2nQ3AHl2zXlEUB9M0PZbn+djz4VTXsSHftnMDCiwCI6CUEiPBIlCuJLYFrbzg+itw3/eGF/K6F+4hLPu4tA9JCAK0dGgsLhuSraxRuJiyfTn3f22JOz74GbFgwYUtitSMVIuWbDAAB/IZ8HxooolnczQrZBNNXDj4ASgQDuFKJKNGggIQQfXAdIauKJl2cOCfPNe94y3PIcxP0NHTowI6gykzVLsLpcX0hqipOSgDPvPgUf7Vb3+WLx7j9d9Y4lNOQieRFIUlK0AojcQi3LnfLK1vzC4+ELTxXO0FJTpOl7XatWvXF4IguN73o6/L9yuAKbf1+ZOdAPzX4uKiKIpiDGq9FB7WHfLrct56K7W6m3q9XZg3a4uiaJ8QYjbP8/vqJoT119f7hU8aCV4sNfR+rLTWJEnC9PS0m56eptVq4cGIP/Ysy1haWrpvaWnppjRNN8jQJwmHaqzOxRryzI2623zdYNGDyrm5ubuiKLrN16X7+zHLMobD4cHjx4/fetFvsjYpy/HAOU1TkiRienr6A9PT0+9LkuSke+ZUc9sYNy5LqbfBK8uSNE3p9/sHd+zYcUuSJOR5Pu4Usry8zGOPPSayLBuThvXSFX+vdrvdfVEU3R7H8S2b3cvWlpse1+mOfTMVWN03YF0VETAcDj/e7/dvStO0OFeKoov5+XS650R9jM5ufZRAiBVgzRCwBDrClimBhfkArunyB//8H7zie77zuisIhgtErkQHgJI4V2IxKC0oBym6u5O+2MFH/+pR/s//8FfXPjrk8ACoehHV0YYBZ6t/N/mAJpq4YNGUADTRxIXk30ZSu0oPAAKJQ1dPRlHJ9QscSQyf/+LyPXuviW+76oorCKWit7pCGGtQDlcOELJEtis1gBmssmtuhisum+f48aP/6PiyO2AkZANHaSBKZilLicQhOJ9A6+LjGDee68VlTrjJdfg9YIdS6hX1jPJ6e7rTv/9W7vwjE7sblFKplPLBOjHgwf5mwHUrx+36a0c/OxLH8e1SykQI8aAHvfVMu3+vzQDPxQL+6yUCI+Lig86524wxSRiG47Hx46SU2mutTfM8v9+fXx3wemKjAlT2WTe/ntIGZJTJ9v3qPZEUBAHT09O3t1qt2+uS/5EUnF6vd8fq6upPTI7vxRaTHhNelePvhW63Tbfb/bWpqal/nCTJhqz5Zvf/5BzROhirf+o1+3meUxQF09PT1/m/DcMQgOXlZU6cOHFTmqaH634XdfBfOfxP3d5qtT4chuF1de+LiSM6b+ufc66XpulvZVl2Z5Zlj9TVBecGAD9z5s9W53l25y/AWpRWGFWlH6yBwFkuC+GaLh/7x//Tc2569bUztF0PYXKisIVDktsMg8FZixASlUxzYqD59Df7/NQv/uVV38p4uE9V4jgmWcT4wqFw4ybETTTRREMANNHEJYb/RyZ+IzfekagSgURgwBmqHn4wKGGQc+RLXzxx5DWvfvHN7VjQboEphwQtidCGwhVYLbEStFToKOSanfN0Ak2vt7x/YdEc6BdQEmNNC5xEyhKBaQiAi2hjV/9ZWZZ94A+llN+hlLrGg811ULq995/MrNVqe/cGQXCLUuo6KeUh59zS5CZ7UhVQJwhOFSNQt0drfUMQBDdLKY84547UM4ybZf6fboPI00Vd4VCWJWVZpmVZ3pnn+f1BELzb12j7Yx61p7vRWnt/mqaHJ8erTgBYa5518+up3v+TSpKRHH5vt9v9777mHyo5e5qmS71e74d7vd7dw+Hwoi+z8IqYupLGS/6jKGLXrp2u2+2+ot1ujw346uNxOiWREHJDBt+7/RdFgZSSTqezAeD3ej2OHTt27erq6qFJgtDfk0mS0O127+12u7fVx38zgq4+Rc/EZ6FOKkx0HHjUGHN/r9d7V5Zlj9XB/7n1c7h0CQCBQZqSQEsKI0BpwjggLnKu34n74Zsuv+Ztr7ySPV1weV7V7AcxQ1OpdKJAo6whdwGrbo6/WVT8rwf+VDxRspoCqGB0bUd1h+OMvyEc0QKNA0ATTTQEQBNNXKIkwAaoAUgUbpSZdzggagvKsvL8E5ZDn/jY177+1htf+s5uRyMwFFmfIA4QkWBtOCAIQ1SSUK6uIU3BNZfvJIlCjh0/tv/oMgcKp1FOoqQAChANAXCxbu5Gm2ML/OWIBNi9EUjK04LXOpjfuHkX9Zr967TW7x4BhfuNMad0sZ9UCEx6AHggY4w5JKU8EkXR7WEY3ialXHLOHfJZy7rR2MVYs1vP7tcJihEZcLgsy/uBd9dbzvkxiKLo3cPh8EC93MGPzTrR4Z518+uphHPOEyZjsDw1NXVLp9P5ZH08nXMMh8NDI7O/B30Lu2dC1CX6NXXDbfPz8w90ux2iKBqfy1P1JzDGbjDcHAwG+NKTTqeDtZYoihBCsLy8zPHjx6/t9/uH/bh60gCo1/p/Mo7jvZPKlzqRtT4n3JaAfDvzeTMDQWttL8/zD+Z5/sE0TRe8ash/dp0EfTY+n54uAkA5g3LgRInTERJLmA94/g7+7Q++6bLX/OBbXkY8PE6gLBIJOqSQVQs/JaAoLVq3GMgun3+i5Cfu/JMfejzjS31AaFntYjYQAFXCQ43UjlUBYxNNNHFRwI8mmmji6X6wjyCA01R8XIHCokaoz1BZAahYYVJDZGEKeOnVuH/1U9/N9VfGDFceRiaCpKsps1VMYdByGlUolFNQagZpwB/+1cP8m//2jd4XH6Ub6YhhaSmVwwjbeACcB2BzLjZ5/mdKKZIkeUG73b43iqKr1gkAdcrPPxlwbl0W4LOxeZ4fGgwGt6Zpetg7gtezkqdTFdSBjHPOu7i/P0mS2wGGw+Gd/X7/jjRNJ/wMOAkEXfg+7eKU9cyj68LU1NTi1NTUrAdb/jWLi4ssLy/Pra2tLfm/r4CbGb3+bM/vme0B4MfEX/NWq8XMzIyLomhMCIzq2e8eDAbvGQ6HY7l7EARMusFfjARSvVtEHMdMTU09MDMzs6/dbuOc2XDPb1ZOc6r1xJiKQLHW0u/3x+C/3W4Tx/H4dWtraxw9evTatbW1w36+1dUJQRDQarXe3+l0bg/DcEMrwHrZymQpkBAn1/2fygtgszWjPs9G4P/u4XD4z30ZwyRRcCZEyTPp+XS6Z8O58gAQlCQK8hySOKIcZswJ+JG3X+F+5Htewk63QlBkIKBwAoKQTFRlAqEIWRsUyPYO/uZYzk/9yr355x4nGgogUJSFqTY2olYC4Er06F+GsfaxiSaauEDRKACaaOICM3CithFRE5y4589t6cBJQt0iswXHVjhw9Ilv7H/l8/dy2dwcBJr+YIVWJFEC8tQQhTEIBdmAIBbs2rUTdBCeOLbw3sUVc6fFYqXFntfsa6MAOBsSwGdGR4BxQQjxFSnl26WUYQWan1r7xsn+2HWCwGcElVJ7lFLvDoJgL3DPVhvuSZO+zTL5tQ37fUKIPVrrfSPfgT1SyvvLskzrBMPkcV4MUQdAPovvx0RKSZZlZFl2J3CD1npvvWZ95Ep/e1EUB3yte72k4uxP85lfAuCBZrfb3dvtdh9QSs2ueyQ4er3eHSsrK3d4B/s6iXKxO717IA3Q6XTYuXOn27Fjx54kScbXfxJgb+YDsFWfe6UqH43hcEiWZQRBwNTUFHEcY60lSRKWlpZ48skn54bD4RH/uroXR7vd3jc9Pf1Eu92+Yb2938mfWb9v19eM7RGZ2yHZjDFfzPP87jRNfzrLsg2mhueCYH0mz5/z4wEAuXWEAkRuuDJk9ta3zA9/4M0v5aoumOEyQRhjywKLIwg1Jk+xxtBqdSiDaT7zrR6/9Dt/xme+ic4DyC1YJ5CBxlk7Gl+DcFVSYz2xoWvwo6EBmmiiIQCaaOISJQE0Fj2yzAHPkEvCoIMxgkTHYEuszREaBhYeO8KBoL+w/6r5GeZnO5R5HykKgkCjjUM4hykBHWCcIWkFXHN5l0QPk+MLvf2rAw5kDkxDADwjNnsjoPAN59yfSynfqpSa3u74btWreyslgFIqCYJgn1LqZq31rJTy/skWanWJ9mYZKg/WfHcA59w9SqkbgiDYOyICblFKPSiEOFzvKnAxgbp6lm3yHOtjN+q1/iFjTCqEuNFnSr08W0q5vyzLA77Nmh/LS50A8JL4drs92+12vxxF0Z56l4h+v3/nYDA4kKYpdQXFxeYTcar7J4oipqam9s3Pzz8xMzNDFEXje8Yf/mSpyanm7sb7UZCmKVmWeTA/boVorWUwGHD8+PE7VlZW7qvPx5H/B91u95ZOp3Nvq9XaUA7g41QeC9Uxb75uPVUPAGPMF7Msu3M4HP5yvTPB5PtsYjTaEABnem+iMFYQKctz27z9+9/Q/dw/fNur2DurGK6t0mp3SU1J4QpCLZDC4tIcLRXWCR480ufffOSzfPwrpSgdlBZ0rDAqxpVA0oIiQzkIYNzlqBx1H6jUAd4HqYkmmmgIgCaauMTQvxg9HEUNko6gEMZWrgDSVpI9h8MIcK6NEIpvfHPtgCtW91/73CvZtXMakw2gGKKisHoXFVA4iwokzhUkouC5V15GK4KHvrl8w8qADznhKn8eMfLmFSBwI3WCRYyO0AlRpayEQwg7qukTpz/BhgA442Osm/B5Ezrn3GNKqVxr/T1Sqm0B2M0AxGbS/skuAFEU7QmC4EYp5c3W2oPGmLSeDT+diZ+XGvtsrdY60VrfPMqkz8Zx/G4hxB5jzD3+fS8mULdZ5rM+ZmVZEkURSimGwyHD4fB+IcSDURTdEgQBRVEQRZGXq+/J8/weLwmvJNiXhonZVmGMYXp6et/09PRDSqmk3t99MBjcubi4eMekw70nUcIw5GLvAqC1ZnZ29q7du3ffNTs7O67V92SGtWZDTbsnPia7b2xG3AkhyPOCPM+ByrnfkwteafKtb33r2uFwOJ5b9Xr/drt9y8zMzId9dwD/u8mOAPV5XT+uSj1kTwvut7POlWX5h1mW3ZmmqfWZ/7o/yCSxWF+vLmUCACnGe4jRD6pzcgrvKSSolIVy1FnICYeRlSNfNxIkmeXvvKH9lffc/FquSDLCskcyNc1gmKEijQ4U2hRQ5AgRoDo7+MrxjP/4J5/nvz2QiaXRJWi1JL3UgjXQmoI0BWfwRwJe9j/SAgjbEABNNHFh4UcTTTRxsU1Et+GBLhHY8YPSdwsAQYSkRcbfe2PX/e8/+jZmg6NEagViRZn1MU7g0EgR4IxElxKlYp589AT/40vHuPPgifc8WXL3Uga5CJBRm7LMoRgSaZDOYYWgJMYIgROAKFAU1TE7UZkUbAI8txdnW4NpT7lZ2u5xnDnolFsC73MRk+ZxHkiHYUgURXtnZ2cfmsxQb+ez1//m1Fn3erbaGEOWZR8ZDAa3DofDIs8LtA5OWbM/+e+Ry/i+brf7QJIkZFnmZdKH0zS9o9frHUzT1JMPpGl6kux+svTgQoYnaOrgzTupJ0ly186dO2/zf1uWJWtra4cXFxev9edYv74eENfl4Gd/H53vzfWp568niSaBuj+vdrtNu93+cLvdvkUp5e+xpV6v96rBYHD49H3fz+/5VSZ769d3koioS/Yrkz+HUnIMXq+++moXxzH1DHudQKqD/c3KbOqvqX+WJ9VWVlbGBJQH9lpr+v0+i4uLHzl27Nj3+/vLmxCOFAkf6HQ676uXG2y1/pxqbdvOmlO/pyeIjl4Yxp3BYHDf2traTX4tqJucnn79ehbuBbaxtjnncALMyARWW4two3p7p7AEozHMCLEEMkcqRw6kFtCaKHRMrRn+yfdc7v7nN34b10yVIPqAoSDCBhF5ntPtJri1E+R5jprayddWFL/5iSf45Y8cFimQsy7td+PNjK5+4uw4wbFOAHhfAPs0rVFNNNHEps/nZgiaaOJiDsfmdjkWkBginDAcfjg9EMnl/a/Z9zJsmaJFidQjibEwSKmrB7ExCKXoRLBzuks8k9z8+NHl/31xlZ+TwjEsHE5oOp2EIk9RcpToRwEah0AgcKIcKQTEWfKI4hyMz9mD+TMHlOcfiJ6iRd4SkAghbgiCYINhlwcY2x2/051/bfP+QinlS7XWq1EUrhZF2a9vyCeVBpMtBUd/c2TUdvA6f5xCiFkp5T6lVKqUOmStJcsy6v3HtzIyvNCb9cm6aP9VluU9xpjrnHPXhWFIEAQAs8aYI8aYQ8aYsfv7qL3gmNzxgO3sz/F8AyVxGgBtTrqHfavEkQT9w1EU3aKUoigKhsPhweFw+J4syx4simIb5+/O8/Vdz0R7IsPf0845wjAky3KMsf76UpaWTqfNlVde6TqdzhiUT5bQ1OfEZoD2FC3y8F006vX5/nOyLGNhYeHji4uLb6sTUyN/gLdNTU39WRzH372dVp5bkXrbnX/eaHByDEefHfb7gzvTNP2JoijSybXibE3uns0EwPrUq7oFydHNKpwcZdirzH+kI4zNkc5gLFgLUQI6UsjVkne/sePe8ern8uIr24hsGco+JBFKK4ZZhnQQKolwDht0OeFm+aPPHeHn/9PXxUBDYbeahRv3LO6kf1maJoBNNNEQAE000cQZhUWTI3AUwGcfXDugxPL+FzxvL50YXNoHIShsWSn3cbgsQ+QlQsZE3Wkuu2ongc7V8uLq/uVlDjg0QrdITYZxBqEqEkFb0FYirQQhsULhhEAgEWf1EG8IgO0A70mQUGtFd58Q4oiX1ddB1vbO6dQEwKScX0qJ1vqFYRj+UBiG/5tzfEhKuTT593UAU1cR1ADQfaPs9w3+faWUs0EQ3ByG4budcx/0ALD+uou1ZeCk6sSDtCzLDlpr75FS3hYEAXEcEwTBzdbaNMuy+yezv/Us77lROlxYAqBuelg/x1FW/PZOp/NepRRlWTIYDO7o9/s/MRwOjxRFsU0AeH7Pr952rsrWb5yX1flVcmpjLFor5uZm37V79+4vTk9Pj1v8bXYfbwb8Jwm0yXu+Dv6NMeMWf/5rOByysLDwkZWVlbfleT4+9pHPwru63e7vtVqtaU88PZVa/TOdd5u10TTGfNEY85Xl5ZW/VxRFOqn0OBUB8GzO/j+VayKxaGdQzuJEBfwrPx+LoESIsmrxqxWZqcoHZzoBtm+Zyizf/dLQ/eObX8e1u0NkYsiDEqkl0hkK54jCkKjVIl3tIYM2aXA5v/uXixz4tc+KPpA32L2JJhoCoIkmmrgAGwUqIV2cQCEEmYWvfHnlQF4c3//SF1xLpEFgsCYDIAwUSgVYKzBOI5UiSkquuHwHkYh48vGFdy8NzAeNrWoEXSDHmX5lHcqtuxUYKXFCIrEXNQGwWf37qczwLjYCYDNAUgdXo43zISFEIqW8od6qa3s1sqcmADbb9NezjlEUv1drfbMQ4pBz7kg9w+m/1yXuXvJsrU2NMfeNugHs88c6akk2q7V+r5TyYFmWS5OkxqRXwcUQkz3S69nasiyP5Hl+wDn37iRJZtvtNkKIG8uyvCdN0yN+jDxQ9JLp7Sk4Lm4CYNLcTghBFEW0Wq3bkyR5v5SSoigYDAbvGQwGH/SdEibv9Qt1fpNZeyE2HpcxFQFQgWzN3NzcB/bs2fML09PTG15fd/o/XTu7SaO/SfDv7w//e601SinSNGVhYeFnlpaWfqwoirGSJEmSXd1u9w9ardb76i0XzyT7/1TJAF/WUZZlzzkXjs6jNxwO39Pr9X46y/INZTST530pAf+n+iwSOLSrsv9GSKxgXOMvKUAYCpMThCHGWiLlaGNISnjjc3H/9Nbv4mVXtgjcKqkdQqgQSpCVBThLEERgHIYWPTfPfZ87ys/8h78Qy0AB2JHKv4kmmmgIgCaaaOJpZgAEld9PXoDUktQ4/uarwwO9lcf2v/pVryRSBcoMseUAYS1SJzgZYl2AEJZA9gikYef0TpQRs9/82tKvDly5GiQRpXNYYXBUFX1gx7L/UlYOvhc7AXCuN10XggDYzBCsDjpHG+z7nHMPBkFwy8h1fpsGadt3U5+U4QOEYeTbBt6mlEqUUoeFEEse9GymRvDvMfr9PUqp65RS1/mfj8BwEgTBe4UQ9yulDtff71z1wT5XhMzkmNTP11+HoigoiuKDwLu11rMjNcBtxph7jDFHiqIYy6RHRo9jM7xnMgFQB9De1yFJklviOH5/EARJlmWHB4PBrf1+/6A3s3tqmebzTwBsVlZT/ayq9zfGkiQxl19+udu9e/frwzAcX796jf9mBNZmc68Ogjd+nj2pnt4TRWVZsrKy8ujq6ur3l2U5JpSSJHlbu93+761W63p/P23lsH+e16/QOdcry/Iv0zT9icFg8NHK30NvSVieiZfLpUYAqA3jYsfZf6TDCgcCSlvQikJkVpKU8D3Xhe7H3vFGXnl1F10sEOqSQCnysqBvC3SsSYTGpiX9gcF1nsNHP9fj9l/5uFgDMiAXGgioJDGNFKCJJhoCoIkmmnhaw0mqTgFK4YzG4ChxfOVwcSAOB/tf9LwraCcSrRxFllFagRMaHDiXoUWONCUzrWl2ze0k0PZ9C0eXnnO8l/9+Xpag1IhlGO31hR1vLKoSgIYAeLo2hZtlyGoZNpxzD0opE6XUDU8VQJ2uBGArcGKMHWchwzC8IQzD92qtrwMO1j0AtpLwj4zU7lNK3SiE2DP5+a1W691KqZuB+4wxS5sBqothsz6petjMsXxU4/7BsiyPBEFwc6fTIYqi2/I8v2c4HB4xxmxwPj8353ZhCYD6dQ/DkFardUscx+9XSu0Ztam7dTgc3pfn+UnlItubl08PAVCfBtU5Vf+ttWJ2duZtl1122ddnZmbwjvoetG/m4r9ZKcBW17ye+Z8k1EbZfbIs48SJE7++sLDw5qIoSJKEdrv9riiK3t7tdn9Vaz3tiYR6ScOZguqn8jpvlDgiKb7S7/ff2O/3v+p/LoQ86V7Zzmc9U9pAnlcCwFUleN54T47q6p0EKyp/XhUHuMIi85IO8O1X4/7nt76SN73wcuTwOFKUOFtUpUdSVuoBpQhlREFCkVzJHz/wGD/z7z8hTgDpiABASpAanGkIgCaaaAiAJppo4undKVRfcTvBpjkSg0VTAkI7Pvv55QOX7RD7Z7ttZuem0DgsECiBlCCEwxlJoFsoYL4Tcs2Vu4lC+4rFE4s/2Uv5eePACI1RDqNGpv/CITBIzDk6iYYA2M6xnc5hf5Qlv885d0QIcfPpHL63QwCc6lgqcLIufVdK+a/rtNbvDYJgr1LqfillOgle6hJ5a21qrb1bCJForW+oZ0hHsvg9UsoblFJLQogHz811O0cE3GnIiHobR4CiKMjz/BBwRAhxc5IkALdZaw/4zL8vmXg2eABMZP5vjON4vxAiybLszsFgcGuapg96d/pJM8WLoQRgXX2zsStDGAYkSUK32/2xyy677LdmZ2e98SPekNOrOiYB7mb3zFbX2QN/3zpwUkVgjGFpaemLS0tLbyuKgjiOabfbH2i327+QJMlb6v4Dm5WonA/QP/k6Ywxpmv76cDj84TRN17x5YTU2YtMxOdXxbaUSuNQIAITECI1Do5xBiZHpL2AEgARraEmYMfDtz8P9w+95Oa/ZO4tKj6FVCUFElhukA6U1kbMoK+ihebLs8JeHFbf/mz8TC0AhYTB6W6RFKoczTQ1AE008kyFEE0008QydvSpOMOmQdqjJshKhWxhnsSanhWUOeN//vMf9nb91HXNhH2yPMKo2UKaEQHaxmUFqBy7AlDHH+20++ulH+NX/9vmPf2WBN69pKFTVAlDgUBakq77sugfxGW4Yz28bwNNtpuq1tGcW57cNYP3YJjfKHiT6Tb2X9kZRRLfbvavdbt92+k306c//VOeidXhKd/40TRkOh+/p9/t3e4l3XdbsJe9SSjqdDt1u96EwDPf6zy3LckkpNevboaVpenCUNR6/7kKGdzmvZ1Uns5P1tn4ezAVBBSAvv/xyp7VmOBxy7Ngxsba2hi/hODfnd2HbAFprCcOQJEn2tlqtD2ut9+V5fnBtbe3WwWCwgSSYbK8XBAEXQxvAeicA34az3W7T7Xa/cNlll13vwWz9+vqfTRp31st56mU6m3lnAGOzP38P+ePwn3P06NEf6vV6v+2co9vtvqvdbv+Wn4NBEJxkwlhvKbidMqHN5v5TaQMohKDX6/36ysrKP8yybMO4VOOkNvxt/X4/VfvIS50AcM7h0BgRgbNEbohyJYgK/Jej5IDIYT6E112Du+U7vo23vvw5zKsBbrCMDCMgBK1BWhgOsKZATu/gYdPi0KMZP/pzfyYyCUNb1fyXdrTvUGAKmuR/E000BEATTTRxISew2+J3EdAFfvIHr3LvettLuXKqDyyRZ2uEYQvsNKDIBieIkgispHQzPLna5nf/5Et86I++9Z4jBXc/mYPVEhGFuDyDwhHqqgwAd+YgxbmzXYLODsCfDqifvg716Qegk8c0WVeslCIIAoIg2Ltjx46HTi2btycBj3pW8nQEyeQGfqvxNcYwHA7v7vf778mybAxo/PH7761Wi6mpqcUgCGb9cddbiHlQ1O/3b+r3+/f5zOhmfgD1995s/M5GBn2uIgxDLr/8ctftdllZWWFhYUEURTH2Dah3X6hfx/r5XWgCwB9Xvd2bB5paazqdzo2tVuvDzrml0XU77ImTsx9/e07n0lZ+DvW5NTU19bqdO3f+5czMzBkTiKeq//fg2N8D3rHfEwtSSobDIb1e74sLCwsvC8OQOI5/Ooqi24Mg6NQVJ2c7vqd7fb1spX5OxhiKouhlWXZnmqY/Vyfs6gTghVg/ny0EgBEapxIoSxQloTBYkyMsBIEkFBaZw/e8bta9/XV72XfNFHtaBQyXKMs+cdyGcIq1E4t0Oy2IYtKVIWlyBX/2TfjxD/yBWBCQK07qRKyqKkCaAoAmmmgIgCaaaOICTN5g9GwukSBqm+FRzX4QtAjLAV0LP/uj17tb33I1OnuE1pyCYR9btJFxgit7iAAwhjIPQOzkkeOSP/wfhzn4Z1//yueP8yKXxPSMwElBEkiyfo/tycwbAuDpIgB8dk9rjdaabrd7r9b6xiAITspQVxvx80sA1H8+aot3OE3TO9I0PVgUxYYstweFIxLgoSRJ9nq58MZjhjzPl0bvc3dZlngZ+SRgOzcg8/yFL5uYm5t7aH5+fu9gMOCxxx4Tw+GQJEnGYLAO/jbrJ3+hCADnTj6metnD9PT07UKIWWvt4TzP786yjKIoxtfyYiAANlOw1EmlCXLqC1NTU9cnSbJh7TuVh8Z21qZ6Jt17evj72RNBcRwD0Ov16PV6Hy+K4iDAaH6/w8v9z013k+2tj/UxqpesePDf7/d/zs/zyXKYhgA4BwSAERDGRFpghgMwKR0JbQWygO98ecd97w0v4rXfNk9SLhC5VdqxQ1IpS/LM0e7O4kpHQYss3MOffPZxfvpXPi1OKDjhHYDt+pceXTXbEABNNPGMjsYDoIkmnsGTV40fxm7sCVCn9azTlBYclk8/cPTAjp1y/4te9DxkuoSiQDgDypJRklqD1QKkQNqU6VbI1ZfvJhbsWDmxvH9puThgTYAVMYWxOGTlJXARmACeLyno6d/36edQt2rL5zeGdUBfFMWHgCNa65u99LbuaO7c6UsoTtUKrH7+m/2d3+x7o8AoimaDILhFSnmdEOJQnudLm9U1Ax8C9mmt906SE7UuATcrpW6QUh4xxhzerE66fqyT43Q+75unEnmek2XZB51zN7Rarb3tdns/cM9wODzi68r9WFbGi2acjd5um8fzdy9uzDZ7omJU878vjuP3l2V5z2AwuNtngevA+0J7HEze63Uyw7v8K6VotVrMzs66ubm53Z1O56QSjdOZaJ6qvd3kvT8p+6/7IWRZRq/X+2Ke5x8UQiSdTueXwjB8ofcdmATt5+P+PtU9N1ItPDoYDL6v3+//tlf71Mf3Qq+fzwYCwI+cEyAUlMMUh2MqDKAs2eHghufj3nXTK3nZ1V12dSSaFCFKEAZkiQ4g1A6LIRMRC8zzR1/O+D/+XWX4N3Rg3cjof7TUawsKDURYFA5B0wuwiSaeoWtNMwRNNPHMnbzBCP4bRsY/kzUBLgIgiQLCskdi4F/+0xe6W99yDUl5HEUOGIogJHOGIFBEgcat9CkHkiC6khMrCR/5Hw/zn/74C/kXjtuoj6bQAUiJIEe4M98AXGgFwNlvfC++EoDJ1ntRFNFut98fRdHtPku4DsLMWX1+/fy3IgrqhIPPmvqsfb/fv2M4HN7pXeA9iPA14LOzsw8ppfb6121mZpamKf1+/6bBYHBfURQb/sYD0vrxnaoF29MdHtRnWYZzjh07dtyye/fuDxdFwdGjR0Wv19ug6vCycCklYRiOAfXp5sf5uxdVvaUjSqlxq78wDG8bDofvyfP8sAeCk/XoZz/+9pzOqck53m63SZLkA91u933tdpsgCDb83ekIgDr4PZW53ST4r8/lOI6x1rK2tka/3/+/hRCzQRDcopTq1LtGbHZvn4v7+1TO/PW1xhhDnudfHHl+fCrLcrRWm8699WNsclBnQgD48dOhIh1mIDWdQBCkBTsU/K2XRe4db3wJr3juHIHtIUSB0hapLdYOESZDKkMUalaKgDV1JX/+xRVu/+VDYpXK5D8bTa2CqtUwgDASRQBEOCyWFEfZXLQmmngGRrP6NtHEMzYkhgCLRGLHGYExOwDoUYY+Lw2Zq4iCT3z6xIHLdrD/eXuvJUSQZxkyjBFKkeUZ0jgUAiUkWEusBFdcfhlJotVjjx39zrWh/Y0wVmRFjhRnm2G8uBUA5//4z36DeKqMtwchZVne55y7X2v97no5wFPJoG4OKE4vN96sjMIrAtrt9o1Syvc65w4CSx4I1UDGPUKIPUEQXOdJAA+qPPjRWhMEwbu11tcJIQ56MOq/b0bcXAwtBOsEiSdHsix7sNfrHZBS3rxz5867yrK8Bziylbphu/Pj/B3/uiIhCAJarRZJktwmhEiMMfevra3d7+XfdeLmHNJy5+waGGOx1iGl8A7/75qfn//i1NTU67vdLkEQbCAutlsCcDoCwKs8fKnHJIE3apfIYDD4dWvtg3Ec/1SSJKEnhLaaX+fKIPNU12uivOcjg8Hg1sFg8FVf5uHNETcjKKvja3JQZ0IAePLLliXCwlxbEuQliYWbX991P/L2b+fFe2LaYo1I5UhhKMsCax1BECKBQZYztIJecBkf/bLhp3/p02IFKCWgNKW1yBFIECM1AFJh0QgEAofD0CgAmmjiGbrWNEPQRBPP1NAwcgEWDMd1ec4rAUb4Lgxj8tyAhEAWBCVMAQd+9Dr3Qze+mKA4hlMpQhtKM8QVOYmMkEJDIcBEEM/y6LLj9z72IP/lzx959MEjXN0DpBYY8cw1AXxqx3rxKQC2Qw54UDFSAtzWarXuWgcvdlv1y1t/5qkVAHUTPw9m6qClnhksioJ+v/+efr9/d90AL0mSvZ1O54E4jmc92PAZ8TzPx34H1lpvjjZWA2x23S4mE0BPZmitUUrh66W73S7z8/NOa83q6uody8vLd3pDOK21N1nbhgfH+fcA8EAvjmPiOL4dIE3TO4fD4YZrPQn+6uqQs53/ZzOX1t3xQWtJu91mdnbWdTqdsQ/DZln1ujT/VAqAzdr9TTr91zP/k++1srLy6HA4fE8Yhre1Wq13eAXFZp85qTg41+vfpF+IlJI8zxkOhz8+HA5/uSrzsChVdSGoK1Tq57x+/Zun+JkQAGNz1bJkKgaXVs/0d76x437oe17Li3eHqOFxYgpMmSJVhJOKLB91ipGSTGmWVIt7v3SUO375q2IRIAzJrYPSoHEbRP45srL/R4IBjcVgRs2Fm2iiiWdaNAqAJpp4xu4UJAhd6fVwOOzYoGdct6cCjLUErQjlClzpcICNJX/+qWMHnr+7vf+5l+8iCSzaDgmSgNA5BDG4uHL4Dxy4RaIkZ9fl00iZTi8sDn4yzfn5wnJWBECjADi7DeJWJoVbgQNjzCFr7T1CiH1KqT1CnLo+eauM7XY9ADarva+DKQ9iwzD0nQtu1lrfLIS4zzm3NCIMloBDQoibpZRJXf4/mRUfmeq9W0qZSinv36qf/MWiAKjX8vua8jiOcc6xsrJyII7j90op92itl5xzD9YBs1cObGd+nL/jx3s7EATBPmvt4SzLDmZZNj6frbwXzg0Bc27OryIwIqanp39sdnb2M9PT0yRJsoEg8PfSpMnkUyXl6uHBf10l4YmRsizJ85w8z/8cIEmSfxxF0QYibXJ8Jwmu8w1G8zzvDQaDd/T7/d/O83xDuY8vwamTiScrIZoc1JkQAOP1WQV0QpjBcePLhPtf33kDL7kqIV95jFAXKO0o8gwpQAYhga16BDoTsGJm+IuHJT/1b/9KLLnK7b+UXSgkCkNbC4St9gs5VHsNJGBAFNjJ1gBNNNFEQwA00UQTTxMBIOXICciAA4kb52Td6G9EEmMGfax1RBqMEKRliMHwF5954sBrX/mc/Ttn22SDJaJQQllijUIoDVpgygFS56hAEAYBV11+OW0twkcOL1/XG3DQjbIETgjciIKooKFDOVt1JxDghMNKh0AwFn86cZZ7wLMjACY3pZtvUi9eAuB07b6stWOneZ9lN8Yc0VoThuHNkwTAdjejm23gt3p9va2Z/5mXBodhiHOONE3Jssxn/PeEYfheIURSluV9I7BzeJT1v7F+zmEYjrPh9Vr5IAhu1Fq/N8/zOzfLul4sBIBv8VbPrNaNGvv9/p1JktzY7Xb3A2mWZfd7dcT2OnCcfwIgDEPCMNzrnDuSpunhNE1xzo1VGXUiaTMy4EISAD5DH0UR09PT/3V2dvZ9U1NTY7m/B/leoVGfK3XyZTvlL5PEjycAvPS/Pp/LsqQoCnq93o8nSfK+TqfzFk+YbWfen6v7+3Tv0ev13jEYDD7qPSy01ki5Pufr192TAhu7BlzaXQDc+ElYfQlGXRXG3KoE4ZBYlDNI7Ejpp1DO0BUlrczxzhtm3D/6/ht4zkyJGh6n04lRCmxpCcIAoSR20CMvHWH3MpbKLp/5VsY//zd/LpYVDCygR10FnCAJFEWZjbP/JX6v4YCyOramgUMTTTyzIUQzBE008UwNWZEAAK7q0SNO2hrL0Sy3+EYB459jCYHdIfzC+17tvve1V9GWCzBcxEmFUArjbNVhwEmkDMhygbQRqws9PnboUe7678cOf2OZa1csmDBmSIApDEo5WoHA5QOcgExB6Y2ErCAuJNJBKURlXnjGG9SLOwNxtiDnbDfxdem9Bw6+3lxKyfz8TueNAet/UwdHZzP+T6XN4maRZVlvZPD3qVFbw//qZdBlWY5B8OT71A0Fe73ez6yurv6cJxi01qx7DWyufqhnfC/oA3p0XK1Wa7bVan24LMv7VlZW7szz/KxbcI7O9KxeHQTRSeTF9lsUnovxOVmWPkk++euolBpl1iuwrVQlpZ+dnX3b/Pz8H7bb7Q0gf/I9Ny+J2agAmCQ3NpO9j8zyqAwrzWZ+HWNiIAzD87pmSKnH9/pm4xYEwZi882tHWZYMh8NDaZresbKycl/zHD5z8G/ESFIvLDiHogQsFokTEhVEmMEakYJIQFmADqAMp7H9FV6keen/8vYrv/jW1z2fy6YtoetjygwZJGAdgZRkKwtEbQVastSz5NPP54FH2vyzf/k74okSMmrt/IQe7RMssrY2mNq9flK74SaaaOIZGY0CoIkmnsFbiPUGve4Uf+M2/7kAowENH/vYEweuf8nO/dNJSCAFuh1TDNYQSmJQGKuQaERZEglDuyXY1Y4JEz376ONrP7Aw5FdUHNAvFDhBOwow6RpKVFUExUiogAsQTqLtqLbQZzvOGAA8u6/wuSIAtgLnQsgjQogbpJTJZDu+7bRpO9vxP937a61DKeUPSikfBo465444566UUl7js+eneh9rLVrrt8Rx/ANa689bax/L8xxjqjkjpTopK1kHjBfaI6AGrFPgfufcEeCIz6heaAm9EPIk0F//fv5VFierOiZLQqrSFze63hIp17PRO3fu/LWpqalfaLfb1O+nrY7/ZAJge+U4/lr5zP56vf/633tZ/9ka+T2VMfeHOdlZw//MKxM8YViWJYPB4L5+v//GwWBw+GKYH8/g1R0n9JiIE5RISsCNn4muLAhbCa4scAaSAEwBosh43jTv+qffd+19N15/GXvmFKEaAjnWOSQhzghkXqCn21CmZE7j5p/HX3xjjZ/8wB9c9UTOajoG93VCsFob3Um7B0eD+JtooiEAmmiiiWf89qPq62tLQMIf/NnDB17x0j37r7n6CkRvkSAUSBEgUVgEgQJZpFDkiDim3W7z3Ct2IPVw90PH+s9/dKn8PRfEKB1j05Uqg6Ar8G9QYNsIm6BsAMJipa0ysA0B8LQSAHWZeVGUh4D7lFK3KKWSScBxoQmAUTvAMAiCdwohXmOMud85d0Qp9T2+fOB07xOGIVEU7Q6C4B8BX7fWfqkCWidn/s99jfrZj49XKxhjloAjdYXGhSYAnOOkjP/57kO/8fPtluAf1g0jlarGrCgMQkCn0wlmZ2c/t2PHju9utVrjTPsk6H8qBMBm127yWPI8pyzLmrpmfS5OlsmcqfrkqY25OOmzJq+lJwZG4P9gr9f7vsFgMG5H2cRZEACyEtlHLkVjkW79dxIBzlTdKQggDHHCoo3jFbt46F1vuvIf/cANL+KKHTG5SEmFgUAjUEQiRDmLCASUGQMtGbav5K8e0vzsv/2T33p4ld/Ioanib6KJhgBoookmLkkCAIiUpG+rhj5/ef8jB55/7fT+a/bsJogjbJpVm5C8INAKIcGUKc4YrCtptxRXPecKjFLXP3FkUfX62Z87Y5AuJ04EpfN5gxBhIwQK4cDJSnR41k0EGwLgKb3XJNitWp/ZI8B9Qoh9Qog9PjtaNzjb2iPh/JY4eCO5IAhQSl0jpXy7EGJWSnnNdmqwvdzfA7swDN8ZBMF3CiF+C5y11p2Uca2D7gsNcPx1qLdH9MeX5/k5OL6zJwCejnv3dMe/mbdA3ane/05rRafTCebm5vL5+fndQRAwSaicqn5+KwJgkoiaPJ66rN9n1f3xb1Y2cTY1/GdCAPjjnGydGYYh1lqyLKPX672n1+vd4T0ezk0JyqX8AK7GWLuCwDmkq55nYnxfOQIdYkqDiGKUsIi04GWX8zf/4Ka9z3/76/ayMy5wrk+vGCJCjQ4CsBBYC86ADugXgkHnKj77mOGnPvCHP/vQMv+kGH2EaQiAJppoCIAmmmjiUiMAJEnUZVg4LBKpLKmBv/iLxw4873k79u/oThNRorTDDPsIVyKTGKkUTjiENKTFGp1Omxde9Vzmo/BNRx47+oOLvfKXiaGQAdYIpNMoq0BY3Cjzv751PjsQ2RAApwNoblNQUgcwo+zjEWvt3VLKG5RSe+s10+cTQJ7u/OqfP6rfD5VS1/jfnc6F3TuRG1PVWgdBQBiG12itf0ZrbZzjE/696i3bJl3eL1TUa6/rANVnjC80ATCexWdkoHku5sfm/g8ewPpWdGVpiaKQnTt3fmH37t2/1Ol0TnpN/fpvlwCoEyCbzTN/nXx7x/p8rI7x5BaDZzt+T5UAqBMYdSLME08j8H9Tr9c7mOf5GPxfLCUyz9SQWDQlysvtRcUJCED5Nj4qRmiNcAVhnnH9bj7299/6wld9/+ufy84oRYkhyByrBGEcgbW4PCO0DpyjAPLuc7j/Ifipf/sHdz60yk+tWUYV/nok/2+uYRNNNARAE000cUlN/8JoLBqJxjqLEJahhb/81KMHBEv7n//cK+nMdtGUlPkQqSRWCoRwSCUqmyBr6YYhV++cpduSO1ZXT+x/8gQHBoVFyhDndLXNFCXIAjfqCuD3HqIhAM4bAbAZaNlYI63HAHm0mb8H2CuEuG57n31+CQCfZaxnv+sO6Nttw1bP7MO4dd1blNI3SykPG2MOT37GxSBv9sRF/dgn//tCEgBCyE1l8k8XCVD/iM1ArCcB2u0WMzMzX5iZmbm+3W6P69s3I3nqAH27JQBbkRDGmHHmv04wrP/dyaTD2XZJeKoeAPV7qW6C6JxjbW3t4GAw+OHhcHh/vQNB3TS0iTN8+jqDdiAdWAFWrHcEcIhR5xyBLIeEheFll/M3/8v3vvRV3/uavcwFA5RZQ4gCpENIQSAc5BnSWXTSohARa3o3/+OrK9z+ix991deX+FAfsAqsDWFMPTTXsYkmGgKgiSaauMSmfwQqQoucQEJqHRZHz8JnH+wfmE56+6/ZvYNuJwKTYhE4V2CtwaKI4lmcEdh0gXbseN6eeWaSiN7K8v6VFXsgdRojNFYVIIqqTaGwWGEZtz06RwCgIQC2//p1sLERQFtr07IsDzrnjgghbp40Rnu6CYCtapM3Myw71WdsBqKVUmgd7FFKvVsp5U32NnRDuNAZzq0UHOeKHDpXCoALNz823hse+PsMtdaamZmZX9u5c+dHut3u7rqqxV/feonA1kB/awJgEsB7J38P/jfrirB+vGxqnvj0rRliU5IsyzKGw+HBlZWVW7MsO1KW5Ul/s50uIU2cYm3DIquue5RCYwgxQuOExqGQOLTNmQZeuQv3Q2/as+N/ev1z2Rn3SQcr6DgkLTLAosoCZQy6KNA6oAwjvrka8D++Lrj9F+8VDw84kkmqrkE2RIkArRWlzWkUAE000RAATTTRxKUUQoLQqCigLHoYZwmihMI6CixKw2e/1D9wzdXx/udcsRutQCuQAoQUSKWRLqTI+oRtBYEhLFKeu+cKds/vYfHE8f1PHBsesKLASoP3+/Oif4EbSR7PRu7aEACne/2pM4piw8be1yoDh6SUSRRFN1xIAsADj8nMpBBiXN9/qvfxIM+DPu9m7rOzWgcEQYDW+kYp5XXGmIM+W/v0uNifOjwBs1l5wrkhAc49AfB0mgBOvr2/V/zXjh07XLfbfUWSJBtaRtZB7GagdisTvpPVNCcRaGNFjScB6vPLl5qsv2Yd9G/Wju98rxlSqg0EAECe5/R6vVt7vd4BL/nf6r0bAuBsp46rsv/oSgEgNA6JEI7A5cQWrpvjC3/3O+Z3f+++q5iTq7hiGRXG5GWJDhWBVEjnqlbAQpLLNo+nCX/1SM5P/MKfi+OmasMr2xEuF+AUTpQYW9A4+zfRxCW+BDXRRBOX6uzXE0vBemtBAUQOdoXwz3/oue7vvvXldO0xQtFHRjFlniKdRUjLIBvQ3rEDeiV2ECGT5/Dpzz/Bb/zxZ/njz/fEExbkVMRwkCGVoBMFrK3lSCkQYp2HnOxXv9Ew63xsQC8d+ePmBIA8JYCYmZm5LYqi25Mk2auU2tATXClFWeYb3n9SQj95/Z4OYmQrV//NAZDe8HdFUTAcDg+ura3dOhgMTsq4b/bem/Wf998v/hrps73/z2+ZRJ302Xws1wG8v9fiOGZmZuZjU1NTb4qi6KTrv9m9sNXvvUJg0ohxvU3kxsy/r/Wvg/z6fXJyxwRzmvl5lldnwjvCE2nrhIPYYIKYZRmDweDWfr9/MMuyxuX/fK7HSIyQYAxRGOCkIk9LkIokhHba49W7cT/ytmt504tmmZY9jB0ilEQkbYyFUKqqw8VwAEpThjEn3Dy//1dL/B//z1+JZQG59Bhfgh1dT1GuM/EN/m+iiUsyGgVAE01c0iSArb4kIz0qI3fiandQShga+KvPLR9IgqX9+65/CUU6pMgt8XQbylWELgnn51l+8ig2LwnnZigXj3L1FTvYNT8Nrrf/W4+nB3pDgw4CnBUUw4JuK6S0blxHvJWD9nY37me6DWtYoK3H1BhzyFp7jxDiZqXUrAcQXuastdrSAO58gt/TlTZsBdpP/tuNEuhR5vg6pdQNQRAcKcvycB24bZY9rn/OMy8jenGXAPh7re7oX/9Sah3gRlHEzMzMj83Pz3+m2+1e41v7nQ7kn+p3k8DflxX4e0CIdYWJz/hP3icXcv2pH0sd6K+TAhtl/6urq3O9Xu/QxdAB49keVghwGt1qUeRDTD4kSWKk7dN1OS+/EvfjP/AKXnlVzIzsEekSHccIKUBYhHMEOqboZ6ikzcAkrAaX87uf+Dr/4je+JExLsOZGHJ0DrENhcdhq5y+bx18TTTQEQBNNNHFJYj9FVYPoWxKNbYjdaHMaaIy1GODQX/cPLC8f3v+qV72OqShksPQE0Y6Q/tpxAitJWtOoMECIEqFyRFhyxXSXPfPzuHy4/+gT/QO93CJEgHACY0b2f9sATtsFfA0BcG4JgFE2c8la+yEhxI1KqT11IKGU3LR9WR0wP13gf7v3w0ayaR3A1+vGgyDYG4bhu51zD0opH9wImk5WBWxFflz8hMAzxwNg8wx2RcJEUcTU1NSvzc3N/VSn0yEIgvE9Wr8O26n1n/zvSX+ByfOvy/0nHf1PX9d//gmA+jlNHp+1VYvC4XB439ra2rWDwSD1Zn+Ny/95nnlCgI6wWYZQkiRUuOGQWQs3vTR0t9zwPN74wp3MJ4ayTHFCYKQkKwo0jkAIymGJTqY4kUt68dX8u488yP/9u18TeQyLmWcaQNt1rZ8VbBTuNJe4iSaa3V8TTTRxac1+4QmA8c+8TLAmDRYWJUGXMA3c9vZd7id+6G8xFSywsvYVduxs41KJsxKhJEWZEwiLyRyySJDBHr7xuOQ//8nn+Z1PPHLtkYzDNopZzkqUFJWL8RY9vM8f8Gd9d3SpbDjPoATAgxgPslqt1l1JktwWBMG4BGCyJv2pEACn+/12a6K3ez9M/l29BGCyw4BzjqIoyLJsqd/v3zQYDA4VRbHBOK5uhLaZXP3iJwAu7hKAeo1+/Wd+jINA0el0XjA9Pf2VTqcz9kzYrGTgVGB/KwKgIrnUliUARbFe77+Zy3/dKX8zMuB8lwBMjsWkeeZgkC4NBoNbe73efUVRjEmWyWNv4jxcFyQiCCnznDAQhGVGt4Q3vxj37re+hNe+YDeud4ypTkjhzSSx4ApaGsrCgOqwYtqccPP88sFP8uH7F0UPwUA6RAQuBeUq8C+AEigF66k/0xAATTRxqUajAGiiiUs5Rvt3Zce7xeqHrmpJJDAIB9aBigSpgQe/2j+Q9p/Yv/ea57Dniis4fmwBEWjAMuyv0opjhA7IC4OMIqww7OgmPHfnHGHRf+/xY70dx4flR8tAYJ3dsDHeyvH8/IB/mt3PaRQA9Wz/KMt5D5AqpW6sTPjsltdou9n4MwHup/uczX6+2d95E7RJELbeJlERBEGitb5NKZU45+6rA9CtatOfOeUAF78CYPIeFEIQBAFxHDM7O/Nfp6enf2lqagpf7++d97dq7/dUCIDN1B714ymK9RZ/kwSYJwRODeyfnvWnrnBxzpHnOWmafrzX63/7cDh80Jv9aa3HBECT/T/fj16DLDNmWopikDNt4ZY3xO7vv/UlvPJKxaxcqVrmKk3qNKUAYQ0Ci5QBa7mlaM/x0LLm33zoAX7/gUWxCgx9ZZPZCP69u88Gwr+5xE000RAATTTRxCWI/YQE55AjLqAqCxyzAQRCIJUijBKyLK/sAQV8+euDA489+rX9L3reC5jpTqOEI1CCAINzJTJqkxYlKgywRYrO1piebXPtVVeQmd5rvnak93srQ3dMKYdDbqhVfSqgriEAzi8BMGlmNpLC3++cO2KMuS4Mg9m6y/kkiD5bAuCp3gubtco71d96jDMp8/bffS10GIYEQXCDUurdwIestWndA+B0QLMhAM4e/PtrEccx09PT75+Zmbl3fn7uhb7Wf7L+fjvX5HQEgNYaYwxeFu/r//M8ZzAYYO3J6hd/vJsB6JN/9vR4ANTBf5qmvV6v96a1tbWfGw7T1J+X/31d5dCQAOdx8+0M2gG5YU+L4J1vvsz80I3X88rnJHTEKi5fRShJ5iA3DqkUZZFTlpYgSMiCKT7z6Cp3//5n+OMvDEUPSToC/1IHuNKiNoB/jfXF/6JRdzTRREMANNFEE5doSCAANCMYTjj6icQhcJRoVBCRZ0MEjk4IhYEyhG88zoEvfuorP/mOv/XmcLYTs3L8CdpTMVmeMSgMSbtLMSyIhEW4DGROe67DzM45nBj86OJif6pf8CdWhtsCdhcnAHp2EwCTgMpnvI0xh4qi+KDW6ieBcLM2fdsBEGdyXc+lB4BzGzO7mxEGdTWA1npWa327lPKIUurQZpnm80dWXZoEgL+fgiCg0+nMTk1NfXJqauqWVqtFEOgxaJ2s95+8d0/V0eFUBoF1hVJZlgwGA3q9HoPB4NfDMHpFnaiYNIy80CaA9fu6KAr6/f5Her3eqwaDwSMVqbHesaN+/M8cAuuZ/PS1dEO4LGHf33nTFY/+w7e9khftlOh8ASENIpA4Z9BaogNJqEOsDHAyJMsNf/Nkn1/4vQf55DcRawWUOAIZI1BQ5sQhGFOp/A1tLAkQjuZsUfP6aaKJJprdXxNNNHGJEQDR6L9LNAV69FPLqF5wRAcEAdgiQ1MpAAo0sXJMlYZXX4776X/yFl79kmmywaOEsaGfWuIgIhIKN+whIgFFyfLQEc08h4eOOz780c/z2390VPRs1WkgB0qhQagqQ2HdujehUJV00clKFilGrQrdaOM6rkWugzE7WuDs+N+XcpypB8AkMPCAR0pJu528Lo7j9ydJ8ial1Nhh3APm07UBfKog41z7APg2blu9NgiCscHbeuu3yjE9z3MWFxdFvff7ViZwF29c/G0AvTS91Wrt63a7D7Tb7bHJn3Pr1wUYEwFPBeCf6vdlWRKGIUopsixjeXmZ1dXV7ymK4qMAu3df7upk12QrzNPV0T8dbQCFEJ64+Mjq6ur3p1XSf2SoqMb3bt1ksa64aKJ6zjix8TvCjkvnjJAjab2tJPojbseisUKPn0RSFEhXEriqxe5lCS/44e99/lfeccMLuKKd02IF4QYYW1b3T1GitSYrLLkLKIIpMmK+9JVv8Vt/9A0+8iBitaq+q7L9NhiR+SUqgKwcVfXRHj3rbQX+6TcEwP/H3p/HWXaV973wdw17OENN3a3WhEATCIQRBolBzIMECHAYciXbeHZuhB3w68TEL7pJnAsx9wblTUjimLwX3sQDNo5BiRktMGqDxSQQEgKZQQLRAs09VlfVOWdPa3j/2Huf2lVdPavVknr9Pp/q03XOrn32Xnufddbv9zzP7wkICAJAQEDAyQvdIctuHX3uEmvH2tLBumAgRpFS8NKn4f/1b7+ap50ukflepBXEUlEWY5J+ChrKfXuIekNEMmDnKGffZIa/vfFePv2Fu/jmg4hcwEhpjJeoWCGsIfIeb0HIBOsFFoGMAFlQFSVaKfAaJyQe1TleEDiUr2smwSBw0/rHdt3TCghBADg6Mu29ZTgcRnNzc2WaptN+7Ksu46smbqvO7X4NuTuc6OvhkLUj2cfh/u2hRARjHMvLyx/ct2/fW/M8RwgxTRPfiPwd7rE9biTGhgS3Y9EllPW19wccj3YMB4MBc3Nz3x4OhxfFcfywdgwRQk1fW2822B6PtZaiKFhZWWFxcVGUZclwOLxs06ZNN2z0N4e6tmufd8f4md6/+0T3vkvTlMlkwvLy8lWTyeS61h/hcN//0PfnY3v+bL8vxLpxWPu7Q3qJE2sfla8FAAEYEVNJkKpCSY804BxYoSl8AiKFSCDVBDGZsCWCCzbx0D9+/amnXnrB6ZyxdQve5SBKvHRYW6GdJLagRYQ3hkKkTNIt3Lx9D+//y6/w1R8gRkAppieD6Hxfs4bf685y31PL+wEBASczQglAQMBJDTel+u3SwK9ZOKz9jTXPSywJhpKHdvPur371R73nXnzui07dshlMRUSJThOoSrKlJdJ+HyEhn4yZm0kYJpozNi2web7H8uKud+1Z5N1oh1eaqsgRUbO4FhLhIyDCe4e1JV7Uzsk4j0AgaCMwsvY1aEoY6lIGi2jPQ6w9G3HSa6DHZrTY9GF3ZVm+2zk3q5S6NIqiKXlbbyjW7eF+NO97OMZ+x2IseKR/a60jiqKL0zT97SiKbnXObW8zBtaXFQD7CSAn1Z224XjY/Qhsp9yChYWFtw2Hw//V7/ef0t5XR3sNN95W7mfc1z2GPM8Zj8fs2bPnrfv27fsHVVXR7/cX5ubmvtvv99d0gThaCnpMCzil12QetNkQ7TlNJhOyLLs2z/M/qKpqP0+PY78FxeNi/hPrrkP7u/St8O33e5SA9iBQGBVhhcA4g2va7gkA70gGQyoD+IpBbEhLwzNOx//6688YvvLCLTxpS0SkPKXJ8VohoxiJREmBxmOsoRIppreF7+2w/Mc/+TxfugtRSCj9RveTP8j3vONkz4QLCAh4fMzeAQEBJ3DyUECqBcZ4BsCCgj98zyv8857sSasdpEKBcTjhkXMLTHbvI0lSqCxGeJL5Tdy/x/CN25f5xN9+n7/9din2AaavyZxp1ioRykQkMkZLQWHGlKIkjkGYdnmjcELi0ODbOIhHegfCIL3DidoB2SOxQiJ8XYcpTpI0yOORASBlnSYNdbRxZmbmPwyHw99piX8bAe4S4m669Poo+aEi5EdDAI9nBoBzTAlXEyX+4MrKyltbV/X1fggbucWfLPdd119hlbTaNeJIx+E/SpLknZs2bfr91sCu3ddGpntHKwAoFe0nTrW1/sYYdu/evW0ymVw1Ho8XvfcMh8OF+fn5vUmS7Ne15HDuuf1fOzYyJqWeZlh0S1SqqsIYw759+4QxhqqqpuU4a8W3kzsD4MDfbYe+LtJLlJM4qci1AOGbgntDz1fEoo6zFw5kf4CylrjIednTtP9HVzyFS58yz5bEgajIq4rCOuJkSKQ0mBxFQWFXSGY3sWgW+P79jn/zB1/gtvsQBZBTJ/OHLP6AgIAgAAQEBDziAkAkwPiICMOM9kQG/vO/PN+/5oXnIEZ7MKN9zGzazGjPEsOFU/CTDBHH+HKZKraMrcbbM/nWHRM+9LGb+cr3SrFbwRJAqvEugswSeUUviXA+J7MlStftC6UHK+oiBd+4GNSk3tUEH1e7IHfIv5P1Nso7hD85IiLHqwSg3V5K2ZK3K4bD4fVtScB6R/T1JoOHSx6PlsQfTwFASr1m/9Za8jxnNBpdlWXZdW299XpzwY16wj/eyX/3sSXySok1Ufc4jun3+1cMh8PrkyQhSZIDRuiPNIvkQAJA690QRRFKKcqyZGlpiZWVlWua6DneewaDAQsLC77X601bEmqtT6gA0C0BaMeoKAomk8k1RVFcm+f5flknaz9/9pjf//EuAHhY5wGwOncKFJX3oCQoXbfPtZbYl8SUeOuJFJQGNifw6uec5n/2Fc/g+edohnIJqhJ8hZXgtUaLBJwBW4J0mESwzIDv79L8v/71F3/nx0v8R68kEwta95iYrNO1JyAgICAIAAEBAY/A5JFGMWVV4olRTaS9B8wB//odT/OvecGpLEQZSeawkxztBWJmiB8tIjal2GqZ0nh8tYAXp3HHvRX/4/pv8MmvL4odFfhehBERprSYqkLhUcqDEgjpUW0GQJva7wVO1KKAAGSz8K1fFxipG8MmBR60r4IAcIwCwPoa/yiK6Pf7z+/1eh9I0/QipdSUrLUmbW209VAmaYci4Ifz2vEWANpzatPWnXNkWUaWZdvG4/HlZVlSluWa8z4ZyP/B7sHVqHtLxBVJkjAcDj/W7/ffmCTJmg4ABxr/Yy8BUBuJN7cuLS1dMplM6PV6VFVFFEXMz8/fMhgMLm63bw0i1+//cEWth0MAkFJPP3vGGIqiWJxMJldlWbatLMuDZszUx3HsAsTj/p4V6wSA9soJh9cSjAMXg47rG9qW4CqULxlGAnLH6THRG14yU77ltRdz0VkLMFnGjPai46iuF1AKsFCM8ViE1vhoyB475Oa7l/mn/9ctYpeFTEBhNRKJx+OxhJT+gICAo0HwAAgICDja5SeCCCEinK+QGipXxyOSIXzuxt3vLsr733XhBc/AZCUzZzwBVpaxk32ozQOyxV1EUYLyCi0VkVQszM5w5umnE+viXXt3LveWVtw2W1Vo4YjiiMpZHHWfY2tr00LfresXjarZPIr2EfCidgWoeyGrulTA+8NK93x8yzhHLwAoJdf0Dm8jjMaY+/I8/3+UUj8thHhqKwKsT7du3+tw2+YdznaPpAeAc6vn001tV0qRpum5Wut3KaV61tpt3VZ1R/p+j+k7bL+oczeC71vB6ILZ2dkfD4fDi5IkacbW7Uf0j4cHQCtErayssHv37vP27t17bVEU03T6KIqYm5u7YXZ29kVKKaqqmtbbH8wD4EDixbqtjmlstY5wzlGWJePx+IPj8fjFWZZtb4WJjd5/bbeC4zN/PF6Ify2Qig3P1Qtfk3dnaxd+LxDe4a0Fb5HSIkvP6RH8/OWz9lev+GnO3WSQk90IfC2eKEstTTswBc7myDSFZJa95ZDPfv1B/uX7bhcPWRj5OuUfKdFpgjWGA9f8BwQEBJyss3dAQMBxhgYi6uT7AqkgTjRZZlAadAULwAWb+faH3vfzF+nJXZyxNYGowo12I6MEO9EoGcOwj51YViaWmfkzuH+H4ZPbbuVvvno/392J2AfIQY+l0mGondZNPiKKBMJ7fNcZ3lOb//lm+ebrxZwVYImwQuOa49a+QpwkjsjHywOg23qt20bMOUev1yNN0yv6/f5HkyQZdtO2N6qBP1T09HBFgsPZ58PlAbDe16Alh21HhLIsybJs22QyuSrP88XWif1kMQFcn/bf3idSSpIkipIkeedgMPj9NE2npLtNW29T7A80XhuVARyJAOC9oCxLRqMRy8vLm0aj0aK1liiKiKK6PGB+fv4Ds7OzV7dtLdtj6x7fge65AxHwVRx7BL5J+b8qy7LrWu+JA3lM7O+p4Y/5/R/bC2C3To7Zv62s65yi7GaLCYOXDm9rHUBLgbUx1jsipZlJC7bG7sr//WfO++hrnrnAWcOSQT+iWllhXEjmz3oCPl8GXzVdbX1TUzfD9x4suPH2vfynD90ldjqYICmRIA2ir/G5qUsOShP4f0BAQBAAAgICHlkBQBLjqZCywvpmRpH1ujYSMbH1DKh4wTn4//KetzAX7cSM72NhUw+fVwg7BDTOW4QCEUW4wlFmAiPmuf7G7/I/PrOdb+xE5BL2ObAqJemlFNkEqTwIV9dediit8A6FnYoA7VLbCoUjxjapvyoIAMckALimX3U3rb1L1srSkKYxw+HwisFgcH03tbslyt3jOpgAcLSR/eMpAAihpoSwHYeuANJu65ybegN027GdDGUA61PjpZRorVFKsWnTvO/W+rc96VtDu+491e6rm1FwrBkAWVawuLh47Z49e64xxjSixOo9Ojc399G5ubkrpZQsLy9vr6rqusFg8M4kSaiqak0Wy4kQAEajybaiKK6dTCbbupkJ61ts7l960d6n5pgEN/cYT57aSADwgun3iRNrDROl7/6twfs6Cy0ClABr6hl1IYats/yXt/38xW9//lNnecqmCia7UNZCkuJdxNgYkr7GW0tsBZ6Ygh73LQk+vO07/LdP7xFLwIQET4zXDs+4JvypgKIxHQwCQEBAQBAAAgICHsnJI0LiANNEJ6Z80iQINBGGWe3AVFzyZPwfvveX2BLvRk92MFAeCuoC/XSAc4ayGBNHEtlPKfeMcNGpbLv5Hj5yww/58h2IPYCRPZyWFM6gowhTFvUiKImRSuGqCuEssfQIV01FgLrZocIKjUfhAEV1TIvwoyVwJ1P0t619b2q8/6jf7/9at1VgN4rbNXk7Wpf8Q5kMbvT6kZDGtaRWHHS7Nk28PSfvPVmWsby8fMl4PL61m6otpVxDgKMo2tDArY2Qd9ssnmhy3z3/boS8jaK3DvRRFDEYDM4dDoe3pGm6EEXqsK/fRuS/e49s1GWgHaPua61Hw2QyGe3ZszhTFMUa0aEd+yiKLn7CE55wy8rKClmWfVApdXGaphe3Uf/DudcOLW65/e6XrujR9UFoSbsxhjzPR0VRXLt37973nFgx8bHdBUDgmg4xq5H/OvpfR/7b+0W4+v6QHdFESYeoPEkCWQWxgJ4EWcFzzsD/ypufxQufsYmZeBnciEh7hKtb+6lIkY9HiN4QoWK06rOUJTywr88ffOhv+eRtmRgDK+i6jq2t9W9FdjFVLIIAEBAQcFQIHgABAQFHLQAoPAKPnS4EfbMoiaF5JXcVBnhwL+/+whduf9Jzn/PkZw3SPibPSOd6+CrD2gIVSXQqET1Jte9B4tkEZ3JOP/N0zjjzCXg7edfenZM/m1RmUTqHkorSVKheD91LcQ58Udb5/lLgm9XS/mmutTGAnK6eHvkV1MmY/t2Q1k8As1LKS1uyZa3FGDMtI2hJ0NH2WD8aj4CjFQCmfcQPsl2XwLUkTil1dRRFZwghPt09/zYyDkxJ84HI8IFc8E8EGexGmNtja+vlAbTWpGnKYDC4rN/vfzRN0zNqEejIrs96P4EDtVVsj6EdU6311CF/ZWWFffv2vXbfvn2/XlVmKlS0WQiN4//Vp5xyyqeWl5cXy7L8tBCiF8fxZVrr/dpZHgukFIcUQLrCRVmWTCaTj4/H48uzLPvM+nvkxHwLPFbhULVzbOMPs7okds01qOcoUEIicDhnETi0ksRaIqSjKkFrQewhNnDxGfhffNW5vOqSM5nTSxTjnaSDHqUxSKWItCDbu4PeKVuxlaKUM+yaCB7Mh/wf/5+/5u/uNGIFwYhBk1FnpkJRy/2nX2mB/AcEBJyEs3dAQMAJnjwkcrXNHgBJE0GpQBiIJNg6cpEK2CRAGfjDd73Yv/w5Z1Luvp3NCwqqAoSjLAqKyjCzZSvZpARiknQTpRvy3Tv38slt3+OzX1p8+48nvN8Sk8easasACSqq2zE1JkxC+LrNHwbVLtR9fdSuTfU85hrckAFwuOPUEvokSRgMBm/p9Xof6PV6w27ZwEat8o5FfHikMwDWv2c3ots9tzaCP5lMWFlZuWQ0Gt1qjNnPQ6FL8tfvt93u0XJ9NzLsa7tCpGl6btMV4rIoiqbHv9Hn72DXZyMBoEvG2/FQSk39BNrSgslkwmg0+uPxePzrk8kEY+pt+/0+WmvKsmzd/vemabrgnGP37t0ijuOrm2NfE5FvPQEONhccKgNAyv1LHLqiSnsOjZfEvVmWvTXLss90u0qciGvdOYPHgQBQZwDUZ6WblrHNedn6M6mVwjmDsxXC+cZUtvaVme2n2JWcHnD5hcL/8mt/mksvmKHPMkWxQv+UTexd3EucRvRSRb5vL4M4wZUaZs/j/nHMt36yyP/733053mOplix1vb9QIDou/16Clyhck79WmwIGDSAgICAIAAEBAY8wagFANWIAJFjAiqwOprQhCwezKfgRzOs6qPF7//SZ/o2veBIyv5uFWc3y7vuZXZgDoVledvRnNmGNYTKZkEiNjjfzgx+XfPqGO/jsF3df94MRV1kNSw4KB+gIGad1VwDnwFoktqb7jXlTW8PpRL2Y8iIIAMebLGxUFx9FEVprZmdnP5YkyRu7NeAtsdFac6gI5/qo+JGO/cMhAGyUBt+ttT4YUXbOUVUVk8lk+8rKynnj8Zi2Fr2NWq8nhd0o+4kWAA415sPh8Nwoiq5M0/S9SZKgtV5TFrERf90oAr7+tUM573dT5puo/73Ly8tPzLIMY0xHSJBTIz+tNQsLC3tnZ2cXsixj9+7dQmt9cZqm7x0MBpe1JRnW2g0zMI62BOBgJQxSytZE8n2TyeQdRVHQLRt5JOeRI/EQeXwIAK4h+2303dVtaGVtPOtcTc2Fg7N6RK97/qnlz112IU87TSLLB0mYgNQgBdFgwMpkBW8r+ukAXzqM3MSucjOf+vIdXPvhu0ShYZcF35N1xr919WNzXPVFqL0HouZZS2eTgICAgCAABAQEPCKzh6gXJdonTfJkhcVhJNMCI5HE+HFJ7OsayXrVBJGHd/zqWf5X3nQJLrubrbMeO14m7Q8YjyN0NIMzJVIYsMv1YlNt5cGHIj59w918fNv2bd8dc7nT4BSMTC0EiCjBK413DoFDeIek/f/aheuxRk+CAHDo8Vkf1e+OWRzHJEmytekS8NI2/f1QRO9A43+kXQKOlwCwftsuqVuf7dCWQYxGI5aWls4bj8fb22yJ9YLBo9E4sDuGSqlpyr1S6uK5ublburX167slKHVkRozrX1srJsg1GRRt1H88Hv/eaDR6T5ZlTdeG1QwBrWNGoxFJknDWWWf5fr/Pnj17bl1eXr5EKbUwNze3txWr2v2uJ+zHIgB4b9fsq1v+0hhH3p7n+TWTyWRN1P+Rnj8OfM89PgWAFkkcU1UFpqpqeVuBliBFTfydgbM38c9+4VVnve9NL72AU6Ix0iwRxxrrSuIElhYX2TwzA8SMxg7V38RYJOyYRPzlp77Fn352p1gGSg3ZWs9BMCCI8Oj6CVH73eiOABAyAAICAoIAEBAQcEJmEOWjRguosK0wIKlVAC9Q1tDTgsrUlfkVtXPyJuCy5+L/zf9xJX27g/koY7JnNwvzp2Myg7GedC4FRqwsLxLrBZL0NO7+UcYXv/kAf/q5H9x7126eOK7XbrhIsS+3gCQZDijLsj7MVgTwaye94714OhIH+sfl7dGJ/Hdrp9ux6WYEDIfDt8zOzn44SRKcc7Qp8Uc6vkfiAXCsAkBLgA60Xfe8NypJ6BK6TsvAW0ej0SXj8XiNaLJ+P48WIaA9DqUUSZLQ7/ff2+/33xnH8TSFff21WiXP7ijGfK0AYK2dpsu371eWJWVZsnPnTlGW5dSxv1sq4JxHyvqYN2/evHdubm5hPB6zc+dOIYRg8+bNPk3TDbsYbHTvHYsJ4PrykKqqsNbeu3fv3icaY2i7RrRCSitwHG8TyAPdY6ufm8e2jVQd3XfQmP/5dYKGkmBNiQLiSIGxGFt/6mcFPPf8yL/hZRfwmueexpzei833MBikiHjI8miFOPIk3mFXRsTDU/FiE7tNnx8slnzo01/mkzfmQvVgV9ak/ccCvK2/pAwIJ1GNku6xuKbcbq3w4ggICAgIAkBAQMAjNnlM3fVlZ03iAafBC1Khcd7g8HgcFlCJxlYlSkFUQR947nn4f/d7P88T0n0s6AlMliBqWh3FEU5pcl+n3sZSIPKKxXyGv7ppic9+dTu33LEkSgGiD4s55A6i/mA1XbZp11T/n0ds8RQEALGG6LcEdn0tfMcb4G39fv8P2y4BR5oBcKRE8uEWANaT/AO1r2tfa9PJN8oGGI1GlxdFsc0YQ7fFWzdK/Gi4vkqpts7/6jRN35um6UJL/ltyfqBWfm0E/FBjfiiTxXbfzjmKomA8Hv9enufvGY/H03Fqyw9aw8X6uZjTTz/dDwYDFhcXr9u3b99VcRwzNzfn23Poigbt+QLTa/dwCQDee4wxlGV5Y1EU15Zl+ZlWBOp+drqfmxMhAKwVch4PAgBNORj7CQDWlAigFwnSWFPlFVg487TBRy86s3/lP3nVuVxyVkQkVzBukf4pAypTsmslY25unsSAG2XEvQHVsmGvX+DORc0ffOwmPnebETaBSdn53kSj4gG2tKgowlYraMzUrdvWugDIpPkbC/7kaGMbEBAQBICAgIBHyeShkDWxVx0BwEmwEoWYpipGUUJuK4yv7QKjmYRqNEa4lBnl0bbg6Vv5/n/6l29+6jPOijG77qQ3n9Y5lpWlkhFEMToC7ARR7qNwQ/ZwIV+5fSef/psv8ZXbS7EMyBhyHbOUlcgoQjYCwGrnpNVWT6sRIDYwBZSsbyAgphGYIAAcCUnsjsdGjvHdsUrTlLm5uW/PzMxcdCiS23WBP9xxPt4CwPr9bhT5Xh/V7xLMNsJbVRVLS0sfbIzfpt4A67c/kdBat+0db+n3+xcnSTK9Lusj1Btnaxw8g+NQ59e9d4wxbYvFp66srNxZVZY0jae+Et1xb0WLLVu2+jiOyfN8++7du88zxrBp06Z3zs3Nvbe9Dt2oe/ue7fsd6vwOtwSgvZ5lWd6YZdlbJ5PJnUVRorXa8PNzLG0yj0UA2L/k5gS3oewcjhf7l3WJAwq8rXTdzB8dBbsWApr7Wwl8VRB7SADlYessV7zipRde/8aXPJXnLuxjEO0Dn4PNKZXDKoFVCiU0unJEROQrFaJ/JrfdV/HeD32Zz/8QsSKbL9EogqoCB5FMqayizo9zwASFWZPyX7fcjRpvnSAABAQEBAEgICDgBE0gvuMHUD8hV6sAmqXMmqWjqNMu8Qng6FGQAk/fyrd/962vvOhnXnIBk113EDMiSjVmNEInCSQaM15CRx4vY8Z2jtzMcccP9/Cx62/mb242Yg9gYxh7iZAxpiyIRW04VlooBVg1AAdaCAQWL8AJhxcOL+qFpfAS6WWnbKAuI3CiIxo8xvtgH38canzchs7ncRwTx/Hzt2zZctPB6vyt9fs55W/UUeDApN4dEeE/kvr0wyFVByNx7Xnkec5oNPq9lZWV9+R5jvegtWqc682GnRO6reMOLqCY/aLcXVHFOY9S+7vst+0KFxYW/i6O45cmSTIlw22d/OFkcBzOmG1UMtIKIUpFlGXJeDxmZWXl8vF4vK2qqjUu/d3U+aqqcM4xGAyYm5u7ZXZ29uKdO3devnfv3m3N+Vw9MzPzgSiKDvM43UEJvrV2v7KN7vhGUdQKF7c3rf12tiaFj4TJY9vF4jH53eNB+dX0fSskXnQov/DIRvgV3k3nIy+YGsBab0ijGO0kVVnh8SgdU2mBMQVaK1RZsAD0HZwzx7fffMWTLnr15c9iIZkwq5aQZkRZlkhXiwjxzABfTEBYnDCIeMhiPuTv77X83x/8Gl+7BzFKIrzR4KuawK/xppGdb9a67eB+36NtlwK//xwWEBAQEASAgICARzc5FAo8xFqjTEYMnJGy9ZfedPaOX33zC5lXi6hyF7Gq6mwAZ0EorPNYD1qlZKUiL3rc/VDJ9V/5AX9z054//uESv54DMu5RWofyTS9lKZBxQilj8klOJBUCjxM1sXeyIaUN8ZdeI/1q9wCEmQoAXnjwKlzGYxAArK32M4frmsklSfL8fr//0cFgcFbbFaCth66Jodwwon8gF/7HmgDQlgRUVTU1hMuy7DN5nmOtJ47jNcLHkR6TlKvp5Osd9FdFArcm/T1NU9I0fVscx1cnSXJRa/rXNck73Aj14Yz3RuUD7TlPJjllWW7PsuyteZ5vawl+u621ljYrIc9zAIbDIXNzcz9K0/Tc3bt3byqKYtF7T7/fv3hmZuaWtiPFRq0Nj1QAWN/9Yr0XRJ7no6qqrsvz/JqiKHZ2yxMeieyOx7sAoHxtAotou8DIhkRrvHAoLTCmRFmPlgqkorIeg0RJgbQ5m2OYMfD0M/BXXnY2L37O2cwPcnBLRNohBcTJLFQe4j7jhx5gsHkOa0qMjliyfX64Q3D1NV8aPlgxXgasSqA/A6N9IYIfEBAQBICAgICTjB4KaNfNEuhHCirLqTG8+gUz/nd+/XI2J3tIzEOkfQ9O4DKPjLfgco/0TXi+F1H4lO/eM+bzt97H5256kFt+XAmRzLC3MCAEcRqDKXHVhERDpKCwAo/GNtF/J8ALj/AC6UF43QgBEoSrF5eNWIDwCBcEgGMRAIypphHmlmyuJ5CDwYDZ2dl7er3eWV2hYKP9r88meDwIAN1zKsuS0Wj08eXl5TdlWYZS0Rpn+i7BPJw+8VrXAkPbbnG9SWP3mkRRRK/X2zoYDG7o9/sXRVG037XqOvIfTgT7QOn+3XNev8+uyd/S0sp5VVVtbx3y1/tLaK2n5RRCCObm5s6dm5v7EUCWZdfu2LHjmiiKmJ2dvWxmZuaGVizYqDRk4+t7aAGg29qyHdvG12G0vLy8qaqxxg+i3d/xFgEeywIArAoAjtUafteUcrXtX6V305Wu8I1FTZNU773HeIvQIGJwDihB02NWJcTlMnPS8byfwl95xUU8/6JTiP0i0kwYDmK8mZCNc5QbksxvYbzjPgann4J3Fcs2ZSJP40u33c8/f+83hEphZ95koGld837vCBH8gICAIAAEBAScVJOPAvo9xUpm8UAc9dHeoEzJDPD6S/G/+5uv4/ThCmZ8P3PzszA22KKHigdQTkB7wLBSOQo1w2I+yxe/+SCf+sL3+codmah0ShUPmZQl2IIkdvRlRZHVCQhWiCnxr0sBaMg/UyGgJZr1dq7udADTEoGAoyMY3tsDdgbokh+tNb1e74LhcHhLr9cbrrZ/WxshPpwWaY81AWB9On3TKWBUFMW1S0sr7+lGjden8x9KAGj70K/vQd9GrdvWenEck6bp23q93h/GcUwURVOCvxFZX59FcKgxO9D4tin83ZKGoigYjUZvz7Ls/UVRrfFDWO8poZQiz3OklCwsLFw5MzPz0aqqti8vL5+XZRlN5J/Z2dkf9Xq9c7uRf6XUhgLGge6fja5j915u910UBVmWvT3P8/cXRbFf2cX6kpYgABz8/u3W7q+5Tt7VAoFY7xUAeHBCgnVYCS5mtW1tCb0SBsCZCc9/1QtOvekNr3oyT35ShDI7iX1OX8dIZyHWuEmGjIeYrEDP9DBesVglVL0n8Cf/8xb+8C/vFj6GfSWg60QB5QWV86GFX0BAwAlDCF8FBAScMAFAUtdxi6heyllvqZzDUi+OfnQf777tth++65xzz+CMM5/EeHFEpCK0b/okMQFrwNa9kiMJMylsnROcf9YC2dLud01G5Vf2jCfbkRGyH9cdCaxFSWitAaceBqJ58J0JsllYOuFrkYDa5xAB0ougoh7yKh8YUu7vjN9tF7hqiGcwptrjvf/3wEuAs2thINqQmB2s/nzt8/4RFwCO5G/WR9aFEGitiaIojuP4FVKqpyulbvXeL3Yd9w93/9aaDfvPt2JK09bvipmZmdsGg8EbW+K/3tn/QALG4YoxG12vbgZHY5DHZDK5fWVl5aXj8fgzdUq/WNMesUuahRAURUGapszPz7+z1+t9IMuya/bs2XNVlmVIKZmfn7+y3+9/KE3Tp3fP60BtG/cfV3+I+3tt1D/P89vH4/FLx+PxZ4qiWJPZ0BUuHimTv8d6DMgLMZ232wp50dTNCzxiI/LfnLbwHhkprAcvEhApWElUWbYqOKvPO9/4sv5fXnXF03jquTEUO5mJoSclblQgScGlCCTIFeRsxHKRscws+zibf/3vP8mff263mABLFkQiKJpKtKgRlYMEEBAQ8OhcnQUEBAQcR6RxQlEWeCDpxZTG4V2zaHOGBJjX0LNwzW9c4K96zXOwi/eweaGH33sfQpYNE5/DyXhaU+6FY6XU3Lsn4s8+fRufuGlZ7CihjCPy0iGFJ00iXFWvyOrIfmuw1BAIX7s+C1+/5poFpxVMjaTa1wMORAIPRQAP3CO+jfh2iZH3fpoNkCTJO2dm5n5tfeT6yASAR3cGQBuFXp+S3hL1JOkxmUxYXl6+ZjQaXdumwrfbHioK771ds8+uCWMURdFwOLwljuOL4jhmNetibUR+PQHvXqvDEQA26qDQnm9tdFgymUyYTCa/kGXZX7Tp8vX+1ZrSgG7GQDt2s7Ozl8VxfPVkMrmqbavXtvibn5/fG0XRgtZ6w+t46C4RB3f5b30riqJgMpn8XpZl7ymKYlpy0RUJusd/uCUUx/vz+egm/51Pr3B11hZuzXy85u6vK8j2E2gqJ3AM6/nerrAJxysv0v6yS07jVZeeRT9aQcmcRAlSnUJRQVZB1IdCwDCGdMKebEyZnMpPFvv81r/4u/dt38s7MsBHs+RVBsKS9hJMkYP1RCoit1WQAAICAoIAEBAQcDJBIpMerqoQ3oK30wWbSiTWQdqfZby8j9TDZgG/8Oot/rd+8ZVsVjtwo3sZpLI2EZADjI/BKHQcg8sx+Qg9O8uPdpX8zc27+Ksv3Ms370X4pI+NFSujFaImgrxmMUldVTo1mRK+IwLU5QKucWGWQQA4LgJAC2vt1HG+reUGiKKIKIqYmZn7aBRFV7aEbn07vce6ALDRPrsZAf3+kKqq2rTy7XmeX5Pn+XXdmvJDjX+XrEdRRJIkW9M0fW8cx7+WJMl+LvYtcep2Gdio68LhRK/X/103s6AlxFmW3buysnJenudVlzi3AsBGZL39SdMUKeW5jVEgAP1+nzRNr5RSnjsYDN7bGhiuN45sHfwPdn0PJQA0JQujxuH/a2VZHlaGwaPl8/noFwDqdn7tfC1wU8NWN20LuPaxXvi65voYtEzQrk/PGU7vm6tf+PSFD7zhZafy4osXGOg95JM9RPEQV0nyfTmzcwuQatixAwabYDjH3myZLJ3nm9snvP1f3iT2OSBWLJceiBjMzkbj5VFVv7dBKYO1If4fEBAQBICAgICTbvaRtQ25kAgHylVEeBofpjrKLnt1z2Nr6bkxc8DlF+H/5T95OedtFWi3gh3tw4mYKJnDlwJbFOjIQgyYMT6ZY08xxxdv38Of//V3+NL3KzEBkpk+47zACdksJCW+mRIFfmogJTv9ol1jNGVbAWBdxCngyAjGgQLU3aj3RiS8fS2KEvr9/mXD4fCGriN+N6r6WBYA1hvbrSfORVERRRFtBLtpGbhtNBpdnuf5YZjwrZLmJEno9XrTOv+NiP/6Gvv1x384rf8OJQC01957z9LS0h9PJpNfn0wmGGNRSk7FIGstUZRMTfagjrh3sxG01lRVteZYhRAMBoPLZmdnb2g9E1rC32ZAtPdg+/8DXeNDCQArKysfz/P8mslkcmd7HN3jW985oXvfHu/o/+NHAKiF2i75nxoDIrFitcxLeDrtAevuMH2liUvDKYrBa55/9ugtr38WzzjPQX43Wk+wVY7zfaJ4FqyGfAS+gP4AS59l1yePF/jI527m3/3RT8QIcKlgnNddBeopRhLrmMqUQIWKDMZAUAACAgKCABAQEHDyzT66WQQZiUaiG0JmcBg0qKhZRHmkMsy5gsTA85+Mf8c/egHPOqdHVC6hZdQsqh22KmpCJCVECa6wVICN5/j29kX+5K9uYtvXEctAFSmWjUVHfdCaKjegFHEUU5U5ylsEphEBWgGgXtDVC8pHrmXXsZDOwyGjDy+x2Nil/0AE9FgIjJSSOI7p9/vvHA6H743juHb37vRTX19TvTpu7hAETxz2eB8PAeBQz0up19Tst20Dsywjz/PrlpaWrmpbJ7bbtKSzzq6QLfF/S7/f/3Ab8T/Y+x/aGX9/sWYjktu+1hL4NtPDGMNoNBqNx+PLV1ZWvnbw0VxbetAlzd0yhW6GQ6/Xu2wwGEwFo4Od13pfgf23XXteQoi21n9UFMW1e/fufc+jR4zzG47fY1pgpM3EctM5epX8K4wF1R9gjYGqQkSCOJLYYoL2hvlYQ2a4YBO3XPmqcy9+/Yuewin9DKo99FMJDqqiIkqHIBzGFDhZEQ8ScqeY6FN5cGXAf/+zG/no53eLEbXLfwaIOMEXqyaFAkvtW9PxIggCQEBAwAlCMAEMCAg4cQLA6uoUOX2qjtw4BEgNkQZr8L7E4ak8PLiXd99y271Pvuinzr1oftMpgMJ7i/cF0ewAU1mkijGlQyUx2uXYYpmFuT5PftKTSGX5roceGH1vpfDf6w01VVlQlhW9wQzGeGxRkvZ6WFs1CziPwDekX9bGT6yu4k6UAPDYusgbEcWHZ/8NkfyKtfYr3vsXKaUWWoK3kcngatTZHzHhPzxvgUdGwOmef5dYN+79T1dKvUhrnQshvuecmwoBURSRpimzszNvS9P0N9M0/f3W4O9QqelHIgC0/1dKTaPpbXS/6zkQRXU7w9FoxNLS0tvH4/GbyrK879BR8P19Aw50HZtzvrjX6/3nKIrOWF8istF5dctJ1o9NLS6s9VDI85zxePx7KysrV4zH4y+e6BT/Y/18PhaWsAKP8mJq7IcQeBQeRX92/oJiNN6DlPRmBluryfLYlRn9yDMjQeSOVz9rxv/C659yxgsumuHU4W5S9hIrh5AKSFA6xUzGyDRGRAKXpuwsLJPeKXzjRyN+7z98js/fNhFSwsRLSjRJmmLKcvrdUQuNph7tJhMhfGMEBASE2T8gIOCkn4lEJ30TFL7p1ayUxNoMhENFoCWUBfQ8bBHwjl9/lv/511+EX97O5qTClhlxOsRUFqUUQgLG4K1C9BZAz/HdH93PDbfcxX/75P2X7Cy5tajACLAiBp3iZB2JbFNF6+hNW3HaHmPdEhBcEADW4ZHMAOi+p5SSXq/HcDi8od/vX9aN/neJ4upzR5YBcDTCwIHH5tgzAIRQ+6Xnr0+nbyLSjMfjy/M83yaEoNfrXZ2m6XvTNF7YqBXfwyUAtCaOXTf/tQTaTR8nk8m9Kysr500mk6r1LziUiWF7/gcy62v3r7UmTdNzB4PBDUmSrGn3d7Dzan0A1mdFdO+fNtukKIrbsyx7a1vrv1EJwaPjM9mFfIxPNLr+XnCr9f9OSCwKJzRWSIRW+KoEm5MqQyJBmfr747IL8Ve+6pm8+Dlb6bEDXz5IHAFyiCskrgApNHI2ZbK4iFrYyiia5aEi4Qvfuo9//9/+ftOuRRYBejphbCweQRQljKu8LikTHprvCRrir5pLYQlJAAEBAUEACAgIOKkmH4lsKLXD4dugugecBhQKicAgMJgmAl+X6ycgBGmV0/fwyp/C/5+//XrOGpbM9hwuz+r6cuExeYWWMeg+FA6DoFSO3WXMX3/9Pq777Hf43o8RcQoTAysGKiKkipuFm6+PYY1AUR93EABOvACwnly2LvZxHF88MzNzi9Z6Whve3a7e9ugJ/+GS4eMtAKx/rZvh0CXiRVHQmNAtxnHcZEisEvKNIuiH8lA4HAGg+9x6j4CyLMnz/N7RaHRJnuc7u60Mu/X4BxMA1p93V/xoSwt6vd5Cv9//aJqml7VmkdbaNfs/0Hmt7y7RFZWsraiqiizLfi/LsveUZTl1+H8kXPxPbgFAUn9prHoAtLBC44TAoQGDNwUzsWOgwGZwap+LX3JRdMvPXfZsLjhdMz8zwZU7kEyI0whEirMKGQ2wWcEkz5jZehb3rUh22zk+9Jlb+PD1u8SeAqKepBg7IiQxCRaLw6GjiHGVNW0Km3H2tWdM27y0CgJAQEBAEAACAgJOrslHExEBhooKrzrrUVuLAD0Z41wFWCSeDF8XLsmoXvx5h6ZixsLTNvPX1/7uZa+96Nw+sd9NRIGSUd2qSfYBhbUFKpJ4bVnMPStuE9/4zv1c98lbuOkORAUYBRMLuj9gUlarJL/p3Sy8ZDUDwAQB4AQKAC0B7BLpLtEZDofnxnF8dZqm70ySZE0aeh2dPjyif6DXTrQA0NbAr2/l1/U86EbRW1K8Wh9vjmLMj6wEoOtR0JJvYwxVVTEajX5vMpm8ZzKZYK1Hazk1NDycLgbT+up1wkKX/Kdpuh/5b38O5PLfzYZY31qwPTZjDFk2/r2iKK7NsqyqTf7qjKVD+SgEAeDhEQDWewC0nixWSLyQCCmxVc58X5A4Dxk89VRW3vyqJw1f9Mwnce6CZSjGeF+Ar1DaYb3BYdFJRF6UeJWieqewYxxx38os/+mPrmfbbYgxUKUCbxUYg/KShASLwWNR2pO5JuTvIvAxdclCRkQVBICAgIATiuABEBAQcIIEAFBNjaTD1U9016Pega+QQNRYPFk8Io4gisEZ8JpkMEtRZCxn/MXNX9++fP5TTnv1mWeeRlFkpEkfPHjnEcIhtQftEL6EKkdUOec84VROP2WWydID79q1k3d7XycYZHmFl7YxbHKdws1O/X+bIXCCBIBjJRjH/7iPrweAUno/k7luFLgsy0Vr7Tbv/VeAFwkhFtrzrsmgO+LxOFTa+CM5/u3l70bXW/K53viwa1a3+jsbZgwcKKX+SAWAjh/B9H3LsmQ0Gt24srLymqWlpY+1Zo1aqzVdBw5nbKx1+0Xru2R9OBxe2ev1PtDr9V7UCgvtuR3M4b87Du24KKWmJn9Zlm0bj8dXTSbjjxRF4Ywxa8h/a7J4qBKGR8cs/BgVGRE4IWpfFjwIW5driaaXizBYYxjGQA66gkufgn/rzz4zvuLSC9iajEnsHiJRNN0DYoTsIYjq1H0Zk1tFGW1mok7jtu0Tfufdn3/t39/DL8oIChTWKBCKOI1x1lJ52xybw7rpgVKr27XCLabfZIH8BwQEhNk/ICDgJJx8VpvpyXoxJFxDqpttPMQKpFdU1tZtnVqxAEiTPkWeE2lFrAyi8AyA33jTmf63f/V1iMm99MQIKUuUqKP4pqzQDkhSkILxUoFJTuXefYqP/M23+PSX7nvrvUt8cExdYmqaNXxb+y+drhdyvl5knsgMgEerAPBIZQC0Lvj712bXMMaglEJrTRRFxHF8ZV37np4bRRHe26Maj43aAj4aSgAO5GHQRuH33+fa59cT/2MtAej+31pLnudMJpO3TyaT95dlWftsNAJB+37ddPtDjalza4WONqofxzFRFJ07Nzf3o/X7X58hcTgCQHv8RVFsz/P8mizLrquqak0GRVdcaTMQHk0CwOMtA6DbjlVhOlkAq9tEcV3vPyPgZc+K/T9644t41tmzRJMHSVkBVyAUlKXEO02S9EApsJZKJOTRLHvtHP/z89/hD/7se2LJtz7+9WOUzDAucryoWusa2q6xWqRY25rbVoBr7AAlnqgZ+4rVPQYEBAQEASAgIOAkmoBqw7929WRBtiSgeapZ1CUqobQlHo9q/AK0jsiNbfbn6AGzwDlzfOA//5vXXn3uGREzSYHJ9xB5V9df5gU4C1qBV1QmpYy38GCW8rmv38nHv/Ad7rgfsVRCKcG27f983f4Pr+tok6/lCy89XvimN3WzrG4MC4SXaxal04yCIAA8LB4AG0Wuu1HeloxB7X7f7/cvHg6Ht6RpekQlAI9GAUDreHp+66PmXUK8vjZ+lWD7NSnxtagi17S0OxYBoD2mpjXhqDH529nuN45jrLXTNPv2vTdK0T+ABLSGoHvvp9e41+t9YDAYXNzNEOke38EMH9e/1hz/ttFodHldrmCn9++B9hU8AA6F1br9ev5vU/prEXjaYnV6At3Sq+a6iHr71gNA+sYMENBNtdjpC7zl1S+Y+/AbXvosLtiaMOeW6fkJ+KIm31LjrQShESqhMoLSalxyCg9MYv7Th67nr24aiwmQN+0Fo2m7WoHFIbRDRGBNfcBCKHwhEcRN3H9cH2/zA4PmzPIgAAQEBAQBICAg4GSFXLMwXKcOrJmwfOf/cqoPrC4OBYYESIBTewx+/52vGL3sknNhfB9bew6Wd+HGe5HDGRAJdmkZ1etBnDLOHGM1y63bl/mL62/hS99CTDwUQOWg8qBiAVJQ5o6B0nhnsLr2DjCAiOsjsTlIoVBOo5yanowTDiebzAF/dAvwwyXYhyayj+8k1G4Utmssl6YpcRxfsWnTlusP5DZ/IHLeJXuHE+A9GJHf6H272x9K4FlPPNdvf6jfj0QgOhCJXt9hoRUR2tcmkwnLy8uXjsfjr7XEf6MI/IazQiMGrDcTXD2X1dZ8rev+YDBYaASecw9WSrC+E0C7j7ZrgNaaoijIsuzW0Wh0SZZlHeLf/q0/RlHtWAm4e9jm3Ufar0BgpjWo1muciHBovHAIKiQlOEgkaKGxRlA6gUcipEAqga9KokjVBrHeI2UMpiD2hvkUnvIE/FWvO4NXPueJLOicXlGRWIcwqjHmK3GizixzUuF0RCVm2ZVF3Lek+efv+dz7Hhjxjl0GChIECb4RqQUG8PiWwK+/7I1gIRqpgDVfZ7pz/RwBAQEBjzSCB0BAQMCjAL7zc3TLyTr0Uj/UNkyQG6ov3Hj3u/tp/q5nP/OnWdq9m16iUf0UihyzMkHPz4Kw2NE+Ii0Y9FMWZob81AVPgWr3u0b78hctjfmzRIOKIC/BOM/s3ABTOirncKLxJGxCPF7UmaS1dYCqa0oRTeSqTgStycPD0wf+6AWAx/dddaAIbEP27nLO95xzTxdC9LTW01Txtoa7rRs/EKmT8ljHXzxsBP14ELjuPrukfn3afddfoI34G2NYXl7+48lk8k+yLDti8t99//Xvu5qBIdcIO71ej8Fg8Kk4ji/uZmkc+O/rY22FojiOkVJijGEymSyORqNfyfP8nxZFsYb8rz4eqwAgHoZ588TNH8f2zq6j8db589JLBH4aydd1Nj6muT5aRyhZk2rnHVEq8MJTlQacZ8ug/xKZT35y5iyXveHlCz/6rV9+Hhc/eciCXkYX+4gxKNF0D1AaUk2ZF0TDOZzs8dDIk0Wn8NXv7uR3/++vxLsqPrOnggIJJJ0J0yPwzbeMP8i1ORDBb58PLgABAQEnag4OCAgIeExCItqU0CZttDujKQepgNhDH3jNc5T/F7/18wzUMjFL6GKRmRQwhizLcbrPYLCJSWaoMsNwbhO7xiVf+uZdfOqr9/D1HzJ8MGNsIo2VEWVZkQ5nKIqCSHgiDabKMdZP0xO8AC9qdUB42aSq1m2rPHXP6iNdAq53gT82Avr4zwA4ECmr08UTkiRhMBjc0Ov1LouiaA2x7daOb0T0Hu4MgCON2B+sVv9w9ncosto68R8o0t/+3iX/TVu82/M8v2Y8Hn+mTfHvkvHu3x1q7DYqt1h9fTWKnyQJMzMzHx0MBle2JH4jl//1pojdchEpJWVZMplMPphl2VuzLFvTOaE9x9VsgZABcNTShaBJ1q/nQ+1AuTpq7lE44RCJJjMTwCIiUAK8oUm1EljlQUkWolNfIpcXvxiT8/xz8W954zk864IZTt/SI8HiSou3jkhLhLNUZZ3MXxUT0uEmlrOIXG1hRz7gT/7XjXxk214xos78KppjRahGo67lXCUVxlXhazggIOAxiZABEBAQ8JiEQCDRjQjQRFOaDIBaFKCp0a8TLrc/4N99w+duz5960VmXzZ1yKlEvRk72IX2F7s8jVJ/xuCCONIOeRmSLDLXhvHPO5Nzzn4hU2b/YsWv84GTibtUK0DGF9WAc1pg6BdkJUqmItJo6lLcigJcW6X0d2WqOy9V21UdB/FdH4dgEgMe5RNSpf19P4GoSN+0X/2fW2gebbICFxjBwvxr4rtN+/f9jvIePkMAfnUh06Pc/nNfXewW0Akk3ol9VFePx+I9XVlauGI1Gd3W330hIONyuCwfKdPCettUfvV7vnb1e77e7Ik7X6X8j4aLbocBay3g83ra8vHzJZDJpTP7WdpdYX06y0eGHDIDDFx+cqCvkaxtYg8Qjmv4wHoXxDq8dRLW461xzzaVARRFWWJJEICcrPzklMdGbLp23v/Gzz+blz9rCllmLWNlTewH4COvqbjBeOWQMMhII3WM51xTxaXzzrhXe90c38OlvZGIMWKnIvW/IP0jlm7YbdfRfCIcPAfyAgIDH7Bo6ICAg4DE5eUlkbemHo2qyAFjjHSC8JMIRAxEwq8BY+OWfO9e/5fWXcH78EIx24nwPJWOcr+glCpTHZxlCJFRigBhsZsdE85mb7uB/bfsO39mO2GvB9GYpvUI5gzAl0lVoIZGRpLAOr0TTk7pO+ZTeon29ngWoBPjD0GEPTOhCBsDBoJSapnhvlLre1pC3bd6iKKLX67231+u9M0mSDdPGj3T8DkbuD0QW15sZHgmBP9jfHGkGgBBiWg6xnoy3BNs5R1VV5Hn+8TzPr8nz/M6yLLHWEUV6Q6f9wxUo1rd23L/jg6Lf79Pv9z8ax/GVrYlg6x2gtZ5e//WGiN3zK8uSJuL/waIo1twvG12rVQEgZAAcy3t7FMJ7EKYx8WvS832EE1C5gii2CO0pm1PVGjwDqDyJL9DGcuFZ7L3yNVsX3vySp/PE+QgxWkQUBfQSqKqGwQsqU2FtgRcTHDEiOZ1lO8env/Bd/vh//uS6HyxyVSUEYz9TV+1LwOdAiZC1oOy6q2cbvocDAgKCABAQEBDwCAsATdst3KoAMF3YSvCKXhxjywyBQQO9qF4TvvLZ+N/9hRfy5M2KQaSgmpDoCldNKIsJcZKiZk6hWilwIkUNt7Cvirn1Bzv52Odu4fqvjMQeoNKSNIpRQlPlBZXzCKmpnEVGuvYHEA4wKGxTAtAs371o6l+PnDzWZOPYkrge7wJAG9ltSwG6deytALB++6Zl4ILW+rK5ubmPtlHiNtrdJYDHWgJwpCZ+ByObR1JTfyRktdtFoSXX7b6qqqKqqtFkMrlqMpl8Js9zvAel5JR8r71f19blH45LfnfbbkmHlJIoShgMBu8cDAbvba91K/y017obxe8KAM45jDFkWfbB8Xj81qIo1oyTtXbNua4/nvp5GwSAo517PDXhB6x0eFF7qbTmedID3iKFRfiaaysFQiuKyqErzxbg+Rfif/lnf4qXPP8M4nInKp/QlzOQGZAKV2bIRE/FgKzIQUoqPcf3flLx8S98h0/eUMS7KqpSQC6HlLbpSiMs+AxBsfrdIle7EBzUAiAgICDgUYxQAhAQEPAYRW2y5HF4WjKnmh+9uo2EyhkcnuFcn32Tigq470Hefef3733XYHbIWWdtAcaU4z30UkU0M4+MY8b7Fol7CZGOyUcTIg/nnLGZc85MOGXT5F07Hsh6+dhvc8bgTYlQCkOEkzFSxfXbe183uPIO0awWnWjS//2RT8FrycixZgA8zu+QA/R578pI6yPMDTHMq6r6nvf+e8aYRe/9xV0BYZUIHiMJEg+PieDxIm/dGvlu+YQxhrIsGY/Hb59MJldlWXZnWZZ4X99TrViytuWgOOpj6B5H16V/MBi+M47jq5VSC10RZ73JYDeLo434F0Vx62g0+gdZln0wz/Op38FGpH+jMQ8mgMf+ztpbEA4nBFb62rhFOVAWLy2RlAgjUS4i9hHSClxl6Ck4Y8DgdU+n/J23PIfnPuM0ypUHSBNH2tPkZUGUxCAkQkuQDmsySueQySzjcoY77/P854/czMe+aMWiw+U0Tfm8QSmJ9xaBRdWzRG08KFb9XR6W4Q8ICAg4gXNwQEBAwGMT3YWYbwWA9kmHVBLnKoSuI5e2LBFCo3UM5YQ+MAP8wqu0f+vPvYwzhgV+tIM0VuA8pD1c7hA+RegexjpKazAyZywGfOG2Xfz1393BTbchRoDVgrFLsCSIKMLbHCEqBCXgay8AJK7pey0x037XhyKwG/0eMgCOleCq/dzsuyTSWkscx/T7/SsHg8FH0zRFa90heYeOwB5uBsBG2x0qQn4osnq4x3IoAaD7d8YYiqK4vSzLD66srLy/m2GxvotCN+Oiff/143wkAkDr1h9FEVpr5uc3rTmhtpNDm53Q7eLQ7qMx+XtrnucfnEwmazI7rLVrsgXaUoDu+K3NZnDHKACc3BkAyju8ACvAKLc6fTcNYYSRyFLSY8BAaqzbC3jOOIV/dfH5/P7/8XPP4ewFTzTUGJ9hZIn3FThBJCN86Yj6CXjL8iTHxQuI6Axu+MKd/MGf3nHj3+/lZSPqjoAygqJcHRXv6xKz2mdGYLFYKpBmdeUcjPwDAgKCABAQEBDwCM9e3RlsKgLIzurMbTDL6WkOp8Iyqx3KwMXn4P/t776SZ56lYO9dSGlBDWHsIJmDJCIvl1EaIi1YmVSIwal8+669fObGH/C5L0+uuXuFa0s0Vg2ZWIOOHdZOULpOX61KcC5G6ZnmmCeNOHB08P5Yp/DHOoE5cnK79vzkIQl2m1aeJAnD4fC9w+HwnUmSNHXmdk0bvPVkd71p3JGSrONNylq3fDdts6anwkdLoNtzstaS5znj8fi1k8nkM2VZPiwZDAfqsNB2FGjLDlqRIYoiBoPBFb1e7wMgh0qphfY4W5Ggu++W4DcGhddkWXZtVVXNtuaYxl8ccwrNyewBAMZ6oihCSEtpqnqujprDKkHJIbKKSF1Mz0/oscLZm7jlVS/fcvHPvPR8ztuU0Y/K+o+kgliBzTDVBB05kAJizb5xjo1PpdBP5MN/dRsf+KMfi90elonwQgMFCDc1jW110VqsjfCN10yd818haoeAwP0DAgIeswglAAEBAY9tAUB0fsfX7QA3Cs209aWiyVNG4EnJncRg2Tfi3V/88t29c86eedF5Zz8R4QWUgNRYb/GiIorBmgm+mtAbxpTjPZxx2hbOP/scZmfkZZN9e9+1tM+92/qcJBZ4X+Ka7gQeUCIiiQcon1CUGUr6us70mAbhmGjzMZKaE53CfHSk83CPv0vmm6j2Nmvt95xzl3nve1GkpwR1vWFca0R3uIZ+JwJtlL6NlLct+4QQRFE0NVFsiP/7JpPJG4ui+Ha7zfFEN0OiHTutNUmSkCTJb2qtXxRF8Ryslm60okvXq6CqKiaTyQdHo9HlWZZt67r7H+v9d+xjcPKWAHgBUZJSGYOtavKvZDMdOokkRlqFsgbJPjZFJc97mvZvftWTznjtC5/EU8+K8NUutPZ4I6hyi7QglEBqA5GlImdsFTZ9Aj/aGfN//ZfP8aef2CeWgTERjl4tHGAB16T7r46sXVNaVpd8KDzRtIFhEAECAgIeu0vogICAgMcgZJ27KdZF+v1qBKdendULON94BqzZVg7BeuLUoGxBVMEmCf/6bRf7lz37LOb1XhbSCqjIVhbxTtAf9kBbbD5G9QZUpYL4NDI3z81/v5PrPvt1vvzt/NTdBTsZwu5JXU2g4hhvBN46YiKiSFH6vDEIPFqSFDIAuoTxyEmbPOzt2/Twtu1ckiRXz8wMPtC2DOwa1XVTyI+F/B+raHCov+8S5lbk6AoYjbv/vePx+PIsy+40xqzJdjheoka3RKDNwGjHPU3TfxXH8dVSyrOUitaMeWv+155LVVXb8zy/ZjweX9ea/HWzNA5VAhMyAI4vjK3T6ZUCpSKkT7BGIrxCec8gBlvs49QeW196idrxplc+ledeuIVZNaYY76Y3SBmPM4bxZkgGsLyMFTlqWDD2Y/I4Qc1dwBdumvCe/3DTB+/ayVt1MmCpGGMV4HW9DHYW0QgANHKAF1C7fDZ1CQ6Ed8R4EgweyAATvogDAgKCABAQEBDwCAoARA2hr9ZkA4g2uOehNgRsl3YV4PDT8E3UGPGVtBGgfrPX179ozv/jn30Bp6YrnDYwzMS23r+pwBXgbSNCaCqncXKI1fP8+KGCj3/+W3zqi7uu276Hq2wCVqeMMot1llTHJAqyIsdH6pgiSEEAOL4CgHNuDalsRYC2M0CaxlGapu/t9/u/05YFHMlxHm/Sdaj9twS7TZVv6+eLoqAsy9FkMrmqLMvPFEWBMWa/EocjG+tDb9vNluhmACiliOOYNE3fkiTJO5VSF9XXh0UhxEJ7PVqhpizLbcaYbZPJ5FpjDG3Kf1sOsOon8GiYw05WAcDVpDtSOOepSg8+JhU9Ii/QjNGUPPMs/KtfspWXPvc0zj0jImUFbQokksoqenObMEslZZ7Tn58FUbFULeFnZnlgnPBnf3UL/+0vrcgAFZ/CSjkBPa7nXbf6PbEa42+6+0nZDE8zRt4hLCRAXOd1BQEgICAgCAABAQEBJ0YAAJo2TS3f8HQFgKgRARyiEQBasUA6mJudYWl5BYdGKF3XBQuD9nD2PM/4V297xe2vesYW9OhutgwMAkM+zkkH85iiRPdT8DllliGjHiQL/Oihkm//cIk//+R3ueN+xK4CVJIgdERWZThj6/aAsk4qDQLAo1MA6EbDu8R09b0cURSRpunWfr//0V6v99I2df5ALf66veyPNw5HAOimzgOtu//7six7R1EUrDf5awn04ZQBHEuEvB3nTtr/W6IoulJKea6U8tzm/q+UUgutcFGW5fY8z68piuK6xqxwTfu/breH+tr6R8EcdnIKAAIHztWt/ZQGr7GFQ1MyB2xJecZLnzW8/eWXnsGLL9nMwmBMme2uLVTlAO8ShIvI85JeL0GlkqVsiUzETOQ8DywPeP8ffZXP3DQRBWBEH+NLlDZoAcbU3w9OULccBBwaP1WRacrFmqyx5r9RZ9SqViwICAgICAJAQEBAwCOzeFaohuWbeincFQBgXWcAR1vriag3Vc2Gm+Y3vWTXvuUvyjjBGgMSVCoRo4xZ4J+8Yav/jateyoLcgxk9xOygX0eIvMCZEqnKemVoK7LcY8Q89J/ALd9b5LrP3Mrffm1F7AMKAZkHIyHtC6qyPcYgADwaBYC2Br5NQ+/WltdE0kyfb7oFvK3f7/9h2y1gvdN/l3xu9NojLQB0iX9VVWRZduNkMrmqKIqdbcS/TbFvz3O9o/+xCAAblRGsbbNXmy+mafq2KIquFEIseO8XhRALQogFpaKz2jEtiuLaLMuuaUWL9R0d1hJ/cUAX/yAAPHJo77FepFFUUMIAeOEzUv/K553Dz7zkycyle+nJPQi7DMKjZExlY4rcMezPkY1H6H5MhmfZetTck/j81+/n3/y7bw93ZIyRm1l2ljjWeJYpq5JYrpqy+ukoykaM7ZrI2kYAWP/BCd++AQEBQQAICAgIOCGTV5fa1ws5uW591ngEeLkx2QVmhjMsj1bq7QREvYQqK8BDT4B20ANe/ezI/9NffTUXnd3HLP6AVBSUThCnKeCoyrqlmOz1oVIsLVnS2Sdy1wMZN9z8Az72+e3bv7OT83wPTG/IytIErdRB2wAGAeDECgBthLwbJV9fQ94llU2d+tY0Td8bx/Gv9Xq9DbsDPFoMAdsOAFVVjbIse2uWZX9RFMUBjQzXj+Oh2hQeboZAVxBpx1hKSZIkW7XWl0VRdKVS6mLv/aL3frH52wXvRWWtvbUoimvLstxeluWaLgBdr4L1LfzaLg5BADgxAoAVGtWbxxQFuthHH89ZM7zkBRdx489e8Qxe+cLzqUb34LLFuvZex3gXURYWpSJ0P6Xc9yBxv0euYnK9ie/eV/CBP7+ZG76KMEBFSo7C4XFUOCriJKIoKxpv1ub7Qq4Zi/q7xaE642sB0/3SgToFIIgBAQEBQQAICAgIeGQFADqLOIdcTeFsYzuis1CeRtslIIijmLIqkLHCi9rgDFOne6a6LvdX1AJABDxphn/2G7/41Pe9+RU/hS53MFAZ0pVYoacRRUEbNFKYUuHjOZbLITffsYPrPv8t/u72sXgoB5dA5RNAIjGAWZ2Qm+P0YjUa5ZoXZfOa8KwhMGu1gHab1W33385tSCKCALB2nwcjklKu9rLvmtFFUUQURWzdutVvlIJ+uELA8c4QMMYwmUxuXF5eflme5/u1LuwaGq6v0T+cMT/U8XcN+7rEvPVdmJ2d/Vgb7e+M22L7+3icvamqqu1VVU2jyd1j7QoU6zML6n3ZYzr+YyfNJ/LzIxsTvM69jmvmhzrt3XfnTmQzj9SPXqydc4RfnauEpyO8rr5fd38eibUSRcm8dFxwOg+94WVnnvrGy5/Geac77OQ+YlETdW801ii06IOMoSoZFznJTI+lymKSeb5y+7381z/9EbffjUDDstHT9n0Og5SOyjWZPI155Or1WysUt4aAuvtZ6QoAq4lnJz6JJCAgICAIAAEBASfzBOb3W1C7VWen9nHNwtsdfCZszKESBbEAb2Ao4R+8+jz/Kz9zCc8+dS9ifD+lTEAlaK1RGHw5QkvAenwFyDmcWmD7jpJt3/gBf/O1n3DLTxD7+jOMrQYmRNIgnJ12LihLh9Bx073A1j2tlUIKjTAOVxYo7aek3rULct8sxr1EOY3wYioaADjhmsW7n/azPjLS/HDi+EYwD5Revvr78SVwWmv6/f5lMzMzN/R6vf0i6lrLtr3gmuj04Y571wV/vVjRRujXZx+0JQ3OOXbt2iHa91+f6n8wgnukxPdA52GMqz8zSk3fXylFv98/t9frfcA5t705nnOVUhcLIRaMMduyLHtrURTbq6p42AWkh1cAc8f49xyX/dfnKhEuaUxQ6wJ36R1O2loMFQYnV0m+8LVnimjmFSegkhUIgfAa4URdMo9DCYuS4CoHUiJljPMC4x1eOISCRBri3LO1z9YXPSvd8b+97tlc+sxT6bMI+S4i5fDGILzEGIVWSS1YVAa8JJM9diVb2McsH77us/z5R3aKca27MrZgieq5c9oWlmnUXzbU3jW5ARtliol1ozdtLNttPXvsnSQDAgICggAQEBAQcEJnQy/XzIo6UpiymjpEt4+DCM7fwlevffullz7nKXMgHKaakETgihViWSFNhkgSsBJKjbEpRJuZ2JSbv3UXn/jqD/jk7YXYC1gHlasfdSSROqWypnZltw6PxXuLs74uS9UxaRRjykm9jJXNAlUybYMovUY6ifQK4RpCJ10d25N1doQ4TAL+eBAANjqH4y0AtOQ7iiL6/f47B4PBe9M07USozYaR6aN5/26WQisIRFE0JfdtZLwsS1ZWVq4dj8fXWFut2X5tffzxFwDaEpZ1JRQL/X7/o3EcX2atXQRwzm13zm03xmwry/KDbcT/4UzhPxkFAHw0jdxLDwiDE74WAKTBrvtzZUE6jfISK8BoixcgXYy0EuUAb5CiQDRzknUS7zUChdYCJQ1Qokt4xhns/YevOnfhisufwembHap4kJi8pueVAR9DFIFUFMvLKJ0iRcJ4VCE3ncu2u1b49//9b/juHQgkZK4OyieDGcZ5USu2wq0h68KDajIDLLYRAAICAgKCABAQEBBw8nD+NRkCct3M6KZRIw1EnSyCCDgthl+78nx/9VUvJirvo1q+h4XNae0u5Twuy0An+GhAYSLKMmamtwmXwb0P7eOGW7/L9Tfv4ev3IAoFeTwgLy1Ii+pF2HxSexC4OgvBOcgsFFqgoh6UDunbqH7940T9nPAS5VfTdtvXPGBlMe5fPwAAaBhJREFUE+n1spO6+/gVAA50/I+EANAaCMZxzGAwuHIwGHw0juMm6m3WGAt2I/lttsDBSavYTwBYv5/Wub+qKsbj8fbxeHx5lmXb65R5v6FQ8kgJAFGUUFUV1lq01vR6PXq93gcat/+FRpzYXlXVdWVZfjDP8+2tb0F9nA9f+PVkEQC6HSx8Q45FMw9086JW5xOmc0UtKEqUk1jpKGILCITpERuFxiFEgZMFFkiGCctjA6ZPoiK0HSEpOX2OZ5x3Brf/zq++jPOfmHLqqR5X7saZZfpao9wQcg8GTDFCJwJmUnbtXUH1tuL1qXzkr7/Of/2LB176wApfdEAUw0oJFkmUDsnyDKRdO0atOLpfBkBAQEBAEAACAgICTroJ0K9fMDdkX0rqdFbj1mQCaAHWw6yAFz0d/8//95fz3AvmWH7wDgaxQ2kJSUyVVXid4kVMsWKJ0aQqxRWG3Hm+dseDfOobD/J338t+5weL/MciSXFa4/MRWkNUQdK2n9JghGQFT2kkCWldjysdTthmQe9A1HW4yq89PyvBdmp3lXt8CwCHPp+H7/03fHVNxwA3FQL6/f7VaZq+t9dLFtp6924pwPpuAwc+D7Vf6n7X9d4YM30cj8cfHI1Gb83zvL72SmFMeVQZCA+XACClnpL5NE3p9/sfiOP4au/9orX2VmPMNmvtrVVVbSvLson6Hx8X/8e7ALD+mrUp/jW5bzre+dZjpPFTacqFurX/yoN0EqsMhTL1HGl6xF6j8aBKrCypRG2ngpIkagZVZkSm5OwF3vaGy075w9e//Blc+MR5sLuRch8qypHC4UuPNH2U74HuUSztI5lPGVvHWAy4Z6/jj/7ii3xqG2LiQUaQVbVJXxIPGJcWi0BphbGT/V38HbVJADTkPwgAAQEBQQAICAgICAJA21tACPB2Wg8q10+aAgYxiAIWBPz2LzzB//KbnovMf8JMapgUOd5Bogd1/WxeISIFSuKyCqmHOJuwfXfF33zzJ3z85vv47kOIJSspraSnIfIeZyylrZeqcZSCMJSlQ5LUC3XpcKJxpWpqedvjlH7VH8CKugVh+6KyJ58AsPZcjq8A0I2mG2Ow1q4xCZyZGfyHOI6vTpJkqJSansfhZgAIodaZEso151dVFSsrK9ctLy9fVRTF1GDPOUebAbBeAOga/B04df/h8wCIoog0TRkMBh9NkuTK5rhvrarquizLrjXGUFXVhp0JQgbA4e1/w+wYYbCNoikcKLdaOsRUBBCNV0j9XrKp8ZcenDS1KR40qf/1vW6lw7TeARG1fUkJWxN44QXC/8yLn8Irnn06Z21NyfbtotcTEJc4XyBxtcpZRVSFR4oeKplnb+YQs6fxhdt+xL/9w5u2/fABLq+AtAeTrM3u10h6VNRlTnGsKMrRtLvLmoney9U5PggAAQEBQQAICAgIOHkmP7nfUlquFQJqq30AIiXREmwTVZUactPWlMKMgL6Hlz4D/46rX8q5pyUkMkeWE0RVEkO9GrYFXgmETsHEmInHJUNW/AxfuXM3n/ryHdz8/aW371jh/aPaYwuhJZWt+wRoodE0/dlRjQFgXdPvhWsW6BsIAICRde0uUtYGh25th4DHswCw8Tkc/wyA1nSvJd+tOV/9HPR6PQaDwX/o9/u/E0XRNPLfdd0/MGkVU1LcEuOWMBtjGI1Gl+d5vi3P86kPgNZ6Wve/UZLBIykAaB2TJMlC0zbxau/9YpPqf00rmFhrpw7/Wuvp+B3o+IMAsPb+ONC5euFw2q8TAOoUf+E0Xqw6hHjhm6wit0ZgFKLRSH19JMbRzC/1BBtHQAlnb+ItV7zglA+/6aVP41lnzzLrFrGTvaher56gfIGzJVJLSFIgpigVlR8gelt5cDniv/7JJ/kf1y+JQkEpoXDgbT2PJ3qIsQLjPaLuZYCnAorVTgVdE9ggAAQEBIQ1cEBAQEAQADYSAKRS+CYDwDuzZskulMA4j9IS5RxYiFRddnrmgHP/2a9c8qM3XXoOm8QeRLELqSqYHYIpWF7eixYJkZhDyhSnYyovKErBjr2GL992P5/92t18b4947UO5/syKdUitiKTAVI6qqo2xpChBmP1a+0nfRutWF7xeSCwaKwReaMChfHVYRoCPdQHgwMf/yAgAXZO7rihgjEFrSZIkpGn6/IYIv7R1xj90G7q1LQqNMeR5vphl2VvLsrxuPB6zUYmBUmrqQXA0hP7hEgDm5zddLaU8Vwix4JzbXpblB4uiWGwj/krtn+EwJbAhA+CoBICpwCPANVknwtWp/aoNlnu52lkEpv4hCFNz+2ZuUVYipQbpqTAY5xEeYgU9BamFZ56Pf/3Lzuby51/AExcEfrSDnrcwO4ClJYgk9HqgNZQZVVZSRgn0tlDGp3HjrffyX/7733HbDxBW1NYAFRo/beNqaPOzelGPsioAgxIO64vGz2A/6akZjCAABAQEBAEgICAg4KQTALqBoVURQG640JYIokjVBM5ZVBxhqgoApcE2GQEzwBzwup8W/tff8AKefeEm8tEDoAqSQYywJVLElIVAyQSBw5ZVvQjXs+waae540PDxr93NV+98iO/cm4tSQJxqykpQWoWINPgchFlzzLXJVUcEaE7Oo7FC1f23RQR4FMVhtQIMAsDREbhuPX+bdt+2uqsJvu9kA9RCQL/ff0u/3/9wHMdorQ9xXdT076uqoizLbVmWvTXLsu1lWRJF0Rp3/y6Brn0D3H5j90iaAM7NLVzZuPvfWlXVfqn+G7Ux7B5jK2AEAeDwBIDudfNInIzrdqHeIbDNYz0fdsuGvKDTTs81pQLgqxglE6R0eEq8q0iAuQgWIl7yMy/ZcuNLnvVEnvP0UxioCRT7SHXdztSUGbqfABaMxyMQuoeNB2RiwD47w4c++WU+8tf3ve9HD/EOK6Dy4IiIVEJpq9UxVArhBN4bBI5EKSqbT8dnfxEgCAABAQFhDRwQEBBw0goAGy2n/RovgI0X223kvF4c6zoX1no0hgSmP6elXParV55/w8+99jkMxB5EtUiv12MyGaElaOFRZVWvtKM+iITcSMYuYt9E8uVvbef6r23nG3dZ8WAJVkukFhSFJe5HVJWtF/pCgvEQRUgErsiJlKzraptzcU3kzBPjRJ0BUAsIRzmGIjTBPib5oEnbb1372xT9phQgmp+fL7XW09T3lsy35QQgmUwmrKysvDXLsg+2Jnkt2Ts0UXcPC8E/ENoIfmtS2BL7NisB5DSdf30rwkdGQDrmK/ioEQA2vmYH3r9Hg0+a2v0KgUVSAm5K/lWS1qS7bK5fHNetF6sCiJFqFleBshU9WRK7MQsanv9U/OWXnM0rn302W/uGWBt8uYJxDtXrIZIISwVyjI48RDFZISj8EDk4i1u+t4c//8RX+MQXczEBCrkq0gpXl1x5wAq9uoz19T8C15nz2EAAkIBqtrdBAAgICAgCQEBAQMDJKgK4NYtjeYAFtFvz/2kbwdqjH3xNsRVmOrnGwKkx/Pxrn+R/+WeexylDR7a8i82zGsmIarxIIhJQMXaUUXlIZ4YQ98lXJixVfe7aKdh2273c8M272b7LirxpB1hZ8AqS/hDrJGVWAhIVa3AWfIFsoly1F4Cs03vbCJg4tghYEAAeHgGgS9bb6LYQguFw+Pw4jq9O0/TXer3elFC3jviTSf7Bpmb+1i75bwnhoYn08RUAuufXfW7VrHD19VYkaMfg8I4jCABHKwDgNfh63hKUICqkMFPy7wFrAaVAJUz7n5gSrEWqCGccvSRGFRnKV5wzw1te/MyFD7/m+efwgqedwiz7KJd3kKYaZmegNDjn8WlKSYWIKpJBn1HhKeUcIzvHpz7/HT503Q+vu2snV2VAIdZG79tOBLUAwNTPpI7mr26zfl5f3Yfu/BIEgICAgCAABAQEBJz0E6A/igW6BiQS2+QFeDwIw8wwolypiIEUOH8TH33bL7/syje/8pnku76HLu9nZiahKhymMPTmZ+rV7cqemt0Pt1LZGKMWWMw0N31nO5/7yrf4xg95+wNLvD+ZV1sf2md3WkBFA5xIMNbWi2HlEFRIylU5w69bFE97GwQB4ITehx3C2yXDbalAr9fbOhgMbkjT9CLvPZPJ5I+zLHtrUVRVtw1g1w+gTZ8/kQLAwc63FQA2er/VFH93VMcfBIDD2b8ErxB4ECUSN20L2JLrJE3Jc1fn3kcpkdBU+QSFY74fU2ZjEgELPRaecR57X33pU3ne08/irHnJjJwQuRG4HFyBKTOc98Qzs6ASlkcZ6eZTuGdPTm/TOfzg/oz3/f8+w1f/HlFJyKkTmprA/hqxVjTUfcMGJr4zt/v1T8s6U6rtbRhKAAICAsL6NyAgIODknQj9IRfqboMFtUTh0M0i0qCxiMZcoCbiw77G5wZhYChAe3jFhdL/i7f/LBec7hnt/TEy0qRakO17iIQKPdMD6/GFRySzoHpkRjKxEQ/tq/jsl7/NX92weO3dY65BgVea5dJREKGjASLS5NkSQnskZe3W3RUB/MH8DoIA8EhhvbldN82/KwRIKYnjmDiOI4CyLKuyLJFSr8kcaPfTigKPVgGgfQ8p9Zr367YkDALA8RYAaFqAumnkn07031G77MfpkDIzYA2plMwN0if4cnKfKQybNDz76fjnX3w6z7rwDM47bZahMohsgrQFvUhSlstIVdEbJOA8k1GGpEc8ewYPFDF7zAz/89O38Kcfe0AsAS6CzINdVSlRvknbbzKXHA6PrcuXDq3idn7vCp6B/AcEBAQBICAgICCw/yP8s7hZTBocds2M2tamSqBCeUcM9CVIVxcMzMcs/N5vvXLvTz95ltNmLNrsoR+V+HyMy0ui4RwYA5HCe8G49Ohkljie4567d/DV237En35u1+I9i2xabpayldJUIqUUktKVeGlWnbtZNQSUQQB4dN6KHQLckroDueDXbfD0Ac3rHg0lAAc6rvUCwEYiwJES4CAAHI0AQF0GJNx0Umv0wUYAkE3bUU+CJfZNtxPg1ISXvPaF3Piql5zPM37qNHBLVJN9xDJCMwAfg3UIWVH6fXhREkc9vI0xxZCJ3MK22x/kv330O/fe+SBPtICPt7JYjkGMVwv9HSgfAT0gajKsCqBqfprWBYclBMhA+gMCAgKCABAQEBBmwIMsGA+CNh7lm2XoGpdpr5stJEiDcFUnflUvQRNgALz6OQP/K29+IRc/ZRN+/ACRy+jHCjsZoQYp1fIyPoqIB/M4q8lGJbEVOL2Zr9y1l09+8Vt8+ZbxS/dUfDEHRkCJhijGUuLEqimWaLoCSK8P0B4rCAAngvCvr5PvpvKvd8HvEuXW5f3hjqA/XALAgcj8qqCh93u/9eMQBIDjLADAmlaiXjRE2WuSKMVVGdJU9BsKPqOJnvFUypdf/ARe9ZwnsXW2QkbLlMUikYZED7BViisVaX/I3sWd9OZjSmDnYsbCKU/hnvsq3v+hL3D9txDjZg6Vagsr1uPxSDVGxxVl6Wp+7yM8vWYGddAIAKITxffr5/OusOvXOgKII5/uAwICAoIAEBAQEPD4gGxmQbehEHCgCbJdLK+22Guh102ujiROqKoC6x06VnWNPtDvx5iVkhTYIuDNl2/yv/j653D+qRE+30HChKrMiaMUHc9gCrBWkCR9EJI8N+TRLDvHgm9+934+9YVb+er3nFgBfBIxNh4j6fQAAOFqYaJ+BC+L0AXgUSgAdEld1xRwf7InNyTJ7XOPVgFgI4LaCh5HS4CDAHB0HgDtDOZF91gVwku8LZlLNZHN0BU883z8a192Ps9/1pM4a1PMvBkjqhWMz4kTUEpSjEfIAqJen3LfEvHW05ksj1kWQ/ymJ/NX277DB/7H319+z4hteQKVrG0ChI9QaBQKS47HdLKqmi4r3gNmWpGlvEQgm0QBh2+zAaYCwLouLh0vAdfuLiAgICAIAAEBAQFBADikANC+KFbXlnXAqU79F82SVFFHtFybai+oawDaxbaFYRLh8zrC9sKn4H/zl17IC595OtXKfcwkClvkSKdRXiOsq12vhaCsDC4eMLERRg758c6M62+8jU//3QNvv2eF9xeAUVCJxvW/raP1ul74CwciB1EeERHpZg1IBCGl9ujRTdM/UAr/Rh0CVp+T+wkD6x33T6QAcGjhQxzw/A/vOE5uAaCeUxzCO/B2v6alnvqz70T9Sm0C6lbnNa+az7OfHqvwEuEFyntme5JqMmFBweUvmPFvuvyZXHj2kIEe0RclYpyRKIX3lsqWKAnSWYTzICNI+kyWC/T8E7lrj+UP/vJG/uqmQiwDhY5AVNMJNRIJrrIoIJKKwlWYdp5tT8y7NeF75UAQNXNsVwCQG1+LRgBoswMC/w8ICAgCQEBAQMDJOgs+bCvBtUvwtammzWuiG5OPQAgiKRAmIwWetMCv/sqbz/vjX3rDi4jynSR2mZ632GyEc4643wM8hXFE0QzWeoqiwMuYpRK+dNtdfOxvd3Db3YiRg4mn7g6AxHiLkBFCR5S2RKsCcE0qeX18SjR15c6vORffGIQ5wMu65aHynTTigxC9Ry+BOzyiejACf3wJ5CMrRhw53FFc84fz/B/r4tPRn79HYkQEwqFtjvYO1ZnOrAAjFcZrkHFNyJ2FqkR6S6TrriVKCYzNAUccRdi8QjiYTxUitzz1Cfifeck5vPJ5Z/OE+YqBWCb2ObYoiHSfqrIo4ZFJBKbCO4+IemQl2GgO2zuVm+/cwQf+15f5/O2IZQE2HTR1U1lN6hvjAbGueZ8/xCq1nnsaX4zuvXA4fgABAQEBQQAICAgICHjkF/+qaUvlkNqhrCX2sDmGJy7w/X/xT1781IvO3cJCnNMXGbiMYryEjiTOC6zRCCFIEoWvCkZ5iepvYfsuy7avbefjf7vr1nsXuWTZg1MpOZLCWpz0oEBipgKA92I1ZdYJPJ5IrRIUL9yqACBWe20/ngWARzMBDAJAEACsqJ3ylCtQ1IIczWfUAl4nGCfAyZoAC5Deop3DCYfQEZUtkAJiJdDOkQqYkRAbeNPlZ/pLLzqL5zz9VOaiEW78AD1domIPpQHfr8WFCPKVJaRWRIM5RrnCJVvYOYq57rM389G/eeiN9474xAgoFSCi+txt1bTiCwgICAgIAkBAQEDASYBIgzN1PaqkLnOVrnYSSIBZ4CUX9/xv/tKrefIZMXblHhZigzYZUgjQQ8oipyjHRJEmTVJcJSirCBvN8+279/LRv/0213+9FDssVESUQqC0JUo0ee6b9GA3bSPXTcmuKov0rXGWm5puSd/qBAfvIhAEgCAABAHgeJ2/QzWfTVtb52GFxIu21Z2ou4hISSQFUng0Hik80nsq75kYR29+Hpsb3GSFGWCzgBdeiP+HrzyP51x4OnOpQFJnCUhlUdrgxaR+74lG65iCDNWL2Z2NyNUQkZ7JN7+7h//nj7/JD+6lTvkHpO4xMlmtM2qgDN8BAQEBAUEACAgICDiJJl8FKAFKgfVgbPO8TFESnMlJgDNStv7GWy7c8XNXPBc9foCkWmKgLbbKUP0+psgoKksvTjBFiS0renNbcXqOn+zz/O13dvJXX/g2X7/TiBKIEhiV4GSERdW14qJpOYdFirp+3FqLxNXdA2BK/IVvywHkMXYSODiBOzIyGQSAIACcPNdf4JC1TR7GS6zQeKFA6Cal3oGpSGJBLD1VWeLs6tzjJKg0wVQFsYGBh6edwvf/4SvPeerrXnQOZwwLemoCWFzpcICMIzJT4GXBcHYOxp4sr3CJZsl41Pwp3L2r4P1/8iW+eDNixdQcX9LDoKga9/62GZ8lZOYHBAQEBAEgICAg4CQTACJVr9WdrxfEFlmXBQhHb2aGbHmJeQkzDp79RPyvvukFPPeCzZzaz1DFfVTZClF/C6QzFOMxQgviWJJPSqJ4llEpKfWQB0aOG27+Pp+48SeLd97PphwwSmFEglASlMA6hzUFeIOUjUDhV4m/a4iGI2rIXnWMJCwIAEEACALAUZ+7cLXRnxc49NShU9Kk+uNRwuKdw7h6flEapNZIKSkmJZtiOC3hDS/+qfjjv/L6F/CMczdBuZtUF4xHexjMpOArqDKIIvCQlxYjFF7FlKKHj7ey4mb4o7/8An/yid1ihTrin85KVnKHrWqmr2h/FA6PwTUSRkBAQEBAEAACAgICToLJV8t6sW4bHuORoBROg0eAdei0jxmN6OOYBQbAmy6d8b/0hudx0dkSP9mJLSWicfpGglAO4x1lYUh6fYTSLOaexSrhoRXFjd+4h+u/+MPr79vH65arerHutMTrpOEQjkg4fFmhqMsSfCNOGJFgRALCo3yBwBzDKDy6BYBDkeJjP74gAAQB4Civl6iN/kCC81NDzjZjR3qHFALrLB6IIomMJA5fl/ZUcEoEP302/k2vfCavfO65bE4niGIvkTAoYUB6vC8w1RiEJ0p6QISrIBcp1XAzu7KIr3/zHj7wp9+/6a49vMBKWHbg4pTS5FOrExxgQHvQxEgkBSU2dBEJCAgICAJAQEBAwMkBSV3pD0kkEL7C2qrOBGhm5ngwpBznCAExBu2g34gApw34V7/5Cxf+/kuffQZb04LJrvvZlPYQc3NQOTJTEM9oMpPhKot3EUovoNQMO/aO+cF9e/nUF+/gzgcL7rwfsehgBPgoBSmRwqFMTtRkALTO4pXoYUUCAoTPUT4IAEEACALAI339rZA42ZgA2orI1fPDNFsHEDqhdB4vBVI5vKnAQizhjISF/+3ieO+Vr7qE859yBuPxDhKZMdsXiHKMK3NkmtTu+lGMFYI8NwgjGIgeZbyJ20cpf/TxL3H9ZxdF6ep0/wyNF30yX4EsEXEtQDR+o03X1dqnwDeeIgEBAQEBQQAICAgIOAmgkXqIMwaa2lgFKAltFz6HRCDwWIQALcC5VelgFrj82fhfev2zuPQpZxFni7hsRJRqvLIUYkKJIY5jIpXiM4kwAiUFhY3YbWa48Zvbuf4rP+Bb93DRjpK/H0tBQYrzoL1FedOY/zWkA42VTQmAr6ZGZEEACAJAEAAeYQGgyfrRtkB7NxUAHOCEpkTj8CgN2hdIA1tSuPjCnn/Jhafzi5eex4xcglgi0zpzyLkJ0hYo6cFaiGKMSFjOAT3H7Oyp7HpomRu/fTf/8a9+eOPde3nZpKgFQkddHuSQSKUwLsdRrjY8EXU1AYCKYmwRXAADAgICggAQEBAQcNKgcesW1CYAwoGXqIb01z29PWCmhllWtJwhAiqGEUQ5PGHAS3759U+98edeeRFnDHLE6CcIldVvk0RMTIWOI4RxqMoh4yGMcohSMjnkh7sMn/36D/nUTTu3/3A352VSk/les6D3CAxaeqwrsLaO+Gst6vYFbR/udQTykSDvQviH4RocCyk+0QT4RJD+/c//6K/1Y1sAONR5H3p8j60EwHtbd+5wFm88zoNHoXQPVIIXAmdzIjtiIYKnnop/4U9t4uXPPpefPnuOXrmD/kCCdVhrUP0ejoLMjOn3UzAVwmu87WPUZsbyFG6/Z5m/+MzXuO4Le8WYVSP/uu+AXre09HgcDrdqFirXXb7gAhgQEBAQBICAgICAk20C9gLwmrpYVtY9vbHopr6+KZ/FSOoUAalqScA6ZmKwk7os4DU/nfh//OYX85zze+hyJ1pWjFcWGWyap8gnSOGI4h5ux15kkkAaAymVnueBFcVXv7uTL3zzJ9z6w6Vrf7KHa3KZ4JM+pbOYIgNR0e9HeFeR56AV+Omi/0QQsCAABAHgsYxjMwGUCpyrx0CrGESEMZ7KeqSHWHsil3HmLFc874JN119+8Vk85/xNnN4ricwiad+DN3XnAOcx3qEHMcSCSZETyRjjUjxbuH9R8Mkv3sn/+Ozd1/xwiWsnEoynNiz1UPf2E4ipGOAbCcA1PL/J/+/eKj4IAAEBAQFBAAgICAg4iSbfqPm/RWLpseqWVSCoiDoUwQGlmGoENUxt/AWQKNAGNil4/fPn/M+/7hLO2ZJz5ikRbmUPVTYh6c9RjibgLPFpp0BZYkqLcBoVzWHp8eOdBX/3je3ccMtdfP2HiBUgjyKsjqlMhrW1yViSgKmoycM6EnjsxDIIAEEACALAoWC9QeoY68GXtZ9+HEdEVMjCsGUATz9L+xf91BN57gWncN4WySlJQU/kICuQjgqQKkElKQBFmWFdgdc9kvmz2LESccM37uHDn/423/wRomgmr8I3gmTb08+1hUndGcsAVTchAGiFTurXggdAQEBAQBAAAgICAk4GqGYpLACDxBA1koCnXmYblF9dKjvAtBE0ubqXSEgqUy+ypYeegMTBnIBffP2c/9krLuHUnqHnMgZpiqtypPZkVYGVEVpIEhyUBuEkRLMsTRR37Sj55Ffv4KY7dnPbfYgM0CmUDpwFHUFR1SnHLQlsiaD3Hu/9I1AGcKzk4eEnoEEACALAI3b+UlCVJUprBv2YcjKBCs6c4wk/fe7svc972pmcvyXhqWcOOHNOMRBjlBmBL+v+o3EfEym891hrcQ6EjEEPKPQ8N33vAT7yuVv59Ne8GAMigrKq56QkhpFps5fan6iZ1WRHALBNeRMIJHI684Gjwh9TF5GAgICAgCAABAQEBDyGJt8IiQBs0w/bT1NkZe0L4GvjrG5MzdMutBv/AGqjvrQ2DaAw9TZK1kLA2Zt52z//lZf84cuffRY6u5fZuELYCuMs0cw8RZbToyKRFrIVqAzEM5Bs5p69lm/etYdt39zO17+f//4DS/zrUoGVYKQmNw7nxZTstz/ee5xzSHm8CW4QAIIAcPIKAFKCVgJlS0QBswoufCL+5ZeczXMuOI0LzhgycGNSkRGJEiVq130vFE4luMFmduzayWzf00s1eeGJ5p7IDx8S/Omnb+Yjf/uQ2Odh7Oq5SVB3EGg5eztnuXbumt5YTWqAF/vNebJucAo4LC5UAAQEBAQEASAgICDgZIFEoJpmWAZEZ708ramljp51F9BNJM2jsEiU0mAzVFNrG/UEpVfYSoL1xFTMAi+6AP+bP38pl1x4Gi7bwzBRKOEpJyO0NyQaEKZ+v8pRZQaRbmJs+9y7T3DLnbvY9o3tfOP7E7G7hBxAa0pW65CllEEACALASSMAHHuXiKM/f4GBytOXMKvh9Bn+/IXPmPuF11x6IRedvcCMmuAne0h1VXcWsSVlZTEIdNxDpEMeWpxw+llPxJRjRnlJwZAbbvohf/KJn9z+vd08cxkohW58RxxUBtFkJcWRpKjq8XeiI176dUKAbyP+rukmYpHNdQsegAEBAQFBAAgICAg4uWbfTmhf+NY8q4ZtSP5qSm2dTqsx07IASwQqxti6ZEDKuk0gU1NBwTCJscWYlLpt4FVXpP5tv/I60uwBZrM99HoKerMYYxiXFXGaEEcCk+fESMrCY/2QXGzizvst277+I/7u5h/x/d1G5EnEBIkxBu/9VACgEQVCCUAQAIIAcHzOP/YV8xI2R1z2vKf1bnjDK57NC552OkOWEZOdaFGAljhXUTkBUqF0jBACay3GGOJeynIOrn8at9+9wv/3L7/EV+5A5NTV+bIXs5KV1HF7idISJxzemobc95qjKRrxsJ57RFMS4FsRoDNjIdxaT4CgAAQEBAQEASAgICDgpIBkv9x+7VerZz0SOxUA1HShraimvvt1LE3jhK8X1y0h8pI0rg25irKApjv3bASigqefhf+373gZzz+zj1t8iNyDHPQxEgwVkhJpC3pKIK3C2QhjZ8j9Zh7Y4/jat+/hq9+/ly98d2dtEljV8oRXgNBYIbGOdQqHQ/g6Crh6jnFNEITDN69vNFD7ef01WRH+YbkIQQAIAsDRHbtfk+Lu1j6KdQKYl+vOu42It3X08qD3vMSgvEcCykPfwSXn4t/w0qdz2aXP4JSkQI4eIBFjiBp3f2sxMsbKhMoLjPPgPFqAVzGZ7PPQCD5y/S1c97mRWASKxuCvjc4rKZAiprC2/rwJQFlwClzanEsBFIiuy3+H3Hs62UzdbUIKQEBAQEAQAAICAgJOutm3Y6K1fkL2a1QCpqRhrW7QWVz7AxEsR9tAoP0ZAv/oFT3/S294MWeetoByI7LxTmYHkjiylMWYyhqUTIijGUwZUWaQRrP4SvKT3Tnf+PEyn//mHdz0rX3DXYaxk1BImFiNlXH9TlqCMAhbIH1tdaioMxWs7OGI8FQ4USGbUghY7W4gvER6ORUKGsvx+qyEXD3/R/OlPiBBPrEZDMe7W8OhhIFjjaAf6/Ef2/4l3idTMo8wiFaEE6bZPx2C36b81PeywCCxpDEYKZlkDu8gjhUKhS0rlFIIIXDOEWFJXe3r8ZRT2Hvp0+YWfuENl3La0NEXJZEdI5UBk4EtodfHIilEROEkpQWFItIa5R177Rz/69a9/Mmnv/6HP36Q3xIKCltH/oUSWOvXnuuGY9CJ7OM2msAOvuoM5D8gICAgCAABAQEBAY8MEmCuEQJ+59ee6n/uDS9jKBbJFu/BZDuZm0mJej2K8RhrJJFMEJXEG4f2CitTJvEpPLBs+OLN3+MTf3sXf78D4TSYtM+eicXJXk1xhQUqtCimhQ3Og/cRnggvLH6aweBWtRFPTf47RLelzP4x9O0VBIDHqwAQdQSAur69K1IJIVYXWV4i/Nq0H0GFaQz10n6E9zDJKoQQ9HsJRVGQKE/qIapga8rFL35mcsvrX/JsnvXkrSTlQ8wPFdgKOxmjpK+dAb2DSFFUFpXOIHuzLOWOsdHIaMj37/wxf7ntNj5xmxe7mvfXWmJMfT8mSf3eh77PQgu/gICAgCAABAQEBAQ8Zib/SMBcCjaDJ5/KDf/nP33lZZdeeDpDswc52YmfLKG0AuPAOlAJxCkIjReKSZ6hk1mcmOdH94359Be/w6e+suN9d414RynA9+ZZyR3OWRAeEYGXVV2HICCydTqza1qIOa+biD8dQmUAhxMSJyS2LYkQDuXsNI36sSkCBAHgsSsAuHWlKBLXRvyb6yIRyOZ+lr6+10XzY6RCDecvKMrsTp2PUFi01lilmAiFxYGdMJSwqYQXPA3/yz/zbJ711NOJZMFc4pg8dC+zgwR0H+cEQii8NUhb1PVEWFyWM/YpVf807tgt+ci2W/nUl/eKHTmU1KU7aRpjraWqLABKKay1QQAICAgICAJAQEBAQMDjZ/aXIBVgkd7Rc7AAXHYx/nd//Wd4wtAyKyZQLUE2glRBfwB5zkpRkKY9oiihGpdkpULG85R6Mz98YMRff+U7fP6W+27cvpuXjQGvI0iHFN5RljkIj0wEsipqcuQArxAuwTuFROJweGlwwuKFwwrwQtbHjQIPylWPGQFgY9L5+BYAHt9wazp0tO3w6nR53fxPNeTfNQKAq130PRihGXsFQtNXDmkLjC/w1K76SsGchovOkf7nXnERr3z2k9gUZyizjJCOqlhhdmEOlkaMJhXolDgZ4IxFeEusFSKOqSq4b8nwib/7Nn/06cnwQcd4EsHESHppQlFkOLfxfbp6fwQBICAgICAIAAEBAQEBj/3Zf2YWJhMQoJwlsZ4BMA+8+tna/+YvvoazNkHsF6lGD6GkJY3rtmBC9Sknkni4Cedy9q3sQ+uYwcwW9q0Y7rx3H5+76ft888cZ3/gJYtGC0SD1DNLHgKOSS+Ad2oJyCm11Q/4FFkElwUjwsq0vbq3FWyL12CQgqyJAEAAeywLAqvgkp1kAq54UEiHqnvfC12KB9G15iwcESg0ZFSVIT9Lv1ak4WckpCs5b4PtvfOlZT33lcy/giadGCLvETF9hTUm2PKKXRFTlBK0kUZSAjMAKrFcYNSCTA/YWEX/95dv4y+u3b7trN5ejYGTryL/UCZUp1pTha60xTU1CmqbkeX6I+y0IAAEBAQFBAAgICAgIeOzM/rJZ0HsFDhSehUhjq5wZYAD83BVb/T983fM4/4w+qtyFm+xEmAkChXUzGCeRyhEnAuUNZVkiSFDJPIv///buK0iyK7/v/PeYe9OUad/wDe8xcAPMAMPB+OEYkqJGXJFccje0Umxw92H1IOlBjA1xX8gH8UHch9UL9SBFbJDBlUiRQ1GcoRnvBwPvPdDoRgPdaFsuM+89Zh/Ozays6sZgKFIDM79PRKO6s7KyMu/Nwq3/75zzP03Nd584xF/+4BnuezZ+6ZUzfHJlAm23mWHsGbIJ+AQu5tkU6UzZSaAxnjjdG9EkyBGTEy4HDOkcTRLfXqYF9htNNTfmb1uAKwB4S3+E8g8/F+W8lx0ugPJx7otyC3VdY7whTib4Fq7cyf/y8+8//z985s4rufnSnQxYxw4SqdlgdfUMdV0zWBhCCIR2gvcejKNpINCDwR6OrFkeO7LGv/ujr/LwC5iTLcTpFqHAwNU0saEFqrrMVihT/u22qf9v9n5TACAiogBARETeUReAQd2jaSYMBzUbowaAYX/IeLzBcn9IM95gF/CLnz6Q/4dPXsv1FzgG4QhhdAZbLeJsjUu+W8hvwRoCkZAyOVlstcza2PP4C6f5+kMH+fbjr/HUcczpAI3tE40r3dNNIOfQFUqGjCdkD/huwDThcsTSzEb+49t8F4D5AvtcIYACgHe47Ge/RG2O7pe/J1POebSJTFeAm7lTZsoeHmYEiwkuquBTt9f573/4Rt571W6W+i3ECbSBjfUGX/epd+2AjTNMVo7SW+yBq0gBolsm1jt5fdznscOr/PFXH+SPv3nSrFN25cDYbo/OMtOnIlN7z3po2V7uO+fmAgEREVEAICIi75r/+U+3BOx7GIeyY1+LoUk1uD5EAzYxSKv0ydx8Aav/6+euXvzpu65kkRVM2MCFgMkeZzwYW4rKrr2AyZAC5DygNYscb3o89MJRvvDdB/nmQ6ObT454dGIMrc0EB60p3zIZU7b9SxUmTRupJWwXFBhSt+b6nRMAnCsEUADwDq//zXRA33Y7Vkx/ttLsfGcD0aTuY7ecBTBk+gmu3Mfvfuja83/tE++5lPdfusAFwxaTT0EYl8K9twC5TxsTLiesz2DGkBMh95jYIY3fwxOHzvBHf/0AX/zeqnm1gQ0g9z2xpfyU+womEyBTFuAkImm2BGB747+tPQBEREQBgIiIvOP/59+10ysz7LvbS5ldEbFQVWUUkgk9A/1YGgV+7M7F/Ll7buKj1++il04RTcJ6gzVATLiYwRiaSaBeWGbiKtaagKsXsbbi5RcO89ATh/nmoyd46tXm64fO8JFVC6seJgYwdamuQqLC4lOCGAhkMJboDAb3jmsAeLazn/+bdab/uwgAVNj9XRT/CVwmk0ld3Wyzm9vuz1B5R2wmYBKVB1IiRBj0YN8id91z7QXf/eQdV/Deq/ew16+xkzPYNIYQwHvwA3COjRiJRPreUtkEbSCZAafNXl44GfjKvU/xp199+QvPnOBnNoBUwbh9o9/wPOSq+3tL2QdAREQUAIiIyE9MCDA/M7kEAF1TM9ftKU7AWqi7bft6wF7g791G/pkP38gdd9yAt2Mmq68zdFA5QxpPsLt20W5ssNomql5NbRw0LT5GrFvmmePw7ccO8s1HnuWxV9LvHFrlX6xBmQ2QHTlkvHXUtoxGxhgJGJJ1WGshpnd4CKAA4J0cAKRuej8ZcB5rawye1CYILaSWgYFB1TW6jLB7kQ9dd/W+r7/nsr38wj03cMFgwoAzVHEF7yOkCCFDtQCuZty2+GEfU3lW1zcYNxFreqykBf7gSw/xjQdf5/FDmAlABevBMMmm+/kuzTNtLssP8uw90+tehAIAEREFACIi8hPClooBoJtav+WqkMFZQ46QcbOgwGAwRDyJBWBfxcIn7tix9iuf/SluvXInceMITXOSHcs1J06fYmlpiZ5fIo8n5CZgrSvTl2Mi9ndwunW8emLCA08e4Wv3vcAjL3H3iTHfG1kI/R6jkGlCBGdx3mNMJjUtKUa88+/wc6AA4J0bAEAyCesc2VakkEstnQHrGNSWPFlhIcOigT01P3/Ffj5/6zU7uevWa7nx0l30xofYtVSVLxo1Zcq/r4jeka1lMmlZWNrNZG3MagPDvZdy6EzgD/7ym/zZN1/79YMr/PZ62vpuiN1T6A36rI3GZLP1Zxo2+xDms95DauonIqIAQERE3uUBgAUC2Li5r/m0UEjlHs71CDGRsIDHOgcmEcIGPRKLwBVL/Kuf+eD5v/mZj9zClRcPse1phn5CWF/Bt4G6rkqB08RSgdQVK5MxthpSVTtYWXM8e/AMDz3zOt974gj3v9TUrwXakYVYV0RjibGFlKiA2nmamN7WPQAUALzbf4NyhJC6JpUG6z2Vs9g4xobAALhkF//q+ovcb9562V5uvWIf1160gz1DxyCtYN0K0EKsIVqy65N8jyZDYwzDwQ7WNiLZ7+SloyP++Ev38qX7Tv7zQxv832eAdcDWA2praMcbOKYzehwNsSzjmQYAXeNMk8uyH2ZhgQIAEREFACIi8hN2JfDd5cDPFQIRcpg1CyzlpiXhNpcImABETGVxOeFaOL8Hv/Chi/Mvf/x2bjrPM4jHIa0C41KdZMckGSYx0R94JqMxLjhqN8CZZU6tGx5+4STff/YoX3niVQ6ucuXhNV6YAK6C2oHPZab0JEE07+RZAAoA3rksKVj6vqauHKQJodmgyrCzDzv7/LObLqt/5/pLd3H7VRdw1fmL7B/Agptg2zXyZB0zcOS2wfSWYWkHBNhYG0My2HoH63nA8ycSf/i1R/mv3z6y+/iYUw0lb4hA4wwhmrn3gsHZijhtSsB028EAebPx5/Rd054VACgIEBFRACAiIu/+K0C2bLYEnIpUtadtxmA2pw1bY3E4jHdM4gSMAdOVFTniYmAvcKDPr/yTn7vy9z9y+6Vcd+kik7XXWF87ycLCgF5/yHhSmqOZFOlhIRpyA9gBY7PAsYnngRdPct9zR/jWo0fWXjjG0looa5nTdLa1UwCgAOAt+tHJFhsNPWOweYwBFoHLz+Pl992w/5IbLtvL1Rft5IJlz56hw8d18mQVT2BQV1A5SIGcDBsYRgGS9Sws7ibS49iZzH/91qP8l28dOfTwcQ6sAa1xkB0DLIFxKeANZUZO9qQ4He43eG8JYdJFBWlLnw/ThQhpGuQpABARUQAgIiLvdrZMyQfIAc/mjgDTEcaAL7MDqhpyhDABwuaFI4N1Bu89KSXaNs5GGWtKq7E7rjL5c5+4kw++5wAHliO9yUmqySlcDmQ7oEkZ68BaAyScqwDDuIGQexw9E3n6lVUeePZ1vvfMqzx+GHM6gRn2WRs3WgKgAOAt4XJi4CyxKVP9r9zLn9/znn2fvefWy7jpwB7OXzKY0Wl6pluVnyBlS8yOmLot9nLCG6gGfagGrCXLodMNf/WDp/nTb7689thRlhoLG7mM1s9X676CkEr+liOzEM+7qiyVASxp9h5LTEf7HZszfdo3KPYVAIiIKAAQEZF3YQDggIzJYdYNwHa//iegwYPtdWucE9Biq4wjlv3FM+S8dd5AmGs6VnkwDSwABxb5+X/wob2f/9zH3stV+4aktWMMbSSGMdlbjLdMUoM1mZ4DmzLYmtx6JmGBE5Mejx8Z8Y3HDvKtxw7y/KvZrCdou+7mZZ91O+t2Xhqhpy0XO5MtZIvN5X7TP5bN9dHTXQXsXLGVzDTvKAV312R9NitCAcBb+B6eO455/tDlbcfGpO58pVmvi/JvO2uGt/28mrxZRG8/K3WCxQxXX8jk/TcdqO+66TJuuGSR8xciw7iKb1cxJkFsIXqSrcmmT8iehCfaGlMvsDqasDgYshYyf/2dB/mjL73AA69jVoCRgzZ3hb9zzPYbPAfvSyPClMpz7Veepm22vNPyLObz3S0KAEREFACIiMhPVgjQ/cJvOLsfeJ5FAmw2EttSPG0rLM9xVZluG1hRPl53Mfnv/+wn+OWP38KuU/fSj8eh6hGsZ5IC2EzloUoRQy4VPgNS7DGKA9Zjn2cPneDbjx3iqw++wsHjyZwuS5yZOBgbQ2shzD1BA1Sma1kQDJaK7DwTB9lmyBGTUuljQMKlrS8jA9FAMrb86Y6dfaM62qRzFlRnH7MfXsBvDwO2/zvn+Lcs+t9esyfy3+Q3kmxLoEPZkm8a1Gw+RrdvRbdPnyFhyyaSs3PrzfTsWCKGEICcsdbRqz2mbTExlFF6AymV5Sc9D3v73PXLH7zsu3dctYf3XH8ZexYNjF8nN6eoGeNsacDXtgnMAOf7hFDOgbOZjTzk1OBi1swOHn70Kf7zn32F+57HjIBgYS1BA3P9OfJcNDf/A/ej/XK3teP/fHCiYl9ERAGAiIjI3/ACks9RUHpvySngulHMaZywd9lw7X6f/89fvo2bLuoxHNRMmjV6dabnIbUbmNhAaHHGY3qLEB3NRsS6BXw1ZKUd8vTrie88/CLfuu9xnjyUzLEMYyBWELwl+m67tpCgLfuw++zwuSIaQ1OVvdxtApNjKQ675zlfrOeu/krGdrML7KwIVQDwFgUA88ffJFJ3zGfvQ2NLk4g8HcnPGAKGMHvjhu7wOe/wviYbR4yZEBpsigy8ITeRITDsBuCHwPtv3ZM//YH38FNXL7O/P8HlhsnoNN40DJaqcljHI7CONhlwfVKuWB9HEhX9/pBJbzdfeuoE/99ffJvvPzI2LeB7sDYp7+HsHDHOLdOZNub8EQMAERERBQAiIvJjDQDmZxY400087gpsT5kR8L6ryf/oc/fw4VsvYrhxCDs6ynBYl5nKLTRNC1WPejCE5MswbJuJbcYt7OTEeublYyPuffI1vvLAizzyUjSvBVgDgqnBdrujG1NGdp3FxkxoR3ibZ9P7ozGkbIjGbhb409fZTQW3qXw0eXPJwTl7EPx3CgC23/aTHACUgj/N9rmfNanMc+FA9t0sAbN57Lu/JAP14vLCaDRep5mUc+QszjmMMVgCLrbYkNjh4Ko9vHzXtTsu+eBNl3PzFfs5f0eFiacwqaGyDuo+xEg7GpFSoKotk2aVXr9PyLDR1vjlA6Te+Xz53uf4vT/9Et9/AdN0P0iTrrFlKG97rK+JITNblLOtm7/qfxERUQAgIiI/Vm6uvM1vWFDOhQCUademCwKydxAiew38wkd25v/9Fz7ElXs945MHsXHEwo4dhGZCSAlcxiWwOeGsAWMIocXUS7jePk6Pejx1aMT9Tx3jWw8f5P5nXjcnI4wxtMYTLKQYwSSscyz0e+SNjdks8WgMwZZJ4mXU1W5JN0xOuFyav02LyWDfoIv631EA8EYhwPT2n+wZAN2ov5kr/KdBwCwE8JjcTQM5R7+A6QyAetCjchBDQzPZKMtWfAmozlvi5++5ad/nf+5Dt3DHFftYTmeom5O4KkIelUdsM5NxxPoBveEiOEtoW/ygz4mTp3HDnfjlC/nu46/y+3/yNb79eDRrwIjNVfiZ0pIjWUcbIGdzjogtsP2VKAQQEREFACIi8tYGAKYbtcxlGYAxhhjarsneZgGTPaRQdgyoKdOrP3L7IP/Pf+9u7rzuPMz6q+yoAj5FaMelunOGnCZshIBb3snGJGFbT98tUpllJuOKZ18+waPPHeNr9z/Bk6+F33xpg/+rsWAW+6wH2Bi3kDM938ekTDKJbMpo8nQqeZormE22ZVlA8uX559IqMJu8rdhPb1LQbv28yT96AX7uIOBHX7/9dgwA3qzgf7Mmi2b7GnYzVxDnbp7JOZoB0vUCGNiye0UMZZ2AsdCzsFzBjopfuefW3b//iTuv484bDrDIGoxOslBlTG6ZrJ5i4MBYC/0B1D2ImdGkKdvx+SXWwwCzeAmPHFrl//38l/nygydN0x31EUAPVppp9c/mdpwGbFWRmjD7yZq+1rP7dIiIiCgAEBGRtzwAoDQNnCtXnIXKGgyZlKBJYD3EUO5feXAhsQO4Yg9/8i/+ye1//9YDu7lkV40Zr0C7gfOpjJR6y3o3Xb+fHaYxMILaL0C1RGgdr51u+MbDT/NXP3iKRw5yx5GW+zcozdXqxWGZ+Z0N2WRyt/FhKRDzlvLapOmMgG5d+WyvhB9fAHDuEOAnOQCwc8evNPgrU+WnD17uk7ru/hlbegV0IYDPiWGAXt48ij3gmkvIH77jWu68/iLuuOYCeukMvbROlcbEUKb3u8pT1V16NZ4wiZFsa0yvT7R9JmHIWl7g4edO8x+/8D2++sTIjNmc3g9lZ80zjQXrNp+vMVR1j7ZtIYbZazOz13j22VcAICIiCgBEROTtEQA4V7ZBy5vFqpn72uFCzcpGU27sG2jyrNn57gp6DfzCR8/LP/eh67nmgiF7ey393ECIOJvBjWlTi3UDrKlI0WGoMEA7bql8TbI9TmxEHn7+KF954Fm++/jqd18+yQdWgYm3NKY/G13NXZO16cT+ac08Lb1muyLMNZ/7UYrwNyp0/1u2EdwaArw7A4Af5bhkPCn3AYvLLY4JjoZzTpy3ELGlZ4O1ZZA9NuyLUEVYBG6/mvyxu6/jrhuv4OLdfQZug41Tr7I0rPEOQjMGa/D9PjEm1tbXsdayuLhIagOraxOqhfNo+vv4+qOv8vmvPcxf3n/abFBa98XuuVS+hBIbIYHplQDAds80hC40yywsDNhYXz9n4a/iX0REFACIiMhbcgGxc2XoZghgt1xdrDVYa0kxklLobusaAvru66fVjK0gGEiBHokhsADcdAH5lz5zOR+/6xb29GuYnGJYT0iTNZJx4CtCBmttmWUQp9OnPSnXbOQ+Z5oezx5Z4Zs/eJJvPnSEx49iRrbbKYBSeyVbKtNU2v1tFv9mWnalv3EB/XcZAGwNAX7SA4Ae2RhcbjHELgAovRrYFgJMtwhM3fftJ7h8wCduuZS/vuf267nzhgNctqtmkFfpx42yvr/nYDwu7/S6JmfDRtOCsVSDIRNj2ZgkKr9IMIvc9/hh/tMX7+frz2DOANPZJt55Ern0oAAwjpwtmBqc7Ub7E+RUJgTEEka9UeHPLKLSFn4iIqIAQERE3qILSJ7emLfNBJgWK/OFmUmbUwi64VHH1hnczoGJ5fYesAzcdjX5c59+L5/9wHvY0ZygatfIOWBcABcgR6KJYBzGVYwnqcwQcAuE4MnJs7o+4dCJdb7z7BEeevEITz23/qWjJ/nkWigz/IPrMWo9DWWJQVV5MA0xbGBNxNkyWGsNxGAwxuC9Ly8lRhIZa+2bFrw/zhkA5w4D3uImgDb/0OMRY8Rai+1eszFm9vpTSqSccc6RDbQpkuN0KwCPNb40jUyRvolUOUIqvSYu2MO/ueLC4T//9N3XcOuV53PpeUuY0Snc6BQ7+pQ33fpp8F0DQeuh6oN1pJwpu0p6RrbPmTjg3ieP8kd/9SDffxYz7p77iDLlP1J2i9iynd90aUyu2LKcpIuc3Ll+rmb3mm9QmVAIICIiCgBEROStCwC2FJZ223zsrQ3bsKncpyvyXbfeOU9Lm9LsvxR9MVMDFbBvkV2X7ebkP/7Mzbz/2gNcdtEOwug4uT1Bf7ECF4lra5hqQKQmJkPbZgiZhbqPtY6NJjHqLfH8sRWefPZV7nvsJR54fPIfDp3hn4yACYZquHf/mdHoWMyxPFcbqKuMsYl2AsNej9BCCGFWVBtjYDrjISUFAH+LAKCqKnIuI+dtG2ZLMkz3vrDdeyRbML4ie0/KDmKGmPAxU8Uxwy48Om/AP7v+Ev8777/9Om67/iIuv3BAu/YaVWxYHlT0aAijFXxOsDCAtgVfQ6qZJEdjemTfp8GxHiv+9Cvf51sPH+feFzCrwKT7k7GUThd5s2g33RYFZi4ASLb7Udic5m+2nZU09/OwueWkK4+VFQCIiIgCABERebtcXd6kyZ3DdgV/2jaxvoyKmrlbfWmyTtvNonYJljJcs4d//7MfvuIf/8NP38k1+xyj489imhWGu5Zg3JKSJeCo6h6mqmA8JrYjnPekekAwPSZxyOHjIx579nUeef51Hnv+OM8ebi45PuHwBoCvSFXFqB2V3QFq8NaTxxG/Za2DxxhTOsvHiHF2W0Bitx2iv3nx9pMUAKTpDABbdpKYv7sxhpwCISaiMWTnScZAjGAsfWfwk4a9fbhyt823HtjNe6/az40X7+CCHZ7FuoF0hl5djkEIAe89tu5BaAkbG/iqR6JibIaE/k7W3U6ePnKaL3z9B/zlt0/cfGzCoxtshhLJwiiWkX/fWyRMYneey1yATDfrxTLd1Q//Q87C/NIaBQAiIqIAQERE3jlBgElbAgED1F0AkEhdozQ3K0wNidoaYmq67fnmZkybXimCRhv0cmkYeN1F5M/efYBP3X0DV+wdYManMc2IwbAHOZKbCcYlQmzIOVAtLDA+vYJ1PXxvJ9kvst72OL6WefrgKR574TUefOYwzxze+PVDZ/jtERAd5BpaLGGSMAl63mGtJedc9m7vRv4VAPztA4CcEjlnjDE457C5LAuIqdzR25oun8EQCU3EZljwsG+Rz1x1weIXbrpkD7ddeSFX7O+zvx/ZUU1YcBOsaSFtdIW0I4RIkwzGeqp6gOstst5AvWM/J5uabz7yPH/2tQf43hPZnEgwMbCeK4zvU9GQwmRW1yfniNGwWe1PFwOkWYsMMrjIWdP9txf+sL3hn922y4YCABERUQAgIiJvkwvLbIvzuY90pZHvbkt4EoaI7yZNp1KY2QQpbX3Aub8Pe31GG+PZ49XADg8fvW0h//Qd1/DZO65jl1nHtychbkAFbZzQkBguLmFCKskClrYJxORx9QItfU6uR547fIL7nj7E/U8e5bmj/PrRdX57I0NrYRzBOYOzZZp6GwMxZawB62uMMYQUtxTa+azjpADghwUAvbqmaRpSG7HW4O1muWxsTWRAaiZY1hgCez1cvod8wwHHVefv4KbLz+fCPQvsW17A5jFts4YzCV+Bd5Y8meDIOAvWe3AV0GMjVZxJAzbqPfzFd5/gT776OI++Utb35xrGCdpowQ82l+HngCdjCRgSmbLlXzaUjpfTtf45MZ0I4Ladybw9ADDbkoDtoZqKfxERUQAgIiLvlAuLm5VFlowlTiMCk7ot9roi1VblrzFBbkuRbSEnT8qG7B2mcuTQQGgZZtgFfOhq8v/0M3dzzy1XkNePQlphed8SuMSZ14+yPFgqz9UayBHaSSkCTcXGJNKaIa+vJV451fLUyyd44KlXePbQRnP8DB84Oeb+U7l0eTeA75rR5ZxJlGnrMScFAH+LAMAaQ4wRR2myaCn/zjlTW0NqAwNg74ArrtjP87dcuovbrtrLDRfv4sIdnr4J2DiBVLrsu34N3jGajFlfX2f/zt3kmJg0gTZbbG+Z9dzn6ddWefzwGf7jXz999OAZzj82KWv7k4WU5/pb2K4BgavxzkPbkOMEQ8A7mMRpAECJuzKQSty1ffeMWQBwrrArb/34RrmAiIiIAgAREfnvWcGdsxA1P0J5Od2O7U0vUtZisiWlzV0Cpq3T2tmMgQgE6BrDOVN6BCw4sBFuvZj8iz99Jx+69RL2DkYM02l6NmB8j3YywZqE87l0f/fl0dumoap3MI6OSeyxOq44cXLCwSNnePLJF7nvhZM8vOI//OrIfmPSNFTe4ypPCIEmpFkzQAUA/+0BwLTrX2UdxhjaSUPXNpK9fbhuiZPXX8CuG645wPWXncflF+xg/1KPXp6QxiuYNuC7wxVDoI2BbAy+rqi8pdlYZ9waYm8H48Eenj3W8lf3PcWX7z/0hWde52c2KKP4EbDeYDKkWBZyVA68d6QMoyZ272UL3oFxZZuInOaK9nTWEU/b3xdm7ofHsLVpZt48RvM/dQoBREREAYCIiLwtAoD5e6VtH+P2gmdL4Td9HFPWgHffx2Go8BhMV/I7IgFDizGpFGhs3Y6wItEDhsBVy/zuL3z8ol/77Edu5dK9A6owIjUbOJuwLhLDGpkG68rac4sjZUtmSEp9SAvEVHPq5AZPv7bOH9//Io+8cpKXDk3MKJXXNJkGG/WQNqQtIUeazWoopZ/NqauBp2u6bVmRMAtH0ra/21kAUIrltO3wvXkgkLGzwvqcTRqnvRre4OP20OYNQ5xsN98L06+fFfqJbBLYTDJdZ4RsNmvfbMuxMQaXEy6XQMdl2DGguvTAvuaGCxf49M27uHpfzf7dy3giudmgsglvLSaV900MoYRHXSP+lAIhNoTkmPgdpP5uHj94gv/8le/z1/e35jiwDowB6kEJS2KZQUAu583lzbduLm9MkoWQp6/bls+m3G1vudnQMs/Okt22rj+d/bE7x/NVvgIAERFRACAiIm/7C805ewGYs4v+N79g2bmd06d/S1u+z6ysspacEpWBniszwT1w/WX9/NHbr+QffeR6LlpO9CpomhVMWsfaBscES0MzGTNY3gkTGK239OtdGAaEESTf49RoxFOHj/HIc0d49KVTPHaQ33l+lX+xDtTDXaxMAqaqydYQ4wTCBEwAl/BAnSwmJGI2GBzOVBjrCDnREjEOskldcJBmTQRNLsfAJrBshgpmS6V47kObMJh07ku/yVsDgHyO6GYWUADZ2G4mR5r7nl0BnCzOVBATJpemjikFEhEPUEdaMsaXiQBm2vYBg01gQqbvoIqwCFywzO/dcuXCr77vpiu58YqLuHh3xQ53htycpjYG1/Ol4MYCnqZNZFdjfE0IDTEFvAmYNIEwZr23n794JvPn33uO79x31KyzGeBMgGzt3HT/+YClFOTn3ALTbAvGto3+v/Fb/Q0Clzf4Ii0BEBERBQAiIiLbVFVF27blYmfMbIs+gB3Ae/fy2mfvPv+8T3/yHi48f5F2/VV6boPFKtBsnGDQrxmvnKFf9aFegtVAaA2+WiCFgHWZBsta6HP4dOLRg6f47hOv8P0nT/76Syv89hgYYwlYfFVR9StimtA0E4jdqLYBZ0s3hNjtC4+zWOeIqe2K6/Jnvm632WKT7UrNxOZsgFIWbh+Zn0YkGVt2K2DrlHs7d69zSyRzjqUMJnX/7sKBbMnGQu46PLShnIvaU/uyaWKMLTE3tARyt1LCATQl1BgAOyrYWfOZay/pfeGu6w9w8xXncdneIXuGhqFtqPIIY5uybAOgaWiaRNXrY+oebZsZBWizobe4gzZbxk2D7w947oWX+IO/eII/fBhzuns91nbbTOb54nqu4/6WYjxtOaoiIiIKAERERN5GrLU4160lb1uqnBkAPWBvj/0f/+Ceo7/0s3dxxQU1dvQaA8YMTSBsbND3fbCedq3Fux5msAQhMjGWjC8z6m2NcUOOnWn5/qMv8P3HX+L+5zeeemWV619vSrPA5KBJZYl43a8YNxGMIbuMsV1TuZTJIUPIeOu6Ij/Nps0nm0uzQcCkCrLvRou3FqV5OpV8dmsZmS8BAFsDAJO7pQhpVtSfKwCYfzxDwHe72k1H7zOebCzRWKKBalgzSQ0ptJDibADdGo93NcnWxJRwFvou4sI6vQgXL/EvL9/Nv/6lT93CFXtqLt8/ZPcQyC2EdrNCb9uynKHqgYGQI84ZyImNjTUWFpZYm0Rybzcbdidff/gIf/DF7/G9FzAjyvr+RDnsoVs+EgFryrmIcXqg7LbCHwUAIiKiAEBEROTtpqoqjDE0TTO7zTmHc462CTgSNdAHdhr4ex8b5l/6zAe56qKdDNMGA9swOn2C1ExYXF6CHGnW1sFXNMFR9fq4nGkmE2w2uHqRJvU41VqePbLOvU8d4hsPvcjTRzArsRSdE0ogwFJV9rQPYXNtxByfqxIATLd8M4FkInQBQKYLAKbFaFe4n7WN3KzZXLc2Pc/N45+tNc+z4n9rM75tRW43Rd0RqFO3DCGXrRzBk4FoINpAm0pjRtODqnKQLTEmaA0uOxaoIYyAwJKDi/bwtVuuOe/DH3nvldxx7XnsrUYMzRpVHkHYKLtAlCPTzTBwTJqErTx4R9NGYk5UVQW+JtLj9Njylfue5o+/8jIPvYI5BWzgcPUAwhrOlJ0mQ/eafa8ixEwIgTdvYykiIqIAQERE5J1x9et1HyfgEywa8LmEAdfvJ//iz93BXbcc4JLdnjA6St+O6NmGNFkvzemSh6oGU0MbmTSRlB2u6uPqBUZNZmIXOHK65f5nXuFbjzzPoy9u/NvXVvinpxKsulLLUkFlwMWyG2Hqurtl40phnV1XxmcMCZcDyXQj7vMl6baR+1mdbzabDJYAYDrPPW8t7LcVtrOeAGcVvhaXyjGz2ZKMJeK675PARFwO9HqZFDKxLbMeki0j7MlaFmJiVwtX9flPN1y1/A/vuOlSbr/pYi6/eJmeHTEZnSQxweaAIeNMxmNx1kAMhJDJw2WaBFVO2JQJTSTQY5QXOT4Z8Ptf/A5/dd/R33hxhd8qyzHK93feE0OYxiHltXaHJU5zEWNmSyVU8IuIiAIAERGRdxDnHNZaUiod/o2DmFO5CiYgeUx2LFc9Fry5eDw6c3gBOLCD3/vcpy//1Z/7+O3sHDS0q6+wWCWWaottA3FjRIiGXr8PvUGp3icNISS8r6FeJJgFTrcVr48qXjy2zn2Pv8i9z77MCysbv3F8nd9aWynFZ23BVdBEGAewlSOa6Zp6W7ZAzGCTAZPJJm024JsLAWyGs/r8zTW0K4VtOue6/619BjhH8T/7LCbVgCud7c10x4PNkIKQGFgY1GWp/rgtxfXiEC4a8LufvW7/r33whst4701XsHMRwuQoOaxQVRHjM1hDto6UoG0iKSQqY6msJVrP6expsuuetGfUGF44coY/+/IDfOHBZBoDJzJs4LH1AjEEMAFvIYUJ/X6Ptp2QQ3mIPLf+v65rmiacs/hXEz4REVEAICIi8jZjrcXaUuaWKd3nuI93pNg1knMVhPL3vgWbEhVlC8FF4ObLyb/489fzvtuuJq6dYG+/phcDnoTJE3I7Iocxla+g34dxIFLRUhMYYOplohuwNgqc2Wh57IWXeOql17jviWM89TLmJGV5QDIDWmvItmx2WDY9NN2IfwW5pjT9a8E0W+t8M781YD7nxX7WtH9a8Jpzl/j5h/yGEPFkswA4MBPK4oaw2cU+ewa+j2lbqnZED9jvWLjpctY+cOuVvPfqC7n5kj300oSYRkBD7TO2TuSwTjNex1uDq3rgPKSKnBxkT8qWFk/sLbJOzcunJnztgaf5s689f/SJ1zh/1OUdTSpfGsO0S78nTvftm634746XMXjvyTm/4XvlnJ3/RUREFACIiIi8fUKAnHMZ9e+KvJQSMUYMFoPBOEtM3W4B3mOMI7WTUoDGXLbso6wY8MCNl5P/4c/eyT23XEcvjejnMX0zYWDH1KaFOCl/yj5+ZFOTTUXKnhQtxlicG4IbstZ6Dp0Y84NnXuVbD7/IIy8e/Y3XVvitsS0d6WO3ZD8ayF3Hglx65oPpiu6uWDe5+7jZBaCbxt9ttXeOAGBa5G/pGzCbQWDP2r5xeu9gPNkOugZ5TQkAcsDl8rg+QxVgwcKlu9yf33HNRZ/9wI0HeM+BPZy/bFn0YxyrONOA65YOpEDKLZUDKld2EEgZkidSk90iyQ0YB8dKcDz4zEH+9MsP8vUnMevAKrA+bXFgLK6uiOMJFqidKcsGsNT1AuNmXPodmDx7f/xNf2FSACAiIgoARERE3mFXwNLB3mJm+9130+MNs2n3Zu6CaYEKuHIn//IDt17wrz/14ffxnivPZ9muYTaO4/MKCy6Vde+jDVICX1VgPbmNmGTALRHzEjn38D1PA5xYXeWVE+vc++RLfOOBF3nqFW4+1vDoOoD1GO+YhBZSwngwVY8mljAjA945jHOQEm3bYkymrhzOGHIM5FTWupvU9Rmg+zeQrcFYT7aGGDJtTDhbYb0jx0QbSs/8qqqw1hJSi+2VHRXIDuc8LmZM07BsYV+fa2+51D1125X7ueuGy7l8/w4GBmzK1KbC9xKtPU1yExyG2hpMTtiUsDmD99AmcH3aaFkLNXmwi9dHmS9/8wd8/ssvH33iVDfa38Ug0zgkzE6W3VKtm1zO63T8P7DtPnMBx4/yi5ICABERUQAgIiLyDgwAmCvut5SCcw3zyzr6CujhmDBkQq+75e4b6vzzn7yLu2+5gl39lrD6OrY9w1Jl6dmIibE0nstgnQMGYBbJIWH6tnQBDCNisqzFmtfXHfc+eZTHDp7hgWeO8NLRjfrUhLYBXNdZ/8wYkjNle0PnSRFCt1XddOYDQI4tOZXu/lUFlZu+KEfOhjZmQkxdQWvB2K4JXqaua2pfEWOgDRNy14nfEkrfAl96F/gEVYIDO/n3d15/4T++85rzuO3KPewwayz6loGJeFvhTE2MFePU4HdkcIEUW2jL53u+R+nub5hQ4Ya7WQmeh597lb/49n1864H1zx6b8MUJcAZo8DgSdq5oj10Jn7vXUk5yglyOQTd/ogQAxr/p9n5Gxb+IiCgAEBEReRddAM22wi5DmfDvulhgc3YARByBATB05WvHoQQBN1zh82c+fBs/ddvVXLQMO/2YXrNCXD9NZTLD4RCAycY6vcpBbEnkMm3dWtxwCWzNZD2QzCKnR3Dw2AaPvXiUh557lcdfPtm8cpze6RZSDZNMWdduLG22hFAWvruqJlsD2ZJywKSEMQZjMzkGUkiAx1iPtWU3gdRNCzDGYK2lto7xaB0IWBKDuqaypivYAz1g0cH+Bf7NNRf1/vntV13Aey7fzxX7Ftk5BNOeoe8T3uVue4OIM7YsjXCWU6unWNq5hO8PoImkYEhukcYusZKHHDwd+fPvPMQXvvXcb7x4mt9qgcaUEf44PUe5ojQeZEtXf5i2I8zd+v/wBnP4u20U8zl2QVCxLyIiCgBERETeHdxcyTdreDe7KtpSXOZp8Q+GAEQsCVM26JsViHnzq6gpWwneeQ35E3ddw8fffxMX7qgJqyfJzRrDumKhlzHtcWxloB5AyDTjQEzgnMdQ4X3dNRHsM0o9To0czx0+xX2PPs+Dzx3iyVfDHSc2uH+cyjJ6V0OwniZCNJ7xJJQRcOPA2i7LMBAjxESJLGz5nDFlXUBoIUcMmcpkapupvcHFliaU17dg4YKd/D+3XLLz/7h83zJXH9jLlRfs4uJdNTt7Gdo14niNqraQAm1qyaHFO6h7vmtCYGDHPpq1CWsbE3y9hF/Yx9G1xPcefZFvP/4yf33fGXM6wwqlOWK2lOkPNpez15gtnQo3l2jkuTObutkA2xKCzJZzWwKAH6Xb//wcEW0NKCIiCgBERETeERc/NyvwbBlRNnP13bRT3rT6i+X+DoudBgLOEFLLfP840/3HApUFH+HCnXzmnpt3f+GzH7yFO6+9hGXfENdeZXmwQjM6TWw9vf4yxi8waSLJVgyGi6xNRsQYiSFhcSzUi1g8KydWOXhixDeefZ2nXj3NCweP8dpJ7l6b8L1xKsVysGDqioAnYGhz6aeX6RoaWIsxNbkNpfC3pXB2RCqT6LtMHAWqLswYGFhwXLtvN09dd/WFvOfi3bzvgiGX7h6wc88yyQTWR2u0sZktqTAx0atqam/JaUKKYzINxrZEKlZHPaqlCxhXyzx9+BR/9f0n+Or9r/zbg2f4p8HCeirT9DPQTtf1G0qgkQwube3nn0mb523+XOfN5oabszq6At7ks0b/37jZ39ySgjcIDURERBQAiIiIvA0vftNCPmG7SeRdtWjmCknDdEF56XDfhQCZ0nQuk7CUFvwmMzfabCCVfv0VsADsreA9l5E/dc+NfOiOq1lyp9iz6LAJJhsN3tdUVY+mGTMajah6nl6/whlDOxoTRg0+O3rVAKolTptlXj414vmDr/D0i4d59uXXeenV5tCRUxw41RXPDRAt4Cuic7Qxk3KCZLDed1sgJmprsKmFkMvWhxaWHAwMV+wb8idXXmxuvunKA1xz+SVcct4e9g8se+JpbB5DjkxS6ebvqh7ZlKUIBl8aCraRNkVsbbF1RbaZcao5vtrjq/c+wV9++yBPn8KsASNKgNFQliJkcjn2zmCtp40BUingfbf2P2GJdD0MDNvXAcz1eLClLwBV9+/wNwgA5ov/Lk1QACAiIgoARERE3gmm079nQ8OYrqA0ZxV/ZRu+s66aefvjuVnzPJNj15yujDf7ue+46OGiPXztZ+++/MP33Ho1V196AT6u08trDE2DTxuQWmgbyBlsDXUf6iEYz2TSMh41VMZTV0OC73FmDEdOjnj28Akeee4ITx9+nScOTnafbji1RhkhNxUka4kZErk0CowRO31+bXmuu2rYu8jvXn/J4NeuvXAPN191AVdcuJN9g4q+bfG5gRhoTcZ5S8+U8MCEFsKkFMbZkLJllC2NG5IHuxnZRV46usL3H3qKB548zMMH2/OOtxxrSimO82Xmwkbo1vg7UxocZIvFY3KYdWRwWDYI8ysAtjRzfKNzXpoF2s2gZov0Qxr+TQOA6TSRVPoaKAAQEREFACIiIu+AAMDYubnhCdcVgNvGeTe7ym/vNNfNCMjZbH6yezxnwOQwu/u08X7oZgnUwCKw18It11b5Zz56Jx++40qW7RpsHGd5ADRNtyafsk7fVgTrCLbCZqhTCwlSsjTZQbVMawe8emLMwWOneerl13nuyDEefeH15tWTLK60tK0pOxtkW55/juAzDDzsHvArl53H79927SXcdNmFXHvJPnb3YOgCPo5wqaFnMsYZck6MvadJER8jfdNNrE8RYgAcowhmcTcn2gEPPv8aX7rveX7wxKl/d2SF/22VMtofqDEmE3PbnYXuEE7n9mPLk83gMdSUXgyRzNhsyW9mAYCdleWWrbek2S1pvrCf3fKjTv/XDAAREVEAICIi8s4LAWbOHv21c+VdfqOrZp4PBM79eG/UNq6yDpMiNWWJwFX7efiDt+66+VMfuInbrztA1ZwhrZ1m4MF6aDc2SCnR6/XIxoC3xBhJIWKjwdsKTEWOhnFriW7AsbUxLx47wzOHj/Pwi4d58qVw/7EV7ogZvGNXbXnPxXv4+m3XXMztV13IVecvcuGSZVcvYWlhsg6xBV+BrcB4kuthvWM8Ok2vshjvSU1D2wTq3gL4PqfGkbXc59uPPMtffPc5HnyexdcS6xuUpRPR1KQczjoq5zzO2c5u2r7d33wAwLbg5lxn8m/X2f+sTSL1IyQiIgoARERE5EcoJo0Fk7E54jP0gF0ezt/J7+1f5Fd/7Vc/xk1XnMeuOmMnZ1geekhj2pVTGJuZJIOrPD1jMCnApC2j774P/T5pZUyuB7R+gdXgOHxqnUefO8QDjz/P8y/C7mW4+46rueu2m9i/VLOQ11lkjEsb5NEZjLPQ82X2QZsgO5KtaSJM2oYdy0Oa8Tpt9tjeAvSWWE8Vz716hsdffI3//MVHOXyK844Gjk3omhMCAd/NvggqokVERBQAiIiIvPsvvo6y+x7dDnxldfpmz4AecO0F3PeZn7rxvffcdiUHdlkW3AZLvkzFt1Ssr6xjCCwuL4BNhNUVSBE/HJDbSHY1MTlC9mQ7pAmGY8fPcOz1V7n84v0sDhy9ypLaMSk0VM7j6wqsZ2M0wfuy2WEMAZNbBr4qWxcaQ2oMjesz8Ts4shK49+nX+PojL/DdJ09e98oaT0+YNkq0WDKVLesfpiP0ZVNFERERUQAgIiLyLr/49m3p8RcovQEwvdKpz1V4B6lZpU6BJWC3hxsPkP/Bp27hp+68kUEa4TfW2bM4ABNYOX2CGDZYXOjjK5hsbFDVDoMjRgitIZuKyvcxVOQ4gXSGnEc453D1AIylbVoCDlv1cNWASUzkBNZaTE607QRCS7B9WreT+x4/xDcffIJ7n2rvf+Y0d6wBYwsMdzKJtnRPTLGM9scxroz/4wxMsgIAERERBQAiIiLvehbT9bTfXPduu6tyAlOKZmugiqVpYI+ygd3FO/nXP/3+y/7l//jRmzh/kBgOHNYGqtxibSid/eKE3DblYX0FtiZHGE1aUrRYl+j3IphIExJN02Cto19VOGuJsWW0ts7C0k4CFSst2IXd5N4yT714mG888Bz/9ZtHP//yST63ObW/1PujDNl4wHWN87Z1QTAGiKW3gJYAiIiIKAAQERF5d5tO8u8mxFtK0W8y5LbbSg+8725O3VZ9BlIuTQMvhv13XsHRj9xzPe+9+Rp2LVmYrGDTOos11D4RxmOIiaoqDQJTKGv5beUJcZ1MIGWDtRZrHTlnYsy0MbOwtJvVSSRUy6ylHt959Dn+5C8f5tHnMBseTpuyZZ8xBmMMIaZptkFd1zRtJNJtOWDKLgZgyvz/nCCNuz4AIiIiogBARETkXcuCG5biP7WQA46Eg9le97WHUSj1cq/fZ3XckLFQ9ahTph83GFBmBeyruetjP7Xzu5/71N1cfckCee0oi67FxxE+RBwWki1rDdpMSpEmtdQ9h6174Cw0iXGyhGqJONjL8abHoweP84VvPMBXvnfcrOQyeJ8drAYYG1+WLeSAcRaTWkwKs60UrYHYLXHIpgs9rAfruv0VJwoAREREFACIiIj8JFx9u6nxJmNzpsqbzQGnamdpUurWy1elkDYessUbD2kDT8uw+7oe8P6ryR+7+xI++r4b2dXLLJmAa9axbUNtMhjXdR3M0B9Cm1gZtVSLe2G4m0dfPMbXHn6eL37nxUMvHefAyVwePLmaUVMKduv7tLkbzbemhBipxZDodQ8/XduQKUsDMpTtC/P0V4/037ofn4iIiCgAEBEReedcfG33F/MmRXDeLJe3/Ht+U/tpcOApMwJ6wF4P77uhn3/6Azdx540XcuGyoQpnMJPT5DZg8oBkl5jUOziyCt957GW++J2HeejZYE5ROvi30wIeWwIIurX9RAwTLGHuedktz3T69Oz219zdI6L6X0RERAGAiIjIT8DFdzrVfzpYPhs0N5R187PPpi0F9PTCHQybe+rhIVezEtvTUNPSA4bAxYv8q3tu87/5yXtu4YarL2DYG7KyAj948Dm+/N0Huf+Z/IuHx/zhCJgA1nsmIZCwc9/VdkW+BQKeyTmev932StPsebutmcUsXBAREREFACIiIu/6AAC6kXAzV+HPF9HThnm5zBRwc+V4Pqv49nOPmnDekcKYgYOBhzApn73+cvJtd9zJf/nKfZecXs2Hm7JZAN6CtdCErqP/rEAvZf58f4LcfX5+G7/8Rr9d5HP/wqHiX0RERAGAiIjITwi7+XFLALC9Sk5lUX0+exSduRCgLAAw267umVLOd0W+K9+iyYAp2wOSW4jNbCmBzSWQSPPfxIDLWwOAsOV7bwsuzGZwsCmp8hcREVEAICIi8hN49TWU7fFyN6afuwI6221Fcyp7Ac4X06Yr4LFzIcH8p8u8gMo7jDFM2qb0G5jePc/lA7PwwYHzEBOE9oc//7yZVyTmuvxPb50GADmVPQxzLn/vlgQoBxAREXlrOB0CERGRtyAAsNP19F0FnfOWytwQu0K++2Py1vBgtuZ/7j7dmLwh4siklEgpYgzUlS8TCXLGAANXpv3n3H3rZMqc/jQ/FSFvhgTTj9iyH2D3XDf7FtDdDlsXKOS51MF0r0lERETeql9BRERE5Mdq2hZvejEuk+rtOS7OZ+8CUIIDN7s1bY7Cb7uqD/qWGDPtZPOralPT5gmGtGUiQHkki7MVznsm0+YA256BYftOBN3teWuTwnM9/80mgmnbqxIREZEfB80AEBER+bEzGGw3mJ+xpNnIuHnDrygFtOmKf0fCzU2p33LHbrp/22ZihLoyVK4mp0Qm4zDdWPxmmz9nPSYnck6EmOaeyWy9wuy5zr7B3IT+6byBzT0DzhVkmLk/8zMeRERE5MfzG4iIiIi8BezcxfhHGwmfluvl4p22jKXns9OCc17wbfdV6Yd+H/sGn0lzD93dx6Rzdvrf3gLw7GaBGv0XERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERGRH5v/H5ACjPXaFfNVAAAAAElFTkSuQmCC" style="height:130px;width:auto;filter:drop-shadow(0 0 24px rgba(250,176,5,.4))">\n  <div style="display:flex;flex-direction:column;align-items:flex-start">\n    <div class="logo-title"><span>GRID</span>PHANTOM<span>DEV</span></div>\n    <div style="font-family:\'Share Tech Mono\',monospace;font-size:14px;color:#fab005;letter-spacing:4px;margin-top:2px">COMMAND CENTER v2.6</div>\n  </div>\n  <div class="logo-sub">\n    <span class="live-ind"><span class="live-dot"></span><span class="hb-dot" id="hbD"></span><span id="lB" style="color:#22c55e;font-family:\'Share Tech Mono\',monospace;font-size:14px">LIVE</span></span>\n    <span id="clk" class="m" style="color:#71717a;font-size:14px">--:--:--</span>\n  </div>\n</div>\n\n<!-- ROW 2: TICKER -->\n<div class="ticker-bar">\n  <div class="tk"><span class="tk-l">BTC</span><span class="tk-v amber m" id="bP">--</span><span id="bA" style="font-size:12px;color:#3f3f46">•</span></div>\n  <div class="tk"><span class="tk-l">P&L</span><span class="tk-v green m" id="tP">$0.00</span></div>\n  <div class="tk"><span class="tk-l">Win%</span><span class="tk-v m" id="tW" style="color:#d4d4d8">0%</span></div>\n  <div class="tk"><span class="tk-l">Trades</span><span class="tk-v m" id="tT" style="color:#d4d4d8">0</span></div>\n  <div class="tk"><span class="tk-l">Bankroll</span><span class="tk-v amber m" id="tB">$0</span></div>\n  <div class="tk"><span class="tk-l">15m Entry</span><span class="tk-timer" id="t15" style="color:#52525b">--:--</span></div>\n  <div class="tk"><span class="tk-l">5m Entry</span><span class="tk-timer" id="t5" style="color:#52525b">--:--</span></div>\n  <div class="tk"><span class="tk-l">Late Window</span><span class="tk-timer" id="tLW" style="color:#3f3f46">--:--</span></div>\n  <div class="tk" style="margin-left:auto;border-right:none"><span class="tk-l">RTDS</span><span id="rD" class="hb-dot" style="margin:0 4px"></span><span id="rSt" class="m" style="font-size:10px;color:#3f3f46">--</span><span id="rDt" class="m" style="font-size:9px;color:#3f3f46;margin-left:6px"></span></div>\n</div>\n\n<!-- ROW 3: ENGINES (horizontal) -->\n<div class="engine-row">\n  <!-- 15m -->\n  <div class="eng" id="e15"><div class="eng-h"><span><span class="eng-d on" id="e15d"></span><span class="eng-name">15m DIR</span></span><span class="eng-badge" style="background:#3b82f618;color:#3b82f6">CORE</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Trades</span><span class="eng-stat-v" id="e15t">0</span></div><div class="eng-stat"><span class="eng-stat-l">W/L</span><span class="eng-stat-v" id="e15wl">0/0</span></div><div class="eng-stat"><span class="eng-stat-l">P&L</span><span class="eng-stat-v" id="e15p" style="color:#22c55e">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Win%</span><span class="eng-stat-v" id="e15wr">0%</span></div></div><div class="eng-bar"><div class="eng-bar-f" id="e15b" style="width:0%"></div></div><div class="eng-status" id="e15l">Waiting...</div></div>\n  <!-- 5m -->\n  <div class="eng" id="e5"><div class="eng-h"><span><span class="eng-d" id="e5d"></span><span class="eng-name">5m DIR</span></span><span class="eng-badge" style="background:#a855f718;color:#a855f7">FAST</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Trades</span><span class="eng-stat-v" id="e5t">0</span></div><div class="eng-stat"><span class="eng-stat-l">W/L</span><span class="eng-stat-v" id="e5wl">0/0</span></div><div class="eng-stat"><span class="eng-stat-l">P&L</span><span class="eng-stat-v" id="e5p" style="color:#22c55e">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Win%</span><span class="eng-stat-v" id="e5wr">0%</span></div></div><div class="eng-bar"><div class="eng-bar-f" id="e5b" style="width:0%;background:#a855f7"></div></div><div class="eng-status" id="e5l">Waiting...</div></div>\n  <!-- LW -->\n  <div class="eng" id="eLW"><div class="eng-h"><span><span class="eng-d" id="eLWd"></span><span class="eng-name">Late Window</span></span><span class="eng-badge" style="background:#fab00518;color:#fab005">DRIFT</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Trades</span><span class="eng-stat-v" id="eLWt">0</span></div><div class="eng-stat"><span class="eng-stat-l">W/L</span><span class="eng-stat-v" id="eLWwl">0/0</span></div><div class="eng-stat"><span class="eng-stat-l">P&L</span><span class="eng-stat-v" id="eLWp" style="color:#22c55e">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Win%</span><span class="eng-stat-v" id="eLWwr">0%</span></div></div><div class="eng-bar"><div class="eng-bar-f" id="eLWb" style="width:0%;background:#fab005"></div></div><div class="eng-status" id="eLWl">Scanning...</div></div>\n  <!-- Arb -->\n  <div class="eng" id="eA"><div class="eng-h"><span><span class="eng-d" id="eAd"></span><span class="eng-name">Arb Scanner</span></span><span class="eng-badge" style="background:#10b98118;color:#10b981">ARB</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Scans</span><span class="eng-stat-v" id="eAs">0</span></div><div class="eng-stat"><span class="eng-stat-l">Trades</span><span class="eng-stat-v" id="eAt">0</span></div><div class="eng-stat"><span class="eng-stat-l">Profit</span><span class="eng-stat-v" id="eAp" style="color:#22c55e">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Markets</span><span class="eng-stat-v" id="eAm">0</span></div></div><div class="eng-bar"><div class="eng-bar-f" id="eAb" style="width:0%;background:#10b981"></div></div><div class="eng-status" id="eAl">Idle</div></div>\n  <!-- MM -->\n  <div class="eng"><div class="eng-h"><span><span class="eng-d"></span><span class="eng-name">Market Maker</span></span><span class="eng-badge" style="background:#ef444418;color:#ef4444">MM</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Quotes</span><span class="eng-stat-v">0</span></div><div class="eng-stat"><span class="eng-stat-l">Fills</span><span class="eng-stat-v">0</span></div><div class="eng-stat"><span class="eng-stat-l">P&L</span><span class="eng-stat-v">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Spread</span><span class="eng-stat-v">--</span></div></div><div class="eng-bar"><div class="eng-bar-f" style="width:0%;background:#ef4444"></div></div><div class="eng-status">Off</div></div>\n  <!-- Hedge -->\n  <div class="eng"><div class="eng-h"><span><span class="eng-d"></span><span class="eng-name">Hedge</span></span><span class="eng-badge" style="background:#6366f118;color:#6366f1">PROTECT</span></div><div class="eng-stats"><div class="eng-stat"><span class="eng-stat-l">Active</span><span class="eng-stat-v">0</span></div><div class="eng-stat"><span class="eng-stat-l">Hedged</span><span class="eng-stat-v">0</span></div><div class="eng-stat"><span class="eng-stat-l">Saved</span><span class="eng-stat-v">$0</span></div><div class="eng-stat"><span class="eng-stat-l">Status</span><span class="eng-stat-v">Off</span></div></div><div class="eng-bar"><div class="eng-bar-f" style="width:0%;background:#6366f1"></div></div><div class="eng-status">Off</div></div>\n</div>\n\n<!-- MAIN 3-COLUMN -->\n<div class="main">\n  <!-- LEFT: Equity + Positions -->\n  <div class="col-left">\n    <div class="eq-wrap">\n      <div class="eq-title"><span>EQUITY CURVE</span><span class="eq-pnl" id="eqP" style="color:#22c55e">$0.00</span></div>\n      <canvas id="eqC"></canvas>\n    </div>\n    <div class="pos-wrap">\n      <div class="pos-h">\n        <span class="pos-title">POSITIONS</span>\n        <div style="display:flex;gap:4px">\n          <button class="tb a" id="tabO" onclick="switchTab(\'open\')">Open <span id="oC">0</span></button>\n          <button class="tb" id="tabC" onclick="switchTab(\'closed\')">Closed <span id="cC">0</span></button>\n        </div>\n      </div>\n      <div class="pos-cols"><span>TIME</span><span>DIR</span><span>SIZE / PRICE</span><span id="colL">EXP</span><span>P&L</span><span>RESULT</span></div>\n      <div class="pos-body" id="pB"><div style="padding:16px;text-align:center;color:#3f3f46;font-size:10px">Waiting for entry...</div></div>\n    </div>\n  </div>\n\n  <!-- MID: Signals + Oracle + Strategy -->\n  <div class="col-mid">\n    <div class="conf-wrap">\n      <div class="conf-num" id="cfN">0<span style="font-size:18px">%</span></div>\n      <div class="conf-dir" id="cfD" style="color:#52525b">HOLD</div>\n      <div class="conf-label" id="cfL">No trade</div>\n    </div>\n    <div class="sig-wrap">\n      <div class="sig-h"><span class="sig-title">SIGNALS</span></div>\n      <div class="sig-body" id="sigB"><div style="padding:8px;text-align:center;font-size:9px;color:#3f3f46">Waiting...</div></div>\n    </div>\n    <div class="oracle-wrap">\n      <div class="oracle-title"><span>ORACLE SOURCES</span><span id="rL" style="color:#3f3f46;font-family:\'Share Tech Mono\',monospace;font-size:9px">--</span></div>\n      <div class="oracle-row"><span><span class="oracle-dot" style="background:#22c55e"></span>Chainlink</span><span class="m" id="oCL" style="color:#d4d4d8;font-size:11px">--</span></div>\n      <div class="oracle-row"><span><span class="oracle-dot" style="background:#3b82f6"></span>Binance</span><span class="m" id="oBN" style="color:#71717a;font-size:11px">--</span></div>\n      <div class="oracle-row"><span><span class="oracle-dot" style="background:#a855f7"></span>CoinGecko</span><span class="m" style="color:#71717a;font-size:11px">--</span></div>\n    </div>\n    <div class="strat-wrap">\n      <div class="oracle-title" style="margin-bottom:4px"><span>STRATEGY</span></div>\n      <div class="strat-row"><span class="strat-l">Direction</span><span class="strat-v" id="sD" style="color:#71717a">HOLD</span></div>\n      <div class="strat-row"><span class="strat-l">Window Open</span><span class="strat-v" id="sA">--</span></div>\n      <div class="strat-row"><span class="strat-l">Drift</span><span class="strat-v" id="sAsub">--</span></div>\n      <div class="strat-row"><span class="strat-l">Detail</span><span class="strat-v" id="sDsub" style="font-size:9px;color:#52525b">--</span></div>\n      <div class="strat-row"><span class="strat-l">Risk</span><span class="strat-v" id="sR">0/20</span></div>\n      <div class="strat-row"><span class="strat-l">Risk Detail</span><span class="strat-v" id="sRsub" style="font-size:9px;color:#52525b">--</span></div>\n    </div>\n  </div>\n\n  <!-- RIGHT: Activity Feed -->\n  <div class="col-right">\n    <div class="feed-wrap">\n      <div class="feed-h"><span class="feed-title">ACTIVITY FEED</span></div>\n      <div class="feed-body" id="fdB"><div style="padding:8px;text-align:center;font-size:9px;color:#3f3f46">No activity</div></div>\n    </div>\n  </div>\n</div>\n\n<!-- Hidden elements for compatibility -->\n<span id="sB" style="display:none"></span>\n<span id="sP" style="display:none"></span>\n<span id="sPsub" style="display:none"></span>\n\n<!-- TOASTS -->\n<div class="to-wrap" id="toasts"></div>\n\n<script>\nfunction autoScale(){\n  const sw=window.innerWidth,sh=window.innerHeight;\n  const sx=sw/1920,sy=sh/1080;\n  const s=Math.min(sx,sy);\n  document.body.style.transform=\'scale(\'+s+\')\';\n  document.body.style.width=\'1920px\';\n  document.body.style.height=\'1080px\';\n}\nautoScale();\nwindow.addEventListener(\'resize\',autoScale);\nlet ws,state={},eq=[],tab=\'open\',lp=0,tc=0;\nfunction tmr15(){const n=new Date(),m=n.getMinutes(),s=n.getSeconds(),total=m*60+s,boundary=Math.ceil(total/900)*900,raw=boundary-total,t=Math.max(0,raw-60);return{text:`${Math.floor(t/60)}:${String(t%60).padStart(2,\'0\')}`,s:t,c:t<15?\'#22c55e\':t<60?\'#fab005\':\'#52525b\',active:t<=60&&t>0}}\nfunction tmrLW(){const n=new Date(),m=n.getMinutes(),s=n.getSeconds(),total=m*60+s,boundary=Math.ceil(total/900)*900,left=boundary-total;if(left<=150&&left>0){const t=left;return{text:`${Math.floor(t/60)}:${String(t%60).padStart(2,\'0\')}`,s:t,c:t<30?\'#ef4444\':\'#a855f7\',active:true}}return{text:\'--:--\',s:999,c:\'#3f3f46\',active:false}}\nfunction tmr5(){const n=new Date(),m=n.getMinutes(),s=n.getSeconds(),total=m*60+s,boundary=Math.ceil(total/300)*300,raw=boundary-total,t=Math.max(0,raw-55);return{text:`${Math.floor(t/60)}:${String(t%60).padStart(2,\'0\')}`,s:t,c:t<15?\'#a855f7\':t<55?\'#52525b\':\'#3f3f46\',active:t<=55&&t>0}}\nfunction ft(ts){if(!ts)return\'--:--\';return new Date(typeof ts===\'number\'?ts*1000:ts).toLocaleTimeString([],{hour:\'2-digit\',minute:\'2-digit\',second:\'2-digit\'})}\nfunction switchTab(t){tab=t;$(\'tabO\').className=\'tb\'+(t===\'open\'?\' a\':\'\');$(\'tabC\').className=\'tb\'+(t===\'closed\'?\' a\':\'\');$(\'colL\').textContent=t===\'closed\'?\'Result\':\'Exp\';if(state.positions)rPos(state)}\nfunction $(id){return document.getElementById(id)}\nfunction mkRow(p,cl){const up=(p.direction||\'\').toLowerCase()===\'up\';const sz=p.size_usd||0,ep=p.entry_price||0,cf=p.confidence||0;const pnl=cl?(p.pnl||0):0;const pc=pnl>=0?\'#22c55e\':\'#ef4444\';const tm=ft(p.timestamp);let last=\'\';if(cl){const w=p.outcome===\'win\'||pnl>0;last=`<span class="rp" style="background:${w?\'rgba(34,197,94,.08)\':\'rgba(239,68,68,.08)\'};color:${w?\'#22c55e\':\'#ef4444\'}">${w?\'WIN\':\'LOSS\'}</span>`}return `<div class="tr"><span style="color:#3f3f46" class="m">${tm}</span><span><span class="db" style="background:${up?\'rgba(34,197,94,.08)\':\'rgba(239,68,68,.08)\'};color:${up?\'#22c55e\':\'#ef4444\'}">${up?\'\\u25B2\':\'\\u25BC\'}</span></span><span style="color:#52525b">$${sz.toFixed(2)} <span class="m" style="color:#71717a">@${ep.toFixed(3)}</span></span><span style="color:#3f3f46;text-align:right">${(cf*100).toFixed(0)}%</span><span class="m" style="text-align:right;color:${pc};font-weight:700">${cl?(pnl>=0?\'+\':\'\')+pnl.toFixed(2):\'--\'}</span><span style="text-align:right">${last}</span></div>`}\nfunction rPos(d){const op=d.positions?.open||[],cl=d.positions?.closed||[];$(\'oC\').textContent=op.length;$(\'cC\').textContent=cl.length;const items=tab===\'open\'?op:cl;const b=$(\'pB\');if(!items.length){b.innerHTML=`<div style="padding:16px;text-align:center;color:#3f3f46;font-size:10px">${tab===\'open\'?\'Waiting for entry...\':\'No history\'}</div>`}else{b.innerHTML=items.map(p=>mkRow(p,tab===\'closed\')).join(\'\')}}\nconst SC={price_vs_open:\'#fab005\',momentum:\'#3b82f6\',rsi:\'#a855f7\',macd:\'#10b981\',ema_cross:\'#ec4899\'};const SI={price_vs_open:\'\\u25CE\',momentum:\'\\u2192\',rsi:\'\\u223F\',macd:\'\\u2261\',ema_cross:\'\\u2573\'};\nfunction rSig(d){const sigs=d.signals||{};const k=Object.keys(sigs);if(!k.length){$(\'sigB\').innerHTML=\'<div style="padding:8px;text-align:center;font-size:9px;color:#3f3f46">Waiting...</div>\';return}let h=\'\';for(const n of k){const s=sigs[n];const c=SC[n]||\'#52525b\';const dc=s.direction===\'up\'?\'#22c55e\':s.direction===\'down\'?\'#ef4444\':\'#52525b\';const w=Math.round(Math.min(1,s.strength)*100);h+=`<div class="sigr"><div class="sigi" style="background:${c}18;color:${c}">${SI[n]||\'\\u25CF\'}</div><div style="flex:1;min-width:0"><div class="sign">${n.replace(/_/g,\' \')}</div><div class="sigv" style="color:${dc}">${s.direction.toUpperCase()} (${s.raw_value})</div></div><div class="sigbw"><div class="sigbf" style="width:${w}%;background:${c}"></div></div></div>`}$(\'sigB\').innerHTML=h}\nfunction drawEq(){const c=$(\'eqC\');if(!c)return;const x=c.getContext(\'2d\');c.width=c.offsetWidth*2;c.height=440;x.scale(2,2);const W=c.offsetWidth,H=220;x.clearRect(0,0,W,H);if(eq.length<2)return;const mn=Math.min(...eq),mx=Math.max(...eq),rng=mx-mn||1;const pts=eq.map((v,i)=>({x:(i/(eq.length-1))*W,y:H-6-((v-mn)/rng)*(H-12)}));const last=eq[eq.length-1];const pos=last>=0;const gd=x.createLinearGradient(0,0,0,H);gd.addColorStop(0,pos?\'rgba(34,197,94,.12)\':\'rgba(239,68,68,.12)\');gd.addColorStop(1,\'rgba(0,0,0,0)\');x.beginPath();x.moveTo(pts[0].x,H);pts.forEach(p=>x.lineTo(p.x,p.y));x.lineTo(pts[pts.length-1].x,H);x.closePath();x.fillStyle=gd;x.fill();x.beginPath();pts.forEach((p,i)=>i===0?x.moveTo(p.x,p.y):x.lineTo(p.x,p.y));x.strokeStyle=pos?\'#22c55e\':\'#ef4444\';x.lineWidth=1.5;x.stroke();const lpt=pts[pts.length-1];x.beginPath();x.arc(lpt.x,lpt.y,3,0,Math.PI*2);x.fillStyle=pos?\'#22c55e\':\'#ef4444\';x.fill()}\nlet feed=[];function addF(ic,txt,col){feed.unshift({ic,txt,col,ts:Date.now()/1000});if(feed.length>30)feed.pop();rFeed()}\nfunction rFeed(){const el=$(\'fdB\');if(!feed.length){el.innerHTML=\'<div style="padding:8px;text-align:center;font-size:9px;color:#3f3f46">No activity</div>\';return}el.innerHTML=feed.map(f=>`<div class="fi"><span class="fic">${f.ic}</span><div><div class="ft" style="color:${f.col}">${f.txt}</div><div class="fts m">${ft(f.ts)}</div></div></div>`).join(\'\')}\nfunction render(d){state=d;const pnl=d.risk?.total_pnl||d.stats?.total_pnl||0;const pp=pnl>=0;$(\'tP\').textContent=(pp?\'+\':\'\')+`$${pnl.toFixed(2)}`;$(\'tP\').style.color=pp?\'#22c55e\':\'#ef4444\';$(\'tW\').textContent=`${(d.stats?.win_rate||0).toFixed(0)}%`;$(\'tT\').textContent=d.stats?.total_trades||0;$(\'tB\').textContent=`$${(d.risk?.capital||0).toFixed(0)}`;$(\'sB\').textContent=`$${(d.risk?.capital||0).toFixed(0)}`;$(\'sP\').textContent=(pp?\'+\':\'\')+`$${pnl.toFixed(2)}`;$(\'sP\').style.color=pp?\'#22c55e\':\'#ef4444\';$(\'sPsub\').textContent=`${d.stats?.completed||0} completed`;const ap=d.anchor?.open_price;$(\'sA\').textContent=ap?`$${ap.toLocaleString()}`:\'--\';const dr=d.anchor?.drift_pct;$(\'sAsub\').textContent=dr!=null?`Drift: ${dr>0?\'+\':\'\'}${dr.toFixed(4)}%`:\'--\';const dir=(d.strategy?.direction||\'hold\').toUpperCase();$(\'sD\').textContent=dir;$(\'sD\').style.color=dir===\'UP\'?\'#22c55e\':dir===\'DOWN\'?\'#ef4444\':\'#71717a\';$(\'sDsub\').textContent=`conf=${(d.strategy?.confidence||0).toFixed(2)} | vol=${(d.strategy?.volatility_pct||0).toFixed(3)}%`;$(\'sR\').textContent=`${d.risk?.daily_trades||0}/${d.risk?.max_daily_trades||20}`;$(\'sR\').style.color=d.risk?.cooldown_active?\'#ef4444\':\'#d4d4d8\';$(\'sRsub\').textContent=`Loss: ${(d.risk?.daily_loss_pct||0).toFixed(1)}% | Streak: ${d.risk?.consecutive_losses||0}`;const cf=d.strategy?.confidence||0;$(\'cfN\').innerHTML=`${(cf*100).toFixed(0)}<span style="font-size:18px">%</span>`;$(\'cfN\').style.color=cf>=.7?\'#22c55e\':cf>=.5?\'#fab005\':\'#52525b\';$(\'cfD\').textContent=dir;$(\'cfD\').style.color=dir===\'UP\'?\'#22c55e\':dir===\'DOWN\'?\'#ef4444\':\'#52525b\';$(\'cfL\').textContent=d.strategy?.should_trade?\'TRADE SIGNAL\':\'No trade\';if(d.oracle){const hasCL=d.oracle.sources?.includes(\'chainlink\');$(\'rSt\').textContent=hasCL?\'Streaming\':\'Buffered\';$(\'rSt\').style.color=hasCL?\'#22c55e\':\'#fab005\';$(\'rD\').style.background=hasCL?\'#22c55e\':\'#fab005\';$(\'rL\').style.color=hasCL?\'#22c55e\':\'#fab005\';if(d.oracle.chainlink)$(\'oCL\').textContent=\'$\'+d.oracle.chainlink.toLocaleString(undefined,{maximumFractionDigits:2});$(\'rDt\').textContent=hasCL?`CL $${(d.oracle.chainlink||0).toLocaleString()}`:\'REST fallback\'}const bp=d.oracle?.price||0;if(bp>0){$(\'bP\').textContent=\'$\'+bp.toLocaleString(undefined,{minimumFractionDigits:2,maximumFractionDigits:2})}rSig(d);rPos(d);eq.push(pnl);if(eq.length>120)eq.shift();const ep=$(\'eqP\');ep.textContent=(pp?\'+\':\'\')+`$${pnl.toFixed(2)}`;ep.style.color=pp?\'#22c55e\':\'#ef4444\';drawEq();const es=d.engine_stats||{};const e15=es.dir_15m||{};const e15w=e15.wins||0,e15l=e15.losses||0,e15pnl=e15.pnl||0,e15pp=e15pnl>=0;$(\'e15t\').textContent=e15.trades||0;$(\'e15wl\').textContent=`${e15w}/${e15l}`;$(\'e15p\').textContent=(e15pp?\'+\':\'\')+`$${e15pnl.toFixed(2)}`;$(\'e15p\').style.color=e15pp?\'#22c55e\':\'#ef4444\';$(\'e15wr\').textContent=`${(e15.win_rate||0).toFixed(0)}%`;$(\'e15b\').style.width=`${e15.win_rate||0}%`;$(\'e15l\').textContent=`Cycle #${d.cycle||0}`;const e5s=es.dir_5m||{};const e5w=e5s.wins||0,e5l2=e5s.losses||0,e5pnl=e5s.pnl||0,e5pp=e5pnl>=0;$(\'e5t\').textContent=(e5w+e5l2)||0;$(\'e5wl\').textContent=`${e5w}/${e5l2}`;$(\'e5p\').textContent=(e5pp?\'+\':\'\')+`$${e5pnl.toFixed(2)}`;$(\'e5p\').style.color=e5pp?\'#22c55e\':\'#ef4444\';$(\'e5wr\').textContent=`${(e5s.win_rate||0).toFixed(0)}%`;$(\'e5b\').style.width=`${e5s.win_rate||0}%`;$(\'e5l\').textContent=(e5s.trades||0)>0?`${e5w+e5l2} resolved / ${e5s.trades} placed`:\'Waiting...\';$(\'e5d\').className=\'eng-d on\';const eLWs=es.late_window||{};const eLWw=eLWs.wins||0,eLWl2=eLWs.losses||0,eLWpnl=eLWs.pnl||0,eLWpp=eLWpnl>=0;$(\'eLWt\').textContent=(eLWw+eLWl2)||0;$(\'eLWwl\').textContent=`${eLWw}/${eLWl2}`;$(\'eLWp\').textContent=(eLWpp?\'+\':\'\')+`$${eLWpnl.toFixed(2)}`;$(\'eLWp\').style.color=eLWpp?\'#22c55e\':\'#ef4444\';$(\'eLWwr\').textContent=`${(eLWs.win_rate||0).toFixed(0)}%`;$(\'eLWb\').style.width=`${eLWs.win_rate||0}%`;$(\'eLWl\').textContent=(eLWs.trades||0)>0?`${eLWw+eLWl2} resolved / ${eLWs.trades} placed`:\'Scanning...\';$(\'eLWd\').className=\'eng-d on\';const a=d.arb_scanner;if(a){$(\'eAd\').className=\'eng-d on\';$(\'eAs\').textContent=a.scan_count||0;$(\'eAt\').textContent=a.arb_trades||0;$(\'eAp\').textContent=\'$\'+(a.arb_profit||0).toFixed(2);$(\'eAp\').style.color=(a.arb_profit||0)>=0?\'#22c55e\':\'#ef4444\';$(\'eAm\').textContent=a.markets_live||0;$(\'eAl\').textContent=a.running?\'Scanning...\':\'Stopped\';$(\'eAb\').style.width=`${Math.min(100,(a.scan_count||0)/10*100)}%`}addF(\'\\u26A1\',`[15m] Cycle #${d.cycle||0}: ${dir} conf=${(cf*100).toFixed(0)}%`,dir===\'UP\'?\'#22c55e\':dir===\'DOWN\'?\'#ef4444\':\'#52525b\');if(a&&(a.scan_count||0)>0&&(d.cycle||0)%5===0)addF(\'\\uD83D\\uDD04\',`[ARB] ${a.scan_count} scans, ${a.markets_live||0} mkts`,\'#10b981\')}\nfunction hPT(msg){const p=msg.price||msg.chainlink||msg.binance||0;if(p<=0)return;const el=$(\'bP\');const prev=lp||0;el.textContent=\'$\'+p.toLocaleString(undefined,{minimumFractionDigits:2,maximumFractionDigits:2});if(prev>0&&p!==prev){el.style.animation=p>prev?\'prUp .7s ease\':\'prDn .7s ease\';setTimeout(()=>{el.style.animation=\'\'},700);$(\'bA\').textContent=p>prev?\'\\u25B2\':\'\\u25BC\';$(\'bA\').style.color=p>prev?\'#22c55e\':\'#ef4444\'}lp=p;if(msg.chainlink)$(\'oCL\').textContent=\'$\'+msg.chainlink.toLocaleString(undefined,{maximumFractionDigits:2});if(msg.binance)$(\'oBN\').textContent=\'$\'+msg.binance.toLocaleString(undefined,{maximumFractionDigits:2});tc++;pHB()}\nconst EL={directional:\'15m\',directional_5m:\'5m\',late_window:\'LW\',arb:\'ARB\',mm:\'MM\'};function showToast(msg){const c=$(\'toasts\');if(!c)return;const t=document.createElement(\'div\');const res=msg.action===\'resolved\';const win=msg.outcome===\'win\';const up=(msg.direction||\'\').toLowerCase()===\'up\';const dir=up?\'UP\':\'DOWN\';const eng=EL[msg.engine]||msg.engine||\'\';let cls=\'to op\',ic=\'\\uD83D\\uDCC8\',ti=\'\',dt=\'\',ph=\'\';if(res){cls=\'to \'+(win?\'w\':\'l\');ic=win?\'\\u2705\':\'\\u274C\';ti=(win?\'WIN\':\'LOSS\')+\' \\u2014 \'+dir+\' [\'+eng+\']\';dt=\'$\'+(msg.size_usd||0).toFixed(2);const pnl=msg.pnl||0;ph=`<div class="to-p" style="color:${pnl>=0?\'#22c55e\':\'#ef4444\'}">${pnl>=0?\'+\':\'\'}$${Math.abs(pnl).toFixed(2)}</div>`}else{ti=\'OPENED \\u2014 \'+dir+\' [\'+eng+\']\';dt=\'$\'+(msg.size_usd||0).toFixed(2)+\' @ \'+(msg.entry_price||0).toFixed(3)}t.className=cls;t.innerHTML=`<span class="to-i">${ic}</span><div style="flex:1"><div class="to-t">${ti}</div><div class="to-d m">${dt}</div></div>${ph}`;c.appendChild(t);const em={directional:\'e15\',directional_5m:\'e5\',late_window:\'eLW\',arb:\'eA\',mm:\'eMM\'};const cid=em[msg.engine];if(cid){const cd=document.getElementById(cid);if(cd){cd.classList.remove(\'fl\');void cd.offsetWidth;cd.classList.add(\'fl\')}}if(res){addF(win?\'\\u2705\':\'\\u274C\',`${win?\'WIN\':\'LOSS\'} ${dir} [${eng}] $${(msg.pnl||0).toFixed(2)}`,win?\'#22c55e\':\'#ef4444\')}else{addF(\'\\uD83D\\uDCC8\',`OPENED ${dir} [${eng}] $${(msg.size_usd||0).toFixed(2)}`,up?\'#22c55e\':\'#ef4444\')}setTimeout(()=>{t.classList.add(\'to-x\');setTimeout(()=>t.remove(),250)},6000)}\nlet hbT;function pHB(){const d=$(\'hbD\');if(d){d.style.background=\'#22c55e\';d.style.boxShadow=\'0 0 6px rgba(34,197,94,.4)\'}clearTimeout(hbT);hbT=setTimeout(()=>{if(d){d.style.background=\'#fab005\';d.style.boxShadow=\'none\'}},5000)}\nsetInterval(()=>{$(\'clk\').textContent=new Date().toLocaleTimeString([],{hour:\'2-digit\',minute:\'2-digit\',second:\'2-digit\'});const a=tmr15();$(\'t15\').textContent=a.text;$(\'t15\').style.color=a.c;if(a.active)$(\'t15\').style.textShadow=\'0 0 8px \'+a.c;else $(\'t15\').style.textShadow=\'none\';const a5=tmr5();$(\'t5\').textContent=a5.text;$(\'t5\').style.color=a5.c;if(a5.active)$(\'t5\').style.textShadow=\'0 0 8px \'+a5.c;else $(\'t5\').style.textShadow=\'none\';const b=tmrLW();$(\'tLW\').textContent=b.text;$(\'tLW\').style.color=b.c;if(b.active)$(\'tLW\').style.textShadow=\'0 0 8px \'+b.c;else $(\'tLW\').style.textShadow=\'none\'},1000);\nconst EI={\'15m\':\'\\u26A1\',\'5m\':\'\\u23F1\',\'lw\':\'\\uD83D\\uDD2E\',\'arb\':\'\\uD83D\\uDD04\',\'mm\':\'\\uD83C\\uDFE6\',\'hedge\':\'\\uD83D\\uDEE1\'};const EC={\'15m\':\'#3b82f6\',\'5m\':\'#a855f7\',\'lw\':\'#fab005\',\'arb\':\'#10b981\',\'mm\':\'#ef4444\',\'hedge\':\'#6366f1\'};const EA={\'hold\':\'\\u23F8\',\'blocked\':\'\\u26D4\',\'entry\':\'\\u25B6\',\'skip\':\'\\u23ED\',\'no_markets\':\'\\u2205\',\'scan\':\'\\uD83D\\uDD0D\',\'trade\':\'\\uD83D\\uDCC8\'};function hEE(msg){const eng=msg.engine||\'?\';const ic=EI[eng]||\'\\u2699\';const col=EC[eng]||\'#52525b\';const act=msg.action||\'\';const actIc=EA[act]||\'\';const detail=msg.detail||act;addF(ic,`[${eng.toUpperCase()}] ${actIc} ${detail}`,col);pHB()}\nfunction conn(){const p=location.protocol===\'https:\'?\'wss\':\'ws\';ws=new WebSocket(`${p}://${location.host}/ws`);ws.onopen=()=>{$(\'lB\').textContent=\'LIVE\';$(\'lB\').style.color=\'#22c55e\';pHB()};ws.onmessage=e=>{try{const data=JSON.parse(e.data);for(const msg of(Array.isArray(data)?data:[data])){if(msg.type===\'price_tick\')hPT(msg);else if(msg.type===\'trade_notification\')showToast(msg);else if(msg.type===\'engine_event\')hEE(msg);else{render(msg);pHB()}}}catch(err){console.error(err)}};ws.onclose=()=>{$(\'lB\').textContent=\'RECONNECTING\';$(\'lB\').style.color=\'#fab005\';setTimeout(conn,3000)};ws.onerror=()=>ws.close()}\nconn();drawEq();\n</script></body></html>\n'
+
+
+_HTML_BYTES = _build_html().encode("utf-8")
+_HTML_ETAG = '"' + hashlib.sha1(_HTML_BYTES).hexdigest()[:16] + '"'
+# Compressed once here so page loads cost no zlib time (mtime=0 keeps it reproducible)
+_HTML_GZ = gzip.compress(_HTML_BYTES, compresslevel=9, mtime=0)
+_HTML_ETAG_GZ = _HTML_ETAG[:-1] + '-gz"'
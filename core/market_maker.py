@@ -21,9 +21,12 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from config.settings import MarketMakerConfig
+from core.polymarket_client import iso_to_ts
 
 logger = logging.getLogger("market_maker")
 
+SLUG_TIMEFRAME_RE = re.compile(r"btc-updown-(\d+)(m|h)-")
+
 
 # ── Types ────────────────────────────────────────────────────────
 
@@ -193,7 +196,7 @@ class MarketMaker:
     def _parse_timeframe(slug: str) -> Optional[str]:
         if not slug:
             return None
-        m = re.search(r"btc-updown-(\d+)(m|h)-", slug.lower())
+        m = SLUG_TIMEFRAME_RE.search(slug.lower())
         if m:
             qty = int(m.group(1))
             unit = m.group(2)
@@ -202,14 +205,7 @@ class MarketMaker:
 
     @staticmethod
     def _parse_end_time(end_date: str) -> Optional[float]:
-        if not end_date:
-            return None
-        try:
-            import datetime
-            dt = datetime.datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            return dt.timestamp()
-        except:
-            return None
+        return iso_to_ts(end_date) or None
 
     # ── Pricing ──────────────────────────────────────────────────
 
@@ -219,8 +215,8 @@ class MarketMaker:
         Only returns quotes with prices in the safe 0.10-0.90 range.
         """
         quotes = []
-        half_spread = self.config.spread_bps / 10000.0
-        level_step = self.config.level_spacing_bps / 10000.0
+        half_spread = self.config.spread_frac
+        level_step = self.config.level_spacing_frac
 
         for level in range(self.config.num_levels):
             offset = half_spread + (level * level_step)
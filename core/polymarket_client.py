@@ -16,8 +16,11 @@ import logging
 import json
 import os
 import re
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterator, Optional, Any
 from enum import Enum
 
 import aiohttp
@@ -37,6 +40,8 @@ except ImportError:
     logger.warning("py-clob-client not installed. Run: pip install py-clob-client")
 
 TIMEFRAME_SECONDS = {"5m": 300, "15m": 900, "30m": 1800, "1h": 3600}
+SLUG_INTERVAL_RE = re.compile(r"btc-updown-(\d+[mh])-")
+SLUG_WINDOW_TS_RE = re.compile(r"btc-updown-\d+[mh]-(\d+)")
 
 
 class MarketStatus(Enum):
@@ -63,6 +68,7 @@ class BinaryMarket:
     tick_size: str = "0.01"
     resolved: bool = False
     resolution: Optional[str] = None
+    end_ts: float = 0.0  # end_date parsed once at discovery (0.0 = unknown)
 
     @property
     def is_tradeable(self) -> bool:
@@ -89,6 +95,39 @@ class TradeRecord:
     tx_hashes: list = field(default_factory=list)
 
 
+@lru_cache(maxsize=1024)
+def iso_to_ts(value: str) -> float:
+    """Parse a Gamma ISO-8601 timestamp ("...Z") to unix seconds; 0.0 if missing/invalid.
+
+    Memoized: end dates repeat across every discovery pass for a market.
+    """
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError):
+        return 0.0
+
+
+async def gather_pooled(coros, limit: int = 8) -> list:
+    """
+    Await coroutines with at most `limit` in flight; results in input order.
+
+    Unlike fixed-size chunks, a slow call only holds its own slot — the
+    next coroutine starts as soon as any running one finishes.
+    """
+    coros = list(coros)
+    results: list = [None] * len(coros)
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(i, coro):
+        async with sem:
+            results[i] = await coro
+
+    await asyncio.gather(*(_run(i, c) for i, c in enumerate(coros)))
+    return results
+
+
 def _safe_json(val):
     """Parse a value that might be a JSON string, list, or None."""
     if val is None:
@@ -148,6 +187,7 @@ def _parse_market_from_event(event: dict, slug: str) -> Optional[BinaryMarket]:
         else:
             price_up, price_down = 0.5, 0.5
 
+    end_date = m.get("endDate", event.get("endDate", ""))
     return BinaryMarket(
         condition_id=cid,
         question=m.get("question", event.get("title", "")),
@@ -159,24 +199,40 @@ def _parse_market_from_event(event: dict, slug: str) -> Optional[BinaryMarket]:
         volume=float(m.get("volumeNum", m.get("volume", 0))),
         liquidity=float(m.get("liquidityClob", m.get("liquidityNum", 0))),
         created_at=m.get("createdAt", ""),
-        end_date=m.get("endDate", event.get("endDate", "")),
+        end_date=end_date,
         status=MarketStatus.ACTIVE,
+        end_ts=iso_to_ts(end_date),
     )
 
 
 class PolymarketClient:
-    def __init__(self, config):
+    def __init__(self, config, connector: Optional[aiohttp.BaseConnector] = None):
         self.config = config.polymarket
         self._session: Optional[aiohttp.ClientSession] = None
+        self._connector = connector  # Shared keep-alive pool (owned by the bot) or None
         self._clob: Optional[object] = None
         self._clob_initialized = False
         self._active_markets: dict[str, BinaryMarket] = {}
         self._trade_records: list[TradeRecord] = []
         self._archived_trades: list[TradeRecord] = []  # Resolved trades pruned from active list
+        self._recent_closed: deque[TradeRecord] = deque(maxlen=50)  # Last resolved trades, in resolution order
         # ── Fee cache (Phase 1) ──
-        self._fee_cache: dict[str, tuple[float, float]] = {}  # token_id → (fee_rate_bps, cached_at)
+        self._fee_cache: dict[str, tuple[Optional[float], float]] = {}  # token_id → (fee_rate_bps or None on miss, cached_at monotonic)
         self._fee_cache_ttl: int = getattr(config.polymarket, "fee_cache_ttl_secs", 60)
         self._fee_fallback_pct: float = getattr(config.polymarket, "fee_fallback_pct", 1.56)
+        # ── Streamed CLOB quotes (market websocket) ──
+        self._price_cache: dict[str, tuple[float, float, float]] = {}  # token_id → (best_bid, best_ask, received_at monotonic)
+        self._stream_assets: set[str] = set()  # token IDs subscribed (or queued) on the market stream
+        self._stream_ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._stream_sub_tasks: set[asyncio.Task] = set()  # in-flight incremental (un)subscribes
+        self._stream_has_assets = asyncio.Event()  # set while _stream_assets is non-empty
+        self._stream_running = False
+        self._stream_reconnect_backoff = 2.0
+        # ── Discovery cache (shared by the 15m / 5m / late-window / MM paths) ──
+        self._discover_cache: tuple[float, list[BinaryMarket]] = (float("-inf"), [])  # (fetched_at monotonic, markets)
+        self._discover_lock = asyncio.Lock()
+        self._discover_refresh: Optional[asyncio.Task] = None
+        self._liquid_cache: tuple[tuple[float, float], list[BinaryMarket]] = ((float("-inf"), 0.0), [])
 
     # ── CLOB Init ───────────────────────────────────────────────
 
@@ -214,10 +270,19 @@ class PolymarketClient:
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15), headers={"Content-Type": "application/json"})
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15),
+                headers={"Content-Type": "application/json"},
+                connector=self._connector,
+                connector_owner=self._connector is None,
+            )
         return self._session
 
     async def close(self):
+        self._stream_running = False
+        self._stream_has_assets.set()  # wake a stream loop idling with nothing to watch
+        if self._stream_ws and not self._stream_ws.closed:
+            await self._stream_ws.close()
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -226,12 +291,16 @@ class PolymarketClient:
     async def get_fee_rate_bps(self, token_id: str) -> Optional[int]:
         """
         Query Polymarket CLOB for the fee rate (in basis points) for a token.
-        Returns cached value if fresh enough. Returns None on failure.
+        Returns cached value if fresh enough. Returns None on failure; failed
+        lookups are cached briefly, so callers fall back without re-requesting.
         """
-        now = time.time()
+        now = time.monotonic()
         cached = self._fee_cache.get(token_id)
-        if cached and (now - cached[1]) < self._fee_cache_ttl:
-            return int(cached[0])
+        if cached:
+            # Misses expire quickly so a transient API error doesn't pin fee=0 for a full TTL
+            ttl = self._fee_cache_ttl if cached[0] is not None else min(self._fee_cache_ttl, 10)
+            if (now - cached[1]) < ttl:
+                return int(cached[0]) if cached[0] is not None else None
 
         try:
             session = await self._get_session()
@@ -239,11 +308,13 @@ class PolymarketClient:
             async with session.get(url) as resp:
                 if resp.status != 200:
                     logger.debug(f"Fee lookup failed ({resp.status}) for {token_id[:20]}...")
+                    self._fee_cache[token_id] = (None, now)
                     return None
                 data = await resp.json()
 
             raw = data.get("fee_rate_bps", data.get("feeRateBps"))
             if raw is None:
+                self._fee_cache[token_id] = (None, now)
                 return None
 
             bps = int(raw)
@@ -252,6 +323,7 @@ class PolymarketClient:
 
         except Exception as e:
             logger.debug(f"Fee rate lookup error: {e}")
+            self._fee_cache[token_id] = (None, now)
             return None
 
     async def get_fee_pct_for_price(self, token_id: str, price: float) -> float:
@@ -368,13 +440,33 @@ class PolymarketClient:
     async def _fetch_event_by_slug(self, slug: str) -> Optional[dict]:
         try:
             session = await self._get_session()
-            url = f"{self.config.gamma_api_url}/events/slug/{slug}"
+            url = f"{self.config.gamma_events_url}/slug/{slug}"
             async with session.get(url) as resp:
                 if resp.status != 200: return None
                 return await resp.json()
         except Exception:
             return None
 
+    async def _enrich_all(self, markets: list[BinaryMarket]) -> list[BinaryMarket]:
+        """CLOB-enrich markets concurrently (worker threads, bounded) and register them."""
+        if not markets:
+            return []
+        try:
+            # Initialise the SDK client once up front so worker threads don't race to do it
+            await asyncio.to_thread(self._ensure_clob)
+        except Exception:
+            pass  # _enrich_with_clob logs the failure per market
+        enriched = await gather_pooled(
+            (asyncio.to_thread(self._enrich_with_clob, m) for m in markets), limit=8,
+        )
+        for market in enriched:
+            self._remember_active_market(market)
+        return enriched
+
+    def _remember_active_market(self, market: BinaryMarket):
+        self._active_markets[market.condition_id] = market
+        self._watch_tokens(market.token_id_up, market.token_id_down)
+
     async def _discover_by_slug(self) -> list[BinaryMarket]:
         """PRIMARY: Gamma event slug → CLOB enrichment."""
         slugs = self._generate_slugs()
@@ -389,12 +481,10 @@ class PolymarketClient:
                 continue
             market = _parse_market_from_event(result, slug_key)
             if market and market.condition_id not in seen:
-                # Enrich with real token IDs from CLOB
-                market = await asyncio.to_thread(self._enrich_with_clob, market)
                 found.append(market)
                 seen.add(market.condition_id)
-                self._active_markets[market.condition_id] = market
-        return found
+        # Enrich with real token IDs from CLOB
+        return await self._enrich_all(found)
 
     async def _discover_by_pagination(self) -> list[BinaryMarket]:
         """FALLBACK: paginate /events."""
@@ -405,10 +495,11 @@ class PolymarketClient:
             offset = 0
             for _ in range(6):
                 params = {"active": "true", "closed": "false", "limit": 100, "offset": offset, "order": "id", "ascending": "false"}
-                async with session.get(f"{self.config.gamma_api_url}/events", params=params) as resp:
+                async with session.get(self.config.gamma_events_url, params=params) as resp:
                     if resp.status != 200: break
                     data = await resp.json()
                 if not data: break
+                page = []
                 for ev in data:
                     slug = ev.get("slug", "")
                     combined = f"{ev.get('title', '')} {slug}".lower()
@@ -417,10 +508,9 @@ class PolymarketClient:
                     if not (is_btc and is_updown): continue
                     market = _parse_market_from_event(ev, slug)
                     if market and market.condition_id not in seen:
-                        market = await asyncio.to_thread(self._enrich_with_clob, market)
-                        found.append(market)
+                        page.append(market)
                         seen.add(market.condition_id)
-                        self._active_markets[market.condition_id] = market
+                found.extend(await self._enrich_all(page))
                 if len(data) < 100: break
                 offset += 100
             return found
@@ -429,11 +519,64 @@ class PolymarketClient:
             return []
 
     async def discover_markets(self) -> list[BinaryMarket]:
+        """
+        Cached market discovery with stale-while-revalidate.
+
+        Fresh for market_cache_ttl_secs; for market_cache_swr_secs after that
+        the stale list is returned while one background refresh runs. Past
+        that (or with nothing cached) callers wait on the refresh, and
+        concurrent callers share a single fetch. Prices are overlaid from
+        the market stream on every call.
+        """
+        fetched_at, markets = self._discover_cache
+        age = time.monotonic() - fetched_at
+        if markets and age < self.config.market_cache_ttl_secs:
+            return self.apply_stream_prices(markets)
+        if markets and age < self.config.market_cache_ttl_secs + self.config.market_cache_swr_secs:
+            if self._discover_refresh is None or self._discover_refresh.done():
+                self._discover_refresh = asyncio.create_task(self._refresh_discovery())
+            return self.apply_stream_prices(markets)
+        return self.apply_stream_prices(await self._refresh_discovery())
+
+    def first_active_market(self) -> Optional[BinaryMarket]:
+        """The earliest-discovered market still held, in its latest refreshed form."""
+        return next(iter(self._active_markets.values()), None)
+
+    def cached_markets(self) -> tuple[BinaryMarket, ...]:
+        """The current discovery snapshot as-is (no refresh, no filtering)."""
+        return tuple(self._discover_cache[1])
+
+    def iter_tradeable(self, min_liquidity: float) -> Iterator[BinaryMarket]:
+        """
+        Tradeable markets from the current discovery snapshot with enough liquidity.
+
+        Liquidity is fixed per Gamma snapshot, so that cut is made once per
+        refresh; is_tradeable is re-checked on every call because resolutions
+        flip it in place.
+        """
+        fetched_at, markets = self._discover_cache
+        key = (fetched_at, min_liquidity)
+        if self._liquid_cache[0] != key:
+            self._liquid_cache = (key, [m for m in markets if m.liquidity >= min_liquidity])
+        return (m for m in self._liquid_cache[1] if m.is_tradeable)
+
+    async def _refresh_discovery(self) -> list[BinaryMarket]:
+        seen_fetch = self._discover_cache[0]
+        async with self._discover_lock:
+            fetched_at, markets = self._discover_cache
+            if fetched_at != seen_fetch and markets:
+                return markets  # Another caller refreshed while we waited on the lock
+            markets = await self._discover_uncached()
+            self._discover_cache = (time.monotonic(), markets)
+            self._prune_stream_tokens()
+            return markets
+
+    async def _discover_uncached(self) -> list[BinaryMarket]:
         markets = await self._discover_by_slug()
         if markets:
             interval_counts: dict[str, int] = {}
             for m in markets:
-                match = re.search(r"btc-updown-(\d+[mh])-", m.slug)
+                match = SLUG_INTERVAL_RE.search(m.slug)
                 if match:
                     interval_counts[match.group(1)] = interval_counts.get(match.group(1), 0) + 1
             logger.info(f"Found {len(markets)} BTC directional markets (slug-direct): {interval_counts}")
@@ -443,7 +586,7 @@ class PolymarketClient:
         markets = await self._discover_by_pagination()
         interval_counts: dict[str, int] = {}
         for m in markets:
-            match = re.search(r"btc-updown-(\d+[mh])-", m.slug)
+            match = SLUG_INTERVAL_RE.search(m.slug)
             if match:
                 interval_counts[match.group(1)] = interval_counts.get(match.group(1), 0) + 1
         logger.info(f"Found {len(markets)} BTC directional markets: {interval_counts}")
@@ -453,7 +596,7 @@ class PolymarketClient:
     def get_market_window_ts(market) -> Optional[int]:
         """Extract the window start timestamp from a market slug like btc-updown-15m-1771591500."""
         slug = getattr(market, "slug", "") or ""
-        m = re.search(r"btc-updown-\d+[mh]-(\d+)", slug)
+        m = SLUG_WINDOW_TS_RE.search(slug)
         return int(m.group(1)) if m else None
 
     @staticmethod
@@ -512,9 +655,166 @@ class PolymarketClient:
         logger.warning("Window filter: no match, returning all")
         return markets
 
+    # ── CLOB Market Stream ──────────────────────────────────────
+
+    def _watch_tokens(self, *token_ids: str):
+        """Add token IDs to the market stream; subscribes immediately if connected."""
+        new = [t for t in token_ids if len(t) > 2 and t not in self._stream_assets]  # skip Gamma placeholders ("0"/"1")
+        if not new:
+            return
+        self._stream_assets.update(new)
+        self._stream_has_assets.set()
+        self._send_stream_op(new, "subscribe")
+
+    def _prune_stream_tokens(self):
+        """Drop expired markets' tokens from the stream and the quote cache; unsubscribes if connected."""
+        now = time.time()
+        live = {
+            t for m in self._active_markets.values() if not m.end_ts or m.end_ts > now
+            for t in (m.token_id_up, m.token_id_down) if len(t) > 2
+        }
+        expired = self._stream_assets - live
+        if not expired:
+            return
+        self._stream_assets -= expired
+        for token_id in expired:
+            self._price_cache.pop(token_id, None)
+        if not self._stream_assets:
+            self._stream_has_assets.clear()
+        self._send_stream_op(list(expired), "unsubscribe")
+        logger.debug("📡 CLOB stream pruned %d expired tokens (%d live)", len(expired), len(self._stream_assets))
+
+    def _send_stream_op(self, token_ids: list[str], operation: str):
+        ws = self._stream_ws
+        if ws is not None and not ws.closed:
+            task = asyncio.create_task(ws.send_json({"assets_ids": token_ids, "operation": operation}))
+            self._stream_sub_tasks.add(task)
+            task.add_done_callback(self._on_subscribe_done)
+
+    def _on_subscribe_done(self, task: asyncio.Task):
+        self._stream_sub_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # _stream_assets already reflects the change, so the next reconnect applies it
+            logger.warning(f"📡 CLOB stream (un)subscribe failed: {task.exception()}")
+
+    def _store_quote(self, token_id: str, bid, ask, now: float):
+        try:
+            bid_f = float(bid) if bid not in (None, "") else 0.0
+            ask_f = float(ask) if ask not in (None, "") else 0.0
+        except (TypeError, ValueError):
+            return
+        if bid_f > 0 or ask_f > 0:
+            self._price_cache[token_id] = (bid_f, ask_f, now)
+
+    def _handle_stream_event(self, event: dict, now: float):
+        etype = event.get("event_type")
+        if etype == "book":
+            bids = event.get("bids") or []
+            asks = event.get("asks") or []
+            best_bid = max((float(b["price"]) for b in bids), default=None)
+            best_ask = min((float(a["price"]) for a in asks), default=None)
+            self._store_quote(event.get("asset_id", ""), best_bid, best_ask, now)
+        elif etype == "price_change":
+            for change in event.get("price_changes") or []:
+                self._store_quote(change.get("asset_id", ""), change.get("best_bid"), change.get("best_ask"), now)
+        elif etype == "best_bid_ask":
+            self._store_quote(event.get("asset_id", ""), event.get("best_bid"), event.get("best_ask"), now)
+
+    async def start_market_stream(self):
+        """
+        Persistent websocket to the CLOB market channel. Streams best bid/ask
+        for every discovered token into _price_cache so get_clob_price(),
+        get_midpoint() and apply_stream_prices() skip the HTTP round trip.
+        Reconnects with exponential backoff (2s → 60s).
+
+        Launch as: asyncio.create_task(polymarket.start_market_stream())
+        """
+        self._stream_running = True
+        logger.info("📡 CLOB market stream starting...")
+
+        while self._stream_running:
+            try:
+                # Only re-subscribe to markets that haven't expired yet, and don't
+                # open a socket at all until discovery has found something to watch
+                self._prune_stream_tokens()
+                if not self._stream_assets:
+                    await self._stream_has_assets.wait()
+                    continue
+
+                session = await self._get_session()
+                self._stream_ws = await session.ws_connect(
+                    self.config.clob_ws_url, timeout=10, heartbeat=10,
+                )
+                await self._stream_ws.send_json({"assets_ids": list(self._stream_assets), "type": "market"})
+                self._stream_reconnect_backoff = 2.0
+                logger.info(f"📡 CLOB market stream connected — {len(self._stream_assets)} tokens")
+
+                async for msg in self._stream_ws:
+                    if not self._stream_running:
+                        break
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        try:
+                            data = json.loads(msg.data)
+                        except json.JSONDecodeError:
+                            continue  # "PONG" and other non-JSON frames
+                        now = time.monotonic()
+                        for event in (data if isinstance(data, list) else [data]):
+                            if isinstance(event, dict):
+                                self._handle_stream_event(event, now)
+                    elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSE):
+                        break
+
+                logger.warning("📡 CLOB market stream disconnected — will reconnect")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"📡 CLOB market stream error: {type(e).__name__}: {e}")
+            finally:
+                # Every exit path closes this socket before the next connect
+                ws, self._stream_ws = self._stream_ws, None
+                if ws is not None and not ws.closed:
+                    await ws.close()
+
+            if not self._stream_running:
+                break
+            await asyncio.sleep(self._stream_reconnect_backoff)
+            self._stream_reconnect_backoff = min(self._stream_reconnect_backoff * 2, 60.0)
+
+        logger.info("📡 CLOB market stream stopped")
+
+    def get_streamed_quote(self, token_id: str) -> Optional[tuple[float, float]]:
+        """(best_bid, best_ask) from the market stream, or None if absent/stale."""
+        quote = self._price_cache.get(token_id)
+        if quote is None or time.monotonic() - quote[2] > self.config.stream_max_age_secs:
+            return None
+        return quote[0], quote[1]
+
+    def _streamed_mid(self, token_id: str) -> Optional[float]:
+        quote = self.get_streamed_quote(token_id)
+        if quote is None or quote[0] <= 0 or quote[1] <= 0:
+            return None
+        return (quote[0] + quote[1]) / 2
+
+    def apply_stream_prices(self, markets: list[BinaryMarket]) -> list[BinaryMarket]:
+        """Overwrite Gamma snapshot prices with fresh streamed midpoints, where available."""
+        for m in markets:
+            mid_up = self._streamed_mid(m.token_id_up)
+            if mid_up is not None:
+                m.price_up = mid_up
+            mid_down = self._streamed_mid(m.token_id_down)
+            if mid_down is not None:
+                m.price_down = mid_down
+        return markets
+
     # ── CLOB Price ──────────────────────────────────────────────
 
     def get_clob_price(self, token_id: str, side: str = "BUY") -> Optional[float]:
+        quote = self.get_streamed_quote(token_id)
+        if quote is not None:
+            # Same meaning as the CLOB /price fallback below: BUY → best bid, SELL → best ask
+            streamed = quote[0] if side == "BUY" else quote[1]
+            if streamed > 0:
+                return streamed
         if not self._clob_initialized: return None
         try:
             p = self._clob.get_price(token_id, side=side)
@@ -530,6 +830,10 @@ class PolymarketClient:
 
     # ── Order Execution ─────────────────────────────────────────
 
+    async def _sign_and_post(self, sign, args, order_type):
+        """Sign and post one order in a worker thread; the SDK blocks on crypto and HTTP."""
+        return await asyncio.to_thread(lambda: self._clob.post_order(sign(args), order_type))
+
     async def place_order(self, market: BinaryMarket, direction: str, size_usd: float,
                           price: Optional[float] = None, oracle_price: float = 0.0,
                           confidence: float = 0.0) -> Optional[TradeRecord]:
@@ -546,7 +850,8 @@ class PolymarketClient:
         try:
             mkt = self._active_markets.get(market.condition_id)
 
-            clob_price = self.get_clob_price(token_id, side="BUY")
+            # Off the loop: the HTTP fallback blocks, and concurrent legs should overlap from here
+            clob_price = await asyncio.to_thread(self.get_clob_price, token_id, "BUY")
             exec_price = clob_price if clob_price else price
             logger.info(f"Price: {exec_price:.4f} (clob={clob_price}, gamma={price:.4f})")
 
@@ -572,8 +877,7 @@ class PolymarketClient:
                 # ── Attempt 1: FOK (instant fill, best case) ────────
                 try:
                     args = MarketOrderArgs(token_id=token_id, amount=size_usd, side=BUY, fee_rate_bps=fee_bps, order_type=OrderType.FOK)
-                    signed = self._clob.create_market_order(args)
-                    resp = self._clob.post_order(signed, OrderType.FOK)
+                    resp = await self._sign_and_post(self._clob.create_market_order, args, OrderType.FOK)
                 except Exception as fok_err:
                     fok_msg = str(fok_err).lower()
                     if "fully filled or killed" in fok_msg or "couldn't be fully filled" in fok_msg:
@@ -596,15 +900,14 @@ class PolymarketClient:
 
                 # ── Attempt 2: GTC limit with slippage ──────────────
                 if fok_rejected_thin_book:
-                    slippage_pct = getattr(self.config, 'max_slippage_pct', 2.0)
-                    slippage_price = round(min(0.99, exec_price * (1 + slippage_pct / 100)), 2)
+                    slippage_price = round(min(0.99, exec_price * (1 + self.config.max_slippage_frac)), 2)
                     slippage_shares = round(size_usd / slippage_price, 2)
                     if slippage_shares < 5:
                         slippage_shares = 5.0
 
                     logger.warning(
                         f"FOK rejected (thin book) — retrying as GTC limit | "
-                        f"{exec_price:.4f} → {slippage_price:.4f} (+{slippage_pct:.1f}% slippage) | "
+                        f"{exec_price:.4f} → {slippage_price:.4f} (+{self.config.max_slippage_pct:.1f}% slippage) | "
                         f"{slippage_shares:.1f} shares"
                     )
 
@@ -613,8 +916,7 @@ class PolymarketClient:
                             price=slippage_price, size=slippage_shares,
                             side=BUY, token_id=token_id, fee_rate_bps=fee_bps
                         )
-                        signed2 = self._clob.create_order(args2)
-                        resp = self._clob.post_order(signed2, OrderType.GTC)
+                        resp = await self._sign_and_post(self._clob.create_order, args2, OrderType.GTC)
                     except Exception as gtc_err:
                         logger.error(f"GTC fallback error: {gtc_err}", exc_info=True)
                         return None
@@ -627,7 +929,7 @@ class PolymarketClient:
                         logger.info(f"🟡 GTC order resting — waiting 10s for fill...")
                         await asyncio.sleep(10)
                         try:
-                            self._clob.cancel(gtc_order_id)
+                            await asyncio.to_thread(self._clob.cancel, gtc_order_id)
                             logger.warning(f"GTC cancelled after 10s — no fill")
                             resp = {"success": False, "status": "cancelled", "errorMsg": "GTC timeout — no fill"}
                         except Exception:
@@ -644,8 +946,7 @@ class PolymarketClient:
                 fee_bps = await self.get_fee_rate_bps(token_id) or 0
                 logger.info(f"🔴 LIMIT ORDER: {direction.upper()} {shares:.1f} @ {exec_price:.4f} (fee={fee_bps}bps)")
                 args = OrderArgs(price=exec_price, size=shares, side=BUY, token_id=token_id, fee_rate_bps=fee_bps)
-                signed = self._clob.create_order(args)
-                resp = self._clob.post_order(signed, OrderType.GTC)
+                resp = await self._sign_and_post(self._clob.create_order, args, OrderType.GTC)
 
             logger.info(f"Response: {json.dumps(resp, indent=2)}")
             order_id = resp.get("orderID", trade_id)
@@ -678,7 +979,7 @@ class PolymarketClient:
                         else:
                             # Still resting — cancel it
                             try:
-                                self._clob.cancel(live_order_id)
+                                await asyncio.to_thread(self._clob.cancel, live_order_id)
                                 logger.warning(f"🚫 Resting order cancelled after 12s — no fill (status={live_check_status})")
                             except Exception:
                                 # Cancel failed — might have filled in the meantime
@@ -855,6 +1156,9 @@ class PolymarketClient:
 
     def get_midpoint(self, token_id: str) -> Optional[float]:
         """Get the midpoint price for a token."""
+        streamed = self._streamed_mid(token_id)
+        if streamed is not None:
+            return streamed
         self._ensure_clob()
         try:
             mid = self._clob.get_midpoint(token_id)
@@ -934,6 +1238,7 @@ class PolymarketClient:
                     r.pnl = round(-r.size_usd, 4)
 
                 resolved.append(r)
+                self._recent_closed.append(r)
                 logger.info(
                     f"{'✅' if won else '❌'} {r.trade_id} | "
                     f"{r.outcome.upper()} ({winner}) | ${r.pnl:+.2f}"
@@ -1067,3 +1372,11 @@ class PolymarketClient:
 
     def get_trade_records(self) -> list[TradeRecord]:
         return (self._archived_trades + self._trade_records).copy()
+
+    def iter_open_trades(self) -> Iterator[TradeRecord]:
+        """Unresolved trades, without copying the record lists (open trades are never archived)."""
+        return (r for r in self._trade_records if r.outcome is None)
+
+    def get_recent_closed(self) -> list[TradeRecord]:
+        """The last 50 resolved trades, oldest first."""
+        return list(self._recent_closed)
@@ -107,7 +107,7 @@ class RiskManager:
         kelly = max(0, 2 * confidence - 1)
         fractional_kelly = kelly * self.config.kelly_fraction
         size = self.capital * fractional_kelly
-        size = min(size, self.capital * (self.config.max_trade_pct / 100))
+        size = min(size, self.capital * self.config.max_trade_frac)
         size = min(size, self.config.max_trade_size_usd)
         size = max(size, self.config.min_trade_size_usd)
         size = min(size, self.capital)
@@ -5,15 +5,28 @@
 ╚══════════════════════════════════════════════════════════════════╝
 """
 
+import asyncio
 import json
 import time
 import os
 import logging
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Any
 
 from config.settings import LoggingConfig
 
+logger = logging.getLogger("trade_logger")
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS if HAS_ORJSON else 0
+
 
 class TradeLogger:
     """
@@ -24,8 +37,15 @@ class TradeLogger:
       - strategy.jsonl: Every strategy decision (even HOLDs)
       - oracle.jsonl: Price feeds and consensus records
       - errors.log: Standard error log
+
+    Once start() is called, log_*() and save_performance() only enqueue;
+    a background task, woken by the first queued record, waits FLUSH_INTERVAL
+    seconds to collect a batch and writes it in a worker thread, and close() drains whatever is left. Before start()
+    (or without a running loop) writes happen inline as before.
     """
 
+    FLUSH_INTERVAL = 0.1  # seconds a batch collects after the first queued record
+
     def __init__(self, config: LoggingConfig):
         self.config = config
         
@@ -35,6 +55,14 @@ class TradeLogger:
                      config.performance_file]:
             Path(path).parent.mkdir(parents=True, exist_ok=True)
 
+        # ── Background write queue ──
+        self._pending: deque[tuple[str, dict]] = deque()  # (filepath, record), FIFO
+        self._pending_perf: dict | None = None             # latest snapshot wins
+        self._flush_lock = threading.Lock()  # hand-off of queued records / snapshot (held briefly)
+        self._write_lock = threading.Lock()  # one writer at a time (flusher vs. inline flush())
+        self._flush_task: asyncio.Task | None = None
+        self._flush_wake: asyncio.Event | None = None  # set by log_*() / save_performance()
+
         # Configure Python logging
         logging.basicConfig(
             level=logging.INFO,
@@ -46,12 +74,106 @@ class TradeLogger:
             ],
         )
 
+    # ── Background flusher ──────────────────────────────────────
+
+    def start(self):
+        """Switch to queued writes, flushed by a background task. Needs a running loop."""
+        if self._flush_task is None:
+            self._flush_wake = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self):
+        """Stop the flusher and drain everything still queued."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+            self._flush_wake = None
+        await asyncio.to_thread(self.flush)
+
+    async def _flush_loop(self):
+        wake = self._flush_wake
+        while True:
+            await wake.wait()
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            wake.clear()  # records queued during the write below set it again
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"Log flush failed: {e}")
+                wake.set()  # requeued records: retry after the next interval
+
+    def flush(self):
+        """
+        Write all queued records (grouped per file) and the latest performance snapshot.
+
+        Records whose file write fails go back to the front of the queue and the
+        snapshot is restored unless a newer one arrived, so the next flush retries
+        them; the first error is re-raised for the caller to log.
+        """
+        with self._write_lock:
+            with self._flush_lock:
+                items = [self._pending.popleft() for _ in range(len(self._pending))]
+                perf, self._pending_perf = self._pending_perf, None
+
+            batches: dict[str, list[dict]] = {}
+            for filepath, data in items:
+                batches.setdefault(filepath, []).append(data)
+            failed: set[str] = set()
+            error: Exception | None = None
+            for filepath, records in batches.items():
+                try:
+                    with open(filepath, "ab") as f:
+                        f.write(b"".join(map(self._encode_line, records)))
+                except Exception as e:
+                    failed.add(filepath)
+                    error = error or e
+
+            perf_failed = False
+            if perf is not None:
+                try:
+                    self._write_performance(perf)
+                except Exception as e:
+                    perf_failed = True
+                    error = error or e
+
+            if failed or perf_failed:
+                with self._flush_lock:
+                    if failed:
+                        self._pending.extendleft(reversed([it for it in items if it[0] in failed]))
+                    if perf_failed and self._pending_perf is None:
+                        self._pending_perf = perf
+                raise error
+
+    # ── Writers ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _encode_line(data: dict) -> bytes:
+        if HAS_ORJSON:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE)
+        return (json.dumps(data, default=str) + "\n").encode()
+
     def _write_jsonl(self, filepath: str, data: dict):
-        """Append a JSON line to the specified file."""
+        """Append a JSON line to the specified file (queued once the flusher runs)."""
         data["_ts"] = time.time()
         data["_iso"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        with open(filepath, "a") as f:
-            f.write(json.dumps(data, default=str) + "\n")
+        if self._flush_task is not None:
+            self._pending.append((filepath, data))
+            self._flush_wake.set()
+            return
+        with open(filepath, "ab") as f:
+            f.write(self._encode_line(data))
+
+    def _write_performance(self, perf_data: dict):
+        if HAS_ORJSON:
+            with open(self.config.performance_file, "wb") as f:
+                f.write(orjson.dumps(perf_data, default=str, option=_ORJSON_OPTS | orjson.OPT_INDENT_2))
+        else:
+            with open(self.config.performance_file, "w") as f:
+                json.dump(perf_data, f, indent=2, default=str)
 
     def log_trade(self, trade_data: dict):
         """Log a trade event."""
@@ -81,16 +203,26 @@ class TradeLogger:
     def save_performance(self, perf_data: dict):
         """Save current performance snapshot."""
         perf_data["_saved_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        with open(self.config.performance_file, "w") as f:
-            json.dump(perf_data, f, indent=2, default=str)
+        if self._flush_task is not None:
+            with self._flush_lock:
+                self._pending_perf = perf_data
+            self._flush_wake.set()
+            return
+        self._write_performance(perf_data)
 
     def get_trade_history(self) -> list[dict]:
         """Read all trade records from JSONL."""
+        try:
+            self.flush()
+        except Exception as e:
+            # The records stay queued for the flusher; report what is on disk
+            logger.error(f"Log flush failed before history read: {e}")
         records = []
         path = self.config.trade_log_file
+        loads = orjson.loads if HAS_ORJSON else json.loads
         if os.path.exists(path):
-            with open(path) as f:
+            with open(path, "rb") as f:
                 for line in f:
                     if line.strip():
-                        records.append(json.loads(line))
+                        records.append(loads(line))
         return records
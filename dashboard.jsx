@@ -14,7 +14,13 @@ function useBot(url = "ws://localhost:8765") {
 
       ws.onopen = () => { setConnected(true); console.log("Dashboard connected"); };
       ws.onmessage = (e) => {
-        try { setState(JSON.parse(e.data)); } catch {}
+        try {
+          // Bursts arrive as one JSON array; only full-state messages replace the view
+          const data = JSON.parse(e.data);
+          for (const msg of (Array.isArray(data) ? data : [data])) {
+            if (!msg.type || msg.type === "state") setState(msg);
+          }
+        } catch {}
       };
       ws.onclose = () => {
         setConnected(false);
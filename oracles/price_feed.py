@@ -28,7 +28,7 @@ import aiohttp
 logger = logging.getLogger("oracle")
 
 
-@dataclass
+@dataclass(slots=True)
 class PricePoint:
     source: str
     price: float
@@ -113,9 +113,10 @@ class OracleEngine:
     _rtds_total_attempts: int = 0
     _rtds_total_successes: int = 0
 
-    def __init__(self, config):
+    def __init__(self, config, connector: Optional[aiohttp.BaseConnector] = None):
         self.config = config.oracle
         self._session: Optional[aiohttp.ClientSession] = None
+        self._connector = connector  # Shared keep-alive pool (owned by the bot) or None
         self._last_prices: dict[str, PricePoint] = {}
         self._price_history: list[ConsensusPrice] = []
         self._chainlink_price: Optional[float] = None
@@ -135,7 +136,11 @@ class OracleEngine:
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=self._connector,
+                connector_owner=self._connector is None,
+            )
         return self._session
 
     async def close(self):
@@ -360,7 +365,7 @@ class OracleEngine:
     async def _fetch_binance(self) -> Optional[PricePoint]:
         try:
             session = await self._get_session()
-            url = f"{self.config.binance_base_url}/ticker/bookTicker"
+            url = self.config.binance_ticker_url
             async with session.get(url, params={"symbol": "BTCUSDT"}) as resp:
                 if resp.status == 200:
                     data = await resp.json()
@@ -377,7 +382,7 @@ class OracleEngine:
     async def _fetch_coingecko(self) -> Optional[PricePoint]:
         try:
             session = await self._get_session()
-            url = f"{self.config.coingecko_base_url}/simple/price"
+            url = self.config.coingecko_price_url
             async with session.get(url, params={"ids": "bitcoin", "vs_currencies": "usd"}) as resp:
                 if resp.status == 200:
                     data = await resp.json()
@@ -510,7 +515,7 @@ class OracleEngine:
         """Fetch historical candles from Binance (best candle source)."""
         try:
             session = await self._get_session()
-            url = f"{self.config.binance_base_url}/klines"
+            url = self.config.binance_klines_url
             params = {"symbol": "BTCUSDT", "interval": interval, "limit": min(limit, 1000)}
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
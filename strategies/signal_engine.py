@@ -92,35 +92,49 @@ class StrategyEngine:
     def _rsi(closes: list[float], period: int = 14) -> float:
         if len(closes) < period + 1:
             return 50.0
-        deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-        for i in range(period, len(deltas)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        # Single pass over deltas — no intermediate gains/losses lists
+        gain_sum = 0.0
+        loss_sum = 0.0
+        for i in range(1, period + 1):
+            d = closes[i] - closes[i - 1]
+            if d > 0:
+                gain_sum += d
+            elif d < 0:
+                loss_sum -= d
+        avg_gain = gain_sum / period
+        avg_loss = loss_sum / period
+        for i in range(period + 1, len(closes)):
+            d = closes[i] - closes[i - 1]
+            avg_gain = (avg_gain * (period - 1) + (d if d > 0 else 0)) / period
+            avg_loss = (avg_loss * (period - 1) + (-d if d < 0 else 0)) / period
         if avg_loss == 0:
             return 100.0
         return 100 - (100 / (1 + avg_gain / avg_loss))
 
     @staticmethod
-    def _macd(closes: list[float], fast: int = 12, slow: int = 26, signal: int = 9):
-        if len(closes) < slow + signal:
-            return 0.0, 0.0, 0.0
+    def _macd_series(closes: list[float], fast: int = 12, slow: int = 26, signal: int = 9):
+        """Full MACD and signal lines (both causal, so a prefix of closes yields a prefix of each)."""
         ema_fast = StrategyEngine._ema(closes, fast)
         ema_slow = StrategyEngine._ema(closes, slow)
         min_len = min(len(ema_fast), len(ema_slow))
         macd_line = [ema_fast[-(min_len - i)] - ema_slow[-(min_len - i)] for i in range(min_len)]
         if len(macd_line) < signal:
+            return macd_line, []
+        return macd_line, StrategyEngine._ema(macd_line, signal)
+
+    @staticmethod
+    def _macd(closes: list[float], fast: int = 12, slow: int = 26, signal: int = 9):
+        if len(closes) < slow + signal:
+            return 0.0, 0.0, 0.0
+        macd_line, signal_line = StrategyEngine._macd_series(closes, fast, slow, signal)
+        if not signal_line:
             return macd_line[-1] if macd_line else 0.0, 0.0, 0.0
-        signal_line = StrategyEngine._ema(macd_line, signal)
         return macd_line[-1], signal_line[-1], macd_line[-1] - signal_line[-1]
 
-    def _volatility(self, candles: list[Candle]) -> float:
-        if len(candles) < 2:
+    def _volatility(self, closes: list[float]) -> float:
+        if len(closes) < 2:
             return 0.0
-        returns = [((candles[i].close - candles[i-1].close) / candles[i-1].close) * 100 for i in range(1, len(candles))]
+        returns = [((closes[i] - closes[i-1]) / closes[i-1]) * 100 for i in range(1, len(closes))]
         mean = sum(returns) / len(returns)
         return math.sqrt(sum((r - mean) ** 2 for r in returns) / len(returns))
 
@@ -155,12 +169,12 @@ class StrategyEngine:
             f"Price vs window open: {drift_pct:+.4f}%"
         )
 
-    def _signal_momentum(self, candles: list[Candle]) -> Signal:
-        lookback = min(self.config.momentum_lookback, len(candles) - 1)
+    def _signal_momentum(self, closes: list[float]) -> Signal:
+        lookback = min(self.config.momentum_lookback, len(closes) - 1)
         if lookback < 1:
             return Signal("momentum", MarketDirection.HOLD, 0.0, 0.0, "No data")
-        current = candles[-1].close
-        past = candles[-(lookback + 1)].close
+        current = closes[-1]
+        past = closes[-(lookback + 1)]
         pct = ((current - past) / past) * 100
         strength = min(1.0, abs(pct) / 0.5)
         if pct > 0.02:
@@ -172,8 +186,7 @@ class StrategyEngine:
             strength = 0.0
         return Signal("momentum", d, strength, pct, f"{lookback}-candle: {pct:+.3f}%")
 
-    def _signal_rsi(self, candles: list[Candle]) -> Signal:
-        closes = [c.close for c in candles]
+    def _signal_rsi(self, closes: list[float]) -> Signal:
         rsi = self._rsi(closes, self.config.rsi_period)
         if rsi > self.config.rsi_overbought:
             d, strength = MarketDirection.DOWN, min(1.0, (rsi - self.config.rsi_overbought) / 15)
@@ -189,22 +202,26 @@ class StrategyEngine:
                 strength = (center - rsi) / (center - self.config.rsi_oversold) * 0.3
         return Signal("rsi", d, strength, rsi, f"RSI={rsi:.1f}")
 
-    def _signal_macd(self, candles: list[Candle]) -> Signal:
-        closes = [c.close for c in candles]
-        macd_line, signal_line, histogram = self._macd(
-            closes, self.config.macd_fast, self.config.macd_slow, self.config.macd_signal
-        )
+    def _signal_macd(self, closes: list[float]) -> Signal:
+        fast, slow, sig = self.config.macd_fast, self.config.macd_slow, self.config.macd_signal
+        histogram = 0.0
+        prev_histogram = 0.0
+        if len(closes) >= slow + sig:
+            # One series serves both bars: EMAs are causal, so the previous
+            # bar's MACD equals the [-2] element of the full-series lines.
+            macd_line, signal_line = self._macd_series(closes, fast, slow, sig)
+            if signal_line:
+                histogram = macd_line[-1] - signal_line[-1]
+                if len(closes) - 1 >= slow + sig:
+                    prev_histogram = macd_line[-2] - signal_line[-2]
         d = MarketDirection.UP if histogram > 0 else MarketDirection.DOWN if histogram < 0 else MarketDirection.HOLD
         normalized = abs(histogram) / (closes[-1] if closes else 1) * 10000
         strength = min(1.0, normalized / 10)
-        if len(closes) > 2:
-            prev = self._macd(closes[:-1], self.config.macd_fast, self.config.macd_slow, self.config.macd_signal)
-            if prev[2] * histogram < 0:
-                strength = min(1.0, strength * 1.5)
+        if len(closes) > 2 and prev_histogram * histogram < 0:
+            strength = min(1.0, strength * 1.5)
         return Signal("macd", d, strength, histogram, f"MACD hist={histogram:.2f}")
 
-    def _signal_ema_cross(self, candles: list[Candle]) -> Signal:
-        closes = [c.close for c in candles]
+    def _signal_ema_cross(self, closes: list[float]) -> Signal:
         ema_fast = self._ema(closes, self.config.ema_fast)
         ema_slow = self._ema(closes, self.config.ema_slow)
         if not ema_fast or not ema_slow:
@@ -243,7 +260,10 @@ class StrategyEngine:
                 None, 0.0, False, "Insufficient data (<30 candles)", 0.0,
             )
 
-        volatility = self._volatility(candles[-20:])
+        # Extract closes once; every indicator below works on this list
+        closes = [c.close for c in candles]
+
+        volatility = self._volatility(closes[-20:])
         if volatility < self.config.min_volatility_pct:
             return StrategyDecision(
                 MarketDirection.HOLD, 0.0, [], current_price, open_price,
@@ -279,10 +299,10 @@ class StrategyEngine:
             weights["ema_cross"] = self.config.weight_ema_cross
 
         signals.extend([
-            self._signal_momentum(candles),
-            self._signal_rsi(candles),
-            self._signal_macd(candles),
-            self._signal_ema_cross(candles),
+            self._signal_momentum(closes),
+            self._signal_rsi(closes),
+            self._signal_macd(closes),
+            self._signal_ema_cross(closes),
         ])
 
         # ── Chop filter: indicators split 2v2 = no trend ──